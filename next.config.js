@@ -1,3 +1,27 @@
+// public/data is written by `python3 -m scripts.pipeline deploy` (prebuild) with
+// a .br and a .gz sibling next to every file of these types (COMPRESSIBLE in
+// scripts/pipeline/compress.py): serve the sibling the client accepts.
+const PRECOMPRESSED_TYPES = {
+  json: 'application/json',
+  ndjson: 'application/x-ndjson',
+  xml: 'application/xml; charset=utf-8',
+  html: 'text/html; charset=utf-8',
+  txt: 'text/plain; charset=utf-8',
+  js: 'application/javascript; charset=utf-8',
+  css: 'text/css; charset=utf-8',
+  svg: 'image/svg+xml',
+  csv: 'text/csv; charset=utf-8',
+  sqlite: 'application/vnd.sqlite3',
+  msgpack: 'application/msgpack',
+}
+const dataFile = (ext) => `/data/:path*/:file([^/]+\\.(?:${ext}))`
+const acceptsBr = { type: 'header', key: 'accept-encoding', value: '.*\\bbr\\b.*' }
+const acceptsGzip = { type: 'header', key: 'accept-encoding', value: '.*\\bgzip\\b.*' }
+const PRECOMPRESSED = [
+  { has: [acceptsBr], ext: '.br', encoding: 'br' },
+  { has: [acceptsGzip], missing: [acceptsBr], ext: '.gz', encoding: 'gzip' },
+]
+
 /** @type {import('next').NextConfig} */
 const nextConfig = {
   reactStrictMode: true,
@@ -53,6 +77,30 @@ const nextConfig = {
           { key: 'Cache-Control', value: 'public, max-age=31536000, immutable' },
         ],
       },
+      // Offline articles are named by their content hash
+      {
+        source: '/data/offline/articles/:file*',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=31536000, immutable' },
+        ],
+      },
+      {
+        source: '/data/:path*',
+        headers: [
+          { key: 'Vary', value: 'Accept-Encoding' },
+        ],
+      },
+      ...PRECOMPRESSED.flatMap(({ has, missing, encoding }) =>
+        Object.entries(PRECOMPRESSED_TYPES).map(([ext, type]) => ({
+          source: dataFile(ext),
+          has,
+          ...(missing ? { missing } : {}),
+          headers: [
+            { key: 'Content-Encoding', value: encoding },
+            { key: 'Content-Type', value: type },
+          ],
+        }))
+      ),
     ]
   },
 
@@ -78,10 +126,19 @@ const nextConfig = {
   },
 
   async rewrites() {
-    return [
-      // Next.js 14.2 generateSitemaps() doesn't auto-generate the sitemap index
-      { source: '/sitemap.xml', destination: '/api/sitemap-index' },
-    ]
+    return {
+      // Before the filesystem, which would serve the uncompressed public/ file
+      beforeFiles: PRECOMPRESSED.map(({ has, missing, ext }) => ({
+        source: dataFile(Object.keys(PRECOMPRESSED_TYPES).join('|')),
+        has,
+        ...(missing ? { missing } : {}),
+        destination: `/data/:path*/:file${ext}`,
+      })),
+      afterFiles: [
+        // Next.js 14.2 generateSitemaps() doesn't auto-generate the sitemap index
+        { source: '/sitemap.xml', destination: '/api/sitemap-index' },
+      ],
+    }
   },
 
   env: {
@@ -47,7 +47,9 @@ async function workerFn(workerId: number, depts: string[], outFile: string): Pro
     while (retries < 5) {
       try {
         const result = await client.query(
-          `SELECT id, name, phone, address_postal_code as cp, address_city as city, address_department as dept, is_active
+          `SELECT id, name, phone, address_postal_code as cp, address_city as city, address_department as dept, is_active,
+                  siren, siret, address_street, latitude, longitude, email, code_naf, creation_date, legal_form,
+                  specialty, website, (description IS NOT NULL AND description <> '') as has_description, employee_count
            FROM providers WHERE address_department = $1`,
           [dept]
         )
@@ -0,0 +1,20 @@
+-- Generated by python3 -m scripts.pipeline cms (244 rows)
+BEGIN;
+CREATE TEMP TABLE cms_seed (
+  slug text NOT NULL, page_type text NOT NULL, title text NOT NULL, meta_description text,
+  service_slug text, location_slug text, excerpt text, author text, author_bio text,
+  category text, tags text[], read_time text, seed_hash text NOT NULL
+) ON COMMIT DROP;
+\copy cms_seed FROM 'scripts/output/cms-seed/seed.csv' WITH (FORMAT csv, HEADER true)
+INSERT INTO cms_pages (slug, page_type, title, meta_description, service_slug, location_slug,
+                       excerpt, author, author_bio, category, tags, read_time, status, is_active)
+SELECT slug, page_type, title, meta_description, service_slug, location_slug,
+       excerpt, author, author_bio, category, COALESCE(tags, '{}'), read_time, 'draft', true
+FROM cms_seed WHERE true
+ON CONFLICT (slug, page_type, COALESCE(service_slug, ''), COALESCE(location_slug, '')) WHERE is_active = true
+DO UPDATE SET title = excluded.title, meta_description = excluded.meta_description, excerpt = excluded.excerpt,
+              author = excluded.author, author_bio = excluded.author_bio, category = excluded.category,
+              tags = excluded.tags, read_time = excluded.read_time, updated_at = CURRENT_TIMESTAMP
+WHERE cms_pages.status = 'draft' AND cms_pages.updated_by IS NULL
+  AND cms_pages.content_html IS NULL AND cms_pages.content_json IS NULL;
+COMMIT;
@@ -0,0 +1,37 @@
+"""Offline data pipeline for servicesartisans.
+
+The TypeScript data modules under src/lib/data (blog batches, france.ts, ...)
+stay the source of truth; the stages in this package read them once, derive
+static artefacts and write them under public/data so pages and the CDN can
+serve them without recomputing anything at request time.
+
+Run a stage from the repository root:
+
+    python3 -m scripts.pipeline build          # lint + dupes + emit + export + offline + compress
+    python3 -m scripts.pipeline deploy         # what public/data serves; run by `npm run build`
+    python3 -m scripts.pipeline lint
+    python3 -m scripts.pipeline render         # block cache hit ratio (--benchmark 50000)
+    python3 -m scripts.pipeline stats          # words / reading time / block counts (--drift)
+    python3 -m scripts.pipeline dupes          # near-duplicate report -> .pipeline-cache/duplicates.json
+    python3 -m scripts.pipeline emit
+    python3 -m scripts.pipeline export         # corpus.json/.ndjson/.sqlite/.msgpack (--format sqlite)
+    python3 -m scripts.pipeline offline        # public/data/offline bundle + delta manifest for the apps
+    python3 -m scripts.pipeline compress
+    python3 -m scripts.pipeline sitemap        # public/data/sitemaps/*.xml.gz + sitemap-index.xml (--extended)
+    python3 -m scripts.pipeline listings       # Google Maps crawls -> canonical shards
+    python3 -m scripts.pipeline extract        # saved HTML pages -> gm-listings JSONL (--benchmark N)
+    python3 -m scripts.pipeline match          # providers <-> listings (--benchmark)
+    python3 -m scripts.pipeline quality        # artisans-cache.jsonl -> quality scores CSV + histograms
+    python3 -m scripts.pipeline identifiers    # SIREN/SIRET/phones -> lookup.jsonl + todo.jsonl
+    python3 -m scripts.pipeline insee          # address_city INSEE codes -> corrections.csv + SQL batches
+    python3 -m scripts.pipeline jobs           # checkpoint logs of resumable jobs (--reset JOB, --benchmark N)
+    python3 -m scripts.pipeline coverage       # canonical listings -> scripts/output/listing-coverage.json
+    python3 -m scripts.pipeline france         # france.ts -> france-index.ts (--check)
+    python3 -m scripts.pipeline quartiers      # france.ts quartiers -> quartier-index.ts (--check)
+    python3 -m scripts.pipeline content        # trade-content/problems/guides -> indexes + shards (--check)
+    python3 -m scripts.pipeline communes       # insee-communes.json -> .compact.json
+    python3 -m scripts.pipeline backlinks      # backlinks-*.csv -> columnar .npz cache
+    python3 -m scripts.pipeline nearby         # backlinks -> scripts/output/backlinks-nearby.json
+    python3 -m scripts.pipeline links          # nearest villes + related services -> link-index.ts (--check)
+    python3 -m scripts.pipeline cms            # seed-cms.ts + blog corpus -> scripts/output/cms-seed (--verify, --load)
+"""
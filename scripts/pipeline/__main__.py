@@ -0,0 +1,73 @@
+"""Command line entry point: `python3 -m scripts.pipeline <command>`."""
+import argparse
+import importlib
+import sys
+import time
+
+# command -> (module, help). Modules expose add_arguments(parser) and run(args);
+# a non-zero return from run() stops the pipeline with that exit code.
+COMMANDS = {
+    'lint': ('lint', 'check blog articles for structural content errors'),
+    'render': ('render', 'render blog blocks to HTML through the content-addressed block cache'),
+    'stats': ('stats', 'word counts, reading time and block counts per article (--drift)'),
+    'dupes': ('dupes', 'report near-duplicate articles and blocks (MinHash + LSH)'),
+    'emit': ('emit', 'write blog payloads, index shards and feed to public/data/blog'),
+    'export': ('export', 'export the article corpus as JSON, NDJSON, SQLite (FTS5) and MessagePack'),
+    'offline': ('offline', 'write the versioned offline bundle and delta manifest for the mobile apps'),
+    'compress': ('compress', 'write .br/.gz siblings for every emitted file'),
+    'sitemap': ('sitemap', 'stream every sitemap.ts URL family into gzipped chunks and a sitemap index'),
+    'listings': ('listings', 'dedupe the Google Maps crawls into per-department canonical shards'),
+    'extract': ('extract', 're-extract gm-listings JSONL from saved Maps / Search / PagesJaunes pages'),
+    'match': ('matcher', 'match provider export rows to Google Maps listings'),
+    'quality': ('quality', 'score every provider of the export like calculateQualityScore, with histograms'),
+    'identifiers': ('identifiers', 'validate SIREN/SIRET and normalize phones into a deduplicated lookup'),
+    'insee': ('insee', 'resolve INSEE codes stored in address_city into commune names, as SQL batches'),
+    'jobs': ('jobs', 'list, reset or benchmark the checkpoint logs of the resumable job runner'),
+    'coverage': ('coverage', 'aggregate listings per department and trade into scripts/output/listing-coverage.json'),
+    'france': ('france', 'precompute the france.ts lookup indexes into france-index.ts'),
+    'quartiers': ('quartiers', 'precompute quartier slugs and per-ville slug maps into quartier-index.ts'),
+    'content': ('content', 'shard trade-content.ts, problems.ts and guides.ts into indexes and per-entry modules'),
+    'communes': ('communes', 'compact insee-communes.json for insee-resolver.ts'),
+    'backlinks': ('backlinks', 'normalize the backlinks-*.csv exports into columnar tables'),
+    'nearby': ('nearby', 'link backlink institutions to nearby communes, villes and departements'),
+    'links': ('links', 'precompute nearest villes and related services into link-index.ts'),
+    'cms': ('cms_seed', 'emit the cms_pages seed as a COPY-ready CSV plus the delta not yet loaded (--load)'),
+}
+
+# Composite commands run their steps in order; a step is a command line, its
+# options otherwise left at their defaults. `deploy` runs before `next build`
+# (package.json prebuild) and writes everything public/data serves; its
+# `--check` steps fail the build when a generated index in src/lib/data no
+# longer matches its source, since the getters read those by position.
+PIPELINES = {
+    'build': ['lint', 'dupes', 'emit', 'export', 'offline', 'compress'],
+    'deploy': ['lint', 'france --check', 'quartiers --check', 'links --check', 'content --check',
+               'emit', 'export', 'offline --check', 'sitemap', 'compress'],
+}
+
+
+def _module(name: str):
+    return importlib.import_module(f'{__package__}.{COMMANDS[name][0]}')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python3 -m scripts.pipeline')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        _module(name).add_arguments(sub.add_parser(name, help=help_text))
+    for name, steps in PIPELINES.items():
+        sub.add_parser(name, help=' + '.join(steps))
+    args = parser.parse_args(argv)
+
+    for step in PIPELINES.get(args.command, [args.command]):
+        started = time.perf_counter()
+        step_args = args if step == args.command else parser.parse_args(step.split())
+        status = _module(step_args.command).run(step_args)
+        print(f'[{step}] done in {time.perf_counter() - started:.2f}s')
+        if status:
+            return status
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
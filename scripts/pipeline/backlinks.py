@@ -0,0 +1,237 @@
+"""Normalize the backlinks-*.csv exports into columnar tables.
+
+scrape-backlinks.mjs writes one CSV per annuaire category plus
+backlinks-tous.csv, with `telephone`, `adresse` and `site_web` kept as the
+API's JSON arrays inside CSV cells. This stage parses every file once, keeps
+one entity per (category, nom, email) across all of them and explodes the
+arrays into typed NumPy columns:
+
+- entities: category, nom, email, insee, postal_code, commune, lat, lon,
+  phone, website (primary address = first one with coordinates);
+- addresses / phones / sites: one row per array item, `entity` pointing back
+  into the entities table.
+
+Everything is saved as one .npz under .pipeline-cache/. Parsed rows are cached
+per source file by content hash, so only a changed export is parsed again, and
+the .npz is reused as-is when no export changed.
+"""
+import csv
+import io
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from .cache import HashCache, content_hash
+from .files import write_atomic
+from .listings import normalize_phone
+from .paths import CACHE_DIR, ROOT
+
+SOURCE_GLOB = 'backlinks-*.csv'
+ALL_FILE = 'backlinks-tous.csv'
+TABLE_FILE = CACHE_DIR / 'backlinks.npz'
+CACHE_VERSION = 1
+
+# Category labels of scrape-backlinks.mjs TARGETS, in the same order
+CATEGORIES = {
+    'epci': 'Communautés de communes / Agglo / Métropoles',
+    'chambre_metier': 'Chambres des Métiers (CMA)',
+    'cci': 'Chambres de Commerce (CCI)',
+    'adil': 'ADIL (Info Logement)',
+    'fr_renov': "Espaces France Rénov'",
+    'caue': 'CAUE (Architecture/Urbanisme)',
+}
+CATEGORY_LABELS = list(CATEGORIES.values())
+
+ADDRESS_KINDS = ('Adresse', 'Adresse postale')
+
+
+def _json_cell(cell: str) -> list[dict]:
+    if not cell:
+        return []
+    try:
+        value = json.loads(cell)
+    except json.JSONDecodeError:
+        return []
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def _coord(raw: str) -> float:
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return math.nan
+    return value if math.isfinite(value) else math.nan
+
+
+def parse_row(row: dict, category: str) -> dict:
+    """One CSV row with its JSON cells decoded into plain lists."""
+    return {
+        'category': category,
+        'nom': row.get('nom', '').strip(),
+        'email': row.get('email', '').strip().lower(),
+        'insee': [c for c in row.get('code_insee', '').split(';') if c],
+        'phones': [
+            {'raw': p.get('valeur', ''), 'phone': normalize_phone(p.get('valeur')) or '', 'description': p.get('description', '')}
+            for p in _json_cell(row.get('telephone', ''))
+        ],
+        'addresses': [
+            {
+                'kind': a.get('type_adresse', ''),
+                'postal_code': a.get('code_postal', ''),
+                'commune': a.get('nom_commune', ''),
+                'lat': _coord(a.get('latitude')),
+                'lon': _coord(a.get('longitude')),
+            }
+            for a in _json_cell(row.get('adresse', ''))
+        ],
+        'sites': [
+            {'url': s.get('valeur', '').strip(), 'label': s.get('libelle', '')}
+            for s in _json_cell(row.get('site_web', '')) if s.get('valeur')
+        ],
+    }
+
+
+def parse_file(path: Path) -> list[dict]:
+    """Rows of one export; per-category files take their category from the file name."""
+    file_category = None
+    if path.name != ALL_FILE:
+        file_category = CATEGORIES.get(path.stem.removeprefix('backlinks-'), path.stem.removeprefix('backlinks-'))
+    # utf-8-sig: the exports start with a BOM so Excel opens them as UTF-8
+    with path.open(encoding='utf-8-sig', newline='') as f:
+        return [parse_row(row, file_category or row.get('categorie', '')) for row in csv.DictReader(f)]
+
+
+def _json_safe(rows: list[dict]) -> list[dict]:
+    # NaN is not valid JSON for the hash cache; None round-trips back to NaN
+    for row in rows:
+        for a in row['addresses']:
+            for k in ('lat', 'lon'):
+                if isinstance(a[k], float) and math.isnan(a[k]):
+                    a[k] = None
+    return rows
+
+
+def merge(files: list[list[dict]]) -> list[dict]:
+    """One entity per (category, nom, email), first file wins, sorted for stable output."""
+    entities: dict[tuple, dict] = {}
+    for rows in files:
+        for row in rows:
+            entities.setdefault((row['category'], row['nom'], row['email']), row)
+    return [entities[k] for k in sorted(entities)]
+
+
+def _primary_address(addresses: list[dict]) -> dict:
+    for a in addresses:
+        if a['lat'] is not None and not math.isnan(a['lat']):
+            return a
+    return addresses[0] if addresses else {}
+
+
+def _nan(value) -> float:
+    return math.nan if value is None else value
+
+
+def to_columns(entities: list[dict]) -> dict[str, np.ndarray]:
+    categories = sorted({e['category'] for e in entities} - set(CATEGORY_LABELS))
+    labels = CATEGORY_LABELS + categories
+    category_id = {label: i for i, label in enumerate(labels)}
+
+    cols = {k: [] for k in ('category', 'nom', 'email', 'insee', 'postal_code', 'commune', 'lat', 'lon', 'phone', 'website')}
+    addresses = {k: [] for k in ('entity', 'kind', 'postal_code', 'commune', 'lat', 'lon')}
+    phones = {k: [] for k in ('entity', 'phone', 'raw', 'description')}
+    sites = {k: [] for k in ('entity', 'url', 'label')}
+    for i, e in enumerate(entities):
+        primary = _primary_address(e['addresses'])
+        cols['category'].append(category_id[e['category']])
+        cols['nom'].append(e['nom'])
+        cols['email'].append(e['email'])
+        cols['insee'].append(e['insee'][0] if e['insee'] else '')
+        cols['postal_code'].append(primary.get('postal_code', ''))
+        cols['commune'].append(primary.get('commune', ''))
+        cols['lat'].append(_nan(primary.get('lat')))
+        cols['lon'].append(_nan(primary.get('lon')))
+        cols['phone'].append(next((p['phone'] for p in e['phones'] if p['phone']), ''))
+        cols['website'].append(e['sites'][0]['url'] if e['sites'] else '')
+        for a in e['addresses']:
+            addresses['entity'].append(i)
+            addresses['kind'].append(ADDRESS_KINDS.index(a['kind']) if a['kind'] in ADDRESS_KINDS else -1)
+            addresses['postal_code'].append(a['postal_code'])
+            addresses['commune'].append(a['commune'])
+            addresses['lat'].append(_nan(a['lat']))
+            addresses['lon'].append(_nan(a['lon']))
+        for p in e['phones']:
+            phones['entity'].append(i)
+            phones['phone'].append(p['phone'])
+            phones['raw'].append(p['raw'])
+            phones['description'].append(p['description'])
+        for s in e['sites']:
+            sites['entity'].append(i)
+            sites['url'].append(s['url'])
+            sites['label'].append(s['label'])
+
+    out = {'category_labels': np.array(labels)}
+    for prefix, table in (('', cols), ('address_', addresses), ('phone_', phones), ('site_', sites)):
+        for name, values in table.items():
+            if name in ('lat', 'lon'):
+                array = np.array(values, dtype=np.float64)
+            elif name in ('entity', 'category', 'kind'):
+                array = np.array(values, dtype=np.int32 if name == 'entity' else np.int8)
+            else:
+                array = np.array(values, dtype=str)
+            out[prefix + name] = array
+    return out
+
+
+def source_files(source_dir: Path = ROOT) -> list[Path]:
+    """backlinks-tous.csv first so its rows win the dedupe, then the categories by name."""
+    files = sorted(source_dir.glob(SOURCE_GLOB))
+    return sorted(files, key=lambda p: (p.name != ALL_FILE, p.name))
+
+
+def load_backlinks(source_dir: Path = ROOT, table_path: Path = TABLE_FILE, force: bool = False) -> tuple[dict, dict]:
+    """(columns, stats): the columnar tables, rebuilt only when an export changed."""
+    files = source_files(source_dir)
+    digests = {p.name: content_hash(p.read_bytes()) for p in files}
+    fingerprint = content_hash(json.dumps(digests, sort_keys=True))
+    if not force and table_path.exists():
+        with np.load(table_path, allow_pickle=False) as stored:
+            if str(stored['fingerprint']) == fingerprint:
+                columns = {k: stored[k] for k in stored.files if k != 'fingerprint'}
+                return columns, {'files': len(files), 'parsed': 0, 'reused': True}
+
+    cache = HashCache('backlinks', CACHE_VERSION)
+    parsed = []
+    for path in files:
+        rows = None if force else cache.get(path.name, digests[path.name])
+        if rows is None:
+            rows = _json_safe(parse_file(path))
+            cache.put(path.name, digests[path.name], rows)
+        parsed.append(rows)
+    cache.save()
+
+    columns = to_columns(merge(parsed))
+    buf = io.BytesIO()
+    np.savez_compressed(buf, fingerprint=np.array(fingerprint), **columns)
+    write_atomic(table_path, buf.getvalue())
+    return columns, {'files': len(files), 'parsed': cache.misses, 'reused': False}
+
+
+def add_arguments(parser):
+    parser.add_argument('--source-dir', type=Path, default=ROOT)
+    parser.add_argument('--force', action='store_true', help='re-parse every export')
+
+
+def run(args) -> int:
+    columns, stats = load_backlinks(args.source_dir, force=args.force)
+    if not stats['files']:
+        print(f'No {SOURCE_GLOB} found in {args.source_dir} (run node scripts/scrape-backlinks.mjs)')
+        return 1
+    n = len(columns['nom'])
+    located = int(np.count_nonzero(~np.isnan(columns['lat'])))
+    status = 'reused' if stats['reused'] else f"{stats['parsed']} of {stats['files']} files parsed"
+    print(f"{n} entities from {stats['files']} exports ({status}): {located} located, "
+          f"{int(np.count_nonzero(columns['insee']))} with INSEE code, {len(columns['address_entity'])} addresses, "
+          f"{len(columns['phone_entity'])} phones, {len(columns['site_entity'])} sites -> {TABLE_FILE}")
+    return 0
@@ -0,0 +1,163 @@
+"""Python port of parseContentBlocks from src/app/(public)/blog/[slug]/page.tsx.
+
+Keep the two in sync: the linter and stats stages rely on this producing the
+same blocks the page renders. extract_faq ports extractFAQFromBlocks.
+"""
+import re
+import unicodedata
+
+CALLOUT = re.compile(r'^:::(tip|warning|info|takeaway|budget|expert)\s*(.*)$')
+ORDERED_ITEM = re.compile(r'^\d+\.\s')
+TABLE_SEPARATOR = re.compile(r'^\|[\s\-:|]+\|$|^[\s|:\-]+$')
+LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+WORD = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+FAQ_HEADING = re.compile(r'questions?\s+fr[eé]quentes?', re.IGNORECASE)
+
+
+def slugify(text: str) -> str:
+    text = unicodedata.normalize('NFD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return re.sub(r'[^a-z0-9]+', '-', text).strip('-')
+
+
+def split_lines(content: list[str]) -> list[str]:
+    """Flatten content strings into trimmed, non-empty lines."""
+    lines = []
+    for raw in content:
+        for part in raw.split('\n\n'):
+            lines.extend(s.strip() for s in part.split('\n') if s.strip())
+    return lines
+
+
+def table_cells(line: str) -> list[str]:
+    line = line[1:] if line.startswith('|') else line
+    line = line[:-1] if line.endswith('|') else line
+    return [cell.strip() for cell in line.split('|')]
+
+
+def parse_table(lines: list[str]) -> dict | None:
+    if len(lines) < 2:
+        return None
+    headers = table_cells(lines[0])
+    rows = [table_cells(line) for line in lines[1:] if not TABLE_SEPARATOR.match(line)]
+    return {'type': 'table', 'headers': headers, 'rows': rows}
+
+
+def split_spans(lines: list[str]) -> list[tuple[str, list[str]]]:
+    """(kind, source lines) of each block, in order.
+
+    Only looks at line prefixes; parse_span() does the rest, so a span can be
+    parsed (and cached) on its own.
+    """
+    spans = []
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        start = i
+
+        if line.startswith(':::') and not line.startswith(':::end') and line != ':::' and CALLOUT.match(line):
+            i += 1
+            while i < n and lines[i] != ':::':
+                i += 1
+            if i < n:
+                i += 1
+            spans.append(('callout', lines[start:i]))
+            continue
+
+        if line.startswith('## ') or line.startswith('### '):
+            spans.append(('h2' if line.startswith('## ') else 'h3', [line]))
+            i += 1
+            continue
+
+        for kind, is_item in (
+            ('table', lambda s: s.startswith('|')),
+            ('list', lambda s: s.startswith('- ')),
+            ('ordered', lambda s: ORDERED_ITEM.match(s)),
+            ('blockquote', lambda s: s.startswith('> ')),
+        ):
+            if is_item(line) and (kind != 'table' or '|' in line[1:]):
+                while i < n and is_item(lines[i]):
+                    i += 1
+                spans.append((kind, lines[start:i]))
+                break
+        else:
+            spans.append(('p', [line]))
+            i += 1
+    return spans
+
+
+def parse_span(kind: str, span: list[str]) -> dict | None:
+    """The block of one split_spans() span; None for a table too short to render."""
+    if kind == 'callout':
+        m = CALLOUT.match(span[0])
+        body = span[1:-1] if len(span) > 1 and span[-1] == ':::' else span[1:]
+        return {'type': 'callout', 'calloutType': m.group(1), 'title': m.group(2).strip(), 'content': body}
+    if kind == 'h2':
+        text = span[0][3:]
+        return {'type': 'h2', 'text': text, 'id': slugify(text)}
+    if kind == 'h3':
+        text = span[0][4:]
+        return {'type': 'h3', 'text': text, 'id': slugify(text)}
+    if kind == 'table':
+        return parse_table(span)
+    if kind == 'list':
+        return {'type': 'list', 'ordered': False, 'items': [s[2:] for s in span]}
+    if kind == 'ordered':
+        return {'type': 'list', 'ordered': True, 'items': [ORDERED_ITEM.sub('', s, 1) for s in span]}
+    if kind == 'blockquote':
+        return {'type': 'blockquote', 'text': ' '.join(s[2:] for s in span)}
+    return {'type': 'p', 'text': span[0]}
+
+
+def parse_blocks(content: list[str]) -> list[dict]:
+    blocks = (parse_span(kind, span) for kind, span in split_spans(split_lines(content)))
+    return [block for block in blocks if block is not None]
+
+
+def extract_faq(blocks: list[dict]) -> list[dict]:
+    """{question, answer} from the ### questions under a `## Questions fréquentes` heading."""
+    faqs = []
+    in_faq = False
+    for i, block in enumerate(blocks):
+        if block['type'] == 'h2':
+            if in_faq:
+                break
+            in_faq = bool(FAQ_HEADING.search(block['text']))
+            continue
+        if in_faq and block['type'] == 'h3':
+            answer = []
+            for following in blocks[i + 1:]:
+                if following['type'] in ('h2', 'h3'):
+                    break
+                if following['type'] == 'p':
+                    answer.append(following['text'])
+                elif following['type'] == 'list':
+                    answer.append('. '.join(following['items']))
+            if answer:
+                faqs.append({'question': block['text'], 'answer': ' '.join(answer)})
+    return faqs
+
+
+def inline_text(block: dict) -> list[str]:
+    """The inline-markdown strings a block displays."""
+    kind = block['type']
+    if kind == 'table':
+        return block['headers'] + [cell for row in block['rows'] for cell in row]
+    if kind == 'list':
+        return block['items']
+    if kind == 'callout':
+        return [block['title'], *block['content']]
+    return [block['text']]
+
+
+def block_counts(block: dict) -> list[int]:
+    """[words, internal links, external links] of one block."""
+    words = internal = external = 0
+    for text in inline_text(block):
+        for m in LINK.finditer(text):
+            if m.group(2).startswith(('http://', 'https://')):
+                external += 1
+            else:
+                internal += 1
+        words += len(WORD.findall(LINK.sub(r'\1', text)))
+    return [words, internal, external]
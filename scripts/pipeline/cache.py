@@ -0,0 +1,61 @@
+"""Content-hash caches persisted between pipeline runs."""
+import hashlib
+import json
+
+from .files import write_atomic
+from .paths import CACHE_DIR
+
+
+def content_hash(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class HashCache:
+    """`key -> (digest, value)` store saved as JSON under .pipeline-cache/.
+
+    Entries not read or written during a run are dropped on save, so the
+    cache never outgrows the current inputs.
+    """
+
+    def __init__(self, name: str, version: int = 1):
+        self.path = CACHE_DIR / f'{name}.json'
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, list] = {}
+        self._seen: set[str] = set()
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+            if stored.get('version') == version:
+                self._entries = stored['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, key: str, digest: str, default=None):
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == digest:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return default
+
+    def put(self, key: str, digest: str, value=None):
+        self._seen.add(key)
+        self._entries[key] = [digest, value]
+
+    def unseen(self) -> list[str]:
+        """Keys stored by a previous run and not read or written by this one."""
+        return [k for k in self._entries if k not in self._seen]
+
+    def save(self):
+        entries = {k: v for k, v in self._entries.items() if k in self._seen}
+        payload = json.dumps({'version': self.version, 'entries': entries}, ensure_ascii=False, separators=(',', ':'))
+        write_atomic(self.path, payload.encode('utf-8'))
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,342 @@
+"""Emit the cms_pages seed as one COPY-ready file, plus the delta not yet loaded.
+
+scripts/seed-cms.ts checks and inserts its entries one request at a time
+and never seeds the blog. This stage builds the same entries from its
+literals (staticPages, homepageSeed, faqSeed, servicesSlugs, emergencySlugs),
+adds one `blog` row per article of the assembled corpus (title, excerpt as
+meta_description, author, category, tags, read time) and, with
+`--locations`, one `location` row per service x ville, then writes under
+scripts/output/cms-seed:
+
+    seed.csv       every row, COPY (FORMAT csv) ready, with a seed_hash column
+    load-all.sql   psql script: \\copy seed.csv + one INSERT ... ON CONFLICT
+    loaded.csv     key and seed_hash of every row loaded into the database,
+                   rewritten only by a successful `--load`
+    changes.csv    the rows of seed.csv missing from loaded.csv or changed
+    load.sql       the same script over changes.csv
+    summary.json   row counts per page_type and the added/changed/removed keys
+
+seed.csv, load-all.sql and loaded.csv are committed; the delta files are
+local (gitignored). The delta is taken against what was last loaded, not
+against the previous run: generating twice before a load keeps every
+pending row in changes.csv, and an unchanged tree rewrites nothing.
+`--load` runs load.sql with psql on $DATABASE_URL and, once it commits,
+records the loaded hashes in loaded.csv. `--against` diffs against another
+snapshot (another database); without any snapshot every row is pending.
+
+A row is keyed like the cms_pages_slug_type_uniq index (slug, page_type,
+service_slug, location_slug) and hashed over its seeded fields, so the delta
+is exact and re-seeding only ships what moved. The upsert inserts missing
+rows as drafts and refreshes a seeded row only while it is an untouched
+draft (no content, never saved from the admin), so loading either script
+twice, or after edits, is harmless. Rows that left the seed are reported,
+never deleted.
+
+`--verify` replays load-all and load into an SQLite stand-in of cms_pages
+with the same unique index and checks the result against the seed.
+"""
+import csv
+import io
+import json
+import os
+import re
+import sqlite3
+import subprocess
+from pathlib import Path
+
+from .cache import content_hash
+from .corpus import load_articles
+from .files import write_if_changed
+from .france import FRANCE_FILE, load_france
+from .paths import ROOT, SCRIPTS_OUTPUT_DIR
+from .quality import _relative
+from .tsliteral import load_const
+
+SEED_FILE = ROOT / 'scripts' / 'seed-cms.ts'
+OUT_DIR = SCRIPTS_OUTPUT_DIR / 'cms-seed'
+LOADED_FILE = OUT_DIR / 'loaded.csv'
+
+COLUMNS = ('slug', 'page_type', 'title', 'meta_description', 'service_slug', 'location_slug',
+           'excerpt', 'author', 'author_bio', 'category', 'tags', 'read_time')
+KEY = ('slug', 'page_type', 'service_slug', 'location_slug')
+
+# Column limits of migration 305_cms_schema.sql (and cms-utils.ts)
+_SLUG = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+MAX_LENGTH = {'slug': 200, 'title': 500, 'meta_description': 170, 'excerpt': 1000,
+              'author': 200, 'author_bio': 2000, 'category': 200, 'read_time': 50}
+
+STAGE_TABLE = '''CREATE TEMP TABLE cms_seed (
+  slug text NOT NULL, page_type text NOT NULL, title text NOT NULL, meta_description text,
+  service_slug text, location_slug text, excerpt text, author text, author_bio text,
+  category text, tags {tags}, read_time text, seed_hash text NOT NULL
+){on_commit};
+'''
+
+# Shared by the psql scripts and the SQLite stand-in
+UPSERT = '''INSERT INTO cms_pages (slug, page_type, title, meta_description, service_slug, location_slug,
+                       excerpt, author, author_bio, category, tags, read_time, status, is_active)
+SELECT slug, page_type, title, meta_description, service_slug, location_slug,
+       excerpt, author, author_bio, category, COALESCE(tags, '{}'), read_time, 'draft', true
+FROM cms_seed WHERE true
+ON CONFLICT (slug, page_type, COALESCE(service_slug, ''), COALESCE(location_slug, '')) WHERE is_active = true
+DO UPDATE SET title = excluded.title, meta_description = excluded.meta_description, excerpt = excluded.excerpt,
+              author = excluded.author, author_bio = excluded.author_bio, category = excluded.category,
+              tags = excluded.tags, read_time = excluded.read_time, updated_at = CURRENT_TIMESTAMP
+WHERE cms_pages.status = 'draft' AND cms_pages.updated_by IS NULL
+  AND cms_pages.content_html IS NULL AND cms_pages.content_json IS NULL;
+'''
+
+# Run from the repository root: psql "$DATABASE_URL" -f <out>/load.sql
+LOAD_SQL = '''-- Generated by python3 -m scripts.pipeline cms ({rows} rows)
+BEGIN;
+{stage}\\copy cms_seed FROM '{csv}' WITH (FORMAT csv, HEADER true)
+{upsert}COMMIT;
+'''
+
+# Columns of cms_pages the stand-in needs, same defaults and unique index
+STANDIN_SCHEMA = '''CREATE TABLE cms_pages (
+  id integer PRIMARY KEY, slug text NOT NULL, page_type text NOT NULL, title text NOT NULL,
+  content_json text, content_html text, meta_description text, excerpt text, author text,
+  author_bio text, category text, tags text DEFAULT '{}', read_time text, service_slug text,
+  location_slug text, status text NOT NULL DEFAULT 'draft', is_active boolean NOT NULL DEFAULT true,
+  updated_by text, updated_at text
+);
+CREATE UNIQUE INDEX cms_pages_slug_type_uniq
+  ON cms_pages(slug, page_type, COALESCE(service_slug, ''), COALESCE(location_slug, ''))
+  WHERE is_active = true;
+'''
+
+
+def capitalize(slug: str) -> str:
+    """capitalize() of seed-cms.ts."""
+    return slug[:1].upper() + slug[1:].replace('-', ' ')
+
+
+def _row(**fields) -> dict:
+    return {column: fields.get(column) for column in COLUMNS}
+
+
+def _meta(text: str, limit: int = MAX_LENGTH['meta_description']) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rsplit(' ', 1)[0].rstrip(' ,;:.') + '…'
+
+
+def seed_rows(seed: dict, articles: dict[str, dict], villes: list[dict] | None = None) -> list[dict]:
+    """Every seed row, in seed-cms.ts order, then blog, then location rows."""
+    rows = [_row(**entry) for entry in (*seed['staticPages'], seed['homepageSeed'], seed['faqSeed'])]
+    services = seed['servicesSlugs']
+    rows += [_row(slug=s, page_type='service', title=capitalize(s) + ' en France', service_slug=s) for s in services]
+    rows += [_row(slug=s + '-tarifs', page_type='static', title='Tarifs ' + capitalize(s).lower() + ' 2026',
+                  meta_description='Guide des prix ' + capitalize(s).lower() + ' en 2026. Tarifs détaillés par prestation.')
+             for s in services]
+    rows += [_row(slug=s + '-urgence', page_type='static', title=capitalize(s) + ' urgence 24h/24',
+                  meta_description=capitalize(s) + ' en urgence. Intervention rapide 24h/24 et 7j/7.')
+             for s in seed['emergencySlugs']]
+    rows += [
+        _row(slug=slug, page_type='blog', title=a['title'], meta_description=_meta(a['excerpt']),
+             excerpt=a['excerpt'], author=a.get('author'), author_bio=a.get('authorBio'),
+             category=a.get('category'), tags=a.get('tags') or None, read_time=a.get('readTime'))
+        for slug, a in articles.items()
+    ]
+    for ville in villes or ():
+        rows += [_row(slug=f"{s}-{ville['slug']}", page_type='location', title=f"{capitalize(s)} à {ville['name']}",
+                      service_slug=s, location_slug=ville['slug']) for s in services]
+    return rows
+
+
+def validate(rows: list[dict]) -> list[str]:
+    """Rows the cms_pages constraints would reject, as messages."""
+    errors, seen = [], set()
+    for row in rows:
+        key = row_key(row)
+        if key in seen:
+            errors.append(f'duplicate key {key}')
+        seen.add(key)
+        for column in ('slug', 'service_slug', 'location_slug'):
+            if row[column] is not None and not _SLUG.match(row[column]):
+                errors.append(f'{key}: bad {column} {row[column]!r}')
+        for column, limit in MAX_LENGTH.items():
+            if row[column] is not None and len(row[column]) > limit:
+                errors.append(f'{key}: {column} longer than {limit}')
+    return errors
+
+
+def row_key(row: dict) -> str:
+    return '/'.join(row[column] or '' for column in KEY)
+
+
+def row_hash(row: dict) -> str:
+    return content_hash(json.dumps([row[column] for column in COLUMNS], ensure_ascii=False))
+
+
+def pg_array(values: list[str] | None) -> str | None:
+    """text[] literal for COPY: {"a","b c"}."""
+    if values is None:
+        return None
+    return '{' + ','.join('"' + v.replace('\\', '\\\\').replace('"', '\\"') + '"' for v in values) + '}'
+
+
+def render_csv(rows: list[dict]) -> str:
+    # an unquoted empty field is NULL for COPY csv, which is what None should be
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow((*COLUMNS, 'seed_hash'))
+    for row in rows:
+        writer.writerow([pg_array(row[c]) if c == 'tags' else row[c] for c in COLUMNS] + [row_hash(row)])
+    return buffer.getvalue()
+
+
+def read_hashes(path: Path) -> dict[str, str]:
+    """Key -> seed_hash of a loaded.csv snapshot (or a seed.csv); empty when there is none."""
+    if not path.exists():
+        return {}
+    with path.open(encoding='utf-8', newline='') as f:
+        return {row_key({c: row[c] or None for c in KEY}): row['seed_hash'] for row in csv.DictReader(f)}
+
+
+def render_loaded(hashes: dict[str, str]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow((*KEY, 'seed_hash'))
+    for key, digest in hashes.items():
+        writer.writerow([*key.split('/'), digest])
+    return buffer.getvalue()
+
+
+def diff(rows: list[dict], previous: dict[str, str]) -> tuple[list[dict], dict]:
+    """(added or changed rows, summary of the delta)."""
+    added, changed, delta = [], [], []
+    for row in rows:
+        key, digest = row_key(row), row_hash(row)
+        if key not in previous:
+            added.append(key)
+        elif previous[key] != digest:
+            changed.append(key)
+        else:
+            continue
+        delta.append(row)
+    current = {row_key(row) for row in rows}
+    removed = [key for key in previous if key not in current]
+    return delta, {'added': added, 'changed': changed, 'removed': removed,
+                   'unchanged': len(rows) - len(delta)}
+
+
+def load_sql(csv_path: Path, rows: int) -> str:
+    return LOAD_SQL.format(rows=rows, csv=_relative(csv_path), upsert=UPSERT,
+                           stage=STAGE_TABLE.format(tags='text[]', on_commit=' ON COMMIT DROP'))
+
+
+def _standin_load(db: sqlite3.Connection, text: str):
+    db.executescript('DROP TABLE IF EXISTS temp.cms_seed;\n' + STAGE_TABLE.format(tags='text', on_commit=''))
+    records = list(csv.DictReader(io.StringIO(text)))
+    db.executemany(f"INSERT INTO cms_seed VALUES ({', '.join('?' * (len(COLUMNS) + 1))})",
+                   [[r[c] or None for c in (*COLUMNS, 'seed_hash')] for r in records])
+    db.executescript(UPSERT)
+
+
+def verify(seed_csv: str, changes_csv: str) -> list[str]:
+    """Replay the scripts into an SQLite stand-in; returns the mismatches."""
+    db = sqlite3.connect(':memory:')
+    db.executescript(STANDIN_SCHEMA)
+    _standin_load(db, changes_csv)
+    _standin_load(db, seed_csv)
+    # an edited page must survive re-seeding
+    db.execute("UPDATE cms_pages SET updated_by = 'admin', title = title || ' (edited)' WHERE id = 1")
+    _standin_load(db, seed_csv)
+    _standin_load(db, changes_csv)
+
+    stored = {
+        '/'.join(v or '' for v in row[:4]): row[4:]
+        for row in db.execute('SELECT slug, page_type, service_slug, location_slug, title, meta_description, '
+                              'tags, updated_by FROM cms_pages')
+    }
+    errors = []
+    expected = list(csv.DictReader(io.StringIO(seed_csv)))
+    for record in expected:
+        key = row_key({c: record[c] or None for c in KEY})
+        if key not in stored:
+            errors.append(f'{key}: missing')
+            continue
+        title, meta, tags, edited = stored[key]
+        if edited:
+            if not title.endswith(' (edited)'):
+                errors.append(f'{key}: edited page overwritten')
+        elif (title, meta or '', tags) != (record['title'], record['meta_description'], record['tags'] or '{}'):
+            errors.append(f'{key}: stale row')
+    if len(stored) != len(expected):
+        errors.append(f'{len(stored)} rows stored for {len(expected)} seeded')
+    return errors
+
+
+def load(script: Path) -> bool:
+    """Run a load script with psql on $DATABASE_URL; True once it committed."""
+    url = os.environ.get('DATABASE_URL')
+    if not url:
+        print('DATABASE_URL is not set')
+        return False
+    try:
+        result = subprocess.run(['psql', url, '-v', 'ON_ERROR_STOP=1', '-q', '-f', str(script)], cwd=ROOT)
+    except FileNotFoundError:
+        print('psql not found')
+        return False
+    return result.returncode == 0
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='output directory')
+    parser.add_argument('--against', type=Path, default=None,
+                        help='snapshot of the loaded rows to diff against (default: loaded.csv in --out)')
+    parser.add_argument('--locations', action='store_true', help='also seed one location page per service x ville')
+    parser.add_argument('--verify', action='store_true', help='replay the scripts into an SQLite stand-in of cms_pages')
+    parser.add_argument('--load', action='store_true',
+                        help='run load.sql with psql on $DATABASE_URL, then record the rows as loaded')
+
+
+def run(args) -> int:
+    seed = {name: load_const(SEED_FILE, name)
+            for name in ('staticPages', 'homepageSeed', 'faqSeed', 'servicesSlugs', 'emergencySlugs')}
+    villes = load_france(FRANCE_FILE)[0] if args.locations else None
+    rows = seed_rows(seed, load_articles(), villes)
+    errors = validate(rows)
+    for error in errors[:20]:
+        print(f'  {error}')
+    if errors:
+        print(f'{len(errors)} seed rows would be rejected by cms_pages')
+        return 1
+
+    baseline = args.against or args.out / LOADED_FILE.name
+    loaded = read_hashes(baseline)
+    delta, summary = diff(rows, loaded)
+    seed_csv, changes_csv = render_csv(rows), render_csv(delta)
+    write_if_changed(args.out / 'seed.csv', seed_csv)
+    write_if_changed(args.out / 'changes.csv', changes_csv)
+    write_if_changed(args.out / 'load.sql', load_sql(args.out / 'changes.csv', len(delta)))
+    write_if_changed(args.out / 'load-all.sql', load_sql(args.out / 'seed.csv', len(rows)))
+    by_type: dict[str, int] = {}
+    for row in rows:
+        by_type[row['page_type']] = by_type.get(row['page_type'], 0) + 1
+    write_if_changed(args.out / 'summary.json', json.dumps(
+        {'rows': len(rows), 'pageTypes': by_type, **summary}, ensure_ascii=False, indent=1) + '\n')
+    print(f"{len(rows):,} seed rows ({', '.join(f'{n:,} {t}' for t, n in by_type.items())}): "
+          f"{len(summary['added']):,} added, {len(summary['changed']):,} changed, "
+          f"{len(summary['removed']):,} removed since {_relative(baseline)} -> {args.out}")
+
+    if args.verify:
+        problems = verify(seed_csv, changes_csv)
+        for problem in problems[:20]:
+            print(f'  {problem}')
+        print(f"SQLite stand-in: {'OK' if not problems else f'{len(problems)} mismatches'}")
+        if problems:
+            return 1
+    if args.load:
+        if not delta:
+            print(f'Nothing to load: the database matches {_relative(baseline)}')
+            return 0
+        if not load(args.out / 'load.sql'):
+            print(f'Load failed: {_relative(baseline)} left as is')
+            return 1
+        # rows that left the seed stay in cms_pages, so they stay in the snapshot
+        write_if_changed(baseline, render_loaded({**loaded, **{row_key(r): row_hash(r) for r in delta}}))
+        print(f'Loaded {len(delta):,} rows, recorded in {_relative(baseline)}')
+    return 0
@@ -0,0 +1,99 @@
+"""Compact the INSEE commune table read by src/lib/insee-resolver.ts.
+
+insee-communes.json maps ~35 000 codes to `{n, r, d}` objects, which costs
+2 MB of JSON and one object per commune on the heap. The compact form keeps
+the same data as parallel arrays:
+
+- `codes`: every code, sorted, concatenated at a fixed width of 5 characters
+  (binary search with substring compares, no per-code string);
+- `names`: string table of commune names;
+- `communes`: one integer per code, `nameId << DEPT_BITS | deptId`;
+- `departements` / `regions`: small enum tables (each department has exactly
+  one region, so the region id lives on the department);
+- `byName`: code positions ordered by accent-normalized name, so the reverse
+  lookup is a binary search instead of a map built on first use.
+
+Paris, Marseille and Lyon arrondissement codes are folded in under the name
+of their parent commune.
+"""
+import json
+import unicodedata
+from pathlib import Path
+
+from .files import write_if_changed
+from .paths import SRC_DATA_DIR
+
+SOURCE_FILE = SRC_DATA_DIR / 'insee-communes.json'
+OUT_FILE = SRC_DATA_DIR / 'insee-communes.compact.json'
+
+CODE_LEN = 5
+DEPT_BITS = 7
+
+# (parent commune code, first arrondissement, last arrondissement)
+ARRONDISSEMENTS = (
+    ('75056', 75101, 75120),  # Paris
+    ('13055', 13201, 13216),  # Marseille
+    ('69123', 69381, 69389),  # Lyon
+)
+
+
+def normalize_name(name: str) -> str:
+    """Same as _normalize in insee-resolver.ts: lowercase, strip U+0300-U+036F, trim."""
+    name = unicodedata.normalize('NFD', name.lower())
+    return ''.join(c for c in name if not '\u0300' <= c <= '\u036f').strip()
+
+
+def with_arrondissements(communes: dict[str, dict]) -> dict[str, dict]:
+    out = dict(communes)
+    for parent, first, last in ARRONDISSEMENTS:
+        for code in range(first, last + 1):
+            out.setdefault(str(code), communes[parent])
+    return out
+
+
+def compact(communes: dict[str, dict]) -> dict:
+    codes = sorted(communes)
+    bad = [c for c in codes if len(c) != CODE_LEN]
+    if bad:
+        raise ValueError(f'INSEE codes must be {CODE_LEN} characters: {", ".join(bad[:5])}')
+
+    dept_region = {}
+    for code in codes:
+        entry = communes[code]
+        if dept_region.setdefault(entry['d'], entry['r']) != entry['r']:
+            raise ValueError(f"department {entry['d']} is listed under several regions")
+    regions = sorted(set(dept_region.values()))
+    departements = sorted(dept_region)
+    if len(departements) >= 1 << DEPT_BITS:
+        raise ValueError(f'{len(departements)} departments do not fit in {DEPT_BITS} bits')
+    region_id = {r: i for i, r in enumerate(regions)}
+    dept_id = {d: i for i, d in enumerate(departements)}
+
+    names = sorted({communes[c]['n'] for c in codes}, key=lambda n: (normalize_name(n), n))
+    name_id = {n: i for i, n in enumerate(names)}
+
+    return {
+        'regions': regions,
+        'departements': [[d, region_id[dept_region[d]]] for d in departements],
+        'names': names,
+        'codes': ''.join(codes),
+        'communes': [name_id[communes[c]['n']] << DEPT_BITS | dept_id[communes[c]['d']] for c in codes],
+        # sorted() is stable and codes are sorted, so equal names keep code order
+        'byName': sorted(range(len(codes)), key=lambda i: normalize_name(communes[codes[i]]['n'])),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--source', type=Path, default=SOURCE_FILE)
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+
+
+def run(args) -> int:
+    communes = json.loads(args.source.read_text(encoding='utf-8'))
+    table = compact(with_arrondissements(communes))
+    data = json.dumps(table, ensure_ascii=False, separators=(',', ':')) + '\n'
+    changed = write_if_changed(args.out, data)
+    print(f"{len(table['communes'])} communes ({len(communes)} + arrondissements), {len(table['names'])} names, "
+          f"{len(table['departements'])} departements: {args.source.stat().st_size:,} -> {len(data.encode()):,} bytes "
+          f"-> {args.out} ({'updated' if changed else 'unchanged'})")
+    return 0
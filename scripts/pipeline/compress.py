@@ -0,0 +1,107 @@
+"""Write precompressed .br and .gz siblings for every emitted file.
+
+Both use their maximum level (brotli q11, gzip -9); that is too slow to do per
+request but costs nothing here because unchanged files are skipped by content
+hash. gzip output is written with mtime=0 so rebuilds are byte-identical.
+
+next.config.js rewrites a /data request to its .br (or .gz) sibling when the
+client accepts it and sets Content-Encoding and the type of the source, so
+every COMPRESSIBLE file gets both siblings, even a tiny one: the rewrite
+cannot tell whether a sibling exists. Keep COMPRESSIBLE in step with
+PRECOMPRESSED_TYPES there.
+"""
+import gzip
+from pathlib import Path
+
+from .cache import HashCache, content_hash
+from .files import write_atomic
+from .parallel import pool_map
+from .paths import OUT_DIR
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE = {'.json', '.ndjson', '.xml', '.html', '.txt', '.js', '.css', '.svg', '.csv', '.sqlite', '.msgpack'}
+SIBLINGS = ('.br', '.gz')
+
+
+def _sibling(path: Path, ext: str) -> Path:
+    return path.with_name(path.name + ext)
+
+
+def _compress_file(path: str) -> tuple[str, int, int, int]:
+    """Worker: (path, raw size, br size, gz size)."""
+    src = Path(path)
+    data = src.read_bytes()
+    encoded = {'.br': brotli.compress(data, quality=11), '.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    for ext, blob in encoded.items():
+        write_atomic(_sibling(src, ext), blob)
+    return path, len(data), len(encoded['.br']), len(encoded['.gz'])
+
+
+def find_sources(root: Path) -> list[Path]:
+    return sorted(p for p in root.rglob('*') if p.is_file() and p.suffix in COMPRESSIBLE)
+
+
+def prune_orphans(root: Path, cache: HashCache) -> int:
+    """Remove the siblings this stage wrote for sources that are gone.
+
+    Only files known to the cache are touched: the sitemap stage writes its
+    own .xml.gz chunks, which have no source next to them.
+    """
+    removed = 0
+    for key in cache.unseen():
+        for ext in SIBLINGS:
+            sib = _sibling(root / key, ext)
+            if sib.is_file() and not (root / key).is_file():
+                sib.unlink()
+                removed += 1
+    return removed
+
+
+def compress_tree(root: Path = OUT_DIR, workers: int | None = None, force: bool = False) -> dict:
+    cache = HashCache('compress', version=3)
+    todo: list[tuple[str, str]] = []
+    sources = find_sources(root)
+    for src in sources:
+        key = src.relative_to(root).as_posix()
+        digest = content_hash(src.read_bytes())
+        fresh = cache.get(key, digest) is not None
+        if force or not fresh or not all(_sibling(src, ext).exists() for ext in SIBLINGS):
+            todo.append((key, digest))
+
+    results = pool_map(_compress_file, [str(root / key) for key, _ in todo], workers, min_parallel=16)
+    raw = br = gz = 0
+    for (key, digest), (_, raw_size, br_size, gz_size) in zip(todo, results):
+        cache.put(key, digest, [raw_size, br_size, gz_size])
+        raw, br, gz = raw + raw_size, br + br_size, gz + gz_size
+    removed = prune_orphans(root, cache)
+    cache.save()
+    return {
+        'files': len(sources),
+        'compressed': len(todo),
+        'skipped': len(sources) - len(todo),
+        'raw': raw,
+        'br': br,
+        'gz': gz,
+        'removed': removed,
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--root', type=Path, default=OUT_DIR, help='directory to compress')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='ignore the hash cache')
+
+
+def run(args):
+    if brotli is None:
+        print('brotli is not installed (pip install -r scripts/pipeline/requirements.txt)')
+        return 1
+    s = compress_tree(args.root, args.workers, args.force)
+    print(f"Compressed {s['compressed']}/{s['files']} files ({s['skipped']} unchanged, "
+          f"{s['removed']} stale siblings removed)")
+    if s['raw']:
+        print(f"  {s['raw']} bytes -> br {s['br'] / s['raw']:.1%}, gz {s['gz'] / s['raw']:.1%}")
@@ -0,0 +1,194 @@
+"""Shard the hand-maintained content collections of src/lib/data.
+
+trade-content.ts, problems.ts and guides.ts stay the edited sources. Pages
+that render one entry or a list of cards pulled the whole collection into
+their bundle, and problems.ts / guides.ts answered every lookup with a
+find/filter scan. For each collection this stage writes:
+
+- <source>-index.ts: slug -> position, grouping indexes (problems by service,
+  guides by category and trade) and metadata-only summaries for listing and
+  card rendering, plus a loader that imports a single entry;
+- <source>-shards/<slug>.ts: one full entry per file, loaded on demand.
+
+Collections are described declaratively in COLLECTIONS, so another literal
+only needs a new entry there. `--check` fails on stale files, for CI.
+"""
+import re
+from pathlib import Path
+
+from .paths import SRC_DATA_DIR
+from .tsemit import generated_header, render_module, ts_const, write_module
+from .tsliteral import extract_const
+
+# source: module under src/lib/data; const: literal read from it (array, or
+# record keyed by slug); type: its entry interface; name / plural: used for the
+# generated identifiers; summary: fields kept in the index; groups: group name
+# -> entry fields whose values (string or string[]) are the group keys.
+COLLECTIONS = (
+    {
+        'source': 'trade-content',
+        'const': 'tradeContent',
+        'type': 'TradeContent',
+        'name': 'TradeContent',
+        'plural': 'TRADE_CONTENTS',
+        'summary': ('slug', 'name', 'priceRange', 'averageResponseTime'),
+        'groups': {},
+    },
+    {
+        'source': 'problems',
+        'const': 'problems',
+        'type': 'Problem',
+        'name': 'Problem',
+        'plural': 'PROBLEMS',
+        'summary': ('slug', 'name', 'description', 'primaryService', 'relatedServices', 'urgencyLevel',
+                    'estimatedCost', 'averageResponseTime', 'seasonality'),
+        'groups': {'service': ('primaryService', 'relatedServices')},
+    },
+    {
+        'source': 'guides',
+        'const': 'guides',
+        'type': 'Guide',
+        'name': 'Guide',
+        'plural': 'GUIDES',
+        'summary': ('slug', 'title', 'metaDescription', 'category', 'trade', 'readingTime', 'lastUpdated',
+                    'relatedServices'),
+        'groups': {'category': ('category',), 'trade': ('trade',)},
+    },
+)
+
+_SLUG = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+
+
+def _upper(name: str) -> str:
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).upper()
+
+
+def _lower(name: str) -> str:
+    return name[0].lower() + name[1:]
+
+
+def load_entries(spec: dict, data_dir: Path = SRC_DATA_DIR) -> list[dict]:
+    """Entries in source order; a record literal keeps its insertion order."""
+    value = extract_const((data_dir / f"{spec['source']}.ts").read_text(encoding='utf-8'), spec['const'])
+    entries = list(value.values()) if isinstance(value, dict) else value
+    slugs = [e['slug'] for e in entries]
+    bad = [s for s in slugs if not _SLUG.match(s)]
+    if bad:
+        raise ValueError(f"{spec['source']}.ts: slugs are used as file names and must be kebab-case: {', '.join(bad)}")
+    if len(set(slugs)) != len(slugs):
+        dupes = sorted({s for s in slugs if slugs.count(s) > 1})
+        raise ValueError(f"{spec['source']}.ts: duplicate slugs {', '.join(dupes)}")
+    return entries
+
+
+def group_keys(entry: dict, fields: tuple[str, ...]) -> list[str]:
+    keys = []
+    for field in fields:
+        value = entry.get(field)
+        for key in value if isinstance(value, list) else [value]:
+            if key and key not in keys:
+                keys.append(key)
+    return keys
+
+
+def build_index(spec: dict, entries: list[dict]) -> dict:
+    groups = {}
+    for group, fields in spec['groups'].items():
+        positions: dict[str, list[int]] = {}
+        for i, entry in enumerate(entries):
+            for key in group_keys(entry, fields):
+                positions.setdefault(key, []).append(i)
+        groups[group] = dict(sorted(positions.items()))
+    return {
+        'index': {e['slug']: i for i, e in enumerate(entries)},
+        'summaries': [{k: e[k] for k in spec['summary'] if k in e} for e in entries],
+        'groups': groups,
+    }
+
+
+def render_index(spec: dict, index: dict) -> list[str]:
+    name, type_, source = spec['name'], spec['type'], spec['source']
+    upper, summaries = _upper(name), f"{_lower(name)}Summaries"
+    picked = ' | '.join(f"'{k}'" for k in spec['summary'])
+    parts = [
+        generated_header('content', f'src/lib/data/{source}.ts'),
+        f"import type {{ {type_} }} from './{source}'\n\n"
+        f"/** {type_} sans les champs de contenu, pour les listes et les cartes */\n"
+        f"export type {name}Summary = Pick<{type_}, {picked}>",
+        ts_const(f'{upper}_INDEX', 'Record<string, number>', index['index'], doc=f'Slug -> position dans `{spec["const"]}`'),
+        ts_const(summaries, f'{name}Summary[]', index['summaries'], doc=f'Mêmes entrées et même ordre que `{spec["const"]}`'),
+    ]
+    for group, positions in index['groups'].items():
+        parts.append(ts_const(f"{spec['plural']}_BY_{group.upper()}", 'Record<string, number[]>', positions,
+                              doc=f'{group.title()} -> positions, dans l\'ordre de `{spec["const"]}`'))
+    functions = [
+        'function has(index: Record<string, unknown>, key: string): boolean {\n'
+        '  return Object.prototype.hasOwnProperty.call(index, key)\n'
+        '}',
+        f'export function get{name}Summary(slug: string): {name}Summary | undefined {{\n'
+        f'  return has({upper}_INDEX, slug) ? {summaries}[{upper}_INDEX[slug]] : undefined\n'
+        '}',
+    ]
+    for group in index['groups']:
+        const = f"{spec['plural']}_BY_{group.upper()}"
+        functions.append(
+            f'export function get{name}SummariesBy{group.title()}({group}: string): {name}Summary[] {{\n'
+            f'  return has({const}, {group}) ? {const}[{group}].map((i) => {summaries}[i]) : []\n'
+            '}')
+    functions.append(
+        f'/** Entrée complète, chargée seule depuis son shard */\n'
+        f'export async function load{name}(slug: string): Promise<{type_} | undefined> {{\n'
+        f'  if (!has({upper}_INDEX, slug)) return undefined\n'
+        f'  const shard: {{ entry: {type_} }} = await import(`./{source}-shards/${{slug}}`)\n'
+        '  return shard.entry\n'
+        '}')
+    return parts + ['\n\n'.join(functions) + '\n']
+
+
+def render_shard(spec: dict, entry: dict) -> list[str]:
+    return [
+        generated_header('content', f"src/lib/data/{spec['source']}.ts"),
+        f"import type {{ {spec['type']} }} from '../{spec['source']}'",
+        ts_const('entry', spec['type'], entry),
+    ]
+
+
+def outputs(spec: dict, entries: list[dict], data_dir: Path = SRC_DATA_DIR) -> dict[Path, list[str]]:
+    files = {data_dir / f"{spec['source']}-index.ts": render_index(spec, build_index(spec, entries))}
+    for entry in entries:
+        files[data_dir / f"{spec['source']}-shards" / f"{entry['slug']}.ts"] = render_shard(spec, entry)
+    return files
+
+
+def shard_dirs(data_dir: Path = SRC_DATA_DIR) -> list[Path]:
+    return [data_dir / f"{spec['source']}-shards" for spec in COLLECTIONS]
+
+
+def add_arguments(parser):
+    parser.add_argument('--check', action='store_true', help='fail if a generated file is out of date instead of writing it')
+
+
+def run(args) -> int:
+    files: dict[Path, list[str]] = {}
+    counts = []
+    for spec in COLLECTIONS:
+        entries = load_entries(spec)
+        files.update(outputs(spec, entries))
+        counts.append(f"{len(entries)} {spec['const']}")
+    stale_shards = {path for directory in shard_dirs() for path in directory.glob('*.ts')} - set(files)
+    if args.check:
+        stale = [path for path, parts in files.items()
+                 if not path.exists() or path.read_text(encoding='utf-8') != render_module(parts)]
+        stale += sorted(stale_shards)
+        for path in stale:
+            print(f'{path} is out of date')
+        if stale:
+            print('Run python3 -m scripts.pipeline content')
+            return 1
+        print(f'{len(files)} generated files are up to date')
+        return 0
+    written = sum(write_module(path, parts) for path, parts in files.items())
+    for path in sorted(stale_shards):
+        path.unlink()
+    print(f"Sharded {', '.join(counts)} into {len(files)} files ({written} updated, {len(stale_shards)} removed)")
+    return 0
@@ -0,0 +1,61 @@
+"""Load the blog corpus exactly as src/lib/data/blog/articles.ts assembles it."""
+import pickle
+import re
+from pathlib import Path
+
+from .cache import content_hash
+from .files import write_atomic
+from .paths import BLOG_DIR, CACHE_DIR
+from .tsliteral import extract_const
+
+_IMPORT = re.compile(r"^import\s*\{\s*(\w+)\s*\}\s*from\s*'\./([\w-]+)'", re.MULTILINE)
+_ALL_ARTICLES = re.compile(r'export const allArticles[^=]*=\s*\{(.*?)\n\}', re.DOTALL)
+_SPREAD = re.compile(r'\.\.\.(\w+)')
+
+
+def batch_order(blog_dir: Path = BLOG_DIR) -> list[tuple[str, str]]:
+    """(module stem, export name) for every batch, in `allArticles` spread order."""
+    src = (blog_dir / 'articles.ts').read_text(encoding='utf-8')
+    modules = {name: stem for name, stem in _IMPORT.findall(src)}
+    body = _ALL_ARTICLES.search(src)
+    if not body:
+        raise ValueError('allArticles not found in articles.ts')
+    return [(modules[name], name) for name in _SPREAD.findall(body.group(1))]
+
+
+def _load_batch(path: Path, name: str) -> dict:
+    """Parse one batch module, reusing the pickled result while the file is unchanged."""
+    src = path.read_text(encoding='utf-8')
+    digest = content_hash(src)
+    cached = CACHE_DIR / 'corpus' / f'{path.stem}.pickle'
+    try:
+        with cached.open('rb') as f:
+            stored_digest, batch = pickle.load(f)
+        if stored_digest == digest:
+            return batch
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    batch = extract_const(src, name)
+    write_atomic(cached, pickle.dumps((digest, batch), protocol=pickle.HIGHEST_PROTOCOL))
+    return batch
+
+
+def load_batches(blog_dir: Path = BLOG_DIR) -> list[tuple[str, dict]]:
+    """Every batch as (module stem, {slug: article}), in spread order."""
+    return [(stem, _load_batch(blog_dir / f'{stem}.ts', name)) for stem, name in batch_order(blog_dir)]
+
+
+def merge_batches(batches: list[tuple[str, dict]]) -> dict[str, dict]:
+    """Merge like the object spread in articles.ts: later batches win, first key position is kept.
+
+    Each article gets `slug` and `batch` keys added.
+    """
+    articles: dict[str, dict] = {}
+    for stem, batch in batches:
+        for slug, article in batch.items():
+            articles[slug] = {'slug': slug, 'batch': stem, **article}
+    return articles
+
+
+def load_articles(blog_dir: Path = BLOG_DIR) -> dict[str, dict]:
+    return merge_batches(load_batches(blog_dir))
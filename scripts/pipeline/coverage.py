@@ -0,0 +1,152 @@
+"""Aggregate the Google Maps listings into per-department and per-trade coverage.
+
+One streaming pass over the canonical listings (the listings stage runs first
+when its shards are missing or older than the crawls, so a listing is never
+counted once per crawl) feeds counters only; nothing is held per listing. The
+result is written as scripts/output/listing-coverage.json, sorted and rounded
+so that re-running on the same crawls leaves the file untouched.
+
+It is a report, not a page data module: DEPT_ARTISAN_COUNTS and the
+providerCount of map-coverage.ts stay hand-curated, since they hold INSEE/CAPEB
+enterprise estimates that a crawl of a few thousand businesses per department
+cannot replace. DEPT_ARTISAN_COUNTS is read here as the denominator of the
+coverage ratio, which is what tells how far the crawls are from replacing it.
+"""
+import json
+from pathlib import Path
+
+from .blocks import slugify
+from .listings import iter_listings, normalize_phone
+from .files import write_if_changed
+from .paths import SCRIPTS_OUTPUT_DIR, SRC_DATA_DIR
+from .tsliteral import load_const
+
+COUNTS_FILE = SRC_DATA_DIR / 'dept-artisan-counts.ts'
+OUT_FILE = SCRIPTS_OUTPUT_DIR / 'listing-coverage.json'
+
+# Rating histogram buckets: [<2, 2-3, 3-4, 4-4.5, >=4.5]
+RATING_EDGES = (2.0, 3.0, 4.0, 4.5)
+
+# A handful of crawled review counts have the next number glued on (e.g.
+# 251345710); no artisan listing comes close to this many reviews.
+MAX_REVIEWS = 20000
+
+
+def rating_bucket(rating: float) -> int:
+    for i, edge in enumerate(RATING_EDGES):
+        if rating < edge:
+            return i
+    return len(RATING_EDGES)
+
+
+def _new_stats() -> dict:
+    return {'listings': 0, 'withPhone': 0, 'withWebsite': 0, 'rated': 0, 'reviews': 0,
+            'ratingSum': 0.0, 'ratings': [0] * (len(RATING_EDGES) + 1)}
+
+
+def _add(stats: dict, listing: dict, phone: str | None, rating: float | None):
+    stats['listings'] += 1
+    stats['withPhone'] += phone is not None
+    stats['withWebsite'] += bool(listing.get('website'))
+    reviews = listing.get('reviewCount')
+    if isinstance(reviews, int) and 0 < reviews <= MAX_REVIEWS:
+        stats['reviews'] += reviews
+    if rating is not None:
+        stats['rated'] += 1
+        stats['ratingSum'] += rating
+        stats['ratings'][rating_bucket(rating)] += 1
+
+
+def _finish(stats: dict) -> dict:
+    """Counters in ListingStats key order, with the rating sum turned into a mean."""
+    return {
+        'listings': stats['listings'],
+        'withPhone': stats['withPhone'],
+        'withWebsite': stats['withWebsite'],
+        'rated': stats['rated'],
+        'reviews': stats['reviews'],
+        'avgRating': round(stats['ratingSum'] / stats['rated'], 2) if stats['rated'] else None,
+        'ratings': stats['ratings'],
+    }
+
+
+def _rating(listing: dict) -> float | None:
+    try:
+        rating = float(listing['rating'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return rating if 0 < rating <= 5 else None
+
+
+def aggregate(listings, btp_counts: dict[str, int]) -> dict:
+    """Single pass over `listings`; returns department, trade, city and total stats."""
+    depts: dict[str, dict] = {}
+    trades: dict[str, dict] = {}
+    cities: dict[str, dict] = {}
+    totals = _new_stats()
+    for listing in listings:
+        dept = listing.get('deptCode')
+        trade = listing.get('trade')
+        phone = normalize_phone(listing.get('phone'))
+        rating = _rating(listing)
+        _add(totals, listing, phone, rating)
+        if dept:
+            d = depts.setdefault(dept, {**_new_stats(), 'trades': {}})
+            _add(d, listing, phone, rating)
+            if trade:
+                d['trades'][trade] = d['trades'].get(trade, 0) + 1
+        if trade:
+            t = trades.setdefault(trade, {**_new_stats(), 'departments': set()})
+            _add(t, listing, phone, rating)
+            if dept:
+                t['departments'].add(dept)
+        if listing.get('city') and dept:
+            c = cities.setdefault(slugify(listing['city']),
+                                  {'name': listing['city'], 'deptCode': dept, 'listings': 0, 'rated': 0, 'ratingSum': 0.0})
+            c['listings'] += 1
+            if rating is not None:
+                c['rated'] += 1
+                c['ratingSum'] += rating
+
+    by_dept = {}
+    for code in sorted(depts):
+        d = _finish(depts[code])
+        btp = btp_counts.get(code)
+        d['coverage'] = round(d['listings'] / btp, 4) if btp else None
+        d['trades'] = dict(sorted(depts[code]['trades'].items()))
+        by_dept[code] = d
+    by_trade = {}
+    for name in sorted(trades):
+        t = _finish(trades[name])
+        t['departments'] = len(trades[name]['departments'])
+        by_trade[name] = t
+    by_city = {
+        slug: {'name': c['name'], 'deptCode': c['deptCode'], 'listings': c['listings'],
+               'avgRating': round(c['ratingSum'] / c['rated'], 2) if c['rated'] else None}
+        for slug, c in sorted(cities.items())
+    }
+    return {'departments': by_dept, 'trades': by_trade, 'cities': by_city, 'totals': _finish(totals)}
+
+
+def render(result: dict) -> str:
+    return json.dumps({'totals': result['totals'], 'departments': result['departments'],
+                       'trades': result['trades'], 'cities': result['cities']},
+                      ensure_ascii=False, indent=1) + '\n'
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+
+
+def run(args) -> int:
+    counts = load_const(COUNTS_FILE, 'DEPT_ARTISAN_COUNTS')
+    result = aggregate(iter_listings(), {code: c['btp'] for code, c in counts.items()})
+    if not result['totals']['listings']:
+        print('No listings found (run the Google Maps crawls first)')
+        return 1
+    changed = write_if_changed(args.out, render(result))
+    totals = result['totals']
+    print(f"{totals['listings']} listings across {len(result['departments'])} departments, "
+          f"{len(result['trades'])} trades and {len(result['cities'])} cities "
+          f"-> {args.out} ({'updated' if changed else 'unchanged'})")
+    return 0
@@ -0,0 +1,220 @@
+"""Find near-duplicate articles and blocks with MinHash + LSH.
+
+Two passes share one MinHasher:
+
+- articles: the set of distinctive words of each article (words found in at
+  most MAX_DOC_FREQ of the articles, so the vocabulary every article uses
+  does not make them all look alike). This is what surfaces topic overlaps
+  such as prix-plombier-2026-tarifs-horaires vs
+  combien-coute-un-plombier-tarifs-devis;
+- blocks: word 3-shingles of every paragraph, list, callout, table and
+  quote of at least MIN_BLOCK_WORDS words. Identical blocks are grouped
+  first, and only one copy of each goes through LSH.
+
+Signatures are computed for a whole batch of sets at once with NumPy. LSH
+buckets each band of rows with one argsort, so only pairs that share a
+bucket are compared, which keeps the cost near-linear in the number of
+articles. Candidates are then checked against the exact Jaccard
+similarity. The report is written as JSON, and the top pairs are printed.
+"""
+import json
+import time
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+from .blocks import LINK, WORD, inline_text
+from .corpus import load_articles
+from .files import write_if_changed
+from .paths import CACHE_DIR
+from .render import BlockCache, render_corpus, synthetic_corpus
+
+OUT_FILE = CACHE_DIR / 'duplicates.json'
+
+NUM_PERM = 192
+MERSENNE = (1 << 31) - 1
+SHINGLE_MULT = np.uint64(0x9E3779B97F4A7C15)
+# More rows per band = fewer candidates; articles use a lower threshold
+ARTICLE_ROWS, ARTICLE_THRESHOLD = 3, 0.25
+BLOCK_ROWS, BLOCK_THRESHOLD = 4, 0.6
+BLOCK_SHINGLE = 3
+MIN_BLOCK_WORDS = 12
+MAX_DOC_FREQ = 0.2
+# Buckets larger than this are boilerplate, not duplicates worth listing pair by pair
+MAX_BUCKET = 50
+# Candidates whose MinHash estimate is further below the threshold skip the exact check
+ESTIMATE_MARGIN = 0.1
+# Shingles per signature chunk: bounds the (shingles x permutations) matrix
+CHUNK = 1 << 16
+
+
+def words(text: str) -> list[str]:
+    return [w.lower() for w in WORD.findall(LINK.sub(r'\1', text))]
+
+
+class MinHasher:
+    """NUM_PERM universal hashes (a*x + b) mod 2^31-1 applied to uint64 shingle hashes."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MERSENNE, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, MERSENNE, num_perm, dtype=np.uint64)
+
+    def signatures(self, sets: list[np.ndarray]) -> np.ndarray:
+        """(len(sets), num_perm) signature matrix; empty sets get MERSENNE everywhere."""
+        out = np.full((len(sets), len(self.a)), MERSENNE, dtype=np.uint32)
+        start = 0
+        while start < len(sets):
+            end, size = start, 0
+            while end < len(sets) and (size == 0 or size + len(sets[end]) <= CHUNK):
+                size += len(sets[end])
+                end += 1
+            lengths = np.array([len(s) for s in sets[start:end]])
+            if size:
+                # shingles repeated across the chunk are hashed once
+                values, inverse = np.unique(np.concatenate(sets[start:end]) % np.uint64(MERSENNE), return_inverse=True)
+                # (permutations, shingles): reduceat runs along contiguous rows
+                hashed = ((self.a[:, None] * values + self.b[:, None]) % np.uint64(MERSENNE)).astype(np.uint32)[:, inverse]
+                rows = np.flatnonzero(lengths)
+                offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])[rows]
+                out[start + rows] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = end
+        return out
+
+
+def shingle_set(ids: np.ndarray, k: int) -> np.ndarray:
+    """Unique uint64 hashes of the k-grams of a word-id sequence (the whole sequence when shorter)."""
+    if len(ids) == 0:
+        return ids.astype(np.uint64)
+    k = min(k, len(ids))
+    h = np.zeros(len(ids) - k + 1, dtype=np.uint64)
+    for j in range(k):
+        h = h * SHINGLE_MULT + ids[j:len(ids) - k + 1 + j].astype(np.uint64)
+    return np.unique(h)
+
+
+def lsh_candidates(signatures: np.ndarray, rows: int) -> np.ndarray:
+    """(i, j) pairs, i < j, that share at least one band bucket."""
+    valid = np.flatnonzero(signatures[:, 0] != MERSENNE)
+    pairs = set()
+    mult = np.uint64(0x100000001B3) ** np.arange(rows, dtype=np.uint64)
+    for band in range(signatures.shape[1] // rows):
+        keys = (signatures[valid, band * rows:(band + 1) * rows] * mult).sum(axis=1)
+        order = np.argsort(keys, kind='stable')
+        starts = np.flatnonzero(np.concatenate([[True], np.diff(keys[order]) != 0, [True]]))
+        sizes = np.diff(starts)
+        shared = (sizes > 1) & (sizes <= MAX_BUCKET)
+        for start, size in zip(starts[:-1][shared].tolist(), sizes[shared].tolist()):
+            pairs.update(combinations(sorted(valid[order[start:start + size]].tolist()), 2))
+    return np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+
+
+def estimate(signatures: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """MinHash estimate of the Jaccard similarity of each pair: share of equal signature rows."""
+    out = np.empty(len(pairs))
+    for start in range(0, len(pairs), CHUNK):
+        i, j = pairs[start:start + CHUNK].T
+        out[start:start + CHUNK] = (signatures[i] == signatures[j]).mean(axis=1)
+    return out
+
+
+def similar_pairs(sets: list[np.ndarray], signatures: np.ndarray, rows: int, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """LSH candidates whose estimate is near the threshold, checked against the exact Jaccard similarity."""
+    pairs = lsh_candidates(signatures, rows)
+    pairs = pairs[estimate(signatures, pairs) >= threshold - ESTIMATE_MARGIN]
+    sims = jaccard(sets, pairs)
+    return pairs[sims >= threshold], sims[sims >= threshold]
+
+
+def jaccard(sets: list[np.ndarray], pairs: np.ndarray) -> np.ndarray:
+    sims = np.empty(len(pairs))
+    for n, (i, j) in enumerate(pairs.tolist()):
+        inter = len(np.intersect1d(sets[i], sets[j], assume_unique=True))
+        sims[n] = inter / (len(sets[i]) + len(sets[j]) - inter)
+    return sims
+
+
+def find_duplicates(articles: dict[str, dict], rendered: dict[str, tuple], hasher: MinHasher | None = None) -> dict:
+    hasher = hasher or MinHasher()
+    slugs = list(rendered)
+    vocab: dict[str, int] = {}
+    # block text -> (word ids, words); blocks repeated across articles are tokenized once
+    tokens: dict[str, tuple[np.ndarray, list[str]]] = {}
+    groups: dict[str, dict] = {}
+    article_ids = []
+    for slug in slugs:
+        ids = []
+        for block in rendered[slug][0]:
+            text = ' '.join(inline_text(block))
+            if text not in tokens:
+                block_words = words(text)
+                tokens[text] = (np.array([vocab.setdefault(w, len(vocab)) for w in block_words], dtype=np.int64), block_words)
+            block_ids, block_words = tokens[text]
+            ids.append(block_ids)
+            if block['type'] not in ('h2', 'h3') and len(block_words) >= MIN_BLOCK_WORDS:
+                group = groups.setdefault(' '.join(block_words), {'text': text, 'ids': block_ids, 'articles': {}})
+                group['articles'][slug] = None
+        article_ids.append(np.unique(np.concatenate(ids)) if ids else np.zeros(0, dtype=np.int64))
+
+    # Articles: distinctive word sets
+    doc_freq = np.bincount(np.concatenate(article_ids), minlength=len(vocab)) if article_ids else np.zeros(0)
+    distinctive = doc_freq <= max(1, MAX_DOC_FREQ * len(slugs))
+    article_sets = [ids[distinctive[ids]].astype(np.uint64) for ids in article_ids]
+    pairs, sims = similar_pairs(article_sets, hasher.signatures(article_sets), ARTICLE_ROWS, ARTICLE_THRESHOLD)
+    article_pairs = [
+        {'a': slugs[i], 'b': slugs[j], 'similarity': round(float(s), 3),
+         'crossBatch': articles[slugs[i]].get('batch') != articles[slugs[j]].get('batch')}
+        for (i, j), s in sorted(zip(pairs.tolist(), sims), key=lambda p: (-p[1], p[0]))
+    ]
+
+    # Blocks: identical ones are grouped by their words, then 3-shingle LSH over one copy of each
+    keys = list(groups)
+    block_sets = [shingle_set(groups[k]['ids'], BLOCK_SHINGLE) for k in keys]
+    pairs, sims = similar_pairs(block_sets, hasher.signatures(block_sets), BLOCK_ROWS, BLOCK_THRESHOLD)
+
+    def excerpt(group: dict) -> dict:
+        return {'text': group['text'][:160], 'articles': list(group['articles'])}
+
+    repeated = sorted((groups[k] for k in keys if len(groups[k]['articles']) > 1), key=lambda g: (-len(g['articles']), g['text']))
+    near = [
+        {'similarity': round(float(s), 3), 'a': excerpt(groups[keys[i]]), 'b': excerpt(groups[keys[j]])}
+        for (i, j), s in sorted(zip(pairs.tolist(), sims), key=lambda p: (-p[1], p[0]))
+    ]
+    return {
+        'params': {'numPerm': len(hasher.a), 'articleThreshold': ARTICLE_THRESHOLD, 'blockThreshold': BLOCK_THRESHOLD,
+                   'maxDocFreq': MAX_DOC_FREQ, 'minBlockWords': MIN_BLOCK_WORDS},
+        'articles': article_pairs,
+        'repeatedBlocks': [excerpt(g) for g in repeated],
+        'nearDuplicateBlocks': near,
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+    parser.add_argument('--top', type=int, default=10, help='pairs printed')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='run on N synthetic articles instead')
+
+
+def run(args) -> int:
+    articles = load_articles()
+    cache = None
+    if args.benchmark:
+        articles = {slug: {**a, 'batch': 'synthetic'} for slug, a in synthetic_corpus(articles, args.benchmark).items()}
+        # the synthetic blocks must not evict the corpus entries from the 'blocks' cache
+        cache = BlockCache('blocks-benchmark')
+    rendered, _ = render_corpus(articles, cache)
+    if cache is not None:
+        cache.save()
+    started = time.perf_counter()
+    report = find_duplicates(articles, rendered)
+    elapsed = time.perf_counter() - started
+    if not args.benchmark:
+        write_if_changed(args.out, json.dumps(report, ensure_ascii=False, indent=1) + '\n')
+    for pair in report['articles'][:args.top]:
+        print(f"  {pair['similarity']:.2f}  {pair['a']} ~ {pair['b']}{' (cross-batch)' if pair['crossBatch'] else ''}")
+    print(f"{len(rendered)} articles in {elapsed:.2f}s: {len(report['articles'])} similar article pairs "
+          f"(>= {ARTICLE_THRESHOLD}), {len(report['repeatedBlocks'])} blocks repeated verbatim, "
+          f"{len(report['nearDuplicateBlocks'])} near-duplicate block pairs (>= {BLOCK_THRESHOLD})"
+          + ('' if args.benchmark else f' -> {args.out}'))
+    return 0
@@ -0,0 +1,154 @@
+"""Emit the blog corpus as static files under public/data/blog.
+
+    articles/<slug>.json   full article payload
+    html/<slug>.html       rendered article body (see render.py)
+    index/<n>.json         metadata shards, newest first (see index/manifest.json)
+    feed.xml               same RSS as src/app/feed.xml/route.ts
+"""
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from .corpus import load_articles
+from .files import write_if_changed
+from .paths import BLOG_OUT_DIR, SITE_NAME, SITE_URL
+from .render import render_corpus
+from .stats import corpus_stats
+
+INDEX_SHARD_SIZE = 50
+FEED_ITEMS = 50
+
+# Mirrors categoryNormalize in src/lib/data/blog/articles-index.ts
+CATEGORY_NORMALIZE = {
+    'Securite': 'Sécurité',
+    'Energie': 'Énergie',
+}
+
+META_FIELDS = ('slug', 'title', 'excerpt', 'category', 'tags', 'date', 'readTime', 'image')
+STATS_FIELDS = ('headings', 'tables', 'callouts', 'faq', 'internalLinks', 'externalLinks')
+
+
+def dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def with_stats(article: dict, stats: dict) -> dict:
+    """The article with readTime recomputed and its content statistics."""
+    return {**article, 'readTime': f"{stats['readingMinutes']} min", 'wordCount': stats['wordCount'],
+            'stats': {k: stats[k] for k in STATS_FIELDS}}
+
+
+def article_payload(article: dict) -> dict:
+    return {k: v for k, v in article.items() if k != 'batch'}
+
+
+def article_meta(article: dict) -> dict:
+    meta = {k: article.get(k) for k in (*META_FIELDS, 'wordCount', 'stats')}
+    meta['category'] = CATEGORY_NORMALIZE.get(meta['category'], meta['category'])
+    meta['tags'] = meta['tags'] or []
+    return meta
+
+
+def sorted_by_date(articles: dict[str, dict]) -> list[dict]:
+    """Newest first; ties keep corpus order like the stable sort in articles-index.ts."""
+    return sorted(articles.values(), key=lambda a: a['date'], reverse=True)
+
+
+def _rfc822(date: str) -> str:
+    return format_datetime(datetime.fromisoformat(date).replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def render_feed(latest: list[dict]) -> str:
+    last_build = _rfc822(latest[0]['date']) if latest else format_datetime(datetime.now(timezone.utc), usegmt=True)
+    esc = lambda s: escape(s, {'"': '&quot;', "'": '&apos;'})  # noqa: E731
+    items = [f'''    <item>
+      <title>{esc(a['title'])}</title>
+      <link>{SITE_URL}/blog/{a['slug']}</link>
+      <guid isPermaLink="true">{SITE_URL}/blog/{a['slug']}</guid>
+      <description>{esc(a['excerpt'])}</description>
+      <pubDate>{_rfc822(a['date'])}</pubDate>
+      <category>{esc(a['category'])}</category>
+    </item>''' for a in latest]
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>{esc(SITE_NAME)} — Blog Artisanat &amp; Travaux</title>
+    <link>{SITE_URL}/blog</link>
+    <description>Conseils, guides et actualités sur l'artisanat, les travaux de rénovation, les prix et la réglementation.</description>
+    <language>fr</language>
+    <lastBuildDate>{last_build}</lastBuildDate>
+    <atom:link href="{SITE_URL}/feed.xml" rel="self" type="application/rss+xml"/>
+    <image>
+      <url>{SITE_URL}/apple-touch-icon.png</url>
+      <title>{esc(SITE_NAME)}</title>
+      <link>{SITE_URL}</link>
+    </image>
+{chr(10).join(items)}
+  </channel>
+</rss>'''
+
+
+def _prune(directory: Path, keep: set[str]) -> int:
+    """Delete emitted files (and compressed siblings) that are no longer produced."""
+    removed = 0
+    for path in directory.glob('*'):
+        base = path.name.removesuffix('.br').removesuffix('.gz')
+        if base not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def canonical_corpus(articles: dict[str, dict]) -> tuple[dict[str, dict], dict[str, tuple], dict]:
+    """(articles with their statistics, render_corpus() output, render stats): what every output is built from."""
+    rendered, render_stats = render_corpus(articles)
+    stats = corpus_stats(articles, rendered)
+    return {slug: with_stats(article, stats[slug]) for slug, article in articles.items()}, rendered, render_stats
+
+
+def emit_blog(articles: dict[str, dict], out_dir: Path = BLOG_OUT_DIR) -> dict:
+    """Write every blog artefact; unchanged files are left untouched."""
+    written = 0
+    articles, rendered, render_stats = canonical_corpus(articles)
+    article_dir = out_dir / 'articles'
+    for slug, article in articles.items():
+        written += write_if_changed(article_dir / f'{slug}.json', dumps(article_payload(article)))
+    html_dir = out_dir / 'html'
+    for slug, (_, body, _) in rendered.items():
+        written += write_if_changed(html_dir / f'{slug}.html', body + '\n')
+
+    ordered = sorted_by_date(articles)
+    metas = [article_meta(a) for a in ordered]
+    shards = [metas[i:i + INDEX_SHARD_SIZE] for i in range(0, len(metas), INDEX_SHARD_SIZE)]
+    index_dir = out_dir / 'index'
+    shard_names = [f'{n}.json' for n in range(1, len(shards) + 1)]
+    for name, shard in zip(shard_names, shards):
+        written += write_if_changed(index_dir / name, dumps(shard))
+    manifest = {
+        'total': len(metas),
+        'shardSize': INDEX_SHARD_SIZE,
+        'shards': shard_names,
+        'categories': ['Tous', *sorted({m['category'] for m in metas})],
+    }
+    written += write_if_changed(index_dir / 'manifest.json', dumps(manifest))
+
+    written += write_if_changed(out_dir / 'feed.xml', render_feed(ordered[:FEED_ITEMS]))
+
+    removed = _prune(article_dir, {f'{slug}.json' for slug in articles})
+    removed += _prune(html_dir, {f'{slug}.html' for slug in articles})
+    removed += _prune(index_dir, {*shard_names, 'manifest.json'})
+    return {'articles': len(articles), 'shards': len(shards), 'written': written, 'removed': removed,
+            'block_hit_ratio': render_stats['hit_ratio']}
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=BLOG_OUT_DIR, help='output directory')
+
+
+def run(args):
+    stats = emit_blog(load_articles(), args.out)
+    print(f"Emitted {stats['articles']} articles, {stats['shards']} index shards "
+          f"({stats['written']} files written, {stats['removed']} removed, "
+          f"{stats['block_hit_ratio']:.1%} of blocks from the render cache)")
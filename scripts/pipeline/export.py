@@ -0,0 +1,183 @@
+"""Export the canonical blog corpus for consumers that do not read TypeScript.
+
+The records are the emitted article payloads (statistics and recomputed
+readTime included) plus the rendered body HTML, newest first. They go
+through a single pass that feeds every selected exporter:
+
+    corpus.json      one JSON array
+    corpus.ndjson    one record per line, for streaming and analytics
+    corpus.sqlite    `articles` table plus an `articles_fts` FTS5 index, for
+                     the Capacitor apps' offline cache and search
+    corpus.msgpack   MessagePack array of the records (needs msgpack)
+
+An exporter is a class in EXPORTERS with a `write(record)` method and a
+`finish()` returning the file bytes, so another format is one more entry.
+Files are only rewritten when their bytes change.
+"""
+import html
+import json
+import re
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from .corpus import load_articles
+from .emit import CATEGORY_NORMALIZE, article_payload, canonical_corpus, dumps, sorted_by_date
+from .files import write_if_changed
+from .paths import BLOG_OUT_DIR
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# Bump when the SQLite schema changes; apps compare it to PRAGMA user_version
+SQLITE_SCHEMA_VERSION = 1
+
+_TAG = re.compile(r'<[^>]+>')
+_SPACE = re.compile(r'\s+')
+
+
+def record(article: dict, body: str) -> dict:
+    return {**article_payload(article), 'html': body}
+
+
+def plain_text(markup: str) -> str:
+    return _SPACE.sub(' ', html.unescape(_TAG.sub(' ', markup))).strip()
+
+
+class JsonExporter:
+    suffix = '.json'
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, rec: dict):
+        self._parts.append(dumps(rec))
+
+    def finish(self) -> bytes:
+        return ('[' + ',\n'.join(self._parts) + ']\n').encode('utf-8')
+
+
+class NdjsonExporter(JsonExporter):
+    suffix = '.ndjson'
+
+    def finish(self) -> bytes:
+        return ''.join(part + '\n' for part in self._parts).encode('utf-8')
+
+
+class SqliteExporter:
+    """Articles table (scalar columns + full JSON payload) and an FTS5 index over the text.
+
+    The database is built in a temporary file and vacuumed, so identical
+    records give an identical file.
+    """
+    suffix = '.sqlite'
+    SCHEMA = f'''
+        PRAGMA user_version = {SQLITE_SCHEMA_VERSION};
+        CREATE TABLE articles (
+            slug TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            excerpt TEXT,
+            category TEXT,
+            tags TEXT,
+            date TEXT,
+            read_time TEXT,
+            word_count INTEGER,
+            image TEXT,
+            payload TEXT NOT NULL,
+            html TEXT NOT NULL
+        );
+        CREATE INDEX articles_date ON articles (date DESC);
+        CREATE INDEX articles_category ON articles (category, date DESC);
+        CREATE VIRTUAL TABLE articles_fts USING fts5 (
+            slug UNINDEXED, title, excerpt, tags, body,
+            tokenize = 'unicode61 remove_diacritics 2'
+        );
+    '''
+
+    def __init__(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'corpus.sqlite'
+        self._db = sqlite3.connect(self._path)
+        self._db.executescript(self.SCHEMA)
+
+    def write(self, rec: dict):
+        category = CATEGORY_NORMALIZE.get(rec.get('category'), rec.get('category'))
+        tags = rec.get('tags') or []
+        payload = {k: v for k, v in rec.items() if k != 'html'}
+        self._db.execute('INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+            rec['slug'], rec['title'], rec.get('excerpt'), category, dumps(tags), rec.get('date'),
+            rec.get('readTime'), rec.get('wordCount'), rec.get('image'), dumps(payload), rec['html']))
+        self._db.execute('INSERT INTO articles_fts VALUES (?, ?, ?, ?, ?)', (
+            rec['slug'], rec['title'], rec.get('excerpt') or '', ' '.join(tags), plain_text(rec['html'])))
+
+    def finish(self) -> bytes:
+        try:
+            self._db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+            self._db.commit()
+            self._db.execute('VACUUM')
+            self._db.close()
+            return self._path.read_bytes()
+        finally:
+            self._dir.cleanup()
+
+
+class MsgpackExporter:
+    suffix = '.msgpack'
+
+    def __init__(self):
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._parts = []
+
+    def write(self, rec: dict):
+        self._parts.append(self._packer.pack(rec))
+
+    def finish(self) -> bytes:
+        return self._packer.pack_array_header(len(self._parts)) + b''.join(self._parts)
+
+
+# format -> exporter class, or None when its optional dependency is missing
+EXPORTERS = {
+    'json': JsonExporter,
+    'ndjson': NdjsonExporter,
+    'sqlite': SqliteExporter,
+    'msgpack': MsgpackExporter if msgpack is not None else None,
+}
+
+
+def export_corpus(articles: dict[str, dict], formats: list[str], out_dir: Path, name: str = 'corpus') -> dict[str, tuple[Path, int, bool]]:
+    """Format -> (path, size, written) for every available format."""
+    articles, rendered, _ = canonical_corpus(articles)
+    exporters = {fmt: EXPORTERS[fmt]() for fmt in formats if EXPORTERS[fmt] is not None}
+    for article in sorted_by_date(articles):
+        rec = record(article, rendered[article['slug']][1])
+        for exporter in exporters.values():
+            exporter.write(rec)
+    results = {}
+    for fmt, exporter in exporters.items():
+        path = out_dir / f'{name}{exporter.suffix}'
+        data = exporter.finish()
+        results[fmt] = (path, len(data), write_if_changed(path, data))
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--format', dest='formats', action='append', choices=sorted(EXPORTERS),
+                        help='format to write (repeatable); all of them by default')
+    parser.add_argument('--out', type=Path, default=BLOG_OUT_DIR, help='output directory')
+
+
+def run(args) -> int:
+    formats = args.formats or list(EXPORTERS)
+    missing = [fmt for fmt in formats if EXPORTERS[fmt] is None]
+    if missing and args.formats:
+        print(f"{', '.join(missing)}: optional dependency not installed (pip install -r scripts/pipeline/requirements.txt)")
+        return 1
+    articles = load_articles()
+    results = export_corpus(articles, formats, args.out)
+    for fmt, (path, size, written) in results.items():
+        print(f"  {fmt:8} {path} {size / 1024:,.0f} KiB{'' if written else ' (unchanged)'}")
+    skipped = f" ({', '.join(missing)} skipped: not installed)" if missing else ''
+    print(f'Exported {len(articles)} articles as {len(results)} formats{skipped}')
+    return 0
@@ -0,0 +1,344 @@
+"""Re-extract Google Maps / Google Search / PagesJaunes listings from saved HTML pages.
+
+scrape-gm-turbo.ts and scrape-gm-cities.ts parse each page once, in Node,
+right after fetching it, so a parsing fix only applies to future crawls.
+This stage runs the same rules over stored snapshots:
+
+- pages are read as a stream of decoded chunks and scanned through a window
+  that keeps each parser's context behind the scan position and its context
+  plus MAX_ANCHOR ahead, so memory does not grow with the page and gzipped
+  archives are never inflated whole;
+- the anchors and context windows are the ones of parseGoogleMaps (the
+  "Obtenir un itinéraire" and hfpxzc patterns, 3000 characters around) and
+  parseGoogleSearch (OSrXXb, 1500 after); the two Maps patterns are
+  collected in one pass and merged in the order the TypeScript loops give;
+- PagesJaunes cards (bi-denomination, the layout parse-pj.js probes) are
+  read up to the next card: <h3> name, first "Tél" number, city of the
+  ADRESSE-PRO link. parse-pj.js stops at the nested <h3> and finds no name
+  on the current markup;
+- a combo (trade, departement, optional city, one page per kind) is merged
+  like processCombo: Maps, then Search names not seen yet, then PJ, then one
+  listing per phone. Ids are hashId() of the crawl the combo comes from:
+  `gmc-` keyed on the city when there is one, else `gm-` on the departement.
+
+Combos run through jobs.run_job, under a job named after the hash of this
+file: an interrupted run resumes, and changing a rule starts a new job.
+
+Snapshots are listed in a manifest, one JSON object per line, page paths
+relative to it:
+
+    {"trade": "plombier", "deptCode": "01", "city": "Bourg-en-Bresse",
+     "maps": "plombier-01/maps.html.gz", "search": "plombier-01/search.html"}
+
+Output is gm-listings JSONL (gmId, name, phone, rating, reviewCount,
+website, trade, deptCode, city), in manifest order.
+"""
+import gzip
+import html
+import io
+import json
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from .cache import content_hash
+from .files import write_if_changed
+from .jobs import run_job
+from .listings import iter_jsonl, normalize_phone
+from .paths import GM_DATA_DIR
+
+SNAPSHOT_DIR = GM_DATA_DIR / 'snapshots'
+MANIFEST_FILE = SNAPSHOT_DIR / 'pages.jsonl'
+OUT_FILE = GM_DATA_DIR / 'gm-listings-extracted.jsonl'
+SAMPLES = (('maps', GM_DATA_DIR / 'sample-maps.html'), ('pj', GM_DATA_DIR / 'sample-pj-search.html'))
+
+CHUNK = 1 << 16
+# Longest anchor match the window waits for before giving up on it
+MAX_ANCHOR = 4096
+
+_DIGITS = r'[0-9]'
+PHONE = re.compile(r'(0[1-9][\s.]?{d}{{2}}[\s.]?{d}{{2}}[\s.]?{d}{{2}}[\s.]?{d}{{2}})'.format(d=_DIGITS))
+MAPS_RATING = re.compile(r'([0-9][,.]?[0-9]?)\s*.toiles?\s+([0-9][0-9\s]*)\s*avis')
+SEARCH_RATING = re.compile(r'([0-9][,.][0-9])\s*(?:étoiles?|stars?|<)')
+SEARCH_REVIEWS = re.compile(r'\(([0-9][0-9\s.,]*)\)')
+SEARCH_WEBSITE = re.compile(r'href="(https?://(?!www\.google)[^"]{5,200})"')
+MAPS_SKIP = re.compile(r'^(résultats|filtres|réduire|plan|en savoir|obtenir|visiter)', re.IGNORECASE)
+SEARCH_SKIP = re.compile(r'^(entreprises?|résultats|recherche|plus de|voir|afficher)', re.IGNORECASE)
+# Phones the Maps parser drops: 095/099 are VoIP ranges of call-tracking services
+TRACKING = re.compile(r'^09[59]')
+PJ_NAME = re.compile(r'^[^>]*>\s*<h3[^>]*>([^<]+)<')
+PJ_PHONE = re.compile(r'Tél\s*:\s*' + PHONE.pattern)
+PJ_ADDRESS = re.compile(r'"ADRESSE-PRO"[^>]*>([^<]+)<')
+PJ_CITY = re.compile(r'\b[0-9]{5}\s+(.+)$')
+PJ_CARD = 'class="bi-denomination'
+
+EXCLUDED_HOSTS = ('google.com', 'google.fr', 'facebook.com', 'instagram.com', 'twitter.com', 'linkedin.com',
+                  'x.com', 'pagesjaunes.fr')
+FIELDS = ('gmId', 'name', 'phone', 'rating', 'reviewCount', 'website', 'trade', 'deptCode', 'city')
+
+
+def decode_html(s: str) -> str:
+    """decodeHtml() of the scrapers: a handful of entities and JSON \\uXXXX escapes."""
+    s = (s.replace('&#39;', "'").replace('&amp;', '&').replace('&quot;', '"').replace('&#x27;', "'")
+         .replace('&lt;', '<').replace('&gt;', '>').replace('&nbsp;', ' ').replace('\xa0', ' '))
+    return re.sub(r'\\u([0-9a-fA-F]{4})', lambda m: chr(int(m.group(1), 16)), s)
+
+
+def normalize_website(raw: str | None) -> str | None:
+    """normalizeWebsite(): https:// by default, social and directory hosts dropped, WHATWG-like serialization."""
+    if not raw:
+        return None
+    url = raw.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower()
+        port = parts.port
+    except ValueError:
+        return None
+    if not host or any(c in host for c in ' <>"') or any(d in host for d in EXCLUDED_HOSTS):
+        return None
+    netloc = host + (f':{port}' if port and port != {'http': 80, 'https': 443}[parts.scheme] else '')
+    if '@' in parts.netloc:
+        netloc = parts.netloc.rsplit('@', 1)[0] + '@' + netloc
+    return urlunsplit((parts.scheme, netloc, parts.path or '/', parts.query, parts.fragment))
+
+
+def hash_id(prefix: str, trade: str, place: str, name: str) -> str:
+    """hashId(): Java-style 32-bit string hash over UTF-16 code units, base 36."""
+    key = f'{trade}-{place}-{name.lower().strip()}'.encode('utf-16-le')
+    h = 0
+    for i in range(0, len(key), 2):
+        h = (h * 31 + (key[i] | key[i + 1] << 8)) & 0xFFFFFFFF
+    h = abs(h - (1 << 32) if h >= 1 << 31 else h)
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    out = ''
+    while True:
+        h, r = divmod(h, 36)
+        out = digits[r] + out
+        if not h:
+            return f'{prefix}-{out}'
+
+
+def _number(text: str) -> int | float:
+    # parseFloat: JSON.stringify writes 5, not 5.0
+    value = float(text.replace(',', '.'))
+    return int(value) if value.is_integer() else value
+
+
+def _website(context: str, name: str) -> str | None:
+    ne = re.escape(name[:20])
+    ws = (re.search(rf'aria-label="Visiter le site Web de[^"]*{ne}[^"]*"[^>]*href="([^"]+)"', context, re.IGNORECASE)
+          or re.search(rf'href="(https?://[^"]+)"[^>]*aria-label="Visiter le site Web de[^"]*{ne}', context, re.IGNORECASE))
+    return normalize_website(ws.group(1)) if ws else None
+
+
+def read_chunks(path: Path, size: int = CHUNK):
+    """Decoded text of a page, `size` characters at a time; .gz pages are inflated on the fly."""
+    raw = gzip.open(path, 'rb') if path.suffix == '.gz' else path.open('rb')
+    with raw, io.TextIOWrapper(raw, encoding='utf-8', errors='replace', newline='') as text:
+        while chunk := text.read(size):
+            yield chunk
+
+
+def scan(chunks, anchors: dict[str, re.Pattern], before: int, after: int):
+    """(anchor, match, window, offset) for every anchor match, in order per anchor.
+
+    `window` holds at least `before` characters before the match and `after`
+    after it (less at the edges of the page); the match and its context are
+    `window`-relative, `offset` is the window's position in the page.
+    """
+    buf, base = '', 0
+    next_at = dict.fromkeys(anchors, 0)
+    chunks = iter(chunks)
+    eof = False
+    while not eof:
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buf += chunk
+        limit = len(buf) if eof else len(buf) - after - MAX_ANCHOR
+        if limit <= 0:
+            continue
+        for name, rx in anchors.items():
+            while (m := rx.search(buf, next_at[name] - base)) and (eof or m.end() <= limit):
+                yield name, m, buf, base
+                next_at[name] = base + m.end()
+            if not eof:
+                # a match cut by the end of the buffer starts at or after m.start()
+                next_at[name] = base + (m.start() if m else max(next_at[name] - base, limit))
+        drop = max(0, min(next_at.values()) - base - before)
+        buf, base = buf[drop:], base + drop
+
+
+def _maps_listing(name: str, ctx: str, website_ctx: str, last_phone: bool) -> dict:
+    phones = PHONE.findall(ctx)
+    phone = normalize_phone(phones[-1 if last_phone else 0]) if phones else None
+    listing = {'name': name, 'phone': phone if phone and not TRACKING.match(phone) else None}
+    rating = MAPS_RATING.findall(ctx.replace('&nbsp;', ' ').replace('\xa0', ' '))
+    if rating:
+        value, reviews = rating[-1 if last_phone else 0]
+        listing['rating'] = _number(value)
+        listing['reviewCount'] = int(re.sub(r'\s', '', reviews))
+    listing['website'] = _website(website_ctx, name)
+    return listing
+
+
+def parse_maps(chunks) -> list[dict]:
+    """parseGoogleMaps: itinerary buttons (context before) then hfpxzc links (context after)."""
+    anchors = {
+        'direction': re.compile(r'aria-label="Obtenir un itin.raire vers ([^"]{2,80})"'),
+        'business': re.compile(r'class="[^"]*hfpxzc[^"]*"[^>]*aria-label="([^"]{3,80})"'),
+    }
+    found = {'direction': [], 'business': []}
+    for anchor, m, buf, _ in scan(chunks, anchors, before=3000, after=3000):
+        name = decode_html(m.group(1)).strip()
+        start = m.start()
+        if anchor == 'direction':
+            found[anchor].append((name, buf[max(0, start - 3000):start], buf[max(0, start - 3000):start + 2000]))
+        elif not MAPS_SKIP.match(name):
+            ctx = buf[start:start + 3000]
+            found[anchor].append((name, ctx, ctx))
+    listings, seen = [], set()
+    for anchor, entries in found.items():
+        for name, ctx, website_ctx in entries:
+            if not name or (anchor == 'direction' and len(name) < 2) or name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            listings.append(_maps_listing(name, ctx, website_ctx, last_phone=anchor == 'direction'))
+    return listings
+
+
+def parse_search(chunks) -> list[dict]:
+    """parseGoogleSearch: local pack names (OSrXXb), 1500 characters of context after."""
+    anchors = {'name': re.compile(r'class="[^"]*OSrXXb[^"]*"[^>]*>([^<]{3,80})<')}
+    listings, seen = [], set()
+    for _, m, buf, _ in scan(chunks, anchors, before=0, after=1500):
+        name = decode_html(m.group(1).strip())
+        if not name or len(name) < 2 or name.lower() in seen or SEARCH_SKIP.match(name):
+            continue
+        ctx = buf[m.start():m.start() + 1500]
+        phone = PHONE.search(ctx)
+        listing = {'name': name, 'phone': normalize_phone(phone.group(1)) if phone else None}
+        if rating := SEARCH_RATING.search(ctx):
+            listing['rating'] = _number(rating.group(1))
+        if (reviews := SEARCH_REVIEWS.search(ctx)) and (count := re.sub(r'[\s.,]', '', reviews.group(1))).isdigit():
+            listing['reviewCount'] = int(count)
+        website = SEARCH_WEBSITE.search(ctx)
+        listing['website'] = normalize_website(website.group(1)) if website else None
+        seen.add(name.lower())
+        listings.append(listing)
+    return listings
+
+
+def parse_pj(chunks) -> list[dict]:
+    """PagesJaunes result cards, each read up to the next bi-denomination link."""
+    anchors = {'card': re.compile(r'class="bi-denomination[^"]*"')}
+    listings, seen = [], set()
+    for _, m, buf, _ in scan(chunks, anchors, before=0, after=12000):
+        card = buf[m.start():m.start() + 12000]
+        if (end := card.find(PJ_CARD, 1)) > 0:
+            card = card[:end]
+        name = PJ_NAME.search(card)
+        name = re.sub(r'\s+', ' ', html.unescape(name.group(1))).strip() if name else ''
+        if not name or name.lower() in seen:
+            continue
+        phone = PJ_PHONE.search(card)
+        address = PJ_ADDRESS.search(card)
+        city = PJ_CITY.search(re.sub(r'\s+', ' ', html.unescape(address.group(1))).strip()) if address else None
+        seen.add(name.lower())
+        listings.append({'name': name, 'phone': normalize_phone(phone.group(1)) if phone else None,
+                         'city': city.group(1) if city else None})
+    return listings
+
+
+# page kind -> parser, in the order processCombo merges them
+PARSERS = {'maps': parse_maps, 'search': parse_search, 'pj': parse_pj}
+
+
+def extract_combo(combo: dict, root: Path) -> list[dict]:
+    """Listings of one combo's pages, merged and deduplicated like processCombo."""
+    city = combo.get('city')
+    prefix, place = ('gmc', city) if city else ('gm', combo['deptCode'])
+    merged, names = [], set()
+    for kind, parser in PARSERS.items():
+        if not combo.get(kind):
+            continue
+        for listing in parser(read_chunks(root / combo[kind])):
+            if listing['name'].lower() not in names:
+                names.add(listing['name'].lower())
+                merged.append(listing)
+    out, phones = [], set()
+    for listing in merged:
+        phone = listing.get('phone')
+        if phone and phone in phones:
+            continue
+        if phone:
+            phones.add(phone)
+        record = {**listing, 'gmId': hash_id(prefix, combo['trade'], place, listing['name']),
+                  'trade': combo['trade'], 'deptCode': combo['deptCode'], 'city': city or listing.get('city')}
+        # JSON.stringify drops undefined fields
+        out.append({k: record[k] for k in FIELDS if record.get(k) is not None})
+    return out
+
+
+def _extract_task(key: str, task: tuple) -> list[dict]:
+    combo, root = task
+    return extract_combo(combo, Path(root))
+
+
+def rules_version() -> str:
+    return content_hash(Path(__file__).read_bytes())[:12]
+
+
+def combo_key(combo: dict) -> str:
+    return json.dumps(combo, sort_keys=True, ensure_ascii=False)
+
+
+def benchmark(rounds: int, workers: int | None):
+    for kind, path in SAMPLES:
+        size = path.stat().st_size
+        started = time.perf_counter()
+        for _ in range(rounds):
+            listings = PARSERS[kind](read_chunks(path))
+        seconds = time.perf_counter() - started
+        print(f'  {kind:6} {path.name}: {len(listings)} listings/page, {rounds / seconds:,.1f} pages/s, '
+              f'{size * rounds / seconds / 1e6:,.1f} MB/s (one process)')
+    combos = {f'sample-{n}': ({'trade': 'plombier', 'deptCode': '01', 'maps': SAMPLES[0][1].name,
+                               'pj': SAMPLES[1][1].name}, str(GM_DATA_DIR)) for n in range(rounds)}
+    results, stats = run_job(f'extract-benchmark-{rules_version()}', combos, _extract_task, workers)
+    total = sum(path.stat().st_size for _, path in SAMPLES) * stats['ran']
+    print(f"  pool   {stats['ran']:,} combos ({stats['skipped']:,} already done) in {stats['seconds']:.2f}s: "
+          f"{stats['ran'] / max(stats['seconds'], 1e-9):,.1f} combos/s, {total / max(stats['seconds'], 1e-9) / 1e6:,.1f} MB/s, "
+          f"{sum(map(len, results.values())):,} listings")
+
+
+def add_arguments(parser):
+    parser.add_argument('--manifest', type=Path, default=MANIFEST_FILE, help='snapshot manifest (JSONL)')
+    parser.add_argument('--out', type=Path, default=OUT_FILE, help='gm-listings JSONL to write')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count, at most 8)')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='parse the bundled sample pages N times')
+
+
+def run(args) -> int:
+    if args.benchmark:
+        print(f'Benchmark: bundled samples x {args.benchmark}')
+        benchmark(args.benchmark, args.workers)
+        return 0
+    if not args.manifest.exists():
+        print(f'Snapshot manifest not found: {args.manifest}')
+        return 1
+    root = args.manifest.parent
+    combos = {combo_key(c): (c, str(root)) for c in iter_jsonl(args.manifest) if c.get('trade') and c.get('deptCode')}
+    results, stats = run_job(f'extract-{rules_version()}', combos, _extract_task, args.workers)
+    if stats['failed']:
+        return 1
+    listings = [listing for key in combos for listing in results[key]]
+    written = write_if_changed(args.out, ''.join(json.dumps(l, ensure_ascii=False, separators=(',', ':')) + '\n'
+                                                 for l in listings))
+    print(f"{len(combos):,} combos ({stats['skipped']:,} from checkpoints) -> {len(listings):,} listings "
+          f"in {stats['seconds']:.2f}s -> {args.out}{'' if written else ' (unchanged)'}")
+    return 0
@@ -0,0 +1,217 @@
+"""Precompute the lookup indexes and light shards of src/lib/data/france.ts.
+
+france.ts stays the hand-edited source of the villes, departements and regions
+literals. This stage reads them and writes:
+
+- france-index.ts: array positions only (slug -> position, department/region
+  -> positions sorted by population, numeric populations), so every getter
+  in france.ts is a lookup instead of a find/filter/sort;
+- france-core.ts: every ville without `description` and `quartiers`, for
+  client components and server code that only search or link cities, with
+  the core variants of the france.ts getters;
+- france-villes/<code>.ts: those two heavy fields for one department, loaded
+  on demand through loadVille() / loadQuartier() in france-core.ts by the
+  ville and quartier pages.
+
+`--check` fails when a generated file no longer matches france.ts, for CI.
+"""
+import re
+from pathlib import Path
+
+from .communes import normalize_name
+from .paths import SRC_DATA_DIR
+from .tsemit import generated_header, render_module, ts_const, write_module
+from .tsliteral import extract_const
+
+FRANCE_FILE = SRC_DATA_DIR / 'france.ts'
+OUT_FILE = SRC_DATA_DIR / 'france-index.ts'
+CORE_FILE = SRC_DATA_DIR / 'france-core.ts'
+SHARD_DIR = SRC_DATA_DIR / 'france-villes'
+
+# Fields that stay out of france-core.ts and go to the per-department shards
+HEAVY_FIELDS = ('description', 'quartiers')
+
+
+def parse_population(pop: str) -> int:
+    """Same as parsePopulation in france.ts: '156 000' -> 156000, 0 when unreadable."""
+    digits = ''.join(pop.split())
+    return int(digits) if digits.isdigit() else 0
+
+
+def quartier_slug(name: str) -> str:
+    """Same as toQuartierSlug in france.ts."""
+    return re.sub(r'[^a-z0-9]+', '-', normalize_name(name)).strip('-')
+
+
+def _by_population(positions: list[int], populations: list[int]) -> list[int]:
+    # sorted() is stable like Array.prototype.sort, so ties keep source order
+    return sorted(positions, key=lambda i: -populations[i])
+
+
+def build_index(villes: list[dict], departements: list[dict], regions: list[dict]) -> dict:
+    for kind, items in (('ville', villes), ('departement', departements), ('region', regions)):
+        slugs = [item['slug'] for item in items]
+        if len(set(slugs)) != len(slugs):
+            dupes = sorted({s for s in slugs if slugs.count(s) > 1})
+            raise ValueError(f'duplicate {kind} slugs in france.ts: {", ".join(dupes)}')
+
+    populations = [parse_population(v['population']) for v in villes]
+    by_dept: dict[str, list[int]] = {}
+    by_region: dict[str, list[int]] = {}
+    for i, ville in enumerate(villes):
+        by_dept.setdefault(ville['departementCode'], []).append(i)
+        by_region.setdefault(ville['region'], []).append(i)
+    by_dept = {code: _by_population(ids, populations) for code, ids in sorted(by_dept.items())}
+    by_region = {name: _by_population(ids, populations) for name, ids in sorted(by_region.items())}
+
+    return {
+        'VILLE_COUNT': len(villes),
+        'VILLE_INDEX': {v['slug']: i for i, v in enumerate(villes)},
+        'VILLE_POPULATIONS': populations,
+        'VILLES_BY_DEPARTEMENT': by_dept,
+        'VILLES_BY_REGION': by_region,
+        'DEPARTEMENT_INDEX': {d['slug']: i for i, d in enumerate(departements)},
+        'DEPARTEMENT_INDEX_BY_CODE': {d['code']: i for i, d in enumerate(departements)},
+        'REGION_INDEX': {r['slug']: i for i, r in enumerate(regions)},
+        'REGION_INDEX_BY_NAME': {r['name']: i for i, r in enumerate(regions)},
+    }
+
+
+CONSTS = (
+    ('VILLE_COUNT', 'number', 'Length of `villes` when the index was built'),
+    ('VILLE_INDEX', 'Record<string, number>', 'Ville slug -> position in `villes`'),
+    ('VILLE_POPULATIONS', 'number[]', 'Parsed `population` of each ville, by position'),
+    ('VILLES_BY_DEPARTEMENT', 'Record<string, number[]>', 'Departement code -> ville positions, most populated first'),
+    ('VILLES_BY_REGION', 'Record<string, number[]>', 'Region name -> ville positions, most populated first'),
+    ('DEPARTEMENT_INDEX', 'Record<string, number>', 'Departement slug -> position in `departements`'),
+    ('DEPARTEMENT_INDEX_BY_CODE', 'Record<string, number>', 'Departement code -> position in `departements`'),
+    ('REGION_INDEX', 'Record<string, number>', 'Region slug -> position in `regions`'),
+    ('REGION_INDEX_BY_NAME', 'Record<string, number>', 'Region name -> position in `regions`'),
+)
+
+
+def render(index: dict) -> list[str]:
+    return [generated_header('france', 'src/lib/data/france.ts')] + [
+        ts_const(name, type_, index[name], doc=doc) for name, type_, doc in CONSTS
+    ]
+
+
+CORE_TYPES = '''import type { Ville } from './france'
+import { VILLE_INDEX, VILLES_BY_DEPARTEMENT } from './france-index'
+import { lookup, nearbyPositions, pick } from './france-lookup'
+import { QUARTIER_INDEX } from './quartier-index'
+
+/** Ville sans les champs texte lourds */
+export type VilleCore = Omit<Ville, 'description' | 'quartiers'>
+
+export type VilleDetails = Pick<Ville, 'description' | 'quartiers'>
+'''
+
+CORE_LOADERS = '''export function getVilleCoreBySlug(slug: string): VilleCore | undefined {
+  const i = lookup(VILLE_INDEX, slug)
+  return i === undefined ? undefined : villesCore[i]
+}
+
+/** getVillesByDepartement() de france.ts, sans les champs lourds */
+export function getVillesCoreByDepartement(departementCode: string): VilleCore[] {
+  return pick(villesCore, lookup(VILLES_BY_DEPARTEMENT, departementCode))
+}
+
+/** getNearbyCities() de france.ts, sans les champs lourds */
+export function getNearbyVillesCore(villeSlug: string, limit: number = 5): VilleCore[] {
+  const i = lookup(VILLE_INDEX, villeSlug)
+  return i === undefined ? [] : pick(villesCore, nearbyPositions(i, villesCore[i], limit))
+}
+
+/** Description et quartiers d'une ville, chargés avec le shard de son département */
+export async function loadVilleDetails(ville: Pick<VilleCore, 'slug' | 'departementCode'>): Promise<VilleDetails | undefined> {
+  const shard: { villeDetails: Record<string, VilleDetails> } = await import(`./france-villes/${ville.departementCode}`)
+  return lookup(shard.villeDetails, ville.slug)
+}
+
+/** Ville complète sans importer france.ts : le noyau plus un seul shard départemental */
+export async function loadVille(slug: string): Promise<Ville | undefined> {
+  const core = getVilleCoreBySlug(slug)
+  if (!core) return undefined
+  const details = await loadVilleDetails(core)
+  return { ...core, description: details?.description ?? '', quartiers: details?.quartiers ?? [] }
+}
+
+/** getQuartierBySlug() de france.ts, à partir de loadVille() */
+export async function loadQuartier(villeSlug: string, qSlug: string): Promise<{ ville: Ville; quartierName: string } | null> {
+  const positions = lookup(QUARTIER_INDEX, villeSlug)
+  const i = positions && lookup(positions, qSlug)
+  if (i === undefined) return null
+  const ville = await loadVille(villeSlug)
+  return ville ? { ville, quartierName: ville.quartiers[i] } : null
+}
+'''
+
+
+def render_core(villes: list[dict]) -> list[str]:
+    core = [{k: v for k, v in ville.items() if k not in HEAVY_FIELDS} for ville in villes]
+    return [
+        generated_header('france', 'src/lib/data/france.ts'),
+        CORE_TYPES,
+        ts_const('villesCore', 'VilleCore[]', core, doc='Mêmes villes et même ordre que `villes` dans france.ts'),
+        CORE_LOADERS,
+    ]
+
+
+def render_shards(villes: list[dict]) -> dict[str, list[str]]:
+    """Department code -> module parts holding the heavy fields of its villes."""
+    by_dept: dict[str, dict] = {}
+    for ville in villes:
+        by_dept.setdefault(ville['departementCode'], {})[ville['slug']] = {k: ville[k] for k in HEAVY_FIELDS}
+    return {
+        code: [
+            generated_header('france', 'src/lib/data/france.ts'),
+            "import type { VilleDetails } from '../france-core'",
+            ts_const('villeDetails', 'Record<string, VilleDetails>', details),
+        ]
+        for code, details in sorted(by_dept.items())
+    }
+
+
+def outputs(villes: list[dict], departements: list[dict], regions: list[dict], out: Path = OUT_FILE) -> dict[Path, list[str]]:
+    """Every generated file with its module parts."""
+    files = {
+        out: render(build_index(villes, departements, regions)),
+        CORE_FILE: render_core(villes),
+    }
+    for code, parts in render_shards(villes).items():
+        files[SHARD_DIR / f'{code}.ts'] = parts
+    return files
+
+
+def load_france(path: Path = FRANCE_FILE) -> tuple[list[dict], list[dict], list[dict]]:
+    src = path.read_text(encoding='utf-8')
+    return extract_const(src, 'villes'), extract_const(src, 'departements'), extract_const(src, 'regions')
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+    parser.add_argument('--check', action='store_true', help='fail if the index is out of date instead of writing it')
+
+
+def run(args) -> int:
+    villes, departements, regions = load_france()
+    files = outputs(villes, departements, regions, args.out)
+    stale_shards = set(SHARD_DIR.glob('*.ts')) - set(files)
+    if args.check:
+        stale = [path for path, parts in files.items()
+                 if not path.exists() or path.read_text(encoding='utf-8') != render_module(parts)]
+        stale += sorted(stale_shards)
+        for path in stale:
+            print(f'{path} is out of date')
+        if stale:
+            print('Run python3 -m scripts.pipeline france')
+            return 1
+        print(f'{len(files)} generated files are up to date')
+        return 0
+    written = sum(write_module(path, parts) for path, parts in files.items())
+    for path in stale_shards:
+        path.unlink()
+    print(f'Indexed {len(villes)} villes, {len(departements)} departements and {len(regions)} regions '
+          f'into {len(files)} files ({written} updated, {len(stale_shards)} removed)')
+    return 0
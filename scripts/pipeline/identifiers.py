@@ -0,0 +1,256 @@
+"""Validate SIREN/SIRET and normalize phones for providers and Google Maps listings.
+
+enrich-siret.ts, enrich-phone*.ts and import-gm-phones.ts each clean
+identifiers record by record. Here every column is handled as one array: the
+strings become a (rows, width) matrix of code points, the characters to keep
+are compacted to the left with a stable argsort, and the checks run on the
+digit matrix.
+
+- SIREN (9 digits) and SIRET (14 digits): Luhn checksum, whitespace ignored.
+  La Poste establishments (SIREN 356000000) break Luhn: their SIRET is valid
+  when the sum of its digits is a multiple of 5. The head office
+  (35600000000048) keeps the Luhn check, as in python-stdnum.
+- phones: same national form as normalize_phone() (+33 / 0033 prefixes,
+  10 digits), then E.164 with the overseas country codes, and a PHONE_TYPES
+  class from the ARCEP numbering plan. Premium and tracking ranges (036,
+  089, 099), which the enrichment scripts refuse, are kept but classed
+  `premium`.
+
+Outputs under scripts/.enrich-data/identifiers:
+
+    lookup.jsonl   one line per distinct phone / SIRET / SIREN, with its class
+                   or status and how many providers and listings carry it
+    todo.jsonl     providers that still need a remote lookup, and why:
+                   `siret` (missing or invalid), `phone` (missing, invalid,
+                   premium, or shared with another provider)
+"""
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .files import write_if_changed
+from .listings import SOURCES
+from .matcher import ENRICH_DIR, PROVIDERS_FILE
+from .paths import GM_DATA_DIR
+from .providers import read_columns
+
+OUT_DIR = ENRICH_DIR / 'identifiers'
+
+# Identifier status, by increasing quality
+STATUSES = ('missing', 'malformed', 'invalid', 'valid')
+MISSING, MALFORMED, INVALID, VALID = range(len(STATUSES))
+
+PHONE_TYPES = ('invalid', 'landline', 'mobile', 'voip', 'freephone', 'special', 'premium')
+LA_POSTE_SIREN = '356000000'
+LA_POSTE_HEAD_OFFICE = '35600000000048'
+
+# National prefix -> E.164 country code of the overseas departments (landline and mobile ranges)
+OVERSEAS = {
+    '0590': '+590', '0690': '+590', '0691': '+590',
+    '0594': '+594', '0694': '+594',
+    '0596': '+596', '0696': '+596', '0697': '+596',
+    '0262': '+262', '0263': '+262', '0269': '+262', '0692': '+262', '0693': '+262', '0639': '+262',
+}
+
+_ZERO, _PLUS = ord('0'), ord('+')
+# Code points ignored between digits (0 is numpy's padding); phones also allow . - ( )
+WHITESPACE = [0, 9, 10, 13, 32, 160, 8239]
+PHONE_SEPARATORS = WHITESPACE + [ord(c) for c in '.-()']
+TEXT_WIDTH = 40
+
+
+def _text(value) -> str:
+    if isinstance(value, str):
+        return value
+    return str(value) if isinstance(value, int) and not isinstance(value, bool) else ''
+
+
+def compact(values: list, width: int, keep_plus: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(digits, lengths, clean) of each value with whitespace (and phone separators) removed.
+
+    digits is a (rows, width) int8 matrix of the kept characters, left-aligned,
+    -1 past the end and `+` as its offset from '0'; lengths counts every kept
+    character. clean is False when a value held anything else, or more than
+    TEXT_WIDTH characters.
+    """
+    strings = [_text(v) for v in values]
+    text = np.array(strings, dtype=f'U{TEXT_WIDTH}')
+    points = text.view(np.uint32).reshape(len(values), TEXT_WIDTH)
+    is_digit = (points >= _ZERO) & (points <= _ZERO + 9)
+    keep = is_digit | (points == _PLUS) if keep_plus else is_digit
+    clean = np.all(keep | np.isin(points, PHONE_SEPARATORS if keep_plus else WHITESPACE), axis=1)
+    clean &= np.fromiter(map(len, strings), dtype=np.int64, count=len(strings)) <= TEXT_WIDTH
+    order = np.argsort(~keep, axis=1, kind='stable')
+    packed = np.take_along_axis(np.where(keep, points.astype(np.int16) - _ZERO, -1), order, axis=1)
+    lengths = keep.sum(axis=1)
+    return packed[:, :width].astype(np.int8), lengths, clean
+
+
+def _status(present: np.ndarray, well_formed: np.ndarray, checksum: np.ndarray) -> np.ndarray:
+    return np.where(~present, MISSING, np.where(~well_formed, MALFORMED, np.where(checksum, VALID, INVALID))).astype(np.uint8)
+
+
+def _luhn(digits: np.ndarray, double_even: bool) -> np.ndarray:
+    doubled = digits.astype(np.int16)
+    cols = slice(0, None, 2) if double_even else slice(1, None, 2)
+    d = doubled[:, cols] * 2
+    doubled[:, cols] = np.where(d > 9, d - 9, d)
+    return doubled.sum(axis=1) % 10 == 0
+
+
+def as_strings(digits: np.ndarray) -> np.ndarray:
+    """Digit matrix -> array of strings (rows of -1 give '')."""
+    chars = np.where(digits >= 0, digits + _ZERO, 0).astype(np.uint32)
+    return np.ascontiguousarray(chars).view(f'U{digits.shape[1]}').ravel()
+
+
+def validate_siren(values: list) -> tuple[np.ndarray, np.ndarray]:
+    """(status, clean 9-digit strings)."""
+    digits, lengths, clean = compact(values, 9)
+    well_formed = clean & (lengths == 9)
+    return _status(lengths > 0, well_formed, well_formed & _luhn(digits, double_even=False)), as_strings(digits)
+
+
+def validate_siret(values: list) -> tuple[np.ndarray, np.ndarray]:
+    """(status, clean 14-digit strings), with the La Poste rule."""
+    digits, lengths, clean = compact(values, 14)
+    well_formed = clean & (lengths == 14)
+    strings = as_strings(digits)
+    la_poste = np.char.startswith(strings, LA_POSTE_SIREN) & (strings != LA_POSTE_HEAD_OFFICE)
+    checksum = np.where(la_poste, digits.astype(np.int16).sum(axis=1) % 5 == 0, _luhn(digits, double_even=True))
+    return _status(lengths > 0, well_formed, well_formed & checksum), strings
+
+
+def normalize_phones(values: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(national 10-digit strings, E.164 strings, PHONE_TYPES index); '' and 0 when invalid."""
+    if not values:
+        return np.array([], dtype='U10'), np.array([], dtype='U16'), np.array([], dtype=np.uint8)
+    packed, lengths, clean = compact(values, 16, keep_plus=True)
+    plus = packed[:, 0] == _PLUS - _ZERO
+    intl = plus & (packed[:, 1] == 3) & (packed[:, 2] == 3)
+    intl00 = (packed[:, 0] == 0) & (packed[:, 1] == 0) & (packed[:, 2] == 3) & (packed[:, 3] == 3)
+    start = np.where(intl, 3, np.where(intl00, 4, 1))
+    national = np.empty((len(values), 10), dtype=np.int16)
+    national[:, 0] = np.where(intl | intl00, 0, packed[:, 0])
+    national[:, 1:] = np.take_along_axis(packed, (start[:, None] + np.arange(9)).clip(max=packed.shape[1] - 1), axis=1)
+    length = np.where(intl, lengths - 2, np.where(intl00, lengths - 3, lengths))
+    ok = clean & (length == 10) & np.all((national >= 0) & (national <= 9), axis=1) & (national[:, 0] == 0) & (national[:, 1] != 0)
+    national = np.where(ok[:, None], national, -1)
+
+    strings = as_strings(national)
+    a, b, c = national[:, 1], national[:, 2], national[:, 3]
+    types = np.select(
+        [~ok,
+         ((a == 3) & (b == 6)) | ((a == 8) & (b == 9)) | ((a == 9) & (b == 9)),
+         (a >= 1) & (a <= 5),
+         (a == 6) | (a == 7),
+         a == 9,
+         (a == 8) & (b == 0) & (c <= 5)],
+        [0, 6, 1, 2, 3, 4], default=5).astype(np.uint8)
+    e164 = np.char.add('+33', np.char.lstrip(strings, '0')).astype('U16')
+    e164[~ok] = ''
+    prefix = strings.astype('U4')
+    for national_prefix, country in OVERSEAS.items():
+        rows = prefix == national_prefix
+        if rows.any():
+            e164[rows] = np.char.add(country, np.char.lstrip(strings[rows], '0'))
+    return strings, e164, types
+
+
+def _counts(keys: np.ndarray) -> dict[str, int]:
+    values, counts = np.unique(keys[keys != ''], return_counts=True)
+    return dict(zip(values.tolist(), counts.tolist()))
+
+
+def build(providers: dict[str, list], listing_phones: list) -> tuple[list[dict], list[dict], dict]:
+    siren_status, sirens = validate_siren(providers['siren'])
+    siret_status, sirets = validate_siret(providers['siret'])
+    _, phones, phone_types = normalize_phones(providers['phone'])
+    _, gm_phones, gm_types = normalize_phones(listing_phones)
+
+    # A SIRET starts with the company's SIREN: a valid SIRET fills a missing or bad SIREN
+    derived = (siret_status == VALID) & (siren_status != VALID)
+    sirens = np.where(derived, sirets.astype('U9'), sirens)
+    siren_status = np.where(derived, VALID, siren_status)
+    mismatch = (siret_status == VALID) & (siren_status == VALID) & (sirets.astype('U9') != sirens)
+
+    provider_phones, listing_counts = _counts(phones), _counts(gm_phones)
+    phone_type = {}
+    for keys, types in ((gm_phones, gm_types), (phones, phone_types)):
+        phone_type.update(zip(keys[keys != ''].tolist(), types[keys != ''].tolist()))
+    lookup = [
+        {'kind': 'phone', 'value': phone, 'type': PHONE_TYPES[phone_type[phone]],
+         'providers': provider_phones.get(phone, 0), 'listings': listing_counts.get(phone, 0)}
+        for phone in sorted(provider_phones.keys() | listing_counts.keys())
+    ]
+    for kind, keys, status in (('siret', sirets, siret_status), ('siren', sirens, siren_status)):
+        counts = _counts(np.where(status == VALID, keys, ''))
+        lookup += [{'kind': kind, 'value': value, 'status': 'valid', 'providers': n} for value, n in sorted(counts.items())]
+
+    _, inverse, counts = np.unique(phones, return_inverse=True, return_counts=True)
+    shared = (phones != '') & (counts[inverse] > 1)
+    given = np.fromiter(map(bool, providers['phone']), dtype=bool, count=len(phones))
+    needs_phone = (phones == '') | (phone_types == PHONE_TYPES.index('premium')) | shared
+    needs_siret = (siret_status != VALID) | mismatch
+    todo = []
+    for i in np.flatnonzero(needs_phone | needs_siret).tolist():
+        needs = []
+        if needs_siret[i]:
+            needs.append('siret')
+        if needs_phone[i]:
+            needs.append('phone')
+        entry = {'id': providers['id'][i], 'needs': needs,
+                 'siret': STATUSES[siret_status[i]] if not mismatch[i] else 'siren_mismatch',
+                 'phone': 'shared' if shared[i] else PHONE_TYPES[phone_types[i]] if given[i] else STATUSES[MISSING]}
+        if siren_status[i] == VALID:
+            entry['siren'] = str(sirens[i])
+        todo.append(entry)
+
+    stats = {
+        'providers': len(providers['id']),
+        'siret': {s: int((siret_status == n).sum()) for n, s in enumerate(STATUSES)},
+        'siren': {s: int((siren_status == n).sum()) for n, s in enumerate(STATUSES)},
+        'phoneTypes': {STATUSES[MISSING]: int((~given).sum()),
+                       **{t: int(((phone_types == n) & given).sum()) for n, t in enumerate(PHONE_TYPES)}},
+        'sharedPhones': int(shared.sum()),
+        'todo': len(todo),
+    }
+    return lookup, todo, stats
+
+
+def _jsonl(rows: list[dict]) -> str:
+    return ''.join(json.dumps(row, ensure_ascii=False, separators=(',', ':')) + '\n' for row in rows)
+
+
+def add_arguments(parser):
+    parser.add_argument('--providers', type=Path, default=PROVIDERS_FILE, help='provider export (JSONL)')
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='output directory')
+    parser.add_argument('--workers', type=int, default=None)
+
+
+def run(args) -> int:
+    if not args.providers.exists():
+        print(f'Provider export not found: {args.providers} (run npx tsx scripts/export-artisans-pg.ts)')
+        return 1
+    started = time.perf_counter()
+    providers = read_columns({'id': ('id',), 'siren': ('siren',), 'siret': ('siret',), 'phone': ('phone',)},
+                             args.providers, args.workers)
+    keep = [i for i, value in enumerate(providers['id']) if value]
+    providers = {name: [values[i] for i in keep] for name, values in providers.items()}
+    listing_phones = []
+    for _, filename in SOURCES:
+        if (GM_DATA_DIR / filename).exists():
+            listing_phones += read_columns({'phone': ('phone',)}, GM_DATA_DIR / filename, args.workers)['phone']
+    read = time.perf_counter()
+    lookup, todo, stats = build(providers, listing_phones)
+    built = time.perf_counter()
+
+    write_if_changed(args.out / 'lookup.jsonl', _jsonl(lookup))
+    write_if_changed(args.out / 'todo.jsonl', _jsonl(todo))
+    write_if_changed(args.out / 'summary.json', json.dumps(stats, indent=1) + '\n')
+    print(f"{stats['providers']:,} providers + {len(listing_phones):,} listings in {built - started:.2f}s "
+          f"({read - started:.2f}s reading): SIRET {stats['siret']}, phones {stats['phoneTypes']}, "
+          f"{len(lookup):,} distinct identifiers, {len(todo):,} providers still need a lookup -> {args.out}")
+    return 0
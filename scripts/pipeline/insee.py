@@ -0,0 +1,210 @@
+"""Resolve the INSEE codes stored in providers.address_city, once, at rest.
+
+Most providers carry a commune code ("69123") instead of a city name in
+address_city, and insee-resolver.ts patches them on every page view
+(resolveProviderCity / resolveProviderCities). Here the whole export is
+resolved in one pass:
+
+- the distinct address_city values are factorized (np.unique), so each code
+  is parsed once however many providers share it;
+- the values shaped like codes (isInseeCode: 4-5 digits, or a Corsican
+  2A/2B code) are joined against the sorted commune codes with a single
+  np.searchsorted. Arrondissements of Paris, Marseille and Lyon resolve to
+  their parent commune, like the compact table. A 4-digit value is a code
+  that lost its leading zero in a spreadsheet round trip (departments 01-09)
+  and is padded, where findCode() gives up on it;
+- the inverse index of the factorization maps the result back to providers.
+
+Outputs under scripts/.enrich-data/insee:
+
+    corrections.csv     id, code, address_city, address_region per provider
+    upload.sql          psql script: \\copy corrections.csv, one UPDATE by id
+    sql/batch-NN.sql    SQL Editor batches in the generate-upload-sql.ts shape,
+    sql/all-updates.sql keyed by code: every provider still holding the code
+                        is fixed, not only the exported (active) ones
+    summary.json        totals and the unknown codes, most frequent first
+
+address_region is only filled when empty, like resolveProviderCity.
+"""
+import csv
+import io
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .communes import ARRONDISSEMENTS, CODE_LEN, SOURCE_FILE, with_arrondissements
+from .files import write_if_changed
+from .matcher import ENRICH_DIR, PROVIDERS_FILE
+from .providers import read_columns
+from .quality import _relative
+
+OUT_DIR = ENRICH_DIR / 'insee'
+
+# Same rows per file as generate-upload-sql.ts
+BATCH = 1000
+TOP_UNKNOWN = 50
+
+# isInseeCode() in insee-resolver.ts
+_INSEE_CODE = re.compile(r'^(?:\d{4,5}|[0-9][A-Z0-9]\d{3})$')
+
+COLUMNS = {
+    'id': ('id',),
+    'city': ('address_city', 'city'),
+}
+
+# Run from the repository root: psql "$DATABASE_URL" -f <out>/upload.sql
+UPLOAD_SQL = '''-- Generated by python3 -m scripts.pipeline insee
+BEGIN;
+CREATE TEMP TABLE insee_corrections (id uuid PRIMARY KEY, code text NOT NULL, city text NOT NULL, region text) ON COMMIT DROP;
+\\copy insee_corrections FROM '{csv}' WITH (FORMAT csv, HEADER true)
+UPDATE providers p
+SET address_city = c.city, address_region = COALESCE(NULLIF(p.address_region, ''), c.region)
+FROM insee_corrections c
+WHERE p.id = c.id
+  AND p.address_city = c.code;
+COMMIT;
+'''
+
+BATCH_SQL = '''-- {title}
+UPDATE providers AS p
+SET address_city = v.city, address_region = COALESCE(NULLIF(p.address_region, ''), v.region)
+FROM (VALUES
+{values}
+) AS v(code, city, region)
+WHERE p.address_city = v.code;
+'''
+
+
+def load_table(source: Path = SOURCE_FILE) -> tuple[np.ndarray, list[str], list[str]]:
+    """(sorted codes, names, regions) of every commune, arrondissements included."""
+    communes = with_arrondissements(json.loads(source.read_text(encoding='utf-8')))
+    codes = sorted(communes)
+    return (np.array(codes, dtype=f'U{CODE_LEN}'),
+            [communes[c]['n'] for c in codes], [communes[c]['r'] for c in codes])
+
+
+def as_code(value: str) -> str | None:
+    """The commune code an address_city value holds, or None when it is a name."""
+    if not _INSEE_CODE.match(value):
+        return None
+    return value.zfill(CODE_LEN)
+
+
+def resolve(cities: list, table_codes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(values, inverse, position) for the distinct address_city strings.
+
+    values[inverse] gives back the column; position[k] is the commune row of
+    values[k], -1 for a name and -2 for a code missing from the table.
+    """
+    values, inverse = np.unique(np.array([c if isinstance(c, str) else '' for c in cities], dtype=str),
+                                return_inverse=True)
+    codes = [as_code(v) for v in values.tolist()]
+    is_code = np.array([c is not None for c in codes], dtype=bool)
+    wanted = np.array([c or '' for c in codes], dtype=f'U{CODE_LEN}')
+    found = np.minimum(np.searchsorted(table_codes, wanted), len(table_codes) - 1)
+    hit = is_code & (table_codes[found] == wanted)
+    position = np.where(hit, found, np.where(is_code, -2, -1))
+    return values, inverse, position
+
+
+def render_csv(ids: list, stored: list, cities: list, regions: list) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(('id', 'code', 'address_city', 'address_region'))
+    writer.writerows(zip(ids, stored, cities, regions))
+    return buffer.getvalue()
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def render_batches(rows: list[tuple[str, str, str]], size: int = BATCH) -> dict[str, str]:
+    """File name -> SQL for (code, city, region) rows: numbered batches plus all-updates.sql."""
+    values = [f'  ({_quote(code)}, {_quote(city)}, {_quote(region)})' for code, city, region in rows]
+    count = -(-len(values) // size)
+    width = max(2, len(str(count)))
+    files = {}
+    for f in range(count):
+        batch = values[f * size:(f + 1) * size]
+        files[f'batch-{f + 1:0{width}d}.sql'] = BATCH_SQL.format(
+            title=f'Batch {f + 1}/{count} ({len(batch)} codes)', values=',\n'.join(batch))
+    files['all-updates.sql'] = BATCH_SQL.format(title=f'ALL {len(values)} codes in one query', values=',\n'.join(values))
+    return files
+
+
+def build(providers: dict[str, list], table: tuple[np.ndarray, list[str], list[str]]) -> tuple[dict, list, dict]:
+    """(corrections columns, (code, city, region) rows, summary) for one export."""
+    table_codes, names, regions = table
+    values, inverse, position = resolve(providers['city'], table_codes)
+    per_row = position[inverse]
+    fixed = np.flatnonzero(per_row >= 0)
+    rows = per_row[fixed].tolist()
+    stored = values[inverse[fixed]].tolist()
+    corrections = {
+        'id': [providers['id'][i] for i in fixed.tolist()],
+        'code': stored,
+        'city': [names[r] for r in rows],
+        'region': [regions[r] for r in rows],
+    }
+    # one SQL row per stored value: '1001' and '01001' are both rewritten
+    seen = np.flatnonzero(position >= 0)
+    by_code = [(v, names[r], regions[r]) for v, r in zip(values[seen].tolist(), position[seen].tolist())]
+
+    unknown = np.flatnonzero(position == -2)
+    unknown_counts = np.bincount(inverse, minlength=len(values))[unknown]
+    order = np.argsort(-unknown_counts, kind='stable')[:TOP_UNKNOWN]
+    summary = {
+        'providers': len(providers['id']),
+        'resolved': len(fixed),
+        'names': int(((per_row == -1) & (values[inverse] != '')).sum()),
+        'empty': int((values[inverse] == '').sum()),
+        'unknown': int(unknown_counts.sum()),
+        'padded': int(sum(len(v) < CODE_LEN for v in stored)),
+        'arrondissements': int(sum(first <= int(c) <= last for c in corrections['code'] if c.isdigit()
+                                   for _, first, last in ARRONDISSEMENTS)),
+        'distinctCodes': len(by_code),
+        'topUnknown': {str(values[unknown[i]]): int(unknown_counts[i]) for i in order.tolist()},
+    }
+    return corrections, by_code, summary
+
+
+def add_arguments(parser):
+    parser.add_argument('--providers', type=Path, default=PROVIDERS_FILE, help='provider export (JSONL)')
+    parser.add_argument('--communes', type=Path, default=SOURCE_FILE, help='INSEE commune table')
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='output directory')
+    parser.add_argument('--batch', type=int, default=BATCH, help='codes per SQL Editor batch file')
+    parser.add_argument('--workers', type=int, default=None)
+
+
+def run(args) -> int:
+    if not args.providers.exists():
+        print(f'Provider export not found: {args.providers} (run npx tsx scripts/export-artisans-pg.ts)')
+        return 1
+    started = time.perf_counter()
+    providers = read_columns(COLUMNS, args.providers, args.workers)
+    keep = [i for i, value in enumerate(providers['id']) if value]
+    providers = {name: [values[i] for i in keep] for name, values in providers.items()}
+    table = load_table(args.communes)
+    read = time.perf_counter()
+    corrections, by_code, summary = build(providers, table)
+    built = time.perf_counter()
+
+    write_if_changed(args.out / 'corrections.csv', render_csv(*corrections.values()))
+    write_if_changed(args.out / 'upload.sql', UPLOAD_SQL.format(csv=_relative(args.out / 'corrections.csv')))
+    batches = render_batches(by_code, args.batch)
+    sql_dir = args.out / 'sql'
+    for name, sql in batches.items():
+        write_if_changed(sql_dir / name, sql)
+    for path in sql_dir.glob('*.sql'):
+        if path.name not in batches:
+            path.unlink()
+    write_if_changed(args.out / 'summary.json', json.dumps(summary, ensure_ascii=False, indent=1) + '\n')
+    print(f"{summary['providers']:,} providers in {built - started:.2f}s ({read - started:.2f}s reading): "
+          f"{summary['resolved']:,} codes resolved ({summary['arrondissements']:,} arrondissements, "
+          f"{summary['padded']:,} padded), {summary['unknown']:,} unknown, {summary['names']:,} already names; "
+          f"{summary['distinctCodes']:,} distinct codes in {len(batches) - 1} batches -> {args.out}")
+    return 0
@@ -0,0 +1,298 @@
+"""Resumable job runner: items sharded over worker processes, progress in append-only logs.
+
+The crawl and enrichment scripts keep their progress in JSON documents
+(scripts/.gm-data/*-progress.json) rewritten whole on every update, and
+split work by hand (enrich-by-name-progress-A..D). A job here is a mapping
+of item key -> payload and a module-level function:
+
+- each key goes to shard crc32(key) % shards, one worker process per shard;
+- a worker appends `[key, result]` JSON lines to its own log under
+  .pipeline-cache/jobs/<job>/, and flushes + fsyncs every SYNC_EVERY items or
+  SYNC_SECONDS, whichever comes first, so the cost of durability is one
+  fsync per batch instead of one rewrite per item;
+- on start every log of the job is replayed (whatever the shard count was)
+  and only the keys without a result run. A crash loses at most the
+  unsynced batch; a torn last line is cut off before appending;
+- workers report each synced batch to the parent, which prints items/s and
+  the ETA of every shard.
+
+`fn(key, payload)` returns any JSON value (None included); an exception
+stops its shard, the others finish, and the next run retries from the
+failed item. The `jobs` command lists the checkpoint logs, resets a job or
+benchmarks the runner (`--benchmark N`).
+"""
+import fcntl
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import time
+import traceback
+import zlib
+from pathlib import Path
+
+from .parallel import default_workers
+from .paths import CACHE_DIR
+
+JOBS_DIR = CACHE_DIR / 'jobs'
+
+SYNC_EVERY = 256
+SYNC_SECONDS = 1.0
+REPORT_SECONDS = 5.0
+
+
+class Checkpoint:
+    """Append-only `[key, result]` log with batched fsync."""
+
+    def __init__(self, path: Path, sync_every: int = SYNC_EVERY, sync_seconds: float = SYNC_SECONDS):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_seconds = sync_seconds
+        self._file = None
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    @staticmethod
+    def replay(path: Path) -> tuple[dict, int]:
+        """(key -> result, length of the valid prefix); stops at the first torn or corrupt line."""
+        done, valid = {}, 0
+        with path.open('rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    key, result = json.loads(line)
+                except ValueError:
+                    break
+                done[key] = result
+                valid += len(line)
+        return done, valid
+
+    def open(self) -> 'Checkpoint':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            _, valid = self.replay(self.path)
+            if valid < self.path.stat().st_size:
+                os.truncate(self.path, valid)
+        self._file = self.path.open('ab')
+        self._synced_at = time.monotonic()
+        return self
+
+    def append(self, key: str, result=None) -> int:
+        """Record one item; returns how many items this call made durable (0 until the batch syncs)."""
+        self._file.write(json.dumps([key, result], ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n')
+        self._pending += 1
+        if self._pending >= self.sync_every or time.monotonic() - self._synced_at >= self.sync_seconds:
+            return self.sync()
+        return 0
+
+    def sync(self) -> int:
+        """Flush and fsync; returns how many items became durable."""
+        synced, self._pending = self._pending, 0
+        if synced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._synced_at = time.monotonic()
+        return synced
+
+    def close(self):
+        if self._file:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+def shard_of(key: str, shards: int) -> int:
+    return zlib.crc32(key.encode('utf-8')) % shards
+
+
+def load_done(job_dir: Path) -> dict:
+    """Key -> result across every log of a job, whatever shard count wrote them."""
+    done = {}
+    for path in sorted(job_dir.glob('*.log')):
+        done.update(Checkpoint.replay(path)[0])
+    return done
+
+
+def _log_path(job_dir: Path, shard: int, shards: int) -> Path:
+    return job_dir / f'shard-{shard:02d}-of-{shards:02d}.log'
+
+
+def _run_shard(fn, job_dir: Path, shard: int, shards: int, items: list[tuple], progress,
+               sync_every: int = SYNC_EVERY, sync_seconds: float = SYNC_SECONDS):
+    """Worker: run one shard's pending items; every synced batch is put on `progress`."""
+    log = Checkpoint(_log_path(job_dir, shard, shards), sync_every, sync_seconds).open()
+    error = None
+    try:
+        for key, payload in items:
+            if synced := log.append(key, fn(key, payload)):
+                progress.put(('done', shard, synced))
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        progress.put(('done', shard, log.sync()))
+        log.close()
+    progress.put(('end', shard, error))
+
+
+class Progress:
+    """Durable item counts per shard, printed as items/s and ETA every REPORT_SECONDS."""
+
+    def __init__(self, job: str, totals: list[int], report_seconds: float = REPORT_SECONDS):
+        self.job = job
+        self.totals = totals
+        self.done = [0] * len(totals)
+        self.errors: dict[int, str] = {}
+        self.ended: set[int] = set()
+        self.report_seconds = report_seconds
+        self.started = self._reported = time.monotonic()
+
+    def put(self, message: tuple):
+        kind, shard, value = message
+        if kind == 'done':
+            self.done[shard] += value
+        else:
+            self.ended.add(shard)
+            if value:
+                self.errors[shard] = value
+        if time.monotonic() - self._reported >= self.report_seconds:
+            self.report()
+
+    def report(self):
+        self._reported = now = time.monotonic()
+        elapsed = max(now - self.started, 1e-9)
+        shards = []
+        for shard, (done, total) in enumerate(zip(self.done, self.totals)):
+            rate = done / elapsed
+            if shard in self.errors:
+                state = 'failed'
+            elif done >= total:
+                state = 'done'
+            else:
+                state = f'ETA {(total - done) / rate:,.0f}s' if rate else 'ETA ?'
+            shards.append(f'{shard}: {done:,}/{total:,} {rate:,.0f}/s {state}')
+        print(f'  [{self.job}] {sum(self.done):,}/{sum(self.totals):,} in {elapsed:.0f}s | ' + ' | '.join(shards), flush=True)
+
+
+def run_job(name: str, items: dict[str, object], fn, shards: int | None = None, job_dir: Path | None = None,
+            sync_every: int = SYNC_EVERY, sync_seconds: float = SYNC_SECONDS,
+            report_seconds: float = REPORT_SECONDS) -> tuple[dict, dict]:
+    """Run `fn(key, payload)` on every item without a checkpointed result.
+
+    Returns (key -> result for the items of `items` that are done, stats).
+    `fn` must be a module-level function so worker processes can import it.
+    """
+    job_dir = job_dir or JOBS_DIR / name
+    job_dir.mkdir(parents=True, exist_ok=True)
+    shards = shards or default_workers()
+    with (job_dir / '.lock').open('w') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise RuntimeError(f'job {name} is already running ({job_dir})') from None
+        started = time.perf_counter()
+        done = load_done(job_dir)
+        pending: list[list[tuple]] = [[] for _ in range(shards)]
+        for key, payload in items.items():
+            if key not in done:
+                pending[shard_of(key, shards)].append((key, payload))
+        replayed = time.perf_counter() - started
+
+        progress = Progress(name, [len(p) for p in pending], report_seconds)
+        active = [shard for shard in range(shards) if pending[shard]]
+        if len(active) == 1:
+            _run_shard(fn, job_dir, active[0], shards, pending[active[0]], progress, sync_every, sync_seconds)
+        elif active:
+            _run_processes(fn, job_dir, shards, pending, active, progress, sync_every, sync_seconds)
+        if active:
+            progress.report()
+        done = load_done(job_dir) if active else done
+
+    results = {key: done[key] for key in items if key in done}
+    for shard, error in sorted(progress.errors.items()):
+        print(f'  [{name}] shard {shard} stopped:\n{error}')
+    return results, {
+        'items': len(items),
+        'skipped': len(items) - sum(progress.totals),
+        'ran': sum(progress.done),
+        'failed': sorted(progress.errors),
+        'replaySeconds': round(replayed, 3),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+def _run_processes(fn, job_dir: Path, shards: int, pending: list[list[tuple]], active: list[int],
+                   progress: Progress, sync_every: int, sync_seconds: float):
+    messages = multiprocessing.Queue()
+    workers = {
+        shard: multiprocessing.Process(target=_run_shard, daemon=True, args=(
+            fn, job_dir, shard, shards, pending[shard], messages, sync_every, sync_seconds))
+        for shard in active
+    }
+    for worker in workers.values():
+        worker.start()
+    while len(progress.ended) < len(workers):
+        try:
+            progress.put(messages.get(timeout=progress.report_seconds))
+        except queue.Empty:
+            progress.report()
+            for shard, worker in workers.items():
+                # killed without a word (OOM killer, SIGKILL): its synced items are in the log
+                if shard not in progress.ended and not worker.is_alive() and messages.empty():
+                    progress.put(('end', shard, f'worker exited with code {worker.exitcode}'))
+    for worker in workers.values():
+        worker.join()
+
+
+def _benchmark_item(key: str, payload: int) -> str:
+    digest = key.encode()
+    for _ in range(payload):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()[:16]
+
+
+def benchmark(size: int, shards: int | None):
+    job_dir = JOBS_DIR / 'benchmark'
+    shutil.rmtree(job_dir, ignore_errors=True)
+    items = {f'item-{n}': 200 for n in range(size)}
+    print(f'Benchmark: {size:,} items of 200 sha256 rounds on {shards or default_workers()} shards')
+    for label in ('cold', 'resumed'):
+        results, stats = run_job('benchmark', items, _benchmark_item, shards, job_dir, report_seconds=1.0)
+        print(f"  {label}: {stats['ran']:,} ran, {stats['skipped']:,} skipped in {stats['seconds']:.2f}s "
+              f"(replay {stats['replaySeconds']:.2f}s), {len(results):,} results")
+
+
+def status(jobs_dir: Path = JOBS_DIR) -> list[tuple[str, str, int, int]]:
+    """(job, log, entries, bytes) of every checkpoint log."""
+    rows = []
+    for path in sorted(jobs_dir.glob('*/*.log')):
+        done, _ = Checkpoint.replay(path)
+        rows.append((path.parent.name, path.name, len(done), path.stat().st_size))
+    return rows
+
+
+def add_arguments(parser):
+    parser.add_argument('--reset', metavar='JOB', help='delete the checkpoint logs of a job')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='run N synthetic items, then resume the finished job')
+    parser.add_argument('--shards', type=int, default=None, help='worker processes (default: CPU count, at most 8)')
+
+
+def run(args) -> int:
+    if args.benchmark:
+        benchmark(args.benchmark, args.shards)
+        return 0
+    if args.reset:
+        job_dir = JOBS_DIR / args.reset
+        if not job_dir.is_dir():
+            print(f'No checkpoints for job {args.reset} in {JOBS_DIR}')
+            return 1
+        shutil.rmtree(job_dir)
+        print(f'Removed {job_dir}')
+        return 0
+    rows = status()
+    for job, log, entries, size in rows:
+        print(f'  {job:24} {log:24} {entries:>10,} items {size / 1024:>10,.0f} KiB')
+    print(f'{len({r[0] for r in rows})} jobs, {sum(r[2] for r in rows):,} checkpointed items in {JOBS_DIR}')
+    return 0
@@ -0,0 +1,204 @@
+"""Precompute the internal-link tables of the ville and service pages.
+
+getNearbyCities() listed the most populated villes of the same departement,
+then of the region: Boulogne-Billancourt linked to Paris and to the big
+communes at the far end of the Hauts-de-Seine before its neighbours. This
+stage ranks by distance instead and writes link-index.ts:
+
+- NEARBY_VILLES: the NEARBY_MAX closest villes of each ville, any departement;
+- NEARBY_IN_DEPARTEMENT: the closest villes of the same departement;
+- RELATED_SERVICES: per service, the hand-picked `curatedRelatedServices` of
+  navigation.ts first, then the services that share a NAF code, list it back,
+  or appear with it in a guide or a problem, best scored first.
+
+Ville positions are the commune points of the nearby stage (backlinks
+exports and cityMarkers). Most villes have none: they used to stand at the
+centre of their departement, which ranked every such peer at 0 km and gave
+them the same arbitrary far neighbours. A ville without a point keeps the
+population ranking (departement, then region) instead, and only villes with
+a point are ranked by distance. Distances are one vectorized haversine per
+block of villes over the whole table (2 267 x 2 267 pairs).
+
+`--check` fails when link-index.ts is out of date, for CI.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .backlinks import load_backlinks
+from .content import COLLECTIONS, load_entries
+from .france import FRANCE_FILE, load_france, parse_population
+from .nearby import COMMUNES_FILE, MARKERS_FILE, CommuneResolver, commune_points
+from .paths import SRC_DATA_DIR
+from .spatial import haversine_km
+from .tsemit import generated_header, render_module, ts_const, write_module
+from .tsliteral import extract_const, load_const
+
+NAVIGATION_FILE = SRC_DATA_DIR.parent / 'constants' / 'navigation.ts'
+NAF_FILE = SRC_DATA_DIR / 'service-naf-mapping.ts'
+OUT_FILE = SRC_DATA_DIR / 'link-index.ts'
+
+# Callers ask getNearbyCities() for at most 12 cities; larger limits extend
+# these lists with the department/region ones at request time.
+NEARBY_MAX = 12
+# Service pages show at most 8 related services
+RELATED_MAX = 8
+
+# Villes per haversine block: bounds the (block, villes) distance matrix
+BLOCK = 512
+
+# Relatedness score of two services
+REVERSE_WEIGHT = 3
+NAF_WEIGHT = 2
+COOCCURRENCE_WEIGHT = 1
+
+CONSTS = (
+    ('NEARBY_MAX', 'number', 'Length of each NEARBY_VILLES / NEARBY_IN_DEPARTEMENT list'),
+    ('NEARBY_VILLES', 'number[][]', 'Positions in `villes` of the closest villes of each ville, nearest first'),
+    ('NEARBY_IN_DEPARTEMENT', 'number[][]', 'Same, restricted to the departement of the ville'),
+    ('RELATED_SERVICES', 'Record<string, string[]>', 'Service slug -> related service slugs, curated ones first'),
+)
+
+
+def ville_points(villes: list[dict], columns: dict, communes: dict[str, dict], markers: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """(lat, lon) per ville; NaN where its commune is not located."""
+    resolver = CommuneResolver(communes)
+    codes = [resolver.lookup(v['name'], (v['departementCode'],)) for v in villes]
+    by_slug = dict(zip((v['slug'] for v in villes), codes))
+    marker_points = {by_slug[m['slug']]: (m['lat'], m['lng']) for m in markers if by_slug.get(m['slug'])}
+    points = commune_points(columns, resolver, marker_points)
+
+    lat, lon = np.full(len(villes), np.nan), np.full(len(villes), np.nan)
+    for i, code in enumerate(codes):
+        if code in points:
+            lat[i], lon[i] = points[code]
+    return lat, lon
+
+
+def _by_population(villes: list[dict], populations: np.ndarray, key: str) -> dict[str, list[int]]:
+    groups: dict[str, list[int]] = {}
+    for i in np.argsort(-populations, kind='stable').tolist():
+        groups.setdefault(villes[i][key], []).append(i)
+    return groups
+
+
+def nearest_villes(villes: list[dict], lat: np.ndarray, lon: np.ndarray, k: int = NEARBY_MAX) -> tuple[list, list]:
+    """(NEARBY_VILLES, NEARBY_IN_DEPARTEMENT): nearest first, the more populated first at equal distance."""
+    n = len(villes)
+    populations = np.array([parse_population(v['population']) for v in villes], dtype=np.int64)
+    depts = np.array([v['departementCode'] for v in villes])
+    by_dept = _by_population(villes, populations, 'departementCode')
+    by_region = _by_population(villes, populations, 'region')
+    unlocated = np.isnan(lat)
+
+    nearby, in_dept = [], []
+    for start in range(0, n, BLOCK):
+        rows = np.arange(start, min(start + BLOCK, n))
+        km = haversine_km(lat[rows, None], lon[rows, None], lat[None, :], lon[None, :])
+        km[np.isnan(km)] = np.inf
+        km[np.arange(len(rows)), rows] = np.inf
+        tie = np.broadcast_to(-populations, km.shape)
+        # lexsort is stable, so equal distance and population keep source order
+        order = np.lexsort((tie, km), axis=-1)[:, :k]
+        dept_km = np.where(depts[rows, None] == depts[None, :], km, np.inf)
+        dept_order = np.lexsort((tie, dept_km), axis=-1)[:, :k]
+        for r, i in enumerate(rows.tolist()):
+            ville = villes[i]
+            same_dept = [j for j in by_dept[ville['departementCode']] if j != i]
+            if unlocated[i]:
+                # getNearbyCities() before distances: departement, then region, by population
+                out = same_dept[:k] + [j for j in by_region[ville['region']]
+                                       if villes[j]['departementCode'] != ville['departementCode']][:k - len(same_dept[:k])]
+                nearby.append(out)
+                in_dept.append(same_dept[:k])
+                continue
+            nearby.append(order[r][np.isfinite(km[r, order[r]])].tolist())
+            # the located peers first, then the others by population
+            closest = dept_order[r][np.isfinite(dept_km[r, dept_order[r]])].tolist()
+            in_dept.append((closest + [j for j in same_dept if unlocated[j]])[:k])
+    return nearby, in_dept
+
+
+def related_services(services: list[dict], curated: dict[str, list[str]], naf: dict[str, list[str]],
+                     groups: list[list[str]], k: int = RELATED_MAX) -> dict[str, list[str]]:
+    """Curated list first, then the best scored services; ties keep `services` order."""
+    slugs = [s['slug'] for s in services]
+    known = set(slugs)
+    score = {a: dict.fromkeys(slugs, 0) for a in slugs}
+    for a, related in curated.items():
+        for b in related:
+            if a in known and b in known:
+                score[b][a] += REVERSE_WEIGHT
+    for a in slugs:
+        for b in slugs:
+            if a != b:
+                score[a][b] += NAF_WEIGHT * len(set(naf.get(a, ())) & set(naf.get(b, ())))
+    for group in groups:
+        members = sorted(set(group) & known)
+        for a in members:
+            for b in members:
+                if a != b:
+                    score[a][b] += COOCCURRENCE_WEIGHT
+
+    out = {}
+    for a in slugs:
+        picked = [b for b in dict.fromkeys(curated.get(a, ())) if b in known and b != a][:k]
+        ranked = sorted((b for b in slugs if b != a and b not in picked and score[a][b] > 0),
+                        key=lambda b: -score[a][b])
+        out[a] = picked + ranked[:k - len(picked)]
+    return out
+
+
+def content_groups() -> list[list[str]]:
+    """Services cited together by one guide or one problem."""
+    specs = {spec['source']: spec for spec in COLLECTIONS}
+    groups = [[g.get('trade', ''), *g.get('relatedServices', [])] for g in load_entries(specs['guides'])]
+    groups += [[p['primaryService'], *p.get('relatedServices', [])] for p in load_entries(specs['problems'])]
+    return groups
+
+
+def build(villes: list[dict], lat: np.ndarray, lon: np.ndarray, services: list[dict], curated: dict,
+          naf: dict, groups: list[list[str]]) -> dict:
+    nearby, in_dept = nearest_villes(villes, lat, lon)
+    return {
+        'NEARBY_MAX': NEARBY_MAX,
+        'NEARBY_VILLES': nearby,
+        'NEARBY_IN_DEPARTEMENT': in_dept,
+        'RELATED_SERVICES': related_services(services, curated, naf, groups),
+    }
+
+
+def render(index: dict) -> list[str]:
+    return [generated_header('links', 'src/lib/data/france.ts, navigation.ts and the backlinks exports')] + [
+        ts_const(name, type_, index[name], doc=doc) for name, type_, doc in CONSTS
+    ]
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+    parser.add_argument('--check', action='store_true', help='fail if the index is out of date instead of writing it')
+
+
+def run(args) -> int:
+    columns, stats = load_backlinks()
+    if not stats['files']:
+        print('No backlinks export found (run python3 -m scripts.pipeline backlinks)')
+        return 1
+    villes, _, _ = load_france()
+    communes = json.loads(COMMUNES_FILE.read_text(encoding='utf-8'))
+    lat, lon = ville_points(villes, columns, communes, load_const(MARKERS_FILE, 'cityMarkers'))
+    services = load_const(FRANCE_FILE, 'services')
+    curated = extract_const(NAVIGATION_FILE.read_text(encoding='utf-8'), 'curatedRelatedServices')
+    index = build(villes, lat, lon, services, curated, load_const(NAF_FILE, 'SERVICE_TO_NAF'), content_groups())
+    parts = render(index)
+    if args.check:
+        if not args.out.exists() or args.out.read_text(encoding='utf-8') != render_module(parts):
+            print(f'{args.out} is out of date\nRun python3 -m scripts.pipeline links')
+            return 1
+        print(f'{args.out} is up to date')
+        return 0
+    written = write_module(args.out, parts)
+    print(f'Linked {len(villes)} villes ({int(np.isfinite(lat).sum())} located, {int(np.isnan(lat).sum())} ranked by population) '
+          f"and {len(index['RELATED_SERVICES'])} services -> {args.out} ({'updated' if written else 'unchanged'})")
+    return 0
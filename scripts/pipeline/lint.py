@@ -0,0 +1,181 @@
+"""Structural linter for the blog corpus.
+
+Catches what parseContentBlocks would otherwise swallow silently at render
+time. Per-article results are cached by content hash, so only edited articles
+are re-checked; `build` runs this first and stops on any error.
+"""
+import re
+from datetime import date
+
+from .blocks import CALLOUT, ORDERED_ITEM, TABLE_SEPARATOR, slugify, split_lines, table_cells
+from .cache import HashCache, content_hash
+from .corpus import load_batches, merge_batches
+from .emit import dumps
+from .parallel import pool_map
+
+# Bump when rules change so cached results are recomputed
+RULES_VERSION = 3
+
+REQUIRED_TEXT = ('title', 'excerpt', 'image', 'author', 'date', 'readTime', 'category')
+HEADING = re.compile(r'^#{1,6}\s')
+
+
+def _issue(rule: str, message: str, severity: str = 'error') -> dict:
+    return {'rule': rule, 'severity': severity, 'message': message}
+
+
+def _check_table(rows: list[str], where: str) -> list[dict]:
+    real = [r for r in rows if not TABLE_SEPARATOR.match(r)]
+    if len(real) < 2:
+        return [_issue('short-table', f'{where}: a table needs a header and at least one row, it is dropped at render')]
+    width = len(table_cells(real[0]))
+    issues = []
+    for n, row in enumerate(real[1:], 1):
+        cells = len(table_cells(row))
+        if cells != width:
+            issues.append(_issue('ragged-table', f'{where}: row {n} has {cells} cells, header has {width}'))
+    return issues
+
+
+def lint_article(article: dict) -> list[dict]:
+    """Every structural issue of one article, in content order."""
+    issues = []
+    for field in REQUIRED_TEXT:
+        if not isinstance(article.get(field), str) or not article[field].strip():
+            issues.append(_issue('missing-field', f'`{field}` is missing or empty'))
+    for field in ('date', 'updatedDate'):
+        value = article.get(field)
+        if isinstance(value, str) and value:
+            try:
+                date.fromisoformat(value)
+            except ValueError:
+                issues.append(_issue('bad-date', f'`{field}` {value!r} is not YYYY-MM-DD'))
+    if not isinstance(article.get('tags'), list):
+        issues.append(_issue('missing-field', '`tags` must be a list'))
+    content = article.get('content')
+    if not isinstance(content, list) or not content:
+        issues.append(_issue('missing-field', '`content` is missing or empty'))
+        return issues
+    for n, qa in enumerate(article.get('faq') or [], 1):
+        if not (qa.get('question') or '').strip() or not (qa.get('answer') or '').strip():
+            issues.append(_issue('faq-incomplete', f'faq #{n} has an empty question or answer'))
+
+    lines = split_lines(content)
+    heading_ids: dict[str, str] = {}
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        if line.startswith(':::'):
+            if line == ':::':
+                issues.append(_issue('stray-callout-close', f'line {i + 1}: `:::` without an open callout renders as text'))
+                i += 1
+                continue
+            m = CALLOUT.match(line)
+            if not m:
+                if not line.startswith(':::end'):
+                    issues.append(_issue('unknown-callout', f'line {i + 1}: {line[:40]!r} is not a known callout type'))
+                i += 1
+                continue
+            start, kind = i, m.group(1)
+            i += 1
+            body = []
+            while i < n and lines[i] != ':::':
+                if CALLOUT.match(lines[i]):
+                    issues.append(_issue('nested-callout', f'line {i + 1}: callout opened inside :::{kind} from line {start + 1}'))
+                body.append(lines[i])
+                i += 1
+            if i == n:
+                issues.append(_issue('unclosed-callout', f'line {start + 1}: :::{kind} is never closed and swallows the rest of the article'))
+            i += 1
+            if not body:
+                issues.append(_issue('empty-callout', f'line {start + 1}: :::{kind} is empty', 'warning'))
+            if kind == 'budget':
+                rows = [b for b in body if b.startswith('|')]
+                if rows:
+                    issues.extend(_check_table(rows, f'line {start + 1}: :::budget'))
+            continue
+
+        if line.startswith('## ') or line.startswith('### '):
+            text = line.split(' ', 1)[1]
+            anchor = slugify(text)
+            if anchor in heading_ids:
+                issues.append(_issue('duplicate-heading', f'line {i + 1}: heading {text!r} repeats anchor #{anchor}', 'warning'))
+            heading_ids[anchor] = text
+        elif line.startswith('|') and '|' in line[1:]:
+            start = i
+            while i < n and lines[i].startswith('|'):
+                i += 1
+            issues.extend(_check_table(lines[start:i], f'line {start + 1}: table'))
+            continue
+        elif line.startswith('- ') or ORDERED_ITEM.match(line):
+            item = line[2:] if line.startswith('- ') else ORDERED_ITEM.sub('', line, 1)
+            if HEADING.match(item):
+                issues.append(_issue('heading-in-list', f'line {i + 1}: heading inside a list item renders as literal `#`'))
+        i += 1
+    return issues
+
+
+def _lint_job(job: tuple[str, dict]) -> tuple[str, list[dict]]:
+    slug, article = job
+    return slug, lint_article(article)
+
+
+def duplicate_slugs(batches: list[tuple[str, dict]]) -> dict[str, list[str]]:
+    """slug -> batches defining it, for slugs defined more than once."""
+    seen: dict[str, list[str]] = {}
+    for stem, batch in batches:
+        for slug in batch:
+            seen.setdefault(slug, []).append(stem)
+    return {slug: stems for slug, stems in seen.items() if len(stems) > 1}
+
+
+def lint_corpus(batches: list[tuple[str, dict]], workers: int | None = None,
+                use_cache: bool = True) -> tuple[dict[str, list[dict]], dict]:
+    """(`batch/slug` -> issues for every article with issues, run stats)."""
+    cache = HashCache('lint', version=RULES_VERSION)
+    results: dict[str, list[dict]] = {}
+    todo = []
+    digests = {}
+    for stem, batch in batches:
+        for slug, article in batch.items():
+            key = f'{stem}/{slug}'
+            digests[key] = content_hash(dumps(article))
+            cached = cache.get(key, digests[key]) if use_cache else None
+            if cached is None:
+                todo.append((key, article))
+            elif cached:
+                results[key] = cached
+    for key, issues in pool_map(_lint_job, todo, workers, min_parallel=256):
+        cache.put(key, digests[key], issues)
+        if issues:
+            results[key] = issues
+
+    articles = merge_batches(batches)
+    for slug, stems in duplicate_slugs(batches).items():
+        for stem in stems:
+            results.setdefault(f'{stem}/{slug}', []).append(_issue(
+                'duplicate-slug',
+                f"defined in {', '.join(stems)}; {articles[slug]['batch']} wins in allArticles"))
+    cache.save()
+    return results, {'checked': len(todo), 'cached': cache.hits}
+
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true', help='re-check every article')
+    parser.add_argument('--strict', action='store_true', help='fail on warnings too')
+
+
+def run(args) -> int:
+    results, stats = lint_corpus(load_batches(), args.workers, use_cache=not args.no_cache)
+    errors = warnings = 0
+    for key in sorted(results):
+        for issue in results[key]:
+            if issue['severity'] == 'error':
+                errors += 1
+            else:
+                warnings += 1
+            print(f"{key}: {issue['severity']} [{issue['rule']}] {issue['message']}")
+    print(f"Linted {stats['checked'] + stats['cached']} articles ({stats['cached']} from cache): "
+          f'{errors} errors, {warnings} warnings')
+    return 1 if errors or (args.strict and warnings) else 0
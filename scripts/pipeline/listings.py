@@ -0,0 +1,260 @@
+"""Dedupe and merge the Google Maps listing crawls into one canonical file set.
+
+The three crawls overlap: the same business shows up under several trades,
+in re-crawls appended to the same file, and across files with different ids
+(`gm-` ids hash trade+dept+name, `gmc-` ids hash trade+city+name). Records are
+clustered on normalized phone and on gmId; each cluster becomes one canonical
+listing whose fields follow SOURCES precedence.
+
+Clusters live in an SQLite index on disk rather than in dicts, so memory stays
+flat however many cities get crawled. Output is one JSONL shard per deptCode.
+"""
+import json
+import sqlite3
+from pathlib import Path
+
+from .paths import CACHE_DIR, GM_DATA_DIR
+
+# Highest precedence first: the per-city crawl is the most recent and the only
+# one with `city`, turbo (v2) re-crawled the first pass with ratings.
+SOURCES = (
+    ('cities', 'gm-listings-cities.jsonl'),
+    ('v2', 'gm-listings-v2.jsonl'),
+    ('base', 'gm-listings.jsonl'),
+)
+
+# Fields merged by precedence: a lower-ranked source always wins. Between
+# records of the same source, volatile fields (ratings, website) take the
+# later line, which is the fresher re-crawl; identity fields keep the first.
+# Grouped fields are taken together from the same record so a rating never
+# ends up paired with another crawl's review count.
+FIELD_GROUPS = (
+    (('name',), False),
+    (('phone',), False),
+    (('deptCode',), False),
+    (('city',), False),
+    (('website',), True),
+    (('rating', 'reviewCount'), True),
+)
+
+CANONICAL_DIR = GM_DATA_DIR / 'canonical'
+INDEX_PATH = CACHE_DIR / 'listings-index.sqlite'
+COMMIT_EVERY = 5000
+
+
+def normalize_phone(raw: str | None) -> str | None:
+    """Same rules as normalizePhone in enrich-by-name.ts: 10-digit national form or None."""
+    if not raw:
+        return None
+    c = ''.join(ch for ch in str(raw) if ch.isdigit() or ch == '+')
+    if c.startswith('+33'):
+        c = '0' + c[3:]
+    elif c.startswith('0033'):
+        c = '0' + c[4:]
+    if len(c) != 10 or not c.isdigit() or c[0] != '0' or c[1] == '0':
+        return None
+    if c.startswith('089') or c.startswith('036'):
+        return None
+    return c
+
+
+def iter_jsonl(path: Path):
+    """Yield parsed records, skipping blank and truncated lines (crawls get killed mid-write)."""
+    with path.open(encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def iter_sources(data_dir: Path = GM_DATA_DIR):
+    """(rank, source name, record) across all crawls, in precedence order."""
+    for rank, (name, filename) in enumerate(SOURCES):
+        path = data_dir / filename
+        if path.exists():
+            for record in iter_jsonl(path):
+                yield rank, name, record
+
+
+def _present(value) -> bool:
+    return value is not None and value != ''
+
+
+class ListingIndex:
+    """Disk-backed clusters: `keys` maps phone/gmId keys to a cluster id."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript('''
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            PRAGMA cache_size = -16000;
+            CREATE TABLE keys (key TEXT PRIMARY KEY, cid INTEGER NOT NULL) WITHOUT ROWID;
+            CREATE INDEX keys_cid ON keys (cid);
+            CREATE TABLE clusters (cid INTEGER PRIMARY KEY, data TEXT NOT NULL);
+        ''')
+        self.pending = 0
+
+    def _lookup(self, keys: list[str]) -> list[int]:
+        marks = ','.join('?' * len(keys))
+        rows = self.db.execute(f'SELECT DISTINCT cid FROM keys WHERE key IN ({marks})', keys).fetchall()
+        return sorted(r[0] for r in rows)
+
+    def _load(self, cid: int) -> dict:
+        return json.loads(self.db.execute('SELECT data FROM clusters WHERE cid = ?', (cid,)).fetchone()[0])
+
+    def add(self, rank: int, source: str, record: dict):
+        phone = normalize_phone(record.get('phone'))
+        record = {**record, 'phone': phone}
+        keys = [f"gm:{record['gmId']}"] if record.get('gmId') else []
+        if phone:
+            keys.append(f'phone:{phone}')
+        if not keys:
+            return
+
+        cids = self._lookup(keys)
+        if cids:
+            cid = cids[0]
+            cluster = self._load(cid)
+            for other in cids[1:]:
+                _merge_cluster(cluster, self._load(other))
+                self.db.execute('UPDATE keys SET cid = ? WHERE cid = ?', (cid, other))
+                self.db.execute('DELETE FROM clusters WHERE cid = ?', (other,))
+            _merge_record(cluster, rank, source, record)
+            self.db.execute('UPDATE clusters SET data = ? WHERE cid = ?', (json.dumps(cluster, ensure_ascii=False), cid))
+        else:
+            cluster = _new_cluster()
+            _merge_record(cluster, rank, source, record)
+            cid = self.db.execute('INSERT INTO clusters (data) VALUES (?)', (json.dumps(cluster, ensure_ascii=False),)).lastrowid
+        self.db.executemany('INSERT OR IGNORE INTO keys (key, cid) VALUES (?, ?)', [(k, cid) for k in keys])
+
+        self.pending += 1
+        if self.pending >= COMMIT_EVERY:
+            self.db.commit()
+            self.pending = 0
+
+    def clusters(self):
+        """Canonical listings in first-seen order, streamed from disk."""
+        self.db.commit()
+        for (data,) in self.db.execute('SELECT data FROM clusters ORDER BY cid'):
+            yield canonical(json.loads(data))
+
+    def close(self):
+        self.db.close()
+
+
+def _new_cluster() -> dict:
+    return {'fields': {}, 'gmIds': [], 'trades': [], 'sources': []}
+
+
+def _append_unique(target: list, value):
+    if _present(value) and value not in target:
+        target.append(value)
+
+
+def _merge_record(cluster: dict, rank: int, source: str, record: dict):
+    """Fold one raw record into a cluster following FIELD_GROUPS precedence."""
+    fields = cluster['fields']
+    for group, latest_wins in FIELD_GROUPS:
+        if not _present(record.get(group[0])):
+            continue
+        current = fields.get(group[0])
+        if current is None or rank < current[0] or (latest_wins and rank == current[0]):
+            for field in group:
+                fields[field] = [rank, record.get(field)]
+    _append_unique(cluster['gmIds'], record.get('gmId'))
+    _append_unique(cluster['trades'], record.get('trade'))
+    _append_unique(cluster['sources'], source)
+
+
+def _merge_cluster(into: dict, other: dict):
+    for group, _ in FIELD_GROUPS:
+        theirs = other['fields'].get(group[0])
+        mine = into['fields'].get(group[0])
+        if theirs is not None and (mine is None or theirs[0] < mine[0]):
+            for field in group:
+                if field in other['fields']:
+                    into['fields'][field] = other['fields'][field]
+    for key in ('gmIds', 'trades', 'sources'):
+        for value in other[key]:
+            _append_unique(into[key], value)
+
+
+def canonical(cluster: dict) -> dict:
+    out = {'gmId': cluster['gmIds'][0] if cluster['gmIds'] else None}
+    for group, _ in FIELD_GROUPS:
+        for field in group:
+            value = cluster['fields'].get(field, [None, None])[1]
+            if _present(value):
+                out[field] = value
+    # Primary trade is the first one seen in the best-ranked crawl
+    out['trade'] = cluster['trades'][0] if cluster['trades'] else None
+    out['gmIds'] = cluster['gmIds']
+    out['trades'] = cluster['trades']
+    out['sources'] = cluster['sources']
+    return out
+
+
+def iter_canonical(out_dir: Path = CANONICAL_DIR):
+    """Stream canonical listings back from the per-department shards."""
+    for shard in sorted(out_dir.glob('*.jsonl')):
+        yield from iter_jsonl(shard)
+
+
+def iter_listings(data_dir: Path = GM_DATA_DIR, out_dir: Path = CANONICAL_DIR):
+    """Canonical listings, (re)building the shards first when they are missing or older than a crawl.
+
+    Never the raw crawls: they hold every listing several times over.
+    """
+    crawls = [data_dir / filename for _, filename in SOURCES if (data_dir / filename).exists()]
+    shards = list(out_dir.glob('*.jsonl'))
+    stale = not shards or (crawls and max(p.stat().st_mtime for p in crawls) > min(p.stat().st_mtime for p in shards))
+    if stale and crawls:
+        print(f'Canonical listings missing or older than the crawls: rebuilding {out_dir}')
+        build_canonical(data_dir, out_dir)
+    return iter_canonical(out_dir)
+
+
+def build_canonical(data_dir: Path = GM_DATA_DIR, out_dir: Path = CANONICAL_DIR) -> dict:
+    index = ListingIndex()
+    raw = 0
+    for rank, source, record in iter_sources(data_dir):
+        index.add(rank, source, record)
+        raw += 1
+
+    # Shards are appended cluster by cluster, so only file handles are held
+    # open, never the listings themselves.
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob('*.jsonl'):
+        old.unlink()
+    handles = {}
+    per_dept: dict[str, int] = {}
+    try:
+        for listing in index.clusters():
+            dept = listing.get('deptCode') or 'unknown'
+            if dept not in handles:
+                handles[dept] = (out_dir / f'{dept}.jsonl').open('w', encoding='utf-8')
+            handles[dept].write(json.dumps(listing, ensure_ascii=False) + '\n')
+            per_dept[dept] = per_dept.get(dept, 0) + 1
+    finally:
+        for f in handles.values():
+            f.close()
+        index.close()
+    return {'raw': raw, 'canonical': sum(per_dept.values()), 'departments': len(per_dept)}
+
+
+def add_arguments(parser):
+    parser.add_argument('--data-dir', type=Path, default=GM_DATA_DIR)
+    parser.add_argument('--out', type=Path, default=CANONICAL_DIR)
+
+
+def run(args):
+    stats = build_canonical(args.data_dir, args.out)
+    print(f"Merged {stats['raw']} raw listings into {stats['canonical']} canonical listings "
+          f"across {stats['departments']} departments -> {args.out}")
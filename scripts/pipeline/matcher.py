@@ -0,0 +1,256 @@
+"""Match providers to Google Maps listings with blocked, vectorized name scoring.
+
+Candidates are blocked on (deptCode, trade, phone prefix): a provider that
+already has a phone is only compared with listings sharing its 4-digit prefix,
+one without a phone with every listing of its department and trade. Trades are
+compared as service slugs: the provider specialty and the listing trade are
+lowercased and mapped through SPECIALTY_TO_SLUG of activate-providers.ts, so
+'Peintre', 'finition' and 'platrier' share a block. A specialty that maps to no
+listing trade ('isolation', unknown values) falls back to the block of every
+trade of the department. Inside a block, names become hashed character-trigram vectors and the whole block is
+scored with one matrix product. Blocks are spread over a process pool.
+
+Output lines are `{artisanId, phone, score, ...}`, the shape
+upload-matches-bulk.ts reads; extra keys (gmId, rating, website) are ignored
+there but let later jobs enrich more than the phone.
+"""
+import json
+import re
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from .listings import iter_jsonl, iter_listings, iter_sources, normalize_phone
+from .parallel import pool_map
+from .paths import ROOT
+from .tsliteral import load_const
+
+ACTIVATE_FILE = ROOT / 'scripts' / 'activate-providers.ts'
+ENRICH_DIR = ROOT / 'scripts' / '.enrich-data'
+PROVIDERS_FILE = ENRICH_DIR / 'artisans-cache.jsonl'
+MATCHES_FILE = ENRICH_DIR / 'matches' / 'matches-full.jsonl'
+
+DIMENSIONS = 4096
+THRESHOLD = 0.55
+PREFIX_LEN = 4
+ANY = '*'
+
+# Same stop list as match-and-enrich.ts: legal forms and generic trade words
+# carry no signal and make every "SARL ... Rénovation" look alike.
+LEGAL_FORMS = re.compile(
+    r'\b(sarl|sas|sasu|eurl|sa|sci|scp|snc|earl|eirl|auto[- ]?entrepreneur|ei|ste|societe|entreprise|ets|'
+    r'etablissements?|cabinet|agence|groupe|holding|international|france|services?|batiment|btp|construction|'
+    r'renovation|travaux|habitat|maison|concept|solutions?|multi[- ]?services?|general[e]?|artisan(ale)?)\b')
+
+
+def normalize_name(name: str) -> str:
+    name = unicodedata.normalize('NFD', name or '')
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    name = LEGAL_FORMS.sub(' ', name)
+    return ' '.join(re.sub(r'[^a-z0-9]', ' ', name).split())
+
+
+def trigram_matrix(names: list[str]) -> np.ndarray:
+    """L2-normalized hashed trigram counts, one row per name."""
+    rows, cols = [], []
+    for i, name in enumerate(names):
+        padded = f'  {normalize_name(name)} '
+        for j in range(len(padded) - 2):
+            rows.append(i)
+            cols.append(zlib.crc32(padded[j:j + 3].encode()) % DIMENSIONS)
+    matrix = np.zeros((len(names), DIMENSIONS), dtype=np.float32)
+    np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def load_trade_map() -> dict[str, str]:
+    """SPECIALTY_TO_SLUG of activate-providers.ts: provider specialty -> service slug."""
+    return load_const(ACTIVATE_FILE, 'SPECIALTY_TO_SLUG')
+
+
+def trade_key(value: str | None, trade_map: dict[str, str]) -> str:
+    """Lowercased, unaccented, hyphenated, then mapped like activate-providers.ts does."""
+    if not value:
+        return ANY
+    value = unicodedata.normalize('NFD', value)
+    value = '-'.join(''.join(c for c in value if not unicodedata.combining(c)).lower().split())
+    return trade_map.get(value, value)
+
+
+def block_key(dept: str, trade: str | None, phone: str | None) -> tuple[str, str, str]:
+    return dept or ANY, trade or ANY, phone[:PREFIX_LEN] if phone else ANY
+
+
+def build_blocks(providers: list[dict], listings: list[dict], trade_map: dict[str, str]) -> list[tuple]:
+    """(key, provider rows, listing rows) for every block holding both sides."""
+    index: dict[tuple, list[int]] = {}
+    listing_trades = set()
+    for li, listing in enumerate(listings):
+        dept = listing.get('deptCode') or ANY
+        prefix = listing['phone'][:PREFIX_LEN]
+        trades = {trade_key(t, trade_map) for t in listing.get('trades', [listing.get('trade')])}
+        listing_trades |= trades
+        for trade in trades | {ANY}:
+            index.setdefault((dept, trade, prefix), []).append(li)
+            index.setdefault((dept, trade, ANY), []).append(li)
+
+    by_block: dict[tuple, list[dict]] = {}
+    for provider in providers:
+        trade = trade_key(provider.get('specialty'), trade_map)
+        if trade not in listing_trades:
+            trade = ANY
+        by_block.setdefault(block_key(provider.get('dept'), trade, provider.get('phone')), []).append(provider)
+
+    blocks = []
+    for key, members in by_block.items():
+        ids = index.get(key)
+        if ids:
+            blocks.append((key, [(p['id'], p['name'], p.get('phone')) for p in members],
+                           [(listings[i]['phone'], listings[i]['name'], i) for i in ids]))
+    return blocks
+
+
+def score_block(block: tuple) -> list[tuple[str, int, float]]:
+    """Worker: best listing per provider as (provider id, listing index, score)."""
+    _, providers, listings = block
+    scores = trigram_matrix([p[1] for p in providers]) @ trigram_matrix([l[1] for l in listings]).T
+    # An identical phone is a certain match whatever the name says
+    listing_phones = np.array([l[0] for l in listings])
+    for row, (_, _, phone) in enumerate(providers):
+        if phone:
+            scores[row, listing_phones == phone] = 1.0
+    best = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(providers)), best]
+    return [(providers[r][0], listings[best[r]][2], float(best_scores[r]))
+            for r in np.flatnonzero(best_scores >= THRESHOLD)]
+
+
+def assign(candidates: list[tuple[str, int, float]]) -> list[tuple[str, int, float]]:
+    """Greedy one-to-one assignment by descending score, like upload-matches-bulk.ts."""
+    used_providers, used_listings, out = set(), set(), []
+    for provider_id, li, score in sorted(candidates, key=lambda c: -c[2]):
+        if provider_id in used_providers or li in used_listings:
+            continue
+        used_providers.add(provider_id)
+        used_listings.add(li)
+        out.append((provider_id, li, score))
+    return out
+
+
+def load_listings() -> list[dict]:
+    """Listings with a valid phone, one per phone."""
+    out, seen = [], set()
+    for listing in iter_listings():
+        phone = normalize_phone(listing.get('phone'))
+        if phone and listing.get('name') and phone not in seen:
+            seen.add(phone)
+            out.append({**listing, 'phone': phone})
+    return out
+
+
+def load_providers(path: Path) -> list[dict]:
+    """Rows of export-artisans-pg.ts: {id, name, phone, cp, city, dept[, specialty]}."""
+    return [{**p, 'phone': normalize_phone(p.get('phone'))}
+            for p in iter_jsonl(path) if p.get('id') and p.get('name')]
+
+
+def match(providers: list[dict], listings: list[dict], workers: int | None = None,
+          trade_map: dict[str, str] | None = None) -> tuple[list[dict], dict]:
+    started = time.perf_counter()
+    blocks = build_blocks(providers, listings, load_trade_map() if trade_map is None else trade_map)
+    pairs = sum(len(b[1]) * len(b[2]) for b in blocks)
+    # Biggest blocks first so one straggler does not hold up the pool
+    blocks.sort(key=lambda b: -len(b[1]) * len(b[2]))
+    candidates = [c for result in pool_map(score_block, blocks, workers, min_parallel=32) for c in result]
+    matches = []
+    for provider_id, li, score in assign(candidates):
+        listing = listings[li]
+        matches.append({
+            'artisanId': provider_id,
+            'phone': listing['phone'],
+            'score': round(score, 4),
+            'source': 'gm',
+            'gmId': listing.get('gmId'),
+            **{k: listing[k] for k in ('rating', 'reviewCount', 'website') if listing.get(k) is not None},
+        })
+    stats = {'blocks': len(blocks), 'pairs': pairs, 'seconds': time.perf_counter() - started}
+    return matches, stats
+
+
+def noncanonical(trade: str | None, n: int, trade_map: dict[str, str]) -> str | None:
+    """A provider-style spelling of a crawl trade: capitalized, an alias of the same service, or unmapped."""
+    if not trade:
+        return trade
+    aliases = [k for k, slug in trade_map.items() if slug == trade_map.get(trade, trade) and k != trade]
+    variants = [trade.capitalize(), aliases[n % len(aliases)].upper() if aliases else trade.upper(), 'isolation']
+    return variants[n % len(variants)]
+
+
+def benchmark(workers: int | None = None):
+    """Hold out the phones of the first crawl and recover them from the two later ones.
+
+    Run twice: with the crawl trades as specialties, then with the provider
+    spellings of noncanonical(), which must land in the same blocks (or the
+    department-wide one) and score about the same.
+    """
+    held_out, listings = [], []
+    for _, source, record in iter_sources():
+        phone = normalize_phone(record.get('phone'))
+        if not phone or not record.get('name'):
+            continue
+        if source == 'base':
+            held_out.append({'id': record['gmId'], 'name': record['name'], 'dept': record.get('deptCode'),
+                             'specialty': record.get('trade'), 'phone': None, 'expected': phone})
+        else:
+            listings.append({**record, 'phone': phone})
+    seen, unique = set(), []
+    for listing in listings:
+        if listing['phone'] not in seen:
+            seen.add(listing['phone'])
+            unique.append(listing)
+    expected = {p['id']: p['expected'] for p in held_out}
+    findable = sum(1 for p in held_out if p['expected'] in seen)
+    trade_map = load_trade_map()
+    naive = len(held_out) * len(unique)
+    print(f'Benchmark: {len(held_out)} providers x {len(unique)} listings '
+          f'({findable} held-out phones present in the later crawls)')
+
+    variants = [{**p, 'specialty': noncanonical(p['specialty'], n, trade_map)} for n, p in enumerate(held_out)]
+    for label, providers in (('crawl trades', held_out), ('provider spellings', variants)):
+        matches, stats = match(providers, unique, workers, trade_map)
+        correct = sum(1 for m in matches if expected[m['artisanId']] == m['phone'])
+        print(f'  {label}:')
+        print(f"    {stats['blocks']} blocks, {stats['pairs']:,} scored pairs "
+              f"({stats['pairs'] / naive:.2%} of {naive:,} naive comparisons)")
+        print(f"    {len(matches)} matches in {stats['seconds']:.2f}s "
+              f"({stats['pairs'] / max(stats['seconds'], 1e-9) / 1e6:.1f}M pairs/s)")
+        print(f'    precision {correct / max(len(matches), 1):.1%}, recall {correct / max(findable, 1):.1%}')
+
+
+def add_arguments(parser):
+    parser.add_argument('--providers', type=Path, default=PROVIDERS_FILE, help='provider export (JSONL)')
+    parser.add_argument('--out', type=Path, default=MATCHES_FILE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--benchmark', action='store_true', help='score against the bundled crawls instead')
+
+
+def run(args) -> int:
+    if args.benchmark:
+        benchmark(args.workers)
+        return 0
+    if not args.providers.exists():
+        print(f'Provider export not found: {args.providers} (run npx tsx scripts/export-artisans-pg.ts)')
+        return 1
+    matches, stats = match(load_providers(args.providers), load_listings(), args.workers)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    with args.out.open('w', encoding='utf-8') as f:
+        for m in matches:
+            f.write(json.dumps(m, ensure_ascii=False) + '\n')
+    print(f"{len(matches)} matches from {stats['blocks']} blocks ({stats['pairs']:,} pairs) "
+          f"in {stats['seconds']:.2f}s -> {args.out}")
+    return 0
@@ -0,0 +1,198 @@
+"""Link backlink prospects to the communes, villes and departements around them.
+
+The backlinks exports are the only geocoded source in the tree: every
+institution address carries latitude/longitude, postal code and commune name.
+This stage turns them into commune points, snaps each address to its INSEE
+code through insee-communes.json (median of every address seen in the
+commune, or the cityMarkers position from map-coverage.ts when there is one),
+and answers in bulk, through spatial.GridIndex:
+
+- for every located commune and france.ts ville: the N nearest institutions
+  and every institution within the radius;
+- for every departement: the N nearest institutions to the centre of its
+  located communes, plus the institutions whose commune is in it.
+
+Providers link through their commune (`address_city` is an INSEE code or a
+commune name, see insee-resolver.ts), so the per-commune lists serve them
+without a coordinate of their own. The result is one JSON file under
+scripts/output, next to the CSV exports it comes from; institutions are
+referenced by position in its `institutions` table.
+"""
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .backlinks import load_backlinks
+from .communes import ARRONDISSEMENTS, SOURCE_FILE as COMMUNES_FILE, normalize_name
+from .files import write_if_changed
+from .france import load_france
+from .paths import SCRIPTS_OUTPUT_DIR, SRC_DATA_DIR
+from .spatial import GridIndex, to_xyz
+from .tsliteral import load_const
+
+OUT_FILE = SCRIPTS_OUTPUT_DIR / 'backlinks-nearby.json'
+MARKERS_FILE = SRC_DATA_DIR / 'map-coverage.ts'
+
+NEAREST = 10
+RADIUS_KM = 30.0
+
+_CEDEX = re.compile(r'\s+cedex\b.*$', re.IGNORECASE)
+
+
+def departement_of(code: str) -> str:
+    """Departement of an INSEE code or postal code: 2 characters, 3 overseas."""
+    return code[:3] if code.startswith('97') else code[:2]
+
+
+def _postal_departements(postal_code: str) -> tuple[str, ...]:
+    if postal_code.startswith('20'):
+        return '2A', '2B'
+    return (departement_of(postal_code),)
+
+
+class CommuneResolver:
+    """(commune name, postal code) -> INSEE code, arrondissements folded into their commune."""
+
+    def __init__(self, communes: dict[str, dict]):
+        self.communes = communes
+        self.by_name: dict[tuple[str, str], list[str]] = {}
+        for code, entry in sorted(communes.items()):
+            self.by_name.setdefault((normalize_name(entry['n']), entry['d']), []).append(code)
+        self.parent = {str(code): parent for parent, first, last in ARRONDISSEMENTS for code in range(first, last + 1)}
+
+    def code(self, code: str) -> str | None:
+        code = self.parent.get(code, code)
+        return code if code in self.communes else None
+
+    def lookup(self, name: str, departements: tuple[str, ...]) -> str | None:
+        name = normalize_name(_CEDEX.sub('', name))
+        codes = [c for d in departements for c in self.by_name.get((name, d), ())]
+        # homonyms inside one departement cannot be told apart without coordinates
+        return codes[0] if len(codes) == 1 else None
+
+
+def _located(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    # a few addresses carry a latitude without a longitude
+    return ~(np.isnan(lat) | np.isnan(lon))
+
+
+def commune_points(columns: dict, resolver: CommuneResolver, markers: dict[str, tuple[float, float]]) -> dict[str, tuple[float, float]]:
+    """INSEE code -> (lat, lon) for every commune the exports or the city markers locate."""
+    seen: dict[str, list[tuple[float, float]]] = {}
+    located = _located(columns['lat'], columns['lon'])
+    for insee, lat, lon in zip(columns['insee'][located], columns['lat'][located], columns['lon'][located]):
+        if code := resolver.code(str(insee)):
+            seen.setdefault(code, []).append((lat, lon))
+    located = _located(columns['address_lat'], columns['address_lon'])
+    for postal_code, commune, lat, lon in zip(columns['address_postal_code'][located], columns['address_commune'][located],
+                                              columns['address_lat'][located], columns['address_lon'][located]):
+        if code := resolver.lookup(str(commune), _postal_departements(str(postal_code))):
+            seen.setdefault(code, []).append((lat, lon))
+    points = {code: tuple(float(x) for x in np.median(np.array(coords), axis=0)) for code, coords in seen.items()}
+    points.update(markers)
+    return dict(sorted(points.items()))
+
+
+def _links(results: list[tuple[np.ndarray, np.ndarray]]) -> list[list]:
+    return [[[int(i), round(float(km), 1)] for i, km in zip(ids, dist)] for ids, dist in results]
+
+
+def _center(points: list[tuple[float, float]]) -> tuple[float, float]:
+    # mean of the unit vectors, so a departement on the antimeridian would still work
+    x, y, z = to_xyz(*np.array(points).T).mean(axis=0)
+    return float(np.degrees(np.arctan2(z, np.hypot(x, y)))), float(np.degrees(np.arctan2(y, x)))
+
+
+def build(columns: dict, communes: dict[str, dict], villes: list[dict], departements: list[dict],
+          markers: list[dict], k: int = NEAREST, radius_km: float = RADIUS_KM) -> dict:
+    resolver = CommuneResolver(communes)
+    ville_codes = {v['slug']: resolver.lookup(v['name'], (v['departementCode'],)) for v in villes}
+    marker_points = {ville_codes[m['slug']]: (m['lat'], m['lng']) for m in markers if ville_codes.get(m['slug'])}
+    points = commune_points(columns, resolver, marker_points)
+
+    located = np.flatnonzero(_located(columns['lat'], columns['lon']))
+    index = GridIndex(columns['lat'][located], columns['lon'][located])
+    institutions = [
+        {
+            'nom': str(columns['nom'][i]),
+            'category': int(columns['category'][i]),
+            'insee': str(columns['insee'][i]),
+            'commune': str(columns['commune'][i]),
+            'postalCode': str(columns['postal_code'][i]),
+            'lat': round(float(columns['lat'][i]), 5),
+            'lon': round(float(columns['lon'][i]), 5),
+            'email': str(columns['email'][i]),
+            'phone': str(columns['phone'][i]),
+            'website': str(columns['website'][i]),
+        }
+        for i in located
+    ]
+
+    codes = list(points)
+    lat, lon = np.array([points[c] for c in codes]).T if codes else (np.empty(0), np.empty(0))
+    nearest = _links(index.nearest(lat, lon, k))
+    within = _links(index.radius(lat, lon, radius_km))
+    by_commune = {
+        code: {'lat': round(points[code][0], 5), 'lon': round(points[code][1], 5), 'nearest': n, 'radius': r}
+        for code, n, r in zip(codes, nearest, within)
+    }
+
+    by_ville = {
+        slug: {'insee': code, **by_commune[code]}
+        for slug, code in sorted(ville_codes.items()) if code in by_commune
+    }
+
+    dept_points: dict[str, list] = {}
+    for code, point in points.items():
+        dept_points.setdefault(communes[code]['d'], []).append(point)
+    dept_members: dict[str, list[int]] = {}
+    for position, institution in enumerate(institutions):
+        if code := resolver.code(institution['insee']):
+            dept_members.setdefault(communes[code]['d'], []).append(position)
+    dept_codes = [d['code'] for d in departements if d['code'] in dept_points]
+    centers = [_center(dept_points[code]) for code in dept_codes]
+    clat, clon = np.array(centers).T if centers else (np.empty(0), np.empty(0))
+    by_dept = {
+        code: {'lat': round(center[0], 5), 'lon': round(center[1], 5), 'nearest': n, 'institutions': dept_members.get(code, [])}
+        for code, center, n in zip(dept_codes, centers, _links(index.nearest(clat, clon, k)))
+    }
+
+    return {
+        'nearest': k,
+        'radiusKm': radius_km,
+        'categories': [str(c) for c in columns['category_labels']],
+        'institutions': institutions,
+        'communes': by_commune,
+        'villes': by_ville,
+        'departements': dict(sorted(by_dept.items())),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--nearest', type=int, default=NEAREST, help='institutions kept per commune/departement')
+    parser.add_argument('--radius', type=float, default=RADIUS_KM, help='radius query, in km')
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+
+
+def run(args) -> int:
+    columns, stats = load_backlinks()
+    if not stats['files']:
+        print('No backlinks export found (run python3 -m scripts.pipeline backlinks)')
+        return 1
+    communes = json.loads(COMMUNES_FILE.read_text(encoding='utf-8'))
+    villes, departements, _ = load_france()
+    markers = load_const(MARKERS_FILE, 'cityMarkers')
+
+    started = time.perf_counter()
+    result = build(columns, communes, villes, departements, markers, args.nearest, args.radius)
+    elapsed = time.perf_counter() - started
+    changed = write_if_changed(args.out, json.dumps(result, ensure_ascii=False, separators=(',', ':')) + '\n')
+    in_radius = sum(len(c['radius']) for c in result['communes'].values())
+    print(f"{len(result['institutions'])} institutions linked to {len(result['communes'])} communes, "
+          f"{len(result['villes'])}/{len(villes)} villes and {len(result['departements'])} departements "
+          f"({in_radius} pairs within {args.radius:g} km) in {elapsed:.2f}s "
+          f"-> {args.out} ({'updated' if changed else 'unchanged'})")
+    return 0
@@ -0,0 +1,152 @@
+"""Versioned offline bundle of the blog for the Capacitor apps.
+
+The android/ and ios/ shells load the web blog pages: every visit pulls a
+full rendered page, and nothing is readable offline. This stage writes
+under public/data/offline:
+
+    index.json               compact list of every article, newest first:
+                             {"fields": [...], "rows": [[...], ...], "categories": [...]}
+    articles/<hash>.json     one payload per article (metadata, body HTML from
+                             render.py, FAQ), named by its content hash so it
+                             is immutable and caches forever
+    manifest.json            the delta manifest: sync version, index hash,
+                             slug -> [payload hash, version it last changed],
+                             slug -> version it was removed
+
+An app remembers the version and hashes of its last sync; it fetches
+manifest.json, stops when the version did not move, and otherwise
+downloads index.json (when its hash changed) plus only the payloads whose
+hash differs, and drops the removed slugs (src/lib/offline-articles.ts).
+The per-article versions let a client that keeps no hashes do the same
+with `version > last sync`.
+
+Versions must survive fresh builds (public/data is not committed), so the
+per-article hashes and versions live in scripts/output/offline-sync.json,
+committed: a run that changes, adds or removes any article bumps the
+version by one and stamps the affected slugs with it; an unchanged corpus
+keeps the version, and every file is left untouched. The deploy pipeline
+runs `offline --check`: it writes the bundle from the committed ledger and
+fails when the ledger is out of date, since two deploys that each advanced
+an uncommitted ledger could publish different content under one version.
+"""
+import json
+from pathlib import Path
+
+from .cache import content_hash
+from .corpus import load_articles
+from .emit import CATEGORY_NORMALIZE, _prune, canonical_corpus, dumps, sorted_by_date
+from .files import write_if_changed
+from .paths import OUT_DIR, SCRIPTS_OUTPUT_DIR
+
+OFFLINE_DIR = OUT_DIR / 'offline'
+LEDGER_FILE = SCRIPTS_OUTPUT_DIR / 'offline-sync.json'
+
+# Bump when the payload or index shape changes: apps resync from scratch
+FORMAT = 1
+
+INDEX_FIELDS = ('slug', 'title', 'excerpt', 'category', 'date', 'readTime', 'image')
+PAYLOAD_FIELDS = ('slug', 'title', 'excerpt', 'category', 'tags', 'date', 'updatedDate', 'readTime', 'image',
+                  'author', 'authorBio', 'wordCount', 'faq')
+
+
+def payload(article: dict, html: str) -> dict:
+    out = {k: article[k] for k in PAYLOAD_FIELDS if article.get(k) is not None}
+    out['category'] = CATEGORY_NORMALIZE.get(out.get('category'), out.get('category'))
+    out['html'] = html
+    return out
+
+
+def compact_index(ordered: list[dict]) -> dict:
+    rows = [[CATEGORY_NORMALIZE.get(a.get(k), a.get(k)) if k == 'category' else a.get(k) for k in INDEX_FIELDS]
+            for a in ordered]
+    return {
+        'fields': list(INDEX_FIELDS),
+        'rows': rows,
+        'categories': sorted({row[INDEX_FIELDS.index('category')] for row in rows}),
+    }
+
+
+def load_ledger(path: Path) -> dict:
+    if not path.exists():
+        return {'format': FORMAT, 'version': 0, 'index': None, 'articles': {}, 'removed': {}}
+    ledger = json.loads(path.read_text(encoding='utf-8'))
+    if ledger.get('format') != FORMAT:
+        # a new shape invalidates every payload an app holds
+        return {'format': FORMAT, 'version': ledger['version'], 'index': None, 'articles': {}, 'removed': {}}
+    return ledger
+
+
+def advance(ledger: dict, hashes: dict[str, str], index_hash: str) -> tuple[dict, dict]:
+    """(next ledger, {'changed', 'added', 'removed'} slugs); the version moves only when something did."""
+    previous = ledger['articles']
+    added = [slug for slug in hashes if slug not in previous]
+    changed = [slug for slug in hashes if slug in previous and previous[slug][0] != hashes[slug]]
+    removed = [slug for slug in previous if slug not in hashes]
+    delta = {'added': added, 'changed': changed, 'removed': removed}
+    if not (added or changed or removed) and ledger['index'] == index_hash:
+        return ledger, delta
+
+    version = ledger['version'] + 1
+    stamped = {*added, *changed}
+    articles = {slug: [digest, version if slug in stamped else previous[slug][1]]
+                for slug, digest in hashes.items()}
+    gone = {slug: v for slug, v in ledger['removed'].items() if slug not in hashes}
+    gone.update(dict.fromkeys(removed, version))
+    return {'format': FORMAT, 'version': version, 'index': index_hash, 'articles': articles,
+            'removed': dict(sorted(gone.items()))}, delta
+
+
+def build_bundle(articles: dict[str, dict], ledger: dict, out_dir: Path = OFFLINE_DIR) -> tuple[dict, dict]:
+    """Write the bundle; returns (next ledger, stats)."""
+    articles, rendered, _ = canonical_corpus(articles)
+    ordered = sorted_by_date(articles)
+    payloads = {a['slug']: dumps(payload(a, rendered[a['slug']][1])) for a in ordered}
+    hashes = {slug: content_hash(text) for slug, text in payloads.items()}
+    index = dumps(compact_index(ordered))
+    ledger, delta = advance(ledger, hashes, content_hash(index))
+
+    written = write_if_changed(out_dir / 'index.json', index)
+    article_dir = out_dir / 'articles'
+    for slug, text in payloads.items():
+        written += write_if_changed(article_dir / f'{hashes[slug]}.json', text)
+    manifest = {
+        'format': FORMAT,
+        'version': ledger['version'],
+        'index': ledger['index'],
+        'articles': ledger['articles'],
+        'removed': ledger['removed'],
+    }
+    written += write_if_changed(out_dir / 'manifest.json', dumps(manifest))
+    removed = _prune(article_dir, {f'{digest}.json' for digest in hashes.values()})
+
+    changed = set(delta['added']) | set(delta['changed'])
+    return ledger, {
+        **delta,
+        'version': ledger['version'],
+        'written': written,
+        'pruned': removed,
+        'indexBytes': len(index.encode('utf-8')),
+        'payloadBytes': sum(len(t.encode('utf-8')) for t in payloads.values()),
+        'deltaBytes': sum(len(payloads[s].encode('utf-8')) for s in changed),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OFFLINE_DIR, help='output directory')
+    parser.add_argument('--ledger', type=Path, default=LEDGER_FILE, help='committed hashes and sync versions')
+    parser.add_argument('--check', action='store_true', help='fail if the ledger is out of date instead of writing it')
+
+
+def run(args) -> int:
+    ledger, stats = build_bundle(load_articles(), load_ledger(args.ledger), args.out)
+    text = json.dumps(ledger, ensure_ascii=False, indent=1) + '\n'
+    if args.check and (not args.ledger.exists() or args.ledger.read_text(encoding='utf-8') != text):
+        print(f'{args.ledger} is out of date\nRun python3 -m scripts.pipeline offline and commit it')
+        return 1
+    write_if_changed(args.ledger, text)
+    print(f"Offline bundle v{stats['version']}: {len(ledger['articles'])} articles "
+          f"({stats['indexBytes'] / 1024:.0f} KiB index, {stats['payloadBytes'] / 1024:.0f} KiB payloads); "
+          f"{len(stats['added'])} added, {len(stats['changed'])} changed, {len(stats['removed'])} removed "
+          f"({stats['deltaBytes'] / 1024:.0f} KiB to sync), {stats['written']} files written, "
+          f"{stats['pruned']} pruned -> {args.out}")
+    return 0
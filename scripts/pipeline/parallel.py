@@ -0,0 +1,21 @@
+"""Process-pool helper shared by the CPU-bound stages."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def pool_map(fn, items: list, workers: int | None = None, min_parallel: int = 64) -> list:
+    """`[fn(x) for x in items]`, spread over a process pool when it pays off.
+
+    `fn` must be a module-level function. Small inputs run inline: spawning
+    workers costs more than the work itself.
+    """
+    workers = workers or default_workers()
+    if workers == 1 or len(items) < min_parallel:
+        return [fn(x) for x in items]
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
@@ -0,0 +1,20 @@
+"""Repository locations shared by every pipeline stage."""
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SRC_DATA_DIR = ROOT / 'src' / 'lib' / 'data'
+BLOG_DIR = SRC_DATA_DIR / 'blog'
+GM_DATA_DIR = ROOT / 'scripts' / '.gm-data'
+SCRIPTS_OUTPUT_DIR = ROOT / 'scripts' / 'output'
+
+# Everything the pipeline emits is served as-is from public/
+OUT_DIR = Path(os.environ.get('PIPELINE_OUT_DIR', ROOT / 'public' / 'data'))
+BLOG_OUT_DIR = OUT_DIR / 'blog'
+
+# Hash caches persisted between runs (gitignored)
+CACHE_DIR = Path(os.environ.get('PIPELINE_CACHE_DIR', ROOT / '.pipeline-cache'))
+
+SITE_URL = (os.environ.get('NEXT_PUBLIC_SITE_URL') or 'https://servicesartisans.fr').strip().rstrip('/')
+SITE_NAME = 'ServicesArtisans'
@@ -0,0 +1,76 @@
+"""Columnar reader of the provider export (artisans-cache.jsonl).
+
+export-artisans-pg.ts writes one JSON object per provider, ~743k lines.
+read_columns() splits the file into byte ranges aligned on line starts and
+parses each range in a pool worker. Only the requested columns are kept, as
+plain lists in file order, ready to become NumPy arrays. A column can list
+several source keys, because the exports alias some fields (`cp` for
+address_postal_code, `dept` for address_department, ...).
+"""
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .matcher import PROVIDERS_FILE
+from .parallel import default_workers, pool_map
+
+# Below this size one process parses faster than a pool starts
+MIN_PARALLEL_BYTES = 8 << 20
+
+
+def _ranges(path: Path, parts: int) -> list[tuple[int, int]]:
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open('rb') as f:
+        for n in range(1, parts):
+            f.seek(max(size * n // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _read_range(task: tuple) -> dict[str, list]:
+    """Worker: the requested columns of the lines in [start, end)."""
+    path, start, end, columns = task
+    out = {name: [] for name in columns}
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # truncated last line of an interrupted export
+        for name, keys in columns.items():
+            value = None
+            for key in keys:
+                value = row.get(key)
+                if value is not None:
+                    break
+            out[name].append(value)
+    return out
+
+
+def read_columns(columns: dict[str, tuple[str, ...]], path: Path = PROVIDERS_FILE,
+                 workers: int | None = None) -> dict[str, list]:
+    """Column -> values in file order; `columns` maps each column to the keys it is read from."""
+    workers = workers or default_workers()
+    parts = workers * 4 if path.stat().st_size >= MIN_PARALLEL_BYTES else 1
+    tasks = [(os.fspath(path), start, end, columns) for start, end in _ranges(path, parts)]
+    out = {name: [] for name in columns}
+    for chunk in pool_map(_read_range, tasks, workers, min_parallel=2):
+        for name, values in chunk.items():
+            out[name].extend(values)
+    return out
+
+
+def js_truthy(values: list) -> np.ndarray:
+    """Boolean array of JavaScript truthiness: null, '', 0, false and NaN are false, [] and {} true."""
+    return np.fromiter((isinstance(v, (list, dict)) or (bool(v) and not (isinstance(v, float) and math.isnan(v)))
+                        for v in values), dtype=bool, count=len(values))
@@ -0,0 +1,175 @@
+"""Score every provider of the export like calculateQualityScore in data-quality.ts.
+
+scripts/lib/data-quality.ts scores one record at a time and
+updateQualityScores() writes them back 500 rows and one UPDATE per provider
+at a time. Here the export is read as columns (providers.read_columns), each
+rule becomes a presence vector, and the whole table is scored at once:
+
+- score: presence matrix x RULES points, capped at 100;
+- flags: one bit per missing_* flag (FLAGS order), turned into the same JSON
+  arrays data_quality_flags stores, once per distinct bitmask.
+
+Outputs under scripts/.enrich-data/quality:
+
+    quality-scores.csv   id, data_quality_score, data_quality_flags
+    upload.sql           psql script: \\copy into a temp table, one UPDATE
+    summary.json         flag legend, totals, per-department and per-trade
+                         score histograms (buckets of 10, 100 on its own)
+"""
+import csv
+import io
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .files import write_if_changed
+from .matcher import ENRICH_DIR, PROVIDERS_FILE
+from .paths import ROOT
+from .providers import js_truthy, read_columns
+
+OUT_DIR = ENRICH_DIR / 'quality'
+
+# (column, points, flag when missing), in calculateQualityScore order
+RULES = (
+    ('name', 10, 'missing_name'),
+    ('siren', 10, 'missing_siren'),
+    ('siret', 10, 'missing_siret'),
+    ('address_street', 5, 'missing_street'),
+    ('address_city', 5, 'missing_city'),
+    ('address_postal_code', 5, 'missing_postal_code'),
+    ('address_department', 5, 'missing_department'),
+    ('gps', 5, 'missing_gps'),
+    ('phone', 10, 'missing_phone'),
+    ('email', 5, 'missing_email'),
+    ('code_naf', 5, 'missing_naf'),
+    ('creation_date', 5, 'missing_creation_date'),
+    ('legal_form', 5, 'missing_legal_form'),
+    ('specialty', 5, 'missing_specialty'),
+    ('website', 3, None),
+    ('description', 4, None),
+    ('employee_count', 3, None),
+)
+FLAGS = [flag for _, _, flag in RULES if flag]
+MAX_SCORE = 100
+BUCKETS = MAX_SCORE // 10 + 1
+
+# column -> export keys; export-artisans-pg.ts aliases the address fields
+COLUMNS = {
+    'id': ('id',),
+    **{column: (column,) for column, _, _ in RULES if column != 'gps'},
+    'address_city': ('address_city', 'city'),
+    'address_postal_code': ('address_postal_code', 'cp'),
+    'address_department': ('address_department', 'dept'),
+    'latitude': ('latitude',),
+    'longitude': ('longitude',),
+    'description': ('description', 'has_description'),
+}
+
+# Run from the repository root: psql "$DATABASE_URL" -f <out>/upload.sql
+UPLOAD_SQL = '''-- Generated by python3 -m scripts.pipeline quality
+BEGIN;
+CREATE TEMP TABLE quality_scores (id uuid PRIMARY KEY, score integer NOT NULL, flags jsonb NOT NULL) ON COMMIT DROP;
+\\copy quality_scores FROM '{csv}' WITH (FORMAT csv, HEADER true)
+UPDATE providers p
+SET data_quality_score = q.score, data_quality_flags = q.flags
+FROM quality_scores q
+WHERE p.id = q.id
+  AND (p.data_quality_score IS DISTINCT FROM q.score OR p.data_quality_flags IS DISTINCT FROM q.flags);
+COMMIT;
+'''
+
+
+def presence(columns: dict[str, list]) -> np.ndarray:
+    """(providers, RULES) boolean matrix: the rule's field is truthy."""
+    present = {name: js_truthy(values) for name, values in columns.items() if name != 'id'}
+    present['gps'] = present['latitude'] & present['longitude']
+    return np.column_stack([present[column] for column, _, _ in RULES])
+
+
+def score(present: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(scores, flag bitmasks): bit i of a mask is set when FLAGS[i] applies."""
+    points = np.array([p for _, p, _ in RULES], dtype=np.int16)
+    scores = np.minimum(present.astype(np.int16) @ points, MAX_SCORE).astype(np.uint8)
+    flagged = [i for i, (_, _, flag) in enumerate(RULES) if flag]
+    bits = np.left_shift(np.uint32(1), np.arange(len(flagged), dtype=np.uint32))
+    masks = (~present[:, flagged]).astype(np.uint32) @ bits
+    return scores, masks
+
+
+def flag_names(mask: int) -> list[str]:
+    return [flag for i, flag in enumerate(FLAGS) if mask >> i & 1]
+
+
+def histograms(keys: list, scores: np.ndarray, masks: np.ndarray) -> dict[str, dict]:
+    """Key -> {count, mean, histogram, flags} for one grouping column."""
+    names, group = np.unique(np.array([k or '' for k in keys], dtype=str), return_inverse=True)
+    count = np.bincount(group, minlength=len(names))
+    total = np.bincount(group, weights=scores, minlength=len(names))
+    buckets = np.bincount(group * BUCKETS + scores // 10, minlength=len(names) * BUCKETS).reshape(-1, BUCKETS)
+    flags = np.stack([np.bincount(group, weights=(masks >> i) & 1, minlength=len(names)) for i in range(len(FLAGS))], axis=1)
+    return {
+        str(name) or '?': {
+            'count': int(count[g]),
+            'mean': round(float(total[g] / count[g]), 1),
+            'histogram': buckets[g].tolist(),
+            'flags': {flag: int(flags[g, i]) for i, flag in enumerate(FLAGS) if flags[g, i]},
+        }
+        for g, name in enumerate(names)
+    }
+
+
+def render_csv(ids: list, scores: np.ndarray, masks: np.ndarray) -> str:
+    """id, data_quality_score, data_quality_flags; each distinct mask is serialized once."""
+    unique, inverse = np.unique(masks, return_inverse=True)
+    flag_json = [json.dumps(flag_names(int(m)), separators=(',', ':')) for m in unique]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(('id', 'score', 'flags'))
+    writer.writerows(zip(ids, scores.tolist(), (flag_json[i] for i in inverse.tolist())))
+    return buffer.getvalue()
+
+
+def _relative(path: Path) -> str:
+    path = path.resolve()
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else path.as_posix()
+
+
+def add_arguments(parser):
+    parser.add_argument('--providers', type=Path, default=PROVIDERS_FILE, help='provider export (JSONL)')
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='output directory')
+    parser.add_argument('--workers', type=int, default=None)
+
+
+def run(args) -> int:
+    if not args.providers.exists():
+        print(f'Provider export not found: {args.providers} (run npx tsx scripts/export-artisans-pg.ts)')
+        return 1
+    started = time.perf_counter()
+    columns = read_columns(COLUMNS, args.providers, args.workers)
+    parsed = time.perf_counter()
+    ids = columns.pop('id')
+    keep = [i for i, value in enumerate(ids) if value]
+    if len(keep) < len(ids):
+        ids = [ids[i] for i in keep]
+        columns = {name: [values[i] for i in keep] for name, values in columns.items()}
+    scores, masks = score(presence(columns))
+    scored = time.perf_counter()
+
+    summary = {
+        'flags': FLAGS,
+        'providers': len(ids),
+        'mean': round(float(scores.mean()), 1) if len(ids) else 0,
+        'histogram': np.bincount(scores // 10, minlength=BUCKETS).tolist(),
+        'flagCounts': {flag: int(((masks >> i) & 1).sum()) for i, flag in enumerate(FLAGS)},
+        'byDepartement': histograms(columns['address_department'], scores, masks),
+        'byTrade': histograms(columns['specialty'], scores, masks),
+    }
+    write_if_changed(args.out / 'quality-scores.csv', render_csv(ids, scores, masks))
+    write_if_changed(args.out / 'upload.sql', UPLOAD_SQL.format(csv=_relative(args.out / 'quality-scores.csv')))
+    write_if_changed(args.out / 'summary.json', json.dumps(summary, ensure_ascii=False, indent=1) + '\n')
+    print(f"Scored {len(ids):,} providers (mean {summary['mean']}) in {scored - started:.2f}s "
+          f"({parsed - started:.2f}s reading, {scored - parsed:.2f}s scoring), "
+          f"{len(summary['byDepartement'])} departements, {len(summary['byTrade'])} trades -> {args.out}")
+    return 0
@@ -0,0 +1,90 @@
+"""Precompute the quartier slugs and per-ville slug maps of france.ts.
+
+getQuartiersByVille() re-slugifies every quartier of a ville on each call,
+getQuartierBySlug() scans them until a slug matches, and quartier-data.ts
+builds the profile of all ~8 200 quartiers when the module loads, then
+filters the whole record to list one ville. This stage writes
+quartier-index.ts:
+
+- QUARTIER_SLUGS: ville slug -> toQuartierSlug() of each quartier, in
+  `ville.quartiers` order;
+- QUARTIER_INDEX: ville slug -> quartier slug -> position in
+  `ville.quartiers` (the first one when two names share a slug, like the
+  `find` it replaces);
+
+so quartier pages, the service x quartier sitemaps and quartier-data.ts
+resolve a quartier with two lookups and compute its profile on demand.
+
+The keys of QUARTIER_PRIX_REEL (quartier-real-data.ts) name quartiers as
+`villeSlug::quartierName`; a key that matches no quartier would silently
+never apply, so it fails the stage.
+"""
+from pathlib import Path
+
+from .france import load_france, quartier_slug
+from .paths import SRC_DATA_DIR
+from .tsemit import generated_header, render_module, ts_const, write_module
+from .tsliteral import extract_const
+
+REAL_DATA_FILE = SRC_DATA_DIR / 'quartier-real-data.ts'
+OUT_FILE = SRC_DATA_DIR / 'quartier-index.ts'
+
+CONSTS = (
+    ('QUARTIER_COUNT', 'number', 'Number of quartiers over all villes'),
+    ('QUARTIER_SLUGS', 'Record<string, string[]>', 'Ville slug -> slug of each quartier, in `ville.quartiers` order'),
+    ('QUARTIER_INDEX', 'Record<string, Record<string, number>>',
+     'Ville slug -> quartier slug -> position in `ville.quartiers`'),
+)
+
+
+def build_index(villes: list[dict], real_keys: list[str]) -> dict:
+    slugs, index = {}, {}
+    for ville in villes:
+        quartiers = ville.get('quartiers') or []
+        if not quartiers:
+            continue
+        slugs[ville['slug']] = [quartier_slug(name) for name in quartiers]
+        positions = {}
+        for i, slug in enumerate(slugs[ville['slug']]):
+            positions.setdefault(slug, i)
+        index[ville['slug']] = positions
+
+    names = {(ville['slug'], name) for ville in villes for name in ville.get('quartiers') or []}
+    orphans = [key for key in real_keys if tuple(key.split('::', 1)) not in names]
+    if orphans:
+        raise ValueError(f'QUARTIER_PRIX_REEL keys match no quartier in france.ts: {", ".join(orphans)}')
+    return {
+        'QUARTIER_COUNT': sum(len(s) for s in slugs.values()),
+        'QUARTIER_SLUGS': slugs,
+        'QUARTIER_INDEX': index,
+    }
+
+
+def render(index: dict) -> list[str]:
+    return [generated_header('quartiers', 'src/lib/data/france.ts')] + [
+        ts_const(name, type_, index[name], doc=doc) for name, type_, doc in CONSTS
+    ]
+
+
+def add_arguments(parser):
+    parser.add_argument('--out', type=Path, default=OUT_FILE)
+    parser.add_argument('--check', action='store_true', help='fail if the index is out of date instead of writing it')
+
+
+def run(args) -> int:
+    villes, _, _ = load_france()
+    real_keys = list(extract_const(REAL_DATA_FILE.read_text(encoding='utf-8'), 'QUARTIER_PRIX_REEL'))
+    index = build_index(villes, real_keys)
+    parts = render(index)
+    if args.check:
+        if not args.out.exists() or args.out.read_text(encoding='utf-8') != render_module(parts):
+            print(f'{args.out} is out of date\nRun python3 -m scripts.pipeline quartiers')
+            return 1
+        print(f'{args.out} is up to date')
+        return 0
+    written = write_module(args.out, parts)
+    collisions = index['QUARTIER_COUNT'] - sum(len(p) for p in index['QUARTIER_INDEX'].values())
+    print(f"Indexed {index['QUARTIER_COUNT']} quartiers of {len(index['QUARTIER_SLUGS'])} villes "
+          f"({collisions} slug collisions, {len(real_keys)} real-price entries checked) "
+          f"-> {args.out} ({'updated' if written else 'unchanged'})")
+    return 0
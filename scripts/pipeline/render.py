@@ -0,0 +1,246 @@
+"""Render blog content blocks to HTML through a content-addressed block cache.
+
+The markup mirrors the block switch in src/app/(public)/blog/[slug]/page.tsx
+(same elements and classes, inline **bold** and [links](...)); the lucide
+callout icons and the <section> wrappers around each h2 stay in the page.
+
+Articles share many blocks verbatim: call-to-action paragraphs, takeaway
+callouts, TVA tables. Each block span is keyed by the hash of its source
+lines, and the cache stores its parsed block and rendered HTML, so a block
+is parsed and rendered once no matter how many articles repeat it, and not
+at all on the next run. `--benchmark N` measures this on a synthetic corpus
+of N articles recombined from the real blocks.
+"""
+import html
+import random
+import re
+import time
+
+from .blocks import block_counts, parse_span, parse_table, split_lines, split_spans
+from .cache import HashCache, content_hash
+from .corpus import load_articles
+from .paths import CACHE_DIR
+
+# Bump when the markup or block_counts changes: every cached block is rendered again
+RENDER_VERSION = 2
+
+INLINE = re.compile(r'(\*\*(.+?)\*\*|\[([^\]]+)\]\(([^)]+)\))')
+BULLET = re.compile(r'^-\s*')
+AUTHOR = re.compile(r'^(--|—)\s*')
+QUOTES = re.compile(r'^"|"$')
+GUILLEMETS = re.compile(r'^«\s*|\s*»$')
+
+CALLOUT_STYLES = {
+    'tip': ('bg-emerald-50', 'border-emerald-400', 'text-emerald-700'),
+    'warning': ('bg-orange-50', 'border-orange-400', 'text-orange-700'),
+    'info': ('bg-blue-50', 'border-blue-400', 'text-blue-700'),
+    'takeaway': ('bg-amber-50', 'border-amber-400', 'text-amber-700'),
+    'budget': ('bg-gradient-to-r from-amber-50 to-orange-50', 'border-amber-400', 'text-amber-700'),
+    'expert': ('bg-slate-50', 'border-slate-400', 'text-slate-700'),
+}
+CALLOUT_LABELS = {
+    'tip': 'CONSEIL',
+    'warning': 'ATTENTION',
+    'info': 'BON À SAVOIR',
+    'takeaway': 'À RETENIR',
+    'budget': 'BUDGET INDICATIF',
+    'expert': 'AVIS D’EXPERT',
+}
+
+PARAGRAPH = '<p class="article-paragraph">'
+INTRO = '<p class="article-intro article-excerpt">'
+
+
+def _esc(text: str) -> str:
+    return html.escape(text, quote=True)
+
+
+def render_inline(text: str) -> str:
+    """renderInlineMarkdown(): **bold** and [text](url), external links nofollow."""
+    out, last = [], 0
+    for m in INLINE.finditer(text):
+        out.append(_esc(text[last:m.start()]))
+        if m.group(2):
+            out.append(f'<strong>{_esc(m.group(2))}</strong>')
+        else:
+            url = m.group(4)
+            external = url.startswith('http://') or url.startswith('https://')
+            attrs = ' target="_blank" rel="nofollow noopener noreferrer"' if external else ''
+            out.append(f'<a href="{_esc(url)}" class="text-amber-600 hover:underline"{attrs}>{_esc(m.group(3))}</a>')
+        last = m.end()
+    out.append(_esc(text[last:]))
+    return ''.join(out)
+
+
+def _table(headers: list[str], rows: list[list[str]], wrapper: str) -> str:
+    head = ''.join(f'<th>{_esc(h)}</th>' for h in headers)
+    body = ''.join('<tr>' + ''.join(f'<td>{render_inline(c)}</td>' for c in row) + '</tr>' for row in rows)
+    return f'<div class="{wrapper}"><table class="article-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>'
+
+
+def _callout_content(block: dict) -> str:
+    kind, content = block['calloutType'], block['content']
+    if kind == 'takeaway':
+        items = ''.join(f'<li>{render_inline(item)}</li>' for item in (BULLET.sub('', line) for line in content))
+        return f'<ul class="article-list article-list-unordered mt-2 mb-0">{items}</ul>'
+    if kind == 'budget':
+        text = ''.join(f'<p>{render_inline(line)}</p>' for line in content if not line.startswith('|'))
+        table = parse_table([line for line in content if line.startswith('|')])
+        if table:
+            text += _table(table['headers'], table['rows'], 'article-table-wrapper mt-2')
+        return f'<div class="article-callout-content">{text}</div>'
+    if kind == 'expert':
+        quote, author = [], ''
+        for line in content:
+            if line.startswith('-- ') or line.startswith('— '):
+                author = AUTHOR.sub('', line)
+            else:
+                quote.append(GUILLEMETS.sub('', QUOTES.sub('', line)))
+        out = f'<p class="italic text-lg leading-relaxed text-gray-700">«\u00a0{_esc(" ".join(quote))}\u00a0»</p>'
+        if author:
+            out += f'<p class="mt-3 font-semibold text-sm text-slate-600">— {_esc(author)}</p>'
+        return f'<div class="article-callout-content">{out}</div>'
+    return '<div class="article-callout-content">' + ''.join(f'<p>{render_inline(line)}</p>' for line in content) + '</div>'
+
+
+def render_block(block: dict) -> str:
+    kind = block['type']
+    if kind == 'p':
+        return f'{PARAGRAPH}{render_inline(block["text"])}</p>'
+    if kind == 'h2':
+        return (f'<h2 id="{_esc(block["id"])}" class="article-h2">'
+                f'<span class="article-h2-bar" aria-hidden="true"></span>{_esc(block["text"])}</h2>')
+    if kind == 'h3':
+        return f'<h3 id="{_esc(block["id"])}" class="article-h3">{_esc(block["text"])}</h3>'
+    if kind == 'list':
+        items = ''.join(f'<li>{render_inline(item)}</li>' for item in block['items'])
+        return f'<ul class="article-list article-list-{"ordered" if block["ordered"] else "unordered"}">{items}</ul>'
+    if kind == 'callout':
+        bg, border, header = CALLOUT_STYLES[block['calloutType']]
+        label = block['title'] or CALLOUT_LABELS[block['calloutType']]
+        return (f'<div class="article-callout {bg} {border}"><div class="article-callout-header {header}">{_esc(label)}</div>'
+                f'{_callout_content(block)}</div>')
+    if kind == 'table':
+        return _table(block['headers'], block['rows'], 'article-table-wrapper')
+    if kind == 'blockquote':
+        return f'<blockquote class="article-blockquote">{render_inline(block["text"])}</blockquote>'
+    return ''
+
+
+class BlockCache:
+    """Span hash -> [parsed block, html, block_counts], persisted as a HashCache.
+
+    The key is the content hash of the span, so identical spans share one
+    entry across articles and batches; entries no article used this run are
+    dropped on save. Spans already seen in this run are found by their text,
+    which skips hashing the repeats.
+    """
+
+    def __init__(self, name: str = 'blocks'):
+        self._cache = HashCache(name, RENDER_VERSION)
+        self._seen: dict[str, list] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, span: list[str]) -> list:
+        text = kind + '\n' + '\n'.join(span)
+        entry = self._seen.get(text)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        key = content_hash(text)
+        entry = self._cache.get(key, key)
+        if entry is None:
+            self.misses += 1
+            block = parse_span(kind, span)
+            entry = [block, render_block(block), block_counts(block)] if block else [None, '', [0, 0, 0]]
+            self._cache.put(key, key, entry)
+        else:
+            self.hits += 1
+        self._seen[text] = entry
+        return entry
+
+    def save(self):
+        self._cache.save()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def render_content(content: list[str], cache: BlockCache) -> tuple[list[dict], str, list[list[int]]]:
+    """(parsed blocks, article body HTML, block_counts of each block) of one article's `content`."""
+    blocks, parts, counts = [], [], []
+    for kind, span in split_spans(split_lines(content)):
+        block, markup, block_count = cache.get(kind, span)
+        if block is not None:
+            blocks.append(block)
+            parts.append(markup)
+            counts.append(block_count)
+    # the page styles the opening paragraph as the intro
+    if blocks and blocks[0]['type'] == 'p':
+        parts[0] = INTRO + parts[0].removeprefix(PARAGRAPH)
+    return blocks, '\n'.join(parts), counts
+
+
+def render_corpus(articles: dict[str, dict], cache: BlockCache | None = None) -> tuple[dict[str, tuple], dict]:
+    """(slug -> render_content() result, run stats); the cache is saved when owned here."""
+    own = cache is None
+    cache = cache or BlockCache()
+    started = time.perf_counter()
+    rendered = {slug: render_content(article['content'], cache) for slug, article in articles.items()}
+    if own:
+        cache.save()
+    return rendered, {'articles': len(rendered), 'hits': cache.hits, 'misses': cache.misses,
+                      'hit_ratio': cache.hit_ratio, 'seconds': time.perf_counter() - started}
+
+
+def synthetic_corpus(articles: dict[str, dict], size: int, seed: int = 0, fresh: float = 0.02) -> dict[str, dict]:
+    """`size` articles of 20-60 real spans drawn at random; a `fresh` share of paragraphs gets unique text."""
+    rng = random.Random(seed)
+    spans = [span for article in articles.values() for _, span in split_spans(split_lines(article['content']))]
+    corpus = {}
+    for n in range(size):
+        lines = []
+        for span in rng.choices(spans, k=rng.randint(20, 60)):
+            if len(span) == 1 and not span[0].startswith(('#', '|', '- ', '> ', ':::')) and rng.random() < fresh:
+                span = [f'{span[0]} ({n})']
+            lines.extend(span)
+        corpus[f'synthetic-{n}'] = {'content': ['\n'.join(lines)]}
+    return corpus
+
+
+def benchmark(size: int):
+    articles = synthetic_corpus(load_articles(), size)
+    print(f'Benchmark: {size} synthetic articles recombined from the corpus blocks')
+    started = time.perf_counter()
+    total = 0
+    for article in articles.values():
+        for kind, span in split_spans(split_lines(article['content'])):
+            block = parse_span(kind, span)
+            total += len(render_block(block)) if block else 0
+    print(f'  no cache: {time.perf_counter() - started:.2f}s')
+    name = 'blocks-benchmark'
+    (CACHE_DIR / f'{name}.json').unlink(missing_ok=True)
+    for label in ('cold', 'warm'):
+        cache = BlockCache(name)
+        _, stats = render_corpus(articles, cache)
+        saved = time.perf_counter()
+        cache.save()
+        print(f"  {label}: {stats['hits'] + stats['misses']:,} blocks in {stats['seconds']:.2f}s "
+              f"({stats['hit_ratio']:.1%} hits, {stats['misses']:,} rendered), cache saved in {time.perf_counter() - saved:.2f}s")
+
+
+def add_arguments(parser):
+    parser.add_argument('--benchmark', type=int, metavar='N', help='render N synthetic articles, cold then warm cache')
+
+
+def run(args) -> int:
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return 0
+    _, stats = render_corpus(load_articles())
+    print(f"Rendered {stats['articles']} articles: {stats['hits'] + stats['misses']} blocks, "
+          f"{stats['hit_ratio']:.1%} from the block cache ({stats['misses']} rendered) in {stats['seconds']:.2f}s")
+    return 0
@@ -0,0 +1,198 @@
+"""Write the static sitemap chunks and their index, gzipped.
+
+src/app/sitemap.ts used to build these URL families inside generateSitemaps():
+it counted and sliced the service x ville (x quartier) products on every
+crawler hit, so each request materialized a whole family. Here every family is
+described as runs of a path template over a product of slug lists, and URL
+n of a run is found by mixed-radix arithmetic. Each chunk of CHUNK_SIZE URLs
+is then an independent task: a worker streams its URLs into a gzip stream,
+without building the family. Chunks run on a process pool.
+
+Outputs, under public/data/sitemaps and served as-is:
+
+    <family>-<n>.xml.gz   at most CHUNK_SIZE URLs each
+    sitemap-index.xml     sitemap index of every chunk
+
+The deploy pipeline writes them before `next build`; robots.ts lists
+sitemap-index.xml. Provider pages need the database and are the only
+sitemaps left in sitemap.ts, indexed by /sitemap.xml. The Phase 2 cities
+(service-cities-extended) are written with `--extended`.
+"""
+import gzip
+import io
+import math
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from .content import COLLECTIONS, load_entries
+from .corpus import load_articles
+from .files import write_if_changed
+from .france import FRANCE_FILE, quartier_slug
+from .parallel import pool_map
+from .paths import OUT_DIR, SITE_URL
+from .tsliteral import extract_const
+
+SITEMAP_DIR = OUT_DIR / 'sitemaps'
+# public/ is served from the site root
+SITEMAP_URL = f'{SITE_URL}/data/sitemaps'
+INDEX_FILE = 'sitemap-index.xml'
+
+# Under the 50 000 URL limit of the protocol, like sitemap.ts
+CHUNK_SIZE = 45_000
+# Same Phase 1 crawl budget as TOP_CITIES_PHASE1 in sitemap.ts
+TOP_CITIES_PHASE1 = 300
+
+STATIC_PAGES = (
+    '/a-propos', '/contact', '/blog', '/faq', '/comment-ca-marche', '/tarifs', '/urgence', '/devis',
+    '/mentions-legales', '/confidentialite', '/cgv', '/accessibilite', '/notre-processus-de-verification',
+    '/politique-avis', '/mediation', '/plan-du-site', '/outils/calculateur-prix', '/outils/diagnostic',
+    '/carte-artisans', '/artisans',
+)
+
+HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+FOOTER = '</urlset>\n'
+
+
+def load_data() -> dict:
+    """Slug lists of every dimension, in the order sitemap.ts iterates them."""
+    src = FRANCE_FILE.read_text(encoding='utf-8')
+    villes = extract_const(src, 'villes')
+    trades, problems, guides = (load_entries(spec) for spec in COLLECTIONS)
+    articles = load_articles()
+    return {
+        'services': [s['slug'] for s in extract_const(src, 'services')],
+        'villes': [v['slug'] for v in villes],
+        'villeQuartiers': [f"{v['slug']}/{quartier_slug(q)}" for v in villes for q in v.get('quartiers') or []],
+        'departements': [d['slug'] for d in extract_const(src, 'departements')],
+        'regions': [r['slug'] for r in extract_const(src, 'regions')],
+        'trades': [t['slug'] for t in trades],
+        'emergency': [t['slug'] for t in trades if t.get('emergencyInfo')],
+        'problems': [p['slug'] for p in problems],
+        'guides': [g['slug'] for g in guides],
+        'articles': list(articles),
+        'articleDates': [a.get('updatedDate') or a['date'] for a in articles.values()],
+    }
+
+
+def families(data: dict, extended: bool = False) -> list[tuple[str, list[tuple]]]:
+    """(family, runs); a run is (template, axes, lastmods) and yields template.format(*product(axes))."""
+    services, villes, vq = data['services'], data['villes'], data['villeQuartiers']
+    out = [
+        ('static', [
+            ('', [], None),
+            ('{}', [list(STATIC_PAGES)], None),
+            ('/blog/{}', [data['articles']], data['articleDates']),
+            ('/services', [], None),
+            ('/services/{}', [services], None),
+            ('/urgence/{}', [data['emergency']], None),
+            ('/tarifs/{}', [data['trades']], None),
+        ]),
+        ('service-cities', [('/services/{}/{}', [services, villes[:TOP_CITIES_PHASE1]], None)]),
+    ]
+    if extended:
+        out.append(('service-cities-extended', [('/services/{}/{}', [services, villes[TOP_CITIES_PHASE1:]], None)]))
+    out += [
+        ('cities', [('/villes', [], None), ('/villes/{}', [villes], None)]),
+        ('geo', [('/departements', [], None), ('/departements/{}', [data['departements']], None),
+                 ('/regions', [], None), ('/regions/{}', [data['regions']], None)]),
+        ('quartiers', [('/villes/{}', [vq], None)]),
+        ('service-quartiers', [('/services/{}/{}', [services, vq], None)]),
+        ('devis-services', [('/devis/{}', [data['trades']], None)]),
+        ('devis-service-cities', [('/devis/{}/{}', [services, villes], None)]),
+        ('devis-quartiers', [('/devis/{}/{}', [services, vq], None)]),
+        ('urgence-service-cities', [('/urgence/{}/{}', [data['emergency'], villes], None)]),
+        ('tarifs-service-cities', [('/tarifs/{}/{}', [services, villes], None)]),
+        ('avis-services', [('/avis', [], None), ('/avis/{}', [data['trades']], None)]),
+        ('avis-service-cities', [('/avis/{}/{}', [data['trades'], villes], None)]),
+        ('problemes', [('/problemes', [], None), ('/problemes/{}', [data['problems']], None)]),
+        ('problemes-cities', [('/problemes/{}/{}', [data['problems'], villes], None)]),
+        ('dept-services', [('/departements/{}/{}', [data['departements'], data['trades']], None)]),
+        ('region-services', [('/regions/{}/{}', [data['regions'], data['trades']], None)]),
+        ('guides', [('/guides', [], None), ('/guides/{}', [data['guides']], None)]),
+    ]
+    return out
+
+
+def run_size(run: tuple) -> int:
+    return math.prod(len(axis) for axis in run[1])
+
+
+def run_urls(run: tuple, start: int, stop: int):
+    """(path, lastmod) of URLs start..stop-1 of a run, nested-loop order (last axis fastest)."""
+    template, axes, lastmods = run
+    for n in range(start, stop):
+        parts, rest = [], n
+        for axis in reversed(axes):
+            rest, i = divmod(rest, len(axis))
+            parts.append(axis[i])
+        path = template.format(*reversed(parts))
+        yield path, (lastmods[n] if lastmods else None)
+
+
+def family_urls(runs: list[tuple], start: int, stop: int):
+    """URLs start..stop-1 of a family, across its runs."""
+    offset = 0
+    for run in runs:
+        size = run_size(run)
+        if offset + size > start and offset < stop:
+            yield from run_urls(run, max(start - offset, 0), min(stop - offset, size))
+        offset += size
+
+
+def _write_chunk(task: tuple) -> tuple[str, int, bool]:
+    """Worker: gzip one chunk of a family. Returns (file name, URL count, written)."""
+    name, runs, start, stop, out_dir = task
+    buffer = io.BytesIO()
+    count = 0
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as gz:
+        gz.write(HEADER.encode())
+        for path, lastmod in family_urls(runs, start, stop):
+            entry = f'<url><loc>{escape(SITE_URL + path)}</loc>'
+            if lastmod:
+                entry += f'<lastmod>{lastmod}</lastmod>'
+            gz.write((entry + '</url>\n').encode())
+            count += 1
+        gz.write(FOOTER.encode())
+    return name, count, write_if_changed(Path(out_dir) / name, buffer.getvalue())
+
+
+def chunk_tasks(fams: list[tuple[str, list[tuple]]], out_dir: Path, chunk_size: int = CHUNK_SIZE) -> list[tuple]:
+    tasks = []
+    for family, runs in fams:
+        total = sum(run_size(run) for run in runs)
+        for n, start in enumerate(range(0, total, chunk_size)):
+            tasks.append((f'{family}-{n}.xml.gz', runs, start, min(start + chunk_size, total), str(out_dir)))
+    return tasks
+
+
+def render_index(names: list[str], base_url: str) -> str:
+    entries = ''.join(f'  <sitemap><loc>{escape(f"{base_url}/{name}")}</loc></sitemap>\n' for name in names)
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n{entries}</sitemapindex>\n')
+
+
+def write_sitemaps(data: dict, out_dir: Path = SITEMAP_DIR, extended: bool = False, workers: int | None = None) -> dict:
+    tasks = chunk_tasks(families(data, extended), out_dir)
+    results = pool_map(_write_chunk, tasks, workers=workers, min_parallel=4)
+    names = [name for name, _, _ in results]
+    written = sum(w for _, _, w in results) + write_if_changed(out_dir / INDEX_FILE, render_index(names, SITEMAP_URL))
+    removed = 0
+    for path in out_dir.glob('*.xml.gz'):
+        # sitemap-index.xml.gz is the compress stage's sibling of the index
+        if path.name not in names and path.name != f'{INDEX_FILE}.gz':
+            path.unlink()
+            removed += 1
+    return {'chunks': len(names), 'urls': sum(c for _, c, _ in results), 'written': written, 'removed': removed}
+
+
+def add_arguments(parser):
+    parser.add_argument('--extended', action='store_true', help='include the Phase 2 service-cities-extended family')
+    parser.add_argument('--out', type=Path, default=SITEMAP_DIR, help='output directory')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count, at most 8)')
+
+
+def run(args) -> int:
+    stats = write_sitemaps(load_data(), args.out, args.extended, args.workers)
+    print(f"{stats['urls']:,} URLs in {stats['chunks']} chunks + {INDEX_FILE} "
+          f"({stats['written']} files written, {stats['removed']} removed) -> {args.out}")
+    return 0
@@ -0,0 +1,123 @@
+"""Uniform grid index for bulk nearest-neighbour and radius queries on lat/lon.
+
+Points are stored as unit vectors and bucketed in a 3D grid whose cell edge is
+the chord of the query radius, so every point within the radius of a query
+lies in one of the 27 cells around it. A query batch is answered in one pass:
+the candidate ranges of all 27 cells of every query are looked up with
+searchsorted, expanded into (query, point) pairs and filtered on the exact
+great-circle distance, without a Python loop over queries. Working on the
+sphere keeps the overseas departments exact, which a flat projection centred
+on mainland France would not.
+
+nearest() runs radius passes with a doubling radius for the queries that have
+not found k points yet; a point outside the radius is farther than every point
+inside it, so the k closest found are the true k nearest.
+"""
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+HALF_CIRCUMFERENCE_KM = np.pi * EARTH_RADIUS_KM
+
+# 27 neighbour cell offsets, the query cell included
+_OFFSETS = np.array([(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)], dtype=np.int64)
+
+# Queries per pass: bounds the (query, point) pair arrays
+CHUNK = 2048
+
+
+def to_xyz(lat, lon) -> np.ndarray:
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance, broadcast over the inputs."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=np.float64)) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _chord(km: float) -> float:
+    return 2 * np.sin(min(km, HALF_CIRCUMFERENCE_KM) / (2 * EARTH_RADIUS_KM))
+
+
+def _arc_km(chord: np.ndarray) -> np.ndarray:
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+class GridIndex:
+    """Static index over `lat`/`lon` arrays; results are positions in those arrays."""
+
+    def __init__(self, lat, lon):
+        self.xyz = to_xyz(lat, lon)
+        self._grids: dict[float, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.xyz)
+
+    def _grid(self, cell: float):
+        # One sorted key array per cell size; nearest() reuses them across passes
+        if cell not in self._grids:
+            side = int(2 / cell) + 3
+            keys = self._keys(self.xyz, cell, side)
+            order = np.argsort(keys, kind='stable')
+            self._grids[cell] = (side, keys[order], order)
+        return self._grids[cell]
+
+    @staticmethod
+    def _keys(xyz: np.ndarray, cell: float, side: int, offsets=None) -> np.ndarray:
+        # +1 keeps the -1 neighbour of the first cell inside the grid, so keys never alias
+        ijk = np.floor((xyz + 1) / cell).astype(np.int64) + 1
+        if offsets is not None:
+            ijk = ijk[:, None, :] + offsets[None, :, :]
+        return (ijk[..., 0] * side + ijk[..., 1]) * side + ijk[..., 2]
+
+    def _pairs(self, qxyz: np.ndarray, km: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(query, point, km) for every point within `km`, sorted by query, distance, point."""
+        cell = max(_chord(km), 1e-9)
+        side, keys, order = self._grid(cell)
+        cells = self._keys(qxyz, cell, side, _OFFSETS)
+        lo = np.searchsorted(keys, cells, 'left').ravel()
+        counts = np.searchsorted(keys, cells, 'right').ravel() - lo
+        total = int(counts.sum())
+        query = np.repeat(np.repeat(np.arange(len(qxyz)), len(_OFFSETS)), counts)
+        # position of each pair in `keys`: start of its cell range + rank inside the range
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        point = order[starts + np.arange(total)]
+        dist = _arc_km(np.linalg.norm(qxyz[query] - self.xyz[point], axis=1))
+        keep = dist <= km
+        query, point, dist = query[keep], point[keep], dist[keep]
+        by = np.lexsort((point, dist, query))
+        return query[by], point[by], dist[by]
+
+    def radius(self, lat, lon, km: float) -> list[tuple[np.ndarray, np.ndarray]]:
+        """For each query point, (positions, km) of the points within `km`, closest first."""
+        qxyz = to_xyz(lat, lon)
+        out = []
+        for start in range(0, len(qxyz), CHUNK):
+            chunk = qxyz[start:start + CHUNK]
+            query, point, dist = self._pairs(chunk, km)
+            bounds = np.searchsorted(query, np.arange(len(chunk) + 1))
+            out += [(point[a:b], dist[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        return out
+
+    def nearest(self, lat, lon, k: int, max_km: float = HALF_CIRCUMFERENCE_KM,
+                start_km: float = 25.0) -> list[tuple[np.ndarray, np.ndarray]]:
+        """For each query point, (positions, km) of its k nearest points within `max_km`."""
+        qxyz = to_xyz(lat, lon)
+        out: list = [None] * len(qxyz)
+        pending = np.arange(len(qxyz))
+        km = min(start_km, max_km)
+        while len(pending):
+            final = km >= max_km
+            for start in range(0, len(pending), CHUNK):
+                ids = pending[start:start + CHUNK]
+                query, point, dist = self._pairs(qxyz[ids], km)
+                bounds = np.searchsorted(query, np.arange(len(ids) + 1))
+                for q, a, b in zip(ids, bounds[:-1], bounds[1:]):
+                    if b - a >= k or final:
+                        out[q] = (point[a:a + k], dist[a:a + k])
+            pending = np.array([q for q in pending if out[q] is None], dtype=np.int64)
+            km = min(km * 2, max_km)
+        return out
@@ -0,0 +1,81 @@
+"""Content statistics of every blog article, computed from the rendered blocks.
+
+Word and link counts come per block from the render cache (block_counts), so
+an incremental build only counts the blocks it had to render again; the rest
+is a sum over each article's blocks. emit writes the result into the
+article payloads and index shards, with `readTime` recomputed from the word
+count: the hand-typed values in the batch files drift from the content.
+This command reports that drift.
+"""
+import math
+import re
+
+from .blocks import WORD, extract_faq
+from .corpus import load_articles
+from .render import render_corpus
+
+WORDS_PER_MINUTE = 200
+
+# Hand-typed readTime values further off than this are reported
+DRIFT_MINUTES = 2
+
+_MINUTES = re.compile(r'(\d+)\s*min')
+
+
+def reading_minutes(words: int) -> int:
+    return max(1, math.ceil(words / WORDS_PER_MINUTE))
+
+
+def article_stats(article: dict, blocks: list[dict], counts: list[list[int]]) -> dict:
+    """Counts of one article from its parsed blocks and their block_counts."""
+    faq = article.get('faq') or []
+    words = sum(c[0] for c in counts)
+    # the FAQ field renders below the content; without one the page extracts it from the blocks
+    words += sum(len(WORD.findall(item.get('question', ''))) + len(WORD.findall(item.get('answer', '')))
+                 for item in faq)
+    types = [b['type'] for b in blocks]
+    return {
+        'wordCount': words,
+        'readingMinutes': reading_minutes(words),
+        'headings': types.count('h2') + types.count('h3'),
+        'tables': types.count('table') + sum(
+            1 for b in blocks if b['type'] == 'callout' and b['calloutType'] == 'budget' and any(line.startswith('|') for line in b['content'])),
+        'callouts': types.count('callout'),
+        'faq': len(faq) or len(extract_faq(blocks)),
+        'internalLinks': sum(c[1] for c in counts),
+        'externalLinks': sum(c[2] for c in counts),
+    }
+
+
+def corpus_stats(articles: dict[str, dict], rendered: dict[str, tuple]) -> dict[str, dict]:
+    return {slug: article_stats(articles[slug], blocks, counts) for slug, (blocks, _, counts) in rendered.items()}
+
+
+def hand_minutes(read_time: str | None) -> int | None:
+    m = _MINUTES.search(read_time or '')
+    return int(m.group(1)) if m else None
+
+
+def add_arguments(parser):
+    parser.add_argument('--drift', action='store_true', help='list every article whose readTime is off')
+
+
+def run(args) -> int:
+    articles = load_articles()
+    rendered, render_stats = render_corpus(articles)
+    stats = corpus_stats(articles, rendered)
+    drift = []
+    for slug, s in stats.items():
+        typed = hand_minutes(articles[slug].get('readTime'))
+        if typed is None or abs(typed - s['readingMinutes']) > DRIFT_MINUTES:
+            drift.append((slug, articles[slug].get('readTime'), s['readingMinutes'], s['wordCount']))
+    if args.drift:
+        for slug, typed, minutes, words in sorted(drift):
+            print(f'{slug}: readTime {typed!r}, {words} words -> {minutes} min')
+    total = sum(s['wordCount'] for s in stats.values())
+    print(f"{len(stats)} articles, {total:,} words ({total // max(len(stats), 1):,} per article), "
+          f"{sum(s['tables'] for s in stats.values())} tables, {sum(s['callouts'] for s in stats.values())} callouts, "
+          f"{sum(s['internalLinks'] for s in stats.values())} internal / {sum(s['externalLinks'] for s in stats.values())} external links; "
+          f"{len(drift)} hand-typed readTime off by more than {DRIFT_MINUTES} min "
+          f"({render_stats['hit_ratio']:.1%} of blocks from the render cache)")
+    return 0
@@ -0,0 +1,39 @@
+from scripts.pipeline.identifiers import (
+    INVALID, MALFORMED, MISSING, PHONE_TYPES, VALID, build, normalize_phones, validate_siren, validate_siret,
+)
+
+
+def test_siren_luhn_and_status():
+    status, sirens = validate_siren(['443 061 841', '443061842', '12', ''])
+    assert status.tolist() == [VALID, INVALID, MALFORMED, MISSING]
+    assert sirens[0] == '443061841'
+
+
+def test_la_poste_siret_uses_digit_sum_except_head_office():
+    status, _ = validate_siret(['44306184100047', '35600000049837', '35600000000049', '35600000000048'])
+    assert status.tolist() == [VALID, VALID, INVALID, VALID]
+
+
+def test_phones_national_e164_and_type():
+    national, e164, types = normalize_phones(['01 23 45 67 89', '+33 6 12 34 56 78', '0690 12 34 56', '0899 12 34 56', '12'])
+    assert national.tolist() == ['0123456789', '0612345678', '0690123456', '0899123456', '']
+    assert e164.tolist() == ['+33123456789', '+33612345678', '+590690123456', '+33899123456', '']
+    assert [PHONE_TYPES[t] for t in types] == ['landline', 'mobile', 'mobile', 'premium', 'invalid']
+
+
+def test_empty_columns():
+    national, e164, types = normalize_phones([])
+    assert len(national) == len(e164) == len(types) == 0
+    lookup, todo, stats = build({'id': [], 'siren': [], 'siret': [], 'phone': []}, [])
+    assert lookup == [] and todo == [] and stats['providers'] == 0
+
+
+def test_missing_phone_is_not_counted_invalid():
+    providers = {'id': ['a', 'b', 'c'], 'siren': ['', '', ''], 'siret': ['44306184100047'] * 3,
+                 'phone': ['', 'abc', '06 12 34 56 78']}
+    lookup, todo, stats = build(providers, ['06 12 34 56 78'])
+    assert stats['phoneTypes']['missing'] == 1
+    assert stats['phoneTypes']['invalid'] == 1
+    assert stats['phoneTypes']['mobile'] == 1
+    assert {t['id']: t['phone'] for t in todo} == {'a': 'missing', 'b': 'invalid'}
+    assert {'kind': 'phone', 'value': '+33612345678', 'type': 'mobile', 'providers': 1, 'listings': 1} in lookup
@@ -0,0 +1,64 @@
+import json
+
+from scripts.pipeline.jobs import Checkpoint, _log_path, load_done, run_job, shard_of
+
+
+def double(key: str, payload):
+    if payload == 'boom':
+        raise ValueError(key)
+    return payload * 2
+
+
+def test_torn_last_line_is_cut_before_appending(tmp_path):
+    path = tmp_path / 'shard-00-of-01.log'
+    path.write_bytes(b'["a",1]\n["b",2]\n["c",')
+    done, valid = Checkpoint.replay(path)
+    assert done == {'a': 1, 'b': 2}
+    assert valid == len(b'["a",1]\n["b",2]\n')
+
+    log = Checkpoint(path).open()
+    log.append('c', 3)
+    log.close()
+    assert Checkpoint.replay(path)[0] == {'a': 1, 'b': 2, 'c': 3}
+    assert path.read_bytes().endswith(b'["b",2]\n["c",3]\n')
+
+
+def test_resume_with_another_shard_count(tmp_path):
+    items = {f'item-{n}': n for n in range(40)}
+    first = {key: items[key] for key in list(items)[:25]}
+    results, stats = run_job('t', first, double, shards=3, job_dir=tmp_path, report_seconds=60)
+    assert stats['ran'] == 25 and len(list(tmp_path.glob('*-of-03.log'))) == 3
+
+    results, stats = run_job('t', items, double, shards=2, job_dir=tmp_path, report_seconds=60)
+    assert stats['skipped'] == 25
+    assert stats['ran'] == 15
+    assert results == {key: n * 2 for key, n in items.items()}
+    assert set(load_done(tmp_path)) == set(items)
+
+
+def test_failed_shard_is_retried_from_the_failed_item(tmp_path):
+    keys = [f'item-{n}' for n in range(10)]
+    items = {key: n for n, key in enumerate(keys)}
+    items['item-4'] = 'boom'
+    results, stats = run_job('t', items, double, shards=1, job_dir=tmp_path, report_seconds=60)
+    assert stats['failed'] == [0]
+    assert list(results) == keys[:4]
+
+    items['item-4'] = 4
+    results, stats = run_job('t', items, double, shards=1, job_dir=tmp_path, report_seconds=60)
+    assert stats['failed'] == []
+    assert stats['ran'] == 6
+    assert results == {key: n * 2 for n, key in enumerate(keys)}
+
+
+def test_failed_shard_does_not_stop_the_others(tmp_path):
+    items = {f'item-{n}': n for n in range(30)}
+    bad = 'item-7'
+    items[bad] = 'boom'
+    results, stats = run_job('t', items, double, shards=2, job_dir=tmp_path, report_seconds=60)
+    failed = shard_of(bad, 2)
+    assert stats['failed'] == [failed]
+    other = [key for key in items if shard_of(key, 2) != failed]
+    assert all(key in results for key in other)
+    log = _log_path(tmp_path, failed, 2)
+    assert bad not in {json.loads(line)[0] for line in log.read_text().splitlines()}
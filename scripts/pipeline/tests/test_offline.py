@@ -0,0 +1,66 @@
+import json
+
+from scripts.pipeline.offline import FORMAT, advance, load_ledger
+
+
+def ledger_of(hashes: dict[str, str], index: str = 'i1') -> dict:
+    return advance(empty_ledger(), hashes, index)[0]
+
+
+def empty_ledger() -> dict:
+    return {'format': FORMAT, 'version': 0, 'index': None, 'articles': {}, 'removed': {}}
+
+
+def test_unchanged_corpus_keeps_the_version():
+    ledger = ledger_of({'a': 'ha', 'b': 'hb'})
+    assert ledger['version'] == 1
+    same, delta = advance(ledger, {'a': 'ha', 'b': 'hb'}, 'i1')
+    assert same == ledger
+    assert delta == {'added': [], 'changed': [], 'removed': []}
+
+
+def test_index_change_alone_bumps_the_version():
+    ledger = ledger_of({'a': 'ha'})
+    ledger, _ = advance(ledger, {'a': 'ha'}, 'i2')
+    assert ledger['version'] == 2
+    assert ledger['articles'] == {'a': ['ha', 1]}
+
+
+def test_added_changed_and_removed_slugs_are_stamped():
+    ledger = ledger_of({'a': 'ha', 'b': 'hb', 'c': 'hc'})
+    ledger, delta = advance(ledger, {'a': 'ha', 'b': 'hb2', 'd': 'hd'}, 'i2')
+    assert delta == {'added': ['d'], 'changed': ['b'], 'removed': ['c']}
+    assert ledger['version'] == 2
+    assert ledger['articles'] == {'a': ['ha', 1], 'b': ['hb2', 2], 'd': ['hd', 2]}
+    assert ledger['removed'] == {'c': 2}
+
+
+def test_removed_slug_coming_back():
+    ledger = ledger_of({'a': 'ha', 'b': 'hb'})
+    ledger, _ = advance(ledger, {'a': 'ha'}, 'i2')
+    ledger, _ = advance(ledger, {'a': 'ha', 'e': 'he'}, 'i3')
+    assert ledger['removed'] == {'b': 2}
+    ledger, delta = advance(ledger, {'a': 'ha', 'b': 'hb', 'e': 'he'}, 'i4')
+    assert delta['added'] == ['b']
+    assert ledger['version'] == 4
+    assert ledger['articles']['b'] == ['hb', 4]
+    assert ledger['removed'] == {}
+
+
+def test_missing_ledger_starts_at_version_zero(tmp_path):
+    assert load_ledger(tmp_path / 'offline-sync.json') == empty_ledger()
+
+
+def test_format_change_resyncs_every_article(tmp_path):
+    path = tmp_path / 'offline-sync.json'
+    old = {'format': FORMAT - 1, 'version': 7, 'index': 'i1', 'articles': {'a': ['ha', 3]}, 'removed': {'z': 5}}
+    path.write_text(json.dumps(old), encoding='utf-8')
+    ledger = load_ledger(path)
+    assert ledger == {'format': FORMAT, 'version': 7, 'index': None, 'articles': {}, 'removed': {}}
+    ledger, delta = advance(ledger, {'a': 'ha'}, 'i1')
+    assert delta['added'] == ['a']
+    assert ledger['version'] == 8
+    assert ledger['articles'] == {'a': ['ha', 8]}
+
+    path.write_text(json.dumps(ledger), encoding='utf-8')
+    assert load_ledger(path) == ledger
@@ -0,0 +1,26 @@
+from scripts.pipeline.blocks import block_counts, parse_blocks
+from scripts.pipeline.stats import article_stats
+
+
+def stats_of(article: dict) -> dict:
+    blocks = parse_blocks(article['content'])
+    return article_stats(article, blocks, [block_counts(b) for b in blocks])
+
+
+def test_counts_faq_field_words():
+    article = {
+        'content': ['## Le chantier', 'Comptez deux jours de travaux.'],
+        'faq': [{'question': 'Combien coûte un devis ?', 'answer': "Le devis d'un artisan est gratuit."}],
+    }
+    without_faq = stats_of({**article, 'faq': []})
+    with_faq = stats_of(article)
+    assert without_faq['wordCount'] == 7
+    assert with_faq['wordCount'] == 7 + 4 + 6
+    assert with_faq['faq'] == 1
+
+
+def test_faq_extracted_from_blocks_is_counted_once():
+    article = {'content': ['## Questions fréquentes', '### Faut-il un permis ?', 'Non, une déclaration suffit.']}
+    stats = stats_of(article)
+    assert stats['faq'] == 1
+    assert stats['wordCount'] == 2 + 3 + 4
@@ -0,0 +1,98 @@
+"""Write TypeScript data literals in the style of the hand-written modules.
+
+Single quotes, bare identifier keys, trailing commas, and one object per
+line when it fits, so generated diffs stay readable and byte-stable.
+"""
+import re
+from pathlib import Path
+
+from .files import write_if_changed
+
+_IDENT = re.compile(r'^[A-Za-z_$][\w$]*$')
+MAX_INLINE = 180
+INDENT = '  '
+
+
+def generated_header(command: str, source: str) -> str:
+    return (f'// Generated by `python3 -m scripts.pipeline {command}` from {source}.\n'
+            '// Do not edit by hand: re-run the command instead.\n')
+
+
+def ts_string(s: str) -> str:
+    return "'" + s.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '') + "'"
+
+
+def ts_key(key) -> str:
+    key = str(key)
+    return key if _IDENT.match(key) else ts_string(key)
+
+
+def _scalar(value) -> str:
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        return ts_string(value)
+    raise TypeError(f'cannot emit {type(value).__name__} as a TS literal')
+
+
+def _inline(value) -> str:
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        return '{ ' + ', '.join(f'{ts_key(k)}: {_inline(v)}' for k, v in value.items()) + ' }'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(_inline(v) for v in value) + ']'
+    return _scalar(value)
+
+
+def ts_value(value, level: int = 0) -> str:
+    """Render `value`; containers go multi-line only when they do not fit on one."""
+    flat = _inline(value)
+    if not isinstance(value, (dict, list, tuple)) or len(flat) + len(INDENT) * level <= MAX_INLINE or not value:
+        return flat
+    pad = INDENT * (level + 1)
+    if isinstance(value, dict):
+        lines = [f'{pad}{ts_key(k)}: {ts_value(v, level + 1)},' for k, v in value.items()]
+        return '{\n' + '\n'.join(lines) + '\n' + INDENT * level + '}'
+    if all(not isinstance(v, (dict, list, tuple)) for v in value):
+        lines = _packed([_scalar(v) + ',' for v in value], pad)
+    else:
+        lines = [f'{pad}{ts_value(v, level + 1)},' for v in value]
+    return '[\n' + '\n'.join(lines) + '\n' + INDENT * level + ']'
+
+
+def _packed(items: list[str], pad: str) -> list[str]:
+    """Fill lines with as many scalars as fit, instead of one number per line."""
+    lines, line = [], pad
+    for item in items:
+        if line != pad and len(line) + 1 + len(item) > MAX_INLINE:
+            lines.append(line)
+            line = pad
+        line += item if line == pad else ' ' + item
+    lines.append(line)
+    return lines
+
+
+def ts_const(name: str, type_: str, value, doc: str | None = None) -> str:
+    head = f'/** {doc} */\n' if doc else ''
+    return f'{head}export const {name}: {type_} = {ts_value(value)}\n'
+
+
+def render_module(parts: list[str]) -> str:
+    """Join top-level chunks with one blank line between them."""
+    return '\n'.join(p.rstrip('\n') + '\n' for p in parts)
+
+
+def write_module(path: Path, parts: list[str]) -> bool:
+    return write_if_changed(path, render_module(parts))
+
@@ -0,0 +1,149 @@
+"""Read data literals out of the TypeScript modules in src/lib/data.
+
+The data files are plain object/array literals (`export const x: T = {...}`),
+so a small tokenizer is enough: no evaluation, no spreads, no expressions.
+"""
+import re
+from pathlib import Path
+
+_TOKEN = re.compile(r'''
+    (?P<ws>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<num>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,])
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class LiteralError(ValueError):
+    """Raised when a data module contains something other than a plain literal."""
+
+
+def _unescape_match(m: re.Match) -> str:
+    esc = m.group(1)
+    if esc[0] == 'u':
+        return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+    if esc[0] == 'x':
+        return chr(int(esc[1:], 16))
+    if esc in ('\n', '\r\n'):
+        return ''  # line continuation
+    return _SIMPLE_ESCAPES.get(esc, esc)
+
+
+def _unquote(token: str) -> str:
+    body = token[1:-1]
+    return _ESCAPE.sub(_unescape_match, body) if '\\' in body else body
+
+
+class _Parser:
+    def __init__(self, src: str, pos: int):
+        self.src = src
+        self.pos = pos
+
+    def _next(self):
+        while True:
+            m = _TOKEN.match(self.src, self.pos)
+            if not m:
+                line = self.src.count('\n', 0, self.pos) + 1
+                raise LiteralError(f'unexpected input at line {line}: {self.src[self.pos:self.pos + 40]!r}')
+            self.pos = m.end()
+            if m.lastgroup != 'ws':
+                return m.lastgroup, m.group()
+
+    def _peek(self):
+        saved = self.pos
+        tok = self._next()
+        self.pos = saved
+        return tok
+
+    def value(self):
+        kind, text = self._next()
+        if kind == 'str':
+            return _unquote(text)
+        if kind == 'num':
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        if kind == 'ident':
+            if text in _CONSTANTS:
+                return _CONSTANTS[text]
+            raise LiteralError(f'identifier {text!r} is not a literal')
+        if text == '{':
+            return self._object()
+        if text == '[':
+            return self._array()
+        raise LiteralError(f'unexpected {text!r}')
+
+    def _object(self) -> dict:
+        out = {}
+        while True:
+            kind, text = self._next()
+            if text == '}':
+                return out
+            if kind == 'str':
+                key = _unquote(text)
+            elif kind in ('ident', 'num'):
+                key = text
+            else:
+                raise LiteralError(f'unexpected {text!r} in object')
+            if self._next()[1] != ':':
+                raise LiteralError(f'expected ":" after key {key!r}')
+            out[key] = self.value()
+            sep = self._next()[1]
+            if sep == '}':
+                return out
+            if sep != ',':
+                raise LiteralError(f'expected "," after key {key!r}')
+
+    def _array(self) -> list:
+        out = []
+        while True:
+            if self._peek()[1] == ']':
+                self._next()
+                return out
+            out.append(self.value())
+            sep = self._next()[1]
+            if sep == ']':
+                return out
+            if sep != ',':
+                raise LiteralError('expected "," in array')
+
+
+def parse_literal(src: str, pos: int = 0):
+    """Parse the literal starting at `pos`; returns (value, end offset)."""
+    parser = _Parser(src, pos)
+    value = parser.value()
+    return value, parser.pos
+
+
+def _initializer_start(src: str, decl_end: int) -> int:
+    """Skip a type annotation and return the offset just after the `=`."""
+    depth = 0
+    i = decl_end
+    while i < len(src):
+        c = src[i]
+        if c in '{[(<':
+            depth += 1
+        elif c in '}])':
+            depth -= 1
+        elif c == '>' and src[i - 1] != '=':
+            depth -= 1
+        elif c == '=' and depth == 0 and src[i + 1] != '>':
+            return i + 1
+        i += 1
+    raise LiteralError('no initializer found')
+
+
+def extract_const(src: str, name: str):
+    """Value of `[export] const <name> ... = <literal>` inside `src`."""
+    m = re.search(r'^(?:export\s+)?const\s+' + re.escape(name) + r'\b', src, re.MULTILINE)
+    if not m:
+        raise LiteralError(f'const {name} not found')
+    value, _ = parse_literal(src, _initializer_start(src, m.end()))
+    return value
+
+
+def load_const(path: Path, name: str):
+    return extract_const(Path(path).read_text(encoding='utf-8'), name)
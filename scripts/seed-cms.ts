@@ -8,6 +8,10 @@
  *
  * Usage:
  *   npx tsx scripts/seed-cms.ts
+ *
+ * For a bulk load (blog articles included, only the rows not yet loaded into
+ * this database), the pipeline reads the literals below:
+ *   python3 -m scripts.pipeline cms --load
  */
 
 import { createClient } from '@supabase/supabase-js'
@@ -8,7 +8,8 @@ import { getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL, SITE_NAME } from '@/lib/seo/config'
 import { hashCode, getRegionalMultiplier, generateQuartierContent } from '@/lib/seo/location-content'
 import { tradeContent, getTradesSlugs } from '@/lib/data/trade-content'
-import { villes, getQuartierBySlug, getQuartiersByVille, getNearbyCities } from '@/lib/data/france'
+import { villesCore, loadQuartier, getNearbyVillesCore } from '@/lib/data/france-core'
+import { quartierLinks, quartierSlugs } from '@/lib/data/france-lookup'
 import { getServiceImage } from '@/lib/data/images'
 import { relatedServices } from '@/lib/constants/navigation'
 import DevisForm from '@/components/DevisForm'
@@ -21,13 +22,13 @@ const tradeSlugs = getTradesSlugs()
 
 export function generateStaticParams() {
   const topServices = tradeSlugs.slice(0, 3)
-  const topCities = villes.slice(0, 10)
+  const topCities = villesCore.slice(0, 10)
   return topServices.flatMap((s) =>
     topCities.flatMap((v) =>
-      getQuartiersByVille(v.slug).map((q) => ({
+      quartierSlugs(v.slug).map((q) => ({
         service: s,
         location: v.slug,
-        quartier: q.slug,
+        quartier: q,
       }))
     )
   )
@@ -46,7 +47,7 @@ export async function generateMetadata({
 }): Promise<Metadata> {
   const { service, location, quartier } = await params
   const trade = tradeContent[service]
-  const quartierData = getQuartierBySlug(location, quartier)
+  const quartierData = await loadQuartier(location, quartier)
   if (!trade || !quartierData) return {}
 
   const { ville, quartierName } = quartierData
@@ -104,7 +105,7 @@ export default async function DevisQuartierPage({
   const { service, location, quartier } = await params
 
   const trade = tradeContent[service]
-  const quartierData = getQuartierBySlug(location, quartier)
+  const quartierData = await loadQuartier(location, quartier)
   if (!trade || !quartierData) notFound()
 
   const { ville, quartierName } = quartierData
@@ -177,12 +178,12 @@ export default async function DevisQuartierPage({
   ]
 
   // --- Cross-links ---
-  const otherQuartiers = getQuartiersByVille(location).filter((q) => q.slug !== quartier).slice(0, 10)
+  const otherQuartiers = quartierLinks(ville).filter((q) => q.slug !== quartier).slice(0, 10)
   const relatedSlugs = relatedServices[service] || []
   const otherServices = relatedSlugs.length > 0
     ? relatedSlugs.slice(0, 6).filter((s) => tradeContent[s])
     : tradeSlugs.filter((s) => s !== service).slice(0, 6)
-  const nearbyCities = getNearbyCities(location, 6)
+  const nearbyCities = getNearbyVillesCore(location, 6)
 
   return (
     <div className="min-h-screen bg-gray-50">
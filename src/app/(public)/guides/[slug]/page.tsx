@@ -6,11 +6,11 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { SITE_URL } from '@/lib/seo/config'
 import { getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
-import { getGuideBySlug, getGuideSlugs, getGuidesByCategory } from '@/lib/data/guides'
-import { getTradeContent } from '@/lib/data/trade-content'
+import { guideSummaries, getGuideSummariesByCategory, loadGuide } from '@/lib/data/guides-index'
+import { getTradeContentSummary } from '@/lib/data/trade-content-index'
 
 export function generateStaticParams() {
-  return getGuideSlugs().map((slug) => ({ slug }))
+  return guideSummaries.map((g) => ({ slug: g.slug }))
 }
 
 export const dynamicParams = false
@@ -30,7 +30,7 @@ const categoryLabels: Record<string, { label: string; color: string; bgColor: st
 
 export async function generateMetadata({ params }: PageProps): Promise<Metadata> {
   const { slug } = await params
-  const guide = getGuideBySlug(slug)
+  const guide = await loadGuide(slug)
   if (!guide) return { title: 'Guide non trouvé' }
 
   return {
@@ -54,7 +54,7 @@ export async function generateMetadata({ params }: PageProps): Promise<Metadata>
 
 export default async function GuidePage({ params }: PageProps) {
   const { slug } = await params
-  const guide = getGuideBySlug(slug)
+  const guide = await loadGuide(slug)
   if (!guide) notFound()
 
   const catMeta = categoryLabels[guide.category] || categoryLabels.choisir
@@ -62,13 +62,13 @@ export default async function GuidePage({ params }: PageProps) {
   // Related services with trade content
   const relatedTrades = guide.relatedServices
     .map(s => {
-      const trade = getTradeContent(s)
+      const trade = getTradeContentSummary(s)
       return trade ? { slug: s, name: trade.name } : null
     })
     .filter(Boolean) as { slug: string; name: string }[]
 
   // Related guides (same category, excluding current)
-  const relatedGuides = getGuidesByCategory(guide.category)
+  const relatedGuides = getGuideSummariesByCategory(guide.category)
     .filter(g => g.slug !== slug)
     .slice(0, 4)
 
@@ -5,7 +5,7 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { SITE_URL } from '@/lib/seo/config'
 import { getBreadcrumbSchema, getCollectionPageSchema, getFAQSchema } from '@/lib/seo/jsonld'
-import { guides, getGuidesByCategory } from '@/lib/data/guides'
+import { guideSummaries, getGuideSummariesByCategory } from '@/lib/data/guides-index'
 
 export const revalidate = 86400
 
@@ -34,7 +34,7 @@ export const metadata: Metadata = {
   openGraph: {
     locale: 'fr_FR',
     title: 'Guides pratiques — Travaux et rénovation',
-    description: `${guides.length} guides pratiques pour vos travaux : artisans, entretien, normes, économies et urgences.`,
+    description: `${guideSummaries.length} guides pratiques pour vos travaux : artisans, entretien, normes, économies et urgences.`,
     type: 'website',
     url: `${SITE_URL}/guides`,
   },
@@ -48,9 +48,9 @@ export default function GuidesHubPage() {
 
   const collectionSchema = getCollectionPageSchema({
     name: 'Guides pratiques — Travaux et rénovation',
-    description: `${guides.length} guides pratiques pour vos travaux : choisir un artisan, entretien, réglementation, économies et urgences.`,
+    description: `${guideSummaries.length} guides pratiques pour vos travaux : choisir un artisan, entretien, réglementation, économies et urgences.`,
     url: '/guides',
-    itemCount: guides.length,
+    itemCount: guideSummaries.length,
   })
 
   const faqSchema = getFAQSchema(hubFaq)
@@ -82,7 +82,7 @@ export default function GuidesHubPage() {
           <div className="max-w-3xl">
             <div className="inline-flex items-center gap-2 px-4 py-2 bg-indigo-500/15 backdrop-blur-sm rounded-full border border-indigo-400/25 mb-5">
               <BookOpen className="w-4 h-4 text-indigo-400" />
-              <span className="text-sm font-medium text-indigo-200">{guides.length} guides</span>
+              <span className="text-sm font-medium text-indigo-200">{guideSummaries.length} guides</span>
             </div>
             <h1 className="font-heading text-3xl md:text-4xl lg:text-5xl font-extrabold tracking-[-0.025em] leading-[1.1] mb-5">
               Guides pratiques — Tout savoir sur les travaux
@@ -98,7 +98,7 @@ export default function GuidesHubPage() {
         {/* ─── CATEGORY SECTIONS ────────────────────────────── */}
         {categories.map((cat) => {
           const meta = categoryMeta[cat]
-          const catGuides = getGuidesByCategory(cat)
+          const catGuides = getGuideSummariesByCategory(cat)
           const Icon = meta.icon
           return (
             <section key={cat} className="mb-16">
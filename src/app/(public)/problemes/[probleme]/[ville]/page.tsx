@@ -6,8 +6,8 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL, SITE_NAME } from '@/lib/seo/config'
-import { getProblemBySlug, getProblemSlugs, getProblemsByService } from '@/lib/data/problems'
-import { tradeContent } from '@/lib/data/trade-content'
+import { problemSummaries, getProblemSummariesByService, loadProblem } from '@/lib/data/problems-index'
+import { loadTradeContent } from '@/lib/data/trade-content-index'
 import { villes, getVilleBySlug, getNearbyCities } from '@/lib/data/france'
 import { hashCode, getRegionalMultiplier } from '@/lib/seo/location-content'
 import { getCommuneBySlug, formatNumber } from '@/lib/data/commune-data'
@@ -25,7 +25,7 @@ const top10Cities = [...villes]
   .slice(0, 10)
 
 export function generateStaticParams() {
-  const top10Problems = getProblemSlugs().slice(0, 10)
+  const top10Problems = problemSummaries.slice(0, 10).map((p) => p.slug)
   return top10Problems.flatMap((p) =>
     top10Cities.map((v) => ({ probleme: p, ville: v.slug }))
   )
@@ -86,7 +86,7 @@ export async function generateMetadata({
   params: Promise<{ probleme: string; ville: string }>
 }): Promise<Metadata> {
   const { probleme, ville } = await params
-  const problem = getProblemBySlug(probleme)
+  const problem = await loadProblem(probleme)
   const villeData = getVilleBySlug(ville)
   if (!problem || !villeData) return {}
 
@@ -156,11 +156,11 @@ export default async function ProblemeVillePage({
 }) {
   const { probleme, ville } = await params
 
-  const problem = getProblemBySlug(probleme)
+  const problem = await loadProblem(probleme)
   const villeData = getVilleBySlug(ville)
   if (!problem || !villeData) notFound()
 
-  const trade = tradeContent[problem.primaryService]
+  const trade = await loadTradeContent(problem.primaryService)
   const tradeName = trade?.name ?? problem.primaryService
   const gradient = urgencyGradients[problem.urgencyLevel]
 
@@ -181,7 +181,7 @@ export default async function ProblemeVillePage({
 
   // Related data
   const nearbyCities = getNearbyCities(ville, 6)
-  const relatedProblems = getProblemsByService(problem.primaryService)
+  const relatedProblems = getProblemSummariesByService(problem.primaryService)
     .filter((p) => p.slug !== problem.slug)
     .slice(0, 4)
 
@@ -6,15 +6,15 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL, SITE_NAME } from '@/lib/seo/config'
-import { getProblemBySlug, getProblemSlugs, getProblemsByService } from '@/lib/data/problems'
-import { tradeContent } from '@/lib/data/trade-content'
+import { problemSummaries, getProblemSummariesByService, loadProblem } from '@/lib/data/problems-index'
+import { getTradeContentSummary } from '@/lib/data/trade-content-index'
 import { villes } from '@/lib/data/france'
 import { hashCode } from '@/lib/seo/location-content'
 
 export const dynamicParams = false
 
 export function generateStaticParams() {
-  return getProblemSlugs().map((probleme) => ({ probleme }))
+  return problemSummaries.map((p) => ({ probleme: p.slug }))
 }
 
 const urgencyGradients = {
@@ -48,10 +48,10 @@ function truncateTitle(title: string, maxLen = 60): string {
 
 export async function generateMetadata({ params }: { params: Promise<{ probleme: string }> }): Promise<Metadata> {
   const { probleme } = await params
-  const problem = getProblemBySlug(probleme)
+  const problem = await loadProblem(probleme)
   if (!problem) return {}
 
-  const trade = tradeContent[problem.primaryService]
+  const trade = getTradeContentSummary(problem.primaryService)
   const tradeName = trade?.name ?? problem.primaryService
 
   const titleHash = Math.abs(hashCode(`probleme-title-${probleme}`))
@@ -94,10 +94,10 @@ const top20Cities = [...villes]
 
 export default async function ProblemePage({ params }: { params: Promise<{ probleme: string }> }) {
   const { probleme } = await params
-  const problem = getProblemBySlug(probleme)
+  const problem = await loadProblem(probleme)
   if (!problem) notFound()
 
-  const trade = tradeContent[problem.primaryService]
+  const trade = getTradeContentSummary(problem.primaryService)
   const tradeName = trade?.name ?? problem.primaryService
   const gradient = urgencyGradients[problem.urgencyLevel]
 
@@ -113,7 +113,7 @@ export default async function ProblemePage({ params }: { params: Promise<{ probl
   const h1 = h1Templates[h1Hash % h1Templates.length]
 
   // Related problems (same service)
-  const relatedProblems = getProblemsByService(problem.primaryService)
+  const relatedProblems = getProblemSummariesByService(problem.primaryService)
     .filter((p) => p.slug !== problem.slug)
     .slice(0, 6)
 
@@ -5,7 +5,7 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL } from '@/lib/seo/config'
-import problems from '@/lib/data/problems'
+import { problemSummaries } from '@/lib/data/problems-index'
 
 export const metadata: Metadata = {
   title: 'Problèmes courants — Diagnostic et solutions',
@@ -47,9 +47,9 @@ const otherServiceSlugs = ['peintre-en-batiment', 'vitrier', 'menuisier', 'isola
 
 function getProblemsByCategory(slug: string) {
   if (slug === '_other') {
-    return problems.filter((p) => otherServiceSlugs.includes(p.primaryService))
+    return problemSummaries.filter((p) => otherServiceSlugs.includes(p.primaryService))
   }
-  return problems.filter((p) => p.primaryService === slug)
+  return problemSummaries.filter((p) => p.primaryService === slug)
 }
 
 const serviceNameMap: Record<string, string> = {
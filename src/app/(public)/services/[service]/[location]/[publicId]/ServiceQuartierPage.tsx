@@ -9,12 +9,9 @@ import { getBreadcrumbSchema, getFAQSchema, getItemListSchema } from '@/lib/seo/
 import { SITE_URL } from '@/lib/seo/config'
 import { getArtisanUrl } from '@/lib/utils'
 import { getServiceImage } from '@/lib/data/images'
-import {
-  services as staticServicesList,
-  getQuartierBySlug,
-  getQuartiersByVille,
-  getNearbyCities,
-} from '@/lib/data/france'
+import { services as staticServicesList } from '@/lib/data/france'
+import { loadQuartier, getNearbyVillesCore } from '@/lib/data/france-core'
+import { quartierLinks } from '@/lib/data/france-lookup'
 import { getTradeContent } from '@/lib/data/trade-content'
 import { getQuartierData } from '@/lib/data/quartier-data'
 import {
@@ -47,12 +44,12 @@ export default async function ServiceQuartierPage({
   quartierSlug,
 }: ServiceQuartierPageProps) {
   // 1. Resolve quartier (static data)
-  const quartierData = getQuartierBySlug(locationSlug, quartierSlug)
+  const quartierData = await loadQuartier(locationSlug, quartierSlug)
   if (!quartierData) notFound()
   const { ville, quartierName } = quartierData
 
   // 1b. Enriched quartier data (real stats, description, risks, transport…)
-  const quartierRealData = getQuartierData(locationSlug, quartierSlug)
+  const quartierRealData = getQuartierData(ville, quartierSlug)
 
   // 2. Resolve service (DB → static fallback)
   let service: Service
@@ -192,8 +189,8 @@ export default async function ServiceQuartierPage({
         return svc ? { name: svc.name, slug: svc.slug } : null
       }).filter((s): s is NonNullable<typeof s> => s !== null)
     : popularServices.filter(s => s.slug !== serviceSlug).slice(0, 6)
-  const otherQuartiers = getQuartiersByVille(locationSlug).filter(q => q.slug !== quartierSlug).slice(0, 10)
-  const nearbyCities = getNearbyCities(locationSlug, 8)
+  const otherQuartiers = quartierLinks(ville).filter(q => q.slug !== quartierSlug).slice(0, 10)
+  const nearbyCities = getNearbyVillesCore(locationSlug, 8)
   const { profile } = quartierContent
 
   return (
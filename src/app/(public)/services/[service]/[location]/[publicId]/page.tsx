@@ -58,7 +58,9 @@ interface ProviderRecord {
 }
 import { SITE_URL } from '@/lib/seo/config'
 import { hashCode } from '@/lib/seo/location-content'
-import { getQuartierBySlug, services as staticServicesList, villes } from '@/lib/data/france'
+import { services as staticServicesList } from '@/lib/data/france'
+import { villesCore, loadQuartier } from '@/lib/data/france-core'
+import { quartierSlugs } from '@/lib/data/france-lookup'
 import ServiceQuartierPage from './ServiceQuartierPage'
 
 export const revalidate = 300
@@ -66,18 +68,17 @@ export const revalidate = 300
 // Pre-render top service×city×quartier combos for ISR warming
 const TOP_CITIES_QUARTIER = 10
 export function generateStaticParams() {
-  const topCities = villes.slice(0, TOP_CITIES_QUARTIER)
+  const topCities = villesCore.slice(0, TOP_CITIES_QUARTIER)
   // Only pre-render first 3 services × 10 cities × quartiers to keep build fast
   const topServices = staticServicesList.slice(0, 3)
   return topServices.flatMap(s =>
-    topCities.flatMap(v => {
-      const quartiers = v.quartiers || []
-      return quartiers.map(q => ({
+    topCities.flatMap(v =>
+      quartierSlugs(v.slug).map(q => ({
         service: s.slug,
         location: v.slug,
-        publicId: q.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, ''),
+        publicId: q,
       }))
-    })
+    )
   )
 }
 export const dynamicParams = true
@@ -352,7 +353,7 @@ export async function generateMetadata({ params }: PageProps): Promise<Metadata>
   const { service: serviceSlug, location: locationSlug, publicId } = await params
 
   // ─── QUARTIER DETECTION ──────────────────────────────────
-  const quartierMatch = getQuartierBySlug(locationSlug, publicId)
+  const quartierMatch = await loadQuartier(locationSlug, publicId)
   if (quartierMatch) {
     const { ville, quartierName } = quartierMatch
     const staticSvc = staticServicesList.find(s => s.slug === serviceSlug)
@@ -483,7 +484,7 @@ export default async function ProviderPage({ params }: PageProps) {
   const { service: serviceSlug, location: locationSlug, publicId } = await params
 
   // ─── QUARTIER DETECTION ──────────────────────────────────
-  const quartierMatch = getQuartierBySlug(locationSlug, publicId)
+  const quartierMatch = await loadQuartier(locationSlug, publicId)
   if (quartierMatch) {
     return <ServiceQuartierPage serviceSlug={serviceSlug} locationSlug={locationSlug} quartierSlug={publicId} />
   }
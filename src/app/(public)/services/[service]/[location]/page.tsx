@@ -18,7 +18,7 @@ import Breadcrumb from '@/components/Breadcrumb'
 import { REVALIDATE } from '@/lib/cache'
 import { getArtisanUrl } from '@/lib/utils'
 import { getServiceImage } from '@/lib/data/images'
-import { services as staticServicesList, villes, getVilleBySlug, getNearbyCities, getVillesByDepartement } from '@/lib/data/france'
+import { services as staticServicesList, villes, getVilleBySlug, getNearbyCities, getNearbyCitiesInDepartement, getVillesByDepartement } from '@/lib/data/france'
 import { getTradeContent } from '@/lib/data/trade-content'
 import { getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL } from '@/lib/seo/config'
@@ -356,9 +356,10 @@ export default async function ServiceLocationPage({ params }: PageProps) {
       }).filter(Boolean) as { slug: string; name: string; icon: string }[]
     : popularServices.filter(s => s.slug !== serviceSlug).slice(0, 6)
   const nearbyCities = getNearbyCities(locationSlug, 12)
-  const deptCities = location.department_code
-    ? getVillesByDepartement(location.department_code).filter(v => v.slug !== locationSlug).slice(0, 10)
-    : []
+  const nearbyInDept = getNearbyCitiesInDepartement(locationSlug, 10)
+  const deptCities = nearbyInDept.length > 0 || !location.department_code
+    ? nearbyInDept
+    : getVillesByDepartement(location.department_code).filter(v => v.slug !== locationSlug).slice(0, 10)
 
   // Varied H1 text per service+location combo
   const h1Hash = Math.abs(hashCode(`h1-${serviceSlug}-${locationSlug}`))
@@ -13,7 +13,7 @@ import Breadcrumb from '@/components/Breadcrumb'
 import { PopularCitiesLinks } from '@/components/InternalLinks'
 import { popularServices } from '@/lib/constants/navigation'
 import { services as staticServicesList, villes, departements, getVillesByDepartement } from '@/lib/data/france'
-import { getTradeContent } from '@/lib/data/trade-content'
+import { loadTradeContent } from '@/lib/data/trade-content-index'
 import { getServiceImage, BLUR_PLACEHOLDER } from '@/lib/data/images'
 import { getPageContent, getTradeContentOverride } from '@/lib/cms'
 import { CmsContent } from '@/components/CmsContent'
@@ -208,7 +208,7 @@ export default async function ServicePage({ params }: PageProps) {
   }, {} as Record<string, CityInfo[]>) || {}
 
   // Trade-specific rich content (prices, FAQ, tips, certifications)
-  const tradeBase = getTradeContent(serviceSlug)
+  const tradeBase = await loadTradeContent(serviceSlug)
   const cmsTradeOverride = await getTradeContentOverride(serviceSlug)
   const trade = tradeBase && cmsTradeOverride
     ? { ...tradeBase, ...cmsTradeOverride } as typeof tradeBase
@@ -9,6 +9,7 @@ import { SITE_URL, PHONE_TEL } from '@/lib/seo/config'
 import { tradeContent } from '@/lib/data/trade-content'
 import { hashCode } from '@/lib/seo/location-content'
 import { villes, services } from '@/lib/data/france'
+import { relatedServices as relatedServiceSlugs } from '@/lib/constants/navigation'
 import { getServiceImage } from '@/lib/data/images'
 import { getPageContent } from '@/lib/cms'
 import { CmsContent } from '@/components/CmsContent'
@@ -213,7 +214,12 @@ export default async function UrgenceServicePage({ params }: { params: Promise<{
   const faqSchema = getFAQSchema(allFaqItems)
 
   // Related services for cross-linking
-  const relatedServices = services.filter((s) => s.slug !== service).slice(0, 4)
+  const relatedSlugs = relatedServiceSlugs[service] || []
+  const relatedServices = relatedSlugs.length > 0
+    ? relatedSlugs.slice(0, 4)
+        .map((slug) => services.find((s) => s.slug === slug))
+        .filter((s): s is (typeof services)[number] => s !== undefined)
+    : services.filter((s) => s.slug !== service).slice(0, 4)
 
   return (
     <div className="min-h-screen bg-gray-50">
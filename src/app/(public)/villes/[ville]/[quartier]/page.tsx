@@ -7,7 +7,9 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { getBreadcrumbSchema, getCollectionPageSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL } from '@/lib/seo/config'
-import { villes, services, getQuartierBySlug, getQuartiersByVille, getNearbyCities, getRegionSlugByName, getDepartementByCode } from '@/lib/data/france'
+import { services, getRegionSlugByName, getDepartementByCode } from '@/lib/data/france'
+import { villesCore, loadQuartier, getNearbyVillesCore } from '@/lib/data/france-core'
+import { quartierLinks, quartierSlugs } from '@/lib/data/france-lookup'
 import { getCityImage, BLUR_PLACEHOLDER } from '@/lib/data/images'
 import { generateQuartierContent, hashCode } from '@/lib/seo/location-content'
 import { formatNumber, formatEuro } from '@/lib/data/commune-data'
@@ -15,8 +17,8 @@ import { formatNumber, formatEuro } from '@/lib/data/commune-data'
 // Pre-render top 20 cities × their quartiers (~200 pages)
 const TOP_CITIES = 20
 export function generateStaticParams() {
-  return villes.slice(0, TOP_CITIES).flatMap(v =>
-    getQuartiersByVille(v.slug).map(q => ({ ville: v.slug, quartier: q.slug }))
+  return villesCore.slice(0, TOP_CITIES).flatMap(v =>
+    quartierSlugs(v.slug).map(slug => ({ ville: v.slug, quartier: slug }))
   )
 }
 
@@ -34,7 +36,7 @@ function truncateTitle(title: string, maxLen = 55): string {
 
 export async function generateMetadata({ params }: PageProps): Promise<Metadata> {
   const { ville: villeSlug, quartier: quartierSlug } = await params
-  const result = getQuartierBySlug(villeSlug, quartierSlug)
+  const result = await loadQuartier(villeSlug, quartierSlug)
   if (!result) return { title: 'Quartier non trouvé' }
 
   const { ville, quartierName } = result
@@ -87,12 +89,12 @@ export async function generateMetadata({ params }: PageProps): Promise<Metadata>
 
 export default async function QuartierPage({ params }: PageProps) {
   const { ville: villeSlug, quartier: quartierSlug } = await params
-  const result = getQuartierBySlug(villeSlug, quartierSlug)
+  const result = await loadQuartier(villeSlug, quartierSlug)
   if (!result) notFound()
 
   const { ville, quartierName } = result
-  const quartiers = getQuartiersByVille(villeSlug).filter(q => q.slug !== quartierSlug)
-  const nearbyVilles = getNearbyCities(villeSlug, 8)
+  const quartiers = quartierLinks(ville).filter(q => q.slug !== quartierSlug)
+  const nearbyVilles = getNearbyVillesCore(villeSlug, 8)
   const regionSlug = getRegionSlugByName(ville.region)
   const dept = getDepartementByCode(ville.departementCode)
   const deptSlug = dept?.slug
@@ -123,7 +125,7 @@ export default async function QuartierPage({ params }: PageProps) {
   const faqSchema = getFAQSchema(content.faqItems)
 
   // Region villes for SEO links
-  const regionVilles = villes.filter(v => v.region === ville.region && v.slug !== villeSlug).slice(0, 10)
+  const regionVilles = villesCore.filter(v => v.region === ville.region && v.slug !== villeSlug).slice(0, 10)
 
   return (
     <div className="min-h-screen bg-gray-50">
@@ -7,14 +7,16 @@ import Breadcrumb from '@/components/Breadcrumb'
 import JsonLd from '@/components/JsonLd'
 import { getPlaceSchema, getBreadcrumbSchema, getFAQSchema } from '@/lib/seo/jsonld'
 import { SITE_URL } from '@/lib/seo/config'
-import { villes, getVilleBySlug, services, getRegionSlugByName, getDepartementByCode, getQuartiersByVille } from '@/lib/data/france'
+import { services, getRegionSlugByName, getDepartementByCode } from '@/lib/data/france'
+import { villesCore, loadVille } from '@/lib/data/france-core'
+import { quartierLinks } from '@/lib/data/france-lookup'
 import { getCityImage, BLUR_PLACEHOLDER } from '@/lib/data/images'
 import { generateVilleContent, hashCode } from '@/lib/seo/location-content'
 
 // Pre-render top 20 cities, rest generated on-demand via ISR
 const TOP_CITIES_COUNT = 20
 export function generateStaticParams() {
-  return villes.slice(0, TOP_CITIES_COUNT).map((ville) => ({ ville: ville.slug }))
+  return villesCore.slice(0, TOP_CITIES_COUNT).map((ville) => ({ ville: ville.slug }))
 }
 
 export const dynamicParams = true
@@ -31,7 +33,7 @@ function truncateTitle(title: string, maxLen = 55): string {
 
 export async function generateMetadata({ params }: PageProps): Promise<Metadata> {
   const { ville: villeSlug } = await params
-  const ville = getVilleBySlug(villeSlug)
+  const ville = await loadVille(villeSlug)
   if (!ville) return { title: 'Ville non trouvée' }
 
   const cityImage = getCityImage(villeSlug)
@@ -82,16 +84,16 @@ export async function generateMetadata({ params }: PageProps): Promise<Metadata>
 
 export default async function VillePage({ params }: PageProps) {
   const { ville: villeSlug } = await params
-  const ville = getVilleBySlug(villeSlug)
+  const ville = await loadVille(villeSlug)
   if (!ville) notFound()
 
   // Get other villes in the same departement
-  const nearbyVilles = villes.filter(
+  const nearbyVilles = villesCore.filter(
     (v) => v.departementCode === ville.departementCode && v.slug !== ville.slug
   )
 
   // Get other villes in the same region
-  const regionVilles = villes.filter(
+  const regionVilles = villesCore.filter(
     (v) => v.region === ville.region && v.slug !== ville.slug
   ).slice(0, 8)
 
@@ -277,7 +279,7 @@ export default async function VillePage({ params }: PageProps) {
             </div>
             <div className="bg-white rounded-2xl border border-gray-200 p-6">
               <div className="flex flex-wrap gap-2.5">
-                {getQuartiersByVille(villeSlug).map(({ name, slug }) => (
+                {quartierLinks(ville).map(({ name, slug }) => (
                   <Link key={slug} href={`/villes/${villeSlug}/${slug}`} className="bg-gray-50 text-slate-700 px-4 py-2 rounded-full text-sm border border-gray-100 hover:bg-emerald-50 hover:text-emerald-700 hover:border-emerald-200 transition-colors">
                     {name}
                   </Link>
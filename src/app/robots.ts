@@ -89,6 +89,9 @@ export default function robots(): MetadataRoute.Robots {
       },
     ],
     sitemap: [
+      // Static URL families, written at build time by scripts/pipeline/sitemap.py
+      `${SITE_URL}/data/sitemaps/sitemap-index.xml`,
+      // Provider pages (database), see src/app/sitemap.ts
       `${SITE_URL}/sitemap.xml`,
       `${SITE_URL}/news-sitemap.xml`,
       `${SITE_URL}/image-sitemap.xml`,
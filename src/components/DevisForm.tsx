@@ -1,7 +1,8 @@
 'use client'
 
 import { useState, useCallback } from 'react'
-import { services, villes } from '@/lib/data/france'
+import { services } from '@/lib/data/france'
+import { villesCore } from '@/lib/data/france-core'
 import { CheckCircle, ArrowRight, ArrowLeft, ChevronDown } from 'lucide-react'
 
 interface FormData {
@@ -131,7 +132,7 @@ export default function DevisForm({
   )
 
   const filteredVilles = villeQuery.length >= 2
-    ? villes
+    ? villesCore
         .filter((v) =>
           v.name.toLowerCase().includes(villeQuery.toLowerCase()) ||
           v.codePostal.startsWith(villeQuery)
@@ -15,7 +15,8 @@ import {
   popularCities,
   popularRegions
 } from '@/lib/constants/navigation'
-import { villes, services, regions } from '@/lib/data/france'
+import { services, regions } from '@/lib/data/france'
+import { VILLE_COUNT } from '@/lib/data/france-index'
 
 // Re-export for backward compatibility
 export { popularCities, popularRegions }
@@ -111,7 +112,7 @@ export function PopularCitiesLinks({
         href="/villes"
         className="inline-flex items-center gap-1 text-clay-400 hover:text-clay-600 text-sm font-medium mt-3"
       >
-        Artisans dans {villes.length} villes <ArrowRight className="w-4 h-4" />
+        Artisans dans {VILLE_COUNT} villes <ArrowRight className="w-4 h-4" />
       </Link>
     </div>
   )
@@ -154,7 +155,7 @@ export function GeographicNavigation({ className = '' }: { className?: string })
         </div>
         <div>
           <div className="font-semibold text-gray-900 group-hover:text-amber-600">Par ville</div>
-          <div className="text-sm text-gray-500">{villes.length} villes</div>
+          <div className="text-sm text-gray-500">{VILLE_COUNT} villes</div>
         </div>
       </Link>
     </div>
@@ -247,7 +248,7 @@ export function QuickSiteLinks({ className = '' }: { className?: string }) {
           {services.length} métiers d&apos;artisanat
         </Link>
         <Link href="/villes" className="text-gray-600 hover:text-clay-400 py-1">
-          {villes.length} villes de France
+          {VILLE_COUNT} villes de France
         </Link>
         <Link href="/regions" className="text-gray-600 hover:text-clay-400 py-1">
           Par région
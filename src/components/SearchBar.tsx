@@ -3,7 +3,8 @@
 import { useState, useMemo, useRef, useEffect, useCallback } from 'react'
 import { useRouter } from 'next/navigation'
 import { Search, MapPin, ChevronDown } from 'lucide-react'
-import { services, villes, type Ville } from '@/lib/data/france'
+import { services } from '@/lib/data/france'
+import { villesCore, type VilleCore } from '@/lib/data/france-core'
 
 interface SearchBarProps {
   size?: 'compact' | 'large'
@@ -28,17 +29,17 @@ function formatPopulation(pop: string): string {
 }
 
 // ── Fuzzy city search with prioritized matching ─────────────────────
-function searchCities(query: string, limit = 6): Ville[] {
+function searchCities(query: string, limit = 6): VilleCore[] {
   if (!query || query.length < 1) return []
 
   const normalized = normalizeText(query)
 
-  const prefixMatches: Ville[] = []
-  const containsMatches: Ville[] = []
-  const postalMatches: Ville[] = []
-  const deptMatches: Ville[] = []
+  const prefixMatches: VilleCore[] = []
+  const containsMatches: VilleCore[] = []
+  const postalMatches: VilleCore[] = []
+  const deptMatches: VilleCore[] = []
 
-  for (const v of villes) {
+  for (const v of villesCore) {
     const normalizedName = normalizeText(v.name)
 
     if (normalizedName.startsWith(normalized)) {
@@ -52,7 +53,7 @@ function searchCities(query: string, limit = 6): Ville[] {
     }
   }
 
-  const sortByPop = (a: Ville, b: Ville) => {
+  const sortByPop = (a: VilleCore, b: VilleCore) => {
     const popA = parseInt(a.population.replace(/\s/g, ''), 10) || 0
     const popB = parseInt(b.population.replace(/\s/g, ''), 10) || 0
     return popB - popA
@@ -151,8 +152,8 @@ export default function SearchBar({ size = 'compact' }: SearchBarProps) {
     if (!hasTypedCity) {
       // Return popular cities mapped to Ville objects
       return popularCities.map(pc => {
-        const match = villes.find(v => v.slug === pc.slug)
-        return match || { name: pc.name, slug: pc.slug, region: '', departement: '', departementCode: '', population: '', codePostal: '', description: '', quartiers: [] } as Ville
+        const match = villesCore.find(v => v.slug === pc.slug)
+        return match || { name: pc.name, slug: pc.slug, region: '', departement: '', departementCode: '', population: '', codePostal: '' } as VilleCore
       })
     }
     return []
@@ -208,7 +209,7 @@ export default function SearchBar({ size = 'compact' }: SearchBarProps) {
     e?.preventDefault()
     if (!serviceSlug || !cityQuery.trim()) return
 
-    const cityMatch = villes.find(
+    const cityMatch = villesCore.find(
       v => normalizeText(v.name) === normalizeText(cityQuery.trim())
     )
     const citySlugValue = cityMatch ? cityMatch.slug : cityQuery.trim().toLowerCase()
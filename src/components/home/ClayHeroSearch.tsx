@@ -2,7 +2,8 @@
 
 import { useState, useRef, useCallback, useEffect } from 'react'
 import { useRouter } from 'next/navigation'
-import { services, villes, type Ville } from '@/lib/data/france'
+import { services } from '@/lib/data/france'
+import { villesCore, type VilleCore } from '@/lib/data/france-core'
 
 function normalizeText(text: string): string {
   return text.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim()
@@ -21,19 +22,19 @@ function searchServices(query: string, limit = 6): typeof services {
   return [...prefix, ...contains].slice(0, limit)
 }
 
-function searchCities(query: string, limit = 6): Ville[] {
+function searchCities(query: string, limit = 6): VilleCore[] {
   if (!query || query.length < 1) return []
   const n = normalizeText(query)
-  const prefix: Ville[] = []
-  const contains: Ville[] = []
-  const postal: Ville[] = []
-  for (const v of villes) {
+  const prefix: VilleCore[] = []
+  const contains: VilleCore[] = []
+  const postal: VilleCore[] = []
+  for (const v of villesCore) {
     const vn = normalizeText(v.name)
     if (vn.startsWith(n)) prefix.push(v)
     else if (vn.includes(n)) contains.push(v)
     else if (v.codePostal.startsWith(query.trim())) postal.push(v)
   }
-  const sortByPop = (a: Ville, b: Ville) => {
+  const sortByPop = (a: VilleCore, b: VilleCore) => {
     const pa = parseInt(a.population.replace(/\s/g, ''), 10) || 0
     const pb = parseInt(b.population.replace(/\s/g, ''), 10) || 0
     return pb - pa
@@ -49,7 +50,7 @@ export function ClayHeroSearch() {
   const [service, setService] = useState('')
   const [ville, setVille] = useState('')
   const [serviceSuggestions, setServiceSuggestions] = useState<typeof services>([])
-  const [citySuggestions, setCitySuggestions] = useState<Ville[]>([])
+  const [citySuggestions, setCitySuggestions] = useState<VilleCore[]>([])
   const [activeField, setActiveField] = useState<'service' | 'city' | null>(null)
   const [highlightedIndex, setHighlightedIndex] = useState(-1)
   const [selectedServiceSlug, setSelectedServiceSlug] = useState('')
@@ -98,7 +99,7 @@ export function ClayHeroSearch() {
     cityInputRef.current?.focus()
   }
 
-  function selectCity(v: Ville) {
+  function selectCity(v: VilleCore) {
     setVille(v.name)
     setSelectedCitySlug(v.slug)
     setCitySuggestions([])
@@ -4,7 +4,8 @@ import { useEffect, useRef } from 'react'
 import Link from 'next/link'
 import Image from 'next/image'
 import { motion, useMotionValue, useTransform, animate, useInView, type Variants } from 'framer-motion'
-import { services, villes, departements } from '@/lib/data/france'
+import { services, departements } from '@/lib/data/france'
+import { VILLE_COUNT } from '@/lib/data/france-index'
 import { heroImage } from '@/lib/data/images'
 import { HeroSearch } from '@/components/search/HeroSearch'
 
@@ -300,7 +301,7 @@ export function HeroSection({ artisanCount = 0 }: { artisanCount?: number }) {
             >
               {[
                 { value: artisanCount, suffix: '', label: 'artisans' },
-                { value: villes.length, suffix: '', label: 'villes' },
+                { value: VILLE_COUNT, suffix: '', label: 'villes' },
                 { value: departements.length, suffix: '', label: 'départements' },
                 { value: services.length, suffix: '', label: 'métiers' },
               ].map((stat) => (
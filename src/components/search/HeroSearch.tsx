@@ -5,7 +5,7 @@ import { useRouter } from 'next/navigation'
 import { Search, MapPin, TrendingUp, Zap, Wrench, Key, Flame, PaintBucket, Hammer, Grid3X3, Home, TreeDeciduous, Navigation, ChevronRight, Clock, X } from 'lucide-react'
 import { motion, AnimatePresence } from 'framer-motion'
 import { slugify } from '@/lib/utils'
-import { villes, type Ville } from '@/lib/data/france'
+import { villesCore, type VilleCore } from '@/lib/data/france-core'
 
 // ── Icon map ─────────────────────────────────────────────────────────
 const iconMap: Record<string, React.ComponentType<{ className?: string }>> = {
@@ -46,21 +46,21 @@ function formatPopulation(pop: string): string {
 }
 
 // ── Fuzzy city search with prioritized matching ─────────────────────
-function searchCities(query: string, limit = 8): Ville[] {
+function searchCities(query: string, limit = 8): VilleCore[] {
   if (!query || query.length < 2) return []
 
   const normalized = normalizeText(query)
 
   // 1) Exact prefix match (highest priority) — sorted by population desc
-  const prefixMatches: Ville[] = []
+  const prefixMatches: VilleCore[] = []
   // 2) Contains match (inside the name but not prefix)
-  const containsMatches: Ville[] = []
+  const containsMatches: VilleCore[] = []
   // 3) Postal code match
-  const postalMatches: Ville[] = []
+  const postalMatches: VilleCore[] = []
   // 4) Departement name match
-  const deptMatches: Ville[] = []
+  const deptMatches: VilleCore[] = []
 
-  for (const v of villes) {
+  for (const v of villesCore) {
     const normalizedName = normalizeText(v.name)
 
     if (normalizedName.startsWith(normalized)) {
@@ -75,7 +75,7 @@ function searchCities(query: string, limit = 8): Ville[] {
   }
 
   // Sort each group by population descending for relevance
-  const sortByPop = (a: Ville, b: Ville) => {
+  const sortByPop = (a: VilleCore, b: VilleCore) => {
     const popA = parseInt(a.population.replace(/\s/g, ''), 10) || 0
     const popB = parseInt(b.population.replace(/\s/g, ''), 10) || 0
     return popB - popA
@@ -288,7 +288,7 @@ export function HeroSearch() {
   const handleSubmit = useCallback((e?: React.FormEvent) => {
     e?.preventDefault()
     const serviceSlug = services.find(s => normalizeText(s.name) === normalizeText(query))?.slug || slugify(query)
-    const cityMatch = villes.find(v => normalizeText(v.name) === normalizeText(location))
+    const cityMatch = villesCore.find(v => normalizeText(v.name) === normalizeText(location))
     const citySlug = cityMatch?.slug || slugify(location)
 
     // Save to recent searches
@@ -371,14 +371,14 @@ export function HeroSearch() {
     if (!hasTypedCity && recentSearches.length > 0) {
       // Map recent searches to ville objects or placeholders
       return recentSearches.map(name => {
-        const match = villes.find(v => normalizeText(v.name) === normalizeText(name))
-        return match || { name, slug: slugify(name), region: '', departement: '', departementCode: '', population: '', codePostal: '', description: '', quartiers: [] } as Ville
+        const match = villesCore.find(v => normalizeText(v.name) === normalizeText(name))
+        return match || { name, slug: slugify(name), region: '', departement: '', departementCode: '', population: '', codePostal: '' } as VilleCore
       })
     }
     // Popular cities
     return popularCities.map(pc => {
-      const match = villes.find(v => v.slug === pc.slug)
-      return match || { name: pc.name, slug: pc.slug, region: '', departement: '', departementCode: '', population: '', codePostal: '', description: '', quartiers: [] } as Ville
+      const match = villesCore.find(v => v.slug === pc.slug)
+      return match || { name: pc.name, slug: pc.slug, region: '', departement: '', departementCode: '', population: '', codePostal: '' } as VilleCore
     })
   }, [filteredCities, hasTypedCity, recentSearches])
 
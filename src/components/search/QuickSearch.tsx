@@ -3,7 +3,8 @@
 import { useState, useMemo, useRef, useEffect, useCallback } from 'react'
 import { useRouter } from 'next/navigation'
 import { Search, MapPin, Wrench, X } from 'lucide-react'
-import { services, villes, type Ville } from '@/lib/data/france'
+import { services } from '@/lib/data/france'
+import { villesCore, type VilleCore } from '@/lib/data/france-core'
 
 // ── Normalize text (strip accents, lowercase) ───────────────────────
 function normalizeText(text: string): string {
@@ -25,16 +26,16 @@ function formatPopulation(pop: string): string {
 }
 
 // ── Fuzzy city search with prioritized matching ─────────────────────
-function searchCities(query: string, limit = 5): Ville[] {
+function searchCities(query: string, limit = 5): VilleCore[] {
   if (!query || query.length < 1) return []
 
   const normalized = normalizeText(query)
 
-  const prefixMatches: Ville[] = []
-  const containsMatches: Ville[] = []
-  const postalMatches: Ville[] = []
+  const prefixMatches: VilleCore[] = []
+  const containsMatches: VilleCore[] = []
+  const postalMatches: VilleCore[] = []
 
-  for (const v of villes) {
+  for (const v of villesCore) {
     const normalizedName = normalizeText(v.name)
 
     if (normalizedName.startsWith(normalized)) {
@@ -46,7 +47,7 @@ function searchCities(query: string, limit = 5): Ville[] {
     }
   }
 
-  const sortByPop = (a: Ville, b: Ville) => {
+  const sortByPop = (a: VilleCore, b: VilleCore) => {
     const popA = parseInt(a.population.replace(/\s/g, ''), 10) || 0
     const popB = parseInt(b.population.replace(/\s/g, ''), 10) || 0
     return popB - popA
@@ -153,7 +154,7 @@ function buildSuggestions(input: string): Suggestion[] {
     // If no city part remaining, but service matched exactly with trailing space
     if (cityPart.length === 0 && input.endsWith(' ')) {
       // Show top cities for this service
-      const topCities = [...villes]
+      const topCities = [...villesCore]
         .sort((a, b) => {
           const popA = parseInt(a.population.replace(/\s/g, ''), 10) || 0
           const popB = parseInt(b.population.replace(/\s/g, ''), 10) || 0
@@ -4,6 +4,7 @@ import { Geolocation } from '@capacitor/geolocation'
 import { Camera, CameraResultType, CameraSource } from '@capacitor/camera'
 import { SplashScreen } from '@capacitor/splash-screen'
 import { StatusBar, Style } from '@capacitor/status-bar'
+import { syncOfflineArticles } from './offline-articles'
 
 // Vérifier si on est sur une plateforme native
 export const isNative = () => Capacitor.isNativePlatform()
@@ -204,6 +205,11 @@ export const initCapacitor = async () => {
   setStatusBarStyle('light')
   setStatusBarColor('#2563eb')
 
+  // Mettre à jour le blog hors ligne en arrière-plan (articles modifiés seulement)
+  syncOfflineArticles().catch((error) => {
+    console.error('Offline articles sync error:', error)
+  })
+
   // Initialiser les notifications push
   await initPushNotifications()
 }
@@ -1,5 +1,7 @@
 // Navigation data - shared between server and client components
 
+import { RELATED_SERVICES } from '@/lib/data/link-index'
+
 export const popularServices = [
   { name: 'Plombier', slug: 'plombier', icon: 'Wrench' },
   { name: 'Électricien', slug: 'electricien', icon: 'Zap' },
@@ -24,7 +26,10 @@ export const popularCities = [
   { name: 'Montpellier', slug: 'montpellier', department: '34' },
 ]
 
-export const relatedServices: Record<string, string[]> = {
+// Services liés choisis à la main. link-index.ts les reprend en tête puis
+// complète jusqu'à 8 ; après modification, relancer :
+//   python3 -m scripts.pipeline links
+export const curatedRelatedServices: Record<string, string[]> = {
   'plombier': ['chauffagiste', 'salle-de-bain', 'cuisiniste', 'climaticien', 'pompe-a-chaleur'],
   'electricien': ['domoticien', 'alarme-securite', 'borne-recharge', 'antenniste', 'panneaux-solaires'],
   'serrurier': ['alarme-securite', 'vitrier', 'metallier', 'ferronnier'],
@@ -73,6 +78,8 @@ export const relatedServices: Record<string, string[]> = {
   'demenageur': ['nettoyage', 'peintre-en-batiment', 'electricien', 'plombier', 'serrurier'],
 }
 
+export const relatedServices: Record<string, string[]> = RELATED_SERVICES
+
 export const popularRegions = [
   { name: 'Île-de-France', slug: 'ile-de-france' },
   { name: 'Auvergne-Rhône-Alpes', slug: 'auvergne-rhone-alpes' },
@@ -467,7 +467,7 @@ export const reglementationArticles: Record<string, {
       "## L'Accompagnateur Rénov' et le calendrier\n\nPour MaPrimeRénov' Parcours accompagné, un Accompagnateur Rénov' agréé est obligatoire. Il réalise l'audit, propose les scénarios, monte les dossiers. Coût : 1 000 à 2 000 € (pris en charge à 100 % pour les ménages modestes).",
       "\n\n:::tip Conseil pro\nLe calendrier idéal : Mois 1-2 : audit énergétique. Mois 2-3 : devis d'artisans RGE. Mois 3-4 : inscription CEE (avant les devis !), dépôt MaPrimeRénov', demande éco-PTZ. Mois 4-5 : signature des devis. Mois 5-8 : travaux. Mois 8-9 : factures et perception des aides.\n:::",
       "\n\n:::warning Attention\nLes erreurs qui font perdre des aides : signer le devis avant l'inscription CEE, commencer les travaux avant l'accord MaPrimeRénov', choisir un artisan non-RGE, ne pas demander l'éco-PTZ avant le début des travaux, oublier les aides locales.\n:::",
-      "\n\n:::budget\n| Exemple : rénovation globale maison 100 m² classée F |\n| Travaux (isolation + fenêtres + PAC) | 45 000 € TTC |\n| MaPrimeRénov' (80 %, ménage modeste) | -36 000 € |\n| CEE Coup de pouce | -5 000 € |\n| Reste à charge | 4 000 € |\n| Éco-PTZ (15 ans) | 22 €/mois |\n:::",
+      "\n\n:::budget Exemple : rénovation globale maison 100 m² classée F\n| Poste | Montant |\n| Travaux (isolation + fenêtres + PAC) | 45 000 € TTC |\n| MaPrimeRénov' (80 %, ménage modeste) | -36 000 € |\n| CEE Coup de pouce | -5 000 € |\n| Reste à charge | 4 000 € |\n| Éco-PTZ (15 ans) | 22 €/mois |\n:::",
       "\n\n:::takeaway\n- Toutes les aides sont cumulables (MaPrimeRénov' + CEE + éco-PTZ + TVA 5,5 % + aides locales)\n- La rénovation globale offre les taux de prise en charge les plus élevés (30-80 %)\n- L'Accompagnateur Rénov' est obligatoire pour le Parcours accompagné\n- Respectez scrupuleusement le calendrier d'inscription aux aides\n- Le reste à charge peut descendre à moins de 10 % pour les ménages modestes\n- N'oubliez pas les aides locales (régions, départements, communes)\n:::",
     ],
     image: '/images/blog/cumul-aides.jpg',
@@ -0,0 +1,58 @@
+import { describe, it, expect } from 'vitest'
+import { tradeContent, getTradesSlugs } from './trade-content'
+import problems, { getProblemBySlug, getProblemsByService } from './problems'
+import { guides, getGuideBySlug, getGuidesByCategory, getGuidesByTrade } from './guides'
+import { TRADE_CONTENT_INDEX, tradeContentSummaries, getTradeContentSummary, loadTradeContent } from './trade-content-index'
+import { PROBLEMS_BY_SERVICE, problemSummaries, getProblemSummary, getProblemSummariesByService, loadProblem } from './problems-index'
+import { GUIDES_BY_TRADE, guideSummaries, getGuideSummariesByCategory, getGuideSummariesByTrade, loadGuide } from './guides-index'
+
+describe('content indexes', () => {
+  it('should match the source collections (run python3 -m scripts.pipeline content if not)', () => {
+    expect(Object.keys(TRADE_CONTENT_INDEX)).toEqual(getTradesSlugs())
+    expect(tradeContentSummaries.map(t => t.slug)).toEqual(getTradesSlugs())
+    expect(problemSummaries.map(p => p.slug)).toEqual(problems.map(p => p.slug))
+    expect(guideSummaries.map(g => g.slug)).toEqual(guides.map(g => g.slug))
+    for (const problem of problems) {
+      expect(getProblemBySlug(problem.slug)).toBe(problem)
+      expect(getProblemSummary(problem.slug)?.estimatedCost).toEqual(problem.estimatedCost)
+    }
+    for (const guide of guides) {
+      expect(getGuideBySlug(guide.slug)).toBe(guide)
+    }
+  })
+
+  it('should return undefined for unknown or inherited keys', () => {
+    expect(getProblemBySlug('constructor')).toBeUndefined()
+    expect(getGuideBySlug('__proto__')).toBeUndefined()
+    expect(getTradeContentSummary('toString')).toBeUndefined()
+    expect(getProblemsByService('constructor')).toEqual([])
+  })
+})
+
+describe('grouping indexes', () => {
+  it('should match the filter implementations', () => {
+    for (const service of Object.keys(PROBLEMS_BY_SERVICE)) {
+      const expected = problems.filter(p => p.primaryService === service || p.relatedServices.includes(service))
+      expect(getProblemsByService(service)).toEqual(expected)
+      expect(getProblemSummariesByService(service).map(p => p.slug)).toEqual(expected.map(p => p.slug))
+    }
+    for (const category of ['choisir', 'entretien', 'reglementation', 'economiser', 'urgence'] as const) {
+      const expected = guides.filter(g => g.category === category)
+      expect(getGuidesByCategory(category)).toEqual(expected)
+      expect(getGuideSummariesByCategory(category).map(g => g.slug)).toEqual(expected.map(g => g.slug))
+    }
+    for (const trade of Object.keys(GUIDES_BY_TRADE)) {
+      expect(getGuidesByTrade(trade)).toEqual(guides.filter(g => g.trade === trade))
+      expect(getGuideSummariesByTrade(trade).map(g => g.slug)).toEqual(getGuidesByTrade(trade).map(g => g.slug))
+    }
+  })
+})
+
+describe('shards', () => {
+  it('should load the same entries as the source modules', async () => {
+    expect(await loadTradeContent('plombier')).toEqual(tradeContent.plombier)
+    expect(await loadProblem(problems[0].slug)).toEqual(problems[0])
+    expect(await loadGuide(guides[0].slug)).toEqual(guides[0])
+    expect(await loadProblem('probleme-inexistant')).toBeUndefined()
+  })
+})
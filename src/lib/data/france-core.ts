@@ -0,0 +1,5170 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Ville } from './france'
+import { VILLE_INDEX, VILLES_BY_DEPARTEMENT } from './france-index'
+import { lookup, nearbyPositions, pick } from './france-lookup'
+import { QUARTIER_INDEX } from './quartier-index'
+
+/** Ville sans les champs texte lourds */
+export type VilleCore = Omit<Ville, 'description' | 'quartiers'>
+
+export type VilleDetails = Pick<Ville, 'description' | 'quartiers'>
+
+/** Mêmes villes et même ordre que `villes` dans france.ts */
+export const villesCore: VilleCore[] = [
+  { slug: 'paris', name: 'Paris', region: 'Île-de-France', departement: 'Paris', departementCode: '75', population: '2 104 000', codePostal: '75000' },
+  {
+    slug: 'marseille',
+    name: 'Marseille',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '886 000',
+    codePostal: '13000',
+  },
+  { slug: 'lyon', name: 'Lyon', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '519 000', codePostal: '69000' },
+  { slug: 'toulouse', name: 'Toulouse', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '515 000', codePostal: '31000' },
+  { slug: 'nice', name: 'Nice', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '358 000', codePostal: '06000' },
+  { slug: 'nantes', name: 'Nantes', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '328 000', codePostal: '44000' },
+  { slug: 'montpellier', name: 'Montpellier', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '310 000', codePostal: '34000' },
+  { slug: 'strasbourg', name: 'Strasbourg', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '294 000', codePostal: '67000' },
+  { slug: 'bordeaux', name: 'Bordeaux', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '268 000', codePostal: '33000' },
+  { slug: 'lille', name: 'Lille', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '238 000', codePostal: '59000' },
+  { slug: 'rennes', name: 'Rennes', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '231 000', codePostal: '35000' },
+  { slug: 'toulon', name: 'Toulon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '179 000', codePostal: '83000' },
+  { slug: 'reims', name: 'Reims', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '178 000', codePostal: '51100' },
+  { slug: 'saint-etienne', name: 'Saint-Étienne', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '173 000', codePostal: '42000' },
+  { slug: 'le-havre', name: 'Le Havre', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '167 000', codePostal: '76600' },
+  { slug: 'villeurbanne', name: 'Villeurbanne', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '164 000', codePostal: '69100' },
+  { slug: 'dijon', name: 'Dijon', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '162 000', codePostal: '21000' },
+  { slug: 'angers', name: 'Angers', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '159 000', codePostal: '49000' },
+  { slug: 'grenoble', name: 'Grenoble', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '156 000', codePostal: '38000' },
+  { slug: 'saint-denis', name: 'Saint-Denis', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '156 000', codePostal: '93200' },
+  { slug: 'nimes', name: 'Nîmes', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '152 000', codePostal: '30000' },
+  {
+    slug: 'aix-en-provence',
+    name: 'Aix-en-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '150 000',
+    codePostal: '13100',
+  },
+  {
+    slug: 'clermont-ferrand',
+    name: 'Clermont-Ferrand',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Puy-de-Dôme',
+    departementCode: '63',
+    population: '146 000',
+    codePostal: '63000',
+  },
+  { slug: 'le-mans', name: 'Le Mans', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '146 000', codePostal: '72000' },
+  { slug: 'brest', name: 'Brest', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '142 000', codePostal: '29200' },
+  { slug: 'tours', name: 'Tours', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '139 000', codePostal: '37000' },
+  { slug: 'amiens', name: 'Amiens', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '136 000', codePostal: '80000' },
+  { slug: 'annecy', name: 'Annecy', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '132 000', codePostal: '74000' },
+  { slug: 'limoges', name: 'Limoges', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '130 000', codePostal: '87000' },
+  { slug: 'metz', name: 'Metz', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '123 000', codePostal: '57000' },
+  { slug: 'perpignan', name: 'Perpignan', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '122 000', codePostal: '66000' },
+  {
+    slug: 'boulogne-billancourt',
+    name: 'Boulogne-Billancourt',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '119 000',
+    codePostal: '92100',
+  },
+  { slug: 'besancon', name: 'Besançon', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '118 000', codePostal: '25000' },
+  { slug: 'rouen', name: 'Rouen', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '118 000', codePostal: '76000' },
+  { slug: 'orleans', name: 'Orléans', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '116 000', codePostal: '45000' },
+  { slug: 'montreuil', name: 'Montreuil', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '112 000', codePostal: '93100' },
+  { slug: 'caen', name: 'Caen', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '109 000', codePostal: '14000' },
+  { slug: 'saint-paul', name: 'Saint-Paul', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '108 000', codePostal: '97411' },
+  { slug: 'argenteuil', name: 'Argenteuil', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '106 000', codePostal: '95100' },
+  { slug: 'mulhouse', name: 'Mulhouse', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '105 000', codePostal: '68100' },
+  { slug: 'nancy', name: 'Nancy', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '104 000', codePostal: '54000' },
+  { slug: 'tourcoing', name: 'Tourcoing', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '99 000', codePostal: '59200' },
+  { slug: 'roubaix', name: 'Roubaix', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '98 000', codePostal: '59100' },
+  { slug: 'nanterre', name: 'Nanterre', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '98 000', codePostal: '92000' },
+  { slug: 'vitry-sur-seine', name: 'Vitry-sur-Seine', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '94 000', codePostal: '94400' },
+  {
+    slug: 'asnieres-sur-seine',
+    name: 'Asnières-sur-Seine',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '94 000',
+    codePostal: '92600',
+  },
+  { slug: 'creteil', name: 'Créteil', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '93 000', codePostal: '94000' },
+  { slug: 'avignon', name: 'Avignon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '92 000', codePostal: '84000' },
+  { slug: 'colombes', name: 'Colombes', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '91 000', codePostal: '92700' },
+  { slug: 'poitiers', name: 'Poitiers', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '90 000', codePostal: '86000' },
+  { slug: 'aubervilliers', name: 'Aubervilliers', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '88 000', codePostal: '93300' },
+  {
+    slug: 'aulnay-sous-bois',
+    name: 'Aulnay-sous-Bois',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '88 000',
+    codePostal: '93600',
+  },
+  { slug: 'dunkerque', name: 'Dunkerque', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '86 000', codePostal: '59140' },
+  { slug: 'noumea', name: 'Nouméa', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '86 000', codePostal: '98800' },
+  { slug: 'saint-pierre', name: 'Saint-Pierre', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '85 000', codePostal: '97410' },
+  { slug: 'versailles', name: 'Versailles', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '84 000', codePostal: '78000' },
+  { slug: 'courbevoie', name: 'Courbevoie', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '83 000', codePostal: '92400' },
+  { slug: 'rueil-malmaison', name: 'Rueil-Malmaison', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '83 000', codePostal: '92500' },
+  { slug: 'le-tampon', name: 'Le Tampon', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '83 000', codePostal: '97418' },
+  { slug: 'beziers', name: 'Béziers', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '82 000', codePostal: '34500' },
+  { slug: 'pau', name: 'Pau', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '80 000', codePostal: '64000' },
+  { slug: 'la-rochelle', name: 'La Rochelle', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '80 000', codePostal: '17000' },
+  { slug: 'cherbourg-en-cotentin', name: 'Cherbourg-en-Cotentin', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '78 000', codePostal: '50100' },
+  { slug: 'merignac', name: 'Mérignac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '78 000', codePostal: '33700' },
+  {
+    slug: 'champigny-sur-marne',
+    name: 'Champigny-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Val-de-Marne',
+    departementCode: '94',
+    population: '78 000',
+    codePostal: '94500',
+  },
+  { slug: 'antibes', name: 'Antibes', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '78 000', codePostal: '06600' },
+  {
+    slug: 'saint-maur-des-fosses',
+    name: 'Saint-Maur-des-Fossés',
+    region: 'Île-de-France',
+    departement: 'Val-de-Marne',
+    departementCode: '94',
+    population: '77 000',
+    codePostal: '94100',
+  },
+  { slug: 'ajaccio', name: 'Ajaccio', region: 'Corse', departement: 'Corse-du-Sud', departementCode: '2A', population: '76 000', codePostal: '20000' },
+  { slug: 'fort-de-france', name: 'Fort-de-France', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '76 000', codePostal: '97200' },
+  { slug: 'saint-nazaire', name: 'Saint-Nazaire', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '75 000', codePostal: '44600' },
+  { slug: 'cannes', name: 'Cannes', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '74 000', codePostal: '06400' },
+  { slug: 'noisy-le-grand', name: 'Noisy-le-Grand', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '73 000', codePostal: '93160' },
+  { slug: 'drancy', name: 'Drancy', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '72 000', codePostal: '93700' },
+  { slug: 'mamoudzou', name: 'Mamoudzou', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '71 000', codePostal: '97600' },
+  { slug: 'cergy', name: 'Cergy', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '71 000', codePostal: '95000' },
+  { slug: 'levallois-perret', name: 'Levallois-Perret', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '68 000', codePostal: '92300' },
+  {
+    slug: 'issy-les-moulineaux',
+    name: 'Issy-les-Moulineaux',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '68 000',
+    codePostal: '92130',
+  },
+  { slug: 'calais', name: 'Calais', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '68 000', codePostal: '62100' },
+  { slug: 'pessac', name: 'Pessac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '67 000', codePostal: '33600' },
+  { slug: 'colmar', name: 'Colmar', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '67 000', codePostal: '68000' },
+  { slug: 'evry-courcouronnes', name: 'Évry-Courcouronnes', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '67 000', codePostal: '91000' },
+  { slug: 'venissieux', name: 'Vénissieux', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '66 000', codePostal: '69200' },
+  { slug: 'ivry-sur-seine', name: 'Ivry-sur-Seine', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '65 000', codePostal: '94200' },
+  { slug: 'valence', name: 'Valence', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '64 000', codePostal: '26000' },
+  { slug: 'clichy', name: 'Clichy', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '64 000', codePostal: '92110' },
+  { slug: 'quimper', name: 'Quimper', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '64 000', codePostal: '29000' },
+  { slug: 'antony', name: 'Antony', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '64 000', codePostal: '92160' },
+  { slug: 'bourges', name: 'Bourges', region: 'Centre-Val de Loire', departement: 'Cher', departementCode: '18', population: '64 000', codePostal: '18000' },
+  {
+    slug: 'la-seyne-sur-mer',
+    name: 'La Seyne-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '64 000',
+    codePostal: '83500',
+  },
+  { slug: 'montauban', name: 'Montauban', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '63 000', codePostal: '82000' },
+  { slug: 'villeneuve-d-ascq', name: 'Villeneuve-d\'Ascq', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '63 000', codePostal: '59650' },
+  { slug: 'cayenne', name: 'Cayenne', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '63 000', codePostal: '97300' },
+  { slug: 'le-blanc-mesnil', name: 'Le Blanc-Mesnil', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '62 000', codePostal: '93150' },
+  { slug: 'troyes', name: 'Troyes', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '62 000', codePostal: '10000' },
+  { slug: 'pantin', name: 'Pantin', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '62 000', codePostal: '93500' },
+  { slug: 'villejuif', name: 'Villejuif', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '60 000', codePostal: '94800' },
+  { slug: 'chambery', name: 'Chambéry', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '60 000', codePostal: '73000' },
+  { slug: 'niort', name: 'Niort', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '60 000', codePostal: '79000' },
+  { slug: 'frejus', name: 'Fréjus', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '60 000', codePostal: '83600' },
+  { slug: 'neuilly-sur-seine', name: 'Neuilly-sur-Seine', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '60 000', codePostal: '92200' },
+  { slug: 'sarcelles', name: 'Sarcelles', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '59 000', codePostal: '95200' },
+  { slug: 'saint-andre', name: 'Saint-André', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '59 000', codePostal: '97440' },
+  { slug: 'clamart', name: 'Clamart', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '59 000', codePostal: '92140' },
+  { slug: 'lorient', name: 'Lorient', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '58 000', codePostal: '56100' },
+  { slug: 'narbonne', name: 'Narbonne', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '58 000', codePostal: '11100' },
+  { slug: 'bobigny', name: 'Bobigny', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '57 000', codePostal: '93000' },
+  { slug: 'meaux', name: 'Meaux', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '57 000', codePostal: '77100' },
+  { slug: 'maisons-alfort', name: 'Maisons-Alfort', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '57 000', codePostal: '94700' },
+  { slug: 'hyeres', name: 'Hyères', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '56 000', codePostal: '83400' },
+  { slug: 'vannes', name: 'Vannes', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '56 000', codePostal: '56000' },
+  { slug: 'beauvais', name: 'Beauvais', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '56 000', codePostal: '60000' },
+  { slug: 'saint-louis', name: 'Saint-Louis', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '55 000', codePostal: '97421' },
+  { slug: 'la-roche-sur-yon', name: 'La Roche-sur-Yon', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '55 000', codePostal: '85000' },
+  { slug: 'chelles', name: 'Chelles', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '55 000', codePostal: '77500' },
+  { slug: 'corbeil-essonnes', name: 'Corbeil-Essonnes', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '54 000', codePostal: '91100' },
+  { slug: 'saint-laurent-du-maroni', name: 'Saint-Laurent-du-Maroni', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '54 000', codePostal: '97320' },
+  { slug: 'cholet', name: 'Cholet', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '54 000', codePostal: '49300' },
+  { slug: 'bayonne', name: 'Bayonne', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '54 000', codePostal: '64100' },
+  { slug: 'fontenay-sous-bois', name: 'Fontenay-sous-Bois', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '54 000', codePostal: '94120' },
+  {
+    slug: 'saint-ouen-sur-seine',
+    name: 'Saint-Ouen-sur-Seine',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '54 000',
+    codePostal: '93400',
+  },
+  {
+    slug: 'cagnes-sur-mer',
+    name: 'Cagnes-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '53 000',
+    codePostal: '06800',
+  },
+  { slug: 'vaulx-en-velin', name: 'Vaulx-en-Velin', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '53 000', codePostal: '69120' },
+  {
+    slug: 'epinay-sur-seine',
+    name: 'Épinay-sur-Seine',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '53 000',
+    codePostal: '93800',
+  },
+  { slug: 'saint-quentin', name: 'Saint-Quentin', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '53 000', codePostal: '02100' },
+  { slug: 'sartrouville', name: 'Sartrouville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '53 000', codePostal: '78500' },
+  { slug: 'sevran', name: 'Sevran', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '53 000', codePostal: '93270' },
+  { slug: 'arles', name: 'Arles', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '52 000', codePostal: '13200' },
+  { slug: 'massy', name: 'Massy', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '52 000', codePostal: '91300' },
+  { slug: 'albi', name: 'Albi', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '51 000', codePostal: '81000' },
+  { slug: 'les-abymes', name: 'Les Abymes', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '51 000', codePostal: '97139' },
+  { slug: 'gennevilliers', name: 'Gennevilliers', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '51 000', codePostal: '92230' },
+  { slug: 'saint-herblain', name: 'Saint-Herblain', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '51 000', codePostal: '44800' },
+  { slug: 'grasse', name: 'Grasse', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '51 000', codePostal: '06130' },
+  { slug: 'bondy', name: 'Bondy', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '51 000', codePostal: '93140' },
+  { slug: 'les-sables-d-olonne', name: 'Les Sables-d\'Olonne', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '50 000', codePostal: '85100' },
+  { slug: 'laval', name: 'Laval', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '49 000', codePostal: '53000' },
+  { slug: 'evreux', name: 'Évreux', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '49 000', codePostal: '27000' },
+  { slug: 'saint-priest', name: 'Saint-Priest', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '49 000', codePostal: '69800' },
+  { slug: 'suresnes', name: 'Suresnes', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '49 000', codePostal: '92150' },
+  { slug: 'martigues', name: 'Martigues', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '48 000', codePostal: '13117' },
+  { slug: 'vincennes', name: 'Vincennes', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '48 000', codePostal: '94300' },
+  { slug: 'aubagne', name: 'Aubagne', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '48 000', codePostal: '13400' },
+  { slug: 'saint-malo', name: 'Saint-Malo', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '47 000', codePostal: '35400' },
+  { slug: 'livry-gargan', name: 'Livry-Gargan', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '47 000', codePostal: '93190' },
+  { slug: 'blois', name: 'Blois', region: 'Centre-Val de Loire', departement: 'Loir-et-Cher', departementCode: '41', population: '47 000', codePostal: '41000' },
+  { slug: 'rosny-sous-bois', name: 'Rosny-sous-Bois', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '47 000', codePostal: '93110' },
+  { slug: 'la-courneuve', name: 'La Courneuve', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '47 000', codePostal: '93120' },
+  { slug: 'brive-la-gaillarde', name: 'Brive-la-Gaillarde', region: 'Nouvelle-Aquitaine', departement: 'Corrèze', departementCode: '19', population: '47 000', codePostal: '19100' },
+  { slug: 'bastia', name: 'Bastia', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '47 000', codePostal: '20200' },
+  { slug: 'talence', name: 'Talence', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '46 000', codePostal: '33400' },
+  { slug: 'meudon', name: 'Meudon', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '46 000', codePostal: '92190' },
+  { slug: 'montrouge', name: 'Montrouge', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '46 000', codePostal: '92120' },
+  { slug: 'ales', name: 'Alès', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '46 000', codePostal: '30100' },
+  { slug: 'carcassonne', name: 'Carcassonne', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '46 000', codePostal: '11000' },
+  { slug: 'melun', name: 'Melun', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '46 000', codePostal: '77000' },
+  { slug: 'choisy-le-roi', name: 'Choisy-le-Roi', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '46 000', codePostal: '94600' },
+  {
+    slug: 'saint-germain-en-laye',
+    name: 'Saint-Germain-en-Laye',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '46 000',
+    codePostal: '78100',
+  },
+  { slug: 'belfort', name: 'Belfort', region: 'Bourgogne-Franche-Comté', departement: 'Territoire de Belfort', departementCode: '90', population: '46 000', codePostal: '90000' },
+  { slug: 'charleville-mezieres', name: 'Charleville-Mézières', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '46 000', codePostal: '08000' },
+  { slug: 'alfortville', name: 'Alfortville', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '46 000', codePostal: '94140' },
+  { slug: 'noisy-le-sec', name: 'Noisy-le-Sec', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '46 000', codePostal: '93130' },
+  { slug: 'sete', name: 'Sète', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '45 000', codePostal: '34200' },
+  {
+    slug: 'chalon-sur-saone',
+    name: 'Chalon-sur-Saône',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '45 000',
+    codePostal: '71100',
+  },
+  { slug: 'bagneux', name: 'Bagneux', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '45 000', codePostal: '92220' },
+  { slug: 'tarbes', name: 'Tarbes', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '44 000', codePostal: '65000' },
+  { slug: 'saint-brieuc', name: 'Saint-Brieuc', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '44 000', codePostal: '22000' },
+  { slug: 'istres', name: 'Istres', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '44 000', codePostal: '13118' },
+  {
+    slug: 'salon-de-provence',
+    name: 'Salon-de-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '44 000',
+    codePostal: '13300',
+  },
+  { slug: 'puteaux', name: 'Puteaux', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '44 000', codePostal: '92800' },
+  { slug: 'caluire-et-cuire', name: 'Caluire-et-Cuire', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '44 000', codePostal: '69300' },
+  { slug: 'reze', name: 'Rezé', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '44 000', codePostal: '44400' },
+  { slug: 'mantes-la-jolie', name: 'Mantes-la-Jolie', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '44 000', codePostal: '78200' },
+  { slug: 'valenciennes', name: 'Valenciennes', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '43 000', codePostal: '59300' },
+  { slug: 'anglet', name: 'Anglet', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '43 000', codePostal: '64600' },
+  { slug: 'bagnolet', name: 'Bagnolet', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '43 000', codePostal: '93170' },
+  { slug: 'bron', name: 'Bron', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '43 000', codePostal: '69500' },
+  { slug: 'chalons-en-champagne', name: 'Châlons-en-Champagne', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '43 000', codePostal: '51000' },
+  { slug: 'chateauroux', name: 'Châteauroux', region: 'Centre-Val de Loire', departement: 'Indre', departementCode: '36', population: '43 000', codePostal: '36000' },
+  { slug: 'arras', name: 'Arras', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '43 000', codePostal: '62000' },
+  { slug: 'thionville', name: 'Thionville', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '43 000', codePostal: '57100' },
+  { slug: 'villenave-d-ornon', name: 'Villenave-d\'Ornon', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '43 000', codePostal: '33140' },
+  { slug: 'castres', name: 'Castres', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '43 000', codePostal: '81100' },
+  { slug: 'bourg-en-bresse', name: 'Bourg-en-Bresse', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '42 000', codePostal: '01000' },
+  { slug: 'gagny', name: 'Gagny', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '42 000', codePostal: '93220' },
+  { slug: 'le-cannet', name: 'Le Cannet', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '42 000', codePostal: '06110' },
+  { slug: 'angouleme', name: 'Angoulême', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '42 000', codePostal: '16000' },
+  { slug: 'garges-les-gonesse', name: 'Garges-lès-Gonesse', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '42 000', codePostal: '95140' },
+  { slug: 'villepinte', name: 'Villepinte', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '41 000', codePostal: '93420' },
+  { slug: 'stains', name: 'Stains', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '41 000', codePostal: '93240' },
+  { slug: 'gap', name: 'Gap', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Hautes-Alpes', departementCode: '05', population: '41 000', codePostal: '05000' },
+  { slug: 'poissy', name: 'Poissy', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '41 000', codePostal: '78300' },
+  { slug: 'colomiers', name: 'Colomiers', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '41 000', codePostal: '31770' },
+  { slug: 'wattrelos', name: 'Wattrelos', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '41 000', codePostal: '59150' },
+  { slug: 'draguignan', name: 'Draguignan', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '41 000', codePostal: '83300' },
+  { slug: 'compiegne', name: 'Compiègne', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '41 000', codePostal: '60200' },
+  { slug: 'montelimar', name: 'Montélimar', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '41 000', codePostal: '26200' },
+  { slug: 'boulogne-sur-mer', name: 'Boulogne-sur-Mer', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '41 000', codePostal: '62200' },
+  { slug: 'douai', name: 'Douai', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '40 000', codePostal: '59500' },
+  { slug: 'marcq-en-bar-ul', name: 'Marcq-en-Barœul', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '40 000', codePostal: '59700' },
+  {
+    slug: 'neuilly-sur-marne',
+    name: 'Neuilly-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '40 000',
+    codePostal: '93330',
+  },
+  { slug: 'le-lamentin', name: 'Le Lamentin', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '39 000', codePostal: '97232' },
+  { slug: 'saint-joseph', name: 'Saint-Joseph', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '39 000', codePostal: '97480' },
+  { slug: 'pontault-combault', name: 'Pontault-Combault', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '39 000', codePostal: '77340' },
+  { slug: 'saint-benoit', name: 'Saint-Benoît', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '39 000', codePostal: '97437' },
+  { slug: 'la-ciotat', name: 'La Ciotat', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '38 000', codePostal: '13600' },
+  { slug: 'joue-les-tours', name: 'Joué-lès-Tours', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '38 000', codePostal: '37300' },
+  {
+    slug: 'tremblay-en-france',
+    name: 'Tremblay-en-France',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '38 000',
+    codePostal: '93290',
+  },
+  { slug: 'chartres', name: 'Chartres', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '38 000', codePostal: '28000' },
+  {
+    slug: 'oullins-pierre-benite',
+    name: 'Oullins-Pierre-Bénite',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '38 000',
+    codePostal: '69310',
+  },
+  {
+    slug: 'thonon-les-bains',
+    name: 'Thonon-les-Bains',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '38 000',
+    codePostal: '74200',
+  },
+  { slug: 'franconville', name: 'Franconville', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '38 000', codePostal: '95130' },
+  {
+    slug: 'saint-martin-d-heres',
+    name: 'Saint-Martin-d\'Hères',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '38 000',
+    codePostal: '38400',
+  },
+  { slug: 'annemasse', name: 'Annemasse', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '38 000', codePostal: '74100' },
+  { slug: 'savigny-sur-orge', name: 'Savigny-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '38 000', codePostal: '91600' },
+  { slug: 'echirolles', name: 'Échirolles', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '37 000', codePostal: '38130' },
+  { slug: 'palaiseau', name: 'Palaiseau', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '37 000', codePostal: '91120' },
+  { slug: 'romainville', name: 'Romainville', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '37 000', codePostal: '93230' },
+  { slug: 'saint-raphael', name: 'Saint-Raphaël', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '37 000', codePostal: '83530' },
+  {
+    slug: 'six-fours-les-plages',
+    name: 'Six-Fours-les-Plages',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '37 000',
+    codePostal: '83140',
+  },
+  { slug: 'sainte-marie', name: 'Sainte-Marie', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '37 000', codePostal: '97438' },
+  {
+    slug: 'conflans-sainte-honorine',
+    name: 'Conflans-Sainte-Honorine',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '37 000',
+    codePostal: '78700',
+  },
+  { slug: 'vitrolles', name: 'Vitrolles', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '37 000', codePostal: '13127' },
+  { slug: 'chatillon', name: 'Châtillon', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '37 000', codePostal: '92320' },
+  { slug: 'meyzieu', name: 'Meyzieu', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '37 000', codePostal: '69330' },
+  { slug: 'athis-mons', name: 'Athis-Mons', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '37 000', codePostal: '91200' },
+  { slug: 'la-possession', name: 'La Possession', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '37 000', codePostal: '97419' },
+  { slug: 'matoury', name: 'Matoury', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '37 000', codePostal: '97351' },
+  { slug: 'bezons', name: 'Bezons', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '36 000', codePostal: '95870' },
+  { slug: 'haguenau', name: 'Haguenau', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '36 000', codePostal: '67500' },
+  { slug: 'creil', name: 'Creil', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '36 000', codePostal: '60100' },
+  {
+    slug: 'villeneuve-saint-georges',
+    name: 'Villeneuve-Saint-Georges',
+    region: 'Île-de-France',
+    departement: 'Val-de-Marne',
+    departementCode: '94',
+    population: '36 000',
+    codePostal: '94190',
+  },
+  {
+    slug: 'villefranche-sur-saone',
+    name: 'Villefranche-sur-Saône',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '36 000',
+    codePostal: '69400',
+  },
+  { slug: 'saint-leu', name: 'Saint-Leu', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '36 000', codePostal: '97416' },
+  { slug: 'chatenay-malabry', name: 'Châtenay-Malabry', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '36 000', codePostal: '92290' },
+  { slug: 'saint-chamond', name: 'Saint-Chamond', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '36 000', codePostal: '42400' },
+  {
+    slug: 'sainte-genevieve-des-bois',
+    name: 'Sainte-Geneviève-des-Bois',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '35 000',
+    codePostal: '91700',
+  },
+  { slug: 'roanne', name: 'Roanne', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '35 000', codePostal: '42300' },
+  {
+    slug: 'le-perreux-sur-marne',
+    name: 'Le Perreux-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Val-de-Marne',
+    departementCode: '94',
+    population: '35 000',
+    codePostal: '94170',
+  },
+  { slug: 'macon', name: 'Mâcon', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '35 000', codePostal: '71000' },
+  { slug: 'auxerre', name: 'Auxerre', region: 'Bourgogne-Franche-Comté', departement: 'Yonne', departementCode: '89', population: '35 000', codePostal: '89000' },
+  { slug: 'dumbea', name: 'Dumbéa', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '35 000', codePostal: '98835' },
+  { slug: 'schiltigheim', name: 'Schiltigheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '35 000', codePostal: '67300' },
+  { slug: 'trappes', name: 'Trappes', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '35 000', codePostal: '78190' },
+  { slug: 'les-mureaux', name: 'Les Mureaux', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '35 000', codePostal: '78130' },
+  { slug: 'houilles', name: 'Houilles', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '34 000', codePostal: '78800' },
+  { slug: 'le-port', name: 'Le Port', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '34 000', codePostal: '97420' },
+  { slug: 'marignane', name: 'Marignane', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '34 000', codePostal: '13700' },
+  { slug: 'romans-sur-isere', name: 'Romans-sur-Isère', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '33 000', codePostal: '26100' },
+  { slug: 'villiers-sur-marne', name: 'Villiers-sur-Marne', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '33 000', codePostal: '94350' },
+  { slug: 'montlucon', name: 'Montluçon', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '33 000', codePostal: '03100' },
+  { slug: 'nevers', name: 'Nevers', region: 'Bourgogne-Franche-Comté', departement: 'Nièvre', departementCode: '58', population: '33 000', codePostal: '58000' },
+  { slug: 'lens', name: 'Lens', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '33 000', codePostal: '62300' },
+  { slug: 'thiais', name: 'Thiais', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '33 000', codePostal: '94320' },
+  {
+    slug: 'saint-medard-en-jalles',
+    name: 'Saint-Médard-en-Jalles',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '33 000',
+    codePostal: '33160',
+  },
+  { slug: 'agen', name: 'Agen', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '33 000', codePostal: '47000' },
+  {
+    slug: 'montigny-le-bretonneux',
+    name: 'Montigny-le-Bretonneux',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '32 000',
+    codePostal: '78180',
+  },
+  { slug: 'nogent-sur-marne', name: 'Nogent-sur-Marne', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '32 000', codePostal: '94130' },
+  { slug: 'aix-les-bains', name: 'Aix-les-Bains', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '32 000', codePostal: '73100' },
+  { slug: 'epinal', name: 'Épinal', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '32 000', codePostal: '88000' },
+  {
+    slug: 'saint-laurent-du-var',
+    name: 'Saint-Laurent-du-Var',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '32 000',
+    codePostal: '06700',
+  },
+  { slug: 'koungou', name: 'Koungou', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '32 000', codePostal: '97600' },
+  { slug: 'pontoise', name: 'Pontoise', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '32 000', codePostal: '95000' },
+  { slug: 'begles', name: 'Bègles', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '32 000', codePostal: '33130' },
+  { slug: 'plaisir', name: 'Plaisir', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '32 000', codePostal: '78370' },
+  { slug: 'herblay-sur-seine', name: 'Herblay-sur-Seine', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '32 000', codePostal: '95220' },
+  { slug: 'vienne', name: 'Vienne', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '32 000', codePostal: '38200' },
+  { slug: 'carpentras', name: 'Carpentras', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '32 000', codePostal: '84200' },
+  { slug: 'mont-de-marsan', name: 'Mont-de-Marsan', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '32 000', codePostal: '40000' },
+  { slug: 'dreux', name: 'Dreux', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '32 000', codePostal: '28100' },
+  { slug: 'vigneux-sur-seine', name: 'Vigneux-sur-Seine', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '31 000', codePostal: '91270' },
+  { slug: 'rillieux-la-pape', name: 'Rillieux-la-Pape', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '31 000', codePostal: '69140' },
+  { slug: 'goussainville', name: 'Goussainville', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '31 000', codePostal: '95190' },
+  { slug: 'ris-orangis', name: 'Ris-Orangis', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '31 000', codePostal: '91130' },
+  { slug: 'l-hay-les-roses', name: 'L\'Haÿ-les-Roses', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '31 000', codePostal: '94240' },
+  { slug: 'saint-martin', name: 'Saint-Martin', region: 'Saint-Martin', departement: 'Saint-Martin', departementCode: '978', population: '31 000', codePostal: '97150' },
+  { slug: 'savigny-le-temple', name: 'Savigny-le-Temple', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '31 000', codePostal: '77176' },
+  { slug: 'cambrai', name: 'Cambrai', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '31 000', codePostal: '59400' },
+  { slug: 'cachan', name: 'Cachan', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '31 000', codePostal: '94230' },
+  { slug: 'chatellerault', name: 'Châtellerault', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '31 000', codePostal: '86100' },
+  { slug: 'baie-mahault', name: 'Baie-Mahault', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '31 000', codePostal: '97122' },
+  { slug: 'viry-chatillon', name: 'Viry-Châtillon', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '31 000', codePostal: '91170' },
+  {
+    slug: 'le-chesnay-rocquencourt',
+    name: 'Le Chesnay-Rocquencourt',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '31 000',
+    codePostal: '78150',
+  },
+  { slug: 'menton', name: 'Menton', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '31 000', codePostal: '06500' },
+  { slug: 'chatou', name: 'Chatou', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '31 000', codePostal: '78400' },
+  { slug: 'malakoff', name: 'Malakoff', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '31 000', codePostal: '92240' },
+  {
+    slug: 'la-garenne-colombes',
+    name: 'La Garenne-Colombes',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '30 000',
+    codePostal: '92250',
+  },
+  { slug: 'tournefeuille', name: 'Tournefeuille', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '30 000', codePostal: '31170' },
+  { slug: 'bourgoin-jallieu', name: 'Bourgoin-Jallieu', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '30 000', codePostal: '38300' },
+  { slug: 'draveil', name: 'Draveil', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '30 000', codePostal: '91210' },
+  { slug: 'lievin', name: 'Liévin', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '30 000', codePostal: '62800' },
+  { slug: 'villiers-le-bel', name: 'Villiers-le-Bel', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '30 000', codePostal: '95400' },
+  {
+    slug: 'vand-uvre-les-nancy',
+    name: 'Vandœuvre-lès-Nancy',
+    region: 'Grand Est',
+    departement: 'Meurthe-et-Moselle',
+    departementCode: '54',
+    population: '30 000',
+    codePostal: '54500',
+  },
+  { slug: 'agde', name: 'Agde', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '30 000', codePostal: '34300' },
+  { slug: 'decines-charpieu', name: 'Décines-Charpieu', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '30 000', codePostal: '69150' },
+  { slug: 'saint-cloud', name: 'Saint-Cloud', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '30 000', codePostal: '92210' },
+  { slug: 'faaa', name: 'Faaa', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '30 000', codePostal: '98704' },
+  { slug: 'villemomble', name: 'Villemomble', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '30 000', codePostal: '93250' },
+  { slug: 'guyancourt', name: 'Guyancourt', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '30 000', codePostal: '78280' },
+  { slug: 'orange', name: 'Orange', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '30 000', codePostal: '84100' },
+  { slug: 'fresnes', name: 'Fresnes', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '30 000', codePostal: '94260' },
+  {
+    slug: 'saint-etienne-du-rouvray',
+    name: 'Saint-Étienne-du-Rouvray',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '30 000',
+    codePostal: '76800',
+  },
+  { slug: 'ermont', name: 'Ermont', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '29 000', codePostal: '95120' },
+  {
+    slug: 'clichy-sous-bois',
+    name: 'Clichy-sous-Bois',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '29 000',
+    codePostal: '93390',
+  },
+  { slug: 'vallauris', name: 'Vallauris', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '29 000', codePostal: '06220' },
+  { slug: 'perigueux', name: 'Périgueux', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '29 000', codePostal: '24000' },
+  {
+    slug: 'sotteville-les-rouen',
+    name: 'Sotteville-lès-Rouen',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '29 000',
+    codePostal: '76300',
+  },
+  { slug: 'bois-colombes', name: 'Bois-Colombes', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '29 000', codePostal: '92270' },
+  {
+    slug: 'le-plessis-robinson',
+    name: 'Le Plessis-Robinson',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '29 000',
+    codePostal: '92350',
+  },
+  { slug: 'charenton-le-pont', name: 'Charenton-le-Pont', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '29 000', codePostal: '94220' },
+  { slug: 'punaauia', name: 'Punaauia', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '29 000', codePostal: '98703' },
+  { slug: 'maubeuge', name: 'Maubeuge', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '29 000', codePostal: '59600' },
+  { slug: 'montfermeil', name: 'Montfermeil', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '29 000', codePostal: '93370' },
+  { slug: 'vanves', name: 'Vanves', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '29 000', codePostal: '92170' },
+  {
+    slug: 'saint-sebastien-sur-loire',
+    name: 'Saint-Sébastien-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '29 000',
+    codePostal: '44230',
+  },
+  { slug: 'orvault', name: 'Orvault', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '29 000', codePostal: '44700' },
+  { slug: 'dieppe', name: 'Dieppe', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '28 000', codePostal: '76200' },
+  { slug: 'soissons', name: 'Soissons', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '28 000', codePostal: '02200' },
+  { slug: 'yerres', name: 'Yerres', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '28 000', codePostal: '91330' },
+  { slug: 'illkirch-graffenstaden', name: 'Illkirch-Graffenstaden', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '28 000', codePostal: '67400' },
+  { slug: 'sucy-en-brie', name: 'Sucy-en-Brie', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '28 000', codePostal: '94370' },
+  { slug: 'le-gosier', name: 'Le Gosier', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '28 000', codePostal: '97190' },
+  { slug: 'rambouillet', name: 'Rambouillet', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '28 000', codePostal: '78120' },
+  { slug: 'remire-montjoly', name: 'Remire-Montjoly', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '28 000', codePostal: '97354' },
+  { slug: 'gonesse', name: 'Gonesse', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '28 000', codePostal: '95500' },
+  { slug: 'paita', name: 'Païta', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '28 000', codePostal: '98889' },
+  { slug: 'blagnac', name: 'Blagnac', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '28 000', codePostal: '31700' },
+  { slug: 'taverny', name: 'Taverny', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '28 000', codePostal: '95150' },
+  { slug: 'la-teste-de-buch', name: 'La Teste-de-Buch', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '28 000', codePostal: '33115' },
+  {
+    slug: 'bussy-saint-georges',
+    name: 'Bussy-Saint-Georges',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '27 000',
+    codePostal: '77600',
+  },
+  { slug: 'champs-sur-marne', name: 'Champs-sur-Marne', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '27 000', codePostal: '77420' },
+  { slug: 'limeil-brevannes', name: 'Limeil-Brévannes', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '27 000', codePostal: '94450' },
+  {
+    slug: 'cormeilles-en-parisis',
+    name: 'Cormeilles-en-Parisis',
+    region: 'Île-de-France',
+    departement: 'Val-d\'Oise',
+    departementCode: '95',
+    population: '27 000',
+    codePostal: '95240',
+  },
+  { slug: 'bergerac', name: 'Bergerac', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '27 000', codePostal: '24100' },
+  { slug: 'sens', name: 'Sens', region: 'Bourgogne-Franche-Comté', departement: 'Yonne', departementCode: '89', population: '27 000', codePostal: '89100' },
+  { slug: 'lambersart', name: 'Lambersart', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '27 000', codePostal: '59130' },
+  { slug: 'armentieres', name: 'Armentières', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '27 000', codePostal: '59280' },
+  { slug: 'gradignan', name: 'Gradignan', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '27 000', codePostal: '33170' },
+  { slug: 'villeparisis', name: 'Villeparisis', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '27 000', codePostal: '77270' },
+  { slug: 'sannois', name: 'Sannois', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '27 000', codePostal: '95110' },
+  { slug: 'etampes', name: 'Étampes', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '27 000', codePostal: '91150' },
+  { slug: 'grigny', name: 'Grigny', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '27 000', codePostal: '91350' },
+  { slug: 'cenon', name: 'Cenon', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '27 000', codePostal: '33150' },
+  { slug: 'bretigny-sur-orge', name: 'Brétigny-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '27 000', codePostal: '91220' },
+  { slug: 'papeete', name: 'Papeete', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '27 000', codePostal: '98714' },
+  { slug: 'lunel', name: 'Lunel', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '27 000', codePostal: '34400' },
+  { slug: 'la-garde', name: 'La Garde', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '26 000', codePostal: '83130' },
+  { slug: 'elancourt', name: 'Élancourt', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '26 000', codePostal: '78990' },
+  { slug: 'saumur', name: 'Saumur', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '26 000', codePostal: '49400' },
+  { slug: 'vertou', name: 'Vertou', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '26 000', codePostal: '44120' },
+  { slug: 'aurillac', name: 'Aurillac', region: 'Auvergne-Rhône-Alpes', departement: 'Cantal', departementCode: '15', population: '26 000', codePostal: '15000' },
+  { slug: 'eaubonne', name: 'Eaubonne', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '26 000', codePostal: '95600' },
+  { slug: 'biarritz', name: 'Biarritz', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '26 000', codePostal: '64200' },
+  { slug: 'miramas', name: 'Miramas', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '26 000', codePostal: '13140' },
+  { slug: 'muret', name: 'Muret', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '26 000', codePostal: '31600' },
+  { slug: 'castelnau-le-lez', name: 'Castelnau-le-Lez', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '26 000', codePostal: '34170' },
+  {
+    slug: 'villeneuve-la-garenne',
+    name: 'Villeneuve-la-Garenne',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '26 000',
+    codePostal: '92390',
+  },
+  { slug: 'les-ulis', name: 'Les Ulis', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '26 000', codePostal: '91940' },
+  {
+    slug: 'les-pavillons-sous-bois',
+    name: 'Les Pavillons-sous-Bois',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '26 000',
+    codePostal: '93320',
+  },
+  { slug: 'sevremoine', name: 'Sèvremoine', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '26 000', codePostal: '49230' },
+  { slug: 'le-grand-quevilly', name: 'Le Grand-Quevilly', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '26 000', codePostal: '76120' },
+  { slug: 'lormont', name: 'Lormont', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '26 000', codePostal: '33310' },
+  { slug: 'henin-beaumont', name: 'Hénin-Beaumont', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '26 000', codePostal: '62110' },
+  { slug: 'brunoy', name: 'Brunoy', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '26 000', codePostal: '91800' },
+  { slug: 'cavaillon', name: 'Cavaillon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '26 000', codePostal: '84300' },
+  {
+    slug: 'saint-ouen-l-aumone',
+    name: 'Saint-Ouen-l\'Aumône',
+    region: 'Île-de-France',
+    departement: 'Val-d\'Oise',
+    departementCode: '95',
+    population: '26 000',
+    codePostal: '95310',
+  },
+  { slug: 'sainte-suzanne', name: 'Sainte-Suzanne', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '26 000', codePostal: '97441' },
+  { slug: 'alencon', name: 'Alençon', region: 'Normandie', departement: 'Orne', departementCode: '61', population: '25 000', codePostal: '61000' },
+  { slug: 'saintes', name: 'Saintes', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '25 000', codePostal: '17100' },
+  { slug: 'le-mont-dore', name: 'Le Mont-Dore', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '25 000', codePostal: '98809' },
+  { slug: 'vernon', name: 'Vernon', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '25 000', codePostal: '27200' },
+  { slug: 'bethune', name: 'Béthune', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '25 000', codePostal: '62400' },
+  { slug: 'vichy', name: 'Vichy', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '25 000', codePostal: '03200' },
+  { slug: 'le-bouscat', name: 'Le Bouscat', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '25 000', codePostal: '33110' },
+  { slug: 'vierzon', name: 'Vierzon', region: 'Centre-Val de Loire', departement: 'Cher', departementCode: '18', population: '25 000', codePostal: '18100' },
+  { slug: 'libourne', name: 'Libourne', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '25 000', codePostal: '33500' },
+  { slug: 'eysines', name: 'Eysines', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '25 000', codePostal: '33320' },
+  { slug: 'kourou', name: 'Kourou', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '25 000', codePostal: '97310' },
+  { slug: 'montbeliard', name: 'Montbéliard', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '25 000', codePostal: '25200' },
+  { slug: 'petit-bourg', name: 'Petit-Bourg', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '25 000', codePostal: '97170' },
+  { slug: 'orly', name: 'Orly', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '25 000', codePostal: '94310' },
+  { slug: 'laon', name: 'Laon', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '24 000', codePostal: '02000' },
+  { slug: 'frontignan', name: 'Frontignan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '24 000', codePostal: '34110' },
+  { slug: 'le-kremlin-bicetre', name: 'Le Kremlin-Bicêtre', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '24 000', codePostal: '94270' },
+  { slug: 'coueron', name: 'Couëron', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '24 000', codePostal: '44220' },
+  {
+    slug: 'fontenay-aux-roses',
+    name: 'Fontenay-aux-Roses',
+    region: 'Île-de-France',
+    departement: 'Hauts-de-Seine',
+    departementCode: '92',
+    population: '24 000',
+    codePostal: '92260',
+  },
+  { slug: 'montgeron', name: 'Montgeron', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '24 000', codePostal: '91230' },
+  {
+    slug: 'beaupreau-en-mauges',
+    name: 'Beaupréau-en-Mauges',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '24 000',
+    codePostal: '49110',
+  },
+  { slug: 'rodez', name: 'Rodez', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '24 000', codePostal: '12000' },
+  { slug: 'sainte-anne', name: 'Sainte-Anne', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '24 000', codePostal: '97180' },
+  { slug: 'les-lilas', name: 'Les Lilas', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '24 000', codePostal: '93260' },
+  { slug: 'dole', name: 'Dole', region: 'Bourgogne-Franche-Comté', departement: 'Jura', departementCode: '39', population: '24 000', codePostal: '39100' },
+  {
+    slug: 'la-valette-du-var',
+    name: 'La Valette-du-Var',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '24 000',
+    codePostal: '83160',
+  },
+  { slug: 'dammarie-les-lys', name: 'Dammarie-les-Lys', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '24 000', codePostal: '77190' },
+  { slug: 'olivet', name: 'Olivet', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '24 000', codePostal: '45160' },
+  { slug: 'herouville-saint-clair', name: 'Hérouville-Saint-Clair', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '23 000', codePostal: '14200' },
+  { slug: 'rochefort', name: 'Rochefort', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '23 000', codePostal: '17300' },
+  { slug: 'combs-la-ville', name: 'Combs-la-Ville', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '23 000', codePostal: '77380' },
+  { slug: 'lanester', name: 'Lanester', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '23 000', codePostal: '56600' },
+  { slug: 'roissy-en-brie', name: 'Roissy-en-Brie', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '23 000', codePostal: '77680' },
+  {
+    slug: 'tassin-la-demi-lune',
+    name: 'Tassin-la-Demi-Lune',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '23 000',
+    codePostal: '69160',
+  },
+  {
+    slug: 'saint-jean-de-braye',
+    name: 'Saint-Jean-de-Braye',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '23 000',
+    codePostal: '45800',
+  },
+  { slug: 'deuil-la-barre', name: 'Deuil-la-Barre', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '23 000', codePostal: '95170' },
+  { slug: 'maisons-laffitte', name: 'Maisons-Laffitte', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '23 000', codePostal: '78600' },
+  { slug: 'le-moule', name: 'Le Moule', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '23 000', codePostal: '97160' },
+  { slug: 'velizy-villacoublay', name: 'Vélizy-Villacoublay', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '23 000', codePostal: '78140' },
+  { slug: 'challans', name: 'Challans', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '23 000', codePostal: '85300' },
+  { slug: 'saint-dizier', name: 'Saint-Dizier', region: 'Grand Est', departement: 'Haute-Marne', departementCode: '52', population: '23 000', codePostal: '52100' },
+  { slug: 'torcy', name: 'Torcy', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '23 000', codePostal: '77200' },
+  {
+    slug: 'manosque',
+    name: 'Manosque',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '23 000',
+    codePostal: '04100',
+  },
+  { slug: 'loos', name: 'Loos', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '23 000', codePostal: '59120' },
+  { slug: 'gif-sur-yvette', name: 'Gif-sur-Yvette', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '23 000', codePostal: '91190' },
+  {
+    slug: 'les-pennes-mirabeau',
+    name: 'Les Pennes-Mirabeau',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '23 000',
+    codePostal: '13170',
+  },
+  { slug: 'oyonnax', name: 'Oyonnax', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '22 000', codePostal: '01100' },
+  {
+    slug: 'montigny-les-cormeilles',
+    name: 'Montigny-lès-Cormeilles',
+    region: 'Île-de-France',
+    departement: 'Val-d\'Oise',
+    departementCode: '95',
+    population: '22 000',
+    codePostal: '95370',
+  },
+  { slug: 'auch', name: 'Auch', region: 'Occitanie', departement: 'Gers', departementCode: '32', population: '22 000', codePostal: '32000' },
+  { slug: 'abbeville', name: 'Abbeville', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '22 000', codePostal: '80100' },
+  {
+    slug: 'villeneuve-sur-lot',
+    name: 'Villeneuve-sur-Lot',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Lot-et-Garonne',
+    departementCode: '47',
+    population: '22 000',
+    codePostal: '47300',
+  },
+  { slug: 'mantes-la-ville', name: 'Mantes-la-Ville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '22 000', codePostal: '78711' },
+  { slug: 'sevres', name: 'Sèvres', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '22 000', codePostal: '92310' },
+  {
+    slug: 'montereau-fault-yonne',
+    name: 'Montereau-Fault-Yonne',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '22 000',
+    codePostal: '77130',
+  },
+  { slug: 'acheres', name: 'Achères', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '22 000', codePostal: '78260' },
+  { slug: 'le-petit-quevilly', name: 'Le Petit-Quevilly', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '22 000', codePostal: '76140' },
+  { slug: 'arcueil', name: 'Arcueil', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '22 000', codePostal: '94110' },
+  { slug: 'epernay', name: 'Épernay', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '22 000', codePostal: '51200' },
+  { slug: 'gujan-mestras', name: 'Gujan-Mestras', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '22 000', codePostal: '33470' },
+  { slug: 'dax', name: 'Dax', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '22 000', codePostal: '40100' },
+  { slug: 'millau', name: 'Millau', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '22 000', codePostal: '12100' },
+  { slug: 'fontaine', name: 'Fontaine', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '22 000', codePostal: '38600' },
+  {
+    slug: 'chemille-en-anjou',
+    name: 'Chemillé-en-Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '22 000',
+    codePostal: '49120',
+  },
+  { slug: 'longjumeau', name: 'Longjumeau', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '22 000', codePostal: '91160' },
+  {
+    slug: 'neuilly-plaisance',
+    name: 'Neuilly-Plaisance',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '22 000',
+    codePostal: '93360',
+  },
+  { slug: 'hazebrouck', name: 'Hazebrouck', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '22 000', codePostal: '59190' },
+  { slug: 'nogent-sur-oise', name: 'Nogent-sur-Oise', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '22 000', codePostal: '60180' },
+  { slug: 'voiron', name: 'Voiron', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '22 000', codePostal: '38500' },
+  { slug: 'fleury-les-aubrais', name: 'Fleury-les-Aubrais', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '22 000', codePostal: '45400' },
+  { slug: 'la-madeleine', name: 'La Madeleine', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '22 000', codePostal: '59110' },
+  {
+    slug: 'saint-michel-sur-orge',
+    name: 'Saint-Michel-sur-Orge',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '22 000',
+    codePostal: '91240',
+  },
+  { slug: 'montmorency', name: 'Montmorency', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '22 000', codePostal: '95160' },
+  { slug: 'montigny-les-metz', name: 'Montigny-lès-Metz', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '22 000', codePostal: '57950' },
+  {
+    slug: 'sainte-foy-les-lyon',
+    name: 'Sainte-Foy-lès-Lyon',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '22 000',
+    codePostal: '69110',
+  },
+  { slug: 'morsang-sur-orge', name: 'Morsang-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '22 000', codePostal: '91390' },
+  {
+    slug: 'mandelieu-la-napoule',
+    name: 'Mandelieu-la-Napoule',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '22 000',
+    codePostal: '06210',
+  },
+  { slug: 'gardanne', name: 'Gardanne', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '22 000', codePostal: '13120' },
+  { slug: 'le-robert', name: 'Le Robert', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '22 000', codePostal: '97231' },
+  { slug: 'lagny-sur-marne', name: 'Lagny-sur-Marne', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '21 000', codePostal: '77400' },
+  { slug: 'allauch', name: 'Allauch', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '21 000', codePostal: '13190' },
+  {
+    slug: 'bruay-la-buissiere',
+    name: 'Bruay-la-Buissière',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '21 000',
+    codePostal: '62700',
+  },
+  { slug: 'givors', name: 'Givors', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '21 000', codePostal: '69700' },
+  { slug: 'saint-gratien', name: 'Saint-Gratien', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '21 000', codePostal: '95210' },
+  { slug: 'saint-cyr-l-ecole', name: 'Saint-Cyr-l\'École', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '21 000', codePostal: '78210' },
+  { slug: 'ozoir-la-ferriere', name: 'Ozoir-la-Ferrière', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '21 000', codePostal: '77330' },
+  { slug: 'saint-genis-laval', name: 'Saint-Genis-Laval', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '21 000', codePostal: '69230' },
+  { slug: 'montaigu-vendee', name: 'Montaigu-Vendée', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '21 000', codePostal: '85600' },
+  { slug: 'le-plessis-trevise', name: 'Le Plessis-Trévise', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '21 000', codePostal: '94420' },
+  { slug: 'mons-en-bar-ul', name: 'Mons-en-Barœul', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59370' },
+  { slug: 'plaisance-du-touch', name: 'Plaisance-du-Touch', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '21 000', codePostal: '31830' },
+  { slug: 'saint-mande', name: 'Saint-Mandé', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '21 000', codePostal: '94160' },
+  { slug: 'bourg-la-reine', name: 'Bourg-la-Reine', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '21 000', codePostal: '92340' },
+  { slug: 'villeneuve-le-roi', name: 'Villeneuve-le-Roi', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '21 000', codePostal: '94290' },
+  { slug: 'carquefou', name: 'Carquefou', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '21 000', codePostal: '44470' },
+  { slug: 'sceaux', name: 'Sceaux', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '21 000', codePostal: '92330' },
+  { slug: 'concarneau', name: 'Concarneau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '21 000', codePostal: '29900' },
+  { slug: 'chaumont', name: 'Chaumont', region: 'Grand Est', departement: 'Haute-Marne', departementCode: '52', population: '21 000', codePostal: '52000' },
+  { slug: 'lingolsheim', name: 'Lingolsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '21 000', codePostal: '67380' },
+  {
+    slug: 'carrieres-sous-poissy',
+    name: 'Carrières-sous-Poissy',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '21 000',
+    codePostal: '78955',
+  },
+  { slug: 'coudekerque-branche', name: 'Coudekerque-Branche', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59210' },
+  { slug: 'wasquehal', name: 'Wasquehal', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59290' },
+  { slug: 'halluin', name: 'Halluin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59250' },
+  {
+    slug: 'la-chapelle-sur-erdre',
+    name: 'La Chapelle-sur-Erdre',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '21 000',
+    codePostal: '44240',
+  },
+  { slug: 'denain', name: 'Denain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59220' },
+  { slug: 'cugnaux', name: 'Cugnaux', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '21 000', codePostal: '31270' },
+  { slug: 'maurepas', name: 'Maurepas', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '21 000', codePostal: '78310' },
+  { slug: 'chaville', name: 'Chaville', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '21 000', codePostal: '92370' },
+  { slug: 'croix', name: 'Croix', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '21 000', codePostal: '59170' },
+  { slug: 'bouguenais', name: 'Bouguenais', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '21 000', codePostal: '44340' },
+  { slug: 'joinville-le-pont', name: 'Joinville-le-Pont', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '21 000', codePostal: '94340' },
+  { slug: 'le-creusot', name: 'Le Creusot', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '21 000', codePostal: '71200' },
+  { slug: 'forbach', name: 'Forbach', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '20 000', codePostal: '57600' },
+  { slug: 'la-celle-saint-cloud', name: 'La Celle-Saint-Cloud', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '20 000', codePostal: '78170' },
+  { slug: 'mitry-mory', name: 'Mitry-Mory', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '20 000', codePostal: '77290' },
+  { slug: 'chilly-mazarin', name: 'Chilly-Mazarin', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '20 000', codePostal: '91380' },
+  { slug: 'beaune', name: 'Beaune', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '20 000', codePostal: '21200' },
+  { slug: 'lannion', name: 'Lannion', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '20 000', codePostal: '22300' },
+  { slug: 'fougeres', name: 'Fougères', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '20 000', codePostal: '35300' },
+  {
+    slug: 'l-isle-sur-la-sorgue',
+    name: 'L\'Isle-sur-la-Sorgue',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '20 000',
+    codePostal: '84800',
+  },
+  { slug: 'grande-synthe', name: 'Grande-Synthe', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '20 000', codePostal: '59760' },
+  { slug: 'mont-saint-aignan', name: 'Mont-Saint-Aignan', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '20 000', codePostal: '76130' },
+  { slug: 'sarreguemines', name: 'Sarreguemines', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '20 000', codePostal: '57200' },
+  { slug: 'cahors', name: 'Cahors', region: 'Occitanie', departement: 'Lot', departementCode: '46', population: '20 000', codePostal: '46000' },
+  { slug: 'bruges', name: 'Bruges', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '20 000', codePostal: '33520' },
+  { slug: 'bourg-les-valence', name: 'Bourg-lès-Valence', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '20 000', codePostal: '26500' },
+  { slug: 'albertville', name: 'Albertville', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '20 000', codePostal: '73200' },
+  { slug: 'bressuire', name: 'Bressuire', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '20 000', codePostal: '79300' },
+  { slug: 'gentilly', name: 'Gentilly', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '20 000', codePostal: '94250' },
+  {
+    slug: 'cournon-d-auvergne',
+    name: 'Cournon-d\'Auvergne',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Puy-de-Dôme',
+    departementCode: '63',
+    population: '20 000',
+    codePostal: '63800',
+  },
+  { slug: 'vence', name: 'Vence', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '20 000', codePostal: '06140' },
+  { slug: 'macouria', name: 'Macouria', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '20 000', codePostal: '97355' },
+  { slug: 'chevilly-larue', name: 'Chevilly-Larue', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '20 000', codePostal: '94550' },
+  { slug: 'ronchin', name: 'Ronchin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '20 000', codePostal: '59790' },
+  { slug: 'mougins', name: 'Mougins', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '20 000', codePostal: '06250' },
+  { slug: 'bruz', name: 'Bruz', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '20 000', codePostal: '35170' },
+  { slug: 'lisieux', name: 'Lisieux', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '20 000', codePostal: '14100' },
+  { slug: 'selestat', name: 'Sélestat', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '20 000', codePostal: '67600' },
+  { slug: 'la-crau', name: 'La Crau', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '20 000', codePostal: '83260' },
+  { slug: 'pertuis', name: 'Pertuis', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '20 000', codePostal: '84120' },
+  { slug: 'le-mee-sur-seine', name: 'Le Mée-sur-Seine', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '20 000', codePostal: '77350' },
+  { slug: 'sch-lcher', name: 'Schœlcher', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '19 000', codePostal: '97233' },
+  { slug: 'saint-lo', name: 'Saint-Lô', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '19 000', codePostal: '50000' },
+  { slug: 'villefontaine', name: 'Villefontaine', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '19 000', codePostal: '38090' },
+  { slug: 'royan', name: 'Royan', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '19 000', codePostal: '17200' },
+  { slug: 'vitre', name: 'Vitré', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '19 000', codePostal: '35500' },
+  { slug: 'juvisy-sur-orge', name: 'Juvisy-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '19 000', codePostal: '91260' },
+  { slug: 'saint-fons', name: 'Saint-Fons', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '19 000', codePostal: '69190' },
+  { slug: 'saint-die-des-vosges', name: 'Saint-Dié-des-Vosges', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '19 000', codePostal: '88100' },
+  { slug: 'moulins', name: 'Moulins', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '19 000', codePostal: '03000' },
+  { slug: 'sorgues', name: 'Sorgues', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '19 000', codePostal: '84700' },
+  { slug: 'brie-comte-robert', name: 'Brie-Comte-Robert', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '19 000', codePostal: '77170' },
+  { slug: 'ploemeur', name: 'Ploemeur', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '19 000', codePostal: '56270' },
+  { slug: 'riom', name: 'Riom', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '19 000', codePostal: '63200' },
+  { slug: 'meylan', name: 'Meylan', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '19 000', codePostal: '38240' },
+  { slug: 'cesson-sevigne', name: 'Cesson-Sévigné', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '19 000', codePostal: '35510' },
+  { slug: 'pornic', name: 'Pornic', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '19 000', codePostal: '44210' },
+  {
+    slug: 'chennevieres-sur-marne',
+    name: 'Chennevières-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Val-de-Marne',
+    departementCode: '94',
+    population: '19 000',
+    codePostal: '94430',
+  },
+  { slug: 'louviers', name: 'Louviers', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '19 000', codePostal: '27400' },
+  {
+    slug: 'mauges-sur-loire',
+    name: 'Mauges-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '19 000',
+    codePostal: '49110',
+  },
+  { slug: 'lamentin', name: 'Lamentin', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '19 000', codePostal: '97129' },
+  { slug: 'faches-thumesnil', name: 'Faches-Thumesnil', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '19 000', codePostal: '59155' },
+  { slug: 'hem', name: 'Hem', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '19 000', codePostal: '59510' },
+  { slug: 'bischheim', name: 'Bischheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '19 000', codePostal: '67800' },
+  { slug: 'le-puy-en-velay', name: 'Le Puy-en-Velay', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Loire', departementCode: '43', population: '19 000', codePostal: '43000' },
+  { slug: 'sanary-sur-mer', name: 'Sanary-sur-Mer', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '19 000', codePostal: '83110' },
+  { slug: 'cognac', name: 'Cognac', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '19 000', codePostal: '16100' },
+  { slug: 'moissy-cramayel', name: 'Moissy-Cramayel', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '19 000', codePostal: '77550' },
+  { slug: 'bry-sur-marne', name: 'Bry-sur-Marne', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '19 000', codePostal: '94360' },
+  {
+    slug: 'chateauneuf-les-martigues',
+    name: 'Châteauneuf-les-Martigues',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '18 000',
+    codePostal: '13220',
+  },
+  { slug: 'eragny', name: 'Éragny', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '18 000', codePostal: '95610' },
+  { slug: 'le-pontet', name: 'Le Pontet', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '18 000', codePostal: '84130' },
+  {
+    slug: 'romorantin-lanthenay',
+    name: 'Romorantin-Lanthenay',
+    region: 'Centre-Val de Loire',
+    departement: 'Loir-et-Cher',
+    departementCode: '41',
+    population: '18 000',
+    codePostal: '41200',
+  },
+  { slug: 'floirac', name: 'Floirac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '18 000', codePostal: '33270' },
+  { slug: 'bonneuil-sur-marne', name: 'Bonneuil-sur-Marne', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '18 000', codePostal: '94380' },
+  { slug: 'luneville', name: 'Lunéville', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '18 000', codePostal: '54300' },
+  {
+    slug: 'moorea-maiao',
+    name: 'Moorea-Maiao',
+    region: 'Polynésie française',
+    departement: 'Polynésie française',
+    departementCode: '987',
+    population: '18 000',
+    codePostal: '98728',
+  },
+  { slug: 'bagnols-sur-ceze', name: 'Bagnols-sur-Cèze', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '18 000', codePostal: '30200' },
+  { slug: 'ducos', name: 'Ducos', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '18 000', codePostal: '97224' },
+  { slug: 'hendaye', name: 'Hendaye', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '18 000', codePostal: '64700' },
+  { slug: 'pontarlier', name: 'Pontarlier', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '18 000', codePostal: '25300' },
+  {
+    slug: 'soisy-sous-montmorency',
+    name: 'Soisy-sous-Montmorency',
+    region: 'Île-de-France',
+    departement: 'Val-d\'Oise',
+    departementCode: '95',
+    population: '18 000',
+    codePostal: '95230',
+  },
+  { slug: 'saint-egreve', name: 'Saint-Égrève', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '18 000', codePostal: '38120' },
+  {
+    slug: 'digne-les-bains',
+    name: 'Digne-les-Bains',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '18 000',
+    codePostal: '04000',
+  },
+  { slug: 'osny', name: 'Osny', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '18 000', codePostal: '95520' },
+  { slug: 'ecully', name: 'Écully', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '18 000', codePostal: '69130' },
+  { slug: 'carvin', name: 'Carvin', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '18 000', codePostal: '62220' },
+  {
+    slug: 'saint-maximin-la-sainte-baume',
+    name: 'Saint-Maximin-la-Sainte-Baume',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '18 000',
+    codePostal: '83470',
+  },
+  { slug: 'limay', name: 'Limay', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '18 000', codePostal: '78520' },
+  { slug: 'jouy-le-moutier', name: 'Jouy-le-Moutier', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '18 000', codePostal: '95280' },
+  { slug: 'brignoles', name: 'Brignoles', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '18 000', codePostal: '83170' },
+  { slug: 'dzaoudzi', name: 'Dzaoudzi', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '18 000', codePostal: '97615' },
+  { slug: 'cluses', name: 'Cluses', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '18 000', codePostal: '74300' },
+  { slug: 'balma', name: 'Balma', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '18 000', codePostal: '31130' },
+  { slug: 'garches', name: 'Garches', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '18 000', codePostal: '92380' },
+  { slug: 'sainte-rose', name: 'Sainte-Rose', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '18 000', codePostal: '97115' },
+  { slug: 'capesterre-belle-eau', name: 'Capesterre-Belle-Eau', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '18 000', codePostal: '97130' },
+  {
+    slug: 'segre-en-anjou-bleu',
+    name: 'Segré-en-Anjou Bleu',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '18 000',
+    codePostal: '49500',
+  },
+  { slug: 'ambares-et-lagrave', name: 'Ambarès-et-Lagrave', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '18 000', codePostal: '33440' },
+  {
+    slug: 'villeneuve-loubet',
+    name: 'Villeneuve-Loubet',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '18 000',
+    codePostal: '06270',
+  },
+  { slug: 'l-isle-d-abeau', name: 'L\'Isle-d\'Abeau', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '18 000', codePostal: '38080' },
+  { slug: 'chamalieres', name: 'Chamalières', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '18 000', codePostal: '63400' },
+  { slug: 'vire-normandie', name: 'Vire Normandie', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '17 000', codePostal: '14500' },
+  { slug: 'avion', name: 'Avion', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '17 000', codePostal: '62210' },
+  { slug: 'yutz', name: 'Yutz', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '17 000', codePostal: '57970' },
+  { slug: 'lattes', name: 'Lattes', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '17 000', codePostal: '34970' },
+  { slug: 'marmande', name: 'Marmande', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '17 000', codePostal: '47200' },
+  { slug: 'boissy-saint-leger', name: 'Boissy-Saint-Léger', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '17 000', codePostal: '94470' },
+  { slug: 'sallanches', name: 'Sallanches', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '17 000', codePostal: '74700' },
+  { slug: 'saran', name: 'Saran', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '17 000', codePostal: '45770' },
+  { slug: 'fecamp', name: 'Fécamp', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '17 000', codePostal: '76400' },
+  { slug: 'annonay', name: 'Annonay', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '17 000', codePostal: '07100' },
+  { slug: 'lamballe-armor', name: 'Lamballe-Armor', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '17 000', codePostal: '22400' },
+  { slug: 'viroflay', name: 'Viroflay', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '17 000', codePostal: '78220' },
+  { slug: 'blanquefort', name: 'Blanquefort', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '17 000', codePostal: '33290' },
+  { slug: 'oree-d-anjou', name: 'Orée d\'Anjou', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '17 000', codePostal: '49530' },
+  {
+    slug: 'montceau-les-mines',
+    name: 'Montceau-les-Mines',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '17 000',
+    codePostal: '71300',
+  },
+  { slug: 'firminy', name: 'Firminy', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '17 000', codePostal: '42700' },
+  {
+    slug: 'saint-cyr-sur-loire',
+    name: 'Saint-Cyr-sur-Loire',
+    region: 'Centre-Val de Loire',
+    departement: 'Indre-et-Loire',
+    departementCode: '37',
+    population: '17 000',
+    codePostal: '37540',
+  },
+  {
+    slug: 'le-pre-saint-gervais',
+    name: 'Le Pré-Saint-Gervais',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '17 000',
+    codePostal: '93310',
+  },
+  {
+    slug: 'la-baule-escoublac',
+    name: 'La Baule-Escoublac',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '17 000',
+    codePostal: '44500',
+  },
+  { slug: 'verdun', name: 'Verdun', region: 'Grand Est', departement: 'Meuse', departementCode: '55', population: '17 000', codePostal: '55100' },
+  { slug: 'guerande', name: 'Guérande', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '17 000', codePostal: '44350' },
+  { slug: 'les-clayes-sous-bois', name: 'Les Clayes-sous-Bois', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '17 000', codePostal: '78340' },
+  {
+    slug: 'saint-jean-de-la-ruelle',
+    name: 'Saint-Jean-de-la-Ruelle',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '17 000',
+    codePostal: '45140',
+  },
+  { slug: 'loire-authion', name: 'Loire-Authion', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '17 000', codePostal: '49140' },
+  { slug: 'marly-le-roi', name: 'Marly-le-Roi', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '17 000', codePostal: '78160' },
+  { slug: 'valserhone', name: 'Valserhône', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '17 000', codePostal: '01200' },
+  { slug: 'sedan', name: 'Sedan', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '17 000', codePostal: '08200' },
+  { slug: 'cestas', name: 'Cestas', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '17 000', codePostal: '33610' },
+  { slug: 'lons-le-saunier', name: 'Lons-le-Saunier', region: 'Bourgogne-Franche-Comté', departement: 'Jura', departementCode: '39', population: '17 000', codePostal: '39000' },
+  { slug: 'bois-d-arcy', name: 'Bois-d\'Arcy', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '17 000', codePostal: '78390' },
+  {
+    slug: 'chateau-gontier-sur-mayenne',
+    name: 'Château-Gontier-sur-Mayenne',
+    region: 'Pays de la Loire',
+    departement: 'Mayenne',
+    departementCode: '53',
+    population: '17 000',
+    codePostal: '53200',
+  },
+  {
+    slug: 'chateaurenard',
+    name: 'Châteaurenard',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '17 000',
+    codePostal: '13160',
+  },
+  { slug: 'mauguio', name: 'Mauguio', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '17 000', codePostal: '34130' },
+  { slug: 'les-herbiers', name: 'Les Herbiers', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '17 000', codePostal: '85500' },
+  { slug: 'orsay', name: 'Orsay', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '16 000', codePostal: '91400' },
+  { slug: 'pamiers', name: 'Pamiers', region: 'Occitanie', departement: 'Ariège', departementCode: '09', population: '16 000', codePostal: '09100' },
+  { slug: 'rumilly', name: 'Rumilly', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '16 000', codePostal: '74150' },
+  { slug: 'mennecy', name: 'Mennecy', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '16 000', codePostal: '91540' },
+  {
+    slug: 'sainte-luce-sur-loire',
+    name: 'Sainte-Luce-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '16 000',
+    codePostal: '44980',
+  },
+  { slug: 'coulommiers', name: 'Coulommiers', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '16 000', codePostal: '77120' },
+  { slug: 'landerneau', name: 'Landerneau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '16 000', codePostal: '29800' },
+  { slug: 'trelaze', name: 'Trélazé', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '16 000', codePostal: '49800' },
+  { slug: 'verneuil-sur-seine', name: 'Verneuil-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '16 000', codePostal: '78480' },
+  { slug: 'morne-a-l-eau', name: 'Morne-à-l\'Eau', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '16 000', codePostal: '97111' },
+  {
+    slug: 'saint-julien-en-genevois',
+    name: 'Saint-Julien-en-Genevois',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '16 000',
+    codePostal: '74160',
+  },
+  { slug: 'gaillac', name: 'Gaillac', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '16 000', codePostal: '81600' },
+  { slug: 'saint-leu-la-foret', name: 'Saint-Leu-la-Forêt', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '16 000', codePostal: '95320' },
+  { slug: 'montbrison', name: 'Montbrison', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '16 000', codePostal: '42600' },
+  { slug: 'vaureal', name: 'Vauréal', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '16 000', codePostal: '95490' },
+  { slug: 'sin-le-noble', name: 'Sin-le-Noble', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '16 000', codePostal: '59450' },
+  { slug: 'domont', name: 'Domont', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '16 000', codePostal: '95330' },
+  { slug: 'le-pecq', name: 'Le Pecq', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '16 000', codePostal: '78230' },
+  { slug: 'noisiel', name: 'Noisiel', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '16 000', codePostal: '77186' },
+  { slug: 'saint-amand-les-eaux', name: 'Saint-Amand-les-Eaux', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '16 000', codePostal: '59230' },
+  { slug: 'amberieu-en-bugey', name: 'Ambérieu-en-Bugey', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '16 000', codePostal: '01500' },
+  { slug: 'le-bourget', name: 'Le Bourget', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '16 000', codePostal: '93350' },
+  { slug: 'luce', name: 'Lucé', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '16 000', codePostal: '28110' },
+  { slug: 'hennebont', name: 'Hennebont', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '16 000', codePostal: '56700' },
+  {
+    slug: 'saint-pierre-des-corps',
+    name: 'Saint-Pierre-des-Corps',
+    region: 'Centre-Val de Loire',
+    departement: 'Indre-et-Loire',
+    departementCode: '37',
+    population: '16 000',
+    codePostal: '37700',
+  },
+  {
+    slug: 'fos-sur-mer',
+    name: 'Fos-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '16 000',
+    codePostal: '13270',
+  },
+  { slug: 'dembeni', name: 'Dembeni', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '16 000', codePostal: '97660' },
+  { slug: 'biscarrosse', name: 'Biscarrosse', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '16 000', codePostal: '40600' },
+  { slug: 'hayange', name: 'Hayange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '16 000', codePostal: '57700' },
+  {
+    slug: 'port-de-bouc',
+    name: 'Port-de-Bouc',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '16 000',
+    codePostal: '13110',
+  },
+  { slug: 'le-francois', name: 'Le François', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '16 000', codePostal: '97240' },
+  { slug: 'toul', name: 'Toul', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '16 000', codePostal: '54200' },
+  {
+    slug: 'saint-just-saint-rambert',
+    name: 'Saint-Just-Saint-Rambert',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '16 000',
+    codePostal: '42170',
+  },
+  { slug: 'vendome', name: 'Vendôme', region: 'Centre-Val de Loire', departement: 'Loir-et-Cher', departementCode: '41', population: '16 000', codePostal: '41100' },
+  {
+    slug: 'montrevault-sur-evre',
+    name: 'Montrevault-sur-Èvre',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '16 000',
+    codePostal: '49110',
+  },
+  {
+    slug: 'saint-fargeau-ponthierry',
+    name: 'Saint-Fargeau-Ponthierry',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '16 000',
+    codePostal: '77310',
+  },
+  { slug: 'beaucaire', name: 'Beaucaire', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '16 000', codePostal: '30300' },
+  { slug: 'montevrain', name: 'Montévrain', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '16 000', codePostal: '77144' },
+  { slug: 'longwy', name: 'Longwy', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '16 000', codePostal: '54400' },
+  { slug: 'francheville', name: 'Francheville', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '16 000', codePostal: '69340' },
+  { slug: 'fontainebleau', name: 'Fontainebleau', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '16 000', codePostal: '77300' },
+  { slug: 'le-vesinet', name: 'Le Vésinet', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '16 000', codePostal: '78110' },
+  { slug: 'wittenheim', name: 'Wittenheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '16 000', codePostal: '68270' },
+  { slug: 'guipavas', name: 'Guipavas', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '16 000', codePostal: '29490' },
+  { slug: 'wattignies', name: 'Wattignies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '16 000', codePostal: '59139' },
+  { slug: 'montivilliers', name: 'Montivilliers', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '15 000', codePostal: '76290' },
+  { slug: 'elbeuf', name: 'Elbeuf', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '15 000', codePostal: '76500' },
+  {
+    slug: 'roquebrune-sur-argens',
+    name: 'Roquebrune-sur-Argens',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '15 000',
+    codePostal: '83380',
+  },
+  { slug: 'tarascon', name: 'Tarascon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '15 000', codePostal: '13150' },
+  {
+    slug: 'bouc-bel-air',
+    name: 'Bouc-Bel-Air',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '15 000',
+    codePostal: '13320',
+  },
+  { slug: 'castanet-tolosan', name: 'Castanet-Tolosan', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '15 000', codePostal: '31320' },
+  { slug: 'avrille', name: 'Avrillé', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '15 000', codePostal: '49240' },
+  { slug: 'rive-de-gier', name: 'Rive-de-Gier', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '15 000', codePostal: '42800' },
+  { slug: 'morlaix', name: 'Morlaix', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '15 000', codePostal: '29600' },
+  {
+    slug: 'ramonville-saint-agne',
+    name: 'Ramonville-Saint-Agne',
+    region: 'Occitanie',
+    departement: 'Haute-Garonne',
+    departementCode: '31',
+    population: '15 000',
+    codePostal: '31520',
+  },
+  { slug: 'senlis', name: 'Senlis', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '15 000', codePostal: '60300' },
+  { slug: 'issoire', name: 'Issoire', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '15 000', codePostal: '63500' },
+  { slug: 'montmagny', name: 'Montmagny', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '15 000', codePostal: '95360' },
+  { slug: 'chateau-thierry', name: 'Château-Thierry', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '15 000', codePostal: '02400' },
+  { slug: 'vesoul', name: 'Vesoul', region: 'Bourgogne-Franche-Comté', departement: 'Haute-Saône', departementCode: '70', population: '15 000', codePostal: '70000' },
+  { slug: 'haubourdin', name: 'Haubourdin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '15 000', codePostal: '59320' },
+  { slug: 'lognes', name: 'Lognes', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '15 000', codePostal: '77185' },
+  {
+    slug: 'saint-brice-sous-foret',
+    name: 'Saint-Brice-sous-Forêt',
+    region: 'Île-de-France',
+    departement: 'Val-d\'Oise',
+    departementCode: '95',
+    population: '15 000',
+    codePostal: '95350',
+  },
+  { slug: 'verrieres-le-buisson', name: 'Verrières-le-Buisson', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '15 000', codePostal: '91370' },
+  { slug: 'pointe-a-pitre', name: 'Pointe-à-Pitre', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '15 000', codePostal: '97110' },
+  { slug: 'arnouville', name: 'Arnouville', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '15 000', codePostal: '95400' },
+  { slug: 'saint-avertin', name: 'Saint-Avertin', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '15 000', codePostal: '37550' },
+  { slug: 'woippy', name: 'Woippy', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '15 000', codePostal: '57140' },
+  { slug: 'romilly-sur-seine', name: 'Romilly-sur-Seine', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '15 000', codePostal: '10100' },
+  { slug: 'la-fleche', name: 'La Flèche', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '15 000', codePostal: '72200' },
+  { slug: 'illzach', name: 'Illzach', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '15 000', codePostal: '68110' },
+  {
+    slug: 'saint-jean-de-luz',
+    name: 'Saint-Jean-de-Luz',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Pyrénées-Atlantiques',
+    departementCode: '64',
+    population: '15 000',
+    codePostal: '64500',
+  },
+  { slug: 'montargis', name: 'Montargis', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '15 000', codePostal: '45200' },
+  { slug: 'carrieres-sur-seine', name: 'Carrières-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '15 000', codePostal: '78420' },
+  { slug: 'fameck', name: 'Fameck', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '15 000', codePostal: '57290' },
+  { slug: 'laxou', name: 'Laxou', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '15 000', codePostal: '54520' },
+  { slug: 'dinan', name: 'Dinan', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '15 000', codePostal: '22100' },
+  { slug: 'saint-avold', name: 'Saint-Avold', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '15 000', codePostal: '57500' },
+  { slug: 'le-raincy', name: 'Le Raincy', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '15 000', codePostal: '93340' },
+  { slug: 'saint-gilles', name: 'Saint-Gilles', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '15 000', codePostal: '30800' },
+  { slug: 'bailleul', name: 'Bailleul', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '15 000', codePostal: '59270' },
+  { slug: 'villers-les-nancy', name: 'Villers-lès-Nancy', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '15 000', codePostal: '54600' },
+  {
+    slug: 'saint-orens-de-gameville',
+    name: 'Saint-Orens-de-Gameville',
+    region: 'Occitanie',
+    departement: 'Haute-Garonne',
+    departementCode: '31',
+    population: '15 000',
+    codePostal: '31650',
+  },
+  { slug: 'pontivy', name: 'Pontivy', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '15 000', codePostal: '56300' },
+  { slug: 'mahina', name: 'Mahina', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '15 000', codePostal: '98709' },
+  { slug: 'bar-le-duc', name: 'Bar-le-Duc', region: 'Grand Est', departement: 'Meuse', departementCode: '55', population: '15 000', codePostal: '55000' },
+  { slug: 'ollioules', name: 'Ollioules', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '15 000', codePostal: '83190' },
+  { slug: 'montesson', name: 'Montesson', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '15 000', codePostal: '78360' },
+  {
+    slug: 'saint-brevin-les-pins',
+    name: 'Saint-Brevin-les-Pins',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '15 000',
+    codePostal: '44250',
+  },
+  { slug: 'bois-guillaume', name: 'Bois-Guillaume', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '15 000', codePostal: '76230' },
+  { slug: 'saint-maurice', name: 'Saint-Maurice', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '15 000', codePostal: '94410' },
+  { slug: 'saint-paul-les-dax', name: 'Saint-Paul-lès-Dax', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '14 000', codePostal: '40990' },
+  { slug: 'l-etang-sale', name: 'L\'Étang-Salé', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '14 000', codePostal: '97427' },
+  { slug: 'saint-genis-pouilly', name: 'Saint-Genis-Pouilly', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '14 000', codePostal: '01630' },
+  { slug: 'flers', name: 'Flers', region: 'Normandie', departement: 'Orne', departementCode: '61', population: '14 000', codePostal: '61100' },
+  { slug: 'plerin', name: 'Plérin', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '14 000', codePostal: '22190' },
+  { slug: 'valenton', name: 'Valenton', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '14 000', codePostal: '94460' },
+  { slug: 'canteleu', name: 'Canteleu', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '14 000', codePostal: '76380' },
+  { slug: 'billere', name: 'Billère', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '14 000', codePostal: '64140' },
+  { slug: 'saint-omer', name: 'Saint-Omer', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '14 000', codePostal: '62500' },
+  { slug: 'rixheim', name: 'Rixheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '14 000', codePostal: '68170' },
+  { slug: 'persan', name: 'Persan', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '14 000', codePostal: '95340' },
+  { slug: 'crepy-en-valois', name: 'Crépy-en-Valois', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '14 000', codePostal: '60800' },
+  { slug: 'castelsarrasin', name: 'Castelsarrasin', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '14 000', codePostal: '82100' },
+  { slug: 'montataire', name: 'Montataire', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '14 000', codePostal: '60160' },
+  { slug: 'chenove', name: 'Chenôve', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '14 000', codePostal: '21300' },
+  { slug: 'auray', name: 'Auray', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '14 000', codePostal: '56400' },
+  { slug: 'pont-a-mousson', name: 'Pont-à-Mousson', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '14 000', codePostal: '54700' },
+  { slug: 'hautmont', name: 'Hautmont', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '14 000', codePostal: '59330' },
+  {
+    slug: 'saint-martin-de-crau',
+    name: 'Saint-Martin-de-Crau',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '14 000',
+    codePostal: '13310',
+  },
+  { slug: 'morangis', name: 'Morangis', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '14 000', codePostal: '91420' },
+  { slug: 'sainte-maxime', name: 'Sainte-Maxime', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '14 000', codePostal: '83120' },
+  { slug: 'roncq', name: 'Roncq', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '14 000', codePostal: '59223' },
+  { slug: 'audincourt', name: 'Audincourt', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '14 000', codePostal: '25400' },
+  { slug: 'douarnenez', name: 'Douarnenez', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '14 000', codePostal: '29100' },
+  { slug: 'pirae', name: 'Pirae', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '14 000', codePostal: '98716' },
+  { slug: 'fontenay-le-comte', name: 'Fontenay-le-Comte', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '14 000', codePostal: '85200' },
+  { slug: 'juvignac', name: 'Juvignac', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '14 000', codePostal: '34990' },
+  { slug: 'lys-lez-lannoy', name: 'Lys-lez-Lannoy', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '14 000', codePostal: '59390' },
+  { slug: 'bollene', name: 'Bollène', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '14 000', codePostal: '84500' },
+  { slug: 'lieusaint', name: 'Lieusaint', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '14 000', codePostal: '77127' },
+  {
+    slug: 'belleville-en-beaujolais',
+    name: 'Belleville-en-Beaujolais',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '14 000',
+    codePostal: '69220',
+  },
+  { slug: 'bandraboua', name: 'Bandraboua', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '14 000', codePostal: '97650' },
+  { slug: 'ostwald', name: 'Ostwald', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '14 000', codePostal: '67540' },
+  { slug: 'saint-francois', name: 'Saint-François', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '14 000', codePostal: '97118' },
+  { slug: 'tsingoni', name: 'Tsingoni', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '14 000', codePostal: '97680' },
+  { slug: 'vaires-sur-marne', name: 'Vaires-sur-Marne', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '14 000', codePostal: '77360' },
+  { slug: 'meru', name: 'Méru', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '14 000', codePostal: '60110' },
+  { slug: 'thouars', name: 'Thouars', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '14 000', codePostal: '79100' },
+  { slug: 'mions', name: 'Mions', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '14 000', codePostal: '69780' },
+  { slug: 'andresy', name: 'Andrésy', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '14 000', codePostal: '78570' },
+  { slug: 'caudry', name: 'Caudry', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '14 000', codePostal: '59540' },
+  {
+    slug: 'berre-l-etang',
+    name: 'Berre-l\'Étang',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '14 000',
+    codePostal: '13130',
+  },
+  { slug: 'carros', name: 'Carros', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '14 000', codePostal: '06510' },
+  {
+    slug: 'saint-jacques-de-la-lande',
+    name: 'Saint-Jacques-de-la-Lande',
+    region: 'Bretagne',
+    departement: 'Ille-et-Vilaine',
+    departementCode: '35',
+    population: '14 000',
+    codePostal: '35136',
+  },
+  { slug: 'pierrelatte', name: 'Pierrelatte', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '14 000', codePostal: '26700' },
+  { slug: 'fleury-merogis', name: 'Fleury-Mérogis', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '14 000', codePostal: '91700' },
+  { slug: 'fontenay-le-fleury', name: 'Fontenay-le-Fleury', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '14 000', codePostal: '78330' },
+  { slug: 'avon', name: 'Avon', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '14 000', codePostal: '77210' },
+  { slug: 'gex', name: 'Gex', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '14 000', codePostal: '01170' },
+  { slug: 'lons', name: 'Lons', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '14 000', codePostal: '64140' },
+  {
+    slug: 'taiarapu-est',
+    name: 'Taiarapu-Est',
+    region: 'Polynésie française',
+    departement: 'Polynésie française',
+    departementCode: '987',
+    population: '14 000',
+    codePostal: '98719',
+  },
+  { slug: 'amilly', name: 'Amilly', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '14 000', codePostal: '45200' },
+  { slug: 'plouzane', name: 'Plouzané', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '14 000', codePostal: '29280' },
+  { slug: 'argentan', name: 'Argentan', region: 'Normandie', departement: 'Orne', departementCode: '61', population: '14 000', codePostal: '61200' },
+  { slug: 'gien', name: 'Gien', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '13 000', codePostal: '45500' },
+  { slug: 'plougastel-daoulas', name: 'Plougastel-Daoulas', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '13 000', codePostal: '29470' },
+  { slug: 'genas', name: 'Genas', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '13 000', codePostal: '69740' },
+  { slug: 'moissac', name: 'Moissac', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '13 000', codePostal: '82200' },
+  { slug: 'tulle', name: 'Tulle', region: 'Nouvelle-Aquitaine', departement: 'Corrèze', departementCode: '19', population: '13 000', codePostal: '19000' },
+  { slug: 'mouvaux', name: 'Mouvaux', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59420' },
+  { slug: 'kingersheim', name: 'Kingersheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '13 000', codePostal: '68260' },
+  { slug: 'claye-souilly', name: 'Claye-Souilly', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '13 000', codePostal: '77410' },
+  { slug: 'bonneville', name: 'Bonneville', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '13 000', codePostal: '74130' },
+  { slug: 'saint-jean-de-vedas', name: 'Saint-Jean-de-Védas', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '13 000', codePostal: '34430' },
+  { slug: 'cusset', name: 'Cusset', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '13 000', codePostal: '03300' },
+  { slug: 'monteux', name: 'Monteux', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '13 000', codePostal: '84170' },
+  { slug: 'cuers', name: 'Cuers', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '13 000', codePostal: '83390' },
+  { slug: 'freyming-merlebach', name: 'Freyming-Merlebach', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '13 000', codePostal: '57800' },
+  { slug: 'lourdes', name: 'Lourdes', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '13 000', codePostal: '65100' },
+  { slug: 'seclin', name: 'Seclin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59113' },
+  { slug: 'val-de-reuil', name: 'Val-de-Reuil', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '13 000', codePostal: '27100' },
+  { slug: 'saint-andre-lez-lille', name: 'Saint-André-lez-Lille', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59350' },
+  {
+    slug: 'canet-en-roussillon',
+    name: 'Canet-en-Roussillon',
+    region: 'Occitanie',
+    departement: 'Pyrénées-Orientales',
+    departementCode: '66',
+    population: '13 000',
+    codePostal: '66140',
+  },
+  { slug: 'anzin', name: 'Anzin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59410' },
+  { slug: 'autun', name: 'Autun', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '13 000', codePostal: '71400' },
+  { slug: 'les-ponts-de-ce', name: 'Les Ponts-de-Cé', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '13 000', codePostal: '49130' },
+  { slug: 'villeneuve-les-avignon', name: 'Villeneuve-lès-Avignon', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '13 000', codePostal: '30400' },
+  { slug: 'outreau', name: 'Outreau', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '13 000', codePostal: '62230' },
+  { slug: 'graulhet', name: 'Graulhet', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '13 000', codePostal: '81300' },
+  {
+    slug: 'saint-hilaire-de-riez',
+    name: 'Saint-Hilaire-de-Riez',
+    region: 'Pays de la Loire',
+    departement: 'Vendée',
+    departementCode: '85',
+    population: '13 000',
+    codePostal: '85270',
+  },
+  { slug: 'petite-ile', name: 'Petite-Île', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '13 000', codePostal: '97429' },
+  { slug: 'tergnier', name: 'Tergnier', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '13 000', codePostal: '02700' },
+  { slug: 'auriol', name: 'Auriol', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '13 000', codePostal: '13390' },
+  { slug: 'bras-panon', name: 'Bras-Panon', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '13 000', codePostal: '97412' },
+  { slug: 'noyon', name: 'Noyon', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '13 000', codePostal: '60400' },
+  { slug: 'betton', name: 'Betton', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '13 000', codePostal: '35830' },
+  { slug: 'tarnos', name: 'Tarnos', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '13 000', codePostal: '40220' },
+  { slug: 'gueret', name: 'Guéret', region: 'Nouvelle-Aquitaine', departement: 'Creuse', departementCode: '23', population: '13 000', codePostal: '23000' },
+  { slug: 'fonsorbes', name: 'Fonsorbes', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '13 000', codePostal: '31470' },
+  { slug: 'berck', name: 'Berck', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '13 000', codePostal: '62600' },
+  { slug: 'amboise', name: 'Amboise', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '13 000', codePostal: '37400' },
+  { slug: 'yzeure', name: 'Yzeure', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '13 000', codePostal: '03400' },
+  { slug: 'nemours', name: 'Nemours', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '13 000', codePostal: '77140' },
+  { slug: 'mayenne', name: 'Mayenne', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '13 000', codePostal: '53100' },
+  { slug: 'chateaudun', name: 'Châteaudun', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '13 000', codePostal: '28200' },
+  {
+    slug: 'moret-loing-et-orvanne',
+    name: 'Moret-Loing-et-Orvanne',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '13 000',
+    codePostal: '77250',
+  },
+  { slug: 'saint-andre-les-vergers', name: 'Saint-André-les-Vergers', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '13 000', codePostal: '10120' },
+  { slug: 'pornichet', name: 'Pornichet', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '13 000', codePostal: '44380' },
+  { slug: 'paea', name: 'Paea', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '13 000', codePostal: '98711' },
+  { slug: 'comines', name: 'Comines', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59560' },
+  { slug: 'aubergenville', name: 'Aubergenville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '13 000', codePostal: '78410' },
+  {
+    slug: 'chambray-les-tours',
+    name: 'Chambray-lès-Tours',
+    region: 'Centre-Val de Loire',
+    departement: 'Indre-et-Loire',
+    departementCode: '37',
+    population: '13 000',
+    codePostal: '37170',
+  },
+  { slug: 'andernos-les-bains', name: 'Andernos-les-Bains', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '13 000', codePostal: '33510' },
+  { slug: 'chalette-sur-loing', name: 'Châlette-sur-Loing', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '13 000', codePostal: '45120' },
+  { slug: 'meze', name: 'Mèze', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '13 000', codePostal: '34140' },
+  { slug: 'bayeux', name: 'Bayeux', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '13 000', codePostal: '14400' },
+  { slug: 'la-chapelle-saint-luc', name: 'La Chapelle-Saint-Luc', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '13 000', codePostal: '10600' },
+  { slug: 'l-union', name: 'L\'Union', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '13 000', codePostal: '31240' },
+  {
+    slug: 'saint-andre-de-cubzac',
+    name: 'Saint-André-de-Cubzac',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '13 000',
+    codePostal: '33240',
+  },
+  { slug: 'marquette-lez-lille', name: 'Marquette-lez-Lille', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '13 000', codePostal: '59520' },
+  { slug: 'vidauban', name: 'Vidauban', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '13 000', codePostal: '83550' },
+  { slug: 'obernai', name: 'Obernai', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '13 000', codePostal: '67210' },
+  { slug: 'rognac', name: 'Rognac', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '13 000', codePostal: '13340' },
+  { slug: 'louvres', name: 'Louvres', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '13 000', codePostal: '95380' },
+  { slug: 'villetaneuse', name: 'Villetaneuse', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '13 000', codePostal: '93430' },
+  { slug: 'sollies-pont', name: 'Solliès-Pont', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '13 000', codePostal: '83210' },
+  { slug: 'granville', name: 'Granville', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '13 000', codePostal: '50400' },
+  { slug: 'brignais', name: 'Brignais', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '13 000', codePostal: '69530' },
+  { slug: 'l-isle-adam', name: 'L\'Isle-Adam', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '12 000', codePostal: '95290' },
+  { slug: 'saint-ave', name: 'Saint-Avé', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '12 000', codePostal: '56890' },
+  { slug: 'quimperle', name: 'Quimperlé', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '12 000', codePostal: '29300' },
+  { slug: 'mende', name: 'Mende', region: 'Occitanie', departement: 'Lozère', departementCode: '48', population: '12 000', codePostal: '48000' },
+  { slug: 'aubenas', name: 'Aubenas', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '12 000', codePostal: '07200' },
+  { slug: 'pont-du-chateau', name: 'Pont-du-Château', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '12 000', codePostal: '63430' },
+  { slug: 'gisors', name: 'Gisors', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '12 000', codePostal: '27140' },
+  { slug: 'pont-sainte-maxence', name: 'Pont-Sainte-Maxence', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '12 000', codePostal: '60700' },
+  { slug: 'guidel', name: 'Guidel', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '12 000', codePostal: '56520' },
+  { slug: 'sable-sur-sarthe', name: 'Sablé-sur-Sarthe', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '12 000', codePostal: '72300' },
+  { slug: 'oissel', name: 'Oissel', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '12 000', codePostal: '76350' },
+  {
+    slug: 'le-chambon-feugerolles',
+    name: 'Le Chambon-Feugerolles',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '12 000',
+    codePostal: '42500',
+  },
+  { slug: 'vernouillet', name: 'Vernouillet', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '12 000', codePostal: '28500' },
+  { slug: 'cogolin', name: 'Cogolin', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '12 000', codePostal: '83310' },
+  { slug: 'chateaubriant', name: 'Châteaubriant', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '12 000', codePostal: '44110' },
+  { slug: 'creutzwald', name: 'Creutzwald', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '12 000', codePostal: '57150' },
+  { slug: 'harnes', name: 'Harnes', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '12 000', codePostal: '62440' },
+  { slug: 'bischwiller', name: 'Bischwiller', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '12 000', codePostal: '67240' },
+  { slug: 'la-queue-en-brie', name: 'La Queue-en-Brie', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '12 000', codePostal: '94510' },
+  { slug: 'triel-sur-seine', name: 'Triel-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '12 000', codePostal: '78510' },
+  { slug: 'riedisheim', name: 'Riedisheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '12 000', codePostal: '68400' },
+  { slug: 'raismes', name: 'Raismes', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '12 000', codePostal: '59590' },
+  { slug: 'sarrebourg', name: 'Sarrebourg', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '12 000', codePostal: '57400' },
+  { slug: 'castelnaudary', name: 'Castelnaudary', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '12 000', codePostal: '11400' },
+  { slug: 'bully-les-mines', name: 'Bully-les-Mines', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '12 000', codePostal: '62160' },
+  { slug: 'saint-gaudens', name: 'Saint-Gaudens', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '12 000', codePostal: '31800' },
+  { slug: 'ferney-voltaire', name: 'Ferney-Voltaire', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '12 000', codePostal: '01210' },
+  { slug: 'craponne', name: 'Craponne', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '12 000', codePostal: '69290' },
+  { slug: 'onet-le-chateau', name: 'Onet-le-Château', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '12 000', codePostal: '12000' },
+  { slug: 'saint-cyprien', name: 'Saint-Cyprien', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '12 000', codePostal: '66750' },
+  { slug: 'la-motte-servolex', name: 'La Motte-Servolex', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '12 000', codePostal: '73290' },
+  { slug: 'cernay', name: 'Cernay', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '12 000', codePostal: '68700' },
+  { slug: 'mios', name: 'Mios', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '12 000', codePostal: '33380' },
+  {
+    slug: 'roquebrune-cap-martin',
+    name: 'Roquebrune-Cap-Martin',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '12 000',
+    codePostal: '06190',
+  },
+  { slug: 'florange', name: 'Florange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '12 000', codePostal: '57190' },
+  { slug: 'barentin', name: 'Barentin', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '12 000', codePostal: '76360' },
+  {
+    slug: 'septemes-les-vallons',
+    name: 'Septèmes-les-Vallons',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '12 000',
+    codePostal: '13240',
+  },
+  { slug: 'marly', name: 'Marly', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '12 000', codePostal: '59770' },
+  {
+    slug: 'saint-pierre-du-perray',
+    name: 'Saint-Pierre-du-Perray',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '12 000',
+    codePostal: '91280',
+  },
+  { slug: 'vedene', name: 'Vedène', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '12 000', codePostal: '84270' },
+  { slug: 'valbonne', name: 'Valbonne', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '12 000', codePostal: '06560' },
+  { slug: 'ifs', name: 'Ifs', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '12 000', codePostal: '14123' },
+  {
+    slug: 'beausoleil',
+    name: 'Beausoleil',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '12 000',
+    codePostal: '06240',
+  },
+  { slug: 'villepreux', name: 'Villepreux', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '12 000', codePostal: '78450' },
+  {
+    slug: 'dammartin-en-goele',
+    name: 'Dammartin-en-Goële',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '12 000',
+    codePostal: '77230',
+  },
+  { slug: 'le-relecq-kerhuon', name: 'Le Relecq-Kerhuon', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '12 000', codePostal: '29480' },
+  { slug: 'talant', name: 'Talant', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '12 000', codePostal: '21240' },
+  { slug: 'riviere-salee', name: 'Rivière-Salée', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '12 000', codePostal: '97215' },
+  { slug: 'somain', name: 'Somain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '12 000', codePostal: '59490' },
+  { slug: 'papara', name: 'Papara', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '12 000', codePostal: '98712' },
+  { slug: 'h-nheim', name: 'Hœnheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '12 000', codePostal: '67800' },
+  { slug: 'seyssinet-pariset', name: 'Seyssinet-Pariset', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '12 000', codePostal: '38170' },
+  { slug: 'bauge-en-anjou', name: 'Baugé-en-Anjou', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '12 000', codePostal: '49150' },
+  { slug: 'pace', name: 'Pacé', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '12 000', codePostal: '35740' },
+  { slug: 'dugny', name: 'Dugny', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '12 000', codePostal: '93440' },
+  { slug: 'arpajon', name: 'Arpajon', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '12 000', codePostal: '91290' },
+  { slug: 'vauvert', name: 'Vauvert', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '12 000', codePostal: '30600' },
+  {
+    slug: 'saint-cyr-sur-mer',
+    name: 'Saint-Cyr-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '12 000',
+    codePostal: '83270',
+  },
+  { slug: 'villecresnes', name: 'Villecresnes', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '12 000', codePostal: '94440' },
+  { slug: 'sassenage', name: 'Sassenage', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '12 000', codePostal: '38360' },
+  { slug: 'bruay-sur-l-escaut', name: 'Bruay-sur-l\'Escaut', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '12 000', codePostal: '59860' },
+  { slug: 'thiers', name: 'Thiers', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '12 000', codePostal: '63300' },
+  {
+    slug: 'plan-de-cuques',
+    name: 'Plan-de-Cuques',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '12 000',
+    codePostal: '13380',
+  },
+  { slug: 'provins', name: 'Provins', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '12 000', codePostal: '77160' },
+  { slug: 'saint-esteve', name: 'Saint-Estève', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '12 000', codePostal: '66240' },
+  {
+    slug: 'saint-germain-les-arpajon',
+    name: 'Saint-Germain-lès-Arpajon',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '12 000',
+    codePostal: '91180',
+  },
+  { slug: 'mericourt', name: 'Méricourt', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '12 000', codePostal: '62680' },
+  { slug: 'pia', name: 'Pia', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '12 000', codePostal: '66380' },
+  { slug: 'epinay-sous-senart', name: 'Épinay-sous-Sénart', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '12 000', codePostal: '91860' },
+  { slug: 'riviere-pilote', name: 'Rivière-Pilote', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '12 000', codePostal: '97211' },
+  {
+    slug: 'ancenis-saint-gereon',
+    name: 'Ancenis-Saint-Géréon',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '12 000',
+    codePostal: '44150',
+  },
+  { slug: 'chauny', name: 'Chauny', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '12 000', codePostal: '02300' },
+  { slug: 'n-ux-les-mines', name: 'Nœux-les-Mines', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '12 000', codePostal: '62290' },
+  { slug: 'bolbec', name: 'Bolbec', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '12 000', codePostal: '76210' },
+  { slug: 'maizieres-les-metz', name: 'Maizières-lès-Metz', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '12 000', codePostal: '57280' },
+  { slug: 'les-avirons', name: 'Les Avirons', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '12 000', codePostal: '97425' },
+  { slug: 'ploufragan', name: 'Ploufragan', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '12 000', codePostal: '22440' },
+  { slug: 'la-hague', name: 'La Hague', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '11 000', codePostal: '50440' },
+  { slug: 'pontchateau', name: 'Pontchâteau', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '11 000', codePostal: '44160' },
+  { slug: 'vaux-le-penil', name: 'Vaux-le-Pénil', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '11 000', codePostal: '77000' },
+  { slug: 'saverne', name: 'Saverne', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '11 000', codePostal: '67700' },
+  { slug: 'la-trinite', name: 'La Trinité', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '11 000', codePostal: '97220' },
+  { slug: 'fourmies', name: 'Fourmies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59610' },
+  { slug: 'pamandzi', name: 'Pamandzi', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '11 000', codePostal: '97615' },
+  { slug: 'yvetot', name: 'Yvetot', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '11 000', codePostal: '76190' },
+  { slug: 'enghien-les-bains', name: 'Enghien-les-Bains', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '11 000', codePostal: '95880' },
+  { slug: 'biganos', name: 'Biganos', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33380' },
+  { slug: 'gravelines', name: 'Gravelines', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59820' },
+  { slug: 'gaillard', name: 'Gaillard', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '11 000', codePostal: '74240' },
+  { slug: 'saint-junien', name: 'Saint-Junien', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '11 000', codePostal: '87200' },
+  { slug: 'dourdan', name: 'Dourdan', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '11 000', codePostal: '91410' },
+  { slug: 'briancon', name: 'Briançon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Hautes-Alpes', departementCode: '05', population: '11 000', codePostal: '05100' },
+  { slug: 'le-haillan', name: 'Le Haillan', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33185' },
+  {
+    slug: 'la-roche-sur-foron',
+    name: 'La Roche-sur-Foron',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '11 000',
+    codePostal: '74800',
+  },
+  { slug: 'panazol', name: 'Panazol', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '11 000', codePostal: '87350' },
+  {
+    slug: 'montlouis-sur-loire',
+    name: 'Montlouis-sur-Loire',
+    region: 'Centre-Val de Loire',
+    departement: 'Indre-et-Loire',
+    departementCode: '37',
+    population: '11 000',
+    codePostal: '37270',
+  },
+  { slug: 'corbas', name: 'Corbas', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '11 000', codePostal: '69960' },
+  { slug: 'le-luc', name: 'Le Luc', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '11 000', codePostal: '83340' },
+  { slug: 'tournon-sur-rhone', name: 'Tournon-sur-Rhône', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '11 000', codePostal: '07300' },
+  {
+    slug: 'villefranche-de-rouergue',
+    name: 'Villefranche-de-Rouergue',
+    region: 'Occitanie',
+    departement: 'Aveyron',
+    departementCode: '12',
+    population: '11 000',
+    codePostal: '12200',
+  },
+  { slug: 'castelginest', name: 'Castelginest', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '11 000', codePostal: '31780' },
+  { slug: 'saint-jean', name: 'Saint-Jean', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '11 000', codePostal: '31240' },
+  { slug: 'guebwiller', name: 'Guebwiller', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '11 000', codePostal: '68500' },
+  {
+    slug: 'guilherand-granges',
+    name: 'Guilherand-Granges',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Ardèche',
+    departementCode: '07',
+    population: '11 000',
+    codePostal: '07500',
+  },
+  { slug: 'cesson', name: 'Cesson', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '11 000', codePostal: '77240' },
+  { slug: 'chassieu', name: 'Chassieu', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '11 000', codePostal: '69680' },
+  { slug: 'porto-vecchio', name: 'Porto-Vecchio', region: 'Corse', departement: 'Corse-du-Sud', departementCode: '2A', population: '11 000', codePostal: '20137' },
+  { slug: 'issoudun', name: 'Issoudun', region: 'Centre-Val de Loire', departement: 'Indre', departementCode: '36', population: '11 000', codePostal: '36100' },
+  { slug: 'sada', name: 'Sada', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '11 000', codePostal: '97640' },
+  { slug: 'riorges', name: 'Riorges', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '11 000', codePostal: '42153' },
+  {
+    slug: 'chevigny-saint-sauveur',
+    name: 'Chevigny-Saint-Sauveur',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '11 000',
+    codePostal: '21800',
+  },
+  { slug: 'arcachon', name: 'Arcachon', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33120' },
+  { slug: 'ville-d-avray', name: 'Ville-d\'Avray', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '11 000', codePostal: '92410' },
+  {
+    slug: 'pelissanne',
+    name: 'Pélissanne',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '11 000',
+    codePostal: '13330',
+  },
+  { slug: 'le-taillan-medoc', name: 'Le Taillan-Médoc', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33320' },
+  { slug: 'villeneuve-tolosane', name: 'Villeneuve-Tolosane', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '11 000', codePostal: '31270' },
+  { slug: 'doue-en-anjou', name: 'Doué-en-Anjou', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '11 000', codePostal: '49700' },
+  {
+    slug: 'la-chapelle-saint-mesmin',
+    name: 'La Chapelle-Saint-Mesmin',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '11 000',
+    codePostal: '45380',
+  },
+  {
+    slug: 'mouans-sartoux',
+    name: 'Mouans-Sartoux',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '11 000',
+    codePostal: '06370',
+  },
+  { slug: 'croissy-sur-seine', name: 'Croissy-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '11 000', codePostal: '78290' },
+  { slug: 'wambrechies', name: 'Wambrechies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59118' },
+  {
+    slug: 'thouare-sur-loire',
+    name: 'Thouaré-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '11 000',
+    codePostal: '44470',
+  },
+  { slug: 'vitry-le-francois', name: 'Vitry-le-François', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '11 000', codePostal: '51300' },
+  { slug: 'ormesson-sur-marne', name: 'Ormesson-sur-Marne', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '11 000', codePostal: '94490' },
+  { slug: 'lavaur', name: 'Lavaur', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '11 000', codePostal: '81500' },
+  { slug: 'pont-saint-esprit', name: 'Pont-Saint-Esprit', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '11 000', codePostal: '30130' },
+  { slug: 'maromme', name: 'Maromme', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '11 000', codePostal: '76150' },
+  { slug: 'mana', name: 'Mana', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '11 000', codePostal: '97318' },
+  { slug: 'le-pont-de-claix', name: 'Le Pont-de-Claix', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '11 000', codePostal: '38800' },
+  { slug: 'stiring-wendel', name: 'Stiring-Wendel', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '11 000', codePostal: '57350' },
+  { slug: 'fondettes', name: 'Fondettes', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '11 000', codePostal: '37230' },
+  {
+    slug: 'vetraz-monthoux',
+    name: 'Vétraz-Monthoux',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '11 000',
+    codePostal: '74100',
+  },
+  { slug: 'saint-saulve', name: 'Saint-Saulve', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59880' },
+  { slug: 'trets', name: 'Trets', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '11 000', codePostal: '13530' },
+  { slug: 'le-pradet', name: 'Le Pradet', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '11 000', codePostal: '83220' },
+  { slug: 'tarare', name: 'Tarare', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '11 000', codePostal: '69170' },
+  {
+    slug: 'saint-martin-boulogne',
+    name: 'Saint-Martin-Boulogne',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '11 000',
+    codePostal: '62280',
+  },
+  { slug: 'orthez', name: 'Orthez', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '11 000', codePostal: '64300' },
+  {
+    slug: 'brissac-loire-aubance',
+    name: 'Brissac Loire Aubance',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '11 000',
+    codePostal: '49250',
+  },
+  { slug: 'amneville', name: 'Amnéville', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '11 000', codePostal: '57360' },
+  {
+    slug: 'villeneuve-les-maguelone',
+    name: 'Villeneuve-lès-Maguelone',
+    region: 'Occitanie',
+    departement: 'Hérault',
+    departementCode: '34',
+    population: '11 000',
+    codePostal: '34750',
+  },
+  {
+    slug: 'chanteloup-les-vignes',
+    name: 'Chanteloup-les-Vignes',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '11 000',
+    codePostal: '78570',
+  },
+  { slug: 'passy', name: 'Passy', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '11 000', codePostal: '74190' },
+  { slug: 'ann-ullin', name: 'Annœullin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59112' },
+  { slug: 'chateaugiron', name: 'Châteaugiron', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '11 000', codePostal: '35410' },
+  { slug: 'teva-i-uta', name: 'Teva I Uta', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '11 000', codePostal: '98726' },
+  { slug: 'igny', name: 'Igny', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '11 000', codePostal: '91430' },
+  { slug: 'deville-les-rouen', name: 'Déville-lès-Rouen', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '11 000', codePostal: '76250' },
+  { slug: 'erstein', name: 'Erstein', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '11 000', codePostal: '67150' },
+  { slug: 'dinard', name: 'Dinard', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '11 000', codePostal: '35800' },
+  { slug: 'tinqueux', name: 'Tinqueux', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '11 000', codePostal: '51430' },
+  { slug: 'bondoufle', name: 'Bondoufle', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '11 000', codePostal: '91070' },
+  {
+    slug: 'boulazac-isle-manoire',
+    name: 'Boulazac Isle Manoire',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Dordogne',
+    departementCode: '24',
+    population: '11 000',
+    codePostal: '24330',
+  },
+  { slug: 'bora-bora', name: 'Bora-Bora', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '11 000', codePostal: '98730' },
+  { slug: 'allonnes', name: 'Allonnes', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '11 000', codePostal: '72700' },
+  { slug: 'beaumont', name: 'Beaumont', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '11 000', codePostal: '63110' },
+  { slug: 'epinay-sur-orge', name: 'Épinay-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '11 000', codePostal: '91360' },
+  { slug: 'etaples', name: 'Étaples', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '11 000', codePostal: '62630' },
+  {
+    slug: 'oloron-sainte-marie',
+    name: 'Oloron-Sainte-Marie',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Pyrénées-Atlantiques',
+    departementCode: '64',
+    population: '11 000',
+    codePostal: '64400',
+  },
+  { slug: 'parempuyre', name: 'Parempuyre', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33290' },
+  { slug: 'leognan', name: 'Léognan', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '11 000', codePostal: '33850' },
+  { slug: 'chantepie', name: 'Chantepie', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '11 000', codePostal: '35135' },
+  { slug: 'urrugne', name: 'Urrugne', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '11 000', codePostal: '64122' },
+  {
+    slug: 'saint-barthelemy',
+    name: 'Saint-Barthélemy',
+    region: 'Saint-Barthélemy',
+    departement: 'Saint-Barthélemy',
+    departementCode: '977',
+    population: '11 000',
+    codePostal: '97133',
+  },
+  { slug: 'wittelsheim', name: 'Wittelsheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '11 000', codePostal: '68310' },
+  { slug: 'mainvilliers', name: 'Mainvilliers', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '11 000', codePostal: '28300' },
+  {
+    slug: 'voisins-le-bretonneux',
+    name: 'Voisins-le-Bretonneux',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '11 000',
+    codePostal: '78960',
+  },
+  { slug: 'hericourt', name: 'Héricourt', region: 'Bourgogne-Franche-Comté', departement: 'Haute-Saône', departementCode: '70', population: '11 000', codePostal: '70400' },
+  { slug: 'vieux-conde', name: 'Vieux-Condé', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '11 000', codePostal: '59690' },
+  {
+    slug: 'port-jerome-sur-seine',
+    name: 'Port-Jérôme-sur-Seine',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '11 000',
+    codePostal: '76170',
+  },
+  { slug: 'argeles-sur-mer', name: 'Argelès-sur-Mer', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '11 000', codePostal: '66700' },
+  { slug: 'treillieres', name: 'Treillières', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '11 000', codePostal: '44119' },
+  { slug: 'chantilly', name: 'Chantilly', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '11 000', codePostal: '60500' },
+  {
+    slug: 'la-londe-les-maures',
+    name: 'La Londe-les-Maures',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '11 000',
+    codePostal: '83250',
+  },
+  { slug: 'fosses', name: 'Fosses', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '11 000', codePostal: '95470' },
+  { slug: 'clermont', name: 'Clermont', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '11 000', codePostal: '60600' },
+  { slug: 'longuenesse', name: 'Longuenesse', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '11 000', codePostal: '62219' },
+  {
+    slug: 'charvieu-chavagneux',
+    name: 'Charvieu-Chavagneux',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '11 000',
+    codePostal: '38230',
+  },
+  { slug: 'seysses', name: 'Seysses', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '11 000', codePostal: '31600' },
+  { slug: 'limoux', name: 'Limoux', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '11 000', codePostal: '11300' },
+  { slug: 'biot', name: 'Biot', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '11 000', codePostal: '06410' },
+  {
+    slug: 'pernes-les-fontaines',
+    name: 'Pernes-les-Fontaines',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '11 000',
+    codePostal: '84210',
+  },
+  { slug: 'valentigney', name: 'Valentigney', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '11 000', codePostal: '25700' },
+  { slug: 'brumath', name: 'Brumath', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '10 000', codePostal: '67170' },
+  { slug: 'eybens', name: 'Eybens', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '10 000', codePostal: '38320' },
+  { slug: 'villers-cotterets', name: 'Villers-Cotterêts', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '10 000', codePostal: '02600' },
+  { slug: 'la-riche', name: 'La Riche', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '10 000', codePostal: '37520' },
+  { slug: 'portes-les-valence', name: 'Portes-lès-Valence', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '10 000', codePostal: '26800' },
+  { slug: 'caudebec-les-elbeuf', name: 'Caudebec-lès-Elbeuf', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '10 000', codePostal: '76320' },
+  { slug: 'saint-gely-du-fesc', name: 'Saint-Gély-du-Fesc', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '10 000', codePostal: '34980' },
+  { slug: 'marck', name: 'Marck', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '10 000', codePostal: '62730' },
+  { slug: 'cabestany', name: 'Cabestany', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '10 000', codePostal: '66330' },
+  { slug: 'divonne-les-bains', name: 'Divonne-les-Bains', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '10 000', codePostal: '01220' },
+  { slug: 'aubiere', name: 'Aubière', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '10 000', codePostal: '63170' },
+  { slug: 'auterive', name: 'Auterive', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31190' },
+  {
+    slug: 'thorigny-sur-marne',
+    name: 'Thorigny-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '10 000',
+    codePostal: '77400',
+  },
+  { slug: 'fouesnant', name: 'Fouesnant', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '10 000', codePostal: '29170' },
+  {
+    slug: 'andrezieux-boutheon',
+    name: 'Andrézieux-Bouthéon',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '10 000',
+    codePostal: '42160',
+  },
+  { slug: 'miribel', name: 'Miribel', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '10 000', codePostal: '01700' },
+  { slug: 'blain', name: 'Blain', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '10 000', codePostal: '44130' },
+  { slug: 'aizenay', name: 'Aizenay', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '10 000', codePostal: '85190' },
+  { slug: 'lezignan-corbieres', name: 'Lézignan-Corbières', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '10 000', codePostal: '11200' },
+  {
+    slug: 'gignac-la-nerthe',
+    name: 'Gignac-la-Nerthe',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '10 000',
+    codePostal: '13180',
+  },
+  { slug: 'fuveau', name: 'Fuveau', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '10 000', codePostal: '13710' },
+  { slug: 'gerzat', name: 'Gerzat', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '10 000', codePostal: '63360' },
+  { slug: 'mondeville', name: 'Mondeville', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '10 000', codePostal: '14120' },
+  { slug: 'serris', name: 'Serris', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '10 000', codePostal: '77700' },
+  { slug: 'oignies', name: 'Oignies', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '10 000', codePostal: '62590' },
+  { slug: 'saint-esprit', name: 'Saint-Esprit', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '10 000', codePostal: '97270' },
+  { slug: 'arue', name: 'Arue', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '10 000', codePostal: '98701' },
+  { slug: 'pfastatt', name: 'Pfastatt', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '10 000', codePostal: '68120' },
+  { slug: 'borgo', name: 'Borgo', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '10 000', codePostal: '20290' },
+  { slug: 'apatou', name: 'Apatou', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '10 000', codePostal: '97317' },
+  { slug: 'feyzin', name: 'Feyzin', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '10 000', codePostal: '69320' },
+  { slug: 'villebon-sur-yvette', name: 'Villebon-sur-Yvette', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '10 000', codePostal: '91140' },
+  { slug: 'sainte-savine', name: 'Sainte-Savine', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '10 000', codePostal: '10300' },
+  { slug: 'buxerolles', name: 'Buxerolles', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '10 000', codePostal: '86180' },
+  { slug: 'bandrele', name: 'Bandrele', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '10 000', codePostal: '97660' },
+  {
+    slug: 'la-ferte-sous-jouarre',
+    name: 'La Ferté-sous-Jouarre',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '10 000',
+    codePostal: '77260',
+  },
+  { slug: 'cabries', name: 'Cabriès', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '10 000', codePostal: '13480' },
+  { slug: 'beaumont-sur-oise', name: 'Beaumont-sur-Oise', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '10 000', codePostal: '95260' },
+  { slug: 'le-beausset', name: 'Le Beausset', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '10 000', codePostal: '83330' },
+  { slug: 'carentan-les-marais', name: 'Carentan-les-Marais', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '10 000', codePostal: '50480' },
+  { slug: 'ouangani', name: 'Ouangani', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '10 000', codePostal: '97670' },
+  {
+    slug: 'hitiaa-o-te-ra',
+    name: 'Hitiaa O Te Ra',
+    region: 'Polynésie française',
+    departement: 'Polynésie française',
+    departementCode: '987',
+    population: '10 000',
+    codePostal: '98705',
+  },
+  { slug: 'couzeix', name: 'Couzeix', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '10 000', codePostal: '87270' },
+  { slug: 'lillers', name: 'Lillers', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '10 000', codePostal: '62190' },
+  { slug: 'saint-claude', name: 'Saint-Claude', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '10 000', codePostal: '97120' },
+  { slug: 'courrieres', name: 'Courrières', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '10 000', codePostal: '62710' },
+  { slug: 'ploermel', name: 'Ploërmel', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '10 000', codePostal: '56800' },
+  { slug: 'jeumont', name: 'Jeumont', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '10 000', codePostal: '59460' },
+  { slug: 'avranches', name: 'Avranches', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '10 000', codePostal: '50300' },
+  { slug: 'apt', name: 'Apt', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '10 000', codePostal: '84400' },
+  { slug: 'parthenay', name: 'Parthenay', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '10 000', codePostal: '79200' },
+  { slug: 'pierrelaye', name: 'Pierrelaye', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '10 000', codePostal: '95220' },
+  { slug: 'le-muy', name: 'Le Muy', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '10 000', codePostal: '83490' },
+  { slug: 'douchy-les-mines', name: 'Douchy-les-Mines', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '10 000', codePostal: '59282' },
+  { slug: 'villerupt', name: 'Villerupt', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '10 000', codePostal: '54190' },
+  {
+    slug: 'saint-pierre-du-mont',
+    name: 'Saint-Pierre-du-Mont',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Landes',
+    departementCode: '40',
+    population: '10 000',
+    codePostal: '40280',
+  },
+  { slug: 'maxeville', name: 'Maxéville', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '10 000', codePostal: '54320' },
+  { slug: 'soyaux', name: 'Soyaux', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '10 000', codePostal: '16800' },
+  { slug: 'mazamet', name: 'Mazamet', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '10 000', codePostal: '81200' },
+  { slug: 'filliere', name: 'Fillière', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '10 000', codePostal: '74370' },
+  { slug: 'ingre', name: 'Ingré', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '10 000', codePostal: '45140' },
+  { slug: 'auchel', name: 'Auchel', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '10 000', codePostal: '62260' },
+  { slug: 'grigny-sur-rhone', name: 'Grigny-sur-Rhône', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '10 000', codePostal: '69520' },
+  { slug: 'saint-loubes', name: 'Saint-Loubès', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '10 000', codePostal: '33450' },
+  { slug: 'lambesc', name: 'Lambesc', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '10 000', codePostal: '13410' },
+  { slug: 'pont-audemer', name: 'Pont-Audemer', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '10 000', codePostal: '27500' },
+  { slug: 'la-farlede', name: 'La Farlède', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '10 000', codePostal: '83210' },
+  { slug: 'neuville-en-ferrain', name: 'Neuville-en-Ferrain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '10 000', codePostal: '59960' },
+  { slug: 'loudeac', name: 'Loudéac', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '10 000', codePostal: '22600' },
+  { slug: 'mery-sur-oise', name: 'Méry-sur-Oise', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '10 000', codePostal: '95540' },
+  { slug: 'aniche', name: 'Aniche', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '10 000', codePostal: '59580' },
+  { slug: 'chambly', name: 'Chambly', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '10 000', codePostal: '60230' },
+  { slug: 'saint-gregoire', name: 'Saint-Grégoire', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '10 000', codePostal: '35760' },
+  { slug: 'leguevin', name: 'Léguevin', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31490' },
+  { slug: 'foix', name: 'Foix', region: 'Occitanie', departement: 'Ariège', departementCode: '09', population: '10 000', codePostal: '09000' },
+  { slug: 'voreppe', name: 'Voreppe', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '10 000', codePostal: '38340' },
+  { slug: 'bourg-de-peage', name: 'Bourg-de-Péage', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '10 000', codePostal: '26300' },
+  {
+    slug: 'lancon-provence',
+    name: 'Lançon-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '10 000',
+    codePostal: '13680',
+  },
+  { slug: 'saint-max', name: 'Saint-Max', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '10 000', codePostal: '54130' },
+  {
+    slug: 'saint-amand-montrond',
+    name: 'Saint-Amand-Montrond',
+    region: 'Centre-Val de Loire',
+    departement: 'Cher',
+    departementCode: '18',
+    population: '10 000',
+    codePostal: '18200',
+  },
+  {
+    slug: 'saint-laurent-de-la-salanque',
+    name: 'Saint-Laurent-de-la-Salanque',
+    region: 'Occitanie',
+    departement: 'Pyrénées-Orientales',
+    departementCode: '66',
+    population: '10 000',
+    codePostal: '66250',
+  },
+  { slug: 'saint-lys', name: 'Saint-Lys', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31470' },
+  { slug: 'carmaux', name: 'Carmaux', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '10 000', codePostal: '81400' },
+  { slug: 'ezanville', name: 'Ézanville', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '10 000', codePostal: '95460' },
+  { slug: 'lorgues', name: 'Lorgues', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '10 000', codePostal: '83510' },
+  { slug: 'beauchamp', name: 'Beauchamp', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '10 000', codePostal: '95250' },
+  { slug: 'roche-la-moliere', name: 'Roche-la-Molière', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '10 000', codePostal: '42230' },
+  { slug: 'le-rheu', name: 'Le Rheu', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '10 000', codePostal: '35650' },
+  { slug: 'merville', name: 'Merville', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '10 000', codePostal: '59660' },
+  { slug: 'frouzins', name: 'Frouzins', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31270' },
+  { slug: 'figeac', name: 'Figeac', region: 'Occitanie', departement: 'Lot', departementCode: '46', population: '10 000', codePostal: '46100' },
+  { slug: 'portet-sur-garonne', name: 'Portet-sur-Garonne', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31120' },
+  { slug: 'montlhery', name: 'Montlhéry', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '10 000', codePostal: '91310' },
+  { slug: 'grand-couronne', name: 'Grand-Couronne', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '10 000', codePostal: '76530' },
+  { slug: 'mezidon-vallee-d-auge', name: 'Mézidon Vallée d\'Auge', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '10 000', codePostal: '14140' },
+  { slug: 'bernay', name: 'Bernay', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '10 000', codePostal: '27300' },
+  { slug: 'revel', name: 'Revel', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '10 000', codePostal: '31250' },
+  { slug: 'bondues', name: 'Bondues', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '9 500', codePostal: '59910' },
+  { slug: 'aytre', name: 'Aytré', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '9 500', codePostal: '17440' },
+  {
+    slug: 'montigny-en-gohelle',
+    name: 'Montigny-en-Gohelle',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '9 500',
+    codePostal: '62640',
+  },
+  {
+    slug: 'cosne-cours-sur-loire',
+    name: 'Cosne-Cours-sur-Loire',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Nièvre',
+    departementCode: '58',
+    population: '9 500',
+    codePostal: '58200',
+  },
+  {
+    slug: 'saint-barthelemy-d-anjou',
+    name: 'Saint-Barthélemy-d\'Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '9 500',
+    codePostal: '49124',
+  },
+  { slug: 'saint-sulpice-la-pointe', name: 'Saint-Sulpice-la-Pointe', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '9 500', codePostal: '81370' },
+  { slug: 'basse-goulaine', name: 'Basse-Goulaine', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '9 500', codePostal: '44115' },
+  { slug: 'grand-santi', name: 'Grand-Santi', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '9 500', codePostal: '97340' },
+  { slug: 'saint-doulchard', name: 'Saint-Doulchard', region: 'Centre-Val de Loire', departement: 'Cher', departementCode: '18', population: '9 500', codePostal: '18230' },
+  { slug: 'aucamville', name: 'Aucamville', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '9 500', codePostal: '31140' },
+  { slug: 'saint-jean-d-illac', name: 'Saint-Jean-d\'Illac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '9 500', codePostal: '33127' },
+  { slug: 'perols', name: 'Pérols', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '9 500', codePostal: '34470' },
+  { slug: 'crosne', name: 'Crosne', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '9 500', codePostal: '91560' },
+  { slug: 'gros-morne', name: 'Gros-Morne', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '9 500', codePostal: '97213' },
+  { slug: 'lesquin', name: 'Lesquin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '9 500', codePostal: '59810' },
+  {
+    slug: 'saint-remy-de-provence',
+    name: 'Saint-Rémy-de-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '9 500',
+    codePostal: '13210',
+  },
+  { slug: 'aire-sur-la-lys', name: 'Aire-sur-la-Lys', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '9 500', codePostal: '62120' },
+  { slug: 'audenge', name: 'Audenge', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '9 500', codePostal: '33980' },
+  { slug: 'maripasoula', name: 'Maripasoula', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '9 500', codePostal: '97370' },
+  { slug: 'nort-sur-erdre', name: 'Nort-sur-Erdre', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '9 500', codePostal: '44390' },
+  { slug: 'darnetal', name: 'Darnétal', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '9 500', codePostal: '76160' },
+  {
+    slug: 'saint-jean-le-blanc',
+    name: 'Saint-Jean-le-Blanc',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '9 500',
+    codePostal: '45650',
+  },
+  { slug: 'sene', name: 'Séné', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '9 500', codePostal: '56860' },
+  { slug: 'bures-sur-yvette', name: 'Bures-sur-Yvette', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '9 500', codePostal: '91440' },
+  { slug: 'savenay', name: 'Savenay', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '9 500', codePostal: '44260' },
+  { slug: 'redon', name: 'Redon', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '9 500', codePostal: '35600' },
+  { slug: 'l-isle-jourdain', name: 'L\'Isle-Jourdain', region: 'Occitanie', departement: 'Gers', departementCode: '32', population: '9 500', codePostal: '32600' },
+  { slug: 'leers', name: 'Leers', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '9 500', codePostal: '59115' },
+  { slug: 'albert', name: 'Albert', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '9 500', codePostal: '80300' },
+  { slug: 'ville-la-grand', name: 'Ville-la-Grand', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '9 500', codePostal: '74100' },
+  { slug: 'petit-caux', name: 'Petit-Caux', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '9 500', codePostal: '76370' },
+  { slug: 'elne', name: 'Elne', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '9 500', codePostal: '66200' },
+  { slug: 'vallet', name: 'Vallet', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '9 500', codePostal: '44330' },
+  { slug: 'quincy-sous-senart', name: 'Quincy-sous-Sénart', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '9 500', codePostal: '91480' },
+  { slug: 'clermont-l-herault', name: 'Clermont-l\'Hérault', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '9 500', codePostal: '34800' },
+  { slug: 'tonneins', name: 'Tonneins', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '9 500', codePostal: '47400' },
+  { slug: 'lescar', name: 'Lescar', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '9 500', codePostal: '64230' },
+  { slug: 'arques', name: 'Arques', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '9 500', codePostal: '62510' },
+  { slug: 'landivisiau', name: 'Landivisiau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '9 500', codePostal: '29400' },
+  {
+    slug: 'dombasle-sur-meurthe',
+    name: 'Dombasle-sur-Meurthe',
+    region: 'Grand Est',
+    departement: 'Meurthe-et-Moselle',
+    departementCode: '54',
+    population: '9 500',
+    codePostal: '54110',
+  },
+  { slug: 'lucon', name: 'Luçon', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '9 500', codePostal: '85400' },
+  { slug: 'basse-terre', name: 'Basse-Terre', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '9 500', codePostal: '97100' },
+  { slug: 'sallaumines', name: 'Sallaumines', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '9 500', codePostal: '62430' },
+  { slug: 'guichen', name: 'Guichen', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '9 500', codePostal: '35580' },
+  { slug: 'sainte-luce', name: 'Sainte-Luce', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '9 500', codePostal: '97228' },
+  { slug: 'carqueiranne', name: 'Carqueiranne', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '9 500', codePostal: '83320' },
+  {
+    slug: 'saint-philbert-de-grand-lieu',
+    name: 'Saint-Philbert-de-Grand-Lieu',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '9 500',
+    codePostal: '44310',
+  },
+  { slug: 'belley', name: 'Belley', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '9 500', codePostal: '01300' },
+  { slug: 'magny-les-hameaux', name: 'Magny-les-Hameaux', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '9 500', codePostal: '78114' },
+  { slug: 'chaponost', name: 'Chaponost', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '9 500', codePostal: '69630' },
+  { slug: 'rombas', name: 'Rombas', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '9 500', codePostal: '57120' },
+  { slug: 'mont-saint-martin', name: 'Mont-Saint-Martin', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '9 500', codePostal: '54350' },
+  {
+    slug: 'jarville-la-malgrange',
+    name: 'Jarville-la-Malgrange',
+    region: 'Grand Est',
+    departement: 'Meurthe-et-Moselle',
+    departementCode: '54',
+    population: '9 500',
+    codePostal: '54140',
+  },
+  { slug: 'liffre', name: 'Liffré', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '9 500', codePostal: '35340' },
+  { slug: 'la-ravoire', name: 'La Ravoire', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '9 500', codePostal: '73490' },
+  { slug: 'livron-sur-drome', name: 'Livron-sur-Drôme', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '9 500', codePostal: '26250' },
+  { slug: 'le-passage', name: 'Le Passage', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '9 500', codePostal: '47520' },
+  { slug: 'molsheim', name: 'Molsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '9 500', codePostal: '67120' },
+  {
+    slug: 'nogent-le-rotrou',
+    name: 'Nogent-le-Rotrou',
+    region: 'Centre-Val de Loire',
+    departement: 'Eure-et-Loir',
+    departementCode: '28',
+    population: '9 500',
+    codePostal: '28400',
+  },
+  {
+    slug: 'paray-le-monial',
+    name: 'Paray-le-Monial',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '9 500',
+    codePostal: '71600',
+  },
+  { slug: 'poisy', name: 'Poisy', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '9 500', codePostal: '74330' },
+  { slug: 'vert-saint-denis', name: 'Vert-Saint-Denis', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '9 500', codePostal: '77240' },
+  { slug: 'hagondange', name: 'Hagondange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '9 500', codePostal: '57300' },
+  { slug: 'les-sorinieres', name: 'Les Sorinières', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '9 500', codePostal: '44840' },
+  { slug: 'rivesaltes', name: 'Rivesaltes', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '9 500', codePostal: '66600' },
+  { slug: 'evian-les-bains', name: 'Évian-les-Bains', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '9 500', codePostal: '74500' },
+  { slug: 'conde-sur-l-escaut', name: 'Condé-sur-l\'Escaut', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '9 500', codePostal: '59163' },
+  {
+    slug: 'fontaine-les-dijon',
+    name: 'Fontaine-lès-Dijon',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '9 500',
+    codePostal: '21121',
+  },
+  { slug: 'le-cres', name: 'Le Crès', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '9 000', codePostal: '34920' },
+  { slug: 'lifou', name: 'Lifou', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '9 000', codePostal: '98820' },
+  { slug: 'valreas', name: 'Valréas', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '9 000', codePostal: '84600' },
+  { slug: 'dardilly', name: 'Dardilly', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '9 000', codePostal: '69570' },
+  { slug: 'ouistreham', name: 'Ouistreham', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '9 000', codePostal: '14150' },
+  { slug: 'sarzeau', name: 'Sarzeau', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '9 000', codePostal: '56370' },
+  { slug: 'beuvry', name: 'Beuvry', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '9 000', codePostal: '62660' },
+  { slug: 'ussel', name: 'Ussel', region: 'Nouvelle-Aquitaine', departement: 'Corrèze', departementCode: '19', population: '9 000', codePostal: '19200' },
+  { slug: 'capbreton', name: 'Capbreton', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '9 000', codePostal: '40130' },
+  { slug: 'le-teich', name: 'Le Teich', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '9 000', codePostal: '33470' },
+  { slug: 'launaguet', name: 'Launaguet', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '9 000', codePostal: '31140' },
+  { slug: 'scionzier', name: 'Scionzier', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '9 000', codePostal: '74950' },
+  { slug: 'breuillet', name: 'Breuillet', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '9 000', codePostal: '91650' },
+  { slug: 'prevessin-moens', name: 'Prévessin-Moëns', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '9 000', codePostal: '01280' },
+  {
+    slug: 'varennes-vauzelles',
+    name: 'Varennes-Vauzelles',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Nièvre',
+    departementCode: '58',
+    population: '9 000',
+    codePostal: '58640',
+  },
+  { slug: 'bougival', name: 'Bougival', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '9 000', codePostal: '78380' },
+  { slug: 'tomblaine', name: 'Tomblaine', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '9 000', codePostal: '54510' },
+  { slug: 'grabels', name: 'Grabels', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '9 000', codePostal: '34790' },
+  { slug: 'checy', name: 'Chécy', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '9 000', codePostal: '45430' },
+  { slug: 'lamorlaye', name: 'Lamorlaye', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '9 000', codePostal: '60260' },
+  { slug: 'grenade', name: 'Grenade', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '9 000', codePostal: '31330' },
+  { slug: 'magny-le-hongre', name: 'Magny-le-Hongre', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '9 000', codePostal: '77700' },
+  {
+    slug: 'la-fare-les-oliviers',
+    name: 'La Fare-les-Oliviers',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '9 000',
+    codePostal: '13580',
+  },
+  { slug: 'escaudain', name: 'Escaudain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '9 000', codePostal: '59124' },
+  { slug: 'irigny', name: 'Irigny', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '9 000', codePostal: '69540' },
+  {
+    slug: 'morieres-les-avignon',
+    name: 'Morières-lès-Avignon',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '9 000',
+    codePostal: '84310',
+  },
+  { slug: 'joigny', name: 'Joigny', region: 'Bourgogne-Franche-Comté', departement: 'Yonne', departementCode: '89', population: '9 000', codePostal: '89300' },
+  { slug: 'queven', name: 'Quéven', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '9 000', codePostal: '56530' },
+  {
+    slug: 'saint-paul-trois-chateaux',
+    name: 'Saint-Paul-Trois-Châteaux',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Drôme',
+    departementCode: '26',
+    population: '9 000',
+    codePostal: '26130',
+  },
+  { slug: 'cornebarrieu', name: 'Cornebarrieu', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '9 000', codePostal: '31700' },
+  { slug: 'pibrac', name: 'Pibrac', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '9 000', codePostal: '31820' },
+  { slug: 'veauche', name: 'Veauche', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '9 000', codePostal: '42340' },
+  { slug: 'quetigny', name: 'Quetigny', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '9 000', codePostal: '21800' },
+  { slug: 'boucau', name: 'Boucau', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '9 000', codePostal: '64340' },
+  { slug: 'cebazat', name: 'Cébazat', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '9 000', codePostal: '63118' },
+  { slug: 'meulan-en-yvelines', name: 'Meulan-en-Yvelines', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '9 000', codePostal: '78250' },
+  {
+    slug: 'bellerive-sur-allier',
+    name: 'Bellerive-sur-Allier',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Allier',
+    departementCode: '03',
+    population: '9 000',
+    codePostal: '03700',
+  },
+  { slug: 'velaux', name: 'Velaux', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '9 000', codePostal: '13880' },
+  {
+    slug: 'epagny-metz-tessy',
+    name: 'Epagny Metz-Tessy',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '9 000',
+    codePostal: '74330',
+  },
+  { slug: 'chirongui', name: 'Chirongui', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '9 000', codePostal: '97620' },
+  {
+    slug: 'gonfreville-l-orcher',
+    name: 'Gonfreville-l\'Orcher',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '9 000',
+    codePostal: '76700',
+  },
+  {
+    slug: 'roquevaire',
+    name: 'Roquevaire',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '9 000',
+    codePostal: '13360',
+  },
+  {
+    slug: 'entraigues-sur-la-sorgue',
+    name: 'Entraigues-sur-la-Sorgue',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '9 000',
+    codePostal: '84320',
+  },
+  { slug: 'les-angles', name: 'Les Angles', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '9 000', codePostal: '30133' },
+  { slug: 'longvic', name: 'Longvic', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '9 000', codePostal: '21600' },
+  { slug: 'le-thor', name: 'Le Thor', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '9 000', codePostal: '84250' },
+  {
+    slug: 'chartres-de-bretagne',
+    name: 'Chartres-de-Bretagne',
+    region: 'Bretagne',
+    departement: 'Ille-et-Vilaine',
+    departementCode: '35',
+    population: '9 000',
+    codePostal: '35131',
+  },
+  { slug: 'perigny', name: 'Périgny', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '9 000', codePostal: '17180' },
+  { slug: 'bessancourt', name: 'Bessancourt', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '9 000', codePostal: '95550' },
+  { slug: 'saint-jean-de-monts', name: 'Saint-Jean-de-Monts', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '9 000', codePostal: '85160' },
+  { slug: 'gouvieux', name: 'Gouvieux', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '9 000', codePostal: '60270' },
+  { slug: 'nangis', name: 'Nangis', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '9 000', codePostal: '77370' },
+  { slug: 'pithiviers', name: 'Pithiviers', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '9 000', codePostal: '45300' },
+  { slug: 'golbey', name: 'Golbey', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '9 000', codePostal: '88190' },
+  {
+    slug: 'gretz-armainvilliers',
+    name: 'Gretz-Armainvilliers',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '9 000',
+    codePostal: '77220',
+  },
+  {
+    slug: 'monistrol-sur-loire',
+    name: 'Monistrol-sur-Loire',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Loire',
+    departementCode: '43',
+    population: '9 000',
+    codePostal: '43120',
+  },
+  { slug: 'ombree-d-anjou', name: 'Ombrée d\'Anjou', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '9 000', codePostal: '49420' },
+  { slug: 'le-portel', name: 'Le Portel', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '9 000', codePostal: '62480' },
+  { slug: 'sarlat-la-caneda', name: 'Sarlat-la-Canéda', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '9 000', codePostal: '24200' },
+  {
+    slug: 'la-chapelle-d-armentieres',
+    name: 'La Chapelle-d\'Armentières',
+    region: 'Hauts-de-France',
+    departement: 'Nord',
+    departementCode: '59',
+    population: '9 000',
+    codePostal: '59930',
+  },
+  {
+    slug: 'les-hauts-d-anjou',
+    name: 'Les Hauts-d\'Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '9 000',
+    codePostal: '49330',
+  },
+  { slug: 'la-ferte-bernard', name: 'La Ferté-Bernard', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '8 500', codePostal: '72400' },
+  { slug: 'le-teil', name: 'Le Teil', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '8 500', codePostal: '07400' },
+  { slug: 'wingles', name: 'Wingles', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 500', codePostal: '62410' },
+  { slug: 'beauzelle', name: 'Beauzelle', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '8 500', codePostal: '31700' },
+  { slug: 'lempdes', name: 'Lempdes', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '8 500', codePostal: '63370' },
+  {
+    slug: 'chamonix-mont-blanc',
+    name: 'Chamonix-Mont-Blanc',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '8 500',
+    codePostal: '74400',
+  },
+  { slug: 'soustons', name: 'Soustons', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '8 500', codePostal: '40140' },
+  { slug: 'aigues-mortes', name: 'Aigues-Mortes', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 500', codePostal: '30220' },
+  {
+    slug: 'l-ile-saint-denis',
+    name: 'L\'Île-Saint-Denis',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '8 500',
+    codePostal: '93450',
+  },
+  {
+    slug: 'artigues-pres-bordeaux',
+    name: 'Artigues-près-Bordeaux',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '8 500',
+    codePostal: '33370',
+  },
+  { slug: 'plabennec', name: 'Plabennec', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '8 500', codePostal: '29860' },
+  { slug: 'petit-couronne', name: 'Petit-Couronne', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '8 500', codePostal: '76650' },
+  { slug: 'coutras', name: 'Coutras', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '8 500', codePostal: '33230' },
+  { slug: 'margny-les-compiegne', name: 'Margny-lès-Compiègne', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '8 500', codePostal: '60280' },
+  {
+    slug: 'saint-chamas',
+    name: 'Saint-Chamas',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '8 500',
+    codePostal: '13250',
+  },
+  { slug: 'essey-les-nancy', name: 'Essey-lès-Nancy', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '8 500', codePostal: '54270' },
+  { slug: 'thorigne-fouillard', name: 'Thorigné-Fouillard', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '8 500', codePostal: '35235' },
+  { slug: 'saint-jory', name: 'Saint-Jory', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '8 500', codePostal: '31790' },
+  { slug: 'crest', name: 'Crest', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '8 500', codePostal: '26400' },
+  { slug: 'isbergues', name: 'Isbergues', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 500', codePostal: '62330' },
+  { slug: 'janze', name: 'Janzé', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '8 500', codePostal: '35150' },
+  { slug: 'le-poire-sur-vie', name: 'Le Poiré-sur-Vie', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '8 500', codePostal: '85170' },
+  { slug: 'souleuvre-en-bocage', name: 'Souleuvre en Bocage', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '8 500', codePostal: '14260' },
+  { slug: 'domerat', name: 'Domérat', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '8 500', codePostal: '03410' },
+  { slug: 'marcoussis', name: 'Marcoussis', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '8 500', codePostal: '91460' },
+  { slug: 'aulnoye-aymeries', name: 'Aulnoye-Aymeries', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 500', codePostal: '59620' },
+  { slug: 'crolles', name: 'Crolles', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 500', codePostal: '38920' },
+  { slug: 'ergue-gaberic', name: 'Ergué-Gabéric', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '8 500', codePostal: '29500' },
+  { slug: 'puget-sur-argens', name: 'Puget-sur-Argens', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '8 500', codePostal: '83480' },
+  { slug: 'roussillon', name: 'Roussillon', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 500', codePostal: '38150' },
+  { slug: 'le-grau-du-roi', name: 'Le Grau-du-Roi', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 500', codePostal: '30240' },
+  { slug: 'serignan', name: 'Sérignan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 500', codePostal: '34410' },
+  { slug: 'saint-renan', name: 'Saint-Renan', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '8 500', codePostal: '29290' },
+  {
+    slug: 'port-saint-louis-du-rhone',
+    name: 'Port-Saint-Louis-du-Rhône',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '8 500',
+    codePostal: '13230',
+  },
+  { slug: 'mauleon', name: 'Mauléon', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '8 500', codePostal: '79700' },
+  { slug: 'chantonnay', name: 'Chantonnay', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '8 500', codePostal: '85110' },
+  { slug: 'sautron', name: 'Sautron', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '8 500', codePostal: '44880' },
+  {
+    slug: 'le-loroux-bottereau',
+    name: 'Le Loroux-Bottereau',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '8 500',
+    codePostal: '44430',
+  },
+  { slug: 'rouvroy', name: 'Rouvroy', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 500', codePostal: '62320' },
+  { slug: 'thaon-les-vosges', name: 'Thaon-les-Vosges', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '8 500', codePostal: '88150' },
+  {
+    slug: 'chateauneuf-sur-loire',
+    name: 'Châteauneuf-sur-Loire',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '8 500',
+    codePostal: '45110',
+  },
+  {
+    slug: 'bormes-les-mimosas',
+    name: 'Bormes-les-Mimosas',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '8 500',
+    codePostal: '83230',
+  },
+  {
+    slug: 'varces-allieres-et-risset',
+    name: 'Varces-Allières-et-Risset',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '8 500',
+    codePostal: '38760',
+  },
+  { slug: 'lillebonne', name: 'Lillebonne', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '8 500', codePostal: '76170' },
+  { slug: 'privas', name: 'Privas', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '8 500', codePostal: '07000' },
+  { slug: 'vendin-le-vieil', name: 'Vendin-le-Vieil', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 500', codePostal: '62880' },
+  { slug: 'vif', name: 'Vif', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 500', codePostal: '38450' },
+  { slug: 'uzes', name: 'Uzès', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 500', codePostal: '30700' },
+  { slug: 'le-plessis-bouchard', name: 'Le Plessis-Bouchard', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '8 500', codePostal: '95130' },
+  { slug: 'peymeinade', name: 'Peymeinade', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '8 500', codePostal: '06530' },
+  { slug: 'unieux', name: 'Unieux', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '8 500', codePostal: '42240' },
+  {
+    slug: 'la-salvetat-saint-gilles',
+    name: 'La Salvetat-Saint-Gilles',
+    region: 'Occitanie',
+    departement: 'Haute-Garonne',
+    departementCode: '31',
+    population: '8 500',
+    codePostal: '31880',
+  },
+  {
+    slug: 'saint-vallier',
+    name: 'Saint-Vallier',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '8 500',
+    codePostal: '71230',
+  },
+  { slug: 'theix-noyalo', name: 'Theix-Noyalo', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '8 500', codePostal: '56450' },
+  {
+    slug: 'talmont-saint-hilaire',
+    name: 'Talmont-Saint-Hilaire',
+    region: 'Pays de la Loire',
+    departement: 'Vendée',
+    departementCode: '85',
+    population: '8 500',
+    codePostal: '85440',
+  },
+  { slug: 'le-marin', name: 'Le Marin', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '8 500', codePostal: '97290' },
+  { slug: 'pont-l-abbe', name: 'Pont-l\'Abbé', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '8 500', codePostal: '29120' },
+  { slug: 'le-vauclin', name: 'Le Vauclin', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '8 500', codePostal: '97280' },
+  { slug: 'eguilles', name: 'Éguilles', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '8 500', codePostal: '13510' },
+  { slug: 'onnaing', name: 'Onnaing', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 500', codePostal: '59264' },
+  { slug: 'ballan-mire', name: 'Ballan-Miré', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '8 500', codePostal: '37510' },
+  { slug: 'hirson', name: 'Hirson', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '8 500', codePostal: '02500' },
+  { slug: 'reignier-esery', name: 'Reignier-Ésery', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '8 500', codePostal: '74930' },
+  { slug: 'perenchies', name: 'Pérenchies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 500', codePostal: '59840' },
+  { slug: 'groslay', name: 'Groslay', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '8 500', codePostal: '95410' },
+  { slug: 'tregueux', name: 'Trégueux', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '8 500', codePostal: '22950' },
+  {
+    slug: 'saint-aubin-les-elbeuf',
+    name: 'Saint-Aubin-lès-Elbeuf',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '8 500',
+    codePostal: '76410',
+  },
+  { slug: 'la-grande-motte', name: 'La Grande-Motte', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 500', codePostal: '34280' },
+  { slug: 'bassens', name: 'Bassens', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '8 500', codePostal: '33530' },
+  { slug: 'vaucresson', name: 'Vaucresson', region: 'Île-de-France', departement: 'Hauts-de-Seine', departementCode: '92', population: '8 500', codePostal: '92420' },
+  { slug: 'pignan', name: 'Pignan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 500', codePostal: '34570' },
+  {
+    slug: 'gennes-val-de-loire',
+    name: 'Gennes-Val-de-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '8 500',
+    codePostal: '49160',
+  },
+  { slug: 'venelles', name: 'Venelles', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '8 500', codePostal: '13770' },
+  { slug: 'larmor-plage', name: 'Larmor-Plage', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '8 500', codePostal: '56260' },
+  { slug: 'marseillan', name: 'Marseillan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 500', codePostal: '34340' },
+  { slug: 'trignac', name: 'Trignac', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '8 500', codePostal: '44570' },
+  { slug: 'orchies', name: 'Orchies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 500', codePostal: '59310' },
+  {
+    slug: 'taiarapu-ouest',
+    name: 'Taiarapu-Ouest',
+    region: 'Polynésie française',
+    departement: 'Polynésie française',
+    departementCode: '987',
+    population: '8 500',
+    codePostal: '98723',
+  },
+  { slug: 'feurs', name: 'Feurs', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '8 500', codePostal: '42110' },
+  {
+    slug: 'noyal-chatillon-sur-seiche',
+    name: 'Noyal-Châtillon-sur-Seiche',
+    region: 'Bretagne',
+    departement: 'Ille-et-Vilaine',
+    departementCode: '35',
+    population: '8 500',
+    codePostal: '35230',
+  },
+  { slug: 'marguerittes', name: 'Marguerittes', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 500', codePostal: '30320' },
+  { slug: 'bouaye', name: 'Bouaye', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '8 500', codePostal: '44830' },
+  {
+    slug: 'saint-gilles-croix-de-vie',
+    name: 'Saint-Gilles-Croix-de-Vie',
+    region: 'Pays de la Loire',
+    departement: 'Vendée',
+    departementCode: '85',
+    population: '8 500',
+    codePostal: '85800',
+  },
+  { slug: 'carbon-blanc', name: 'Carbon-Blanc', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '8 500', codePostal: '33560' },
+  { slug: 'coutances', name: 'Coutances', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '8 500', codePostal: '50200' },
+  { slug: 'bihorel', name: 'Bihorel', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '8 500', codePostal: '76420' },
+  {
+    slug: 'saint-pierre-les-elbeuf',
+    name: 'Saint-Pierre-lès-Elbeuf',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '8 500',
+    codePostal: '76320',
+  },
+  { slug: 'chiconi', name: 'Chiconi', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '8 500', codePostal: '97670' },
+  {
+    slug: 'tonnay-charente',
+    name: 'Tonnay-Charente',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '8 500',
+    codePostal: '17430',
+  },
+  { slug: 'harfleur', name: 'Harfleur', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '8 500', codePostal: '76700' },
+  { slug: 'tournan-en-brie', name: 'Tournan-en-Brie', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '8 500', codePostal: '77220' },
+  { slug: 'guilers', name: 'Guilers', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '8 500', codePostal: '29820' },
+  { slug: 'bandol', name: 'Bandol', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '8 500', codePostal: '83150' },
+  { slug: 'brunstatt-didenheim', name: 'Brunstatt-Didenheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '8 500', codePostal: '68350' },
+  { slug: 'evron', name: 'Évron', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '8 500', codePostal: '53150' },
+  { slug: 'meximieux', name: 'Meximieux', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '8 000', codePostal: '01800' },
+  {
+    slug: 'teteghem-coudekerque-village',
+    name: 'Téteghem-Coudekerque-Village',
+    region: 'Hauts-de-France',
+    departement: 'Nord',
+    departementCode: '59',
+    population: '8 000',
+    codePostal: '59229',
+  },
+  { slug: 'thuir', name: 'Thuir', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '8 000', codePostal: '66300' },
+  { slug: 'pegomas', name: 'Pégomas', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '8 000', codePostal: '06580' },
+  { slug: 'malemort', name: 'Malemort', region: 'Nouvelle-Aquitaine', departement: 'Corrèze', departementCode: '19', population: '8 000', codePostal: '19360' },
+  { slug: 'souffelweyersheim', name: 'Souffelweyersheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '8 000', codePostal: '67460' },
+  {
+    slug: 'charnay-les-macon',
+    name: 'Charnay-lès-Mâcon',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '8 000',
+    codePostal: '71850',
+  },
+  { slug: 'donges', name: 'Donges', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '8 000', codePostal: '44480' },
+  { slug: 'mazingarbe', name: 'Mazingarbe', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 000', codePostal: '62670' },
+  { slug: 'petit-canal', name: 'Petit-Canal', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '8 000', codePostal: '97131' },
+  { slug: 'salles', name: 'Salles', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '8 000', codePostal: '33770' },
+  { slug: 'vern-sur-seiche', name: 'Vern-sur-Seiche', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '8 000', codePostal: '35770' },
+  { slug: 'anse', name: 'Anse', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '8 000', codePostal: '69480' },
+  {
+    slug: 'la-colle-sur-loup',
+    name: 'La Colle-sur-Loup',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '8 000',
+    codePostal: '06480',
+  },
+  { slug: 'paray-vieille-poste', name: 'Paray-Vieille-Poste', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '8 000', codePostal: '91550' },
+  {
+    slug: 'ballancourt-sur-essonne',
+    name: 'Ballancourt-sur-Essonne',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '8 000',
+    codePostal: '91610',
+  },
+  { slug: 'le-mesnil-esnard', name: 'Le Mesnil-Esnard', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '8 000', codePostal: '76240' },
+  { slug: 'linselles', name: 'Linselles', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 000', codePostal: '59126' },
+  { slug: 'la-ville-du-bois', name: 'La Ville-du-Bois', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '8 000', codePostal: '91620' },
+  { slug: 'chinon', name: 'Chinon', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '8 000', codePostal: '37500' },
+  { slug: 'questembert', name: 'Questembert', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '8 000', codePostal: '56230' },
+  { slug: 'val-de-briey', name: 'Val de Briey', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '8 000', codePostal: '54150' },
+  { slug: 'coulaines', name: 'Coulaines', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '8 000', codePostal: '72190' },
+  {
+    slug: 'cavalaire-sur-mer',
+    name: 'Cavalaire-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '8 000',
+    codePostal: '83240',
+  },
+  { slug: 'talange', name: 'Talange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '8 000', codePostal: '57525' },
+  { slug: 'rochefort-du-gard', name: 'Rochefort-du-Gard', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 000', codePostal: '30650' },
+  { slug: 'sorbiers', name: 'Sorbiers', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '8 000', codePostal: '42290' },
+  {
+    slug: 'verrieres-en-anjou',
+    name: 'Verrières-en-Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '8 000',
+    codePostal: '49112',
+  },
+  { slug: 'la-tour-du-pin', name: 'La Tour-du-Pin', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38110' },
+  { slug: 'les-arcs', name: 'Les Arcs', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '8 000', codePostal: '83460' },
+  { slug: 'boussy-saint-antoine', name: 'Boussy-Saint-Antoine', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '8 000', codePostal: '91800' },
+  { slug: 'seyssins', name: 'Seyssins', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38180' },
+  { slug: 'uvea', name: 'Uvea', region: 'Wallis et Futuna', departement: 'Wallis et Futuna', departementCode: '986', population: '8 000', codePostal: '98600' },
+  { slug: 'guenange', name: 'Guénange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '8 000', codePostal: '57310' },
+  { slug: 'monts', name: 'Monts', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '8 000', codePostal: '37260' },
+  { slug: 'vineuil', name: 'Vineuil', region: 'Centre-Val de Loire', departement: 'Loir-et-Cher', departementCode: '41', population: '8 000', codePostal: '41350' },
+  { slug: 'wintzenheim', name: 'Wintzenheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '8 000', codePostal: '68124' },
+  {
+    slug: 'martignas-sur-jalle',
+    name: 'Martignas-sur-Jalle',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '8 000',
+    codePostal: '33127',
+  },
+  { slug: 'jarny', name: 'Jarny', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '8 000', codePostal: '54800' },
+  { slug: 'kone', name: 'Koné', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '8 000', codePostal: '98859' },
+  { slug: 'languidic', name: 'Languidic', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '8 000', codePostal: '56440' },
+  { slug: 'la-ricamarie', name: 'La Ricamarie', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '8 000', codePostal: '42150' },
+  { slug: 'champagnole', name: 'Champagnole', region: 'Bourgogne-Franche-Comté', departement: 'Jura', departementCode: '39', population: '8 000', codePostal: '39300' },
+  { slug: 'bellegarde', name: 'Bellegarde', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '8 000', codePostal: '30127' },
+  { slug: 'gleize', name: 'Gleizé', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '8 000', codePostal: '69400' },
+  { slug: 'tignieu-jameyzieu', name: 'Tignieu-Jameyzieu', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38230' },
+  { slug: 'aureilhan', name: 'Aureilhan', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '8 000', codePostal: '65800' },
+  { slug: 'beaugency', name: 'Beaugency', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '8 000', codePostal: '45190' },
+  { slug: 'le-malesherbois', name: 'Le Malesherbois', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '8 000', codePostal: '45300' },
+  {
+    slug: 'saint-vincent-de-tyrosse',
+    name: 'Saint-Vincent-de-Tyrosse',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Landes',
+    departementCode: '40',
+    population: '8 000',
+    codePostal: '40230',
+  },
+  { slug: 'vaujours', name: 'Vaujours', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '8 000', codePostal: '93410' },
+  { slug: 'aussonne', name: 'Aussonne', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '8 000', codePostal: '31840' },
+  { slug: 'isle', name: 'Isle', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '8 000', codePostal: '87170' },
+  { slug: 'louveciennes', name: 'Louveciennes', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '8 000', codePostal: '78430' },
+  { slug: 'linas', name: 'Linas', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '8 000', codePostal: '91310' },
+  { slug: 'jouy-en-josas', name: 'Jouy-en-Josas', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '8 000', codePostal: '78350' },
+  { slug: 'libercourt', name: 'Libercourt', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 000', codePostal: '62820' },
+  { slug: 'le-soler', name: 'Le Soler', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '8 000', codePostal: '66270' },
+  { slug: 'saint-affrique', name: 'Saint-Affrique', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '8 000', codePostal: '12400' },
+  { slug: 'langueux', name: 'Langueux', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '8 000', codePostal: '22360' },
+  { slug: 'billy-montigny', name: 'Billy-Montigny', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 000', codePostal: '62420' },
+  { slug: 'houplines', name: 'Houplines', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 000', codePostal: '59116' },
+  { slug: 'geispolsheim', name: 'Geispolsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '8 000', codePostal: '67118' },
+  { slug: 'mordelles', name: 'Mordelles', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '8 000', codePostal: '35310' },
+  { slug: 'lege-cap-ferret', name: 'Lège-Cap-Ferret', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '8 000', codePostal: '33950' },
+  { slug: 'contes', name: 'Contes', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '8 000', codePostal: '06390' },
+  { slug: 'ustaritz', name: 'Ustaritz', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '8 000', codePostal: '64480' },
+  { slug: 'romagnat', name: 'Romagnat', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '8 000', codePostal: '63540' },
+  {
+    slug: 'saint-julien-de-concelles',
+    name: 'Saint-Julien-de-Concelles',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '8 000',
+    codePostal: '44450',
+  },
+  { slug: 'lure', name: 'Lure', region: 'Bourgogne-Franche-Comté', departement: 'Haute-Saône', departementCode: '70', population: '8 000', codePostal: '70200' },
+  { slug: 'achicourt', name: 'Achicourt', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '8 000', codePostal: '62217' },
+  { slug: 'gargenville', name: 'Gargenville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '8 000', codePostal: '78440' },
+  {
+    slug: 'saint-pierre-en-faucigny',
+    name: 'Saint-Pierre-en-Faucigny',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '8 000',
+    codePostal: '74800',
+  },
+  { slug: 'publier', name: 'Publier', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '8 000', codePostal: '74500' },
+  {
+    slug: 'sisteron',
+    name: 'Sisteron',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '8 000',
+    codePostal: '04200',
+  },
+  { slug: 'cappelle-la-grande', name: 'Cappelle-la-Grande', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 000', codePostal: '59180' },
+  { slug: 'claix', name: 'Claix', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38640' },
+  {
+    slug: 'coulounieix-chamiers',
+    name: 'Coulounieix-Chamiers',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Dordogne',
+    departementCode: '24',
+    population: '8 000',
+    codePostal: '24660',
+  },
+  { slug: 'bompas', name: 'Bompas', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '8 000', codePostal: '66430' },
+  {
+    slug: 'courcelles-les-lens',
+    name: 'Courcelles-lès-Lens',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '8 000',
+    codePostal: '62970',
+  },
+  { slug: 'baillargues', name: 'Baillargues', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 000', codePostal: '34670' },
+  { slug: 'malzeville', name: 'Malzéville', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '8 000', codePostal: '54220' },
+  { slug: 'corte', name: 'Corte', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '8 000', codePostal: '20250' },
+  { slug: 'moirans', name: 'Moirans', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38430' },
+  { slug: 'neuville-sur-saone', name: 'Neuville-sur-Saône', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '8 000', codePostal: '69250' },
+  { slug: 'montreuil-juigne', name: 'Montreuil-Juigné', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '8 000', codePostal: '49460' },
+  { slug: 'lagord', name: 'Lagord', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '8 000', codePostal: '17140' },
+  { slug: 'terville', name: 'Terville', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '8 000', codePostal: '57180' },
+  { slug: 'pezenas', name: 'Pézenas', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '8 000', codePostal: '34120' },
+  { slug: 'la-verpilliere', name: 'La Verpillière', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '8 000', codePostal: '38290' },
+  {
+    slug: 'saint-etienne-de-montluc',
+    name: 'Saint-Étienne-de-Montluc',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '8 000',
+    codePostal: '44360',
+  },
+  { slug: 'hettange-grande', name: 'Hettange-Grande', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '8 000', codePostal: '57330' },
+  { slug: 'chessy', name: 'Chessy', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '8 000', codePostal: '77700' },
+  {
+    slug: 'saint-aubin-de-medoc',
+    name: 'Saint-Aubin-de-Médoc',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '8 000',
+    codePostal: '33160',
+  },
+  { slug: 'saint-denis-en-val', name: 'Saint-Denis-en-Val', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '8 000', codePostal: '45560' },
+  { slug: 'la-couronne', name: 'La Couronne', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '8 000', codePostal: '16400' },
+  { slug: 'nieppe', name: 'Nieppe', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 000', codePostal: '59850' },
+  { slug: 'thann', name: 'Thann', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '8 000', codePostal: '68800' },
+  { slug: 'cranves-sales', name: 'Cranves-Sales', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '8 000', codePostal: '74380' },
+  { slug: 'wavrin', name: 'Wavrin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '8 000', codePostal: '59136' },
+  { slug: 'lys-haut-layon', name: 'Lys-Haut-Layon', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '7 500', codePostal: '49310' },
+  {
+    slug: 'saint-remy-les-chevreuse',
+    name: 'Saint-Rémy-lès-Chevreuse',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '7 500',
+    codePostal: '78470',
+  },
+  { slug: 'noisy-le-roi', name: 'Noisy-le-Roi', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 500', codePostal: '78590' },
+  { slug: 'les-andelys', name: 'Les Andelys', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '7 500', codePostal: '27700' },
+  { slug: 'mtsamboro', name: 'Mtsamboro', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '7 500', codePostal: '97630' },
+  { slug: 'beynes', name: 'Beynes', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 500', codePostal: '78650' },
+  { slug: 'saint-marcellin', name: 'Saint-Marcellin', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38160' },
+  {
+    slug: 'les-avenieres-veyrins-thuellin',
+    name: 'Les Avenières Veyrins-Thuellin',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '7 500',
+    codePostal: '38630',
+  },
+  { slug: 'emerainville', name: 'Émerainville', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '7 500', codePostal: '77184' },
+  {
+    slug: 'machecoul-saint-meme',
+    name: 'Machecoul-Saint-Même',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 500',
+    codePostal: '44270',
+  },
+  { slug: 'bidart', name: 'Bidart', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '7 500', codePostal: '64210' },
+  { slug: 'pluvigner', name: 'Pluvigner', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '7 500', codePostal: '56330' },
+  { slug: 'falaise', name: 'Falaise', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '7 500', codePostal: '14700' },
+  { slug: 'langon', name: 'Langon', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '7 500', codePostal: '33210' },
+  { slug: 'bain-de-bretagne', name: 'Bain-de-Bretagne', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 500', codePostal: '35470' },
+  { slug: 'mimizan', name: 'Mimizan', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '7 500', codePostal: '40200' },
+  { slug: 'villars', name: 'Villars', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '7 500', codePostal: '42390' },
+  { slug: 'l-aigle', name: 'L\'Aigle', region: 'Normandie', departement: 'Orne', departementCode: '61', population: '7 500', codePostal: '61300' },
+  {
+    slug: 'bourg-saint-andeol',
+    name: 'Bourg-Saint-Andéol',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Ardèche',
+    departementCode: '07',
+    population: '7 500',
+    codePostal: '07700',
+  },
+  { slug: 'biguglia', name: 'Biguglia', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '7 500', codePostal: '20620' },
+  { slug: 'hasparren', name: 'Hasparren', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '7 500', codePostal: '64240' },
+  { slug: 'tullins', name: 'Tullins', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38210' },
+  { slug: 'saint-prix', name: 'Saint-Prix', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '7 500', codePostal: '95390' },
+  { slug: 'deols', name: 'Déols', region: 'Centre-Val de Loire', departement: 'Indre', departementCode: '36', population: '7 500', codePostal: '36130' },
+  {
+    slug: 'saint-maixent-l-ecole',
+    name: 'Saint-Maixent-l\'École',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Deux-Sèvres',
+    departementCode: '79',
+    population: '7 500',
+    codePostal: '79400',
+  },
+  { slug: 'loireauxence', name: 'Loireauxence', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 500', codePostal: '44370' },
+  { slug: 'parentis-en-born', name: 'Parentis-en-Born', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '7 500', codePostal: '40160' },
+  { slug: 'auxonne', name: 'Auxonne', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '7 500', codePostal: '21130' },
+  { slug: 'gerardmer', name: 'Gérardmer', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '7 500', codePostal: '88400' },
+  { slug: 'saint-peray', name: 'Saint-Péray', region: 'Auvergne-Rhône-Alpes', departement: 'Ardèche', departementCode: '07', population: '7 500', codePostal: '07130' },
+  {
+    slug: 'sausset-les-pins',
+    name: 'Sausset-les-Pins',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '7 500',
+    codePostal: '13960',
+  },
+  { slug: 'lesneven', name: 'Lesneven', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 500', codePostal: '29260' },
+  { slug: 'wissembourg', name: 'Wissembourg', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '7 500', codePostal: '67160' },
+  { slug: 'goyave', name: 'Goyave', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '7 500', codePostal: '97128' },
+  { slug: 'rosporden', name: 'Rosporden', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 500', codePostal: '29140' },
+  {
+    slug: 'faverges-seythenex',
+    name: 'Faverges-Seythenex',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '7 500',
+    codePostal: '74210',
+  },
+  {
+    slug: 'saint-apollinaire',
+    name: 'Saint-Apollinaire',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '7 500',
+    codePostal: '21850',
+  },
+  { slug: 'melesse', name: 'Melesse', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 500', codePostal: '35520' },
+  {
+    slug: 'saint-yrieix-sur-charente',
+    name: 'Saint-Yrieix-sur-Charente',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente',
+    departementCode: '16',
+    population: '7 500',
+    codePostal: '16710',
+  },
+  { slug: 'suce-sur-erdre', name: 'Sucé-sur-Erdre', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 500', codePostal: '44240' },
+  { slug: 'chateaubourg', name: 'Châteaubourg', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 500', codePostal: '35220' },
+  { slug: 'jaunay-marigny', name: 'Jaunay-Marigny', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '7 500', codePostal: '86130' },
+  {
+    slug: 'saint-jean-de-maurienne',
+    name: 'Saint-Jean-de-Maurienne',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Savoie',
+    departementCode: '73',
+    population: '7 500',
+    codePostal: '73300',
+  },
+  { slug: 'ceret', name: 'Céret', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '7 500', codePostal: '66400' },
+  { slug: 'villard-bonnot', name: 'Villard-Bonnot', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38190' },
+  { slug: 'crozon', name: 'Crozon', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 500', codePostal: '29160' },
+  { slug: 'huningue', name: 'Huningue', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '7 500', codePostal: '68330' },
+  { slug: 'saint-berthevin', name: 'Saint-Berthevin', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '7 500', codePostal: '53940' },
+  {
+    slug: 'saint-germain-les-corbeil',
+    name: 'Saint-Germain-lès-Corbeil',
+    region: 'Île-de-France',
+    departement: 'Essonne',
+    departementCode: '91',
+    population: '7 500',
+    codePostal: '91250',
+  },
+  { slug: 'pordic', name: 'Pordic', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '7 500', codePostal: '22590' },
+  { slug: 'clisson', name: 'Clisson', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 500', codePostal: '44190' },
+  { slug: 'toulouges', name: 'Toulouges', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '7 500', codePostal: '66350' },
+  { slug: 'fabregues', name: 'Fabrègues', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 500', codePostal: '34690' },
+  { slug: 'rethel', name: 'Rethel', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '7 500', codePostal: '08300' },
+  { slug: 'saujon', name: 'Saujon', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '7 500', codePostal: '17600' },
+  { slug: 'chaumes-en-retz', name: 'Chaumes-en-Retz', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 500', codePostal: '44320' },
+  {
+    slug: 'saint-didier-au-mont-d-or',
+    name: 'Saint-Didier-au-Mont-d\'Or',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '7 500',
+    codePostal: '69370',
+  },
+  { slug: 'langres', name: 'Langres', region: 'Grand Est', departement: 'Haute-Marne', departementCode: '52', population: '7 500', codePostal: '52200' },
+  { slug: 'soisy-sur-seine', name: 'Soisy-sur-Seine', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 500', codePostal: '91450' },
+  { slug: 'yssingeaux', name: 'Yssingeaux', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Loire', departementCode: '43', population: '7 500', codePostal: '43200' },
+  { slug: 'trois-rivieres', name: 'Trois-Rivières', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '7 500', codePostal: '97114' },
+  { slug: 'carhaix-plouguer', name: 'Carhaix-Plouguer', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 500', codePostal: '29270' },
+  { slug: 'lagnieu', name: 'Lagnieu', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '7 500', codePostal: '01150' },
+  { slug: 'ruelle-sur-touvre', name: 'Ruelle-sur-Touvre', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '7 500', codePostal: '16600' },
+  { slug: 'remiremont', name: 'Remiremont', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '7 500', codePostal: '88200' },
+  { slug: 'gieres', name: 'Gières', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38610' },
+  { slug: 'lisses', name: 'Lisses', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 500', codePostal: '91090' },
+  { slug: 'trelissac', name: 'Trélissac', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '7 500', codePostal: '24750' },
+  { slug: 'cournonterral', name: 'Cournonterral', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 500', codePostal: '34660' },
+  {
+    slug: 'saint-nicolas-de-port',
+    name: 'Saint-Nicolas-de-Port',
+    region: 'Grand Est',
+    departement: 'Meurthe-et-Moselle',
+    departementCode: '54',
+    population: '7 500',
+    codePostal: '54210',
+  },
+  { slug: 'audun-le-tiche', name: 'Audun-le-Tiche', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '7 500', codePostal: '57390' },
+  { slug: 'guipry-messac', name: 'Guipry-Messac', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 500', codePostal: '35480' },
+  { slug: 'fresnes-sur-escaut', name: 'Fresnes-sur-Escaut', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 500', codePostal: '59970' },
+  { slug: 'digoin', name: 'Digoin', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '7 500', codePostal: '71160' },
+  { slug: 'pontcharra', name: 'Pontcharra', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38530' },
+  { slug: 'paimpol', name: 'Paimpol', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '7 500', codePostal: '22500' },
+  { slug: 'lanton', name: 'Lanton', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '7 500', codePostal: '33138' },
+  { slug: 'perros-guirec', name: 'Perros-Guirec', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '7 500', codePostal: '22700' },
+  { slug: 'villemoisson-sur-orge', name: 'Villemoisson-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 500', codePostal: '91360' },
+  { slug: 'barlin', name: 'Barlin', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '7 500', codePostal: '62620' },
+  { slug: 'courtry', name: 'Courtry', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '7 500', codePostal: '77181' },
+  { slug: 'rosny-sur-seine', name: 'Rosny-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 500', codePostal: '78710' },
+  {
+    slug: 'gournay-sur-marne',
+    name: 'Gournay-sur-Marne',
+    region: 'Île-de-France',
+    departement: 'Seine-Saint-Denis',
+    departementCode: '93',
+    population: '7 500',
+    codePostal: '93460',
+  },
+  { slug: 'moyeuvre-grande', name: 'Moyeuvre-Grande', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '7 500', codePostal: '57250' },
+  { slug: 'courdimanche', name: 'Courdimanche', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '7 500', codePostal: '95800' },
+  { slug: 'saint-christol-lez-ales', name: 'Saint-Christol-lez-Alès', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '7 500', codePostal: '30380' },
+  {
+    slug: 'nanteuil-les-meaux',
+    name: 'Nanteuil-lès-Meaux',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '7 500',
+    codePostal: '77100',
+  },
+  { slug: 'gourbeyre', name: 'Gourbeyre', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '7 500', codePostal: '97113' },
+  { slug: 'ensisheim', name: 'Ensisheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '7 500', codePostal: '68190' },
+  {
+    slug: 'roquefort-les-pins',
+    name: 'Roquefort-les-Pins',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '7 500',
+    codePostal: '06330',
+  },
+  { slug: 'le-pian-medoc', name: 'Le Pian-Médoc', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '7 500', codePostal: '33290' },
+  { slug: 'vizille', name: 'Vizille', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 500', codePostal: '38220' },
+  {
+    slug: 'la-ferte-saint-aubin',
+    name: 'La Ferté-Saint-Aubin',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '7 500',
+    codePostal: '45240',
+  },
+  {
+    slug: 'montoir-de-bretagne',
+    name: 'Montoir-de-Bretagne',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 500',
+    codePostal: '44550',
+  },
+  {
+    slug: 'le-mesnil-saint-denis',
+    name: 'Le Mesnil-Saint-Denis',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '7 500',
+    codePostal: '78320',
+  },
+  {
+    slug: 'bourg-saint-maurice',
+    name: 'Bourg-Saint-Maurice',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Savoie',
+    departementCode: '73',
+    population: '7 500',
+    codePostal: '73700',
+  },
+  { slug: 'salazie', name: 'Salazie', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '7 500', codePostal: '97433' },
+  { slug: 'waziers', name: 'Waziers', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 500', codePostal: '59119' },
+  { slug: 'la-gaude', name: 'La Gaude', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '7 500', codePostal: '06610' },
+  {
+    slug: 'saint-pee-sur-nivelle',
+    name: 'Saint-Pée-sur-Nivelle',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Pyrénées-Atlantiques',
+    departementCode: '64',
+    population: '7 500',
+    codePostal: '64310',
+  },
+  { slug: 'vendargues', name: 'Vendargues', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 500', codePostal: '34740' },
+  {
+    slug: 'divatte-sur-loire',
+    name: 'Divatte-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 500',
+    codePostal: '44450',
+  },
+  { slug: 'orgeval', name: 'Orgeval', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 500', codePostal: '78630' },
+  { slug: 'lodeve', name: 'Lodève', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 500', codePostal: '34700' },
+  { slug: 'colombelles', name: 'Colombelles', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '7 000', codePostal: '14460' },
+  { slug: 'mably', name: 'Mably', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '7 000', codePostal: '42300' },
+  { slug: 'herbignac', name: 'Herbignac', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 000', codePostal: '44410' },
+  { slug: 'chauray', name: 'Chauray', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '7 000', codePostal: '79180' },
+  { slug: 'les-trois-bassins', name: 'Les Trois-Bassins', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '7 000', codePostal: '97426' },
+  { slug: 'caudan', name: 'Caudan', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '7 000', codePostal: '56850' },
+  { slug: 'kervignac', name: 'Kervignac', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '7 000', codePostal: '56700' },
+  { slug: 'templeuve-en-pevele', name: 'Templeuve-en-Pévèle', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59242' },
+  { slug: 'ecouen', name: 'Écouen', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '7 000', codePostal: '95440' },
+  { slug: 'sainte-pazanne', name: 'Sainte-Pazanne', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '7 000', codePostal: '44680' },
+  {
+    slug: 'verneuil-d-avre-et-d-iton',
+    name: 'Verneuil d\'Avre et d\'Iton',
+    region: 'Normandie',
+    departement: 'Eure',
+    departementCode: '27',
+    population: '7 000',
+    codePostal: '27130',
+  },
+  {
+    slug: 'aubigny-les-clouzeaux',
+    name: 'Aubigny-Les Clouzeaux',
+    region: 'Pays de la Loire',
+    departement: 'Vendée',
+    departementCode: '85',
+    population: '7 000',
+    codePostal: '85430',
+  },
+  { slug: 'labenne', name: 'Labenne', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '7 000', codePostal: '40530' },
+  { slug: 'montauroux', name: 'Montauroux', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '7 000', codePostal: '83440' },
+  { slug: 'entre-deux', name: 'Entre-Deux', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '7 000', codePostal: '97414' },
+  { slug: 'pleurtuit', name: 'Pleurtuit', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 000', codePostal: '35730' },
+  { slug: 'egly', name: 'Égly', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 000', codePostal: '91520' },
+  { slug: 'saint-ismier', name: 'Saint-Ismier', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 000', codePostal: '38330' },
+  { slug: 'eckbolsheim', name: 'Eckbolsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '7 000', codePostal: '67201' },
+  { slug: 'ugine', name: 'Ugine', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '7 000', codePostal: '73400' },
+  { slug: 'wissous', name: 'Wissous', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 000', codePostal: '91320' },
+  { slug: 'tregunc', name: 'Trégunc', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 000', codePostal: '29910' },
+  { slug: 'balaruc-les-bains', name: 'Balaruc-les-Bains', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 000', codePostal: '34540' },
+  { slug: 'la-talaudiere', name: 'La Talaudière', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '7 000', codePostal: '42350' },
+  { slug: 'eyguieres', name: 'Eyguières', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '7 000', codePostal: '13430' },
+  { slug: 'bagneres-de-bigorre', name: 'Bagnères-de-Bigorre', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '7 000', codePostal: '65200' },
+  { slug: 'guingamp', name: 'Guingamp', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '7 000', codePostal: '22200' },
+  { slug: 'viriat', name: 'Viriat', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '7 000', codePostal: '01440' },
+  { slug: 'saint-pierre-en-auge', name: 'Saint-Pierre-en-Auge', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '7 000', codePostal: '14140' },
+  {
+    slug: 'pont-saint-martin',
+    name: 'Pont-Saint-Martin',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 000',
+    codePostal: '44860',
+  },
+  { slug: 'peronne', name: 'Péronne', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '7 000', codePostal: '80200' },
+  { slug: 'auby', name: 'Auby', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59950' },
+  {
+    slug: 'aulnoy-lez-valenciennes',
+    name: 'Aulnoy-lez-Valenciennes',
+    region: 'Hauts-de-France',
+    departement: 'Nord',
+    departementCode: '59',
+    population: '7 000',
+    codePostal: '59300',
+  },
+  { slug: 'villemandeur', name: 'Villemandeur', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '7 000', codePostal: '45700' },
+  { slug: 'vieux-habitants', name: 'Vieux-Habitants', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '7 000', codePostal: '97119' },
+  {
+    slug: 'notre-dame-de-bondeville',
+    name: 'Notre-Dame-de-Bondeville',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '7 000',
+    codePostal: '76960',
+  },
+  {
+    slug: 'grandchamp-des-fontaines',
+    name: 'Grandchamp-des-Fontaines',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 000',
+    codePostal: '44119',
+  },
+  { slug: 'leforest', name: 'Leforest', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '7 000', codePostal: '62790' },
+  { slug: 'barr', name: 'Barr', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '7 000', codePostal: '67140' },
+  { slug: 'brech', name: 'Brech', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '7 000', codePostal: '56400' },
+  { slug: 'manduel', name: 'Manduel', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '7 000', codePostal: '30129' },
+  {
+    slug: 'binic-etables-sur-mer',
+    name: 'Binic-Étables-sur-Mer',
+    region: 'Bretagne',
+    departement: 'Côtes-d\'Armor',
+    departementCode: '22',
+    population: '7 000',
+    codePostal: '22520',
+  },
+  { slug: 'jurancon', name: 'Jurançon', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '7 000', codePostal: '64110' },
+  { slug: 'epone', name: 'Épône', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 000', codePostal: '78680' },
+  { slug: 'uckange', name: 'Uckange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '7 000', codePostal: '57270' },
+  { slug: 'sathonay-camp', name: 'Sathonay-Camp', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '7 000', codePostal: '69580' },
+  { slug: 'trevoux', name: 'Trévoux', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '7 000', codePostal: '01600' },
+  {
+    slug: 'saint-andre-des-eaux',
+    name: 'Saint-André-des-Eaux',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '7 000',
+    codePostal: '44117',
+  },
+  { slug: 'soultz-haut-rhin', name: 'Soultz-Haut-Rhin', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '7 000', codePostal: '68360' },
+  { slug: 'chauvigny', name: 'Chauvigny', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '7 000', codePostal: '86300' },
+  { slug: 'sainte-adresse', name: 'Sainte-Adresse', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '7 000', codePostal: '76310' },
+  {
+    slug: 'castelnau-d-estretefonds',
+    name: 'Castelnau-d\'Estrétefonds',
+    region: 'Occitanie',
+    departement: 'Haute-Garonne',
+    departementCode: '31',
+    population: '7 000',
+    codePostal: '31620',
+  },
+  {
+    slug: 'saint-rambert-d-albon',
+    name: 'Saint-Rambert-d\'Albon',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Drôme',
+    departementCode: '26',
+    population: '7 000',
+    codePostal: '26140',
+  },
+  { slug: 'nerac', name: 'Nérac', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '7 000', codePostal: '47600' },
+  { slug: 'marsillargues', name: 'Marsillargues', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 000', codePostal: '34590' },
+  { slug: 'etrechy', name: 'Étréchy', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '7 000', codePostal: '91580' },
+  {
+    slug: 'saint-bonnet-de-mure',
+    name: 'Saint-Bonnet-de-Mure',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '7 000',
+    codePostal: '69720',
+  },
+  {
+    slug: 'bailly-romainvilliers',
+    name: 'Bailly-Romainvilliers',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '7 000',
+    codePostal: '77700',
+  },
+  { slug: 'betheny', name: 'Bétheny', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '7 000', codePostal: '51450' },
+  { slug: 'valognes', name: 'Valognes', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '7 000', codePostal: '50700' },
+  {
+    slug: 'fontaines-sur-saone',
+    name: 'Fontaines-sur-Saône',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '7 000',
+    codePostal: '69270',
+  },
+  { slug: 'cognin', name: 'Cognin', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '7 000', codePostal: '73160' },
+  { slug: 'morteau', name: 'Morteau', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '7 000', codePostal: '25500' },
+  { slug: 'luisant', name: 'Luisant', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '7 000', codePostal: '28600' },
+  { slug: 'houdain', name: 'Houdain', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '7 000', codePostal: '62150' },
+  { slug: 'saint-pol-de-leon', name: 'Saint-Pol-de-Léon', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 000', codePostal: '29250' },
+  {
+    slug: 'la-plaine-des-palmistes',
+    name: 'La Plaine-des-Palmistes',
+    region: 'La Réunion',
+    departement: 'La Réunion',
+    departementCode: '974',
+    population: '7 000',
+    codePostal: '97431',
+  },
+  { slug: 'pledran', name: 'Plédran', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '7 000', codePostal: '22960' },
+  { slug: 'bourbourg', name: 'Bourbourg', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59630' },
+  { slug: 'senas', name: 'Sénas', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '7 000', codePostal: '13560' },
+  { slug: 'escalquens', name: 'Escalquens', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '7 000', codePostal: '31750' },
+  { slug: 'jacou', name: 'Jacou', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 000', codePostal: '34830' },
+  { slug: 'lucciana', name: 'Lucciana', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '7 000', codePostal: '20290' },
+  { slug: 'lesigny', name: 'Lésigny', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '7 000', codePostal: '77150' },
+  { slug: 'change', name: 'Changé', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '7 000', codePostal: '72560' },
+  { slug: 'cadaujac', name: 'Cadaujac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '7 000', codePostal: '33140' },
+  {
+    slug: 'trans-en-provence',
+    name: 'Trans-en-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '7 000',
+    codePostal: '83720',
+  },
+  {
+    slug: 'beaufort-en-anjou',
+    name: 'Beaufort-en-Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '7 000',
+    codePostal: '49250',
+  },
+  { slug: 'surgeres', name: 'Surgères', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '7 000', codePostal: '17700' },
+  { slug: 'montluel', name: 'Montluel', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '7 000', codePostal: '01120' },
+  {
+    slug: 'saint-maurice-l-exil',
+    name: 'Saint-Maurice-l\'Exil',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '7 000',
+    codePostal: '38550',
+  },
+  { slug: 'castries', name: 'Castries', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 000', codePostal: '34160' },
+  { slug: 'acigne', name: 'Acigné', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 000', codePostal: '35690' },
+  {
+    slug: 'carnoux-en-provence',
+    name: 'Carnoux-en-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '7 000',
+    codePostal: '13470',
+  },
+  { slug: 'veigne', name: 'Veigné', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '7 000', codePostal: '37250' },
+  { slug: 'auvers-sur-oise', name: 'Auvers-sur-Oise', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '7 000', codePostal: '95430' },
+  {
+    slug: 'le-controis-en-sologne',
+    name: 'Le Controis-en-Sologne',
+    region: 'Centre-Val de Loire',
+    departement: 'Loir-et-Cher',
+    departementCode: '41',
+    population: '7 000',
+    codePostal: '41120',
+  },
+  {
+    slug: 'noyelles-sous-lens',
+    name: 'Noyelles-sous-Lens',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '7 000',
+    codePostal: '62221',
+  },
+  { slug: 'lutterbach', name: 'Lutterbach', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '7 000', codePostal: '68460' },
+  { slug: 'essarts-en-bocage', name: 'Essarts-en-Bocage', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '7 000', codePostal: '85140' },
+  {
+    slug: 'les-abrets-en-dauphine',
+    name: 'Les Abrets en Dauphiné',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '7 000',
+    codePostal: '38490',
+  },
+  { slug: 'le-coteau', name: 'Le Coteau', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '7 000', codePostal: '42120' },
+  { slug: 'loudun', name: 'Loudun', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '7 000', codePostal: '86200' },
+  { slug: 'laudun-l-ardoise', name: 'Laudun-l\'Ardoise', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '7 000', codePostal: '30290' },
+  { slug: 'domene', name: 'Domène', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '7 000', codePostal: '38420' },
+  { slug: 'chabeuil', name: 'Chabeuil', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '7 000', codePostal: '26120' },
+  {
+    slug: 'saint-thibault-des-vignes',
+    name: 'Saint-Thibault-des-Vignes',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '7 000',
+    codePostal: '77400',
+  },
+  { slug: 'les-essarts-le-roi', name: 'Les Essarts-le-Roi', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '7 000', codePostal: '78690' },
+  {
+    slug: 'saint-yrieix-la-perche',
+    name: 'Saint-Yrieix-la-Perche',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Haute-Vienne',
+    departementCode: '87',
+    population: '7 000',
+    codePostal: '87500',
+  },
+  { slug: 'nyons', name: 'Nyons', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '7 000', codePostal: '26110' },
+  { slug: 'montfort-sur-meu', name: 'Montfort-sur-Meu', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '7 000', codePostal: '35160' },
+  { slug: 'quesnoy-sur-deule', name: 'Quesnoy-sur-Deûle', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59890' },
+  { slug: 'caussade', name: 'Caussade', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '7 000', codePostal: '82300' },
+  { slug: 'loos-en-gohelle', name: 'Loos-en-Gohelle', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '7 000', codePostal: '62750' },
+  { slug: 'poussan', name: 'Poussan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '7 000', codePostal: '34560' },
+  { slug: 'beuvrages', name: 'Beuvrages', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59192' },
+  { slug: 'douvaine', name: 'Douvaine', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '7 000', codePostal: '74140' },
+  { slug: 'ploeren', name: 'Ploeren', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '7 000', codePostal: '56880' },
+  { slug: 'liancourt', name: 'Liancourt', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '7 000', codePostal: '60140' },
+  {
+    slug: 'saint-jean-d-angely',
+    name: 'Saint-Jean-d\'Angély',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '7 000',
+    codePostal: '17400',
+  },
+  { slug: 'brindas', name: 'Brindas', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '7 000', codePostal: '69126' },
+  { slug: 'divion', name: 'Divion', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '7 000', codePostal: '62460' },
+  { slug: 'puilboreau', name: 'Puilboreau', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '7 000', codePostal: '17138' },
+  { slug: 'le-cateau-cambresis', name: 'Le Cateau-Cambrésis', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '7 000', codePostal: '59360' },
+  { slug: 'saint-julien-les-villas', name: 'Saint-Julien-les-Villas', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '7 000', codePostal: '10800' },
+  { slug: 'merville-31', name: 'Merville', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '7 000', codePostal: '31330' },
+  {
+    slug: 'cambo-les-bains',
+    name: 'Cambo-les-Bains',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Pyrénées-Atlantiques',
+    departementCode: '64',
+    population: '7 000',
+    codePostal: '64250',
+  },
+  { slug: 'plouguerneau', name: 'Plouguerneau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '7 000', codePostal: '29880' },
+  { slug: 'moelan-sur-mer', name: 'Moëlan-sur-Mer', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '6 500', codePostal: '29350' },
+  { slug: 'meyreuil', name: 'Meyreuil', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 500', codePostal: '13590' },
+  { slug: 'gaillon', name: 'Gaillon', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '6 500', codePostal: '27600' },
+  { slug: 'itteville', name: 'Itteville', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 500', codePostal: '91760' },
+  { slug: 'saint-alban-leysse', name: 'Saint-Alban-Leysse', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '6 500', codePostal: '73230' },
+  { slug: 'saulx-les-chartreux', name: 'Saulx-les-Chartreux', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 500', codePostal: '91160' },
+  { slug: 'neufchateau', name: 'Neufchâteau', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '6 500', codePostal: '88300' },
+  {
+    slug: 'saint-victoret',
+    name: 'Saint-Victoret',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 500',
+    codePostal: '13730',
+  },
+  {
+    slug: 'le-peage-de-roussillon',
+    name: 'Le Péage-de-Roussillon',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '6 500',
+    codePostal: '38550',
+  },
+  { slug: 'othis', name: 'Othis', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 500', codePostal: '77280' },
+  { slug: 'feignies', name: 'Feignies', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59750' },
+  {
+    slug: 'vallons-de-l-erdre',
+    name: 'Vallons-de-l\'Erdre',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '6 500',
+    codePostal: '44540',
+  },
+  {
+    slug: 'vigneux-de-bretagne',
+    name: 'Vigneux-de-Bretagne',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '6 500',
+    codePostal: '44360',
+  },
+  { slug: 'inzinzac-lochrist', name: 'Inzinzac-Lochrist', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 500', codePostal: '56650' },
+  { slug: 'migennes', name: 'Migennes', region: 'Bourgogne-Franche-Comté', departement: 'Yonne', departementCode: '89', population: '6 500', codePostal: '89400' },
+  { slug: 'fronton', name: 'Fronton', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 500', codePostal: '31620' },
+  { slug: 'meung-sur-loire', name: 'Meung-sur-Loire', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '6 500', codePostal: '45130' },
+  {
+    slug: 'luxeuil-les-bains',
+    name: 'Luxeuil-les-Bains',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Haute-Saône',
+    departementCode: '70',
+    population: '6 500',
+    codePostal: '70300',
+  },
+  { slug: 'montech', name: 'Montech', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '6 500', codePostal: '82700' },
+  { slug: 'cassis', name: 'Cassis', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 500', codePostal: '13260' },
+  {
+    slug: 'chalonnes-sur-loire',
+    name: 'Chalonnes-sur-Loire',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '6 500',
+    codePostal: '49290',
+  },
+  { slug: 'thones', name: 'Thônes', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74230' },
+  {
+    slug: 'chatelaillon-plage',
+    name: 'Châtelaillon-Plage',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '6 500',
+    codePostal: '17340',
+  },
+  { slug: 'gignac', name: 'Gignac', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 500', codePostal: '34150' },
+  { slug: 'elven', name: 'Elven', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 500', codePostal: '56250' },
+  { slug: 'la-bassee', name: 'La Bassée', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59480' },
+  { slug: 'le-lavandou', name: 'Le Lavandou', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 500', codePostal: '83980' },
+  { slug: 'grenay', name: 'Grenay', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 500', codePostal: '62160' },
+  { slug: 'honfleur', name: 'Honfleur', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 500', codePostal: '14600' },
+  { slug: 'gigean', name: 'Gigean', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 500', codePostal: '34770' },
+  {
+    slug: 'saint-pierre-d-oleron',
+    name: 'Saint-Pierre-d\'Oléron',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '6 500',
+    codePostal: '17310',
+  },
+  {
+    slug: 'laneuveville-devant-nancy',
+    name: 'Laneuveville-devant-Nancy',
+    region: 'Grand Est',
+    departement: 'Meurthe-et-Moselle',
+    departementCode: '54',
+    population: '6 500',
+    codePostal: '54410',
+  },
+  { slug: 'lentilly', name: 'Lentilly', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69210' },
+  { slug: 'sury-le-comtal', name: 'Sury-le-Comtal', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '6 500', codePostal: '42450' },
+  { slug: 'canohes', name: 'Canohès', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '6 500', codePostal: '66680' },
+  { slug: 'loriol-sur-drome', name: 'Loriol-sur-Drôme', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '6 500', codePostal: '26270' },
+  {
+    slug: 'la-penne-sur-huveaune',
+    name: 'La Penne-sur-Huveaune',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 500',
+    codePostal: '13821',
+  },
+  {
+    slug: 'montauban-de-bretagne',
+    name: 'Montauban-de-Bretagne',
+    region: 'Bretagne',
+    departement: 'Ille-et-Vilaine',
+    departementCode: '35',
+    population: '6 500',
+    codePostal: '35360',
+  },
+  { slug: 'bouffemont', name: 'Bouffémont', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '6 500', codePostal: '95570' },
+  { slug: 'ceyrat', name: 'Ceyrat', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '6 500', codePostal: '63122' },
+  { slug: 'chasse-sur-rhone', name: 'Chasse-sur-Rhône', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '6 500', codePostal: '38670' },
+  { slug: 'furiani', name: 'Furiani', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '6 500', codePostal: '20600' },
+  { slug: 'labarthe-sur-leze', name: 'Labarthe-sur-Lèze', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 500', codePostal: '31860' },
+  { slug: 'heric', name: 'Héric', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '6 500', codePostal: '44810' },
+  { slug: 'labruguiere', name: 'Labruguière', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '6 500', codePostal: '81290' },
+  { slug: 'bouchemaine', name: 'Bouchemaine', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '6 500', codePostal: '49080' },
+  { slug: 'gemenos', name: 'Gémenos', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 500', codePostal: '13420' },
+  {
+    slug: 'longuenee-en-anjou',
+    name: 'Longuenée-en-Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '6 500',
+    codePostal: '49220',
+  },
+  { slug: 'thoiry', name: 'Thoiry', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '6 500', codePostal: '01710' },
+  { slug: 'le-lorrain', name: 'Le Lorrain', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '6 500', codePostal: '97214' },
+  { slug: 'longue-jumelles', name: 'Longué-Jumelles', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '6 500', codePostal: '49160' },
+  { slug: 'saint-juery', name: 'Saint-Juéry', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '6 500', codePostal: '81160' },
+  {
+    slug: 'saint-jean-bonnefonds',
+    name: 'Saint-Jean-Bonnefonds',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '6 500',
+    codePostal: '42650',
+  },
+  { slug: 'le-mene', name: 'Le Mené', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '6 500', codePostal: '22330' },
+  { slug: 'champigneulles', name: 'Champigneulles', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 500', codePostal: '54250' },
+  { slug: 'rives', name: 'Rives', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '6 500', codePostal: '38140' },
+  {
+    slug: 'la-bouilladisse',
+    name: 'La Bouilladisse',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 500',
+    codePostal: '13720',
+  },
+  {
+    slug: 'sainte-livrade-sur-lot',
+    name: 'Sainte-Livrade-sur-Lot',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Lot-et-Garonne',
+    departementCode: '47',
+    population: '6 500',
+    codePostal: '47110',
+  },
+  { slug: 'eaunes', name: 'Eaunes', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 500', codePostal: '31600' },
+  { slug: 'la-chevroliere', name: 'La Chevrolière', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '6 500', codePostal: '44118' },
+  { slug: 'marange-silvange', name: 'Marange-Silvange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '6 500', codePostal: '57535' },
+  { slug: 'l-arbresle', name: 'L\'Arbresle', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69210' },
+  { slug: 'saint-alban', name: 'Saint-Alban', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 500', codePostal: '31140' },
+  { slug: 'cormontreuil', name: 'Cormontreuil', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '6 500', codePostal: '51350' },
+  { slug: 'la-mulatiere', name: 'La Mulatière', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69350' },
+  { slug: 'ondres', name: 'Ondres', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '6 500', codePostal: '40440' },
+  { slug: 'bon-encontre', name: 'Bon-Encontre', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '6 500', codePostal: '47240' },
+  { slug: 'lezoux', name: 'Lezoux', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '6 500', codePostal: '63190' },
+  { slug: 'gueugnon', name: 'Gueugnon', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '6 500', codePostal: '71130' },
+  { slug: 'brioude', name: 'Brioude', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Loire', departementCode: '43', population: '6 500', codePostal: '43100' },
+  { slug: 'estaires', name: 'Estaires', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59940' },
+  { slug: 'neuves-maisons', name: 'Neuves-Maisons', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 500', codePostal: '54230' },
+  {
+    slug: 'chatuzange-le-goubet',
+    name: 'Chatuzange-le-Goubet',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Drôme',
+    departementCode: '26',
+    population: '6 500',
+    codePostal: '26300',
+  },
+  { slug: 'ploudalmezeau', name: 'Ploudalmézeau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '6 500', codePostal: '29830' },
+  { slug: 'ambert', name: 'Ambert', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '6 500', codePostal: '63600' },
+  { slug: 'limours', name: 'Limours', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 500', codePostal: '91470' },
+  { slug: 'marignier', name: 'Marignier', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74970' },
+  { slug: 'les-trois-ilets', name: 'Les Trois-Îlets', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '6 500', codePostal: '97229' },
+  { slug: 'la-montagne', name: 'La Montagne', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '6 500', codePostal: '44620' },
+  { slug: 'change-53', name: 'Changé', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '6 500', codePostal: '53810' },
+  { slug: 'gouesnou', name: 'Gouesnou', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '6 500', codePostal: '29850' },
+  { slug: 'eu', name: 'Eu', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '6 500', codePostal: '76260' },
+  {
+    slug: 'champagne-sur-seine',
+    name: 'Champagne-sur-Seine',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '6 500',
+    codePostal: '77430',
+  },
+  { slug: 'calvisson', name: 'Calvisson', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '6 500', codePostal: '30420' },
+  { slug: 'ares', name: 'Arès', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 500', codePostal: '33740' },
+  { slug: 'longpont-sur-orge', name: 'Longpont-sur-Orge', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 500', codePostal: '91310' },
+  { slug: 'villers-saint-paul', name: 'Villers-Saint-Paul', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '6 500', codePostal: '60870' },
+  {
+    slug: 'le-perray-en-yvelines',
+    name: 'Le Perray-en-Yvelines',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '6 500',
+    codePostal: '78610',
+  },
+  { slug: 'saint-pathus', name: 'Saint-Pathus', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 500', codePostal: '77178' },
+  { slug: 'condom', name: 'Condom', region: 'Occitanie', departement: 'Gers', departementCode: '32', population: '6 500', codePostal: '32100' },
+  { slug: 'grezieu-la-varenne', name: 'Grézieu-la-Varenne', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69290' },
+  { slug: 'vezin-le-coquet', name: 'Vezin-le-Coquet', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 500', codePostal: '35132' },
+  {
+    slug: 'saint-priest-en-jarez',
+    name: 'Saint-Priest-en-Jarez',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '6 500',
+    codePostal: '42270',
+  },
+  { slug: 'cuincy', name: 'Cuincy', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59553' },
+  {
+    slug: 'saint-florent-sur-cher',
+    name: 'Saint-Florent-sur-Cher',
+    region: 'Centre-Val de Loire',
+    departement: 'Cher',
+    departementCode: '18',
+    population: '6 500',
+    codePostal: '18400',
+  },
+  { slug: 'entrelacs', name: 'Entrelacs', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '6 500', codePostal: '73410' },
+  {
+    slug: 'saint-laurent-blangy',
+    name: 'Saint-Laurent-Blangy',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '6 500',
+    codePostal: '62223',
+  },
+  { slug: 'ploneour-lanvern', name: 'Plonéour-Lanvern', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '6 500', codePostal: '29720' },
+  { slug: 'sciez', name: 'Sciez', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74140' },
+  { slug: 'louhans', name: 'Louhans', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '6 500', codePostal: '71500' },
+  { slug: 'peronnas', name: 'Péronnas', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '6 500', codePostal: '01960' },
+  { slug: 'frouard', name: 'Frouard', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 500', codePostal: '54390' },
+  { slug: 'bonsecours', name: 'Bonsecours', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '6 500', codePostal: '76240' },
+  { slug: 'm-tsangamouji', name: 'M\'Tsangamouji', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '6 500', codePostal: '97650' },
+  { slug: 'saint-andre-de-sangonis', name: 'Saint-André-de-Sangonis', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 500', codePostal: '34725' },
+  { slug: 'courthezon', name: 'Courthézon', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '6 500', codePostal: '84350' },
+  { slug: 'la-tronche', name: 'La Tronche', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '6 500', codePostal: '38700' },
+  {
+    slug: 'auneau-bleury-saint-symphorien',
+    name: 'Auneau-Bleury-Saint-Symphorien',
+    region: 'Centre-Val de Loire',
+    departement: 'Eure-et-Loir',
+    departementCode: '28',
+    population: '6 500',
+    codePostal: '28700',
+  },
+  { slug: 'embrun', name: 'Embrun', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Hautes-Alpes', departementCode: '05', population: '6 500', codePostal: '05200' },
+  { slug: 'combourg', name: 'Combourg', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 500', codePostal: '35270' },
+  { slug: 'saint-remy', name: 'Saint-Rémy', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '6 500', codePostal: '71100' },
+  { slug: 'murs-erigne', name: 'Mûrs-Erigné', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '6 500', codePostal: '49610' },
+  { slug: 'j-uf', name: 'Jœuf', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 500', codePostal: '54240' },
+  { slug: 'saint-flour', name: 'Saint-Flour', region: 'Auvergne-Rhône-Alpes', departement: 'Cantal', departementCode: '15', population: '6 500', codePostal: '15100' },
+  { slug: 'breal-sous-montfort', name: 'Bréal-sous-Montfort', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 500', codePostal: '35310' },
+  { slug: 'saint-jorioz', name: 'Saint-Jorioz', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74410' },
+  { slug: 'sevremont', name: 'Sèvremont', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '6 500', codePostal: '85700' },
+  { slug: 'magnanville', name: 'Magnanville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 500', codePostal: '78200' },
+  { slug: 'mehun-sur-yevre', name: 'Mehun-sur-Yèvre', region: 'Centre-Val de Loire', departement: 'Cher', departementCode: '18', population: '6 500', codePostal: '18500' },
+  { slug: 'izon', name: 'Izon', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 500', codePostal: '33450' },
+  { slug: 'baud', name: 'Baud', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 500', codePostal: '56150' },
+  { slug: 'givet', name: 'Givet', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '6 500', codePostal: '08600' },
+  { slug: 'plescop', name: 'Plescop', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 500', codePostal: '56890' },
+  { slug: 'arpajon-sur-cere', name: 'Arpajon-sur-Cère', region: 'Auvergne-Rhône-Alpes', departement: 'Cantal', departementCode: '15', population: '6 500', codePostal: '15130' },
+  { slug: 'ambilly', name: 'Ambilly', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74100' },
+  { slug: 'nandy', name: 'Nandy', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 500', codePostal: '77176' },
+  { slug: 'villemur-sur-tarn', name: 'Villemur-sur-Tarn', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 500', codePostal: '31340' },
+  {
+    slug: 'bons-en-chablais',
+    name: 'Bons-en-Chablais',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '6 500',
+    codePostal: '74890',
+  },
+  { slug: 'le-mesnil-le-roi', name: 'Le Mesnil-le-Roi', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 500', codePostal: '78600' },
+  {
+    slug: 'saint-cyr-au-mont-d-or',
+    name: 'Saint-Cyr-au-Mont-d\'Or',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '6 500',
+    codePostal: '69450',
+  },
+  {
+    slug: 'dompierre-sur-mer',
+    name: 'Dompierre-sur-Mer',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '6 500',
+    codePostal: '17139',
+  },
+  {
+    slug: 'champagne-au-mont-d-or',
+    name: 'Champagne-au-Mont-d\'Or',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '6 500',
+    codePostal: '69410',
+  },
+  { slug: 'thyez', name: 'Thyez', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 500', codePostal: '74300' },
+  { slug: 'avallon', name: 'Avallon', region: 'Bourgogne-Franche-Comté', departement: 'Yonne', departementCode: '89', population: '6 500', codePostal: '89200' },
+  { slug: 'vaugneray', name: 'Vaugneray', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69670' },
+  { slug: 'pont-de-cheruy', name: 'Pont-de-Chéruy', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '6 500', codePostal: '38230' },
+  { slug: 'bonchamp-les-laval', name: 'Bonchamp-lès-Laval', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '6 500', codePostal: '53960' },
+  { slug: 'chatel-guyon', name: 'Châtel-Guyon', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '6 500', codePostal: '63140' },
+  { slug: 'milhaud', name: 'Milhaud', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '6 500', codePostal: '30540' },
+  { slug: 'esvres', name: 'Esvres', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '6 500', codePostal: '37320' },
+  { slug: 'louvroil', name: 'Louvroil', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59720' },
+  { slug: 'vouneuil-sous-biard', name: 'Vouneuil-sous-Biard', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '6 500', codePostal: '86580' },
+  { slug: 'lallaing', name: 'Lallaing', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 500', codePostal: '59167' },
+  { slug: 'mazan', name: 'Mazan', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '6 500', codePostal: '84380' },
+  { slug: 'migne-auxances', name: 'Migné-Auxances', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '6 500', codePostal: '86440' },
+  { slug: 'mare', name: 'Maré', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '6 500', codePostal: '98828' },
+  { slug: 'mornant', name: 'Mornant', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 500', codePostal: '69440' },
+  { slug: 'belin-beliet', name: 'Belin-Béliet', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 500', codePostal: '33830' },
+  { slug: 'noyal-sur-vilaine', name: 'Noyal-sur-Vilaine', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 500', codePostal: '35530' },
+  { slug: 'sollies-toucas', name: 'Solliès-Toucas', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 500', codePostal: '83210' },
+  {
+    slug: 'chatenoy-le-royal',
+    name: 'Châtenoy-le-Royal',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Saône-et-Loire',
+    departementCode: '71',
+    population: '6 500',
+    codePostal: '71880',
+  },
+  { slug: 'huahine', name: 'Huahine', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '6 500', codePostal: '98731' },
+  { slug: 'pluneret', name: 'Pluneret', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 500', codePostal: '56400' },
+  {
+    slug: 'saint-pryve-saint-mesmin',
+    name: 'Saint-Pryvé-Saint-Mesmin',
+    region: 'Centre-Val de Loire',
+    departement: 'Loiret',
+    departementCode: '45',
+    population: '6 500',
+    codePostal: '45750',
+  },
+  { slug: 'wimereux', name: 'Wimereux', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 500', codePostal: '62930' },
+  { slug: 'homecourt', name: 'Homécourt', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 500', codePostal: '54310' },
+  { slug: 'mer', name: 'Mer', region: 'Centre-Val de Loire', departement: 'Loir-et-Cher', departementCode: '41', population: '6 500', codePostal: '41500' },
+  { slug: 'jassans-riottier', name: 'Jassans-Riottier', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '6 000', codePostal: '01480' },
+  { slug: 'fleurance', name: 'Fleurance', region: 'Occitanie', departement: 'Gers', departementCode: '32', population: '6 000', codePostal: '32500' },
+  { slug: 'bellevigny', name: 'Bellevigny', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '6 000', codePostal: '85170' },
+  {
+    slug: 'saint-martin-de-seignanx',
+    name: 'Saint-Martin-de-Seignanx',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Landes',
+    departementCode: '40',
+    population: '6 000',
+    codePostal: '40390',
+  },
+  {
+    slug: 'cuges-les-pins',
+    name: 'Cuges-les-Pins',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13780',
+  },
+  { slug: 'loches', name: 'Loches', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '6 000', codePostal: '37600' },
+  { slug: 'malaunay', name: 'Malaunay', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '6 000', codePostal: '76770' },
+  {
+    slug: 'terrasson-lavilledieu',
+    name: 'Terrasson-Lavilledieu',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Dordogne',
+    departementCode: '24',
+    population: '6 000',
+    codePostal: '24120',
+  },
+  { slug: 'pont-eveque', name: 'Pont-Évêque', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '6 000', codePostal: '38780' },
+  { slug: 'aire-sur-l-adour', name: 'Aire-sur-l\'Adour', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '6 000', codePostal: '40800' },
+  { slug: 'saint-marcel', name: 'Saint-Marcel', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '6 000', codePostal: '71380' },
+  { slug: 'guer', name: 'Guer', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 000', codePostal: '56380' },
+  { slug: 'livarot-pays-d-auge', name: 'Livarot-Pays-d\'Auge', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 000', codePostal: '14140' },
+  { slug: 'bruguieres', name: 'Bruguières', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 000', codePostal: '31150' },
+  { slug: 'horbourg-wihr', name: 'Horbourg-Wihr', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '6 000', codePostal: '68180' },
+  {
+    slug: 'saint-quentin-fallavier',
+    name: 'Saint-Quentin-Fallavier',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '6 000',
+    codePostal: '38070',
+  },
+  { slug: 'boueni', name: 'Bouéni', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '6 000', codePostal: '97620' },
+  {
+    slug: 'saint-symphorien-d-ozon',
+    name: 'Saint-Symphorien-d\'Ozon',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '6 000',
+    codePostal: '69360',
+  },
+  { slug: 'prades-le-lez', name: 'Prades-le-Lez', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34730' },
+  { slug: 'menucourt', name: 'Menucourt', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '6 000', codePostal: '95180' },
+  { slug: 'thue-et-mue', name: 'Thue et Mue', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 000', codePostal: '14210' },
+  { slug: 'saint-genest-lerpt', name: 'Saint-Genest-Lerpt', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '6 000', codePostal: '42530' },
+  {
+    slug: 'saint-marcel-les-valence',
+    name: 'Saint-Marcel-lès-Valence',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Drôme',
+    departementCode: '26',
+    population: '6 000',
+    codePostal: '26320',
+  },
+  { slug: 'feytiat', name: 'Feytiat', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '6 000', codePostal: '87220' },
+  {
+    slug: 'saint-mitre-les-remparts',
+    name: 'Saint-Mitre-les-Remparts',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13920',
+  },
+  { slug: 'octeville-sur-mer', name: 'Octeville-sur-Mer', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '6 000', codePostal: '76930' },
+  { slug: 'petite-rosselle', name: 'Petite-Rosselle', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '6 000', codePostal: '57540' },
+  {
+    slug: 'franqueville-saint-pierre',
+    name: 'Franqueville-Saint-Pierre',
+    region: 'Normandie',
+    departement: 'Seine-Maritime',
+    departementCode: '76',
+    population: '6 000',
+    codePostal: '76520',
+  },
+  { slug: 'mallemort', name: 'Mallemort', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 000', codePostal: '13370' },
+  { slug: 'behren-les-forbach', name: 'Behren-lès-Forbach', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '6 000', codePostal: '57460' },
+  { slug: 'le-blanc', name: 'Le Blanc', region: 'Centre-Val de Loire', departement: 'Indre', departementCode: '36', population: '6 000', codePostal: '36300' },
+  { slug: 'aurec-sur-loire', name: 'Aurec-sur-Loire', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Loire', departementCode: '43', population: '6 000', codePostal: '43110' },
+  {
+    slug: 'marennes-hiers-brouage',
+    name: 'Marennes-Hiers-Brouage',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '6 000',
+    codePostal: '17320',
+  },
+  { slug: 'le-diamant', name: 'Le Diamant', region: 'Martinique', departement: 'Martinique', departementCode: '972', population: '6 000', codePostal: '97223' },
+  {
+    slug: 'saint-denis-les-bourg',
+    name: 'Saint-Denis-lès-Bourg',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Ain',
+    departementCode: '01',
+    population: '6 000',
+    codePostal: '01000',
+  },
+  { slug: 'fayence', name: 'Fayence', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 000', codePostal: '83440' },
+  {
+    slug: 'oraison',
+    name: 'Oraison',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '6 000',
+    codePostal: '04700',
+  },
+  { slug: 'prades', name: 'Prades', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '6 000', codePostal: '66500' },
+  { slug: 'jonage', name: 'Jonage', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 000', codePostal: '69330' },
+  { slug: 'dourges', name: 'Dourges', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62119' },
+  { slug: 'vendenheim', name: 'Vendenheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67550' },
+  { slug: 'quint-fonsegrives', name: 'Quint-Fonsegrives', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 000', codePostal: '31130' },
+  { slug: 'palavas-les-flots', name: 'Palavas-les-Flots', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34250' },
+  { slug: 'bouillante', name: 'Bouillante', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '6 000', codePostal: '97125' },
+  { slug: 'le-barcares', name: 'Le Barcarès', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '6 000', codePostal: '66420' },
+  { slug: 'blainville-sur-orne', name: 'Blainville-sur-Orne', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 000', codePostal: '14550' },
+  {
+    slug: 'saint-cannat',
+    name: 'Saint-Cannat',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13760',
+  },
+  { slug: 'sainte-sigolene', name: 'Sainte-Sigolène', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Loire', departementCode: '43', population: '6 000', codePostal: '43600' },
+  { slug: 'ostricourt', name: 'Ostricourt', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59162' },
+  { slug: 'haute-goulaine', name: 'Haute-Goulaine', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '6 000', codePostal: '44115' },
+  { slug: 'pecquencourt', name: 'Pecquencourt', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59146' },
+  {
+    slug: 'fouquieres-les-lens',
+    name: 'Fouquières-lès-Lens',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '6 000',
+    codePostal: '62740',
+  },
+  { slug: 'mutzig', name: 'Mutzig', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67190' },
+  { slug: 'pierrefeu-du-var', name: 'Pierrefeu-du-Var', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 000', codePostal: '83390' },
+  { slug: 'maule', name: 'Maule', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78580' },
+  { slug: 'hersin-coupigny', name: 'Hersin-Coupigny', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62530' },
+  { slug: 'noves', name: 'Noves', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 000', codePostal: '13550' },
+  { slug: 'mesnils-sur-iton', name: 'Mesnils-sur-Iton', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '6 000', codePostal: '27160' },
+  {
+    slug: 'saint-martin-le-vinoux',
+    name: 'Saint-Martin-le-Vinoux',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '6 000',
+    codePostal: '38950',
+  },
+  { slug: 'bois-le-roi', name: 'Bois-le-Roi', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 000', codePostal: '77590' },
+  { slug: 'esbly', name: 'Esbly', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 000', codePostal: '77450' },
+  { slug: 'bouillargues', name: 'Bouillargues', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '6 000', codePostal: '30230' },
+  {
+    slug: 'saint-jean-de-boiseau',
+    name: 'Saint-Jean-de-Boiseau',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '6 000',
+    codePostal: '44640',
+  },
+  { slug: 'beauvoisin', name: 'Beauvoisin', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '6 000', codePostal: '30640' },
+  { slug: 'geveze', name: 'Gévezé', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 000', codePostal: '35850' },
+  { slug: 'mondonville', name: 'Mondonville', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 000', codePostal: '31700' },
+  {
+    slug: 'vaison-la-romaine',
+    name: 'Vaison-la-Romaine',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '6 000',
+    codePostal: '84110',
+  },
+  { slug: 'mortagne-sur-sevre', name: 'Mortagne-sur-Sèvre', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '6 000', codePostal: '85290' },
+  { slug: 'luc-la-primaube', name: 'Luc-la-Primaube', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '6 000', codePostal: '12450' },
+  { slug: 'le-castellet', name: 'Le Castellet', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 000', codePostal: '83330' },
+  { slug: 'jouars-pontchartrain', name: 'Jouars-Pontchartrain', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78760' },
+  { slug: 'pavilly', name: 'Pavilly', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '6 000', codePostal: '76570' },
+  { slug: 'marly-la-ville', name: 'Marly-la-Ville', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '6 000', codePostal: '95670' },
+  { slug: 'trith-saint-leger', name: 'Trith-Saint-Léger', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59125' },
+  { slug: 'commentry', name: 'Commentry', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '6 000', codePostal: '03600' },
+  { slug: 'vexin-sur-epte', name: 'Vexin-sur-Epte', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '6 000', codePostal: '27420' },
+  { slug: 'saint-girons', name: 'Saint-Girons', region: 'Occitanie', departement: 'Ariège', departementCode: '09', population: '6 000', codePostal: '09200' },
+  { slug: 'donzere', name: 'Donzère', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '6 000', codePostal: '26290' },
+  { slug: 'clapiers', name: 'Clapiers', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34830' },
+  {
+    slug: 'saint-mandrier-sur-mer',
+    name: 'Saint-Mandrier-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '6 000',
+    codePostal: '83430',
+  },
+  { slug: 'noyelles-godault', name: 'Noyelles-Godault', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62950' },
+  { slug: 'fontenay-tresigny', name: 'Fontenay-Trésigny', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 000', codePostal: '77610' },
+  { slug: 'la-verriere', name: 'La Verrière', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78320' },
+  { slug: 'ablon-sur-seine', name: 'Ablon-sur-Seine', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '6 000', codePostal: '94480' },
+  { slug: 'lavelanet', name: 'Lavelanet', region: 'Occitanie', departement: 'Ariège', departementCode: '09', population: '6 000', codePostal: '09300' },
+  { slug: 'conde-en-normandie', name: 'Condé-en-Normandie', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 000', codePostal: '14110' },
+  { slug: 'corbie', name: 'Corbie', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '6 000', codePostal: '80800' },
+  { slug: 'aubignan', name: 'Aubignan', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '6 000', codePostal: '84810' },
+  { slug: 'hombourg-haut', name: 'Hombourg-Haut', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '6 000', codePostal: '57470' },
+  { slug: 'benfeld', name: 'Benfeld', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67230' },
+  { slug: 'marnaz', name: 'Marnaz', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 000', codePostal: '74460' },
+  { slug: 'naintre', name: 'Naintré', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '6 000', codePostal: '86530' },
+  { slug: 'roost-warendin', name: 'Roost-Warendin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59286' },
+  {
+    slug: 'saint-denis-de-pile',
+    name: 'Saint-Denis-de-Pile',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Gironde',
+    departementCode: '33',
+    population: '6 000',
+    codePostal: '33910',
+  },
+  { slug: 'blanzy', name: 'Blanzy', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '6 000', codePostal: '71450' },
+  { slug: 'vias', name: 'Vias', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34450' },
+  { slug: 'loon-plage', name: 'Loon-Plage', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59279' },
+  { slug: 'villennes-sur-seine', name: 'Villennes-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78670' },
+  { slug: 'ciboure', name: 'Ciboure', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '6 000', codePostal: '64500' },
+  { slug: 'quievrechain', name: 'Quiévrechain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '6 000', codePostal: '59920' },
+  { slug: 'sains-en-gohelle', name: 'Sains-en-Gohelle', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62114' },
+  { slug: 'fleury-sur-orne', name: 'Fleury-sur-Orne', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '6 000', codePostal: '14123' },
+  {
+    slug: 'le-puy-sainte-reparade',
+    name: 'Le Puy-Sainte-Réparade',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13610',
+  },
+  { slug: 'montdidier', name: 'Montdidier', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '6 000', codePostal: '80500' },
+  { slug: 'grand-champ', name: 'Grand-Champ', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 000', codePostal: '56390' },
+  {
+    slug: 'bellevigne-en-layon',
+    name: 'Bellevigne-en-Layon',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '6 000',
+    codePostal: '49380',
+  },
+  { slug: 'negrepelisse', name: 'Nègrepelisse', region: 'Occitanie', departement: 'Tarn-et-Garonne', departementCode: '82', population: '6 000', codePostal: '82800' },
+  { slug: 'tain-l-hermitage', name: 'Tain-l\'Hermitage', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '6 000', codePostal: '26600' },
+  { slug: 'fontenilles', name: 'Fontenilles', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 000', codePostal: '31470' },
+  {
+    slug: 'saint-pierre-d-irube',
+    name: 'Saint-Pierre-d\'Irube',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Pyrénées-Atlantiques',
+    departementCode: '64',
+    population: '6 000',
+    codePostal: '64990',
+  },
+  {
+    slug: 'saint-andre-de-la-roche',
+    name: 'Saint-André-de-la-Roche',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '6 000',
+    codePostal: '06730',
+  },
+  { slug: 'bricquebec-en-cotentin', name: 'Bricquebec-en-Cotentin', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '6 000', codePostal: '50260' },
+  { slug: 'aixe-sur-vienne', name: 'Aixe-sur-Vienne', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '6 000', codePostal: '87700' },
+  { slug: 'raon-l-etape', name: 'Raon-l\'Étape', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '6 000', codePostal: '88110' },
+  { slug: 'saintry-sur-seine', name: 'Saintry-sur-Seine', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 000', codePostal: '91250' },
+  { slug: 'saint-zacharie', name: 'Saint-Zacharie', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 000', codePostal: '83640' },
+  { slug: 'eschau', name: 'Eschau', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67114' },
+  {
+    slug: 'saint-arnoult-en-yvelines',
+    name: 'Saint-Arnoult-en-Yvelines',
+    region: 'Île-de-France',
+    departement: 'Yvelines',
+    departementCode: '78',
+    population: '6 000',
+    codePostal: '78730',
+  },
+  { slug: 'grand-charmont', name: 'Grand-Charmont', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '6 000', codePostal: '25200' },
+  { slug: 'lesparre-medoc', name: 'Lesparre-Médoc', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 000', codePostal: '33340' },
+  { slug: 'douvrin', name: 'Douvrin', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62138' },
+  { slug: 'rabastens', name: 'Rabastens', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '6 000', codePostal: '81800' },
+  { slug: 'montpon-menesterol', name: 'Montpon-Ménestérol', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '6 000', codePostal: '24700' },
+  { slug: 'riantec', name: 'Riantec', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 000', codePostal: '56670' },
+  { slug: 'la-wantzenau', name: 'La Wantzenau', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67610' },
+  { slug: 'gond-pontouvre', name: 'Gond-Pontouvre', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '6 000', codePostal: '16160' },
+  { slug: 'oberhausbergen', name: 'Oberhausbergen', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67205' },
+  { slug: 'le-poinconnet', name: 'Le Poinçonnet', region: 'Centre-Val de Loire', departement: 'Indre', departementCode: '36', population: '6 000', codePostal: '36330' },
+  { slug: 'seloncourt', name: 'Seloncourt', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '6 000', codePostal: '25230' },
+  { slug: 'port-la-nouvelle', name: 'Port-la-Nouvelle', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '6 000', codePostal: '11210' },
+  { slug: 'fismes', name: 'Fismes', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '6 000', codePostal: '51170' },
+  { slug: 'chambourcy', name: 'Chambourcy', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78240' },
+  { slug: 'boe', name: 'Boé', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '6 000', codePostal: '47550' },
+  { slug: 'ludres', name: 'Ludres', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '6 000', codePostal: '54710' },
+  {
+    slug: 'saint-martin-lez-tatinghem',
+    name: 'Saint-Martin-lez-Tatinghem',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '6 000',
+    codePostal: '62500',
+  },
+  { slug: 'ventabren', name: 'Ventabren', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 000', codePostal: '13122' },
+  { slug: 'bessan', name: 'Bessan', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34550' },
+  { slug: 'arradon', name: 'Arradon', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 000', codePostal: '56610' },
+  { slug: 'gareoult', name: 'Garéoult', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '6 000', codePostal: '83136' },
+  { slug: 'kembs', name: 'Kembs', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '6 000', codePostal: '68680' },
+  { slug: 'roye', name: 'Roye', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '6 000', codePostal: '80700' },
+  { slug: 'cessy', name: 'Cessy', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '6 000', codePostal: '01170' },
+  { slug: 'villabe', name: 'Villabé', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '6 000', codePostal: '91100' },
+  { slug: 'dol-de-bretagne', name: 'Dol-de-Bretagne', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '6 000', codePostal: '35120' },
+  { slug: 'saint-galmier', name: 'Saint-Galmier', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '6 000', codePostal: '42330' },
+  { slug: 'sillingy', name: 'Sillingy', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 000', codePostal: '74330' },
+  { slug: 'annezin', name: 'Annezin', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62232' },
+  { slug: 'montmorillon', name: 'Montmorillon', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '6 000', codePostal: '86500' },
+  { slug: 'briec', name: 'Briec', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '6 000', codePostal: '29510' },
+  { slug: 'buc', name: 'Buc', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '6 000', codePostal: '78530' },
+  { slug: 'nieul-sur-mer', name: 'Nieul-sur-Mer', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '6 000', codePostal: '17137' },
+  { slug: 'lannemezan', name: 'Lannemezan', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '6 000', codePostal: '65300' },
+  {
+    slug: 'saint-just-en-chaussee',
+    name: 'Saint-Just-en-Chaussée',
+    region: 'Hauts-de-France',
+    departement: 'Oise',
+    departementCode: '60',
+    population: '6 000',
+    codePostal: '60130',
+  },
+  { slug: 'mouroux', name: 'Mouroux', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '6 000', codePostal: '77120' },
+  { slug: 'viry', name: 'Viry', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '6 000', codePostal: '74580' },
+  { slug: 'le-barp', name: 'Le Barp', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 000', codePostal: '33114' },
+  { slug: 'bedarieux', name: 'Bédarieux', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '6 000', codePostal: '34600' },
+  { slug: 'algrange', name: 'Algrange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '6 000', codePostal: '57440' },
+  {
+    slug: 'roquefort-la-bedoule',
+    name: 'Roquefort-la-Bédoule',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13830',
+  },
+  { slug: 'sarrians', name: 'Sarrians', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '6 000', codePostal: '84260' },
+  {
+    slug: 'saint-laurent-de-mure',
+    name: 'Saint-Laurent-de-Mure',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '6 000',
+    codePostal: '69720',
+  },
+  { slug: 'calvi', name: 'Calvi', region: 'Corse', departement: 'Haute-Corse', departementCode: '2B', population: '6 000', codePostal: '20260' },
+  { slug: 'vergeze', name: 'Vergèze', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '6 000', codePostal: '30310' },
+  { slug: 'fenouillet', name: 'Fenouillet', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '6 000', codePostal: '31150' },
+  {
+    slug: 'simiane-collongue',
+    name: 'Simiane-Collongue',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13109',
+  },
+  { slug: 'oye-plage', name: 'Oye-Plage', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '6 000', codePostal: '62215' },
+  { slug: 'fegersheim', name: 'Fegersheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67640' },
+  { slug: 'wasselonne', name: 'Wasselonne', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '6 000', codePostal: '67310' },
+  { slug: 'magny-en-vexin', name: 'Magny-en-Vexin', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '6 000', codePostal: '95420' },
+  {
+    slug: 'le-palais-sur-vienne',
+    name: 'Le Palais-sur-Vienne',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Haute-Vienne',
+    departementCode: '87',
+    population: '6 000',
+    codePostal: '87410',
+  },
+  { slug: 'peypin', name: 'Peypin', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '6 000', codePostal: '13124' },
+  { slug: 'erdre-en-anjou', name: 'Erdre-en-Anjou', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '6 000', codePostal: '49220' },
+  { slug: 'thizy-les-bourgs', name: 'Thizy-les-Bourgs', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '6 000', codePostal: '69240' },
+  {
+    slug: 'saint-hilaire-du-harcouet',
+    name: 'Saint-Hilaire-du-Harcouët',
+    region: 'Normandie',
+    departement: 'Manche',
+    departementCode: '50',
+    population: '6 000',
+    codePostal: '50600',
+  },
+  { slug: 'pointe-noire', name: 'Pointe-Noire', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '6 000', codePostal: '97116' },
+  { slug: 'maze-milon', name: 'Mazé-Milon', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '6 000', codePostal: '49140' },
+  {
+    slug: 'ensues-la-redonne',
+    name: 'Ensuès-la-Redonne',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '6 000',
+    codePostal: '13820',
+  },
+  { slug: 'canejan', name: 'Canéjan', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '6 000', codePostal: '33610' },
+  { slug: 'plouay', name: 'Plouay', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '6 000', codePostal: '56240' },
+  {
+    slug: 'saint-gervais-les-bains',
+    name: 'Saint-Gervais-les-Bains',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '6 000',
+    codePostal: '74170',
+  },
+  { slug: 'melle', name: 'Melle', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '6 000', codePostal: '79500' },
+  { slug: 'doullens', name: 'Doullens', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '6 000', codePostal: '80600' },
+  { slug: 'flines-lez-raches', name: 'Flines-lez-Raches', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59148' },
+  { slug: 'lacanau', name: 'Lacanau', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 500', codePostal: '33680' },
+  {
+    slug: 'la-cadiere-d-azur',
+    name: 'La Cadière-d\'Azur',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '5 500',
+    codePostal: '83740',
+  },
+  { slug: 'coursan', name: 'Coursan', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '5 500', codePostal: '11110' },
+  { slug: 'orgeres', name: 'Orgères', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '5 500', codePostal: '35230' },
+  { slug: 'beaucouze', name: 'Beaucouzé', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '5 500', codePostal: '49070' },
+  { slug: 'bannalec', name: 'Bannalec', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 500', codePostal: '29380' },
+  { slug: 'gournay-en-bray', name: 'Gournay-en-Bray', region: 'Normandie', departement: 'Seine-Maritime', departementCode: '76', population: '5 500', codePostal: '76220' },
+  { slug: 'piolenc', name: 'Piolenc', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '5 500', codePostal: '84420' },
+  { slug: 'revin', name: 'Revin', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '5 500', codePostal: '08500' },
+  { slug: 'epernon', name: 'Épernon', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '5 500', codePostal: '28230' },
+  {
+    slug: 'saint-michel-chef-chef',
+    name: 'Saint-Michel-Chef-Chef',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '5 500',
+    codePostal: '44730',
+  },
+  {
+    slug: 'saint-martin-la-pallu',
+    name: 'Saint-Martin-la-Pallu',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Vienne',
+    departementCode: '86',
+    population: '5 500',
+    codePostal: '86110',
+  },
+  {
+    slug: 'cugand-la-bernardiere',
+    name: 'Cugand-la-Bernardière',
+    region: 'Pays de la Loire',
+    departement: 'Vendée',
+    departementCode: '85',
+    population: '5 500',
+    codePostal: '85610',
+  },
+  { slug: 'lannilis', name: 'Lannilis', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 500', codePostal: '29870' },
+  { slug: 'missillac', name: 'Missillac', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 500', codePostal: '44780' },
+  { slug: 'marolles-en-hurepoix', name: 'Marolles-en-Hurepoix', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '5 500', codePostal: '91630' },
+  { slug: 'valdahon', name: 'Valdahon', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '5 500', codePostal: '25800' },
+  { slug: 'aimargues', name: 'Aimargues', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '5 500', codePostal: '30470' },
+  { slug: 'saint-privat-des-vieux', name: 'Saint-Privat-des-Vieux', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '5 500', codePostal: '30340' },
+  {
+    slug: 'carry-le-rouet',
+    name: 'Carry-le-Rouet',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '5 500',
+    codePostal: '13620',
+  },
+  { slug: 'tournus', name: 'Tournus', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '5 500', codePostal: '71700' },
+  { slug: 'mondelange', name: 'Mondelange', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 500', codePostal: '57300' },
+  {
+    slug: 'montbonnot-saint-martin',
+    name: 'Montbonnot-Saint-Martin',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '5 500',
+    codePostal: '38330',
+  },
+  { slug: 'saleilles', name: 'Saleilles', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '5 500', codePostal: '66280' },
+  { slug: 'valdalliere', name: 'Valdallière', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 500', codePostal: '14350' },
+  { slug: 'marcheprime', name: 'Marcheprime', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 500', codePostal: '33380' },
+  { slug: 'mourenx', name: 'Mourenx', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '5 500', codePostal: '64150' },
+  { slug: 'ligne', name: 'Ligné', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 500', codePostal: '44850' },
+  { slug: 'altkirch', name: 'Altkirch', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '5 500', codePostal: '68130' },
+  { slug: 'leves', name: 'Lèves', region: 'Centre-Val de Loire', departement: 'Eure-et-Loir', departementCode: '28', population: '5 500', codePostal: '28300' },
+  { slug: 'dainville', name: 'Dainville', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62000' },
+  { slug: 'l-isle-d-espagnac', name: 'L\'Isle-d\'Espagnac', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '5 500', codePostal: '16340' },
+  { slug: 'longueau', name: 'Longueau', region: 'Hauts-de-France', departement: 'Somme', departementCode: '80', population: '5 500', codePostal: '80330' },
+  { slug: 'saint-xandre', name: 'Saint-Xandre', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '5 500', codePostal: '17138' },
+  { slug: 'saint-georges-d-orques', name: 'Saint-Georges-d\'Orques', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '5 500', codePostal: '34680' },
+  { slug: 'gan', name: 'Gan', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '5 500', codePostal: '64290' },
+  { slug: 'cancale', name: 'Cancale', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '5 500', codePostal: '35260' },
+  { slug: 'bedarrides', name: 'Bédarrides', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '5 500', codePostal: '84370' },
+  {
+    slug: 'la-roquette-sur-siagne',
+    name: 'La Roquette-sur-Siagne',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '5 500',
+    codePostal: '06550',
+  },
+  { slug: 'pouzauges', name: 'Pouzauges', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85700' },
+  {
+    slug: 'caumont-sur-durance',
+    name: 'Caumont-sur-Durance',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '5 500',
+    codePostal: '84510',
+  },
+  { slug: 'sausheim', name: 'Sausheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '5 500', codePostal: '68390' },
+  { slug: 'la-creche', name: 'La Crèche', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '5 500', codePostal: '79260' },
+  { slug: 'rocbaron', name: 'Rocbaron', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '5 500', codePostal: '83136' },
+  { slug: 'sigean', name: 'Sigean', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '5 500', codePostal: '11130' },
+  { slug: 'parmain', name: 'Parmain', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '5 500', codePostal: '95620' },
+  { slug: 'chanverrie', name: 'Chanverrie', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85130' },
+  { slug: 'montrond-les-bains', name: 'Montrond-les-Bains', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '5 500', codePostal: '42210' },
+  { slug: 'santes', name: 'Santes', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59211' },
+  {
+    slug: 'rives-du-loir-en-anjou',
+    name: 'Rives-du-Loir-en-Anjou',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '5 500',
+    codePostal: '49140',
+  },
+  { slug: 'pourrieres', name: 'Pourrières', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '5 500', codePostal: '83910' },
+  { slug: 'montval-sur-loir', name: 'Montval-sur-Loir', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '5 500', codePostal: '72500' },
+  { slug: 'sainghin-en-weppes', name: 'Sainghin-en-Weppes', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59184' },
+  { slug: 'wallers', name: 'Wallers', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59135' },
+  { slug: 'challes-les-eaux', name: 'Challes-les-Eaux', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '5 500', codePostal: '73190' },
+  { slug: 'delle', name: 'Delle', region: 'Bourgogne-Franche-Comté', departement: 'Territoire de Belfort', departementCode: '90', population: '5 500', codePostal: '90100' },
+  { slug: 'la-gorgue', name: 'La Gorgue', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59253' },
+  { slug: 'rungis', name: 'Rungis', region: 'Île-de-France', departement: 'Val-de-Marne', departementCode: '94', population: '5 500', codePostal: '94150' },
+  { slug: 'gannat', name: 'Gannat', region: 'Auvergne-Rhône-Alpes', departement: 'Allier', departementCode: '03', population: '5 500', codePostal: '03800' },
+  { slug: 'sauvian', name: 'Sauvian', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '5 500', codePostal: '34410' },
+  {
+    slug: 'cloyes-les-trois-rivieres',
+    name: 'Cloyes-les-Trois-Rivières',
+    region: 'Centre-Val de Loire',
+    departement: 'Eure-et-Loir',
+    departementCode: '28',
+    population: '5 500',
+    codePostal: '28220',
+  },
+  { slug: 'port-louis', name: 'Port-Louis', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '5 500', codePostal: '97117' },
+  {
+    slug: 'la-ville-aux-dames',
+    name: 'La Ville-aux-Dames',
+    region: 'Centre-Val de Loire',
+    departement: 'Indre-et-Loire',
+    departementCode: '37',
+    population: '5 500',
+    codePostal: '37700',
+  },
+  { slug: 'bohain-en-vermandois', name: 'Bohain-en-Vermandois', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '5 500', codePostal: '02110' },
+  { slug: 'ternay', name: 'Ternay', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '5 500', codePostal: '69360' },
+  {
+    slug: 'saint-martin-d-uriage',
+    name: 'Saint-Martin-d\'Uriage',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Isère',
+    departementCode: '38',
+    population: '5 500',
+    codePostal: '38410',
+  },
+  { slug: 'genay', name: 'Genay', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '5 500', codePostal: '69730' },
+  { slug: 'wormhout', name: 'Wormhout', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59470' },
+  { slug: 'liverdun', name: 'Liverdun', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '5 500', codePostal: '54460' },
+  { slug: 'ludon-medoc', name: 'Ludon-Médoc', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 500', codePostal: '33290' },
+  { slug: 'bourail', name: 'Bourail', region: 'Nouvelle-Calédonie', departement: 'Nouvelle-Calédonie', departementCode: '988', population: '5 500', codePostal: '98870' },
+  { slug: 'carbonne', name: 'Carbonne', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '5 500', codePostal: '31390' },
+  { slug: 'beaurains', name: 'Beaurains', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62217' },
+  { slug: 'le-port-marly', name: 'Le Port-Marly', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '5 500', codePostal: '78560' },
+  { slug: 'viarmes', name: 'Viarmes', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '5 500', codePostal: '95270' },
+  { slug: 'ille-sur-tet', name: 'Ille-sur-Têt', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '5 500', codePostal: '66130' },
+  { slug: 'ambazac', name: 'Ambazac', region: 'Nouvelle-Aquitaine', departement: 'Haute-Vienne', departementCode: '87', population: '5 500', codePostal: '87240' },
+  { slug: 'pollestres', name: 'Pollestres', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '5 500', codePostal: '66450' },
+  { slug: 'quincy-voisins', name: 'Quincy-Voisins', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '5 500', codePostal: '77860' },
+  { slug: 'baisieux', name: 'Baisieux', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59780' },
+  { slug: 'chazelles-sur-lyon', name: 'Chazelles-sur-Lyon', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '5 500', codePostal: '42140' },
+  { slug: 'nogent-sur-seine', name: 'Nogent-sur-Seine', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '5 500', codePostal: '10400' },
+  { slug: 'lardy', name: 'Lardy', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '5 500', codePostal: '91510' },
+  { slug: 'roquemaure', name: 'Roquemaure', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '5 500', codePostal: '30150' },
+  { slug: 'aussillon', name: 'Aussillon', region: 'Occitanie', departement: 'Tarn', departementCode: '81', population: '5 500', codePostal: '81200' },
+  {
+    slug: 'saint-sebastien-de-morsent',
+    name: 'Saint-Sébastien-de-Morsent',
+    region: 'Normandie',
+    departement: 'Eure',
+    departementCode: '27',
+    population: '5 500',
+    codePostal: '27180',
+  },
+  { slug: 'nouzonville', name: 'Nouzonville', region: 'Grand Est', departement: 'Ardennes', departementCode: '08', population: '5 500', codePostal: '08700' },
+  {
+    slug: 'saint-mars-du-desert',
+    name: 'Saint-Mars-du-Désert',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '5 500',
+    codePostal: '44850',
+  },
+  { slug: 'coublevie', name: 'Coublevie', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '5 500', codePostal: '38500' },
+  { slug: 'les-achards', name: 'Les Achards', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85150' },
+  { slug: 'servian', name: 'Servian', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '5 500', codePostal: '34290' },
+  { slug: 'la-garnache', name: 'La Garnache', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85710' },
+  { slug: 'neuville-de-poitou', name: 'Neuville-de-Poitou', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '5 500', codePostal: '86170' },
+  { slug: 'penmarch', name: 'Penmarch', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 500', codePostal: '29760' },
+  { slug: 'kani-keli', name: 'Kani-Kéli', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '5 500', codePostal: '97625' },
+  { slug: 'chevreuse', name: 'Chevreuse', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '5 500', codePostal: '78460' },
+  { slug: 'ernee', name: 'Ernée', region: 'Pays de la Loire', departement: 'Mayenne', departementCode: '53', population: '5 500', codePostal: '53500' },
+  { slug: 'grans', name: 'Grans', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '5 500', codePostal: '13450' },
+  { slug: 'le-boulou', name: 'Le Boulou', region: 'Occitanie', departement: 'Pyrénées-Orientales', departementCode: '66', population: '5 500', codePostal: '66160' },
+  { slug: 'drap', name: 'Drap', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '5 500', codePostal: '06340' },
+  {
+    slug: 'nueil-les-aubiers',
+    name: 'Nueil-les-Aubiers',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Deux-Sèvres',
+    departementCode: '79',
+    population: '5 500',
+    codePostal: '79250',
+  },
+  { slug: 'guines', name: 'Guînes', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62340' },
+  { slug: 'foulayronnes', name: 'Foulayronnes', region: 'Nouvelle-Aquitaine', departement: 'Lot-et-Garonne', departementCode: '47', population: '5 500', codePostal: '47510' },
+  { slug: 'etoile-sur-rhone', name: 'Étoile-sur-Rhône', region: 'Auvergne-Rhône-Alpes', departement: 'Drôme', departementCode: '26', population: '5 500', codePostal: '26800' },
+  {
+    slug: 'la-roque-d-antheron',
+    name: 'La Roque-d\'Anthéron',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '5 500',
+    codePostal: '13640',
+  },
+  { slug: 'rosheim', name: 'Rosheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 500', codePostal: '67560' },
+  { slug: 'ollainville', name: 'Ollainville', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '5 500', codePostal: '91340' },
+  { slug: 'la-ferriere', name: 'La Ferrière', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85280' },
+  { slug: 'aubigny-sur-nere', name: 'Aubigny-sur-Nère', region: 'Centre-Val de Loire', departement: 'Cher', departementCode: '18', population: '5 500', codePostal: '18700' },
+  { slug: 'noyant-villages', name: 'Noyant-Villages', region: 'Pays de la Loire', departement: 'Maine-et-Loire', departementCode: '49', population: '5 500', codePostal: '49390' },
+  { slug: 'cregy-les-meaux', name: 'Crégy-lès-Meaux', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '5 500', codePostal: '77124' },
+  { slug: 'arnage', name: 'Arnage', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '5 500', codePostal: '72230' },
+  {
+    slug: 'chatillon-sur-seine',
+    name: 'Châtillon-sur-Seine',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '5 500',
+    codePostal: '21400',
+  },
+  { slug: 'saint-memmie', name: 'Saint-Memmie', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '5 500', codePostal: '51470' },
+  { slug: 'fenain', name: 'Fenain', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59179' },
+  {
+    slug: 'saint-genis-les-ollieres',
+    name: 'Saint-Genis-les-Ollières',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '5 500',
+    codePostal: '69290',
+  },
+  { slug: 'coulogne', name: 'Coulogne', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62137' },
+  { slug: 'roques', name: 'Roques', region: 'Occitanie', departement: 'Haute-Garonne', departementCode: '31', population: '5 500', codePostal: '31120' },
+  { slug: 'boulay-moselle', name: 'Boulay-Moselle', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 500', codePostal: '57220' },
+  {
+    slug: 'marsannay-la-cote',
+    name: 'Marsannay-la-Côte',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '5 500',
+    codePostal: '21160',
+  },
+  { slug: 'mouguerre', name: 'Mouguerre', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '5 500', codePostal: '64990' },
+  { slug: 'wervicq-sud', name: 'Wervicq-Sud', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59117' },
+  { slug: 'rousset', name: 'Rousset', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '5 500', codePostal: '13790' },
+  { slug: 'flers-en-escrebieux', name: 'Flers-en-Escrebieux', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59128' },
+  { slug: 'aiffres', name: 'Aiffres', region: 'Nouvelle-Aquitaine', departement: 'Deux-Sèvres', departementCode: '79', population: '5 500', codePostal: '79230' },
+  { slug: 'reichshoffen', name: 'Reichshoffen', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 500', codePostal: '67110' },
+  { slug: 'lacroix-saint-ouen', name: 'Lacroix-Saint-Ouen', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '5 500', codePostal: '60610' },
+  { slug: 'le-cendre', name: 'Le Cendre', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '5 500', codePostal: '63670' },
+  { slug: 'ploumagoar', name: 'Ploumagoar', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '5 500', codePostal: '22970' },
+  { slug: 'heillecourt', name: 'Heillecourt', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '5 500', codePostal: '54180' },
+  { slug: 'marles-les-mines', name: 'Marles-les-Mines', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62540' },
+  {
+    slug: 'peyrolles-en-provence',
+    name: 'Peyrolles-en-Provence',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Bouches-du-Rhône',
+    departementCode: '13',
+    population: '5 500',
+    codePostal: '13860',
+  },
+  {
+    slug: 'saint-pierre-les-nemours',
+    name: 'Saint-Pierre-lès-Nemours',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '5 500',
+    codePostal: '77140',
+  },
+  { slug: 'plouhinec', name: 'Plouhinec', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '5 500', codePostal: '56680' },
+  {
+    slug: 'borderes-sur-l-echez',
+    name: 'Bordères-sur-l\'Échez',
+    region: 'Occitanie',
+    departement: 'Hautes-Pyrénées',
+    departementCode: '65',
+    population: '5 500',
+    codePostal: '65320',
+  },
+  { slug: 'vic-le-comte', name: 'Vic-le-Comte', region: 'Auvergne-Rhône-Alpes', departement: 'Puy-de-Dôme', departementCode: '63', population: '5 500', codePostal: '63270' },
+  {
+    slug: 'le-lion-d-angers',
+    name: 'Le Lion-d\'Angers',
+    region: 'Pays de la Loire',
+    departement: 'Maine-et-Loire',
+    departementCode: '49',
+    population: '5 500',
+    codePostal: '49220',
+  },
+  { slug: 'drusenheim', name: 'Drusenheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 500', codePostal: '67410' },
+  {
+    slug: 'charbonnieres-les-bains',
+    name: 'Charbonnières-les-Bains',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Rhône',
+    departementCode: '69',
+    population: '5 500',
+    codePostal: '69260',
+  },
+  { slug: 'garons', name: 'Garons', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '5 500', codePostal: '30128' },
+  { slug: 'levens', name: 'Levens', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Alpes-Maritimes', departementCode: '06', population: '5 500', codePostal: '06670' },
+  { slug: 'cormelles-le-royal', name: 'Cormelles-le-Royal', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 500', codePostal: '14123' },
+  { slug: 'saint-astier', name: 'Saint-Astier', region: 'Nouvelle-Aquitaine', departement: 'Dordogne', departementCode: '24', population: '5 500', codePostal: '24110' },
+  { slug: 'cruseilles', name: 'Cruseilles', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '5 500', codePostal: '74350' },
+  { slug: 'calonne-ricouart', name: 'Calonne-Ricouart', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62470' },
+  { slug: 'gray', name: 'Gray', region: 'Bourgogne-Franche-Comté', departement: 'Haute-Saône', departementCode: '70', population: '5 500', codePostal: '70100' },
+  { slug: 'trebes', name: 'Trèbes', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '5 500', codePostal: '11800' },
+  { slug: 'reyrieux', name: 'Reyrieux', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '5 500', codePostal: '01600' },
+  { slug: 'parigne-l-eveque', name: 'Parigné-l\'Évêque', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '5 500', codePostal: '72250' },
+  { slug: 'blere', name: 'Bléré', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '5 500', codePostal: '37150' },
+  { slug: 'commercy', name: 'Commercy', region: 'Grand Est', departement: 'Meuse', departementCode: '55', population: '5 500', codePostal: '55200' },
+  { slug: 'chagny', name: 'Chagny', region: 'Bourgogne-Franche-Comté', departement: 'Saône-et-Loire', departementCode: '71', population: '5 500', codePostal: '71150' },
+  { slug: 'meriel', name: 'Mériel', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '5 500', codePostal: '95630' },
+  { slug: 'bretignolles-sur-mer', name: 'Bretignolles-sur-Mer', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85470' },
+  { slug: 'erquinghem-lys', name: 'Erquinghem-Lys', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59193' },
+  { slug: 'idron', name: 'Idron', region: 'Nouvelle-Aquitaine', departement: 'Pyrénées-Atlantiques', departementCode: '64', population: '5 500', codePostal: '64320' },
+  { slug: 'dechy', name: 'Dechy', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 500', codePostal: '59187' },
+  {
+    slug: 'la-balme-de-sillingy',
+    name: 'La Balme-de-Sillingy',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Haute-Savoie',
+    departementCode: '74',
+    population: '5 500',
+    codePostal: '74330',
+  },
+  { slug: 'plesse', name: 'Plessé', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 500', codePostal: '44630' },
+  { slug: 'mundolsheim', name: 'Mundolsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 500', codePostal: '67450' },
+  { slug: 'le-pellerin', name: 'Le Pellerin', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 500', codePostal: '44640' },
+  { slug: 'mouy', name: 'Mouy', region: 'Hauts-de-France', departement: 'Oise', departementCode: '60', population: '5 500', codePostal: '60250' },
+  { slug: 'gambsheim', name: 'Gambsheim', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 500', codePostal: '67760' },
+  { slug: 'audruicq', name: 'Audruicq', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62370' },
+  { slug: 'bethoncourt', name: 'Bethoncourt', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '5 500', codePostal: '25200' },
+  { slug: 'barberaz', name: 'Barberaz', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '5 500', codePostal: '73000' },
+  { slug: 'vindry-sur-turdine', name: 'Vindry-sur-Turdine', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '5 500', codePostal: '69490' },
+  { slug: 'saint-lyphard', name: 'Saint-Lyphard', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 500', codePostal: '44410' },
+  { slug: 'tahaa', name: 'Tahaa', region: 'Polynésie française', departement: 'Polynésie française', departementCode: '987', population: '5 500', codePostal: '98733' },
+  { slug: 'villers-le-lac', name: 'Villers-le-Lac', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '5 500', codePostal: '25130' },
+  { slug: 'tresses', name: 'Tresses', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 500', codePostal: '33370' },
+  { slug: 'brebieres', name: 'Brebières', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 500', codePostal: '62117' },
+  { slug: 'blotzheim', name: 'Blotzheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '5 500', codePostal: '68730' },
+  { slug: 'mormant', name: 'Mormant', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '5 500', codePostal: '77720' },
+  { slug: 'champniers', name: 'Champniers', region: 'Nouvelle-Aquitaine', departement: 'Charente', departementCode: '16', population: '5 500', codePostal: '16430' },
+  {
+    slug: 'condat-sur-vienne',
+    name: 'Condat-sur-Vienne',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Haute-Vienne',
+    departementCode: '87',
+    population: '5 500',
+    codePostal: '87920',
+  },
+  { slug: 'mouilleron-le-captif', name: 'Mouilleron-le-Captif', region: 'Pays de la Loire', departement: 'Vendée', departementCode: '85', population: '5 500', codePostal: '85000' },
+  { slug: 'villette-d-anthon', name: 'Villette-d\'Anthon', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '5 500', codePostal: '38280' },
+  { slug: 'moulins-les-metz', name: 'Moulins-lès-Metz', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 500', codePostal: '57160' },
+  { slug: 'valleiry', name: 'Valleiry', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '5 500', codePostal: '74520' },
+  { slug: 'cazouls-les-beziers', name: 'Cazouls-lès-Béziers', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '5 500', codePostal: '34370' },
+  { slug: 'florensac', name: 'Florensac', region: 'Occitanie', departement: 'Hérault', departementCode: '34', population: '5 500', codePostal: '34510' },
+  {
+    slug: 'chatillon-sur-chalaronne',
+    name: 'Châtillon-sur-Chalaronne',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Ain',
+    departementCode: '01',
+    population: '5 500',
+    codePostal: '01400',
+  },
+  { slug: 'pont-sainte-marie', name: 'Pont-Sainte-Marie', region: 'Grand Est', departement: 'Aube', departementCode: '10', population: '5 000', codePostal: '10150' },
+  { slug: 'bauvin', name: 'Bauvin', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 000', codePostal: '59221' },
+  { slug: 'le-rove', name: 'Le Rove', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Bouches-du-Rhône', departementCode: '13', population: '5 000', codePostal: '13740' },
+  { slug: 'mulsanne', name: 'Mulsanne', region: 'Pays de la Loire', departement: 'Sarthe', departementCode: '72', population: '5 000', codePostal: '72230' },
+  { slug: 'guemene-penfao', name: 'Guémené-Penfao', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 000', codePostal: '44290' },
+  { slug: 'semeac', name: 'Séméac', region: 'Occitanie', departement: 'Hautes-Pyrénées', departementCode: '65', population: '5 000', codePostal: '65600' },
+  {
+    slug: 'nuits-saint-georges',
+    name: 'Nuits-Saint-Georges',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Côte-d\'Or',
+    departementCode: '21',
+    population: '5 000',
+    codePostal: '21700',
+  },
+  { slug: 'mignaloux-beauvoir', name: 'Mignaloux-Beauvoir', region: 'Nouvelle-Aquitaine', departement: 'Vienne', departementCode: '86', population: '5 000', codePostal: '86550' },
+  { slug: 'laille', name: 'Laillé', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '5 000', codePostal: '35890' },
+  { slug: 'farebersviller', name: 'Farébersviller', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 000', codePostal: '57450' },
+  {
+    slug: 'forcalquier',
+    name: 'Forcalquier',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '5 000',
+    codePostal: '04300',
+  },
+  {
+    slug: 'saint-clement-de-riviere',
+    name: 'Saint-Clément-de-Rivière',
+    region: 'Occitanie',
+    departement: 'Hérault',
+    departementCode: '34',
+    population: '5 000',
+    codePostal: '34980',
+  },
+  { slug: 'marquise', name: 'Marquise', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62250' },
+  { slug: 'le-bourget-du-lac', name: 'Le Bourget-du-Lac', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '5 000', codePostal: '73370' },
+  { slug: 'nans-les-pins', name: 'Nans-les-Pins', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '5 000', codePostal: '83860' },
+  { slug: 'surzur', name: 'Surzur', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '5 000', codePostal: '56450' },
+  { slug: 'vernaison', name: 'Vernaison', region: 'Auvergne-Rhône-Alpes', departement: 'Rhône', departementCode: '69', population: '5 000', codePostal: '69390' },
+  { slug: 'tourves', name: 'Tourves', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Var', departementCode: '83', population: '5 000', codePostal: '83170' },
+  {
+    slug: 'saint-saturnin-les-avignon',
+    name: 'Saint-Saturnin-lès-Avignon',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Vaucluse',
+    departementCode: '84',
+    population: '5 000',
+    codePostal: '84450',
+  },
+  { slug: 'gorges', name: 'Gorges', region: 'Pays de la Loire', departement: 'Loire-Atlantique', departementCode: '44', population: '5 000', codePostal: '44190' },
+  { slug: 'vaux-sur-seine', name: 'Vaux-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '5 000', codePostal: '78740' },
+  { slug: 'jonquieres', name: 'Jonquières', region: 'Provence-Alpes-Côte d\'Azur', departement: 'Vaucluse', departementCode: '84', population: '5 000', codePostal: '84150' },
+  { slug: 'beynost', name: 'Beynost', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '5 000', codePostal: '01700' },
+  {
+    slug: 'brou-sur-chantereine',
+    name: 'Brou-sur-Chantereine',
+    region: 'Île-de-France',
+    departement: 'Seine-et-Marne',
+    departementCode: '77',
+    population: '5 000',
+    codePostal: '77177',
+  },
+  { slug: 'acoua', name: 'Acoua', region: 'Mayotte', departement: 'Mayotte', departementCode: '976', population: '5 000', codePostal: '97630' },
+  { slug: 'pauillac', name: 'Pauillac', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 000', codePostal: '33250' },
+  { slug: 'gauchy', name: 'Gauchy', region: 'Hauts-de-France', departement: 'Aisne', departementCode: '02', population: '5 000', codePostal: '02430' },
+  { slug: 'l-hopital', name: 'L\'Hôpital', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 000', codePostal: '57490' },
+  { slug: 'schweighouse-sur-moder', name: 'Schweighouse-sur-Moder', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 000', codePostal: '67590' },
+  { slug: 'scaer', name: 'Scaër', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 000', codePostal: '29390' },
+  { slug: 'bassens-73', name: 'Bassens', region: 'Auvergne-Rhône-Alpes', departement: 'Savoie', departementCode: '73', population: '5 000', codePostal: '73000' },
+  { slug: 'valdoie', name: 'Valdoie', region: 'Bourgogne-Franche-Comté', departement: 'Territoire de Belfort', departementCode: '90', population: '5 000', codePostal: '90300' },
+  { slug: 'coubron', name: 'Coubron', region: 'Île-de-France', departement: 'Seine-Saint-Denis', departementCode: '93', population: '5 000', codePostal: '93470' },
+  { slug: 'villerest', name: 'Villerest', region: 'Auvergne-Rhône-Alpes', departement: 'Loire', departementCode: '42', population: '5 000', codePostal: '42300' },
+  { slug: 'loison-sous-lens', name: 'Loison-sous-Lens', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62218' },
+  { slug: 'seichamps', name: 'Seichamps', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '5 000', codePostal: '54280' },
+  { slug: 'villars-les-dombes', name: 'Villars-les-Dombes', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '5 000', codePostal: '01330' },
+  { slug: 'l-etang-la-ville', name: 'L\'Étang-la-Ville', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '5 000', codePostal: '78620' },
+  { slug: 'baume-les-dames', name: 'Baume-les-Dames', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '5 000', codePostal: '25110' },
+  { slug: 'trilport', name: 'Trilport', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '5 000', codePostal: '77470' },
+  { slug: 'pont-l-eveque', name: 'Pont-l\'Évêque', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 000', codePostal: '14130' },
+  { slug: 'douvres-la-delivrande', name: 'Douvres-la-Délivrande', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 000', codePostal: '14440' },
+  {
+    slug: 'le-cannet-des-maures',
+    name: 'Le Cannet-des-Maures',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Var',
+    departementCode: '83',
+    population: '5 000',
+    codePostal: '83340',
+  },
+  {
+    slug: 'villeneuve-sur-yonne',
+    name: 'Villeneuve-sur-Yonne',
+    region: 'Bourgogne-Franche-Comté',
+    departement: 'Yonne',
+    departementCode: '89',
+    population: '5 000',
+    codePostal: '89500',
+  },
+  { slug: 'longuyon', name: 'Longuyon', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '5 000', codePostal: '54260' },
+  { slug: 'saint-vit', name: 'Saint-Vit', region: 'Bourgogne-Franche-Comté', departement: 'Doubs', departementCode: '25', population: '5 000', codePostal: '25410' },
+  { slug: 'saint-cheron', name: 'Saint-Chéron', region: 'Île-de-France', departement: 'Essonne', departementCode: '91', population: '5 000', codePostal: '91530' },
+  { slug: 'ferriere-la-grande', name: 'Ferrière-la-Grande', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 000', codePostal: '59680' },
+  { slug: 'locmaria-plouzane', name: 'Locmaria-Plouzané', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 000', codePostal: '29280' },
+  { slug: 'cucq', name: 'Cucq', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62780' },
+  { slug: 'villenoy', name: 'Villenoy', region: 'Île-de-France', departement: 'Seine-et-Marne', departementCode: '77', population: '5 000', codePostal: '77124' },
+  { slug: 'chavanoz', name: 'Chavanoz', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '5 000', codePostal: '38230' },
+  { slug: 'sully-sur-loire', name: 'Sully-sur-Loire', region: 'Centre-Val de Loire', departement: 'Loiret', departementCode: '45', population: '5 000', codePostal: '45600' },
+  { slug: 'dives-sur-mer', name: 'Dives-sur-Mer', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 000', codePostal: '14160' },
+  {
+    slug: 'moncoutant-sur-sevre',
+    name: 'Moncoutant-sur-Sèvre',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Deux-Sèvres',
+    departementCode: '79',
+    population: '5 000',
+    codePostal: '79240',
+  },
+  {
+    slug: 'villeneuve-en-retz',
+    name: 'Villeneuve-en-Retz',
+    region: 'Pays de la Loire',
+    departement: 'Loire-Atlantique',
+    departementCode: '44',
+    population: '5 000',
+    codePostal: '44580',
+  },
+  {
+    slug: 'saint-marcellin-en-forez',
+    name: 'Saint-Marcellin-en-Forez',
+    region: 'Auvergne-Rhône-Alpes',
+    departement: 'Loire',
+    departementCode: '42',
+    population: '5 000',
+    codePostal: '42680',
+  },
+  { slug: 'le-val-d-hazey', name: 'Le Val d\'Hazey', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '5 000', codePostal: '27600' },
+  { slug: 'faulquemont', name: 'Faulquemont', region: 'Grand Est', departement: 'Moselle', departementCode: '57', population: '5 000', codePostal: '57380' },
+  {
+    slug: 'chateau-arnoux-saint-auban',
+    name: 'Château-Arnoux-Saint-Auban',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-de-Haute-Provence',
+    departementCode: '04',
+    population: '5 000',
+    codePostal: '04160',
+  },
+  { slug: 'ay-champagne', name: 'Aÿ-Champagne', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '5 000', codePostal: '51150' },
+  { slug: 'val-de-moder', name: 'Val-de-Moder', region: 'Grand Est', departement: 'Bas-Rhin', departementCode: '67', population: '5 000', codePostal: '67350' },
+  { slug: 'pulnoy', name: 'Pulnoy', region: 'Grand Est', departement: 'Meurthe-et-Moselle', departementCode: '54', population: '5 000', codePostal: '54425' },
+  { slug: 'baillif', name: 'Baillif', region: 'Guadeloupe', departement: 'Guadeloupe', departementCode: '971', population: '5 000', codePostal: '97123' },
+  { slug: 'genlis', name: 'Genlis', region: 'Bourgogne-Franche-Comté', departement: 'Côte-d\'Or', departementCode: '21', population: '5 000', codePostal: '21110' },
+  { slug: 'billy-berclau', name: 'Billy-Berclau', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62138' },
+  {
+    slug: 'saint-georges-de-didonne',
+    name: 'Saint-Georges-de-Didonne',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Charente-Maritime',
+    departementCode: '17',
+    population: '5 000',
+    codePostal: '17110',
+  },
+  {
+    slug: 'saint-pantaleon-de-larche',
+    name: 'Saint-Pantaléon-de-Larche',
+    region: 'Nouvelle-Aquitaine',
+    departement: 'Corrèze',
+    departementCode: '19',
+    population: '5 000',
+    codePostal: '19600',
+  },
+  { slug: 'muzillac', name: 'Muzillac', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '5 000', codePostal: '56190' },
+  { slug: 'maen-roch', name: 'Maen Roch', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '5 000', codePostal: '35460' },
+  { slug: 'baden', name: 'Baden', region: 'Bretagne', departement: 'Morbihan', departementCode: '56', population: '5 000', codePostal: '56870' },
+  { slug: 'chateaulin', name: 'Châteaulin', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 000', codePostal: '29150' },
+  { slug: 'ornex', name: 'Ornex', region: 'Auvergne-Rhône-Alpes', departement: 'Ain', departementCode: '01', population: '5 000', codePostal: '01210' },
+  { slug: 'saint-philippe', name: 'Saint-Philippe', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '5 000', codePostal: '97442' },
+  { slug: 'giberville', name: 'Giberville', region: 'Normandie', departement: 'Calvados', departementCode: '14', population: '5 000', codePostal: '14730' },
+  { slug: 'habsheim', name: 'Habsheim', region: 'Grand Est', departement: 'Haut-Rhin', departementCode: '68', population: '5 000', codePostal: '68440' },
+  { slug: 'yffiniac', name: 'Yffiniac', region: 'Bretagne', departement: 'Côtes-d\'Armor', departementCode: '22', population: '5 000', codePostal: '22120' },
+  { slug: 'sommieres', name: 'Sommières', region: 'Occitanie', departement: 'Gard', departementCode: '30', population: '5 000', codePostal: '30250' },
+  {
+    slug: 'villefranche-de-lauragais',
+    name: 'Villefranche-de-Lauragais',
+    region: 'Occitanie',
+    departement: 'Haute-Garonne',
+    departementCode: '31',
+    population: '5 000',
+    codePostal: '31290',
+  },
+  { slug: 'la-ferte-mace', name: 'La Ferté Macé', region: 'Normandie', departement: 'Orne', departementCode: '61', population: '5 000', codePostal: '61410' },
+  { slug: 'blaye', name: 'Blaye', region: 'Nouvelle-Aquitaine', departement: 'Gironde', departementCode: '33', population: '5 000', codePostal: '33390' },
+  { slug: 'haillicourt', name: 'Haillicourt', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62940' },
+  { slug: 'bonnieres-sur-seine', name: 'Bonnières-sur-Seine', region: 'Île-de-France', departement: 'Yvelines', departementCode: '78', population: '5 000', codePostal: '78270' },
+  { slug: 'luynes', name: 'Luynes', region: 'Centre-Val de Loire', departement: 'Indre-et-Loire', departementCode: '37', population: '5 000', codePostal: '37230' },
+  { slug: 'petite-foret', name: 'Petite-Forêt', region: 'Hauts-de-France', departement: 'Nord', departementCode: '59', population: '5 000', codePostal: '59494' },
+  { slug: 'laventie', name: 'Laventie', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62840' },
+  { slug: 'saint-sever', name: 'Saint-Sever', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '5 000', codePostal: '40500' },
+  { slug: 'cilaos', name: 'Cilaos', region: 'La Réunion', departement: 'La Réunion', departementCode: '974', population: '5 000', codePostal: '97413' },
+  { slug: 'bezannes', name: 'Bezannes', region: 'Grand Est', departement: 'Marne', departementCode: '51', population: '5 000', codePostal: '51430' },
+  { slug: 'champagne-sur-oise', name: 'Champagne-sur-Oise', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '5 000', codePostal: '95660' },
+  { slug: 'sainte-soulle', name: 'Sainte-Soulle', region: 'Nouvelle-Aquitaine', departement: 'Charente-Maritime', departementCode: '17', population: '5 000', codePostal: '17220' },
+  { slug: 'la-meziere', name: 'La Mézière', region: 'Bretagne', departement: 'Ille-et-Vilaine', departementCode: '35', population: '5 000', codePostal: '35520' },
+  { slug: 'gruissan', name: 'Gruissan', region: 'Occitanie', departement: 'Aude', departementCode: '11', population: '5 000', codePostal: '11430' },
+  { slug: 'hauts-de-bienne', name: 'Hauts de Bienne', region: 'Bourgogne-Franche-Comté', departement: 'Jura', departementCode: '39', population: '5 000', codePostal: '39400' },
+  {
+    slug: 'saint-etienne-au-mont',
+    name: 'Saint-Étienne-au-Mont',
+    region: 'Hauts-de-France',
+    departement: 'Pas-de-Calais',
+    departementCode: '62',
+    population: '5 000',
+    codePostal: '62360',
+  },
+  { slug: 'pacy-sur-eure', name: 'Pacy-sur-Eure', region: 'Normandie', departement: 'Eure', departementCode: '27', population: '5 000', codePostal: '27120' },
+  { slug: 'morcenx-la-nouvelle', name: 'Morcenx-la-Nouvelle', region: 'Nouvelle-Aquitaine', departement: 'Landes', departementCode: '40', population: '5 000', codePostal: '40110' },
+  { slug: 'decazeville', name: 'Decazeville', region: 'Occitanie', departement: 'Aveyron', departementCode: '12', population: '5 000', codePostal: '12300' },
+  { slug: 'allinges', name: 'Allinges', region: 'Auvergne-Rhône-Alpes', departement: 'Haute-Savoie', departementCode: '74', population: '5 000', codePostal: '74200' },
+  { slug: 'saint-james', name: 'Saint-James', region: 'Normandie', departement: 'Manche', departementCode: '50', population: '5 000', codePostal: '50240' },
+  { slug: 'rambervillers', name: 'Rambervillers', region: 'Grand Est', departement: 'Vosges', departementCode: '88', population: '5 000', codePostal: '88700' },
+  { slug: 'plouigneau', name: 'Plouigneau', region: 'Bretagne', departement: 'Finistère', departementCode: '29', population: '5 000', codePostal: '29610' },
+  { slug: 'beaurepaire', name: 'Beaurepaire', region: 'Auvergne-Rhône-Alpes', departement: 'Isère', departementCode: '38', population: '5 000', codePostal: '38270' },
+  { slug: 'lestrem', name: 'Lestrem', region: 'Hauts-de-France', departement: 'Pas-de-Calais', departementCode: '62', population: '5 000', codePostal: '62136' },
+  {
+    slug: 'villefranche-sur-mer',
+    name: 'Villefranche-sur-Mer',
+    region: 'Provence-Alpes-Côte d\'Azur',
+    departement: 'Alpes-Maritimes',
+    departementCode: '06',
+    population: '5 000',
+    codePostal: '06230',
+  },
+  { slug: 'luzarches', name: 'Luzarches', region: 'Île-de-France', departement: 'Val-d\'Oise', departementCode: '95', population: '5 000', codePostal: '95270' },
+  {
+    slug: 'taputapuatea',
+    name: 'Taputapuatea',
+    region: 'Polynésie française',
+    departement: 'Polynésie française',
+    departementCode: '987',
+    population: '5 000',
+    codePostal: '98735',
+  },
+  { slug: 'papaichton', name: 'Papaichton', region: 'Guyane', departement: 'Guyane', departementCode: '973', population: '5 000', codePostal: '97316' },
+]
+
+export function getVilleCoreBySlug(slug: string): VilleCore | undefined {
+  const i = lookup(VILLE_INDEX, slug)
+  return i === undefined ? undefined : villesCore[i]
+}
+
+/** getVillesByDepartement() de france.ts, sans les champs lourds */
+export function getVillesCoreByDepartement(departementCode: string): VilleCore[] {
+  return pick(villesCore, lookup(VILLES_BY_DEPARTEMENT, departementCode))
+}
+
+/** getNearbyCities() de france.ts, sans les champs lourds */
+export function getNearbyVillesCore(villeSlug: string, limit: number = 5): VilleCore[] {
+  const i = lookup(VILLE_INDEX, villeSlug)
+  return i === undefined ? [] : pick(villesCore, nearbyPositions(i, villesCore[i], limit))
+}
+
+/** Description et quartiers d'une ville, chargés avec le shard de son département */
+export async function loadVilleDetails(ville: Pick<VilleCore, 'slug' | 'departementCode'>): Promise<VilleDetails | undefined> {
+  const shard: { villeDetails: Record<string, VilleDetails> } = await import(`./france-villes/${ville.departementCode}`)
+  return lookup(shard.villeDetails, ville.slug)
+}
+
+/** Ville complète sans importer france.ts : le noyau plus un seul shard départemental */
+export async function loadVille(slug: string): Promise<Ville | undefined> {
+  const core = getVilleCoreBySlug(slug)
+  if (!core) return undefined
+  const details = await loadVilleDetails(core)
+  return { ...core, description: details?.description ?? '', quartiers: details?.quartiers ?? [] }
+}
+
+/** getQuartierBySlug() de france.ts, à partir de loadVille() */
+export async function loadQuartier(villeSlug: string, qSlug: string): Promise<{ ville: Ville; quartierName: string } | null> {
+  const positions = lookup(QUARTIER_INDEX, villeSlug)
+  const i = positions && lookup(positions, qSlug)
+  if (i === undefined) return null
+  const ville = await loadVille(villeSlug)
+  return ville ? { ville, quartierName: ville.quartiers[i] } : null
+}
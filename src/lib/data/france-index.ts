@@ -0,0 +1,2927 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+/** Length of `villes` when the index was built */
+export const VILLE_COUNT: number = 2267
+
+/** Ville slug -> position in `villes` */
+export const VILLE_INDEX: Record<string, number> = {
+  paris: 0,
+  marseille: 1,
+  lyon: 2,
+  toulouse: 3,
+  nice: 4,
+  nantes: 5,
+  montpellier: 6,
+  strasbourg: 7,
+  bordeaux: 8,
+  lille: 9,
+  rennes: 10,
+  toulon: 11,
+  reims: 12,
+  'saint-etienne': 13,
+  'le-havre': 14,
+  villeurbanne: 15,
+  dijon: 16,
+  angers: 17,
+  grenoble: 18,
+  'saint-denis': 19,
+  nimes: 20,
+  'aix-en-provence': 21,
+  'clermont-ferrand': 22,
+  'le-mans': 23,
+  brest: 24,
+  tours: 25,
+  amiens: 26,
+  annecy: 27,
+  limoges: 28,
+  metz: 29,
+  perpignan: 30,
+  'boulogne-billancourt': 31,
+  besancon: 32,
+  rouen: 33,
+  orleans: 34,
+  montreuil: 35,
+  caen: 36,
+  'saint-paul': 37,
+  argenteuil: 38,
+  mulhouse: 39,
+  nancy: 40,
+  tourcoing: 41,
+  roubaix: 42,
+  nanterre: 43,
+  'vitry-sur-seine': 44,
+  'asnieres-sur-seine': 45,
+  creteil: 46,
+  avignon: 47,
+  colombes: 48,
+  poitiers: 49,
+  aubervilliers: 50,
+  'aulnay-sous-bois': 51,
+  dunkerque: 52,
+  noumea: 53,
+  'saint-pierre': 54,
+  versailles: 55,
+  courbevoie: 56,
+  'rueil-malmaison': 57,
+  'le-tampon': 58,
+  beziers: 59,
+  pau: 60,
+  'la-rochelle': 61,
+  'cherbourg-en-cotentin': 62,
+  merignac: 63,
+  'champigny-sur-marne': 64,
+  antibes: 65,
+  'saint-maur-des-fosses': 66,
+  ajaccio: 67,
+  'fort-de-france': 68,
+  'saint-nazaire': 69,
+  cannes: 70,
+  'noisy-le-grand': 71,
+  drancy: 72,
+  mamoudzou: 73,
+  cergy: 74,
+  'levallois-perret': 75,
+  'issy-les-moulineaux': 76,
+  calais: 77,
+  pessac: 78,
+  colmar: 79,
+  'evry-courcouronnes': 80,
+  venissieux: 81,
+  'ivry-sur-seine': 82,
+  valence: 83,
+  clichy: 84,
+  quimper: 85,
+  antony: 86,
+  bourges: 87,
+  'la-seyne-sur-mer': 88,
+  montauban: 89,
+  'villeneuve-d-ascq': 90,
+  cayenne: 91,
+  'le-blanc-mesnil': 92,
+  troyes: 93,
+  pantin: 94,
+  villejuif: 95,
+  chambery: 96,
+  niort: 97,
+  frejus: 98,
+  'neuilly-sur-seine': 99,
+  sarcelles: 100,
+  'saint-andre': 101,
+  clamart: 102,
+  lorient: 103,
+  narbonne: 104,
+  bobigny: 105,
+  meaux: 106,
+  'maisons-alfort': 107,
+  hyeres: 108,
+  vannes: 109,
+  beauvais: 110,
+  'saint-louis': 111,
+  'la-roche-sur-yon': 112,
+  chelles: 113,
+  'corbeil-essonnes': 114,
+  'saint-laurent-du-maroni': 115,
+  cholet: 116,
+  bayonne: 117,
+  'fontenay-sous-bois': 118,
+  'saint-ouen-sur-seine': 119,
+  'cagnes-sur-mer': 120,
+  'vaulx-en-velin': 121,
+  'epinay-sur-seine': 122,
+  'saint-quentin': 123,
+  sartrouville: 124,
+  sevran: 125,
+  arles: 126,
+  massy: 127,
+  albi: 128,
+  'les-abymes': 129,
+  gennevilliers: 130,
+  'saint-herblain': 131,
+  grasse: 132,
+  bondy: 133,
+  'les-sables-d-olonne': 134,
+  laval: 135,
+  evreux: 136,
+  'saint-priest': 137,
+  suresnes: 138,
+  martigues: 139,
+  vincennes: 140,
+  aubagne: 141,
+  'saint-malo': 142,
+  'livry-gargan': 143,
+  blois: 144,
+  'rosny-sous-bois': 145,
+  'la-courneuve': 146,
+  'brive-la-gaillarde': 147,
+  bastia: 148,
+  talence: 149,
+  meudon: 150,
+  montrouge: 151,
+  ales: 152,
+  carcassonne: 153,
+  melun: 154,
+  'choisy-le-roi': 155,
+  'saint-germain-en-laye': 156,
+  belfort: 157,
+  'charleville-mezieres': 158,
+  alfortville: 159,
+  'noisy-le-sec': 160,
+  sete: 161,
+  'chalon-sur-saone': 162,
+  bagneux: 163,
+  tarbes: 164,
+  'saint-brieuc': 165,
+  istres: 166,
+  'salon-de-provence': 167,
+  puteaux: 168,
+  'caluire-et-cuire': 169,
+  reze: 170,
+  'mantes-la-jolie': 171,
+  valenciennes: 172,
+  anglet: 173,
+  bagnolet: 174,
+  bron: 175,
+  'chalons-en-champagne': 176,
+  chateauroux: 177,
+  arras: 178,
+  thionville: 179,
+  'villenave-d-ornon': 180,
+  castres: 181,
+  'bourg-en-bresse': 182,
+  gagny: 183,
+  'le-cannet': 184,
+  angouleme: 185,
+  'garges-les-gonesse': 186,
+  villepinte: 187,
+  stains: 188,
+  gap: 189,
+  poissy: 190,
+  colomiers: 191,
+  wattrelos: 192,
+  draguignan: 193,
+  compiegne: 194,
+  montelimar: 195,
+  'boulogne-sur-mer': 196,
+  douai: 197,
+  'marcq-en-bar-ul': 198,
+  'neuilly-sur-marne': 199,
+  'le-lamentin': 200,
+  'saint-joseph': 201,
+  'pontault-combault': 202,
+  'saint-benoit': 203,
+  'la-ciotat': 204,
+  'joue-les-tours': 205,
+  'tremblay-en-france': 206,
+  chartres: 207,
+  'oullins-pierre-benite': 208,
+  'thonon-les-bains': 209,
+  franconville: 210,
+  'saint-martin-d-heres': 211,
+  annemasse: 212,
+  'savigny-sur-orge': 213,
+  echirolles: 214,
+  palaiseau: 215,
+  romainville: 216,
+  'saint-raphael': 217,
+  'six-fours-les-plages': 218,
+  'sainte-marie': 219,
+  'conflans-sainte-honorine': 220,
+  vitrolles: 221,
+  chatillon: 222,
+  meyzieu: 223,
+  'athis-mons': 224,
+  'la-possession': 225,
+  matoury: 226,
+  bezons: 227,
+  haguenau: 228,
+  creil: 229,
+  'villeneuve-saint-georges': 230,
+  'villefranche-sur-saone': 231,
+  'saint-leu': 232,
+  'chatenay-malabry': 233,
+  'saint-chamond': 234,
+  'sainte-genevieve-des-bois': 235,
+  roanne: 236,
+  'le-perreux-sur-marne': 237,
+  macon: 238,
+  auxerre: 239,
+  dumbea: 240,
+  schiltigheim: 241,
+  trappes: 242,
+  'les-mureaux': 243,
+  houilles: 244,
+  'le-port': 245,
+  marignane: 246,
+  'romans-sur-isere': 247,
+  'villiers-sur-marne': 248,
+  montlucon: 249,
+  nevers: 250,
+  lens: 251,
+  thiais: 252,
+  'saint-medard-en-jalles': 253,
+  agen: 254,
+  'montigny-le-bretonneux': 255,
+  'nogent-sur-marne': 256,
+  'aix-les-bains': 257,
+  epinal: 258,
+  'saint-laurent-du-var': 259,
+  koungou: 260,
+  pontoise: 261,
+  begles: 262,
+  plaisir: 263,
+  'herblay-sur-seine': 264,
+  vienne: 265,
+  carpentras: 266,
+  'mont-de-marsan': 267,
+  dreux: 268,
+  'vigneux-sur-seine': 269,
+  'rillieux-la-pape': 270,
+  goussainville: 271,
+  'ris-orangis': 272,
+  'l-hay-les-roses': 273,
+  'saint-martin': 274,
+  'savigny-le-temple': 275,
+  cambrai: 276,
+  cachan: 277,
+  chatellerault: 278,
+  'baie-mahault': 279,
+  'viry-chatillon': 280,
+  'le-chesnay-rocquencourt': 281,
+  menton: 282,
+  chatou: 283,
+  malakoff: 284,
+  'la-garenne-colombes': 285,
+  tournefeuille: 286,
+  'bourgoin-jallieu': 287,
+  draveil: 288,
+  lievin: 289,
+  'villiers-le-bel': 290,
+  'vand-uvre-les-nancy': 291,
+  agde: 292,
+  'decines-charpieu': 293,
+  'saint-cloud': 294,
+  faaa: 295,
+  villemomble: 296,
+  guyancourt: 297,
+  orange: 298,
+  fresnes: 299,
+  'saint-etienne-du-rouvray': 300,
+  ermont: 301,
+  'clichy-sous-bois': 302,
+  vallauris: 303,
+  perigueux: 304,
+  'sotteville-les-rouen': 305,
+  'bois-colombes': 306,
+  'le-plessis-robinson': 307,
+  'charenton-le-pont': 308,
+  punaauia: 309,
+  maubeuge: 310,
+  montfermeil: 311,
+  vanves: 312,
+  'saint-sebastien-sur-loire': 313,
+  orvault: 314,
+  dieppe: 315,
+  soissons: 316,
+  yerres: 317,
+  'illkirch-graffenstaden': 318,
+  'sucy-en-brie': 319,
+  'le-gosier': 320,
+  rambouillet: 321,
+  'remire-montjoly': 322,
+  gonesse: 323,
+  paita: 324,
+  blagnac: 325,
+  taverny: 326,
+  'la-teste-de-buch': 327,
+  'bussy-saint-georges': 328,
+  'champs-sur-marne': 329,
+  'limeil-brevannes': 330,
+  'cormeilles-en-parisis': 331,
+  bergerac: 332,
+  sens: 333,
+  lambersart: 334,
+  armentieres: 335,
+  gradignan: 336,
+  villeparisis: 337,
+  sannois: 338,
+  etampes: 339,
+  grigny: 340,
+  cenon: 341,
+  'bretigny-sur-orge': 342,
+  papeete: 343,
+  lunel: 344,
+  'la-garde': 345,
+  elancourt: 346,
+  saumur: 347,
+  vertou: 348,
+  aurillac: 349,
+  eaubonne: 350,
+  biarritz: 351,
+  miramas: 352,
+  muret: 353,
+  'castelnau-le-lez': 354,
+  'villeneuve-la-garenne': 355,
+  'les-ulis': 356,
+  'les-pavillons-sous-bois': 357,
+  sevremoine: 358,
+  'le-grand-quevilly': 359,
+  lormont: 360,
+  'henin-beaumont': 361,
+  brunoy: 362,
+  cavaillon: 363,
+  'saint-ouen-l-aumone': 364,
+  'sainte-suzanne': 365,
+  alencon: 366,
+  saintes: 367,
+  'le-mont-dore': 368,
+  vernon: 369,
+  bethune: 370,
+  vichy: 371,
+  'le-bouscat': 372,
+  vierzon: 373,
+  libourne: 374,
+  eysines: 375,
+  kourou: 376,
+  montbeliard: 377,
+  'petit-bourg': 378,
+  orly: 379,
+  laon: 380,
+  frontignan: 381,
+  'le-kremlin-bicetre': 382,
+  coueron: 383,
+  'fontenay-aux-roses': 384,
+  montgeron: 385,
+  'beaupreau-en-mauges': 386,
+  rodez: 387,
+  'sainte-anne': 388,
+  'les-lilas': 389,
+  dole: 390,
+  'la-valette-du-var': 391,
+  'dammarie-les-lys': 392,
+  olivet: 393,
+  'herouville-saint-clair': 394,
+  rochefort: 395,
+  'combs-la-ville': 396,
+  lanester: 397,
+  'roissy-en-brie': 398,
+  'tassin-la-demi-lune': 399,
+  'saint-jean-de-braye': 400,
+  'deuil-la-barre': 401,
+  'maisons-laffitte': 402,
+  'le-moule': 403,
+  'velizy-villacoublay': 404,
+  challans: 405,
+  'saint-dizier': 406,
+  torcy: 407,
+  manosque: 408,
+  loos: 409,
+  'gif-sur-yvette': 410,
+  'les-pennes-mirabeau': 411,
+  oyonnax: 412,
+  'montigny-les-cormeilles': 413,
+  auch: 414,
+  abbeville: 415,
+  'villeneuve-sur-lot': 416,
+  'mantes-la-ville': 417,
+  sevres: 418,
+  'montereau-fault-yonne': 419,
+  acheres: 420,
+  'le-petit-quevilly': 421,
+  arcueil: 422,
+  epernay: 423,
+  'gujan-mestras': 424,
+  dax: 425,
+  millau: 426,
+  fontaine: 427,
+  'chemille-en-anjou': 428,
+  longjumeau: 429,
+  'neuilly-plaisance': 430,
+  hazebrouck: 431,
+  'nogent-sur-oise': 432,
+  voiron: 433,
+  'fleury-les-aubrais': 434,
+  'la-madeleine': 435,
+  'saint-michel-sur-orge': 436,
+  montmorency: 437,
+  'montigny-les-metz': 438,
+  'sainte-foy-les-lyon': 439,
+  'morsang-sur-orge': 440,
+  'mandelieu-la-napoule': 441,
+  gardanne: 442,
+  'le-robert': 443,
+  'lagny-sur-marne': 444,
+  allauch: 445,
+  'bruay-la-buissiere': 446,
+  givors: 447,
+  'saint-gratien': 448,
+  'saint-cyr-l-ecole': 449,
+  'ozoir-la-ferriere': 450,
+  'saint-genis-laval': 451,
+  'montaigu-vendee': 452,
+  'le-plessis-trevise': 453,
+  'mons-en-bar-ul': 454,
+  'plaisance-du-touch': 455,
+  'saint-mande': 456,
+  'bourg-la-reine': 457,
+  'villeneuve-le-roi': 458,
+  carquefou: 459,
+  sceaux: 460,
+  concarneau: 461,
+  chaumont: 462,
+  lingolsheim: 463,
+  'carrieres-sous-poissy': 464,
+  'coudekerque-branche': 465,
+  wasquehal: 466,
+  halluin: 467,
+  'la-chapelle-sur-erdre': 468,
+  denain: 469,
+  cugnaux: 470,
+  maurepas: 471,
+  chaville: 472,
+  croix: 473,
+  bouguenais: 474,
+  'joinville-le-pont': 475,
+  'le-creusot': 476,
+  forbach: 477,
+  'la-celle-saint-cloud': 478,
+  'mitry-mory': 479,
+  'chilly-mazarin': 480,
+  beaune: 481,
+  lannion: 482,
+  fougeres: 483,
+  'l-isle-sur-la-sorgue': 484,
+  'grande-synthe': 485,
+  'mont-saint-aignan': 486,
+  sarreguemines: 487,
+  cahors: 488,
+  bruges: 489,
+  'bourg-les-valence': 490,
+  albertville: 491,
+  bressuire: 492,
+  gentilly: 493,
+  'cournon-d-auvergne': 494,
+  vence: 495,
+  macouria: 496,
+  'chevilly-larue': 497,
+  ronchin: 498,
+  mougins: 499,
+  bruz: 500,
+  lisieux: 501,
+  selestat: 502,
+  'la-crau': 503,
+  pertuis: 504,
+  'le-mee-sur-seine': 505,
+  'sch-lcher': 506,
+  'saint-lo': 507,
+  villefontaine: 508,
+  royan: 509,
+  vitre: 510,
+  'juvisy-sur-orge': 511,
+  'saint-fons': 512,
+  'saint-die-des-vosges': 513,
+  moulins: 514,
+  sorgues: 515,
+  'brie-comte-robert': 516,
+  ploemeur: 517,
+  riom: 518,
+  meylan: 519,
+  'cesson-sevigne': 520,
+  pornic: 521,
+  'chennevieres-sur-marne': 522,
+  louviers: 523,
+  'mauges-sur-loire': 524,
+  lamentin: 525,
+  'faches-thumesnil': 526,
+  hem: 527,
+  bischheim: 528,
+  'le-puy-en-velay': 529,
+  'sanary-sur-mer': 530,
+  cognac: 531,
+  'moissy-cramayel': 532,
+  'bry-sur-marne': 533,
+  'chateauneuf-les-martigues': 534,
+  eragny: 535,
+  'le-pontet': 536,
+  'romorantin-lanthenay': 537,
+  floirac: 538,
+  'bonneuil-sur-marne': 539,
+  luneville: 540,
+  'moorea-maiao': 541,
+  'bagnols-sur-ceze': 542,
+  ducos: 543,
+  hendaye: 544,
+  pontarlier: 545,
+  'soisy-sous-montmorency': 546,
+  'saint-egreve': 547,
+  'digne-les-bains': 548,
+  osny: 549,
+  ecully: 550,
+  carvin: 551,
+  'saint-maximin-la-sainte-baume': 552,
+  limay: 553,
+  'jouy-le-moutier': 554,
+  brignoles: 555,
+  dzaoudzi: 556,
+  cluses: 557,
+  balma: 558,
+  garches: 559,
+  'sainte-rose': 560,
+  'capesterre-belle-eau': 561,
+  'segre-en-anjou-bleu': 562,
+  'ambares-et-lagrave': 563,
+  'villeneuve-loubet': 564,
+  'l-isle-d-abeau': 565,
+  chamalieres: 566,
+  'vire-normandie': 567,
+  avion: 568,
+  yutz: 569,
+  lattes: 570,
+  marmande: 571,
+  'boissy-saint-leger': 572,
+  sallanches: 573,
+  saran: 574,
+  fecamp: 575,
+  annonay: 576,
+  'lamballe-armor': 577,
+  viroflay: 578,
+  blanquefort: 579,
+  'oree-d-anjou': 580,
+  'montceau-les-mines': 581,
+  firminy: 582,
+  'saint-cyr-sur-loire': 583,
+  'le-pre-saint-gervais': 584,
+  'la-baule-escoublac': 585,
+  verdun: 586,
+  guerande: 587,
+  'les-clayes-sous-bois': 588,
+  'saint-jean-de-la-ruelle': 589,
+  'loire-authion': 590,
+  'marly-le-roi': 591,
+  valserhone: 592,
+  sedan: 593,
+  cestas: 594,
+  'lons-le-saunier': 595,
+  'bois-d-arcy': 596,
+  'chateau-gontier-sur-mayenne': 597,
+  chateaurenard: 598,
+  mauguio: 599,
+  'les-herbiers': 600,
+  orsay: 601,
+  pamiers: 602,
+  rumilly: 603,
+  mennecy: 604,
+  'sainte-luce-sur-loire': 605,
+  coulommiers: 606,
+  landerneau: 607,
+  trelaze: 608,
+  'verneuil-sur-seine': 609,
+  'morne-a-l-eau': 610,
+  'saint-julien-en-genevois': 611,
+  gaillac: 612,
+  'saint-leu-la-foret': 613,
+  montbrison: 614,
+  vaureal: 615,
+  'sin-le-noble': 616,
+  domont: 617,
+  'le-pecq': 618,
+  noisiel: 619,
+  'saint-amand-les-eaux': 620,
+  'amberieu-en-bugey': 621,
+  'le-bourget': 622,
+  luce: 623,
+  hennebont: 624,
+  'saint-pierre-des-corps': 625,
+  'fos-sur-mer': 626,
+  dembeni: 627,
+  biscarrosse: 628,
+  hayange: 629,
+  'port-de-bouc': 630,
+  'le-francois': 631,
+  toul: 632,
+  'saint-just-saint-rambert': 633,
+  vendome: 634,
+  'montrevault-sur-evre': 635,
+  'saint-fargeau-ponthierry': 636,
+  beaucaire: 637,
+  montevrain: 638,
+  longwy: 639,
+  francheville: 640,
+  fontainebleau: 641,
+  'le-vesinet': 642,
+  wittenheim: 643,
+  guipavas: 644,
+  wattignies: 645,
+  montivilliers: 646,
+  elbeuf: 647,
+  'roquebrune-sur-argens': 648,
+  tarascon: 649,
+  'bouc-bel-air': 650,
+  'castanet-tolosan': 651,
+  avrille: 652,
+  'rive-de-gier': 653,
+  morlaix: 654,
+  'ramonville-saint-agne': 655,
+  senlis: 656,
+  issoire: 657,
+  montmagny: 658,
+  'chateau-thierry': 659,
+  vesoul: 660,
+  haubourdin: 661,
+  lognes: 662,
+  'saint-brice-sous-foret': 663,
+  'verrieres-le-buisson': 664,
+  'pointe-a-pitre': 665,
+  arnouville: 666,
+  'saint-avertin': 667,
+  woippy: 668,
+  'romilly-sur-seine': 669,
+  'la-fleche': 670,
+  illzach: 671,
+  'saint-jean-de-luz': 672,
+  montargis: 673,
+  'carrieres-sur-seine': 674,
+  fameck: 675,
+  laxou: 676,
+  dinan: 677,
+  'saint-avold': 678,
+  'le-raincy': 679,
+  'saint-gilles': 680,
+  bailleul: 681,
+  'villers-les-nancy': 682,
+  'saint-orens-de-gameville': 683,
+  pontivy: 684,
+  mahina: 685,
+  'bar-le-duc': 686,
+  ollioules: 687,
+  montesson: 688,
+  'saint-brevin-les-pins': 689,
+  'bois-guillaume': 690,
+  'saint-maurice': 691,
+  'saint-paul-les-dax': 692,
+  'l-etang-sale': 693,
+  'saint-genis-pouilly': 694,
+  flers: 695,
+  plerin: 696,
+  valenton: 697,
+  canteleu: 698,
+  billere: 699,
+  'saint-omer': 700,
+  rixheim: 701,
+  persan: 702,
+  'crepy-en-valois': 703,
+  castelsarrasin: 704,
+  montataire: 705,
+  chenove: 706,
+  auray: 707,
+  'pont-a-mousson': 708,
+  hautmont: 709,
+  'saint-martin-de-crau': 710,
+  morangis: 711,
+  'sainte-maxime': 712,
+  roncq: 713,
+  audincourt: 714,
+  douarnenez: 715,
+  pirae: 716,
+  'fontenay-le-comte': 717,
+  juvignac: 718,
+  'lys-lez-lannoy': 719,
+  bollene: 720,
+  lieusaint: 721,
+  'belleville-en-beaujolais': 722,
+  bandraboua: 723,
+  ostwald: 724,
+  'saint-francois': 725,
+  tsingoni: 726,
+  'vaires-sur-marne': 727,
+  meru: 728,
+  thouars: 729,
+  mions: 730,
+  andresy: 731,
+  caudry: 732,
+  'berre-l-etang': 733,
+  carros: 734,
+  'saint-jacques-de-la-lande': 735,
+  pierrelatte: 736,
+  'fleury-merogis': 737,
+  'fontenay-le-fleury': 738,
+  avon: 739,
+  gex: 740,
+  lons: 741,
+  'taiarapu-est': 742,
+  amilly: 743,
+  plouzane: 744,
+  argentan: 745,
+  gien: 746,
+  'plougastel-daoulas': 747,
+  genas: 748,
+  moissac: 749,
+  tulle: 750,
+  mouvaux: 751,
+  kingersheim: 752,
+  'claye-souilly': 753,
+  bonneville: 754,
+  'saint-jean-de-vedas': 755,
+  cusset: 756,
+  monteux: 757,
+  cuers: 758,
+  'freyming-merlebach': 759,
+  lourdes: 760,
+  seclin: 761,
+  'val-de-reuil': 762,
+  'saint-andre-lez-lille': 763,
+  'canet-en-roussillon': 764,
+  anzin: 765,
+  autun: 766,
+  'les-ponts-de-ce': 767,
+  'villeneuve-les-avignon': 768,
+  outreau: 769,
+  graulhet: 770,
+  'saint-hilaire-de-riez': 771,
+  'petite-ile': 772,
+  tergnier: 773,
+  auriol: 774,
+  'bras-panon': 775,
+  noyon: 776,
+  betton: 777,
+  tarnos: 778,
+  gueret: 779,
+  fonsorbes: 780,
+  berck: 781,
+  amboise: 782,
+  yzeure: 783,
+  nemours: 784,
+  mayenne: 785,
+  chateaudun: 786,
+  'moret-loing-et-orvanne': 787,
+  'saint-andre-les-vergers': 788,
+  pornichet: 789,
+  paea: 790,
+  comines: 791,
+  aubergenville: 792,
+  'chambray-les-tours': 793,
+  'andernos-les-bains': 794,
+  'chalette-sur-loing': 795,
+  meze: 796,
+  bayeux: 797,
+  'la-chapelle-saint-luc': 798,
+  'l-union': 799,
+  'saint-andre-de-cubzac': 800,
+  'marquette-lez-lille': 801,
+  vidauban: 802,
+  obernai: 803,
+  rognac: 804,
+  louvres: 805,
+  villetaneuse: 806,
+  'sollies-pont': 807,
+  granville: 808,
+  brignais: 809,
+  'l-isle-adam': 810,
+  'saint-ave': 811,
+  quimperle: 812,
+  mende: 813,
+  aubenas: 814,
+  'pont-du-chateau': 815,
+  gisors: 816,
+  'pont-sainte-maxence': 817,
+  guidel: 818,
+  'sable-sur-sarthe': 819,
+  oissel: 820,
+  'le-chambon-feugerolles': 821,
+  vernouillet: 822,
+  cogolin: 823,
+  chateaubriant: 824,
+  creutzwald: 825,
+  harnes: 826,
+  bischwiller: 827,
+  'la-queue-en-brie': 828,
+  'triel-sur-seine': 829,
+  riedisheim: 830,
+  raismes: 831,
+  sarrebourg: 832,
+  castelnaudary: 833,
+  'bully-les-mines': 834,
+  'saint-gaudens': 835,
+  'ferney-voltaire': 836,
+  craponne: 837,
+  'onet-le-chateau': 838,
+  'saint-cyprien': 839,
+  'la-motte-servolex': 840,
+  cernay: 841,
+  mios: 842,
+  'roquebrune-cap-martin': 843,
+  florange: 844,
+  barentin: 845,
+  'septemes-les-vallons': 846,
+  marly: 847,
+  'saint-pierre-du-perray': 848,
+  vedene: 849,
+  valbonne: 850,
+  ifs: 851,
+  beausoleil: 852,
+  villepreux: 853,
+  'dammartin-en-goele': 854,
+  'le-relecq-kerhuon': 855,
+  talant: 856,
+  'riviere-salee': 857,
+  somain: 858,
+  papara: 859,
+  'h-nheim': 860,
+  'seyssinet-pariset': 861,
+  'bauge-en-anjou': 862,
+  pace: 863,
+  dugny: 864,
+  arpajon: 865,
+  vauvert: 866,
+  'saint-cyr-sur-mer': 867,
+  villecresnes: 868,
+  sassenage: 869,
+  'bruay-sur-l-escaut': 870,
+  thiers: 871,
+  'plan-de-cuques': 872,
+  provins: 873,
+  'saint-esteve': 874,
+  'saint-germain-les-arpajon': 875,
+  mericourt: 876,
+  pia: 877,
+  'epinay-sous-senart': 878,
+  'riviere-pilote': 879,
+  'ancenis-saint-gereon': 880,
+  chauny: 881,
+  'n-ux-les-mines': 882,
+  bolbec: 883,
+  'maizieres-les-metz': 884,
+  'les-avirons': 885,
+  ploufragan: 886,
+  'la-hague': 887,
+  pontchateau: 888,
+  'vaux-le-penil': 889,
+  saverne: 890,
+  'la-trinite': 891,
+  fourmies: 892,
+  pamandzi: 893,
+  yvetot: 894,
+  'enghien-les-bains': 895,
+  biganos: 896,
+  gravelines: 897,
+  gaillard: 898,
+  'saint-junien': 899,
+  dourdan: 900,
+  briancon: 901,
+  'le-haillan': 902,
+  'la-roche-sur-foron': 903,
+  panazol: 904,
+  'montlouis-sur-loire': 905,
+  corbas: 906,
+  'le-luc': 907,
+  'tournon-sur-rhone': 908,
+  'villefranche-de-rouergue': 909,
+  castelginest: 910,
+  'saint-jean': 911,
+  guebwiller: 912,
+  'guilherand-granges': 913,
+  cesson: 914,
+  chassieu: 915,
+  'porto-vecchio': 916,
+  issoudun: 917,
+  sada: 918,
+  riorges: 919,
+  'chevigny-saint-sauveur': 920,
+  arcachon: 921,
+  'ville-d-avray': 922,
+  pelissanne: 923,
+  'le-taillan-medoc': 924,
+  'villeneuve-tolosane': 925,
+  'doue-en-anjou': 926,
+  'la-chapelle-saint-mesmin': 927,
+  'mouans-sartoux': 928,
+  'croissy-sur-seine': 929,
+  wambrechies: 930,
+  'thouare-sur-loire': 931,
+  'vitry-le-francois': 932,
+  'ormesson-sur-marne': 933,
+  lavaur: 934,
+  'pont-saint-esprit': 935,
+  maromme: 936,
+  mana: 937,
+  'le-pont-de-claix': 938,
+  'stiring-wendel': 939,
+  fondettes: 940,
+  'vetraz-monthoux': 941,
+  'saint-saulve': 942,
+  trets: 943,
+  'le-pradet': 944,
+  tarare: 945,
+  'saint-martin-boulogne': 946,
+  orthez: 947,
+  'brissac-loire-aubance': 948,
+  amneville: 949,
+  'villeneuve-les-maguelone': 950,
+  'chanteloup-les-vignes': 951,
+  passy: 952,
+  'ann-ullin': 953,
+  chateaugiron: 954,
+  'teva-i-uta': 955,
+  igny: 956,
+  'deville-les-rouen': 957,
+  erstein: 958,
+  dinard: 959,
+  tinqueux: 960,
+  bondoufle: 961,
+  'boulazac-isle-manoire': 962,
+  'bora-bora': 963,
+  allonnes: 964,
+  beaumont: 965,
+  'epinay-sur-orge': 966,
+  etaples: 967,
+  'oloron-sainte-marie': 968,
+  parempuyre: 969,
+  leognan: 970,
+  chantepie: 971,
+  urrugne: 972,
+  'saint-barthelemy': 973,
+  wittelsheim: 974,
+  mainvilliers: 975,
+  'voisins-le-bretonneux': 976,
+  hericourt: 977,
+  'vieux-conde': 978,
+  'port-jerome-sur-seine': 979,
+  'argeles-sur-mer': 980,
+  treillieres: 981,
+  chantilly: 982,
+  'la-londe-les-maures': 983,
+  fosses: 984,
+  clermont: 985,
+  longuenesse: 986,
+  'charvieu-chavagneux': 987,
+  seysses: 988,
+  limoux: 989,
+  biot: 990,
+  'pernes-les-fontaines': 991,
+  valentigney: 992,
+  brumath: 993,
+  eybens: 994,
+  'villers-cotterets': 995,
+  'la-riche': 996,
+  'portes-les-valence': 997,
+  'caudebec-les-elbeuf': 998,
+  'saint-gely-du-fesc': 999,
+  marck: 1000,
+  cabestany: 1001,
+  'divonne-les-bains': 1002,
+  aubiere: 1003,
+  auterive: 1004,
+  'thorigny-sur-marne': 1005,
+  fouesnant: 1006,
+  'andrezieux-boutheon': 1007,
+  miribel: 1008,
+  blain: 1009,
+  aizenay: 1010,
+  'lezignan-corbieres': 1011,
+  'gignac-la-nerthe': 1012,
+  fuveau: 1013,
+  gerzat: 1014,
+  mondeville: 1015,
+  serris: 1016,
+  oignies: 1017,
+  'saint-esprit': 1018,
+  arue: 1019,
+  pfastatt: 1020,
+  borgo: 1021,
+  apatou: 1022,
+  feyzin: 1023,
+  'villebon-sur-yvette': 1024,
+  'sainte-savine': 1025,
+  buxerolles: 1026,
+  bandrele: 1027,
+  'la-ferte-sous-jouarre': 1028,
+  cabries: 1029,
+  'beaumont-sur-oise': 1030,
+  'le-beausset': 1031,
+  'carentan-les-marais': 1032,
+  ouangani: 1033,
+  'hitiaa-o-te-ra': 1034,
+  couzeix: 1035,
+  lillers: 1036,
+  'saint-claude': 1037,
+  courrieres: 1038,
+  ploermel: 1039,
+  jeumont: 1040,
+  avranches: 1041,
+  apt: 1042,
+  parthenay: 1043,
+  pierrelaye: 1044,
+  'le-muy': 1045,
+  'douchy-les-mines': 1046,
+  villerupt: 1047,
+  'saint-pierre-du-mont': 1048,
+  maxeville: 1049,
+  soyaux: 1050,
+  mazamet: 1051,
+  filliere: 1052,
+  ingre: 1053,
+  auchel: 1054,
+  'grigny-sur-rhone': 1055,
+  'saint-loubes': 1056,
+  lambesc: 1057,
+  'pont-audemer': 1058,
+  'la-farlede': 1059,
+  'neuville-en-ferrain': 1060,
+  loudeac: 1061,
+  'mery-sur-oise': 1062,
+  aniche: 1063,
+  chambly: 1064,
+  'saint-gregoire': 1065,
+  leguevin: 1066,
+  foix: 1067,
+  voreppe: 1068,
+  'bourg-de-peage': 1069,
+  'lancon-provence': 1070,
+  'saint-max': 1071,
+  'saint-amand-montrond': 1072,
+  'saint-laurent-de-la-salanque': 1073,
+  'saint-lys': 1074,
+  carmaux: 1075,
+  ezanville: 1076,
+  lorgues: 1077,
+  beauchamp: 1078,
+  'roche-la-moliere': 1079,
+  'le-rheu': 1080,
+  merville: 1081,
+  frouzins: 1082,
+  figeac: 1083,
+  'portet-sur-garonne': 1084,
+  montlhery: 1085,
+  'grand-couronne': 1086,
+  'mezidon-vallee-d-auge': 1087,
+  bernay: 1088,
+  revel: 1089,
+  bondues: 1090,
+  aytre: 1091,
+  'montigny-en-gohelle': 1092,
+  'cosne-cours-sur-loire': 1093,
+  'saint-barthelemy-d-anjou': 1094,
+  'saint-sulpice-la-pointe': 1095,
+  'basse-goulaine': 1096,
+  'grand-santi': 1097,
+  'saint-doulchard': 1098,
+  aucamville: 1099,
+  'saint-jean-d-illac': 1100,
+  perols: 1101,
+  crosne: 1102,
+  'gros-morne': 1103,
+  lesquin: 1104,
+  'saint-remy-de-provence': 1105,
+  'aire-sur-la-lys': 1106,
+  audenge: 1107,
+  maripasoula: 1108,
+  'nort-sur-erdre': 1109,
+  darnetal: 1110,
+  'saint-jean-le-blanc': 1111,
+  sene: 1112,
+  'bures-sur-yvette': 1113,
+  savenay: 1114,
+  redon: 1115,
+  'l-isle-jourdain': 1116,
+  leers: 1117,
+  albert: 1118,
+  'ville-la-grand': 1119,
+  'petit-caux': 1120,
+  elne: 1121,
+  vallet: 1122,
+  'quincy-sous-senart': 1123,
+  'clermont-l-herault': 1124,
+  tonneins: 1125,
+  lescar: 1126,
+  arques: 1127,
+  landivisiau: 1128,
+  'dombasle-sur-meurthe': 1129,
+  lucon: 1130,
+  'basse-terre': 1131,
+  sallaumines: 1132,
+  guichen: 1133,
+  'sainte-luce': 1134,
+  carqueiranne: 1135,
+  'saint-philbert-de-grand-lieu': 1136,
+  belley: 1137,
+  'magny-les-hameaux': 1138,
+  chaponost: 1139,
+  rombas: 1140,
+  'mont-saint-martin': 1141,
+  'jarville-la-malgrange': 1142,
+  liffre: 1143,
+  'la-ravoire': 1144,
+  'livron-sur-drome': 1145,
+  'le-passage': 1146,
+  molsheim: 1147,
+  'nogent-le-rotrou': 1148,
+  'paray-le-monial': 1149,
+  poisy: 1150,
+  'vert-saint-denis': 1151,
+  hagondange: 1152,
+  'les-sorinieres': 1153,
+  rivesaltes: 1154,
+  'evian-les-bains': 1155,
+  'conde-sur-l-escaut': 1156,
+  'fontaine-les-dijon': 1157,
+  'le-cres': 1158,
+  lifou: 1159,
+  valreas: 1160,
+  dardilly: 1161,
+  ouistreham: 1162,
+  sarzeau: 1163,
+  beuvry: 1164,
+  ussel: 1165,
+  capbreton: 1166,
+  'le-teich': 1167,
+  launaguet: 1168,
+  scionzier: 1169,
+  breuillet: 1170,
+  'prevessin-moens': 1171,
+  'varennes-vauzelles': 1172,
+  bougival: 1173,
+  tomblaine: 1174,
+  grabels: 1175,
+  checy: 1176,
+  lamorlaye: 1177,
+  grenade: 1178,
+  'magny-le-hongre': 1179,
+  'la-fare-les-oliviers': 1180,
+  escaudain: 1181,
+  irigny: 1182,
+  'morieres-les-avignon': 1183,
+  joigny: 1184,
+  queven: 1185,
+  'saint-paul-trois-chateaux': 1186,
+  cornebarrieu: 1187,
+  pibrac: 1188,
+  veauche: 1189,
+  quetigny: 1190,
+  boucau: 1191,
+  cebazat: 1192,
+  'meulan-en-yvelines': 1193,
+  'bellerive-sur-allier': 1194,
+  velaux: 1195,
+  'epagny-metz-tessy': 1196,
+  chirongui: 1197,
+  'gonfreville-l-orcher': 1198,
+  roquevaire: 1199,
+  'entraigues-sur-la-sorgue': 1200,
+  'les-angles': 1201,
+  longvic: 1202,
+  'le-thor': 1203,
+  'chartres-de-bretagne': 1204,
+  perigny: 1205,
+  bessancourt: 1206,
+  'saint-jean-de-monts': 1207,
+  gouvieux: 1208,
+  nangis: 1209,
+  pithiviers: 1210,
+  golbey: 1211,
+  'gretz-armainvilliers': 1212,
+  'monistrol-sur-loire': 1213,
+  'ombree-d-anjou': 1214,
+  'le-portel': 1215,
+  'sarlat-la-caneda': 1216,
+  'la-chapelle-d-armentieres': 1217,
+  'les-hauts-d-anjou': 1218,
+  'la-ferte-bernard': 1219,
+  'le-teil': 1220,
+  wingles: 1221,
+  beauzelle: 1222,
+  lempdes: 1223,
+  'chamonix-mont-blanc': 1224,
+  soustons: 1225,
+  'aigues-mortes': 1226,
+  'l-ile-saint-denis': 1227,
+  'artigues-pres-bordeaux': 1228,
+  plabennec: 1229,
+  'petit-couronne': 1230,
+  coutras: 1231,
+  'margny-les-compiegne': 1232,
+  'saint-chamas': 1233,
+  'essey-les-nancy': 1234,
+  'thorigne-fouillard': 1235,
+  'saint-jory': 1236,
+  crest: 1237,
+  isbergues: 1238,
+  janze: 1239,
+  'le-poire-sur-vie': 1240,
+  'souleuvre-en-bocage': 1241,
+  domerat: 1242,
+  marcoussis: 1243,
+  'aulnoye-aymeries': 1244,
+  crolles: 1245,
+  'ergue-gaberic': 1246,
+  'puget-sur-argens': 1247,
+  roussillon: 1248,
+  'le-grau-du-roi': 1249,
+  serignan: 1250,
+  'saint-renan': 1251,
+  'port-saint-louis-du-rhone': 1252,
+  mauleon: 1253,
+  chantonnay: 1254,
+  sautron: 1255,
+  'le-loroux-bottereau': 1256,
+  rouvroy: 1257,
+  'thaon-les-vosges': 1258,
+  'chateauneuf-sur-loire': 1259,
+  'bormes-les-mimosas': 1260,
+  'varces-allieres-et-risset': 1261,
+  lillebonne: 1262,
+  privas: 1263,
+  'vendin-le-vieil': 1264,
+  vif: 1265,
+  uzes: 1266,
+  'le-plessis-bouchard': 1267,
+  peymeinade: 1268,
+  unieux: 1269,
+  'la-salvetat-saint-gilles': 1270,
+  'saint-vallier': 1271,
+  'theix-noyalo': 1272,
+  'talmont-saint-hilaire': 1273,
+  'le-marin': 1274,
+  'pont-l-abbe': 1275,
+  'le-vauclin': 1276,
+  eguilles: 1277,
+  onnaing: 1278,
+  'ballan-mire': 1279,
+  hirson: 1280,
+  'reignier-esery': 1281,
+  perenchies: 1282,
+  groslay: 1283,
+  tregueux: 1284,
+  'saint-aubin-les-elbeuf': 1285,
+  'la-grande-motte': 1286,
+  bassens: 1287,
+  vaucresson: 1288,
+  pignan: 1289,
+  'gennes-val-de-loire': 1290,
+  venelles: 1291,
+  'larmor-plage': 1292,
+  marseillan: 1293,
+  trignac: 1294,
+  orchies: 1295,
+  'taiarapu-ouest': 1296,
+  feurs: 1297,
+  'noyal-chatillon-sur-seiche': 1298,
+  marguerittes: 1299,
+  bouaye: 1300,
+  'saint-gilles-croix-de-vie': 1301,
+  'carbon-blanc': 1302,
+  coutances: 1303,
+  bihorel: 1304,
+  'saint-pierre-les-elbeuf': 1305,
+  chiconi: 1306,
+  'tonnay-charente': 1307,
+  harfleur: 1308,
+  'tournan-en-brie': 1309,
+  guilers: 1310,
+  bandol: 1311,
+  'brunstatt-didenheim': 1312,
+  evron: 1313,
+  meximieux: 1314,
+  'teteghem-coudekerque-village': 1315,
+  thuir: 1316,
+  pegomas: 1317,
+  malemort: 1318,
+  souffelweyersheim: 1319,
+  'charnay-les-macon': 1320,
+  donges: 1321,
+  mazingarbe: 1322,
+  'petit-canal': 1323,
+  salles: 1324,
+  'vern-sur-seiche': 1325,
+  anse: 1326,
+  'la-colle-sur-loup': 1327,
+  'paray-vieille-poste': 1328,
+  'ballancourt-sur-essonne': 1329,
+  'le-mesnil-esnard': 1330,
+  linselles: 1331,
+  'la-ville-du-bois': 1332,
+  chinon: 1333,
+  questembert: 1334,
+  'val-de-briey': 1335,
+  coulaines: 1336,
+  'cavalaire-sur-mer': 1337,
+  talange: 1338,
+  'rochefort-du-gard': 1339,
+  sorbiers: 1340,
+  'verrieres-en-anjou': 1341,
+  'la-tour-du-pin': 1342,
+  'les-arcs': 1343,
+  'boussy-saint-antoine': 1344,
+  seyssins: 1345,
+  uvea: 1346,
+  guenange: 1347,
+  monts: 1348,
+  vineuil: 1349,
+  wintzenheim: 1350,
+  'martignas-sur-jalle': 1351,
+  jarny: 1352,
+  kone: 1353,
+  languidic: 1354,
+  'la-ricamarie': 1355,
+  champagnole: 1356,
+  bellegarde: 1357,
+  gleize: 1358,
+  'tignieu-jameyzieu': 1359,
+  aureilhan: 1360,
+  beaugency: 1361,
+  'le-malesherbois': 1362,
+  'saint-vincent-de-tyrosse': 1363,
+  vaujours: 1364,
+  aussonne: 1365,
+  isle: 1366,
+  louveciennes: 1367,
+  linas: 1368,
+  'jouy-en-josas': 1369,
+  libercourt: 1370,
+  'le-soler': 1371,
+  'saint-affrique': 1372,
+  langueux: 1373,
+  'billy-montigny': 1374,
+  houplines: 1375,
+  geispolsheim: 1376,
+  mordelles: 1377,
+  'lege-cap-ferret': 1378,
+  contes: 1379,
+  ustaritz: 1380,
+  romagnat: 1381,
+  'saint-julien-de-concelles': 1382,
+  lure: 1383,
+  achicourt: 1384,
+  gargenville: 1385,
+  'saint-pierre-en-faucigny': 1386,
+  publier: 1387,
+  sisteron: 1388,
+  'cappelle-la-grande': 1389,
+  claix: 1390,
+  'coulounieix-chamiers': 1391,
+  bompas: 1392,
+  'courcelles-les-lens': 1393,
+  baillargues: 1394,
+  malzeville: 1395,
+  corte: 1396,
+  moirans: 1397,
+  'neuville-sur-saone': 1398,
+  'montreuil-juigne': 1399,
+  lagord: 1400,
+  terville: 1401,
+  pezenas: 1402,
+  'la-verpilliere': 1403,
+  'saint-etienne-de-montluc': 1404,
+  'hettange-grande': 1405,
+  chessy: 1406,
+  'saint-aubin-de-medoc': 1407,
+  'saint-denis-en-val': 1408,
+  'la-couronne': 1409,
+  nieppe: 1410,
+  thann: 1411,
+  'cranves-sales': 1412,
+  wavrin: 1413,
+  'lys-haut-layon': 1414,
+  'saint-remy-les-chevreuse': 1415,
+  'noisy-le-roi': 1416,
+  'les-andelys': 1417,
+  mtsamboro: 1418,
+  beynes: 1419,
+  'saint-marcellin': 1420,
+  'les-avenieres-veyrins-thuellin': 1421,
+  emerainville: 1422,
+  'machecoul-saint-meme': 1423,
+  bidart: 1424,
+  pluvigner: 1425,
+  falaise: 1426,
+  langon: 1427,
+  'bain-de-bretagne': 1428,
+  mimizan: 1429,
+  villars: 1430,
+  'l-aigle': 1431,
+  'bourg-saint-andeol': 1432,
+  biguglia: 1433,
+  hasparren: 1434,
+  tullins: 1435,
+  'saint-prix': 1436,
+  deols: 1437,
+  'saint-maixent-l-ecole': 1438,
+  loireauxence: 1439,
+  'parentis-en-born': 1440,
+  auxonne: 1441,
+  gerardmer: 1442,
+  'saint-peray': 1443,
+  'sausset-les-pins': 1444,
+  lesneven: 1445,
+  wissembourg: 1446,
+  goyave: 1447,
+  rosporden: 1448,
+  'faverges-seythenex': 1449,
+  'saint-apollinaire': 1450,
+  melesse: 1451,
+  'saint-yrieix-sur-charente': 1452,
+  'suce-sur-erdre': 1453,
+  chateaubourg: 1454,
+  'jaunay-marigny': 1455,
+  'saint-jean-de-maurienne': 1456,
+  ceret: 1457,
+  'villard-bonnot': 1458,
+  crozon: 1459,
+  huningue: 1460,
+  'saint-berthevin': 1461,
+  'saint-germain-les-corbeil': 1462,
+  pordic: 1463,
+  clisson: 1464,
+  toulouges: 1465,
+  fabregues: 1466,
+  rethel: 1467,
+  saujon: 1468,
+  'chaumes-en-retz': 1469,
+  'saint-didier-au-mont-d-or': 1470,
+  langres: 1471,
+  'soisy-sur-seine': 1472,
+  yssingeaux: 1473,
+  'trois-rivieres': 1474,
+  'carhaix-plouguer': 1475,
+  lagnieu: 1476,
+  'ruelle-sur-touvre': 1477,
+  remiremont: 1478,
+  gieres: 1479,
+  lisses: 1480,
+  trelissac: 1481,
+  cournonterral: 1482,
+  'saint-nicolas-de-port': 1483,
+  'audun-le-tiche': 1484,
+  'guipry-messac': 1485,
+  'fresnes-sur-escaut': 1486,
+  digoin: 1487,
+  pontcharra: 1488,
+  paimpol: 1489,
+  lanton: 1490,
+  'perros-guirec': 1491,
+  'villemoisson-sur-orge': 1492,
+  barlin: 1493,
+  courtry: 1494,
+  'rosny-sur-seine': 1495,
+  'gournay-sur-marne': 1496,
+  'moyeuvre-grande': 1497,
+  courdimanche: 1498,
+  'saint-christol-lez-ales': 1499,
+  'nanteuil-les-meaux': 1500,
+  gourbeyre: 1501,
+  ensisheim: 1502,
+  'roquefort-les-pins': 1503,
+  'le-pian-medoc': 1504,
+  vizille: 1505,
+  'la-ferte-saint-aubin': 1506,
+  'montoir-de-bretagne': 1507,
+  'le-mesnil-saint-denis': 1508,
+  'bourg-saint-maurice': 1509,
+  salazie: 1510,
+  waziers: 1511,
+  'la-gaude': 1512,
+  'saint-pee-sur-nivelle': 1513,
+  vendargues: 1514,
+  'divatte-sur-loire': 1515,
+  orgeval: 1516,
+  lodeve: 1517,
+  colombelles: 1518,
+  mably: 1519,
+  herbignac: 1520,
+  chauray: 1521,
+  'les-trois-bassins': 1522,
+  caudan: 1523,
+  kervignac: 1524,
+  'templeuve-en-pevele': 1525,
+  ecouen: 1526,
+  'sainte-pazanne': 1527,
+  'verneuil-d-avre-et-d-iton': 1528,
+  'aubigny-les-clouzeaux': 1529,
+  labenne: 1530,
+  montauroux: 1531,
+  'entre-deux': 1532,
+  pleurtuit: 1533,
+  egly: 1534,
+  'saint-ismier': 1535,
+  eckbolsheim: 1536,
+  ugine: 1537,
+  wissous: 1538,
+  tregunc: 1539,
+  'balaruc-les-bains': 1540,
+  'la-talaudiere': 1541,
+  eyguieres: 1542,
+  'bagneres-de-bigorre': 1543,
+  guingamp: 1544,
+  viriat: 1545,
+  'saint-pierre-en-auge': 1546,
+  'pont-saint-martin': 1547,
+  peronne: 1548,
+  auby: 1549,
+  'aulnoy-lez-valenciennes': 1550,
+  villemandeur: 1551,
+  'vieux-habitants': 1552,
+  'notre-dame-de-bondeville': 1553,
+  'grandchamp-des-fontaines': 1554,
+  leforest: 1555,
+  barr: 1556,
+  brech: 1557,
+  manduel: 1558,
+  'binic-etables-sur-mer': 1559,
+  jurancon: 1560,
+  epone: 1561,
+  uckange: 1562,
+  'sathonay-camp': 1563,
+  trevoux: 1564,
+  'saint-andre-des-eaux': 1565,
+  'soultz-haut-rhin': 1566,
+  chauvigny: 1567,
+  'sainte-adresse': 1568,
+  'castelnau-d-estretefonds': 1569,
+  'saint-rambert-d-albon': 1570,
+  nerac: 1571,
+  marsillargues: 1572,
+  etrechy: 1573,
+  'saint-bonnet-de-mure': 1574,
+  'bailly-romainvilliers': 1575,
+  betheny: 1576,
+  valognes: 1577,
+  'fontaines-sur-saone': 1578,
+  cognin: 1579,
+  morteau: 1580,
+  luisant: 1581,
+  houdain: 1582,
+  'saint-pol-de-leon': 1583,
+  'la-plaine-des-palmistes': 1584,
+  pledran: 1585,
+  bourbourg: 1586,
+  senas: 1587,
+  escalquens: 1588,
+  jacou: 1589,
+  lucciana: 1590,
+  lesigny: 1591,
+  change: 1592,
+  cadaujac: 1593,
+  'trans-en-provence': 1594,
+  'beaufort-en-anjou': 1595,
+  surgeres: 1596,
+  montluel: 1597,
+  'saint-maurice-l-exil': 1598,
+  castries: 1599,
+  acigne: 1600,
+  'carnoux-en-provence': 1601,
+  veigne: 1602,
+  'auvers-sur-oise': 1603,
+  'le-controis-en-sologne': 1604,
+  'noyelles-sous-lens': 1605,
+  lutterbach: 1606,
+  'essarts-en-bocage': 1607,
+  'les-abrets-en-dauphine': 1608,
+  'le-coteau': 1609,
+  loudun: 1610,
+  'laudun-l-ardoise': 1611,
+  domene: 1612,
+  chabeuil: 1613,
+  'saint-thibault-des-vignes': 1614,
+  'les-essarts-le-roi': 1615,
+  'saint-yrieix-la-perche': 1616,
+  nyons: 1617,
+  'montfort-sur-meu': 1618,
+  'quesnoy-sur-deule': 1619,
+  caussade: 1620,
+  'loos-en-gohelle': 1621,
+  poussan: 1622,
+  beuvrages: 1623,
+  douvaine: 1624,
+  ploeren: 1625,
+  liancourt: 1626,
+  'saint-jean-d-angely': 1627,
+  brindas: 1628,
+  divion: 1629,
+  puilboreau: 1630,
+  'le-cateau-cambresis': 1631,
+  'saint-julien-les-villas': 1632,
+  'merville-31': 1633,
+  'cambo-les-bains': 1634,
+  plouguerneau: 1635,
+  'moelan-sur-mer': 1636,
+  meyreuil: 1637,
+  gaillon: 1638,
+  itteville: 1639,
+  'saint-alban-leysse': 1640,
+  'saulx-les-chartreux': 1641,
+  neufchateau: 1642,
+  'saint-victoret': 1643,
+  'le-peage-de-roussillon': 1644,
+  othis: 1645,
+  feignies: 1646,
+  'vallons-de-l-erdre': 1647,
+  'vigneux-de-bretagne': 1648,
+  'inzinzac-lochrist': 1649,
+  migennes: 1650,
+  fronton: 1651,
+  'meung-sur-loire': 1652,
+  'luxeuil-les-bains': 1653,
+  montech: 1654,
+  cassis: 1655,
+  'chalonnes-sur-loire': 1656,
+  thones: 1657,
+  'chatelaillon-plage': 1658,
+  gignac: 1659,
+  elven: 1660,
+  'la-bassee': 1661,
+  'le-lavandou': 1662,
+  grenay: 1663,
+  honfleur: 1664,
+  gigean: 1665,
+  'saint-pierre-d-oleron': 1666,
+  'laneuveville-devant-nancy': 1667,
+  lentilly: 1668,
+  'sury-le-comtal': 1669,
+  canohes: 1670,
+  'loriol-sur-drome': 1671,
+  'la-penne-sur-huveaune': 1672,
+  'montauban-de-bretagne': 1673,
+  bouffemont: 1674,
+  ceyrat: 1675,
+  'chasse-sur-rhone': 1676,
+  furiani: 1677,
+  'labarthe-sur-leze': 1678,
+  heric: 1679,
+  labruguiere: 1680,
+  bouchemaine: 1681,
+  gemenos: 1682,
+  'longuenee-en-anjou': 1683,
+  thoiry: 1684,
+  'le-lorrain': 1685,
+  'longue-jumelles': 1686,
+  'saint-juery': 1687,
+  'saint-jean-bonnefonds': 1688,
+  'le-mene': 1689,
+  champigneulles: 1690,
+  rives: 1691,
+  'la-bouilladisse': 1692,
+  'sainte-livrade-sur-lot': 1693,
+  eaunes: 1694,
+  'la-chevroliere': 1695,
+  'marange-silvange': 1696,
+  'l-arbresle': 1697,
+  'saint-alban': 1698,
+  cormontreuil: 1699,
+  'la-mulatiere': 1700,
+  ondres: 1701,
+  'bon-encontre': 1702,
+  lezoux: 1703,
+  gueugnon: 1704,
+  brioude: 1705,
+  estaires: 1706,
+  'neuves-maisons': 1707,
+  'chatuzange-le-goubet': 1708,
+  ploudalmezeau: 1709,
+  ambert: 1710,
+  limours: 1711,
+  marignier: 1712,
+  'les-trois-ilets': 1713,
+  'la-montagne': 1714,
+  'change-53': 1715,
+  gouesnou: 1716,
+  eu: 1717,
+  'champagne-sur-seine': 1718,
+  calvisson: 1719,
+  ares: 1720,
+  'longpont-sur-orge': 1721,
+  'villers-saint-paul': 1722,
+  'le-perray-en-yvelines': 1723,
+  'saint-pathus': 1724,
+  condom: 1725,
+  'grezieu-la-varenne': 1726,
+  'vezin-le-coquet': 1727,
+  'saint-priest-en-jarez': 1728,
+  cuincy: 1729,
+  'saint-florent-sur-cher': 1730,
+  entrelacs: 1731,
+  'saint-laurent-blangy': 1732,
+  'ploneour-lanvern': 1733,
+  sciez: 1734,
+  louhans: 1735,
+  peronnas: 1736,
+  frouard: 1737,
+  bonsecours: 1738,
+  'm-tsangamouji': 1739,
+  'saint-andre-de-sangonis': 1740,
+  courthezon: 1741,
+  'la-tronche': 1742,
+  'auneau-bleury-saint-symphorien': 1743,
+  embrun: 1744,
+  combourg: 1745,
+  'saint-remy': 1746,
+  'murs-erigne': 1747,
+  'j-uf': 1748,
+  'saint-flour': 1749,
+  'breal-sous-montfort': 1750,
+  'saint-jorioz': 1751,
+  sevremont: 1752,
+  magnanville: 1753,
+  'mehun-sur-yevre': 1754,
+  izon: 1755,
+  baud: 1756,
+  givet: 1757,
+  plescop: 1758,
+  'arpajon-sur-cere': 1759,
+  ambilly: 1760,
+  nandy: 1761,
+  'villemur-sur-tarn': 1762,
+  'bons-en-chablais': 1763,
+  'le-mesnil-le-roi': 1764,
+  'saint-cyr-au-mont-d-or': 1765,
+  'dompierre-sur-mer': 1766,
+  'champagne-au-mont-d-or': 1767,
+  thyez: 1768,
+  avallon: 1769,
+  vaugneray: 1770,
+  'pont-de-cheruy': 1771,
+  'bonchamp-les-laval': 1772,
+  'chatel-guyon': 1773,
+  milhaud: 1774,
+  esvres: 1775,
+  louvroil: 1776,
+  'vouneuil-sous-biard': 1777,
+  lallaing: 1778,
+  mazan: 1779,
+  'migne-auxances': 1780,
+  mare: 1781,
+  mornant: 1782,
+  'belin-beliet': 1783,
+  'noyal-sur-vilaine': 1784,
+  'sollies-toucas': 1785,
+  'chatenoy-le-royal': 1786,
+  huahine: 1787,
+  pluneret: 1788,
+  'saint-pryve-saint-mesmin': 1789,
+  wimereux: 1790,
+  homecourt: 1791,
+  mer: 1792,
+  'jassans-riottier': 1793,
+  fleurance: 1794,
+  bellevigny: 1795,
+  'saint-martin-de-seignanx': 1796,
+  'cuges-les-pins': 1797,
+  loches: 1798,
+  malaunay: 1799,
+  'terrasson-lavilledieu': 1800,
+  'pont-eveque': 1801,
+  'aire-sur-l-adour': 1802,
+  'saint-marcel': 1803,
+  guer: 1804,
+  'livarot-pays-d-auge': 1805,
+  bruguieres: 1806,
+  'horbourg-wihr': 1807,
+  'saint-quentin-fallavier': 1808,
+  boueni: 1809,
+  'saint-symphorien-d-ozon': 1810,
+  'prades-le-lez': 1811,
+  menucourt: 1812,
+  'thue-et-mue': 1813,
+  'saint-genest-lerpt': 1814,
+  'saint-marcel-les-valence': 1815,
+  feytiat: 1816,
+  'saint-mitre-les-remparts': 1817,
+  'octeville-sur-mer': 1818,
+  'petite-rosselle': 1819,
+  'franqueville-saint-pierre': 1820,
+  mallemort: 1821,
+  'behren-les-forbach': 1822,
+  'le-blanc': 1823,
+  'aurec-sur-loire': 1824,
+  'marennes-hiers-brouage': 1825,
+  'le-diamant': 1826,
+  'saint-denis-les-bourg': 1827,
+  fayence: 1828,
+  oraison: 1829,
+  prades: 1830,
+  jonage: 1831,
+  dourges: 1832,
+  vendenheim: 1833,
+  'quint-fonsegrives': 1834,
+  'palavas-les-flots': 1835,
+  bouillante: 1836,
+  'le-barcares': 1837,
+  'blainville-sur-orne': 1838,
+  'saint-cannat': 1839,
+  'sainte-sigolene': 1840,
+  ostricourt: 1841,
+  'haute-goulaine': 1842,
+  pecquencourt: 1843,
+  'fouquieres-les-lens': 1844,
+  mutzig: 1845,
+  'pierrefeu-du-var': 1846,
+  maule: 1847,
+  'hersin-coupigny': 1848,
+  noves: 1849,
+  'mesnils-sur-iton': 1850,
+  'saint-martin-le-vinoux': 1851,
+  'bois-le-roi': 1852,
+  esbly: 1853,
+  bouillargues: 1854,
+  'saint-jean-de-boiseau': 1855,
+  beauvoisin: 1856,
+  geveze: 1857,
+  mondonville: 1858,
+  'vaison-la-romaine': 1859,
+  'mortagne-sur-sevre': 1860,
+  'luc-la-primaube': 1861,
+  'le-castellet': 1862,
+  'jouars-pontchartrain': 1863,
+  pavilly: 1864,
+  'marly-la-ville': 1865,
+  'trith-saint-leger': 1866,
+  commentry: 1867,
+  'vexin-sur-epte': 1868,
+  'saint-girons': 1869,
+  donzere: 1870,
+  clapiers: 1871,
+  'saint-mandrier-sur-mer': 1872,
+  'noyelles-godault': 1873,
+  'fontenay-tresigny': 1874,
+  'la-verriere': 1875,
+  'ablon-sur-seine': 1876,
+  lavelanet: 1877,
+  'conde-en-normandie': 1878,
+  corbie: 1879,
+  aubignan: 1880,
+  'hombourg-haut': 1881,
+  benfeld: 1882,
+  marnaz: 1883,
+  naintre: 1884,
+  'roost-warendin': 1885,
+  'saint-denis-de-pile': 1886,
+  blanzy: 1887,
+  vias: 1888,
+  'loon-plage': 1889,
+  'villennes-sur-seine': 1890,
+  ciboure: 1891,
+  quievrechain: 1892,
+  'sains-en-gohelle': 1893,
+  'fleury-sur-orne': 1894,
+  'le-puy-sainte-reparade': 1895,
+  montdidier: 1896,
+  'grand-champ': 1897,
+  'bellevigne-en-layon': 1898,
+  negrepelisse: 1899,
+  'tain-l-hermitage': 1900,
+  fontenilles: 1901,
+  'saint-pierre-d-irube': 1902,
+  'saint-andre-de-la-roche': 1903,
+  'bricquebec-en-cotentin': 1904,
+  'aixe-sur-vienne': 1905,
+  'raon-l-etape': 1906,
+  'saintry-sur-seine': 1907,
+  'saint-zacharie': 1908,
+  eschau: 1909,
+  'saint-arnoult-en-yvelines': 1910,
+  'grand-charmont': 1911,
+  'lesparre-medoc': 1912,
+  douvrin: 1913,
+  rabastens: 1914,
+  'montpon-menesterol': 1915,
+  riantec: 1916,
+  'la-wantzenau': 1917,
+  'gond-pontouvre': 1918,
+  oberhausbergen: 1919,
+  'le-poinconnet': 1920,
+  seloncourt: 1921,
+  'port-la-nouvelle': 1922,
+  fismes: 1923,
+  chambourcy: 1924,
+  boe: 1925,
+  ludres: 1926,
+  'saint-martin-lez-tatinghem': 1927,
+  ventabren: 1928,
+  bessan: 1929,
+  arradon: 1930,
+  gareoult: 1931,
+  kembs: 1932,
+  roye: 1933,
+  cessy: 1934,
+  villabe: 1935,
+  'dol-de-bretagne': 1936,
+  'saint-galmier': 1937,
+  sillingy: 1938,
+  annezin: 1939,
+  montmorillon: 1940,
+  briec: 1941,
+  buc: 1942,
+  'nieul-sur-mer': 1943,
+  lannemezan: 1944,
+  'saint-just-en-chaussee': 1945,
+  mouroux: 1946,
+  viry: 1947,
+  'le-barp': 1948,
+  bedarieux: 1949,
+  algrange: 1950,
+  'roquefort-la-bedoule': 1951,
+  sarrians: 1952,
+  'saint-laurent-de-mure': 1953,
+  calvi: 1954,
+  vergeze: 1955,
+  fenouillet: 1956,
+  'simiane-collongue': 1957,
+  'oye-plage': 1958,
+  fegersheim: 1959,
+  wasselonne: 1960,
+  'magny-en-vexin': 1961,
+  'le-palais-sur-vienne': 1962,
+  peypin: 1963,
+  'erdre-en-anjou': 1964,
+  'thizy-les-bourgs': 1965,
+  'saint-hilaire-du-harcouet': 1966,
+  'pointe-noire': 1967,
+  'maze-milon': 1968,
+  'ensues-la-redonne': 1969,
+  canejan: 1970,
+  plouay: 1971,
+  'saint-gervais-les-bains': 1972,
+  melle: 1973,
+  doullens: 1974,
+  'flines-lez-raches': 1975,
+  lacanau: 1976,
+  'la-cadiere-d-azur': 1977,
+  coursan: 1978,
+  orgeres: 1979,
+  beaucouze: 1980,
+  bannalec: 1981,
+  'gournay-en-bray': 1982,
+  piolenc: 1983,
+  revin: 1984,
+  epernon: 1985,
+  'saint-michel-chef-chef': 1986,
+  'saint-martin-la-pallu': 1987,
+  'cugand-la-bernardiere': 1988,
+  lannilis: 1989,
+  missillac: 1990,
+  'marolles-en-hurepoix': 1991,
+  valdahon: 1992,
+  aimargues: 1993,
+  'saint-privat-des-vieux': 1994,
+  'carry-le-rouet': 1995,
+  tournus: 1996,
+  mondelange: 1997,
+  'montbonnot-saint-martin': 1998,
+  saleilles: 1999,
+  valdalliere: 2000,
+  marcheprime: 2001,
+  mourenx: 2002,
+  ligne: 2003,
+  altkirch: 2004,
+  leves: 2005,
+  dainville: 2006,
+  'l-isle-d-espagnac': 2007,
+  longueau: 2008,
+  'saint-xandre': 2009,
+  'saint-georges-d-orques': 2010,
+  gan: 2011,
+  cancale: 2012,
+  bedarrides: 2013,
+  'la-roquette-sur-siagne': 2014,
+  pouzauges: 2015,
+  'caumont-sur-durance': 2016,
+  sausheim: 2017,
+  'la-creche': 2018,
+  rocbaron: 2019,
+  sigean: 2020,
+  parmain: 2021,
+  chanverrie: 2022,
+  'montrond-les-bains': 2023,
+  santes: 2024,
+  'rives-du-loir-en-anjou': 2025,
+  pourrieres: 2026,
+  'montval-sur-loir': 2027,
+  'sainghin-en-weppes': 2028,
+  wallers: 2029,
+  'challes-les-eaux': 2030,
+  delle: 2031,
+  'la-gorgue': 2032,
+  rungis: 2033,
+  gannat: 2034,
+  sauvian: 2035,
+  'cloyes-les-trois-rivieres': 2036,
+  'port-louis': 2037,
+  'la-ville-aux-dames': 2038,
+  'bohain-en-vermandois': 2039,
+  ternay: 2040,
+  'saint-martin-d-uriage': 2041,
+  genay: 2042,
+  wormhout: 2043,
+  liverdun: 2044,
+  'ludon-medoc': 2045,
+  bourail: 2046,
+  carbonne: 2047,
+  beaurains: 2048,
+  'le-port-marly': 2049,
+  viarmes: 2050,
+  'ille-sur-tet': 2051,
+  ambazac: 2052,
+  pollestres: 2053,
+  'quincy-voisins': 2054,
+  baisieux: 2055,
+  'chazelles-sur-lyon': 2056,
+  'nogent-sur-seine': 2057,
+  lardy: 2058,
+  roquemaure: 2059,
+  aussillon: 2060,
+  'saint-sebastien-de-morsent': 2061,
+  nouzonville: 2062,
+  'saint-mars-du-desert': 2063,
+  coublevie: 2064,
+  'les-achards': 2065,
+  servian: 2066,
+  'la-garnache': 2067,
+  'neuville-de-poitou': 2068,
+  penmarch: 2069,
+  'kani-keli': 2070,
+  chevreuse: 2071,
+  ernee: 2072,
+  grans: 2073,
+  'le-boulou': 2074,
+  drap: 2075,
+  'nueil-les-aubiers': 2076,
+  guines: 2077,
+  foulayronnes: 2078,
+  'etoile-sur-rhone': 2079,
+  'la-roque-d-antheron': 2080,
+  rosheim: 2081,
+  ollainville: 2082,
+  'la-ferriere': 2083,
+  'aubigny-sur-nere': 2084,
+  'noyant-villages': 2085,
+  'cregy-les-meaux': 2086,
+  arnage: 2087,
+  'chatillon-sur-seine': 2088,
+  'saint-memmie': 2089,
+  fenain: 2090,
+  'saint-genis-les-ollieres': 2091,
+  coulogne: 2092,
+  roques: 2093,
+  'boulay-moselle': 2094,
+  'marsannay-la-cote': 2095,
+  mouguerre: 2096,
+  'wervicq-sud': 2097,
+  rousset: 2098,
+  'flers-en-escrebieux': 2099,
+  aiffres: 2100,
+  reichshoffen: 2101,
+  'lacroix-saint-ouen': 2102,
+  'le-cendre': 2103,
+  ploumagoar: 2104,
+  heillecourt: 2105,
+  'marles-les-mines': 2106,
+  'peyrolles-en-provence': 2107,
+  'saint-pierre-les-nemours': 2108,
+  plouhinec: 2109,
+  'borderes-sur-l-echez': 2110,
+  'vic-le-comte': 2111,
+  'le-lion-d-angers': 2112,
+  drusenheim: 2113,
+  'charbonnieres-les-bains': 2114,
+  garons: 2115,
+  levens: 2116,
+  'cormelles-le-royal': 2117,
+  'saint-astier': 2118,
+  cruseilles: 2119,
+  'calonne-ricouart': 2120,
+  gray: 2121,
+  trebes: 2122,
+  reyrieux: 2123,
+  'parigne-l-eveque': 2124,
+  blere: 2125,
+  commercy: 2126,
+  chagny: 2127,
+  meriel: 2128,
+  'bretignolles-sur-mer': 2129,
+  'erquinghem-lys': 2130,
+  idron: 2131,
+  dechy: 2132,
+  'la-balme-de-sillingy': 2133,
+  plesse: 2134,
+  mundolsheim: 2135,
+  'le-pellerin': 2136,
+  mouy: 2137,
+  gambsheim: 2138,
+  audruicq: 2139,
+  bethoncourt: 2140,
+  barberaz: 2141,
+  'vindry-sur-turdine': 2142,
+  'saint-lyphard': 2143,
+  tahaa: 2144,
+  'villers-le-lac': 2145,
+  tresses: 2146,
+  brebieres: 2147,
+  blotzheim: 2148,
+  mormant: 2149,
+  champniers: 2150,
+  'condat-sur-vienne': 2151,
+  'mouilleron-le-captif': 2152,
+  'villette-d-anthon': 2153,
+  'moulins-les-metz': 2154,
+  valleiry: 2155,
+  'cazouls-les-beziers': 2156,
+  florensac: 2157,
+  'chatillon-sur-chalaronne': 2158,
+  'pont-sainte-marie': 2159,
+  bauvin: 2160,
+  'le-rove': 2161,
+  mulsanne: 2162,
+  'guemene-penfao': 2163,
+  semeac: 2164,
+  'nuits-saint-georges': 2165,
+  'mignaloux-beauvoir': 2166,
+  laille: 2167,
+  farebersviller: 2168,
+  forcalquier: 2169,
+  'saint-clement-de-riviere': 2170,
+  marquise: 2171,
+  'le-bourget-du-lac': 2172,
+  'nans-les-pins': 2173,
+  surzur: 2174,
+  vernaison: 2175,
+  tourves: 2176,
+  'saint-saturnin-les-avignon': 2177,
+  gorges: 2178,
+  'vaux-sur-seine': 2179,
+  jonquieres: 2180,
+  beynost: 2181,
+  'brou-sur-chantereine': 2182,
+  acoua: 2183,
+  pauillac: 2184,
+  gauchy: 2185,
+  'l-hopital': 2186,
+  'schweighouse-sur-moder': 2187,
+  scaer: 2188,
+  'bassens-73': 2189,
+  valdoie: 2190,
+  coubron: 2191,
+  villerest: 2192,
+  'loison-sous-lens': 2193,
+  seichamps: 2194,
+  'villars-les-dombes': 2195,
+  'l-etang-la-ville': 2196,
+  'baume-les-dames': 2197,
+  trilport: 2198,
+  'pont-l-eveque': 2199,
+  'douvres-la-delivrande': 2200,
+  'le-cannet-des-maures': 2201,
+  'villeneuve-sur-yonne': 2202,
+  longuyon: 2203,
+  'saint-vit': 2204,
+  'saint-cheron': 2205,
+  'ferriere-la-grande': 2206,
+  'locmaria-plouzane': 2207,
+  cucq: 2208,
+  villenoy: 2209,
+  chavanoz: 2210,
+  'sully-sur-loire': 2211,
+  'dives-sur-mer': 2212,
+  'moncoutant-sur-sevre': 2213,
+  'villeneuve-en-retz': 2214,
+  'saint-marcellin-en-forez': 2215,
+  'le-val-d-hazey': 2216,
+  faulquemont: 2217,
+  'chateau-arnoux-saint-auban': 2218,
+  'ay-champagne': 2219,
+  'val-de-moder': 2220,
+  pulnoy: 2221,
+  baillif: 2222,
+  genlis: 2223,
+  'billy-berclau': 2224,
+  'saint-georges-de-didonne': 2225,
+  'saint-pantaleon-de-larche': 2226,
+  muzillac: 2227,
+  'maen-roch': 2228,
+  baden: 2229,
+  chateaulin: 2230,
+  ornex: 2231,
+  'saint-philippe': 2232,
+  giberville: 2233,
+  habsheim: 2234,
+  yffiniac: 2235,
+  sommieres: 2236,
+  'villefranche-de-lauragais': 2237,
+  'la-ferte-mace': 2238,
+  blaye: 2239,
+  haillicourt: 2240,
+  'bonnieres-sur-seine': 2241,
+  luynes: 2242,
+  'petite-foret': 2243,
+  laventie: 2244,
+  'saint-sever': 2245,
+  cilaos: 2246,
+  bezannes: 2247,
+  'champagne-sur-oise': 2248,
+  'sainte-soulle': 2249,
+  'la-meziere': 2250,
+  gruissan: 2251,
+  'hauts-de-bienne': 2252,
+  'saint-etienne-au-mont': 2253,
+  'pacy-sur-eure': 2254,
+  'morcenx-la-nouvelle': 2255,
+  decazeville: 2256,
+  allinges: 2257,
+  'saint-james': 2258,
+  rambervillers: 2259,
+  plouigneau: 2260,
+  beaurepaire: 2261,
+  lestrem: 2262,
+  'villefranche-sur-mer': 2263,
+  luzarches: 2264,
+  taputapuatea: 2265,
+  papaichton: 2266,
+}
+
+/** Parsed `population` of each ville, by position */
+export const VILLE_POPULATIONS: number[] = [
+  2104000, 886000, 519000, 515000, 358000, 328000, 310000, 294000, 268000, 238000, 231000, 179000, 178000, 173000, 167000, 164000, 162000, 159000, 156000, 156000, 152000, 150000,
+  146000, 146000, 142000, 139000, 136000, 132000, 130000, 123000, 122000, 119000, 118000, 118000, 116000, 112000, 109000, 108000, 106000, 105000, 104000, 99000, 98000, 98000,
+  94000, 94000, 93000, 92000, 91000, 90000, 88000, 88000, 86000, 86000, 85000, 84000, 83000, 83000, 83000, 82000, 80000, 80000, 78000, 78000, 78000, 78000, 77000, 76000, 76000,
+  75000, 74000, 73000, 72000, 71000, 71000, 68000, 68000, 68000, 67000, 67000, 67000, 66000, 65000, 64000, 64000, 64000, 64000, 64000, 64000, 63000, 63000, 63000, 62000, 62000,
+  62000, 60000, 60000, 60000, 60000, 60000, 59000, 59000, 59000, 58000, 58000, 57000, 57000, 57000, 56000, 56000, 56000, 55000, 55000, 55000, 54000, 54000, 54000, 54000, 54000,
+  54000, 53000, 53000, 53000, 53000, 53000, 53000, 52000, 52000, 51000, 51000, 51000, 51000, 51000, 51000, 50000, 49000, 49000, 49000, 49000, 48000, 48000, 48000, 47000, 47000,
+  47000, 47000, 47000, 47000, 47000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 46000, 45000, 45000, 45000, 44000, 44000, 44000, 44000, 44000,
+  44000, 44000, 44000, 43000, 43000, 43000, 43000, 43000, 43000, 43000, 43000, 43000, 43000, 42000, 42000, 42000, 42000, 42000, 41000, 41000, 41000, 41000, 41000, 41000, 41000,
+  41000, 41000, 41000, 40000, 40000, 40000, 39000, 39000, 39000, 39000, 38000, 38000, 38000, 38000, 38000, 38000, 38000, 38000, 38000, 38000, 37000, 37000, 37000, 37000, 37000,
+  37000, 37000, 37000, 37000, 37000, 37000, 37000, 37000, 36000, 36000, 36000, 36000, 36000, 36000, 36000, 36000, 35000, 35000, 35000, 35000, 35000, 35000, 35000, 35000, 35000,
+  34000, 34000, 34000, 33000, 33000, 33000, 33000, 33000, 33000, 33000, 33000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000, 32000,
+  31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 31000, 30000, 30000, 30000, 30000, 30000, 30000, 30000, 30000, 30000,
+  30000, 30000, 30000, 30000, 30000, 30000, 30000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 29000, 28000, 28000, 28000, 28000,
+  28000, 28000, 28000, 28000, 28000, 28000, 28000, 28000, 28000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000, 27000,
+  27000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 26000, 25000, 25000, 25000,
+  25000, 25000, 25000, 25000, 25000, 25000, 25000, 25000, 25000, 25000, 25000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000, 24000,
+  23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 23000, 22000, 22000, 22000, 22000, 22000, 22000, 22000,
+  22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000, 22000,
+  21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000,
+  21000, 21000, 21000, 21000, 21000, 21000, 21000, 21000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000,
+  20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 20000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000,
+  19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 19000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000,
+  18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 18000, 17000, 17000,
+  17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000, 17000,
+  17000, 17000, 17000, 17000, 17000, 17000, 17000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000,
+  16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000, 16000,
+  16000, 16000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000,
+  15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 15000, 14000, 14000,
+  14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000,
+  14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000, 14000,
+  14000, 14000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000,
+  13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000,
+  13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 13000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000,
+  12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000,
+  12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000,
+  12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 12000, 11000, 11000, 11000, 11000, 11000, 11000, 11000,
+  11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000,
+  11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000,
+  11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000,
+  11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 11000, 10000,
+  10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000,
+  10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000,
+  10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000,
+  10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 10000, 9500, 9500, 9500, 9500, 9500,
+  9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500,
+  9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500, 9500,
+  9500, 9500, 9500, 9500, 9500, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000,
+  9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000,
+  9000, 9000, 9000, 9000, 9000, 9000, 9000, 9000, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500,
+  8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500,
+  8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500,
+  8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8500, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000,
+  8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000,
+  8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000,
+  8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000,
+  7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500,
+  7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500,
+  7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500,
+  7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7500, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000,
+  7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000,
+  7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000,
+  7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000,
+  7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 7000, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500, 6500,
+  6500, 6500, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000,
+  6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 6000, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500,
+  5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5500, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000,
+  5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000,
+  5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000,
+  5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000,
+  5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000,
+]
+
+/** Departement code -> ville positions, most populated first */
+export const VILLES_BY_DEPARTEMENT: Record<string, number[]> = {
+  '01': [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314, 1476, 1545, 1564, 1597, 1684, 1736, 1793, 1827, 1934, 2123, 2158, 2181, 2195, 2231],
+  '02': [123, 316, 380, 659, 773, 881, 995, 1280, 2039, 2185],
+  '03': [249, 371, 514, 756, 783, 1194, 1242, 1867, 2034],
+  '04': [408, 548, 1388, 1829, 2169, 2218],
+  '05': [189, 901, 1744],
+  '06': [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499, 564, 734, 843, 850, 852, 928, 990, 1268, 1317, 1327, 1379, 1503, 1512, 1903, 2014, 2075, 2116, 2263],
+  '07': [576, 814, 908, 913, 1220, 1263, 1432, 1443],
+  '08': [158, 593, 1467, 1757, 1984, 2062],
+  '09': [602, 1067, 1869, 1877],
+  '10': [93, 669, 788, 798, 1025, 1632, 2057, 2159],
+  '11': [104, 153, 833, 989, 1011, 1922, 1978, 2020, 2122, 2251],
+  '12': [387, 426, 838, 909, 1372, 1861, 2256],
+  '13': [
+    1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411, 442, 445, 534, 598, 626, 630, 649, 650, 710, 733, 774, 804, 846, 872, 923, 943, 1012, 1013, 1029, 1057, 1070, 1105,
+    1180, 1195, 1199, 1233, 1252, 1277, 1291, 1444, 1542, 1587, 1601, 1637, 1643, 1655, 1672, 1682, 1692, 1797, 1817, 1821, 1839, 1849, 1895, 1928, 1951, 1957, 1963, 1969, 1995,
+    2073, 2080, 2098, 2107, 2161,
+  ],
+  '14': [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518, 1546, 1664, 1805, 1813, 1838, 1878, 1894, 2000, 2117, 2199, 2200, 2212, 2233],
+  '15': [349, 1749, 1759],
+  '16': [185, 531, 1050, 1409, 1452, 1477, 1918, 2007, 2150],
+  '17': [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630, 1658, 1666, 1766, 1825, 1943, 2009, 2225, 2249],
+  '18': [87, 373, 1072, 1098, 1730, 1754, 2084],
+  '19': [147, 750, 1165, 1318, 2226],
+  '21': [16, 481, 706, 856, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165, 2223],
+  '22': [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491, 1544, 1559, 1585, 1689, 2104, 2235],
+  '23': [779],
+  '24': [304, 332, 962, 1216, 1391, 1481, 1800, 1915, 2118],
+  '25': [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2140, 2145, 2197, 2204],
+  '26': [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613, 1617, 1671, 1708, 1815, 1870, 1900, 2079],
+  '27': [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868, 2061, 2216, 2254],
+  '28': [207, 268, 623, 786, 822, 975, 1148, 1581, 1743, 1985, 2005, 2036],
+  '29': [
+    24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006, 1128, 1229, 1246, 1251, 1275, 1310, 1445, 1448, 1459, 1475, 1539, 1583, 1635, 1636, 1709, 1716, 1733, 1941, 1981,
+    1989, 2069, 2188, 2207, 2230, 2260,
+  ],
+  '2A': [67, 916],
+  '2B': [148, 1021, 1396, 1433, 1590, 1677, 1954],
+  '30': [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266, 1299, 1339, 1357, 1499, 1558, 1611, 1719, 1774, 1854, 1856, 1955, 1993, 1994, 2059, 2115, 2236],
+  '31': [
+    3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780, 799, 835, 910, 911, 925, 988, 1004, 1066, 1074, 1082, 1084, 1089, 1099, 1168, 1178, 1187, 1188, 1222, 1236, 1270,
+    1365, 1569, 1588, 1633, 1651, 1678, 1694, 1698, 1762, 1806, 1834, 1858, 1901, 1956, 2047, 2093, 2237,
+  ],
+  '32': [414, 1116, 1725, 1794],
+  '33': [
+    8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372, 374, 375, 424, 489, 538, 563, 579, 594, 794, 800, 842, 896, 902, 921, 924, 969, 970, 1056, 1100, 1107, 1167, 1228, 1231,
+    1287, 1302, 1324, 1351, 1378, 1407, 1427, 1490, 1504, 1593, 1720, 1755, 1783, 1886, 1912, 1948, 1970, 1976, 2001, 2045, 2146, 2184, 2239,
+  ],
+  '34': [
+    6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796, 950, 999, 1101, 1124, 1158, 1175, 1250, 1286, 1289, 1293, 1394, 1402, 1466, 1482, 1514, 1517, 1540, 1572, 1589, 1599,
+    1622, 1659, 1665, 1740, 1811, 1835, 1871, 1888, 1929, 1949, 2010, 2035, 2066, 2156, 2157, 2170,
+  ],
+  '35': [
+    10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971, 1065, 1080, 1115, 1133, 1143, 1204, 1235, 1239, 1298, 1325, 1377, 1428, 1451, 1454, 1485, 1533, 1600, 1618, 1673,
+    1727, 1745, 1750, 1784, 1857, 1936, 1979, 2012, 2167, 2228, 2250,
+  ],
+  '36': [177, 917, 1437, 1823, 1920],
+  '37': [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348, 1602, 1775, 1798, 2038, 2125, 2242],
+  '38': [
+    18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861, 869, 938, 987, 994, 1068, 1245, 1248, 1261, 1265, 1342, 1345, 1359, 1390, 1397, 1403, 1420, 1421, 1435, 1458, 1479,
+    1488, 1505, 1535, 1598, 1608, 1612, 1644, 1676, 1691, 1742, 1771, 1801, 1808, 1851, 1998, 2041, 2064, 2153, 2210, 2261,
+  ],
+  '39': [390, 595, 1356, 2252],
+  '40': [267, 425, 628, 692, 778, 1048, 1166, 1225, 1363, 1429, 1440, 1530, 1701, 1796, 1802, 2245, 2255],
+  '41': [144, 537, 634, 1349, 1604, 1792],
+  '42': [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189, 1269, 1297, 1340, 1355, 1430, 1519, 1541, 1609, 1669, 1688, 1728, 1814, 1937, 2023, 2056, 2192, 2215],
+  '43': [529, 1213, 1473, 1705, 1824, 1840],
+  '44': [
+    5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521, 585, 587, 605, 689, 789, 824, 880, 888, 931, 981, 1009, 1096, 1109, 1114, 1122, 1136, 1153, 1255, 1256, 1294, 1300,
+    1321, 1382, 1404, 1423, 1439, 1453, 1464, 1469, 1507, 1515, 1520, 1527, 1547, 1554, 1565, 1647, 1648, 1679, 1695, 1714, 1842, 1855, 1986, 1990, 2003, 2063, 2134, 2136, 2143,
+    2163, 2178, 2214,
+  ],
+  '45': [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053, 1111, 1176, 1210, 1259, 1361, 1362, 1408, 1506, 1551, 1652, 1789, 2211],
+  '46': [488, 1083],
+  '47': [254, 416, 571, 1125, 1146, 1571, 1693, 1702, 1925, 2078],
+  '48': [813],
+  '49': [
+    17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635, 652, 767, 862, 926, 948, 1094, 1214, 1218, 1290, 1341, 1399, 1414, 1595, 1656, 1681, 1683, 1686, 1747, 1898, 1964,
+    1968, 1980, 2025, 2085, 2112,
+  ],
+  '50': [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1904, 1966, 2258],
+  '51': [12, 176, 423, 932, 960, 1576, 1699, 1923, 2089, 2219, 2247],
+  '52': [406, 462, 1471],
+  '53': [135, 597, 785, 1313, 1461, 1715, 1772, 2072],
+  '54': [
+    40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129, 1141, 1142, 1174, 1234, 1335, 1352, 1395, 1483, 1667, 1690, 1707, 1737, 1748, 1791, 1926, 2044, 2105, 2194, 2203,
+    2221,
+  ],
+  '55': [586, 686, 2126],
+  '56': [
+    103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163, 1185, 1272, 1292, 1334, 1354, 1425, 1523, 1524, 1557, 1625, 1649, 1660, 1756, 1758, 1788, 1804, 1897, 1916, 1930,
+    1971, 2109, 2174, 2227, 2229,
+  ],
+  '57': [
+    29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825, 832, 844, 884, 939, 949, 1140, 1152, 1338, 1347, 1401, 1405, 1484, 1497, 1562, 1696, 1819, 1822, 1881, 1950, 1997,
+    2094, 2154, 2168, 2186, 2217,
+  ],
+  '58': [250, 1093, 1172],
+  '59': [
+    9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334, 335, 409, 431, 435, 454, 465, 466, 467, 469, 473, 485, 498, 526, 527, 616, 620, 645, 661, 681, 709, 713, 719, 732, 751,
+    761, 763, 765, 791, 801, 831, 847, 858, 870, 892, 897, 930, 942, 953, 978, 1040, 1046, 1060, 1063, 1081, 1090, 1104, 1117, 1156, 1181, 1217, 1244, 1278, 1282, 1295, 1315, 1331,
+    1375, 1389, 1410, 1413, 1486, 1511, 1525, 1549, 1550, 1586, 1619, 1623, 1631, 1646, 1661, 1706, 1729, 1776, 1778, 1841, 1843, 1866, 1885, 1889, 1892, 1975, 2024, 2028, 2029,
+    2032, 2043, 2055, 2090, 2097, 2099, 2130, 2132, 2160, 2206, 2243,
+  ],
+  '60': [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985, 1064, 1177, 1208, 1232, 1626, 1722, 1945, 2102, 2137],
+  '61': [366, 695, 745, 1431, 2238],
+  '62': [
+    77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769, 781, 826, 834, 876, 882, 946, 967, 986, 1000, 1017, 1036, 1038, 1054, 1092, 1106, 1127, 1132, 1164, 1215, 1221, 1238,
+    1257, 1264, 1322, 1370, 1374, 1384, 1393, 1493, 1555, 1582, 1605, 1621, 1629, 1663, 1732, 1790, 1832, 1844, 1848, 1873, 1893, 1913, 1927, 1939, 1958, 2006, 2048, 2077, 2092,
+    2106, 2120, 2139, 2147, 2171, 2193, 2208, 2224, 2240, 2244, 2253, 2262,
+  ],
+  '63': [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223, 1381, 1675, 1703, 1710, 1773, 2103, 2111],
+  '64': [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126, 1191, 1380, 1424, 1434, 1513, 1560, 1634, 1891, 1902, 2002, 2011, 2096, 2131],
+  '65': [164, 760, 1360, 1543, 1944, 2110, 2164],
+  '66': [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392, 1457, 1465, 1670, 1830, 1837, 1999, 2051, 2053, 2074],
+  '67': [
+    7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890, 958, 993, 1147, 1319, 1376, 1446, 1536, 1556, 1833, 1845, 1882, 1909, 1917, 1919, 1959, 1960, 2081, 2101, 2113, 2135,
+    2138, 2187, 2220,
+  ],
+  '68': [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312, 1350, 1411, 1460, 1502, 1566, 1606, 1807, 1932, 2004, 2017, 2148, 2234],
+  '69': [
+    2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293, 399, 439, 447, 451, 512, 550, 640, 722, 730, 748, 809, 837, 906, 915, 945, 1023, 1055, 1139, 1161, 1182, 1326, 1358,
+    1398, 1470, 1563, 1574, 1578, 1628, 1668, 1697, 1700, 1726, 1765, 1767, 1770, 1782, 1810, 1831, 1953, 1965, 2040, 2042, 2091, 2114, 2142, 2175,
+  ],
+  '70': [660, 977, 1383, 1653, 2121],
+  '71': [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746, 1786, 1803, 1887, 1996, 2127],
+  '72': [23, 670, 819, 964, 1219, 1336, 1592, 2027, 2087, 2124, 2162],
+  '73': [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030, 2141, 2172, 2189],
+  '74': [
+    27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952, 1052, 1119, 1150, 1155, 1169, 1196, 1224, 1281, 1386, 1387, 1412, 1449, 1624, 1657, 1712, 1734, 1751, 1760, 1763,
+    1768, 1883, 1938, 1947, 1972, 2119, 2133, 2155, 2257,
+  ],
+  '75': [0],
+  '76': [
+    14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690, 698, 820, 845, 883, 894, 936, 957, 979, 998, 1086, 1110, 1120, 1198, 1230, 1262, 1285, 1304, 1305, 1308, 1330, 1553,
+    1568, 1717, 1738, 1799, 1818, 1820, 1864, 1982,
+  ],
+  '77': [
+    106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407, 419, 444, 450, 479, 505, 516, 532, 606, 619, 636, 638, 641, 662, 721, 727, 739, 753, 784, 787, 854, 873, 889, 914,
+    1005, 1016, 1028, 1151, 1179, 1209, 1212, 1309, 1406, 1422, 1494, 1500, 1575, 1591, 1614, 1645, 1718, 1724, 1761, 1852, 1853, 1874, 1946, 2054, 2086, 2108, 2149, 2182, 2198,
+    2209,
+  ],
+  '78': [
+    55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281, 283, 297, 321, 346, 402, 404, 417, 420, 449, 464, 471, 478, 553, 578, 588, 591, 596, 609, 618, 642, 674, 688, 731,
+    738, 792, 829, 853, 929, 951, 976, 1138, 1173, 1193, 1367, 1369, 1385, 1415, 1416, 1419, 1495, 1508, 1516, 1561, 1615, 1723, 1753, 1764, 1847, 1863, 1875, 1890, 1910, 1924,
+    1942, 2049, 2071, 2179, 2196, 2241,
+  ],
+  '79': [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2076, 2100, 2213],
+  '80': [26, 415, 1118, 1548, 1879, 1896, 1933, 1974, 2008],
+  '81': [128, 181, 612, 770, 934, 1051, 1075, 1095, 1680, 1687, 1914, 2060],
+  '82': [89, 704, 749, 1620, 1654, 1899],
+  '83': [
+    11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552, 555, 648, 687, 712, 758, 802, 807, 823, 867, 907, 944, 983, 1031, 1045, 1059, 1077, 1135, 1247, 1260, 1311, 1337, 1343,
+    1531, 1594, 1662, 1785, 1828, 1846, 1862, 1872, 1908, 1931, 1977, 2019, 2026, 2173, 2176, 2201,
+  ],
+  '84': [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991, 1042, 1160, 1183, 1200, 1203, 1741, 1779, 1859, 1880, 1952, 1983, 2013, 2016, 2177, 2180],
+  '85': [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254, 1273, 1301, 1529, 1607, 1752, 1795, 1860, 1988, 2015, 2022, 2065, 2067, 2083, 2129, 2152],
+  '86': [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  '87': [28, 899, 904, 1035, 1366, 1616, 1816, 1905, 1962, 2052, 2151],
+  '88': [258, 513, 1211, 1258, 1442, 1478, 1642, 1906, 2259],
+  '89': [239, 333, 1184, 1650, 1769, 2202],
+  '90': [157, 2031, 2190],
+  '91': [
+    80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317, 339, 340, 342, 356, 362, 385, 410, 429, 436, 440, 480, 511, 601, 604, 664, 711, 737, 848, 865, 875, 878, 900, 956,
+    961, 966, 1024, 1085, 1102, 1113, 1123, 1170, 1243, 1328, 1329, 1332, 1344, 1368, 1462, 1472, 1480, 1492, 1534, 1538, 1573, 1639, 1641, 1711, 1721, 1907, 1935, 1991, 2058,
+    2082, 2205,
+  ],
+  '92': [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102, 130, 138, 150, 151, 163, 168, 222, 233, 284, 285, 294, 306, 307, 312, 355, 384, 418, 457, 460, 472, 559, 922, 1288],
+  '93': [
+    19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125, 133, 143, 145, 146, 160, 174, 183, 187, 188, 199, 206, 216, 296, 302, 311, 357, 389, 430, 584, 622, 679, 806, 864, 1227,
+    1364, 1496, 2191,
+  ],
+  '94': [
+    44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230, 237, 248, 252, 256, 273, 277, 299, 308, 319, 330, 379, 382, 422, 453, 456, 458, 475, 493, 497, 522, 533, 539, 572, 691,
+    697, 828, 868, 933, 1876, 2033,
+  ],
+  '95': [
+    38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323, 326, 331, 338, 350, 364, 401, 413, 437, 448, 535, 546, 549, 554, 613, 615, 617, 658, 663, 666, 702, 805, 810, 895,
+    984, 1030, 1044, 1062, 1076, 1078, 1206, 1267, 1283, 1436, 1498, 1526, 1603, 1674, 1812, 1865, 1961, 2021, 2050, 2128, 2248, 2264,
+  ],
+  '971': [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725, 1037, 1131, 1323, 1447, 1474, 1501, 1552, 1836, 1967, 2037, 2222],
+  '972': [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274, 1276, 1685, 1713, 1826],
+  '973': [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 1108, 2266],
+  '974': [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365, 693, 772, 775, 885, 1510, 1522, 1532, 1584, 2232, 2246],
+  '976': [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418, 1739, 1809, 2070, 2183],
+  '977': [973],
+  '978': [274],
+  '986': [1346],
+  '987': [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034, 1296, 1787, 2144, 2265],
+  '988': [53, 240, 324, 368, 1159, 1353, 1781, 2046],
+}
+
+/** Region name -> ville positions, most populated first */
+export const VILLES_BY_REGION: Record<string, number[]> = {
+  'Auvergne-Rhône-Alpes': [
+    2, 13, 15, 18, 22, 27, 81, 83, 96, 121, 137, 169, 175, 182, 195, 208, 209, 211, 212, 214, 223, 231, 234, 236, 247, 249, 257, 265, 270, 287, 293, 349, 371, 399, 412, 427, 433,
+    439, 447, 451, 490, 491, 494, 508, 512, 514, 518, 519, 529, 547, 550, 557, 565, 566, 573, 576, 582, 592, 603, 611, 614, 621, 633, 640, 653, 657, 694, 722, 730, 736, 740, 748,
+    754, 756, 783, 809, 814, 815, 821, 836, 837, 840, 861, 869, 871, 898, 903, 906, 908, 913, 915, 919, 938, 941, 945, 952, 965, 987, 994, 997, 1002, 1003, 1007, 1008, 1014, 1023,
+    1052, 1055, 1068, 1069, 1079, 1119, 1137, 1139, 1144, 1145, 1150, 1155, 1161, 1169, 1171, 1182, 1186, 1189, 1192, 1194, 1196, 1213, 1220, 1223, 1224, 1237, 1242, 1245, 1248,
+    1261, 1263, 1265, 1269, 1281, 1297, 1314, 1326, 1340, 1342, 1345, 1355, 1358, 1359, 1381, 1386, 1387, 1390, 1397, 1398, 1403, 1412, 1420, 1421, 1430, 1432, 1435, 1443, 1449,
+    1456, 1458, 1470, 1473, 1476, 1479, 1488, 1505, 1509, 1519, 1535, 1537, 1541, 1545, 1563, 1564, 1570, 1574, 1578, 1579, 1597, 1598, 1608, 1609, 1612, 1613, 1617, 1624, 1628,
+    1640, 1644, 1657, 1668, 1669, 1671, 1675, 1676, 1684, 1688, 1691, 1697, 1700, 1703, 1705, 1708, 1710, 1712, 1726, 1728, 1731, 1734, 1736, 1742, 1749, 1751, 1759, 1760, 1763,
+    1765, 1767, 1768, 1770, 1771, 1773, 1782, 1793, 1801, 1808, 1810, 1814, 1815, 1824, 1827, 1831, 1840, 1851, 1867, 1870, 1883, 1900, 1934, 1937, 1938, 1947, 1953, 1965, 1972,
+    1998, 2023, 2030, 2034, 2040, 2041, 2042, 2056, 2064, 2079, 2091, 2103, 2111, 2114, 2119, 2123, 2133, 2141, 2142, 2153, 2155, 2158, 2172, 2175, 2181, 2189, 2192, 2195, 2210,
+    2215, 2231, 2257, 2261,
+  ],
+  'Bourgogne-Franche-Comté': [
+    16, 32, 157, 162, 238, 239, 250, 333, 377, 390, 476, 481, 545, 581, 595, 660, 706, 714, 766, 856, 920, 977, 992, 1093, 1149, 1157, 1172, 1184, 1190, 1202, 1271, 1320, 1356,
+    1383, 1441, 1450, 1487, 1580, 1650, 1653, 1704, 1735, 1746, 1769, 1786, 1803, 1887, 1911, 1921, 1992, 1996, 2031, 2088, 2095, 2121, 2127, 2140, 2145, 2165, 2190, 2197, 2202,
+    2204, 2223, 2252,
+  ],
+  Bretagne: [
+    10, 24, 85, 103, 109, 142, 165, 397, 461, 482, 483, 500, 510, 517, 520, 577, 607, 624, 644, 654, 677, 684, 696, 707, 715, 735, 744, 747, 777, 811, 812, 818, 855, 863, 886, 954,
+    959, 971, 1006, 1039, 1061, 1065, 1080, 1112, 1115, 1128, 1133, 1143, 1163, 1185, 1204, 1229, 1235, 1239, 1246, 1251, 1272, 1275, 1284, 1292, 1298, 1310, 1325, 1334, 1354,
+    1373, 1377, 1425, 1428, 1445, 1448, 1451, 1454, 1459, 1463, 1475, 1485, 1489, 1491, 1523, 1524, 1533, 1539, 1544, 1557, 1559, 1583, 1585, 1600, 1618, 1625, 1635, 1636, 1649,
+    1660, 1673, 1689, 1709, 1716, 1727, 1733, 1745, 1750, 1756, 1758, 1784, 1788, 1804, 1857, 1897, 1916, 1930, 1936, 1941, 1971, 1979, 1981, 1989, 2012, 2069, 2104, 2109, 2167,
+    2174, 2188, 2207, 2227, 2228, 2229, 2230, 2235, 2250, 2260,
+  ],
+  'Centre-Val de Loire': [
+    25, 34, 87, 144, 177, 205, 207, 268, 373, 393, 400, 434, 537, 574, 583, 589, 623, 625, 634, 667, 673, 743, 746, 782, 786, 793, 795, 822, 905, 917, 927, 940, 975, 996, 1053,
+    1072, 1098, 1111, 1148, 1176, 1210, 1259, 1279, 1333, 1348, 1349, 1361, 1362, 1408, 1437, 1506, 1551, 1581, 1602, 1604, 1652, 1730, 1743, 1754, 1775, 1789, 1792, 1798, 1823,
+    1920, 1985, 2005, 2036, 2038, 2084, 2125, 2211, 2242,
+  ],
+  Corse: [67, 148, 916, 1021, 1396, 1433, 1590, 1677, 1954],
+  'Grand Est': [
+    7, 12, 29, 39, 40, 79, 93, 158, 176, 179, 228, 241, 258, 291, 318, 406, 423, 438, 462, 463, 477, 487, 502, 513, 528, 540, 569, 586, 593, 629, 632, 639, 643, 668, 669, 671, 675,
+    676, 678, 682, 686, 701, 708, 724, 752, 759, 788, 798, 803, 825, 827, 830, 832, 841, 844, 860, 884, 890, 912, 932, 939, 949, 958, 960, 974, 993, 1020, 1025, 1047, 1049, 1071,
+    1129, 1140, 1141, 1142, 1147, 1152, 1174, 1211, 1234, 1258, 1312, 1319, 1335, 1338, 1347, 1350, 1352, 1376, 1395, 1401, 1405, 1411, 1442, 1446, 1460, 1467, 1471, 1478, 1483,
+    1484, 1497, 1502, 1536, 1556, 1562, 1566, 1576, 1606, 1632, 1642, 1667, 1690, 1696, 1699, 1707, 1737, 1748, 1757, 1791, 1807, 1819, 1822, 1833, 1845, 1881, 1882, 1906, 1909,
+    1917, 1919, 1923, 1926, 1932, 1950, 1959, 1960, 1984, 1997, 2004, 2017, 2044, 2057, 2062, 2081, 2089, 2094, 2101, 2105, 2113, 2126, 2135, 2138, 2148, 2154, 2159, 2168, 2186,
+    2187, 2194, 2203, 2217, 2219, 2220, 2221, 2234, 2247, 2259,
+  ],
+  Guadeloupe: [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725, 1037, 1131, 1323, 1447, 1474, 1501, 1552, 1836, 1967, 2037, 2222],
+  Guyane: [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 1108, 2266],
+  'Hauts-de-France': [
+    9, 26, 41, 42, 52, 77, 90, 110, 123, 172, 178, 192, 194, 196, 197, 198, 229, 251, 276, 289, 310, 316, 334, 335, 361, 370, 380, 409, 415, 431, 432, 435, 446, 454, 465, 466, 467,
+    469, 473, 485, 498, 526, 527, 551, 568, 616, 620, 645, 656, 659, 661, 681, 700, 703, 705, 709, 713, 719, 728, 732, 751, 761, 763, 765, 769, 773, 776, 781, 791, 801, 817, 826,
+    831, 834, 847, 858, 870, 876, 881, 882, 892, 897, 930, 942, 946, 953, 967, 978, 982, 985, 986, 995, 1000, 1017, 1036, 1038, 1040, 1046, 1054, 1060, 1063, 1064, 1081, 1090,
+    1092, 1104, 1106, 1117, 1118, 1127, 1132, 1156, 1164, 1177, 1181, 1208, 1215, 1217, 1221, 1232, 1238, 1244, 1257, 1264, 1278, 1280, 1282, 1295, 1315, 1322, 1331, 1370, 1374,
+    1375, 1384, 1389, 1393, 1410, 1413, 1486, 1493, 1511, 1525, 1548, 1549, 1550, 1555, 1582, 1586, 1605, 1619, 1621, 1623, 1626, 1629, 1631, 1646, 1661, 1663, 1706, 1722, 1729,
+    1732, 1776, 1778, 1790, 1832, 1841, 1843, 1844, 1848, 1866, 1873, 1879, 1885, 1889, 1892, 1893, 1896, 1913, 1927, 1933, 1939, 1945, 1958, 1974, 1975, 2006, 2008, 2024, 2028,
+    2029, 2032, 2039, 2043, 2048, 2055, 2077, 2090, 2092, 2097, 2099, 2102, 2106, 2120, 2130, 2132, 2137, 2139, 2147, 2160, 2171, 2185, 2193, 2206, 2208, 2224, 2240, 2243, 2244,
+    2253, 2262,
+  ],
+  'La Réunion': [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365, 693, 772, 775, 885, 1510, 1522, 1532, 1584, 2232, 2246],
+  Martinique: [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274, 1276, 1685, 1713, 1826],
+  Mayotte: [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418, 1739, 1809, 2070, 2183],
+  Normandie: [
+    14, 33, 36, 62, 136, 300, 305, 315, 359, 366, 369, 394, 421, 486, 501, 507, 523, 567, 575, 646, 647, 690, 695, 698, 745, 762, 797, 808, 816, 820, 845, 851, 883, 887, 894, 936,
+    957, 979, 998, 1015, 1032, 1041, 1058, 1086, 1087, 1088, 1110, 1120, 1162, 1198, 1230, 1241, 1262, 1285, 1303, 1304, 1305, 1308, 1330, 1417, 1426, 1431, 1518, 1528, 1546, 1553,
+    1568, 1577, 1638, 1664, 1717, 1738, 1799, 1805, 1813, 1818, 1820, 1838, 1850, 1864, 1868, 1878, 1894, 1904, 1966, 1982, 2000, 2061, 2117, 2199, 2200, 2212, 2216, 2233, 2238,
+    2254, 2258,
+  ],
+  'Nouvelle-Aquitaine': [
+    8, 28, 49, 60, 61, 63, 78, 97, 117, 147, 149, 173, 180, 185, 253, 254, 262, 267, 278, 304, 327, 332, 336, 341, 351, 360, 367, 372, 374, 375, 395, 416, 424, 425, 489, 492, 509,
+    531, 538, 544, 563, 571, 579, 594, 628, 672, 692, 699, 729, 741, 750, 778, 779, 794, 800, 842, 896, 899, 902, 904, 921, 924, 947, 962, 968, 969, 970, 972, 1026, 1035, 1043,
+    1048, 1050, 1056, 1091, 1100, 1107, 1125, 1126, 1146, 1165, 1166, 1167, 1191, 1205, 1216, 1225, 1228, 1231, 1253, 1287, 1302, 1307, 1318, 1324, 1351, 1363, 1366, 1378, 1380,
+    1391, 1400, 1407, 1409, 1424, 1427, 1429, 1434, 1438, 1440, 1452, 1455, 1468, 1477, 1481, 1490, 1504, 1513, 1521, 1530, 1560, 1567, 1571, 1593, 1596, 1610, 1616, 1627, 1630,
+    1634, 1658, 1666, 1693, 1701, 1702, 1720, 1755, 1766, 1777, 1780, 1783, 1796, 1800, 1802, 1816, 1825, 1884, 1886, 1891, 1902, 1905, 1912, 1915, 1918, 1925, 1940, 1943, 1948,
+    1962, 1970, 1973, 1976, 1987, 2001, 2002, 2007, 2009, 2011, 2018, 2045, 2052, 2068, 2076, 2078, 2096, 2100, 2118, 2131, 2146, 2150, 2151, 2166, 2184, 2213, 2225, 2226, 2239,
+    2245, 2249, 2255,
+  ],
+  'Nouvelle-Calédonie': [53, 240, 324, 368, 1159, 1353, 1781, 2046],
+  Occitanie: [
+    3, 6, 20, 30, 59, 89, 104, 128, 152, 153, 161, 164, 181, 191, 286, 292, 325, 344, 353, 354, 381, 387, 414, 426, 455, 470, 488, 542, 558, 570, 599, 602, 612, 637, 651, 655, 680,
+    683, 704, 718, 749, 755, 760, 764, 768, 770, 780, 796, 799, 813, 833, 835, 838, 839, 866, 874, 877, 909, 910, 911, 925, 934, 935, 950, 980, 988, 989, 999, 1001, 1004, 1011,
+    1051, 1066, 1067, 1073, 1074, 1075, 1082, 1083, 1084, 1089, 1095, 1099, 1101, 1116, 1121, 1124, 1154, 1158, 1168, 1175, 1178, 1187, 1188, 1201, 1222, 1226, 1236, 1249, 1250,
+    1266, 1270, 1286, 1289, 1293, 1299, 1316, 1339, 1357, 1360, 1365, 1371, 1372, 1392, 1394, 1402, 1457, 1465, 1466, 1482, 1499, 1514, 1517, 1540, 1543, 1558, 1569, 1572, 1588,
+    1589, 1599, 1611, 1620, 1622, 1633, 1651, 1654, 1659, 1665, 1670, 1678, 1680, 1687, 1694, 1698, 1719, 1725, 1740, 1762, 1774, 1794, 1806, 1811, 1830, 1834, 1835, 1837, 1854,
+    1856, 1858, 1861, 1869, 1871, 1877, 1888, 1899, 1901, 1914, 1922, 1929, 1944, 1949, 1955, 1956, 1978, 1993, 1994, 1999, 2010, 2020, 2035, 2047, 2051, 2053, 2059, 2060, 2066,
+    2074, 2093, 2110, 2115, 2122, 2156, 2157, 2164, 2170, 2236, 2237, 2251, 2256,
+  ],
+  'Pays de la Loire': [
+    5, 17, 23, 69, 112, 116, 131, 134, 135, 170, 313, 314, 347, 348, 358, 383, 386, 405, 428, 452, 459, 468, 474, 521, 524, 562, 580, 585, 587, 590, 597, 600, 605, 608, 635, 652,
+    670, 689, 717, 767, 771, 785, 789, 819, 824, 862, 880, 888, 926, 931, 948, 964, 981, 1009, 1010, 1094, 1096, 1109, 1114, 1122, 1130, 1136, 1153, 1207, 1214, 1218, 1219, 1240,
+    1254, 1255, 1256, 1273, 1290, 1294, 1300, 1301, 1313, 1321, 1336, 1341, 1382, 1399, 1404, 1414, 1423, 1439, 1453, 1461, 1464, 1469, 1507, 1515, 1520, 1527, 1529, 1547, 1554,
+    1565, 1592, 1595, 1607, 1647, 1648, 1656, 1679, 1681, 1683, 1686, 1695, 1714, 1715, 1747, 1752, 1772, 1795, 1842, 1855, 1860, 1898, 1964, 1968, 1980, 1986, 1988, 1990, 2003,
+    2015, 2022, 2025, 2027, 2063, 2065, 2067, 2072, 2083, 2085, 2087, 2112, 2124, 2129, 2134, 2136, 2143, 2152, 2162, 2163, 2178, 2214,
+  ],
+  'Polynésie française': [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034, 1296, 1787, 2144, 2265],
+  'Provence-Alpes-Côte d\'Azur': [
+    1, 4, 11, 21, 47, 65, 70, 88, 98, 108, 120, 126, 132, 139, 141, 166, 167, 184, 189, 193, 204, 217, 218, 221, 246, 259, 266, 282, 298, 303, 345, 352, 363, 391, 408, 411, 441,
+    442, 445, 484, 495, 499, 503, 504, 515, 530, 534, 536, 548, 552, 555, 564, 598, 626, 630, 648, 649, 650, 687, 710, 712, 720, 733, 734, 757, 758, 774, 802, 804, 807, 823, 843,
+    846, 849, 850, 852, 867, 872, 901, 907, 923, 928, 943, 944, 983, 990, 991, 1012, 1013, 1029, 1031, 1042, 1045, 1057, 1059, 1070, 1077, 1105, 1135, 1160, 1180, 1183, 1195, 1199,
+    1200, 1203, 1233, 1247, 1252, 1260, 1268, 1277, 1291, 1311, 1317, 1327, 1337, 1343, 1379, 1388, 1444, 1503, 1512, 1531, 1542, 1587, 1594, 1601, 1637, 1643, 1655, 1662, 1672,
+    1682, 1692, 1741, 1744, 1779, 1785, 1797, 1817, 1821, 1828, 1829, 1839, 1846, 1849, 1859, 1862, 1872, 1880, 1895, 1903, 1908, 1928, 1931, 1951, 1952, 1957, 1963, 1969, 1977,
+    1983, 1995, 2013, 2014, 2016, 2019, 2026, 2073, 2075, 2080, 2098, 2107, 2116, 2161, 2169, 2173, 2176, 2177, 2180, 2201, 2218, 2263,
+  ],
+  'Saint-Barthélemy': [973],
+  'Saint-Martin': [274],
+  'Wallis et Futuna': [1346],
+  'Île-de-France': [
+    0, 19, 31, 35, 38, 43, 44, 45, 46, 48, 50, 51, 55, 56, 57, 64, 66, 71, 72, 74, 75, 76, 80, 82, 84, 86, 92, 94, 95, 99, 100, 102, 105, 106, 107, 113, 114, 118, 119, 122, 124,
+    125, 127, 130, 133, 138, 140, 143, 145, 146, 150, 151, 154, 155, 156, 159, 160, 163, 168, 171, 174, 183, 186, 187, 188, 190, 199, 202, 206, 210, 213, 215, 216, 220, 222, 224,
+    227, 230, 233, 235, 237, 242, 243, 244, 248, 252, 255, 256, 261, 263, 264, 269, 271, 272, 273, 275, 277, 280, 281, 283, 284, 285, 288, 290, 294, 296, 297, 299, 301, 302, 306,
+    307, 308, 311, 312, 317, 319, 321, 323, 326, 328, 329, 330, 331, 337, 338, 339, 340, 342, 346, 350, 355, 356, 357, 362, 364, 379, 382, 384, 385, 389, 392, 396, 398, 401, 402,
+    404, 407, 410, 413, 417, 418, 419, 420, 422, 429, 430, 436, 437, 440, 444, 448, 449, 450, 453, 456, 457, 458, 460, 464, 471, 472, 475, 478, 479, 480, 493, 497, 505, 511, 516,
+    522, 532, 533, 535, 539, 546, 549, 553, 554, 559, 572, 578, 584, 588, 591, 596, 601, 604, 606, 609, 613, 615, 617, 618, 619, 622, 636, 638, 641, 642, 658, 662, 663, 664, 666,
+    674, 679, 688, 691, 697, 702, 711, 721, 727, 731, 737, 738, 739, 753, 784, 787, 792, 805, 806, 810, 828, 829, 848, 853, 854, 864, 865, 868, 873, 875, 878, 889, 895, 900, 914,
+    922, 929, 933, 951, 956, 961, 966, 976, 984, 1005, 1016, 1024, 1028, 1030, 1044, 1062, 1076, 1078, 1085, 1102, 1113, 1123, 1138, 1151, 1170, 1173, 1179, 1193, 1206, 1209, 1212,
+    1227, 1243, 1267, 1283, 1288, 1309, 1328, 1329, 1332, 1344, 1364, 1367, 1368, 1369, 1385, 1406, 1415, 1416, 1419, 1422, 1436, 1462, 1472, 1480, 1492, 1494, 1495, 1496, 1498,
+    1500, 1508, 1516, 1526, 1534, 1538, 1561, 1573, 1575, 1591, 1603, 1614, 1615, 1639, 1641, 1645, 1674, 1711, 1718, 1721, 1723, 1724, 1753, 1761, 1764, 1812, 1847, 1852, 1853,
+    1863, 1865, 1874, 1875, 1876, 1890, 1907, 1910, 1924, 1935, 1942, 1946, 1961, 1991, 2021, 2033, 2049, 2050, 2054, 2058, 2071, 2082, 2086, 2108, 2128, 2149, 2179, 2182, 2191,
+    2196, 2198, 2205, 2209, 2241, 2248, 2264,
+  ],
+}
+
+/** Departement slug -> position in `departements` */
+export const DEPARTEMENT_INDEX: Record<string, number> = {
+  ain: 0,
+  aisne: 1,
+  allier: 2,
+  'alpes-de-haute-provence': 3,
+  'hautes-alpes': 4,
+  'alpes-maritimes': 5,
+  ardeche: 6,
+  ardennes: 7,
+  ariege: 8,
+  aube: 9,
+  aude: 10,
+  aveyron: 11,
+  'bouches-du-rhone': 12,
+  calvados: 13,
+  cantal: 14,
+  charente: 15,
+  'charente-maritime': 16,
+  cher: 17,
+  correze: 18,
+  'cote-dor': 19,
+  'cotes-darmor': 20,
+  creuse: 21,
+  dordogne: 22,
+  doubs: 23,
+  drome: 24,
+  eure: 25,
+  'eure-et-loir': 26,
+  finistere: 27,
+  gard: 28,
+  'haute-garonne': 29,
+  gers: 30,
+  gironde: 31,
+  herault: 32,
+  'ille-et-vilaine': 33,
+  indre: 34,
+  'indre-et-loire': 35,
+  isere: 36,
+  jura: 37,
+  landes: 38,
+  'loir-et-cher': 39,
+  loire: 40,
+  'haute-loire': 41,
+  'loire-atlantique': 42,
+  loiret: 43,
+  lot: 44,
+  'lot-et-garonne': 45,
+  lozere: 46,
+  'maine-et-loire': 47,
+  manche: 48,
+  marne: 49,
+  'haute-marne': 50,
+  mayenne: 51,
+  'meurthe-et-moselle': 52,
+  meuse: 53,
+  morbihan: 54,
+  moselle: 55,
+  nievre: 56,
+  nord: 57,
+  oise: 58,
+  orne: 59,
+  'pas-de-calais': 60,
+  'puy-de-dome': 61,
+  'pyrenees-atlantiques': 62,
+  'hautes-pyrenees': 63,
+  'pyrenees-orientales': 64,
+  'bas-rhin': 65,
+  'haut-rhin': 66,
+  rhone: 67,
+  'haute-saone': 68,
+  'saone-et-loire': 69,
+  sarthe: 70,
+  savoie: 71,
+  'haute-savoie': 72,
+  paris: 73,
+  'seine-maritime': 74,
+  'seine-et-marne': 75,
+  yvelines: 76,
+  'deux-sevres': 77,
+  somme: 78,
+  tarn: 79,
+  'tarn-et-garonne': 80,
+  var: 81,
+  vaucluse: 82,
+  vendee: 83,
+  vienne: 84,
+  'haute-vienne': 85,
+  vosges: 86,
+  yonne: 87,
+  'territoire-de-belfort': 88,
+  essonne: 89,
+  'hauts-de-seine': 90,
+  'seine-saint-denis': 91,
+  'val-de-marne': 92,
+  'val-doise': 93,
+  'corse-du-sud': 94,
+  'haute-corse': 95,
+  guadeloupe: 96,
+  martinique: 97,
+  guyane: 98,
+  'la-reunion': 99,
+  mayotte: 100,
+}
+
+/** Departement code -> position in `departements` */
+export const DEPARTEMENT_INDEX_BY_CODE: Record<string, number> = {
+  '01': 0,
+  '02': 1,
+  '03': 2,
+  '04': 3,
+  '05': 4,
+  '06': 5,
+  '07': 6,
+  '08': 7,
+  '09': 8,
+  '10': 9,
+  '11': 10,
+  '12': 11,
+  '13': 12,
+  '14': 13,
+  '15': 14,
+  '16': 15,
+  '17': 16,
+  '18': 17,
+  '19': 18,
+  '21': 19,
+  '22': 20,
+  '23': 21,
+  '24': 22,
+  '25': 23,
+  '26': 24,
+  '27': 25,
+  '28': 26,
+  '29': 27,
+  '30': 28,
+  '31': 29,
+  '32': 30,
+  '33': 31,
+  '34': 32,
+  '35': 33,
+  '36': 34,
+  '37': 35,
+  '38': 36,
+  '39': 37,
+  '40': 38,
+  '41': 39,
+  '42': 40,
+  '43': 41,
+  '44': 42,
+  '45': 43,
+  '46': 44,
+  '47': 45,
+  '48': 46,
+  '49': 47,
+  '50': 48,
+  '51': 49,
+  '52': 50,
+  '53': 51,
+  '54': 52,
+  '55': 53,
+  '56': 54,
+  '57': 55,
+  '58': 56,
+  '59': 57,
+  '60': 58,
+  '61': 59,
+  '62': 60,
+  '63': 61,
+  '64': 62,
+  '65': 63,
+  '66': 64,
+  '67': 65,
+  '68': 66,
+  '69': 67,
+  '70': 68,
+  '71': 69,
+  '72': 70,
+  '73': 71,
+  '74': 72,
+  '75': 73,
+  '76': 74,
+  '77': 75,
+  '78': 76,
+  '79': 77,
+  '80': 78,
+  '81': 79,
+  '82': 80,
+  '83': 81,
+  '84': 82,
+  '85': 83,
+  '86': 84,
+  '87': 85,
+  '88': 86,
+  '89': 87,
+  '90': 88,
+  '91': 89,
+  '92': 90,
+  '93': 91,
+  '94': 92,
+  '95': 93,
+  '2A': 94,
+  '2B': 95,
+  '971': 96,
+  '972': 97,
+  '973': 98,
+  '974': 99,
+  '976': 100,
+}
+
+/** Region slug -> position in `regions` */
+export const REGION_INDEX: Record<string, number> = {
+  'ile-de-france': 0,
+  'auvergne-rhone-alpes': 1,
+  'provence-alpes-cote-azur': 2,
+  occitanie: 3,
+  'nouvelle-aquitaine': 4,
+  'hauts-de-france': 5,
+  'grand-est': 6,
+  'pays-de-la-loire': 7,
+  bretagne: 8,
+  normandie: 9,
+  'bourgogne-franche-comte': 10,
+  'centre-val-de-loire': 11,
+  corse: 12,
+  guadeloupe: 13,
+  martinique: 14,
+  guyane: 15,
+  'la-reunion': 16,
+  mayotte: 17,
+}
+
+/** Region name -> position in `regions` */
+export const REGION_INDEX_BY_NAME: Record<string, number> = {
+  'Île-de-France': 0,
+  'Auvergne-Rhône-Alpes': 1,
+  'Provence-Alpes-Côte d\'Azur': 2,
+  Occitanie: 3,
+  'Nouvelle-Aquitaine': 4,
+  'Hauts-de-France': 5,
+  'Grand Est': 6,
+  'Pays de la Loire': 7,
+  Bretagne: 8,
+  Normandie: 9,
+  'Bourgogne-Franche-Comté': 10,
+  'Centre-Val de Loire': 11,
+  Corse: 12,
+  Guadeloupe: 13,
+  Martinique: 14,
+  Guyane: 15,
+  'La Réunion': 16,
+  Mayotte: 17,
+}
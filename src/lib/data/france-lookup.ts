@@ -0,0 +1,47 @@
+// Recherches par position partagées par france.ts et france-core.ts.
+//
+// Ce module ne lit que les index générés : france.ts les applique à `villes`,
+// france-core.ts à `villesCore`, sans que l'un importe le tableau de l'autre.
+
+import { VILLES_BY_DEPARTEMENT, VILLES_BY_REGION } from './france-index'
+import { NEARBY_VILLES } from './link-index'
+import { QUARTIER_SLUGS } from './quartier-index'
+
+/** Valeur d'une clé dans un index généré (ignore les clés héritées comme `constructor`) */
+export function lookup<T>(index: Record<string, T>, key: string): T | undefined {
+  return Object.prototype.hasOwnProperty.call(index, key) ? index[key] : undefined
+}
+
+export function pick<T>(items: T[], positions: number[] | undefined): T[] {
+  return Array.isArray(positions) ? positions.map(i => items[i]) : []
+}
+
+/**
+ * Positions des villes proches de la ville en position `i` (voir getNearbyCities) :
+ * la liste précalculée de link-index.ts, complétée au-delà par le département
+ * puis la région, par population décroissante.
+ */
+export function nearbyPositions(i: number, ville: { departementCode: string; region: string }, limit: number): number[] {
+  const nearest = NEARBY_VILLES[i].slice(0, limit)
+  if (limit <= nearest.length) return nearest
+
+  const seen = new Set([i, ...nearest])
+  for (const j of [...VILLES_BY_DEPARTEMENT[ville.departementCode], ...VILLES_BY_REGION[ville.region]]) {
+    if (nearest.length >= limit) break
+    if (seen.has(j)) continue
+    seen.add(j)
+    nearest.push(j)
+  }
+  return nearest
+}
+
+/** Slugs des quartiers d'une ville, sans charger ses noms (quartier-index.ts) */
+export function quartierSlugs(villeSlug: string): string[] {
+  return lookup(QUARTIER_SLUGS, villeSlug) ?? []
+}
+
+/** Quartiers d'une ville avec leur slug précalculé (quartier-index.ts) */
+export function quartierLinks(ville: { slug: string; quartiers: string[] }): { name: string; slug: string }[] {
+  const slugs = quartierSlugs(ville.slug)
+  return ville.quartiers.map((q, i) => ({ name: q, slug: slugs[i] }))
+}
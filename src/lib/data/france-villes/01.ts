@@ -0,0 +1,111 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'bourg-en-bresse': {
+    description: 'Bourg-en-Bresse est une ville dynamique de 42 000 habitants située dans le département Ain en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Bourg-en-Bresse, ainsi que Montagnat, Péronnas, Saint-Denis-lès-Bourg pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Montagnat', 'Péronnas', 'Saint-Denis-lès-Bourg', 'Viriat', 'Ceyzériat', 'Saint-Étienne-du-Bois'],
+  },
+  oyonnax: {
+    description: 'Artisans référencés à Oyonnax et ses environs. Cette ville active rhônalpine de 22 000 habitants en Ain compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Bellignat, Arbent, Dortan.',
+    quartiers: ['Centre-ville', 'Bellignat', 'Arbent', 'Dortan', 'Izernore', 'Montréal-la-Cluse', 'Nantua'],
+  },
+  valserhone: {
+    description: 'Artisans référencés à Valserhône et ses environs. Cette commune rhônalpine de 17 000 habitants en Ain compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Collonges, Péron, Nantua.',
+    quartiers: ['Centre-ville', 'Collonges', 'Péron', 'Nantua', 'Saint-Jean-de-Gonville', 'Montréal-la-Cluse', 'Bellignat'],
+  },
+  'amberieu-en-bugey': {
+    description: 'Vous habitez à Ambérieu-en-Bugey ou ses environs ? Nos artisans qualifiés du Ain sont disponibles pour tous vos travaux. Ambérieu-en-Bugey, commune rhônalpine de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Denis-en-Bugey, Château-Gaillard, Saint-Rambert-en-Bugey.',
+    quartiers: ['Centre-ville', 'Saint-Denis-en-Bugey', 'Château-Gaillard', 'Saint-Rambert-en-Bugey', 'Ambronay', 'Lagnieu', 'Jujurieux'],
+  },
+  'saint-genis-pouilly': {
+    description: 'Saint-Genis-Pouilly (Ain, Auvergne-Rhône-Alpes) est une commune de 14 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Prévessin-Moëns, Chevry, Sergy.',
+    quartiers: ['Centre-ville', 'Prévessin-Moëns', 'Chevry', 'Sergy', 'Ornex', 'Ségny', 'Crozet'],
+  },
+  gex: {
+    description: 'Artisans référencés à Gex et ses environs. Cette commune rhônalpine de 14 000 habitants en Ain compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Échenevex, Cessy, Divonne-les-Bains.',
+    quartiers: ['Centre-ville', 'Échenevex', 'Cessy', 'Divonne-les-Bains', 'Ségny', 'Versonnex', 'Chevry'],
+  },
+  'ferney-voltaire': {
+    description: 'Artisans référencés à Ferney-Voltaire et ses environs. Cette commune rhônalpine de 12 000 habitants en Ain compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Prévessin-Moëns, Ornex, Versonnex.',
+    quartiers: ['Centre-ville', 'Prévessin-Moëns', 'Ornex', 'Versonnex', 'Saint-Genis-Pouilly', 'Ségny', 'Chevry'],
+  },
+  'divonne-les-bains': {
+    description: 'Découvrez les meilleurs artisans à Divonne-les-Bains en Ain. Avec les Alpes et la vallée du Rhône et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Gex, Cessy, Versonnex.',
+    quartiers: ['Centre-ville', 'Gex', 'Cessy', 'Versonnex', 'Ségny', 'Échenevex', 'Ornex'],
+  },
+  miribel: {
+    description: 'Artisans référencés à Miribel et ses environs. Cette commune rhônalpine de 10 000 habitants en Ain compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Neyron, Saint-Maurice-de-Beynost, Beynost.',
+    quartiers: ['Centre-ville', 'Neyron', 'Saint-Maurice-de-Beynost', 'Beynost', 'Mionnay', 'La Boisse', 'Montluel'],
+  },
+  belley: {
+    description: 'Trouvez des artisans qualifiés à Belley (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'prevessin-moens': {
+    description: 'Trouvez des artisans qualifiés à Prévessin-Moëns (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  meximieux: {
+    description: 'Trouvez des artisans qualifiés à Meximieux (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lagnieu: {
+    description: 'Trouvez des artisans qualifiés à Lagnieu (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  viriat: {
+    description: 'Trouvez des artisans qualifiés à Viriat (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  trevoux: {
+    description: 'Trouvez des artisans qualifiés à Trévoux (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  montluel: {
+    description: 'Trouvez des artisans qualifiés à Montluel (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  thoiry: {
+    description: 'Trouvez des artisans qualifiés à Thoiry (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  peronnas: {
+    description: 'Trouvez des artisans qualifiés à Péronnas (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'jassans-riottier': {
+    description: 'Trouvez des artisans qualifiés à Jassans-Riottier (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-denis-les-bourg': {
+    description: 'Trouvez des artisans qualifiés à Saint-Denis-lès-Bourg (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cessy: {
+    description: 'Trouvez des artisans qualifiés à Cessy (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  reyrieux: {
+    description: 'Trouvez des artisans qualifiés à Reyrieux (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatillon-sur-chalaronne': {
+    description: 'Trouvez des artisans qualifiés à Châtillon-sur-Chalaronne (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beynost: {
+    description: 'Trouvez des artisans qualifiés à Beynost (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villars-les-dombes': {
+    description: 'Trouvez des artisans qualifiés à Villars-les-Dombes (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ornex: {
+    description: 'Trouvez des artisans qualifiés à Ornex (Ain). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,44 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-quentin': { description: 'Ville art déco de Picardie.', quartiers: ['Centre-ville', 'Europe', 'Vermandois', 'Saint-Martin'] },
+  soissons: {
+    description: 'Trouvez un artisan de confiance à Soissons (Aisne). Avec 28 000 habitants, cette ville active nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Belleu, Villeneuve-Saint-Germain, Crouy.',
+    quartiers: ['Centre-ville', 'Belleu', 'Villeneuve-Saint-Germain', 'Crouy', 'Vailly-sur-Aisne', 'Braine', 'Anizy-le-Grand'],
+  },
+  laon: {
+    description: 'Besoin d’un professionnel à Laon ? Située en Hauts-de-France, cette ville active du Aisne bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Athies-sous-Laon, Anizy-le-Grand, Saint-Gobain.',
+    quartiers: ['Centre-ville', 'Athies-sous-Laon', 'Anizy-le-Grand', 'Saint-Gobain', 'Vailly-sur-Aisne', 'La Fère', 'Beautor'],
+  },
+  'chateau-thierry': {
+    description: 'Château-Thierry est une commune de 15 000 habitants située dans le département Aisne en Hauts-de-France. Nos artisans qualifiés interviennent à Château-Thierry, ainsi que Essômes-sur-Marne, Charly-sur-Marne, Nogent-l\'Artaud pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Essômes-sur-Marne', 'Charly-sur-Marne', 'Nogent-l\'Artaud', 'Fère-en-Tardenois', 'La Ferté-Milon'],
+  },
+  tergnier: {
+    description: 'Tergnier est une commune de 13 000 habitants située dans le département Aisne en Hauts-de-France. Nos artisans qualifiés interviennent à Tergnier, ainsi que Beautor, La Fère, Chauny pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Beautor', 'La Fère', 'Chauny', 'Sinceny', 'Saint-Gobain', 'Gauchy'],
+  },
+  chauny: {
+    description: 'Chauny est une commune de 12 000 habitants située dans le département Aisne en Hauts-de-France. Nos artisans qualifiés interviennent à Chauny, ainsi que Sinceny, Tergnier, Beautor pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sinceny', 'Tergnier', 'Beautor', 'La Fère', 'Saint-Gobain', 'Anizy-le-Grand'],
+  },
+  'villers-cotterets': {
+    description: 'Villers-Cotterêts est une commune de 10 000 habitants située dans le département Aisne en Hauts-de-France. Nos artisans qualifiés interviennent à Villers-Cotterêts, ainsi que La Ferté-Milon, Belleu, Soissons pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'La Ferté-Milon', 'Belleu', 'Soissons'],
+  },
+  hirson: {
+    description: 'Trouvez des artisans qualifiés à Hirson (Aisne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bohain-en-vermandois': {
+    description: 'Trouvez des artisans qualifiés à Bohain-en-Vermandois (Aisne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gauchy: {
+    description: 'Trouvez des artisans qualifiés à Gauchy (Aisne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,40 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  montlucon: {
+    description: 'À Montluçon, ville dynamique du Allier (33 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Désertines, Saint-Victor, Domérat.',
+    quartiers: ['Centre-ville', 'Désertines', 'Saint-Victor', 'Domérat', 'Prémilhat', 'Néris-les-Bains', 'Huriel'],
+  },
+  vichy: { description: 'Reine des villes d\'eaux.', quartiers: ['Centre-ville', 'Les Ailes', 'Croix-Saint-Martin', 'France'] },
+  moulins: {
+    description: 'Vous habitez à Moulins ou ses environs ? Nos artisans qualifiés du Allier sont disponibles pour tous vos travaux. Moulins, commune rhônalpine de 19 000 habitants, mérite des professionnels à la hauteur, ainsi que Avermes, Yzeure, Bourbon-l\'Archambault.',
+    quartiers: ['Centre-ville', 'Avermes', 'Yzeure', 'Bourbon-l\'Archambault'],
+  },
+  cusset: {
+    description: 'Vous habitez à Cusset ou ses environs ? Nos artisans qualifiés du Allier sont disponibles pour tous vos travaux. Cusset, commune rhônalpine de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Vichy, Creuzier-le-Vieux, Abrest.',
+    quartiers: ['Centre-ville', 'Vichy', 'Creuzier-le-Vieux', 'Abrest', 'Bellerive-sur-Allier', 'Saint-Germain-des-Fossés', 'Saint-Yorre'],
+  },
+  yzeure: {
+    description: 'Artisans référencés à Yzeure et ses environs. Cette commune rhônalpine de 13 000 habitants en Allier compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Moulins, Avermes, Dompierre-sur-Besbre.',
+    quartiers: ['Centre-ville', 'Moulins', 'Avermes', 'Dompierre-sur-Besbre'],
+  },
+  'bellerive-sur-allier': {
+    description: 'Trouvez des artisans qualifiés à Bellerive-sur-Allier (Allier). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  domerat: {
+    description: 'Trouvez des artisans qualifiés à Domérat (Allier). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  commentry: {
+    description: 'Trouvez des artisans qualifiés à Commentry (Allier). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gannat: {
+    description: 'Trouvez des artisans qualifiés à Gannat (Allier). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
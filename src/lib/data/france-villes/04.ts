@@ -0,0 +1,28 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  manosque: { description: 'Ville de Jean Giono.', quartiers: ['Centre-ville', 'Saint-Lazare', 'Les Plantiers', 'La Rochette'] },
+  'digne-les-bains': {
+    description: 'Besoin d’un professionnel à Digne-les-Bains ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Alpes-de-Haute-Provence bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Malijai, Château-Arnoux-Saint-Auban.',
+    quartiers: ['Centre-ville', 'Malijai', 'Château-Arnoux-Saint-Auban'],
+  },
+  sisteron: {
+    description: 'Trouvez des artisans qualifiés à Sisteron (Alpes-de-Haute-Provence). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  oraison: {
+    description: 'Trouvez des artisans qualifiés à Oraison (Alpes-de-Haute-Provence). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  forcalquier: {
+    description: 'Trouvez des artisans qualifiés à Forcalquier (Alpes-de-Haute-Provence). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chateau-arnoux-saint-auban': {
+    description: 'Trouvez des artisans qualifiés à Château-Arnoux-Saint-Auban (Alpes-de-Haute-Provence). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,16 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  gap: { description: 'Préfecture la plus haute de France.', quartiers: ['Centre-ville', 'Fontreyne', 'Romette', 'Tokoro'] },
+  briancon: {
+    description: 'Briançon est une commune de 11 000 habitants située dans le département Hautes-Alpes en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Briançon, ainsi que L\'Argentière-la-Bessée pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'L\'Argentière-la-Bessée'],
+  },
+  embrun: {
+    description: 'Trouvez des artisans qualifiés à Embrun (Hautes-Alpes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,118 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  nice: { description: 'Capitale de la Côte d\'Azur avec son climat méditerranéen.', quartiers: ['Vieux Nice', 'Promenade des Anglais', 'Cimiez', 'Port', 'Libération', 'Saint-Roch'] },
+  antibes: {
+    description: 'Station balnéaire sur la Côte d\'Azur.',
+    quartiers: ['Centre-ville', 'Juan-les-Pins', 'Sophia Antipolis', 'La Fontonne', 'Cap-d\'Antibes', 'Les Semboules', 'Rabiac'],
+  },
+  cannes: { description: 'Capitale mondiale du cinéma sur la Croisette.', quartiers: ['Centre-ville', 'La Bocca', 'Carnot', 'Croix des Gardes', 'Californie', 'Petit-Juas', 'République'] },
+  'cagnes-sur-mer': {
+    description: 'Trouvez un artisan de confiance à Cagnes-sur-Mer (Alpes-Maritimes). Avec 53 000 habitants, cette ville importante provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Laurent-du-Var, Saint-Paul-de-Vence, La Colle-sur-Loup.',
+    quartiers: ['Centre-ville', 'Saint-Laurent-du-Var', 'Saint-Paul-de-Vence', 'La Colle-sur-Loup', 'Villeneuve-Loubet', 'La Gaude', 'Biot'],
+  },
+  grasse: { description: 'Capitale mondiale du parfum.', quartiers: ['Centre-ville', 'Saint-Claude', 'Magagnosc', 'Le Plan', 'Plan-de-Grasse', 'Saint-Jacques', 'Les Marronniers'] },
+  'le-cannet': {
+    description: 'Besoin d’un professionnel à Le Cannet ? Située en Provence-Alpes-Côte d\'Azur, cette ville dynamique du Alpes-Maritimes bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Mougins, Cannes, La Roquette-sur-Siagne.',
+    quartiers: ['Centre-ville', 'Mougins', 'Cannes', 'La Roquette-sur-Siagne', 'Vallauris', 'Mouans-Sartoux', 'Valbonne'],
+  },
+  'saint-laurent-du-var': {
+    description: 'À Saint-Laurent-du-Var, ville dynamique du Alpes-Maritimes (32 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Cagnes-sur-Mer, La Gaude, Saint-Paul-de-Vence.',
+    quartiers: ['Centre-ville', 'Cagnes-sur-Mer', 'La Gaude', 'Saint-Paul-de-Vence', 'Nice', 'La Colle-sur-Loup', 'Villeneuve-Loubet'],
+  },
+  menton: {
+    description: 'Trouvez un artisan de confiance à Menton (Alpes-Maritimes). Avec 31 000 habitants, cette ville dynamique provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Roquebrune-Cap-Martin, Peille, Beausoleil.',
+    quartiers: ['Centre-ville', 'Roquebrune-Cap-Martin', 'Peille', 'Beausoleil', 'La Turbie', 'Sospel', 'Cap-d\'Ail'],
+  },
+  vallauris: {
+    description: 'À Vallauris, ville active du Alpes-Maritimes (29 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Antibes, Mougins, Le Cannet.',
+    quartiers: ['Centre-ville', 'Antibes', 'Mougins', 'Le Cannet', 'Cannes', 'Biot', 'Valbonne'],
+  },
+  'mandelieu-la-napoule': {
+    description: 'Vous habitez à Mandelieu-la-Napoule ou ses environs ? Nos artisans qualifiés du Alpes-Maritimes sont disponibles pour tous vos travaux. Mandelieu-la-Napoule, ville active provençale de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Pégomas, La Roquette-sur-Siagne, Cannes.',
+    quartiers: ['Centre-ville', 'Pégomas', 'La Roquette-sur-Siagne', 'Cannes', 'Le Cannet', 'Auribeau-sur-Siagne', 'Mougins'],
+  },
+  vence: {
+    description: 'Trouvez un artisan de confiance à Vence (Alpes-Maritimes). Avec 20 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Jeannet, Saint-Paul-de-Vence, La Gaude.',
+    quartiers: ['Centre-ville', 'Saint-Jeannet', 'Saint-Paul-de-Vence', 'La Gaude', 'Tourrettes-sur-Loup', 'La Colle-sur-Loup', 'Gattières'],
+  },
+  mougins: {
+    description: 'Besoin d’un professionnel à Mougins ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Alpes-Maritimes bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Le Cannet, Mouans-Sartoux, Valbonne.',
+    quartiers: ['Centre-ville', 'Le Cannet', 'Mouans-Sartoux', 'Valbonne', 'La Roquette-sur-Siagne', 'Vallauris', 'Cannes'],
+  },
+  'villeneuve-loubet': {
+    description: 'Vous habitez à Villeneuve-Loubet ou ses environs ? Nos artisans qualifiés du Alpes-Maritimes sont disponibles pour tous vos travaux. Villeneuve-Loubet, commune provençale de 18 000 habitants, mérite des professionnels à la hauteur, ainsi que Biot, Roquefort-les-Pins, La Colle-sur-Loup.',
+    quartiers: ['Centre-ville', 'Biot', 'Roquefort-les-Pins', 'La Colle-sur-Loup', 'Cagnes-sur-Mer', 'Saint-Paul-de-Vence', 'Valbonne'],
+  },
+  carros: {
+    description: 'Besoin d’un professionnel à Carros ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Alpes-Maritimes bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Gattières, Saint-Jeannet, Saint-Martin-du-Var.',
+    quartiers: ['Centre-ville', 'Gattières', 'Saint-Jeannet', 'Saint-Martin-du-Var', 'Colomars', 'Aspremont', 'La Gaude'],
+  },
+  'roquebrune-cap-martin': {
+    description: 'Trouvez un artisan de confiance à Roquebrune-Cap-Martin (Alpes-Maritimes). Avec 12 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Beausoleil, Menton, La Turbie.',
+    quartiers: ['Centre-ville', 'Beausoleil', 'Menton', 'La Turbie', 'Peille', 'Cap-d\'Ail', 'Èze'],
+  },
+  valbonne: {
+    description: 'Valbonne (Alpes-Maritimes, Provence-Alpes-Côte d\'Azur) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Opio, Mougins, Biot.',
+    quartiers: ['Centre-ville', 'Opio', 'Mougins', 'Biot', 'Mouans-Sartoux', 'Roquefort-les-Pins', 'Châteauneuf-Grasse'],
+  },
+  beausoleil: {
+    description: 'Beausoleil (Alpes-Maritimes, Provence-Alpes-Côte d\'Azur) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que La Turbie, Cap-d\'Ail, Roquebrune-Cap-Martin.',
+    quartiers: ['Centre-ville', 'La Turbie', 'Cap-d\'Ail', 'Roquebrune-Cap-Martin', 'Èze', 'Peille', 'La Trinité'],
+  },
+  'mouans-sartoux': {
+    description: 'Découvrez les meilleurs artisans à Mouans-Sartoux en Alpes-Maritimes. Avec le climat méditerranéen et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Roquette-sur-Siagne, Mougins, Auribeau-sur-Siagne.',
+    quartiers: ['Centre-ville', 'La Roquette-sur-Siagne', 'Mougins', 'Auribeau-sur-Siagne', 'Grasse', 'Châteauneuf-Grasse', 'Valbonne'],
+  },
+  biot: {
+    description: 'Découvrez les meilleurs artisans à Biot en Alpes-Maritimes. Avec le climat méditerranéen et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Villeneuve-Loubet, Valbonne, Antibes.',
+    quartiers: ['Centre-ville', 'Villeneuve-Loubet', 'Valbonne', 'Antibes', 'Roquefort-les-Pins', 'Vallauris', 'Opio'],
+  },
+  peymeinade: {
+    description: 'Trouvez des artisans qualifiés à Peymeinade (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pegomas: {
+    description: 'Trouvez des artisans qualifiés à Pégomas (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-colle-sur-loup': {
+    description: 'Trouvez des artisans qualifiés à La Colle-sur-Loup (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  contes: {
+    description: 'Trouvez des artisans qualifiés à Contes (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'roquefort-les-pins': {
+    description: 'Trouvez des artisans qualifiés à Roquefort-les-Pins (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-gaude': {
+    description: 'Trouvez des artisans qualifiés à La Gaude (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-andre-de-la-roche': {
+    description: 'Trouvez des artisans qualifiés à Saint-André-de-la-Roche (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-roquette-sur-siagne': {
+    description: 'Trouvez des artisans qualifiés à La Roquette-sur-Siagne (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  drap: {
+    description: 'Trouvez des artisans qualifiés à Drap (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  levens: {
+    description: 'Trouvez des artisans qualifiés à Levens (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villefranche-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Villefranche-sur-Mer (Alpes-Maritimes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
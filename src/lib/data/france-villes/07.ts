@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  annonay: {
+    description: 'Artisans référencés à Annonay et ses environs. Cette commune rhônalpine de 17 000 habitants en Ardèche compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Boulieu-lès-Annonay, Roiffieux, Davézieux.',
+    quartiers: ['Centre-ville', 'Boulieu-lès-Annonay', 'Roiffieux', 'Davézieux', 'Vernosc-lès-Annonay', 'Peaugres', 'Sarras'],
+  },
+  aubenas: {
+    description: 'Vous habitez à Aubenas ou ses environs ? Nos artisans qualifiés du Ardèche sont disponibles pour tous vos travaux. Aubenas, commune rhônalpine de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Étienne-de-Fontbellon, Ucel, Lavilledieu.',
+    quartiers: ['Centre-ville', 'Saint-Étienne-de-Fontbellon', 'Ucel', 'Lavilledieu', 'Vesseaux', 'Vals-les-Bains', 'Villeneuve-de-Berg'],
+  },
+  'tournon-sur-rhone': {
+    description: 'Besoin d’un professionnel à Tournon-sur-Rhône ? Située en Auvergne-Rhône-Alpes, cette commune du Ardèche bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Jean-de-Muzols, Cornas, Saint-Péray.',
+    quartiers: ['Centre-ville', 'Saint-Jean-de-Muzols', 'Cornas', 'Saint-Péray', 'Guilherand-Granges', 'Sarras', 'Soyons'],
+  },
+  'guilherand-granges': {
+    description: 'Vous habitez à Guilherand-Granges ou ses environs ? Nos artisans qualifiés du Ardèche sont disponibles pour tous vos travaux. Guilherand-Granges, commune rhônalpine de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Péray, Soyons, Cornas.',
+    quartiers: ['Centre-ville', 'Saint-Péray', 'Soyons', 'Cornas', 'Charmes-sur-Rhône', 'Saint-Georges-les-Bains', 'Tournon-sur-Rhône'],
+  },
+  'le-teil': {
+    description: 'Trouvez des artisans qualifiés à Le Teil (Ardèche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  privas: {
+    description: 'Trouvez des artisans qualifiés à Privas (Ardèche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bourg-saint-andeol': {
+    description: 'Trouvez des artisans qualifiés à Bourg-Saint-Andéol (Ardèche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-peray': {
+    description: 'Trouvez des artisans qualifiés à Saint-Péray (Ardèche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,28 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'charleville-mezieres': { description: 'Ville du poète Arthur Rimbaud.', quartiers: ['Centre-ville', 'Manchester', 'La Houillère', 'Montjoly'] },
+  sedan: {
+    description: 'À Sedan, commune du Ardennes (17 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Floing, Bazeilles, Vrigne aux Bois.',
+    quartiers: ['Centre-ville', 'Floing', 'Bazeilles', 'Vrigne aux Bois', 'Vivier-au-Court', 'Douzy', 'Nouvion-sur-Meuse'],
+  },
+  rethel: {
+    description: 'Trouvez des artisans qualifiés à Rethel (Ardennes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  givet: {
+    description: 'Trouvez des artisans qualifiés à Givet (Ardennes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  revin: {
+    description: 'Trouvez des artisans qualifiés à Revin (Ardennes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nouzonville: {
+    description: 'Trouvez des artisans qualifiés à Nouzonville (Ardennes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,23 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  pamiers: {
+    description: 'Trouvez un artisan de confiance à Pamiers (Ariège). Avec 16 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que La Tour-du-Crieu, Saint-Jean-du-Falga, Verniolle.',
+    quartiers: ['Centre-ville', 'La Tour-du-Crieu', 'Saint-Jean-du-Falga', 'Verniolle', 'Varilhes', 'Saverdun', 'Mazères'],
+  },
+  foix: {
+    description: 'Trouvez des artisans qualifiés à Foix (Ariège). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-girons': {
+    description: 'Trouvez des artisans qualifiés à Saint-Girons (Ariège). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lavelanet: {
+    description: 'Trouvez des artisans qualifiés à Lavelanet (Ariège). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  troyes: {
+    description: 'Capitale historique de la Champagne.',
+    quartiers: ['Centre historique', 'Pont-Sainte-Marie', 'Chartreux', 'Boucherat', 'Sénardes', 'Jules-Guesde', 'Bouchon-de-Champagne'],
+  },
+  'romilly-sur-seine': {
+    description: 'Romilly-sur-Seine est une commune de 15 000 habitants située dans le département Aube en Grand Est. Nos artisans qualifiés interviennent à Romilly-sur-Seine, ainsi que Villenauxe-la-Grande, Nogent-sur-Seine pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Villenauxe-la-Grande', 'Nogent-sur-Seine'],
+  },
+  'saint-andre-les-vergers': {
+    description: 'Découvrez les meilleurs artisans à Saint-André-les-Vergers en Aube. Avec le carrefour européen et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Rosières-près-Troyes, La Rivière-de-Corps, Troyes.',
+    quartiers: ['Centre-ville', 'Rosières-près-Troyes', 'La Rivière-de-Corps', 'Troyes', 'Sainte-Savine', 'Les Noës-près-Troyes', 'Saint-Germain'],
+  },
+  'la-chapelle-saint-luc': {
+    description: 'La Chapelle-Saint-Luc est une commune de 13 000 habitants située dans le département Aube en Grand Est. Nos artisans qualifiés interviennent à La Chapelle-Saint-Luc, ainsi que Les Noës-près-Troyes, Sainte-Savine, Troyes pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Les Noës-près-Troyes', 'Sainte-Savine', 'Troyes', 'La Rivière-de-Corps', 'Saint-André-les-Vergers', 'Pont-Sainte-Marie'],
+  },
+  'sainte-savine': {
+    description: 'Vous habitez à Sainte-Savine ou ses environs ? Nos artisans qualifiés du Aube sont disponibles pour tous vos travaux. Sainte-Savine, commune du Grand Est de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Les Noës-près-Troyes, La Chapelle-Saint-Luc, La Rivière-de-Corps.',
+    quartiers: ['Centre-ville', 'Les Noës-près-Troyes', 'La Chapelle-Saint-Luc', 'La Rivière-de-Corps', 'Saint-André-les-Vergers', 'Troyes', 'Rosières-près-Troyes'],
+  },
+  'saint-julien-les-villas': {
+    description: 'Trouvez des artisans qualifiés à Saint-Julien-les-Villas (Aube). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nogent-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Nogent-sur-Seine (Aube). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-sainte-marie': {
+    description: 'Trouvez des artisans qualifiés à Pont-Sainte-Marie (Aube). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,41 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  narbonne: { description: 'Ville romaine du Languedoc.', quartiers: ['Centre-ville', 'Saint-Jean-Saint-Pierre', 'Razimbaud', 'Narbonne-Plage'] },
+  carcassonne: { description: 'Cité médiévale UNESCO.', quartiers: ['La Cité', 'Bastide Saint-Louis', 'Grazailles', 'Montredon'] },
+  castelnaudary: {
+    description: 'Castelnaudary est une commune de 12 000 habitants située dans le département Aude en Occitanie. Nos artisans qualifiés interviennent à Castelnaudary, ainsi que Bram, Montréal pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bram', 'Montréal'],
+  },
+  limoux: {
+    description: 'Découvrez les meilleurs artisans à Limoux en Aude. Avec le sud de la France et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Palaja, Montréal, Quillan.',
+    quartiers: ['Centre-ville', 'Palaja', 'Montréal', 'Quillan', 'Carcassonne', 'Pennautier', 'Villemoustaussou'],
+  },
+  'lezignan-corbieres': {
+    description: 'Besoin d’un professionnel à Lézignan-Corbières ? Située en Occitanie, cette commune du Aude bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Nazaire-d\'Aude, Saint-Marcel-sur-Aude, Sallèles-d\'Aude.',
+    quartiers: ['Centre-ville', 'Saint-Nazaire-d\'Aude', 'Saint-Marcel-sur-Aude', 'Sallèles-d\'Aude', 'Moussan', 'Argeliers', 'Ouveillan'],
+  },
+  'port-la-nouvelle': {
+    description: 'Trouvez des artisans qualifiés à Port-la-Nouvelle (Aude). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coursan: {
+    description: 'Trouvez des artisans qualifiés à Coursan (Aude). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sigean: {
+    description: 'Trouvez des artisans qualifiés à Sigean (Aude). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  trebes: {
+    description: 'Trouvez des artisans qualifiés à Trèbes (Aude). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gruissan: {
+    description: 'Trouvez des artisans qualifiés à Gruissan (Aude). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
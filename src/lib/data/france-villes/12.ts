@@ -0,0 +1,32 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  rodez: { description: 'Ville du musée Soulages.', quartiers: ['Centre-ville', 'Bourran', 'Saint-Éloi', 'Olemps'] },
+  millau: {
+    description: 'Artisans référencés à Millau et ses environs. Cette ville active occitane de 22 000 habitants en Aveyron compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Cavalerie, Sévérac d\'Aveyron.',
+    quartiers: ['Centre-ville', 'La Cavalerie', 'Sévérac d\'Aveyron'],
+  },
+  'onet-le-chateau': {
+    description: 'Onet-le-Château (Aveyron, Occitanie) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Rodez, Olemps, Le Monastère.',
+    quartiers: ['Centre-ville', 'Rodez', 'Olemps', 'Le Monastère', 'Sébazac-Concourès', 'Druelle Balsac', 'Salles-la-Source'],
+  },
+  'villefranche-de-rouergue': {
+    description: 'Artisans référencés à Villefranche-de-Rouergue et ses environs. Cette commune occitane de 11 000 habitants en Aveyron compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Rignac, Capdenac-Gare.',
+    quartiers: ['Centre-ville', 'Rignac', 'Capdenac-Gare'],
+  },
+  'saint-affrique': {
+    description: 'Trouvez des artisans qualifiés à Saint-Affrique (Aveyron). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'luc-la-primaube': {
+    description: 'Trouvez des artisans qualifiés à Luc-la-Primaube (Aveyron). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  decazeville: {
+    description: 'Trouvez des artisans qualifiés à Decazeville (Aveyron). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,276 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  marseille: {
+    description: 'Deuxième ville de France, Marseille est un port méditerranéen dynamique. Trouvez des artisans qualifiés dans tous les quartiers marseillais.',
+    quartiers: ['Vieux-Port', 'Le Panier', 'La Joliette', 'Castellane', 'La Canebière', 'Prado', 'Bonneveine', 'Les Calanques'],
+  },
+  'aix-en-provence': { description: 'Ville d\'art, d\'eau et de lumière en Provence.', quartiers: ['Centre historique', 'Cours Mirabeau', 'Mazarin', 'Jas de Bouffan'] },
+  arles: {
+    description: 'Plus grande commune de France, patrimoine UNESCO.',
+    quartiers: ['Centre historique', 'Trinquetaille', 'Barriol', 'Pont de Crau', 'Griffeuille', 'Trébon', 'Monplaisir'],
+  },
+  martigues: {
+    description: 'Trouvez un artisan de confiance à Martigues (Bouches-du-Rhône). Avec 48 000 habitants, cette ville dynamique provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Port-de-Bouc, Sausset-les-Pins, Châteauneuf-les-Martigues.',
+    quartiers: ['Centre-ville', 'Port-de-Bouc', 'Sausset-les-Pins', 'Châteauneuf-les-Martigues', 'Saint-Mitre-les-Remparts', 'Carry-le-Rouet', 'Ensuès-la-Redonne'],
+  },
+  aubagne: {
+    description: 'À Aubagne, ville dynamique du Bouches-du-Rhône (48 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Carnoux-en-Provence, La Penne-sur-Huveaune, Roquevaire.',
+    quartiers: ['Centre-ville', 'Carnoux-en-Provence', 'La Penne-sur-Huveaune', 'Roquevaire', 'Roquefort-la-Bédoule', 'Gémenos', 'Cassis'],
+  },
+  istres: {
+    description: 'Besoin d’un professionnel à Istres ? Située en Provence-Alpes-Côte d\'Azur, cette ville dynamique du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Miramas, Saint-Martin-de-Crau, Saint-Chamas.',
+    quartiers: ['Centre-ville', 'Miramas', 'Saint-Martin-de-Crau', 'Saint-Chamas', 'Fos-sur-Mer', 'Grans', 'Saint-Mitre-les-Remparts'],
+  },
+  'salon-de-provence': {
+    description: 'Besoin d’un professionnel à Salon-de-Provence ? Située en Provence-Alpes-Côte d\'Azur, cette ville dynamique du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Grans, Eyguières, Miramas.',
+    quartiers: ['Centre-ville', 'Grans', 'Eyguières', 'Miramas', 'Lamanon', 'Pélissanne', 'Sénas'],
+  },
+  'la-ciotat': {
+    description: 'Trouvez un artisan de confiance à La Ciotat (Bouches-du-Rhône). Avec 38 000 habitants, cette ville dynamique provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ceyreste, Cassis, Roquefort-la-Bédoule.',
+    quartiers: ['Centre-ville', 'Ceyreste', 'Cassis', 'Roquefort-la-Bédoule', 'Carnoux-en-Provence', 'Aubagne', 'Gémenos'],
+  },
+  vitrolles: {
+    description: 'Artisans référencés à Vitrolles et ses environs. Cette ville dynamique provençale de 37 000 habitants en Bouches-du-Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Victoret, Marignane, Rognac.',
+    quartiers: ['Centre-ville', 'Saint-Victoret', 'Marignane', 'Rognac', 'Cabriès', 'Les Pennes-Mirabeau', 'Gignac-la-Nerthe'],
+  },
+  marignane: {
+    description: 'Besoin d’un professionnel à Marignane ? Située en Provence-Alpes-Côte d\'Azur, cette ville dynamique du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Victoret, Gignac-la-Nerthe, Vitrolles.',
+    quartiers: ['Centre-ville', 'Saint-Victoret', 'Gignac-la-Nerthe', 'Vitrolles', 'Châteauneuf-les-Martigues', 'Le Rove', 'Ensuès-la-Redonne'],
+  },
+  miramas: {
+    description: 'Besoin d’un professionnel à Miramas ? Située en Provence-Alpes-Côte d\'Azur, cette ville active du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Grans, Saint-Chamas, Istres.',
+    quartiers: ['Centre-ville', 'Grans', 'Saint-Chamas', 'Istres', 'Salon-de-Provence', 'Saint-Martin-de-Crau', 'Lançon-Provence'],
+  },
+  'les-pennes-mirabeau': {
+    description: 'Les Pennes-Mirabeau est une ville active de 23 000 habitants située dans le département Bouches-du-Rhône en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Les Pennes-Mirabeau, ainsi que Septèmes-les-Vallons, Saint-Victoret, Cabriès pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Septèmes-les-Vallons', 'Saint-Victoret', 'Cabriès', 'Vitrolles', 'Le Rove', 'Gignac-la-Nerthe'],
+  },
+  gardanne: {
+    description: 'Gardanne est une ville active de 22 000 habitants située dans le département Bouches-du-Rhône en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Gardanne, ainsi que Meyreuil, Mimet, Fuveau pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Meyreuil', 'Mimet', 'Fuveau', 'Bouc-Bel-Air', 'Gréasque', 'Simiane-Collongue'],
+  },
+  allauch: {
+    description: 'Besoin d’un professionnel à Allauch ? Située en Provence-Alpes-Côte d\'Azur, cette ville active du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Plan-de-Cuques, Cadolive, Saint-Savournin.',
+    quartiers: ['Centre-ville', 'Plan-de-Cuques', 'Cadolive', 'Saint-Savournin', 'Peypin', 'Mimet', 'Roquevaire'],
+  },
+  'chateauneuf-les-martigues': {
+    description: 'Trouvez un artisan de confiance à Châteauneuf-les-Martigues (Bouches-du-Rhône). Avec 18 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Carry-le-Rouet, Ensuès-la-Redonne, Sausset-les-Pins.',
+    quartiers: ['Centre-ville', 'Carry-le-Rouet', 'Ensuès-la-Redonne', 'Sausset-les-Pins', 'Marignane', 'Gignac-la-Nerthe', 'Martigues'],
+  },
+  chateaurenard: {
+    description: 'Châteaurenard est une commune de 17 000 habitants située dans le département Bouches-du-Rhône en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Châteaurenard, ainsi que Rognonas, Eyragues, Noves pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Rognonas', 'Eyragues', 'Noves', 'Graveson', 'Barbentane', 'Maillane'],
+  },
+  'fos-sur-mer': {
+    description: 'Fos-sur-Mer est une commune de 16 000 habitants située dans le département Bouches-du-Rhône en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Fos-sur-Mer, ainsi que Port-Saint-Louis-du-Rhône, Port-de-Bouc, Saint-Mitre-les-Remparts pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Port-Saint-Louis-du-Rhône', 'Port-de-Bouc', 'Saint-Mitre-les-Remparts', 'Istres', 'Martigues', 'Saint-Chamas'],
+  },
+  'port-de-bouc': {
+    description: 'Trouvez un artisan de confiance à Port-de-Bouc (Bouches-du-Rhône). Avec 16 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Mitre-les-Remparts, Martigues, Fos-sur-Mer.',
+    quartiers: ['Centre-ville', 'Saint-Mitre-les-Remparts', 'Martigues', 'Fos-sur-Mer', 'Châteauneuf-les-Martigues', 'Sausset-les-Pins', 'Port-Saint-Louis-du-Rhône'],
+  },
+  tarascon: {
+    description: 'À Tarascon, commune du Bouches-du-Rhône (15 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Saint-Étienne-du-Grès, Fontvieille, Maillane.',
+    quartiers: ['Centre-ville', 'Saint-Étienne-du-Grès', 'Fontvieille', 'Maillane', 'Graveson', 'Barbentane', 'Paradou'],
+  },
+  'bouc-bel-air': {
+    description: 'Besoin d’un professionnel à Bouc-Bel-Air ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Simiane-Collongue, Cabriès, Septèmes-les-Vallons.',
+    quartiers: ['Centre-ville', 'Simiane-Collongue', 'Cabriès', 'Septèmes-les-Vallons', 'Gardanne', 'Mimet', 'Meyreuil'],
+  },
+  'saint-martin-de-crau': {
+    description: 'Saint-Martin-de-Crau (Bouches-du-Rhône, Provence-Alpes-Côte d\'Azur) est une commune de 14 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Istres, Mouriès, Miramas.',
+    quartiers: ['Centre-ville', 'Istres', 'Mouriès', 'Miramas', 'Maussane-les-Alpilles', 'Paradou', 'Grans'],
+  },
+  'berre-l-etang': {
+    description: 'À Berre-l\'Étang, commune du Bouches-du-Rhône (14 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Rognac, La Fare-les-Oliviers, Velaux.',
+    quartiers: ['Centre-ville', 'Rognac', 'La Fare-les-Oliviers', 'Velaux', 'Lançon-Provence', 'Saint-Chamas', 'Marignane'],
+  },
+  auriol: {
+    description: 'Artisans référencés à Auriol et ses environs. Cette commune provençale de 13 000 habitants en Bouches-du-Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Bouilladisse, Roquevaire, La Destrousse.',
+    quartiers: ['Centre-ville', 'La Bouilladisse', 'Roquevaire', 'La Destrousse', 'Gémenos', 'Peypin', 'Belcodène'],
+  },
+  rognac: {
+    description: 'Besoin d’un professionnel à Rognac ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Velaux, Berre-l\'Étang, Vitrolles.',
+    quartiers: ['Centre-ville', 'Velaux', 'Berre-l\'Étang', 'Vitrolles', 'La Fare-les-Oliviers', 'Coudoux', 'Ventabren'],
+  },
+  'septemes-les-vallons': {
+    description: 'Découvrez les meilleurs artisans à Septèmes-les-Vallons en Bouches-du-Rhône. Avec le climat méditerranéen et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Simiane-Collongue, Les Pennes-Mirabeau, Bouc-Bel-Air.',
+    quartiers: ['Centre-ville', 'Simiane-Collongue', 'Les Pennes-Mirabeau', 'Bouc-Bel-Air', 'Cabriès', 'Plan-de-Cuques', 'Mimet'],
+  },
+  'plan-de-cuques': {
+    description: 'Artisans référencés à Plan-de-Cuques et ses environs. Cette commune provençale de 12 000 habitants en Bouches-du-Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Allauch, Mimet, Simiane-Collongue.',
+    quartiers: ['Centre-ville', 'Allauch', 'Mimet', 'Simiane-Collongue', 'Cadolive', 'Saint-Savournin', 'Septèmes-les-Vallons'],
+  },
+  pelissanne: {
+    description: 'Découvrez les meilleurs artisans à Pélissanne en Bouches-du-Rhône. Avec le climat méditerranéen et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Vernègues, Lançon-Provence, Lambesc.',
+    quartiers: ['Centre-ville', 'Vernègues', 'Lançon-Provence', 'Lambesc', 'Alleins', 'La Fare-les-Oliviers', 'Salon-de-Provence'],
+  },
+  trets: {
+    description: 'Besoin d’un professionnel à Trets ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Bouches-du-Rhône bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Peynier, Rousset, La Bouilladisse.',
+    quartiers: ['Centre-ville', 'Peynier', 'Rousset', 'La Bouilladisse', 'Auriol', 'Belcodène', 'La Destrousse'],
+  },
+  'gignac-la-nerthe': {
+    description: 'Découvrez les meilleurs artisans à Gignac-la-Nerthe en Bouches-du-Rhône. Avec le climat méditerranéen et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Le Rove, Saint-Victoret, Marignane.',
+    quartiers: ['Centre-ville', 'Le Rove', 'Saint-Victoret', 'Marignane', 'Ensuès-la-Redonne', 'Châteauneuf-les-Martigues', 'Les Pennes-Mirabeau'],
+  },
+  fuveau: {
+    description: 'Artisans référencés à Fuveau et ses environs. Cette commune provençale de 10 000 habitants en Bouches-du-Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Gréasque, Châteauneuf-le-Rouge, Belcodène.',
+    quartiers: ['Centre-ville', 'Gréasque', 'Châteauneuf-le-Rouge', 'Belcodène', 'Gardanne', 'Meyreuil', 'Peynier'],
+  },
+  cabries: {
+    description: 'Artisans référencés à Cabriès et ses environs. Cette commune provençale de 10 000 habitants en Bouches-du-Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Bouc-Bel-Air, Les Pennes-Mirabeau, Vitrolles.',
+    quartiers: ['Centre-ville', 'Bouc-Bel-Air', 'Les Pennes-Mirabeau', 'Vitrolles', 'Septèmes-les-Vallons', 'Simiane-Collongue', 'Saint-Victoret'],
+  },
+  lambesc: {
+    description: 'Vous habitez à Lambesc ou ses environs ? Nos artisans qualifiés du Bouches-du-Rhône sont disponibles pour tous vos travaux. Lambesc, commune provençale de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Vernègues, Charleval, Saint-Cannat.',
+    quartiers: ['Centre-ville', 'Vernègues', 'Charleval', 'Saint-Cannat', 'Pélissanne', 'La Roque-d\'Anthéron', 'Rognes'],
+  },
+  'lancon-provence': {
+    description: 'Trouvez des artisans qualifiés à Lançon-Provence (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-remy-de-provence': {
+    description: 'Trouvez des artisans qualifiés à Saint-Rémy-de-Provence (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-fare-les-oliviers': {
+    description: 'Trouvez des artisans qualifiés à La Fare-les-Oliviers (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  velaux: {
+    description: 'Trouvez des artisans qualifiés à Velaux (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  roquevaire: {
+    description: 'Trouvez des artisans qualifiés à Roquevaire (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-chamas': {
+    description: 'Trouvez des artisans qualifiés à Saint-Chamas (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'port-saint-louis-du-rhone': {
+    description: 'Trouvez des artisans qualifiés à Port-Saint-Louis-du-Rhône (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eguilles: {
+    description: 'Trouvez des artisans qualifiés à Éguilles (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  venelles: {
+    description: 'Trouvez des artisans qualifiés à Venelles (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sausset-les-pins': {
+    description: 'Trouvez des artisans qualifiés à Sausset-les-Pins (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eyguieres: {
+    description: 'Trouvez des artisans qualifiés à Eyguières (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  senas: {
+    description: 'Trouvez des artisans qualifiés à Sénas (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'carnoux-en-provence': {
+    description: 'Trouvez des artisans qualifiés à Carnoux-en-Provence (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  meyreuil: {
+    description: 'Trouvez des artisans qualifiés à Meyreuil (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-victoret': {
+    description: 'Trouvez des artisans qualifiés à Saint-Victoret (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cassis: {
+    description: 'Trouvez des artisans qualifiés à Cassis (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-penne-sur-huveaune': {
+    description: 'Trouvez des artisans qualifiés à La Penne-sur-Huveaune (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gemenos: {
+    description: 'Trouvez des artisans qualifiés à Gémenos (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-bouilladisse': {
+    description: 'Trouvez des artisans qualifiés à La Bouilladisse (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cuges-les-pins': {
+    description: 'Trouvez des artisans qualifiés à Cuges-les-Pins (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-mitre-les-remparts': {
+    description: 'Trouvez des artisans qualifiés à Saint-Mitre-les-Remparts (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mallemort: {
+    description: 'Trouvez des artisans qualifiés à Mallemort (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-cannat': {
+    description: 'Trouvez des artisans qualifiés à Saint-Cannat (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  noves: {
+    description: 'Trouvez des artisans qualifiés à Noves (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-puy-sainte-reparade': {
+    description: 'Trouvez des artisans qualifiés à Le Puy-Sainte-Réparade (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ventabren: {
+    description: 'Trouvez des artisans qualifiés à Ventabren (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'roquefort-la-bedoule': {
+    description: 'Trouvez des artisans qualifiés à Roquefort-la-Bédoule (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'simiane-collongue': {
+    description: 'Trouvez des artisans qualifiés à Simiane-Collongue (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  peypin: {
+    description: 'Trouvez des artisans qualifiés à Peypin (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ensues-la-redonne': {
+    description: 'Trouvez des artisans qualifiés à Ensuès-la-Redonne (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'carry-le-rouet': {
+    description: 'Trouvez des artisans qualifiés à Carry-le-Rouet (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  grans: {
+    description: 'Trouvez des artisans qualifiés à Grans (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-roque-d-antheron': {
+    description: 'Trouvez des artisans qualifiés à La Roque-d\'Anthéron (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rousset: {
+    description: 'Trouvez des artisans qualifiés à Rousset (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'peyrolles-en-provence': {
+    description: 'Trouvez des artisans qualifiés à Peyrolles-en-Provence (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-rove': {
+    description: 'Trouvez des artisans qualifiés à Le Rove (Bouches-du-Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,107 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  caen: {
+    description: 'Cité de Guillaume le Conquérant.',
+    quartiers: ['Centre-ville', 'Vaucelles', 'Calvaire Saint-Pierre', 'Beaulieu', 'Vaugueux', 'Saint-Jean', 'Grâce-de-Dieu', 'La Guérinière'],
+  },
+  'herouville-saint-clair': {
+    description: 'Vous habitez à Hérouville-Saint-Clair ou ses environs ? Nos artisans qualifiés du Calvados sont disponibles pour tous vos travaux. Hérouville-Saint-Clair, ville active normande de 23 000 habitants, mérite des professionnels à la hauteur, ainsi que Épron, Colombelles, Blainville-sur-Orne.',
+    quartiers: ['Centre-ville', 'Épron', 'Colombelles', 'Blainville-sur-Orne', 'Caen', 'Mondeville', 'Biéville-Beuville'],
+  },
+  lisieux: {
+    description: 'À Lisieux, commune du Calvados (20 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Valorbiquet, Livarot-Pays-d\'Auge, Pont-l\'Évêque.',
+    quartiers: ['Centre-ville', 'Valorbiquet', 'Livarot-Pays-d\'Auge', 'Pont-l\'Évêque', 'Mézidon Vallée d\'Auge', 'Dozulé', 'Saint-Pierre-en-Auge'],
+  },
+  'vire-normandie': {
+    description: 'À Vire Normandie, commune du Calvados (17 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Noues de Sienne, Valdallière, Souleuvre en Bocage.',
+    quartiers: ['Centre-ville', 'Noues de Sienne', 'Valdallière', 'Souleuvre en Bocage', 'Condé-en-Normandie', 'Les Monts d\'Aunay'],
+  },
+  bayeux: {
+    description: 'Découvrez les meilleurs artisans à Bayeux en Calvados. Avec le patrimoine historique et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Vigor-le-Grand, Creully sur Seulles, Le Molay-Littry.',
+    quartiers: ['Centre-ville', 'Saint-Vigor-le-Grand', 'Creully sur Seulles', 'Le Molay-Littry', 'Thue et Mue', 'Rots', 'Saint-Manvieu-Norrey'],
+  },
+  ifs: {
+    description: 'Besoin d’un professionnel à Ifs ? Située en Normandie, cette commune du Calvados bénéficie de des besoins en rénovation et étanchéité. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Cormelles-le-Royal, Fleury-sur-Orne, Mondeville.',
+    quartiers: ['Centre-ville', 'Cormelles-le-Royal', 'Fleury-sur-Orne', 'Mondeville', 'Soliers', 'Louvigny', 'Saint-Martin-de-May'],
+  },
+  mondeville: {
+    description: 'Vous habitez à Mondeville ou ses environs ? Nos artisans qualifiés du Calvados sont disponibles pour tous vos travaux. Mondeville, commune normande de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Giberville, Cormelles-le-Royal, Colombelles.',
+    quartiers: ['Centre-ville', 'Giberville', 'Cormelles-le-Royal', 'Colombelles', 'Ifs', 'Démouville', 'Cagny'],
+  },
+  'mezidon-vallee-d-auge': {
+    description: 'Trouvez des artisans qualifiés à Mézidon Vallée d\'Auge (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ouistreham: {
+    description: 'Trouvez des artisans qualifiés à Ouistreham (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'souleuvre-en-bocage': {
+    description: 'Trouvez des artisans qualifiés à Souleuvre en Bocage (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  falaise: {
+    description: 'Trouvez des artisans qualifiés à Falaise (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  colombelles: {
+    description: 'Trouvez des artisans qualifiés à Colombelles (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-en-auge': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-en-Auge (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  honfleur: {
+    description: 'Trouvez des artisans qualifiés à Honfleur (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'livarot-pays-d-auge': {
+    description: 'Trouvez des artisans qualifiés à Livarot-Pays-d\'Auge (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'thue-et-mue': {
+    description: 'Trouvez des artisans qualifiés à Thue et Mue (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'blainville-sur-orne': {
+    description: 'Trouvez des artisans qualifiés à Blainville-sur-Orne (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'conde-en-normandie': {
+    description: 'Trouvez des artisans qualifiés à Condé-en-Normandie (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'fleury-sur-orne': {
+    description: 'Trouvez des artisans qualifiés à Fleury-sur-Orne (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  valdalliere: {
+    description: 'Trouvez des artisans qualifiés à Valdallière (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cormelles-le-royal': {
+    description: 'Trouvez des artisans qualifiés à Cormelles-le-Royal (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-l-eveque': {
+    description: 'Trouvez des artisans qualifiés à Pont-l\'Évêque (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'douvres-la-delivrande': {
+    description: 'Trouvez des artisans qualifiés à Douvres-la-Délivrande (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'dives-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Dives-sur-Mer (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  giberville: {
+    description: 'Trouvez des artisans qualifiés à Giberville (Calvados). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
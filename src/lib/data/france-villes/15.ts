@@ -0,0 +1,19 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  aurillac: {
+    description: 'Aurillac (Cantal, Auvergne-Rhône-Alpes) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Naucelles, Arpajon-sur-Cère, Ytrac.',
+    quartiers: ['Centre-ville', 'Naucelles', 'Arpajon-sur-Cère', 'Ytrac', 'Jussac'],
+  },
+  'saint-flour': {
+    description: 'Trouvez des artisans qualifiés à Saint-Flour (Cantal). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'arpajon-sur-cere': {
+    description: 'Trouvez des artisans qualifiés à Arpajon-sur-Cère (Cantal). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,37 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  angouleme: { description: 'Capitale internationale de la bande dessinée.', quartiers: ['Centre-ville', 'Grande Garenne', 'Bel-Air', 'Sillac'] },
+  cognac: { description: 'Capitale mondiale du cognac.', quartiers: ['Centre-ville', 'Saint-Martin', 'Crouin', 'La Chaudronne'] },
+  soyaux: {
+    description: 'Trouvez un artisan de confiance à Soyaux (Charente). Avec 10 000 habitants, cette commune néo-aquitaine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que L\'Isle-d\'Espagnac, Magnac-sur-Touvre, Puymoyen.',
+    quartiers: ['Centre-ville', 'L\'Isle-d\'Espagnac', 'Magnac-sur-Touvre', 'Puymoyen', 'Garat', 'Angoulême', 'Gond-Pontouvre'],
+  },
+  'la-couronne': {
+    description: 'Trouvez des artisans qualifiés à La Couronne (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-yrieix-sur-charente': {
+    description: 'Trouvez des artisans qualifiés à Saint-Yrieix-sur-Charente (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ruelle-sur-touvre': {
+    description: 'Trouvez des artisans qualifiés à Ruelle-sur-Touvre (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gond-pontouvre': {
+    description: 'Trouvez des artisans qualifiés à Gond-Pontouvre (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'l-isle-d-espagnac': {
+    description: 'Trouvez des artisans qualifiés à L\'Isle-d\'Espagnac (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  champniers: {
+    description: 'Trouvez des artisans qualifiés à Champniers (Charente). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
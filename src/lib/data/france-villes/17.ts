@@ -0,0 +1,75 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'la-rochelle': { description: 'Port atlantique historique, ville écologique.', quartiers: ['Vieux Port', 'Minimes', 'Laleu', 'Mireuil', 'La Pallice', 'Villeneuve-les-Salines', 'Port-Neuf'] },
+  saintes: { description: 'Ville d\'art et d\'histoire romaine.', quartiers: ['Centre-ville', 'Saint-Pallais', 'Bellevue', 'Recouvrance'] },
+  rochefort: { description: 'Arsenal maritime historique.', quartiers: ['Centre-ville', 'Martrou', 'La Vieille Paroisse', 'Libération'] },
+  royan: { description: 'Station balnéaire de la côte atlantique.', quartiers: ['Centre-ville', 'Pontaillac', 'Foncillon', 'Conche du Chay'] },
+  aytre: {
+    description: 'Trouvez des artisans qualifiés à Aytré (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  perigny: {
+    description: 'Trouvez des artisans qualifiés à Périgny (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'tonnay-charente': {
+    description: 'Trouvez des artisans qualifiés à Tonnay-Charente (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lagord: {
+    description: 'Trouvez des artisans qualifiés à Lagord (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  saujon: {
+    description: 'Trouvez des artisans qualifiés à Saujon (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  surgeres: {
+    description: 'Trouvez des artisans qualifiés à Surgères (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jean-d-angely': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-d\'Angély (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  puilboreau: {
+    description: 'Trouvez des artisans qualifiés à Puilboreau (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatelaillon-plage': {
+    description: 'Trouvez des artisans qualifiés à Châtelaillon-Plage (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-d-oleron': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-d\'Oléron (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'dompierre-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Dompierre-sur-Mer (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marennes-hiers-brouage': {
+    description: 'Trouvez des artisans qualifiés à Marennes-Hiers-Brouage (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nieul-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Nieul-sur-Mer (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-xandre': {
+    description: 'Trouvez des artisans qualifiés à Saint-Xandre (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-georges-de-didonne': {
+    description: 'Trouvez des artisans qualifiés à Saint-Georges-de-Didonne (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-soulle': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Soulle (Charente-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,32 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  bourges: { description: 'Ville d\'art au cœur de la France.', quartiers: ['Centre historique', 'Asnières', 'Gibjoncs', 'Pignoux', 'Val-d\'Auron', 'Chancellerie', 'Aéroport'] },
+  vierzon: {
+    description: 'Vierzon (Cher, Centre-Val de Loire) est une ville active de 25 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Méreau, Foëcy, Vignoux-sur-Barangeon.',
+    quartiers: ['Centre-ville', 'Méreau', 'Foëcy', 'Vignoux-sur-Barangeon', 'Mehun-sur-Yèvre', 'Saint-Martin-d\'Auxigny'],
+  },
+  'saint-amand-montrond': {
+    description: 'Trouvez des artisans qualifiés à Saint-Amand-Montrond (Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-doulchard': {
+    description: 'Trouvez des artisans qualifiés à Saint-Doulchard (Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-florent-sur-cher': {
+    description: 'Trouvez des artisans qualifiés à Saint-Florent-sur-Cher (Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mehun-sur-yevre': {
+    description: 'Trouvez des artisans qualifiés à Mehun-sur-Yèvre (Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aubigny-sur-nere': {
+    description: 'Trouvez des artisans qualifiés à Aubigny-sur-Nère (Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,27 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'brive-la-gaillarde': {
+    description: 'Artisans référencés à Brive-la-Gaillarde et ses environs. Cette ville dynamique néo-aquitaine de 47 000 habitants en Corrèze compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Ussac, Cosnac, Saint-Pantaléon-de-Larche.',
+    quartiers: ['Centre-ville', 'Ussac', 'Cosnac', 'Saint-Pantaléon-de-Larche', 'Malemort', 'Varetz', 'Donzenac'],
+  },
+  tulle: {
+    description: 'Découvrez les meilleurs artisans à Tulle en Corrèze. Avec le sud-ouest atlantique et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Naves, Sainte-Féréole, Malemort.',
+    quartiers: ['Centre-ville', 'Naves', 'Sainte-Féréole', 'Malemort', 'Donzenac', 'Cosnac', 'Argentat-sur-Dordogne'],
+  },
+  ussel: {
+    description: 'Trouvez des artisans qualifiés à Ussel (Corrèze). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  malemort: {
+    description: 'Trouvez des artisans qualifiés à Malemort (Corrèze). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pantaleon-de-larche': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pantaléon-de-Larche (Corrèze). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,60 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  dijon: { description: 'Capitale des ducs de Bourgogne, ville gastronomique.', quartiers: ['Centre historique', 'Toison d\'Or', 'Fontaine d\'Ouche', 'Grésilles'] },
+  beaune: {
+    description: 'Beaune est une ville active de 20 000 habitants située dans le département Côte-d\'Or en Bourgogne-Franche-Comté. Nos artisans qualifiés interviennent à Beaune, ainsi que Nuits-Saint-Georges, Seurre, Gevrey-Chambertin pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Nuits-Saint-Georges', 'Seurre', 'Gevrey-Chambertin'],
+  },
+  chenove: {
+    description: 'Chenôve (Côte-d\'Or, Bourgogne-Franche-Comté) est une commune de 14 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Marsannay-la-Côte, Perrigny-lès-Dijon, Longvic.',
+    quartiers: ['Centre-ville', 'Marsannay-la-Côte', 'Perrigny-lès-Dijon', 'Longvic', 'Dijon', 'Talant', 'Plombières-lès-Dijon'],
+  },
+  talant: {
+    description: 'Artisans référencés à Talant et ses environs. Cette commune bourguignonne de 12 000 habitants en Côte-d\'Or compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Fontaine-lès-Dijon, Dijon, Plombières-lès-Dijon.',
+    quartiers: ['Centre-ville', 'Fontaine-lès-Dijon', 'Dijon', 'Plombières-lès-Dijon', 'Chenôve', 'Marsannay-la-Côte', 'Saint-Apollinaire'],
+  },
+  'chevigny-saint-sauveur': {
+    description: 'Trouvez un artisan de confiance à Chevigny-Saint-Sauveur (Côte-d\'Or). Avec 11 000 habitants, cette commune bourguignonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Sennecey-lès-Dijon, Quetigny, Neuilly-Crimolois.',
+    quartiers: ['Centre-ville', 'Sennecey-lès-Dijon', 'Quetigny', 'Neuilly-Crimolois', 'Saint-Apollinaire', 'Longvic', 'Varois-et-Chaignot'],
+  },
+  'fontaine-les-dijon': {
+    description: 'Trouvez des artisans qualifiés à Fontaine-lès-Dijon (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  quetigny: {
+    description: 'Trouvez des artisans qualifiés à Quetigny (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  longvic: {
+    description: 'Trouvez des artisans qualifiés à Longvic (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  auxonne: {
+    description: 'Trouvez des artisans qualifiés à Auxonne (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-apollinaire': {
+    description: 'Trouvez des artisans qualifiés à Saint-Apollinaire (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatillon-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Châtillon-sur-Seine (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marsannay-la-cote': {
+    description: 'Trouvez des artisans qualifiés à Marsannay-la-Côte (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nuits-saint-georges': {
+    description: 'Trouvez des artisans qualifiés à Nuits-Saint-Georges (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  genlis: {
+    description: 'Trouvez des artisans qualifiés à Genlis (Côte-d\'Or). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,76 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-brieuc': { description: 'Préfecture des Côtes-d\'Armor.', quartiers: ['Centre-ville', 'Cesson', 'Europe', 'Balzac'] },
+  lannion: {
+    description: 'Vous habitez à Lannion ou ses environs ? Nos artisans qualifiés du Côtes-d\'Armor sont disponibles pour tous vos travaux. Lannion, ville active bretonne de 20 000 habitants, mérite des professionnels à la hauteur, ainsi que Louannec, Ploubezre, Pleumeur-Bodou.',
+    quartiers: ['Centre-ville', 'Louannec', 'Ploubezre', 'Pleumeur-Bodou', 'Ploumilliau', 'Trébeurden', 'Trégastel'],
+  },
+  'lamballe-armor': {
+    description: 'Lamballe-Armor est une commune de 17 000 habitants située dans le département Côtes-d\'Armor en Bretagne. Nos artisans qualifiés interviennent à Lamballe-Armor, ainsi que Saint-Alban, Pommeret, Hillion pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Alban', 'Pommeret', 'Hillion', 'Pléneuf-Val-André', 'Quessoy', 'Yffiniac'],
+  },
+  dinan: {
+    description: 'Besoin d’un professionnel à Dinan ? Située en Bretagne, cette commune du Côtes-d\'Armor bénéficie de des besoins spécifiques liés au climat océanique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Quévert, Lanvallay, Trélivan.',
+    quartiers: ['Centre-ville', 'Quévert', 'Lanvallay', 'Trélivan', 'Taden', 'Pleslin-Trigavou', 'Plouër-sur-Rance'],
+  },
+  plerin: {
+    description: 'Découvrez les meilleurs artisans à Plérin en Côtes-d\'Armor. Avec le littoral atlantique et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Pordic, Saint-Brieuc, Trémuson.',
+    quartiers: ['Centre-ville', 'Pordic', 'Saint-Brieuc', 'Trémuson', 'Ploufragan', 'Langueux', 'Trégueux'],
+  },
+  ploufragan: {
+    description: 'Vous habitez à Ploufragan ou ses environs ? Nos artisans qualifiés du Côtes-d\'Armor sont disponibles pour tous vos travaux. Ploufragan, commune bretonne de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Brieuc, Trégueux, Saint-Julien.',
+    quartiers: ['Centre-ville', 'Saint-Brieuc', 'Trégueux', 'Saint-Julien', 'Trémuson', 'Plérin', 'Langueux'],
+  },
+  loudeac: {
+    description: 'Trouvez des artisans qualifiés à Loudéac (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tregueux: {
+    description: 'Trouvez des artisans qualifiés à Trégueux (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  langueux: {
+    description: 'Trouvez des artisans qualifiés à Langueux (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pordic: {
+    description: 'Trouvez des artisans qualifiés à Pordic (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  paimpol: {
+    description: 'Trouvez des artisans qualifiés à Paimpol (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'perros-guirec': {
+    description: 'Trouvez des artisans qualifiés à Perros-Guirec (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guingamp: {
+    description: 'Trouvez des artisans qualifiés à Guingamp (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'binic-etables-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Binic-Étables-sur-Mer (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pledran: {
+    description: 'Trouvez des artisans qualifiés à Plédran (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-mene': {
+    description: 'Trouvez des artisans qualifiés à Le Mené (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ploumagoar: {
+    description: 'Trouvez des artisans qualifiés à Ploumagoar (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  yffiniac: {
+    description: 'Trouvez des artisans qualifiés à Yffiniac (Côtes-d\'Armor). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,11 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  gueret: {
+    description: 'Guéret est une commune de 13 000 habitants située dans le département Creuse en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Guéret, ainsi que Sainte-Feyre pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sainte-Feyre'],
+  },
+}
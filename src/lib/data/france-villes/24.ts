@@ -0,0 +1,40 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  perigueux: { description: 'Capitale du Périgord.', quartiers: ['Centre historique', 'Boulazac', 'Chamiers', 'Churchill'] },
+  bergerac: {
+    description: 'À Bergerac, ville active du Dordogne (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Prigonrieux, Lamonzie-Saint-Martin, La Force.',
+    quartiers: ['Centre-ville', 'Prigonrieux', 'Lamonzie-Saint-Martin', 'La Force', 'Lalinde', 'Eymet', 'Port-Sainte-Foy-et-Ponchapt'],
+  },
+  'boulazac-isle-manoire': {
+    description: 'Trouvez un artisan de confiance à Boulazac Isle Manoire (Dordogne). Avec 11 000 habitants, cette commune néo-aquitaine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Sanilhac, Bassillac et Auberoche, Trélissac.',
+    quartiers: ['Centre-ville', 'Sanilhac', 'Bassillac et Auberoche', 'Trélissac', 'Périgueux', 'Coulounieix-Chamiers', 'Champcevinel'],
+  },
+  'sarlat-la-caneda': {
+    description: 'Trouvez des artisans qualifiés à Sarlat-la-Canéda (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'coulounieix-chamiers': {
+    description: 'Trouvez des artisans qualifiés à Coulounieix-Chamiers (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  trelissac: {
+    description: 'Trouvez des artisans qualifiés à Trélissac (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'terrasson-lavilledieu': {
+    description: 'Trouvez des artisans qualifiés à Terrasson-Lavilledieu (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montpon-menesterol': {
+    description: 'Trouvez des artisans qualifiés à Montpon-Ménestérol (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-astier': {
+    description: 'Trouvez des artisans qualifiés à Saint-Astier (Dordogne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
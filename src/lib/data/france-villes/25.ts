@@ -0,0 +1,53 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  besancon: { description: 'Capitale de l\'horlogerie française, ville verte.', quartiers: ['Centre-ville', 'Battant', 'Planoise', 'Palente', 'Bregille'] },
+  montbeliard: { description: 'Ville industrielle et culturelle.', quartiers: ['Centre-ville', 'Petite Hollande', 'Chiffogne', 'Les Fougères'] },
+  pontarlier: {
+    description: 'Pontarlier est une commune de 18 000 habitants située dans le département Doubs en Bourgogne-Franche-Comté. Nos artisans qualifiés interviennent à Pontarlier, ainsi que Doubs, Val-d\'Usiers, Levier pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Doubs', 'Val-d\'Usiers', 'Levier', 'Montlebon', 'Morteau', 'Orchamps-Vennes'],
+  },
+  audincourt: {
+    description: 'Découvrez les meilleurs artisans à Audincourt en Doubs. Avec le cœur de la France et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Valentigney, Seloncourt, Exincourt.',
+    quartiers: ['Centre-ville', 'Valentigney', 'Seloncourt', 'Exincourt', 'Étupes', 'Sochaux', 'Voujeaucourt'],
+  },
+  valentigney: {
+    description: 'Découvrez les meilleurs artisans à Valentigney en Doubs. Avec le cœur de la France et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Audincourt, Voujeaucourt, Seloncourt.',
+    quartiers: ['Centre-ville', 'Audincourt', 'Voujeaucourt', 'Seloncourt', 'Mandeure', 'Exincourt', 'Mathay'],
+  },
+  morteau: {
+    description: 'Trouvez des artisans qualifiés à Morteau (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'grand-charmont': {
+    description: 'Trouvez des artisans qualifiés à Grand-Charmont (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  seloncourt: {
+    description: 'Trouvez des artisans qualifiés à Seloncourt (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  valdahon: {
+    description: 'Trouvez des artisans qualifiés à Valdahon (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bethoncourt: {
+    description: 'Trouvez des artisans qualifiés à Bethoncourt (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villers-le-lac': {
+    description: 'Trouvez des artisans qualifiés à Villers-le-Lac (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'baume-les-dames': {
+    description: 'Trouvez des artisans qualifiés à Baume-les-Dames (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-vit': {
+    description: 'Trouvez des artisans qualifiés à Saint-Vit (Doubs). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
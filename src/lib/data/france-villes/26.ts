@@ -0,0 +1,80 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  valence: { description: 'Porte du Midi sur le Rhône.', quartiers: ['Centre-ville', 'Fontbarlettes', 'Chamberlière', 'Le Plan'] },
+  montelimar: {
+    description: 'Artisans référencés à Montélimar et ses environs. Cette ville dynamique rhônalpine de 41 000 habitants en Drôme compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Montboucher-sur-Jabron, Châteauneuf-du-Rhône, Malataverne.',
+    quartiers: ['Centre-ville', 'Montboucher-sur-Jabron', 'Châteauneuf-du-Rhône', 'Malataverne', 'Donzère', 'Grane', 'Pierrelatte'],
+  },
+  'romans-sur-isere': {
+    description: 'Vous habitez à Romans-sur-Isère ou ses environs ? Nos artisans qualifiés du Drôme sont disponibles pour tous vos travaux. Romans-sur-Isère, ville dynamique rhônalpine de 33 000 habitants, mérite des professionnels à la hauteur, ainsi que Mours-Saint-Eusèbe, Peyrins, Génissieux.',
+    quartiers: ['Centre-ville', 'Mours-Saint-Eusèbe', 'Peyrins', 'Génissieux', 'Bourg-de-Péage', 'Chatuzange-le-Goubet', 'Alixan'],
+  },
+  'bourg-les-valence': {
+    description: 'Découvrez les meilleurs artisans à Bourg-lès-Valence en Drôme. Avec les Alpes et la vallée du Rhône et 20 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Marcel-lès-Valence, Valence, La Roche-de-Glun.',
+    quartiers: ['Centre-ville', 'Saint-Marcel-lès-Valence', 'Valence', 'La Roche-de-Glun', 'Pont-de-l\'Isère', 'Châteauneuf-sur-Isère', 'Malissard'],
+  },
+  pierrelatte: {
+    description: 'Trouvez un artisan de confiance à Pierrelatte (Drôme). Avec 14 000 habitants, cette commune rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Paul-Trois-Châteaux, Donzère, Malataverne.',
+    quartiers: ['Centre-ville', 'Saint-Paul-Trois-Châteaux', 'Donzère', 'Malataverne', 'Suze-la-Rousse', 'Châteauneuf-du-Rhône', 'Montélimar'],
+  },
+  'portes-les-valence': {
+    description: 'Artisans référencés à Portes-lès-Valence et ses environs. Cette commune rhônalpine de 10 000 habitants en Drôme compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Étoile-sur-Rhône, Beaumont-lès-Valence, Valence.',
+    quartiers: ['Centre-ville', 'Étoile-sur-Rhône', 'Beaumont-lès-Valence', 'Valence', 'Malissard', 'Montmeyran', 'Bourg-lès-Valence'],
+  },
+  'bourg-de-peage': {
+    description: 'Trouvez des artisans qualifiés à Bourg-de-Péage (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'livron-sur-drome': {
+    description: 'Trouvez des artisans qualifiés à Livron-sur-Drôme (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-paul-trois-chateaux': {
+    description: 'Trouvez des artisans qualifiés à Saint-Paul-Trois-Châteaux (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  crest: {
+    description: 'Trouvez des artisans qualifiés à Crest (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-rambert-d-albon': {
+    description: 'Trouvez des artisans qualifiés à Saint-Rambert-d\'Albon (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chabeuil: {
+    description: 'Trouvez des artisans qualifiés à Chabeuil (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nyons: {
+    description: 'Trouvez des artisans qualifiés à Nyons (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'loriol-sur-drome': {
+    description: 'Trouvez des artisans qualifiés à Loriol-sur-Drôme (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatuzange-le-goubet': {
+    description: 'Trouvez des artisans qualifiés à Chatuzange-le-Goubet (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-marcel-les-valence': {
+    description: 'Trouvez des artisans qualifiés à Saint-Marcel-lès-Valence (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  donzere: {
+    description: 'Trouvez des artisans qualifiés à Donzère (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'tain-l-hermitage': {
+    description: 'Trouvez des artisans qualifiés à Tain-l\'Hermitage (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'etoile-sur-rhone': {
+    description: 'Trouvez des artisans qualifiés à Étoile-sur-Rhône (Drôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,64 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  evreux: { description: 'Préfecture de l\'Eure, ville historique.', quartiers: ['Centre-ville', 'Navarre', 'La Madeleine', 'Saint-Michel'] },
+  vernon: {
+    description: 'Vernon est une ville active de 25 000 habitants située dans le département Eure en Normandie. Nos artisans qualifiés interviennent à Vernon, ainsi que Saint-Marcel, La Chapelle-Longueville, Gasny pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Marcel', 'La Chapelle-Longueville', 'Gasny', 'Pacy-sur-Eure', 'Vexin-sur-Epte', 'Saint-Aubin-sur-Gaillon'],
+  },
+  louviers: {
+    description: 'Trouvez un artisan de confiance à Louviers (Eure). Avec 19 000 habitants, cette commune normande dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Vaudreuil, Val-de-Reuil, Pont-de-l\'Arche.',
+    quartiers: ['Centre-ville', 'Le Vaudreuil', 'Val-de-Reuil', 'Pont-de-l\'Arche', 'Pîtres', 'Le Val d\'Hazey', 'Clef Vallée d\'Eure'],
+  },
+  'val-de-reuil': {
+    description: 'Vous habitez à Val-de-Reuil ou ses environs ? Nos artisans qualifiés du Eure sont disponibles pour tous vos travaux. Val-de-Reuil, commune normande de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Le Vaudreuil, Pont-de-l\'Arche, Louviers.',
+    quartiers: ['Centre-ville', 'Le Vaudreuil', 'Pont-de-l\'Arche', 'Louviers', 'Pîtres', 'Romilly-sur-Andelle', 'Le Val d\'Hazey'],
+  },
+  gisors: {
+    description: 'Vous habitez à Gisors ou ses environs ? Nos artisans qualifiés du Eure sont disponibles pour tous vos travaux. Gisors, commune normande de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Étrépagny, Vexin-sur-Epte, Gasny.',
+    quartiers: ['Centre-ville', 'Étrépagny', 'Vexin-sur-Epte', 'Gasny'],
+  },
+  'pont-audemer': {
+    description: 'Trouvez un artisan de confiance à Pont-Audemer (Eure). Avec 10 000 habitants, cette commune normande dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Beuzeville, Bourg-Achard, Brionne.',
+    quartiers: ['Centre-ville', 'Beuzeville', 'Bourg-Achard', 'Brionne', 'Grand Bourgtheroulde'],
+  },
+  bernay: {
+    description: 'Trouvez des artisans qualifiés à Bernay (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-andelys': {
+    description: 'Trouvez des artisans qualifiés à Les Andelys (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'verneuil-d-avre-et-d-iton': {
+    description: 'Trouvez des artisans qualifiés à Verneuil d\'Avre et d\'Iton (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gaillon: {
+    description: 'Trouvez des artisans qualifiés à Gaillon (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mesnils-sur-iton': {
+    description: 'Trouvez des artisans qualifiés à Mesnils-sur-Iton (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vexin-sur-epte': {
+    description: 'Trouvez des artisans qualifiés à Vexin-sur-Epte (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-sebastien-de-morsent': {
+    description: 'Trouvez des artisans qualifiés à Saint-Sébastien-de-Morsent (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-val-d-hazey': {
+    description: 'Trouvez des artisans qualifiés à Le Val d\'Hazey (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pacy-sur-eure': {
+    description: 'Trouvez des artisans qualifiés à Pacy-sur-Eure (Eure). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,52 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  chartres: { description: 'Ville de la cathédrale, capitale de la Beauce.', quartiers: ['Centre-ville', 'Beaulieu', 'La Madeleine', 'Rechèvres'] },
+  dreux: {
+    description: 'Dreux est une ville dynamique de 32 000 habitants située dans le département Eure-et-Loir en Centre-Val de Loire. Nos artisans qualifiés interviennent à Dreux, ainsi que Vernouillet, Abondant, Saint-Rémy-sur-Avre pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Vernouillet', 'Abondant', 'Saint-Rémy-sur-Avre', 'Bû', 'Saint-Lubin-des-Joncherets', 'Anet'],
+  },
+  luce: {
+    description: 'Lucé (Eure-et-Loir, Centre-Val de Loire) est une commune de 16 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Luisant, Mainvilliers, Le Coudray.',
+    quartiers: ['Centre-ville', 'Luisant', 'Mainvilliers', 'Le Coudray', 'Chartres', 'Lèves', 'Champhol'],
+  },
+  chateaudun: {
+    description: 'À Châteaudun, commune du Eure-et-Loir (13 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural exceptionnel, nos professionnels interviennent dans toute la commune, ainsi que Saint-Denis-Lanneray, Cloyes-les-Trois-Rivières, Bonneval.',
+    quartiers: ['Centre-ville', 'Saint-Denis-Lanneray', 'Cloyes-les-Trois-Rivières', 'Bonneval', 'Vald\'Yerre', 'Brou'],
+  },
+  vernouillet: {
+    description: 'Trouvez un artisan de confiance à Vernouillet (Eure-et-Loir). Avec 12 000 habitants, cette commune du Centre dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Dreux, Saint-Rémy-sur-Avre, Abondant.',
+    quartiers: ['Centre-ville', 'Dreux', 'Saint-Rémy-sur-Avre', 'Abondant', 'Saint-Lubin-des-Joncherets', 'Tremblay-les-Villages', 'Bû'],
+  },
+  mainvilliers: {
+    description: 'Vous habitez à Mainvilliers ou ses environs ? Nos artisans qualifiés du Eure-et-Loir sont disponibles pour tous vos travaux. Mainvilliers, commune du Centre de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Lèves, Lucé, Chartres.',
+    quartiers: ['Centre-ville', 'Lèves', 'Lucé', 'Chartres', 'Luisant', 'Champhol', 'Saint-Prest'],
+  },
+  'nogent-le-rotrou': {
+    description: 'Trouvez des artisans qualifiés à Nogent-le-Rotrou (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  luisant: {
+    description: 'Trouvez des artisans qualifiés à Luisant (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'auneau-bleury-saint-symphorien': {
+    description: 'Trouvez des artisans qualifiés à Auneau-Bleury-Saint-Symphorien (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  epernon: {
+    description: 'Trouvez des artisans qualifiés à Épernon (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  leves: {
+    description: 'Trouvez des artisans qualifiés à Lèves (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cloyes-les-trois-rivieres': {
+    description: 'Trouvez des artisans qualifiés à Cloyes-les-Trois-Rivières (Eure-et-Loir). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,149 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  brest: { description: 'Grand port breton, ville maritime par excellence.', quartiers: ['Centre-ville', 'Recouvrance', 'Saint-Marc', 'Lambézellec', 'Bellevue'] },
+  quimper: { description: 'Capitale de la Cornouaille bretonne.', quartiers: ['Centre historique', 'Ergué-Armel', 'Penhars', 'Kerfeunteun', 'Moulin-Vert', 'Locmaria', 'Creac\'h Gwen'] },
+  concarneau: {
+    description: 'Vous habitez à Concarneau ou ses environs ? Nos artisans qualifiés du Finistère sont disponibles pour tous vos travaux. Concarneau, ville active bretonne de 21 000 habitants, mérite des professionnels à la hauteur, ainsi que Melgven, La Forêt-Fouesnant, Saint-Yvi.',
+    quartiers: ['Centre-ville', 'Melgven', 'La Forêt-Fouesnant', 'Saint-Yvi', 'Trégunc', 'Rosporden', 'Pont-Aven'],
+  },
+  landerneau: {
+    description: 'Vous habitez à Landerneau ou ses environs ? Nos artisans qualifiés du Finistère sont disponibles pour tous vos travaux. Landerneau, commune bretonne de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Pencran, La Forest-Landerneau, Plouédern.',
+    quartiers: ['Centre-ville', 'Pencran', 'La Forest-Landerneau', 'Plouédern', 'Dirinon', 'Ploudaniel', 'Loperhet'],
+  },
+  guipavas: {
+    description: 'Guipavas est une commune de 16 000 habitants située dans le département Finistère en Bretagne. Nos artisans qualifiés interviennent à Guipavas, ainsi que Le Relecq-Kerhuon, Gouesnou, La Forest-Landerneau pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Relecq-Kerhuon', 'Gouesnou', 'La Forest-Landerneau', 'Plougastel-Daoulas', 'Brest', 'Plabennec'],
+  },
+  morlaix: {
+    description: 'Artisans référencés à Morlaix et ses environs. Cette commune bretonne de 15 000 habitants en Finistère compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Martin-des-Champs, Taulé, Plouigneau.',
+    quartiers: ['Centre-ville', 'Saint-Martin-des-Champs', 'Taulé', 'Plouigneau', 'Plourin-lès-Morlaix', 'Plougasnou', 'Lanmeur'],
+  },
+  douarnenez: {
+    description: 'À Douarnenez, commune du Finistère (14 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat en granit et ardoise, nos professionnels interviennent dans toute la commune, ainsi que Plogonnec, Plonéis, Plogastel-Saint-Germain.',
+    quartiers: ['Centre-ville', 'Plogonnec', 'Plonéis', 'Plogastel-Saint-Germain', 'Plozévet', 'Pouldreuzic', 'Plouhinec'],
+  },
+  plouzane: {
+    description: 'Besoin d’un professionnel à Plouzané ? Située en Bretagne, cette commune du Finistère bénéficie de des besoins spécifiques liés au climat océanique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Locmaria-Plouzané, Guilers, Saint-Renan.',
+    quartiers: ['Centre-ville', 'Locmaria-Plouzané', 'Guilers', 'Saint-Renan', 'Brest', 'Bohars', 'Ploumoguer'],
+  },
+  'plougastel-daoulas': {
+    description: 'Découvrez les meilleurs artisans à Plougastel-Daoulas en Finistère. Avec le littoral atlantique et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Le Relecq-Kerhuon, Loperhet, Guipavas.',
+    quartiers: ['Centre-ville', 'Le Relecq-Kerhuon', 'Loperhet', 'Guipavas', 'Logonna-Daoulas', 'Brest', 'La Forest-Landerneau'],
+  },
+  quimperle: {
+    description: 'Quimperlé est une commune de 12 000 habitants située dans le département Finistère en Bretagne. Nos artisans qualifiés interviennent à Quimperlé, ainsi que Mellac, Rédené, Tréméven pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Mellac', 'Rédené', 'Tréméven', 'Clohars-Carnoët', 'Moëlan-sur-Mer', 'Riec-sur-Bélon'],
+  },
+  'le-relecq-kerhuon': {
+    description: 'Découvrez les meilleurs artisans à Le Relecq-Kerhuon en Finistère. Avec le littoral atlantique et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Guipavas, Plougastel-Daoulas, Gouesnou.',
+    quartiers: ['Centre-ville', 'Guipavas', 'Plougastel-Daoulas', 'Gouesnou', 'Loperhet', 'Brest', 'La Forest-Landerneau'],
+  },
+  fouesnant: {
+    description: 'À Fouesnant, commune du Finistère (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat en granit et ardoise, nos professionnels interviennent dans toute la commune, ainsi que Bénodet, Clohars-Fouesnant, Pleuven.',
+    quartiers: ['Centre-ville', 'Bénodet', 'Clohars-Fouesnant', 'Pleuven', 'Gouesnach', 'La Forêt-Fouesnant', 'Combrit'],
+  },
+  landivisiau: {
+    description: 'Trouvez des artisans qualifiés à Landivisiau (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plabennec: {
+    description: 'Trouvez des artisans qualifiés à Plabennec (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ergue-gaberic': {
+    description: 'Trouvez des artisans qualifiés à Ergué-Gabéric (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-renan': {
+    description: 'Trouvez des artisans qualifiés à Saint-Renan (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-l-abbe': {
+    description: 'Trouvez des artisans qualifiés à Pont-l\'Abbé (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guilers: {
+    description: 'Trouvez des artisans qualifiés à Guilers (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lesneven: {
+    description: 'Trouvez des artisans qualifiés à Lesneven (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rosporden: {
+    description: 'Trouvez des artisans qualifiés à Rosporden (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  crozon: {
+    description: 'Trouvez des artisans qualifiés à Crozon (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'carhaix-plouguer': {
+    description: 'Trouvez des artisans qualifiés à Carhaix-Plouguer (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tregunc: {
+    description: 'Trouvez des artisans qualifiés à Trégunc (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pol-de-leon': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pol-de-Léon (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plouguerneau: {
+    description: 'Trouvez des artisans qualifiés à Plouguerneau (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'moelan-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Moëlan-sur-Mer (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ploudalmezeau: {
+    description: 'Trouvez des artisans qualifiés à Ploudalmézeau (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gouesnou: {
+    description: 'Trouvez des artisans qualifiés à Gouesnou (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ploneour-lanvern': {
+    description: 'Trouvez des artisans qualifiés à Plonéour-Lanvern (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  briec: {
+    description: 'Trouvez des artisans qualifiés à Briec (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bannalec: {
+    description: 'Trouvez des artisans qualifiés à Bannalec (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lannilis: {
+    description: 'Trouvez des artisans qualifiés à Lannilis (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  penmarch: {
+    description: 'Trouvez des artisans qualifiés à Penmarch (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  scaer: {
+    description: 'Trouvez des artisans qualifiés à Scaër (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'locmaria-plouzane': {
+    description: 'Trouvez des artisans qualifiés à Locmaria-Plouzané (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chateaulin: {
+    description: 'Trouvez des artisans qualifiés à Châteaulin (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plouigneau: {
+    description: 'Trouvez des artisans qualifiés à Plouigneau (Finistère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,12 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  ajaccio: { description: 'Cité impériale, ville natale de Napoléon.', quartiers: ['Centre-ville', 'Les Cannes', 'Mezzavia', 'Salines', 'Saint-Jean', 'Pietralba', 'Résidence des Îles'] },
+  'porto-vecchio': {
+    description: 'Besoin d’un professionnel à Porto-Vecchio ? Située en Corse, cette commune du Corse-du-Sud bénéficie de des artisans aux savoir-faire insulaires. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Lecci, Zonza, Bonifacio.',
+    quartiers: ['Centre-ville', 'Lecci', 'Zonza', 'Bonifacio'],
+  },
+}
@@ -0,0 +1,32 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  bastia: { description: 'Capitale économique de la Corse.', quartiers: ['Terra Vecchia', 'Terra Nova', 'Lupino', 'Paese Novo'] },
+  borgo: {
+    description: 'Trouvez un artisan de confiance à Borgo (Haute-Corse). Avec 10 000 habitants, cette commune corse dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Biguglia, Lucciana, Vescovato.',
+    quartiers: ['Centre-ville', 'Biguglia', 'Lucciana', 'Vescovato', 'Furiani', 'Bastia', 'Penta-di-Casinca'],
+  },
+  corte: {
+    description: 'Trouvez des artisans qualifiés à Corte (Haute-Corse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  biguglia: {
+    description: 'Trouvez des artisans qualifiés à Biguglia (Haute-Corse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lucciana: {
+    description: 'Trouvez des artisans qualifiés à Lucciana (Haute-Corse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  furiani: {
+    description: 'Trouvez des artisans qualifiés à Furiani (Haute-Corse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  calvi: {
+    description: 'Trouvez des artisans qualifiés à Calvi (Haute-Corse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
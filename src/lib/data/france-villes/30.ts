@@ -0,0 +1,113 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  nimes: { description: 'Rome française avec ses monuments antiques.', quartiers: ['Écusson', 'Gambetta', 'Costières', 'Mas de Mingue', 'Richelieu', 'Jean-Jaurès', 'Pissevin'] },
+  ales: { description: 'Porte des Cévennes.', quartiers: ['Centre-ville', 'Rochebelle', 'Clavières', 'Tamaris'] },
+  'bagnols-sur-ceze': {
+    description: 'Artisans référencés à Bagnols-sur-Cèze et ses environs. Cette commune occitane de 18 000 habitants en Gard compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Laudun-l\'Ardoise, Pont-Saint-Esprit, Saint-Victor-la-Coste.',
+    quartiers: ['Centre-ville', 'Laudun-l\'Ardoise', 'Pont-Saint-Esprit', 'Saint-Victor-la-Coste', 'Saint-Laurent-des-Arbres', 'Saint-Geniès-de-Comolas', 'Roquemaure'],
+  },
+  beaucaire: {
+    description: 'Trouvez un artisan de confiance à Beaucaire (Gard). Avec 16 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Jonquières-Saint-Vincent, Manduel, Redessan.',
+    quartiers: ['Centre-ville', 'Jonquières-Saint-Vincent', 'Manduel', 'Redessan', 'Bellegarde', 'Fourques', 'Montfrin'],
+  },
+  'saint-gilles': {
+    description: 'Artisans référencés à Saint-Gilles et ses environs. Cette commune occitane de 15 000 habitants en Gard compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Générac, Beauvoisin, Vauvert.',
+    quartiers: ['Centre-ville', 'Générac', 'Beauvoisin', 'Vauvert', 'Bellegarde', 'Fourques', 'Garons'],
+  },
+  'villeneuve-les-avignon': {
+    description: 'Besoin d’un professionnel à Villeneuve-lès-Avignon ? Située en Occitanie, cette commune du Gard bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Pujaut, Sauveterre, Les Angles.',
+    quartiers: ['Centre-ville', 'Pujaut', 'Sauveterre', 'Les Angles', 'Roquemaure', 'Saze', 'Rochefort-du-Gard'],
+  },
+  vauvert: {
+    description: 'Vauvert (Gard, Occitanie) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Cailar, Beauvoisin, Saint-Laurent-d\'Aigouze.',
+    quartiers: ['Centre-ville', 'Le Cailar', 'Beauvoisin', 'Saint-Laurent-d\'Aigouze', 'Saint-Gilles', 'Aimargues', 'Générac'],
+  },
+  'pont-saint-esprit': {
+    description: 'Trouvez un artisan de confiance à Pont-Saint-Esprit (Gard). Avec 11 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Bagnols-sur-Cèze, Laudun-l\'Ardoise, Saint-Geniès-de-Comolas.',
+    quartiers: ['Centre-ville', 'Bagnols-sur-Cèze', 'Laudun-l\'Ardoise', 'Saint-Geniès-de-Comolas', 'Saint-Victor-la-Coste', 'Saint-Laurent-des-Arbres', 'Roquemaure'],
+  },
+  'les-angles': {
+    description: 'Trouvez des artisans qualifiés à Les Angles (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aigues-mortes': {
+    description: 'Trouvez des artisans qualifiés à Aigues-Mortes (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-grau-du-roi': {
+    description: 'Trouvez des artisans qualifiés à Le Grau-du-Roi (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  uzes: {
+    description: 'Trouvez des artisans qualifiés à Uzès (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marguerittes: {
+    description: 'Trouvez des artisans qualifiés à Marguerittes (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'rochefort-du-gard': {
+    description: 'Trouvez des artisans qualifiés à Rochefort-du-Gard (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bellegarde: {
+    description: 'Trouvez des artisans qualifiés à Bellegarde (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-christol-lez-ales': {
+    description: 'Trouvez des artisans qualifiés à Saint-Christol-lez-Alès (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  manduel: {
+    description: 'Trouvez des artisans qualifiés à Manduel (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'laudun-l-ardoise': {
+    description: 'Trouvez des artisans qualifiés à Laudun-l\'Ardoise (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  calvisson: {
+    description: 'Trouvez des artisans qualifiés à Calvisson (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  milhaud: {
+    description: 'Trouvez des artisans qualifiés à Milhaud (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bouillargues: {
+    description: 'Trouvez des artisans qualifiés à Bouillargues (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beauvoisin: {
+    description: 'Trouvez des artisans qualifiés à Beauvoisin (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vergeze: {
+    description: 'Trouvez des artisans qualifiés à Vergèze (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aimargues: {
+    description: 'Trouvez des artisans qualifiés à Aimargues (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-privat-des-vieux': {
+    description: 'Trouvez des artisans qualifiés à Saint-Privat-des-Vieux (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  roquemaure: {
+    description: 'Trouvez des artisans qualifiés à Roquemaure (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  garons: {
+    description: 'Trouvez des artisans qualifiés à Garons (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sommieres: {
+    description: 'Trouvez des artisans qualifiés à Sommières (Gard). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
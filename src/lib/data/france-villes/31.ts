@@ -0,0 +1,200 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  toulouse: { description: 'La ville rose, capitale de l\'aéronautique française.', quartiers: ['Capitole', 'Saint-Cyprien', 'Carmes', 'Les Minimes', 'Saint-Michel', 'Rangueil', 'Blagnac'] },
+  colomiers: {
+    description: 'Colomiers (Haute-Garonne, Occitanie) est une ville dynamique de 41 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Tournefeuille, Cornebarrieu, Blagnac.',
+    quartiers: ['Centre-ville', 'Tournefeuille', 'Cornebarrieu', 'Blagnac', 'Pibrac', 'La Salvetat-Saint-Gilles', 'Plaisance-du-Touch'],
+  },
+  tournefeuille: {
+    description: 'À Tournefeuille, ville dynamique du Haute-Garonne (30 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural riche, nos professionnels interviennent dans toute la commune, ainsi que Cugnaux, Colomiers, Plaisance-du-Touch.',
+    quartiers: ['Centre-ville', 'Cugnaux', 'Colomiers', 'Plaisance-du-Touch', 'Villeneuve-Tolosane', 'La Salvetat-Saint-Gilles', 'Frouzins'],
+  },
+  blagnac: {
+    description: 'Blagnac est une ville active de 28 000 habitants située dans le département Haute-Garonne en Occitanie. Nos artisans qualifiés interviennent à Blagnac, ainsi que Beauzelle, Cornebarrieu, Aucamville pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Beauzelle', 'Cornebarrieu', 'Aucamville', 'Fenouillet', 'Colomiers', 'Seilh'],
+  },
+  muret: {
+    description: 'Muret (Haute-Garonne, Occitanie) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Fauga, Eaunes, Labastidette.',
+    quartiers: ['Centre-ville', 'Le Fauga', 'Eaunes', 'Labastidette', 'Lherm', 'Seysses', 'Saubens'],
+  },
+  'plaisance-du-touch': {
+    description: 'Découvrez les meilleurs artisans à Plaisance-du-Touch en Haute-Garonne. Avec le sud de la France et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Salvetat-Saint-Gilles, Tournefeuille, Fonsorbes.',
+    quartiers: ['Centre-ville', 'La Salvetat-Saint-Gilles', 'Tournefeuille', 'Fonsorbes', 'Frouzins', 'Léguevin', 'Cugnaux'],
+  },
+  cugnaux: {
+    description: 'À Cugnaux, ville active du Haute-Garonne (21 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural riche, nos professionnels interviennent dans toute la commune, ainsi que Villeneuve-Tolosane, Tournefeuille, Frouzins.',
+    quartiers: ['Centre-ville', 'Villeneuve-Tolosane', 'Tournefeuille', 'Frouzins', 'Roques', 'Portet-sur-Garonne', 'Plaisance-du-Touch'],
+  },
+  balma: {
+    description: 'Balma (Haute-Garonne, Occitanie) est une commune de 18 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Flourens, Quint-Fonsegrives, Montrabé.',
+    quartiers: ['Centre-ville', 'Flourens', 'Quint-Fonsegrives', 'Montrabé', 'L\'Union', 'Toulouse', 'Saint-Jean'],
+  },
+  'castanet-tolosan': {
+    description: 'Castanet-Tolosan est une commune de 15 000 habitants située dans le département Haute-Garonne en Occitanie. Nos artisans qualifiés interviennent à Castanet-Tolosan, ainsi que Péchabou, Pompertuzat, Auzeville-Tolosane pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Péchabou', 'Pompertuzat', 'Auzeville-Tolosane', 'Labège', 'Escalquens', 'Ramonville-Saint-Agne'],
+  },
+  'ramonville-saint-agne': {
+    description: 'Ramonville-Saint-Agne (Haute-Garonne, Occitanie) est une commune de 15 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Auzeville-Tolosane, Labège, Castanet-Tolosan.',
+    quartiers: ['Centre-ville', 'Auzeville-Tolosane', 'Labège', 'Castanet-Tolosan', 'Saint-Orens-de-Gameville', 'Péchabou', 'Quint-Fonsegrives'],
+  },
+  'saint-orens-de-gameville': {
+    description: 'Artisans référencés à Saint-Orens-de-Gameville et ses environs. Cette commune occitane de 15 000 habitants en Haute-Garonne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Labège, Quint-Fonsegrives, Escalquens.',
+    quartiers: ['Centre-ville', 'Labège', 'Quint-Fonsegrives', 'Escalquens', 'Auzeville-Tolosane', 'Ramonville-Saint-Agne', 'Flourens'],
+  },
+  fonsorbes: {
+    description: 'Trouvez un artisan de confiance à Fonsorbes (Haute-Garonne). Avec 13 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Fontenilles, Saint-Lys, Plaisance-du-Touch.',
+    quartiers: ['Centre-ville', 'Fontenilles', 'Saint-Lys', 'Plaisance-du-Touch', 'Seysses', 'La Salvetat-Saint-Gilles', 'Frouzins'],
+  },
+  'l-union': {
+    description: 'Artisans référencés à L\'Union et ses environs. Cette commune occitane de 13 000 habitants en Haute-Garonne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Jean, Launaguet, Saint-Geniès-Bellevue.',
+    quartiers: ['Centre-ville', 'Saint-Jean', 'Launaguet', 'Saint-Geniès-Bellevue', 'Rouffiac-Tolosan', 'Montrabé', 'Balma'],
+  },
+  'saint-gaudens': {
+    description: 'À Saint-Gaudens, commune du Haute-Garonne (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural riche, nos professionnels interviennent dans toute la commune, ainsi que Montréjeau, Martres-Tolosane.',
+    quartiers: ['Centre-ville', 'Montréjeau', 'Martres-Tolosane'],
+  },
+  castelginest: {
+    description: 'Découvrez les meilleurs artisans à Castelginest en Haute-Garonne. Avec le sud de la France et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Alban, Fonbeauzard, Pechbonnieu.',
+    quartiers: ['Centre-ville', 'Saint-Alban', 'Fonbeauzard', 'Pechbonnieu', 'Gratentour', 'Aucamville', 'Saint-Loup-Cammas'],
+  },
+  'saint-jean': {
+    description: 'Besoin d’un professionnel à Saint-Jean ? Située en Occitanie, cette commune du Haute-Garonne bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Rouffiac-Tolosan, L\'Union, Saint-Geniès-Bellevue.',
+    quartiers: ['Centre-ville', 'Rouffiac-Tolosan', 'L\'Union', 'Saint-Geniès-Bellevue', 'Castelmaurou', 'Montrabé', 'Launaguet'],
+  },
+  'villeneuve-tolosane': {
+    description: 'Trouvez un artisan de confiance à Villeneuve-Tolosane (Haute-Garonne). Avec 11 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Cugnaux, Roques, Frouzins.',
+    quartiers: ['Centre-ville', 'Cugnaux', 'Roques', 'Frouzins', 'Roquettes', 'Portet-sur-Garonne', 'Pinsaguel'],
+  },
+  seysses: {
+    description: 'Vous habitez à Seysses ou ses environs ? Nos artisans qualifiés du Haute-Garonne sont disponibles pour tous vos travaux. Seysses, commune occitane de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Frouzins, Fonsorbes, Labastidette.',
+    quartiers: ['Centre-ville', 'Frouzins', 'Fonsorbes', 'Labastidette', 'Villeneuve-Tolosane', 'Roques', 'Muret'],
+  },
+  auterive: {
+    description: 'Auterive (Haute-Garonne, Occitanie) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Miremont, Cintegabelle, Venerque.',
+    quartiers: ['Centre-ville', 'Miremont', 'Cintegabelle', 'Venerque', 'Vernet', 'Lagardelle-sur-Lèze', 'Nailloux'],
+  },
+  leguevin: {
+    description: 'Trouvez des artisans qualifiés à Léguevin (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-lys': {
+    description: 'Trouvez des artisans qualifiés à Saint-Lys (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  frouzins: {
+    description: 'Trouvez des artisans qualifiés à Frouzins (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'portet-sur-garonne': {
+    description: 'Trouvez des artisans qualifiés à Portet-sur-Garonne (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  revel: {
+    description: 'Trouvez des artisans qualifiés à Revel (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aucamville: {
+    description: 'Trouvez des artisans qualifiés à Aucamville (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  launaguet: {
+    description: 'Trouvez des artisans qualifiés à Launaguet (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  grenade: {
+    description: 'Trouvez des artisans qualifiés à Grenade (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cornebarrieu: {
+    description: 'Trouvez des artisans qualifiés à Cornebarrieu (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pibrac: {
+    description: 'Trouvez des artisans qualifiés à Pibrac (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beauzelle: {
+    description: 'Trouvez des artisans qualifiés à Beauzelle (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jory': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jory (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-salvetat-saint-gilles': {
+    description: 'Trouvez des artisans qualifiés à La Salvetat-Saint-Gilles (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aussonne: {
+    description: 'Trouvez des artisans qualifiés à Aussonne (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'castelnau-d-estretefonds': {
+    description: 'Trouvez des artisans qualifiés à Castelnau-d\'Estrétefonds (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  escalquens: {
+    description: 'Trouvez des artisans qualifiés à Escalquens (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'merville-31': {
+    description: 'Trouvez des artisans qualifiés à Merville (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fronton: {
+    description: 'Trouvez des artisans qualifiés à Fronton (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'labarthe-sur-leze': {
+    description: 'Trouvez des artisans qualifiés à Labarthe-sur-Lèze (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eaunes: {
+    description: 'Trouvez des artisans qualifiés à Eaunes (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-alban': {
+    description: 'Trouvez des artisans qualifiés à Saint-Alban (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villemur-sur-tarn': {
+    description: 'Trouvez des artisans qualifiés à Villemur-sur-Tarn (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bruguieres: {
+    description: 'Trouvez des artisans qualifiés à Bruguières (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'quint-fonsegrives': {
+    description: 'Trouvez des artisans qualifiés à Quint-Fonsegrives (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mondonville: {
+    description: 'Trouvez des artisans qualifiés à Mondonville (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fontenilles: {
+    description: 'Trouvez des artisans qualifiés à Fontenilles (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fenouillet: {
+    description: 'Trouvez des artisans qualifiés à Fenouillet (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  carbonne: {
+    description: 'Trouvez des artisans qualifiés à Carbonne (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  roques: {
+    description: 'Trouvez des artisans qualifiés à Roques (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villefranche-de-lauragais': {
+    description: 'Trouvez des artisans qualifiés à Villefranche-de-Lauragais (Haute-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
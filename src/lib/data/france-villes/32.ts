@@ -0,0 +1,23 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  auch: {
+    description: 'Trouvez un artisan de confiance à Auch (Gers). Avec 22 000 habitants, cette ville active occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Pavie, Mirande, Fleurance.',
+    quartiers: ['Centre-ville', 'Pavie', 'Mirande', 'Fleurance'],
+  },
+  'l-isle-jourdain': {
+    description: 'Trouvez des artisans qualifiés à L\'Isle-Jourdain (Gers). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  condom: {
+    description: 'Trouvez des artisans qualifiés à Condom (Gers). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fleurance: {
+    description: 'Trouvez des artisans qualifiés à Fleurance (Gers). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
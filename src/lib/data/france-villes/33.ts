@@ -0,0 +1,227 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  bordeaux: { description: 'Capitale mondiale du vin, ville au patrimoine exceptionnel.', quartiers: ['Centre historique', 'Chartrons', 'Saint-Michel', 'Bastide', 'Bacalan'] },
+  merignac: { description: 'Ville aéronautique de la métropole bordelaise.', quartiers: ['Centre-ville', 'Capeyron', 'Arlac', 'Chemin Long', 'Beutre', 'Bourranville', 'Pichey'] },
+  pessac: { description: 'Ville universitaire de la métropole bordelaise.', quartiers: ['Centre-ville', 'Saige', 'Alouette', 'Cap de Bos'] },
+  talence: { description: 'Ville étudiante de Bordeaux.', quartiers: ['Centre-ville', 'Forum', 'Plume la Poule', 'Raba'] },
+  'villenave-d-ornon': {
+    description: 'Besoin d’un professionnel à Villenave-d\'Ornon ? Située en Nouvelle-Aquitaine, cette ville dynamique du Gironde bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Bègles, Cadaujac, Latresne.',
+    quartiers: ['Centre-ville', 'Bègles', 'Cadaujac', 'Latresne', 'Talence', 'Gradignan', 'Quinsac'],
+  },
+  'saint-medard-en-jalles': {
+    description: 'Saint-Médard-en-Jalles (Gironde, Nouvelle-Aquitaine) est une ville dynamique de 33 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Martignas-sur-Jalle, Saint-Aubin-de-Médoc, Le Haillan.',
+    quartiers: ['Centre-ville', 'Martignas-sur-Jalle', 'Saint-Aubin-de-Médoc', 'Le Haillan', 'Le Taillan-Médoc', 'Mérignac', 'Saint-Jean-d\'Illac'],
+  },
+  begles: {
+    description: 'Bègles (Gironde, Nouvelle-Aquitaine) est une ville dynamique de 32 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Villenave-d\'Ornon, Talence, Floirac.',
+    quartiers: ['Centre-ville', 'Villenave-d\'Ornon', 'Talence', 'Floirac', 'Bouliac', 'Latresne', 'Carignan-de-Bordeaux'],
+  },
+  'la-teste-de-buch': {
+    description: 'Vous habitez à La Teste-de-Buch ou ses environs ? Nos artisans qualifiés du Gironde sont disponibles pour tous vos travaux. La Teste-de-Buch, ville active néo-aquitaine de 28 000 habitants, mérite des professionnels à la hauteur, ainsi que Arcachon, Gujan-Mestras, Le Teich.',
+    quartiers: ['Centre-ville', 'Arcachon', 'Gujan-Mestras', 'Le Teich', 'Lège-Cap-Ferret', 'Biganos', 'Andernos-les-Bains'],
+  },
+  gradignan: {
+    description: 'À Gradignan, ville active du Gironde (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Canéjan, Talence, Léognan.',
+    quartiers: ['Centre-ville', 'Canéjan', 'Talence', 'Léognan', 'Villenave-d\'Ornon', 'Pessac', 'Bègles'],
+  },
+  cenon: {
+    description: 'À Cenon, ville active du Gironde (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Lormont, Floirac, Artigues-près-Bordeaux.',
+    quartiers: ['Centre-ville', 'Lormont', 'Floirac', 'Artigues-près-Bordeaux', 'Tresses', 'Bouliac', 'Bordeaux'],
+  },
+  lormont: {
+    description: 'À Lormont, ville active du Gironde (26 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Cenon, Artigues-près-Bordeaux, Carbon-Blanc.',
+    quartiers: ['Centre-ville', 'Cenon', 'Artigues-près-Bordeaux', 'Carbon-Blanc', 'Bassens', 'Yvrac', 'Sainte-Eulalie'],
+  },
+  'le-bouscat': {
+    description: 'Besoin d’un professionnel à Le Bouscat ? Située en Nouvelle-Aquitaine, cette ville active du Gironde bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Bordeaux, Bruges, Eysines.',
+    quartiers: ['Centre-ville', 'Bordeaux', 'Bruges', 'Eysines', 'Blanquefort', 'Cenon', 'Talence'],
+  },
+  libourne: {
+    description: 'Libourne est une ville active de 25 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Libourne, ainsi que Arveyres, Génissac, Vayres pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Arveyres', 'Génissac', 'Vayres', 'Saint-Denis-de-Pile', 'Galgon', 'Izon'],
+  },
+  eysines: {
+    description: 'Eysines est une ville active de 25 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Eysines, ainsi que Le Haillan, Bruges, Le Bouscat pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Haillan', 'Bruges', 'Le Bouscat', 'Le Taillan-Médoc', 'Bordeaux', 'Blanquefort'],
+  },
+  'gujan-mestras': {
+    description: 'Trouvez un artisan de confiance à Gujan-Mestras (Gironde). Avec 22 000 habitants, cette ville active néo-aquitaine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Teich, La Teste-de-Buch, Arcachon.',
+    quartiers: ['Centre-ville', 'Le Teich', 'La Teste-de-Buch', 'Arcachon', 'Biganos', 'Mios', 'Salles'],
+  },
+  bruges: {
+    description: 'Bruges est une ville active de 20 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Bruges, ainsi que Le Bouscat, Bordeaux, Eysines pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Bouscat', 'Bordeaux', 'Eysines', 'Blanquefort', 'Bassens', 'Le Taillan-Médoc'],
+  },
+  floirac: {
+    description: 'Floirac est une commune de 18 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Floirac, ainsi que Bouliac, Cenon, Bègles pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bouliac', 'Cenon', 'Bègles', 'Artigues-près-Bordeaux', 'Tresses', 'Carignan-de-Bordeaux'],
+  },
+  'ambares-et-lagrave': {
+    description: 'À Ambarès-et-Lagrave, commune du Gironde (18 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Saint-Louis-de-Montferrand, Cubzac-les-Ponts, Bassens.',
+    quartiers: ['Centre-ville', 'Saint-Louis-de-Montferrand', 'Cubzac-les-Ponts', 'Bassens', 'Carbon-Blanc', 'Sainte-Eulalie', 'Parempuyre'],
+  },
+  blanquefort: {
+    description: 'À Blanquefort, commune du Gironde (17 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Bruges, Parempuyre, Le Taillan-Médoc.',
+    quartiers: ['Centre-ville', 'Bruges', 'Parempuyre', 'Le Taillan-Médoc', 'Eysines', 'Le Pian-Médoc', 'Le Bouscat'],
+  },
+  cestas: {
+    description: 'À Cestas, commune du Gironde (17 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Canéjan, Pessac, Léognan.',
+    quartiers: ['Centre-ville', 'Canéjan', 'Pessac', 'Léognan', 'Marcheprime', 'Saint-Jean-d\'Illac', 'Gradignan'],
+  },
+  'andernos-les-bains': {
+    description: 'Andernos-les-Bains (Gironde, Nouvelle-Aquitaine) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Arès, Lège-Cap-Ferret, Lanton.',
+    quartiers: ['Centre-ville', 'Arès', 'Lège-Cap-Ferret', 'Lanton', 'Audenge', 'Le Porge', 'Arcachon'],
+  },
+  'saint-andre-de-cubzac': {
+    description: 'Saint-André-de-Cubzac (Gironde, Nouvelle-Aquitaine) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Cubzac-les-Ponts, La Lande-de-Fronsac, Val de Virvée.',
+    quartiers: ['Centre-ville', 'Cubzac-les-Ponts', 'La Lande-de-Fronsac', 'Val de Virvée', 'Peujard', 'Ambarès-et-Lagrave', 'Saint-Loubès'],
+  },
+  mios: {
+    description: 'Mios est une commune de 12 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Mios, ainsi que Biganos, Salles, Marcheprime pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Biganos', 'Salles', 'Marcheprime', 'Le Teich', 'Le Barp', 'Audenge'],
+  },
+  biganos: {
+    description: 'À Biganos, commune du Gironde (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Audenge, Mios, Marcheprime.',
+    quartiers: ['Centre-ville', 'Audenge', 'Mios', 'Marcheprime', 'Le Teich', 'Lanton', 'Gujan-Mestras'],
+  },
+  'le-haillan': {
+    description: 'Besoin d’un professionnel à Le Haillan ? Située en Nouvelle-Aquitaine, cette commune du Gironde bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Eysines, Mérignac, Le Taillan-Médoc.',
+    quartiers: ['Centre-ville', 'Eysines', 'Mérignac', 'Le Taillan-Médoc', 'Le Bouscat', 'Bruges', 'Saint-Médard-en-Jalles'],
+  },
+  arcachon: {
+    description: 'Vous habitez à Arcachon ou ses environs ? Nos artisans qualifiés du Gironde sont disponibles pour tous vos travaux. Arcachon, commune néo-aquitaine de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que La Teste-de-Buch, Lège-Cap-Ferret, Gujan-Mestras.',
+    quartiers: ['Centre-ville', 'La Teste-de-Buch', 'Lège-Cap-Ferret', 'Gujan-Mestras', 'Andernos-les-Bains', 'Le Teich', 'Biganos'],
+  },
+  'le-taillan-medoc': {
+    description: 'Vous habitez à Le Taillan-Médoc ou ses environs ? Nos artisans qualifiés du Gironde sont disponibles pour tous vos travaux. Le Taillan-Médoc, commune néo-aquitaine de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Eysines, Le Haillan, Le Pian-Médoc.',
+    quartiers: ['Centre-ville', 'Eysines', 'Le Haillan', 'Le Pian-Médoc', 'Blanquefort', 'Saint-Aubin-de-Médoc', 'Bruges'],
+  },
+  parempuyre: {
+    description: 'Besoin d’un professionnel à Parempuyre ? Située en Nouvelle-Aquitaine, cette commune du Gironde bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Ludon-Médoc, Saint-Louis-de-Montferrand, Blanquefort.',
+    quartiers: ['Centre-ville', 'Ludon-Médoc', 'Saint-Louis-de-Montferrand', 'Blanquefort', 'Macau', 'Ambarès-et-Lagrave', 'Ambès'],
+  },
+  leognan: {
+    description: 'Léognan est une commune de 11 000 habitants située dans le département Gironde en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Léognan, ainsi que Martillac, Gradignan, Canéjan pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Martillac', 'Gradignan', 'Canéjan', 'Cadaujac', 'Villenave-d\'Ornon', 'La Brède'],
+  },
+  'saint-loubes': {
+    description: 'Trouvez un artisan de confiance à Saint-Loubès (Gironde). Avec 10 000 habitants, cette commune néo-aquitaine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Sulpice-et-Cameyrac, Montussan, Sainte-Eulalie.',
+    quartiers: ['Centre-ville', 'Saint-Sulpice-et-Cameyrac', 'Montussan', 'Sainte-Eulalie', 'Cubzac-les-Ponts', 'Izon', 'Yvrac'],
+  },
+  'saint-jean-d-illac': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-d\'Illac (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  audenge: {
+    description: 'Trouvez des artisans qualifiés à Audenge (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-teich': {
+    description: 'Trouvez des artisans qualifiés à Le Teich (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'artigues-pres-bordeaux': {
+    description: 'Trouvez des artisans qualifiés à Artigues-près-Bordeaux (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coutras: {
+    description: 'Trouvez des artisans qualifiés à Coutras (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bassens: {
+    description: 'Trouvez des artisans qualifiés à Bassens (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'carbon-blanc': {
+    description: 'Trouvez des artisans qualifiés à Carbon-Blanc (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  salles: {
+    description: 'Trouvez des artisans qualifiés à Salles (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'martignas-sur-jalle': {
+    description: 'Trouvez des artisans qualifiés à Martignas-sur-Jalle (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'lege-cap-ferret': {
+    description: 'Trouvez des artisans qualifiés à Lège-Cap-Ferret (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-aubin-de-medoc': {
+    description: 'Trouvez des artisans qualifiés à Saint-Aubin-de-Médoc (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  langon: {
+    description: 'Trouvez des artisans qualifiés à Langon (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lanton: {
+    description: 'Trouvez des artisans qualifiés à Lanton (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-pian-medoc': {
+    description: 'Trouvez des artisans qualifiés à Le Pian-Médoc (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cadaujac: {
+    description: 'Trouvez des artisans qualifiés à Cadaujac (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ares: {
+    description: 'Trouvez des artisans qualifiés à Arès (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  izon: {
+    description: 'Trouvez des artisans qualifiés à Izon (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'belin-beliet': {
+    description: 'Trouvez des artisans qualifiés à Belin-Béliet (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-denis-de-pile': {
+    description: 'Trouvez des artisans qualifiés à Saint-Denis-de-Pile (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'lesparre-medoc': {
+    description: 'Trouvez des artisans qualifiés à Lesparre-Médoc (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-barp': {
+    description: 'Trouvez des artisans qualifiés à Le Barp (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  canejan: {
+    description: 'Trouvez des artisans qualifiés à Canéjan (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lacanau: {
+    description: 'Trouvez des artisans qualifiés à Lacanau (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marcheprime: {
+    description: 'Trouvez des artisans qualifiés à Marcheprime (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ludon-medoc': {
+    description: 'Trouvez des artisans qualifiés à Ludon-Médoc (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tresses: {
+    description: 'Trouvez des artisans qualifiés à Tresses (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pauillac: {
+    description: 'Trouvez des artisans qualifiés à Pauillac (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  blaye: {
+    description: 'Trouvez des artisans qualifiés à Blaye (Gironde). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,193 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  montpellier: { description: 'Ville étudiante et dynamique du sud de la France.', quartiers: ['Écusson', 'Antigone', 'Port-Marianne', 'Hôpitaux-Facultés', 'Mosson'] },
+  beziers: { description: 'Ville viticole du Languedoc.', quartiers: ['Centre historique', 'Arènes', 'Devèze', 'La Montagnette', 'Faubourg', 'Iranget', 'Grangette'] },
+  sete: {
+    description: 'Artisans référencés à Sète et ses environs. Cette ville dynamique occitane de 45 000 habitants en Hérault compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Mèze, Loupian, Marseillan.',
+    quartiers: ['Centre-ville', 'Mèze', 'Loupian', 'Marseillan', 'Balaruc-les-Bains', 'Balaruc-le-Vieux', 'Pomérols'],
+  },
+  agde: {
+    description: 'Trouvez un artisan de confiance à Agde (Hérault). Avec 30 000 habitants, cette ville active occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Vias, Marseillan, Bessan.',
+    quartiers: ['Centre-ville', 'Vias', 'Marseillan', 'Bessan', 'Florensac', 'Pomérols', 'Portiragnes'],
+  },
+  lunel: {
+    description: 'Lunel est une ville active de 27 000 habitants située dans le département Hérault en Occitanie. Nos artisans qualifiés interviennent à Lunel, ainsi que Saint-Just, Lunel-Viel, Marsillargues pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Just', 'Lunel-Viel', 'Marsillargues', 'Valergues', 'Entre-Vignes', 'Lansargues'],
+  },
+  'castelnau-le-lez': {
+    description: 'Découvrez les meilleurs artisans à Castelnau-le-Lez en Hérault. Avec le sud de la France et 26 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Le Crès, Jacou, Clapiers.',
+    quartiers: ['Centre-ville', 'Le Crès', 'Jacou', 'Clapiers', 'Montpellier', 'Saint-Aunès', 'Vendargues'],
+  },
+  frontignan: {
+    description: 'Découvrez les meilleurs artisans à Frontignan en Hérault. Avec le sud de la France et 24 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Balaruc-le-Vieux, Balaruc-les-Bains, Gigean.',
+    quartiers: ['Centre-ville', 'Balaruc-le-Vieux', 'Balaruc-les-Bains', 'Gigean', 'Vic-la-Gardiole', 'Mireval', 'Poussan'],
+  },
+  lattes: {
+    description: 'Lattes (Hérault, Occitanie) est une commune de 17 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Pérols, Palavas-les-Flots, Montpellier.',
+    quartiers: ['Centre-ville', 'Pérols', 'Palavas-les-Flots', 'Montpellier', 'Saint-Jean-de-Védas', 'Villeneuve-lès-Maguelone', 'Castelnau-le-Lez'],
+  },
+  mauguio: {
+    description: 'Vous habitez à Mauguio ou ses environs ? Nos artisans qualifiés du Hérault sont disponibles pour tous vos travaux. Mauguio, commune occitane de 17 000 habitants, mérite des professionnels à la hauteur, ainsi que Candillargues, La Grande-Motte, Mudaison.',
+    quartiers: ['Centre-ville', 'Candillargues', 'La Grande-Motte', 'Mudaison', 'Saint-Aunès', 'Pérols', 'Lansargues'],
+  },
+  juvignac: {
+    description: 'Vous habitez à Juvignac ou ses environs ? Nos artisans qualifiés du Hérault sont disponibles pour tous vos travaux. Juvignac, commune occitane de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Georges-d\'Orques, Grabels, Lavérune.',
+    quartiers: ['Centre-ville', 'Saint-Georges-d\'Orques', 'Grabels', 'Lavérune', 'Murviel-lès-Montpellier', 'Saussan', 'Pignan'],
+  },
+  'saint-jean-de-vedas': {
+    description: 'Artisans référencés à Saint-Jean-de-Védas et ses environs. Cette commune occitane de 13 000 habitants en Hérault compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Lavérune, Saussan, Montpellier.',
+    quartiers: ['Centre-ville', 'Lavérune', 'Saussan', 'Montpellier', 'Lattes', 'Juvignac', 'Fabrègues'],
+  },
+  meze: {
+    description: 'Artisans référencés à Mèze et ses environs. Cette commune occitane de 13 000 habitants en Hérault compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Loupian, Pinet, Pomérols.',
+    quartiers: ['Centre-ville', 'Loupian', 'Pinet', 'Pomérols', 'Villeveyrac', 'Sète', 'Montagnac'],
+  },
+  'villeneuve-les-maguelone': {
+    description: 'Villeneuve-lès-Maguelone (Hérault, Occitanie) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Mireval, Vic-la-Gardiole, Palavas-les-Flots.',
+    quartiers: ['Centre-ville', 'Mireval', 'Vic-la-Gardiole', 'Palavas-les-Flots', 'Lattes', 'Saint-Jean-de-Védas', 'Fabrègues'],
+  },
+  'saint-gely-du-fesc': {
+    description: 'Saint-Gély-du-Fesc (Hérault, Occitanie) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Combaillaux, Saint-Clément-de-Rivière, Les Matelles.',
+    quartiers: ['Centre-ville', 'Combaillaux', 'Saint-Clément-de-Rivière', 'Les Matelles', 'Grabels', 'Prades-le-Lez', 'Montferrier-sur-Lez'],
+  },
+  perols: {
+    description: 'Trouvez des artisans qualifiés à Pérols (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'clermont-l-herault': {
+    description: 'Trouvez des artisans qualifiés à Clermont-l\'Hérault (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-cres': {
+    description: 'Trouvez des artisans qualifiés à Le Crès (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  grabels: {
+    description: 'Trouvez des artisans qualifiés à Grabels (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  serignan: {
+    description: 'Trouvez des artisans qualifiés à Sérignan (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-grande-motte': {
+    description: 'Trouvez des artisans qualifiés à La Grande-Motte (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pignan: {
+    description: 'Trouvez des artisans qualifiés à Pignan (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marseillan: {
+    description: 'Trouvez des artisans qualifiés à Marseillan (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  baillargues: {
+    description: 'Trouvez des artisans qualifiés à Baillargues (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pezenas: {
+    description: 'Trouvez des artisans qualifiés à Pézenas (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fabregues: {
+    description: 'Trouvez des artisans qualifiés à Fabrègues (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cournonterral: {
+    description: 'Trouvez des artisans qualifiés à Cournonterral (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vendargues: {
+    description: 'Trouvez des artisans qualifiés à Vendargues (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lodeve: {
+    description: 'Trouvez des artisans qualifiés à Lodève (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'balaruc-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Balaruc-les-Bains (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marsillargues: {
+    description: 'Trouvez des artisans qualifiés à Marsillargues (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  jacou: {
+    description: 'Trouvez des artisans qualifiés à Jacou (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  castries: {
+    description: 'Trouvez des artisans qualifiés à Castries (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  poussan: {
+    description: 'Trouvez des artisans qualifiés à Poussan (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gignac: {
+    description: 'Trouvez des artisans qualifiés à Gignac (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gigean: {
+    description: 'Trouvez des artisans qualifiés à Gigean (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-andre-de-sangonis': {
+    description: 'Trouvez des artisans qualifiés à Saint-André-de-Sangonis (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'prades-le-lez': {
+    description: 'Trouvez des artisans qualifiés à Prades-le-Lez (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'palavas-les-flots': {
+    description: 'Trouvez des artisans qualifiés à Palavas-les-Flots (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  clapiers: {
+    description: 'Trouvez des artisans qualifiés à Clapiers (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vias: {
+    description: 'Trouvez des artisans qualifiés à Vias (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bessan: {
+    description: 'Trouvez des artisans qualifiés à Bessan (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bedarieux: {
+    description: 'Trouvez des artisans qualifiés à Bédarieux (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-georges-d-orques': {
+    description: 'Trouvez des artisans qualifiés à Saint-Georges-d\'Orques (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sauvian: {
+    description: 'Trouvez des artisans qualifiés à Sauvian (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  servian: {
+    description: 'Trouvez des artisans qualifiés à Servian (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cazouls-les-beziers': {
+    description: 'Trouvez des artisans qualifiés à Cazouls-lès-Béziers (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  florensac: {
+    description: 'Trouvez des artisans qualifiés à Florensac (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-clement-de-riviere': {
+    description: 'Trouvez des artisans qualifiés à Saint-Clément-de-Rivière (Hérault). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,169 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  rennes: { description: 'Capitale bretonne, ville étudiante et innovante.', quartiers: ['Centre', 'Thabor', 'Sainte-Thérèse', 'Villejean', 'Maurepas'] },
+  'saint-malo': { description: 'Cité corsaire, ville fortifiée.', quartiers: ['Intra-muros', 'Saint-Servan', 'Paramé', 'Rothéneuf'] },
+  fougeres: {
+    description: 'À Fougères, ville active du Ille-et-Vilaine (20 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat en granit et ardoise, nos professionnels interviennent dans toute la commune, ainsi que Lécousse, Javené, Romagné.',
+    quartiers: ['Centre-ville', 'Lécousse', 'Javené', 'Romagné', 'Saint-Germain-en-Coglès', 'La Chapelle-Fleurigné', 'Maen Roch'],
+  },
+  bruz: {
+    description: 'À Bruz, commune du Ille-et-Vilaine (20 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat en granit et ardoise, nos professionnels interviennent dans toute la commune, ainsi que Pont-Péan, Chartres-de-Bretagne, Chavagne.',
+    quartiers: ['Centre-ville', 'Pont-Péan', 'Chartres-de-Bretagne', 'Chavagne', 'Saint-Jacques-de-la-Lande', 'Laillé', 'Goven'],
+  },
+  vitre: {
+    description: 'Découvrez les meilleurs artisans à Vitré en Ille-et-Vilaine. Avec le littoral atlantique et 19 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Étrelles, Balazé, Argentré-du-Plessis.',
+    quartiers: ['Centre-ville', 'Étrelles', 'Balazé', 'Argentré-du-Plessis', 'Val-d\'Izé', 'Saint-Didier', 'Domalain'],
+  },
+  'cesson-sevigne': {
+    description: 'Trouvez un artisan de confiance à Cesson-Sévigné (Ille-et-Vilaine). Avec 19 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Thorigné-Fouillard, Chantepie, Acigné.',
+    quartiers: ['Centre-ville', 'Thorigné-Fouillard', 'Chantepie', 'Acigné', 'Rennes', 'Domloup', 'Betton'],
+  },
+  'saint-jacques-de-la-lande': {
+    description: 'Trouvez un artisan de confiance à Saint-Jacques-de-la-Lande (Ille-et-Vilaine). Avec 14 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Chartres-de-Bretagne, Vezin-le-Coquet, Rennes.',
+    quartiers: ['Centre-ville', 'Chartres-de-Bretagne', 'Vezin-le-Coquet', 'Rennes', 'Le Rheu', 'Chavagne', 'Noyal-Châtillon-sur-Seiche'],
+  },
+  betton: {
+    description: 'Artisans référencés à Betton et ses environs. Cette commune bretonne de 13 000 habitants en Ille-et-Vilaine compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Grégoire, Chevaigné, Melesse.',
+    quartiers: ['Centre-ville', 'Saint-Grégoire', 'Chevaigné', 'Melesse', 'Thorigné-Fouillard', 'Montgermont', 'La Chapelle-des-Fougeretz'],
+  },
+  pace: {
+    description: 'Pacé (Ille-et-Vilaine, Bretagne) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que La Chapelle-des-Fougeretz, Montgermont, Vezin-le-Coquet.',
+    quartiers: ['Centre-ville', 'La Chapelle-des-Fougeretz', 'Montgermont', 'Vezin-le-Coquet', 'L\'Hermitage', 'Saint-Gilles', 'Gévezé'],
+  },
+  chateaugiron: {
+    description: 'À Châteaugiron, commune du Ille-et-Vilaine (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat en granit et ardoise, nos professionnels interviennent dans toute la commune, ainsi que Domagné, Domloup, Noyal-sur-Vilaine.',
+    quartiers: ['Centre-ville', 'Domagné', 'Domloup', 'Noyal-sur-Vilaine', 'Nouvoitou', 'Piré-Chancé', 'Brécé'],
+  },
+  dinard: {
+    description: 'Besoin d’un professionnel à Dinard ? Située en Bretagne, cette commune du Ille-et-Vilaine bénéficie de des besoins spécifiques liés au climat océanique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que La Richardais, Saint-Lunaire, Saint-Malo.',
+    quartiers: ['Centre-ville', 'La Richardais', 'Saint-Lunaire', 'Saint-Malo', 'Saint-Briac-sur-Mer', 'Pleurtuit', 'Saint-Jouan-des-Guérets'],
+  },
+  chantepie: {
+    description: 'Trouvez un artisan de confiance à Chantepie (Ille-et-Vilaine). Avec 11 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Vern-sur-Seiche, Cesson-Sévigné, Domloup.',
+    quartiers: ['Centre-ville', 'Vern-sur-Seiche', 'Cesson-Sévigné', 'Domloup', 'Noyal-Châtillon-sur-Seiche', 'Rennes', 'Nouvoitou'],
+  },
+  'saint-gregoire': {
+    description: 'Trouvez des artisans qualifiés à Saint-Grégoire (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-rheu': {
+    description: 'Trouvez des artisans qualifiés à Le Rheu (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  redon: {
+    description: 'Trouvez des artisans qualifiés à Redon (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guichen: {
+    description: 'Trouvez des artisans qualifiés à Guichen (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  liffre: {
+    description: 'Trouvez des artisans qualifiés à Liffré (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chartres-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Chartres-de-Bretagne (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'thorigne-fouillard': {
+    description: 'Trouvez des artisans qualifiés à Thorigné-Fouillard (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  janze: {
+    description: 'Trouvez des artisans qualifiés à Janzé (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noyal-chatillon-sur-seiche': {
+    description: 'Trouvez des artisans qualifiés à Noyal-Châtillon-sur-Seiche (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vern-sur-seiche': {
+    description: 'Trouvez des artisans qualifiés à Vern-sur-Seiche (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mordelles: {
+    description: 'Trouvez des artisans qualifiés à Mordelles (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bain-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Bain-de-Bretagne (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  melesse: {
+    description: 'Trouvez des artisans qualifiés à Melesse (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chateaubourg: {
+    description: 'Trouvez des artisans qualifiés à Châteaubourg (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'guipry-messac': {
+    description: 'Trouvez des artisans qualifiés à Guipry-Messac (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pleurtuit: {
+    description: 'Trouvez des artisans qualifiés à Pleurtuit (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  acigne: {
+    description: 'Trouvez des artisans qualifiés à Acigné (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montfort-sur-meu': {
+    description: 'Trouvez des artisans qualifiés à Montfort-sur-Meu (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montauban-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Montauban-de-Bretagne (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vezin-le-coquet': {
+    description: 'Trouvez des artisans qualifiés à Vezin-le-Coquet (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  combourg: {
+    description: 'Trouvez des artisans qualifiés à Combourg (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'breal-sous-montfort': {
+    description: 'Trouvez des artisans qualifiés à Bréal-sous-Montfort (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noyal-sur-vilaine': {
+    description: 'Trouvez des artisans qualifiés à Noyal-sur-Vilaine (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  geveze: {
+    description: 'Trouvez des artisans qualifiés à Gévezé (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'dol-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Dol-de-Bretagne (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  orgeres: {
+    description: 'Trouvez des artisans qualifiés à Orgères (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cancale: {
+    description: 'Trouvez des artisans qualifiés à Cancale (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  laille: {
+    description: 'Trouvez des artisans qualifiés à Laillé (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'maen-roch': {
+    description: 'Trouvez des artisans qualifiés à Maen Roch (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-meziere': {
+    description: 'Trouvez des artisans qualifiés à La Mézière (Ille-et-Vilaine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
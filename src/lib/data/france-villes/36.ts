@@ -0,0 +1,24 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  chateauroux: { description: 'Préfecture de l\'Indre, ville verte.', quartiers: ['Centre-ville', 'Saint-Christophe', 'Beaulieu', 'Saint-Jacques'] },
+  issoudun: {
+    description: 'Besoin d’un professionnel à Issoudun ? Située en Centre-Val de Loire, cette commune du Indre bénéficie de des besoins en entretien de maisons individuelles. Comparez les artisans et demandez un devis gratuit pour vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  deols: {
+    description: 'Trouvez des artisans qualifiés à Déols (Indre). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-blanc': {
+    description: 'Trouvez des artisans qualifiés à Le Blanc (Indre). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-poinconnet': {
+    description: 'Trouvez des artisans qualifiés à Le Poinçonnet (Indre). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
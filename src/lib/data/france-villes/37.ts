@@ -0,0 +1,80 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  tours: { description: 'Jardin de la France, au cœur des châteaux de la Loire.', quartiers: ['Vieux Tours', 'Grammont', 'Les Deux-Lions', 'Saint-Symphorien', 'Sanitas'] },
+  'joue-les-tours': {
+    description: 'Joué-lès-Tours (Indre-et-Loire, Centre-Val de Loire) est une ville dynamique de 38 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Ballan-Miré, Chambray-lès-Tours, La Riche.',
+    quartiers: ['Centre-ville', 'Ballan-Miré', 'Chambray-lès-Tours', 'La Riche', 'Saint-Avertin', 'Montbazon', 'Tours'],
+  },
+  'saint-cyr-sur-loire': {
+    description: 'Trouvez un artisan de confiance à Saint-Cyr-sur-Loire (Indre-et-Loire). Avec 17 000 habitants, cette commune du Centre dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que La Membrolle-sur-Choisille, Fondettes, Tours.',
+    quartiers: ['Centre-ville', 'La Membrolle-sur-Choisille', 'Fondettes', 'Tours', 'La Riche', 'Mettray', 'Notre-Dame-d\'Oé'],
+  },
+  'saint-pierre-des-corps': {
+    description: 'Saint-Pierre-des-Corps est une commune de 16 000 habitants située dans le département Indre-et-Loire en Centre-Val de Loire. Nos artisans qualifiés interviennent à Saint-Pierre-des-Corps, ainsi que Tours, La Ville-aux-Dames, Saint-Avertin pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Tours', 'La Ville-aux-Dames', 'Saint-Avertin', 'Larçay', 'Rochecorbon', 'Chambray-lès-Tours'],
+  },
+  'saint-avertin': {
+    description: 'Saint-Avertin (Indre-et-Loire, Centre-Val de Loire) est une commune de 15 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Chambray-lès-Tours, Larçay, Saint-Pierre-des-Corps.',
+    quartiers: ['Centre-ville', 'Chambray-lès-Tours', 'Larçay', 'Saint-Pierre-des-Corps', 'La Ville-aux-Dames', 'Tours', 'Véretz'],
+  },
+  amboise: {
+    description: 'Amboise est une commune de 13 000 habitants située dans le département Indre-et-Loire en Centre-Val de Loire. Nos artisans qualifiés interviennent à Amboise, ainsi que La Croix-en-Touraine, Nazelles-Négron, Saint-Martin-le-Beau pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'La Croix-en-Touraine', 'Nazelles-Négron', 'Saint-Martin-le-Beau', 'Bléré', 'Montlouis-sur-Loire', 'Athée-sur-Cher'],
+  },
+  'chambray-les-tours': {
+    description: 'Chambray-lès-Tours (Indre-et-Loire, Centre-Val de Loire) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Avertin, Larçay, Joué-lès-Tours.',
+    quartiers: ['Centre-ville', 'Saint-Avertin', 'Larçay', 'Joué-lès-Tours', 'Veigné', 'Montbazon', 'Saint-Pierre-des-Corps'],
+  },
+  'montlouis-sur-loire': {
+    description: 'Trouvez un artisan de confiance à Montlouis-sur-Loire (Indre-et-Loire). Avec 11 000 habitants, cette commune du Centre dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Véretz, Azay-sur-Cher, La Ville-aux-Dames.',
+    quartiers: ['Centre-ville', 'Véretz', 'Azay-sur-Cher', 'La Ville-aux-Dames', 'Saint-Martin-le-Beau', 'Larçay', 'Vouvray'],
+  },
+  fondettes: {
+    description: 'Artisans référencés à Fondettes et ses environs. Cette commune du Centre de 11 000 habitants en Indre-et-Loire compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Cyr-sur-Loire, La Membrolle-sur-Choisille, La Riche.',
+    quartiers: ['Centre-ville', 'Saint-Cyr-sur-Loire', 'La Membrolle-sur-Choisille', 'La Riche', 'Luynes', 'Mettray', 'Tours'],
+  },
+  'la-riche': {
+    description: 'La Riche est une commune de 10 000 habitants située dans le département Indre-et-Loire en Centre-Val de Loire. Nos artisans qualifiés interviennent à La Riche, ainsi que Fondettes, Saint-Cyr-sur-Loire, Tours pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Fondettes', 'Saint-Cyr-sur-Loire', 'Tours', 'Joué-lès-Tours', 'Ballan-Miré', 'La Membrolle-sur-Choisille'],
+  },
+  'ballan-mire': {
+    description: 'Trouvez des artisans qualifiés à Ballan-Miré (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chinon: {
+    description: 'Trouvez des artisans qualifiés à Chinon (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  monts: {
+    description: 'Trouvez des artisans qualifiés à Monts (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  veigne: {
+    description: 'Trouvez des artisans qualifiés à Veigné (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  esvres: {
+    description: 'Trouvez des artisans qualifiés à Esvres (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  loches: {
+    description: 'Trouvez des artisans qualifiés à Loches (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ville-aux-dames': {
+    description: 'Trouvez des artisans qualifiés à La Ville-aux-Dames (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  blere: {
+    description: 'Trouvez des artisans qualifiés à Bléré (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  luynes: {
+    description: 'Trouvez des artisans qualifiés à Luynes (Indre-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,215 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  grenoble: {
+    description: 'Capitale des Alpes françaises, ville universitaire.',
+    quartiers: ['Centre-ville', 'Europole', 'Île Verte', 'Village Olympique', 'Championnet', 'Bajatière', 'Eaux-Claires'],
+  },
+  'saint-martin-d-heres': {
+    description: 'Trouvez un artisan de confiance à Saint-Martin-d\'Hères (Isère). Avec 38 000 habitants, cette ville dynamique rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Gières, Poisat, Eybens.',
+    quartiers: ['Centre-ville', 'Gières', 'Poisat', 'Eybens', 'Grenoble', 'La Tronche', 'Meylan'],
+  },
+  echirolles: {
+    description: 'Découvrez les meilleurs artisans à Échirolles en Isère. Avec les Alpes et la vallée du Rhône et 37 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Le Pont-de-Claix, Eybens, Seyssins.',
+    quartiers: ['Centre-ville', 'Le Pont-de-Claix', 'Eybens', 'Seyssins', 'Grenoble', 'Poisat', 'Jarrie'],
+  },
+  vienne: {
+    description: 'Vienne (Isère, Auvergne-Rhône-Alpes) est une ville dynamique de 32 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Pont-Évêque, Jardin, Serpaize.',
+    quartiers: ['Centre-ville', 'Pont-Évêque', 'Jardin', 'Serpaize', 'Seyssuel', 'Reventin-Vaugris', 'Chuzelles'],
+  },
+  'bourgoin-jallieu': {
+    description: 'Bourgoin-Jallieu est une ville dynamique de 30 000 habitants située dans le département Isère en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Bourgoin-Jallieu, ainsi que Saint-Alban-de-Roche, L\'Isle-d\'Abeau, Saint-Savin pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Alban-de-Roche', 'L\'Isle-d\'Abeau', 'Saint-Savin', 'Nivolas-Vermelle', 'Ruy-Montceau', 'Vaulx-Milieu'],
+  },
+  fontaine: {
+    description: 'Artisans référencés à Fontaine et ses environs. Cette ville active rhônalpine de 22 000 habitants en Isère compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Seyssinet-Pariset, Sassenage, Grenoble.',
+    quartiers: ['Centre-ville', 'Seyssinet-Pariset', 'Sassenage', 'Grenoble', 'Saint-Martin-le-Vinoux', 'Seyssins', 'Saint-Égrève'],
+  },
+  voiron: {
+    description: 'Voiron (Isère, Auvergne-Rhône-Alpes) est une ville active de 22 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Coublevie, Saint-Étienne-de-Crossey, Chirens.',
+    quartiers: ['Centre-ville', 'Coublevie', 'Saint-Étienne-de-Crossey', 'Chirens', 'Saint-Jean-de-Moirans', 'La Buisse', 'Moirans'],
+  },
+  villefontaine: {
+    description: 'Villefontaine est une commune de 19 000 habitants située dans le département Isère en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Villefontaine, ainsi que La Verpillière, Vaulx-Milieu, Saint-Quentin-Fallavier pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'La Verpillière', 'Vaulx-Milieu', 'Saint-Quentin-Fallavier', 'Roche', 'Frontonas', 'L\'Isle-d\'Abeau'],
+  },
+  meylan: {
+    description: 'Découvrez les meilleurs artisans à Meylan en Isère. Avec les Alpes et la vallée du Rhône et 19 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Montbonnot-Saint-Martin, Corenc, La Tronche.',
+    quartiers: ['Centre-ville', 'Montbonnot-Saint-Martin', 'Corenc', 'La Tronche', 'Biviers', 'Gières', 'Domène'],
+  },
+  'saint-egreve': {
+    description: 'Trouvez un artisan de confiance à Saint-Égrève (Isère). Avec 18 000 habitants, cette commune rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Martin-le-Vinoux, Sassenage, Fontanil-Cornillon.',
+    quartiers: ['Centre-ville', 'Saint-Martin-le-Vinoux', 'Sassenage', 'Fontanil-Cornillon', 'Fontaine', 'Noyarey', 'La Tronche'],
+  },
+  'l-isle-d-abeau': {
+    description: 'Découvrez les meilleurs artisans à L\'Isle-d\'Abeau en Isère. Avec les Alpes et la vallée du Rhône et 18 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Vaulx-Milieu, Saint-Alban-de-Roche, Bourgoin-Jallieu.',
+    quartiers: ['Centre-ville', 'Vaulx-Milieu', 'Saint-Alban-de-Roche', 'Bourgoin-Jallieu', 'Frontonas', 'Villefontaine', 'La Verpillière'],
+  },
+  'seyssinet-pariset': {
+    description: 'Artisans référencés à Seyssinet-Pariset et ses environs. Cette commune rhônalpine de 12 000 habitants en Isère compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Seyssins, Fontaine, Grenoble.',
+    quartiers: ['Centre-ville', 'Seyssins', 'Fontaine', 'Grenoble', 'Échirolles', 'Sassenage', 'Le Pont-de-Claix'],
+  },
+  sassenage: {
+    description: 'Besoin d’un professionnel à Sassenage ? Située en Auvergne-Rhône-Alpes, cette commune du Isère bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Fontaine, Saint-Égrève, Noyarey.',
+    quartiers: ['Centre-ville', 'Fontaine', 'Saint-Égrève', 'Noyarey', 'Saint-Martin-le-Vinoux', 'Fontanil-Cornillon', 'Seyssinet-Pariset'],
+  },
+  'le-pont-de-claix': {
+    description: 'Découvrez les meilleurs artisans à Le Pont-de-Claix en Isère. Avec les Alpes et la vallée du Rhône et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Échirolles, Claix, Jarrie.',
+    quartiers: ['Centre-ville', 'Échirolles', 'Claix', 'Jarrie', 'Varces-Allières-et-Risset', 'Seyssins', 'Eybens'],
+  },
+  'charvieu-chavagneux': {
+    description: 'Découvrez les meilleurs artisans à Charvieu-Chavagneux en Isère. Avec les Alpes et la vallée du Rhône et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Pont-de-Chéruy, Tignieu-Jameyzieu, Chavanoz.',
+    quartiers: ['Centre-ville', 'Pont-de-Chéruy', 'Tignieu-Jameyzieu', 'Chavanoz', 'Saint-Romain-de-Jalionas', 'Satolas-et-Bonce', 'Villette-d\'Anthon'],
+  },
+  eybens: {
+    description: 'Découvrez les meilleurs artisans à Eybens en Isère. Avec les Alpes et la vallée du Rhône et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Poisat, Échirolles, Saint-Martin-d\'Hères.',
+    quartiers: ['Centre-ville', 'Poisat', 'Échirolles', 'Saint-Martin-d\'Hères', 'Brié-et-Angonnes', 'Grenoble', 'Jarrie'],
+  },
+  voreppe: {
+    description: 'Trouvez des artisans qualifiés à Voreppe (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  crolles: {
+    description: 'Trouvez des artisans qualifiés à Crolles (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  roussillon: {
+    description: 'Trouvez des artisans qualifiés à Roussillon (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'varces-allieres-et-risset': {
+    description: 'Trouvez des artisans qualifiés à Varces-Allières-et-Risset (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vif: {
+    description: 'Trouvez des artisans qualifiés à Vif (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-tour-du-pin': {
+    description: 'Trouvez des artisans qualifiés à La Tour-du-Pin (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  seyssins: {
+    description: 'Trouvez des artisans qualifiés à Seyssins (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'tignieu-jameyzieu': {
+    description: 'Trouvez des artisans qualifiés à Tignieu-Jameyzieu (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  claix: {
+    description: 'Trouvez des artisans qualifiés à Claix (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  moirans: {
+    description: 'Trouvez des artisans qualifiés à Moirans (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-verpilliere': {
+    description: 'Trouvez des artisans qualifiés à La Verpillière (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-marcellin': {
+    description: 'Trouvez des artisans qualifiés à Saint-Marcellin (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-avenieres-veyrins-thuellin': {
+    description: 'Trouvez des artisans qualifiés à Les Avenières Veyrins-Thuellin (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tullins: {
+    description: 'Trouvez des artisans qualifiés à Tullins (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villard-bonnot': {
+    description: 'Trouvez des artisans qualifiés à Villard-Bonnot (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gieres: {
+    description: 'Trouvez des artisans qualifiés à Gières (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pontcharra: {
+    description: 'Trouvez des artisans qualifiés à Pontcharra (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vizille: {
+    description: 'Trouvez des artisans qualifiés à Vizille (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-ismier': {
+    description: 'Trouvez des artisans qualifiés à Saint-Ismier (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-maurice-l-exil': {
+    description: 'Trouvez des artisans qualifiés à Saint-Maurice-l\'Exil (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-abrets-en-dauphine': {
+    description: 'Trouvez des artisans qualifiés à Les Abrets en Dauphiné (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  domene: {
+    description: 'Trouvez des artisans qualifiés à Domène (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-peage-de-roussillon': {
+    description: 'Trouvez des artisans qualifiés à Le Péage-de-Roussillon (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chasse-sur-rhone': {
+    description: 'Trouvez des artisans qualifiés à Chasse-sur-Rhône (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rives: {
+    description: 'Trouvez des artisans qualifiés à Rives (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-tronche': {
+    description: 'Trouvez des artisans qualifiés à La Tronche (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-de-cheruy': {
+    description: 'Trouvez des artisans qualifiés à Pont-de-Chéruy (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-eveque': {
+    description: 'Trouvez des artisans qualifiés à Pont-Évêque (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-quentin-fallavier': {
+    description: 'Trouvez des artisans qualifiés à Saint-Quentin-Fallavier (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-martin-le-vinoux': {
+    description: 'Trouvez des artisans qualifiés à Saint-Martin-le-Vinoux (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montbonnot-saint-martin': {
+    description: 'Trouvez des artisans qualifiés à Montbonnot-Saint-Martin (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-martin-d-uriage': {
+    description: 'Trouvez des artisans qualifiés à Saint-Martin-d\'Uriage (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coublevie: {
+    description: 'Trouvez des artisans qualifiés à Coublevie (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villette-d-anthon': {
+    description: 'Trouvez des artisans qualifiés à Villette-d\'Anthon (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chavanoz: {
+    description: 'Trouvez des artisans qualifiés à Chavanoz (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beaurepaire: {
+    description: 'Trouvez des artisans qualifiés à Beaurepaire (Isère). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
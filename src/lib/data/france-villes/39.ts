@@ -0,0 +1,23 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  dole: {
+    description: 'Artisans référencés à Dole et ses environs. Cette ville active bourguignonne de 24 000 habitants en Jura compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Foucherans, Damparis, Tavaux.',
+    quartiers: ['Centre-ville', 'Foucherans', 'Damparis', 'Tavaux'],
+  },
+  'lons-le-saunier': {
+    description: 'Découvrez les meilleurs artisans à Lons-le-Saunier en Jura. Avec le cœur de la France et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Montmorot, Poligny.',
+    quartiers: ['Centre-ville', 'Montmorot', 'Poligny'],
+  },
+  champagnole: {
+    description: 'Trouvez des artisans qualifiés à Champagnole (Jura). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'hauts-de-bienne': {
+    description: 'Trouvez des artisans qualifiés à Hauts de Bienne (Jura). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,72 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'mont-de-marsan': {
+    description: 'À Mont-de-Marsan, ville dynamique du Landes (32 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Saint-Pierre-du-Mont, Grenade-sur-l\'Adour, Saint-Sever.',
+    quartiers: ['Centre-ville', 'Saint-Pierre-du-Mont', 'Grenade-sur-l\'Adour', 'Saint-Sever', 'Villeneuve-de-Marsan', 'Tartas'],
+  },
+  dax: { description: 'Première station thermale de France.', quartiers: ['Centre-ville', 'Sablar', 'Saint-Pierre', 'Saint-Vincent-de-Xaintes'] },
+  biscarrosse: {
+    description: 'Biscarrosse est une commune de 16 000 habitants située dans le département Landes en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Biscarrosse, ainsi que Parentis-en-Born, Sanguinet, Ychoux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Parentis-en-Born', 'Sanguinet', 'Ychoux', 'Mimizan'],
+  },
+  'saint-paul-les-dax': {
+    description: 'Artisans référencés à Saint-Paul-lès-Dax et ses environs. Cette commune néo-aquitaine de 14 000 habitants en Landes compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Mées, Dax, Magescq.',
+    quartiers: ['Centre-ville', 'Mées', 'Dax', 'Magescq', 'Saint-Vincent-de-Paul', 'Narrosse', 'Saint-Geours-de-Maremne'],
+  },
+  tarnos: {
+    description: 'Vous habitez à Tarnos ou ses environs ? Nos artisans qualifiés du Landes sont disponibles pour tous vos travaux. Tarnos, commune néo-aquitaine de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Ondres, Saint-Martin-de-Seignanx, Labenne.',
+    quartiers: ['Centre-ville', 'Ondres', 'Saint-Martin-de-Seignanx', 'Labenne', 'Capbreton', 'Bénesse-Maremne', 'Soorts-Hossegor'],
+  },
+  'saint-pierre-du-mont': {
+    description: 'Artisans référencés à Saint-Pierre-du-Mont et ses environs. Cette commune néo-aquitaine de 10 000 habitants en Landes compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Mont-de-Marsan, Grenade-sur-l\'Adour, Saint-Sever.',
+    quartiers: ['Centre-ville', 'Mont-de-Marsan', 'Grenade-sur-l\'Adour', 'Saint-Sever', 'Villeneuve-de-Marsan', 'Tartas'],
+  },
+  capbreton: {
+    description: 'Trouvez des artisans qualifiés à Capbreton (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  soustons: {
+    description: 'Trouvez des artisans qualifiés à Soustons (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-vincent-de-tyrosse': {
+    description: 'Trouvez des artisans qualifiés à Saint-Vincent-de-Tyrosse (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mimizan: {
+    description: 'Trouvez des artisans qualifiés à Mimizan (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'parentis-en-born': {
+    description: 'Trouvez des artisans qualifiés à Parentis-en-Born (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  labenne: {
+    description: 'Trouvez des artisans qualifiés à Labenne (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ondres: {
+    description: 'Trouvez des artisans qualifiés à Ondres (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-martin-de-seignanx': {
+    description: 'Trouvez des artisans qualifiés à Saint-Martin-de-Seignanx (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aire-sur-l-adour': {
+    description: 'Trouvez des artisans qualifiés à Aire-sur-l\'Adour (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-sever': {
+    description: 'Trouvez des artisans qualifiés à Saint-Sever (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'morcenx-la-nouvelle': {
+    description: 'Trouvez des artisans qualifiés à Morcenx-la-Nouvelle (Landes). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,28 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  blois: { description: 'Ville royale des châteaux de la Loire.', quartiers: ['Centre-ville', 'Vienne', 'Les Grouëts', 'Cabochon'] },
+  'romorantin-lanthenay': {
+    description: 'Besoin d’un professionnel à Romorantin-Lanthenay ? Située en Centre-Val de Loire, cette commune du Loir-et-Cher bénéficie de des besoins en entretien de maisons individuelles. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Pruniers-en-Sologne, Villefranche-sur-Cher, Gièvres.',
+    quartiers: ['Centre-ville', 'Pruniers-en-Sologne', 'Villefranche-sur-Cher', 'Gièvres', 'Selles-sur-Cher', 'Salbris', 'Cour-Cheverny'],
+  },
+  vendome: {
+    description: 'À Vendôme, commune du Loir-et-Cher (16 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural exceptionnel, nos professionnels interviennent dans toute la commune, ainsi que Saint-Ouen, Naveil, Montoire-sur-le-Loir.',
+    quartiers: ['Centre-ville', 'Saint-Ouen', 'Naveil', 'Montoire-sur-le-Loir'],
+  },
+  vineuil: {
+    description: 'Trouvez des artisans qualifiés à Vineuil (Loir-et-Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-controis-en-sologne': {
+    description: 'Trouvez des artisans qualifiés à Le Controis-en-Sologne (Loir-et-Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mer: {
+    description: 'Trouvez des artisans qualifiés à Mer (Loir-et-Cher). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
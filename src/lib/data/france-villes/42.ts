@@ -0,0 +1,120 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-etienne': { description: 'Ville design UNESCO, ancien bassin industriel.', quartiers: ['Centre-ville', 'Châteaucreux', 'Bellevue', 'Terrenoire', 'Montreynaud', 'La Métare'] },
+  'saint-chamond': {
+    description: 'Découvrez les meilleurs artisans à Saint-Chamond en Loire. Avec les Alpes et la vallée du Rhône et 36 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que L\'Horme, Saint-Jean-Bonnefonds, La Grand-Croix.',
+    quartiers: ['Centre-ville', 'L\'Horme', 'Saint-Jean-Bonnefonds', 'La Grand-Croix', 'Saint-Paul-en-Jarez', 'La Talaudière', 'Sorbiers'],
+  },
+  roanne: {
+    description: 'À Roanne, ville dynamique du Loire (35 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Le Coteau, Riorges, Perreux.',
+    quartiers: ['Centre-ville', 'Le Coteau', 'Riorges', 'Perreux', 'Mably', 'Commelle-Vernay', 'Villerest'],
+  },
+  firminy: {
+    description: 'Découvrez les meilleurs artisans à Firminy en Loire. Avec les Alpes et la vallée du Rhône et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Fraisses, Unieux, Le Chambon-Feugerolles.',
+    quartiers: ['Centre-ville', 'Fraisses', 'Unieux', 'Le Chambon-Feugerolles', 'Roche-la-Molière', 'La Ricamarie', 'Saint-Étienne'],
+  },
+  montbrison: {
+    description: 'À Montbrison, commune du Loire (16 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Savigneux, Champdieu, Saint-Romain-le-Puy.',
+    quartiers: ['Centre-ville', 'Savigneux', 'Champdieu', 'Saint-Romain-le-Puy', 'Sury-le-Comtal', 'Montrond-les-Bains', 'Saint-Cyprien'],
+  },
+  'saint-just-saint-rambert': {
+    description: 'Saint-Just-Saint-Rambert est une commune de 16 000 habitants située dans le département Loire en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Saint-Just-Saint-Rambert, ainsi que Bonson, Andrézieux-Bouthéon, Saint-Cyprien pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bonson', 'Andrézieux-Bouthéon', 'Saint-Cyprien', 'La Fouillouse', 'Saint-Marcellin-en-Forez', 'Sury-le-Comtal'],
+  },
+  'rive-de-gier': {
+    description: 'Rive-de-Gier est une commune de 15 000 habitants située dans le département Loire en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Rive-de-Gier, ainsi que Lorette, Genilac, Saint-Martin-la-Plaine pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Lorette', 'Genilac', 'Saint-Martin-la-Plaine', 'La Grand-Croix', 'Saint-Paul-en-Jarez', 'L\'Horme'],
+  },
+  'le-chambon-feugerolles': {
+    description: 'À Le Chambon-Feugerolles, commune du Loire (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que La Ricamarie, Firminy, Roche-la-Molière.',
+    quartiers: ['Centre-ville', 'La Ricamarie', 'Firminy', 'Roche-la-Molière', 'Saint-Étienne', 'Unieux', 'Fraisses'],
+  },
+  riorges: {
+    description: 'À Riorges, commune du Loire (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Roanne, Pouilly-les-Nonains, Le Coteau.',
+    quartiers: ['Centre-ville', 'Roanne', 'Pouilly-les-Nonains', 'Le Coteau', 'Villerest', 'Commelle-Vernay', 'Mably'],
+  },
+  'andrezieux-boutheon': {
+    description: 'Andrézieux-Bouthéon est une commune de 10 000 habitants située dans le département Loire en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Andrézieux-Bouthéon, ainsi que Veauche, Saint-Cyprien, Bonson pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Veauche', 'Saint-Cyprien', 'Bonson', 'La Fouillouse', 'Saint-Just-Saint-Rambert', 'Sury-le-Comtal'],
+  },
+  'roche-la-moliere': {
+    description: 'Trouvez des artisans qualifiés à Roche-la-Molière (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  veauche: {
+    description: 'Trouvez des artisans qualifiés à Veauche (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  unieux: {
+    description: 'Trouvez des artisans qualifiés à Unieux (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  feurs: {
+    description: 'Trouvez des artisans qualifiés à Feurs (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sorbiers: {
+    description: 'Trouvez des artisans qualifiés à Sorbiers (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ricamarie': {
+    description: 'Trouvez des artisans qualifiés à La Ricamarie (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  villars: {
+    description: 'Trouvez des artisans qualifiés à Villars (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mably: {
+    description: 'Trouvez des artisans qualifiés à Mably (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-talaudiere': {
+    description: 'Trouvez des artisans qualifiés à La Talaudière (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-coteau': {
+    description: 'Trouvez des artisans qualifiés à Le Coteau (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sury-le-comtal': {
+    description: 'Trouvez des artisans qualifiés à Sury-le-Comtal (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jean-bonnefonds': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-Bonnefonds (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-priest-en-jarez': {
+    description: 'Trouvez des artisans qualifiés à Saint-Priest-en-Jarez (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-genest-lerpt': {
+    description: 'Trouvez des artisans qualifiés à Saint-Genest-Lerpt (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-galmier': {
+    description: 'Trouvez des artisans qualifiés à Saint-Galmier (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montrond-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Montrond-les-Bains (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chazelles-sur-lyon': {
+    description: 'Trouvez des artisans qualifiés à Chazelles-sur-Lyon (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  villerest: {
+    description: 'Trouvez des artisans qualifiés à Villerest (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-marcellin-en-forez': {
+    description: 'Trouvez des artisans qualifiés à Saint-Marcellin-en-Forez (Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
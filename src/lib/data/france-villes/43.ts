@@ -0,0 +1,31 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'le-puy-en-velay': {
+    description: 'Le Puy-en-Velay (Haute-Loire, Auvergne-Rhône-Alpes) est une commune de 19 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Brives-Charensac, Vals-près-le-Puy, Chadrac.',
+    quartiers: ['Centre-ville', 'Brives-Charensac', 'Vals-près-le-Puy', 'Chadrac', 'Espaly-Saint-Marcel', 'Coubon', 'Polignac'],
+  },
+  'monistrol-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Monistrol-sur-Loire (Haute-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  yssingeaux: {
+    description: 'Trouvez des artisans qualifiés à Yssingeaux (Haute-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  brioude: {
+    description: 'Trouvez des artisans qualifiés à Brioude (Haute-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aurec-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Aurec-sur-Loire (Haute-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-sigolene': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Sigolène (Haute-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
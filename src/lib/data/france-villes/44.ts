@@ -0,0 +1,258 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  nantes: { description: 'Ville dynamique de l\'Ouest, connue pour sa créativité.', quartiers: ['Centre-ville', 'Île de Nantes', 'Doulon', 'Erdre', 'Chantenay'] },
+  'saint-nazaire': { description: 'Grand port de l\'Atlantique, chantiers navals.', quartiers: ['Centre-ville', 'Méan-Penhoët', 'Avalix', 'Trignac'] },
+  'saint-herblain': { description: 'Ville de la métropole nantaise.', quartiers: ['Bourg', 'Sillon', 'Joli Mai', 'Bagatelle'] },
+  reze: {
+    description: 'Besoin d’un professionnel à Rezé ? Située en Pays de la Loire, cette ville dynamique du Loire-Atlantique bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Les Sorinières, Bouguenais, Pont-Saint-Martin.',
+    quartiers: ['Centre-ville', 'Les Sorinières', 'Bouguenais', 'Pont-Saint-Martin', 'Saint-Sébastien-sur-Loire', 'Saint-Aignan-Grandlieu', 'Vertou'],
+  },
+  'saint-sebastien-sur-loire': {
+    description: 'Saint-Sébastien-sur-Loire (Loire-Atlantique, Pays de la Loire) est une ville active de 29 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Basse-Goulaine, Rezé, Nantes.',
+    quartiers: ['Centre-ville', 'Basse-Goulaine', 'Rezé', 'Nantes', 'Sainte-Luce-sur-Loire', 'Vertou', 'Haute-Goulaine'],
+  },
+  orvault: {
+    description: 'Orvault (Loire-Atlantique, Pays de la Loire) est une ville active de 29 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Treillières, Sautron, La Chapelle-sur-Erdre.',
+    quartiers: ['Centre-ville', 'Treillières', 'Sautron', 'La Chapelle-sur-Erdre', 'Saint-Herblain', 'Nantes', 'Vigneux-de-Bretagne'],
+  },
+  vertou: {
+    description: 'Vertou (Loire-Atlantique, Pays de la Loire) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Les Sorinières, Château-Thébaud, La Haie-Fouassière.',
+    quartiers: ['Centre-ville', 'Les Sorinières', 'Château-Thébaud', 'La Haie-Fouassière', 'Haute-Goulaine', 'Saint-Sébastien-sur-Loire', 'Le Bignon'],
+  },
+  coueron: {
+    description: 'Trouvez un artisan de confiance à Couëron (Loire-Atlantique). Avec 24 000 habitants, cette ville active ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Étienne-de-Montluc, Saint-Jean-de-Boiseau, Sautron.',
+    quartiers: ['Centre-ville', 'Saint-Étienne-de-Montluc', 'Saint-Jean-de-Boiseau', 'Sautron', 'Le Pellerin', 'Indre', 'La Montagne'],
+  },
+  carquefou: {
+    description: 'À Carquefou, ville active du Loire-Atlantique (21 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour les châteaux de la Loire, nos professionnels interviennent dans toute la commune, ainsi que Thouaré-sur-Loire, Sainte-Luce-sur-Loire, Mauves-sur-Loire.',
+    quartiers: ['Centre-ville', 'Thouaré-sur-Loire', 'Sainte-Luce-sur-Loire', 'Mauves-sur-Loire', 'Saint-Mars-du-Désert', 'La Chapelle-sur-Erdre', 'Sucé-sur-Erdre'],
+  },
+  'la-chapelle-sur-erdre': {
+    description: 'Trouvez un artisan de confiance à La Chapelle-sur-Erdre (Loire-Atlantique). Avec 21 000 habitants, cette ville active ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Treillières, Orvault, Sucé-sur-Erdre.',
+    quartiers: ['Centre-ville', 'Treillières', 'Orvault', 'Sucé-sur-Erdre', 'Carquefou', 'Nantes', 'Grandchamp-des-Fontaines'],
+  },
+  bouguenais: {
+    description: 'Besoin d’un professionnel à Bouguenais ? Située en Pays de la Loire, cette ville active du Loire-Atlantique bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Rezé, Saint-Aignan-Grandlieu, Bouaye.',
+    quartiers: ['Centre-ville', 'Rezé', 'Saint-Aignan-Grandlieu', 'Bouaye', 'Indre', 'La Montagne', 'Saint-Herblain'],
+  },
+  pornic: {
+    description: 'À Pornic, commune du Loire-Atlantique (19 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour les châteaux de la Loire, nos professionnels interviennent dans toute la commune, ainsi que Chauvé, La Bernerie-en-Retz, Saint-Michel-Chef-Chef.',
+    quartiers: ['Centre-ville', 'Chauvé', 'La Bernerie-en-Retz', 'Saint-Michel-Chef-Chef', 'La Plaine-sur-Mer', 'Chaumes-en-Retz', 'Saint-Père-en-Retz'],
+  },
+  'la-baule-escoublac': {
+    description: 'Artisans référencés à La Baule-Escoublac et ses environs. Cette commune ligérienne de 17 000 habitants en Loire-Atlantique compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Pornichet, Saint-André-des-Eaux, Le Pouliguen.',
+    quartiers: ['Centre-ville', 'Pornichet', 'Saint-André-des-Eaux', 'Le Pouliguen', 'Guérande', 'Batz-sur-Mer', 'Saint-Nazaire'],
+  },
+  guerande: {
+    description: 'Vous habitez à Guérande ou ses environs ? Nos artisans qualifiés du Loire-Atlantique sont disponibles pour tous vos travaux. Guérande, commune ligérienne de 17 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Molf, La Turballe, La Baule-Escoublac.',
+    quartiers: ['Centre-ville', 'Saint-Molf', 'La Turballe', 'La Baule-Escoublac', 'Saint-Lyphard', 'Le Pouliguen', 'Batz-sur-Mer'],
+  },
+  'sainte-luce-sur-loire': {
+    description: 'Trouvez un artisan de confiance à Sainte-Luce-sur-Loire (Loire-Atlantique). Avec 16 000 habitants, cette commune ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Thouaré-sur-Loire, Basse-Goulaine, Carquefou.',
+    quartiers: ['Centre-ville', 'Thouaré-sur-Loire', 'Basse-Goulaine', 'Carquefou', 'Saint-Julien-de-Concelles', 'Saint-Sébastien-sur-Loire', 'Nantes'],
+  },
+  'saint-brevin-les-pins': {
+    description: 'Besoin d’un professionnel à Saint-Brevin-les-Pins ? Située en Pays de la Loire, cette commune du Loire-Atlantique bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Corsept, Saint-Père-en-Retz, Saint-Nazaire.',
+    quartiers: ['Centre-ville', 'Corsept', 'Saint-Père-en-Retz', 'Saint-Nazaire', 'Trignac', 'Saint-Michel-Chef-Chef', 'Montoir-de-Bretagne'],
+  },
+  pornichet: {
+    description: 'Artisans référencés à Pornichet et ses environs. Cette commune ligérienne de 13 000 habitants en Loire-Atlantique compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Baule-Escoublac, Saint-Nazaire, Saint-André-des-Eaux.',
+    quartiers: ['Centre-ville', 'La Baule-Escoublac', 'Saint-Nazaire', 'Saint-André-des-Eaux', 'Le Pouliguen', 'Trignac', 'Guérande'],
+  },
+  chateaubriant: {
+    description: 'Artisans référencés à Châteaubriant et ses environs. Cette commune ligérienne de 12 000 habitants en Loire-Atlantique compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Rougé, Erbray, Abbaretz.',
+    quartiers: ['Centre-ville', 'Rougé', 'Erbray', 'Abbaretz', 'Derval', 'Nozay', 'Riaillé'],
+  },
+  'ancenis-saint-gereon': {
+    description: 'Besoin d’un professionnel à Ancenis-Saint-Géréon ? Située en Pays de la Loire, cette commune du Loire-Atlantique bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Vair-sur-Loire, Mésanger, Oudon.',
+    quartiers: ['Centre-ville', 'Vair-sur-Loire', 'Mésanger', 'Oudon', 'Couffé', 'Loireauxence', 'Mouzeil'],
+  },
+  pontchateau: {
+    description: 'Pontchâteau (Loire-Atlantique, Pays de la Loire) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Drefféac, Sainte-Anne-sur-Brivet, Crossac.',
+    quartiers: ['Centre-ville', 'Drefféac', 'Sainte-Anne-sur-Brivet', 'Crossac', 'Besné', 'Sainte-Reine-de-Bretagne', 'Campbon'],
+  },
+  'thouare-sur-loire': {
+    description: 'À Thouaré-sur-Loire, commune du Loire-Atlantique (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour les châteaux de la Loire, nos professionnels interviennent dans toute la commune, ainsi que Saint-Julien-de-Concelles, Carquefou, Sainte-Luce-sur-Loire.',
+    quartiers: ['Centre-ville', 'Saint-Julien-de-Concelles', 'Carquefou', 'Sainte-Luce-sur-Loire', 'Mauves-sur-Loire', 'Divatte-sur-Loire', 'Basse-Goulaine'],
+  },
+  treillieres: {
+    description: 'Vous habitez à Treillières ou ses environs ? Nos artisans qualifiés du Loire-Atlantique sont disponibles pour tous vos travaux. Treillières, commune ligérienne de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Orvault, La Chapelle-sur-Erdre, Grandchamp-des-Fontaines.',
+    quartiers: ['Centre-ville', 'Orvault', 'La Chapelle-sur-Erdre', 'Grandchamp-des-Fontaines', 'Sautron', 'Vigneux-de-Bretagne', 'Sucé-sur-Erdre'],
+  },
+  blain: {
+    description: 'Découvrez les meilleurs artisans à Blain en Loire-Atlantique. Avec la façade atlantique et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Bouvron, Fay-de-Bretagne, Notre-Dame-des-Landes.',
+    quartiers: ['Centre-ville', 'Bouvron', 'Fay-de-Bretagne', 'Notre-Dame-des-Landes', 'Vay', 'Héric', 'Malville'],
+  },
+  'basse-goulaine': {
+    description: 'Trouvez des artisans qualifiés à Basse-Goulaine (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nort-sur-erdre': {
+    description: 'Trouvez des artisans qualifiés à Nort-sur-Erdre (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  savenay: {
+    description: 'Trouvez des artisans qualifiés à Savenay (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vallet: {
+    description: 'Trouvez des artisans qualifiés à Vallet (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-philbert-de-grand-lieu': {
+    description: 'Trouvez des artisans qualifiés à Saint-Philbert-de-Grand-Lieu (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-sorinieres': {
+    description: 'Trouvez des artisans qualifiés à Les Sorinières (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sautron: {
+    description: 'Trouvez des artisans qualifiés à Sautron (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-loroux-bottereau': {
+    description: 'Trouvez des artisans qualifiés à Le Loroux-Bottereau (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  trignac: {
+    description: 'Trouvez des artisans qualifiés à Trignac (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bouaye: {
+    description: 'Trouvez des artisans qualifiés à Bouaye (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  donges: {
+    description: 'Trouvez des artisans qualifiés à Donges (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-julien-de-concelles': {
+    description: 'Trouvez des artisans qualifiés à Saint-Julien-de-Concelles (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-etienne-de-montluc': {
+    description: 'Trouvez des artisans qualifiés à Saint-Étienne-de-Montluc (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'machecoul-saint-meme': {
+    description: 'Trouvez des artisans qualifiés à Machecoul-Saint-Même (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  loireauxence: {
+    description: 'Trouvez des artisans qualifiés à Loireauxence (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'suce-sur-erdre': {
+    description: 'Trouvez des artisans qualifiés à Sucé-sur-Erdre (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  clisson: {
+    description: 'Trouvez des artisans qualifiés à Clisson (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chaumes-en-retz': {
+    description: 'Trouvez des artisans qualifiés à Chaumes-en-Retz (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montoir-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Montoir-de-Bretagne (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'divatte-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Divatte-sur-Loire (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  herbignac: {
+    description: 'Trouvez des artisans qualifiés à Herbignac (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-pazanne': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Pazanne (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pont-saint-martin': {
+    description: 'Trouvez des artisans qualifiés à Pont-Saint-Martin (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'grandchamp-des-fontaines': {
+    description: 'Trouvez des artisans qualifiés à Grandchamp-des-Fontaines (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-andre-des-eaux': {
+    description: 'Trouvez des artisans qualifiés à Saint-André-des-Eaux (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vallons-de-l-erdre': {
+    description: 'Trouvez des artisans qualifiés à Vallons-de-l\'Erdre (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vigneux-de-bretagne': {
+    description: 'Trouvez des artisans qualifiés à Vigneux-de-Bretagne (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  heric: {
+    description: 'Trouvez des artisans qualifiés à Héric (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-chevroliere': {
+    description: 'Trouvez des artisans qualifiés à La Chevrolière (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-montagne': {
+    description: 'Trouvez des artisans qualifiés à La Montagne (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'haute-goulaine': {
+    description: 'Trouvez des artisans qualifiés à Haute-Goulaine (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jean-de-boiseau': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-de-Boiseau (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-michel-chef-chef': {
+    description: 'Trouvez des artisans qualifiés à Saint-Michel-Chef-Chef (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  missillac: {
+    description: 'Trouvez des artisans qualifiés à Missillac (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ligne: {
+    description: 'Trouvez des artisans qualifiés à Ligné (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-mars-du-desert': {
+    description: 'Trouvez des artisans qualifiés à Saint-Mars-du-Désert (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plesse: {
+    description: 'Trouvez des artisans qualifiés à Plessé (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-pellerin': {
+    description: 'Trouvez des artisans qualifiés à Le Pellerin (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-lyphard': {
+    description: 'Trouvez des artisans qualifiés à Saint-Lyphard (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'guemene-penfao': {
+    description: 'Trouvez des artisans qualifiés à Guémené-Penfao (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gorges: {
+    description: 'Trouvez des artisans qualifiés à Gorges (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villeneuve-en-retz': {
+    description: 'Trouvez des artisans qualifiés à Villeneuve-en-Retz (Loire-Atlantique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,100 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  orleans: { description: 'Cité johannique sur les bords de la Loire.', quartiers: ['Centre-ville', 'La Source', 'Saint-Marceau', 'Argonne', 'Madeleine'] },
+  olivet: {
+    description: 'À Olivet, ville active du Loiret (24 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural exceptionnel, nos professionnels interviennent dans toute la commune, ainsi que Orléans, Saint-Pryvé-Saint-Mesmin, Saint-Jean-le-Blanc.',
+    quartiers: ['Centre-ville', 'Orléans', 'Saint-Pryvé-Saint-Mesmin', 'Saint-Jean-le-Blanc', 'Saint-Hilaire-Saint-Mesmin', 'La Chapelle-Saint-Mesmin', 'Saint-Jean-de-la-Ruelle'],
+  },
+  'saint-jean-de-braye': {
+    description: 'Saint-Jean-de-Braye est une ville active de 23 000 habitants située dans le département Loiret en Centre-Val de Loire. Nos artisans qualifiés interviennent à Saint-Jean-de-Braye, ainsi que Semoy, Boigny-sur-Bionne, Fleury-les-Aubrais pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Semoy', 'Boigny-sur-Bionne', 'Fleury-les-Aubrais', 'Chécy', 'Saint-Denis-en-Val', 'Saint-Jean-le-Blanc'],
+  },
+  'fleury-les-aubrais': {
+    description: 'Artisans référencés à Fleury-les-Aubrais et ses environs. Cette ville active du Centre de 22 000 habitants en Loiret compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saran, Semoy, Saint-Jean-de-Braye.',
+    quartiers: ['Centre-ville', 'Saran', 'Semoy', 'Saint-Jean-de-Braye', 'Saint-Jean-de-la-Ruelle', 'Saint-Jean-le-Blanc', 'Boigny-sur-Bionne'],
+  },
+  saran: {
+    description: 'Saran (Loiret, Centre-Val de Loire) est une commune de 17 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Fleury-les-Aubrais, Saint-Jean-de-la-Ruelle, Ormes.',
+    quartiers: ['Centre-ville', 'Fleury-les-Aubrais', 'Saint-Jean-de-la-Ruelle', 'Ormes', 'Ingré', 'Gidy', 'Semoy'],
+  },
+  'saint-jean-de-la-ruelle': {
+    description: 'Saint-Jean-de-la-Ruelle est une commune de 17 000 habitants située dans le département Loiret en Centre-Val de Loire. Nos artisans qualifiés interviennent à Saint-Jean-de-la-Ruelle, ainsi que Saint-Pryvé-Saint-Mesmin, La Chapelle-Saint-Mesmin, Saran pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Pryvé-Saint-Mesmin', 'La Chapelle-Saint-Mesmin', 'Saran', 'Ingré', 'Orléans', 'Fleury-les-Aubrais'],
+  },
+  montargis: {
+    description: 'Artisans référencés à Montargis et ses environs. Cette commune du Centre de 15 000 habitants en Loiret compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Châlette-sur-Loing, Amilly, Villemandeur.',
+    quartiers: ['Centre-ville', 'Châlette-sur-Loing', 'Amilly', 'Villemandeur', 'Pannes', 'Corquilleroy', 'Cepoy'],
+  },
+  amilly: {
+    description: 'Amilly est une commune de 14 000 habitants située dans le département Loiret en Centre-Val de Loire. Nos artisans qualifiés interviennent à Amilly, ainsi que Montargis, Châlette-sur-Loing, Villemandeur pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Montargis', 'Châlette-sur-Loing', 'Villemandeur', 'Cepoy', 'Pannes', 'Corquilleroy'],
+  },
+  gien: {
+    description: 'À Gien, commune du Loiret (13 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural exceptionnel, nos professionnels interviennent dans toute la commune, ainsi que Poilly-lez-Gien, Briare, Nogent-sur-Vernisson.',
+    quartiers: ['Centre-ville', 'Poilly-lez-Gien', 'Briare', 'Nogent-sur-Vernisson', 'Coullons', 'Ouzouer-sur-Loire', 'Châtillon-sur-Loire'],
+  },
+  'chalette-sur-loing': {
+    description: 'Châlette-sur-Loing est une commune de 13 000 habitants située dans le département Loiret en Centre-Val de Loire. Nos artisans qualifiés interviennent à Châlette-sur-Loing, ainsi que Montargis, Cepoy, Corquilleroy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Montargis', 'Cepoy', 'Corquilleroy', 'Amilly', 'Pannes', 'Villemandeur'],
+  },
+  'la-chapelle-saint-mesmin': {
+    description: 'La Chapelle-Saint-Mesmin (Loiret, Centre-Val de Loire) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Pryvé-Saint-Mesmin, Saint-Jean-de-la-Ruelle, Saint-Hilaire-Saint-Mesmin.',
+    quartiers: ['Centre-ville', 'Saint-Pryvé-Saint-Mesmin', 'Saint-Jean-de-la-Ruelle', 'Saint-Hilaire-Saint-Mesmin', 'Ingré', 'Chaingy', 'Olivet'],
+  },
+  ingre: {
+    description: 'Trouvez un artisan de confiance à Ingré (Loiret). Avec 10 000 habitants, cette commune du Centre dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ormes, La Chapelle-Saint-Mesmin, Saint-Jean-de-la-Ruelle.',
+    quartiers: ['Centre-ville', 'Ormes', 'La Chapelle-Saint-Mesmin', 'Saint-Jean-de-la-Ruelle', 'Chaingy', 'Saint-Pryvé-Saint-Mesmin', 'Saran'],
+  },
+  'saint-jean-le-blanc': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-le-Blanc (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  checy: {
+    description: 'Trouvez des artisans qualifiés à Chécy (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pithiviers: {
+    description: 'Trouvez des artisans qualifiés à Pithiviers (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chateauneuf-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Châteauneuf-sur-Loire (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beaugency: {
+    description: 'Trouvez des artisans qualifiés à Beaugency (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-malesherbois': {
+    description: 'Trouvez des artisans qualifiés à Le Malesherbois (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-denis-en-val': {
+    description: 'Trouvez des artisans qualifiés à Saint-Denis-en-Val (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ferte-saint-aubin': {
+    description: 'Trouvez des artisans qualifiés à La Ferté-Saint-Aubin (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  villemandeur: {
+    description: 'Trouvez des artisans qualifiés à Villemandeur (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'meung-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Meung-sur-Loire (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pryve-saint-mesmin': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pryvé-Saint-Mesmin (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sully-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Sully-sur-Loire (Loiret). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
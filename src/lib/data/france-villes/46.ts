@@ -0,0 +1,12 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  cahors: { description: 'Ville du vin de Cahors et du pont Valentré.', quartiers: ['Centre historique', 'Cabessut', 'Terre-Rouge', 'Sainte-Valérie'] },
+  figeac: {
+    description: 'Trouvez des artisans qualifiés à Figeac (Lot). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,44 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  agen: { description: 'Capitale du pruneau.', quartiers: ['Centre-ville', 'Montanou', 'Pin', 'Ermitage'] },
+  'villeneuve-sur-lot': {
+    description: 'Besoin d’un professionnel à Villeneuve-sur-Lot ? Située en Nouvelle-Aquitaine, cette ville active du Lot-et-Garonne bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Sylvestre-sur-Lot, Bias, Pujols.',
+    quartiers: ['Centre-ville', 'Saint-Sylvestre-sur-Lot', 'Bias', 'Pujols', 'Penne-d\'Agenais', 'Monflanquin', 'Casseneuil'],
+  },
+  marmande: {
+    description: 'Marmande (Lot-et-Garonne, Nouvelle-Aquitaine) est une commune de 17 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Sainte-Bazeille, Miramont-de-Guyenne, Tonneins.',
+    quartiers: ['Centre-ville', 'Sainte-Bazeille', 'Miramont-de-Guyenne', 'Tonneins', 'Casteljaloux', 'Clairac'],
+  },
+  tonneins: {
+    description: 'Trouvez des artisans qualifiés à Tonneins (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-passage': {
+    description: 'Trouvez des artisans qualifiés à Le Passage (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nerac: {
+    description: 'Trouvez des artisans qualifiés à Nérac (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-livrade-sur-lot': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Livrade-sur-Lot (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bon-encontre': {
+    description: 'Trouvez des artisans qualifiés à Bon-Encontre (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  boe: {
+    description: 'Trouvez des artisans qualifiés à Boé (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  foulayronnes: {
+    description: 'Trouvez des artisans qualifiés à Foulayronnes (Lot-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,11 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  mende: {
+    description: 'Trouvez un artisan de confiance à Mende (Lozère). Avec 12 000 habitants, cette commune occitane dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Marvejols, Bourgs sur Colagne, La Canourgue.',
+    quartiers: ['Centre-ville', 'Marvejols', 'Bourgs sur Colagne', 'La Canourgue', 'Peyre en Aubrac'],
+  },
+}
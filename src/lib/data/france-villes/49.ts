@@ -0,0 +1,149 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  angers: { description: 'Ville verte au patrimoine médiéval remarquable.', quartiers: ['Centre-ville', 'Doutre', 'Belle-Beille', 'Monplaisir', 'Roseraie'] },
+  cholet: { description: 'Capitale industrielle des Mauges.', quartiers: ['Centre-ville', 'Bonnevay', 'Bretagne', 'Jean Monnet'] },
+  saumur: {
+    description: 'Saumur (Maine-et-Loire, Pays de la Loire) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Vivy, Allonnes, Bellevigne-les-Châteaux.',
+    quartiers: ['Centre-ville', 'Vivy', 'Allonnes', 'Bellevigne-les-Châteaux', 'Brain-sur-Allonnes', 'Gennes-Val-de-Loire', 'Longué-Jumelles'],
+  },
+  sevremoine: {
+    description: 'Sèvremoine est une ville active de 26 000 habitants située dans le département Maine-et-Loire en Pays de la Loire. Nos artisans qualifiés interviennent à Sèvremoine, ainsi que La Romagne, La Séguinière, Saint-Christophe-du-Bois pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'La Romagne', 'La Séguinière', 'Saint-Christophe-du-Bois', 'Bégrolles-en-Mauges', 'Saint-Léger-sous-Cholet', 'Beaupréau-en-Mauges'],
+  },
+  'beaupreau-en-mauges': {
+    description: 'Beaupréau-en-Mauges (Maine-et-Loire, Pays de la Loire) est une ville active de 24 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Montrevault-sur-Èvre, Bégrolles-en-Mauges, Le May-sur-Èvre.',
+    quartiers: ['Centre-ville', 'Montrevault-sur-Èvre', 'Bégrolles-en-Mauges', 'Le May-sur-Èvre', 'Saint-Léger-sous-Cholet', 'La Séguinière', 'Sèvremoine'],
+  },
+  'chemille-en-anjou': {
+    description: 'Trouvez un artisan de confiance à Chemillé-en-Anjou (Maine-et-Loire). Avec 22 000 habitants, cette ville active ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Val-du-Layon, Bellevigne-en-Layon, Trémentines.',
+    quartiers: ['Centre-ville', 'Val-du-Layon', 'Bellevigne-en-Layon', 'Trémentines', 'Rochefort-sur-Loire', 'Chalonnes-sur-Loire', 'Le May-sur-Èvre'],
+  },
+  'mauges-sur-loire': {
+    description: 'Trouvez un artisan de confiance à Mauges-sur-Loire (Maine-et-Loire). Avec 19 000 habitants, cette commune ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ingrandes-le-Fresne-sur-Loire, Chalonnes-sur-Loire, Montrevault-sur-Èvre.',
+    quartiers: ['Centre-ville', 'Ingrandes-le-Fresne-sur-Loire', 'Chalonnes-sur-Loire', 'Montrevault-sur-Èvre', 'Saint-Georges-sur-Loire', 'Beaupréau-en-Mauges', 'La Possonnière'],
+  },
+  'segre-en-anjou-bleu': {
+    description: 'Artisans référencés à Segré-en-Anjou Bleu et ses environs. Cette commune ligérienne de 18 000 habitants en Maine-et-Loire compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Le Lion-d\'Angers, Erdre-en-Anjou, Ombrée d\'Anjou.',
+    quartiers: ['Centre-ville', 'Le Lion-d\'Angers', 'Erdre-en-Anjou', 'Ombrée d\'Anjou', 'Candé', 'Longuenée-en-Anjou', 'Saint-Clément-de-la-Place'],
+  },
+  'oree-d-anjou': {
+    description: 'Vous habitez à Orée d\'Anjou ou ses environs ? Nos artisans qualifiés du Maine-et-Loire sont disponibles pour tous vos travaux. Orée d\'Anjou, commune ligérienne de 17 000 habitants, mérite des professionnels à la hauteur, ainsi que Montrevault-sur-Èvre, Beaupréau-en-Mauges, Mauges-sur-Loire.',
+    quartiers: ['Centre-ville', 'Montrevault-sur-Èvre', 'Beaupréau-en-Mauges', 'Mauges-sur-Loire'],
+  },
+  'loire-authion': {
+    description: 'Loire-Authion est une commune de 17 000 habitants située dans le département Maine-et-Loire en Pays de la Loire. Nos artisans qualifiés interviennent à Loire-Authion, ainsi que Le Plessis-Grammoire, Mazé-Milon, Trélazé pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Plessis-Grammoire', 'Mazé-Milon', 'Trélazé', 'Saint-Barthélemy-d\'Anjou', 'Verrières-en-Anjou', 'La Ménitré'],
+  },
+  trelaze: {
+    description: 'Vous habitez à Trélazé ou ses environs ? Nos artisans qualifiés du Maine-et-Loire sont disponibles pour tous vos travaux. Trélazé, commune ligérienne de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Barthélemy-d\'Anjou, Les Ponts-de-Cé, Le Plessis-Grammoire.',
+    quartiers: ['Centre-ville', 'Saint-Barthélemy-d\'Anjou', 'Les Ponts-de-Cé', 'Le Plessis-Grammoire', 'Angers', 'Verrières-en-Anjou', 'Sainte-Gemmes-sur-Loire'],
+  },
+  'montrevault-sur-evre': {
+    description: 'Besoin d’un professionnel à Montrevault-sur-Èvre ? Située en Pays de la Loire, cette commune du Maine-et-Loire bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Beaupréau-en-Mauges, Mauges-sur-Loire, Bégrolles-en-Mauges.',
+    quartiers: ['Centre-ville', 'Beaupréau-en-Mauges', 'Mauges-sur-Loire', 'Bégrolles-en-Mauges', 'Orée d\'Anjou', 'Le May-sur-Èvre', 'Saint-Léger-sous-Cholet'],
+  },
+  avrille: {
+    description: 'À Avrillé, commune du Maine-et-Loire (15 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour les châteaux de la Loire, nos professionnels interviennent dans toute la commune, ainsi que Angers, Beaucouzé, Montreuil-Juigné.',
+    quartiers: ['Centre-ville', 'Angers', 'Beaucouzé', 'Montreuil-Juigné', 'Cantenay-Épinard', 'Écouflant', 'Saint-Lambert-la-Potherie'],
+  },
+  'les-ponts-de-ce': {
+    description: 'Vous habitez à Les Ponts-de-Cé ou ses environs ? Nos artisans qualifiés du Maine-et-Loire sont disponibles pour tous vos travaux. Les Ponts-de-Cé, commune ligérienne de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Trélazé, Sainte-Gemmes-sur-Loire, Mûrs-Erigné.',
+    quartiers: ['Centre-ville', 'Trélazé', 'Sainte-Gemmes-sur-Loire', 'Mûrs-Erigné', 'Saint-Melaine-sur-Aubance', 'Les Garennes sur Loire', 'Saint-Barthélemy-d\'Anjou'],
+  },
+  'bauge-en-anjou': {
+    description: 'Besoin d’un professionnel à Baugé-en-Anjou ? Située en Pays de la Loire, cette commune du Maine-et-Loire bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Jarzé Villages, Les Bois d\'Anjou, Beaufort-en-Anjou.',
+    quartiers: ['Centre-ville', 'Jarzé Villages', 'Les Bois d\'Anjou', 'Beaufort-en-Anjou', 'Durtal', 'Mazé-Milon', 'Noyant-Villages'],
+  },
+  'doue-en-anjou': {
+    description: 'À Doué-en-Anjou, commune du Maine-et-Loire (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour les châteaux de la Loire, nos professionnels interviennent dans toute la commune, ainsi que Lys-Haut-Layon, Terranjou, Montreuil-Bellay.',
+    quartiers: ['Centre-ville', 'Lys-Haut-Layon', 'Terranjou', 'Montreuil-Bellay', 'Gennes-Val-de-Loire', 'Brissac Loire Aubance', 'Saumur'],
+  },
+  'brissac-loire-aubance': {
+    description: 'Trouvez un artisan de confiance à Brissac Loire Aubance (Maine-et-Loire). Avec 11 000 habitants, cette commune ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Les Garennes sur Loire, Terranjou, Saint-Melaine-sur-Aubance.',
+    quartiers: ['Centre-ville', 'Les Garennes sur Loire', 'Terranjou', 'Saint-Melaine-sur-Aubance', 'Bellevigne-en-Layon', 'Les Ponts-de-Cé', 'Mûrs-Erigné'],
+  },
+  'saint-barthelemy-d-anjou': {
+    description: 'Trouvez des artisans qualifiés à Saint-Barthélemy-d\'Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ombree-d-anjou': {
+    description: 'Trouvez des artisans qualifiés à Ombrée d\'Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-hauts-d-anjou': {
+    description: 'Trouvez des artisans qualifiés à Les Hauts-d\'Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gennes-val-de-loire': {
+    description: 'Trouvez des artisans qualifiés à Gennes-Val-de-Loire (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'verrieres-en-anjou': {
+    description: 'Trouvez des artisans qualifiés à Verrières-en-Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montreuil-juigne': {
+    description: 'Trouvez des artisans qualifiés à Montreuil-Juigné (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'lys-haut-layon': {
+    description: 'Trouvez des artisans qualifiés à Lys-Haut-Layon (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'beaufort-en-anjou': {
+    description: 'Trouvez des artisans qualifiés à Beaufort-en-Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chalonnes-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Chalonnes-sur-Loire (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bouchemaine: {
+    description: 'Trouvez des artisans qualifiés à Bouchemaine (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'longuenee-en-anjou': {
+    description: 'Trouvez des artisans qualifiés à Longuenée-en-Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'longue-jumelles': {
+    description: 'Trouvez des artisans qualifiés à Longué-Jumelles (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'murs-erigne': {
+    description: 'Trouvez des artisans qualifiés à Mûrs-Erigné (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bellevigne-en-layon': {
+    description: 'Trouvez des artisans qualifiés à Bellevigne-en-Layon (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'erdre-en-anjou': {
+    description: 'Trouvez des artisans qualifiés à Erdre-en-Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'maze-milon': {
+    description: 'Trouvez des artisans qualifiés à Mazé-Milon (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beaucouze: {
+    description: 'Trouvez des artisans qualifiés à Beaucouzé (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'rives-du-loir-en-anjou': {
+    description: 'Trouvez des artisans qualifiés à Rives-du-Loir-en-Anjou (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noyant-villages': {
+    description: 'Trouvez des artisans qualifiés à Noyant-Villages (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-lion-d-angers': {
+    description: 'Trouvez des artisans qualifiés à Le Lion-d\'Angers (Maine-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,48 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'cherbourg-en-cotentin': { description: 'Grand port transatlantique normand.', quartiers: ['Centre-ville', 'Équeurdreville', 'Octeville', 'Tourlaville', 'Val-de-Saire', 'Querqueville', 'La Glacerie'] },
+  'saint-lo': {
+    description: 'Artisans référencés à Saint-Lô et ses environs. Cette commune normande de 19 000 habitants en Manche compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Agneaux, Condé-sur-Vire, Bourgvallées.',
+    quartiers: ['Centre-ville', 'Agneaux', 'Condé-sur-Vire', 'Bourgvallées', 'Saint-Jean-d\'Elle', 'Marigny-Le-Lozon', 'Saint-Amand-Villages'],
+  },
+  granville: {
+    description: 'Artisans référencés à Granville et ses environs. Cette commune normande de 13 000 habitants en Manche compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Donville-les-Bains, Bréhal, Saint-Pair-sur-Mer.',
+    quartiers: ['Centre-ville', 'Donville-les-Bains', 'Bréhal', 'Saint-Pair-sur-Mer', 'Jullouville', 'Agon-Coutainville'],
+  },
+  'la-hague': {
+    description: 'Vous habitez à La Hague ou ses environs ? Nos artisans qualifiés du Manche sont disponibles pour tous vos travaux. La Hague, commune normande de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Cherbourg-en-Cotentin, Les Pieux, Brix.',
+    quartiers: ['Centre-ville', 'Cherbourg-en-Cotentin', 'Les Pieux', 'Brix', 'Bricquebec-en-Cotentin'],
+  },
+  'carentan-les-marais': {
+    description: 'Vous habitez à Carentan-les-Marais ou ses environs ? Nos artisans qualifiés du Manche sont disponibles pour tous vos travaux. Carentan-les-Marais, commune normande de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Sainte-Mère-Église, Picauville, Périers.',
+    quartiers: ['Centre-ville', 'Sainte-Mère-Église', 'Picauville', 'Périers', 'Marigny-Le-Lozon', 'Agneaux', 'Saint-Lô'],
+  },
+  avranches: {
+    description: 'À Avranches, commune du Manche (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Ducey-Les Chéris, Sartilly-Baie-Bocage, Isigny-le-Buat.',
+    quartiers: ['Centre-ville', 'Ducey-Les Chéris', 'Sartilly-Baie-Bocage', 'Isigny-le-Buat', 'Brécey', 'Pontorson', 'Jullouville'],
+  },
+  coutances: {
+    description: 'Trouvez des artisans qualifiés à Coutances (Manche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  valognes: {
+    description: 'Trouvez des artisans qualifiés à Valognes (Manche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bricquebec-en-cotentin': {
+    description: 'Trouvez des artisans qualifiés à Bricquebec-en-Cotentin (Manche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-hilaire-du-harcouet': {
+    description: 'Trouvez des artisans qualifiés à Saint-Hilaire-du-Harcouët (Manche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-james': {
+    description: 'Trouvez des artisans qualifiés à Saint-James (Manche). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
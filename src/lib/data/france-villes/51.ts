@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  reims: { description: 'Cité des sacres, capitale du champagne.', quartiers: ['Centre-ville', 'Clairmarais', 'Croix-Rouge', 'Jean-Jaurès', 'Tinqueux', 'Cormontreuil', 'Wilson'] },
+  'chalons-en-champagne': { description: 'Préfecture de la Marne, ville d\'art.', quartiers: ['Centre-ville', 'Croix-Jean-Robert', 'Mont-Héry', 'Verbeau'] },
+  epernay: { description: 'Capitale du Champagne.', quartiers: ['Centre-ville', 'Bernon', 'Clara-Zetkin', 'Maison Blanche'] },
+  'vitry-le-francois': {
+    description: 'Besoin d’un professionnel à Vitry-le-François ? Située en Grand Est, cette commune du Marne bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tinqueux: {
+    description: 'À Tinqueux, commune du Marne (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Saint-Brice-Courcelles, Bezannes, Reims.',
+    quartiers: ['Centre-ville', 'Saint-Brice-Courcelles', 'Bezannes', 'Reims', 'Cormontreuil', 'Bétheny', 'Muizon'],
+  },
+  betheny: {
+    description: 'Trouvez des artisans qualifiés à Bétheny (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cormontreuil: {
+    description: 'Trouvez des artisans qualifiés à Cormontreuil (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fismes: {
+    description: 'Trouvez des artisans qualifiés à Fismes (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-memmie': {
+    description: 'Trouvez des artisans qualifiés à Saint-Memmie (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ay-champagne': {
+    description: 'Trouvez des artisans qualifiés à Aÿ-Champagne (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bezannes: {
+    description: 'Trouvez des artisans qualifiés à Bezannes (Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,19 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-dizier': {
+    description: 'À Saint-Dizier, ville active du Haute-Marne (23 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Éclaron-Braucourt-Sainte-Livière, Wassy, La Porte du Der.',
+    quartiers: ['Centre-ville', 'Éclaron-Braucourt-Sainte-Livière', 'Wassy', 'La Porte du Der'],
+  },
+  chaumont: {
+    description: 'Vous habitez à Chaumont ou ses environs ? Nos artisans qualifiés du Haute-Marne sont disponibles pour tous vos travaux. Chaumont, ville active du Grand Est de 21 000 habitants, mérite des professionnels à la hauteur, ainsi que Nogent.',
+    quartiers: ['Centre-ville', 'Nogent'],
+  },
+  langres: {
+    description: 'Trouvez des artisans qualifiés à Langres (Haute-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
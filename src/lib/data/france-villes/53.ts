@@ -0,0 +1,36 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  laval: { description: 'Cité médiévale sur la Mayenne.', quartiers: ['Centre-ville', 'Saint-Nicolas', 'Bourny', 'Ferrié'] },
+  'chateau-gontier-sur-mayenne': {
+    description: 'Besoin d’un professionnel à Château-Gontier-sur-Mayenne ? Située en Pays de la Loire, cette commune du Mayenne bénéficie de un dynamisme immobilier croissant. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Quelaines-Saint-Gault, Meslay-du-Maine, Craon.',
+    quartiers: ['Centre-ville', 'Quelaines-Saint-Gault', 'Meslay-du-Maine', 'Craon', 'Entrammes', 'Cossé-le-Vivien', 'L\'Huisserie'],
+  },
+  mayenne: {
+    description: 'Mayenne (Mayenne, Pays de la Loire) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Ambrières-les-Vallées, Montsûrs, Lassay-les-Châteaux.',
+    quartiers: ['Centre-ville', 'Ambrières-les-Vallées', 'Montsûrs', 'Lassay-les-Châteaux', 'Gorron', 'Andouillé', 'Louverné'],
+  },
+  evron: {
+    description: 'Trouvez des artisans qualifiés à Évron (Mayenne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-berthevin': {
+    description: 'Trouvez des artisans qualifiés à Saint-Berthevin (Mayenne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'change-53': {
+    description: 'Trouvez des artisans qualifiés à Changé (Mayenne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bonchamp-les-laval': {
+    description: 'Trouvez des artisans qualifiés à Bonchamp-lès-Laval (Mayenne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ernee: {
+    description: 'Trouvez des artisans qualifiés à Ernée (Mayenne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
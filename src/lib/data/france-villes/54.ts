@@ -0,0 +1,135 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  nancy: {
+    description: 'Capitale de l\'Art nouveau, place Stanislas UNESCO.',
+    quartiers: ['Centre-ville', 'Saurupt', 'Haussonville', 'Trois Maisons', 'Stanislas', 'Poincaré', 'Haut-du-Lièvre'],
+  },
+  'vand-uvre-les-nancy': {
+    description: 'Vandœuvre-lès-Nancy est une ville active de 30 000 habitants située dans le département Meurthe-et-Moselle en Grand Est. Nos artisans qualifiés interviennent à Vandœuvre-lès-Nancy, ainsi que Houdemont, Villers-lès-Nancy, Heillecourt pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Houdemont', 'Villers-lès-Nancy', 'Heillecourt', 'Nancy', 'Jarville-la-Malgrange', 'Laxou'],
+  },
+  luneville: {
+    description: 'Artisans référencés à Lunéville et ses environs. Cette commune du Grand Est de 18 000 habitants en Meurthe-et-Moselle compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Chanteheux, Blainville-sur-l\'Eau, Damelevières.',
+    quartiers: ['Centre-ville', 'Chanteheux', 'Blainville-sur-l\'Eau', 'Damelevières', 'Dombasle-sur-Meurthe', 'Rosières-aux-Salines', 'Varangéville'],
+  },
+  toul: {
+    description: 'Artisans référencés à Toul et ses environs. Cette commune du Grand Est de 16 000 habitants en Meurthe-et-Moselle compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Dommartin-lès-Toul, Écrouves, Gondreville.',
+    quartiers: ['Centre-ville', 'Dommartin-lès-Toul', 'Écrouves', 'Gondreville', 'Foug', 'Bois-de-Haye', 'Liverdun'],
+  },
+  longwy: {
+    description: 'Longwy est une commune de 16 000 habitants située dans le département Meurthe-et-Moselle en Grand Est. Nos artisans qualifiés interviennent à Longwy, ainsi que Herserange, Réhon, Mexy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Herserange', 'Réhon', 'Mexy', 'Longlaville', 'Mont-Saint-Martin', 'Lexy'],
+  },
+  laxou: {
+    description: 'Trouvez un artisan de confiance à Laxou (Meurthe-et-Moselle). Avec 15 000 habitants, cette commune du Grand Est dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Villers-lès-Nancy, Maxéville, Champigneulles.',
+    quartiers: ['Centre-ville', 'Villers-lès-Nancy', 'Maxéville', 'Champigneulles', 'Vandœuvre-lès-Nancy', 'Nancy', 'Chaligny'],
+  },
+  'villers-les-nancy': {
+    description: 'À Villers-lès-Nancy, commune du Meurthe-et-Moselle (15 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Vandœuvre-lès-Nancy, Laxou, Chaligny.',
+    quartiers: ['Centre-ville', 'Vandœuvre-lès-Nancy', 'Laxou', 'Chaligny', 'Houdemont', 'Nancy', 'Neuves-Maisons'],
+  },
+  'pont-a-mousson': {
+    description: 'Vous habitez à Pont-à-Mousson ou ses environs ? Nos artisans qualifiés du Meurthe-et-Moselle sont disponibles pour tous vos travaux. Pont-à-Mousson, commune du Grand Est de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Blénod-lès-Pont-à-Mousson, Pagny-sur-Moselle, Dieulouard.',
+    quartiers: ['Centre-ville', 'Blénod-lès-Pont-à-Mousson', 'Pagny-sur-Moselle', 'Dieulouard', 'Custines', 'Pompey', 'Liverdun'],
+  },
+  villerupt: {
+    description: 'Vous habitez à Villerupt ou ses environs ? Nos artisans qualifiés du Meurthe-et-Moselle sont disponibles pour tous vos travaux. Villerupt, commune du Grand Est de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Thil, Hussigny-Godbrange, Haucourt-Moulaine.',
+    quartiers: ['Centre-ville', 'Thil', 'Hussigny-Godbrange', 'Haucourt-Moulaine', 'Saulnes', 'Mexy', 'Herserange'],
+  },
+  maxeville: {
+    description: 'À Maxéville, commune du Meurthe-et-Moselle (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Champigneulles, Nancy, Laxou.',
+    quartiers: ['Centre-ville', 'Champigneulles', 'Nancy', 'Laxou', 'Malzéville', 'Saint-Max', 'Frouard'],
+  },
+  'saint-max': {
+    description: 'Trouvez des artisans qualifiés à Saint-Max (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'dombasle-sur-meurthe': {
+    description: 'Trouvez des artisans qualifiés à Dombasle-sur-Meurthe (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mont-saint-martin': {
+    description: 'Trouvez des artisans qualifiés à Mont-Saint-Martin (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'jarville-la-malgrange': {
+    description: 'Trouvez des artisans qualifiés à Jarville-la-Malgrange (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tomblaine: {
+    description: 'Trouvez des artisans qualifiés à Tomblaine (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'essey-les-nancy': {
+    description: 'Trouvez des artisans qualifiés à Essey-lès-Nancy (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'val-de-briey': {
+    description: 'Trouvez des artisans qualifiés à Val de Briey (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  jarny: {
+    description: 'Trouvez des artisans qualifiés à Jarny (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  malzeville: {
+    description: 'Trouvez des artisans qualifiés à Malzéville (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-nicolas-de-port': {
+    description: 'Trouvez des artisans qualifiés à Saint-Nicolas-de-Port (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'laneuveville-devant-nancy': {
+    description: 'Trouvez des artisans qualifiés à Laneuveville-devant-Nancy (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  champigneulles: {
+    description: 'Trouvez des artisans qualifiés à Champigneulles (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'neuves-maisons': {
+    description: 'Trouvez des artisans qualifiés à Neuves-Maisons (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  frouard: {
+    description: 'Trouvez des artisans qualifiés à Frouard (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'j-uf': {
+    description: 'Trouvez des artisans qualifiés à Jœuf (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  homecourt: {
+    description: 'Trouvez des artisans qualifiés à Homécourt (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ludres: {
+    description: 'Trouvez des artisans qualifiés à Ludres (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  liverdun: {
+    description: 'Trouvez des artisans qualifiés à Liverdun (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  heillecourt: {
+    description: 'Trouvez des artisans qualifiés à Heillecourt (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  seichamps: {
+    description: 'Trouvez des artisans qualifiés à Seichamps (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  longuyon: {
+    description: 'Trouvez des artisans qualifiés à Longuyon (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pulnoy: {
+    description: 'Trouvez des artisans qualifiés à Pulnoy (Meurthe-et-Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
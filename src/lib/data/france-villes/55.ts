@@ -0,0 +1,16 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  verdun: { description: 'Ville de mémoire de la Grande Guerre.', quartiers: ['Centre-ville', 'Faubourg Pavé', 'Glorieux', 'Belleville'] },
+  'bar-le-duc': {
+    description: 'Artisans référencés à Bar-le-Duc et ses environs. Cette commune du Grand Est de 15 000 habitants en Meuse compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Fains-Véel, Ligny-en-Barrois, Revigny-sur-Ornain.',
+    quartiers: ['Centre-ville', 'Fains-Véel', 'Ligny-en-Barrois', 'Revigny-sur-Ornain', 'Ancerville'],
+  },
+  commercy: {
+    description: 'Trouvez des artisans qualifiés à Commercy (Meuse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,145 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  lorient: { description: 'Ville des cinq ports, festival interceltique.', quartiers: ['Centre-ville', 'Merville', 'Nouvelle Ville', 'Keryado'] },
+  vannes: { description: 'Ville médiévale sur le Golfe du Morbihan.', quartiers: ['Centre historique', 'Ménimur', 'Kercado', 'Conleau'] },
+  lanester: {
+    description: 'Découvrez les meilleurs artisans à Lanester en Morbihan. Avec le littoral atlantique et 23 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Locmiquélic, Lorient, Caudan.',
+    quartiers: ['Centre-ville', 'Locmiquélic', 'Lorient', 'Caudan', 'Kervignac', 'Riantec', 'Hennebont'],
+  },
+  ploemeur: {
+    description: 'Trouvez un artisan de confiance à Ploemeur (Morbihan). Avec 19 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Larmor-Plage, Lorient, Quéven.',
+    quartiers: ['Centre-ville', 'Larmor-Plage', 'Lorient', 'Quéven', 'Guidel', 'Port-Louis', 'Gestel'],
+  },
+  hennebont: {
+    description: 'Trouvez un artisan de confiance à Hennebont (Morbihan). Avec 16 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Kervignac, Caudan, Lanester.',
+    quartiers: ['Centre-ville', 'Kervignac', 'Caudan', 'Lanester', 'Inzinzac-Lochrist', 'Merlevenez', 'Cléguer'],
+  },
+  pontivy: {
+    description: 'Trouvez un artisan de confiance à Pontivy (Morbihan). Avec 15 000 habitants, cette commune bretonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Sourn, Noyal-Pontivy, Cléguérec.',
+    quartiers: ['Centre-ville', 'Le Sourn', 'Noyal-Pontivy', 'Cléguérec', 'Pluméliau-Bieuzy', 'Évellys', 'Bubry'],
+  },
+  auray: {
+    description: 'Besoin d’un professionnel à Auray ? Située en Bretagne, cette commune du Morbihan bénéficie de des besoins spécifiques liés au climat océanique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Pluneret, Crach, Sainte-Anne-d\'Auray.',
+    quartiers: ['Centre-ville', 'Pluneret', 'Crach', 'Sainte-Anne-d\'Auray', 'Brech', 'Le Bono', 'Ploemel'],
+  },
+  'saint-ave': {
+    description: 'Artisans référencés à Saint-Avé et ses environs. Cette commune bretonne de 12 000 habitants en Morbihan compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Meucon, Monterblanc, Vannes.',
+    quartiers: ['Centre-ville', 'Meucon', 'Monterblanc', 'Vannes', 'Saint-Nolff', 'Plescop', 'Locqueltas'],
+  },
+  guidel: {
+    description: 'Besoin d’un professionnel à Guidel ? Située en Bretagne, cette commune du Morbihan bénéficie de des besoins spécifiques liés au climat océanique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Gestel, Quéven, Pont-Scorff.',
+    quartiers: ['Centre-ville', 'Gestel', 'Quéven', 'Pont-Scorff', 'Ploemeur', 'Lorient', 'Larmor-Plage'],
+  },
+  ploermel: {
+    description: 'Découvrez les meilleurs artisans à Ploërmel en Morbihan. Avec le littoral atlantique et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Val d\'Oust, Taupont, Malestroit.',
+    quartiers: ['Centre-ville', 'Val d\'Oust', 'Taupont', 'Malestroit', 'Josselin', 'Sérent', 'Guégon'],
+  },
+  sene: {
+    description: 'Trouvez des artisans qualifiés à Séné (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sarzeau: {
+    description: 'Trouvez des artisans qualifiés à Sarzeau (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  queven: {
+    description: 'Trouvez des artisans qualifiés à Quéven (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'theix-noyalo': {
+    description: 'Trouvez des artisans qualifiés à Theix-Noyalo (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'larmor-plage': {
+    description: 'Trouvez des artisans qualifiés à Larmor-Plage (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  questembert: {
+    description: 'Trouvez des artisans qualifiés à Questembert (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  languidic: {
+    description: 'Trouvez des artisans qualifiés à Languidic (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pluvigner: {
+    description: 'Trouvez des artisans qualifiés à Pluvigner (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  caudan: {
+    description: 'Trouvez des artisans qualifiés à Caudan (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  kervignac: {
+    description: 'Trouvez des artisans qualifiés à Kervignac (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  brech: {
+    description: 'Trouvez des artisans qualifiés à Brech (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ploeren: {
+    description: 'Trouvez des artisans qualifiés à Ploeren (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'inzinzac-lochrist': {
+    description: 'Trouvez des artisans qualifiés à Inzinzac-Lochrist (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  elven: {
+    description: 'Trouvez des artisans qualifiés à Elven (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  baud: {
+    description: 'Trouvez des artisans qualifiés à Baud (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plescop: {
+    description: 'Trouvez des artisans qualifiés à Plescop (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pluneret: {
+    description: 'Trouvez des artisans qualifiés à Pluneret (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guer: {
+    description: 'Trouvez des artisans qualifiés à Guer (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'grand-champ': {
+    description: 'Trouvez des artisans qualifiés à Grand-Champ (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  riantec: {
+    description: 'Trouvez des artisans qualifiés à Riantec (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  arradon: {
+    description: 'Trouvez des artisans qualifiés à Arradon (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plouay: {
+    description: 'Trouvez des artisans qualifiés à Plouay (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  plouhinec: {
+    description: 'Trouvez des artisans qualifiés à Plouhinec (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  surzur: {
+    description: 'Trouvez des artisans qualifiés à Surzur (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  muzillac: {
+    description: 'Trouvez des artisans qualifiés à Muzillac (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  baden: {
+    description: 'Trouvez des artisans qualifiés à Baden (Morbihan). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
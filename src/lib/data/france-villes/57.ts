@@ -0,0 +1,149 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  metz: { description: 'Ville d\'art à l\'architecture remarquable.', quartiers: ['Centre-ville', 'Sablon', 'Plantières', 'Queuleu', 'Borny'] },
+  thionville: { description: 'Ville frontalière du Luxembourg.', quartiers: ['Centre-ville', 'Beauregard', 'Côte des Roses', 'Élange'] },
+  'montigny-les-metz': {
+    description: 'Découvrez les meilleurs artisans à Montigny-lès-Metz en Moselle. Avec le carrefour européen et 22 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Longeville-lès-Metz, Moulins-lès-Metz, Le Ban-Saint-Martin.',
+    quartiers: ['Centre-ville', 'Longeville-lès-Metz', 'Moulins-lès-Metz', 'Le Ban-Saint-Martin', 'Metz', 'Scy-Chazelles', 'Marly'],
+  },
+  forbach: {
+    description: 'Forbach (Moselle, Grand Est) est une ville active de 20 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Œting, Stiring-Wendel, Schœneck.',
+    quartiers: ['Centre-ville', 'Œting', 'Stiring-Wendel', 'Schœneck', 'Petite-Rosselle', 'Morsbach', 'Behren-lès-Forbach'],
+  },
+  sarreguemines: {
+    description: 'Besoin d’un professionnel à Sarreguemines ? Située en Grand Est, cette ville active du Moselle bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Hambach, Woustviller, Grosbliederstroff.',
+    quartiers: ['Centre-ville', 'Hambach', 'Woustviller', 'Grosbliederstroff', 'Alsting', 'Behren-lès-Forbach', 'Spicheren'],
+  },
+  yutz: {
+    description: 'Artisans référencés à Yutz et ses environs. Cette commune du Grand Est de 17 000 habitants en Moselle compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Manom, Basse-Ham, Thionville.',
+    quartiers: ['Centre-ville', 'Manom', 'Basse-Ham', 'Thionville', 'Bertrange', 'Terville', 'Florange'],
+  },
+  hayange: {
+    description: 'Hayange (Moselle, Grand Est) est une commune de 16 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Nilvange, Serémange-Erzange, Knutange.',
+    quartiers: ['Centre-ville', 'Nilvange', 'Serémange-Erzange', 'Knutange', 'Algrange', 'Neufchef', 'Florange'],
+  },
+  woippy: {
+    description: 'Woippy est une commune de 15 000 habitants située dans le département Moselle en Grand Est. Nos artisans qualifiés interviennent à Woippy, ainsi que Plappeville, Le Ban-Saint-Martin, Maizières-lès-Metz pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Plappeville', 'Le Ban-Saint-Martin', 'Maizières-lès-Metz', 'Saint-Julien-lès-Metz', 'Longeville-lès-Metz', 'Scy-Chazelles'],
+  },
+  fameck: {
+    description: 'Vous habitez à Fameck ou ses environs ? Nos artisans qualifiés du Moselle sont disponibles pour tous vos travaux. Fameck, commune du Grand Est de 15 000 habitants, mérite des professionnels à la hauteur, ainsi que Vitry-sur-Orne, Serémange-Erzange, Uckange.',
+    quartiers: ['Centre-ville', 'Vitry-sur-Orne', 'Serémange-Erzange', 'Uckange', 'Gandrange', 'Florange', 'Clouange'],
+  },
+  'saint-avold': {
+    description: 'Besoin d’un professionnel à Saint-Avold ? Située en Grand Est, cette commune du Moselle bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que L\'Hôpital, Longeville-lès-Saint-Avold, Carling.',
+    quartiers: ['Centre-ville', 'L\'Hôpital', 'Longeville-lès-Saint-Avold', 'Carling', 'Hombourg-Haut', 'Porcelette', 'Valmont'],
+  },
+  'freyming-merlebach': {
+    description: 'Trouvez un artisan de confiance à Freyming-Merlebach (Moselle). Avec 13 000 habitants, cette commune du Grand Est dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Hombourg-Haut, Cocheren, L\'Hôpital.',
+    quartiers: ['Centre-ville', 'Hombourg-Haut', 'Cocheren', 'L\'Hôpital', 'Morsbach', 'Carling', 'Farébersviller'],
+  },
+  creutzwald: {
+    description: 'Creutzwald (Moselle, Grand Est) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Falck, Ham-sous-Varsberg, Porcelette.',
+    quartiers: ['Centre-ville', 'Falck', 'Ham-sous-Varsberg', 'Porcelette', 'Carling', 'L\'Hôpital', 'Saint-Avold'],
+  },
+  sarrebourg: {
+    description: 'Artisans référencés à Sarrebourg et ses environs. Cette commune du Grand Est de 12 000 habitants en Moselle compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Réding, Phalsbourg, Dabo.',
+    quartiers: ['Centre-ville', 'Réding', 'Phalsbourg', 'Dabo'],
+  },
+  florange: {
+    description: 'Découvrez les meilleurs artisans à Florange en Moselle. Avec le carrefour européen et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Terville, Serémange-Erzange, Uckange.',
+    quartiers: ['Centre-ville', 'Terville', 'Serémange-Erzange', 'Uckange', 'Fameck', 'Hayange', 'Thionville'],
+  },
+  'maizieres-les-metz': {
+    description: 'Maizières-lès-Metz (Moselle, Grand Est) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Talange, Hagondange, Marange-Silvange.',
+    quartiers: ['Centre-ville', 'Talange', 'Hagondange', 'Marange-Silvange', 'Amnéville', 'Woippy', 'Ennery'],
+  },
+  'stiring-wendel': {
+    description: 'Artisans référencés à Stiring-Wendel et ses environs. Cette commune du Grand Est de 11 000 habitants en Moselle compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Schœneck, Forbach, Spicheren.',
+    quartiers: ['Centre-ville', 'Schœneck', 'Forbach', 'Spicheren', 'Œting', 'Behren-lès-Forbach', 'Petite-Rosselle'],
+  },
+  amneville: {
+    description: 'Trouvez un artisan de confiance à Amnéville (Moselle). Avec 11 000 habitants, cette commune du Grand Est dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Rombas, Clouange, Gandrange.',
+    quartiers: ['Centre-ville', 'Rombas', 'Clouange', 'Gandrange', 'Hagondange', 'Marange-Silvange', 'Vitry-sur-Orne'],
+  },
+  rombas: {
+    description: 'Trouvez des artisans qualifiés à Rombas (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  hagondange: {
+    description: 'Trouvez des artisans qualifiés à Hagondange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  talange: {
+    description: 'Trouvez des artisans qualifiés à Talange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guenange: {
+    description: 'Trouvez des artisans qualifiés à Guénange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  terville: {
+    description: 'Trouvez des artisans qualifiés à Terville (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'hettange-grande': {
+    description: 'Trouvez des artisans qualifiés à Hettange-Grande (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'audun-le-tiche': {
+    description: 'Trouvez des artisans qualifiés à Audun-le-Tiche (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'moyeuvre-grande': {
+    description: 'Trouvez des artisans qualifiés à Moyeuvre-Grande (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  uckange: {
+    description: 'Trouvez des artisans qualifiés à Uckange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marange-silvange': {
+    description: 'Trouvez des artisans qualifiés à Marange-Silvange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'petite-rosselle': {
+    description: 'Trouvez des artisans qualifiés à Petite-Rosselle (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'behren-les-forbach': {
+    description: 'Trouvez des artisans qualifiés à Behren-lès-Forbach (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'hombourg-haut': {
+    description: 'Trouvez des artisans qualifiés à Hombourg-Haut (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  algrange: {
+    description: 'Trouvez des artisans qualifiés à Algrange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mondelange: {
+    description: 'Trouvez des artisans qualifiés à Mondelange (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'boulay-moselle': {
+    description: 'Trouvez des artisans qualifiés à Boulay-Moselle (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'moulins-les-metz': {
+    description: 'Trouvez des artisans qualifiés à Moulins-lès-Metz (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  farebersviller: {
+    description: 'Trouvez des artisans qualifiés à Farébersviller (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'l-hopital': {
+    description: 'Trouvez des artisans qualifiés à L\'Hôpital (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  faulquemont: {
+    description: 'Trouvez des artisans qualifiés à Faulquemont (Moselle). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,16 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  nevers: { description: 'Ville de la faïence et de Bernadette.', quartiers: ['Centre-ville', 'Mouësse', 'Grande Pâture', 'Baratte'] },
+  'cosne-cours-sur-loire': {
+    description: 'Trouvez des artisans qualifiés à Cosne-Cours-sur-Loire (Nièvre). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'varennes-vauzelles': {
+    description: 'Trouvez des artisans qualifiés à Varennes-Vauzelles (Nièvre). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
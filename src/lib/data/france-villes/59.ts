@@ -0,0 +1,427 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  lille: { description: 'Métropole du Nord, carrefour européen dynamique.', quartiers: ['Vieux-Lille', 'Centre', 'Wazemmes', 'Fives', 'Moulins'] },
+  tourcoing: { description: 'Ville industrielle à la frontière belge.', quartiers: ['Centre-ville', 'Virolois', 'Croix-Rouge', 'Blanc Seau', 'Pont-de-Neuville', 'Épidème', 'Marlière'] },
+  roubaix: { description: 'Ancienne capitale textile, ville en renouveau.', quartiers: ['Centre-ville', 'Barbieux', 'Alma', 'Nouveau Roubaix', 'Épeule', 'Cul-de-Four', 'Pile'] },
+  dunkerque: {
+    description: 'Premier port français de la mer du Nord.',
+    quartiers: ['Centre-ville', 'Malo-les-Bains', 'Rosendaël', 'Petite-Synthe', 'Glacis', 'Coudekerque-Branche', 'Saint-Pol-sur-Mer'],
+  },
+  'villeneuve-d-ascq': { description: 'Ville technologique de la métropole lilloise.', quartiers: ['Hôtel de Ville', 'Pont de Bois', 'Triolo', 'Château', 'Flers', 'Annappes', 'Brigode'] },
+  valenciennes: {
+    description: 'À Valenciennes, ville dynamique du Nord (43 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Anzin, Marly, La Sentinelle.',
+    quartiers: ['Centre-ville', 'Anzin', 'Marly', 'La Sentinelle', 'Beuvrages', 'Petite-Forêt', 'Trith-Saint-Léger'],
+  },
+  wattrelos: {
+    description: 'Wattrelos (Nord, Hauts-de-France) est une ville dynamique de 41 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Roubaix, Leers, Tourcoing.',
+    quartiers: ['Centre-ville', 'Roubaix', 'Leers', 'Tourcoing', 'Lys-lez-Lannoy', 'Mouvaux', 'Toufflers'],
+  },
+  douai: {
+    description: 'Besoin d’un professionnel à Douai ? Située en Hauts-de-France, cette ville dynamique du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Waziers, Sin-le-Noble, Dechy.',
+    quartiers: ['Centre-ville', 'Waziers', 'Sin-le-Noble', 'Dechy', 'Roost-Warendin', 'Lambres-lez-Douai', 'Flers-en-Escrebieux'],
+  },
+  'marcq-en-bar-ul': {
+    description: 'Besoin d’un professionnel à Marcq-en-Barœul ? Située en Hauts-de-France, cette ville dynamique du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Wasquehal, Bondues, Marquette-lez-Lille.',
+    quartiers: ['Centre-ville', 'Wasquehal', 'Bondues', 'Marquette-lez-Lille', 'La Madeleine', 'Mouvaux', 'Croix'],
+  },
+  cambrai: {
+    description: 'Vous habitez à Cambrai ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Cambrai, ville dynamique nordiste de 31 000 habitants, mérite des professionnels à la hauteur, ainsi que Neuville-Saint-Rémy, Proville, Escaudœuvres.',
+    quartiers: ['Centre-ville', 'Neuville-Saint-Rémy', 'Proville', 'Escaudœuvres', 'Raillencourt-Sainte-Olle', 'Masnières', 'Iwuy'],
+  },
+  maubeuge: {
+    description: 'À Maubeuge, ville active du Nord (29 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Louvroil, Rousies, Feignies.',
+    quartiers: ['Centre-ville', 'Louvroil', 'Rousies', 'Feignies', 'Ferrière-la-Grande', 'Hautmont', 'La Longueville'],
+  },
+  lambersart: {
+    description: 'Lambersart (Nord, Hauts-de-France) est une ville active de 27 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-André-lez-Lille, Lompret, Lille.',
+    quartiers: ['Centre-ville', 'Saint-André-lez-Lille', 'Lompret', 'Lille', 'Marquette-lez-Lille', 'La Madeleine', 'Verlinghem'],
+  },
+  armentieres: {
+    description: 'Besoin d’un professionnel à Armentières ? Située en Hauts-de-France, cette ville active du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Nieppe, La Chapelle-d\'Armentières, Houplines.',
+    quartiers: ['Centre-ville', 'Nieppe', 'La Chapelle-d\'Armentières', 'Houplines', 'Erquinghem-Lys', 'Frelinghien', 'Prémesques'],
+  },
+  loos: {
+    description: 'Loos (Nord, Hauts-de-France) est une ville active de 23 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Emmerin, Haubourdin, Wattignies.',
+    quartiers: ['Centre-ville', 'Emmerin', 'Haubourdin', 'Wattignies', 'Sequedin', 'Lille', 'Faches-Thumesnil'],
+  },
+  hazebrouck: {
+    description: 'Découvrez les meilleurs artisans à Hazebrouck en Nord. Avec le nord de la France et 22 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Morbecque, Vieux-Berquin, Cassel.',
+    quartiers: ['Centre-ville', 'Morbecque', 'Vieux-Berquin', 'Cassel', 'Blaringhem', 'Méteren', 'Godewaersvelde'],
+  },
+  'la-madeleine': {
+    description: 'Trouvez un artisan de confiance à La Madeleine (Nord). Avec 22 000 habitants, cette ville active nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-André-lez-Lille, Marquette-lez-Lille, Mons-en-Barœul.',
+    quartiers: ['Centre-ville', 'Saint-André-lez-Lille', 'Marquette-lez-Lille', 'Mons-en-Barœul', 'Lille', 'Lambersart', 'Marcq-en-Barœul'],
+  },
+  'mons-en-bar-ul': {
+    description: 'À Mons-en-Barœul, ville active du Nord (21 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que La Madeleine, Wasquehal, Lezennes.',
+    quartiers: ['Centre-ville', 'La Madeleine', 'Wasquehal', 'Lezennes', 'Villeneuve-d\'Ascq', 'Marcq-en-Barœul', 'Lille'],
+  },
+  'coudekerque-branche': {
+    description: 'Coudekerque-Branche (Nord, Hauts-de-France) est une ville active de 21 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Cappelle-la-Grande, Téteghem-Coudekerque-Village, Dunkerque.',
+    quartiers: ['Centre-ville', 'Cappelle-la-Grande', 'Téteghem-Coudekerque-Village', 'Dunkerque', 'Leffrinckoucke', 'Armbouts-Cappel', 'Bergues'],
+  },
+  wasquehal: {
+    description: 'À Wasquehal, ville active du Nord (21 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Croix, Marcq-en-Barœul, Mons-en-Barœul.',
+    quartiers: ['Centre-ville', 'Croix', 'Marcq-en-Barœul', 'Mons-en-Barœul', 'Mouvaux', 'Roubaix', 'Bondues'],
+  },
+  halluin: {
+    description: 'Halluin (Nord, Hauts-de-France) est une ville active de 21 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Neuville-en-Ferrain, Roncq, Bousbecque.',
+    quartiers: ['Centre-ville', 'Neuville-en-Ferrain', 'Roncq', 'Bousbecque', 'Wervicq-Sud', 'Linselles', 'Tourcoing'],
+  },
+  denain: {
+    description: 'Vous habitez à Denain ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Denain, ville active nordiste de 21 000 habitants, mérite des professionnels à la hauteur, ainsi que Haulchin, Haveluy, Douchy-les-Mines.',
+    quartiers: ['Centre-ville', 'Haulchin', 'Haveluy', 'Douchy-les-Mines', 'Lourches', 'Escaudain', 'Prouvy'],
+  },
+  croix: {
+    description: 'Croix (Nord, Hauts-de-France) est une ville active de 21 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Wasquehal, Roubaix, Mouvaux.',
+    quartiers: ['Centre-ville', 'Wasquehal', 'Roubaix', 'Mouvaux', 'Hem', 'Marcq-en-Barœul', 'Villeneuve-d\'Ascq'],
+  },
+  'grande-synthe': {
+    description: 'Trouvez un artisan de confiance à Grande-Synthe (Nord). Avec 20 000 habitants, cette ville active nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Dunkerque, Armbouts-Cappel, Loon-Plage.',
+    quartiers: ['Centre-ville', 'Dunkerque', 'Armbouts-Cappel', 'Loon-Plage', 'Cappelle-la-Grande', 'Coudekerque-Branche', 'Bourbourg'],
+  },
+  ronchin: {
+    description: 'Trouvez un artisan de confiance à Ronchin (Nord). Avec 20 000 habitants, cette commune nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Faches-Thumesnil, Lezennes, Lesquin.',
+    quartiers: ['Centre-ville', 'Faches-Thumesnil', 'Lezennes', 'Lesquin', 'Wattignies', 'Templemars', 'Lille'],
+  },
+  'faches-thumesnil': {
+    description: 'Faches-Thumesnil est une commune de 19 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Faches-Thumesnil, ainsi que Ronchin, Wattignies, Templemars pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Ronchin', 'Wattignies', 'Templemars', 'Lesquin', 'Lezennes', 'Loos'],
+  },
+  hem: {
+    description: 'Besoin d’un professionnel à Hem ? Située en Hauts-de-France, cette commune du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Villeneuve-d\'Ascq, Lys-lez-Lannoy, Toufflers.',
+    quartiers: ['Centre-ville', 'Villeneuve-d\'Ascq', 'Lys-lez-Lannoy', 'Toufflers', 'Croix', 'Willems', 'Roubaix'],
+  },
+  'sin-le-noble': {
+    description: 'Sin-le-Noble (Nord, Hauts-de-France) est une commune de 16 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Dechy, Douai, Waziers.',
+    quartiers: ['Centre-ville', 'Dechy', 'Douai', 'Waziers', 'Guesnain', 'Lallaing', 'Montigny-en-Ostrevent'],
+  },
+  'saint-amand-les-eaux': {
+    description: 'Découvrez les meilleurs artisans à Saint-Amand-les-Eaux en Nord. Avec le nord de la France et 16 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Raismes, Hasnon, Lecelles.',
+    quartiers: ['Centre-ville', 'Raismes', 'Hasnon', 'Lecelles', 'Rosult', 'Beuvrages', 'Petite-Forêt'],
+  },
+  wattignies: {
+    description: 'Vous habitez à Wattignies ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Wattignies, commune nordiste de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Templemars, Emmerin, Faches-Thumesnil.',
+    quartiers: ['Centre-ville', 'Templemars', 'Emmerin', 'Faches-Thumesnil', 'Loos', 'Houplin-Ancoisne', 'Haubourdin'],
+  },
+  haubourdin: {
+    description: 'Trouvez un artisan de confiance à Haubourdin (Nord). Avec 15 000 habitants, cette commune nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Emmerin, Loos, Santes.',
+    quartiers: ['Centre-ville', 'Emmerin', 'Loos', 'Santes', 'Sequedin', 'Hallennes-lez-Haubourdin', 'Houplin-Ancoisne'],
+  },
+  bailleul: {
+    description: 'Besoin d’un professionnel à Bailleul ? Située en Hauts-de-France, cette commune du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Méteren, Steenwerck, Nieppe.',
+    quartiers: ['Centre-ville', 'Méteren', 'Steenwerck', 'Nieppe', 'Boeschepe', 'Estaires', 'Vieux-Berquin'],
+  },
+  hautmont: {
+    description: 'Hautmont est une commune de 14 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Hautmont, ainsi que Louvroil, Feignies, Maubeuge pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Louvroil', 'Feignies', 'Maubeuge', 'Ferrière-la-Grande', 'Pont-sur-Sambre', 'Bachant'],
+  },
+  roncq: {
+    description: 'À Roncq, commune du Nord (14 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Linselles, Bousbecque, Neuville-en-Ferrain.',
+    quartiers: ['Centre-ville', 'Linselles', 'Bousbecque', 'Neuville-en-Ferrain', 'Halluin', 'Tourcoing', 'Bondues'],
+  },
+  'lys-lez-lannoy': {
+    description: 'Découvrez les meilleurs artisans à Lys-lez-Lannoy en Nord. Avec le nord de la France et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Leers, Toufflers, Hem.',
+    quartiers: ['Centre-ville', 'Leers', 'Toufflers', 'Hem', 'Roubaix', 'Wattrelos', 'Croix'],
+  },
+  caudry: {
+    description: 'Caudry est une commune de 14 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Caudry, ainsi que Bertry, Walincourt-Selvigny, Avesnes-les-Aubert pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bertry', 'Walincourt-Selvigny', 'Avesnes-les-Aubert', 'Le Cateau-Cambrésis', 'Solesmes', 'Busigny'],
+  },
+  mouvaux: {
+    description: 'Mouvaux (Nord, Hauts-de-France) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Tourcoing, Bondues, Croix.',
+    quartiers: ['Centre-ville', 'Tourcoing', 'Bondues', 'Croix', 'Wasquehal', 'Roubaix', 'Marcq-en-Barœul'],
+  },
+  seclin: {
+    description: 'Découvrez les meilleurs artisans à Seclin en Nord. Avec le nord de la France et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Gondecourt, Houplin-Ancoisne, Templemars.',
+    quartiers: ['Centre-ville', 'Gondecourt', 'Houplin-Ancoisne', 'Templemars', 'Phalempin', 'Avelin', 'Wattignies'],
+  },
+  'saint-andre-lez-lille': {
+    description: 'Trouvez un artisan de confiance à Saint-André-lez-Lille (Nord). Avec 13 000 habitants, cette commune nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Lambersart, Marquette-lez-Lille, La Madeleine.',
+    quartiers: ['Centre-ville', 'Lambersart', 'Marquette-lez-Lille', 'La Madeleine', 'Lille', 'Lompret', 'Verlinghem'],
+  },
+  anzin: {
+    description: 'Anzin est une commune de 13 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Anzin, ainsi que Beuvrages, Valenciennes, Petite-Forêt pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Beuvrages', 'Valenciennes', 'Petite-Forêt', 'Bruay-sur-l\'Escaut', 'La Sentinelle', 'Saint-Saulve'],
+  },
+  comines: {
+    description: 'Découvrez les meilleurs artisans à Comines en Nord. Avec le nord de la France et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Wervicq-Sud, Quesnoy-sur-Deûle, Linselles.',
+    quartiers: ['Centre-ville', 'Wervicq-Sud', 'Quesnoy-sur-Deûle', 'Linselles', 'Bousbecque', 'Wambrechies', 'Frelinghien'],
+  },
+  'marquette-lez-lille': {
+    description: 'Vous habitez à Marquette-lez-Lille ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Marquette-lez-Lille, commune nordiste de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-André-lez-Lille, La Madeleine, Wambrechies.',
+    quartiers: ['Centre-ville', 'Saint-André-lez-Lille', 'La Madeleine', 'Wambrechies', 'Lambersart', 'Marcq-en-Barœul', 'Verlinghem'],
+  },
+  raismes: {
+    description: 'Artisans référencés à Raismes et ses environs. Cette commune nordiste de 12 000 habitants en Nord compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Beuvrages, Bruay-sur-l\'Escaut, Petite-Forêt.',
+    quartiers: ['Centre-ville', 'Beuvrages', 'Bruay-sur-l\'Escaut', 'Petite-Forêt', 'Anzin', 'Saint-Amand-les-Eaux', 'Escautpont'],
+  },
+  marly: {
+    description: 'Marly (Nord, Hauts-de-France) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Aulnoy-lez-Valenciennes, Saultain, Valenciennes.',
+    quartiers: ['Centre-ville', 'Aulnoy-lez-Valenciennes', 'Saultain', 'Valenciennes', 'Saint-Saulve', 'Anzin', 'Préseau'],
+  },
+  somain: {
+    description: 'Vous habitez à Somain ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Somain, commune nordiste de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Fenain, Aniche, Abscon.',
+    quartiers: ['Centre-ville', 'Fenain', 'Aniche', 'Abscon', 'Pecquencourt', 'Auberchicourt', 'Hornaing'],
+  },
+  'bruay-sur-l-escaut': {
+    description: 'Vous habitez à Bruay-sur-l\'Escaut ou ses environs ? Nos artisans qualifiés du Nord sont disponibles pour tous vos travaux. Bruay-sur-l\'Escaut, commune nordiste de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Beuvrages, Saint-Saulve, Anzin.',
+    quartiers: ['Centre-ville', 'Beuvrages', 'Saint-Saulve', 'Anzin', 'Escautpont', 'Raismes', 'Valenciennes'],
+  },
+  fourmies: {
+    description: 'Besoin d’un professionnel à Fourmies ? Située en Hauts-de-France, cette commune du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Wignehies, Anor, Trélon.',
+    quartiers: ['Centre-ville', 'Wignehies', 'Anor', 'Trélon', 'Sains-du-Nord', 'Avesnelles', 'Avesnes-sur-Helpe'],
+  },
+  gravelines: {
+    description: 'Gravelines est une commune de 11 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Gravelines, ainsi que Grand-Fort-Philippe, Loon-Plage, Bourbourg pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Grand-Fort-Philippe', 'Loon-Plage', 'Bourbourg', 'Grande-Synthe', 'Dunkerque', 'Armbouts-Cappel'],
+  },
+  wambrechies: {
+    description: 'Besoin d’un professionnel à Wambrechies ? Située en Hauts-de-France, cette commune du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Marquette-lez-Lille, Quesnoy-sur-Deûle, Verlinghem.',
+    quartiers: ['Centre-ville', 'Marquette-lez-Lille', 'Quesnoy-sur-Deûle', 'Verlinghem', 'Bondues', 'Saint-André-lez-Lille', 'Marcq-en-Barœul'],
+  },
+  'saint-saulve': {
+    description: 'Artisans référencés à Saint-Saulve et ses environs. Cette commune nordiste de 11 000 habitants en Nord compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Onnaing, Bruay-sur-l\'Escaut, Marly.',
+    quartiers: ['Centre-ville', 'Onnaing', 'Bruay-sur-l\'Escaut', 'Marly', 'Anzin', 'Valenciennes', 'Beuvrages'],
+  },
+  'ann-ullin': {
+    description: 'Artisans référencés à Annœullin et ses environs. Cette commune nordiste de 11 000 habitants en Nord compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Provin, Allennes-les-Marais, Bauvin.',
+    quartiers: ['Centre-ville', 'Provin', 'Allennes-les-Marais', 'Bauvin', 'Sainghin-en-Weppes', 'Gondecourt', 'Wavrin'],
+  },
+  'vieux-conde': {
+    description: 'À Vieux-Condé, commune du Nord (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Hergnies, Condé-sur-l\'Escaut, Fresnes-sur-Escaut.',
+    quartiers: ['Centre-ville', 'Hergnies', 'Condé-sur-l\'Escaut', 'Fresnes-sur-Escaut', 'Escautpont', 'Raismes', 'Crespin'],
+  },
+  jeumont: {
+    description: 'Besoin d’un professionnel à Jeumont ? Située en Hauts-de-France, cette commune du Nord bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Marpent, Boussois, Recquignies.',
+    quartiers: ['Centre-ville', 'Marpent', 'Boussois', 'Recquignies', 'Cousolre', 'Rousies', 'Ferrière-la-Grande'],
+  },
+  'douchy-les-mines': {
+    description: 'Découvrez les meilleurs artisans à Douchy-les-Mines en Nord. Avec le nord de la France et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Lourches, Haulchin, Neuville-sur-Escaut.',
+    quartiers: ['Centre-ville', 'Lourches', 'Haulchin', 'Neuville-sur-Escaut', 'Denain', 'Thiant', 'Haspres'],
+  },
+  'neuville-en-ferrain': {
+    description: 'Neuville-en-Ferrain est une commune de 10 000 habitants située dans le département Nord en Hauts-de-France. Nos artisans qualifiés interviennent à Neuville-en-Ferrain, ainsi que Halluin, Roncq, Tourcoing pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Halluin', 'Roncq', 'Tourcoing', 'Bousbecque', 'Mouvaux', 'Wattrelos'],
+  },
+  aniche: {
+    description: 'Trouvez des artisans qualifiés à Aniche (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  merville: {
+    description: 'Trouvez des artisans qualifiés à Merville (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bondues: {
+    description: 'Trouvez des artisans qualifiés à Bondues (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lesquin: {
+    description: 'Trouvez des artisans qualifiés à Lesquin (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  leers: {
+    description: 'Trouvez des artisans qualifiés à Leers (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'conde-sur-l-escaut': {
+    description: 'Trouvez des artisans qualifiés à Condé-sur-l\'Escaut (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  escaudain: {
+    description: 'Trouvez des artisans qualifiés à Escaudain (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-chapelle-d-armentieres': {
+    description: 'Trouvez des artisans qualifiés à La Chapelle-d\'Armentières (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aulnoye-aymeries': {
+    description: 'Trouvez des artisans qualifiés à Aulnoye-Aymeries (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  onnaing: {
+    description: 'Trouvez des artisans qualifiés à Onnaing (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  perenchies: {
+    description: 'Trouvez des artisans qualifiés à Pérenchies (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  orchies: {
+    description: 'Trouvez des artisans qualifiés à Orchies (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'teteghem-coudekerque-village': {
+    description: 'Trouvez des artisans qualifiés à Téteghem-Coudekerque-Village (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  linselles: {
+    description: 'Trouvez des artisans qualifiés à Linselles (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  houplines: {
+    description: 'Trouvez des artisans qualifiés à Houplines (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cappelle-la-grande': {
+    description: 'Trouvez des artisans qualifiés à Cappelle-la-Grande (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nieppe: {
+    description: 'Trouvez des artisans qualifiés à Nieppe (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wavrin: {
+    description: 'Trouvez des artisans qualifiés à Wavrin (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'fresnes-sur-escaut': {
+    description: 'Trouvez des artisans qualifiés à Fresnes-sur-Escaut (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  waziers: {
+    description: 'Trouvez des artisans qualifiés à Waziers (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'templeuve-en-pevele': {
+    description: 'Trouvez des artisans qualifiés à Templeuve-en-Pévèle (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  auby: {
+    description: 'Trouvez des artisans qualifiés à Auby (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aulnoy-lez-valenciennes': {
+    description: 'Trouvez des artisans qualifiés à Aulnoy-lez-Valenciennes (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bourbourg: {
+    description: 'Trouvez des artisans qualifiés à Bourbourg (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'quesnoy-sur-deule': {
+    description: 'Trouvez des artisans qualifiés à Quesnoy-sur-Deûle (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beuvrages: {
+    description: 'Trouvez des artisans qualifiés à Beuvrages (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-cateau-cambresis': {
+    description: 'Trouvez des artisans qualifiés à Le Cateau-Cambrésis (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  feignies: {
+    description: 'Trouvez des artisans qualifiés à Feignies (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-bassee': {
+    description: 'Trouvez des artisans qualifiés à La Bassée (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  estaires: {
+    description: 'Trouvez des artisans qualifiés à Estaires (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cuincy: {
+    description: 'Trouvez des artisans qualifiés à Cuincy (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  louvroil: {
+    description: 'Trouvez des artisans qualifiés à Louvroil (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lallaing: {
+    description: 'Trouvez des artisans qualifiés à Lallaing (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ostricourt: {
+    description: 'Trouvez des artisans qualifiés à Ostricourt (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pecquencourt: {
+    description: 'Trouvez des artisans qualifiés à Pecquencourt (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'trith-saint-leger': {
+    description: 'Trouvez des artisans qualifiés à Trith-Saint-Léger (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'roost-warendin': {
+    description: 'Trouvez des artisans qualifiés à Roost-Warendin (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'loon-plage': {
+    description: 'Trouvez des artisans qualifiés à Loon-Plage (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  quievrechain: {
+    description: 'Trouvez des artisans qualifiés à Quiévrechain (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'flines-lez-raches': {
+    description: 'Trouvez des artisans qualifiés à Flines-lez-Raches (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  santes: {
+    description: 'Trouvez des artisans qualifiés à Santes (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainghin-en-weppes': {
+    description: 'Trouvez des artisans qualifiés à Sainghin-en-Weppes (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wallers: {
+    description: 'Trouvez des artisans qualifiés à Wallers (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-gorgue': {
+    description: 'Trouvez des artisans qualifiés à La Gorgue (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wormhout: {
+    description: 'Trouvez des artisans qualifiés à Wormhout (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  baisieux: {
+    description: 'Trouvez des artisans qualifiés à Baisieux (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fenain: {
+    description: 'Trouvez des artisans qualifiés à Fenain (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'wervicq-sud': {
+    description: 'Trouvez des artisans qualifiés à Wervicq-Sud (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'flers-en-escrebieux': {
+    description: 'Trouvez des artisans qualifiés à Flers-en-Escrebieux (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'erquinghem-lys': {
+    description: 'Trouvez des artisans qualifiés à Erquinghem-Lys (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  dechy: {
+    description: 'Trouvez des artisans qualifiés à Dechy (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bauvin: {
+    description: 'Trouvez des artisans qualifiés à Bauvin (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ferriere-la-grande': {
+    description: 'Trouvez des artisans qualifiés à Ferrière-la-Grande (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'petite-foret': {
+    description: 'Trouvez des artisans qualifiés à Petite-Forêt (Nord). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
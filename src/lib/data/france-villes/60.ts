@@ -0,0 +1,88 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  beauvais: { description: 'Ville de la cathédrale la plus haute de France.', quartiers: ['Centre-ville', 'Saint-Jean', 'Saint-Lucien', 'Argentine'] },
+  compiegne: {
+    description: 'Besoin d’un professionnel à Compiègne ? Située en Hauts-de-France, cette ville dynamique du Oise bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Clairoix, Margny-lès-Compiègne, Choisy-au-Bac.',
+    quartiers: ['Centre-ville', 'Clairoix', 'Margny-lès-Compiègne', 'Choisy-au-Bac', 'Venette', 'Jaux', 'Lacroix-Saint-Ouen'],
+  },
+  creil: {
+    description: 'Vous habitez à Creil ou ses environs ? Nos artisans qualifiés du Oise sont disponibles pour tous vos travaux. Creil, ville dynamique nordiste de 36 000 habitants, mérite des professionnels à la hauteur, ainsi que Nogent-sur-Oise, Villers-Saint-Paul, Saint-Maximin.',
+    quartiers: ['Centre-ville', 'Nogent-sur-Oise', 'Villers-Saint-Paul', 'Saint-Maximin', 'Montataire', 'Verneuil-en-Halatte', 'Monchy-Saint-Éloi'],
+  },
+  'nogent-sur-oise': {
+    description: 'Vous habitez à Nogent-sur-Oise ou ses environs ? Nos artisans qualifiés du Oise sont disponibles pour tous vos travaux. Nogent-sur-Oise, ville active nordiste de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Monchy-Saint-Éloi, Villers-Saint-Paul, Creil.',
+    quartiers: ['Centre-ville', 'Monchy-Saint-Éloi', 'Villers-Saint-Paul', 'Creil', 'Montataire', 'Laigneville', 'Cauffry'],
+  },
+  senlis: {
+    description: 'Découvrez les meilleurs artisans à Senlis en Oise. Avec le nord de la France et 15 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Verneuil-en-Halatte, Chantilly, Creil.',
+    quartiers: ['Centre-ville', 'Verneuil-en-Halatte', 'Chantilly', 'Creil', 'Saint-Maximin', 'Orry-la-Ville', 'Pontpoint'],
+  },
+  'crepy-en-valois': {
+    description: 'Besoin d’un professionnel à Crépy-en-Valois ? Située en Hauts-de-France, cette commune du Oise bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Béthisy-Saint-Pierre, Nanteuil-le-Haudouin, Verberie.',
+    quartiers: ['Centre-ville', 'Béthisy-Saint-Pierre', 'Nanteuil-le-Haudouin', 'Verberie', 'Lacroix-Saint-Ouen', 'Le Meux', 'Le Plessis-Belleville'],
+  },
+  montataire: {
+    description: 'Artisans référencés à Montataire et ses environs. Cette commune nordiste de 14 000 habitants en Oise compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Nogent-sur-Oise, Laigneville, Creil.',
+    quartiers: ['Centre-ville', 'Nogent-sur-Oise', 'Laigneville', 'Creil', 'Saint-Maximin', 'Saint-Leu-d\'Esserent', 'Monchy-Saint-Éloi'],
+  },
+  meru: {
+    description: 'Méru (Oise, Hauts-de-France) est une commune de 14 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Andeville, Bornel, Sainte-Geneviève.',
+    quartiers: ['Centre-ville', 'Andeville', 'Bornel', 'Sainte-Geneviève', 'Noailles', 'Neuilly-en-Thelle', 'Chambly'],
+  },
+  noyon: {
+    description: 'À Noyon, commune du Oise (13 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Ribécourt-Dreslincourt, Thourotte, Longueil-Annel.',
+    quartiers: ['Centre-ville', 'Ribécourt-Dreslincourt', 'Thourotte', 'Longueil-Annel', 'Choisy-au-Bac', 'Clairoix', 'Trosly-Breuil'],
+  },
+  'pont-sainte-maxence': {
+    description: 'Pont-Sainte-Maxence est une commune de 12 000 habitants située dans le département Oise en Hauts-de-France. Nos artisans qualifiés interviennent à Pont-Sainte-Maxence, ainsi que Pontpoint, Brenouille, Chevrières pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Pontpoint', 'Brenouille', 'Chevrières', 'Verneuil-en-Halatte', 'Verberie', 'Villers-Saint-Paul'],
+  },
+  chantilly: {
+    description: 'Chantilly est une commune de 11 000 habitants située dans le département Oise en Hauts-de-France. Nos artisans qualifiés interviennent à Chantilly, ainsi que Coye-la-Forêt, Orry-la-Ville, Lamorlaye pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Coye-la-Forêt', 'Orry-la-Ville', 'Lamorlaye', 'Gouvieux', 'Saint-Maximin', 'La Chapelle-en-Serval'],
+  },
+  clermont: {
+    description: 'Artisans référencés à Clermont et ses environs. Cette commune nordiste de 11 000 habitants en Oise compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Breuil-le-Vert, Fitz-James, Agnetz.',
+    quartiers: ['Centre-ville', 'Breuil-le-Vert', 'Fitz-James', 'Agnetz', 'Breuil-le-Sec', 'Rantigny', 'Liancourt'],
+  },
+  chambly: {
+    description: 'Trouvez des artisans qualifiés à Chambly (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lamorlaye: {
+    description: 'Trouvez des artisans qualifiés à Lamorlaye (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gouvieux: {
+    description: 'Trouvez des artisans qualifiés à Gouvieux (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'margny-les-compiegne': {
+    description: 'Trouvez des artisans qualifiés à Margny-lès-Compiègne (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  liancourt: {
+    description: 'Trouvez des artisans qualifiés à Liancourt (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villers-saint-paul': {
+    description: 'Trouvez des artisans qualifiés à Villers-Saint-Paul (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-just-en-chaussee': {
+    description: 'Trouvez des artisans qualifiés à Saint-Just-en-Chaussée (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'lacroix-saint-ouen': {
+    description: 'Trouvez des artisans qualifiés à Lacroix-Saint-Ouen (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mouy: {
+    description: 'Trouvez des artisans qualifiés à Mouy (Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,27 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  alencon: {
+    description: 'Artisans référencés à Alençon et ses environs. Cette ville active normande de 25 000 habitants en Orne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Damigny, Saint-Germain-du-Corbéis, Condé-sur-Sarthe.',
+    quartiers: ['Centre-ville', 'Damigny', 'Saint-Germain-du-Corbéis', 'Condé-sur-Sarthe', 'Sées'],
+  },
+  flers: {
+    description: 'Artisans référencés à Flers et ses environs. Cette commune normande de 14 000 habitants en Orne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Georges-des-Groseillers, Athis-Val de Rouvre, Tinchebray-Bocage.',
+    quartiers: ['Centre-ville', 'Saint-Georges-des-Groseillers', 'Athis-Val de Rouvre', 'Tinchebray-Bocage', 'Domfront en Poiraie', 'Putanges-le-Lac', 'Bagnoles de l\'Orne Normandie'],
+  },
+  argentan: {
+    description: 'Argentan est une commune de 14 000 habitants située dans le département Orne en Normandie. Nos artisans qualifiés interviennent à Argentan, ainsi que Écouché-les-Vallées, Gouffern en Auge, Sées pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Écouché-les-Vallées', 'Gouffern en Auge', 'Sées', 'Putanges-le-Lac'],
+  },
+  'l-aigle': {
+    description: 'Trouvez des artisans qualifiés à L\'Aigle (Orne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ferte-mace': {
+    description: 'Trouvez des artisans qualifiés à La Ferté Macé (Orne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,294 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  calais: { description: 'Premier port transmanche de France.', quartiers: ['Centre-ville', 'Saint-Pierre', 'Beau-Marais', 'Fort-Nieulay', 'Courgain', 'Nouvelle-France', 'Pont-du-Leu'] },
+  arras: { description: 'Ville aux deux places, patrimoine baroque.', quartiers: ['Centre-ville', 'Saint-Sauveur', 'Citadelle', 'Saint-Michel'] },
+  'boulogne-sur-mer': { description: 'Premier port de pêche français.', quartiers: ['Haute-Ville', 'Capécure', 'Bréquerecque', 'Saint-Pierre'] },
+  lens: {
+    description: 'Besoin d’un professionnel à Lens ? Située en Hauts-de-France, cette ville dynamique du Pas-de-Calais bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Éleu-dit-Leauwette, Loos-en-Gohelle, Loison-sous-Lens.',
+    quartiers: ['Centre-ville', 'Éleu-dit-Leauwette', 'Loos-en-Gohelle', 'Loison-sous-Lens', 'Sallaumines', 'Liévin', 'Avion'],
+  },
+  lievin: {
+    description: 'À Liévin, ville dynamique du Pas-de-Calais (30 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Angres, Éleu-dit-Leauwette, Grenay.',
+    quartiers: ['Centre-ville', 'Angres', 'Éleu-dit-Leauwette', 'Grenay', 'Givenchy-en-Gohelle', 'Lens', 'Aix-Noulette'],
+  },
+  'henin-beaumont': {
+    description: 'Découvrez les meilleurs artisans à Hénin-Beaumont en Pas-de-Calais. Avec le nord de la France et 26 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Montigny-en-Gohelle, Noyelles-Godault, Dourges.',
+    quartiers: ['Centre-ville', 'Montigny-en-Gohelle', 'Noyelles-Godault', 'Dourges', 'Billy-Montigny', 'Drocourt', 'Fouquières-lès-Lens'],
+  },
+  bethune: {
+    description: 'Vous habitez à Béthune ou ses environs ? Nos artisans qualifiés du Pas-de-Calais sont disponibles pour tous vos travaux. Béthune, ville active nordiste de 25 000 habitants, mérite des professionnels à la hauteur, ainsi que Annezin, Verquin, Vendin-lès-Béthune.',
+    quartiers: ['Centre-ville', 'Annezin', 'Verquin', 'Vendin-lès-Béthune', 'Beuvry', 'Locon', 'Labourse'],
+  },
+  'bruay-la-buissiere': {
+    description: 'Bruay-la-Buissière est une ville active de 21 000 habitants située dans le département Pas-de-Calais en Hauts-de-France. Nos artisans qualifiés interviennent à Bruay-la-Buissière, ainsi que Haillicourt, Marles-les-Mines, Lapugnoy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Haillicourt', 'Marles-les-Mines', 'Lapugnoy', 'Divion', 'Houdain', 'Calonne-Ricouart'],
+  },
+  carvin: {
+    description: 'À Carvin, commune du Pas-de-Calais (18 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine industriel en reconversion, nos professionnels interviennent dans toute la commune, ainsi que Libercourt, Meurchin, Courrières.',
+    quartiers: ['Centre-ville', 'Libercourt', 'Meurchin', 'Courrières', 'Oignies', 'Pont-à-Vendin', 'Harnes'],
+  },
+  avion: {
+    description: 'Avion (Pas-de-Calais, Hauts-de-France) est une commune de 17 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Éleu-dit-Leauwette, Vimy, Méricourt.',
+    quartiers: ['Centre-ville', 'Éleu-dit-Leauwette', 'Vimy', 'Méricourt', 'Sallaumines', 'Givenchy-en-Gohelle', 'Lens'],
+  },
+  'saint-omer': {
+    description: 'Vous habitez à Saint-Omer ou ses environs ? Nos artisans qualifiés du Pas-de-Calais sont disponibles pour tous vos travaux. Saint-Omer, commune nordiste de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Longuenesse, Saint-Martin-lez-Tatinghem, Arques.',
+    quartiers: ['Centre-ville', 'Longuenesse', 'Saint-Martin-lez-Tatinghem', 'Arques', 'Blendecques', 'Wizernes', 'Éperlecques'],
+  },
+  outreau: {
+    description: 'Outreau (Pas-de-Calais, Hauts-de-France) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Léonard, Équihen-Plage, Le Portel.',
+    quartiers: ['Centre-ville', 'Saint-Léonard', 'Équihen-Plage', 'Le Portel', 'Saint-Étienne-au-Mont', 'Boulogne-sur-Mer', 'Saint-Martin-Boulogne'],
+  },
+  berck: {
+    description: 'Vous habitez à Berck ou ses environs ? Nos artisans qualifiés du Pas-de-Calais sont disponibles pour tous vos travaux. Berck, commune nordiste de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Rang-du-Fliers, Merlimont, Verton.',
+    quartiers: ['Centre-ville', 'Rang-du-Fliers', 'Merlimont', 'Verton', 'Cucq', 'Le Touquet-Paris-Plage', 'Étaples'],
+  },
+  harnes: {
+    description: 'Trouvez un artisan de confiance à Harnes (Pas-de-Calais). Avec 12 000 habitants, cette commune nordiste dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Annay, Fouquières-lès-Lens, Courrières.',
+    quartiers: ['Centre-ville', 'Annay', 'Fouquières-lès-Lens', 'Courrières', 'Loison-sous-Lens', 'Pont-à-Vendin', 'Noyelles-sous-Lens'],
+  },
+  'bully-les-mines': {
+    description: 'Besoin d’un professionnel à Bully-les-Mines ? Située en Hauts-de-France, cette commune du Pas-de-Calais bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Grenay, Mazingarbe, Aix-Noulette.',
+    quartiers: ['Centre-ville', 'Grenay', 'Mazingarbe', 'Aix-Noulette', 'Sains-en-Gohelle', 'Bouvigny-Boyeffles', 'Liévin'],
+  },
+  mericourt: {
+    description: 'Découvrez les meilleurs artisans à Méricourt en Pas-de-Calais. Avec le nord de la France et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Sallaumines, Rouvroy, Avion.',
+    quartiers: ['Centre-ville', 'Sallaumines', 'Rouvroy', 'Avion', 'Billy-Montigny', 'Noyelles-sous-Lens', 'Fouquières-lès-Lens'],
+  },
+  'n-ux-les-mines': {
+    description: 'Nœux-les-Mines est une commune de 12 000 habitants située dans le département Pas-de-Calais en Hauts-de-France. Nos artisans qualifiés interviennent à Nœux-les-Mines, ainsi que Labourse, Sains-en-Gohelle, Verquin pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Labourse', 'Sains-en-Gohelle', 'Verquin', 'Hersin-Coupigny', 'Sailly-Labourse', 'Barlin'],
+  },
+  'saint-martin-boulogne': {
+    description: 'Vous habitez à Saint-Martin-Boulogne ou ses environs ? Nos artisans qualifiés du Pas-de-Calais sont disponibles pour tous vos travaux. Saint-Martin-Boulogne, commune nordiste de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Boulogne-sur-Mer, Saint-Léonard, Outreau.',
+    quartiers: ['Centre-ville', 'Boulogne-sur-Mer', 'Saint-Léonard', 'Outreau', 'Le Portel', 'Wimille', 'Wimereux'],
+  },
+  etaples: {
+    description: 'Besoin d’un professionnel à Étaples ? Située en Hauts-de-France, cette commune du Pas-de-Calais bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Le Touquet-Paris-Plage, Cucq, Camiers.',
+    quartiers: ['Centre-ville', 'Le Touquet-Paris-Plage', 'Cucq', 'Camiers', 'Merlimont', 'Neufchâtel-Hardelot', 'Rang-du-Fliers'],
+  },
+  longuenesse: {
+    description: 'Longuenesse est une commune de 11 000 habitants située dans le département Pas-de-Calais en Hauts-de-France. Nos artisans qualifiés interviennent à Longuenesse, ainsi que Saint-Martin-lez-Tatinghem, Wizernes, Blendecques pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Martin-lez-Tatinghem', 'Wizernes', 'Blendecques', 'Saint-Omer', 'Arques', 'Ecques'],
+  },
+  marck: {
+    description: 'Découvrez les meilleurs artisans à Marck en Pas-de-Calais. Avec le nord de la France et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Calais, Les Attaques, Coulogne.',
+    quartiers: ['Centre-ville', 'Calais', 'Les Attaques', 'Coulogne', 'Oye-Plage', 'Ardres', 'Coquelles'],
+  },
+  oignies: {
+    description: 'Découvrez les meilleurs artisans à Oignies en Pas-de-Calais. Avec le nord de la France et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Libercourt, Dourges, Courrières.',
+    quartiers: ['Centre-ville', 'Libercourt', 'Dourges', 'Courrières', 'Carvin', 'Évin-Malmaison', 'Noyelles-Godault'],
+  },
+  lillers: {
+    description: 'Vous habitez à Lillers ou ses environs ? Nos artisans qualifiés du Pas-de-Calais sont disponibles pour tous vos travaux. Lillers, commune nordiste de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Allouagne, Burbure, Auchel.',
+    quartiers: ['Centre-ville', 'Allouagne', 'Burbure', 'Auchel', 'Lapugnoy', 'Chocques', 'Isbergues'],
+  },
+  courrieres: {
+    description: 'Découvrez les meilleurs artisans à Courrières en Pas-de-Calais. Avec le nord de la France et 10 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Harnes, Montigny-en-Gohelle, Dourges.',
+    quartiers: ['Centre-ville', 'Harnes', 'Montigny-en-Gohelle', 'Dourges', 'Oignies', 'Fouquières-lès-Lens', 'Hénin-Beaumont'],
+  },
+  auchel: {
+    description: 'Besoin d’un professionnel à Auchel ? Située en Hauts-de-France, cette commune du Pas-de-Calais bénéficie de des besoins importants en isolation thermique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Cauchy-à-la-Tour, Burbure, Calonne-Ricouart.',
+    quartiers: ['Centre-ville', 'Cauchy-à-la-Tour', 'Burbure', 'Calonne-Ricouart', 'Marles-les-Mines', 'Allouagne', 'Lapugnoy'],
+  },
+  'montigny-en-gohelle': {
+    description: 'Trouvez des artisans qualifiés à Montigny-en-Gohelle (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aire-sur-la-lys': {
+    description: 'Trouvez des artisans qualifiés à Aire-sur-la-Lys (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  arques: {
+    description: 'Trouvez des artisans qualifiés à Arques (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sallaumines: {
+    description: 'Trouvez des artisans qualifiés à Sallaumines (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beuvry: {
+    description: 'Trouvez des artisans qualifiés à Beuvry (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-portel': {
+    description: 'Trouvez des artisans qualifiés à Le Portel (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wingles: {
+    description: 'Trouvez des artisans qualifiés à Wingles (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  isbergues: {
+    description: 'Trouvez des artisans qualifiés à Isbergues (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rouvroy: {
+    description: 'Trouvez des artisans qualifiés à Rouvroy (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vendin-le-vieil': {
+    description: 'Trouvez des artisans qualifiés à Vendin-le-Vieil (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mazingarbe: {
+    description: 'Trouvez des artisans qualifiés à Mazingarbe (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  libercourt: {
+    description: 'Trouvez des artisans qualifiés à Libercourt (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'billy-montigny': {
+    description: 'Trouvez des artisans qualifiés à Billy-Montigny (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  achicourt: {
+    description: 'Trouvez des artisans qualifiés à Achicourt (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'courcelles-les-lens': {
+    description: 'Trouvez des artisans qualifiés à Courcelles-lès-Lens (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  barlin: {
+    description: 'Trouvez des artisans qualifiés à Barlin (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  leforest: {
+    description: 'Trouvez des artisans qualifiés à Leforest (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  houdain: {
+    description: 'Trouvez des artisans qualifiés à Houdain (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noyelles-sous-lens': {
+    description: 'Trouvez des artisans qualifiés à Noyelles-sous-Lens (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'loos-en-gohelle': {
+    description: 'Trouvez des artisans qualifiés à Loos-en-Gohelle (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  divion: {
+    description: 'Trouvez des artisans qualifiés à Divion (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  grenay: {
+    description: 'Trouvez des artisans qualifiés à Grenay (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-laurent-blangy': {
+    description: 'Trouvez des artisans qualifiés à Saint-Laurent-Blangy (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wimereux: {
+    description: 'Trouvez des artisans qualifiés à Wimereux (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  dourges: {
+    description: 'Trouvez des artisans qualifiés à Dourges (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'fouquieres-les-lens': {
+    description: 'Trouvez des artisans qualifiés à Fouquières-lès-Lens (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'hersin-coupigny': {
+    description: 'Trouvez des artisans qualifiés à Hersin-Coupigny (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noyelles-godault': {
+    description: 'Trouvez des artisans qualifiés à Noyelles-Godault (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sains-en-gohelle': {
+    description: 'Trouvez des artisans qualifiés à Sains-en-Gohelle (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  douvrin: {
+    description: 'Trouvez des artisans qualifiés à Douvrin (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-martin-lez-tatinghem': {
+    description: 'Trouvez des artisans qualifiés à Saint-Martin-lez-Tatinghem (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  annezin: {
+    description: 'Trouvez des artisans qualifiés à Annezin (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'oye-plage': {
+    description: 'Trouvez des artisans qualifiés à Oye-Plage (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  dainville: {
+    description: 'Trouvez des artisans qualifiés à Dainville (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beaurains: {
+    description: 'Trouvez des artisans qualifiés à Beaurains (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  guines: {
+    description: 'Trouvez des artisans qualifiés à Guînes (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coulogne: {
+    description: 'Trouvez des artisans qualifiés à Coulogne (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marles-les-mines': {
+    description: 'Trouvez des artisans qualifiés à Marles-les-Mines (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'calonne-ricouart': {
+    description: 'Trouvez des artisans qualifiés à Calonne-Ricouart (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  audruicq: {
+    description: 'Trouvez des artisans qualifiés à Audruicq (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  brebieres: {
+    description: 'Trouvez des artisans qualifiés à Brebières (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marquise: {
+    description: 'Trouvez des artisans qualifiés à Marquise (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'loison-sous-lens': {
+    description: 'Trouvez des artisans qualifiés à Loison-sous-Lens (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cucq: {
+    description: 'Trouvez des artisans qualifiés à Cucq (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'billy-berclau': {
+    description: 'Trouvez des artisans qualifiés à Billy-Berclau (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  haillicourt: {
+    description: 'Trouvez des artisans qualifiés à Haillicourt (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  laventie: {
+    description: 'Trouvez des artisans qualifiés à Laventie (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-etienne-au-mont': {
+    description: 'Trouvez des artisans qualifiés à Saint-Étienne-au-Mont (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lestrem: {
+    description: 'Trouvez des artisans qualifiés à Lestrem (Pas-de-Calais). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,80 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'clermont-ferrand': { description: 'Capitale auvergnate au pied des volcans.', quartiers: ['Centre historique', 'Jaude', 'Montferrand', 'Croix-de-Neyrat', 'Les Cézeaux', 'Salins'] },
+  'cournon-d-auvergne': {
+    description: 'Trouvez un artisan de confiance à Cournon-d\'Auvergne (Puy-de-Dôme). Avec 20 000 habitants, cette commune rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Cendre, Lempdes, Pérignat-lès-Sarliève.',
+    quartiers: ['Centre-ville', 'Le Cendre', 'Lempdes', 'Pérignat-lès-Sarliève', 'Orcet', 'Mur-sur-Allier', 'Aubière'],
+  },
+  riom: {
+    description: 'Vous habitez à Riom ou ses environs ? Nos artisans qualifiés du Puy-de-Dôme sont disponibles pour tous vos travaux. Riom, commune rhônalpine de 19 000 habitants, mérite des professionnels à la hauteur, ainsi que Mozac, Saint-Bonnet-près-Riom, Châteaugay.',
+    quartiers: ['Centre-ville', 'Mozac', 'Saint-Bonnet-près-Riom', 'Châteaugay', 'Châtel-Guyon', 'Saint-Beauzire', 'Ennezat'],
+  },
+  chamalieres: {
+    description: 'Trouvez un artisan de confiance à Chamalières (Puy-de-Dôme). Avec 18 000 habitants, cette commune rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Royat, Beaumont, Ceyrat.',
+    quartiers: ['Centre-ville', 'Royat', 'Beaumont', 'Ceyrat', 'Nohanent', 'Clermont-Ferrand', 'Orcines'],
+  },
+  issoire: {
+    description: 'Découvrez les meilleurs artisans à Issoire en Puy-de-Dôme. Avec les Alpes et la vallée du Rhône et 15 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Germain-Lembron, Vic-le-Comte, Brassac-les-Mines.',
+    quartiers: ['Centre-ville', 'Saint-Germain-Lembron', 'Vic-le-Comte', 'Brassac-les-Mines', 'Veyre-Monton', 'Mirefleurs', 'Les Martres-de-Veyre'],
+  },
+  'pont-du-chateau': {
+    description: 'Pont-du-Château est une commune de 12 000 habitants située dans le département Puy-de-Dôme en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Pont-du-Château, ainsi que Mur-sur-Allier, Les Martres-d\'Artière, Lempdes pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Mur-sur-Allier', 'Les Martres-d\'Artière', 'Lempdes', 'Vertaizon', 'Aulnat', 'Gerzat'],
+  },
+  thiers: {
+    description: 'Vous habitez à Thiers ou ses environs ? Nos artisans qualifiés du Puy-de-Dôme sont disponibles pour tous vos travaux. Thiers, commune rhônalpine de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Peschadoires, Orléat, Puy-Guillaume.',
+    quartiers: ['Centre-ville', 'Peschadoires', 'Orléat', 'Puy-Guillaume', 'Courpière', 'Lezoux', 'Maringues'],
+  },
+  beaumont: {
+    description: 'À Beaumont, commune du Puy-de-Dôme (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Ceyrat, Romagnat, Aubière.',
+    quartiers: ['Centre-ville', 'Ceyrat', 'Romagnat', 'Aubière', 'Chamalières', 'Royat', 'Clermont-Ferrand'],
+  },
+  aubiere: {
+    description: 'Aubière est une commune de 10 000 habitants située dans le département Puy-de-Dôme en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Aubière, ainsi que Pérignat-lès-Sarliève, Beaumont, Clermont-Ferrand pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Pérignat-lès-Sarliève', 'Beaumont', 'Clermont-Ferrand', 'La Roche-Blanche', 'Cournon-d\'Auvergne', 'Ceyrat'],
+  },
+  gerzat: {
+    description: 'Gerzat (Puy-de-Dôme, Auvergne-Rhône-Alpes) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Beauzire, Cébazat, Aulnat.',
+    quartiers: ['Centre-ville', 'Saint-Beauzire', 'Cébazat', 'Aulnat', 'Châteaugay', 'Clermont-Ferrand', 'Lempdes'],
+  },
+  cebazat: {
+    description: 'Trouvez des artisans qualifiés à Cébazat (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lempdes: {
+    description: 'Trouvez des artisans qualifiés à Lempdes (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  romagnat: {
+    description: 'Trouvez des artisans qualifiés à Romagnat (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ceyrat: {
+    description: 'Trouvez des artisans qualifiés à Ceyrat (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lezoux: {
+    description: 'Trouvez des artisans qualifiés à Lezoux (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ambert: {
+    description: 'Trouvez des artisans qualifiés à Ambert (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatel-guyon': {
+    description: 'Trouvez des artisans qualifiés à Châtel-Guyon (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-cendre': {
+    description: 'Trouvez des artisans qualifiés à Le Cendre (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vic-le-comte': {
+    description: 'Trouvez des artisans qualifiés à Vic-le-Comte (Puy-de-Dôme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
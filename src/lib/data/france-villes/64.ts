@@ -0,0 +1,98 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  pau: { description: 'Ville royale au pied des Pyrénées.', quartiers: ['Centre-ville', 'Trespoey', 'Saragosse', 'Bosquet', 'Dufau', 'Ousse-des-Bois', 'Université'] },
+  bayonne: { description: 'Capitale du Pays basque français.', quartiers: ['Grand Bayonne', 'Petit Bayonne', 'Saint-Esprit', 'Marracq'] },
+  anglet: {
+    description: 'À Anglet, ville dynamique du Pyrénées-Atlantiques (43 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Biarritz, Bayonne, Boucau.',
+    quartiers: ['Centre-ville', 'Biarritz', 'Bayonne', 'Boucau', 'Bassussarry', 'Saint-Pierre-d\'Irube', 'Arcangues'],
+  },
+  biarritz: { description: 'Station balnéaire de la côte basque.', quartiers: ['Centre-ville', 'La Négresse', 'Saint-Charles', 'Milady'] },
+  hendaye: {
+    description: 'Découvrez les meilleurs artisans à Hendaye en Pyrénées-Atlantiques. Avec le sud-ouest atlantique et 18 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Urrugne, Ciboure, Saint-Jean-de-Luz.',
+    quartiers: ['Centre-ville', 'Urrugne', 'Ciboure', 'Saint-Jean-de-Luz', 'Ascain', 'Sare', 'Saint-Pée-sur-Nivelle'],
+  },
+  'saint-jean-de-luz': {
+    description: 'Saint-Jean-de-Luz est une commune de 15 000 habitants située dans le département Pyrénées-Atlantiques en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Saint-Jean-de-Luz, ainsi que Ciboure, Ahetze, Ascain pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Ciboure', 'Ahetze', 'Ascain', 'Bidart', 'Arbonne', 'Urrugne'],
+  },
+  billere: {
+    description: 'Besoin d’un professionnel à Billère ? Située en Nouvelle-Aquitaine, cette commune du Pyrénées-Atlantiques bénéficie de des besoins en rénovation énergétique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Lons, Jurançon, Pau.',
+    quartiers: ['Centre-ville', 'Lons', 'Jurançon', 'Pau', 'Lescar', 'Bizanos', 'Gelos'],
+  },
+  lons: {
+    description: 'Artisans référencés à Lons et ses environs. Cette commune néo-aquitaine de 14 000 habitants en Pyrénées-Atlantiques compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Billère, Lescar, Pau.',
+    quartiers: ['Centre-ville', 'Billère', 'Lescar', 'Pau', 'Artiguelouve', 'Jurançon', 'Montardon'],
+  },
+  orthez: {
+    description: 'Artisans référencés à Orthez et ses environs. Cette commune néo-aquitaine de 11 000 habitants en Pyrénées-Atlantiques compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Salies-de-Béarn, Mourenx, Artix.',
+    quartiers: ['Centre-ville', 'Salies-de-Béarn', 'Mourenx', 'Artix'],
+  },
+  'oloron-sainte-marie': {
+    description: 'Oloron-Sainte-Marie (Pyrénées-Atlantiques, Nouvelle-Aquitaine) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Arudy, Monein, Gan.',
+    quartiers: ['Centre-ville', 'Arudy', 'Monein', 'Gan', 'Jurançon', 'Artiguelouve', 'Gelos'],
+  },
+  urrugne: {
+    description: 'Urrugne est une commune de 11 000 habitants située dans le département Pyrénées-Atlantiques en Nouvelle-Aquitaine. Nos artisans qualifiés interviennent à Urrugne, ainsi que Ciboure, Hendaye, Ascain pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Ciboure', 'Hendaye', 'Ascain', 'Saint-Jean-de-Luz', 'Sare', 'Saint-Pée-sur-Nivelle'],
+  },
+  lescar: {
+    description: 'Trouvez des artisans qualifiés à Lescar (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  boucau: {
+    description: 'Trouvez des artisans qualifiés à Boucau (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ustaritz: {
+    description: 'Trouvez des artisans qualifiés à Ustaritz (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bidart: {
+    description: 'Trouvez des artisans qualifiés à Bidart (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  hasparren: {
+    description: 'Trouvez des artisans qualifiés à Hasparren (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pee-sur-nivelle': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pée-sur-Nivelle (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  jurancon: {
+    description: 'Trouvez des artisans qualifiés à Jurançon (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cambo-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Cambo-les-Bains (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ciboure: {
+    description: 'Trouvez des artisans qualifiés à Ciboure (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-d-irube': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-d\'Irube (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mourenx: {
+    description: 'Trouvez des artisans qualifiés à Mourenx (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gan: {
+    description: 'Trouvez des artisans qualifiés à Gan (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mouguerre: {
+    description: 'Trouvez des artisans qualifiés à Mouguerre (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  idron: {
+    description: 'Trouvez des artisans qualifiés à Idron (Pyrénées-Atlantiques). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
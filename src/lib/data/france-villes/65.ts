@@ -0,0 +1,32 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  tarbes: { description: 'Ville pyrénéenne, porte des montagnes.', quartiers: ['Centre-ville', 'Laubadère', 'Arsenal', 'Ormeau'] },
+  lourdes: {
+    description: 'Découvrez les meilleurs artisans à Lourdes en Hautes-Pyrénées. Avec le sud de la France et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Ossun, Argelès-Gazost, Juillan.',
+    quartiers: ['Centre-ville', 'Ossun', 'Argelès-Gazost', 'Juillan', 'Odos', 'Ibos', 'Soues'],
+  },
+  aureilhan: {
+    description: 'Trouvez des artisans qualifiés à Aureilhan (Hautes-Pyrénées). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bagneres-de-bigorre': {
+    description: 'Trouvez des artisans qualifiés à Bagnères-de-Bigorre (Hautes-Pyrénées). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lannemezan: {
+    description: 'Trouvez des artisans qualifiés à Lannemezan (Hautes-Pyrénées). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'borderes-sur-l-echez': {
+    description: 'Trouvez des artisans qualifiés à Bordères-sur-l\'Échez (Hautes-Pyrénées). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  semeac: {
+    description: 'Trouvez des artisans qualifiés à Séméac (Hautes-Pyrénées). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,92 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  perpignan: { description: 'Porte de la Catalogne française.', quartiers: ['Centre historique', 'Saint-Jacques', 'Moulin à Vent', 'Le Vernet', 'Bas-Vernet'] },
+  'canet-en-roussillon': {
+    description: 'Besoin d’un professionnel à Canet-en-Roussillon ? Située en Occitanie, cette commune du Pyrénées-Orientales bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Nazaire, Cabestany, Alénya.',
+    quartiers: ['Centre-ville', 'Saint-Nazaire', 'Cabestany', 'Alénya', 'Sainte-Marie-la-Mer', 'Saleilles', 'Villelongue-de-la-Salanque'],
+  },
+  'saint-cyprien': {
+    description: 'Découvrez les meilleurs artisans à Saint-Cyprien en Pyrénées-Orientales. Avec le sud de la France et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Latour-Bas-Elne, Elne, Alénya.',
+    quartiers: ['Centre-ville', 'Latour-Bas-Elne', 'Elne', 'Alénya', 'Saint-Nazaire', 'Corneilla-del-Vercol', 'Théza'],
+  },
+  'saint-esteve': {
+    description: 'À Saint-Estève, commune du Pyrénées-Orientales (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural riche, nos professionnels interviennent dans toute la commune, ainsi que Baho, Baixas, Toulouges.',
+    quartiers: ['Centre-ville', 'Baho', 'Baixas', 'Toulouges', 'Perpignan', 'Le Soler', 'Pézilla-la-Rivière'],
+  },
+  pia: {
+    description: 'Besoin d’un professionnel à Pia ? Située en Occitanie, cette commune du Pyrénées-Orientales bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Claira, Bompas, Rivesaltes.',
+    quartiers: ['Centre-ville', 'Claira', 'Bompas', 'Rivesaltes', 'Villelongue-de-la-Salanque', 'Perpignan', 'Saint-Estève'],
+  },
+  'argeles-sur-mer': {
+    description: 'Découvrez les meilleurs artisans à Argelès-sur-Mer en Pyrénées-Orientales. Avec le sud de la France et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Sorède, Saint-André, Collioure.',
+    quartiers: ['Centre-ville', 'Sorède', 'Saint-André', 'Collioure', 'Palau-del-Vidre', 'Port-Vendres', 'Laroque-des-Albères'],
+  },
+  cabestany: {
+    description: 'Besoin d’un professionnel à Cabestany ? Située en Occitanie, cette commune du Pyrénées-Orientales bénéficie de un ensoleillement favorisant les travaux extérieurs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saleilles, Saint-Nazaire, Canet-en-Roussillon.',
+    quartiers: ['Centre-ville', 'Saleilles', 'Saint-Nazaire', 'Canet-en-Roussillon', 'Perpignan', 'Théza', 'Alénya'],
+  },
+  'saint-laurent-de-la-salanque': {
+    description: 'Trouvez des artisans qualifiés à Saint-Laurent-de-la-Salanque (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  elne: {
+    description: 'Trouvez des artisans qualifiés à Elne (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rivesaltes: {
+    description: 'Trouvez des artisans qualifiés à Rivesaltes (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  thuir: {
+    description: 'Trouvez des artisans qualifiés à Thuir (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-soler': {
+    description: 'Trouvez des artisans qualifiés à Le Soler (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bompas: {
+    description: 'Trouvez des artisans qualifiés à Bompas (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ceret: {
+    description: 'Trouvez des artisans qualifiés à Céret (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  toulouges: {
+    description: 'Trouvez des artisans qualifiés à Toulouges (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  canohes: {
+    description: 'Trouvez des artisans qualifiés à Canohès (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  prades: {
+    description: 'Trouvez des artisans qualifiés à Prades (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-barcares': {
+    description: 'Trouvez des artisans qualifiés à Le Barcarès (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  saleilles: {
+    description: 'Trouvez des artisans qualifiés à Saleilles (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ille-sur-tet': {
+    description: 'Trouvez des artisans qualifiés à Ille-sur-Têt (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pollestres: {
+    description: 'Trouvez des artisans qualifiés à Pollestres (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-boulou': {
+    description: 'Trouvez des artisans qualifiés à Le Boulou (Pyrénées-Orientales). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,144 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  strasbourg: { description: 'Capitale européenne, ville frontière avec l\'Allemagne.', quartiers: ['Grande Île', 'Petite France', 'Krutenau', 'Neudorf', 'Robertsau'] },
+  haguenau: {
+    description: 'Découvrez les meilleurs artisans à Haguenau en Bas-Rhin. Avec le carrefour européen et 36 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Kaltenhouse, Schweighouse-sur-Moder, Oberhoffen-sur-Moder.',
+    quartiers: ['Centre-ville', 'Kaltenhouse', 'Schweighouse-sur-Moder', 'Oberhoffen-sur-Moder', 'Schirrhein', 'Weitbruch', 'Bischwiller'],
+  },
+  schiltigheim: {
+    description: 'Besoin d’un professionnel à Schiltigheim ? Située en Grand Est, cette ville dynamique du Bas-Rhin bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Bischheim, Hœnheim, Souffelweyersheim.',
+    quartiers: ['Centre-ville', 'Bischheim', 'Hœnheim', 'Souffelweyersheim', 'Mundolsheim', 'Mittelhausbergen', 'Reichstett'],
+  },
+  'illkirch-graffenstaden': {
+    description: 'Vous habitez à Illkirch-Graffenstaden ou ses environs ? Nos artisans qualifiés du Bas-Rhin sont disponibles pour tous vos travaux. Illkirch-Graffenstaden, ville active du Grand Est de 28 000 habitants, mérite des professionnels à la hauteur, ainsi que Ostwald, Fegersheim, Eschau.',
+    quartiers: ['Centre-ville', 'Ostwald', 'Fegersheim', 'Eschau', 'Lingolsheim', 'Geispolsheim', 'Strasbourg'],
+  },
+  lingolsheim: {
+    description: 'À Lingolsheim, ville active du Bas-Rhin (21 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Ostwald, Holtzheim, Eckbolsheim.',
+    quartiers: ['Centre-ville', 'Ostwald', 'Holtzheim', 'Eckbolsheim', 'Wolfisheim', 'Entzheim', 'Oberschaeffolsheim'],
+  },
+  selestat: {
+    description: 'Trouvez un artisan de confiance à Sélestat (Bas-Rhin). Avec 20 000 habitants, cette commune du Grand Est dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Scherwiller, Muttersholtz, Ebersheim.',
+    quartiers: ['Centre-ville', 'Scherwiller', 'Muttersholtz', 'Ebersheim', 'Châtenois', 'Dambach-la-Ville', 'Hilsenheim'],
+  },
+  bischheim: {
+    description: 'Artisans référencés à Bischheim et ses environs. Cette commune du Grand Est de 19 000 habitants en Bas-Rhin compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Hœnheim, Schiltigheim, Souffelweyersheim.',
+    quartiers: ['Centre-ville', 'Hœnheim', 'Schiltigheim', 'Souffelweyersheim', 'Reichstett', 'Mundolsheim', 'Mittelhausbergen'],
+  },
+  ostwald: {
+    description: 'Découvrez les meilleurs artisans à Ostwald en Bas-Rhin. Avec le carrefour européen et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Lingolsheim, Illkirch-Graffenstaden, Eckbolsheim.',
+    quartiers: ['Centre-ville', 'Lingolsheim', 'Illkirch-Graffenstaden', 'Eckbolsheim', 'Strasbourg', 'Holtzheim', 'Geispolsheim'],
+  },
+  obernai: {
+    description: 'Obernai est une commune de 13 000 habitants située dans le département Bas-Rhin en Grand Est. Nos artisans qualifiés interviennent à Obernai, ainsi que Bischoffsheim, Rosheim, Griesheim-près-Molsheim pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bischoffsheim', 'Rosheim', 'Griesheim-près-Molsheim', 'Dorlisheim', 'Barr', 'Bœrsch'],
+  },
+  bischwiller: {
+    description: 'Bischwiller est une commune de 12 000 habitants située dans le département Bas-Rhin en Grand Est. Nos artisans qualifiés interviennent à Bischwiller, ainsi que Oberhoffen-sur-Moder, Gries, Kaltenhouse pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Oberhoffen-sur-Moder', 'Gries', 'Kaltenhouse', 'Herrlisheim', 'Schirrhein', 'Weyersheim'],
+  },
+  'h-nheim': {
+    description: 'Artisans référencés à Hœnheim et ses environs. Cette commune du Grand Est de 12 000 habitants en Bas-Rhin compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Souffelweyersheim, Bischheim, Schiltigheim.',
+    quartiers: ['Centre-ville', 'Souffelweyersheim', 'Bischheim', 'Schiltigheim', 'Reichstett', 'Mundolsheim', 'Mittelhausbergen'],
+  },
+  saverne: {
+    description: 'Artisans référencés à Saverne et ses environs. Cette commune du Grand Est de 11 000 habitants en Bas-Rhin compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Marmoutier, Dettwiller, Bouxwiller.',
+    quartiers: ['Centre-ville', 'Marmoutier', 'Dettwiller', 'Bouxwiller', 'Wasselonne', 'Hochfelden', 'Ingwiller'],
+  },
+  erstein: {
+    description: 'Besoin d’un professionnel à Erstein ? Située en Grand Est, cette commune du Bas-Rhin bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Gerstheim, Plobsheim, Eschau.',
+    quartiers: ['Centre-ville', 'Gerstheim', 'Plobsheim', 'Eschau', 'Lipsheim', 'Fegersheim', 'Benfeld'],
+  },
+  brumath: {
+    description: 'À Brumath, commune du Bas-Rhin (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Geudertheim, Vendenheim, Hœrdt.',
+    quartiers: ['Centre-ville', 'Geudertheim', 'Vendenheim', 'Hœrdt', 'Mommenheim', 'Weitbruch', 'Wingersheim les Quatre Bans'],
+  },
+  molsheim: {
+    description: 'Trouvez des artisans qualifiés à Molsheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  souffelweyersheim: {
+    description: 'Trouvez des artisans qualifiés à Souffelweyersheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  geispolsheim: {
+    description: 'Trouvez des artisans qualifiés à Geispolsheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wissembourg: {
+    description: 'Trouvez des artisans qualifiés à Wissembourg (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eckbolsheim: {
+    description: 'Trouvez des artisans qualifiés à Eckbolsheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  barr: {
+    description: 'Trouvez des artisans qualifiés à Barr (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vendenheim: {
+    description: 'Trouvez des artisans qualifiés à Vendenheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mutzig: {
+    description: 'Trouvez des artisans qualifiés à Mutzig (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  benfeld: {
+    description: 'Trouvez des artisans qualifiés à Benfeld (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eschau: {
+    description: 'Trouvez des artisans qualifiés à Eschau (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-wantzenau': {
+    description: 'Trouvez des artisans qualifiés à La Wantzenau (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  oberhausbergen: {
+    description: 'Trouvez des artisans qualifiés à Oberhausbergen (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fegersheim: {
+    description: 'Trouvez des artisans qualifiés à Fegersheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wasselonne: {
+    description: 'Trouvez des artisans qualifiés à Wasselonne (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rosheim: {
+    description: 'Trouvez des artisans qualifiés à Rosheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  reichshoffen: {
+    description: 'Trouvez des artisans qualifiés à Reichshoffen (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  drusenheim: {
+    description: 'Trouvez des artisans qualifiés à Drusenheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mundolsheim: {
+    description: 'Trouvez des artisans qualifiés à Mundolsheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gambsheim: {
+    description: 'Trouvez des artisans qualifiés à Gambsheim (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'schweighouse-sur-moder': {
+    description: 'Trouvez des artisans qualifiés à Schweighouse-sur-Moder (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'val-de-moder': {
+    description: 'Trouvez des artisans qualifiés à Val-de-Moder (Bas-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,97 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  mulhouse: { description: 'Capitale industrielle alsacienne.', quartiers: ['Centre-ville', 'Rebberg', 'Dornach', 'Bourtzwiller', 'Fonderie'] },
+  colmar: { description: 'Capitale des vins d\'Alsace, la petite Venise.', quartiers: ['Centre historique', 'Maraîchers', 'Europe', 'Saint-Antoine'] },
+  wittenheim: {
+    description: 'Découvrez les meilleurs artisans à Wittenheim en Haut-Rhin. Avec le carrefour européen et 16 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Kingersheim, Ruelisheim, Pulversheim.',
+    quartiers: ['Centre-ville', 'Kingersheim', 'Ruelisheim', 'Pulversheim', 'Richwiller', 'Staffelfelden', 'Wittelsheim'],
+  },
+  illzach: {
+    description: 'Vous habitez à Illzach ou ses environs ? Nos artisans qualifiés du Haut-Rhin sont disponibles pour tous vos travaux. Illzach, commune du Grand Est de 15 000 habitants, mérite des professionnels à la hauteur, ainsi que Sausheim, Mulhouse, Baldersheim.',
+    quartiers: ['Centre-ville', 'Sausheim', 'Mulhouse', 'Baldersheim', 'Kingersheim', 'Riedisheim', 'Rixheim'],
+  },
+  rixheim: {
+    description: 'Découvrez les meilleurs artisans à Rixheim en Haut-Rhin. Avec le carrefour européen et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Habsheim, Riedisheim, Sausheim.',
+    quartiers: ['Centre-ville', 'Habsheim', 'Riedisheim', 'Sausheim', 'Illzach', 'Baldersheim', 'Mulhouse'],
+  },
+  kingersheim: {
+    description: 'Découvrez les meilleurs artisans à Kingersheim en Haut-Rhin. Avec le carrefour européen et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Richwiller, Wittenheim, Pfastatt.',
+    quartiers: ['Centre-ville', 'Richwiller', 'Wittenheim', 'Pfastatt', 'Illzach', 'Mulhouse', 'Ruelisheim'],
+  },
+  riedisheim: {
+    description: 'À Riedisheim, commune du Haut-Rhin (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture alsacienne et lorraine, nos professionnels interviennent dans toute la commune, ainsi que Mulhouse, Rixheim, Illzach.',
+    quartiers: ['Centre-ville', 'Mulhouse', 'Rixheim', 'Illzach', 'Brunstatt-Didenheim', 'Habsheim', 'Sausheim'],
+  },
+  cernay: {
+    description: 'Besoin d’un professionnel à Cernay ? Située en Grand Est, cette commune du Haut-Rhin bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Vieux-Thann, Wittelsheim, Staffelfelden.',
+    quartiers: ['Centre-ville', 'Vieux-Thann', 'Wittelsheim', 'Staffelfelden', 'Thann', 'Lutterbach', 'Richwiller'],
+  },
+  guebwiller: {
+    description: 'Besoin d’un professionnel à Guebwiller ? Située en Grand Est, cette commune du Haut-Rhin bénéficie de des hivers rigoureux nécessitant une bonne isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Buhl, Issenheim, Soultz-Haut-Rhin.',
+    quartiers: ['Centre-ville', 'Buhl', 'Issenheim', 'Soultz-Haut-Rhin', 'Bollwiller', 'Soultzmatt', 'Rouffach'],
+  },
+  wittelsheim: {
+    description: 'Vous habitez à Wittelsheim ou ses environs ? Nos artisans qualifiés du Haut-Rhin sont disponibles pour tous vos travaux. Wittelsheim, commune du Grand Est de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Richwiller, Staffelfelden, Lutterbach.',
+    quartiers: ['Centre-ville', 'Richwiller', 'Staffelfelden', 'Lutterbach', 'Pfastatt', 'Wittenheim', 'Kingersheim'],
+  },
+  pfastatt: {
+    description: 'Vous habitez à Pfastatt ou ses environs ? Nos artisans qualifiés du Haut-Rhin sont disponibles pour tous vos travaux. Pfastatt, commune du Grand Est de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Lutterbach, Richwiller, Kingersheim.',
+    quartiers: ['Centre-ville', 'Lutterbach', 'Richwiller', 'Kingersheim', 'Mulhouse', 'Morschwiller-le-Bas', 'Wittelsheim'],
+  },
+  'brunstatt-didenheim': {
+    description: 'Trouvez des artisans qualifiés à Brunstatt-Didenheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wintzenheim: {
+    description: 'Trouvez des artisans qualifiés à Wintzenheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  thann: {
+    description: 'Trouvez des artisans qualifiés à Thann (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  huningue: {
+    description: 'Trouvez des artisans qualifiés à Huningue (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ensisheim: {
+    description: 'Trouvez des artisans qualifiés à Ensisheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'soultz-haut-rhin': {
+    description: 'Trouvez des artisans qualifiés à Soultz-Haut-Rhin (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lutterbach: {
+    description: 'Trouvez des artisans qualifiés à Lutterbach (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'horbourg-wihr': {
+    description: 'Trouvez des artisans qualifiés à Horbourg-Wihr (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  kembs: {
+    description: 'Trouvez des artisans qualifiés à Kembs (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  altkirch: {
+    description: 'Trouvez des artisans qualifiés à Altkirch (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sausheim: {
+    description: 'Trouvez des artisans qualifiés à Sausheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  blotzheim: {
+    description: 'Trouvez des artisans qualifiés à Blotzheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  habsheim: {
+    description: 'Trouvez des artisans qualifiés à Habsheim (Haut-Rhin). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,230 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  lyon: {
+    description: 'Troisième ville de France, Lyon est renommée pour sa gastronomie et son patrimoine.',
+    quartiers: ['Presqu\'île', 'Vieux Lyon', 'Part-Dieu', 'Confluence', 'Croix-Rousse', 'Gerland', 'Villeurbanne'],
+  },
+  villeurbanne: { description: 'Ville attenante à Lyon, pôle universitaire majeur.', quartiers: ['Gratte-Ciel', 'Tonkin', 'Cusset', 'Grandclément', 'Charpennes'] },
+  venissieux: { description: 'Ville industrielle de la métropole lyonnaise.', quartiers: ['Centre-ville', 'Minguettes', 'Parilly', 'Moulin à Vent'] },
+  'vaulx-en-velin': {
+    description: 'À Vaulx-en-Velin, ville importante du Rhône (53 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Décines-Charpieu, Villeurbanne, Bron.',
+    quartiers: ['Centre-ville', 'Décines-Charpieu', 'Villeurbanne', 'Bron', 'Chassieu', 'Rillieux-la-Pape', 'Caluire-et-Cuire'],
+  },
+  'saint-priest': { description: 'Ville dynamique de l\'Est lyonnais.', quartiers: ['Centre-ville', 'Ménival', 'Bel Air', 'Manissieux'] },
+  'caluire-et-cuire': {
+    description: 'Caluire-et-Cuire est une ville dynamique de 44 000 habitants située dans le département Rhône en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Caluire-et-Cuire, ainsi que Collonges-au-Mont-d\'Or, Fontaines-sur-Saône, Saint-Cyr-au-Mont-d\'Or pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Collonges-au-Mont-d\'Or', 'Fontaines-sur-Saône', 'Saint-Cyr-au-Mont-d\'Or', 'Sathonay-Camp', 'Saint-Didier-au-Mont-d\'Or', 'Villeurbanne'],
+  },
+  bron: {
+    description: 'Trouvez un artisan de confiance à Bron (Rhône). Avec 43 000 habitants, cette ville dynamique rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Chassieu, Villeurbanne, Vénissieux.',
+    quartiers: ['Centre-ville', 'Chassieu', 'Villeurbanne', 'Vénissieux', 'Saint-Priest', 'Vaulx-en-Velin', 'Décines-Charpieu'],
+  },
+  'oullins-pierre-benite': {
+    description: 'Besoin d’un professionnel à Oullins-Pierre-Bénite ? Située en Auvergne-Rhône-Alpes, cette ville dynamique du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Genis-Laval, La Mulatière, Saint-Fons.',
+    quartiers: ['Centre-ville', 'Saint-Genis-Laval', 'La Mulatière', 'Saint-Fons', 'Sainte-Foy-lès-Lyon', 'Irigny', 'Chaponost'],
+  },
+  meyzieu: {
+    description: 'Meyzieu est une ville dynamique de 37 000 habitants située dans le département Rhône en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Meyzieu, ainsi que Jonage, Décines-Charpieu, Pusignan pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Jonage', 'Décines-Charpieu', 'Pusignan', 'Genas', 'Chassieu', 'Vaulx-en-Velin'],
+  },
+  'villefranche-sur-saone': {
+    description: 'Besoin d’un professionnel à Villefranche-sur-Saône ? Située en Auvergne-Rhône-Alpes, cette ville dynamique du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Limas, Gleizé, Pommiers.',
+    quartiers: ['Centre-ville', 'Limas', 'Gleizé', 'Pommiers', 'Arnas', 'Anse', 'Porte des Pierres Dorées'],
+  },
+  'rillieux-la-pape': {
+    description: 'À Rillieux-la-Pape, ville dynamique du Rhône (31 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Sathonay-Camp, Sathonay-Village, Fontaines-sur-Saône.',
+    quartiers: ['Centre-ville', 'Sathonay-Camp', 'Sathonay-Village', 'Fontaines-sur-Saône', 'Cailloux-sur-Fontaines', 'Fontaines-Saint-Martin', 'Collonges-au-Mont-d\'Or'],
+  },
+  'decines-charpieu': {
+    description: 'Décines-Charpieu (Rhône, Auvergne-Rhône-Alpes) est une ville active de 30 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Vaulx-en-Velin, Meyzieu, Chassieu.',
+    quartiers: ['Centre-ville', 'Vaulx-en-Velin', 'Meyzieu', 'Chassieu', 'Villeurbanne', 'Bron', 'Jonage'],
+  },
+  'tassin-la-demi-lune': {
+    description: 'Trouvez un artisan de confiance à Tassin-la-Demi-Lune (Rhône). Avec 23 000 habitants, cette ville active rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Charbonnières-les-Bains, Saint-Genis-les-Ollières, Écully.',
+    quartiers: ['Centre-ville', 'Charbonnières-les-Bains', 'Saint-Genis-les-Ollières', 'Écully', 'Craponne', 'Francheville', 'Marcy-l\'Étoile'],
+  },
+  'sainte-foy-les-lyon': {
+    description: 'Besoin d’un professionnel à Sainte-Foy-lès-Lyon ? Située en Auvergne-Rhône-Alpes, cette ville active du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que La Mulatière, Francheville, Oullins-Pierre-Bénite.',
+    quartiers: ['Centre-ville', 'La Mulatière', 'Francheville', 'Oullins-Pierre-Bénite', 'Lyon', 'Tassin-la-Demi-Lune', 'Chaponost'],
+  },
+  givors: {
+    description: 'Besoin d’un professionnel à Givors ? Située en Auvergne-Rhône-Alpes, cette ville active du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Grigny-sur-Rhône, Beauvallon, Ternay.',
+    quartiers: ['Centre-ville', 'Grigny-sur-Rhône', 'Beauvallon', 'Ternay', 'Loire-sur-Rhône', 'Montagny', 'Millery'],
+  },
+  'saint-genis-laval': {
+    description: 'Vous habitez à Saint-Genis-Laval ou ses environs ? Nos artisans qualifiés du Rhône sont disponibles pour tous vos travaux. Saint-Genis-Laval, ville active rhônalpine de 21 000 habitants, mérite des professionnels à la hauteur, ainsi que Oullins-Pierre-Bénite, Irigny, Brignais.',
+    quartiers: ['Centre-ville', 'Oullins-Pierre-Bénite', 'Irigny', 'Brignais', 'Chaponost', 'Vourles', 'Charly'],
+  },
+  'saint-fons': {
+    description: 'Besoin d’un professionnel à Saint-Fons ? Située en Auvergne-Rhône-Alpes, cette commune du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Vénissieux, Feyzin, Oullins-Pierre-Bénite.',
+    quartiers: ['Centre-ville', 'Vénissieux', 'Feyzin', 'Oullins-Pierre-Bénite', 'Irigny', 'Saint-Genis-Laval', 'La Mulatière'],
+  },
+  ecully: {
+    description: 'Besoin d’un professionnel à Écully ? Située en Auvergne-Rhône-Alpes, cette commune du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Champagne-au-Mont-d\'Or, Charbonnières-les-Bains, Tassin-la-Demi-Lune.',
+    quartiers: ['Centre-ville', 'Champagne-au-Mont-d\'Or', 'Charbonnières-les-Bains', 'Tassin-la-Demi-Lune', 'Dardilly', 'Saint-Didier-au-Mont-d\'Or', 'Saint-Genis-les-Ollières'],
+  },
+  francheville: {
+    description: 'À Francheville, commune du Rhône (16 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Craponne, Tassin-la-Demi-Lune, Sainte-Foy-lès-Lyon.',
+    quartiers: ['Centre-ville', 'Craponne', 'Tassin-la-Demi-Lune', 'Sainte-Foy-lès-Lyon', 'Chaponost', 'Saint-Genis-les-Ollières', 'Brindas'],
+  },
+  'belleville-en-beaujolais': {
+    description: 'Artisans référencés à Belleville-en-Beaujolais et ses environs. Cette commune rhônalpine de 14 000 habitants en Rhône compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Georges-de-Reneins, Villié-Morgon, Saint-Étienne-des-Oullières.',
+    quartiers: ['Centre-ville', 'Saint-Georges-de-Reneins', 'Villié-Morgon', 'Saint-Étienne-des-Oullières', 'Arnas', 'Beaujeu', 'Gleizé'],
+  },
+  mions: {
+    description: 'Découvrez les meilleurs artisans à Mions en Rhône. Avec les Alpes et la vallée du Rhône et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Toussieu, Corbas, Chaponnay.',
+    quartiers: ['Centre-ville', 'Toussieu', 'Corbas', 'Chaponnay', 'Saint-Priest', 'Saint-Pierre-de-Chandieu', 'Vénissieux'],
+  },
+  genas: {
+    description: 'Découvrez les meilleurs artisans à Genas en Rhône. Avec les Alpes et la vallée du Rhône et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Bonnet-de-Mure, Chassieu, Pusignan.',
+    quartiers: ['Centre-ville', 'Saint-Bonnet-de-Mure', 'Chassieu', 'Pusignan', 'Meyzieu', 'Saint-Laurent-de-Mure', 'Saint-Priest'],
+  },
+  brignais: {
+    description: 'Vous habitez à Brignais ou ses environs ? Nos artisans qualifiés du Rhône sont disponibles pour tous vos travaux. Brignais, commune rhônalpine de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Vourles, Orliénas, Charly.',
+    quartiers: ['Centre-ville', 'Vourles', 'Orliénas', 'Charly', 'Saint-Genis-Laval', 'Chaponost', 'Irigny'],
+  },
+  craponne: {
+    description: 'Découvrez les meilleurs artisans à Craponne en Rhône. Avec les Alpes et la vallée du Rhône et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Genis-les-Ollières, Francheville, Tassin-la-Demi-Lune.',
+    quartiers: ['Centre-ville', 'Saint-Genis-les-Ollières', 'Francheville', 'Tassin-la-Demi-Lune', 'Brindas', 'Grézieu-la-Varenne', 'Charbonnières-les-Bains'],
+  },
+  corbas: {
+    description: 'Besoin d’un professionnel à Corbas ? Située en Auvergne-Rhône-Alpes, cette commune du Rhône bénéficie de des besoins en chauffage et isolation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Mions, Feyzin, Saint-Symphorien-d\'Ozon.',
+    quartiers: ['Centre-ville', 'Mions', 'Feyzin', 'Saint-Symphorien-d\'Ozon', 'Vénissieux', 'Saint-Priest', 'Chaponnay'],
+  },
+  chassieu: {
+    description: 'Chassieu (Rhône, Auvergne-Rhône-Alpes) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Bron, Saint-Priest, Genas.',
+    quartiers: ['Centre-ville', 'Bron', 'Saint-Priest', 'Genas', 'Décines-Charpieu', 'Vaulx-en-Velin', 'Meyzieu'],
+  },
+  tarare: {
+    description: 'Vous habitez à Tarare ou ses environs ? Nos artisans qualifiés du Rhône sont disponibles pour tous vos travaux. Tarare, commune rhônalpine de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Vindry-sur-Turdine, Amplepuis, Val d\'Oingt.',
+    quartiers: ['Centre-ville', 'Vindry-sur-Turdine', 'Amplepuis', 'Val d\'Oingt', 'Bully', 'Chessy', 'Saint-Germain-Nuelles'],
+  },
+  feyzin: {
+    description: 'Feyzin (Rhône, Auvergne-Rhône-Alpes) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Fons, Irigny, Vénissieux.',
+    quartiers: ['Centre-ville', 'Saint-Fons', 'Irigny', 'Vénissieux', 'Solaize', 'Saint-Symphorien-d\'Ozon', 'Corbas'],
+  },
+  'grigny-sur-rhone': {
+    description: 'Grigny-sur-Rhône (Rhône, Auvergne-Rhône-Alpes) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Ternay, Millery, Montagny.',
+    quartiers: ['Centre-ville', 'Ternay', 'Millery', 'Montagny', 'Sérézin-du-Rhône', 'Givors', 'Communay'],
+  },
+  chaponost: {
+    description: 'Trouvez des artisans qualifiés à Chaponost (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  dardilly: {
+    description: 'Trouvez des artisans qualifiés à Dardilly (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  irigny: {
+    description: 'Trouvez des artisans qualifiés à Irigny (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  anse: {
+    description: 'Trouvez des artisans qualifiés à Anse (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gleize: {
+    description: 'Trouvez des artisans qualifiés à Gleizé (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'neuville-sur-saone': {
+    description: 'Trouvez des artisans qualifiés à Neuville-sur-Saône (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-didier-au-mont-d-or': {
+    description: 'Trouvez des artisans qualifiés à Saint-Didier-au-Mont-d\'Or (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sathonay-camp': {
+    description: 'Trouvez des artisans qualifiés à Sathonay-Camp (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-bonnet-de-mure': {
+    description: 'Trouvez des artisans qualifiés à Saint-Bonnet-de-Mure (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'fontaines-sur-saone': {
+    description: 'Trouvez des artisans qualifiés à Fontaines-sur-Saône (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  brindas: {
+    description: 'Trouvez des artisans qualifiés à Brindas (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lentilly: {
+    description: 'Trouvez des artisans qualifiés à Lentilly (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'l-arbresle': {
+    description: 'Trouvez des artisans qualifiés à L\'Arbresle (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-mulatiere': {
+    description: 'Trouvez des artisans qualifiés à La Mulatière (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'grezieu-la-varenne': {
+    description: 'Trouvez des artisans qualifiés à Grézieu-la-Varenne (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-cyr-au-mont-d-or': {
+    description: 'Trouvez des artisans qualifiés à Saint-Cyr-au-Mont-d\'Or (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'champagne-au-mont-d-or': {
+    description: 'Trouvez des artisans qualifiés à Champagne-au-Mont-d\'Or (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vaugneray: {
+    description: 'Trouvez des artisans qualifiés à Vaugneray (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mornant: {
+    description: 'Trouvez des artisans qualifiés à Mornant (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-symphorien-d-ozon': {
+    description: 'Trouvez des artisans qualifiés à Saint-Symphorien-d\'Ozon (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  jonage: {
+    description: 'Trouvez des artisans qualifiés à Jonage (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-laurent-de-mure': {
+    description: 'Trouvez des artisans qualifiés à Saint-Laurent-de-Mure (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'thizy-les-bourgs': {
+    description: 'Trouvez des artisans qualifiés à Thizy-les-Bourgs (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ternay: {
+    description: 'Trouvez des artisans qualifiés à Ternay (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  genay: {
+    description: 'Trouvez des artisans qualifiés à Genay (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-genis-les-ollieres': {
+    description: 'Trouvez des artisans qualifiés à Saint-Genis-les-Ollières (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'charbonnieres-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Charbonnières-les-Bains (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vindry-sur-turdine': {
+    description: 'Trouvez des artisans qualifiés à Vindry-sur-Turdine (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vernaison: {
+    description: 'Trouvez des artisans qualifiés à Vernaison (Rhône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,27 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  vesoul: {
+    description: 'Découvrez les meilleurs artisans à Vesoul en Haute-Saône. Avec le cœur de la France et 15 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Vaivre-et-Montoille, Échenoz-la-Méline, Port-sur-Saône.',
+    quartiers: ['Centre-ville', 'Vaivre-et-Montoille', 'Échenoz-la-Méline', 'Port-sur-Saône', 'Rioz'],
+  },
+  hericourt: {
+    description: 'Trouvez un artisan de confiance à Héricourt (Haute-Saône). Avec 11 000 habitants, cette commune bourguignonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Champagney, Ronchamp, Lure.',
+    quartiers: ['Centre-ville', 'Champagney', 'Ronchamp', 'Lure'],
+  },
+  lure: {
+    description: 'Trouvez des artisans qualifiés à Lure (Haute-Saône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'luxeuil-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Luxeuil-les-Bains (Haute-Saône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gray: {
+    description: 'Trouvez des artisans qualifiés à Gray (Haute-Saône). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,69 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'chalon-sur-saone': { description: 'Ville fluviale, berceau de la photographie.', quartiers: ['Centre-ville', 'Saint-Jean-des-Vignes', 'Prés Saint-Jean', 'Stade'] },
+  macon: { description: 'Capitale viticole du Mâconnais.', quartiers: ['Centre-ville', 'Flacé', 'Saugeraies', 'Bioux'] },
+  'le-creusot': {
+    description: 'Découvrez les meilleurs artisans à Le Creusot en Saône-et-Loire. Avec le cœur de la France et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Torcy, Le Breuil, Montchanin.',
+    quartiers: ['Centre-ville', 'Torcy', 'Le Breuil', 'Montchanin', 'Blanzy', 'Montceau-les-Mines', 'Autun'],
+  },
+  'montceau-les-mines': {
+    description: 'Découvrez les meilleurs artisans à Montceau-les-Mines en Saône-et-Loire. Avec le cœur de la France et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Vallier, Blanzy, Sanvignes-les-Mines.',
+    quartiers: ['Centre-ville', 'Saint-Vallier', 'Blanzy', 'Sanvignes-les-Mines', 'Ciry-le-Noble', 'Montchanin', 'Torcy'],
+  },
+  autun: {
+    description: 'Autun (Saône-et-Loire, Bourgogne-Franche-Comté) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Épinac, Le Creusot, Le Breuil.',
+    quartiers: ['Centre-ville', 'Épinac', 'Le Creusot', 'Le Breuil', 'Torcy'],
+  },
+  'paray-le-monial': {
+    description: 'Trouvez des artisans qualifiés à Paray-le-Monial (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-vallier': {
+    description: 'Trouvez des artisans qualifiés à Saint-Vallier (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'charnay-les-macon': {
+    description: 'Trouvez des artisans qualifiés à Charnay-lès-Mâcon (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  digoin: {
+    description: 'Trouvez des artisans qualifiés à Digoin (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gueugnon: {
+    description: 'Trouvez des artisans qualifiés à Gueugnon (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  louhans: {
+    description: 'Trouvez des artisans qualifiés à Louhans (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-remy': {
+    description: 'Trouvez des artisans qualifiés à Saint-Rémy (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chatenoy-le-royal': {
+    description: 'Trouvez des artisans qualifiés à Châtenoy-le-Royal (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-marcel': {
+    description: 'Trouvez des artisans qualifiés à Saint-Marcel (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  blanzy: {
+    description: 'Trouvez des artisans qualifiés à Blanzy (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tournus: {
+    description: 'Trouvez des artisans qualifiés à Tournus (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chagny: {
+    description: 'Trouvez des artisans qualifiés à Chagny (Saône-et-Loire). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,48 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'le-mans': { description: 'Ville des 24 Heures, patrimoine historique.', quartiers: ['Centre-ville', 'Pontlieue', 'Les Sablons', 'Université', 'Bollée', 'Coulaines'] },
+  'la-fleche': {
+    description: 'Vous habitez à La Flèche ou ses environs ? Nos artisans qualifiés du Sarthe sont disponibles pour tous vos travaux. La Flèche, commune ligérienne de 15 000 habitants, mérite des professionnels à la hauteur, ainsi que Le Lude, Cérans-Foulletourte, Noyen-sur-Sarthe.',
+    quartiers: ['Centre-ville', 'Le Lude', 'Cérans-Foulletourte', 'Noyen-sur-Sarthe', 'Précigné', 'La Suze-sur-Sarthe', 'Aubigné-Racan'],
+  },
+  'sable-sur-sarthe': {
+    description: 'Découvrez les meilleurs artisans à Sablé-sur-Sarthe en Sarthe. Avec la façade atlantique et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Précigné, Noyen-sur-Sarthe, Loué.',
+    quartiers: ['Centre-ville', 'Précigné', 'Noyen-sur-Sarthe', 'Loué'],
+  },
+  allonnes: {
+    description: 'Artisans référencés à Allonnes et ses environs. Cette commune ligérienne de 11 000 habitants en Sarthe compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Saint-Georges-du-Bois, Spay, Rouillon.',
+    quartiers: ['Centre-ville', 'Saint-Georges-du-Bois', 'Spay', 'Rouillon', 'Le Mans', 'Arnage', 'Moncé-en-Belin'],
+  },
+  'la-ferte-bernard': {
+    description: 'Trouvez des artisans qualifiés à La Ferté-Bernard (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coulaines: {
+    description: 'Trouvez des artisans qualifiés à Coulaines (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  change: {
+    description: 'Trouvez des artisans qualifiés à Changé (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'montval-sur-loir': {
+    description: 'Trouvez des artisans qualifiés à Montval-sur-Loir (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  arnage: {
+    description: 'Trouvez des artisans qualifiés à Arnage (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'parigne-l-eveque': {
+    description: 'Trouvez des artisans qualifiés à Parigné-l\'Évêque (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mulsanne: {
+    description: 'Trouvez des artisans qualifiés à Mulsanne (Sarthe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
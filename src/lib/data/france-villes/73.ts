@@ -0,0 +1,64 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  chambery: { description: 'Ancienne capitale des États de Savoie.', quartiers: ['Centre-ville', 'Biollay', 'Chantemerle', 'Bellevue'] },
+  'aix-les-bains': {
+    description: 'Aix-les-Bains (Savoie, Auvergne-Rhône-Alpes) est une ville dynamique de 32 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Tresserve, Mouxy, Grésy-sur-Aix.',
+    quartiers: ['Centre-ville', 'Tresserve', 'Mouxy', 'Grésy-sur-Aix', 'Drumettaz-Clarafond', 'Viviers-du-Lac', 'Brison-Saint-Innocent'],
+  },
+  albertville: {
+    description: 'Découvrez les meilleurs artisans à Albertville en Savoie. Avec les Alpes et la vallée du Rhône et 20 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Grignon, Gilly-sur-Isère, Mercury.',
+    quartiers: ['Centre-ville', 'Grignon', 'Gilly-sur-Isère', 'Mercury', 'La Bâthie', 'Ugine', 'Val-d\'Arc'],
+  },
+  'la-motte-servolex': {
+    description: 'À La Motte-Servolex, commune du Savoie (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Voglans, Le Bourget-du-Lac, Chambéry.',
+    quartiers: ['Centre-ville', 'Voglans', 'Le Bourget-du-Lac', 'Chambéry', 'Sonnaz', 'Cognin', 'Viviers-du-Lac'],
+  },
+  'la-ravoire': {
+    description: 'Trouvez des artisans qualifiés à La Ravoire (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jean-de-maurienne': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-de-Maurienne (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bourg-saint-maurice': {
+    description: 'Trouvez des artisans qualifiés à Bourg-Saint-Maurice (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ugine: {
+    description: 'Trouvez des artisans qualifiés à Ugine (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cognin: {
+    description: 'Trouvez des artisans qualifiés à Cognin (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-alban-leysse': {
+    description: 'Trouvez des artisans qualifiés à Saint-Alban-Leysse (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  entrelacs: {
+    description: 'Trouvez des artisans qualifiés à Entrelacs (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'challes-les-eaux': {
+    description: 'Trouvez des artisans qualifiés à Challes-les-Eaux (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  barberaz: {
+    description: 'Trouvez des artisans qualifiés à Barberaz (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-bourget-du-lac': {
+    description: 'Trouvez des artisans qualifiés à Le Bourget-du-Lac (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bassens-73': {
+    description: 'Trouvez des artisans qualifiés à Bassens (Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,164 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  annecy: { description: 'Venise des Alpes, ville au bord du lac.', quartiers: ['Vieille Ville', 'Les Balmettes', 'Annecy-le-Vieux', 'Seynod', 'Cran-Gevrier', 'Novel'] },
+  'thonon-les-bains': {
+    description: 'Trouvez un artisan de confiance à Thonon-les-Bains (Haute-Savoie). Avec 38 000 habitants, cette ville dynamique rhônalpine dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Allinges, Anthy-sur-Léman, Publier.',
+    quartiers: ['Centre-ville', 'Allinges', 'Anthy-sur-Léman', 'Publier', 'Margencel', 'Évian-les-Bains', 'Sciez'],
+  },
+  annemasse: {
+    description: 'À Annemasse, ville dynamique du Haute-Savoie (38 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine bâti montagnard et urbain, nos professionnels interviennent dans toute la commune, ainsi que Vétraz-Monthoux, Ambilly, Ville-la-Grand.',
+    quartiers: ['Centre-ville', 'Vétraz-Monthoux', 'Ambilly', 'Ville-la-Grand', 'Gaillard', 'Étrembières', 'Monnetier-Mornex'],
+  },
+  cluses: {
+    description: 'Vous habitez à Cluses ou ses environs ? Nos artisans qualifiés du Haute-Savoie sont disponibles pour tous vos travaux. Cluses, commune rhônalpine de 18 000 habitants, mérite des professionnels à la hauteur, ainsi que Scionzier, Marnaz, Thyez.',
+    quartiers: ['Centre-ville', 'Scionzier', 'Marnaz', 'Thyez', 'Marignier', 'Magland', 'Taninges'],
+  },
+  sallanches: {
+    description: 'Découvrez les meilleurs artisans à Sallanches en Haute-Savoie. Avec les Alpes et la vallée du Rhône et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Domancy, Combloux, Magland.',
+    quartiers: ['Centre-ville', 'Domancy', 'Combloux', 'Magland', 'Le Grand-Bornand', 'Megève', 'Passy'],
+  },
+  rumilly: {
+    description: 'Découvrez les meilleurs artisans à Rumilly en Haute-Savoie. Avec les Alpes et la vallée du Rhône et 16 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Sales, Marcellaz-Albanais, Saint-Félix.',
+    quartiers: ['Centre-ville', 'Sales', 'Marcellaz-Albanais', 'Saint-Félix', 'Vallières-sur-Fier', 'Alby-sur-Chéran', 'Chavanod'],
+  },
+  'saint-julien-en-genevois': {
+    description: 'Saint-Julien-en-Genevois est une commune de 16 000 habitants située dans le département Haute-Savoie en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Saint-Julien-en-Genevois, ainsi que Neydens, Archamps, Beaumont pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Neydens', 'Archamps', 'Beaumont', 'Collonges-sous-Salève', 'Viry', 'Valleiry'],
+  },
+  bonneville: {
+    description: 'Découvrez les meilleurs artisans à Bonneville en Haute-Savoie. Avec les Alpes et la vallée du Rhône et 13 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Ayse, Saint-Pierre-en-Faucigny, Arenthon.',
+    quartiers: ['Centre-ville', 'Ayse', 'Saint-Pierre-en-Faucigny', 'Arenthon', 'Amancy', 'Marignier', 'Contamine-sur-Arve'],
+  },
+  gaillard: {
+    description: 'Gaillard est une commune de 11 000 habitants située dans le département Haute-Savoie en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Gaillard, ainsi que Étrembières, Ambilly, Annemasse pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Étrembières', 'Ambilly', 'Annemasse', 'Monnetier-Mornex', 'Vétraz-Monthoux', 'Ville-la-Grand'],
+  },
+  'la-roche-sur-foron': {
+    description: 'Découvrez les meilleurs artisans à La Roche-sur-Foron en Haute-Savoie. Avec les Alpes et la vallée du Rhône et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Etaux, Amancy, Saint-Pierre-en-Faucigny.',
+    quartiers: ['Centre-ville', 'Etaux', 'Amancy', 'Saint-Pierre-en-Faucigny', 'Arenthon', 'Pers-Jussy', 'Fillière'],
+  },
+  'vetraz-monthoux': {
+    description: 'Vous habitez à Vétraz-Monthoux ou ses environs ? Nos artisans qualifiés du Haute-Savoie sont disponibles pour tous vos travaux. Vétraz-Monthoux, commune rhônalpine de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Annemasse, Ville-la-Grand, Ambilly.',
+    quartiers: ['Centre-ville', 'Annemasse', 'Ville-la-Grand', 'Ambilly', 'Étrembières', 'Gaillard', 'Cranves-Sales'],
+  },
+  passy: {
+    description: 'Passy est une commune de 11 000 habitants située dans le département Haute-Savoie en Auvergne-Rhône-Alpes. Nos artisans qualifiés interviennent à Passy, ainsi que Les Houches, Domancy, Magland pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Les Houches', 'Domancy', 'Magland', 'Saint-Gervais-les-Bains', 'Sallanches', 'Combloux'],
+  },
+  filliere: {
+    description: 'Vous habitez à Fillière ou ses environs ? Nos artisans qualifiés du Haute-Savoie sont disponibles pour tous vos travaux. Fillière, commune rhônalpine de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Groisy, Villaz, Etaux.',
+    quartiers: ['Centre-ville', 'Groisy', 'Villaz', 'Etaux', 'La Roche-sur-Foron', 'Argonay', 'Allonzier-la-Caille'],
+  },
+  'ville-la-grand': {
+    description: 'Trouvez des artisans qualifiés à Ville-la-Grand (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  poisy: {
+    description: 'Trouvez des artisans qualifiés à Poisy (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'evian-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Évian-les-Bains (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  scionzier: {
+    description: 'Trouvez des artisans qualifiés à Scionzier (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'epagny-metz-tessy': {
+    description: 'Trouvez des artisans qualifiés à Epagny Metz-Tessy (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'chamonix-mont-blanc': {
+    description: 'Trouvez des artisans qualifiés à Chamonix-Mont-Blanc (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'reignier-esery': {
+    description: 'Trouvez des artisans qualifiés à Reignier-Ésery (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-en-faucigny': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-en-Faucigny (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  publier: {
+    description: 'Trouvez des artisans qualifiés à Publier (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cranves-sales': {
+    description: 'Trouvez des artisans qualifiés à Cranves-Sales (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'faverges-seythenex': {
+    description: 'Trouvez des artisans qualifiés à Faverges-Seythenex (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  douvaine: {
+    description: 'Trouvez des artisans qualifiés à Douvaine (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  thones: {
+    description: 'Trouvez des artisans qualifiés à Thônes (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marignier: {
+    description: 'Trouvez des artisans qualifiés à Marignier (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sciez: {
+    description: 'Trouvez des artisans qualifiés à Sciez (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jorioz': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jorioz (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ambilly: {
+    description: 'Trouvez des artisans qualifiés à Ambilly (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bons-en-chablais': {
+    description: 'Trouvez des artisans qualifiés à Bons-en-Chablais (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  thyez: {
+    description: 'Trouvez des artisans qualifiés à Thyez (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marnaz: {
+    description: 'Trouvez des artisans qualifiés à Marnaz (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sillingy: {
+    description: 'Trouvez des artisans qualifiés à Sillingy (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  viry: {
+    description: 'Trouvez des artisans qualifiés à Viry (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-gervais-les-bains': {
+    description: 'Trouvez des artisans qualifiés à Saint-Gervais-les-Bains (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cruseilles: {
+    description: 'Trouvez des artisans qualifiés à Cruseilles (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-balme-de-sillingy': {
+    description: 'Trouvez des artisans qualifiés à La Balme-de-Sillingy (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  valleiry: {
+    description: 'Trouvez des artisans qualifiés à Valleiry (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  allinges: {
+    description: 'Trouvez des artisans qualifiés à Allinges (Haute-Savoie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
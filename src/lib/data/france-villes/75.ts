@@ -0,0 +1,14 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  paris: {
+    description: 'Capitale de la France, Paris est le centre économique et culturel du pays. Nos artisans interviennent dans tous les arrondissements parisiens.',
+    quartiers: [
+      '1er arr.', '2e arr.', '3e arr.', '4e arr.', '5e arr.', '6e arr.', '7e arr.', '8e arr.', '9e arr.', '10e arr.', '11e arr.', '12e arr.', '13e arr.', '14e arr.', '15e arr.',
+      '16e arr.', '17e arr.', '18e arr.', '19e arr.', '20e arr.',
+    ],
+  },
+}
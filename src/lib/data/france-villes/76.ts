@@ -0,0 +1,165 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'le-havre': { description: 'Premier port français, ville reconstruite par Perret.', quartiers: ['Centre reconstruit', 'Sainte-Adresse', 'Sanvic', 'Graville', 'Danton'] },
+  rouen: { description: 'Capitale normande au riche patrimoine médiéval.', quartiers: ['Centre historique', 'Saint-Sever', 'Martainville', 'Saint-Clément', 'Grammont', 'Jouvenet'] },
+  'saint-etienne-du-rouvray': {
+    description: 'À Saint-Étienne-du-Rouvray, ville active du Seine-Maritime (30 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Sotteville-lès-Rouen, Amfreville-la-Mi-Voie, Belbeuf.',
+    quartiers: ['Centre-ville', 'Sotteville-lès-Rouen', 'Amfreville-la-Mi-Voie', 'Belbeuf', 'Petit-Couronne', 'Oissel', 'Le Grand-Quevilly'],
+  },
+  'sotteville-les-rouen': {
+    description: 'Sotteville-lès-Rouen (Seine-Maritime, Normandie) est une ville active de 29 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Amfreville-la-Mi-Voie, Le Petit-Quevilly, Saint-Étienne-du-Rouvray.',
+    quartiers: ['Centre-ville', 'Amfreville-la-Mi-Voie', 'Le Petit-Quevilly', 'Saint-Étienne-du-Rouvray', 'Rouen', 'Bonsecours', 'Le Mesnil-Esnard'],
+  },
+  dieppe: {
+    description: 'Vous habitez à Dieppe ou ses environs ? Nos artisans qualifiés du Seine-Maritime sont disponibles pour tous vos travaux. Dieppe, ville active normande de 28 000 habitants, mérite des professionnels à la hauteur, ainsi que Offranville, Arques-la-Bataille, Petit-Caux.',
+    quartiers: ['Centre-ville', 'Offranville', 'Arques-la-Bataille', 'Petit-Caux', 'Saint-Nicolas-d\'Aliermont', 'Luneray', 'Criel-sur-Mer'],
+  },
+  'le-grand-quevilly': {
+    description: 'Le Grand-Quevilly (Seine-Maritime, Normandie) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Petit-Quevilly, Canteleu, Petit-Couronne.',
+    quartiers: ['Centre-ville', 'Le Petit-Quevilly', 'Canteleu', 'Petit-Couronne', 'Sotteville-lès-Rouen', 'Saint-Étienne-du-Rouvray', 'Rouen'],
+  },
+  'le-petit-quevilly': {
+    description: 'Vous habitez à Le Petit-Quevilly ou ses environs ? Nos artisans qualifiés du Seine-Maritime sont disponibles pour tous vos travaux. Le Petit-Quevilly, ville active normande de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Le Grand-Quevilly, Sotteville-lès-Rouen, Canteleu.',
+    quartiers: ['Centre-ville', 'Le Grand-Quevilly', 'Sotteville-lès-Rouen', 'Canteleu', 'Rouen', 'Déville-lès-Rouen', 'Petit-Couronne'],
+  },
+  'mont-saint-aignan': {
+    description: 'Mont-Saint-Aignan (Seine-Maritime, Normandie) est une ville active de 20 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Déville-lès-Rouen, Bois-Guillaume, Notre-Dame-de-Bondeville.',
+    quartiers: ['Centre-ville', 'Déville-lès-Rouen', 'Bois-Guillaume', 'Notre-Dame-de-Bondeville', 'Rouen', 'Bihorel', 'Maromme'],
+  },
+  fecamp: {
+    description: 'Fécamp est une commune de 17 000 habitants située dans le département Seine-Maritime en Normandie. Nos artisans qualifiés interviennent à Fécamp, ainsi que Goderville, Criquetot-l\'Esneval, Cany-Barville pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Goderville', 'Criquetot-l\'Esneval', 'Cany-Barville', 'Terres-de-Caux', 'Bolbec', 'Gruchet-le-Valasse'],
+  },
+  montivilliers: {
+    description: 'Trouvez un artisan de confiance à Montivilliers (Seine-Maritime). Avec 15 000 habitants, cette commune normande dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Harfleur, Épouville, Fontaine-la-Mallet.',
+    quartiers: ['Centre-ville', 'Harfleur', 'Épouville', 'Fontaine-la-Mallet', 'Octeville-sur-Mer', 'Gainneville', 'Gonfreville-l\'Orcher'],
+  },
+  elbeuf: {
+    description: 'À Elbeuf, commune du Seine-Maritime (15 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Caudebec-lès-Elbeuf, Saint-Aubin-lès-Elbeuf, Saint-Pierre-lès-Elbeuf.',
+    quartiers: ['Centre-ville', 'Caudebec-lès-Elbeuf', 'Saint-Aubin-lès-Elbeuf', 'Saint-Pierre-lès-Elbeuf', 'Cléon', 'La Londe', 'Grand-Couronne'],
+  },
+  'bois-guillaume': {
+    description: 'Vous habitez à Bois-Guillaume ou ses environs ? Nos artisans qualifiés du Seine-Maritime sont disponibles pour tous vos travaux. Bois-Guillaume, commune normande de 15 000 habitants, mérite des professionnels à la hauteur, ainsi que Bihorel, Mont-Saint-Aignan, Darnétal.',
+    quartiers: ['Centre-ville', 'Bihorel', 'Mont-Saint-Aignan', 'Darnétal', 'Isneauville', 'Houppeville', 'Rouen'],
+  },
+  canteleu: {
+    description: 'Trouvez un artisan de confiance à Canteleu (Seine-Maritime). Avec 14 000 habitants, cette commune normande dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Grand-Quevilly, Le Petit-Quevilly, Déville-lès-Rouen.',
+    quartiers: ['Centre-ville', 'Le Grand-Quevilly', 'Le Petit-Quevilly', 'Déville-lès-Rouen', 'Maromme', 'Rouen', 'Petit-Couronne'],
+  },
+  oissel: {
+    description: 'Vous habitez à Oissel ou ses environs ? Nos artisans qualifiés du Seine-Maritime sont disponibles pour tous vos travaux. Oissel, commune normande de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Tourville-la-Rivière, Cléon, Saint-Étienne-du-Rouvray.',
+    quartiers: ['Centre-ville', 'Tourville-la-Rivière', 'Cléon', 'Saint-Étienne-du-Rouvray', 'Grand-Couronne', 'Petit-Couronne', 'Saint-Aubin-lès-Elbeuf'],
+  },
+  barentin: {
+    description: 'À Barentin, commune du Seine-Maritime (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Pavilly, Saint-Pierre-de-Varengeville, Le Houlme.',
+    quartiers: ['Centre-ville', 'Pavilly', 'Saint-Pierre-de-Varengeville', 'Le Houlme', 'Malaunay', 'Duclair', 'Montville'],
+  },
+  bolbec: {
+    description: 'Vous habitez à Bolbec ou ses environs ? Nos artisans qualifiés du Seine-Maritime sont disponibles pour tous vos travaux. Bolbec, commune normande de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Gruchet-le-Valasse, Lillebonne, La Frénaye.',
+    quartiers: ['Centre-ville', 'Gruchet-le-Valasse', 'Lillebonne', 'La Frénaye', 'Saint-Romain-de-Colbosc', 'Port-Jérôme-sur-Seine', 'Goderville'],
+  },
+  yvetot: {
+    description: 'À Yvetot, commune du Seine-Maritime (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Yerville, Rives-en-Seine, Sainte-Marguerite-sur-Duclair.',
+    quartiers: ['Centre-ville', 'Yerville', 'Rives-en-Seine', 'Sainte-Marguerite-sur-Duclair', 'Doudeville', 'Terres-de-Caux', 'Pavilly'],
+  },
+  maromme: {
+    description: 'Découvrez les meilleurs artisans à Maromme en Seine-Maritime. Avec le patrimoine historique et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Déville-lès-Rouen, Notre-Dame-de-Bondeville, Mont-Saint-Aignan.',
+    quartiers: ['Centre-ville', 'Déville-lès-Rouen', 'Notre-Dame-de-Bondeville', 'Mont-Saint-Aignan', 'Le Houlme', 'Canteleu', 'Houppeville'],
+  },
+  'deville-les-rouen': {
+    description: 'À Déville-lès-Rouen, commune du Seine-Maritime (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture à colombages, nos professionnels interviennent dans toute la commune, ainsi que Maromme, Mont-Saint-Aignan, Notre-Dame-de-Bondeville.',
+    quartiers: ['Centre-ville', 'Maromme', 'Mont-Saint-Aignan', 'Notre-Dame-de-Bondeville', 'Rouen', 'Canteleu', 'Le Petit-Quevilly'],
+  },
+  'port-jerome-sur-seine': {
+    description: 'Port-Jérôme-sur-Seine (Seine-Maritime, Normandie) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que La Frénaye, Lillebonne, Gruchet-le-Valasse.',
+    quartiers: ['Centre-ville', 'La Frénaye', 'Lillebonne', 'Gruchet-le-Valasse', 'Rives-en-Seine', 'Bolbec', 'Arelaune-en-Seine'],
+  },
+  'caudebec-les-elbeuf': {
+    description: 'Caudebec-lès-Elbeuf est une commune de 10 000 habitants située dans le département Seine-Maritime en Normandie. Nos artisans qualifiés interviennent à Caudebec-lès-Elbeuf, ainsi que Elbeuf, Saint-Pierre-lès-Elbeuf, Saint-Aubin-lès-Elbeuf pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Elbeuf', 'Saint-Pierre-lès-Elbeuf', 'Saint-Aubin-lès-Elbeuf', 'Cléon', 'Grand-Couronne', 'Oissel'],
+  },
+  'grand-couronne': {
+    description: 'Trouvez des artisans qualifiés à Grand-Couronne (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  darnetal: {
+    description: 'Trouvez des artisans qualifiés à Darnétal (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'petit-caux': {
+    description: 'Trouvez des artisans qualifiés à Petit-Caux (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gonfreville-l-orcher': {
+    description: 'Trouvez des artisans qualifiés à Gonfreville-l\'Orcher (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'petit-couronne': {
+    description: 'Trouvez des artisans qualifiés à Petit-Couronne (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lillebonne: {
+    description: 'Trouvez des artisans qualifiés à Lillebonne (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-aubin-les-elbeuf': {
+    description: 'Trouvez des artisans qualifiés à Saint-Aubin-lès-Elbeuf (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bihorel: {
+    description: 'Trouvez des artisans qualifiés à Bihorel (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-les-elbeuf': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-lès-Elbeuf (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  harfleur: {
+    description: 'Trouvez des artisans qualifiés à Harfleur (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-mesnil-esnard': {
+    description: 'Trouvez des artisans qualifiés à Le Mesnil-Esnard (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'notre-dame-de-bondeville': {
+    description: 'Trouvez des artisans qualifiés à Notre-Dame-de-Bondeville (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-adresse': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Adresse (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  eu: {
+    description: 'Trouvez des artisans qualifiés à Eu (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bonsecours: {
+    description: 'Trouvez des artisans qualifiés à Bonsecours (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  malaunay: {
+    description: 'Trouvez des artisans qualifiés à Malaunay (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'octeville-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Octeville-sur-Mer (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'franqueville-saint-pierre': {
+    description: 'Trouvez des artisans qualifiés à Franqueville-Saint-Pierre (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pavilly: {
+    description: 'Trouvez des artisans qualifiés à Pavilly (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gournay-en-bray': {
+    description: 'Trouvez des artisans qualifiés à Gournay-en-Bray (Seine-Maritime). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,267 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  meaux: {
+    description: 'Meaux est une ville importante de 57 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Meaux, ainsi que Nanteuil-lès-Meaux, Crégy-lès-Meaux, Mareuil-lès-Meaux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Nanteuil-lès-Meaux', 'Crégy-lès-Meaux', 'Mareuil-lès-Meaux', 'Villenoy', 'Trilport', 'Chauconin-Neufmontiers'],
+  },
+  chelles: {
+    description: 'Chelles est une ville importante de 55 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Chelles, ainsi que Vaires-sur-Marne, Brou-sur-Chantereine, Courtry pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Vaires-sur-Marne', 'Brou-sur-Chantereine', 'Courtry', 'Champs-sur-Marne', 'Noisiel', 'Torcy'],
+  },
+  melun: {
+    description: 'Trouvez un artisan de confiance à Melun (Seine-et-Marne). Avec 46 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Mée-sur-Seine, Rubelles, Vert-Saint-Denis.',
+    quartiers: ['Centre-ville', 'Le Mée-sur-Seine', 'Rubelles', 'Vert-Saint-Denis', 'Vaux-le-Pénil', 'La Rochette', 'Dammarie-les-Lys'],
+  },
+  'pontault-combault': {
+    description: 'À Pontault-Combault, ville dynamique du Seine-et-Marne (39 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Émerainville, Roissy-en-Brie, Croissy-Beaubourg.',
+    quartiers: ['Centre-ville', 'Émerainville', 'Roissy-en-Brie', 'Croissy-Beaubourg', 'Lésigny', 'Lognes', 'Ozoir-la-Ferrière'],
+  },
+  'savigny-le-temple': {
+    description: 'À Savigny-le-Temple, ville dynamique du Seine-et-Marne (31 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Cesson, Nandy, Vert-Saint-Denis.',
+    quartiers: ['Centre-ville', 'Cesson', 'Nandy', 'Vert-Saint-Denis', 'Réau', 'Moissy-Cramayel', 'Lieusaint'],
+  },
+  'bussy-saint-georges': {
+    description: 'À Bussy-Saint-Georges, ville active du Seine-et-Marne (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Ferrières-en-Brie, Collégien, Pontcarré.',
+    quartiers: ['Centre-ville', 'Ferrières-en-Brie', 'Collégien', 'Pontcarré', 'Chanteloup-en-Brie', 'Croissy-Beaubourg', 'Saint-Thibault-des-Vignes'],
+  },
+  'champs-sur-marne': {
+    description: 'À Champs-sur-Marne, ville active du Seine-et-Marne (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Noisiel, Émerainville, Lognes.',
+    quartiers: ['Centre-ville', 'Noisiel', 'Émerainville', 'Lognes', 'Vaires-sur-Marne', 'Torcy', 'Chelles'],
+  },
+  villeparisis: {
+    description: 'Vous habitez à Villeparisis ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Villeparisis, ville active francilienne de 27 000 habitants, mérite des professionnels à la hauteur, ainsi que Courtry, Mitry-Mory, Claye-Souilly.',
+    quartiers: ['Centre-ville', 'Courtry', 'Mitry-Mory', 'Claye-Souilly', 'Villevaudé', 'Brou-sur-Chantereine', 'Chelles'],
+  },
+  'dammarie-les-lys': {
+    description: 'Découvrez les meilleurs artisans à Dammarie-les-Lys en Seine-et-Marne. Avec la région parisienne et 24 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Rochette, Le Mée-sur-Seine, Boissise-le-Roi.',
+    quartiers: ['Centre-ville', 'La Rochette', 'Le Mée-sur-Seine', 'Boissise-le-Roi', 'Melun', 'Chailly-en-Bière', 'Pringy'],
+  },
+  'combs-la-ville': {
+    description: 'Vous habitez à Combs-la-Ville ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Combs-la-Ville, ville active francilienne de 23 000 habitants, mérite des professionnels à la hauteur, ainsi que Lieusaint, Moissy-Cramayel, Brie-Comte-Robert.',
+    quartiers: ['Centre-ville', 'Lieusaint', 'Moissy-Cramayel', 'Brie-Comte-Robert', 'Évry-Grégy-sur-Yerre', 'Servon', 'Réau'],
+  },
+  'roissy-en-brie': {
+    description: 'Roissy-en-Brie est une ville active de 23 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Roissy-en-Brie, ainsi que Croissy-Beaubourg, Pontcarré, Ozoir-la-Ferrière pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Croissy-Beaubourg', 'Pontcarré', 'Ozoir-la-Ferrière', 'Pontault-Combault', 'Collégien', 'Ferrières-en-Brie'],
+  },
+  torcy: {
+    description: 'Trouvez un artisan de confiance à Torcy (Seine-et-Marne). Avec 23 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Vaires-sur-Marne, Noisiel, Lognes.',
+    quartiers: ['Centre-ville', 'Vaires-sur-Marne', 'Noisiel', 'Lognes', 'Saint-Thibault-des-Vignes', 'Collégien', 'Champs-sur-Marne'],
+  },
+  'montereau-fault-yonne': {
+    description: 'Vous habitez à Montereau-Fault-Yonne ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Montereau-Fault-Yonne, ville active francilienne de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Varennes-sur-Seine, Cannes-Écluse, Saint-Germain-Laval.',
+    quartiers: ['Centre-ville', 'Varennes-sur-Seine', 'Cannes-Écluse', 'Saint-Germain-Laval', 'La Grande-Paroisse', 'Vernou-la-Celle-sur-Seine', 'Saint-Mammès'],
+  },
+  'lagny-sur-marne': {
+    description: 'Besoin d’un professionnel à Lagny-sur-Marne ? Située en Île-de-France, cette ville active du Seine-et-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Thibault-des-Vignes, Thorigny-sur-Marne, Pomponne.',
+    quartiers: ['Centre-ville', 'Saint-Thibault-des-Vignes', 'Thorigny-sur-Marne', 'Pomponne', 'Chanteloup-en-Brie', 'Montévrain', 'Dampmart'],
+  },
+  'ozoir-la-ferriere': {
+    description: 'Trouvez un artisan de confiance à Ozoir-la-Ferrière (Seine-et-Marne). Avec 21 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Roissy-en-Brie, Gretz-Armainvilliers, Pontcarré.',
+    quartiers: ['Centre-ville', 'Roissy-en-Brie', 'Gretz-Armainvilliers', 'Pontcarré', 'Lésigny', 'Chevry-Cossigny', 'Pontault-Combault'],
+  },
+  'mitry-mory': {
+    description: 'Trouvez un artisan de confiance à Mitry-Mory (Seine-et-Marne). Avec 20 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Villeparisis, Claye-Souilly, Courtry.',
+    quartiers: ['Centre-ville', 'Villeparisis', 'Claye-Souilly', 'Courtry', 'Juilly', 'Villevaudé', 'Longperrier'],
+  },
+  'le-mee-sur-seine': {
+    description: 'Artisans référencés à Le Mée-sur-Seine et ses environs. Cette commune francilienne de 20 000 habitants en Seine-et-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Melun, Vert-Saint-Denis, Dammarie-les-Lys.',
+    quartiers: ['Centre-ville', 'Melun', 'Vert-Saint-Denis', 'Dammarie-les-Lys', 'La Rochette', 'Cesson', 'Rubelles'],
+  },
+  'brie-comte-robert': {
+    description: 'Besoin d’un professionnel à Brie-Comte-Robert ? Située en Île-de-France, cette commune du Seine-et-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Servon, Combs-la-Ville, Évry-Grégy-sur-Yerre.',
+    quartiers: ['Centre-ville', 'Servon', 'Combs-la-Ville', 'Évry-Grégy-sur-Yerre', 'Grisy-Suisnes', 'Chevry-Cossigny', 'Lésigny'],
+  },
+  'moissy-cramayel': {
+    description: 'Vous habitez à Moissy-Cramayel ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Moissy-Cramayel, commune francilienne de 19 000 habitants, mérite des professionnels à la hauteur, ainsi que Réau, Lieusaint, Combs-la-Ville.',
+    quartiers: ['Centre-ville', 'Réau', 'Lieusaint', 'Combs-la-Ville', 'Évry-Grégy-sur-Yerre', 'Savigny-le-Temple', 'Nandy'],
+  },
+  coulommiers: {
+    description: 'Vous habitez à Coulommiers ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Coulommiers, commune francilienne de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Mouroux, Boissy-le-Châtel, Beautheil-Saints.',
+    quartiers: ['Centre-ville', 'Mouroux', 'Boissy-le-Châtel', 'Beautheil-Saints', 'Pommeuse', 'Faremoutiers', 'Guérard'],
+  },
+  noisiel: {
+    description: 'À Noisiel, commune du Seine-et-Marne (16 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Champs-sur-Marne, Lognes, Torcy.',
+    quartiers: ['Centre-ville', 'Champs-sur-Marne', 'Lognes', 'Torcy', 'Vaires-sur-Marne', 'Émerainville', 'Croissy-Beaubourg'],
+  },
+  'saint-fargeau-ponthierry': {
+    description: 'Saint-Fargeau-Ponthierry est une commune de 16 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Saint-Fargeau-Ponthierry, ainsi que Pringy, Boissise-le-Roi, Nandy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Pringy', 'Boissise-le-Roi', 'Nandy', 'Cesson', 'Savigny-le-Temple', 'Perthes'],
+  },
+  montevrain: {
+    description: 'Vous habitez à Montévrain ou ses environs ? Nos artisans qualifiés du Seine-et-Marne sont disponibles pour tous vos travaux. Montévrain, commune francilienne de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Chanteloup-en-Brie, Chessy, Dampmart.',
+    quartiers: ['Centre-ville', 'Chanteloup-en-Brie', 'Chessy', 'Dampmart', 'Lagny-sur-Marne', 'Serris', 'Coupvray'],
+  },
+  fontainebleau: {
+    description: 'Fontainebleau (Seine-et-Marne, Île-de-France) est une commune de 16 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Avon, Bois-le-Roi, Samois-sur-Seine.',
+    quartiers: ['Centre-ville', 'Avon', 'Bois-le-Roi', 'Samois-sur-Seine', 'Samoreau', 'Vulaines-sur-Seine', 'Thomery'],
+  },
+  lognes: {
+    description: 'Lognes est une commune de 15 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Lognes, ainsi que Noisiel, Croissy-Beaubourg, Torcy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Noisiel', 'Croissy-Beaubourg', 'Torcy', 'Émerainville', 'Collégien', 'Champs-sur-Marne'],
+  },
+  lieusaint: {
+    description: 'Découvrez les meilleurs artisans à Lieusaint en Seine-et-Marne. Avec la région parisienne et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Moissy-Cramayel, Combs-la-Ville, Nandy.',
+    quartiers: ['Centre-ville', 'Moissy-Cramayel', 'Combs-la-Ville', 'Nandy', 'Savigny-le-Temple', 'Réau', 'Cesson'],
+  },
+  'vaires-sur-marne': {
+    description: 'Trouvez un artisan de confiance à Vaires-sur-Marne (Seine-et-Marne). Avec 14 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Brou-sur-Chantereine, Torcy, Noisiel.',
+    quartiers: ['Centre-ville', 'Brou-sur-Chantereine', 'Torcy', 'Noisiel', 'Chelles', 'Saint-Thibault-des-Vignes', 'Pomponne'],
+  },
+  avon: {
+    description: 'Artisans référencés à Avon et ses environs. Cette commune francilienne de 14 000 habitants en Seine-et-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Thomery, Samoreau, Vulaines-sur-Seine.',
+    quartiers: ['Centre-ville', 'Thomery', 'Samoreau', 'Vulaines-sur-Seine', 'Fontainebleau', 'Samois-sur-Seine', 'Héricy'],
+  },
+  'claye-souilly': {
+    description: 'Artisans référencés à Claye-Souilly et ses environs. Cette commune francilienne de 13 000 habitants en Seine-et-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Annet-sur-Marne, Villevaudé, Villeparisis.',
+    quartiers: ['Centre-ville', 'Annet-sur-Marne', 'Villevaudé', 'Villeparisis', 'Thorigny-sur-Marne', 'Pomponne', 'Courtry'],
+  },
+  nemours: {
+    description: 'Trouvez un artisan de confiance à Nemours (Seine-et-Marne). Avec 13 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Pierre-lès-Nemours, Bourron-Marlotte, Souppes-sur-Loing.',
+    quartiers: ['Centre-ville', 'Saint-Pierre-lès-Nemours', 'Bourron-Marlotte', 'Souppes-sur-Loing', 'Montigny-sur-Loing', 'La Chapelle-la-Reine', 'Moret-Loing-et-Orvanne'],
+  },
+  'moret-loing-et-orvanne': {
+    description: 'Trouvez un artisan de confiance à Moret-Loing-et-Orvanne (Seine-et-Marne). Avec 13 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Mammès, Montigny-sur-Loing, Champagne-sur-Seine.',
+    quartiers: ['Centre-ville', 'Saint-Mammès', 'Montigny-sur-Loing', 'Champagne-sur-Seine', 'Vernou-la-Celle-sur-Seine', 'Thomery', 'La Grande-Paroisse'],
+  },
+  'dammartin-en-goele': {
+    description: 'Artisans référencés à Dammartin-en-Goële et ses environs. Cette commune francilienne de 12 000 habitants en Seine-et-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Longperrier, Saint-Mard, Juilly.',
+    quartiers: ['Centre-ville', 'Longperrier', 'Saint-Mard', 'Juilly', 'Othis', 'Moussy-le-Neuf', 'Saint-Pathus'],
+  },
+  provins: {
+    description: 'Trouvez un artisan de confiance à Provins (Seine-et-Marne). Avec 12 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Donnemarie-Dontilly, Bray-sur-Seine, Nangis.',
+    quartiers: ['Centre-ville', 'Donnemarie-Dontilly', 'Bray-sur-Seine', 'Nangis'],
+  },
+  'vaux-le-penil': {
+    description: 'À Vaux-le-Pénil, commune du Seine-et-Marne (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Livry-sur-Seine, Chartrettes, La Rochette.',
+    quartiers: ['Centre-ville', 'Livry-sur-Seine', 'Chartrettes', 'La Rochette', 'Melun', 'Rubelles', 'Le Mée-sur-Seine'],
+  },
+  cesson: {
+    description: 'À Cesson, commune du Seine-et-Marne (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Savigny-le-Temple, Vert-Saint-Denis, Nandy.',
+    quartiers: ['Centre-ville', 'Savigny-le-Temple', 'Vert-Saint-Denis', 'Nandy', 'Le Mée-sur-Seine', 'Réau', 'Saint-Fargeau-Ponthierry'],
+  },
+  'thorigny-sur-marne': {
+    description: 'À Thorigny-sur-Marne, commune du Seine-et-Marne (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Lagny-sur-Marne, Dampmart, Pomponne.',
+    quartiers: ['Centre-ville', 'Lagny-sur-Marne', 'Dampmart', 'Pomponne', 'Annet-sur-Marne', 'Montévrain', 'Saint-Thibault-des-Vignes'],
+  },
+  serris: {
+    description: 'Serris est une commune de 10 000 habitants située dans le département Seine-et-Marne en Île-de-France. Nos artisans qualifiés interviennent à Serris, ainsi que Bailly-Romainvilliers, Chessy, Magny-le-Hongre pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Bailly-Romainvilliers', 'Chessy', 'Magny-le-Hongre', 'Montévrain', 'Chanteloup-en-Brie', 'Coupvray'],
+  },
+  'la-ferte-sous-jouarre': {
+    description: 'À La Ferté-sous-Jouarre, commune du Seine-et-Marne (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Jouarre, Lizy-sur-Ourcq, Trilport.',
+    quartiers: ['Centre-ville', 'Jouarre', 'Lizy-sur-Ourcq', 'Trilport', 'Rebais', 'Boissy-le-Châtel', 'Mouroux'],
+  },
+  'vert-saint-denis': {
+    description: 'Trouvez des artisans qualifiés à Vert-Saint-Denis (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'magny-le-hongre': {
+    description: 'Trouvez des artisans qualifiés à Magny-le-Hongre (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nangis: {
+    description: 'Trouvez des artisans qualifiés à Nangis (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gretz-armainvilliers': {
+    description: 'Trouvez des artisans qualifiés à Gretz-Armainvilliers (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'tournan-en-brie': {
+    description: 'Trouvez des artisans qualifiés à Tournan-en-Brie (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chessy: {
+    description: 'Trouvez des artisans qualifiés à Chessy (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  emerainville: {
+    description: 'Trouvez des artisans qualifiés à Émerainville (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  courtry: {
+    description: 'Trouvez des artisans qualifiés à Courtry (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nanteuil-les-meaux': {
+    description: 'Trouvez des artisans qualifiés à Nanteuil-lès-Meaux (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bailly-romainvilliers': {
+    description: 'Trouvez des artisans qualifiés à Bailly-Romainvilliers (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lesigny: {
+    description: 'Trouvez des artisans qualifiés à Lésigny (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-thibault-des-vignes': {
+    description: 'Trouvez des artisans qualifiés à Saint-Thibault-des-Vignes (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  othis: {
+    description: 'Trouvez des artisans qualifiés à Othis (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'champagne-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Champagne-sur-Seine (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pathus': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pathus (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  nandy: {
+    description: 'Trouvez des artisans qualifiés à Nandy (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bois-le-roi': {
+    description: 'Trouvez des artisans qualifiés à Bois-le-Roi (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  esbly: {
+    description: 'Trouvez des artisans qualifiés à Esbly (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'fontenay-tresigny': {
+    description: 'Trouvez des artisans qualifiés à Fontenay-Trésigny (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mouroux: {
+    description: 'Trouvez des artisans qualifiés à Mouroux (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'quincy-voisins': {
+    description: 'Trouvez des artisans qualifiés à Quincy-Voisins (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cregy-les-meaux': {
+    description: 'Trouvez des artisans qualifiés à Crégy-lès-Meaux (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-pierre-les-nemours': {
+    description: 'Trouvez des artisans qualifiés à Saint-Pierre-lès-Nemours (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mormant: {
+    description: 'Trouvez des artisans qualifiés à Mormant (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'brou-sur-chantereine': {
+    description: 'Trouvez des artisans qualifiés à Brou-sur-Chantereine (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  trilport: {
+    description: 'Trouvez des artisans qualifiés à Trilport (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  villenoy: {
+    description: 'Trouvez des artisans qualifiés à Villenoy (Seine-et-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,291 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  versailles: {
+    description: 'Cité royale avec son château mondialement célèbre.',
+    quartiers: ['Centre-ville', 'Notre-Dame', 'Saint-Louis', 'Montreuil', 'Porchefontaine', 'Clagny', 'Jussieu'],
+  },
+  sartrouville: {
+    description: 'Artisans référencés à Sartrouville et ses environs. Cette ville importante francilienne de 53 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Houilles, Maisons-Laffitte, Carrières-sur-Seine.',
+    quartiers: ['Centre-ville', 'Houilles', 'Maisons-Laffitte', 'Carrières-sur-Seine', 'Montesson', 'Le Mesnil-le-Roi', 'Chatou'],
+  },
+  'saint-germain-en-laye': {
+    description: 'Vous habitez à Saint-Germain-en-Laye ou ses environs ? Nos artisans qualifiés du Yvelines sont disponibles pour tous vos travaux. Saint-Germain-en-Laye, ville dynamique francilienne de 46 000 habitants, mérite des professionnels à la hauteur, ainsi que Le Mesnil-le-Roi, Montesson, Maisons-Laffitte.',
+    quartiers: ['Centre-ville', 'Le Mesnil-le-Roi', 'Montesson', 'Maisons-Laffitte', 'Le Pecq', 'Le Vésinet', 'Chatou'],
+  },
+  'mantes-la-jolie': {
+    description: 'Besoin d’un professionnel à Mantes-la-Jolie ? Située en Île-de-France, cette ville dynamique du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Buchelay, Mantes-la-Ville, Magnanville.',
+    quartiers: ['Centre-ville', 'Buchelay', 'Mantes-la-Ville', 'Magnanville', 'Limay', 'Follainville-Dennemont', 'Guerville'],
+  },
+  poissy: {
+    description: 'Vous habitez à Poissy ou ses environs ? Nos artisans qualifiés du Yvelines sont disponibles pour tous vos travaux. Poissy, ville dynamique francilienne de 41 000 habitants, mérite des professionnels à la hauteur, ainsi que Villennes-sur-Seine, Carrières-sous-Poissy, Chambourcy.',
+    quartiers: ['Centre-ville', 'Villennes-sur-Seine', 'Carrières-sous-Poissy', 'Chambourcy', 'Orgeval', 'Vernouillet', 'Feucherolles'],
+  },
+  'conflans-sainte-honorine': {
+    description: 'Artisans référencés à Conflans-Sainte-Honorine et ses environs. Cette ville dynamique francilienne de 37 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Achères, Maurecourt, Andrésy.',
+    quartiers: ['Centre-ville', 'Achères', 'Maurecourt', 'Andrésy', 'Chanteloup-les-Vignes', 'Maisons-Laffitte', 'Triel-sur-Seine'],
+  },
+  trappes: {
+    description: 'Vous habitez à Trappes ou ses environs ? Nos artisans qualifiés du Yvelines sont disponibles pour tous vos travaux. Trappes, ville dynamique francilienne de 35 000 habitants, mérite des professionnels à la hauteur, ainsi que Montigny-le-Bretonneux, Élancourt, La Verrière.',
+    quartiers: ['Centre-ville', 'Montigny-le-Bretonneux', 'Élancourt', 'La Verrière', 'Voisins-le-Bretonneux', 'Bois-d\'Arcy', 'Le Mesnil-Saint-Denis'],
+  },
+  'les-mureaux': {
+    description: 'À Les Mureaux, ville dynamique du Yvelines (35 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Meulan-en-Yvelines, Hardricourt, Mézy-sur-Seine.',
+    quartiers: ['Centre-ville', 'Meulan-en-Yvelines', 'Hardricourt', 'Mézy-sur-Seine', 'Bouafle', 'Flins-sur-Seine', 'Verneuil-sur-Seine'],
+  },
+  houilles: {
+    description: 'Houilles (Yvelines, Île-de-France) est une ville dynamique de 34 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Sartrouville, Carrières-sur-Seine, Maisons-Laffitte.',
+    quartiers: ['Centre-ville', 'Sartrouville', 'Carrières-sur-Seine', 'Maisons-Laffitte', 'Montesson', 'Chatou', 'Le Mesnil-le-Roi'],
+  },
+  'montigny-le-bretonneux': {
+    description: 'Besoin d’un professionnel à Montigny-le-Bretonneux ? Située en Île-de-France, cette ville dynamique du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Trappes, Voisins-le-Bretonneux, Bois-d\'Arcy.',
+    quartiers: ['Centre-ville', 'Trappes', 'Voisins-le-Bretonneux', 'Bois-d\'Arcy', 'Guyancourt', 'Saint-Cyr-l\'École', 'Fontenay-le-Fleury'],
+  },
+  plaisir: {
+    description: 'Artisans référencés à Plaisir et ses environs. Cette ville dynamique francilienne de 32 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Les Clayes-sous-Bois, Neauphle-le-Château, Jouars-Pontchartrain.',
+    quartiers: ['Centre-ville', 'Les Clayes-sous-Bois', 'Neauphle-le-Château', 'Jouars-Pontchartrain', 'Élancourt', 'Villiers-Saint-Frédéric', 'Maurepas'],
+  },
+  'le-chesnay-rocquencourt': {
+    description: 'À Le Chesnay-Rocquencourt, ville dynamique du Yvelines (31 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que La Celle-Saint-Cloud, Versailles, Bailly.',
+    quartiers: ['Centre-ville', 'La Celle-Saint-Cloud', 'Versailles', 'Bailly', 'Louveciennes', 'Bougival', 'Saint-Cyr-l\'École'],
+  },
+  chatou: {
+    description: 'Artisans référencés à Chatou et ses environs. Cette ville dynamique francilienne de 31 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Le Vésinet, Croissy-sur-Seine, Montesson.',
+    quartiers: ['Centre-ville', 'Le Vésinet', 'Croissy-sur-Seine', 'Montesson', 'Carrières-sur-Seine', 'Le Port-Marly', 'Le Pecq'],
+  },
+  guyancourt: {
+    description: 'Trouvez un artisan de confiance à Guyancourt (Yvelines). Avec 30 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Voisins-le-Bretonneux, Montigny-le-Bretonneux, Buc.',
+    quartiers: ['Centre-ville', 'Voisins-le-Bretonneux', 'Montigny-le-Bretonneux', 'Buc', 'Saint-Cyr-l\'École', 'Magny-les-Hameaux', 'Versailles'],
+  },
+  rambouillet: {
+    description: 'Rambouillet est une ville active de 28 000 habitants située dans le département Yvelines en Île-de-France. Nos artisans qualifiés interviennent à Rambouillet, ainsi que Le Perray-en-Yvelines, Les Essarts-le-Roi, Saint-Arnoult-en-Yvelines pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Perray-en-Yvelines', 'Les Essarts-le-Roi', 'Saint-Arnoult-en-Yvelines', 'Coignières', 'Montfort-l\'Amaury', 'Le Mesnil-Saint-Denis'],
+  },
+  elancourt: {
+    description: 'Trouvez un artisan de confiance à Élancourt (Yvelines). Avec 26 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Trappes, La Verrière, Maurepas.',
+    quartiers: ['Centre-ville', 'Trappes', 'La Verrière', 'Maurepas', 'Jouars-Pontchartrain', 'Plaisir', 'Le Mesnil-Saint-Denis'],
+  },
+  'maisons-laffitte': {
+    description: 'Découvrez les meilleurs artisans à Maisons-Laffitte en Yvelines. Avec la région parisienne et 23 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Sartrouville, Le Mesnil-le-Roi, Houilles.',
+    quartiers: ['Centre-ville', 'Sartrouville', 'Le Mesnil-le-Roi', 'Houilles', 'Montesson', 'Saint-Germain-en-Laye', 'Carrières-sur-Seine'],
+  },
+  'velizy-villacoublay': {
+    description: 'À Vélizy-Villacoublay, ville active du Yvelines (23 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Viroflay, Jouy-en-Josas, Buc.',
+    quartiers: ['Centre-ville', 'Viroflay', 'Jouy-en-Josas', 'Buc', 'Versailles', 'Le Chesnay-Rocquencourt', 'La Celle-Saint-Cloud'],
+  },
+  'mantes-la-ville': {
+    description: 'À Mantes-la-Ville, ville active du Yvelines (22 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Magnanville, Buchelay, Limay.',
+    quartiers: ['Centre-ville', 'Magnanville', 'Buchelay', 'Limay', 'Mantes-la-Jolie', 'Guerville', 'Porcheville'],
+  },
+  acheres: {
+    description: 'Découvrez les meilleurs artisans à Achères en Yvelines. Avec la région parisienne et 22 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Conflans-Sainte-Honorine, Andrésy, Maisons-Laffitte.',
+    quartiers: ['Centre-ville', 'Conflans-Sainte-Honorine', 'Andrésy', 'Maisons-Laffitte', 'Maurecourt', 'Chanteloup-les-Vignes', 'Saint-Germain-en-Laye'],
+  },
+  'saint-cyr-l-ecole': {
+    description: 'Découvrez les meilleurs artisans à Saint-Cyr-l\'École en Yvelines. Avec la région parisienne et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Fontenay-le-Fleury, Bois-d\'Arcy, Bailly.',
+    quartiers: ['Centre-ville', 'Fontenay-le-Fleury', 'Bois-d\'Arcy', 'Bailly', 'Guyancourt', 'Versailles', 'Montigny-le-Bretonneux'],
+  },
+  'carrieres-sous-poissy': {
+    description: 'Découvrez les meilleurs artisans à Carrières-sous-Poissy en Yvelines. Avec la région parisienne et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Villennes-sur-Seine, Poissy, Chanteloup-les-Vignes.',
+    quartiers: ['Centre-ville', 'Villennes-sur-Seine', 'Poissy', 'Chanteloup-les-Vignes', 'Triel-sur-Seine', 'Andrésy', 'Vernouillet'],
+  },
+  maurepas: {
+    description: 'Découvrez les meilleurs artisans à Maurepas en Yvelines. Avec la région parisienne et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Jouars-Pontchartrain, Coignières, La Verrière.',
+    quartiers: ['Centre-ville', 'Jouars-Pontchartrain', 'Coignières', 'La Verrière', 'Élancourt', 'Le Mesnil-Saint-Denis', 'Neauphle-le-Château'],
+  },
+  'la-celle-saint-cloud': {
+    description: 'Besoin d’un professionnel à La Celle-Saint-Cloud ? Située en Île-de-France, cette ville active du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Bougival, Louveciennes, Le Chesnay-Rocquencourt.',
+    quartiers: ['Centre-ville', 'Bougival', 'Louveciennes', 'Le Chesnay-Rocquencourt', 'Croissy-sur-Seine', 'Marly-le-Roi', 'Le Port-Marly'],
+  },
+  limay: {
+    description: 'Artisans référencés à Limay et ses environs. Cette commune francilienne de 18 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Mantes-la-Ville, Porcheville, Mantes-la-Jolie.',
+    quartiers: ['Centre-ville', 'Mantes-la-Ville', 'Porcheville', 'Mantes-la-Jolie', 'Issou', 'Guerville', 'Buchelay'],
+  },
+  viroflay: {
+    description: 'Artisans référencés à Viroflay et ses environs. Cette commune francilienne de 17 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Vélizy-Villacoublay, Versailles, Jouy-en-Josas.',
+    quartiers: ['Centre-ville', 'Vélizy-Villacoublay', 'Versailles', 'Jouy-en-Josas', 'Buc', 'Le Chesnay-Rocquencourt', 'La Celle-Saint-Cloud'],
+  },
+  'les-clayes-sous-bois': {
+    description: 'Découvrez les meilleurs artisans à Les Clayes-sous-Bois en Yvelines. Avec la région parisienne et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Plaisir, Villepreux, Bois-d\'Arcy.',
+    quartiers: ['Centre-ville', 'Plaisir', 'Villepreux', 'Bois-d\'Arcy', 'Fontenay-le-Fleury', 'Élancourt', 'Trappes'],
+  },
+  'marly-le-roi': {
+    description: 'Besoin d’un professionnel à Marly-le-Roi ? Située en Île-de-France, cette commune du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Mareil-Marly, Louveciennes, L\'Étang-la-Ville.',
+    quartiers: ['Centre-ville', 'Mareil-Marly', 'Louveciennes', 'L\'Étang-la-Ville', 'Le Port-Marly', 'Le Pecq', 'Bailly'],
+  },
+  'bois-d-arcy': {
+    description: 'Artisans référencés à Bois-d\'Arcy et ses environs. Cette commune francilienne de 17 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Fontenay-le-Fleury, Villepreux, Les Clayes-sous-Bois.',
+    quartiers: ['Centre-ville', 'Fontenay-le-Fleury', 'Villepreux', 'Les Clayes-sous-Bois', 'Montigny-le-Bretonneux', 'Saint-Cyr-l\'École', 'Trappes'],
+  },
+  'verneuil-sur-seine': {
+    description: 'Besoin d’un professionnel à Verneuil-sur-Seine ? Située en Île-de-France, cette commune du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Vaux-sur-Seine, Vernouillet, Triel-sur-Seine.',
+    quartiers: ['Centre-ville', 'Vaux-sur-Seine', 'Vernouillet', 'Triel-sur-Seine', 'Les Mureaux', 'Meulan-en-Yvelines', 'Chanteloup-les-Vignes'],
+  },
+  'le-pecq': {
+    description: 'Besoin d’un professionnel à Le Pecq ? Située en Île-de-France, cette commune du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Le Port-Marly, Le Vésinet, Mareil-Marly.',
+    quartiers: ['Centre-ville', 'Le Port-Marly', 'Le Vésinet', 'Mareil-Marly', 'Croissy-sur-Seine', 'Marly-le-Roi', 'Chatou'],
+  },
+  'le-vesinet': {
+    description: 'À Le Vésinet, commune du Yvelines (16 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Croissy-sur-Seine, Chatou, Le Port-Marly.',
+    quartiers: ['Centre-ville', 'Croissy-sur-Seine', 'Chatou', 'Le Port-Marly', 'Le Pecq', 'Montesson', 'Bougival'],
+  },
+  'carrieres-sur-seine': {
+    description: 'À Carrières-sur-Seine, commune du Yvelines (15 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Houilles, Sartrouville, Chatou.',
+    quartiers: ['Centre-ville', 'Houilles', 'Sartrouville', 'Chatou', 'Montesson', 'Le Vésinet', 'Le Mesnil-le-Roi'],
+  },
+  montesson: {
+    description: 'Découvrez les meilleurs artisans à Montesson en Yvelines. Avec la région parisienne et 15 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Le Mesnil-le-Roi, Chatou, Saint-Germain-en-Laye.',
+    quartiers: ['Centre-ville', 'Le Mesnil-le-Roi', 'Chatou', 'Saint-Germain-en-Laye', 'Le Vésinet', 'Carrières-sur-Seine', 'Sartrouville'],
+  },
+  andresy: {
+    description: 'Besoin d’un professionnel à Andrésy ? Située en Île-de-France, cette commune du Yvelines bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Chanteloup-les-Vignes, Maurecourt, Triel-sur-Seine.',
+    quartiers: ['Centre-ville', 'Chanteloup-les-Vignes', 'Maurecourt', 'Triel-sur-Seine', 'Carrières-sous-Poissy', 'Achères', 'Conflans-Sainte-Honorine'],
+  },
+  'fontenay-le-fleury': {
+    description: 'Découvrez les meilleurs artisans à Fontenay-le-Fleury en Yvelines. Avec la région parisienne et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Cyr-l\'École, Bois-d\'Arcy, Villepreux.',
+    quartiers: ['Centre-ville', 'Saint-Cyr-l\'École', 'Bois-d\'Arcy', 'Villepreux', 'Bailly', 'Noisy-le-Roi', 'Montigny-le-Bretonneux'],
+  },
+  aubergenville: {
+    description: 'Aubergenville (Yvelines, Île-de-France) est une commune de 13 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Flins-sur-Seine, Épône, Bouafle.',
+    quartiers: ['Centre-ville', 'Flins-sur-Seine', 'Épône', 'Bouafle', 'Juziers', 'Gargenville', 'Mézières-sur-Seine'],
+  },
+  'triel-sur-seine': {
+    description: 'Triel-sur-Seine est une commune de 12 000 habitants située dans le département Yvelines en Île-de-France. Nos artisans qualifiés interviennent à Triel-sur-Seine, ainsi que Chanteloup-les-Vignes, Vernouillet, Verneuil-sur-Seine pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Chanteloup-les-Vignes', 'Vernouillet', 'Verneuil-sur-Seine', 'Andrésy', 'Carrières-sous-Poissy', 'Maurecourt'],
+  },
+  villepreux: {
+    description: 'Villepreux est une commune de 12 000 habitants située dans le département Yvelines en Île-de-France. Nos artisans qualifiés interviennent à Villepreux, ainsi que Les Clayes-sous-Bois, Bois-d\'Arcy, Fontenay-le-Fleury pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Les Clayes-sous-Bois', 'Bois-d\'Arcy', 'Fontenay-le-Fleury', 'Saint-Nom-la-Bretèche', 'Noisy-le-Roi', 'Saint-Cyr-l\'École'],
+  },
+  'croissy-sur-seine': {
+    description: 'Artisans référencés à Croissy-sur-Seine et ses environs. Cette commune francilienne de 11 000 habitants en Yvelines compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Le Vésinet, Le Port-Marly, Bougival.',
+    quartiers: ['Centre-ville', 'Le Vésinet', 'Le Port-Marly', 'Bougival', 'Chatou', 'Le Pecq', 'Louveciennes'],
+  },
+  'chanteloup-les-vignes': {
+    description: 'Chanteloup-les-Vignes (Yvelines, Île-de-France) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Andrésy, Triel-sur-Seine, Maurecourt.',
+    quartiers: ['Centre-ville', 'Andrésy', 'Triel-sur-Seine', 'Maurecourt', 'Carrières-sous-Poissy', 'Vernouillet', 'Verneuil-sur-Seine'],
+  },
+  'voisins-le-bretonneux': {
+    description: 'Voisins-le-Bretonneux est une commune de 11 000 habitants située dans le département Yvelines en Île-de-France. Nos artisans qualifiés interviennent à Voisins-le-Bretonneux, ainsi que Magny-les-Hameaux, Guyancourt, Montigny-le-Bretonneux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Magny-les-Hameaux', 'Guyancourt', 'Montigny-le-Bretonneux', 'Trappes', 'Saint-Cyr-l\'École', 'Bois-d\'Arcy'],
+  },
+  'magny-les-hameaux': {
+    description: 'Trouvez des artisans qualifiés à Magny-les-Hameaux (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bougival: {
+    description: 'Trouvez des artisans qualifiés à Bougival (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'meulan-en-yvelines': {
+    description: 'Trouvez des artisans qualifiés à Meulan-en-Yvelines (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  louveciennes: {
+    description: 'Trouvez des artisans qualifiés à Louveciennes (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'jouy-en-josas': {
+    description: 'Trouvez des artisans qualifiés à Jouy-en-Josas (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gargenville: {
+    description: 'Trouvez des artisans qualifiés à Gargenville (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-remy-les-chevreuse': {
+    description: 'Trouvez des artisans qualifiés à Saint-Rémy-lès-Chevreuse (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'noisy-le-roi': {
+    description: 'Trouvez des artisans qualifiés à Noisy-le-Roi (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beynes: {
+    description: 'Trouvez des artisans qualifiés à Beynes (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'rosny-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Rosny-sur-Seine (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-mesnil-saint-denis': {
+    description: 'Trouvez des artisans qualifiés à Le Mesnil-Saint-Denis (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  orgeval: {
+    description: 'Trouvez des artisans qualifiés à Orgeval (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  epone: {
+    description: 'Trouvez des artisans qualifiés à Épône (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-essarts-le-roi': {
+    description: 'Trouvez des artisans qualifiés à Les Essarts-le-Roi (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-perray-en-yvelines': {
+    description: 'Trouvez des artisans qualifiés à Le Perray-en-Yvelines (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  magnanville: {
+    description: 'Trouvez des artisans qualifiés à Magnanville (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-mesnil-le-roi': {
+    description: 'Trouvez des artisans qualifiés à Le Mesnil-le-Roi (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  maule: {
+    description: 'Trouvez des artisans qualifiés à Maule (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'jouars-pontchartrain': {
+    description: 'Trouvez des artisans qualifiés à Jouars-Pontchartrain (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-verriere': {
+    description: 'Trouvez des artisans qualifiés à La Verrière (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villennes-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Villennes-sur-Seine (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-arnoult-en-yvelines': {
+    description: 'Trouvez des artisans qualifiés à Saint-Arnoult-en-Yvelines (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chambourcy: {
+    description: 'Trouvez des artisans qualifiés à Chambourcy (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  buc: {
+    description: 'Trouvez des artisans qualifiés à Buc (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-port-marly': {
+    description: 'Trouvez des artisans qualifiés à Le Port-Marly (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chevreuse: {
+    description: 'Trouvez des artisans qualifiés à Chevreuse (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vaux-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Vaux-sur-Seine (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'l-etang-la-ville': {
+    description: 'Trouvez des artisans qualifiés à L\'Étang-la-Ville (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bonnieres-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Bonnières-sur-Seine (Yvelines). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
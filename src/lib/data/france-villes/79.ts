@@ -0,0 +1,55 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  niort: {
+    description: 'Capitale des mutuelles françaises.',
+    quartiers: ['Centre-ville', 'Souché', 'Saint-Florent', 'Clou-Bouchet', 'Sainte-Pezenne', 'Surimeau', 'Tour Chabot-Gavacherie'],
+  },
+  bressuire: {
+    description: 'Artisans référencés à Bressuire et ses environs. Cette commune néo-aquitaine de 20 000 habitants en Deux-Sèvres compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Courlay, Argentonnay, Nueil-les-Aubiers.',
+    quartiers: ['Centre-ville', 'Courlay', 'Argentonnay', 'Nueil-les-Aubiers', 'La Chapelle-Saint-Laurent', 'Cerizay', 'La Forêt-sur-Sèvre'],
+  },
+  thouars: {
+    description: 'Découvrez les meilleurs artisans à Thouars en Deux-Sèvres. Avec le sud-ouest atlantique et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Loretz-d\'Argenton, Saint-Varent, Val en Vignes.',
+    quartiers: ['Centre-ville', 'Loretz-d\'Argenton', 'Saint-Varent', 'Val en Vignes', 'Argentonnay', 'Plaine-et-Vallées', 'Airvault'],
+  },
+  parthenay: {
+    description: 'Artisans référencés à Parthenay et ses environs. Cette commune néo-aquitaine de 10 000 habitants en Deux-Sèvres compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Pompaire, Châtillon-sur-Thouet, La Chapelle-Saint-Laurent.',
+    quartiers: ['Centre-ville', 'Pompaire', 'Châtillon-sur-Thouet', 'La Chapelle-Saint-Laurent', 'Airvault'],
+  },
+  mauleon: {
+    description: 'Trouvez des artisans qualifiés à Mauléon (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-maixent-l-ecole': {
+    description: 'Trouvez des artisans qualifiés à Saint-Maixent-l\'École (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chauray: {
+    description: 'Trouvez des artisans qualifiés à Chauray (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  melle: {
+    description: 'Trouvez des artisans qualifiés à Melle (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-creche': {
+    description: 'Trouvez des artisans qualifiés à La Crèche (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nueil-les-aubiers': {
+    description: 'Trouvez des artisans qualifiés à Nueil-les-Aubiers (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aiffres: {
+    description: 'Trouvez des artisans qualifiés à Aiffres (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'moncoutant-sur-sevre': {
+    description: 'Trouvez des artisans qualifiés à Moncoutant-sur-Sèvre (Deux-Sèvres). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
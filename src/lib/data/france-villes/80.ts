@@ -0,0 +1,40 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  amiens: { description: 'Ville d\'art et d\'histoire, célèbre pour sa cathédrale.', quartiers: ['Centre-ville', 'Saint-Leu', 'Henriville', 'Étouvie', 'Saint-Acheul'] },
+  abbeville: {
+    description: 'Découvrez les meilleurs artisans à Abbeville en Somme. Avec le nord de la France et 22 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Valery-sur-Somme, Feuquières-en-Vimeu, Airaines.',
+    quartiers: ['Centre-ville', 'Saint-Valery-sur-Somme', 'Feuquières-en-Vimeu', 'Airaines', 'Fressenneville', 'Friville-Escarbotin', 'Flixecourt'],
+  },
+  albert: {
+    description: 'Trouvez des artisans qualifiés à Albert (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  peronne: {
+    description: 'Trouvez des artisans qualifiés à Péronne (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  corbie: {
+    description: 'Trouvez des artisans qualifiés à Corbie (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  montdidier: {
+    description: 'Trouvez des artisans qualifiés à Montdidier (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  roye: {
+    description: 'Trouvez des artisans qualifiés à Roye (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  doullens: {
+    description: 'Trouvez des artisans qualifiés à Doullens (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  longueau: {
+    description: 'Trouvez des artisans qualifiés à Longueau (Somme). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
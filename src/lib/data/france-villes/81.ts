@@ -0,0 +1,52 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  albi: { description: 'Cité épiscopale UNESCO, ville de Toulouse-Lautrec.', quartiers: ['Centre historique', 'Cantepau', 'Lapanouse', 'Rayssac'] },
+  castres: {
+    description: 'Castres (Tarn, Occitanie) est une ville dynamique de 43 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saïx, Roquecourbe, Viviers-lès-Montagnes.',
+    quartiers: ['Centre-ville', 'Saïx', 'Roquecourbe', 'Viviers-lès-Montagnes', 'Sémalens', 'Payrin-Augmontel', 'Soual'],
+  },
+  gaillac: {
+    description: 'Gaillac (Tarn, Occitanie) est une commune de 16 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Brens, Lagrave, Lisle-sur-Tarn.',
+    quartiers: ['Centre-ville', 'Brens', 'Lagrave', 'Lisle-sur-Tarn', 'Marssac-sur-Tarn', 'Rabastens', 'Le Sequestre'],
+  },
+  graulhet: {
+    description: 'Artisans référencés à Graulhet et ses environs. Cette commune occitane de 13 000 habitants en Tarn compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Labastide-Saint-Georges, Lagrave, Brens.',
+    quartiers: ['Centre-ville', 'Labastide-Saint-Georges', 'Lagrave', 'Brens', 'Réalmont', 'Lavaur', 'Marssac-sur-Tarn'],
+  },
+  lavaur: {
+    description: 'À Lavaur, commune du Tarn (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine architectural riche, nos professionnels interviennent dans toute la commune, ainsi que Labastide-Saint-Georges, Saint-Sulpice-la-Pointe, Coufouleux.',
+    quartiers: ['Centre-ville', 'Labastide-Saint-Georges', 'Saint-Sulpice-la-Pointe', 'Coufouleux', 'Graulhet', 'Rabastens', 'Puylaurens'],
+  },
+  mazamet: {
+    description: 'Vous habitez à Mazamet ou ses environs ? Nos artisans qualifiés du Tarn sont disponibles pour tous vos travaux. Mazamet, commune occitane de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Aussillon, Aiguefonde, Pont-de-Larn.',
+    quartiers: ['Centre-ville', 'Aussillon', 'Aiguefonde', 'Pont-de-Larn', 'Payrin-Augmontel', 'Labruguière', 'Viviers-lès-Montagnes'],
+  },
+  carmaux: {
+    description: 'Trouvez des artisans qualifiés à Carmaux (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-sulpice-la-pointe': {
+    description: 'Trouvez des artisans qualifiés à Saint-Sulpice-la-Pointe (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  labruguiere: {
+    description: 'Trouvez des artisans qualifiés à Labruguière (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-juery': {
+    description: 'Trouvez des artisans qualifiés à Saint-Juéry (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rabastens: {
+    description: 'Trouvez des artisans qualifiés à Rabastens (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aussillon: {
+    description: 'Trouvez des artisans qualifiés à Aussillon (Tarn). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
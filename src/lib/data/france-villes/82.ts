@@ -0,0 +1,28 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  montauban: { description: 'Ville rose du Tarn-et-Garonne.', quartiers: ['Centre-ville', 'Villebourbon', 'Pomponne', 'Lalande'] },
+  castelsarrasin: {
+    description: 'Vous habitez à Castelsarrasin ou ses environs ? Nos artisans qualifiés du Tarn-et-Garonne sont disponibles pour tous vos travaux. Castelsarrasin, commune occitane de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Nicolas-de-la-Grave, Moissac, La Ville-Dieu-du-Temple.',
+    quartiers: ['Centre-ville', 'Saint-Nicolas-de-la-Grave', 'Moissac', 'La Ville-Dieu-du-Temple', 'Montbeton', 'Lafrançaise', 'Montech'],
+  },
+  moissac: {
+    description: 'Vous habitez à Moissac ou ses environs ? Nos artisans qualifiés du Tarn-et-Garonne sont disponibles pour tous vos travaux. Moissac, commune occitane de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Castelsarrasin, Saint-Nicolas-de-la-Grave, Lafrançaise.',
+    quartiers: ['Centre-ville', 'Castelsarrasin', 'Saint-Nicolas-de-la-Grave', 'Lafrançaise', 'La Ville-Dieu-du-Temple', 'Valence', 'Montbeton'],
+  },
+  caussade: {
+    description: 'Trouvez des artisans qualifiés à Caussade (Tarn-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  montech: {
+    description: 'Trouvez des artisans qualifiés à Montech (Tarn-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  negrepelisse: {
+    description: 'Trouvez des artisans qualifiés à Nègrepelisse (Tarn-et-Garonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
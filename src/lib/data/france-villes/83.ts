@@ -0,0 +1,198 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  toulon: { description: 'Premier port militaire français sur la Méditerranée.', quartiers: ['Vieille ville', 'Mourillon', 'Saint-Jean-du-Var', 'Le Revest'] },
+  'la-seyne-sur-mer': { description: 'Ville maritime de la rade de Toulon.', quartiers: ['Centre-ville', 'Tamaris', 'Les Sablettes', 'Berthe', 'Mar Vivo', 'Pont-de-Fabre', 'Jas-de-Ville'] },
+  frejus: {
+    description: 'Cité romaine de la Côte d\'Azur.',
+    quartiers: ['Centre-ville', 'Fréjus-Plage', 'Saint-Aygulf', 'Les Adrets', 'La Tour-de-Mare', 'Villeneuve', 'Puget-sur-Argens'],
+  },
+  hyeres: { description: 'Ville aux îles d\'Or, station balnéaire historique.', quartiers: ['Centre-ville', 'Giens', 'L\'Ayguade', 'Les Salins', 'Costebelle', 'La Capte', 'La Bayorre'] },
+  draguignan: {
+    description: 'Draguignan est une ville dynamique de 41 000 habitants située dans le département Var en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Draguignan, ainsi que Figanières, Trans-en-Provence, La Motte pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Figanières', 'Trans-en-Provence', 'La Motte', 'Flayosc', 'Les Arcs', 'Callas'],
+  },
+  'saint-raphael': {
+    description: 'Vous habitez à Saint-Raphaël ou ses environs ? Nos artisans qualifiés du Var sont disponibles pour tous vos travaux. Saint-Raphaël, ville dynamique provençale de 37 000 habitants, mérite des professionnels à la hauteur, ainsi que Fréjus, Les Adrets-de-l\'Estérel, Puget-sur-Argens.',
+    quartiers: ['Centre-ville', 'Fréjus', 'Les Adrets-de-l\'Estérel', 'Puget-sur-Argens', 'Bagnols-en-Forêt', 'Montauroux', 'Roquebrune-sur-Argens'],
+  },
+  'six-fours-les-plages': {
+    description: 'Besoin d’un professionnel à Six-Fours-les-Plages ? Située en Provence-Alpes-Côte d\'Azur, cette ville dynamique du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que La Seyne-sur-Mer, Sanary-sur-Mer, Ollioules.',
+    quartiers: ['Centre-ville', 'La Seyne-sur-Mer', 'Sanary-sur-Mer', 'Ollioules', 'Bandol', 'Saint-Mandrier-sur-Mer', 'Toulon'],
+  },
+  'la-garde': {
+    description: 'La Garde est une ville active de 26 000 habitants située dans le département Var en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à La Garde, ainsi que La Valette-du-Var, Le Pradet, La Farlède pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'La Valette-du-Var', 'Le Pradet', 'La Farlède', 'Carqueiranne', 'Solliès-Ville', 'Toulon'],
+  },
+  'la-valette-du-var': {
+    description: 'Découvrez les meilleurs artisans à La Valette-du-Var en Var. Avec le climat méditerranéen et 24 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Garde, Solliès-Ville, La Farlède.',
+    quartiers: ['Centre-ville', 'La Garde', 'Solliès-Ville', 'La Farlède', 'Toulon', 'Le Revest-les-Eaux', 'Le Pradet'],
+  },
+  'la-crau': {
+    description: 'La Crau est une commune de 20 000 habitants située dans le département Var en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à La Crau, ainsi que Solliès-Pont, La Farlède, Solliès-Ville pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Solliès-Pont', 'La Farlède', 'Solliès-Ville', 'La Garde', 'Carqueiranne', 'Cuers'],
+  },
+  'sanary-sur-mer': {
+    description: 'Découvrez les meilleurs artisans à Sanary-sur-Mer en Var. Avec le climat méditerranéen et 19 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Bandol, Ollioules, Six-Fours-les-Plages.',
+    quartiers: ['Centre-ville', 'Bandol', 'Ollioules', 'Six-Fours-les-Plages', 'Le Beausset', 'Saint-Cyr-sur-Mer', 'Évenos'],
+  },
+  'saint-maximin-la-sainte-baume': {
+    description: 'Trouvez un artisan de confiance à Saint-Maximin-la-Sainte-Baume (Var). Avec 18 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Tourves, Seillons-Source-d\'Argens, Bras.',
+    quartiers: ['Centre-ville', 'Tourves', 'Seillons-Source-d\'Argens', 'Bras', 'Nans-les-Pins', 'Pourrières', 'Saint-Zacharie'],
+  },
+  brignoles: {
+    description: 'Brignoles (Var, Provence-Alpes-Côte d\'Azur) est une commune de 18 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Forcalqueiret, Garéoult, Le Val.',
+    quartiers: ['Centre-ville', 'Forcalqueiret', 'Garéoult', 'Le Val', 'Sainte-Anastasie-sur-Issole', 'Rocbaron', 'La Roquebrussanne'],
+  },
+  'roquebrune-sur-argens': {
+    description: 'Artisans référencés à Roquebrune-sur-Argens et ses environs. Cette commune provençale de 15 000 habitants en Var compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Puget-sur-Argens, Le Muy, Sainte-Maxime.',
+    quartiers: ['Centre-ville', 'Puget-sur-Argens', 'Le Muy', 'Sainte-Maxime', 'Fréjus', 'La Motte', 'Bagnols-en-Forêt'],
+  },
+  ollioules: {
+    description: 'Ollioules est une commune de 15 000 habitants située dans le département Var en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Ollioules, ainsi que Sanary-sur-Mer, Évenos, La Seyne-sur-Mer pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sanary-sur-Mer', 'Évenos', 'La Seyne-sur-Mer', 'Toulon', 'Six-Fours-les-Plages', 'Le Beausset'],
+  },
+  'sainte-maxime': {
+    description: 'Besoin d’un professionnel à Sainte-Maxime ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Le Plan-de-la-Tour, Roquebrune-sur-Argens, Saint-Tropez.',
+    quartiers: ['Centre-ville', 'Le Plan-de-la-Tour', 'Roquebrune-sur-Argens', 'Saint-Tropez', 'Grimaud', 'Le Muy', 'Gassin'],
+  },
+  cuers: {
+    description: 'Besoin d’un professionnel à Cuers ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Belgentier, Solliès-Pont, Néoules.',
+    quartiers: ['Centre-ville', 'Belgentier', 'Solliès-Pont', 'Néoules', 'Rocbaron', 'Solliès-Toucas', 'Méounes-lès-Montrieux'],
+  },
+  vidauban: {
+    description: 'Besoin d’un professionnel à Vidauban ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Les Arcs, Le Cannet-des-Maures, Le Plan-de-la-Tour.',
+    quartiers: ['Centre-ville', 'Les Arcs', 'Le Cannet-des-Maures', 'Le Plan-de-la-Tour', 'Trans-en-Provence', 'Lorgues', 'Le Muy'],
+  },
+  'sollies-pont': {
+    description: 'Artisans référencés à Solliès-Pont et ses environs. Cette commune provençale de 13 000 habitants en Var compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Crau, La Farlède, Solliès-Ville.',
+    quartiers: ['Centre-ville', 'La Crau', 'La Farlède', 'Solliès-Ville', 'Cuers', 'Solliès-Toucas', 'La Valette-du-Var'],
+  },
+  cogolin: {
+    description: 'À Cogolin, commune du Var (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Gassin, Grimaud, Cavalaire-sur-Mer.',
+    quartiers: ['Centre-ville', 'Gassin', 'Grimaud', 'Cavalaire-sur-Mer', 'La Croix-Valmer', 'Le Plan-de-la-Tour', 'Saint-Tropez'],
+  },
+  'saint-cyr-sur-mer': {
+    description: 'Besoin d’un professionnel à Saint-Cyr-sur-Mer ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que La Cadière-d\'Azur, Bandol, Le Castellet.',
+    quartiers: ['Centre-ville', 'La Cadière-d\'Azur', 'Bandol', 'Le Castellet', 'Sanary-sur-Mer', 'Le Beausset', 'Ollioules'],
+  },
+  'le-luc': {
+    description: 'Le Luc (Var, Provence-Alpes-Côte d\'Azur) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Cannet-des-Maures, Flassans-sur-Issole, Gonfaron.',
+    quartiers: ['Centre-ville', 'Le Cannet-des-Maures', 'Flassans-sur-Issole', 'Gonfaron', 'Cabasse', 'Le Thoronet', 'Pignans'],
+  },
+  'le-pradet': {
+    description: 'Trouvez un artisan de confiance à Le Pradet (Var). Avec 11 000 habitants, cette commune provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que La Garde, Carqueiranne, La Valette-du-Var.',
+    quartiers: ['Centre-ville', 'La Garde', 'Carqueiranne', 'La Valette-du-Var', 'La Farlède', 'Saint-Mandrier-sur-Mer', 'Toulon'],
+  },
+  'la-londe-les-maures': {
+    description: 'Besoin d’un professionnel à La Londe-les-Maures ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Var bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Hyères, Pierrefeu-du-Var, Bormes-les-Mimosas.',
+    quartiers: ['Centre-ville', 'Hyères', 'Pierrefeu-du-Var', 'Bormes-les-Mimosas', 'La Crau', 'Le Lavandou', 'Puget-Ville'],
+  },
+  'le-beausset': {
+    description: 'Le Beausset (Var, Provence-Alpes-Côte d\'Azur) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Évenos, Le Castellet, Ollioules.',
+    quartiers: ['Centre-ville', 'Évenos', 'Le Castellet', 'Ollioules', 'Sanary-sur-Mer', 'Signes', 'La Cadière-d\'Azur'],
+  },
+  'le-muy': {
+    description: 'Artisans référencés à Le Muy et ses environs. Cette commune provençale de 10 000 habitants en Var compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Motte, Roquebrune-sur-Argens, Les Arcs.',
+    quartiers: ['Centre-ville', 'La Motte', 'Roquebrune-sur-Argens', 'Les Arcs', 'Puget-sur-Argens', 'Trans-en-Provence', 'Callas'],
+  },
+  'la-farlede': {
+    description: 'À La Farlède, commune du Var (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Solliès-Ville, Solliès-Pont, La Crau.',
+    quartiers: ['Centre-ville', 'Solliès-Ville', 'Solliès-Pont', 'La Crau', 'La Garde', 'La Valette-du-Var', 'Solliès-Toucas'],
+  },
+  lorgues: {
+    description: 'Trouvez des artisans qualifiés à Lorgues (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  carqueiranne: {
+    description: 'Trouvez des artisans qualifiés à Carqueiranne (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'puget-sur-argens': {
+    description: 'Trouvez des artisans qualifiés à Puget-sur-Argens (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bormes-les-mimosas': {
+    description: 'Trouvez des artisans qualifiés à Bormes-les-Mimosas (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bandol: {
+    description: 'Trouvez des artisans qualifiés à Bandol (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cavalaire-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Cavalaire-sur-Mer (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-arcs': {
+    description: 'Trouvez des artisans qualifiés à Les Arcs (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  montauroux: {
+    description: 'Trouvez des artisans qualifiés à Montauroux (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'trans-en-provence': {
+    description: 'Trouvez des artisans qualifiés à Trans-en-Provence (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-lavandou': {
+    description: 'Trouvez des artisans qualifiés à Le Lavandou (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sollies-toucas': {
+    description: 'Trouvez des artisans qualifiés à Solliès-Toucas (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  fayence: {
+    description: 'Trouvez des artisans qualifiés à Fayence (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pierrefeu-du-var': {
+    description: 'Trouvez des artisans qualifiés à Pierrefeu-du-Var (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-castellet': {
+    description: 'Trouvez des artisans qualifiés à Le Castellet (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-mandrier-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Saint-Mandrier-sur-Mer (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-zacharie': {
+    description: 'Trouvez des artisans qualifiés à Saint-Zacharie (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gareoult: {
+    description: 'Trouvez des artisans qualifiés à Garéoult (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-cadiere-d-azur': {
+    description: 'Trouvez des artisans qualifiés à La Cadière-d\'Azur (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rocbaron: {
+    description: 'Trouvez des artisans qualifiés à Rocbaron (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pourrieres: {
+    description: 'Trouvez des artisans qualifiés à Pourrières (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'nans-les-pins': {
+    description: 'Trouvez des artisans qualifiés à Nans-les-Pins (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tourves: {
+    description: 'Trouvez des artisans qualifiés à Tourves (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-cannet-des-maures': {
+    description: 'Trouvez des artisans qualifiés à Le Cannet-des-Maures (Var). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
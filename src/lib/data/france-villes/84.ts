@@ -0,0 +1,109 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  avignon: { description: 'Cité des Papes, capitale du théâtre en été.', quartiers: ['Intra-muros', 'Montfavet', 'Rocade Sud', 'Saint-Chamand'] },
+  carpentras: {
+    description: 'À Carpentras, ville dynamique du Vaucluse (32 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Aubignan, Loriol-du-Comtat, Mazan.',
+    quartiers: ['Centre-ville', 'Aubignan', 'Loriol-du-Comtat', 'Mazan', 'Caromb', 'Monteux', 'Beaumes-de-Venise'],
+  },
+  orange: { description: 'Cité romaine, théâtre antique.', quartiers: ['Centre-ville', 'La Tourre', 'Fourches Vieilles', 'Nogent'] },
+  cavaillon: {
+    description: 'Trouvez un artisan de confiance à Cavaillon (Vaucluse). Avec 26 000 habitants, cette ville active provençale dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Taillades, Robion, Caumont-sur-Durance.',
+    quartiers: ['Centre-ville', 'Taillades', 'Robion', 'Caumont-sur-Durance', 'L\'Isle-sur-la-Sorgue', 'Le Thor', 'Cheval-Blanc'],
+  },
+  'l-isle-sur-la-sorgue': {
+    description: 'À L\'Isle-sur-la-Sorgue, ville active du Vaucluse (20 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Le Thor, Velleron, Cavaillon.',
+    quartiers: ['Centre-ville', 'Le Thor', 'Velleron', 'Cavaillon', 'Pernes-les-Fontaines', 'Robion', 'Caumont-sur-Durance'],
+  },
+  pertuis: {
+    description: 'Artisans référencés à Pertuis et ses environs. Cette commune provençale de 20 000 habitants en Vaucluse compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que La Tour-d\'Aigues, Villelaure, Cadenet.',
+    quartiers: ['Centre-ville', 'La Tour-d\'Aigues', 'Villelaure', 'Cadenet', 'Lauris', 'Apt'],
+  },
+  sorgues: {
+    description: 'Sorgues est une commune de 19 000 habitants située dans le département Vaucluse en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Sorgues, ainsi que Le Pontet, Bédarrides, Châteauneuf-du-Pape pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Pontet', 'Bédarrides', 'Châteauneuf-du-Pape', 'Vedène', 'Entraigues-sur-la-Sorgue', 'Althen-des-Paluds'],
+  },
+  'le-pontet': {
+    description: 'À Le Pontet, commune du Vaucluse (18 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour des bâtiments anciens en pierre, nos professionnels interviennent dans toute la commune, ainsi que Vedène, Avignon, Sorgues.',
+    quartiers: ['Centre-ville', 'Vedène', 'Avignon', 'Sorgues', 'Morières-lès-Avignon', 'Entraigues-sur-la-Sorgue', 'Saint-Saturnin-lès-Avignon'],
+  },
+  bollene: {
+    description: 'Artisans référencés à Bollène et ses environs. Cette commune provençale de 14 000 habitants en Vaucluse compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Mondragon, Lapalud, Mornas.',
+    quartiers: ['Centre-ville', 'Mondragon', 'Lapalud', 'Mornas', 'Piolenc', 'Sainte-Cécile-les-Vignes', 'Sérignan-du-Comtat'],
+  },
+  monteux: {
+    description: 'Monteux est une commune de 13 000 habitants située dans le département Vaucluse en Provence-Alpes-Côte d\'Azur. Nos artisans qualifiés interviennent à Monteux, ainsi que Althen-des-Paluds, Loriol-du-Comtat, Pernes-les-Fontaines pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Althen-des-Paluds', 'Loriol-du-Comtat', 'Pernes-les-Fontaines', 'Entraigues-sur-la-Sorgue', 'Carpentras', 'Bédarrides'],
+  },
+  vedene: {
+    description: 'Besoin d’un professionnel à Vedène ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Vaucluse bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Saturnin-lès-Avignon, Entraigues-sur-la-Sorgue, Le Pontet.',
+    quartiers: ['Centre-ville', 'Saint-Saturnin-lès-Avignon', 'Entraigues-sur-la-Sorgue', 'Le Pontet', 'Morières-lès-Avignon', 'Althen-des-Paluds', 'Châteauneuf-de-Gadagne'],
+  },
+  'pernes-les-fontaines': {
+    description: 'Besoin d’un professionnel à Pernes-les-Fontaines ? Située en Provence-Alpes-Côte d\'Azur, cette commune du Vaucluse bénéficie de des besoins en climatisation et rénovation. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Velleron, Monteux, Althen-des-Paluds.',
+    quartiers: ['Centre-ville', 'Velleron', 'Monteux', 'Althen-des-Paluds', 'Saint-Didier', 'Entraigues-sur-la-Sorgue', 'Saint-Saturnin-lès-Avignon'],
+  },
+  apt: {
+    description: 'Apt (Vaucluse, Provence-Alpes-Côte d\'Azur) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Gargas, Saint-Saturnin-lès-Apt, Lauris.',
+    quartiers: ['Centre-ville', 'Gargas', 'Saint-Saturnin-lès-Apt', 'Lauris', 'Cadenet', 'Villelaure', 'Mérindol'],
+  },
+  valreas: {
+    description: 'Trouvez des artisans qualifiés à Valréas (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'morieres-les-avignon': {
+    description: 'Trouvez des artisans qualifiés à Morières-lès-Avignon (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'entraigues-sur-la-sorgue': {
+    description: 'Trouvez des artisans qualifiés à Entraigues-sur-la-Sorgue (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-thor': {
+    description: 'Trouvez des artisans qualifiés à Le Thor (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  courthezon: {
+    description: 'Trouvez des artisans qualifiés à Courthézon (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mazan: {
+    description: 'Trouvez des artisans qualifiés à Mazan (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vaison-la-romaine': {
+    description: 'Trouvez des artisans qualifiés à Vaison-la-Romaine (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  aubignan: {
+    description: 'Trouvez des artisans qualifiés à Aubignan (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sarrians: {
+    description: 'Trouvez des artisans qualifiés à Sarrians (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  piolenc: {
+    description: 'Trouvez des artisans qualifiés à Piolenc (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bedarrides: {
+    description: 'Trouvez des artisans qualifiés à Bédarrides (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'caumont-sur-durance': {
+    description: 'Trouvez des artisans qualifiés à Caumont-sur-Durance (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-saturnin-les-avignon': {
+    description: 'Trouvez des artisans qualifiés à Saint-Saturnin-lès-Avignon (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  jonquieres: {
+    description: 'Trouvez des artisans qualifiés à Jonquières (Vaucluse). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
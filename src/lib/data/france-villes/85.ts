@@ -0,0 +1,115 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'la-roche-sur-yon': {
+    description: 'La Roche-sur-Yon est une ville importante de 55 000 habitants située dans le département Vendée en Pays de la Loire. Nos artisans qualifiés interviennent à La Roche-sur-Yon, ainsi que Mouilleron-le-Captif, Aubigny-Les Clouzeaux, Nesmy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Mouilleron-le-Captif', 'Aubigny-Les Clouzeaux', 'Nesmy', 'La Ferrière', 'La Genétouze', 'Venansault'],
+  },
+  'les-sables-d-olonne': {
+    description: 'Trouvez un artisan de confiance à Les Sables-d\'Olonne (Vendée). Avec 50 000 habitants, cette ville dynamique ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Sainte-Foy, L\'Île-d\'Olonne, Saint-Mathurin.',
+    quartiers: ['Centre-ville', 'Sainte-Foy', 'L\'Île-d\'Olonne', 'Saint-Mathurin', 'Brem-sur-Mer', 'Les Achards', 'Talmont-Saint-Hilaire'],
+  },
+  challans: {
+    description: 'Découvrez les meilleurs artisans à Challans en Vendée. Avec la façade atlantique et 23 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Soullans, La Garnache, Commequiers.',
+    quartiers: ['Centre-ville', 'Soullans', 'La Garnache', 'Commequiers', 'Froidfond', 'Saint-Christophe-du-Ligneron', 'Sallertaine'],
+  },
+  'montaigu-vendee': {
+    description: 'Artisans référencés à Montaigu-Vendée et ses environs. Cette ville active ligérienne de 21 000 habitants en Vendée compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Treize-Septiers, La Boissière-de-Montaigu, Cugand-la-Bernardière.',
+    quartiers: ['Centre-ville', 'Treize-Septiers', 'La Boissière-de-Montaigu', 'Cugand-la-Bernardière', 'L\'Herbergement', 'La Bruffière', 'Les Brouzils'],
+  },
+  'les-herbiers': {
+    description: 'Les Herbiers est une commune de 17 000 habitants située dans le département Vendée en Pays de la Loire. Nos artisans qualifiés interviennent à Les Herbiers, ainsi que Beaurepaire, La Gaubretière, Mouchamps pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Beaurepaire', 'La Gaubretière', 'Mouchamps', 'Chanverrie', 'Les Epesses', 'Saint-Fulgent'],
+  },
+  'fontenay-le-comte': {
+    description: 'Vous habitez à Fontenay-le-Comte ou ses environs ? Nos artisans qualifiés du Vendée sont disponibles pour tous vos travaux. Fontenay-le-Comte, commune ligérienne de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Rives-d\'Autise, Benet, Nalliers.',
+    quartiers: ['Centre-ville', 'Rives-d\'Autise', 'Benet', 'Nalliers', 'La Châtaigneraie', 'Terval', 'Sainte-Gemme-la-Plaine'],
+  },
+  'saint-hilaire-de-riez': {
+    description: 'Vous habitez à Saint-Hilaire-de-Riez ou ses environs ? Nos artisans qualifiés du Vendée sont disponibles pour tous vos travaux. Saint-Hilaire-de-Riez, commune ligérienne de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Notre-Dame-de-Riez, Le Fenouiller, Le Perrier.',
+    quartiers: ['Centre-ville', 'Notre-Dame-de-Riez', 'Le Fenouiller', 'Le Perrier', 'Soullans', 'Saint-Gilles-Croix-de-Vie', 'Saint-Jean-de-Monts'],
+  },
+  aizenay: {
+    description: 'Trouvez un artisan de confiance à Aizenay (Vendée). Avec 10 000 habitants, cette commune ligérienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Beaulieu-sous-la-Roche, Venansault, La Genétouze.',
+    quartiers: ['Centre-ville', 'Beaulieu-sous-la-Roche', 'Venansault', 'La Genétouze', 'Apremont', 'Coëx', 'Le Poiré-sur-Vie'],
+  },
+  lucon: {
+    description: 'Trouvez des artisans qualifiés à Luçon (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-jean-de-monts': {
+    description: 'Trouvez des artisans qualifiés à Saint-Jean-de-Monts (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-poire-sur-vie': {
+    description: 'Trouvez des artisans qualifiés à Le Poiré-sur-Vie (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chantonnay: {
+    description: 'Trouvez des artisans qualifiés à Chantonnay (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'talmont-saint-hilaire': {
+    description: 'Trouvez des artisans qualifiés à Talmont-Saint-Hilaire (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-gilles-croix-de-vie': {
+    description: 'Trouvez des artisans qualifiés à Saint-Gilles-Croix-de-Vie (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aubigny-les-clouzeaux': {
+    description: 'Trouvez des artisans qualifiés à Aubigny-Les Clouzeaux (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'essarts-en-bocage': {
+    description: 'Trouvez des artisans qualifiés à Essarts-en-Bocage (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  sevremont: {
+    description: 'Trouvez des artisans qualifiés à Sèvremont (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bellevigny: {
+    description: 'Trouvez des artisans qualifiés à Bellevigny (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mortagne-sur-sevre': {
+    description: 'Trouvez des artisans qualifiés à Mortagne-sur-Sèvre (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'cugand-la-bernardiere': {
+    description: 'Trouvez des artisans qualifiés à Cugand-la-Bernardière (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  pouzauges: {
+    description: 'Trouvez des artisans qualifiés à Pouzauges (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chanverrie: {
+    description: 'Trouvez des artisans qualifiés à Chanverrie (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-achards': {
+    description: 'Trouvez des artisans qualifiés à Les Achards (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-garnache': {
+    description: 'Trouvez des artisans qualifiés à La Garnache (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ferriere': {
+    description: 'Trouvez des artisans qualifiés à La Ferrière (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bretignolles-sur-mer': {
+    description: 'Trouvez des artisans qualifiés à Bretignolles-sur-Mer (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mouilleron-le-captif': {
+    description: 'Trouvez des artisans qualifiés à Mouilleron-le-Captif (Vendée). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,56 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  poitiers: { description: 'Ville d\'art roman au riche patrimoine.', quartiers: ['Centre-ville', 'Couronneries', 'Gibauderie', 'Beaulieu', 'Trois-Cités', 'Saint-Éloi', 'Montmidi'] },
+  chatellerault: {
+    description: 'À Châtellerault, ville dynamique du Vienne (31 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un habitat varié du littoral à l\'intérieur, nos professionnels interviennent dans toute la commune, ainsi que Naintré, Thuré, Vouneuil-sur-Vienne.',
+    quartiers: ['Centre-ville', 'Naintré', 'Thuré', 'Vouneuil-sur-Vienne', 'Scorbé-Clairvaux', 'Beaumont Saint-Cyr', 'Dangé-Saint-Romain'],
+  },
+  buxerolles: {
+    description: 'Buxerolles (Vienne, Nouvelle-Aquitaine) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Poitiers, Chasseneuil-du-Poitou, Migné-Auxances.',
+    quartiers: ['Centre-ville', 'Poitiers', 'Chasseneuil-du-Poitou', 'Migné-Auxances', 'Montamisé', 'Saint-Benoît', 'Mignaloux-Beauvoir'],
+  },
+  'jaunay-marigny': {
+    description: 'Trouvez des artisans qualifiés à Jaunay-Marigny (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chauvigny: {
+    description: 'Trouvez des artisans qualifiés à Chauvigny (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  loudun: {
+    description: 'Trouvez des artisans qualifiés à Loudun (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vouneuil-sous-biard': {
+    description: 'Trouvez des artisans qualifiés à Vouneuil-sous-Biard (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'migne-auxances': {
+    description: 'Trouvez des artisans qualifiés à Migné-Auxances (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  naintre: {
+    description: 'Trouvez des artisans qualifiés à Naintré (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  montmorillon: {
+    description: 'Trouvez des artisans qualifiés à Montmorillon (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-martin-la-pallu': {
+    description: 'Trouvez des artisans qualifiés à Saint-Martin-la-Pallu (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'neuville-de-poitou': {
+    description: 'Trouvez des artisans qualifiés à Neuville-de-Poitou (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'mignaloux-beauvoir': {
+    description: 'Trouvez des artisans qualifiés à Mignaloux-Beauvoir (Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
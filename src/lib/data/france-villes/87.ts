@@ -0,0 +1,48 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  limoges: { description: 'Capitale des arts du feu, porcelaine et émail.', quartiers: ['Centre-ville', 'Beaubreuil', 'Val de l\'Aurence', 'La Borie', 'La Bastide', 'Le Sablard'] },
+  'saint-junien': {
+    description: 'Saint-Junien (Haute-Vienne, Nouvelle-Aquitaine) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Rochechouart, Oradour-sur-Glane, Veyrac.',
+    quartiers: ['Centre-ville', 'Rochechouart', 'Oradour-sur-Glane', 'Veyrac', 'Verneuil-sur-Vienne', 'Saint-Gence', 'Séreilhac'],
+  },
+  panazol: {
+    description: 'Panazol (Haute-Vienne, Nouvelle-Aquitaine) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Palais-sur-Vienne, Feytiat, Saint-Just-le-Martel.',
+    quartiers: ['Centre-ville', 'Le Palais-sur-Vienne', 'Feytiat', 'Saint-Just-le-Martel', 'Rilhac-Rancon', 'Limoges', 'Saint-Priest-Taurion'],
+  },
+  couzeix: {
+    description: 'Vous habitez à Couzeix ou ses environs ? Nos artisans qualifiés du Haute-Vienne sont disponibles pour tous vos travaux. Couzeix, commune néo-aquitaine de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Limoges, Chaptelat, Saint-Gence.',
+    quartiers: ['Centre-ville', 'Limoges', 'Chaptelat', 'Saint-Gence', 'Verneuil-sur-Vienne', 'Isle', 'Le Palais-sur-Vienne'],
+  },
+  isle: {
+    description: 'Trouvez des artisans qualifiés à Isle (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-yrieix-la-perche': {
+    description: 'Trouvez des artisans qualifiés à Saint-Yrieix-la-Perche (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  feytiat: {
+    description: 'Trouvez des artisans qualifiés à Feytiat (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'aixe-sur-vienne': {
+    description: 'Trouvez des artisans qualifiés à Aixe-sur-Vienne (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-palais-sur-vienne': {
+    description: 'Trouvez des artisans qualifiés à Le Palais-sur-Vienne (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ambazac: {
+    description: 'Trouvez des artisans qualifiés à Ambazac (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'condat-sur-vienne': {
+    description: 'Trouvez des artisans qualifiés à Condat-sur-Vienne (Haute-Vienne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
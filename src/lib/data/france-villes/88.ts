@@ -0,0 +1,40 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  epinal: { description: 'Cité des images.', quartiers: ['Centre-ville', 'La Justice', 'Saut-le-Cerf', 'Poissompré'] },
+  'saint-die-des-vosges': {
+    description: 'Vous habitez à Saint-Dié-des-Vosges ou ses environs ? Nos artisans qualifiés du Vosges sont disponibles pour tous vos travaux. Saint-Dié-des-Vosges, commune du Grand Est de 19 000 habitants, mérite des professionnels à la hauteur, ainsi que Sainte-Marguerite, Saulcy-sur-Meurthe, Moyenmoutier.',
+    quartiers: ['Centre-ville', 'Sainte-Marguerite', 'Saulcy-sur-Meurthe', 'Moyenmoutier', 'Étival-Clairefontaine', 'Senones', 'Raon-l\'Étape'],
+  },
+  golbey: {
+    description: 'Trouvez des artisans qualifiés à Golbey (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'thaon-les-vosges': {
+    description: 'Trouvez des artisans qualifiés à Thaon-les-Vosges (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gerardmer: {
+    description: 'Trouvez des artisans qualifiés à Gérardmer (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  remiremont: {
+    description: 'Trouvez des artisans qualifiés à Remiremont (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  neufchateau: {
+    description: 'Trouvez des artisans qualifiés à Neufchâteau (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'raon-l-etape': {
+    description: 'Trouvez des artisans qualifiés à Raon-l\'Étape (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rambervillers: {
+    description: 'Trouvez des artisans qualifiés à Rambervillers (Vosges). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,28 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  auxerre: { description: 'Ville d\'art et d\'histoire de Bourgogne.', quartiers: ['Centre historique', 'Les Mignottes', 'Sainte-Geneviève', 'Rive Droite'] },
+  sens: {
+    description: 'Trouvez un artisan de confiance à Sens (Yonne). Avec 27 000 habitants, cette ville active bourguignonne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Clément, Paron, Villeneuve-sur-Yonne.',
+    quartiers: ['Centre-ville', 'Saint-Clément', 'Paron', 'Villeneuve-sur-Yonne', 'Pont-sur-Yonne', 'Champigny', 'Saint-Julien-du-Sault'],
+  },
+  joigny: {
+    description: 'Trouvez des artisans qualifiés à Joigny (Yonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  migennes: {
+    description: 'Trouvez des artisans qualifiés à Migennes (Yonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  avallon: {
+    description: 'Trouvez des artisans qualifiés à Avallon (Yonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villeneuve-sur-yonne': {
+    description: 'Trouvez des artisans qualifiés à Villeneuve-sur-Yonne (Yonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
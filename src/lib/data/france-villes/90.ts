@@ -0,0 +1,16 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  belfort: { description: 'Cité du Lion, histoire industrielle.', quartiers: ['Centre-ville', 'Les Résidences', 'Glacis', 'Miotte'] },
+  delle: {
+    description: 'Trouvez des artisans qualifiés à Delle (Territoire de Belfort). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  valdoie: {
+    description: 'Trouvez des artisans qualifiés à Valdoie (Territoire de Belfort). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,271 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'evry-courcouronnes': {
+    description: 'Artisans référencés à Évry-Courcouronnes et ses environs. Cette ville importante francilienne de 67 000 habitants en Essonne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Ris-Orangis, Lisses, Bondoufle.',
+    quartiers: ['Centre-ville', 'Ris-Orangis', 'Lisses', 'Bondoufle', 'Corbeil-Essonnes', 'Soisy-sur-Seine', 'Fleury-Mérogis'],
+  },
+  'corbeil-essonnes': {
+    description: 'À Corbeil-Essonnes, ville importante du Essonne (54 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Villabé, Saintry-sur-Seine, Lisses.',
+    quartiers: ['Centre-ville', 'Villabé', 'Saintry-sur-Seine', 'Lisses', 'Ormoy', 'Saint-Pierre-du-Perray', 'Saint-Germain-lès-Corbeil'],
+  },
+  massy: {
+    description: 'Massy (Essonne, Île-de-France) est une ville importante de 52 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Champlan, Verrières-le-Buisson, Palaiseau.',
+    quartiers: ['Centre-ville', 'Champlan', 'Verrières-le-Buisson', 'Palaiseau', 'Igny', 'Chilly-Mazarin', 'Villebon-sur-Yvette'],
+  },
+  'savigny-sur-orge': {
+    description: 'Besoin d’un professionnel à Savigny-sur-Orge ? Située en Île-de-France, cette ville dynamique du Essonne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Juvisy-sur-Orge, Morangis, Épinay-sur-Orge.',
+    quartiers: ['Centre-ville', 'Juvisy-sur-Orge', 'Morangis', 'Épinay-sur-Orge', 'Viry-Châtillon', 'Villemoisson-sur-Orge', 'Morsang-sur-Orge'],
+  },
+  palaiseau: {
+    description: 'Palaiseau (Essonne, Île-de-France) est une ville dynamique de 37 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Villebon-sur-Yvette, Igny, Massy.',
+    quartiers: ['Centre-ville', 'Villebon-sur-Yvette', 'Igny', 'Massy', 'Orsay', 'Champlan', 'Saulx-les-Chartreux'],
+  },
+  'athis-mons': {
+    description: 'À Athis-Mons, ville dynamique du Essonne (37 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Juvisy-sur-Orge, Paray-Vieille-Poste, Vigneux-sur-Seine.',
+    quartiers: ['Centre-ville', 'Juvisy-sur-Orge', 'Paray-Vieille-Poste', 'Vigneux-sur-Seine', 'Morangis', 'Savigny-sur-Orge', 'Draveil'],
+  },
+  'sainte-genevieve-des-bois': {
+    description: 'Sainte-Geneviève-des-Bois (Essonne, Île-de-France) est une ville dynamique de 35 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Michel-sur-Orge, Villemoisson-sur-Orge, Morsang-sur-Orge.',
+    quartiers: ['Centre-ville', 'Saint-Michel-sur-Orge', 'Villemoisson-sur-Orge', 'Morsang-sur-Orge', 'Villiers-sur-Orge', 'Longpont-sur-Orge', 'Épinay-sur-Orge'],
+  },
+  'vigneux-sur-seine': {
+    description: 'Découvrez les meilleurs artisans à Vigneux-sur-Seine en Essonne. Avec la région parisienne et 31 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Draveil, Montgeron, Athis-Mons.',
+    quartiers: ['Centre-ville', 'Draveil', 'Montgeron', 'Athis-Mons', 'Crosne', 'Juvisy-sur-Orge', 'Yerres'],
+  },
+  'ris-orangis': {
+    description: 'Découvrez les meilleurs artisans à Ris-Orangis en Essonne. Avec la région parisienne et 31 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Grigny, Évry-Courcouronnes, Fleury-Mérogis.',
+    quartiers: ['Centre-ville', 'Grigny', 'Évry-Courcouronnes', 'Fleury-Mérogis', 'Viry-Châtillon', 'Draveil', 'Bondoufle'],
+  },
+  'viry-chatillon': {
+    description: 'Découvrez les meilleurs artisans à Viry-Châtillon en Essonne. Avec la région parisienne et 31 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Grigny, Morsang-sur-Orge, Juvisy-sur-Orge.',
+    quartiers: ['Centre-ville', 'Grigny', 'Morsang-sur-Orge', 'Juvisy-sur-Orge', 'Savigny-sur-Orge', 'Ris-Orangis', 'Villemoisson-sur-Orge'],
+  },
+  draveil: {
+    description: 'Vous habitez à Draveil ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Draveil, ville dynamique francilienne de 30 000 habitants, mérite des professionnels à la hauteur, ainsi que Vigneux-sur-Seine, Montgeron, Grigny.',
+    quartiers: ['Centre-ville', 'Vigneux-sur-Seine', 'Montgeron', 'Grigny', 'Soisy-sur-Seine', 'Ris-Orangis', 'Viry-Châtillon'],
+  },
+  yerres: {
+    description: 'Besoin d’un professionnel à Yerres ? Située en Île-de-France, cette ville active du Essonne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Brunoy, Crosne, Montgeron.',
+    quartiers: ['Centre-ville', 'Brunoy', 'Crosne', 'Montgeron', 'Épinay-sous-Sénart', 'Boussy-Saint-Antoine', 'Vigneux-sur-Seine'],
+  },
+  etampes: {
+    description: 'À Étampes, ville active du Essonne (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Morigny-Champigny, Étréchy, Janville-sur-Juine.',
+    quartiers: ['Centre-ville', 'Morigny-Champigny', 'Étréchy', 'Janville-sur-Juine', 'Le Mérévillois', 'Cerny', 'Pussay'],
+  },
+  grigny: {
+    description: 'Grigny est une ville active de 27 000 habitants située dans le département Essonne en Île-de-France. Nos artisans qualifiés interviennent à Grigny, ainsi que Viry-Châtillon, Ris-Orangis, Morsang-sur-Orge pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Viry-Châtillon', 'Ris-Orangis', 'Morsang-sur-Orge', 'Fleury-Mérogis', 'Draveil', 'Juvisy-sur-Orge'],
+  },
+  'bretigny-sur-orge': {
+    description: 'Trouvez un artisan de confiance à Brétigny-sur-Orge (Essonne). Avec 27 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Germain-lès-Arpajon, Leuville-sur-Orge, Le Plessis-Pâté.',
+    quartiers: ['Centre-ville', 'Saint-Germain-lès-Arpajon', 'Leuville-sur-Orge', 'Le Plessis-Pâté', 'La Norville', 'Saint-Michel-sur-Orge', 'Arpajon'],
+  },
+  'les-ulis': {
+    description: 'Trouvez un artisan de confiance à Les Ulis (Essonne). Avec 26 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Orsay, Bures-sur-Yvette, Villejust.',
+    quartiers: ['Centre-ville', 'Orsay', 'Bures-sur-Yvette', 'Villejust', 'Gometz-le-Châtel', 'Marcoussis', 'Villebon-sur-Yvette'],
+  },
+  brunoy: {
+    description: 'Vous habitez à Brunoy ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Brunoy, ville active francilienne de 26 000 habitants, mérite des professionnels à la hauteur, ainsi que Épinay-sous-Sénart, Yerres, Boussy-Saint-Antoine.',
+    quartiers: ['Centre-ville', 'Épinay-sous-Sénart', 'Yerres', 'Boussy-Saint-Antoine', 'Quincy-sous-Sénart', 'Montgeron', 'Crosne'],
+  },
+  montgeron: {
+    description: 'Trouvez un artisan de confiance à Montgeron (Essonne). Avec 24 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Vigneux-sur-Seine, Crosne, Yerres.',
+    quartiers: ['Centre-ville', 'Vigneux-sur-Seine', 'Crosne', 'Yerres', 'Brunoy', 'Draveil', 'Épinay-sous-Sénart'],
+  },
+  'gif-sur-yvette': {
+    description: 'À Gif-sur-Yvette, ville active du Essonne (23 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Bures-sur-Yvette, Gometz-le-Châtel, Orsay.',
+    quartiers: ['Centre-ville', 'Bures-sur-Yvette', 'Gometz-le-Châtel', 'Orsay', 'Les Ulis', 'Saclay', 'Villejust'],
+  },
+  longjumeau: {
+    description: 'Vous habitez à Longjumeau ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Longjumeau, ville active francilienne de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Chilly-Mazarin, Épinay-sur-Orge, Morangis.',
+    quartiers: ['Centre-ville', 'Chilly-Mazarin', 'Épinay-sur-Orge', 'Morangis', 'Ballainvilliers', 'Champlan', 'Saulx-les-Chartreux'],
+  },
+  'saint-michel-sur-orge': {
+    description: 'Vous habitez à Saint-Michel-sur-Orge ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Saint-Michel-sur-Orge, ville active francilienne de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Sainte-Geneviève-des-Bois, Longpont-sur-Orge, Villiers-sur-Orge.',
+    quartiers: ['Centre-ville', 'Sainte-Geneviève-des-Bois', 'Longpont-sur-Orge', 'Villiers-sur-Orge', 'Villemoisson-sur-Orge', 'Montlhéry', 'Le Plessis-Pâté'],
+  },
+  'morsang-sur-orge': {
+    description: 'Morsang-sur-Orge est une ville active de 22 000 habitants située dans le département Essonne en Île-de-France. Nos artisans qualifiés interviennent à Morsang-sur-Orge, ainsi que Villemoisson-sur-Orge, Viry-Châtillon, Sainte-Geneviève-des-Bois pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Villemoisson-sur-Orge', 'Viry-Châtillon', 'Sainte-Geneviève-des-Bois', 'Grigny', 'Épinay-sur-Orge', 'Fleury-Mérogis'],
+  },
+  'chilly-mazarin': {
+    description: 'Artisans référencés à Chilly-Mazarin et ses environs. Cette ville active francilienne de 20 000 habitants en Essonne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Longjumeau, Morangis, Champlan.',
+    quartiers: ['Centre-ville', 'Longjumeau', 'Morangis', 'Champlan', 'Wissous', 'Savigny-sur-Orge', 'Épinay-sur-Orge'],
+  },
+  'juvisy-sur-orge': {
+    description: 'À Juvisy-sur-Orge, commune du Essonne (19 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Savigny-sur-Orge, Athis-Mons, Viry-Châtillon.',
+    quartiers: ['Centre-ville', 'Savigny-sur-Orge', 'Athis-Mons', 'Viry-Châtillon', 'Morangis', 'Paray-Vieille-Poste', 'Grigny'],
+  },
+  orsay: {
+    description: 'Découvrez les meilleurs artisans à Orsay en Essonne. Avec la région parisienne et 16 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Les Ulis, Bures-sur-Yvette, Villejust.',
+    quartiers: ['Centre-ville', 'Les Ulis', 'Bures-sur-Yvette', 'Villejust', 'Villebon-sur-Yvette', 'Palaiseau', 'Gif-sur-Yvette'],
+  },
+  mennecy: {
+    description: 'Vous habitez à Mennecy ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Mennecy, commune francilienne de 16 000 habitants, mérite des professionnels à la hauteur, ainsi que Ormoy, Villabé, Lisses.',
+    quartiers: ['Centre-ville', 'Ormoy', 'Villabé', 'Lisses', 'Le Coudray-Montceaux', 'Corbeil-Essonnes', 'Vert-le-Petit'],
+  },
+  'verrieres-le-buisson': {
+    description: 'Verrières-le-Buisson est une commune de 15 000 habitants située dans le département Essonne en Île-de-France. Nos artisans qualifiés interviennent à Verrières-le-Buisson, ainsi que Igny, Massy, Bièvres pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Igny', 'Massy', 'Bièvres', 'Palaiseau', 'Champlan', 'Wissous'],
+  },
+  morangis: {
+    description: 'Morangis est une commune de 14 000 habitants située dans le département Essonne en Île-de-France. Nos artisans qualifiés interviennent à Morangis, ainsi que Chilly-Mazarin, Savigny-sur-Orge, Longjumeau pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Chilly-Mazarin', 'Savigny-sur-Orge', 'Longjumeau', 'Paray-Vieille-Poste', 'Juvisy-sur-Orge', 'Wissous'],
+  },
+  'fleury-merogis': {
+    description: 'Découvrez les meilleurs artisans à Fleury-Mérogis en Essonne. Avec la région parisienne et 14 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Bondoufle, Morsang-sur-Orge, Grigny.',
+    quartiers: ['Centre-ville', 'Bondoufle', 'Morsang-sur-Orge', 'Grigny', 'Ris-Orangis', 'Sainte-Geneviève-des-Bois', 'Viry-Châtillon'],
+  },
+  'saint-pierre-du-perray': {
+    description: 'Trouvez un artisan de confiance à Saint-Pierre-du-Perray (Essonne). Avec 12 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saintry-sur-Seine, Saint-Germain-lès-Corbeil, Corbeil-Essonnes.',
+    quartiers: ['Centre-ville', 'Saintry-sur-Seine', 'Saint-Germain-lès-Corbeil', 'Corbeil-Essonnes', 'Tigery', 'Étiolles', 'Villabé'],
+  },
+  arpajon: {
+    description: 'À Arpajon, commune du Essonne (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que La Norville, Saint-Germain-lès-Arpajon, Égly.',
+    quartiers: ['Centre-ville', 'La Norville', 'Saint-Germain-lès-Arpajon', 'Égly', 'Ollainville', 'Leuville-sur-Orge', 'Brétigny-sur-Orge'],
+  },
+  'saint-germain-les-arpajon': {
+    description: 'À Saint-Germain-lès-Arpajon, commune du Essonne (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Arpajon, La Norville, Leuville-sur-Orge.',
+    quartiers: ['Centre-ville', 'Arpajon', 'La Norville', 'Leuville-sur-Orge', 'Brétigny-sur-Orge', 'Linas', 'Ollainville'],
+  },
+  'epinay-sous-senart': {
+    description: 'Vous habitez à Épinay-sous-Sénart ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Épinay-sous-Sénart, commune francilienne de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Brunoy, Boussy-Saint-Antoine, Quincy-sous-Sénart.',
+    quartiers: ['Centre-ville', 'Brunoy', 'Boussy-Saint-Antoine', 'Quincy-sous-Sénart', 'Yerres', 'Varennes-Jarcy', 'Montgeron'],
+  },
+  dourdan: {
+    description: 'Dourdan (Essonne, Île-de-France) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Chéron, Forges-les-Bains, Breuillet.',
+    quartiers: ['Centre-ville', 'Saint-Chéron', 'Forges-les-Bains', 'Breuillet', 'Étréchy', 'Limours', 'Briis-sous-Forges'],
+  },
+  igny: {
+    description: 'Vous habitez à Igny ou ses environs ? Nos artisans qualifiés du Essonne sont disponibles pour tous vos travaux. Igny, commune francilienne de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Bièvres, Palaiseau, Verrières-le-Buisson.',
+    quartiers: ['Centre-ville', 'Bièvres', 'Palaiseau', 'Verrières-le-Buisson', 'Massy', 'Saclay', 'Villebon-sur-Yvette'],
+  },
+  bondoufle: {
+    description: 'Découvrez les meilleurs artisans à Bondoufle en Essonne. Avec la région parisienne et 11 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Fleury-Mérogis, Le Plessis-Pâté, Vert-le-Grand.',
+    quartiers: ['Centre-ville', 'Fleury-Mérogis', 'Le Plessis-Pâté', 'Vert-le-Grand', 'Ris-Orangis', 'Évry-Courcouronnes', 'Lisses'],
+  },
+  'epinay-sur-orge': {
+    description: 'À Épinay-sur-Orge, commune du Essonne (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Villemoisson-sur-Orge, Villiers-sur-Orge, Ballainvilliers.',
+    quartiers: ['Centre-ville', 'Villemoisson-sur-Orge', 'Villiers-sur-Orge', 'Ballainvilliers', 'Longjumeau', 'Savigny-sur-Orge', 'Morsang-sur-Orge'],
+  },
+  'villebon-sur-yvette': {
+    description: 'Villebon-sur-Yvette est une commune de 10 000 habitants située dans le département Essonne en Île-de-France. Nos artisans qualifiés interviennent à Villebon-sur-Yvette, ainsi que Palaiseau, Villejust, Saulx-les-Chartreux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Palaiseau', 'Villejust', 'Saulx-les-Chartreux', 'Champlan', 'Orsay', 'Les Ulis'],
+  },
+  montlhery: {
+    description: 'Trouvez des artisans qualifiés à Montlhéry (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  crosne: {
+    description: 'Trouvez des artisans qualifiés à Crosne (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'bures-sur-yvette': {
+    description: 'Trouvez des artisans qualifiés à Bures-sur-Yvette (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'quincy-sous-senart': {
+    description: 'Trouvez des artisans qualifiés à Quincy-sous-Sénart (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  breuillet: {
+    description: 'Trouvez des artisans qualifiés à Breuillet (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  marcoussis: {
+    description: 'Trouvez des artisans qualifiés à Marcoussis (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'paray-vieille-poste': {
+    description: 'Trouvez des artisans qualifiés à Paray-Vieille-Poste (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'ballancourt-sur-essonne': {
+    description: 'Trouvez des artisans qualifiés à Ballancourt-sur-Essonne (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-ville-du-bois': {
+    description: 'Trouvez des artisans qualifiés à La Ville-du-Bois (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'boussy-saint-antoine': {
+    description: 'Trouvez des artisans qualifiés à Boussy-Saint-Antoine (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  linas: {
+    description: 'Trouvez des artisans qualifiés à Linas (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-germain-les-corbeil': {
+    description: 'Trouvez des artisans qualifiés à Saint-Germain-lès-Corbeil (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'soisy-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Soisy-sur-Seine (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lisses: {
+    description: 'Trouvez des artisans qualifiés à Lisses (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'villemoisson-sur-orge': {
+    description: 'Trouvez des artisans qualifiés à Villemoisson-sur-Orge (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  egly: {
+    description: 'Trouvez des artisans qualifiés à Égly (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  wissous: {
+    description: 'Trouvez des artisans qualifiés à Wissous (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  etrechy: {
+    description: 'Trouvez des artisans qualifiés à Étréchy (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  itteville: {
+    description: 'Trouvez des artisans qualifiés à Itteville (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saulx-les-chartreux': {
+    description: 'Trouvez des artisans qualifiés à Saulx-les-Chartreux (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  limours: {
+    description: 'Trouvez des artisans qualifiés à Limours (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'longpont-sur-orge': {
+    description: 'Trouvez des artisans qualifiés à Longpont-sur-Orge (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saintry-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Saintry-sur-Seine (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  villabe: {
+    description: 'Trouvez des artisans qualifiés à Villabé (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marolles-en-hurepoix': {
+    description: 'Trouvez des artisans qualifiés à Marolles-en-Hurepoix (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  lardy: {
+    description: 'Trouvez des artisans qualifiés à Lardy (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ollainville: {
+    description: 'Trouvez des artisans qualifiés à Ollainville (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-cheron': {
+    description: 'Trouvez des artisans qualifiés à Saint-Chéron (Essonne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,132 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'boulogne-billancourt': { description: 'Ville aux portes de Paris, pôle économique.', quartiers: ['Centre-ville', 'Pont de Sèvres', 'République', 'Les Princes', 'Point-du-Jour', 'Silly', 'Parchamp'] },
+  nanterre: {
+    description: 'Préfecture des Hauts-de-Seine, ville universitaire.',
+    quartiers: ['Centre-ville', 'Petit-Nanterre', 'Mont-Valérien', 'Les Provinces', 'Vieux-Pont', 'Parc Sud', 'Chemin de l\'Île'],
+  },
+  'asnieres-sur-seine': {
+    description: 'Asnières-sur-Seine (Hauts-de-Seine, Île-de-France) est une ville importante de 94 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Gennevilliers, Clichy, Bois-Colombes.',
+    quartiers: ['Centre-ville', 'Gennevilliers', 'Clichy', 'Bois-Colombes', 'Levallois-Perret', 'Villeneuve-la-Garenne', 'Colombes'],
+  },
+  colombes: { description: 'Ville résidentielle des Hauts-de-Seine.', quartiers: ['Centre-ville', 'Petit-Colombes', 'Agent-Sarre', 'Grèves', 'Europe', 'Fossés-Jean', 'Stade'] },
+  courbevoie: { description: 'Ville d\'affaires aux portes de La Défense.', quartiers: ['Centre-ville', 'Bécon', 'Faubourg de l\'Arche', 'Marceau', 'Regnault', 'Gambetta', 'Voltaire'] },
+  'rueil-malmaison': { description: 'Ville impériale aux portes de Paris.', quartiers: ['Centre-ville', 'Mont-Valérien', 'Buzenval', 'Jonchère', 'Plaine-Gare', 'Bois-Préau', 'Coteaux'] },
+  'levallois-perret': {
+    description: 'Besoin d’un professionnel à Levallois-Perret ? Située en Île-de-France, cette ville importante du Hauts-de-Seine bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Clichy, Neuilly-sur-Seine, Courbevoie.',
+    quartiers: ['Centre-ville', 'Clichy', 'Neuilly-sur-Seine', 'Courbevoie', 'Asnières-sur-Seine', 'Bois-Colombes', 'La Garenne-Colombes'],
+  },
+  'issy-les-moulineaux': {
+    description: 'Issy-les-Moulineaux (Hauts-de-Seine, Île-de-France) est une ville importante de 68 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Vanves, Boulogne-Billancourt, Malakoff.',
+    quartiers: ['Centre-ville', 'Vanves', 'Boulogne-Billancourt', 'Malakoff', 'Châtillon', 'Clamart', 'Meudon'],
+  },
+  clichy: {
+    description: 'Artisans référencés à Clichy et ses environs. Cette ville importante francilienne de 64 000 habitants en Hauts-de-Seine compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Levallois-Perret, Asnières-sur-Seine, Bois-Colombes.',
+    quartiers: ['Centre-ville', 'Levallois-Perret', 'Asnières-sur-Seine', 'Bois-Colombes', 'Gennevilliers', 'Neuilly-sur-Seine', 'Courbevoie'],
+  },
+  antony: {
+    description: 'Trouvez un artisan de confiance à Antony (Hauts-de-Seine). Avec 64 000 habitants, cette ville importante francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Sceaux, Châtenay-Malabry, Bourg-la-Reine.',
+    quartiers: ['Centre-ville', 'Sceaux', 'Châtenay-Malabry', 'Bourg-la-Reine', 'Fontenay-aux-Roses', 'Le Plessis-Robinson', 'Bagneux'],
+  },
+  'neuilly-sur-seine': {
+    description: 'Besoin d’un professionnel à Neuilly-sur-Seine ? Située en Île-de-France, cette ville importante du Hauts-de-Seine bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Courbevoie, Levallois-Perret, Puteaux.',
+    quartiers: ['Centre-ville', 'Courbevoie', 'Levallois-Perret', 'Puteaux', 'La Garenne-Colombes', 'Bois-Colombes', 'Clichy'],
+  },
+  clamart: { description: 'Ville résidentielle des Hauts-de-Seine.', quartiers: ['Centre-ville', 'Percy', 'Jardin Parisien', 'Plaine'] },
+  gennevilliers: {
+    description: 'Vous habitez à Gennevilliers ou ses environs ? Nos artisans qualifiés du Hauts-de-Seine sont disponibles pour tous vos travaux. Gennevilliers, ville importante francilienne de 51 000 habitants, mérite des professionnels à la hauteur, ainsi que Asnières-sur-Seine, Bois-Colombes, Villeneuve-la-Garenne.',
+    quartiers: ['Centre-ville', 'Asnières-sur-Seine', 'Bois-Colombes', 'Villeneuve-la-Garenne', 'Colombes', 'Clichy', 'Levallois-Perret'],
+  },
+  suresnes: {
+    description: 'Suresnes est une ville dynamique de 49 000 habitants située dans le département Hauts-de-Seine en Île-de-France. Nos artisans qualifiés interviennent à Suresnes, ainsi que Puteaux, Rueil-Malmaison, Nanterre pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Puteaux', 'Rueil-Malmaison', 'Nanterre', 'Saint-Cloud', 'Garches', 'Neuilly-sur-Seine'],
+  },
+  meudon: {
+    description: 'Meudon est une ville dynamique de 46 000 habitants située dans le département Hauts-de-Seine en Île-de-France. Nos artisans qualifiés interviennent à Meudon, ainsi que Clamart, Sèvres, Chaville pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Clamart', 'Sèvres', 'Chaville', 'Le Plessis-Robinson', 'Issy-les-Moulineaux', 'Boulogne-Billancourt'],
+  },
+  montrouge: {
+    description: 'Montrouge est une ville dynamique de 46 000 habitants située dans le département Hauts-de-Seine en Île-de-France. Nos artisans qualifiés interviennent à Montrouge, ainsi que Malakoff, Bagneux, Vanves pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Malakoff', 'Bagneux', 'Vanves', 'Châtillon', 'Fontenay-aux-Roses', 'Bourg-la-Reine'],
+  },
+  bagneux: {
+    description: 'Besoin d’un professionnel à Bagneux ? Située en Île-de-France, cette ville dynamique du Hauts-de-Seine bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Châtillon, Fontenay-aux-Roses, Montrouge.',
+    quartiers: ['Centre-ville', 'Châtillon', 'Fontenay-aux-Roses', 'Montrouge', 'Bourg-la-Reine', 'Malakoff', 'Sceaux'],
+  },
+  puteaux: {
+    description: 'Artisans référencés à Puteaux et ses environs. Cette ville dynamique francilienne de 44 000 habitants en Hauts-de-Seine compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Suresnes, Neuilly-sur-Seine, Courbevoie.',
+    quartiers: ['Centre-ville', 'Suresnes', 'Neuilly-sur-Seine', 'Courbevoie', 'La Garenne-Colombes', 'Nanterre', 'Levallois-Perret'],
+  },
+  chatillon: {
+    description: 'Vous habitez à Châtillon ou ses environs ? Nos artisans qualifiés du Hauts-de-Seine sont disponibles pour tous vos travaux. Châtillon, ville dynamique francilienne de 37 000 habitants, mérite des professionnels à la hauteur, ainsi que Fontenay-aux-Roses, Malakoff, Bagneux.',
+    quartiers: ['Centre-ville', 'Fontenay-aux-Roses', 'Malakoff', 'Bagneux', 'Vanves', 'Montrouge', 'Clamart'],
+  },
+  'chatenay-malabry': {
+    description: 'À Châtenay-Malabry, ville dynamique du Hauts-de-Seine (36 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Le Plessis-Robinson, Sceaux, Clamart.',
+    quartiers: ['Centre-ville', 'Le Plessis-Robinson', 'Sceaux', 'Clamart', 'Fontenay-aux-Roses', 'Antony', 'Châtillon'],
+  },
+  malakoff: {
+    description: 'Trouvez un artisan de confiance à Malakoff (Hauts-de-Seine). Avec 31 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Vanves, Châtillon, Montrouge.',
+    quartiers: ['Centre-ville', 'Vanves', 'Châtillon', 'Montrouge', 'Bagneux', 'Issy-les-Moulineaux', 'Fontenay-aux-Roses'],
+  },
+  'la-garenne-colombes': {
+    description: 'Découvrez les meilleurs artisans à La Garenne-Colombes en Hauts-de-Seine. Avec la région parisienne et 30 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Courbevoie, Colombes, Bois-Colombes.',
+    quartiers: ['Centre-ville', 'Courbevoie', 'Colombes', 'Bois-Colombes', 'Puteaux', 'Neuilly-sur-Seine', 'Nanterre'],
+  },
+  'saint-cloud': {
+    description: 'À Saint-Cloud, ville active du Hauts-de-Seine (30 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Garches, Sèvres, Boulogne-Billancourt.',
+    quartiers: ['Centre-ville', 'Garches', 'Sèvres', 'Boulogne-Billancourt', 'Vaucresson', 'Suresnes', 'Ville-d\'Avray'],
+  },
+  'bois-colombes': {
+    description: 'Découvrez les meilleurs artisans à Bois-Colombes en Hauts-de-Seine. Avec la région parisienne et 29 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Colombes, Asnières-sur-Seine, La Garenne-Colombes.',
+    quartiers: ['Centre-ville', 'Colombes', 'Asnières-sur-Seine', 'La Garenne-Colombes', 'Courbevoie', 'Gennevilliers', 'Levallois-Perret'],
+  },
+  'le-plessis-robinson': {
+    description: 'À Le Plessis-Robinson, ville active du Hauts-de-Seine (29 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Châtenay-Malabry, Clamart, Fontenay-aux-Roses.',
+    quartiers: ['Centre-ville', 'Châtenay-Malabry', 'Clamart', 'Fontenay-aux-Roses', 'Sceaux', 'Châtillon', 'Meudon'],
+  },
+  vanves: {
+    description: 'À Vanves, ville active du Hauts-de-Seine (29 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Malakoff, Issy-les-Moulineaux, Châtillon.',
+    quartiers: ['Centre-ville', 'Malakoff', 'Issy-les-Moulineaux', 'Châtillon', 'Montrouge', 'Bagneux', 'Fontenay-aux-Roses'],
+  },
+  'villeneuve-la-garenne': {
+    description: 'Découvrez les meilleurs artisans à Villeneuve-la-Garenne en Hauts-de-Seine. Avec la région parisienne et 26 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Gennevilliers, Asnières-sur-Seine, Clichy.',
+    quartiers: ['Centre-ville', 'Gennevilliers', 'Asnières-sur-Seine', 'Clichy', 'Bois-Colombes', 'Levallois-Perret', 'Colombes'],
+  },
+  'fontenay-aux-roses': {
+    description: 'Fontenay-aux-Roses est une ville active de 24 000 habitants située dans le département Hauts-de-Seine en Île-de-France. Nos artisans qualifiés interviennent à Fontenay-aux-Roses, ainsi que Châtillon, Sceaux, Bagneux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Châtillon', 'Sceaux', 'Bagneux', 'Le Plessis-Robinson', 'Bourg-la-Reine', 'Clamart'],
+  },
+  sevres: {
+    description: 'À Sèvres, ville active du Hauts-de-Seine (22 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Chaville, Ville-d\'Avray, Saint-Cloud.',
+    quartiers: ['Centre-ville', 'Chaville', 'Ville-d\'Avray', 'Saint-Cloud', 'Meudon', 'Garches', 'Boulogne-Billancourt'],
+  },
+  'bourg-la-reine': {
+    description: 'Trouvez un artisan de confiance à Bourg-la-Reine (Hauts-de-Seine). Avec 21 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Sceaux, Bagneux, Fontenay-aux-Roses.',
+    quartiers: ['Centre-ville', 'Sceaux', 'Bagneux', 'Fontenay-aux-Roses', 'Châtillon', 'Antony', 'Montrouge'],
+  },
+  sceaux: {
+    description: 'Trouvez un artisan de confiance à Sceaux (Hauts-de-Seine). Avec 21 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Bourg-la-Reine, Fontenay-aux-Roses, Bagneux.',
+    quartiers: ['Centre-ville', 'Bourg-la-Reine', 'Fontenay-aux-Roses', 'Bagneux', 'Châtenay-Malabry', 'Le Plessis-Robinson', 'Antony'],
+  },
+  chaville: {
+    description: 'Chaville est une ville active de 21 000 habitants située dans le département Hauts-de-Seine en Île-de-France. Nos artisans qualifiés interviennent à Chaville, ainsi que Ville-d\'Avray, Sèvres, Meudon pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Ville-d\'Avray', 'Sèvres', 'Meudon', 'Vaucresson', 'Saint-Cloud', 'Garches'],
+  },
+  garches: {
+    description: 'Garches (Hauts-de-Seine, Île-de-France) est une commune de 18 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-Cloud, Vaucresson, Rueil-Malmaison.',
+    quartiers: ['Centre-ville', 'Saint-Cloud', 'Vaucresson', 'Rueil-Malmaison', 'Ville-d\'Avray', 'Sèvres', 'Suresnes'],
+  },
+  'ville-d-avray': {
+    description: 'Vous habitez à Ville-d\'Avray ou ses environs ? Nos artisans qualifiés du Hauts-de-Seine sont disponibles pour tous vos travaux. Ville-d\'Avray, commune francilienne de 11 000 habitants, mérite des professionnels à la hauteur, ainsi que Chaville, Vaucresson, Sèvres.',
+    quartiers: ['Centre-ville', 'Chaville', 'Vaucresson', 'Sèvres', 'Garches', 'Saint-Cloud', 'Meudon'],
+  },
+  vaucresson: {
+    description: 'Trouvez des artisans qualifiés à Vaucresson (Hauts-de-Seine). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
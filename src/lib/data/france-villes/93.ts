@@ -0,0 +1,145 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-denis': { description: 'Ville royale avec sa basilique des rois de France.', quartiers: ['Centre-ville', 'Floréal', 'Pleyel', 'Stade de France', 'Franc-Moisin', 'Basilique'] },
+  montreuil: { description: 'Ville créative aux portes de Paris.', quartiers: ['Centre-ville', 'Croix de Chavaux', 'Villiers-Barbusse', 'La Noue', 'Bel-Air'] },
+  aubervilliers: { description: 'Ville de théâtre et culture.', quartiers: ['Centre-ville', 'Quatre Chemins', 'Landy', 'Villette', 'Robespierre', 'Maladrerie', 'Presqu\'île'] },
+  'aulnay-sous-bois': { description: 'Ville verte de Seine-Saint-Denis.', quartiers: ['Centre-ville', 'Rose des Vents', 'Ambourget', 'Chanteloup', 'Gros-Saule', 'Nonneville', 'Mitry'] },
+  'noisy-le-grand': {
+    description: 'Trouvez un artisan de confiance à Noisy-le-Grand (Seine-Saint-Denis). Avec 73 000 habitants, cette ville importante francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Gournay-sur-Marne, Neuilly-sur-Marne, Neuilly-Plaisance.',
+    quartiers: ['Centre-ville', 'Gournay-sur-Marne', 'Neuilly-sur-Marne', 'Neuilly-Plaisance', 'Gagny', 'Rosny-sous-Bois', 'Villemomble'],
+  },
+  drancy: {
+    description: 'Ville mémorielle de Seine-Saint-Denis.',
+    quartiers: ['Centre-ville', 'La Muette', 'Paris-Campagne', 'Village Parisien', 'Économie', 'Avenir Parisien', 'Petit-Drancy'],
+  },
+  'le-blanc-mesnil': {
+    description: 'Découvrez les meilleurs artisans à Le Blanc-Mesnil en Seine-Saint-Denis. Avec la région parisienne et 62 000 habitants, cette ville importante offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Drancy, Le Bourget, Aulnay-sous-Bois.',
+    quartiers: ['Centre-ville', 'Drancy', 'Le Bourget', 'Aulnay-sous-Bois', 'Dugny', 'Bobigny', 'Bondy'],
+  },
+  pantin: { description: 'Ville créative aux portes de Paris.', quartiers: ['Centre-ville', 'Quatre Chemins', 'Église', 'Courtillières'] },
+  bobigny: {
+    description: 'Besoin d’un professionnel à Bobigny ? Située en Île-de-France, cette ville importante du Seine-Saint-Denis bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Drancy, Noisy-le-Sec, Romainville.',
+    quartiers: ['Centre-ville', 'Drancy', 'Noisy-le-Sec', 'Romainville', 'Pantin', 'Bondy', 'Les Lilas'],
+  },
+  'saint-ouen-sur-seine': {
+    description: 'À Saint-Ouen-sur-Seine, ville importante du Seine-Saint-Denis (54 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Saint-Denis, L\'Île-Saint-Denis, Aubervilliers.',
+    quartiers: ['Centre-ville', 'Saint-Denis', 'L\'Île-Saint-Denis', 'Aubervilliers', 'Épinay-sur-Seine', 'Villetaneuse', 'La Courneuve'],
+  },
+  'epinay-sur-seine': {
+    description: 'Besoin d’un professionnel à Épinay-sur-Seine ? Située en Île-de-France, cette ville importante du Seine-Saint-Denis bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que L\'Île-Saint-Denis, Villetaneuse, Saint-Denis.',
+    quartiers: ['Centre-ville', 'L\'Île-Saint-Denis', 'Villetaneuse', 'Saint-Denis', 'Saint-Ouen-sur-Seine', 'Stains', 'La Courneuve'],
+  },
+  sevran: {
+    description: 'Vous habitez à Sevran ou ses environs ? Nos artisans qualifiés du Seine-Saint-Denis sont disponibles pour tous vos travaux. Sevran, ville importante francilienne de 53 000 habitants, mérite des professionnels à la hauteur, ainsi que Villepinte, Livry-Gargan, Aulnay-sous-Bois.',
+    quartiers: ['Centre-ville', 'Villepinte', 'Livry-Gargan', 'Aulnay-sous-Bois', 'Clichy-sous-Bois', 'Vaujours', 'Les Pavillons-sous-Bois'],
+  },
+  bondy: { description: 'Ville dynamique de Seine-Saint-Denis.', quartiers: ['Centre-ville', 'Nord', 'Mainguy', 'Terre Saint-Blaise'] },
+  'livry-gargan': {
+    description: 'À Livry-Gargan, ville dynamique du Seine-Saint-Denis (47 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Clichy-sous-Bois, Sevran, Les Pavillons-sous-Bois.',
+    quartiers: ['Centre-ville', 'Clichy-sous-Bois', 'Sevran', 'Les Pavillons-sous-Bois', 'Le Raincy', 'Coubron', 'Montfermeil'],
+  },
+  'rosny-sous-bois': {
+    description: 'Artisans référencés à Rosny-sous-Bois et ses environs. Cette ville dynamique francilienne de 47 000 habitants en Seine-Saint-Denis compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Neuilly-Plaisance, Villemomble, Noisy-le-Sec.',
+    quartiers: ['Centre-ville', 'Neuilly-Plaisance', 'Villemomble', 'Noisy-le-Sec', 'Montreuil', 'Bondy', 'Le Raincy'],
+  },
+  'la-courneuve': {
+    description: 'Trouvez un artisan de confiance à La Courneuve (Seine-Saint-Denis). Avec 47 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Bourget, Saint-Denis, Aubervilliers.',
+    quartiers: ['Centre-ville', 'Le Bourget', 'Saint-Denis', 'Aubervilliers', 'Dugny', 'Stains', 'Drancy'],
+  },
+  'noisy-le-sec': {
+    description: 'Noisy-le-Sec est une ville dynamique de 46 000 habitants située dans le département Seine-Saint-Denis en Île-de-France. Nos artisans qualifiés interviennent à Noisy-le-Sec, ainsi que Romainville, Bobigny, Bondy pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Romainville', 'Bobigny', 'Bondy', 'Rosny-sous-Bois', 'Les Lilas', 'Montreuil'],
+  },
+  bagnolet: {
+    description: 'Artisans référencés à Bagnolet et ses environs. Cette ville dynamique francilienne de 43 000 habitants en Seine-Saint-Denis compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Les Lilas, Montreuil, Romainville.',
+    quartiers: ['Centre-ville', 'Les Lilas', 'Montreuil', 'Romainville', 'Le Pré-Saint-Gervais', 'Noisy-le-Sec', 'Pantin'],
+  },
+  gagny: {
+    description: 'Découvrez les meilleurs artisans à Gagny en Seine-Saint-Denis. Avec la région parisienne et 42 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Neuilly-sur-Marne, Montfermeil, Le Raincy.',
+    quartiers: ['Centre-ville', 'Neuilly-sur-Marne', 'Montfermeil', 'Le Raincy', 'Villemomble', 'Clichy-sous-Bois', 'Neuilly-Plaisance'],
+  },
+  villepinte: {
+    description: 'Artisans référencés à Villepinte et ses environs. Cette ville dynamique francilienne de 41 000 habitants en Seine-Saint-Denis compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Sevran, Tremblay-en-France, Aulnay-sous-Bois.',
+    quartiers: ['Centre-ville', 'Sevran', 'Tremblay-en-France', 'Aulnay-sous-Bois', 'Livry-Gargan', 'Vaujours', 'Coubron'],
+  },
+  stains: {
+    description: 'Besoin d’un professionnel à Stains ? Située en Île-de-France, cette ville dynamique du Seine-Saint-Denis bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Denis, La Courneuve, Dugny.',
+    quartiers: ['Centre-ville', 'Saint-Denis', 'La Courneuve', 'Dugny', 'Villetaneuse', 'Le Bourget', 'Aubervilliers'],
+  },
+  'neuilly-sur-marne': {
+    description: 'Trouvez un artisan de confiance à Neuilly-sur-Marne (Seine-Saint-Denis). Avec 40 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Gagny, Neuilly-Plaisance, Gournay-sur-Marne.',
+    quartiers: ['Centre-ville', 'Gagny', 'Neuilly-Plaisance', 'Gournay-sur-Marne', 'Villemomble', 'Noisy-le-Grand', 'Le Raincy'],
+  },
+  'tremblay-en-france': {
+    description: 'Artisans référencés à Tremblay-en-France et ses environs. Cette ville dynamique francilienne de 38 000 habitants en Seine-Saint-Denis compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Villepinte, Sevran, Vaujours.',
+    quartiers: ['Centre-ville', 'Villepinte', 'Sevran', 'Vaujours', 'Aulnay-sous-Bois', 'Livry-Gargan', 'Coubron'],
+  },
+  romainville: {
+    description: 'Besoin d’un professionnel à Romainville ? Située en Île-de-France, cette ville dynamique du Seine-Saint-Denis bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Les Lilas, Noisy-le-Sec, Bagnolet.',
+    quartiers: ['Centre-ville', 'Les Lilas', 'Noisy-le-Sec', 'Bagnolet', 'Le Pré-Saint-Gervais', 'Montreuil', 'Bobigny'],
+  },
+  villemomble: {
+    description: 'Villemomble est une ville active de 30 000 habitants située dans le département Seine-Saint-Denis en Île-de-France. Nos artisans qualifiés interviennent à Villemomble, ainsi que Le Raincy, Rosny-sous-Bois, Les Pavillons-sous-Bois pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Le Raincy', 'Rosny-sous-Bois', 'Les Pavillons-sous-Bois', 'Neuilly-Plaisance', 'Bondy', 'Gagny'],
+  },
+  'clichy-sous-bois': {
+    description: 'Clichy-sous-Bois (Seine-Saint-Denis, Île-de-France) est une ville active de 29 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Livry-Gargan, Montfermeil, Le Raincy.',
+    quartiers: ['Centre-ville', 'Livry-Gargan', 'Montfermeil', 'Le Raincy', 'Coubron', 'Les Pavillons-sous-Bois', 'Gagny'],
+  },
+  montfermeil: {
+    description: 'Besoin d’un professionnel à Montfermeil ? Située en Île-de-France, cette ville active du Seine-Saint-Denis bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Clichy-sous-Bois, Coubron, Gagny.',
+    quartiers: ['Centre-ville', 'Clichy-sous-Bois', 'Coubron', 'Gagny', 'Livry-Gargan', 'Le Raincy', 'Vaujours'],
+  },
+  'les-pavillons-sous-bois': {
+    description: 'Les Pavillons-sous-Bois (Seine-Saint-Denis, Île-de-France) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Bondy, Le Raincy, Villemomble.',
+    quartiers: ['Centre-ville', 'Bondy', 'Le Raincy', 'Villemomble', 'Livry-Gargan', 'Clichy-sous-Bois', 'Rosny-sous-Bois'],
+  },
+  'les-lilas': {
+    description: 'Trouvez un artisan de confiance à Les Lilas (Seine-Saint-Denis). Avec 24 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Le Pré-Saint-Gervais, Romainville, Bagnolet.',
+    quartiers: ['Centre-ville', 'Le Pré-Saint-Gervais', 'Romainville', 'Bagnolet', 'Pantin', 'Noisy-le-Sec', 'Montreuil'],
+  },
+  'neuilly-plaisance': {
+    description: 'Vous habitez à Neuilly-Plaisance ou ses environs ? Nos artisans qualifiés du Seine-Saint-Denis sont disponibles pour tous vos travaux. Neuilly-Plaisance, ville active francilienne de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Rosny-sous-Bois, Neuilly-sur-Marne, Villemomble.',
+    quartiers: ['Centre-ville', 'Rosny-sous-Bois', 'Neuilly-sur-Marne', 'Villemomble', 'Gagny', 'Le Raincy', 'Montreuil'],
+  },
+  'le-pre-saint-gervais': {
+    description: 'Découvrez les meilleurs artisans à Le Pré-Saint-Gervais en Seine-Saint-Denis. Avec la région parisienne et 17 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Les Lilas, Pantin, Bagnolet.',
+    quartiers: ['Centre-ville', 'Les Lilas', 'Pantin', 'Bagnolet', 'Romainville', 'Aubervilliers', 'Bobigny'],
+  },
+  'le-bourget': {
+    description: 'Trouvez un artisan de confiance à Le Bourget (Seine-Saint-Denis). Avec 16 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Dugny, Drancy, Le Blanc-Mesnil.',
+    quartiers: ['Centre-ville', 'Dugny', 'Drancy', 'Le Blanc-Mesnil', 'La Courneuve', 'Bobigny', 'Stains'],
+  },
+  'le-raincy': {
+    description: 'Vous habitez à Le Raincy ou ses environs ? Nos artisans qualifiés du Seine-Saint-Denis sont disponibles pour tous vos travaux. Le Raincy, commune francilienne de 15 000 habitants, mérite des professionnels à la hauteur, ainsi que Villemomble, Les Pavillons-sous-Bois, Clichy-sous-Bois.',
+    quartiers: ['Centre-ville', 'Villemomble', 'Les Pavillons-sous-Bois', 'Clichy-sous-Bois', 'Gagny', 'Bondy', 'Livry-Gargan'],
+  },
+  villetaneuse: {
+    description: 'Trouvez un artisan de confiance à Villetaneuse (Seine-Saint-Denis). Avec 13 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Épinay-sur-Seine, L\'Île-Saint-Denis, Saint-Denis.',
+    quartiers: ['Centre-ville', 'Épinay-sur-Seine', 'L\'Île-Saint-Denis', 'Saint-Denis', 'Stains', 'La Courneuve', 'Saint-Ouen-sur-Seine'],
+  },
+  dugny: {
+    description: 'Vous habitez à Dugny ou ses environs ? Nos artisans qualifiés du Seine-Saint-Denis sont disponibles pour tous vos travaux. Dugny, commune francilienne de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Le Bourget, La Courneuve, Le Blanc-Mesnil.',
+    quartiers: ['Centre-ville', 'Le Bourget', 'La Courneuve', 'Le Blanc-Mesnil', 'Stains', 'Drancy', 'Saint-Denis'],
+  },
+  'l-ile-saint-denis': {
+    description: 'Trouvez des artisans qualifiés à L\'Île-Saint-Denis (Seine-Saint-Denis). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  vaujours: {
+    description: 'Trouvez des artisans qualifiés à Vaujours (Seine-Saint-Denis). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'gournay-sur-marne': {
+    description: 'Trouvez des artisans qualifiés à Gournay-sur-Marne (Seine-Saint-Denis). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  coubron: {
+    description: 'Trouvez des artisans qualifiés à Coubron (Seine-Saint-Denis). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
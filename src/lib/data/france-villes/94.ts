@@ -0,0 +1,160 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'vitry-sur-seine': { description: 'Ville d\'art contemporain en bord de Seine.', quartiers: ['Centre-ville', 'Port-à-l\'Anglais', 'Moulin Vert', 'Plateau', 'Commune-de-Paris', 'Gare', 'Coteau'] },
+  creteil: { description: 'Préfecture du Val-de-Marne, ville nouvelle.', quartiers: ['Centre ancien', 'Palais', 'Échat', 'Mont-Mesly', 'Préfecture', 'Lévrière', 'Habette'] },
+  'champigny-sur-marne': { description: 'Ville dynamique en bord de Marne.', quartiers: ['Centre-ville', 'Coeuilly', 'Plant', 'Tremblay', 'Bois-l\'Abbé', 'Musselburgh', 'Mordacs'] },
+  'saint-maur-des-fosses': { description: 'Ville résidentielle en bord de Marne.', quartiers: ['Le Parc', 'La Varenne', 'Saint-Hilaire', 'Champignol', 'Adamville', 'La Pie', 'Les Mûriers'] },
+  'ivry-sur-seine': {
+    description: 'Besoin d’un professionnel à Ivry-sur-Seine ? Située en Île-de-France, cette ville importante du Val-de-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Charenton-le-Pont, Le Kremlin-Bicêtre, Vitry-sur-Seine.',
+    quartiers: ['Centre-ville', 'Charenton-le-Pont', 'Le Kremlin-Bicêtre', 'Vitry-sur-Seine', 'Villejuif', 'Alfortville', 'Gentilly'],
+  },
+  villejuif: {
+    description: 'Besoin d’un professionnel à Villejuif ? Située en Île-de-France, cette ville importante du Val-de-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Le Kremlin-Bicêtre, Cachan, L\'Haÿ-les-Roses.',
+    quartiers: ['Centre-ville', 'Le Kremlin-Bicêtre', 'Cachan', 'L\'Haÿ-les-Roses', 'Arcueil', 'Gentilly', 'Vitry-sur-Seine'],
+  },
+  'maisons-alfort': {
+    description: 'Vous habitez à Maisons-Alfort ou ses environs ? Nos artisans qualifiés du Val-de-Marne sont disponibles pour tous vos travaux. Maisons-Alfort, ville importante francilienne de 57 000 habitants, mérite des professionnels à la hauteur, ainsi que Alfortville, Saint-Maurice, Créteil.',
+    quartiers: ['Centre-ville', 'Alfortville', 'Saint-Maurice', 'Créteil', 'Joinville-le-Pont', 'Charenton-le-Pont', 'Vitry-sur-Seine'],
+  },
+  'fontenay-sous-bois': { description: 'Ville verte du Val-de-Marne.', quartiers: ['Centre-ville', 'Val de Fontenay', 'Rigollots', 'Bois Cadet'] },
+  vincennes: {
+    description: 'Trouvez un artisan de confiance à Vincennes (Val-de-Marne). Avec 48 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Mandé, Fontenay-sous-Bois, Saint-Maurice.',
+    quartiers: ['Centre-ville', 'Saint-Mandé', 'Fontenay-sous-Bois', 'Saint-Maurice', 'Nogent-sur-Marne', 'Charenton-le-Pont', 'Joinville-le-Pont'],
+  },
+  'choisy-le-roi': {
+    description: 'Artisans référencés à Choisy-le-Roi et ses environs. Cette ville dynamique francilienne de 46 000 habitants en Val-de-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Thiais, Orly, Valenton.',
+    quartiers: ['Centre-ville', 'Thiais', 'Orly', 'Valenton', 'Créteil', 'Vitry-sur-Seine', 'Villeneuve-Saint-Georges'],
+  },
+  alfortville: {
+    description: 'Artisans référencés à Alfortville et ses environs. Cette ville dynamique francilienne de 46 000 habitants en Val-de-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Maisons-Alfort, Vitry-sur-Seine, Créteil.',
+    quartiers: ['Centre-ville', 'Maisons-Alfort', 'Vitry-sur-Seine', 'Créteil', 'Saint-Maurice', 'Ivry-sur-Seine', 'Charenton-le-Pont'],
+  },
+  'villeneuve-saint-georges': {
+    description: 'Artisans référencés à Villeneuve-Saint-Georges et ses environs. Cette ville dynamique francilienne de 36 000 habitants en Val-de-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Valenton, Ablon-sur-Seine, Villeneuve-le-Roi.',
+    quartiers: ['Centre-ville', 'Valenton', 'Ablon-sur-Seine', 'Villeneuve-le-Roi', 'Limeil-Brévannes', 'Orly', 'Choisy-le-Roi'],
+  },
+  'le-perreux-sur-marne': {
+    description: 'À Le Perreux-sur-Marne, ville dynamique du Val-de-Marne (35 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Bry-sur-Marne, Nogent-sur-Marne, Fontenay-sous-Bois.',
+    quartiers: ['Centre-ville', 'Bry-sur-Marne', 'Nogent-sur-Marne', 'Fontenay-sous-Bois', 'Champigny-sur-Marne', 'Villiers-sur-Marne', 'Joinville-le-Pont'],
+  },
+  'villiers-sur-marne': {
+    description: 'Trouvez un artisan de confiance à Villiers-sur-Marne (Val-de-Marne). Avec 33 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Bry-sur-Marne, Champigny-sur-Marne, Le Plessis-Trévise.',
+    quartiers: ['Centre-ville', 'Bry-sur-Marne', 'Champigny-sur-Marne', 'Le Plessis-Trévise', 'Le Perreux-sur-Marne', 'Chennevières-sur-Marne', 'Ormesson-sur-Marne'],
+  },
+  thiais: {
+    description: 'Besoin d’un professionnel à Thiais ? Située en Île-de-France, cette ville dynamique du Val-de-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Choisy-le-Roi, Orly, Chevilly-Larue.',
+    quartiers: ['Centre-ville', 'Choisy-le-Roi', 'Orly', 'Chevilly-Larue', 'Rungis', 'Vitry-sur-Seine', 'Villeneuve-le-Roi'],
+  },
+  'nogent-sur-marne': {
+    description: 'Besoin d’un professionnel à Nogent-sur-Marne ? Située en Île-de-France, cette ville dynamique du Val-de-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Fontenay-sous-Bois, Le Perreux-sur-Marne, Joinville-le-Pont.',
+    quartiers: ['Centre-ville', 'Fontenay-sous-Bois', 'Le Perreux-sur-Marne', 'Joinville-le-Pont', 'Bry-sur-Marne', 'Vincennes', 'Saint-Maurice'],
+  },
+  'l-hay-les-roses': {
+    description: 'L\'Haÿ-les-Roses (Val-de-Marne, Île-de-France) est une ville dynamique de 31 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Chevilly-Larue, Cachan, Villejuif.',
+    quartiers: ['Centre-ville', 'Chevilly-Larue', 'Cachan', 'Villejuif', 'Fresnes', 'Arcueil', 'Rungis'],
+  },
+  cachan: {
+    description: 'Découvrez les meilleurs artisans à Cachan en Val-de-Marne. Avec la région parisienne et 31 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Arcueil, L\'Haÿ-les-Roses, Villejuif.',
+    quartiers: ['Centre-ville', 'Arcueil', 'L\'Haÿ-les-Roses', 'Villejuif', 'Gentilly', 'Le Kremlin-Bicêtre', 'Chevilly-Larue'],
+  },
+  fresnes: {
+    description: 'Découvrez les meilleurs artisans à Fresnes en Val-de-Marne. Avec la région parisienne et 30 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Rungis, Chevilly-Larue, L\'Haÿ-les-Roses.',
+    quartiers: ['Centre-ville', 'Rungis', 'Chevilly-Larue', 'L\'Haÿ-les-Roses', 'Cachan', 'Thiais', 'Villejuif'],
+  },
+  'charenton-le-pont': {
+    description: 'Découvrez les meilleurs artisans à Charenton-le-Pont en Val-de-Marne. Avec la région parisienne et 29 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Ivry-sur-Seine, Saint-Mandé, Saint-Maurice.',
+    quartiers: ['Centre-ville', 'Ivry-sur-Seine', 'Saint-Mandé', 'Saint-Maurice', 'Alfortville', 'Maisons-Alfort', 'Vincennes'],
+  },
+  'sucy-en-brie': {
+    description: 'À Sucy-en-Brie, ville active du Val-de-Marne (28 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Noiseau, Ormesson-sur-Marne, Boissy-Saint-Léger.',
+    quartiers: ['Centre-ville', 'Noiseau', 'Ormesson-sur-Marne', 'Boissy-Saint-Léger', 'Chennevières-sur-Marne', 'Bonneuil-sur-Marne', 'Marolles-en-Brie'],
+  },
+  'limeil-brevannes': {
+    description: 'Trouvez un artisan de confiance à Limeil-Brévannes (Val-de-Marne). Avec 27 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Boissy-Saint-Léger, Valenton, Bonneuil-sur-Marne.',
+    quartiers: ['Centre-ville', 'Boissy-Saint-Léger', 'Valenton', 'Bonneuil-sur-Marne', 'Villeneuve-Saint-Georges', 'Villecresnes', 'Sucy-en-Brie'],
+  },
+  orly: {
+    description: 'Découvrez les meilleurs artisans à Orly en Val-de-Marne. Avec la région parisienne et 25 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Villeneuve-le-Roi, Ablon-sur-Seine, Thiais.',
+    quartiers: ['Centre-ville', 'Villeneuve-le-Roi', 'Ablon-sur-Seine', 'Thiais', 'Choisy-le-Roi', 'Villeneuve-Saint-Georges', 'Rungis'],
+  },
+  'le-kremlin-bicetre': {
+    description: 'À Le Kremlin-Bicêtre, ville active du Val-de-Marne (24 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Gentilly, Villejuif, Arcueil.',
+    quartiers: ['Centre-ville', 'Gentilly', 'Villejuif', 'Arcueil', 'Ivry-sur-Seine', 'Cachan', 'Vitry-sur-Seine'],
+  },
+  arcueil: {
+    description: 'Arcueil (Val-de-Marne, Île-de-France) est une ville active de 22 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Gentilly, Cachan, Le Kremlin-Bicêtre.',
+    quartiers: ['Centre-ville', 'Gentilly', 'Cachan', 'Le Kremlin-Bicêtre', 'Villejuif', 'L\'Haÿ-les-Roses', 'Ivry-sur-Seine'],
+  },
+  'le-plessis-trevise': {
+    description: 'Vous habitez à Le Plessis-Trévise ou ses environs ? Nos artisans qualifiés du Val-de-Marne sont disponibles pour tous vos travaux. Le Plessis-Trévise, ville active francilienne de 21 000 habitants, mérite des professionnels à la hauteur, ainsi que Chennevières-sur-Marne, Villiers-sur-Marne, La Queue-en-Brie.',
+    quartiers: ['Centre-ville', 'Chennevières-sur-Marne', 'Villiers-sur-Marne', 'La Queue-en-Brie', 'Ormesson-sur-Marne', 'Noiseau', 'Champigny-sur-Marne'],
+  },
+  'saint-mande': {
+    description: 'Saint-Mandé (Val-de-Marne, Île-de-France) est une ville active de 21 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Vincennes, Charenton-le-Pont, Saint-Maurice.',
+    quartiers: ['Centre-ville', 'Vincennes', 'Charenton-le-Pont', 'Saint-Maurice', 'Ivry-sur-Seine', 'Fontenay-sous-Bois', 'Joinville-le-Pont'],
+  },
+  'villeneuve-le-roi': {
+    description: 'Artisans référencés à Villeneuve-le-Roi et ses environs. Cette ville active francilienne de 21 000 habitants en Val-de-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Orly, Ablon-sur-Seine, Villeneuve-Saint-Georges.',
+    quartiers: ['Centre-ville', 'Orly', 'Ablon-sur-Seine', 'Villeneuve-Saint-Georges', 'Thiais', 'Choisy-le-Roi', 'Valenton'],
+  },
+  'joinville-le-pont': {
+    description: 'Joinville-le-Pont est une ville active de 21 000 habitants située dans le département Val-de-Marne en Île-de-France. Nos artisans qualifiés interviennent à Joinville-le-Pont, ainsi que Saint-Maurice, Nogent-sur-Marne, Saint-Maur-des-Fossés pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Saint-Maurice', 'Nogent-sur-Marne', 'Saint-Maur-des-Fossés', 'Maisons-Alfort', 'Fontenay-sous-Bois', 'Le Perreux-sur-Marne'],
+  },
+  gentilly: {
+    description: 'Gentilly est une commune de 20 000 habitants située dans le département Val-de-Marne en Île-de-France. Nos artisans qualifiés interviennent à Gentilly, ainsi que Arcueil, Le Kremlin-Bicêtre, Cachan pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Arcueil', 'Le Kremlin-Bicêtre', 'Cachan', 'Villejuif', 'Ivry-sur-Seine', 'L\'Haÿ-les-Roses'],
+  },
+  'chevilly-larue': {
+    description: 'Découvrez les meilleurs artisans à Chevilly-Larue en Val-de-Marne. Avec la région parisienne et 20 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que L\'Haÿ-les-Roses, Rungis, Fresnes.',
+    quartiers: ['Centre-ville', 'L\'Haÿ-les-Roses', 'Rungis', 'Fresnes', 'Thiais', 'Villejuif', 'Cachan'],
+  },
+  'chennevieres-sur-marne': {
+    description: 'Trouvez un artisan de confiance à Chennevières-sur-Marne (Val-de-Marne). Avec 19 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ormesson-sur-Marne, Noiseau, Le Plessis-Trévise.',
+    quartiers: ['Centre-ville', 'Ormesson-sur-Marne', 'Noiseau', 'Le Plessis-Trévise', 'Sucy-en-Brie', 'Champigny-sur-Marne', 'La Queue-en-Brie'],
+  },
+  'bry-sur-marne': {
+    description: 'Artisans référencés à Bry-sur-Marne et ses environs. Cette commune francilienne de 19 000 habitants en Val-de-Marne compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Le Perreux-sur-Marne, Villiers-sur-Marne, Champigny-sur-Marne.',
+    quartiers: ['Centre-ville', 'Le Perreux-sur-Marne', 'Villiers-sur-Marne', 'Champigny-sur-Marne', 'Nogent-sur-Marne', 'Fontenay-sous-Bois', 'Joinville-le-Pont'],
+  },
+  'bonneuil-sur-marne': {
+    description: 'À Bonneuil-sur-Marne, commune du Val-de-Marne (18 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Limeil-Brévannes, Saint-Maur-des-Fossés, Sucy-en-Brie.',
+    quartiers: ['Centre-ville', 'Limeil-Brévannes', 'Saint-Maur-des-Fossés', 'Sucy-en-Brie', 'Créteil', 'Valenton', 'Ormesson-sur-Marne'],
+  },
+  'boissy-saint-leger': {
+    description: 'Boissy-Saint-Léger (Val-de-Marne, Île-de-France) est une commune de 17 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Marolles-en-Brie, Limeil-Brévannes, Villecresnes.',
+    quartiers: ['Centre-ville', 'Marolles-en-Brie', 'Limeil-Brévannes', 'Villecresnes', 'Sucy-en-Brie', 'Bonneuil-sur-Marne', 'Santeny'],
+  },
+  'saint-maurice': {
+    description: 'Besoin d’un professionnel à Saint-Maurice ? Située en Île-de-France, cette commune du Val-de-Marne bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Maisons-Alfort, Joinville-le-Pont, Charenton-le-Pont.',
+    quartiers: ['Centre-ville', 'Maisons-Alfort', 'Joinville-le-Pont', 'Charenton-le-Pont', 'Alfortville', 'Saint-Mandé', 'Vincennes'],
+  },
+  valenton: {
+    description: 'Vous habitez à Valenton ou ses environs ? Nos artisans qualifiés du Val-de-Marne sont disponibles pour tous vos travaux. Valenton, commune francilienne de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que Villeneuve-Saint-Georges, Limeil-Brévannes, Choisy-le-Roi.',
+    quartiers: ['Centre-ville', 'Villeneuve-Saint-Georges', 'Limeil-Brévannes', 'Choisy-le-Roi', 'Bonneuil-sur-Marne', 'Créteil', 'Ablon-sur-Seine'],
+  },
+  'la-queue-en-brie': {
+    description: 'Trouvez un artisan de confiance à La Queue-en-Brie (Val-de-Marne). Avec 12 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Noiseau, Le Plessis-Trévise, Chennevières-sur-Marne.',
+    quartiers: ['Centre-ville', 'Noiseau', 'Le Plessis-Trévise', 'Chennevières-sur-Marne', 'Sucy-en-Brie', 'Ormesson-sur-Marne', 'Santeny'],
+  },
+  villecresnes: {
+    description: 'Vous habitez à Villecresnes ou ses environs ? Nos artisans qualifiés du Val-de-Marne sont disponibles pour tous vos travaux. Villecresnes, commune francilienne de 12 000 habitants, mérite des professionnels à la hauteur, ainsi que Mandres-les-Roses, Marolles-en-Brie, Boissy-Saint-Léger.',
+    quartiers: ['Centre-ville', 'Mandres-les-Roses', 'Marolles-en-Brie', 'Boissy-Saint-Léger', 'Périgny', 'Santeny', 'Limeil-Brévannes'],
+  },
+  'ormesson-sur-marne': {
+    description: 'Ormesson-sur-Marne (Val-de-Marne, Île-de-France) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Chennevières-sur-Marne, Noiseau, Sucy-en-Brie.',
+    quartiers: ['Centre-ville', 'Chennevières-sur-Marne', 'Noiseau', 'Sucy-en-Brie', 'Champigny-sur-Marne', 'Saint-Maur-des-Fossés', 'Bonneuil-sur-Marne'],
+  },
+  'ablon-sur-seine': {
+    description: 'Trouvez des artisans qualifiés à Ablon-sur-Seine (Val-de-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  rungis: {
+    description: 'Trouvez des artisans qualifiés à Rungis (Val-de-Marne). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
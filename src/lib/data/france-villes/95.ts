@@ -0,0 +1,229 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  argenteuil: { description: 'Ville aux impressionnistes en bord de Seine.', quartiers: ['Centre-ville', 'Val d\'Argent', 'Orgemont', 'Joliot-Curie'] },
+  cergy: {
+    description: 'Ville nouvelle, préfecture du Val-d\'Oise.',
+    quartiers: ['Centre', 'Grand Centre', 'Axe Majeur', 'Les Hauts de Cergy', 'Cergy-Préfecture', 'Cergy-Village', 'Cergy-Saint-Christophe'],
+  },
+  sarcelles: { description: 'Ville nouvelle du Val-d\'Oise.', quartiers: ['Village', 'Grand Ensemble', 'Lochères', 'Flanades', 'Chardonnerettes', 'Watteau', 'Chantepie'] },
+  'garges-les-gonesse': {
+    description: 'Découvrez les meilleurs artisans à Garges-lès-Gonesse en Val-d\'Oise. Avec la région parisienne et 42 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Arnouville, Sarcelles, Montmagny.',
+    quartiers: ['Centre-ville', 'Arnouville', 'Sarcelles', 'Montmagny', 'Groslay', 'Villiers-le-Bel', 'Gonesse'],
+  },
+  franconville: {
+    description: 'À Franconville, ville dynamique du Val-d\'Oise (38 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Le Plessis-Bouchard, Montigny-lès-Cormeilles, Ermont.',
+    quartiers: ['Centre-ville', 'Le Plessis-Bouchard', 'Montigny-lès-Cormeilles', 'Ermont', 'Cormeilles-en-Parisis', 'Sannois', 'Beauchamp'],
+  },
+  bezons: {
+    description: 'Trouvez un artisan de confiance à Bezons (Val-d\'Oise). Avec 36 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Argenteuil, Cormeilles-en-Parisis, Sannois.',
+    quartiers: ['Centre-ville', 'Argenteuil', 'Cormeilles-en-Parisis', 'Sannois', 'La Frette-sur-Seine', 'Saint-Gratien', 'Franconville'],
+  },
+  pontoise: {
+    description: 'Trouvez un artisan de confiance à Pontoise (Val-d\'Oise). Avec 32 000 habitants, cette ville dynamique francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Ouen-l\'Aumône, Éragny, Ennery.',
+    quartiers: ['Centre-ville', 'Saint-Ouen-l\'Aumône', 'Éragny', 'Ennery', 'Osny', 'Cergy', 'Neuville-sur-Oise'],
+  },
+  'herblay-sur-seine': {
+    description: 'Vous habitez à Herblay-sur-Seine ou ses environs ? Nos artisans qualifiés du Val-d\'Oise sont disponibles pour tous vos travaux. Herblay-sur-Seine, ville dynamique francilienne de 32 000 habitants, mérite des professionnels à la hauteur, ainsi que Pierrelaye, Beauchamp, Montigny-lès-Cormeilles.',
+    quartiers: ['Centre-ville', 'Pierrelaye', 'Beauchamp', 'Montigny-lès-Cormeilles', 'La Frette-sur-Seine', 'Éragny', 'Bessancourt'],
+  },
+  goussainville: {
+    description: 'Goussainville (Val-d\'Oise, Île-de-France) est une ville dynamique de 31 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Thillay, Fontenay-en-Parisis, Louvres.',
+    quartiers: ['Centre-ville', 'Le Thillay', 'Fontenay-en-Parisis', 'Louvres', 'Roissy-en-France', 'Gonesse', 'Puiseux-en-France'],
+  },
+  'villiers-le-bel': {
+    description: 'Villiers-le-Bel est une ville dynamique de 30 000 habitants située dans le département Val-d\'Oise en Île-de-France. Nos artisans qualifiés interviennent à Villiers-le-Bel, ainsi que Sarcelles, Écouen, Arnouville pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sarcelles', 'Écouen', 'Arnouville', 'Garges-lès-Gonesse', 'Saint-Brice-sous-Forêt', 'Ézanville'],
+  },
+  ermont: {
+    description: 'Ermont (Val-d\'Oise, Île-de-France) est une ville active de 29 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Eaubonne, Sannois, Le Plessis-Bouchard.',
+    quartiers: ['Centre-ville', 'Eaubonne', 'Sannois', 'Le Plessis-Bouchard', 'Franconville', 'Margency', 'Saint-Gratien'],
+  },
+  gonesse: {
+    description: 'Artisans référencés à Gonesse et ses environs. Cette ville active francilienne de 28 000 habitants en Val-d\'Oise compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Le Thillay, Arnouville, Garges-lès-Gonesse.',
+    quartiers: ['Centre-ville', 'Le Thillay', 'Arnouville', 'Garges-lès-Gonesse', 'Goussainville', 'Roissy-en-France', 'Villiers-le-Bel'],
+  },
+  taverny: {
+    description: 'Trouvez un artisan de confiance à Taverny (Val-d\'Oise). Avec 28 000 habitants, cette ville active francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Bessancourt, Saint-Leu-la-Forêt, Beauchamp.',
+    quartiers: ['Centre-ville', 'Bessancourt', 'Saint-Leu-la-Forêt', 'Beauchamp', 'Frépillon', 'Le Plessis-Bouchard', 'Pierrelaye'],
+  },
+  'cormeilles-en-parisis': {
+    description: 'Vous habitez à Cormeilles-en-Parisis ou ses environs ? Nos artisans qualifiés du Val-d\'Oise sont disponibles pour tous vos travaux. Cormeilles-en-Parisis, ville active francilienne de 27 000 habitants, mérite des professionnels à la hauteur, ainsi que La Frette-sur-Seine, Franconville, Montigny-lès-Cormeilles.',
+    quartiers: ['Centre-ville', 'La Frette-sur-Seine', 'Franconville', 'Montigny-lès-Cormeilles', 'Sannois', 'Argenteuil', 'Le Plessis-Bouchard'],
+  },
+  sannois: {
+    description: 'À Sannois, ville active du Val-d\'Oise (27 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Ermont, Saint-Gratien, Argenteuil.',
+    quartiers: ['Centre-ville', 'Ermont', 'Saint-Gratien', 'Argenteuil', 'Franconville', 'Eaubonne', 'Le Plessis-Bouchard'],
+  },
+  eaubonne: {
+    description: 'Eaubonne (Val-d\'Oise, Île-de-France) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Margency, Ermont, Soisy-sous-Montmorency.',
+    quartiers: ['Centre-ville', 'Margency', 'Ermont', 'Soisy-sous-Montmorency', 'Saint-Gratien', 'Andilly', 'Montlignon'],
+  },
+  'saint-ouen-l-aumone': {
+    description: 'Saint-Ouen-l\'Aumône (Val-d\'Oise, Île-de-France) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Pontoise, Méry-sur-Oise, Éragny.',
+    quartiers: ['Centre-ville', 'Pontoise', 'Méry-sur-Oise', 'Éragny', 'Ennery', 'Pierrelaye', 'Herblay-sur-Seine'],
+  },
+  'deuil-la-barre': {
+    description: 'Découvrez les meilleurs artisans à Deuil-la-Barre en Val-d\'Oise. Avec la région parisienne et 23 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Montmagny, Enghien-les-Bains, Groslay.',
+    quartiers: ['Centre-ville', 'Montmagny', 'Enghien-les-Bains', 'Groslay', 'Montmorency', 'Soisy-sous-Montmorency', 'Saint-Gratien'],
+  },
+  'montigny-les-cormeilles': {
+    description: 'Montigny-lès-Cormeilles (Val-d\'Oise, Île-de-France) est une ville active de 22 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Beauchamp, Franconville, La Frette-sur-Seine.',
+    quartiers: ['Centre-ville', 'Beauchamp', 'Franconville', 'La Frette-sur-Seine', 'Cormeilles-en-Parisis', 'Herblay-sur-Seine', 'Le Plessis-Bouchard'],
+  },
+  montmorency: {
+    description: 'À Montmorency, ville active du Val-d\'Oise (22 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Soisy-sous-Montmorency, Saint-Brice-sous-Forêt, Groslay.',
+    quartiers: ['Centre-ville', 'Soisy-sous-Montmorency', 'Saint-Brice-sous-Forêt', 'Groslay', 'Andilly', 'Deuil-la-Barre', 'Margency'],
+  },
+  'saint-gratien': {
+    description: 'Découvrez les meilleurs artisans à Saint-Gratien en Val-d\'Oise. Avec la région parisienne et 21 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Enghien-les-Bains, Sannois, Soisy-sous-Montmorency.',
+    quartiers: ['Centre-ville', 'Enghien-les-Bains', 'Sannois', 'Soisy-sous-Montmorency', 'Eaubonne', 'Ermont', 'Deuil-la-Barre'],
+  },
+  eragny: {
+    description: 'Besoin d’un professionnel à Éragny ? Située en Île-de-France, cette commune du Val-d\'Oise bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Neuville-sur-Oise, Pontoise, Saint-Ouen-l\'Aumône.',
+    quartiers: ['Centre-ville', 'Neuville-sur-Oise', 'Pontoise', 'Saint-Ouen-l\'Aumône', 'Cergy', 'Herblay-sur-Seine', 'Pierrelaye'],
+  },
+  'soisy-sous-montmorency': {
+    description: 'Découvrez les meilleurs artisans à Soisy-sous-Montmorency en Val-d\'Oise. Avec la région parisienne et 18 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Montmorency, Eaubonne, Margency.',
+    quartiers: ['Centre-ville', 'Montmorency', 'Eaubonne', 'Margency', 'Enghien-les-Bains', 'Andilly', 'Saint-Gratien'],
+  },
+  osny: {
+    description: 'Trouvez un artisan de confiance à Osny (Val-d\'Oise). Avec 18 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Boissy-l\'Aillerie, Pontoise, Cergy.',
+    quartiers: ['Centre-ville', 'Boissy-l\'Aillerie', 'Pontoise', 'Cergy', 'Ennery', 'Vauréal', 'Courdimanche'],
+  },
+  'jouy-le-moutier': {
+    description: 'Vous habitez à Jouy-le-Moutier ou ses environs ? Nos artisans qualifiés du Val-d\'Oise sont disponibles pour tous vos travaux. Jouy-le-Moutier, commune francilienne de 18 000 habitants, mérite des professionnels à la hauteur, ainsi que Neuville-sur-Oise, Vauréal, Cergy.',
+    quartiers: ['Centre-ville', 'Neuville-sur-Oise', 'Vauréal', 'Cergy', 'Courdimanche', 'Menucourt', 'Éragny'],
+  },
+  'saint-leu-la-foret': {
+    description: 'Découvrez les meilleurs artisans à Saint-Leu-la-Forêt en Val-d\'Oise. Avec la région parisienne et 16 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Taverny, Le Plessis-Bouchard, Saint-Prix.',
+    quartiers: ['Centre-ville', 'Taverny', 'Le Plessis-Bouchard', 'Saint-Prix', 'Montlignon', 'Bessancourt', 'Beauchamp'],
+  },
+  vaureal: {
+    description: 'Artisans référencés à Vauréal et ses environs. Cette commune francilienne de 16 000 habitants en Val-d\'Oise compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Cergy, Jouy-le-Moutier, Courdimanche.',
+    quartiers: ['Centre-ville', 'Cergy', 'Jouy-le-Moutier', 'Courdimanche', 'Neuville-sur-Oise', 'Menucourt', 'Osny'],
+  },
+  domont: {
+    description: 'Trouvez un artisan de confiance à Domont (Val-d\'Oise). Avec 16 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Bouffémont, Andilly, Ézanville.',
+    quartiers: ['Centre-ville', 'Bouffémont', 'Andilly', 'Ézanville', 'Montlignon', 'Saint-Brice-sous-Forêt', 'Baillet-en-France'],
+  },
+  montmagny: {
+    description: 'Besoin d’un professionnel à Montmagny ? Située en Île-de-France, cette commune du Val-d\'Oise bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Deuil-la-Barre, Groslay, Enghien-les-Bains.',
+    quartiers: ['Centre-ville', 'Deuil-la-Barre', 'Groslay', 'Enghien-les-Bains', 'Montmorency', 'Sarcelles', 'Saint-Brice-sous-Forêt'],
+  },
+  'saint-brice-sous-foret': {
+    description: 'Besoin d’un professionnel à Saint-Brice-sous-Forêt ? Située en Île-de-France, cette commune du Val-d\'Oise bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Groslay, Montmorency, Sarcelles.',
+    quartiers: ['Centre-ville', 'Groslay', 'Montmorency', 'Sarcelles', 'Domont', 'Andilly', 'Soisy-sous-Montmorency'],
+  },
+  arnouville: {
+    description: 'Trouvez un artisan de confiance à Arnouville (Val-d\'Oise). Avec 15 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Garges-lès-Gonesse, Sarcelles, Villiers-le-Bel.',
+    quartiers: ['Centre-ville', 'Garges-lès-Gonesse', 'Sarcelles', 'Villiers-le-Bel', 'Gonesse', 'Le Thillay', 'Groslay'],
+  },
+  persan: {
+    description: 'Trouvez un artisan de confiance à Persan (Val-d\'Oise). Avec 14 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Beaumont-sur-Oise, Champagne-sur-Oise, Bernes-sur-Oise.',
+    quartiers: ['Centre-ville', 'Beaumont-sur-Oise', 'Champagne-sur-Oise', 'Bernes-sur-Oise', 'Presles', 'L\'Isle-Adam', 'Bruyères-sur-Oise'],
+  },
+  louvres: {
+    description: 'Louvres est une commune de 13 000 habitants située dans le département Val-d\'Oise en Île-de-France. Nos artisans qualifiés interviennent à Louvres, ainsi que Puiseux-en-France, Goussainville, Fontenay-en-Parisis pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Puiseux-en-France', 'Goussainville', 'Fontenay-en-Parisis', 'Marly-la-Ville', 'Roissy-en-France', 'Le Thillay'],
+  },
+  'l-isle-adam': {
+    description: 'L\'Isle-Adam est une commune de 12 000 habitants située dans le département Val-d\'Oise en Île-de-France. Nos artisans qualifiés interviennent à L\'Isle-Adam, ainsi que Parmain, Mériel, Presles pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Parmain', 'Mériel', 'Presles', 'Champagne-sur-Oise', 'Butry-sur-Oise', 'Persan'],
+  },
+  'enghien-les-bains': {
+    description: 'Trouvez un artisan de confiance à Enghien-les-Bains (Val-d\'Oise). Avec 11 000 habitants, cette commune francilienne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Gratien, Deuil-la-Barre, Soisy-sous-Montmorency.',
+    quartiers: ['Centre-ville', 'Saint-Gratien', 'Deuil-la-Barre', 'Soisy-sous-Montmorency', 'Montmorency', 'Eaubonne', 'Montmagny'],
+  },
+  fosses: {
+    description: 'À Fosses, commune du Val-d\'Oise (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour le dynamisme économique, nos professionnels interviennent dans toute la commune, ainsi que Marly-la-Ville, Survilliers, Puiseux-en-France.',
+    quartiers: ['Centre-ville', 'Marly-la-Ville', 'Survilliers', 'Puiseux-en-France', 'Saint-Witz', 'Luzarches', 'Chaumontel'],
+  },
+  'beaumont-sur-oise': {
+    description: 'Vous habitez à Beaumont-sur-Oise ou ses environs ? Nos artisans qualifiés du Val-d\'Oise sont disponibles pour tous vos travaux. Beaumont-sur-Oise, commune francilienne de 10 000 habitants, mérite des professionnels à la hauteur, ainsi que Persan, Presles, Bernes-sur-Oise.',
+    quartiers: ['Centre-ville', 'Persan', 'Presles', 'Bernes-sur-Oise', 'Bruyères-sur-Oise', 'Champagne-sur-Oise', 'Saint-Martin-du-Tertre'],
+  },
+  pierrelaye: {
+    description: 'Besoin d’un professionnel à Pierrelaye ? Située en Île-de-France, cette commune du Val-d\'Oise bénéficie de un habitat dense nécessitant des artisans réactifs. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Herblay-sur-Seine, Beauchamp, Bessancourt.',
+    quartiers: ['Centre-ville', 'Herblay-sur-Seine', 'Beauchamp', 'Bessancourt', 'Montigny-lès-Cormeilles', 'Méry-sur-Oise', 'Saint-Ouen-l\'Aumône'],
+  },
+  'mery-sur-oise': {
+    description: 'Trouvez des artisans qualifiés à Méry-sur-Oise (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ezanville: {
+    description: 'Trouvez des artisans qualifiés à Ézanville (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  beauchamp: {
+    description: 'Trouvez des artisans qualifiés à Beauchamp (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bessancourt: {
+    description: 'Trouvez des artisans qualifiés à Bessancourt (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-plessis-bouchard': {
+    description: 'Trouvez des artisans qualifiés à Le Plessis-Bouchard (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  groslay: {
+    description: 'Trouvez des artisans qualifiés à Groslay (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-prix': {
+    description: 'Trouvez des artisans qualifiés à Saint-Prix (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  courdimanche: {
+    description: 'Trouvez des artisans qualifiés à Courdimanche (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  ecouen: {
+    description: 'Trouvez des artisans qualifiés à Écouen (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'auvers-sur-oise': {
+    description: 'Trouvez des artisans qualifiés à Auvers-sur-Oise (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bouffemont: {
+    description: 'Trouvez des artisans qualifiés à Bouffémont (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  menucourt: {
+    description: 'Trouvez des artisans qualifiés à Menucourt (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'marly-la-ville': {
+    description: 'Trouvez des artisans qualifiés à Marly-la-Ville (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'magny-en-vexin': {
+    description: 'Trouvez des artisans qualifiés à Magny-en-Vexin (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  parmain: {
+    description: 'Trouvez des artisans qualifiés à Parmain (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  viarmes: {
+    description: 'Trouvez des artisans qualifiés à Viarmes (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  meriel: {
+    description: 'Trouvez des artisans qualifiés à Mériel (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'champagne-sur-oise': {
+    description: 'Trouvez des artisans qualifiés à Champagne-sur-Oise (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  luzarches: {
+    description: 'Trouvez des artisans qualifiés à Luzarches (Val-d\'Oise). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,99 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'les-abymes': {
+    description: 'Les Abymes (Guadeloupe, Guadeloupe) est une ville importante de 51 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Gosier, Pointe-à-Pitre, Morne-à-l\'Eau.',
+    quartiers: ['Centre-ville', 'Le Gosier', 'Pointe-à-Pitre', 'Morne-à-l\'Eau', 'Baie-Mahault', 'Sainte-Anne', 'Petit-Canal'],
+  },
+  'baie-mahault': {
+    description: 'Besoin d’un professionnel à Baie-Mahault ? Située en Guadeloupe, cette ville dynamique du Guadeloupe bénéficie de des besoins spécifiques en construction cyclonique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Pointe-à-Pitre, Lamentin, Sainte-Rose.',
+    quartiers: ['Centre-ville', 'Pointe-à-Pitre', 'Lamentin', 'Sainte-Rose', 'Les Abymes', 'Petit-Bourg', 'Morne-à-l\'Eau'],
+  },
+  'le-gosier': {
+    description: 'Besoin d’un professionnel à Le Gosier ? Située en Guadeloupe, cette ville active du Guadeloupe bénéficie de des besoins spécifiques en construction cyclonique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Les Abymes, Pointe-à-Pitre, Sainte-Anne.',
+    quartiers: ['Centre-ville', 'Les Abymes', 'Pointe-à-Pitre', 'Sainte-Anne', 'Morne-à-l\'Eau', 'Baie-Mahault', 'Le Moule'],
+  },
+  'petit-bourg': {
+    description: 'Besoin d’un professionnel à Petit-Bourg ? Située en Guadeloupe, cette ville active du Guadeloupe bénéficie de des besoins spécifiques en construction cyclonique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Goyave, Lamentin, Baie-Mahault.',
+    quartiers: ['Centre-ville', 'Goyave', 'Lamentin', 'Baie-Mahault', 'Bouillante', 'Vieux-Habitants', 'Pointe-Noire'],
+  },
+  'sainte-anne': {
+    description: 'À Sainte-Anne, ville active du Guadeloupe (24 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un climat tropical, nos professionnels interviennent dans toute la commune, ainsi que Le Moule, Le Gosier, Les Abymes.',
+    quartiers: ['Centre-ville', 'Le Moule', 'Le Gosier', 'Les Abymes', 'Morne-à-l\'Eau', 'Saint-François', 'Pointe-à-Pitre'],
+  },
+  'le-moule': {
+    description: 'À Le Moule, ville active du Guadeloupe (23 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un climat tropical, nos professionnels interviennent dans toute la commune, ainsi que Sainte-Anne, Petit-Canal, Saint-François.',
+    quartiers: ['Centre-ville', 'Sainte-Anne', 'Petit-Canal', 'Saint-François', 'Morne-à-l\'Eau', 'Les Abymes', 'Port-Louis'],
+  },
+  lamentin: {
+    description: 'Lamentin est une commune de 19 000 habitants située dans le département Guadeloupe en Guadeloupe. Nos artisans qualifiés interviennent à Lamentin, ainsi que Sainte-Rose, Baie-Mahault, Petit-Bourg pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sainte-Rose', 'Baie-Mahault', 'Petit-Bourg', 'Pointe-Noire', 'Pointe-à-Pitre', 'Goyave'],
+  },
+  'sainte-rose': {
+    description: 'Besoin d’un professionnel à Sainte-Rose ? Située en Guadeloupe, cette commune du Guadeloupe bénéficie de des besoins spécifiques en construction cyclonique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Lamentin, Baie-Mahault, Deshaies.',
+    quartiers: ['Centre-ville', 'Lamentin', 'Baie-Mahault', 'Deshaies', 'Pointe-Noire', 'Petit-Bourg', 'Pointe-à-Pitre'],
+  },
+  'capesterre-belle-eau': {
+    description: 'Vous habitez à Capesterre-Belle-Eau ou ses environs ? Nos artisans qualifiés du Guadeloupe sont disponibles pour tous vos travaux. Capesterre-Belle-Eau, commune guadeloupéenne de 18 000 habitants, mérite des professionnels à la hauteur, ainsi que Trois-Rivières, Saint-Claude, Goyave.',
+    quartiers: ['Centre-ville', 'Trois-Rivières', 'Saint-Claude', 'Goyave', 'Gourbeyre', 'Baillif', 'Vieux-Habitants'],
+  },
+  'morne-a-l-eau': {
+    description: 'Trouvez un artisan de confiance à Morne-à-l\'Eau (Guadeloupe). Avec 16 000 habitants, cette commune guadeloupéenne dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Les Abymes, Petit-Canal, Pointe-à-Pitre.',
+    quartiers: ['Centre-ville', 'Les Abymes', 'Petit-Canal', 'Pointe-à-Pitre', 'Le Gosier', 'Port-Louis', 'Baie-Mahault'],
+  },
+  'pointe-a-pitre': {
+    description: 'Pointe-à-Pitre (Guadeloupe, Guadeloupe) est une commune de 15 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Les Abymes, Baie-Mahault, Le Gosier.',
+    quartiers: ['Centre-ville', 'Les Abymes', 'Baie-Mahault', 'Le Gosier', 'Morne-à-l\'Eau', 'Lamentin', 'Petit-Bourg'],
+  },
+  'saint-francois': {
+    description: 'Saint-François (Guadeloupe, Guadeloupe) est une commune de 14 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Le Moule, Sainte-Anne, Le Gosier.',
+    quartiers: ['Centre-ville', 'Le Moule', 'Sainte-Anne', 'Le Gosier', 'Petit-Canal'],
+  },
+  'saint-claude': {
+    description: 'Besoin d’un professionnel à Saint-Claude ? Située en Guadeloupe, cette commune du Guadeloupe bénéficie de des besoins spécifiques en construction cyclonique. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Baillif, Gourbeyre, Vieux-Habitants.',
+    quartiers: ['Centre-ville', 'Baillif', 'Gourbeyre', 'Vieux-Habitants', 'Basse-Terre', 'Trois-Rivières', 'Capesterre-Belle-Eau'],
+  },
+  'basse-terre': {
+    description: 'Trouvez des artisans qualifiés à Basse-Terre (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'petit-canal': {
+    description: 'Trouvez des artisans qualifiés à Petit-Canal (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  goyave: {
+    description: 'Trouvez des artisans qualifiés à Goyave (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'trois-rivieres': {
+    description: 'Trouvez des artisans qualifiés à Trois-Rivières (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  gourbeyre: {
+    description: 'Trouvez des artisans qualifiés à Gourbeyre (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'vieux-habitants': {
+    description: 'Trouvez des artisans qualifiés à Vieux-Habitants (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bouillante: {
+    description: 'Trouvez des artisans qualifiés à Bouillante (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'pointe-noire': {
+    description: 'Trouvez des artisans qualifiés à Pointe-Noire (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'port-louis': {
+    description: 'Trouvez des artisans qualifiés à Port-Louis (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  baillif: {
+    description: 'Trouvez des artisans qualifiés à Baillif (Guadeloupe). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
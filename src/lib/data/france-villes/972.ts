@@ -0,0 +1,75 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'fort-de-france': {
+    description: 'Fort-de-France (Martinique, Martinique) est une ville importante de 76 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Schœlcher, Saint-Joseph, Case-Pilote.',
+    quartiers: ['Centre-ville', 'Schœlcher', 'Saint-Joseph', 'Case-Pilote', 'Gros-Morne', 'Le Lamentin', 'Le Carbet'],
+  },
+  'le-lamentin': {
+    description: 'Trouvez un artisan de confiance à Le Lamentin (Martinique). Avec 39 000 habitants, cette ville dynamique martiniquaise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ducos, Saint-Joseph, Fort-de-France.',
+    quartiers: ['Centre-ville', 'Ducos', 'Saint-Joseph', 'Fort-de-France', 'Le Robert', 'Saint-Esprit', 'Le François'],
+  },
+  'le-robert': {
+    description: 'Vous habitez à Le Robert ou ses environs ? Nos artisans qualifiés du Martinique sont disponibles pour tous vos travaux. Le Robert, ville active martiniquaise de 22 000 habitants, mérite des professionnels à la hauteur, ainsi que Le François, La Trinité, Le Lamentin.',
+    quartiers: ['Centre-ville', 'Le François', 'La Trinité', 'Le Lamentin', 'Gros-Morne', 'Ducos', 'Saint-Joseph'],
+  },
+  'sch-lcher': {
+    description: 'Vous habitez à Schœlcher ou ses environs ? Nos artisans qualifiés du Martinique sont disponibles pour tous vos travaux. Schœlcher, commune martiniquaise de 19 000 habitants, mérite des professionnels à la hauteur, ainsi que Case-Pilote, Fort-de-France, Saint-Joseph.',
+    quartiers: ['Centre-ville', 'Case-Pilote', 'Fort-de-France', 'Saint-Joseph', 'Le Carbet', 'Gros-Morne', 'Le Lamentin'],
+  },
+  ducos: {
+    description: 'Découvrez les meilleurs artisans à Ducos en Martinique. Avec les Caraïbes et 18 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Esprit, Le Lamentin, Rivière-Salée.',
+    quartiers: ['Centre-ville', 'Saint-Esprit', 'Le Lamentin', 'Rivière-Salée', 'Le François', 'Les Trois-Îlets', 'Sainte-Luce'],
+  },
+  'le-francois': {
+    description: 'Besoin d’un professionnel à Le François ? Située en Martinique, cette commune du Martinique bénéficie de des artisans spécialisés en climat tropical. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Esprit, Le Robert, Ducos.',
+    quartiers: ['Centre-ville', 'Saint-Esprit', 'Le Robert', 'Ducos', 'Le Vauclin', 'Le Lamentin', 'Rivière-Salée'],
+  },
+  'riviere-salee': {
+    description: 'Artisans référencés à Rivière-Salée et ses environs. Cette commune martiniquaise de 12 000 habitants en Martinique compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Sainte-Luce, Saint-Esprit, Ducos.',
+    quartiers: ['Centre-ville', 'Sainte-Luce', 'Saint-Esprit', 'Ducos', 'Rivière-Pilote', 'Le Diamant', 'Les Trois-Îlets'],
+  },
+  'riviere-pilote': {
+    description: 'À Rivière-Pilote, commune du Martinique (12 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture créole, nos professionnels interviennent dans toute la commune, ainsi que Le Marin, Sainte-Luce, Le Vauclin.',
+    quartiers: ['Centre-ville', 'Le Marin', 'Sainte-Luce', 'Le Vauclin', 'Saint-Esprit', 'Rivière-Salée', 'Sainte-Anne'],
+  },
+  'la-trinite': {
+    description: 'La Trinité est une commune de 11 000 habitants située dans le département Martinique en Martinique. Nos artisans qualifiés interviennent à La Trinité, ainsi que Sainte-Marie, Le Robert, Gros-Morne pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Sainte-Marie', 'Le Robert', 'Gros-Morne', 'Le Marigot', 'Saint-Joseph', 'Le Lorrain'],
+  },
+  'saint-esprit': {
+    description: 'À Saint-Esprit, commune du Martinique (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une architecture créole, nos professionnels interviennent dans toute la commune, ainsi que Ducos, Rivière-Salée, Le François.',
+    quartiers: ['Centre-ville', 'Ducos', 'Rivière-Salée', 'Le François', 'Rivière-Pilote', 'Le Vauclin', 'Sainte-Luce'],
+  },
+  'gros-morne': {
+    description: 'Trouvez des artisans qualifiés à Gros-Morne (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'sainte-luce': {
+    description: 'Trouvez des artisans qualifiés à Sainte-Luce (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-marin': {
+    description: 'Trouvez des artisans qualifiés à Le Marin (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-vauclin': {
+    description: 'Trouvez des artisans qualifiés à Le Vauclin (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-lorrain': {
+    description: 'Trouvez des artisans qualifiés à Le Lorrain (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-trois-ilets': {
+    description: 'Trouvez des artisans qualifiés à Les Trois-Îlets (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'le-diamant': {
+    description: 'Trouvez des artisans qualifiés à Le Diamant (Martinique). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
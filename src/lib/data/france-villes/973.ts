@@ -0,0 +1,51 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  cayenne: {
+    description: 'À Cayenne, ville importante du Guyane (63 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un climat équatorial, nos professionnels interviennent dans toute la commune, ainsi que Remire-Montjoly, Matoury, Macouria.',
+    quartiers: ['Centre-ville', 'Remire-Montjoly', 'Matoury', 'Macouria', 'Montsinéry-Tonnegrande'],
+  },
+  'saint-laurent-du-maroni': {
+    description: 'Saint-Laurent-du-Maroni est une ville importante de 54 000 habitants située dans le département Guyane en Guyane. Nos artisans qualifiés interviennent à Saint-Laurent-du-Maroni, ainsi que Apatou pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Apatou'],
+  },
+  matoury: {
+    description: 'Trouvez un artisan de confiance à Matoury (Guyane). Avec 37 000 habitants, cette ville dynamique guyanaise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Remire-Montjoly, Cayenne, Montsinéry-Tonnegrande.',
+    quartiers: ['Centre-ville', 'Remire-Montjoly', 'Cayenne', 'Montsinéry-Tonnegrande', 'Macouria'],
+  },
+  'remire-montjoly': {
+    description: 'Remire-Montjoly (Guyane, Guyane) est une ville active de 28 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Cayenne, Matoury.',
+    quartiers: ['Centre-ville', 'Cayenne', 'Matoury'],
+  },
+  kourou: {
+    description: 'Kourou (Guyane, Guyane) est une ville active de 25 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide.',
+    quartiers: ['Centre-ville', 'Village Saramaca', 'Les Roches', 'Zone Industrielle'],
+  },
+  macouria: {
+    description: 'Trouvez un artisan de confiance à Macouria (Guyane). Avec 20 000 habitants, cette commune guyanaise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Cayenne, Montsinéry-Tonnegrande, Matoury.',
+    quartiers: ['Centre-ville', 'Cayenne', 'Montsinéry-Tonnegrande', 'Matoury'],
+  },
+  mana: {
+    description: 'Mana (Guyane, Guyane) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide.',
+    quartiers: ['Centre-ville'],
+  },
+  apatou: {
+    description: 'Besoin d’un professionnel à Apatou ? Située en Guyane, cette commune du Guyane bénéficie de des besoins adaptés au milieu tropical. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Saint-Laurent-du-Maroni.',
+    quartiers: ['Centre-ville', 'Saint-Laurent-du-Maroni'],
+  },
+  'grand-santi': {
+    description: 'Trouvez des artisans qualifiés à Grand-Santi (Guyane). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  maripasoula: {
+    description: 'Trouvez des artisans qualifiés à Maripasoula (Guyane). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  papaichton: {
+    description: 'Trouvez des artisans qualifiés à Papaichton (Guyane). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,95 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-paul': {
+    description: 'Découvrez les meilleurs artisans à Saint-Paul en La Réunion. Avec l\'océan Indien et 108 000 habitants, cette grande ville offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Possession, Les Trois-Bassins, Le Port.',
+    quartiers: ['Centre-ville', 'La Possession', 'Les Trois-Bassins', 'Le Port', 'Saint-Denis', 'Saint-Leu', 'Cilaos'],
+  },
+  'saint-pierre': {
+    description: 'À Saint-Pierre, ville importante du La Réunion (85 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une géographie volcanique, nos professionnels interviennent dans toute la commune, ainsi que Petite-Île, Entre-Deux, Le Tampon.',
+    quartiers: ['Centre-ville', 'Petite-Île', 'Entre-Deux', 'Le Tampon', 'Saint-Louis', 'Saint-Joseph', 'L\'Étang-Salé'],
+  },
+  'le-tampon': {
+    description: 'Le Tampon est une ville importante de 83 000 habitants située dans le département La Réunion en La Réunion. Nos artisans qualifiés interviennent à Le Tampon, ainsi que Entre-Deux, Saint-Joseph, La Plaine-des-Palmistes pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Entre-Deux', 'Saint-Joseph', 'La Plaine-des-Palmistes', 'Saint-Pierre', 'Petite-Île', 'Cilaos'],
+  },
+  'saint-andre': {
+    description: 'Besoin d’un professionnel à Saint-André ? Située en La Réunion, cette ville importante du La Réunion bénéficie de des constructions adaptées aux cyclones. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Sainte-Suzanne, Bras-Panon, Sainte-Marie.',
+    quartiers: ['Centre-ville', 'Sainte-Suzanne', 'Bras-Panon', 'Sainte-Marie', 'Saint-Benoît', 'Salazie', 'Saint-Denis'],
+  },
+  'saint-louis': {
+    description: 'Saint-Louis est une ville importante de 55 000 habitants située dans le département La Réunion en La Réunion. Nos artisans qualifiés interviennent à Saint-Louis, ainsi que Les Avirons, L\'Étang-Salé, Entre-Deux pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Les Avirons', 'L\'Étang-Salé', 'Entre-Deux', 'Saint-Leu', 'Cilaos', 'Saint-Pierre'],
+  },
+  'saint-joseph': {
+    description: 'Saint-Joseph (La Réunion, La Réunion) est une ville dynamique de 39 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Petite-Île, Saint-Philippe, Le Tampon.',
+    quartiers: ['Centre-ville', 'Petite-Île', 'Saint-Philippe', 'Le Tampon', 'Saint-Pierre', 'La Plaine-des-Palmistes', 'Sainte-Rose'],
+  },
+  'saint-benoit': {
+    description: 'Besoin d’un professionnel à Saint-Benoît ? Située en La Réunion, cette ville dynamique du La Réunion bénéficie de des constructions adaptées aux cyclones. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Bras-Panon, La Plaine-des-Palmistes, Salazie.',
+    quartiers: ['Centre-ville', 'Bras-Panon', 'La Plaine-des-Palmistes', 'Salazie', 'Saint-André', 'Sainte-Rose', 'Sainte-Suzanne'],
+  },
+  'sainte-marie': {
+    description: 'Vous habitez à Sainte-Marie ou ses environs ? Nos artisans qualifiés du La Réunion sont disponibles pour tous vos travaux. Sainte-Marie, ville dynamique réunionnaise de 37 000 habitants, mérite des professionnels à la hauteur, ainsi que Sainte-Suzanne, Saint-Denis, Salazie.',
+    quartiers: ['Centre-ville', 'Sainte-Suzanne', 'Saint-Denis', 'Salazie', 'Saint-André', 'Bras-Panon', 'La Possession'],
+  },
+  'la-possession': {
+    description: 'À La Possession, ville dynamique du La Réunion (37 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour une géographie volcanique, nos professionnels interviennent dans toute la commune, ainsi que Saint-Paul, Saint-Denis, Le Port.',
+    quartiers: ['Centre-ville', 'Saint-Paul', 'Saint-Denis', 'Le Port', 'Salazie', 'Les Trois-Bassins', 'Sainte-Marie'],
+  },
+  'saint-leu': {
+    description: 'Besoin d’un professionnel à Saint-Leu ? Située en La Réunion, cette ville dynamique du La Réunion bénéficie de des constructions adaptées aux cyclones. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Les Avirons, L\'Étang-Salé, Les Trois-Bassins.',
+    quartiers: ['Centre-ville', 'Les Avirons', 'L\'Étang-Salé', 'Les Trois-Bassins', 'Saint-Louis', 'Cilaos', 'Entre-Deux'],
+  },
+  'le-port': {
+    description: 'Découvrez les meilleurs artisans à Le Port en La Réunion. Avec l\'océan Indien et 34 000 habitants, cette ville dynamique offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que La Possession, Saint-Paul, Saint-Denis.',
+    quartiers: ['Centre-ville', 'La Possession', 'Saint-Paul', 'Saint-Denis', 'Les Trois-Bassins', 'Sainte-Marie', 'Salazie'],
+  },
+  'sainte-suzanne': {
+    description: 'Sainte-Suzanne (La Réunion, La Réunion) est une ville active de 26 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Saint-André, Sainte-Marie, Bras-Panon.',
+    quartiers: ['Centre-ville', 'Saint-André', 'Sainte-Marie', 'Bras-Panon', 'Salazie', 'Saint-Denis', 'Saint-Benoît'],
+  },
+  'l-etang-sale': {
+    description: 'Artisans référencés à L\'Étang-Salé et ses environs. Cette commune réunionnaise de 14 000 habitants en La Réunion compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Les Avirons, Saint-Leu, Saint-Louis.',
+    quartiers: ['Centre-ville', 'Les Avirons', 'Saint-Leu', 'Saint-Louis', 'Les Trois-Bassins', 'Entre-Deux', 'Cilaos'],
+  },
+  'petite-ile': {
+    description: 'Vous habitez à Petite-Île ou ses environs ? Nos artisans qualifiés du La Réunion sont disponibles pour tous vos travaux. Petite-Île, commune réunionnaise de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Saint-Pierre, Saint-Joseph, Le Tampon.',
+    quartiers: ['Centre-ville', 'Saint-Pierre', 'Saint-Joseph', 'Le Tampon', 'Entre-Deux', 'Saint-Philippe', 'Saint-Louis'],
+  },
+  'bras-panon': {
+    description: 'Trouvez un artisan de confiance à Bras-Panon (La Réunion). Avec 13 000 habitants, cette commune réunionnaise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Saint-Benoît, Saint-André, Sainte-Suzanne.',
+    quartiers: ['Centre-ville', 'Saint-Benoît', 'Saint-André', 'Sainte-Suzanne', 'Salazie', 'La Plaine-des-Palmistes', 'Sainte-Marie'],
+  },
+  'les-avirons': {
+    description: 'Découvrez les meilleurs artisans à Les Avirons en La Réunion. Avec l\'océan Indien et 12 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Saint-Leu, L\'Étang-Salé, Saint-Louis.',
+    quartiers: ['Centre-ville', 'Saint-Leu', 'L\'Étang-Salé', 'Saint-Louis', 'Les Trois-Bassins', 'Cilaos', 'Entre-Deux'],
+  },
+  salazie: {
+    description: 'Trouvez des artisans qualifiés à Salazie (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'les-trois-bassins': {
+    description: 'Trouvez des artisans qualifiés à Les Trois-Bassins (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'entre-deux': {
+    description: 'Trouvez des artisans qualifiés à Entre-Deux (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'la-plaine-des-palmistes': {
+    description: 'Trouvez des artisans qualifiés à La Plaine-des-Palmistes (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'saint-philippe': {
+    description: 'Trouvez des artisans qualifiés à Saint-Philippe (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  cilaos: {
+    description: 'Trouvez des artisans qualifiés à Cilaos (La Réunion). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,75 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  mamoudzou: {
+    description: 'Trouvez un artisan de confiance à Mamoudzou (Mayotte). Avec 71 000 habitants, cette ville importante mahoraise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Koungou, Tsingoni, Dembeni.',
+    quartiers: ['Centre-ville', 'Koungou', 'Tsingoni', 'Dembeni', 'Ouangani', 'Dzaoudzi', 'Pamandzi'],
+  },
+  koungou: {
+    description: 'Koungou est une ville dynamique de 32 000 habitants située dans le département Mayotte en Mayotte. Nos artisans qualifiés interviennent à Koungou, ainsi que Mamoudzou, Tsingoni, Bandraboua pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Mamoudzou', 'Tsingoni', 'Bandraboua', 'Dzaoudzi', 'M\'Tsangamouji', 'Pamandzi'],
+  },
+  dzaoudzi: {
+    description: 'Besoin d’un professionnel à Dzaoudzi ? Située en Mayotte, cette commune du Mayotte bénéficie de des besoins croissants en construction. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Pamandzi, Mamoudzou, Koungou.',
+    quartiers: ['Centre-ville', 'Pamandzi', 'Mamoudzou', 'Koungou', 'Dembeni', 'Tsingoni', 'Ouangani'],
+  },
+  dembeni: {
+    description: 'Artisans référencés à Dembeni et ses environs. Cette commune mahoraise de 16 000 habitants en Mayotte compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Ouangani, Sada, Mamoudzou.',
+    quartiers: ['Centre-ville', 'Ouangani', 'Sada', 'Mamoudzou', 'Chiconi', 'Chirongui', 'Tsingoni'],
+  },
+  bandraboua: {
+    description: 'Vous habitez à Bandraboua ou ses environs ? Nos artisans qualifiés du Mayotte sont disponibles pour tous vos travaux. Bandraboua, commune mahoraise de 14 000 habitants, mérite des professionnels à la hauteur, ainsi que M\'Tsangamouji, Acoua, Tsingoni.',
+    quartiers: ['Centre-ville', 'M\'Tsangamouji', 'Acoua', 'Tsingoni', 'Koungou', 'Mtsamboro', 'Mamoudzou'],
+  },
+  tsingoni: {
+    description: 'À Tsingoni, commune du Mayotte (14 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un développement rapide, nos professionnels interviennent dans toute la commune, ainsi que Chiconi, M\'Tsangamouji, Ouangani.',
+    quartiers: ['Centre-ville', 'Chiconi', 'M\'Tsangamouji', 'Ouangani', 'Mamoudzou', 'Bandraboua', 'Koungou'],
+  },
+  pamandzi: {
+    description: 'Artisans référencés à Pamandzi et ses environs. Cette commune mahoraise de 11 000 habitants en Mayotte compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Dzaoudzi, Mamoudzou, Koungou.',
+    quartiers: ['Centre-ville', 'Dzaoudzi', 'Mamoudzou', 'Koungou', 'Dembeni', 'Ouangani', 'Tsingoni'],
+  },
+  sada: {
+    description: 'Trouvez un artisan de confiance à Sada (Mayotte). Avec 11 000 habitants, cette commune mahoraise dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Ouangani, Chiconi, Chirongui.',
+    quartiers: ['Centre-ville', 'Ouangani', 'Chiconi', 'Chirongui', 'Bouéni', 'Dembeni', 'Tsingoni'],
+  },
+  bandrele: {
+    description: 'Bandrele (Mayotte, Mayotte) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Chirongui, Kani-Kéli, Bouéni.',
+    quartiers: ['Centre-ville', 'Chirongui', 'Kani-Kéli', 'Bouéni', 'Dembeni', 'Sada', 'Ouangani'],
+  },
+  ouangani: {
+    description: 'Besoin d’un professionnel à Ouangani ? Située en Mayotte, cette commune du Mayotte bénéficie de des besoins croissants en construction. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Chiconi, Sada, Dembeni.',
+    quartiers: ['Centre-ville', 'Chiconi', 'Sada', 'Dembeni', 'Tsingoni', 'Mamoudzou', 'Chirongui'],
+  },
+  chirongui: {
+    description: 'Trouvez des artisans qualifiés à Chirongui (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  chiconi: {
+    description: 'Trouvez des artisans qualifiés à Chiconi (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mtsamboro: {
+    description: 'Trouvez des artisans qualifiés à Mtsamboro (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'm-tsangamouji': {
+    description: 'Trouvez des artisans qualifiés à M\'Tsangamouji (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  boueni: {
+    description: 'Trouvez des artisans qualifiés à Bouéni (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  'kani-keli': {
+    description: 'Trouvez des artisans qualifiés à Kani-Kéli (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  acoua: {
+    description: 'Trouvez des artisans qualifiés à Acoua (Mayotte). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,11 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-barthelemy': {
+    description: 'Saint-Barthélemy (Saint-Barthélemy, Saint-Barthélemy) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide.',
+    quartiers: ['Centre-ville'],
+  },
+}
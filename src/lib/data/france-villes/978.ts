@@ -0,0 +1,11 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  'saint-martin': {
+    description: 'Vous habitez à Saint-Martin ou ses environs ? Nos artisans qualifiés du Saint-Martin sont disponibles pour tous vos travaux. Saint-Martin, ville dynamique française de 31 000 habitants, mérite des professionnels à la hauteur.',
+    quartiers: ['Centre-ville', 'Marigot', 'Grand Case', 'Sandy Ground'],
+  },
+}
@@ -0,0 +1,75 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  faaa: {
+    description: 'Trouvez un artisan de confiance à Faaa (Polynésie française). Avec 30 000 habitants, cette ville active française dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Papeete, Punaauia, Pirae.',
+    quartiers: ['Centre-ville', 'Papeete', 'Punaauia', 'Pirae', 'Mahina', 'Paea', 'Papara'],
+  },
+  punaauia: {
+    description: 'Artisans référencés à Punaauia et ses environs. Cette ville active française de 29 000 habitants en Polynésie française compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Faaa, Pirae, Papeete.',
+    quartiers: ['Centre-ville', 'Faaa', 'Pirae', 'Papeete', 'Paea', 'Mahina', 'Papara'],
+  },
+  papeete: {
+    description: 'Artisans référencés à Papeete et ses environs. Cette ville active française de 27 000 habitants en Polynésie française compte de nombreux professionnels pour la plomberie, l’électricité, la menuiserie, la peinture et tous vos travaux, ainsi que Faaa, Pirae, Punaauia.',
+    quartiers: ['Centre-ville', 'Faaa', 'Pirae', 'Punaauia', 'Mahina', 'Paea', 'Hitiaa O Te Ra'],
+  },
+  'moorea-maiao': {
+    description: 'Vous habitez à Moorea-Maiao ou ses environs ? Nos artisans qualifiés du Polynésie française sont disponibles pour tous vos travaux. Moorea-Maiao, commune française de 18 000 habitants, mérite des professionnels à la hauteur.',
+    quartiers: ['Centre-ville'],
+  },
+  mahina: {
+    description: 'Découvrez les meilleurs artisans à Mahina en Polynésie française. Avec la France et 15 000 habitants, cette commune offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage, ainsi que Pirae, Papeete, Faaa.',
+    quartiers: ['Centre-ville', 'Pirae', 'Papeete', 'Faaa', 'Hitiaa O Te Ra', 'Punaauia', 'Paea'],
+  },
+  pirae: {
+    description: 'Trouvez un artisan de confiance à Pirae (Polynésie française). Avec 14 000 habitants, cette commune française dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Papeete, Faaa, Mahina.',
+    quartiers: ['Centre-ville', 'Papeete', 'Faaa', 'Mahina', 'Punaauia', 'Hitiaa O Te Ra', 'Paea'],
+  },
+  'taiarapu-est': {
+    description: 'Taiarapu-Est est une commune de 14 000 habitants située dans le département Polynésie française en Polynésie française. Nos artisans qualifiés interviennent à Taiarapu-Est, ainsi que Taiarapu-Ouest pour tous vos travaux : plomberie, électricité, serrurerie, peinture, rénovation et dépannage urgent.',
+    quartiers: ['Centre-ville', 'Taiarapu-Ouest'],
+  },
+  paea: {
+    description: 'Vous habitez à Paea ou ses environs ? Nos artisans qualifiés du Polynésie française sont disponibles pour tous vos travaux. Paea, commune française de 13 000 habitants, mérite des professionnels à la hauteur, ainsi que Papara, Punaauia, Faaa.',
+    quartiers: ['Centre-ville', 'Papara', 'Punaauia', 'Faaa', 'Pirae', 'Papeete', 'Teva I Uta'],
+  },
+  papara: {
+    description: 'Papara (Polynésie française, Polynésie française) est une commune de 12 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Paea, Punaauia, Teva I Uta.',
+    quartiers: ['Centre-ville', 'Paea', 'Punaauia', 'Teva I Uta', 'Faaa', 'Pirae', 'Mahina'],
+  },
+  'teva-i-uta': {
+    description: 'À Teva I Uta, commune du Polynésie française (11 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine diversifié, nos professionnels interviennent dans toute la commune, ainsi que Papara, Hitiaa O Te Ra, Paea.',
+    quartiers: ['Centre-ville', 'Papara', 'Hitiaa O Te Ra', 'Paea', 'Taiarapu-Ouest', 'Punaauia', 'Mahina'],
+  },
+  'bora-bora': {
+    description: 'Bora-Bora (Polynésie française, Polynésie française) est une commune de 11 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide.',
+    quartiers: ['Centre-ville'],
+  },
+  arue: {
+    description: 'Arue (Polynésie française, Polynésie française) est une commune de 10 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide.',
+    quartiers: ['Centre-ville'],
+  },
+  'hitiaa-o-te-ra': {
+    description: 'À Hitiaa O Te Ra, commune du Polynésie française (10 000 hab.), trouvez rapidement un artisan qualifié pour vos projets. Que ce soit pour un patrimoine diversifié, nos professionnels interviennent dans toute la commune, ainsi que Mahina, Pirae, Teva I Uta.',
+    quartiers: ['Centre-ville', 'Mahina', 'Pirae', 'Teva I Uta', 'Punaauia', 'Papeete', 'Faaa'],
+  },
+  'taiarapu-ouest': {
+    description: 'Trouvez des artisans qualifiés à Taiarapu-Ouest (Polynésie française). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  huahine: {
+    description: 'Trouvez des artisans qualifiés à Huahine (Polynésie française). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  tahaa: {
+    description: 'Trouvez des artisans qualifiés à Tahaa (Polynésie française). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  taputapuatea: {
+    description: 'Trouvez des artisans qualifiés à Taputapuatea (Polynésie française). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
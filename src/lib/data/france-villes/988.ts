@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline france` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { VilleDetails } from '../france-core'
+
+export const villeDetails: Record<string, VilleDetails> = {
+  noumea: {
+    description: 'Trouvez un artisan de confiance à Nouméa (Nouvelle-Calédonie). Avec 86 000 habitants, cette ville importante française dispose d’un réseau de professionnels expérimentés pour la rénovation, le dépannage et l’entretien de votre habitat, ainsi que Dumbéa.',
+    quartiers: ['Centre-ville', 'Dumbéa'],
+  },
+  dumbea: {
+    description: 'Besoin d’un professionnel à Dumbéa ? Située en Nouvelle-Calédonie, cette ville dynamique du Nouvelle-Calédonie bénéficie de des artisans qualifiés. Comparez les artisans et demandez un devis gratuit pour vos travaux, ainsi que Païta, Nouméa.',
+    quartiers: ['Centre-ville', 'Païta', 'Nouméa'],
+  },
+  paita: {
+    description: 'Païta (Nouvelle-Calédonie, Nouvelle-Calédonie) est une ville active de 28 000 habitants où nos artisans qualifiés proposent des services de qualité : rénovation, construction, dépannage et entretien. Devis gratuit et intervention rapide, ainsi que Dumbéa, Bouloupari.',
+    quartiers: ['Centre-ville', 'Dumbéa', 'Bouloupari'],
+  },
+  'le-mont-dore': {
+    description: 'Découvrez les meilleurs artisans à Le Mont-Dore en Nouvelle-Calédonie. Avec la France et 25 000 habitants, cette ville active offre un large choix de professionnels pour tous vos travaux de rénovation et dépannage.',
+    quartiers: ['Centre-ville', 'Boulari', 'La Coulée', 'Plum'],
+  },
+  lifou: {
+    description: 'Trouvez des artisans qualifiés à Lifou (Nouvelle-Calédonie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  kone: {
+    description: 'Trouvez des artisans qualifiés à Koné (Nouvelle-Calédonie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  mare: {
+    description: 'Trouvez des artisans qualifiés à Maré (Nouvelle-Calédonie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+  bourail: {
+    description: 'Trouvez des artisans qualifiés à Bourail (Nouvelle-Calédonie). Nos professionnels interviennent dans toute la commune et ses environs pour tous vos travaux.',
+    quartiers: ['Centre-ville'],
+  },
+}
@@ -0,0 +1,237 @@
+import { describe, it, expect } from 'vitest'
+import {
+  villes,
+  departements,
+  regions,
+  getVilleBySlug,
+  getDepartementBySlug,
+  getDepartementByCode,
+  getVillesByDepartement,
+  getVillesByRegion,
+  getVillePopulation,
+  getNearbyCities,
+  getNearbyCitiesInDepartement,
+  getRegionBySlug,
+  getRegionSlugByName,
+  getQuartiersByVille,
+  getQuartierBySlug,
+  services,
+} from './france'
+import { VILLE_COUNT } from './france-index'
+import { NEARBY_IN_DEPARTEMENT, NEARBY_MAX, NEARBY_VILLES, RELATED_SERVICES } from './link-index'
+import { curatedRelatedServices } from '@/lib/constants/navigation'
+import {
+  villesCore,
+  getVilleCoreBySlug,
+  getVillesCoreByDepartement,
+  getNearbyVillesCore,
+  loadVille,
+  loadQuartier,
+} from './france-core'
+
+const population = (pop: string) => parseInt(pop.replace(/\s/g, ''), 10) || 0
+
+// Ancien slugify de france.ts, référence pour quartier-index.ts
+const quartierSlugReference = (text: string) =>
+  text.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '')
+
+// Ancienne implémentation (filter + sort) : villes non localisées et suite au-delà de NEARBY_MAX
+function nearbyReference(villeSlug: string, limit: number) {
+  const ville = villes.find(v => v.slug === villeSlug)!
+  const sameDept = villes
+    .filter(v => v.departementCode === ville.departementCode && v.slug !== villeSlug)
+    .sort((a, b) => population(b.population) - population(a.population))
+  if (sameDept.length >= limit) return sameDept.slice(0, limit)
+  const seen = new Set([villeSlug, ...sameDept.map(v => v.slug)])
+  const sameRegion = villes
+    .filter(v => v.region === ville.region && !seen.has(v.slug))
+    .sort((a, b) => population(b.population) - population(a.population))
+  return [...sameDept, ...sameRegion].slice(0, limit)
+}
+
+describe('france-index', () => {
+  it('should match france.ts (run python3 -m scripts.pipeline france if not)', () => {
+    expect(VILLE_COUNT).toBe(villes.length)
+    for (const ville of villes) {
+      expect(getVilleBySlug(ville.slug)).toBe(ville)
+    }
+    for (const dept of departements) {
+      expect(getDepartementBySlug(dept.slug)).toBe(dept)
+      expect(getDepartementByCode(dept.code)).toBe(dept)
+    }
+    for (const region of regions) {
+      expect(getRegionBySlug(region.slug)).toBe(region)
+      expect(getRegionSlugByName(region.name)).toBe(region.slug)
+    }
+  })
+})
+
+describe('getVilleBySlug', () => {
+  it('should return undefined for unknown or inherited keys', () => {
+    expect(getVilleBySlug('ville-inexistante')).toBeUndefined()
+    expect(getVilleBySlug('constructor')).toBeUndefined()
+    expect(getVilleBySlug('__proto__')).toBeUndefined()
+  })
+})
+
+describe('getVillesByDepartement', () => {
+  it('should return every city of the department, most populated first', () => {
+    const rhone = getVillesByDepartement('69')
+    expect(rhone).toHaveLength(villes.filter(v => v.departementCode === '69').length)
+    expect(rhone[0].slug).toBe('lyon')
+    const pops = rhone.map(v => population(v.population))
+    expect(pops).toEqual([...pops].sort((a, b) => b - a))
+  })
+
+  it('should return an empty list for unknown codes', () => {
+    expect(getVillesByDepartement('00')).toEqual([])
+    expect(getVillesByDepartement('constructor')).toEqual([])
+  })
+})
+
+describe('getVillesByRegion', () => {
+  it('should return every city of the region, most populated first', () => {
+    const idf = getVillesByRegion('Île-de-France')
+    expect(idf).toHaveLength(villes.filter(v => v.region === 'Île-de-France').length)
+    expect(idf[0].slug).toBe('paris')
+  })
+})
+
+describe('getVillePopulation', () => {
+  it('should parse the population string', () => {
+    expect(getVillePopulation('paris')).toBe(2104000)
+    expect(getVillePopulation('ville-inexistante')).toBe(0)
+  })
+})
+
+describe('getNearbyCities', () => {
+  it('should have one distance-ranked list per ville (run python3 -m scripts.pipeline links if not)', () => {
+    expect(NEARBY_VILLES).toHaveLength(villes.length)
+    expect(NEARBY_IN_DEPARTEMENT).toHaveLength(villes.length)
+    villes.forEach((ville, i) => {
+      for (const list of [NEARBY_VILLES[i], NEARBY_IN_DEPARTEMENT[i]]) {
+        expect(list.length).toBeLessThanOrEqual(NEARBY_MAX)
+        expect(new Set(list).size).toBe(list.length)
+        expect(list).not.toContain(i)
+      }
+      for (const j of NEARBY_IN_DEPARTEMENT[i]) {
+        expect(villes[j].departementCode).toBe(ville.departementCode)
+      }
+    })
+  })
+
+  it('should read the precomputed lists up to NEARBY_MAX', () => {
+    for (const slug of ['paris', 'lyon', 'marseille', 'grenoble', 'ajaccio', 'cayenne']) {
+      const i = villes.findIndex(v => v.slug === slug)
+      for (const limit of [5, 6, 8, 12]) {
+        expect(getNearbyCities(slug, limit)).toEqual(NEARBY_VILLES[i].slice(0, limit).map(j => villes[j]))
+        expect(getNearbyCitiesInDepartement(slug, limit)).toEqual(NEARBY_IN_DEPARTEMENT[i].slice(0, limit).map(j => villes[j]))
+      }
+    }
+  })
+
+  it('should rank neighbours by distance, not population', () => {
+    const slugs = getNearbyCities('boulogne-billancourt', NEARBY_MAX).map(v => v.slug)
+    expect(slugs).toContain('suresnes')
+    expect(getNearbyCitiesInDepartement('marseille', 3).map(v => v.slug)).toContain('aubagne')
+  })
+
+  it('should keep the population ranking for villes without coordinates', () => {
+    // issy-les-moulineaux n'a pas de point : pas de distance au centre du département
+    const slugs = getNearbyCities('issy-les-moulineaux', NEARBY_MAX).map(v => v.slug)
+    expect(slugs).toEqual(nearbyReference('issy-les-moulineaux', NEARBY_MAX).map(v => v.slug))
+    expect(getNearbyCitiesInDepartement('boulogne-billancourt', NEARBY_MAX).map(v => v.slug)).toContain('issy-les-moulineaux')
+  })
+
+  it('should extend the precomputed list beyond NEARBY_MAX', () => {
+    for (const slug of ['paris', 'lyon', 'marseille', 'grenoble', 'ajaccio', 'cayenne']) {
+      const slugs = getNearbyCities(slug, 30).map(v => v.slug)
+      const nearest = getNearbyCities(slug, NEARBY_MAX).map(v => v.slug)
+      expect(slugs.slice(0, NEARBY_MAX)).toEqual(nearest)
+      const rest = nearbyReference(slug, villes.length).map(v => v.slug).filter(s => !nearest.includes(s))
+      expect(slugs.slice(NEARBY_MAX)).toEqual(rest.slice(0, 30 - NEARBY_MAX))
+    }
+  })
+
+  it('should return an empty list for unknown cities', () => {
+    expect(getNearbyCities('ville-inexistante')).toEqual([])
+    expect(getNearbyCitiesInDepartement('constructor')).toEqual([])
+  })
+})
+
+describe('RELATED_SERVICES', () => {
+  it('should list known services, curated ones first', () => {
+    const slugs = new Set(services.map(s => s.slug))
+    for (const service of services) {
+      const related = RELATED_SERVICES[service.slug]
+      expect(related.length).toBeLessThanOrEqual(8)
+      expect(related).not.toContain(service.slug)
+      expect(new Set(related).size).toBe(related.length)
+      for (const slug of related) expect(slugs.has(slug)).toBe(true)
+      const curated = (curatedRelatedServices[service.slug] ?? []).filter(s => slugs.has(s))
+      expect(related.slice(0, curated.length)).toEqual(curated)
+    }
+  })
+})
+
+describe('france-core', () => {
+  it('should list every ville without the heavy fields', () => {
+    expect(villesCore).toHaveLength(villes.length)
+    villesCore.forEach((core, i) => {
+      const { description: _d, quartiers: _q, ...rest } = villes[i]
+      expect(core).toEqual(rest)
+    })
+    expect(getVilleCoreBySlug('lyon')?.departementCode).toBe('69')
+    expect(getVilleCoreBySlug('constructor')).toBeUndefined()
+  })
+
+  it('should load the full ville from its department shard', async () => {
+    for (const slug of ['paris', 'lyon', 'ajaccio', 'cayenne']) {
+      expect(await loadVille(slug)).toEqual(getVilleBySlug(slug))
+    }
+    expect(await loadVille('ville-inexistante')).toBeUndefined()
+  })
+
+  it('should resolve departments and neighbours like france.ts', () => {
+    const slugs = (list: { slug: string }[]) => list.map(v => v.slug)
+    for (const code of ['75', '13', '2A', '973', '00']) {
+      expect(slugs(getVillesCoreByDepartement(code))).toEqual(slugs(getVillesByDepartement(code)))
+    }
+    for (const slug of ['paris', 'ajaccio', 'cayenne', 'ville-inexistante']) {
+      for (const limit of [5, 8, NEARBY_MAX + 5]) {
+        expect(slugs(getNearbyVillesCore(slug, limit))).toEqual(slugs(getNearbyCities(slug, limit)))
+      }
+    }
+  })
+
+  it('should load a quartier from its department shard', async () => {
+    for (const ville of villes.slice(0, 5)) {
+      for (const { slug } of getQuartiersByVille(ville.slug)) {
+        expect(await loadQuartier(ville.slug, slug)).toEqual(getQuartierBySlug(ville.slug, slug))
+      }
+    }
+    expect(await loadQuartier('ville-inexistante', 'centre')).toBeNull()
+    expect(await loadQuartier('paris', 'constructor')).toBeNull()
+  })
+})
+
+describe('quartier-index', () => {
+  it('should match france.ts (run python3 -m scripts.pipeline quartiers if not)', () => {
+    for (const ville of villes) {
+      const quartiers = getQuartiersByVille(ville.slug)
+      expect(quartiers.map(q => q.name)).toEqual(ville.quartiers)
+      expect(quartiers.map(q => q.slug)).toEqual(ville.quartiers.map(quartierSlugReference))
+      for (const { slug } of quartiers) {
+        const name = ville.quartiers.find(q => quartierSlugReference(q) === slug)
+        expect(getQuartierBySlug(ville.slug, slug)).toEqual({ ville, quartierName: name })
+      }
+    }
+  })
+
+  it('should return nothing for unknown or inherited keys', () => {
+    expect(getQuartiersByVille('ville-inexistante')).toEqual([])
+    expect(getQuartierBySlug('ville-inexistante', 'centre')).toBeNull()
+    expect(getQuartierBySlug('paris', 'quartier-inexistant')).toBeNull()
+    expect(getQuartierBySlug('paris', 'constructor')).toBeNull()
+  })
+})
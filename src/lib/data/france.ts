@@ -1,4 +1,27 @@
 // Données complètes des villes et départements français
+//
+// Les fonctions de recherche lisent les index générés dans france-index.ts,
+// les villes proches ceux de link-index.ts (par distance pour les villes localisées).
+// Les composants client utilisent france-core.ts (villes sans description ni
+// quartiers) ; loadVille() y charge ces champs par département à la demande.
+// Après toute modification de `villes`, `departements` ou `regions`, relancer :
+//   python3 -m scripts.pipeline france
+//   python3 -m scripts.pipeline quartiers
+//   python3 -m scripts.pipeline links
+
+import {
+  DEPARTEMENT_INDEX,
+  DEPARTEMENT_INDEX_BY_CODE,
+  REGION_INDEX,
+  REGION_INDEX_BY_NAME,
+  VILLE_INDEX,
+  VILLE_POPULATIONS,
+  VILLES_BY_DEPARTEMENT,
+  VILLES_BY_REGION,
+} from './france-index'
+import { lookup, nearbyPositions, pick, quartierLinks } from './france-lookup'
+import { NEARBY_IN_DEPARTEMENT } from './link-index'
+import { QUARTIER_INDEX } from './quartier-index'
 
 export interface Ville {
   slug: string
@@ -25071,55 +25094,56 @@ export const departements: Departement[] = [
 
 // Fonction pour obtenir une ville par son slug
 export function getVilleBySlug(slug: string): Ville | undefined {
-  return villes.find(v => v.slug === slug)
+  const i = lookup(VILLE_INDEX, slug)
+  return i === undefined ? undefined : villes[i]
 }
 
 // Fonction pour obtenir un département par son slug
 export function getDepartementBySlug(slug: string): Departement | undefined {
-  return departements.find(d => d.slug === slug)
+  const i = lookup(DEPARTEMENT_INDEX, slug)
+  return i === undefined ? undefined : departements[i]
 }
 
 // Fonction pour obtenir un département par son code
 export function getDepartementByCode(code: string): Departement | undefined {
-  return departements.find(d => d.code === code)
+  const i = lookup(DEPARTEMENT_INDEX_BY_CODE, code)
+  return i === undefined ? undefined : departements[i]
 }
 
-// Fonction pour obtenir toutes les villes d'un département
+// Fonction pour obtenir toutes les villes d'un département (population décroissante)
 export function getVillesByDepartement(departementCode: string): Ville[] {
-  return villes.filter(v => v.departementCode === departementCode)
+  return pick(villes, VILLES_BY_DEPARTEMENT[departementCode])
+}
+
+// Fonction pour obtenir toutes les villes d'une région (population décroissante)
+export function getVillesByRegion(regionName: string): Ville[] {
+  return pick(villes, VILLES_BY_REGION[regionName])
 }
 
-/** Parse population string like '156 000' into a number (156000) */
-function parsePopulation(pop: string): number {
-  return parseInt(pop.replace(/\s/g, ''), 10) || 0
+/** Population numérique d'une ville ('156 000' -> 156000), 0 si inconnue */
+export function getVillePopulation(villeSlug: string): number {
+  const i = lookup(VILLE_INDEX, villeSlug)
+  return i === undefined ? 0 : VILLE_POPULATIONS[i]
 }
 
 /**
- * Retourne les villes proches (même département, puis même région) d'une ville donnée.
- * Triées par population décroissante pour un maillage interne SEO optimal.
+ * Retourne les villes proches d'une ville donnée (link-index.ts) : par distance
+ * croissante quand la ville est localisée, sinon celles du même département
+ * puis de la même région par population décroissante. Au-delà de NEARBY_MAX,
+ * la liste précalculée est complétée par le département puis la région
+ * (population décroissante) : les premières villes ne dépendent pas de `limit`.
  */
 export function getNearbyCities(villeSlug: string, limit: number = 5): Ville[] {
-  const ville = getVilleBySlug(villeSlug)
-  if (!ville) return []
-
-  // 1. Villes du même département (hors ville actuelle), triées par population
-  const sameDept = villes
-    .filter(v => v.departementCode === ville.departementCode && v.slug !== villeSlug)
-    .sort((a, b) => parsePopulation(b.population) - parsePopulation(a.population))
-
-  if (sameDept.length >= limit) {
-    return sameDept.slice(0, limit)
-  }
-
-  // 2. Compléter avec des villes de la même région (autres départements)
-  const sameDeptSlugs = new Set(sameDept.map(v => v.slug))
-  sameDeptSlugs.add(villeSlug)
-
-  const sameRegion = villes
-    .filter(v => v.region === ville.region && !sameDeptSlugs.has(v.slug))
-    .sort((a, b) => parsePopulation(b.population) - parsePopulation(a.population))
+  const i = lookup(VILLE_INDEX, villeSlug)
+  if (i === undefined) return []
+  return pick(villes, nearbyPositions(i, villes[i], limit))
+}
 
-  return [...sameDept, ...sameRegion].slice(0, limit)
+// Villes les plus proches dans le même département (au plus NEARBY_MAX)
+export function getNearbyCitiesInDepartement(villeSlug: string, limit: number = 5): Ville[] {
+  const i = lookup(VILLE_INDEX, villeSlug)
+  if (i === undefined) return []
+  return pick(villes, NEARBY_IN_DEPARTEMENT[i].slice(0, limit))
 }
 
 // Régions françaises
@@ -25152,32 +25176,29 @@ export const regions: Region[] = [
 ]
 
 export function getRegionBySlug(slug: string): Region | undefined {
-  return regions.find(r => r.slug === slug)
+  const i = lookup(REGION_INDEX, slug)
+  return i === undefined ? undefined : regions[i]
 }
 
 export function getRegionSlugByName(name: string): string | undefined {
-  return regions.find(r => r.name === name)?.slug
-}
-
-// Inline slugify pour éviter dépendance circulaire avec utils.ts
-function toQuartierSlug(text: string): string {
-  return text.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '')
+  const i = lookup(REGION_INDEX_BY_NAME, name)
+  return i === undefined ? undefined : regions[i].slug
 }
 
-/** Retourne les quartiers d'une ville avec slug généré */
+/** Retourne les quartiers d'une ville avec leur slug précalculé (quartier-index.ts) */
 export function getQuartiersByVille(villeSlug: string): { name: string; slug: string }[] {
   const ville = getVilleBySlug(villeSlug)
-  if (!ville) return []
-  return ville.quartiers.map(q => ({ name: q, slug: toQuartierSlug(q) }))
+  return ville ? quartierLinks(ville) : []
 }
 
 /** Retrouve ville + quartier par slugs */
 export function getQuartierBySlug(villeSlug: string, qSlug: string): { ville: Ville; quartierName: string } | null {
   const ville = getVilleBySlug(villeSlug)
   if (!ville) return null
-  const match = ville.quartiers.find(name => toQuartierSlug(name) === qSlug)
-  if (!match) return null
-  return { ville, quartierName: match }
+  const positions = lookup(QUARTIER_INDEX, villeSlug)
+  const i = positions && lookup(positions, qSlug)
+  if (i === undefined) return null
+  return { ville, quartierName: ville.quartiers[i] }
 }
 
 // Services disponibles avec icônes Lucide (46 métiers)
@@ -0,0 +1,374 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from './guides'
+
+/** Guide sans les champs de contenu, pour les listes et les cartes */
+export type GuideSummary = Pick<Guide, 'slug' | 'title' | 'metaDescription' | 'category' | 'trade' | 'readingTime' | 'lastUpdated' | 'relatedServices'>
+
+/** Slug -> position dans `guides` */
+export const GUIDE_INDEX: Record<string, number> = {
+  'combien-coute-un-plombier': 0,
+  'combien-coute-un-electricien': 1,
+  'prix-renovation-salle-de-bain': 2,
+  'tarif-isolation-thermique': 3,
+  'cout-installation-chaudiere': 4,
+  'prix-renovation-energetique': 5,
+  'tarif-pompe-a-chaleur': 6,
+  'cout-installation-panneaux-solaires': 7,
+  'comment-choisir-artisan-qualifie': 8,
+  'comment-obtenir-devis-travaux': 9,
+  'artisan-rge-comment-verifier': 10,
+  'assurance-decennale-garantie': 11,
+  'aides-renovation-energetique-2025': 12,
+  'prime-cee-comment-obtenir': 13,
+  'que-faire-fuite-eau-urgence': 14,
+  'panne-chaudiere-que-faire': 15,
+  'coupure-electricite-que-faire': 16,
+  'porte-bloquee-serrurerie': 17,
+  'infiltration-toiture-urgence': 18,
+  'guide-renovation-appartement': 19,
+  'refection-toiture-guide': 20,
+  'installation-climatisation-guide': 21,
+  'renovation-cuisine-guide': 22,
+  'prix-carrelage-pose': 23,
+  'tarif-peinture-interieure': 24,
+  'cout-maconnerie-travaux': 25,
+  'tarif-menuiserie-fenetres': 26,
+  'prix-jardin-amenagement': 27,
+  'permis-construire-quand': 28,
+}
+
+/** Mêmes entrées et même ordre que `guides` */
+export const guideSummaries: GuideSummary[] = [
+  {
+    slug: 'combien-coute-un-plombier',
+    title: 'Combien coûte un plombier ? Tarifs et prix 2025',
+    metaDescription: 'Prix d\'un plombier en 2025 : de 60 à 120 €/h. Tarifs pour débouchage, fuite, installation. Devis gratuit en ligne.',
+    category: 'economiser',
+    trade: 'plombier',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['plombier', 'chauffagiste'],
+  },
+  {
+    slug: 'combien-coute-un-electricien',
+    title: 'Prix d\'un électricien en 2025 : tarifs et devis',
+    metaDescription: 'Tarifs d\'un électricien en 2025 : 60–100 €/h. Tableau de prix pour mise aux normes, tableau électrique, dépannage. Devis gratuit.',
+    category: 'economiser',
+    trade: 'electricien',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['electricien', 'domoticien', 'alarme-securite'],
+  },
+  {
+    slug: 'prix-renovation-salle-de-bain',
+    title: 'Prix rénovation salle de bain 2025 : budget complet',
+    metaDescription: 'Budget rénovation salle de bain : 3 000 € (partielle) à 15 000 € (complète). Guide des tarifs par poste : plomberie, carrelage, sanitaires.',
+    category: 'economiser',
+    trade: 'salle-de-bain',
+    readingTime: 6,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['salle-de-bain', 'plombier', 'carreleur', 'electricien'],
+  },
+  {
+    slug: 'tarif-isolation-thermique',
+    title: 'Prix isolation thermique 2025 : combles, murs, sols',
+    metaDescription: 'Tarifs isolation thermique 2025 : combles perdus de 20 à 50 €/m², ITE de 100 à 250 €/m². Aides MaPrimeRénov\' disponibles.',
+    category: 'economiser',
+    trade: 'isolation-thermique',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['isolation-thermique', 'renovation-energetique', 'chauffagiste'],
+  },
+  {
+    slug: 'cout-installation-chaudiere',
+    title: 'Prix installation chaudière 2025 : gaz, fioul, condensation',
+    metaDescription: 'Tarifs installation chaudière 2025 : condensation gaz 2 500–5 000 €. Aides disponibles, économisez jusqu\'à 50 %.',
+    category: 'economiser',
+    trade: 'chauffagiste',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['chauffagiste', 'pompe-a-chaleur', 'isolation-thermique'],
+  },
+  {
+    slug: 'prix-renovation-energetique',
+    title: 'Prix d\'une rénovation énergétique 2025 : budget global',
+    metaDescription: 'Budget rénovation énergétique : 15 000–80 000 €. Aides MaPrimeRénov\', CEE, éco-PTZ : reste à charge sous 10 000 € pour ménages modestes.',
+    category: 'economiser',
+    trade: 'renovation-energetique',
+    readingTime: 6,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['renovation-energetique', 'isolation-thermique', 'pompe-a-chaleur', 'panneaux-solaires'],
+  },
+  {
+    slug: 'tarif-pompe-a-chaleur',
+    title: 'Prix d\'une pompe à chaleur 2025 : air/eau, air/air',
+    metaDescription: 'Tarif PAC 2025 : air/eau 8 000–15 000 €, air/air 2 500–6 000 €. MaPrimeRénov\' jusqu\'à 10 000 €. Devis gratuit.',
+    category: 'economiser',
+    trade: 'pompe-a-chaleur',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['pompe-a-chaleur', 'chauffagiste', 'renovation-energetique', 'isolation-thermique'],
+  },
+  {
+    slug: 'cout-installation-panneaux-solaires',
+    title: 'Prix installation panneaux solaires 2025 : photovoltaïque',
+    metaDescription: 'Prix panneaux solaires 2025 : 8 000–15 000 € pour 6 kWc. Prime autoconsommation, TVA 10 %. Retour sur investissement 8–12 ans.',
+    category: 'economiser',
+    trade: 'panneaux-solaires',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['panneaux-solaires', 'electricien', 'renovation-energetique'],
+  },
+  {
+    slug: 'comment-choisir-artisan-qualifie',
+    title: 'Comment choisir un artisan qualifié : 7 critères essentiels',
+    metaDescription: 'Comment trouver un artisan de confiance ? Certifications, assurances, devis, avis clients. Guide complet pour éviter les arnaques.',
+    category: 'choisir',
+    readingTime: 6,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['plombier', 'electricien', 'macon', 'couvreur'],
+  },
+  {
+    slug: 'comment-obtenir-devis-travaux',
+    title: 'Comment obtenir un devis travaux : guide pratique',
+    metaDescription: 'Comment demander et comparer des devis travaux ? Préparer sa demande, analyser les offres, éviter les pièges. Guide pratique 2025.',
+    category: 'choisir',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['plombier', 'electricien', 'macon', 'couvreur', 'carreleur'],
+  },
+  {
+    slug: 'artisan-rge-comment-verifier',
+    title: 'Artisan RGE : comment vérifier la certification ? Guide 2025',
+    metaDescription: 'Comment vérifier qu\'un artisan est certifié RGE ? Annuaire France Rénov\', labels (Qualibat, QualiPAC, Qualifelec), conditions MaPrimeRénov\'.',
+    category: 'choisir',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['isolation-thermique', 'pompe-a-chaleur', 'panneaux-solaires', 'renovation-energetique'],
+  },
+  {
+    slug: 'assurance-decennale-garantie',
+    title: 'Garantie décennale : tout savoir en 2025',
+    metaDescription: 'La garantie décennale protège votre bien 10 ans. Qui en bénéficie, quels travaux couvre-t-elle, comment la mettre en œuvre ? Guide complet.',
+    category: 'choisir',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['macon', 'couvreur', 'plombier', 'electricien'],
+  },
+  {
+    slug: 'aides-renovation-energetique-2025',
+    title: 'Aides rénovation énergétique 2025 : MaPrimeRénov\', CEE, éco-PTZ',
+    metaDescription: 'Toutes les aides rénovation énergétique 2025 : MaPrimeRénov\', CEE, éco-PTZ, TVA réduite. Jusqu\'à 90 % des travaux couverts pour les ménages modestes.',
+    category: 'economiser',
+    trade: 'renovation-energetique',
+    readingTime: 7,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['isolation-thermique', 'pompe-a-chaleur', 'renovation-energetique', 'panneaux-solaires'],
+  },
+  {
+    slug: 'prime-cee-comment-obtenir',
+    title: 'Prime énergie CEE 2025 : comment en bénéficier ?',
+    metaDescription: 'Les CEE offrent des primes de 500 à 5 000 € pour vos travaux. Sans conditions de revenus, cumulables avec MaPrimeRénov\'.',
+    category: 'economiser',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['isolation-thermique', 'chauffagiste', 'pompe-a-chaleur'],
+  },
+  {
+    slug: 'que-faire-fuite-eau-urgence',
+    title: 'Fuite d\'eau : que faire en urgence ? Guide étape par étape',
+    metaDescription: 'Fuite d\'eau chez vous ? Couper l\'eau, localiser la fuite, limiter les dégâts. Quand appeler un plombier en urgence ? Guide complet.',
+    category: 'urgence',
+    trade: 'plombier',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['plombier', 'chauffagiste'],
+  },
+  {
+    slug: 'panne-chaudiere-que-faire',
+    title: 'Panne de chaudière en hiver : que faire ? Guide urgence',
+    metaDescription: 'Chaudière en panne en hiver ? Vérifiez ces points avant d\'appeler : pression, vanne gaz, code erreur. Guide de dépannage chauffage.',
+    category: 'urgence',
+    trade: 'chauffagiste',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['chauffagiste', 'pompe-a-chaleur', 'plombier'],
+  },
+  {
+    slug: 'coupure-electricite-que-faire',
+    title: 'Coupure d\'électricité : que faire ? Dépannage électrique',
+    metaDescription: 'Panne d\'électricité chez vous ? Tableau électrique, compteur Linky, voisins. Guide pour identifier la panne et contacter le bon interlocuteur.',
+    category: 'urgence',
+    trade: 'electricien',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['electricien', 'domoticien', 'alarme-securite'],
+  },
+  {
+    slug: 'porte-bloquee-serrurerie',
+    title: 'Porte bloquée : que faire ? Serrurier d\'urgence sans arnaque',
+    metaDescription: 'Porte claquée ou serrure bloquée ? Solutions avant d\'appeler, comment choisir un serrurier fiable, prix d\'une ouverture et risques d\'arnaque.',
+    category: 'urgence',
+    trade: 'serrurier',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['serrurier', 'alarme-securite'],
+  },
+  {
+    slug: 'infiltration-toiture-urgence',
+    title: 'Infiltration toiture : que faire en urgence ? Guide couvreur',
+    metaDescription: 'Infiltration d\'eau par la toiture ? Protégez l\'intérieur, localisez la fuite, appelez un couvreur. Coût des réparations et couverture assurance.',
+    category: 'urgence',
+    trade: 'couvreur',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['couvreur', 'charpentier', 'zingueur', 'etancheiste'],
+  },
+  {
+    slug: 'guide-renovation-appartement',
+    title: 'Guide rénovation appartement 2025 : étapes et budget',
+    metaDescription: 'Comment rénover son appartement ? Étapes, budget (5 000–80 000 €), artisans à contacter, aides disponibles. Guide complet de la peinture à la rénovation totale.',
+    category: 'entretien',
+    readingTime: 7,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['electricien', 'plombier', 'carreleur', 'peintre-en-batiment', 'architecte-interieur'],
+  },
+  {
+    slug: 'refection-toiture-guide',
+    title: 'Réfection de toiture : guide complet prix et conseils 2025',
+    metaDescription: 'Guide réfection toiture : matériaux, prix au m², choisir un couvreur, aides disponibles. De la réparation à la rénovation complète.',
+    category: 'entretien',
+    trade: 'couvreur',
+    readingTime: 6,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['couvreur', 'charpentier', 'zingueur', 'isolation-thermique'],
+  },
+  {
+    slug: 'installation-climatisation-guide',
+    title: 'Installation climatisation : guide prix et conseils 2025',
+    metaDescription: 'Choisir et installer une climatisation réversible en 2025 : prix mono-split et multi-split, marques, consommation et entretien.',
+    category: 'entretien',
+    trade: 'climaticien',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['climaticien', 'electricien', 'pompe-a-chaleur'],
+  },
+  {
+    slug: 'renovation-cuisine-guide',
+    title: 'Rénovation cuisine : budget, étapes et conseils 2025',
+    metaDescription: 'Rénover sa cuisine : 3 000 à 25 000 € selon l\'étendue. Guide travaux par poste, ordre d\'intervention des artisans, conseils budget.',
+    category: 'entretien',
+    trade: 'cuisiniste',
+    readingTime: 6,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['cuisiniste', 'plombier', 'electricien', 'carreleur'],
+  },
+  {
+    slug: 'prix-carrelage-pose',
+    title: 'Prix du carrelage et de la pose en 2025 : tarifs au m²',
+    metaDescription: 'Prix carrelage 2025 : fourniture 5–200 €/m², pose 20–60 €/m². Guide complet par type de surface et conseils pour réduire les coûts.',
+    category: 'economiser',
+    trade: 'carreleur',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['carreleur', 'macon', 'salle-de-bain'],
+  },
+  {
+    slug: 'tarif-peinture-interieure',
+    title: 'Prix peinture intérieure 2025 : tarifs au m² par type de surface',
+    metaDescription: 'Tarifs peinture intérieure 2025 : 20–50 €/m² selon la surface et la préparation. Murs, plafonds, boiseries : guide complet des prix.',
+    category: 'economiser',
+    trade: 'peintre-en-batiment',
+    readingTime: 4,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['peintre-en-batiment', 'platrier', 'decorateur'],
+  },
+  {
+    slug: 'cout-maconnerie-travaux',
+    title: 'Prix maçonnerie 2025 : tarifs par type de travaux',
+    metaDescription: 'Tarifs maçonnerie 2025 : démolition, extension, cloisons, enduits. De 50 à 400 €/m² selon les travaux. Artisan qualifié Qualibat.',
+    category: 'economiser',
+    trade: 'macon',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['macon', 'charpentier', 'couvreur', 'electricien'],
+  },
+  {
+    slug: 'tarif-menuiserie-fenetres',
+    title: 'Prix fenêtres et menuiserie 2025 : PVC, alu, bois',
+    metaDescription: 'Tarifs fenêtres 2025 : PVC 400–800 €, aluminium 700–1 500 €, bois 600–1 800 €. Prix de pose, aides CEE. Devis gratuit.',
+    category: 'economiser',
+    trade: 'menuisier',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['menuisier', 'vitrier', 'isolation-thermique'],
+  },
+  {
+    slug: 'prix-jardin-amenagement',
+    title: 'Prix aménagement jardin 2025 : terrasse, clôture, gazon',
+    metaDescription: 'Tarifs aménagement jardin 2025 : terrasse bois 60–150 €/m², clôture 30–120 €/ml, gazon semé 5–20 €/m². Devis paysagiste gratuit.',
+    category: 'economiser',
+    trade: 'paysagiste',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['paysagiste', 'terrassier', 'macon'],
+  },
+  {
+    slug: 'permis-construire-quand',
+    title: 'Permis de construire ou déclaration préalable : quand en avez-vous besoin ?',
+    metaDescription: 'Permis de construire obligatoire au-delà de 20 m² (40 m² en zone urbaine). Déclaration préalable pour petits travaux. Seuils et démarches 2025.',
+    category: 'choisir',
+    readingTime: 5,
+    lastUpdated: '2025-01-15',
+    relatedServices: ['macon', 'couvreur', 'menuisier'],
+  },
+]
+
+/** Category -> positions, dans l'ordre de `guides` */
+export const GUIDES_BY_CATEGORY: Record<string, number[]> = { choisir: [8, 9, 10, 11, 28], economiser: [0, 1, 2, 3, 4, 5, 6, 7, 12, 13, 23, 24, 25, 26, 27], entretien: [19, 20, 21, 22], urgence: [14, 15, 16, 17, 18] }
+
+/** Trade -> positions, dans l'ordre de `guides` */
+export const GUIDES_BY_TRADE: Record<string, number[]> = {
+  carreleur: [23],
+  chauffagiste: [4, 15],
+  climaticien: [21],
+  couvreur: [18, 20],
+  cuisiniste: [22],
+  electricien: [1, 16],
+  'isolation-thermique': [3],
+  macon: [25],
+  menuisier: [26],
+  'panneaux-solaires': [7],
+  paysagiste: [27],
+  'peintre-en-batiment': [24],
+  plombier: [0, 14],
+  'pompe-a-chaleur': [6],
+  'renovation-energetique': [5, 12],
+  'salle-de-bain': [2],
+  serrurier: [17],
+}
+
+function has(index: Record<string, unknown>, key: string): boolean {
+  return Object.prototype.hasOwnProperty.call(index, key)
+}
+
+export function getGuideSummary(slug: string): GuideSummary | undefined {
+  return has(GUIDE_INDEX, slug) ? guideSummaries[GUIDE_INDEX[slug]] : undefined
+}
+
+export function getGuideSummariesByCategory(category: string): GuideSummary[] {
+  return has(GUIDES_BY_CATEGORY, category) ? GUIDES_BY_CATEGORY[category].map((i) => guideSummaries[i]) : []
+}
+
+export function getGuideSummariesByTrade(trade: string): GuideSummary[] {
+  return has(GUIDES_BY_TRADE, trade) ? GUIDES_BY_TRADE[trade].map((i) => guideSummaries[i]) : []
+}
+
+/** Entrée complète, chargée seule depuis son shard */
+export async function loadGuide(slug: string): Promise<Guide | undefined> {
+  if (!has(GUIDE_INDEX, slug)) return undefined
+  const shard: { entry: Guide } = await import(`./guides-shards/${slug}`)
+  return shard.entry
+}
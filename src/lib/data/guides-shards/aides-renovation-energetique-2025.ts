@@ -0,0 +1,36 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'aides-renovation-energetique-2025',
+  title: 'Aides rénovation énergétique 2025 : MaPrimeRénov\', CEE, éco-PTZ',
+  metaDescription: 'Toutes les aides rénovation énergétique 2025 : MaPrimeRénov\', CEE, éco-PTZ, TVA réduite. Jusqu\'à 90 % des travaux couverts pour les ménages modestes.',
+  h1: 'Guide complet des aides à la rénovation énergétique 2025',
+  category: 'economiser',
+  trade: 'renovation-energetique',
+  readingTime: 7,
+  intro: 'En 2025, les aides à la rénovation énergétique restent généreuses. MaPrimeRénov\', CEE, éco-PTZ et TVA réduite peuvent couvrir jusqu\'à 90 % des travaux pour les ménages les plus modestes.',
+  sections: [
+    {
+      title: 'MaPrimeRénov\' 2025 : montants et conditions',
+      content: 'Accessible à tous les propriétaires pour leur résidence principale. Parcours "rénovation d\'ampleur" : jusqu\'à 80 % des travaux (plafond 40 000 € HT) pour ménages très modestes. Travaux obligatoirement réalisés par un artisan RGE.',
+    },
+    {
+      title: 'Les Certificats d\'Économies d\'Énergie (CEE)',
+      content: 'Primes versées par les fournisseurs d\'énergie (EDF, Engie, Total Énergie...) : quelques centaines à plusieurs milliers d\'euros. Aucune condition de revenus. Cumulables avec MaPrimeRénov\'.',
+    },
+    {
+      title: 'L\'éco-prêt à taux zéro (éco-PTZ)',
+      content: 'Finance jusqu\'à 50 000 € de travaux sans intérêts sur 20 ans maximum. Accordé par des banques conventionnées, sans condition de revenus. Cumulable avec MaPrimeRénov\'.',
+    },
+  ],
+  faq: [
+    { q: 'Comment faire une demande de MaPrimeRénov\' ?', a: 'En ligne sur maprimerenov.gouv.fr. Déposez les devis avant travaux, puis les factures après réalisation.' },
+    { q: 'Peut-on cumuler toutes les aides ?', a: 'Oui, MaPrimeRénov\', CEE et éco-PTZ sont cumulables. TVA réduite 5,5 % s\'applique sur tous les travaux d\'isolation.' },
+    { q: 'Quel est le délai pour recevoir MaPrimeRénov\' ?', a: '2 à 4 mois en moyenne après dépôt des factures.' },
+  ],
+  relatedServices: ['isolation-thermique', 'pompe-a-chaleur', 'renovation-energetique', 'panneaux-solaires'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,35 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'artisan-rge-comment-verifier',
+  title: 'Artisan RGE : comment vérifier la certification ? Guide 2025',
+  metaDescription: 'Comment vérifier qu\'un artisan est certifié RGE ? Annuaire France Rénov\', labels (Qualibat, QualiPAC, Qualifelec), conditions MaPrimeRénov\'.',
+  h1: 'Comment vérifier qu\'un artisan est certifié RGE ?',
+  category: 'choisir',
+  readingTime: 4,
+  intro: 'La certification RGE est indispensable pour bénéficier des aides de l\'État. Voici comment vérifier rapidement si votre artisan est bien certifié avant de signer le devis.',
+  sections: [
+    {
+      title: 'Vérifier sur l\'annuaire officiel France Rénov\'',
+      content: 'Le site france-renov.gouv.fr propose un annuaire des artisans certifiés RGE, consultable gratuitement. Saisissez le code postal et le type de travaux. La certification est mise à jour en temps réel.',
+    },
+    {
+      title: 'Les labels RGE reconnus',
+      content: 'Qualibat (maçonnerie, isolation, couverture), Qualifelec (électricité, ENR électrique), QualiPAC (pompes à chaleur), QualiBois (biomasse), Qualit\'EnR (ENR), RGE Études (MOE). Chaque label couvre des métiers spécifiques.',
+    },
+    {
+      title: 'Conséquences du défaut de certification RGE',
+      content: 'Sans certification RGE de l\'artisan, pas de MaPrimeRénov\' ni d\'éco-PTZ pour ces travaux. Vérifiez avant la signature du devis. L\'ANAH effectue des contrôles et peut réclamer le remboursement des aides en cas de fraude.',
+    },
+  ],
+  faq: [
+    { q: 'La certification RGE est-elle valide combien de temps ?', a: '4 ans avec contrôle intermédiaire à 2 ans. Formations continues obligatoires.' },
+    { q: 'Un artisan peut-il être RGE pour une seule spécialité ?', a: 'Oui, la certification est accordée par domaine. Vérifiez qu\'elle couvre bien le type de travaux prévu.' },
+    { q: 'Que faire si un artisan se prétend RGE à tort ?', a: 'Signalez la fraude à la DGCCRF via signal.conso.gouv.fr. L\'artisan s\'expose à des sanctions pénales.' },
+  ],
+  relatedServices: ['isolation-thermique', 'pompe-a-chaleur', 'panneaux-solaires', 'renovation-energetique'],
+  lastUpdated: '2025-01-15',
+}
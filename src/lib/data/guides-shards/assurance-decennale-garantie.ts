@@ -0,0 +1,41 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'assurance-decennale-garantie',
+  title: 'Garantie décennale : tout savoir en 2025',
+  metaDescription: 'La garantie décennale protège votre bien 10 ans. Qui en bénéficie, quels travaux couvre-t-elle, comment la mettre en œuvre ? Guide complet.',
+  h1: 'Tout savoir sur la garantie décennale des artisans',
+  category: 'choisir',
+  readingTime: 5,
+  intro: 'La garantie décennale est une protection légale qui couvre les malfaçons compromettant la solidité d\'un ouvrage pendant 10 ans après sa réception.',
+  sections: [
+    {
+      title: 'Quels travaux sont couverts ?',
+      content: 'La garantie décennale couvre les dommages compromettant la solidité de l\'ouvrage ou le rendant impropre à sa destination : fissures structurelles, infiltrations, défauts d\'isolation, problèmes de fondations. Elle ne couvre pas les dommages esthétiques mineurs ni l\'usure normale.',
+    },
+    {
+      title: 'Les 3 garanties légales du bâtiment',
+      content: 'Parfait achèvement (1 an) : réparation de tous les désordres signalés à la réception. Biennale (2 ans) : équipements dissociables (chaudière, VMC, volets). Décennale (10 ans) : gros ouvrages. Ces garanties sont cumulatives.',
+    },
+    {
+      title: 'Comment mettre en œuvre la garantie décennale ?',
+      content: 'Envoyez une mise en demeure par LRAR à l\'entreprise et à son assureur. Si l\'entreprise est défaillante, contactez directement l\'assureur décennal. Déclarez aussi à votre assurance dommages-ouvrage pour une indemnisation rapide.',
+    },
+  ],
+  faq: [
+    { q: 'La garantie décennale est-elle transmissible en cas de vente ?', a: 'Oui, elle est attachée à l\'ouvrage et se transmet aux propriétaires successifs.' },
+    {
+      q: 'Que faire si un artisan ne fournit pas son attestation décennale ?',
+      a: 'Refusez de signer tout bon de commande. Sans assurance décennale, vous prenez un risque financier majeur.',
+    },
+    {
+      q: 'La garantie décennale couvre-t-elle les travaux de rénovation ?',
+      a: 'Oui, pour les travaux réalisés par un professionnel : extensions, surélévations, réhabilitations importantes.',
+    },
+  ],
+  relatedServices: ['macon', 'couvreur', 'plombier', 'electricien'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'combien-coute-un-electricien',
+  title: 'Prix d\'un électricien en 2025 : tarifs et devis',
+  metaDescription: 'Tarifs d\'un électricien en 2025 : 60–100 €/h. Tableau de prix pour mise aux normes, tableau électrique, dépannage. Devis gratuit.',
+  h1: 'Combien coûte un électricien en 2025 ?',
+  category: 'economiser',
+  trade: 'electricien',
+  readingTime: 5,
+  intro: 'Un électricien facture entre 60 et 100 €/h en province et jusqu\'à 120 €/h en Île-de-France. Le coût total dépend de la complexité des travaux, des matériaux et de la certification de l\'artisan.',
+  sections: [
+    {
+      title: 'Tarifs horaires et forfaits courants',
+      content: 'Tarif horaire moyen : 70 €/h HT en province, 90 €/h en région parisienne. Forfait déplacement : 30–60 €. Mise aux normes tableau électrique : 1 500–4 000 € selon la surface.',
+    },
+    {
+      title: 'Prix par type de travaux',
+      content: 'Installation d\'une prise : 80–150 €. Interrupteur connecté : 120–200 €. Tableau électrique neuf NF C 15-100 : 800–2 000 €. Installation complète maison 100 m² : 8 000–15 000 € fournitures comprises.',
+    },
+    {
+      title: 'Choisir un électricien certifié QUALIFELEC',
+      content: 'La certification QUALIFELEC garantit la conformité aux normes. Elle est recommandée pour les travaux importants. Vérifiez aussi l\'assurance RC pro et la garantie décennale avant de signer.',
+    },
+  ],
+  faq: [
+    { q: 'Un électricien peut-il intervenir sans couper le courant ?', a: 'Non, pour des raisons de sécurité, toute intervention sur l\'installation doit se faire hors tension.' },
+    { q: 'Quelle est la durée de validité d\'un diagnostic électrique ?', a: '3 ans en cas de vente, 6 ans en cas de location.' },
+    {
+      q: 'Les travaux électriques sont-ils éligibles aux aides de l\'État ?',
+      a: 'La mise aux normes peut bénéficier des CEE et, dans certains cas, d\'une aide de l\'Anah pour les ménages modestes.',
+    },
+  ],
+  relatedServices: ['electricien', 'domoticien', 'alarme-securite'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'combien-coute-un-plombier',
+  title: 'Combien coûte un plombier ? Tarifs et prix 2025',
+  metaDescription: 'Prix d\'un plombier en 2025 : de 60 à 120 €/h. Tarifs pour débouchage, fuite, installation. Devis gratuit en ligne.',
+  h1: 'Combien coûte un plombier en 2025 ?',
+  category: 'economiser',
+  trade: 'plombier',
+  readingTime: 5,
+  intro: 'Le tarif horaire d\'un plombier varie entre 60 et 120 € selon la région, l\'intervention et l\'urgence. Comprendre ces tarifs vous permet de comparer les devis et d\'éviter les mauvaises surprises.',
+  sections: [
+    {
+      title: 'Tarifs horaires selon la région',
+      content: 'En Île-de-France, le taux horaire oscille entre 80 et 120 €/h, contre 60 à 90 €/h en province. Le déplacement est souvent inclus dans un rayon de 15 km. Une majoration de 50 à 100 % s\'applique la nuit, le week-end ou les jours fériés.',
+    },
+    {
+      title: 'Prix par type d\'intervention',
+      content: 'Débouchage de canalisation : 80–250 €. Réparation d\'une fuite : 90–200 €. Remplacement d\'un chauffe-eau : 800–2 500 € (fourniture + pose). Installation d\'un WC suspendu : 300–700 € hors fourniture.',
+    },
+    {
+      title: 'Comment réduire la facture ?',
+      content: 'Demandez toujours un devis écrit avant intervention. Comparez au moins 3 artisans. Pour les travaux importants, renseignez-vous sur les aides MaPrimeRénov\' et CEE. Évitez les interventions d\'urgence en faisant contrôler votre plomberie annuellement.',
+    },
+  ],
+  faq: [
+    { q: 'Quel est le prix d\'un dépannage plombier en urgence ?', a: 'Un dépannage la nuit ou le week-end coûte 150 à 300 €/h, avec un forfait déplacement de 50 à 80 €.' },
+    {
+      q: 'Le prix d\'un plombier inclut-il la TVA ?',
+      a: 'Oui. Pour les travaux de rénovation dans une résidence principale de plus de 2 ans, la TVA est réduite à 5,5 ou 10 % selon la nature des travaux.',
+    },
+    {
+      q: 'Comment vérifier si un tarif est correct ?',
+      a: 'Consultez les grilles tarifaires de la CAPEB ou de la FFB et comparez au moins 3 devis. Un prix anormalement bas peut cacher des matériaux de mauvaise qualité.',
+    },
+  ],
+  relatedServices: ['plombier', 'chauffagiste'],
+  lastUpdated: '2025-01-15',
+}
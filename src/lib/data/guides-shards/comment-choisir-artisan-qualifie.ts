@@ -0,0 +1,41 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'comment-choisir-artisan-qualifie',
+  title: 'Comment choisir un artisan qualifié : 7 critères essentiels',
+  metaDescription: 'Comment trouver un artisan de confiance ? Certifications, assurances, devis, avis clients. Guide complet pour éviter les arnaques.',
+  h1: 'Comment choisir un artisan qualifié en 2025 ?',
+  category: 'choisir',
+  readingTime: 6,
+  intro: 'Choisir un artisan qualifié est crucial pour la réussite et la sécurité de vos travaux. Ces 7 critères permettent d\'identifier les professionnels sérieux et d\'éviter les mauvaises surprises.',
+  sections: [
+    {
+      title: 'Vérifier les qualifications et certifications',
+      content: 'Un artisan sérieux est inscrit au Répertoire des Métiers ou au RCS. Pour les travaux énergétiques, le label RGE est indispensable pour accéder aux aides de l\'État. Les labels Qualibat, Qualifelec ou QualiPAC attestent d\'une expertise reconnue.',
+    },
+    {
+      title: 'Exiger les assurances obligatoires',
+      content: 'Tout artisan du bâtiment doit avoir une RC Pro et une garantie décennale. Demandez une attestation d\'assurance à jour avant tout chantier. Sans ces documents, vous n\'êtes pas couvert en cas de sinistre.',
+    },
+    {
+      title: 'Comparer les devis et détecter les anomalies',
+      content: 'Obtenez au moins 3 devis détaillés. Un bon devis mentionne : description précise, fournitures, main-d\'œuvre, délais, conditions de paiement. Méfiez-vous des prix anormalement bas et des acomptes supérieurs à 30 %.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Comment vérifier la réputation d\'un artisan ?',
+      a: 'Consultez les avis Google Maps, Pages Jaunes ou des plateformes certifiées. Demandez des références de chantiers récents.',
+    },
+    { q: 'Peut-on payer un artisan en espèces ?', a: 'Jusqu\'à 1 000 €. Au-delà, virement ou chèque obligatoire. Exigez toujours une facture acquittée.' },
+    {
+      q: 'Que faire en cas de litige avec un artisan ?',
+      a: 'Mise en demeure par LRAR, puis médiateur de la consommation. Pour les malfaçons : garantie de parfait achèvement (1 an) ou décennale (10 ans).',
+    },
+  ],
+  relatedServices: ['plombier', 'electricien', 'macon', 'couvreur'],
+  lastUpdated: '2025-01-15',
+}
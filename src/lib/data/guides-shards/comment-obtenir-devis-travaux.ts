@@ -0,0 +1,38 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'comment-obtenir-devis-travaux',
+  title: 'Comment obtenir un devis travaux : guide pratique',
+  metaDescription: 'Comment demander et comparer des devis travaux ? Préparer sa demande, analyser les offres, éviter les pièges. Guide pratique 2025.',
+  h1: 'Comment obtenir un bon devis travaux ?',
+  category: 'choisir',
+  readingTime: 5,
+  intro: 'Un devis bien préparé est la clé d\'un chantier réussi. Voici comment formuler votre demande, quelles informations fournir et comment analyser les offres reçues.',
+  sections: [
+    {
+      title: 'Préparer sa demande de devis',
+      content: 'Rédigez un descriptif précis : superficie, matériaux souhaités, contraintes d\'accès, délai. Prenez des photos et des mesures. Mentionnez si les travaux nécessitent un artisan RGE. Plus la demande est précise, plus les devis sont comparables.',
+    },
+    {
+      title: 'Ce que doit contenir un devis valable',
+      content: 'Un devis doit mentionner : identité et SIRET de l\'entreprise, date et durée de validité, description détaillée des prestations, prix HT et TTC, taux de TVA, conditions de paiement et délai d\'exécution. Sa signature par les deux parties vaut contrat.',
+    },
+    {
+      title: 'Analyser et négocier les devis',
+      content: 'Comparez les postes ligne par ligne. Interrogez sur les différences de prix importantes. La négociation est possible sur les délais ou variantes. Méfiez-vous d\'un devis nettement plus bas que les autres.',
+    },
+  ],
+  faq: [
+    { q: 'Un devis travaux est-il gratuit ?', a: 'Dans la grande majorité des cas, oui pour les particuliers. Des architectes peuvent facturer une étude préalable.' },
+    {
+      q: 'Peut-on changer d\'avis après avoir signé un devis ?',
+      a: 'Si signé à domicile : 14 jours de rétractation. Hors démarchage : des frais d\'annulation peuvent s\'appliquer.',
+    },
+    { q: 'Quelle est la durée de validité d\'un devis ?', a: '1 à 3 mois en pratique. La durée doit être indiquée sur le document.' },
+  ],
+  relatedServices: ['plombier', 'electricien', 'macon', 'couvreur', 'carreleur'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'coupure-electricite-que-faire',
+  title: 'Coupure d\'électricité : que faire ? Dépannage électrique',
+  metaDescription: 'Panne d\'électricité chez vous ? Tableau électrique, compteur Linky, voisins. Guide pour identifier la panne et contacter le bon interlocuteur.',
+  h1: 'Coupure d\'électricité : diagnostic et solutions',
+  category: 'urgence',
+  trade: 'electricien',
+  readingTime: 4,
+  intro: 'Avant d\'appeler un électricien, vérifiez ces points essentiels. La plupart des coupures peuvent être résolues sans intervention professionnelle.',
+  sections: [
+    {
+      title: 'Identifier l\'origine de la panne',
+      content: 'Si vos voisins sont aussi privés d\'électricité : panne Enedis (réseau). Sinon, ouvrez le tableau électrique : un disjoncteur a pu sauter. Sur un compteur Linky : voyant rouge fixe = disjoncteur Enedis coupé.',
+    },
+    {
+      title: 'Remettre les disjoncteurs en marche',
+      content: 'Remettez les disjoncteurs ON un par un. Si un saute immédiatement : débranchez tous les appareils du circuit. Si le disjoncteur retient sans appareils = court-circuit dans l\'installation → électricien.',
+    },
+    {
+      title: 'Quand appeler un électricien en urgence ?',
+      content: 'Immédiatement si : étincelles, odeur de brûlé, traces de carbonisation. En cas d\'inondation du local électrique : ne touchez à rien, coupez le courant.',
+    },
+  ],
+  faq: [
+    { q: 'Qui appeler en cas de panne de courant générale ?', a: 'Enedis au 09 70 83 19 70 (numéro d\'urgence 24h/24).' },
+    {
+      q: 'Peut-on remettre l\'électricité soi-même ?',
+      a: 'Vous pouvez réenclencher les disjoncteurs de votre tableau. Le disjoncteur Enedis au compteur ne peut être remis que par un technicien Enedis.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle les dégâts d\'une coupure ?',
+      a: 'La plupart des MRH couvrent les dégâts de surtension (appareils endommagés). Déclarez sous 5 jours ouvrés.',
+    },
+  ],
+  relatedServices: ['electricien', 'domoticien', 'alarme-securite'],
+  lastUpdated: '2025-01-15',
+}
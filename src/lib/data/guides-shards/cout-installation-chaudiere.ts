@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'cout-installation-chaudiere',
+  title: 'Prix installation chaudière 2025 : gaz, fioul, condensation',
+  metaDescription: 'Tarifs installation chaudière 2025 : condensation gaz 2 500–5 000 €. Aides disponibles, économisez jusqu\'à 50 %.',
+  h1: 'Combien coûte l\'installation d\'une chaudière en 2025 ?',
+  category: 'economiser',
+  trade: 'chauffagiste',
+  readingTime: 5,
+  intro: 'Remplacer une chaudière coûte entre 2 500 et 8 000 € selon le type d\'équipement. Les pompes à chaleur gagnent du terrain grâce aux aides de l\'État.',
+  sections: [
+    {
+      title: 'Prix par type de chaudière',
+      content: 'Condensation gaz : 2 500–5 000 €. Fioul à condensation : 3 500–6 000 €. Bois granulés : 8 000–15 000 €. PAC air/eau : 8 000–15 000 € (très aidée). Murale : 2 000–4 000 €. Sol : 3 500–6 000 €.',
+    },
+    {
+      title: 'Aides au remplacement de chaudière',
+      content: 'MaPrimeRénov\' finance le remplacement gaz → PAC ou biomasse (5 000–10 000 € selon revenus). Les CEE apportent 500–2 000 € supplémentaires. Cumulables avec éco-PTZ.',
+    },
+    {
+      title: 'Entretien et durée de vie',
+      content: 'Entretien annuel obligatoire (gaz et fioul) : 100–200 €. Durée de vie d\'une chaudière à condensation bien entretenue : 15 à 20 ans.',
+    },
+  ],
+  faq: [
+    { q: 'Quel est le délai d\'installation d\'une chaudière ?', a: 'Remplacement à l\'identique : 1 journée. Changement de système : 2 à 5 jours.' },
+    { q: 'L\'entretien chaudière est-il obligatoire ?', a: 'Oui, annuellement pour les chaudières gaz et fioul (décret du 9 juin 2009).' },
+    {
+      q: 'Chaudière gaz ou pompe à chaleur : que choisir ?',
+      a: 'Logement bien isolé → PAC air/eau (3× plus efficace). Mal isolé → chaudière à condensation en attendant l\'isolation.',
+    },
+  ],
+  relatedServices: ['chauffagiste', 'pompe-a-chaleur', 'isolation-thermique'],
+  lastUpdated: '2025-01-15',
+}
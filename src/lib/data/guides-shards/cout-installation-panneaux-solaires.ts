@@ -0,0 +1,36 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'cout-installation-panneaux-solaires',
+  title: 'Prix installation panneaux solaires 2025 : photovoltaïque',
+  metaDescription: 'Prix panneaux solaires 2025 : 8 000–15 000 € pour 6 kWc. Prime autoconsommation, TVA 10 %. Retour sur investissement 8–12 ans.',
+  h1: 'Combien coûte l\'installation de panneaux solaires en 2025 ?',
+  category: 'economiser',
+  trade: 'panneaux-solaires',
+  readingTime: 5,
+  intro: 'Une installation photovoltaïque résidentielle coûte entre 8 000 et 20 000 €. Les aides et l\'économie sur la facture permettent un retour sur investissement de 8 à 12 ans.',
+  sections: [
+    {
+      title: 'Prix selon la puissance installée',
+      content: '3 kWc : 5 000–9 000 €. 6 kWc : 8 000–14 000 €. 9 kWc : 12 000–20 000 €. Coût au Wc : 1,50 à 2,50 € fourniture et pose.',
+    },
+    {
+      title: 'Aides et dispositifs fiscaux',
+      content: 'Prime autoconsommation (EDF OA) : 400–1 000 €. TVA à 10 % pour ≤ 3 kWc. Revente surplus : tarif révisé trimestriellement par la CRE (S17, ≤ 9 kWc) — vérifiez le tarif en vigueur sur edf-oa.fr avant tout projet. Certaines collectivités apportent jusqu\'à 2 000 € supplémentaires.',
+    },
+    {
+      title: 'Production et rentabilité',
+      content: '1 kWc produit 900–1 400 kWh/an selon l\'ensoleillement. Installation 6 kWc : 50 à 80 % des besoins d\'une famille de 4. Économie annuelle : 600–1 200 €.',
+    },
+  ],
+  faq: [
+    { q: 'Faut-il un permis pour les panneaux solaires ?', a: 'En zone non protégée : déclaration préalable de travaux. En zone ABF : autorisation spécifique requise.' },
+    { q: 'Quelle orientation et inclinaison idéales ?', a: 'Plein sud, inclinaison 30–35°. Sud-est/sud-ouest réduit la production de 5 à 15 %.' },
+    { q: 'Les panneaux fonctionnent-ils par temps nuageux ?', a: 'Oui, mais avec 10 à 25 % de rendement en moins qu\'en plein soleil.' },
+  ],
+  relatedServices: ['panneaux-solaires', 'electricien', 'renovation-energetique'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'cout-maconnerie-travaux',
+  title: 'Prix maçonnerie 2025 : tarifs par type de travaux',
+  metaDescription: 'Tarifs maçonnerie 2025 : démolition, extension, cloisons, enduits. De 50 à 400 €/m² selon les travaux. Artisan qualifié Qualibat.',
+  h1: 'Combien coûtent les travaux de maçonnerie en 2025 ?',
+  category: 'economiser',
+  trade: 'macon',
+  readingTime: 5,
+  intro: 'Les travaux de maçonnerie vont de la démolition de cloison à la construction d\'une extension. Les tarifs varient de 50 à 400 €/m² selon la complexité.',
+  sections: [
+    {
+      title: 'Prix par type d\'intervention',
+      content: 'Démolition cloison non porteuse : 30–80 €/m². Ouverture mur porteur avec IPN : 1 500–4 000 €. Construction cloison : 80–150 €/m². Extension : 1 200–2 000 €/m². Ravalement façade : 40–100 €/m². Dallage béton : 50–120 €/m².',
+    },
+    {
+      title: 'Travaux structurels : permis et études',
+      content: 'Mur porteur : étude de structure obligatoire (500–2 000 €). Extension > 20 m² : permis de construire. 5–20 m² : déclaration préalable. Surface > 150 m² : architecte obligatoire.',
+    },
+    {
+      title: 'Choisir un maçon qualifié',
+      content: 'Pour travaux structurels, exigez la certification Qualibat. Demandez des références récentes et vérifiez l\'assurance décennale. Les fissures structurelles doivent être évaluées avant travaux.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Comment savoir si un mur est porteur ?',
+      a: 'Murs porteurs perpendiculaires aux solives, 15–20 cm d\'épaisseur minimum. La consultation des plans d\'origine ou d\'un bureau d\'études est la seule méthode fiable.',
+    },
+    {
+      q: 'Peut-on abattre une cloison soi-même ?',
+      a: 'Si légère (placo) et manifestement non porteuse : oui. Vérifiez l\'absence de gaines ou tuyaux. En cas de doute, consultez un professionnel.',
+    },
+    { q: 'Quel délai pour un permis de construire ?', a: '2 mois pour une maison individuelle, 3 mois pour les autres constructions. En zone protégée : jusqu\'à 4 mois.' },
+  ],
+  relatedServices: ['macon', 'charpentier', 'couvreur', 'electricien'],
+  lastUpdated: '2025-01-15',
+}
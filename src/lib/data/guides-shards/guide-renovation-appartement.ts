@@ -0,0 +1,44 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'guide-renovation-appartement',
+  title: 'Guide rénovation appartement 2025 : étapes et budget',
+  metaDescription: 'Comment rénover son appartement ? Étapes, budget (5 000–80 000 €), artisans à contacter, aides disponibles. Guide complet de la peinture à la rénovation totale.',
+  h1: 'Guide complet pour la rénovation d\'un appartement',
+  category: 'entretien',
+  readingTime: 7,
+  intro: 'Rénover un appartement demande une organisation rigoureuse. Que vous souhaitiez rafraîchir la décoration ou entreprendre une rénovation complète, ce guide vous accompagne à chaque étape.',
+  sections: [
+    {
+      title: 'Définir l\'étendue et le budget des travaux',
+      content: 'Évaluez l\'état de chaque pièce : électricité, plomberie, isolation, revêtements. Appartement 50 m² : rafraîchissement 5 000–15 000 €. Rénovation complète avec mise aux normes : 30 000–80 000 €.',
+    },
+    {
+      title: 'L\'ordre des travaux à respecter',
+      content: '1) Démolition. 2) Mises aux normes (électricité, plomberie, VMC). 3) Isolation. 4) Plâtrerie et enduits. 5) Menuiseries. 6) Revêtements sol. 7) Peinture. 8) Cuisine et salle de bain. 9) Électricité de finition.',
+    },
+    {
+      title: 'Gérer les démarches et les artisans',
+      content: 'Vérifiez le règlement de copropriété avant de modifier des cloisons ou la plomberie. Planifiez les artisans 4 à 8 semaines à l\'avance. Pour les rénovations importantes, un maître d\'œuvre (8–15 % du budget) simplifie la coordination.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Faut-il prévenir son propriétaire pour des travaux ?',
+      a: 'Si vous êtes locataire, l\'accord écrit du propriétaire est requis pour toute transformation. Les embellissements réversibles (peinture) sont généralement autorisés.',
+    },
+    {
+      q: 'Peut-on rénover sans changer les fenêtres ?',
+      a: 'Oui, mais les fenêtres représentent 10 à 25 % des déperditions thermiques. Des solutions alternatives existent : survitrage, joint d\'étanchéité.',
+    },
+    {
+      q: 'Comment trouver un architecte d\'intérieur ?',
+      a: 'Honoraires : 8 à 15 % du budget travaux. Recommandé pour les rénovations complexes (redistribution des espaces, suivi de chantier).',
+    },
+  ],
+  relatedServices: ['electricien', 'plombier', 'carreleur', 'peintre-en-batiment', 'architecte-interieur'],
+  lastUpdated: '2025-01-15',
+}
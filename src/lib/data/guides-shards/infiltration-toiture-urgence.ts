@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'infiltration-toiture-urgence',
+  title: 'Infiltration toiture : que faire en urgence ? Guide couvreur',
+  metaDescription: 'Infiltration d\'eau par la toiture ? Protégez l\'intérieur, localisez la fuite, appelez un couvreur. Coût des réparations et couverture assurance.',
+  h1: 'Infiltration toiture : urgence et solutions',
+  category: 'urgence',
+  trade: 'couvreur',
+  readingTime: 4,
+  intro: 'Une infiltration de toiture peut causer des dégâts importants en quelques jours. Voici comment réagir en urgence et ce que vous devez savoir avant l\'intervention d\'un couvreur.',
+  sections: [
+    {
+      title: 'Actions d\'urgence immédiates',
+      content: 'Protégez l\'intérieur : seaux, bâches sur les meubles. Si le plafond fait ventre, percez avec précaution pour laisser l\'eau s\'écouler. Coupez l\'électricité dans les pièces touchées. Prenez des photos pour l\'assurance.',
+    },
+    {
+      title: 'Localiser la source de l\'infiltration',
+      content: 'L\'eau peut entrer loin de l\'endroit visible (elle ruisselle sur la charpente). Zones à risque : noues, faîtages, ouvertures (Velux, cheminées), solins d\'étanchéité. Un couvreur peut utiliser une caméra thermique.',
+    },
+    {
+      title: 'Coût de réparation',
+      content: 'Infiltration localisée (quelques tuiles, solin) : 200–800 €. Réfection partielle : 3 000–10 000 €. Réfection complète : 8 000–25 000 € selon surface et matériaux.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Mon assurance couvre-t-elle la réparation de toiture ?',
+      a: 'Les dégâts des eaux intérieurs sont couverts. La réparation de la toiture elle-même : seulement si causée par un événement garanti (tempête, grêle). La vétusté n\'est pas couverte.',
+    },
+    {
+      q: 'Peut-on réparer soi-même une toiture ?',
+      a: 'Les petites réparations accessibles sont possibles pour un bricoleur expérimenté. Tout travail en hauteur sans équipement est dangereux. Faites appel à un couvreur professionnel.',
+    },
+    {
+      q: 'Combien de temps peut-on attendre avant de réparer ?',
+      a: 'L\'eau détériore rapidement la charpente bois (pourriture, mérule) et l\'isolant. Appelez un couvreur dans les 48–72h.',
+    },
+  ],
+  relatedServices: ['couvreur', 'charpentier', 'zingueur', 'etancheiste'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'installation-climatisation-guide',
+  title: 'Installation climatisation : guide prix et conseils 2025',
+  metaDescription: 'Choisir et installer une climatisation réversible en 2025 : prix mono-split et multi-split, marques, consommation et entretien.',
+  h1: 'Guide complet pour l\'installation d\'une climatisation en 2025',
+  category: 'entretien',
+  trade: 'climaticien',
+  readingTime: 5,
+  intro: 'La climatisation réversible est devenue incontournable face aux étés de plus en plus chauds. Une installation bien dimensionnée chauffe l\'hiver et rafraîchit l\'été.',
+  sections: [
+    {
+      title: 'Choisir le bon système',
+      content: 'Mono-split (1 pièce ou 25–50 m²) : 1 500–3 000 € installé. Multi-split (2 à 5 pièces) : 3 000–8 000 €. Climatiseur mobile : 600–1 500 € (sans installation, moins efficace).',
+    },
+    {
+      title: 'Puissance et dimensionnement',
+      content: 'Environ 100 W par m² bien isolé. Pour 20 m² : 2 000–2 500 W suffit. Surdimensionner réduit l\'efficacité et la durée de vie. Un climaticien réalise une étude pour dimensionner correctement.',
+    },
+    {
+      title: 'Entretien et consommation',
+      content: 'COP de 3 à 4 : 3× moins d\'énergie qu\'un radiateur électrique. Entretien annuel recommandé (nettoyage filtres, vérification fluide frigorigène) : 80–150 €.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Faut-il un permis pour installer une climatisation ?',
+      a: 'Déclaration préalable en mairie dans la plupart des cas. En copropriété ou zone ABF : accord requis pour l\'unité extérieure.',
+    },
+    { q: 'Quel COP viser ?', a: 'COP de 3,5 ou plus est excellent. Les modèles haut de gamme atteignent 5 à 6.' },
+    { q: 'Combien de temps dure une climatisation réversible ?', a: '12 à 18 ans bien entretenue.' },
+  ],
+  relatedServices: ['climaticien', 'electricien', 'pompe-a-chaleur'],
+  lastUpdated: '2025-01-15',
+}
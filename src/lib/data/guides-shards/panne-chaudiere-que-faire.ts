@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'panne-chaudiere-que-faire',
+  title: 'Panne de chaudière en hiver : que faire ? Guide urgence',
+  metaDescription: 'Chaudière en panne en hiver ? Vérifiez ces points avant d\'appeler : pression, vanne gaz, code erreur. Guide de dépannage chauffage.',
+  h1: 'Que faire en cas de panne de chaudière en hiver ?',
+  category: 'urgence',
+  trade: 'chauffagiste',
+  readingTime: 4,
+  intro: 'Une panne de chaudière par temps froid est une urgence. Vérifiez ces points simples qui peuvent résoudre le problème sans intervention extérieure.',
+  sections: [
+    {
+      title: 'Vérifications préliminaires',
+      content: 'Vérifiez la pression (1 à 1,5 bar au manomètre). Si trop basse : remplissez via le robinet de remplissage. Consultez le code erreur affiché. Vérifiez que la vanne gaz est ouverte et que les autres appareils à gaz fonctionnent.',
+    },
+    {
+      title: 'Quand appeler un chauffagiste d\'urgence ?',
+      content: 'Appelez immédiatement si : fuite d\'eau visible, présence de gaz (0800 473 333 en priorité), code erreur persistant après réinitialisation, fumée ou odeur anormale.',
+    },
+    {
+      title: 'Solutions de chauffage d\'appoint',
+      content: 'Radiateurs soufflants électriques (1 000–2 500 W). Évitez les appareils à combustion en espace mal ventilé : risque d\'intoxication au CO. Isolez les pièces importantes avec des rideaux épais.',
+    },
+  ],
+  faq: [
+    { q: 'Comment réarmer une chaudière après panne ?', a: 'Attendez 5 minutes, appuyez sur le bouton reset. Si la chaudière s\'arrête de nouveau, appelez un technicien.' },
+    {
+      q: 'Quel est le délai d\'intervention d\'un chauffagiste en urgence ?',
+      a: 'Les délais varient selon la disponibilité des techniciens et votre localisation. Avec un contrat d\'entretien, vous bénéficiez généralement d\'une priorité d\'intervention. Sans contrat, le délai peut être plus long, surtout en plein hiver lorsque la demande est forte.',
+    },
+    { q: 'L\'entretien annuel prévient-il les pannes ?', a: 'Oui, significativement. Les pannes surviennent souvent en début de saison sur des chaudières non entretenues.' },
+  ],
+  relatedServices: ['chauffagiste', 'pompe-a-chaleur', 'plombier'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,41 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'permis-construire-quand',
+  title: 'Permis de construire ou déclaration préalable : quand en avez-vous besoin ?',
+  metaDescription: 'Permis de construire obligatoire au-delà de 20 m² (40 m² en zone urbaine). Déclaration préalable pour petits travaux. Seuils et démarches 2025.',
+  h1: 'Permis de construire ou déclaration préalable : ce qu\'il faut savoir',
+  category: 'choisir',
+  readingTime: 5,
+  intro: 'Avant de commencer des travaux, connaître les autorisations nécessaires est essentiel pour éviter les démolitions forcées et les amendes.',
+  sections: [
+    {
+      title: 'Les travaux sans autorisation',
+      content: 'Peinture et décoration intérieure, remplacement de fenêtres à l\'identique, pose de carrelage, installation de cuisine/salle de bain. Extérieur : clôture < 2 m (sauf règle locale), abri de jardin < 5 m². Vérifiez toujours le PLU de votre commune.',
+    },
+    {
+      title: 'La déclaration préalable de travaux',
+      content: 'Obligatoire pour : extension 5–20 m² (40 m² en zone urbaine PLU), changement d\'aspect extérieur (fenêtres, façade), piscine 10–100 m², abri de jardin 5–20 m². Délai d\'instruction : 1 mois.',
+    },
+    {
+      title: 'Le permis de construire',
+      content: 'Obligatoire au-delà de 20 m² d\'extension (40 m² en zone urbaine), construction neuve > 20 m², piscine > 100 m², changement de destination. Surface > 150 m² : architecte obligatoire. Délai d\'instruction : 2 à 3 mois.',
+    },
+  ],
+  faq: [
+    { q: 'Que risque-t-on à construire sans autorisation ?', a: 'Amende de 1 200 à 6 000 €/m², démolition judiciaire aux frais du propriétaire, hypothèque légale sur le bien.' },
+    {
+      q: 'Le PLU peut-il interdire des travaux normalement autorisés ?',
+      a: 'Oui, le PLU peut imposer des règles plus strictes. Consultez-le avant tout projet (mairie ou géoportail de l\'urbanisme).',
+    },
+    {
+      q: 'Le certificat de conformité est-il obligatoire ?',
+      a: 'La DAACT doit être déposée en mairie dans les 30 jours suivant l\'achèvement (art. R*462-1 Code de l\'urbanisme). Obligatoire pour permis de construire et déclarations préalables.',
+    },
+  ],
+  relatedServices: ['macon', 'couvreur', 'menuisier'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'porte-bloquee-serrurerie',
+  title: 'Porte bloquée : que faire ? Serrurier d\'urgence sans arnaque',
+  metaDescription: 'Porte claquée ou serrure bloquée ? Solutions avant d\'appeler, comment choisir un serrurier fiable, prix d\'une ouverture et risques d\'arnaque.',
+  h1: 'Porte bloquée : solutions et serrurier d\'urgence',
+  category: 'urgence',
+  trade: 'serrurier',
+  readingTime: 4,
+  intro: 'Une porte bloquée est stressante. Voici comment réagir, éviter les arnaques et trouver rapidement un serrurier sérieux disponible en urgence.',
+  sections: [
+    {
+      title: 'Solutions avant d\'appeler un serrurier',
+      content: 'Porte claquée : vérifiez une fenêtre accessible ou un double de clé chez un voisin. Serrure dure : lubrifiez avec huile de paraffine (jamais d\'huile de cuisine). Clé cassée dans la serrure : n\'essayez pas d\'extraire, vous risquez d\'enfoncer le morceau.',
+    },
+    {
+      title: 'Choisir un serrurier fiable',
+      content: 'Évitez les serruriers trouvés via des affiches en cabine ou certains résultats publicitaires Google. Préférez : artisan recommandé par votre assurance habitation, artisan de votre municipalité (certaines villes ont une liste officielle), ou plateforme certifiée.',
+    },
+    {
+      title: 'Prix et risques d\'arnaque',
+      content: 'Dépannage standard : 80–200 € en journée, 150–350 € la nuit ou week-end. Prix annoncé de 600–1 500 € → signe d\'arnaque. Refusez tout paiement sans devis signé. Signalez via signal.conso.gouv.fr.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Mon assurance couvre-t-elle le serrurier d\'urgence ?',
+      a: 'La plupart des MRH incluent une assistance dépannage serrurerie. Vérifiez et appelez votre assureur avant de contacter un serrurier.',
+    },
+    {
+      q: 'Un serrurier peut-il ouvrir sans preuve de domicile ?',
+      a: 'Un serrurier sérieux demandera une pièce d\'identité et idéalement un justificatif de domicile avant d\'intervenir.',
+    },
+    { q: 'Faut-il changer sa serrure après un cambriolage ?', a: 'Oui. Optez pour une serrure certifiée A2P. L\'assurance prend souvent en charge le remplacement.' },
+  ],
+  relatedServices: ['serrurier', 'alarme-securite'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,38 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'prime-cee-comment-obtenir',
+  title: 'Prime énergie CEE 2025 : comment en bénéficier ?',
+  metaDescription: 'Les CEE offrent des primes de 500 à 5 000 € pour vos travaux. Sans conditions de revenus, cumulables avec MaPrimeRénov\'.',
+  h1: 'Comment obtenir la prime CEE en 2025 ?',
+  category: 'economiser',
+  readingTime: 4,
+  intro: 'Les primes CEE permettent d\'obtenir une aide financière sans plafond de revenus pour des travaux de rénovation énergétique. Voici comment en profiter simplement.',
+  sections: [
+    {
+      title: 'Qu\'est-ce que la prime énergie CEE ?',
+      content: 'Obligations imposées aux fournisseurs d\'énergie (EDF, Engie, Total Énergie...) pour financer des travaux d\'économies d\'énergie. La prime est versée en échange de travaux éligibles réalisés par un artisan RGE.',
+    },
+    {
+      title: 'Travaux éligibles aux CEE',
+      content: 'Isolation combles : 1–15 €/m². Isolation murs : 5–25 €/m². PAC : 500–3 000 €. Remplacement chaudière : 300–2 500 €. VMC double flux : 500–1 500 €. Montants plus élevés pour les ménages en précarité énergétique.',
+    },
+    {
+      title: 'Démarche pour obtenir la prime',
+      content: 'Faites la demande AVANT de signer le devis via un opérateur CEE (Hellio, Effy, Économies d\'Énergie...). Ne commencez jamais les travaux avant accord. Après réalisation, envoyez les factures. Prime versée en 1 à 3 mois.',
+    },
+  ],
+  faq: [
+    {
+      q: 'La prime CEE est-elle réservée aux propriétaires ?',
+      a: 'Non, accessible aux propriétaires, bailleurs et locataires (avec accord du propriétaire). Pas de conditions de revenus.',
+    },
+    { q: 'Doit-on choisir le même opérateur CEE que son fournisseur ?', a: 'Non, vous pouvez démarcher n\'importe quel opérateur. Comparez les montants proposés.' },
+    { q: 'La prime CEE est-elle imposable ?', a: 'Non, les primes CEE sont exonérées d\'impôt sur le revenu.' },
+  ],
+  relatedServices: ['isolation-thermique', 'chauffagiste', 'pompe-a-chaleur'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'prix-carrelage-pose',
+  title: 'Prix du carrelage et de la pose en 2025 : tarifs au m²',
+  metaDescription: 'Prix carrelage 2025 : fourniture 5–200 €/m², pose 20–60 €/m². Guide complet par type de surface et conseils pour réduire les coûts.',
+  h1: 'Prix du carrelage et de la pose en 2025',
+  category: 'economiser',
+  trade: 'carreleur',
+  readingTime: 5,
+  intro: 'Le carrelage est l\'un des revêtements les plus durables. Son coût varie de 25 à 260 €/m² selon les matériaux et la pose.',
+  sections: [
+    {
+      title: 'Prix des carreaux selon le type',
+      content: 'Grès cérame émaillé : 5–30 €/m². Grand format pleine masse : 15–80 €/m². Imitation bois rectifié : 20–60 €/m². Pierre naturelle : 30–200 €/m². Mosaïque : 40–150 €/m². Comptez 10–15 % de perte pour les découpes.',
+    },
+    {
+      title: 'Prix de la pose selon la complexité',
+      content: 'Pose simple (joint droit, petit format) : 20–35 €/m². Pose en diagonale : +20–30 %. Grand format (≥60×60) : 35–60 €/m². Dépose ancien carrelage : 10–20 €/m². Ragréage : 10–25 €/m².',
+    },
+    {
+      title: 'Conseils pour réduire le coût',
+      content: 'Choisissez un format standard. Évitez la pose en diagonale (+20–30 % de chutes). Préparez le support vous-même si possible. Commandez 10–15 % de carreaux en plus pour les découpes.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Peut-on poser du carrelage sur de l\'ancien carrelage ?',
+      a: 'Oui si l\'ancien est solide et bien adhérent. Attention à la surhauteur et à la compatibilité avec les portes.',
+    },
+    { q: 'Quel délai de mise en service après pose ?', a: '24–48h avant de marcher dessus. Une semaine avant remise en eau complète (douche).' },
+    { q: 'Quelle épaisseur de colle pour la pose ?', a: '6 à 10 mm pour les petits formats. Colle époxy bi-composant pour grands formats avec enrobage 95 % minimum.' },
+  ],
+  relatedServices: ['carreleur', 'macon', 'salle-de-bain'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'prix-jardin-amenagement',
+  title: 'Prix aménagement jardin 2025 : terrasse, clôture, gazon',
+  metaDescription: 'Tarifs aménagement jardin 2025 : terrasse bois 60–150 €/m², clôture 30–120 €/ml, gazon semé 5–20 €/m². Devis paysagiste gratuit.',
+  h1: 'Combien coûte l\'aménagement d\'un jardin en 2025 ?',
+  category: 'economiser',
+  trade: 'paysagiste',
+  readingTime: 5,
+  intro: 'Aménager un jardin coûte entre 3 000 et 30 000 € selon la surface et les aménagements. Ce guide donne les prix par poste pour budgéter votre projet.',
+  sections: [
+    {
+      title: 'Prix des principales installations',
+      content: 'Terrasse bois exotique : 80–150 €/m². Terrasse composite : 60–120 €/m². Terrasse dallée : 70–150 €/m². Gazon semé : 5–15 €/m². Gazon en rouleaux : 15–35 €/m². Clôture bois : 30–80 €/ml posée. Clôture rigide soudée : 40–100 €/ml.',
+    },
+    {
+      title: 'Coût de l\'entretien annuel',
+      content: 'Tarif horaire paysagiste : 25–50 €/h. Forfait annuel entretien (300 m²) : 300–1 200 €. Prestations : tonte, taille haies, désherbage, ramassage feuilles.',
+    },
+    {
+      title: 'Arrosage automatique et éclairage',
+      content: 'Arrosage automatique : 1 500–5 000 € selon le nombre de zones. Éclairage de jardin basse tension LED : 50–120 € par point lumineux installé.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Faut-il un permis pour une terrasse en bois ?',
+      a: 'Terrasse plain-pied < 20 m² : déclaration préalable si visible depuis la rue. Au-delà ou si surélevée (> 60 cm) : permis de construire possible.',
+    },
+    {
+      q: 'Quelle essence de bois choisir pour une terrasse ?',
+      a: 'Bois exotiques (ipé, teck) : durée 25–40 ans. Pin traité classe 4 : 15–25 ans, bon rapport qualité-prix. Composite : sans entretien, peut être glissant.',
+    },
+    { q: 'Comment entretenir une terrasse en bois ?', a: 'Nettoyeur haute pression chaque printemps. Huile de protection ou saturateur tous les 1–2 ans.' },
+  ],
+  relatedServices: ['paysagiste', 'terrassier', 'macon'],
+  lastUpdated: '2025-01-15',
+}
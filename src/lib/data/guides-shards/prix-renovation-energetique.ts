@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'prix-renovation-energetique',
+  title: 'Prix d\'une rénovation énergétique 2025 : budget global',
+  metaDescription: 'Budget rénovation énergétique : 15 000–80 000 €. Aides MaPrimeRénov\', CEE, éco-PTZ : reste à charge sous 10 000 € pour ménages modestes.',
+  h1: 'Quel budget pour une rénovation énergétique en 2025 ?',
+  category: 'economiser',
+  trade: 'renovation-energetique',
+  readingTime: 6,
+  intro: 'Une rénovation énergétique globale d\'une maison coûte entre 15 000 et 80 000 €. Avec les aides cumulées, le reste à charge peut descendre sous les 10 000 € pour les ménages modestes.',
+  sections: [
+    {
+      title: 'Coût des principaux postes',
+      content: 'Isolation combles : 3 000–8 000 €. ITE : 15 000–30 000 € (maison 100 m²). Remplacement fenêtres : 5 000–15 000 €. PAC : 8 000–15 000 €. VMC double flux : 3 000–6 000 €.',
+    },
+    {
+      title: 'Les aides disponibles en 2025',
+      content: 'MaPrimeRénov\' Rénovation d\'Ampleur : jusqu\'à 80 % (plafond 40 000 € HT). CEE : 500–5 000 € selon travaux. Éco-PTZ : jusqu\'à 50 000 € sur 20 ans. TVA à 5,5 % sur isolation et chauffage.',
+    },
+    {
+      title: 'Gain sur les factures énergétiques',
+      content: 'Passer de G à B réduit les dépenses de chauffage de 60 à 80 %. Pour une maison à 3 000 €/an d\'énergie : économie annuelle de 1 800–2 400 €, retour sur investissement en 5 à 15 ans.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Quelle est la différence entre MaPrimeRénov\' et les CEE ?',
+      a: 'MaPrimeRénov\' est une subvention de l\'État (Anah). Les CEE sont des primes des fournisseurs d\'énergie. Les deux sont cumulables.',
+    },
+    {
+      q: 'Faut-il passer par un AMO ?',
+      a: 'Pour la rénovation d\'ampleur (aide ≥ 5 000 €), un Accompagnateur Rénov\' est obligatoire depuis janvier 2024, financé à 50 % par l\'État.',
+    },
+    { q: 'Quel DPE viser après rénovation ?', a: 'Classe C minimum (< 180 kWh/m²/an) pour valoriser le bien et éviter les futures contraintes réglementaires.' },
+  ],
+  relatedServices: ['renovation-energetique', 'isolation-thermique', 'pompe-a-chaleur', 'panneaux-solaires'],
+  lastUpdated: '2025-01-15',
+}
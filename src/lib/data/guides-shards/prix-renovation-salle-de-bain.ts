@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'prix-renovation-salle-de-bain',
+  title: 'Prix rénovation salle de bain 2025 : budget complet',
+  metaDescription: 'Budget rénovation salle de bain : 3 000 € (partielle) à 15 000 € (complète). Guide des tarifs par poste : plomberie, carrelage, sanitaires.',
+  h1: 'Prix d\'une rénovation salle de bain en 2025',
+  category: 'economiser',
+  trade: 'salle-de-bain',
+  readingTime: 6,
+  intro: 'Rénover une salle de bain coûte entre 3 000 et 15 000 € selon l\'étendue des travaux et les matériaux. Un projet complet implique plomberie, électricité, carrelage, sanitaires et peinture.',
+  sections: [
+    {
+      title: 'Budget selon le type de rénovation',
+      content: 'Rénovation légère (peinture, robinetterie) : 1 500–3 000 €. Rénovation intermédiaire (douche ou baignoire, carrelage) : 4 000–8 000 €. Réfection complète d\'une salle de bain de 6–8 m² : 8 000–15 000 €.',
+    },
+    {
+      title: 'Détail des prix par poste',
+      content: 'Plomberie : 1 500–3 000 €. Carrelage sol et murs (fourniture + pose) : 50–120 €/m². Douche à l\'italienne : 1 500–4 000 €. Meuble vasque : 400–2 000 €. Électricité (spots, sèche-serviette) : 600–1 500 €. Main-d\'œuvre : 30 à 40 % du budget total.',
+    },
+    {
+      title: 'Comment optimiser son budget ?',
+      content: 'Conservez la configuration existante de la plomberie. Choisissez des carreaux de format standard. Comparez les prix sanitaires chez plusieurs distributeurs. Demandez un devis global à un artisan coordinateur.',
+    },
+  ],
+  faq: [
+    { q: 'Quelle est la durée d\'une rénovation complète de salle de bain ?', a: '5 à 10 jours ouvrés selon la taille et la disponibilité des artisans.' },
+    { q: 'Faut-il un permis pour rénover sa salle de bain ?', a: 'Non, sauf si vous créez une fenêtre sur façade (déclaration préalable).' },
+    {
+      q: 'Peut-on rénover soi-même ?',
+      a: 'La peinture et les petits équipements sont accessibles aux bricoleurs. Plomberie et électricité en salle de bain (pièce humide) doivent respecter les normes NF C 15-100.',
+    },
+  ],
+  relatedServices: ['salle-de-bain', 'plombier', 'carreleur', 'electricien'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'que-faire-fuite-eau-urgence',
+  title: 'Fuite d\'eau : que faire en urgence ? Guide étape par étape',
+  metaDescription: 'Fuite d\'eau chez vous ? Couper l\'eau, localiser la fuite, limiter les dégâts. Quand appeler un plombier en urgence ? Guide complet.',
+  h1: 'Fuite d\'eau : que faire en urgence ?',
+  category: 'urgence',
+  trade: 'plombier',
+  readingTime: 4,
+  intro: 'Une fuite d\'eau peut causer des dégâts importants en quelques heures. Ces étapes permettent de limiter les dommages dans l\'attente d\'un plombier.',
+  sections: [
+    {
+      title: 'Étapes immédiates à suivre',
+      content: 'Coupez l\'eau au robinet d\'arrêt général. Si la fuite vient d\'un appareil électrique (chauffe-eau), coupez le disjoncteur. Protégez les meubles et planchers. Prenez des photos pour l\'assurance.',
+    },
+    {
+      title: 'Localiser la fuite',
+      content: 'Relevez votre compteur d\'eau, fermez tous les robinets, revérifiez 2h plus tard : compteur en mouvement = fuite cachée. Un plombier avec caméra thermique peut localiser les fuites dans les murs.',
+    },
+    {
+      title: 'Gérer la déclaration assurance',
+      content: 'Déclarez tout dégât des eaux à votre assurance dans les 5 jours ouvrés. Conservez toutes les factures. La convention IRSI (en vigueur depuis juin 2018) simplifie le règlement entre assureurs en cas de dommages provenant d\'un voisin.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Où se trouve le robinet d\'arrêt général dans un appartement ?',
+      a: 'Sous l\'évier de cuisine, dans le couloir d\'entrée, dans un placard technique ou sur le palier. Repérez-le avant toute urgence.',
+    },
+    {
+      q: 'Comment stopper une fuite temporairement ?',
+      a: 'Un collier de serrage de plomberie (quincaillerie) peut stopper une petite fuite visible. Solution temporaire uniquement.',
+    },
+    {
+      q: 'Qui paye le plombier en cas de dégât des eaux ?',
+      a: 'Si la fuite vient de votre logement : votre assurance habitation (après franchise). Si elle vient du voisin ou des parties communes : assurance du responsable ou copropriété.',
+    },
+  ],
+  relatedServices: ['plombier', 'chauffagiste'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'refection-toiture-guide',
+  title: 'Réfection de toiture : guide complet prix et conseils 2025',
+  metaDescription: 'Guide réfection toiture : matériaux, prix au m², choisir un couvreur, aides disponibles. De la réparation à la rénovation complète.',
+  h1: 'Réfection de toiture : guide complet 2025',
+  category: 'entretien',
+  trade: 'couvreur',
+  readingTime: 6,
+  intro: 'La toiture représente 30 % des déperditions thermiques d\'une maison. Rénover sa couverture, c\'est protéger son bien et réaliser des économies d\'énergie.',
+  sections: [
+    {
+      title: 'Quand faut-il refaire sa toiture ?',
+      content: 'Tuiles : 40–60 ans. Ardoise naturelle : 80–150 ans. Membrane bitumineuse (plate) : 15–25 ans. Signes d\'alerte : tuiles cassées, mousses abondantes, infiltrations, charpente déformée. Audit recommandé au-delà de 30 ans.',
+    },
+    {
+      title: 'Prix selon le type de couverture',
+      content: 'Tuiles terre cuite : 80–150 €/m². Ardoises naturelles : 120–200 €/m². Ardoises fibro-ciment : 60–100 €/m². Zinc : 100–180 €/m². Bac acier : 40–80 €/m². + 10–20 % pour isolation sarking.',
+    },
+    {
+      title: 'Aides pour la rénovation de toiture',
+      content: 'Si rénovation + isolation sarking : éligible MaPrimeRénov\' et CEE. TVA à 10 % pour travaux sur résidences principales de plus de 2 ans.',
+    },
+  ],
+  faq: [
+    { q: 'Quelle saison pour refaire une toiture ?', a: 'Printemps ou automne, par temps sec. Évitez l\'hiver (gel) et les fortes chaleurs estivales.' },
+    {
+      q: 'Doit-on déclarer une réfection de toiture en mairie ?',
+      a: 'Si changement de matériaux ou modification de forme : déclaration préalable. Simple remplacement à l\'identique : aucune démarche.',
+    },
+    {
+      q: 'L\'isolation sarking vaut-elle le surcoût ?',
+      a: 'Oui, mutualiser les frais d\'échafaudage et de main-d\'œuvre est rentable. Surcoût de 30–60 €/m² compensé par les aides et économies d\'énergie.',
+    },
+  ],
+  relatedServices: ['couvreur', 'charpentier', 'zingueur', 'isolation-thermique'],
+  lastUpdated: '2025-01-15',
+}
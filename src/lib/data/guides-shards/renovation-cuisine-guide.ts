@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'renovation-cuisine-guide',
+  title: 'Rénovation cuisine : budget, étapes et conseils 2025',
+  metaDescription: 'Rénover sa cuisine : 3 000 à 25 000 € selon l\'étendue. Guide travaux par poste, ordre d\'intervention des artisans, conseils budget.',
+  h1: 'Guide complet pour rénover sa cuisine en 2025',
+  category: 'entretien',
+  trade: 'cuisiniste',
+  readingTime: 6,
+  intro: 'La cuisine est la pièce à vivre la plus sollicitée et souvent la plus coûteuse à rénover. Ce guide vous permet de planifier votre projet et coordonner les différents corps de métier.',
+  sections: [
+    {
+      title: 'Budget selon le type de rénovation',
+      content: 'Rafraîchissement (peinture portes, plan de travail, robinetterie) : 1 500–4 000 €. Rénovation intermédiaire : 5 000–10 000 €. Rénovation complète d\'une cuisine de 12 m² : 12 000–25 000 €.',
+    },
+    {
+      title: 'Ordre des travaux',
+      content: '1) Dépose ancienne cuisine. 2) Plomberie et électricité. 3) Carrelage ou revêtement sol. 4) Pose des meubles. 5) Plan de travail. 6) Crédence. 7) Électroménager encastré. 8) Plomberie de finition. 9) Électricité de finition.',
+    },
+    {
+      title: 'Cuisiniste ou gestion directe ?',
+      content: 'Cuisiniste : plus simple, plus coûteux (marge 30–50 %). Gérer les artisans soi-même : moins cher mais demande du temps. Option intermédiaire : meubles en grande surface, pose par un cuisiniste indépendant.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Combien de temps pour installer une cuisine neuve ?',
+      a: 'Dans un volume existant : 3 à 5 jours. Avec plomberie, électricité et carrelage : 2 à 4 semaines supplémentaires.',
+    },
+    {
+      q: 'Peut-on rénover sa cuisine soi-même ?',
+      a: 'Peinture des portes d\'armoires, crédence adhésive et robinetterie sont accessibles aux bricoleurs. Plomberie et électricité nécessitent des professionnels.',
+    },
+    { q: 'Faut-il un permis pour changer sa cuisine ?', a: 'Non, sauf déplacement de murs porteurs ou modification de façade.' },
+  ],
+  relatedServices: ['cuisiniste', 'plombier', 'electricien', 'carreleur'],
+  lastUpdated: '2025-01-15',
+}
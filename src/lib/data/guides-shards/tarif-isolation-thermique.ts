@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'tarif-isolation-thermique',
+  title: 'Prix isolation thermique 2025 : combles, murs, sols',
+  metaDescription: 'Tarifs isolation thermique 2025 : combles perdus de 20 à 50 €/m², ITE de 100 à 250 €/m². Aides MaPrimeRénov\' disponibles.',
+  h1: 'Prix de l\'isolation thermique en 2025',
+  category: 'economiser',
+  trade: 'isolation-thermique',
+  readingTime: 5,
+  intro: 'Isoler son logement est l\'investissement le plus rentable pour réduire les factures d\'énergie. Les coûts varient de 20 €/m² pour des combles perdus à 250 €/m² pour une isolation par l\'extérieur.',
+  sections: [
+    {
+      title: 'Prix par type d\'isolation',
+      content: 'Combles perdus (soufflage) : 20–50 €/m². Combles aménagés : 40–80 €/m². Murs par l\'intérieur (ITI) : 30–80 €/m². Isolation thermique par l\'extérieur (ITE) : 100–250 €/m². Plancher bas : 25–60 €/m².',
+    },
+    {
+      title: 'Aides financières disponibles',
+      content: 'MaPrimeRénov\' : 10 à 80 % selon le profil de revenus. CEE : primes complémentaires via fournisseurs d\'énergie. Éco-PTZ : jusqu\'à 50 000 € sans intérêts. Ces aides sont cumulables.',
+    },
+    {
+      title: 'Choisir le bon matériau isolant',
+      content: 'Laine de verre/roche : plus économique (5–15 €/m²). Ouate de cellulose : bon rapport qualité-prix + acoustique. Polyuréthane : meilleures performances, plus cher. Pour des combles perdus, le soufflage en vrac est la solution la plus rapide.',
+    },
+  ],
+  faq: [
+    {
+      q: 'Quelle isolation est la plus efficace pour les combles ?',
+      a: 'Pour combles perdus : soufflage laine minérale ou ouate (R ≥ 7 m².K/W). Pour combles aménagés : panneaux rigides polyuréthane ou laine de bois.',
+    },
+    { q: 'Combien d\'années pour rentabiliser une isolation ?', a: 'L\'isolation des combles est amortie en 3 à 7 ans. Avec les aides, moins de 3 ans pour les ménages modestes.' },
+    {
+      q: 'L\'isolation est-elle obligatoire lors d\'une rénovation ?',
+      a: 'Depuis le 1er janvier 2017 (décret 2016-711 du 30 mai 2016), une isolation minimale est requise lors de travaux importants sur un bâtiment existant.',
+    },
+  ],
+  relatedServices: ['isolation-thermique', 'renovation-energetique', 'chauffagiste'],
+  lastUpdated: '2025-01-15',
+}
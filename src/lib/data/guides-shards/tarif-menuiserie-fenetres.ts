@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'tarif-menuiserie-fenetres',
+  title: 'Prix fenêtres et menuiserie 2025 : PVC, alu, bois',
+  metaDescription: 'Tarifs fenêtres 2025 : PVC 400–800 €, aluminium 700–1 500 €, bois 600–1 800 €. Prix de pose, aides CEE. Devis gratuit.',
+  h1: 'Combien coûte le remplacement des fenêtres en 2025 ?',
+  category: 'economiser',
+  trade: 'menuisier',
+  readingTime: 5,
+  intro: 'Remplacer ses fenêtres est l\'un des travaux les plus rentables pour améliorer le confort. Les prix varient de 400 à 1 800 € par fenêtre selon les matériaux.',
+  sections: [
+    {
+      title: 'Prix par matériau et vitrage',
+      content: 'PVC double vitrage (120×120) : 400–800 €. Aluminium : 700–1 500 €. Bois : 600–1 800 €. Velux : 500–1 200 € posé. Triple vitrage : +15 à 30 % vs double vitrage.',
+    },
+    {
+      title: 'Coûts de pose et dépose',
+      content: 'Dépose fenêtre : 50–100 €/unité. Pose nouvelle fenêtre : 150–300 €/unité. Maison 10 fenêtres : 6 000–15 000 € (fourniture + pose). Raccords (enduits, peinture) : 50–200 € par fenêtre.',
+    },
+    {
+      title: 'Aides pour le remplacement',
+      content: 'TVA à 5,5 % pour travaux d\'amélioration énergétique. MaPrimeRénov\' disponible uniquement dans un bouquet de travaux depuis 2024. Renseignez-vous sur les aides locales.',
+    },
+  ],
+  faq: [
+    {
+      q: 'PVC, aluminium ou bois : lequel choisir ?',
+      a: 'PVC : meilleur rapport qualité-prix, entretien minimal. Aluminium : grandes baies, architecture contemporaine. Bois : esthétique et isolant, entretien tous les 5–7 ans.',
+    },
+    {
+      q: 'Le double vitrage suffit-il ?',
+      a: 'Pour la plupart des logements, un double vitrage avec lame argon (Uw ≤ 1,4 W/m²K) est suffisant. Triple vitrage recommandé en zone froide ou pour rénovation performante.',
+    },
+    { q: 'Faut-il changer les volets en même temps ?', a: 'Si vétustes ou mal adaptés aux nouvelles fenêtres, c\'est le bon moment (économies sur déplacement et échafaudages).' },
+  ],
+  relatedServices: ['menuisier', 'vitrier', 'isolation-thermique'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,39 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'tarif-peinture-interieure',
+  title: 'Prix peinture intérieure 2025 : tarifs au m² par type de surface',
+  metaDescription: 'Tarifs peinture intérieure 2025 : 20–50 €/m² selon la surface et la préparation. Murs, plafonds, boiseries : guide complet des prix.',
+  h1: 'Combien coûte la peinture intérieure en 2025 ?',
+  category: 'economiser',
+  trade: 'peintre-en-batiment',
+  readingTime: 4,
+  intro: 'Repeindre une pièce coûte entre 20 et 60 €/m². Les travaux de préparation représentent souvent 50 % du coût total.',
+  sections: [
+    {
+      title: 'Tarifs par type de surface',
+      content: 'Peinture de murs (état correct) : 20–35 €/m². Plafond : 25–45 €/m². Boiseries et menuiseries : 15–35 €/ml. Réfection complète avec enduit : 40–70 €/m².',
+    },
+    {
+      title: 'Le coût de la préparation des supports',
+      content: 'Bouchage fissures fines : 5–10 €/m². Enduit lissé : 20–40 €/m². Sous-couche : 5–10 €/m² supplémentaire. Dépose papier peint : 8–15 €/m².',
+    },
+    {
+      title: 'Faire soi-même ou faire faire ?',
+      content: 'Fournitures : 20–40 €/m². La préparation, les encadrements et les plafonds sont souvent sous-estimés. Un professionnel est recommandé pour les finitions haut de gamme et les grands volumes.',
+    },
+  ],
+  faq: [
+    { q: 'Quelle peinture pour une salle de bain ?', a: 'Peinture hydrofuge classée E ou spéciale salle de bain avec anti-moisissures. Préférez le satiné ou le brillant au mat.' },
+    { q: 'Combien de couches sont nécessaires ?', a: 'En général 2 couches sur une sous-couche. 3 couches pour recouvrir un mur très foncé en clair.' },
+    {
+      q: 'Différence entre mat, velours et satin ?',
+      a: 'Mat : cache mieux les imperfections, s\'entretient moins bien. Velours : meilleur compromis. Satin/brillant : pour boiseries et zones de passage.',
+    },
+  ],
+  relatedServices: ['peintre-en-batiment', 'platrier', 'decorateur'],
+  lastUpdated: '2025-01-15',
+}
@@ -0,0 +1,36 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/guides.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Guide } from '../guides'
+
+export const entry: Guide = {
+  slug: 'tarif-pompe-a-chaleur',
+  title: 'Prix d\'une pompe à chaleur 2025 : air/eau, air/air',
+  metaDescription: 'Tarif PAC 2025 : air/eau 8 000–15 000 €, air/air 2 500–6 000 €. MaPrimeRénov\' jusqu\'à 10 000 €. Devis gratuit.',
+  h1: 'Combien coûte une pompe à chaleur en 2025 ?',
+  category: 'economiser',
+  trade: 'pompe-a-chaleur',
+  readingTime: 5,
+  intro: 'Une PAC coûte entre 2 500 et 15 000 € installée selon le type. Avec MaPrimeRénov\', jusqu\'à 10 000 € de subvention pour les ménages modestes.',
+  sections: [
+    {
+      title: 'Prix par type de PAC',
+      content: 'Air/air (mono-split) : 2 500–6 000 €. Air/eau (remplace chaudière) : 8 000–15 000 €. Géothermique : 15 000–25 000 €. Air/eau haute température : 10 000–18 000 €.',
+    },
+    {
+      title: 'MaPrimeRénov\' pour une PAC en 2025',
+      content: 'MaPrimeRénov\' couvre 20 à 65 % du coût (plafond 4 000–10 000 € selon revenus). Les CEE ajoutent 500–3 000 €. Reste à charge sous 1 000 € pour ménages très modestes.',
+    },
+    {
+      title: 'Consommation et économies',
+      content: 'COP 3–4 : 3 à 4 kWh produits pour 1 kWh consommé. Réduction facture chauffage de 40 à 60 % vs chaudière électrique. Coût de chauffage d\'une maison 100 m² : 600–900 €/an.',
+    },
+  ],
+  faq: [
+    { q: 'Une PAC est-elle adaptée à une vieille maison ?', a: 'Oui, si le logement est isolé ou avec une PAC haute température. Sinon, améliorer l\'isolation d\'abord.' },
+    { q: 'Quelle puissance de PAC pour ma maison ?', a: 'Environ 1 kW par 10 m² bien isolés. Un chauffagiste fait un bilan thermique pour dimensionner correctement.' },
+    { q: 'La PAC fonctionne-t-elle quand il gèle ?', a: 'Les PAC modernes fonctionnent jusqu\'à -15 à -25 °C. Un appoint électrique peut s\'activer en dessous de -7 °C.' },
+  ],
+  relatedServices: ['pompe-a-chaleur', 'chauffagiste', 'renovation-energetique', 'isolation-thermique'],
+  lastUpdated: '2025-01-15',
+}
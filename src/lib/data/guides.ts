@@ -1,3 +1,16 @@
+/**
+ * Guides pratiques des pages /guides/.
+ *
+ * Après modification, lancer `python3 -m scripts.pipeline content` pour
+ * régénérer guides-index.ts et les shards de guides-shards/.
+ */
+
+import { GUIDE_INDEX, GUIDES_BY_CATEGORY, GUIDES_BY_TRADE } from './guides-index'
+
+function pick(index: Record<string, number[]>, key: string): Guide[] {
+  return Object.prototype.hasOwnProperty.call(index, key) ? index[key].map((i) => guides[i]) : []
+}
+
 export interface Guide {
   slug: string
   title: string
@@ -652,13 +665,13 @@ export function getGuideSlugs(): string[] {
 }
 
 export function getGuideBySlug(slug: string): Guide | undefined {
-  return guides.find((g) => g.slug === slug)
+  return Object.prototype.hasOwnProperty.call(GUIDE_INDEX, slug) ? guides[GUIDE_INDEX[slug]] : undefined
 }
 
 export function getGuidesByCategory(category: Guide['category']): Guide[] {
-  return guides.filter((g) => g.category === category)
+  return pick(GUIDES_BY_CATEGORY, category)
 }
 
 export function getGuidesByTrade(trade: string): Guide[] {
-  return guides.filter((g) => g.trade === trade)
+  return pick(GUIDES_BY_TRADE, trade)
 }
@@ -0,0 +1,4597 @@
+// Generated by `python3 -m scripts.pipeline links` from src/lib/data/france.ts, navigation.ts and the backlinks exports.
+// Do not edit by hand: re-run the command instead.
+
+/** Length of each NEARBY_VILLES / NEARBY_IN_DEPARTEMENT list */
+export const NEARBY_MAX: number = 12
+
+/** Positions in `villes` of the closest villes of each ville, nearest first */
+export const NEARBY_VILLES: number[][] = [
+  [94, 35, 107, 31, 19, 105, 285, 138, 46, 43, 66, 38],
+  [141, 21, 139, 1862, 1977, 167, 88, 11, 391, 807, 345, 555],
+  [15, 809, 1770, 1008, 1810, 1697, 748, 1597, 1782, 1564, 1326, 987],
+  [325, 455, 353, 1178, 1095, 1004, 1762, 1116, 2237, 2047, 602, 89],
+  [259, 65, 282, 850, 70, 132, 1828, 217, 98, 193, 823, 907],
+  [131, 459, 605, 1695, 1554, 1122, 1464, 1009, 880, 452, 1114, 521],
+  [999, 599, 1286, 344, 381, 2236, 1226, 1659, 161, 866, 1124, 20],
+  [241, 958, 1147, 2081, 1845, 803, 1960, 1882, 228, 1556, 890, 502],
+  [1228, 78, 2146, 594, 1056, 800, 374, 2239, 1783, 794, 1427, 921],
+  [42, 41, 1525, 1661, 2032, 361, 197, 251, 370, 431, 2029, 831],
+  [954, 1143, 1133, 1618, 1673, 510, 1804, 2228, 483, 677, 1936, 824],
+  [88, 391, 345, 807, 1862, 1977, 108, 983, 141, 555, 907, 1],
+  [995, 316, 703, 659, 194, 881, 776, 380, 106, 817, 656, 854],
+  [1213, 1782, 1598, 2261, 576, 614, 1297, 265, 1473, 809, 1770, 1810],
+  [1664, 2199, 2212, 979, 1262, 1058, 575, 501, 2200, 36, 894, 1303],
+  [2, 1008, 809, 1810, 1770, 748, 1597, 1697, 987, 1564, 1782, 1326],
+  [2223, 2165, 1441, 481, 390, 2121, 162, 1471, 2088, 766, 476, 32],
+  [2112, 562, 862, 597, 819, 670, 347, 386, 880, 116, 1428, 729],
+  [211, 1245, 433, 1420, 96, 1342, 840, 1456, 247, 257, 565, 1137],
+  [94, 437, 546, 105, 38, 285, 0, 35, 1078, 187, 43, 138],
+  [866, 1266, 637, 2236, 344, 126, 1226, 1105, 1286, 47, 152, 599],
+  [1, 141, 167, 139, 1042, 408, 1862, 1977, 363, 555, 484, 2169],
+  [566, 518, 1703, 871, 657, 371, 1710, 1705, 1867, 1165, 249, 614],
+  [2124, 1006, 1313, 1428, 2072, 785, 2027, 1219, 670, 819, 366, 862],
+  [1229, 1459, 607, 1445, 1128, 715, 2230, 1583, 1275, 85, 1475, 461],
+  [905, 2125, 1798, 2027, 1333, 1515, 144, 634, 1604, 347, 1610, 862],
+  [1879, 1118, 1974, 1896, 415, 1548, 110, 178, 985, 776, 1982, 1717],
+  [1938, 603, 2119, 1657, 1449, 903, 611, 1281, 257, 754, 491, 212],
+  [1962, 1905, 2052, 899, 1616, 779, 1940, 750, 1800, 147, 304, 1165],
+  [884, 1140, 1335, 708, 629, 569, 179, 2217, 678, 825, 1484, 759],
+  [1154, 839, 1316, 980, 2051, 1457, 1830, 104, 1011, 989, 153, 59],
+  [138, 578, 43, 285, 0, 55, 618, 38, 107, 19, 215, 94],
+  [1992, 2197, 2121, 390, 545, 660, 1580, 1441, 1356, 2223, 1383, 377],
+  [421, 845, 1864, 523, 894, 1262, 1058, 1982, 979, 136, 816, 315],
+  [434, 2094, 1652, 1506, 1259, 1792, 1210, 786, 888, 144, 746, 537],
+  [94, 105, 107, 0, 46, 66, 19, 187, 407, 285, 31, 138],
+  [2200, 2212, 797, 1303, 1426, 2199, 501, 14, 695, 1664, 507, 567],
+  [54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365, 693],
+  [285, 1078, 437, 546, 43, 19, 138, 618, 31, 0, 94, 1603],
+  [2017, 841, 1502, 2004, 912, 79, 2031, 157, 977, 377, 1442, 502],
+  [676, 1707, 1129, 1483, 632, 540, 708, 2126, 29, 2217, 2259, 1642],
+  [42, 9, 1525, 2032, 1661, 197, 361, 251, 2029, 431, 831, 370],
+  [41, 9, 1525, 2032, 1661, 197, 361, 251, 2029, 831, 370, 431],
+  [138, 285, 38, 31, 618, 578, 0, 1078, 55, 19, 437, 546],
+  [46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230, 237],
+  [31, 43, 48, 56, 57, 75, 76, 84, 86, 99, 102, 130],
+  [66, 107, 35, 0, 362, 94, 105, 407, 516, 450, 31, 328],
+  [536, 757, 1105, 484, 637, 298, 363, 266, 542, 1266, 126, 20],
+  [31, 43, 45, 56, 57, 75, 76, 84, 86, 99, 102, 130],
+  [2068, 1273, 278, 1207, 1940, 1043, 1438, 1610, 1973, 2018, 729, 1823],
+  [19, 35, 51, 71, 72, 92, 94, 105, 119, 122, 125, 133],
+  [19, 35, 50, 71, 72, 92, 94, 105, 119, 122, 125, 133],
+  [2139, 700, 986, 431, 77, 2077, 2032, 2171, 370, 1661, 196, 41],
+  [240, 324, 368, 1159, 1353, 1781, 2046],
+  [58, 232, 203, 245, 1027, 73, 726, 723, 560, 916, 67, 1396],
+  [578, 255, 31, 138, 601, 618, 43, 1847, 215, 285, 0, 464],
+  [31, 43, 45, 48, 57, 75, 76, 84, 86, 99, 102, 130],
+  [31, 43, 45, 48, 56, 75, 76, 84, 86, 99, 102, 130],
+  [54, 232, 203, 245, 1027, 73, 726, 723, 560, 916, 67, 1396],
+  [292, 104, 1949, 1124, 161, 381, 1011, 1659, 1517, 999, 6, 1154],
+  [2002, 968, 164, 1796, 1802, 1543, 2245, 1944, 267, 425, 414, 1363],
+  [395, 1666, 1596, 1130, 1825, 717, 1627, 97, 509, 1254, 134, 112],
+  [1032, 507, 797, 808, 2200, 567, 36, 1041, 2012, 142, 2212, 1936],
+  [8, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372, 374],
+  [44, 46, 66, 82, 95, 107, 118, 140, 155, 159, 230, 237],
+  [850, 70, 259, 132, 4, 217, 1828, 98, 282, 193, 823, 907],
+  [46, 107, 35, 362, 0, 407, 94, 516, 105, 450, 328, 80],
+  [1396, 916, 1954, 1590, 148, 65, 70, 282, 259, 217, 4, 823],
+  [891, 1134, 1274, 1131, 320, 665, 129, 1037, 1323, 115, 937, 376],
+  [585, 587, 521, 1114, 1009, 2227, 1115, 1554, 131, 1334, 5, 1695],
+  [850, 65, 132, 259, 217, 98, 4, 1828, 193, 282, 823, 907],
+  [19, 35, 50, 51, 72, 92, 94, 105, 119, 122, 125, 133],
+  [19, 35, 50, 51, 71, 92, 94, 105, 119, 122, 125, 133],
+  [726, 723, 1027, 245, 232, 54, 58, 203, 560, 916, 67, 1396],
+  [261, 1603, 464, 810, 1078, 618, 38, 437, 546, 1847, 43, 285],
+  [31, 43, 45, 48, 56, 57, 76, 84, 86, 99, 102, 130],
+  [31, 43, 45, 48, 56, 57, 75, 84, 86, 99, 102, 130],
+  [2077, 2139, 2171, 196, 700, 52, 986, 431, 2032, 370, 1661, 251],
+  [594, 8, 1228, 2146, 1056, 800, 1783, 794, 374, 2239, 921, 1427],
+  [502, 912, 1502, 841, 2017, 1442, 39, 1882, 1556, 513, 803, 958],
+  [235, 362, 1329, 215, 516, 66, 46, 154, 601, 107, 1573, 450],
+  [2, 15, 121, 137, 169, 175, 208, 223, 231, 270, 293, 399],
+  [44, 46, 64, 66, 95, 107, 118, 140, 155, 159, 230, 237],
+  [913, 247, 1263, 576, 1420, 195, 814, 1598, 2261, 1160, 736, 265],
+  [31, 43, 45, 48, 56, 57, 75, 76, 86, 99, 102, 130],
+  [1275, 461, 715, 2230, 1459, 812, 1475, 607, 24, 1128, 103, 1229],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 99, 102, 130],
+  [1730, 373, 917, 1072, 888, 1423, 1093, 537, 250, 177, 746, 1506],
+  [11, 391, 345, 1862, 1977, 807, 108, 983, 141, 555, 907, 1],
+  [1899, 1620, 1762, 704, 1178, 1095, 325, 612, 3, 455, 488, 1116],
+  [9, 41, 42, 52, 172, 192, 197, 198, 276, 310, 334, 335],
+  [226, 376, 937, 115, 1274, 1134, 68, 891, 1131, 320, 665, 129],
+  [19, 35, 50, 51, 71, 72, 94, 105, 119, 122, 125, 133],
+  [669, 654, 2057, 1650, 333, 932, 2088, 1184, 873, 239, 406, 176],
+  [105, 35, 0, 19, 107, 187, 46, 285, 66, 38, 437, 546],
+  [44, 46, 64, 66, 82, 107, 118, 140, 155, 159, 230, 237],
+  [840, 257, 1137, 1245, 603, 433, 1449, 1342, 491, 27, 1938, 211],
+  [2018, 1438, 1973, 717, 1596, 1273, 1043, 1627, 1130, 61, 492, 2015],
+  [217, 1828, 193, 70, 823, 132, 850, 65, 907, 259, 4, 983],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 102, 130],
+  [38, 74, 186, 210, 227, 261, 264, 271, 290, 301, 323, 326],
+  [37, 54, 58, 111, 201, 203, 219, 225, 232, 245, 365, 693],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 130],
+  [812, 1557, 707, 1756, 461, 684, 109, 1475, 85, 1275, 1061, 1334],
+  [1011, 59, 292, 1154, 1949, 153, 30, 1124, 161, 381, 839, 1316],
+  [94, 35, 19, 187, 0, 107, 46, 66, 437, 546, 407, 285],
+  [1406, 444, 1016, 854, 328, 407, 606, 450, 187, 703, 105, 35],
+  [46, 66, 35, 0, 94, 105, 362, 31, 19, 407, 138, 285],
+  [983, 345, 807, 391, 11, 88, 1862, 1977, 907, 555, 823, 141],
+  [707, 1557, 1334, 2227, 1756, 1039, 587, 103, 684, 585, 1115, 1804],
+  [985, 1982, 816, 229, 432, 1030, 810, 982, 1961, 817, 1603, 261],
+  [37, 54, 58, 101, 201, 203, 219, 225, 232, 245, 365, 693],
+  [1240, 2065, 1254, 1130, 134, 1301, 452, 600, 405, 2015, 1695, 1464],
+  [106, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407, 419],
+  [80, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [937, 376, 91, 226, 1274, 1134, 68, 891, 1131, 320, 665, 129],
+  [2022, 386, 600, 1464, 1122, 2015, 452, 492, 880, 1254, 729, 459],
+  [1530, 1363, 425, 2002, 2255, 968, 2245, 1429, 267, 60, 1440, 1802],
+  [44, 46, 64, 66, 82, 95, 107, 140, 155, 159, 230, 237],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 122, 125, 133],
+  [4, 65, 70, 132, 184, 259, 282, 303, 441, 495, 499, 564],
+  [2, 15, 81, 137, 169, 175, 208, 223, 231, 270, 293, 399],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 125, 133],
+  [881, 1548, 732, 776, 276, 380, 1118, 316, 1896, 1879, 892, 194],
+  [55, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 133],
+  [637, 1105, 20, 866, 536, 47, 363, 1226, 167, 344, 1266, 484],
+  [80, 114, 213, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [1687, 1075, 612, 181, 1095, 909, 1762, 1899, 1089, 1620, 387, 1372],
+  [1037, 665, 320, 1323, 1131, 891, 68, 1134, 1274, 115, 937, 376],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [5, 459, 605, 1695, 1554, 1122, 1009, 1114, 1464, 452, 521, 880],
+  [850, 70, 65, 1828, 259, 4, 217, 98, 193, 282, 823, 907],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2065, 1301, 112, 1240, 405, 1130, 1254, 61, 452, 1695, 600, 521],
+  [597, 510, 819, 483, 562, 2112, 1143, 2228, 954, 824, 1006, 2072],
+  [523, 1528, 268, 1088, 421, 1431, 33, 1961, 816, 1058, 1985, 845],
+  [2, 15, 81, 121, 169, 175, 208, 223, 231, 270, 293, 399],
+  [43, 31, 285, 578, 618, 38, 0, 55, 19, 1078, 94, 437],
+  [167, 1, 21, 126, 141, 1105, 363, 637, 484, 536, 1042, 1862],
+  [44, 46, 64, 66, 82, 95, 107, 118, 155, 159, 230, 237],
+  [1862, 1977, 1, 21, 88, 11, 391, 807, 345, 555, 108, 139],
+  [1533, 2012, 677, 1936, 808, 577, 1041, 1673, 1618, 2228, 165, 886],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1792, 1604, 634, 1515, 2125, 1652, 537, 905, 1506, 25, 786, 2094],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1800, 750, 1216, 1616, 304, 1391, 1083, 1165, 349, 1905, 2118, 488],
+  [1590, 1396, 1954, 67, 916, 282, 4, 259, 65, 70, 850, 132],
+  [8, 63, 78, 180, 253, 262, 327, 336, 341, 360, 372, 374],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1266, 2236, 20, 542, 344, 866, 1432, 999, 637, 736, 720, 298],
+  [989, 1011, 833, 1089, 181, 1877, 104, 2237, 2051, 602, 1154, 1067],
+  [641, 516, 80, 1329, 362, 787, 450, 235, 419, 1209, 66, 784],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 159, 230, 237],
+  [55, 124, 171, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [977, 377, 2031, 1383, 2004, 841, 39, 912, 1653, 2017, 1502, 1478],
+  [1467, 1757, 892, 2203, 310, 380, 586, 2219, 176, 1484, 423, 732],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 230, 237],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [381, 292, 6, 1659, 999, 599, 1124, 1286, 59, 1226, 344, 1517],
+  [1996, 481, 476, 1735, 581, 2165, 766, 238, 1320, 595, 2223, 390],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1543, 1944, 1796, 60, 835, 968, 2002, 1802, 414, 2245, 1794, 1725],
+  [886, 577, 1061, 684, 677, 1533, 482, 142, 1673, 1475, 2012, 1039],
+  [1, 21, 126, 139, 141, 167, 204, 221, 246, 352, 411, 442],
+  [363, 139, 21, 484, 1105, 536, 1042, 126, 47, 637, 1, 757],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [2, 15, 81, 121, 137, 175, 208, 223, 231, 270, 293, 399],
+  [5, 69, 131, 313, 314, 348, 383, 459, 468, 474, 521, 585],
+  [55, 124, 156, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [831, 2029, 732, 276, 197, 1525, 310, 361, 9, 42, 41, 251],
+  [60, 117, 351, 544, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2, 15, 81, 121, 137, 169, 208, 223, 231, 270, 293, 399],
+  [932, 423, 2219, 406, 654, 1467, 686, 2113, 669, 659, 93, 586],
+  [1423, 917, 1823, 1730, 373, 1515, 537, 87, 1072, 1798, 1604, 779],
+  [251, 361, 197, 370, 1661, 1118, 1974, 276, 2032, 1525, 1548, 9],
+  [569, 629, 1140, 884, 1335, 1484, 29, 2203, 825, 2217, 678, 708],
+  [8, 63, 78, 149, 253, 262, 327, 336, 341, 360, 372, 374],
+  [1089, 128, 1687, 833, 612, 153, 2237, 1095, 1075, 989, 1011, 3],
+  [2158, 238, 412, 1320, 722, 1597, 592, 231, 1564, 1996, 1008, 1735],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [4, 65, 70, 120, 132, 259, 282, 303, 441, 495, 499, 564],
+  [531, 367, 1627, 2118, 899, 1973, 304, 1391, 1915, 1905, 1616, 800],
+  [38, 74, 100, 210, 227, 261, 264, 271, 290, 301, 323, 326],
+  [105, 94, 19, 35, 854, 437, 546, 2264, 407, 0, 328, 107],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1744, 1388, 548, 901, 2169, 211, 18, 1617, 1245, 1456, 408, 1859],
+  [55, 124, 156, 171, 220, 242, 243, 244, 255, 263, 281, 283],
+  [3, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780, 799],
+  [9, 41, 42, 52, 90, 172, 197, 198, 276, 310, 334, 335],
+  [1828, 907, 98, 217, 823, 555, 132, 70, 850, 983, 807, 65],
+  [817, 703, 776, 995, 656, 432, 985, 229, 1896, 982, 12, 316],
+  [736, 1432, 1263, 1160, 720, 814, 1617, 83, 1859, 913, 542, 298],
+  [2171, 2077, 77, 2139, 700, 986, 52, 431, 415, 1717, 370, 2032],
+  [361, 1525, 251, 2029, 1661, 9, 276, 178, 831, 172, 42, 732],
+  [9, 41, 42, 52, 90, 172, 192, 197, 276, 310, 334, 335],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [68, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [37, 54, 58, 101, 111, 203, 219, 225, 232, 245, 365, 693],
+  [106, 113, 154, 275, 328, 329, 337, 392, 396, 398, 407, 419],
+  [58, 54, 245, 232, 1027, 73, 726, 723, 560, 916, 67, 1396],
+  [1, 21, 126, 139, 141, 166, 167, 221, 246, 352, 411, 442],
+  [25, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [975, 1581, 623, 1985, 321, 268, 900, 786, 339, 1148, 1528, 1573],
+  [2, 15, 81, 121, 137, 169, 175, 223, 231, 270, 293, 399],
+  [1387, 212, 836, 1281, 740, 754, 557, 903, 611, 2252, 2119, 952],
+  [38, 74, 100, 186, 227, 261, 264, 271, 290, 301, 323, 326],
+  [18, 1245, 433, 1420, 96, 1342, 1456, 840, 247, 257, 565, 1137],
+  [1281, 611, 836, 903, 754, 740, 2119, 209, 557, 1938, 592, 27],
+  [80, 114, 127, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [18, 211, 265, 287, 427, 433, 508, 519, 547, 565, 861, 869],
+  [601, 235, 578, 55, 31, 80, 46, 107, 255, 0, 138, 362],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [98, 1828, 70, 193, 823, 132, 850, 65, 907, 259, 4, 983],
+  [11, 88, 98, 108, 193, 217, 345, 391, 503, 530, 552, 555],
+  [37, 54, 58, 101, 111, 201, 203, 225, 232, 245, 365, 693],
+  [55, 124, 156, 171, 190, 242, 243, 244, 255, 263, 281, 283],
+  [1, 21, 126, 139, 141, 166, 167, 204, 246, 352, 411, 442],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [2, 15, 81, 121, 137, 169, 175, 208, 231, 270, 293, 399],
+  [80, 114, 127, 213, 215, 235, 269, 272, 280, 288, 317, 339],
+  [37, 54, 58, 101, 111, 201, 203, 219, 232, 245, 365, 693],
+  [91, 376, 937, 115, 1274, 1134, 68, 891, 1131, 320, 665, 129],
+  [38, 74, 100, 186, 210, 261, 264, 271, 290, 301, 323, 326],
+  [241, 7, 1446, 1960, 890, 1147, 1845, 2081, 958, 803, 1882, 1556],
+  [432, 982, 817, 656, 985, 2264, 1030, 810, 854, 1603, 194, 703],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 237],
+  [1564, 1326, 722, 1697, 2158, 945, 1008, 2, 15, 1770, 1597, 809],
+  [54, 58, 245, 203, 1027, 73, 726, 723, 560, 916, 67, 1396],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [13, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [80, 215, 1329, 601, 362, 1573, 46, 66, 107, 578, 516, 31],
+  [945, 1297, 1149, 871, 614, 1697, 1326, 231, 371, 722, 1564, 1770],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1320, 2158, 722, 1996, 182, 231, 1564, 1326, 1735, 162, 1597, 581],
+  [1650, 1184, 1769, 333, 1093, 673, 93, 746, 2088, 2057, 419, 669],
+  [53, 324, 368, 1159, 1353, 1781, 2046],
+  [7, 1147, 1960, 1845, 958, 228, 2081, 803, 1882, 890, 1556, 502],
+  [55, 124, 156, 171, 190, 220, 243, 244, 255, 263, 281, 283],
+  [55, 124, 156, 171, 190, 220, 242, 244, 255, 263, 281, 283],
+  [55, 124, 156, 171, 190, 220, 242, 243, 255, 263, 281, 283],
+  [232, 54, 58, 203, 1027, 73, 726, 723, 560, 916, 67, 1396],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 352, 411, 442],
+  [83, 913, 1420, 576, 1598, 2261, 1263, 265, 18, 433, 211, 195],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1867, 1072, 779, 514, 518, 371, 566, 22, 1730, 917, 1703, 87],
+  [514, 1093, 1072, 87, 1730, 1769, 1704, 249, 1867, 766, 373, 746],
+  [361, 1661, 178, 370, 197, 2032, 1525, 9, 431, 42, 41, 276],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [8, 63, 78, 149, 180, 262, 327, 336, 341, 360, 372, 374],
+  [1571, 416, 1725, 1794, 704, 571, 89, 414, 488, 332, 1620, 1899],
+  [55, 578, 1847, 601, 618, 31, 138, 43, 215, 464, 285, 38],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [840, 96, 1137, 603, 27, 1938, 1449, 491, 1657, 1342, 2119, 433],
+  [1211, 1478, 2259, 1442, 513, 1653, 540, 1129, 1483, 1383, 1707, 1642],
+  [4, 65, 850, 70, 132, 282, 1828, 217, 98, 193, 823, 907],
+  [73, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [74, 1603, 810, 464, 1078, 38, 618, 437, 546, 1030, 43, 285],
+  [8, 63, 78, 149, 180, 253, 327, 336, 341, 360, 372, 374],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 281, 283],
+  [38, 74, 100, 186, 210, 227, 261, 271, 290, 301, 323, 326],
+  [1810, 1598, 2261, 1782, 809, 508, 748, 2, 15, 1213, 1770, 565],
+  [757, 484, 1859, 536, 298, 47, 363, 1042, 1617, 542, 720, 1160],
+  [2245, 1802, 2255, 425, 1796, 2002, 60, 1429, 1440, 1725, 1363, 1783],
+  [1985, 1528, 975, 207, 623, 1581, 136, 321, 1847, 255, 900, 464],
+  [80, 114, 127, 213, 215, 224, 235, 272, 280, 288, 317, 339],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 293, 399],
+  [38, 74, 100, 186, 210, 227, 261, 264, 290, 301, 323, 326],
+  [80, 114, 127, 213, 215, 224, 235, 269, 280, 288, 317, 339],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [],
+  [106, 113, 154, 202, 328, 329, 337, 392, 396, 398, 407, 419],
+  [732, 197, 2029, 172, 831, 361, 1548, 178, 123, 1525, 251, 1118],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [2068, 49, 1610, 1207, 1798, 1940, 1333, 1823, 1273, 729, 1043, 25],
+  [129, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 288, 317, 339],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 283],
+  [4, 259, 65, 850, 70, 132, 1828, 217, 98, 193, 823, 907],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [43, 38, 138, 31, 19, 0, 1078, 618, 437, 546, 94, 578],
+  [3, 191, 325, 353, 455, 470, 558, 651, 655, 683, 780, 799],
+  [18, 211, 214, 265, 427, 433, 508, 519, 547, 565, 861, 869],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 317, 339],
+  [77, 178, 196, 251, 361, 370, 446, 551, 568, 700, 769, 781],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 301, 323, 326],
+  [40, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129, 1141],
+  [59, 161, 381, 1124, 1659, 104, 1949, 6, 1517, 999, 599, 1286],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 399],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [542, 720, 757, 47, 266, 1859, 536, 736, 1432, 1160, 484, 1266],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [14, 33, 305, 315, 359, 421, 486, 575, 646, 647, 690, 698],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 323, 326],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [4, 65, 70, 120, 132, 184, 259, 282, 441, 495, 499, 564],
+  [1391, 2118, 332, 1800, 1915, 1216, 1616, 147, 185, 1905, 899, 374],
+  [14, 33, 300, 315, 359, 421, 486, 575, 646, 647, 690, 698],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [295, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [892, 172, 831, 2029, 732, 276, 1757, 1525, 197, 123, 42, 361],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [5, 69, 131, 170, 314, 348, 383, 459, 468, 474, 521, 585],
+  [5, 69, 131, 170, 313, 348, 383, 459, 468, 474, 521, 585],
+  [1120, 1717, 894, 845, 1864, 575, 33, 421, 415, 979, 1262, 1982],
+  [12, 995, 881, 380, 776, 703, 194, 659, 123, 817, 656, 106],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 339],
+  [7, 228, 241, 463, 502, 528, 724, 803, 827, 860, 890, 958],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [665, 129, 1037, 1323, 1131, 891, 68, 1134, 1274, 115, 937, 376],
+  [1985, 900, 255, 601, 55, 1847, 1573, 207, 578, 339, 975, 215],
+  [91, 115, 226, 376, 496, 937, 1022, 1097, 1108, 2266],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 326],
+  [53, 240, 368, 1159, 1353, 1781, 2046],
+  [3, 455, 1178, 353, 1116, 1762, 1095, 1004, 2237, 2047, 89, 602],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [8, 63, 78, 149, 180, 253, 262, 336, 341, 360, 372, 374],
+  [407, 444, 1406, 1016, 450, 66, 35, 46, 516, 105, 107, 187],
+  [106, 113, 154, 202, 275, 328, 337, 392, 396, 398, 407, 419],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [2118, 1915, 1391, 304, 571, 416, 1216, 374, 1800, 1427, 254, 1056],
+  [1184, 1650, 419, 2057, 873, 787, 1209, 784, 669, 673, 641, 239],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 335],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 341, 360, 372, 374],
+  [106, 113, 154, 202, 275, 328, 329, 392, 396, 398, 407, 419],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1573, 900, 1329, 235, 80, 1210, 601, 215, 321, 154, 362, 255],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 360, 372, 374],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [295, 309, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [866, 2236, 1226, 1286, 599, 6, 20, 999, 126, 637, 1266, 381],
+  [391, 807, 108, 11, 88, 983, 1862, 1977, 555, 907, 141, 823],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1333, 1610, 862, 729, 17, 670, 1207, 492, 25, 2027, 2112, 116],
+  [5, 69, 131, 170, 313, 314, 383, 459, 468, 474, 521, 585],
+  [2256, 1083, 1749, 838, 387, 750, 1165, 909, 147, 1705, 1800, 813],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [60, 117, 173, 544, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 411, 442],
+  [455, 1004, 3, 325, 2047, 1116, 602, 2237, 1178, 1095, 1762, 1869],
+  [6, 59, 161, 292, 344, 381, 570, 599, 718, 755, 796, 950],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [17, 116, 347, 386, 428, 524, 562, 580, 590, 608, 635, 652],
+  [14, 33, 300, 305, 315, 421, 486, 575, 646, 647, 690, 698],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 372, 374],
+  [251, 197, 1661, 178, 1525, 370, 9, 2032, 276, 2029, 42, 41],
+  [516, 80, 66, 46, 107, 450, 235, 215, 35, 407, 154, 328],
+  [484, 536, 1105, 757, 47, 167, 266, 1042, 637, 126, 298, 1859],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 693],
+  [785, 1544, 2072, 745, 1313, 23, 1219, 1431, 1426, 1148, 2124, 1006],
+  [1627, 531, 509, 395, 1825, 1596, 1912, 1666, 61, 185, 1973, 97],
+  [53, 240, 324, 1159, 1353, 1781, 2046],
+  [136, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868, 2061],
+  [1661, 2032, 251, 431, 361, 178, 9, 986, 197, 700, 1525, 42],
+  [871, 1703, 518, 22, 566, 514, 236, 1867, 1149, 249, 1710, 657],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 374],
+  [888, 537, 1730, 87, 1423, 917, 1604, 177, 1515, 1506, 1072, 746],
+  [1056, 800, 2146, 1228, 8, 1915, 78, 594, 2239, 1427, 571, 332],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [91, 226, 937, 115, 1274, 1134, 68, 891, 1131, 320, 665, 129],
+  [977, 2031, 157, 1383, 2004, 2197, 841, 1653, 39, 660, 2017, 1580],
+  [129, 279, 320, 388, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [316, 881, 123, 12, 776, 995, 1467, 194, 2219, 892, 659, 703],
+  [161, 292, 6, 1659, 999, 599, 1124, 1286, 59, 1226, 344, 1517],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [5, 69, 131, 170, 313, 314, 348, 459, 468, 474, 521, 585],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [116, 1122, 2022, 880, 1464, 452, 600, 459, 605, 17, 5, 1695],
+  [838, 2256, 909, 1075, 426, 1372, 1083, 1687, 128, 349, 612, 813],
+  [129, 279, 320, 378, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1441, 2223, 2121, 2165, 16, 32, 595, 1356, 481, 1735, 162, 1992],
+  [345, 11, 807, 88, 108, 983, 1862, 1977, 555, 141, 907, 823],
+  [106, 113, 154, 202, 275, 328, 329, 337, 396, 398, 407, 419],
+  [34, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [36, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518, 1546],
+  [1825, 1596, 1666, 61, 509, 1627, 367, 531, 97, 717, 1130, 2018],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 398, 407, 419],
+  [103, 109, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 407, 419],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [34, 393, 434, 574, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [129, 279, 320, 378, 388, 525, 560, 561, 610, 665, 725, 1037],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1301, 2065, 521, 1240, 1695, 134, 112, 131, 452, 5, 1464, 69],
+  [686, 2113, 932, 2126, 176, 462, 1642, 586, 632, 93, 654, 1707],
+  [328, 444, 1406, 450, 1016, 66, 35, 105, 46, 107, 187, 94],
+  [2169, 1042, 1388, 21, 548, 555, 167, 484, 363, 141, 266, 193],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 442],
+  [592, 740, 182, 836, 611, 2252, 2119, 212, 1938, 595, 1281, 603],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1794, 1116, 1725, 1796, 455, 1571, 1178, 835, 164, 254, 704, 353],
+  [1717, 1974, 26, 1120, 1879, 1118, 315, 178, 196, 1982, 370, 1896],
+  [254, 1571, 571, 704, 332, 1725, 488, 1794, 1216, 89, 1620, 1899],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [787, 641, 1209, 784, 154, 873, 333, 2057, 516, 1329, 673, 80],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [33, 845, 1864, 523, 894, 1262, 1058, 979, 136, 1982, 1088, 816],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [2219, 176, 659, 654, 12, 932, 1467, 669, 316, 380, 995, 606],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1363, 1530, 2255, 2245, 117, 267, 2002, 1429, 1802, 968, 1440, 60],
+  [1372, 1517, 838, 387, 1949, 813, 1124, 1659, 1687, 1075, 999, 128],
+  [18, 211, 214, 265, 287, 433, 508, 519, 547, 565, 861, 869],
+  [17, 116, 347, 358, 386, 524, 562, 580, 590, 608, 635, 652],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2032, 986, 700, 370, 1661, 9, 251, 52, 2139, 41, 361, 42],
+  [229, 982, 817, 656, 985, 2264, 1030, 810, 854, 194, 703, 1603],
+  [18, 211, 1342, 1245, 1420, 96, 840, 565, 257, 508, 1137, 987],
+  [34, 2094, 1652, 1506, 1259, 1210, 1792, 786, 888, 144, 746, 339],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [546, 1078, 38, 19, 285, 1603, 43, 94, 810, 138, 105, 0],
+  [29, 179, 477, 487, 569, 629, 668, 675, 678, 759, 825, 832],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 495, 499, 564],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [68, 200, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [1406, 328, 1016, 407, 450, 106, 187, 66, 105, 854, 35, 516],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [77, 178, 196, 251, 289, 361, 370, 551, 568, 700, 769, 781],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [516, 328, 407, 1016, 1406, 444, 66, 362, 46, 107, 35, 105],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [1464, 1122, 1695, 600, 2022, 1240, 5, 116, 459, 605, 386, 131],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [325, 3, 353, 1178, 1116, 1004, 2047, 1762, 1095, 2237, 602, 89],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [605, 5, 131, 1554, 1122, 1695, 880, 1464, 1009, 452, 1114, 386],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [85, 1275, 812, 2230, 715, 103, 1475, 1459, 1756, 607, 1128, 24],
+  [1471, 1642, 2088, 406, 686, 2113, 932, 2126, 93, 2121, 632, 16],
+  [7, 228, 241, 318, 502, 528, 724, 803, 827, 860, 890, 958],
+  [618, 1847, 74, 261, 43, 38, 1078, 138, 285, 1603, 55, 255],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 474, 521, 585],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [3, 191, 286, 325, 353, 455, 558, 651, 655, 683, 780, 799],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 521, 585],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [581, 766, 162, 1704, 481, 1996, 1149, 2165, 1320, 238, 1735, 16],
+  [759, 825, 678, 487, 2217, 29, 884, 832, 569, 179, 1140, 890],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2165, 162, 16, 2223, 476, 766, 1441, 390, 1996, 1735, 581, 595],
+  [1583, 1128, 1475, 886, 165, 1445, 607, 2230, 577, 1229, 1061, 684],
+  [2228, 510, 1143, 1041, 954, 135, 10, 1936, 567, 1618, 808, 2012],
+  [363, 536, 757, 266, 47, 1105, 1042, 167, 298, 637, 1859, 542],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [14, 33, 300, 305, 315, 359, 421, 575, 646, 647, 690, 698],
+  [477, 759, 678, 825, 2217, 832, 890, 1960, 228, 1446, 29, 884],
+  [1620, 1899, 909, 89, 704, 1083, 1216, 416, 1762, 2256, 612, 254],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [83, 195, 247, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613, 1617],
+  [1449, 1657, 27, 952, 257, 96, 603, 840, 1938, 903, 754, 1456],
+  [729, 1043, 2015, 1207, 116, 2022, 600, 1254, 1610, 717, 1438, 386],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [22, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223, 1381],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 499, 564],
+  [91, 115, 226, 322, 376, 937, 1022, 1097, 1108, 2266],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 564],
+  [10, 142, 483, 510, 520, 735, 777, 863, 954, 959, 971, 1065],
+  [2199, 1303, 1088, 2212, 1664, 1058, 14, 1426, 36, 1262, 2200, 979],
+  [1882, 1556, 79, 803, 958, 2081, 1147, 1845, 513, 7, 912, 1960],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 530, 552, 555],
+  [47, 266, 298, 363, 484, 515, 536, 720, 757, 849, 991, 1042],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [68, 200, 443, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [1032, 567, 797, 808, 1041, 36, 695, 2200, 1426, 62, 2212, 2012],
+  [565, 748, 987, 1342, 1810, 1597, 265, 1008, 15, 2, 809, 1782],
+  [1825, 367, 395, 1912, 1666, 1627, 531, 1596, 61, 2239, 800, 97],
+  [1143, 954, 483, 2228, 135, 10, 824, 1133, 597, 562, 1618, 1936],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [2259, 1442, 502, 79, 258, 1478, 1211, 1556, 803, 2081, 912, 540],
+  [250, 371, 1867, 1704, 1149, 249, 1072, 518, 581, 871, 1703, 236],
+  [47, 266, 298, 363, 484, 504, 536, 720, 757, 849, 991, 1042],
+  [362, 450, 66, 46, 80, 407, 328, 154, 107, 1016, 444, 1406],
+  [103, 109, 397, 624, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [22, 566, 1703, 871, 371, 657, 1867, 1710, 249, 1705, 1165, 236],
+  [18, 211, 214, 265, 287, 427, 433, 508, 547, 565, 861, 869],
+  [10, 142, 483, 500, 510, 735, 777, 863, 954, 959, 971, 1065],
+  [69, 1114, 585, 405, 131, 587, 1009, 1695, 5, 1554, 459, 605],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [136, 421, 33, 845, 1864, 816, 1088, 1961, 1982, 1058, 894, 268],
+  [17, 116, 347, 358, 386, 428, 562, 580, 590, 608, 635, 652],
+  [129, 279, 320, 378, 388, 403, 560, 561, 610, 665, 725, 1037],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [7, 228, 241, 318, 463, 502, 724, 803, 827, 860, 890, 958],
+  [1473, 1705, 1710, 657, 13, 814, 1749, 614, 1263, 813, 576, 1213],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 552, 555],
+  [367, 1627, 185, 509, 1596, 395, 1973, 1825, 1912, 2239, 97, 2018],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [47, 484, 363, 1105, 757, 266, 637, 298, 126, 542, 167, 1042],
+  [1604, 888, 373, 1515, 1423, 144, 1506, 1792, 917, 1652, 1730, 2125],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1129, 1483, 40, 2259, 676, 1707, 832, 1211, 632, 513, 258, 708],
+  [295, 309, 343, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [298, 720, 1266, 1432, 736, 47, 757, 536, 266, 1859, 1160, 637],
+  [68, 200, 443, 506, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [60, 117, 173, 351, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [1580, 1992, 1356, 32, 2252, 2197, 1387, 209, 595, 740, 390, 836],
+  [437, 1078, 38, 19, 285, 1603, 43, 94, 810, 138, 105, 0],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 565, 861, 869],
+  [1388, 2169, 408, 189, 1744, 1828, 193, 1042, 132, 555, 907, 850],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 568, 700, 769, 781],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 555],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [907, 807, 345, 391, 108, 983, 11, 193, 1862, 1977, 88, 141],
+  [73, 260, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [754, 952, 903, 1281, 1224, 1657, 212, 209, 2119, 611, 1387, 27],
+  [3, 191, 286, 325, 353, 455, 470, 651, 655, 683, 780, 799],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [723, 73, 726, 1027, 245, 203, 232, 58, 54, 916, 1590, 148],
+  [129, 279, 320, 378, 388, 403, 525, 560, 610, 665, 725, 1037],
+  [2112, 597, 17, 824, 880, 819, 135, 510, 386, 670, 862, 954],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [508, 987, 748, 1342, 1810, 1597, 1008, 265, 15, 2, 809, 1137],
+  [22, 518, 1703, 871, 657, 371, 1710, 1705, 1867, 1165, 249, 614],
+  [695, 507, 1041, 808, 797, 1426, 36, 2228, 1032, 483, 2200, 745],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 700, 769, 781],
+  [179, 629, 1140, 884, 1335, 1484, 29, 825, 2203, 2217, 678, 708],
+  [6, 59, 161, 292, 344, 354, 381, 599, 718, 755, 796, 950],
+  [1427, 1571, 416, 332, 254, 374, 1915, 1725, 2146, 1056, 1228, 8],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [27, 209, 212, 557, 603, 611, 754, 898, 903, 941, 952, 1052],
+  [34, 393, 400, 434, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [979, 1262, 894, 14, 1664, 845, 1864, 1058, 315, 2199, 421, 33],
+  [1598, 2261, 13, 265, 1213, 247, 913, 83, 1782, 1810, 1473, 809],
+  [165, 886, 677, 1533, 1061, 142, 1673, 2012, 1618, 684, 1936, 1039],
+  [55, 31, 138, 255, 43, 601, 618, 215, 285, 0, 1847, 38],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [17, 116, 347, 358, 386, 428, 524, 562, 590, 608, 635, 652],
+  [476, 1704, 766, 1149, 162, 1996, 1320, 481, 238, 1735, 2165, 722],
+  [13, 234, 236, 614, 633, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [25, 205, 625, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [587, 69, 2227, 521, 1114, 1009, 1334, 1115, 109, 1554, 131, 707],
+  [2203, 1335, 2113, 686, 2126, 1140, 629, 1484, 708, 884, 29, 569],
+  [585, 69, 2227, 521, 1114, 1334, 1115, 1009, 109, 1554, 707, 1557],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [34, 393, 400, 434, 574, 673, 743, 746, 795, 927, 1053, 1111],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 608, 635, 652],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [412, 611, 2119, 836, 1938, 740, 603, 212, 1281, 27, 903, 1137],
+  [158, 1467, 1757, 1984, 2062, 7, 12, 29, 39, 40, 79, 93],
+  [78, 8, 1228, 2146, 1783, 1056, 794, 800, 921, 374, 2239, 1427],
+  [1735, 1356, 2252, 412, 390, 1996, 740, 162, 182, 1441, 592, 836],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [562, 2112, 819, 135, 17, 670, 510, 824, 1428, 1006, 862, 880],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [6, 1286, 344, 1226, 999, 2236, 866, 381, 161, 1659, 20, 1124],
+  [2022, 2015, 1254, 116, 452, 1464, 1240, 386, 1122, 112, 492, 1130],
+  [215, 578, 55, 255, 235, 31, 138, 43, 0, 80, 107, 618],
+  [1004, 2237, 2047, 353, 1067, 833, 3, 1877, 1869, 455, 1089, 325],
+  [1938, 27, 257, 2119, 1137, 840, 1657, 1449, 96, 592, 611, 903],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [459, 5, 131, 1554, 1122, 1695, 880, 1464, 1009, 452, 1114, 386],
+  [1016, 106, 1406, 444, 1209, 328, 450, 873, 407, 659, 516, 854],
+  [1229, 1445, 1128, 24, 1459, 2230, 1583, 715, 85, 1275, 1475, 461],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 635, 652],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 665, 725, 1037],
+  [212, 1281, 2119, 836, 903, 740, 1938, 754, 592, 27, 1657, 603],
+  [128, 1095, 1687, 1075, 1762, 1899, 1620, 181, 89, 3, 1089, 1178],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1297, 1710, 13, 1213, 945, 657, 1782, 236, 1697, 871, 1770, 1473],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [43, 464, 138, 285, 1847, 38, 55, 578, 31, 1078, 255, 74],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [182, 412, 592, 694, 740, 836, 1002, 1008, 1137, 1171, 1314, 1476],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [975, 1581, 207, 1985, 268, 321, 786, 900, 1148, 1528, 339, 1573],
+  [103, 109, 397, 517, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [25, 205, 583, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [73, 260, 556, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [1440, 1429, 921, 1783, 794, 2255, 594, 78, 8, 1228, 2146, 1427],
+  [569, 179, 1140, 1335, 884, 1484, 29, 2203, 708, 825, 2217, 586],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [68, 200, 443, 506, 543, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [676, 1707, 40, 2126, 708, 1129, 1483, 1642, 540, 29, 2113, 686],
+  [13, 234, 236, 582, 614, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [144, 786, 1792, 2027, 1652, 905, 1219, 1604, 2125, 2124, 25, 2094],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 652],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1105, 126, 47, 20, 536, 1266, 866, 363, 484, 757, 542, 298],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [40, 291, 540, 632, 676, 682, 708, 1047, 1049, 1071, 1129, 1141],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [787, 154, 419, 784, 1209, 1329, 516, 80, 362, 450, 235, 1573],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [39, 79, 671, 701, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [24, 85, 461, 607, 654, 715, 744, 747, 812, 855, 1006, 1128],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 647, 690, 698],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 690, 698],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [3, 191, 286, 325, 353, 455, 470, 558, 655, 683, 780, 799],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [13, 234, 236, 582, 614, 633, 821, 919, 1007, 1079, 1189, 1269],
+  [669, 2057, 93, 873, 423, 2219, 333, 1209, 176, 659, 932, 606],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 683, 780, 799],
+  [817, 982, 432, 229, 2264, 854, 703, 1030, 985, 187, 194, 810],
+  [1710, 1705, 1703, 871, 22, 566, 614, 518, 529, 1749, 1473, 1297],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [12, 995, 606, 316, 423, 106, 2219, 703, 1016, 1406, 444, 873],
+  [1383, 1653, 2197, 32, 977, 2121, 377, 157, 1478, 1992, 258, 2031],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1037, 129, 320, 1323, 1131, 891, 68, 1134, 1274, 115, 937, 376],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [25, 205, 583, 625, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [29, 179, 438, 477, 487, 569, 629, 675, 678, 759, 825, 832],
+  [654, 2057, 873, 93, 333, 1209, 606, 419, 423, 659, 1650, 1184],
+  [862, 1428, 1006, 819, 2027, 23, 2124, 17, 2112, 347, 597, 1333],
+  [39, 79, 643, 701, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [60, 117, 173, 351, 544, 699, 741, 947, 968, 972, 1126, 1191],
+  [784, 746, 1210, 1259, 787, 419, 333, 641, 1184, 1650, 154, 34],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [29, 179, 438, 477, 487, 569, 629, 668, 678, 759, 825, 832],
+  [40, 1707, 632, 1129, 1483, 708, 540, 2126, 29, 1642, 2217, 2259],
+  [1533, 142, 1936, 1673, 2012, 577, 1618, 10, 165, 1143, 886, 2228],
+  [759, 2217, 825, 477, 487, 29, 884, 569, 179, 1140, 832, 708],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [20, 152, 542, 637, 768, 866, 935, 1201, 1226, 1249, 1266, 1299],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 708, 1047, 1049, 1071, 1129, 1141],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 780, 799],
+  [1061, 1756, 707, 1557, 1039, 103, 109, 886, 812, 1475, 165, 577],
+  [295, 309, 343, 541, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [2113, 406, 2126, 932, 586, 632, 1642, 176, 708, 1707, 676, 462],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 698],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [267, 425, 628, 778, 1048, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [182, 412, 592, 621, 740, 836, 1002, 1008, 1137, 1171, 1314, 1476],
+  [567, 1426, 745, 1544, 36, 507, 1303, 1041, 797, 366, 2200, 483],
+  [165, 482, 577, 677, 886, 1061, 1284, 1373, 1463, 1489, 1491, 1544],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [60, 117, 173, 351, 544, 672, 741, 947, 968, 972, 1126, 1191],
+  [986, 2139, 431, 2077, 52, 77, 2032, 370, 2171, 1661, 196, 251],
+  [39, 79, 643, 671, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [995, 194, 656, 817, 854, 12, 432, 106, 229, 982, 316, 2264],
+  [89, 1899, 1620, 1178, 1762, 254, 1794, 416, 488, 1116, 325, 455],
+  [110, 194, 229, 432, 656, 703, 728, 776, 817, 982, 985, 1064],
+  [16, 481, 856, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [1557, 109, 1756, 103, 2227, 1334, 684, 812, 1039, 587, 1061, 585],
+  [29, 676, 632, 40, 884, 1707, 2126, 1140, 1335, 1129, 1483, 2217],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [32, 377, 545, 992, 1580, 1911, 1921, 1992, 2140, 2145, 2197, 2204],
+  [1275, 85, 1459, 2230, 24, 461, 607, 1229, 1128, 1445, 1475, 812],
+  [295, 309, 343, 541, 685, 742, 790, 859, 955, 963, 1019, 1034],
+  [1130, 97, 1254, 2015, 2018, 1596, 61, 1438, 1043, 600, 492, 112],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 755, 796, 950],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [736, 1432, 298, 542, 1160, 1859, 195, 1617, 757, 266, 47, 1266],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [231, 2158, 1564, 1326, 1320, 238, 1697, 945, 1008, 1597, 182, 2],
+  [726, 73, 1027, 245, 232, 54, 58, 203, 560, 916, 67, 1396],
+  [7, 228, 241, 318, 463, 502, 528, 803, 827, 860, 890, 958],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 1037],
+  [723, 73, 1027, 245, 232, 54, 58, 203, 560, 916, 67, 1396],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [110, 194, 229, 432, 656, 703, 705, 776, 817, 982, 985, 1064],
+  [1610, 492, 1207, 347, 1043, 1333, 2068, 116, 2015, 2022, 278, 1273],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [276, 172, 2029, 831, 123, 197, 1548, 310, 361, 1525, 892, 178],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [10, 142, 483, 500, 510, 520, 777, 863, 954, 959, 971, 1065],
+  [1432, 720, 195, 1160, 542, 298, 1859, 1617, 814, 1263, 757, 266],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [836, 212, 2252, 611, 1281, 592, 412, 209, 2119, 903, 754, 1387],
+  [60, 117, 173, 351, 544, 672, 699, 947, 968, 972, 1126, 1191],
+  [295, 309, 343, 541, 685, 716, 790, 859, 955, 963, 1019, 1034],
+  [34, 393, 400, 434, 574, 589, 673, 746, 795, 927, 1053, 1111],
+  [24, 85, 461, 607, 644, 654, 715, 747, 812, 855, 1006, 1128],
+  [1544, 1426, 366, 1303, 695, 785, 1431, 2072, 501, 36, 1088, 2212],
+  [673, 1259, 1093, 888, 1506, 34, 434, 1210, 784, 1184, 373, 2094],
+  [24, 85, 461, 607, 644, 654, 715, 744, 812, 855, 1006, 1128],
+  [987, 508, 1008, 1597, 565, 15, 1810, 2, 809, 265, 1770, 1782],
+  [89, 704, 1620, 1654, 1899, 3, 6, 20, 30, 59, 104, 128],
+  [147, 1800, 1616, 1165, 1216, 349, 28, 1083, 1962, 1905, 2052, 304],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [39, 79, 643, 671, 701, 830, 841, 912, 974, 1020, 1312, 1350],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [903, 1281, 557, 212, 1657, 611, 2119, 27, 952, 836, 1938, 209],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 796, 950],
+  [249, 371, 514, 783, 1194, 1242, 1867, 2034, 2, 13, 15, 18],
+  [266, 484, 536, 47, 298, 363, 1859, 542, 1105, 720, 1042, 1617],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [477, 678, 825, 2217, 487, 29, 884, 569, 832, 179, 1140, 629],
+  [164, 1360, 1543, 1944, 2110, 2164, 3, 6, 20, 30, 59, 89],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [136, 369, 523, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868, 2061],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [30, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [476, 581, 1704, 481, 162, 2165, 1149, 1996, 1769, 16, 2223, 1735],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [20, 152, 542, 637, 680, 866, 935, 1201, 1226, 1249, 1266, 1299],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 781],
+  [128, 181, 612, 934, 1051, 1075, 1095, 1680, 1687, 1914, 2060, 3],
+  [112, 134, 405, 452, 600, 717, 1010, 1130, 1207, 1240, 1254, 1273],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [123, 316, 380, 659, 881, 995, 1280, 2039, 2185, 9, 26, 41],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [881, 194, 1896, 316, 123, 1548, 995, 703, 12, 380, 817, 985],
+  [10, 142, 483, 500, 510, 520, 735, 863, 954, 959, 971, 1065],
+  [267, 425, 628, 692, 1048, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [2052, 1962, 249, 28, 1867, 1905, 177, 1823, 1165, 1072, 899, 1940],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 799],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [25, 205, 583, 625, 667, 793, 905, 940, 996, 1279, 1333, 1348],
+  [249, 371, 514, 756, 1194, 1242, 1867, 2034, 2, 13, 15, 18],
+  [787, 641, 419, 673, 154, 1210, 1329, 1209, 339, 1573, 80, 333],
+  [2072, 366, 1544, 1313, 23, 1006, 745, 2124, 1219, 1428, 819, 1148],
+  [2094, 634, 1652, 623, 1581, 1792, 975, 207, 434, 34, 1148, 144],
+  [641, 419, 784, 154, 1209, 1329, 516, 80, 333, 873, 673, 362],
+  [93, 669, 798, 1025, 1632, 2057, 2159, 7, 12, 29, 39, 40],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [295, 309, 343, 541, 685, 716, 742, 859, 955, 963, 1019, 1034],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [25, 205, 583, 625, 667, 782, 905, 940, 996, 1279, 1333, 1348],
+  [921, 594, 78, 1783, 628, 8, 1440, 1228, 2146, 2239, 1056, 800],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 927, 1053, 1111],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 950],
+  [2200, 36, 507, 1032, 2212, 567, 1426, 1303, 695, 14, 2199, 1664],
+  [93, 669, 788, 1025, 1632, 2057, 2159, 7, 12, 29, 39, 40],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1056, 1228, 2146, 374, 2239, 8, 78, 594, 1915, 1912, 1427, 794],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [2081, 1556, 1147, 1845, 1882, 958, 1960, 502, 7, 241, 890, 228],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [345, 391, 108, 11, 88, 983, 1862, 1977, 555, 907, 141, 823],
+  [1041, 2012, 1936, 142, 1533, 507, 567, 2228, 677, 1032, 483, 1143],
+  [1770, 1782, 1810, 2, 15, 1697, 265, 1008, 748, 1213, 1326, 1597],
+  [1603, 1030, 261, 1078, 74, 437, 546, 2264, 38, 982, 19, 285],
+  [103, 109, 397, 517, 624, 684, 707, 818, 1039, 1112, 1163, 1185],
+  [103, 461, 1756, 85, 1275, 1475, 1557, 707, 684, 2230, 715, 109],
+  [426, 152, 1749, 529, 814, 838, 387, 1372, 1473, 1705, 1517, 1263],
+  [1263, 195, 1432, 736, 720, 913, 83, 1160, 542, 529, 1473, 152],
+  [22, 494, 518, 566, 657, 871, 965, 1003, 1014, 1192, 1223, 1381],
+  [1961, 1982, 110, 261, 74, 1603, 810, 1030, 464, 523, 1078, 985],
+  [432, 656, 229, 982, 985, 194, 703, 2264, 854, 1030, 810, 995],
+  [103, 109, 397, 517, 624, 684, 707, 811, 1039, 1112, 1163, 1185],
+  [1428, 670, 1006, 597, 2112, 862, 135, 23, 562, 17, 2124, 2072],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [13, 234, 236, 582, 614, 633, 653, 919, 1007, 1079, 1189, 1269],
+  [207, 268, 623, 786, 975, 1148, 1581, 1743, 1985, 2005, 2036, 25],
+  [907, 98, 217, 983, 193, 108, 807, 555, 345, 1828, 391, 11],
+  [562, 954, 880, 1133, 1554, 510, 1009, 10, 2112, 459, 605, 597],
+  [759, 678, 477, 2217, 487, 884, 29, 569, 179, 1140, 629, 1335],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 860, 890, 958],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [39, 79, 643, 671, 701, 752, 841, 912, 974, 1020, 1312, 1350],
+  [2029, 172, 1525, 197, 732, 276, 310, 361, 9, 42, 41, 251],
+  [890, 1960, 1845, 1147, 2081, 540, 487, 803, 1556, 513, 678, 2217],
+  [1089, 2237, 153, 602, 989, 1004, 1877, 181, 1067, 3, 353, 1095],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1944, 1869, 2047, 1543, 164, 414, 1116, 353, 1004, 602, 455, 1067],
+  [740, 212, 611, 1281, 2119, 903, 592, 2252, 754, 209, 412, 1938],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [387, 2256, 909, 426, 1075, 1372, 1083, 1687, 128, 349, 813, 612],
+  [980, 30, 1316, 1154, 1457, 2051, 1830, 104, 1011, 989, 59, 153],
+  [257, 96, 1137, 603, 1342, 1449, 27, 1938, 433, 1245, 491, 1657],
+  [39, 912, 1502, 2017, 2004, 157, 79, 2031, 1442, 977, 377, 1478],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1864, 894, 33, 421, 1262, 979, 1058, 523, 315, 575, 1120, 1664],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 991, 1042],
+  [70, 132, 65, 259, 4, 1828, 217, 98, 282, 193, 823, 907],
+  [36, 394, 501, 567, 797, 1015, 1087, 1162, 1241, 1426, 1518, 1546],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [187, 656, 106, 2264, 444, 982, 407, 105, 328, 1406, 1016, 703],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 1006, 1128],
+  [16, 481, 706, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [68, 200, 443, 506, 543, 631, 879, 891, 1018, 1103, 1134, 1274],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [295, 309, 343, 541, 685, 716, 742, 790, 955, 963, 1019, 1034],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 890, 958],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 869],
+  [670, 347, 17, 1428, 819, 1006, 2027, 1333, 2112, 597, 2124, 23],
+  [10, 142, 483, 500, 510, 520, 735, 777, 954, 959, 971, 1065],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [344, 1226, 20, 2236, 1286, 599, 126, 637, 6, 999, 1266, 1105],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1703, 371, 518, 22, 566, 1710, 657, 236, 614, 1297, 1705, 945],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [2057, 1209, 669, 606, 419, 654, 333, 787, 641, 154, 1016, 1406],
+  [30, 764, 839, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [68, 200, 443, 506, 543, 631, 857, 891, 1018, 1103, 1134, 1274],
+  [1122, 459, 605, 386, 5, 1464, 1554, 131, 116, 824, 1695, 562],
+  [776, 123, 316, 380, 194, 12, 1548, 995, 1896, 703, 817, 732],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1140, 29, 629, 569, 179, 1335, 1484, 708, 2217, 825, 678, 759],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [165, 577, 1061, 684, 677, 1533, 482, 142, 1475, 1673, 1039, 1756],
+  [62, 507, 808, 1032, 1041, 1303, 1577, 1904, 1966, 2258, 14, 33],
+  [373, 537, 1506, 87, 1259, 746, 1604, 1730, 1423, 1652, 1792, 34],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1960, 1845, 832, 1147, 2081, 241, 228, 803, 7, 1556, 958, 1882],
+  [68, 1134, 1274, 1131, 320, 665, 129, 1037, 1323, 115, 937, 376],
+  [310, 732, 172, 158, 831, 123, 1757, 2029, 276, 380, 1467, 881],
+  [73, 260, 556, 627, 723, 726, 918, 1027, 1033, 1197, 1306, 1418],
+  [845, 1864, 1262, 979, 421, 575, 33, 1058, 315, 1664, 14, 1120],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 903, 941, 952, 1052],
+  [1905, 28, 1962, 2052, 1616, 1940, 185, 304, 779, 1391, 1823, 2118],
+  [1573, 339, 321, 601, 235, 1985, 215, 1329, 255, 55, 80, 578],
+  [1744, 1456, 189, 1245, 211, 18, 491, 96, 548, 1388, 433, 1449],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [754, 1281, 212, 2119, 611, 1657, 557, 27, 1938, 836, 740, 1449],
+  [28, 899, 1035, 1366, 1616, 1816, 1905, 1962, 2052, 2151, 8, 49],
+  [25, 2125, 1798, 1515, 144, 2027, 1604, 634, 1333, 1792, 278, 1610],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [555, 193, 823, 983, 807, 108, 345, 98, 391, 217, 1828, 11],
+  [576, 814, 913, 1220, 1263, 1432, 1443, 2, 13, 15, 18, 22],
+  [1083, 2256, 1075, 387, 838, 1620, 1687, 488, 128, 1899, 612, 89],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1502, 841, 2017, 39, 79, 1442, 2004, 157, 502, 513, 1478, 2031],
+  [83, 247, 1263, 576, 1420, 195, 814, 1598, 2261, 1473, 1160, 265],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [67, 1396, 1590, 1954, 148, 65, 282, 70, 259, 4, 217, 850],
+  [1423, 1730, 177, 373, 87, 1072, 537, 888, 1515, 1604, 1823, 1798],
+  [73, 260, 556, 627, 723, 726, 893, 1027, 1033, 1197, 1306, 1418],
+  [13, 234, 236, 582, 614, 633, 653, 821, 1007, 1079, 1189, 1269],
+  [16, 481, 706, 856, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [794, 628, 1440, 1783, 594, 78, 8, 1429, 1228, 2146, 1056, 2239],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 1053, 1111],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [406, 176, 686, 2113, 423, 654, 2219, 93, 669, 2126, 586, 462],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [128, 181, 612, 770, 1051, 1075, 1095, 1680, 1687, 1914, 2060, 3],
+  [20, 152, 542, 637, 680, 768, 866, 1201, 1226, 1249, 1266, 1299],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [115, 376, 91, 226, 1274, 1134, 68, 891, 1131, 320, 665, 129],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [25, 205, 583, 625, 667, 782, 793, 905, 996, 1279, 1333, 1348],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 952, 1052],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [1697, 1326, 1297, 231, 1770, 1564, 236, 722, 2, 809, 1782, 15],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [60, 117, 173, 351, 544, 672, 699, 741, 968, 972, 1126, 1191],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1224, 557, 754, 1657, 903, 491, 1449, 1281, 27, 212, 2119, 611],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [10, 1143, 510, 1133, 1618, 824, 483, 2228, 1673, 1804, 135, 1936],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 963, 1019, 1034],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1882, 803, 1556, 2081, 1147, 7, 1845, 241, 502, 1960, 890, 228],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 971, 1065],
+  [12, 176, 423, 932, 1576, 1699, 1923, 2089, 2219, 2247, 7, 29],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [304, 332, 1216, 1391, 1481, 1800, 1915, 2118, 8, 28, 49, 60],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 1019, 1034],
+  [23, 670, 819, 1219, 1336, 1592, 2027, 2087, 2124, 2162, 5, 17],
+  [22, 494, 518, 566, 657, 815, 871, 1003, 1014, 1192, 1223, 1381],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2002, 60, 164, 1796, 1543, 2245, 1802, 425, 1363, 117, 267, 1530],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 1065],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 1126, 1191],
+  [],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 1020, 1312, 1350],
+  [207, 1581, 623, 1985, 321, 268, 900, 786, 1148, 339, 1528, 1573],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [377, 157, 2031, 1383, 2004, 1653, 2197, 841, 660, 39, 912, 1478],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1262, 575, 894, 1664, 1058, 14, 845, 1864, 2199, 421, 33, 501],
+  [839, 30, 1316, 1457, 1154, 2051, 1830, 104, 1011, 989, 59, 292],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [229, 432, 2264, 656, 1030, 817, 810, 985, 854, 187, 1603, 437],
+  [108, 345, 807, 391, 11, 88, 823, 907, 555, 1862, 1977, 193],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [432, 229, 817, 982, 110, 656, 1030, 2264, 194, 1896, 810, 1603],
+  [700, 431, 2139, 2077, 52, 2032, 370, 77, 2171, 1661, 196, 251],
+  [748, 508, 1597, 565, 1008, 15, 2, 1810, 1342, 809, 265, 1770],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [153, 1877, 833, 1011, 1089, 1067, 1830, 2051, 2237, 602, 181, 1154],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 1042],
+  [32, 377, 545, 714, 1580, 1911, 1921, 1992, 2140, 2145, 2197, 2204],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [12, 703, 316, 194, 659, 817, 656, 106, 776, 854, 881, 432],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 1279, 1333, 1348],
+  [83, 195, 247, 490, 736, 1069, 1145, 1186, 1237, 1570, 1613, 1617],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [6, 599, 1659, 2236, 344, 1286, 381, 1124, 161, 1226, 866, 1517],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 877, 980, 1073, 1121, 1154, 1316, 1371, 1392],
+  [182, 412, 592, 621, 694, 740, 836, 1008, 1137, 1171, 1314, 1476],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1014, 1192, 1223, 1381],
+  [602, 353, 2237, 2047, 3, 455, 325, 833, 1116, 1067, 1089, 1869],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1428, 23, 670, 819, 2124, 2027, 862, 1313, 2072, 785, 597, 1219],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1079, 1189, 1269],
+  [1597, 15, 2, 748, 987, 1564, 1810, 809, 1770, 1326, 508, 231],
+  [1114, 1554, 131, 5, 1115, 69, 459, 605, 521, 1695, 585, 587],
+  [112, 134, 405, 452, 600, 717, 771, 1130, 1207, 1240, 1254, 1273],
+  [104, 153, 59, 989, 1154, 30, 2051, 1949, 292, 1316, 181, 833],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1192, 1223, 1381],
+  [36, 394, 501, 567, 797, 851, 1087, 1162, 1241, 1426, 1518, 1546],
+  [1406, 444, 328, 407, 450, 106, 516, 606, 66, 46, 854, 187],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1103, 1134, 1274],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1034],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1312, 1350],
+  [148, 1396, 1433, 1590, 1677, 1954, 67, 916],
+  [91, 115, 226, 322, 376, 496, 937, 1097, 1108, 2266],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [93, 669, 788, 798, 1632, 2057, 2159, 7, 12, 29, 39, 40],
+  [49, 278, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [73, 726, 723, 245, 232, 54, 58, 203, 560, 916, 67, 1396],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [810, 2264, 1603, 982, 437, 546, 1078, 261, 229, 74, 432, 38],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [507, 797, 62, 567, 808, 2200, 36, 1041, 695, 2212, 2012, 1426],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1197, 1306, 1418],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [28, 899, 904, 1366, 1616, 1816, 1905, 1962, 2052, 2151, 8, 49],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [129, 665, 320, 1323, 1131, 891, 68, 1134, 1274, 115, 937, 376],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1804, 1334, 1115, 1061, 1618, 1673, 109, 2227, 1133, 684, 1756, 707],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [808, 1936, 2228, 2012, 567, 483, 142, 507, 1533, 1143, 695, 677],
+  [484, 363, 266, 408, 2169, 757, 167, 536, 21, 47, 1859, 1105],
+  [1207, 1438, 492, 1273, 2018, 729, 2068, 97, 49, 2015, 717, 1973],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1049, 1071, 1129, 1141],
+  [267, 425, 628, 692, 778, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1071, 1129, 1141],
+  [185, 531, 1409, 1452, 1477, 1918, 2007, 2150, 8, 28, 49, 60],
+  [128, 181, 612, 770, 934, 1075, 1095, 1680, 1687, 1914, 2060, 3],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1111],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [2146, 1228, 800, 374, 8, 78, 594, 2239, 1427, 1915, 1783, 794],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1262, 1664, 979, 2199, 501, 1088, 14, 894, 845, 1864, 421, 33],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [684, 886, 165, 577, 1756, 1039, 1673, 1804, 109, 707, 1557, 1618],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1877, 602, 1869, 1004, 833, 2047, 2237, 989, 353, 1089, 153, 3],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [83, 195, 247, 490, 736, 997, 1145, 1186, 1237, 1570, 1613, 1617],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1129, 1141],
+  [1730, 87, 249, 917, 1867, 250, 177, 1423, 373, 514, 779, 1093],
+  [30, 764, 839, 874, 877, 980, 1001, 1121, 1154, 1316, 1371, 1392],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1687, 128, 612, 909, 387, 1095, 838, 181, 1899, 1620, 1762, 2256],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [437, 546, 38, 285, 1603, 19, 43, 810, 261, 618, 138, 74],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1189, 1269],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [2256, 909, 349, 488, 387, 838, 1075, 1620, 1216, 1899, 147, 1687],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [36, 394, 501, 567, 797, 851, 1015, 1162, 1241, 1426, 1518, 1546],
+  [501, 1058, 1431, 2199, 136, 1303, 523, 1664, 1528, 1262, 421, 2212],
+  [833, 2237, 181, 153, 1095, 602, 1004, 3, 989, 612, 128, 325],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [61, 367, 395, 509, 1205, 1307, 1400, 1468, 1596, 1627, 1630, 1658],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [746, 250, 87, 888, 239, 673, 373, 1730, 1184, 1259, 1769, 1650],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1762, 612, 3, 325, 1178, 1899, 455, 89, 128, 2237, 1620, 1089],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1108, 2266],
+  [87, 373, 1072, 1730, 1754, 2084, 25, 34, 144, 177, 205, 207],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1134, 1274],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [637, 536, 47, 126, 363, 484, 167, 757, 20, 266, 1266, 298],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 2266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1163, 1185],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1009, 69, 1554, 521, 131, 5, 1115, 585, 459, 605, 587, 1695],
+  [1334, 1804, 2227, 1009, 1114, 1039, 1133, 69, 587, 1554, 585, 109],
+  [455, 325, 1178, 353, 3, 2047, 414, 1794, 1004, 1762, 89, 704],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1879, 1548, 1974, 26, 178, 1896, 276, 123, 251, 361, 776, 197],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [315, 1717, 415, 845, 1864, 894, 33, 421, 575, 1982, 979, 1262],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1154, 1316, 1371, 1392],
+  [1464, 452, 459, 605, 5, 386, 880, 1695, 131, 2022, 116, 1554],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1659, 1517, 1949, 381, 999, 161, 292, 6, 59, 599, 1286, 2236],
+  [254, 416, 571, 1146, 1571, 1693, 1702, 1925, 2078, 8, 28, 49],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1191],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [607, 1445, 1583, 1229, 2230, 24, 1459, 1475, 715, 482, 85, 1275],
+  [1483, 540, 40, 676, 1707, 632, 2259, 708, 1211, 258, 2217, 832],
+  [717, 1254, 112, 61, 1240, 2065, 2015, 134, 600, 1596, 97, 395],
+  [320, 665, 1037, 129, 1323, 891, 68, 1134, 1274, 115, 937, 376],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [10, 1618, 954, 1804, 1673, 1143, 1115, 824, 1039, 510, 677, 1334],
+  [1274, 68, 891, 1131, 320, 665, 129, 1037, 1323, 115, 937, 376],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [257, 840, 603, 96, 1342, 1938, 27, 565, 987, 508, 592, 2119],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [884, 629, 1335, 569, 179, 29, 1484, 708, 2203, 2217, 825, 678],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [954, 10, 510, 2228, 483, 1133, 1618, 1673, 1936, 824, 135, 677],
+  [96, 257, 491, 840, 1456, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [83, 195, 247, 490, 736, 997, 1069, 1186, 1237, 1570, 1613, 1617],
+  [254, 416, 571, 1125, 1571, 1693, 1702, 1925, 2078, 8, 28, 49],
+  [1845, 2081, 803, 1960, 1556, 958, 241, 1882, 7, 890, 502, 228],
+  [1219, 1313, 1528, 623, 786, 1581, 975, 1431, 207, 2124, 366, 23],
+  [1704, 581, 476, 236, 1320, 766, 238, 514, 722, 1996, 371, 162],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [30, 1316, 839, 2051, 980, 1457, 1830, 104, 1011, 989, 153, 59],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [16, 481, 706, 856, 920, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [53, 240, 324, 368, 1353, 1781, 2046],
+  [1617, 1859, 720, 736, 195, 1432, 298, 266, 542, 757, 1263, 47],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1241, 1426, 1518, 1546],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1185],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [750, 566, 22, 349, 518, 147, 779, 1749, 2052, 1616, 1962, 28],
+  [267, 425, 628, 692, 778, 1048, 1225, 1363, 1429, 1440, 1530, 1701],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1314, 1476],
+  [250, 1093, 16, 32, 157, 162, 238, 239, 333, 377, 390, 476],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [325, 455, 1762, 3, 1116, 89, 1095, 353, 704, 1899, 1620, 1004],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [1650, 239, 333, 673, 419, 2057, 93, 784, 787, 669, 873, 746],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1237, 1570, 1613, 1617],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1269],
+  [16, 481, 706, 856, 920, 1157, 1202, 1441, 1450, 2088, 2095, 2165],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1223, 1381],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [249, 371, 514, 756, 783, 1242, 1867, 2034, 2, 13, 15, 18],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1306, 1418],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1226, 1249, 1266, 1299],
+  [16, 481, 706, 856, 920, 1157, 1190, 1441, 1450, 2088, 2095, 2165],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [61, 367, 395, 509, 1091, 1307, 1400, 1468, 1596, 1627, 1630, 1658],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [2068, 1043, 1610, 729, 49, 1273, 492, 278, 1438, 1333, 347, 2018],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [873, 419, 641, 787, 606, 154, 516, 450, 2057, 1016, 1406, 784],
+  [339, 1259, 784, 1573, 434, 34, 2094, 1329, 673, 900, 641, 787],
+  [258, 1478, 2259, 1442, 513, 1653, 540, 1129, 1483, 1707, 1383, 1642],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [13, 1782, 809, 1598, 2261, 1770, 265, 1810, 1297, 1697, 576, 614],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1800, 147, 1391, 488, 304, 332, 750, 2118, 416, 1616, 1083, 1915],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1313, 1148, 2124, 23, 366, 785, 2072, 634, 786, 2027, 1006, 1428],
+  [576, 814, 908, 913, 1263, 1432, 1443, 2, 13, 15, 18, 22],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1381],
+  [952, 557, 754, 1657, 903, 491, 1449, 1281, 27, 1387, 212, 209],
+  [267, 425, 628, 692, 778, 1048, 1166, 1363, 1429, 1440, 1530, 1701],
+  [1286, 344, 866, 599, 2236, 6, 999, 20, 126, 381, 161, 637],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2146, 8, 1056, 78, 800, 594, 374, 2239, 1427, 1783, 794, 1915],
+  [1445, 24, 607, 1128, 1459, 1583, 2230, 715, 85, 1275, 1475, 482],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1570, 1613, 1617],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [112, 2065, 452, 1254, 1301, 405, 600, 134, 1695, 1464, 1130, 2022],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1426, 1518, 1546],
+  [249, 371, 514, 756, 783, 1194, 1867, 2034, 2, 13, 15, 18],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [211, 18, 433, 96, 1456, 840, 257, 1420, 1342, 1137, 491, 1449],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1266, 1299],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [97, 492, 729, 1043, 1438, 1521, 1973, 2018, 2076, 2100, 2213, 8],
+  [2015, 600, 1130, 112, 1240, 2022, 717, 452, 116, 492, 1464, 2065],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [258, 513, 1211, 1442, 1478, 1642, 1906, 2259, 7, 12, 29, 39],
+  [34, 434, 1506, 2094, 1210, 746, 1652, 673, 888, 1792, 784, 339],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [979, 1058, 894, 1664, 575, 845, 1864, 14, 2199, 421, 33, 501],
+  [814, 195, 913, 83, 1432, 736, 1160, 247, 720, 576, 1473, 1617],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [20, 542, 637, 152, 47, 298, 2236, 866, 1105, 536, 126, 720],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [162, 238, 476, 581, 766, 1149, 1320, 1487, 1704, 1735, 1746, 1786],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [1438, 49, 1043, 1973, 2018, 2068, 1207, 97, 278, 492, 729, 717],
+  [1134, 68, 891, 1131, 320, 665, 129, 1037, 1323, 115, 937, 376],
+  [85, 461, 715, 2230, 1459, 812, 1475, 24, 607, 1128, 1229, 103],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1333, 1348],
+  [123, 316, 380, 659, 773, 881, 995, 2039, 2185, 9, 26, 41],
+  [212, 903, 611, 754, 2119, 836, 557, 740, 1938, 27, 1657, 209],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [165, 482, 577, 677, 696, 886, 1061, 1373, 1463, 1489, 1491, 1544],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1226, 599, 344, 6, 866, 2236, 999, 381, 161, 20, 126, 1659],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [614, 945, 1697, 1213, 236, 1770, 13, 1782, 1326, 809, 1710, 231],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [405, 2065, 134, 1240, 112, 521, 1695, 452, 1130, 131, 1254, 1464],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [501, 1426, 2212, 2199, 36, 745, 2200, 1088, 1664, 14, 1058, 1544],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1418],
+  [61, 367, 395, 509, 1091, 1205, 1400, 1468, 1596, 1627, 1630, 1658],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1350],
+  [1219, 23, 2124, 2072, 785, 1148, 366, 1006, 1428, 2027, 1544, 634],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1476],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2051, 30, 1457, 839, 1154, 980, 1830, 1011, 989, 104, 153, 1877],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [147, 750, 1165, 2226, 8, 28, 49, 60, 61, 63, 78, 97],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [238, 722, 2158, 1996, 182, 231, 1564, 1326, 1735, 581, 162, 945],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [129, 1037, 665, 320, 1131, 891, 68, 1134, 1274, 115, 937, 376],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [1564, 231, 1697, 722, 945, 1770, 2, 15, 1008, 809, 2158, 1597],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [80, 235, 1573, 339, 154, 362, 215, 601, 516, 900, 641, 46],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [347, 1610, 729, 862, 25, 1207, 278, 905, 2027, 670, 2068, 1798],
+  [2227, 109, 1115, 1039, 1804, 587, 707, 1557, 585, 1756, 69, 1114],
+  [1140, 629, 884, 569, 179, 29, 1484, 2203, 708, 586, 2217, 825],
+  [23, 670, 819, 964, 1219, 1592, 2027, 2087, 2124, 2162, 5, 17],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [565, 508, 433, 1137, 987, 748, 840, 96, 257, 1597, 265, 1810],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [144, 537, 634, 1604, 1792, 25, 34, 87, 177, 205, 207, 268],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [53, 240, 324, 368, 1159, 1781, 2046],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [2252, 595, 545, 740, 390, 1735, 32, 1992, 836, 412, 209, 1441],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [164, 760, 1543, 1944, 2110, 2164, 3, 6, 20, 30, 59, 89],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [1530, 425, 117, 2255, 1429, 2245, 2002, 267, 968, 1440, 628, 1802],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [28, 899, 904, 1035, 1616, 1816, 1905, 1962, 2052, 2151, 8, 49],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1392],
+  [426, 1517, 1949, 838, 387, 1687, 1124, 128, 1075, 1659, 181, 59],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1463, 1489, 1491, 1544],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [1653, 977, 660, 157, 377, 1478, 2197, 2031, 1442, 841, 258, 1211],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [209, 212, 1281, 754, 557, 836, 740, 903, 2252, 611, 2119, 952],
+  [548, 2169, 189, 408, 1042, 1744, 1617, 1859, 266, 484, 757, 1160],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [304, 2118, 332, 1915, 1800, 1216, 1616, 147, 185, 374, 1905, 416],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [1590, 1954, 148, 67, 916, 282, 65, 4, 259, 70, 850, 217],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1468, 1596, 1627, 1630, 1658],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1016, 444, 328, 407, 450, 106, 516, 66, 854, 606, 187, 105],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [185, 531, 1050, 1452, 1477, 1918, 2007, 2150, 8, 28, 49, 60],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [136, 369, 523, 762, 816, 1058, 1088, 1528, 1638, 1850, 1868, 2061],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [247, 433, 18, 211, 83, 913, 1342, 1245, 1598, 2261, 576, 565],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [917, 177, 373, 1730, 537, 1515, 87, 888, 1604, 1798, 1072, 1823],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [1303, 745, 695, 36, 1544, 501, 2212, 2200, 2199, 567, 366, 797],
+  [571, 2146, 1228, 594, 1783, 374, 78, 8, 1056, 800, 1571, 1915],
+  [1006, 670, 23, 819, 2124, 2027, 862, 1313, 2072, 785, 597, 2112],
+  [1440, 628, 2255, 1783, 921, 425, 1363, 794, 267, 1530, 2245, 594],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [1528, 1088, 136, 745, 1148, 501, 1544, 268, 366, 1303, 1426, 523],
+  [736, 720, 195, 542, 1160, 298, 814, 1859, 1617, 1263, 1266, 757],
+  [148, 1021, 1396, 1590, 1677, 1954, 67, 916],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [177, 917, 1823, 1920, 25, 34, 87, 144, 205, 207, 268, 373],
+  [2018, 1273, 97, 1973, 1043, 1207, 49, 717, 2068, 492, 1596, 1627],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [628, 1429, 1783, 921, 2255, 794, 594, 78, 8, 267, 1427, 425],
+  [2223, 390, 16, 2121, 2165, 481, 32, 595, 162, 1356, 1735, 1992],
+  [1478, 513, 912, 258, 2259, 1211, 79, 841, 1502, 1653, 157, 502],
+  [576, 814, 908, 913, 1220, 1263, 1432, 2, 13, 15, 18, 22],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1229, 607, 1128, 24, 1583, 1459, 2230, 715, 1475, 482, 85, 1275],
+  [228, 241, 890, 7, 1960, 487, 1147, 1845, 2081, 958, 803, 832],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [491, 1657, 27, 603, 1938, 257, 2119, 840, 903, 96, 952, 754],
+  [16, 481, 706, 856, 920, 1157, 1190, 1202, 1441, 2088, 2095, 2165],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [185, 531, 1050, 1409, 1477, 1918, 2007, 2150, 8, 28, 49, 60],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [49, 278, 1026, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [1245, 491, 901, 96, 211, 18, 1449, 840, 257, 433, 1657, 27],
+  [1316, 2051, 839, 30, 980, 1830, 1154, 989, 1011, 104, 153, 1877],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [24, 715, 1229, 607, 2230, 1445, 1275, 85, 1128, 461, 1583, 1475],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [135, 597, 785, 1313, 1715, 1772, 2072, 5, 17, 23, 69, 112],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1489, 1491, 1544],
+  [1122, 452, 1695, 5, 459, 605, 2022, 386, 131, 116, 600, 880],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [158, 2219, 380, 423, 176, 892, 316, 1757, 586, 881, 12, 659],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1596, 1627, 1630, 1658],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [462, 2121, 2088, 1642, 16, 660, 2223, 1441, 1653, 2165, 390, 32],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [529, 13, 576, 614, 1213, 1710, 1598, 2261, 1263, 814, 1705, 913],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [2230, 812, 1128, 461, 684, 85, 1275, 482, 607, 1583, 1756, 103],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [185, 531, 1050, 1409, 1452, 1918, 2007, 2150, 8, 28, 49, 60],
+  [258, 1442, 1211, 1653, 2259, 1383, 513, 912, 157, 841, 977, 660],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [304, 332, 962, 1216, 1391, 1800, 1915, 2118, 8, 28, 49, 60],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1129, 540, 40, 676, 1707, 632, 2259, 708, 1211, 258, 2217, 832],
+  [629, 179, 569, 2203, 1335, 1140, 884, 29, 586, 708, 825, 2217],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1704, 1735, 1746, 1786],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1491, 1544],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1544],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [2017, 912, 39, 841, 79, 2004, 1442, 502, 157, 2031, 977, 513],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [34, 1652, 434, 1259, 1792, 2094, 888, 537, 144, 1604, 746, 373],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [96, 257, 491, 840, 1144, 1456, 1537, 1579, 1640, 1731, 2030, 2141],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1604, 2125, 1798, 537, 144, 905, 1423, 1792, 25, 373, 177, 917],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1124, 1949, 1659, 999, 1372, 59, 426, 381, 6, 161, 292, 599],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1546],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [97, 492, 729, 1043, 1253, 1438, 1973, 2018, 2076, 2100, 2213, 8],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [9, 197, 42, 361, 41, 2029, 1661, 831, 251, 172, 2032, 370],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [1431, 268, 136, 1088, 1148, 623, 975, 207, 1581, 523, 1985, 1219],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [1363, 117, 425, 2255, 1429, 2002, 2245, 968, 267, 1440, 60, 628],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [142, 677, 2012, 1936, 577, 1673, 808, 1618, 165, 1041, 886, 2228],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1579, 1640, 1731, 2030, 2141],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1944, 164, 835, 60, 1796, 968, 2002, 414, 1802, 1869, 2047, 1116],
+  [366, 745, 785, 2072, 1426, 695, 1431, 1303, 1313, 23, 1219, 1148],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [1118, 123, 1879, 276, 776, 1896, 732, 881, 178, 26, 1974, 197],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1009, 459, 605, 131, 5, 1114, 1695, 880, 1122, 1464, 824, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [803, 2081, 1882, 1147, 1845, 958, 502, 1960, 7, 241, 79, 890],
+  [707, 109, 1756, 103, 2227, 1334, 684, 812, 1039, 587, 1061, 585],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [1326, 231, 1697, 722, 2, 1008, 15, 1770, 2158, 1597, 945, 809],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [49, 278, 1026, 1455, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1613, 1617],
+  [1725, 254, 1794, 416, 571, 414, 704, 1427, 1802, 1796, 267, 332],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [339, 1329, 900, 235, 80, 215, 601, 321, 362, 154, 255, 578],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [12, 176, 423, 932, 960, 1699, 1923, 2089, 2219, 2247, 7, 29],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1904, 1966, 2258, 14, 33],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1640, 1731, 2030, 2141],
+  [1992, 545, 2197, 32, 377, 2031, 977, 1356, 157, 1383, 660, 1387],
+  [975, 207, 623, 1985, 321, 268, 900, 786, 1148, 339, 1528, 1573],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1128, 1445, 607, 1229, 482, 24, 2230, 1475, 1459, 715, 85, 1275],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [148, 1396, 1954, 67, 916, 282, 4, 259, 65, 70, 850, 132],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [23, 670, 819, 964, 1219, 1336, 2027, 2087, 2124, 2162, 5, 17],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [395, 1627, 61, 97, 717, 367, 1825, 2018, 1666, 1130, 1973, 1438],
+  [1008, 987, 748, 15, 2, 1564, 508, 1810, 565, 809, 1326, 231],
+  [2261, 265, 576, 1213, 1782, 1810, 13, 809, 1770, 508, 2, 748],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [810, 261, 74, 1078, 1030, 437, 546, 38, 464, 618, 285, 2264],
+  [144, 1515, 537, 1792, 2125, 1506, 905, 1798, 1652, 888, 634, 373],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [1333, 729, 1207, 347, 2068, 278, 492, 1043, 49, 862, 25, 1273],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1617],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1905, 28, 1962, 1800, 147, 899, 750, 2052, 304, 1391, 2118, 1216],
+  [1160, 1859, 720, 266, 736, 298, 195, 757, 1432, 542, 484, 47],
+  [1673, 10, 1133, 1804, 954, 677, 1143, 1039, 1936, 1533, 1115, 2228],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1899, 89, 1762, 488, 704, 612, 1095, 909, 1178, 1075, 128, 325],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [367, 1596, 531, 395, 1973, 97, 1825, 2018, 509, 61, 1438, 1666],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1658],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [93, 669, 788, 798, 1025, 2057, 2159, 7, 12, 29, 39, 40],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1850, 1868, 2061],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1731, 2030, 2141],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1707, 632, 2126, 462, 676, 40, 1129, 1483, 1211, 2113, 258, 1471],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [1184, 239, 333, 93, 673, 2057, 1769, 419, 669, 873, 787, 784],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [34, 2094, 434, 1792, 1506, 786, 1259, 144, 1604, 634, 537, 888],
+  [1383, 660, 1478, 977, 258, 157, 1211, 1442, 377, 2197, 2031, 2259],
+  [89, 704, 749, 1620, 1899, 3, 6, 20, 30, 59, 104, 128],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1449, 27, 903, 754, 1938, 2119, 491, 557, 1281, 603, 952, 611],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [1124, 1517, 999, 6, 381, 161, 1949, 599, 292, 59, 2236, 1286],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [251, 2032, 370, 361, 9, 1525, 197, 431, 178, 42, 41, 986],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [14, 2199, 1058, 979, 1262, 2212, 501, 575, 1303, 894, 1088, 2200],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1825, 395, 61, 509, 1596, 367, 1130, 1627, 717, 134, 1912, 97],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1618, 677, 10, 1133, 1804, 1039, 1533, 954, 1143, 1936, 577, 142],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [148, 1021, 1396, 1433, 1590, 1954, 67, 916],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1687, 1914, 2060, 3],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [128, 1075, 612, 181, 1095, 909, 387, 1372, 838, 1089, 1899, 1762],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [254, 416, 571, 1125, 1146, 1571, 1702, 1925, 2078, 8, 28, 49],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [5, 131, 459, 605, 1464, 452, 1122, 1554, 405, 1240, 521, 1114],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1770, 1326, 945, 1564, 2, 231, 809, 15, 1782, 1008, 1810, 1297],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [12, 176, 423, 932, 960, 1576, 1923, 2089, 2219, 2247, 7, 29],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [267, 425, 628, 692, 778, 1048, 1166, 1225, 1363, 1429, 1440, 1530],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1925, 2078, 8, 28, 49],
+  [871, 518, 22, 566, 371, 657, 1710, 236, 614, 1705, 1297, 1867],
+  [1149, 581, 476, 766, 514, 236, 162, 1320, 1996, 238, 371, 722],
+  [657, 1749, 1710, 529, 22, 566, 1703, 1473, 871, 614, 518, 13],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [676, 40, 632, 1129, 1483, 540, 708, 2126, 1642, 2259, 1211, 258],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [657, 614, 871, 1705, 1703, 1297, 13, 1473, 22, 529, 566, 236],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [135, 597, 785, 1313, 1461, 1772, 2072, 5, 17, 23, 69, 112],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1120, 315, 415, 845, 1864, 26, 1974, 894, 1982, 33, 421, 196],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1571, 1794, 254, 414, 1796, 416, 1802, 704, 571, 1116, 267, 1178],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [87, 917, 373, 1423, 1072, 177, 888, 537, 1093, 250, 1515, 249],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 2030, 2141],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [1996, 595, 162, 238, 182, 1320, 412, 481, 1356, 390, 2165, 2158],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1985, 2005, 2036, 25],
+  [189, 901, 548, 1388, 1456, 2169, 211, 1245, 18, 408, 1828, 132],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1786],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [1705, 349, 657, 529, 813, 1710, 1473, 22, 566, 1165, 838, 2256],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [87, 373, 1072, 1098, 1730, 2084, 25, 34, 144, 177, 205, 207],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [684, 1557, 707, 103, 109, 1061, 812, 1039, 1334, 2227, 1475, 461],
+  [158, 892, 310, 1467, 2203, 172, 831, 732, 2029, 380, 1484, 276],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [349, 1749, 2, 13, 15, 18, 22, 27, 81, 83, 96, 121],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1095, 1178, 89, 1899, 325, 3, 612, 1620, 455, 704, 1116, 353],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [239, 1650, 2088, 1184, 766, 1093, 250, 476, 16, 481, 2165, 93],
+  [809, 1697, 2, 1782, 15, 1810, 1326, 1564, 1008, 945, 1213, 231],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [135, 597, 785, 1313, 1461, 1715, 2072, 5, 17, 23, 69, 112],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [49, 278, 1026, 1455, 1567, 1610, 1780, 1884, 1940, 1987, 2068, 2166],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1884, 1940, 1987, 2068, 2166],
+  [53, 240, 324, 368, 1159, 1353, 2046],
+  [809, 1770, 1810, 1213, 265, 2, 15, 1697, 1598, 2261, 13, 1008],
+  [594, 1440, 628, 78, 921, 794, 8, 1427, 1228, 2146, 1429, 2255],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [144, 1652, 1604, 1506, 634, 2094, 34, 434, 786, 537, 1515, 888],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [414, 1725, 254, 1571, 1116, 704, 1178, 455, 89, 416, 325, 1796],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [1802, 164, 60, 414, 2245, 2002, 1543, 1725, 267, 1944, 968, 1794],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [2125, 1515, 905, 25, 1604, 278, 144, 1823, 1423, 537, 1333, 177],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [147, 1216, 750, 1616, 304, 1391, 2118, 332, 1905, 488, 28, 1962],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2245, 1796, 267, 60, 2002, 1725, 164, 425, 2255, 968, 1571, 414],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [1039, 1133, 1115, 1618, 1673, 1334, 10, 2227, 954, 109, 1061, 1009],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [809, 265, 2, 15, 1782, 748, 1770, 1008, 508, 987, 1597, 1598],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [28, 899, 904, 1035, 1366, 1616, 1905, 1962, 2052, 2151, 8, 49],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1940, 177, 278, 1798, 49, 1423, 2068, 917, 1515, 779, 2052, 2125],
+  [529, 1213, 1473, 1705, 1840, 2, 13, 15, 18, 22, 27, 81],
+  [395, 1666, 509, 61, 367, 1596, 1627, 1912, 531, 1130, 717, 97],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [132, 193, 98, 217, 850, 70, 65, 259, 907, 823, 4, 555],
+  [408, 548, 1388, 2169, 2218, 1, 4, 11, 21, 47, 65, 70],
+  [2051, 1316, 1457, 30, 1154, 839, 980, 989, 1877, 153, 1011, 1067],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [529, 1213, 1473, 1705, 1824, 2, 13, 15, 18, 22, 27, 81],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1147, 2081, 803, 1960, 1556, 958, 241, 1882, 7, 890, 502, 832],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [464, 618, 255, 55, 578, 43, 138, 74, 31, 285, 261, 38],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1868, 2061],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1617, 1160, 266, 298, 757, 720, 736, 542, 1432, 484, 47, 536],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [387, 426, 838, 909, 1372, 2256, 3, 6, 20, 30, 59, 89],
+  [1977, 88, 141, 11, 391, 807, 345, 108, 1, 555, 983, 21],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [845, 894, 33, 421, 1262, 979, 1058, 523, 315, 575, 1120, 1664],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [249, 1072, 518, 514, 371, 566, 22, 779, 1703, 871, 250, 1730],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 2061],
+  [2047, 835, 1067, 602, 1004, 353, 1877, 1944, 2237, 455, 1116, 3],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1067, 989, 833, 602, 153, 2237, 1004, 1869, 1089, 1830, 2047, 2051],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1118, 26, 1896, 1974, 1548, 178, 776, 415, 123, 985, 194, 276],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [958, 1556, 803, 2081, 502, 1147, 1845, 7, 241, 1960, 79, 890],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1940, 1987, 2068, 2166],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1879, 776, 194, 985, 26, 1118, 1548, 817, 432, 110, 229, 881],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1620, 89, 1762, 704, 1095, 612, 1178, 488, 325, 1075, 909, 3],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1966, 2258, 14, 33],
+  [28, 1962, 899, 2052, 1616, 779, 1940, 1800, 304, 750, 147, 185],
+  [258, 513, 1211, 1258, 1442, 1478, 1642, 2259, 7, 12, 29, 39],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [32, 377, 545, 714, 992, 1580, 1921, 1992, 2140, 2145, 2197, 2204],
+  [2239, 509, 800, 367, 1825, 8, 1056, 1228, 78, 531, 2146, 794],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1680, 1687, 2060, 3],
+  [2118, 374, 332, 1391, 800, 1056, 304, 2146, 1228, 571, 8, 1427],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [185, 531, 1050, 1409, 1452, 1477, 2007, 2150, 8, 28, 49, 60],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [177, 917, 1437, 1823, 25, 34, 87, 144, 205, 207, 268, 373],
+  [32, 377, 545, 714, 992, 1580, 1911, 1992, 2140, 2145, 2197, 2204],
+  [104, 153, 833, 989, 1011, 1978, 2020, 2122, 2251, 3, 6, 20],
+  [12, 176, 423, 932, 960, 1576, 1699, 2089, 2219, 2247, 7, 29],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1702, 2078, 8, 28, 49],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [26, 415, 1118, 1548, 1879, 1896, 1974, 2008, 9, 41, 42, 52],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2012, 142, 1533, 677, 1041, 808, 2228, 1143, 1673, 483, 10, 1618],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [27, 2119, 603, 611, 1657, 903, 1281, 592, 1449, 257, 212, 754],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1823, 49, 278, 2068, 899, 2052, 1273, 1962, 28, 1905, 177, 1207],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [1543, 835, 164, 1796, 1869, 414, 60, 2047, 1116, 968, 1802, 2002],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1517, 1124, 59, 1659, 292, 1372, 381, 161, 104, 999, 426, 6],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [1396, 1590, 148, 67, 916, 282, 65, 259, 4, 70, 850, 217],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [1845, 890, 1147, 2081, 241, 803, 7, 1556, 958, 228, 832, 1882],
+  [816, 74, 261, 464, 1603, 810, 1847, 618, 1982, 1030, 1078, 110],
+  [28, 2052, 1905, 899, 1616, 779, 1940, 750, 1800, 147, 1823, 1165],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1904, 2258, 14, 33],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [2018, 1438, 97, 1273, 1627, 1043, 1596, 49, 717, 2068, 531, 367],
+  [1118, 26, 1879, 178, 415, 370, 251, 1548, 361, 1661, 1896, 197],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1862, 88, 141, 11, 391, 807, 345, 108, 1, 555, 983, 21],
+  [104, 153, 833, 989, 1011, 1922, 2020, 2122, 2251, 3, 6, 20],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [816, 110, 1961, 33, 421, 523, 985, 261, 810, 74, 1030, 1603],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [158, 593, 1467, 1757, 2062, 7, 12, 29, 39, 40, 79, 93],
+  [321, 207, 975, 1581, 623, 900, 268, 255, 1847, 601, 55, 339],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 2068, 2166],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1580, 2197, 32, 545, 377, 660, 1356, 977, 1383, 2031, 2121, 390],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [162, 1735, 238, 1320, 581, 476, 182, 2158, 595, 722, 481, 1149],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [968, 60, 2245, 1802, 425, 1796, 267, 164, 1363, 1530, 117, 1543],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [39, 841, 2017, 2031, 157, 1502, 912, 377, 977, 79, 1383, 1442],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1743, 1985, 2036, 25],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [185, 531, 1050, 1409, 1452, 1477, 1918, 2150, 8, 28, 49, 60],
+  [26, 415, 1118, 1548, 1879, 1896, 1933, 1974, 9, 41, 42, 52],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [142, 1936, 1533, 808, 677, 1041, 2228, 577, 1673, 1618, 483, 1143],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [600, 1254, 2022, 492, 116, 717, 1130, 452, 112, 1240, 386, 1464],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [39, 1502, 841, 2004, 912, 79, 2031, 157, 1442, 977, 377, 502],
+  [97, 1438, 1973, 1273, 1043, 717, 1596, 1627, 1207, 492, 49, 2068],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2122, 2251, 3, 6, 20],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [116, 600, 386, 2015, 452, 1464, 1122, 1254, 492, 1240, 880, 1695],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [2124, 1428, 670, 1006, 23, 25, 862, 905, 634, 1313, 1333, 1219],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [831, 172, 197, 1525, 276, 732, 361, 9, 42, 310, 41, 251],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2141],
+  [377, 157, 977, 2004, 841, 39, 2017, 1383, 1502, 912, 2197, 1653],
+  [1661, 431, 370, 9, 251, 361, 41, 42, 1525, 986, 700, 197],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [249, 371, 514, 756, 783, 1194, 1242, 1867, 2, 13, 15, 18],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1743, 1985, 2005, 25],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [123, 316, 380, 659, 773, 881, 995, 1280, 2185, 9, 26, 41],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [53, 240, 324, 368, 1159, 1353, 1781],
+  [353, 1004, 602, 455, 1869, 1116, 3, 325, 2237, 835, 1067, 1178],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1316, 1830, 1457, 30, 1154, 839, 980, 989, 1011, 153, 104, 1877],
+  [1962, 28, 1905, 899, 779, 1616, 1940, 1823, 750, 1165, 147, 1800],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [873, 669, 654, 1209, 333, 419, 606, 93, 787, 641, 1184, 1650],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1680, 1687, 1914, 3],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [158, 593, 1467, 1757, 1984, 7, 12, 29, 39, 40, 79, 93],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [134, 112, 1301, 1240, 405, 1130, 1254, 452, 1695, 600, 1464, 61],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [49, 1207, 278, 1273, 1043, 1610, 1438, 729, 1940, 1333, 2018, 492],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [785, 366, 1544, 23, 1313, 1006, 2124, 745, 1428, 1219, 819, 135],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2100, 2213, 8],
+  [77, 2171, 2139, 196, 700, 986, 52, 431, 370, 2032, 1661, 251],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1702, 1925, 8, 28, 49],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1147, 803, 1845, 1556, 1882, 1960, 958, 241, 7, 502, 890, 832],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [87, 373, 1072, 1098, 1730, 1754, 25, 34, 144, 177, 205, 207],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [23, 670, 819, 964, 1219, 1336, 1592, 2027, 2124, 2162, 5, 17],
+  [462, 1471, 93, 1769, 16, 239, 1650, 2165, 2223, 1184, 2121, 406],
+  [12, 176, 423, 932, 960, 1576, 1699, 1923, 2219, 2247, 7, 29],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [434, 34, 1652, 1506, 786, 1259, 1792, 1210, 1581, 144, 207, 623],
+  [16, 481, 706, 856, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2165],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2076, 2213, 8],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [164, 760, 1360, 1543, 1944, 2164, 3, 6, 20, 30, 59, 89],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [562, 17, 597, 819, 880, 862, 670, 135, 824, 386, 1428, 1006],
+  [686, 406, 2126, 586, 932, 632, 1642, 708, 176, 1707, 676, 40],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1391, 304, 1915, 332, 1800, 1216, 185, 374, 1616, 800, 571, 147],
+  [1938, 611, 27, 903, 1281, 212, 603, 1657, 754, 836, 592, 740],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1441, 2223, 32, 390, 16, 660, 1471, 2197, 2165, 1992, 1653, 1383],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2020, 2251, 3, 6, 20],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [23, 1313, 1006, 2027, 1428, 1219, 670, 2072, 785, 819, 634, 1148],
+  [905, 1798, 25, 1515, 1604, 144, 634, 1792, 537, 2027, 1333, 278],
+  [632, 2113, 686, 708, 1707, 676, 40, 586, 1642, 406, 1129, 1483],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [2077, 77, 700, 986, 52, 2171, 431, 196, 2032, 370, 1661, 251],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2145, 2197, 2204],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2140, 2197, 2204],
+  [1228, 1056, 8, 78, 800, 374, 594, 2239, 1427, 1783, 794, 1915],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [185, 531, 1050, 1409, 1452, 1477, 1918, 2007, 8, 28, 49, 60],
+  [28, 899, 904, 1035, 1366, 1616, 1816, 1905, 1962, 2052, 8, 49],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [722, 182, 238, 231, 1320, 1564, 1326, 1597, 1008, 15, 2, 1697],
+  [93, 669, 788, 798, 1025, 1632, 2057, 7, 12, 29, 39, 40],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [23, 670, 819, 964, 1219, 1336, 1592, 2027, 2087, 2124, 5, 17],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [164, 760, 1360, 1543, 1944, 2110, 3, 6, 20, 30, 59, 89],
+  [481, 16, 2223, 1441, 162, 390, 476, 766, 2121, 1735, 1996, 581],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [408, 1388, 1042, 548, 21, 266, 484, 363, 757, 555, 167, 1859],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [2077, 196, 77, 2139, 700, 986, 52, 431, 370, 2032, 415, 1661],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [123, 316, 380, 659, 773, 881, 995, 1280, 2039, 9, 26, 41],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [157, 2031, 16, 32, 162, 238, 239, 250, 333, 377, 390, 476],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1992, 32, 660, 1580, 377, 1383, 977, 157, 545, 2031, 1653, 2121],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1664, 501, 2212, 14, 1058, 1303, 1262, 979, 1088, 2200, 36, 1426],
+  [36, 2212, 797, 1303, 14, 2199, 1664, 1426, 501, 507, 695, 1032],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [239, 333, 1184, 1650, 1769, 16, 32, 157, 162, 238, 250, 377],
+  [1484, 1335, 629, 586, 1140, 179, 569, 884, 29, 708, 158, 2126],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2140, 2145, 2197],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [2200, 2199, 36, 1303, 14, 1664, 501, 1426, 797, 1058, 979, 1262],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2076, 2100, 8],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [678, 759, 825, 477, 29, 487, 884, 1140, 708, 569, 179, 832],
+  [408, 548, 1388, 1829, 2169, 1, 4, 11, 21, 47, 65, 70],
+  [423, 176, 659, 1467, 12, 654, 316, 380, 932, 669, 995, 606],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [1441, 16, 2165, 390, 2121, 481, 162, 32, 595, 1735, 1471, 1356],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [147, 750, 1165, 1318, 8, 28, 49, 60, 61, 63, 78, 97],
+  [1334, 109, 587, 585, 1115, 69, 707, 1557, 1039, 1114, 1804, 1009],
+  [483, 1143, 1041, 510, 1936, 10, 954, 2012, 808, 677, 135, 1618],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [85, 715, 1275, 607, 1459, 1128, 461, 1475, 24, 1229, 1445, 1583],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [344, 866, 599, 20, 999, 1286, 6, 1226, 1266, 152, 637, 1659],
+  [1004, 602, 833, 1089, 3, 353, 325, 455, 2047, 1095, 181, 1067],
+  [366, 695, 745, 1431, 14, 33, 36, 62, 136, 300, 305, 315],
+  [800, 1912, 1056, 1228, 8, 2146, 78, 374, 594, 794, 509, 1915],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [267, 1802, 425, 2255, 2002, 1796, 60, 1363, 968, 1530, 1429, 1440],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [12, 176, 423, 932, 960, 1576, 1699, 1923, 2089, 2219, 7, 29],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2020, 2122, 3, 6, 20],
+  [740, 1356, 836, 209, 212, 595, 412, 611, 1387, 592, 1281, 545],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [1429, 267, 1440, 425, 2245, 628, 1363, 1783, 1530, 1802, 921, 117],
+  [1083, 909, 387, 838, 349, 1075, 488, 1687, 128, 1620, 612, 1899],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1904, 1966, 14, 33],
+  [1211, 258, 513, 540, 1442, 1478, 1129, 1483, 1707, 40, 832, 676],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1598, 265, 576, 1213, 1782, 1810, 13, 809, 1770, 508, 2, 748],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [982, 1030, 810, 187, 437, 546, 656, 229, 432, 1078, 854, 1603],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 1108],
+]
+
+/** Same, restricted to the departement of the ville */
+export const NEARBY_IN_DEPARTEMENT: number[][] = [
+  [],
+  [141, 21, 139, 167, 1105, 126, 166, 204, 221, 246, 352, 411],
+  [15, 809, 1770, 1810, 1697, 748, 1782, 1326, 231, 945, 722, 81],
+  [325, 455, 353, 1178, 1004, 1762, 2237, 2047, 1089, 835, 191, 286],
+  [259, 65, 282, 850, 70, 132, 120, 184, 303, 441, 495, 499],
+  [131, 459, 605, 1695, 1554, 1122, 1464, 1009, 880, 1114, 521, 69],
+  [999, 599, 1286, 344, 381, 1659, 161, 1124, 292, 1517, 1949, 59],
+  [241, 958, 1147, 2081, 1845, 803, 1960, 1882, 228, 1556, 890, 502],
+  [1228, 78, 2146, 594, 1056, 800, 374, 2239, 1783, 794, 1427, 921],
+  [42, 41, 1525, 1661, 2032, 197, 431, 2029, 831, 172, 276, 732],
+  [954, 1143, 1133, 1618, 1673, 510, 2228, 483, 1936, 1533, 1115, 2012],
+  [88, 391, 345, 807, 1862, 1977, 108, 983, 555, 907, 823, 193],
+  [2219, 423, 176, 932, 960, 1576, 1699, 1923, 2089, 2247],
+  [614, 1297, 236, 234, 582, 633, 653, 821, 919, 1007, 1079, 1189],
+  [979, 1262, 575, 894, 845, 1864, 421, 33, 315, 1120, 1717, 1982],
+  [2, 809, 1810, 1770, 748, 1697, 1782, 1326, 231, 945, 722, 81],
+  [2223, 2165, 1441, 481, 2088, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [2112, 562, 862, 347, 386, 116, 358, 428, 524, 580, 590, 608],
+  [211, 1245, 433, 1420, 1342, 565, 508, 987, 265, 1598, 2261, 214],
+  [94, 105, 35, 187, 50, 51, 71, 72, 92, 119, 122, 125],
+  [866, 1266, 637, 2236, 1226, 152, 542, 680, 768, 935, 1201, 1249],
+  [1, 141, 167, 139, 1105, 126, 166, 204, 221, 246, 352, 411],
+  [566, 518, 1703, 871, 657, 1710, 494, 815, 965, 1003, 1014, 1192],
+  [2124, 2027, 1219, 670, 819, 964, 1336, 1592, 2087, 2162],
+  [1229, 1459, 607, 1445, 1128, 715, 2230, 1583, 1275, 85, 1475, 461],
+  [905, 2125, 1798, 1333, 205, 583, 625, 667, 782, 793, 940, 996],
+  [1879, 1118, 1974, 1896, 415, 1548, 1933, 2008],
+  [1938, 603, 2119, 1657, 1449, 903, 611, 1281, 754, 212, 557, 952],
+  [1962, 1905, 2052, 899, 1616, 904, 1035, 1366, 1816, 2151],
+  [884, 1140, 629, 569, 179, 2217, 678, 825, 1484, 759, 477, 487],
+  [1154, 839, 1316, 980, 2051, 1457, 1830, 764, 874, 877, 1001, 1073],
+  [138, 43, 285, 45, 48, 56, 57, 75, 76, 84, 86, 99],
+  [1992, 2197, 545, 1580, 377, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [421, 845, 1864, 894, 1262, 1982, 979, 315, 1120, 575, 1717, 14],
+  [434, 1652, 1506, 1259, 1210, 746, 673, 393, 400, 574, 589, 743],
+  [94, 105, 19, 187, 50, 51, 71, 72, 92, 119, 122, 125],
+  [2200, 2212, 797, 1426, 2199, 501, 1664, 567, 394, 851, 1015, 1087],
+  [54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365, 693],
+  [1078, 437, 546, 1603, 261, 74, 810, 1030, 2264, 1961, 100, 186],
+  [2017, 841, 1502, 2004, 912, 79, 643, 671, 701, 752, 830, 974],
+  [676, 1707, 1129, 1483, 632, 540, 708, 1335, 2203, 291, 639, 682],
+  [42, 9, 1525, 2032, 1661, 197, 2029, 431, 831, 172, 276, 52],
+  [41, 9, 1525, 2032, 1661, 197, 2029, 831, 431, 172, 276, 732],
+  [138, 285, 31, 45, 48, 56, 57, 75, 76, 84, 86, 99],
+  [46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230, 237],
+  [31, 43, 48, 56, 57, 75, 76, 84, 86, 99, 102, 130],
+  [66, 107, 44, 64, 82, 95, 118, 140, 155, 159, 230, 237],
+  [536, 757, 484, 298, 363, 266, 720, 1859, 1042, 1160, 504, 515],
+  [31, 43, 45, 56, 57, 75, 76, 84, 86, 99, 102, 130],
+  [2068, 278, 1940, 1610, 1026, 1455, 1567, 1777, 1780, 1884, 1987, 2166],
+  [19, 35, 51, 71, 72, 92, 94, 105, 119, 122, 125, 133],
+  [19, 35, 50, 71, 72, 92, 94, 105, 119, 122, 125, 133],
+  [431, 2032, 1661, 41, 9, 42, 1525, 197, 2029, 831, 172, 276],
+  [240, 324, 368, 1159, 1353, 1781, 2046],
+  [58, 232, 203, 245, 37, 101, 111, 201, 219, 225, 365, 693],
+  [578, 255, 618, 1847, 464, 321, 124, 156, 171, 190, 220, 242],
+  [31, 43, 45, 48, 57, 75, 76, 84, 86, 99, 102, 130],
+  [31, 43, 45, 48, 56, 75, 76, 84, 86, 99, 102, 130],
+  [54, 232, 203, 245, 37, 101, 111, 201, 219, 225, 365, 693],
+  [292, 1949, 1124, 161, 381, 1659, 1517, 999, 6, 599, 1286, 344],
+  [2002, 968, 117, 173, 351, 544, 672, 699, 741, 947, 972, 1126],
+  [395, 1666, 1596, 1825, 1627, 509, 367, 1091, 1205, 1307, 1400, 1468],
+  [1032, 507, 808, 1041, 1303, 887, 1577, 1904, 1966, 2258],
+  [8, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372, 374],
+  [44, 46, 66, 82, 95, 107, 118, 140, 155, 159, 230, 237],
+  [850, 70, 259, 132, 4, 282, 120, 184, 303, 441, 495, 499],
+  [46, 107, 44, 64, 82, 95, 118, 140, 155, 159, 230, 237],
+  [916],
+  [891, 1134, 1274, 200, 443, 506, 543, 631, 857, 879, 1018, 1103],
+  [585, 587, 521, 1114, 1009, 1554, 131, 5, 1695, 459, 605, 1122],
+  [850, 65, 132, 259, 4, 282, 120, 184, 303, 441, 495, 499],
+  [19, 35, 50, 51, 72, 92, 94, 105, 119, 122, 125, 133],
+  [19, 35, 50, 51, 71, 92, 94, 105, 119, 122, 125, 133],
+  [726, 723, 1027, 260, 556, 627, 893, 918, 1033, 1197, 1306, 1418],
+  [261, 1603, 810, 1078, 38, 437, 546, 1030, 1961, 2264, 100, 186],
+  [31, 43, 45, 48, 56, 57, 76, 84, 86, 99, 102, 130],
+  [31, 43, 45, 48, 56, 57, 75, 84, 86, 99, 102, 130],
+  [2077, 2139, 2171, 196, 700, 986, 370, 251, 361, 178, 289, 446],
+  [594, 8, 1228, 2146, 1056, 800, 1783, 794, 374, 2239, 921, 1427],
+  [912, 1502, 841, 2017, 39, 2004, 643, 671, 701, 752, 830, 974],
+  [235, 362, 1329, 215, 601, 1573, 339, 900, 114, 127, 213, 224],
+  [2, 15, 121, 137, 169, 175, 208, 223, 231, 270, 293, 399],
+  [44, 46, 64, 66, 95, 107, 118, 140, 155, 159, 230, 237],
+  [247, 195, 736, 1617, 490, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [31, 43, 45, 48, 56, 57, 75, 76, 86, 99, 102, 130],
+  [1275, 461, 715, 2230, 1459, 812, 1475, 607, 24, 1128, 1229, 1445],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 99, 102, 130],
+  [1730, 373, 1072, 1098, 1754, 2084],
+  [11, 391, 345, 1862, 1977, 807, 108, 983, 555, 907, 823, 193],
+  [1899, 1620, 704, 749, 1654],
+  [9, 41, 42, 52, 172, 192, 197, 198, 276, 310, 334, 335],
+  [226, 376, 937, 115, 322, 496, 1022, 1097, 1108, 2266],
+  [19, 35, 50, 51, 71, 72, 94, 105, 119, 122, 125, 133],
+  [669, 2057, 788, 798, 1025, 1632, 2159],
+  [105, 35, 19, 187, 50, 51, 71, 72, 92, 119, 122, 125],
+  [44, 46, 64, 66, 82, 107, 118, 140, 155, 159, 230, 237],
+  [840, 257, 491, 1456, 1144, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [2018, 1438, 1973, 1043, 492, 729, 1253, 1521, 2076, 2100, 2213],
+  [217, 1828, 193, 823, 907, 983, 555, 108, 807, 345, 391, 11],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 102, 130],
+  [38, 74, 186, 210, 227, 261, 264, 271, 290, 301, 323, 326],
+  [37, 54, 58, 111, 201, 203, 219, 225, 232, 245, 365, 693],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 130],
+  [1557, 707, 1756, 684, 109, 1334, 2227, 1039, 1804, 397, 517, 624],
+  [1011, 153, 989, 833, 1922, 1978, 2020, 2122, 2251],
+  [94, 35, 19, 187, 50, 51, 71, 72, 92, 119, 122, 125],
+  [1406, 444, 1016, 854, 328, 407, 606, 450, 516, 1209, 154, 873],
+  [46, 66, 44, 64, 82, 95, 118, 140, 155, 159, 230, 237],
+  [983, 345, 807, 391, 11, 88, 1862, 1977, 907, 555, 823, 193],
+  [707, 1557, 1334, 2227, 1756, 1039, 103, 684, 1804, 397, 517, 624],
+  [985, 229, 432, 982, 817, 656, 194, 703, 776, 705, 728, 1064],
+  [37, 54, 58, 101, 201, 203, 219, 225, 232, 245, 365, 693],
+  [1240, 2065, 1254, 1130, 134, 1301, 452, 600, 405, 2015, 2022, 717],
+  [106, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407, 419],
+  [80, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [937, 376, 91, 226, 322, 496, 1022, 1097, 1108, 2266],
+  [386, 17, 347, 2112, 562, 862, 358, 428, 524, 580, 590, 608],
+  [2002, 968, 60, 173, 351, 544, 672, 699, 741, 947, 972, 1126],
+  [44, 46, 64, 66, 82, 95, 107, 140, 155, 159, 230, 237],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 122, 125, 133],
+  [4, 65, 70, 132, 184, 259, 282, 303, 441, 495, 499, 564],
+  [2, 15, 81, 137, 169, 175, 208, 223, 231, 270, 293, 399],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 125, 133],
+  [881, 380, 316, 995, 659, 773, 1280, 2039, 2185],
+  [55, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 133],
+  [1105, 167, 139, 21, 1, 141, 166, 204, 221, 246, 352, 411],
+  [80, 114, 213, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [1687, 1075, 612, 181, 1095, 770, 934, 1051, 1680, 1914, 2060],
+  [1037, 665, 320, 1323, 1131, 560, 279, 378, 388, 403, 525, 561],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [5, 459, 605, 1695, 1554, 1122, 1009, 1114, 1464, 521, 880, 69],
+  [850, 70, 65, 259, 4, 282, 120, 184, 303, 441, 495, 499],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2065, 1301, 112, 1240, 405, 1130, 1254, 452, 600, 717, 2015, 2022],
+  [597, 2072, 785, 1313, 1461, 1715, 1772],
+  [523, 1528, 1088, 816, 1058, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [2, 15, 81, 121, 169, 175, 208, 223, 231, 270, 293, 399],
+  [43, 31, 285, 45, 48, 56, 57, 75, 76, 84, 86, 99],
+  [167, 1, 21, 126, 141, 1105, 166, 204, 221, 246, 352, 411],
+  [44, 46, 64, 66, 82, 95, 107, 118, 155, 159, 230, 237],
+  [1, 21, 139, 167, 1105, 126, 166, 204, 221, 246, 352, 411],
+  [1533, 2012, 1936, 1673, 1618, 2228, 10, 1143, 483, 954, 1133, 510],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1792, 1604, 634, 537, 1349],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [750, 1165, 1318, 2226],
+  [1590, 1396, 1954, 1021, 1433, 1677],
+  [8, 63, 78, 180, 253, 262, 327, 336, 341, 360, 372, 374],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1266, 2236, 20, 542, 866, 637, 1226, 680, 768, 935, 1201, 1249],
+  [989, 1011, 833, 104, 1922, 1978, 2020, 2122, 2251],
+  [641, 516, 787, 450, 419, 1209, 784, 328, 407, 1016, 1406, 444],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 159, 230, 237],
+  [55, 124, 171, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [2031, 2190],
+  [1467, 1757, 593, 1984, 2062],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 230, 237],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [381, 292, 6, 1659, 999, 599, 1124, 1286, 59, 344, 1517, 1949],
+  [1996, 476, 1735, 581, 766, 238, 1320, 1704, 1149, 1271, 1487, 1746],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1543, 1944, 760, 1360, 2110, 2164],
+  [886, 577, 1061, 677, 482, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [1, 21, 126, 139, 141, 167, 204, 221, 246, 352, 411, 442],
+  [139, 21, 1105, 126, 1, 141, 166, 204, 221, 246, 352, 411],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [2, 15, 81, 121, 137, 175, 208, 223, 231, 270, 293, 399],
+  [5, 69, 131, 313, 314, 348, 383, 459, 468, 474, 521, 585],
+  [55, 124, 156, 190, 220, 242, 243, 244, 255, 263, 281, 283],
+  [831, 2029, 732, 276, 197, 1525, 310, 9, 42, 41, 892, 1661],
+  [60, 117, 351, 544, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2, 15, 81, 121, 137, 169, 208, 223, 231, 270, 293, 399],
+  [932, 423, 2219, 12, 960, 1576, 1699, 1923, 2089, 2247],
+  [917, 1823, 1437, 1920],
+  [251, 361, 370, 986, 700, 2139, 2077, 2171, 196, 77, 289, 446],
+  [569, 629, 1140, 884, 1484, 29, 825, 2217, 678, 759, 477, 487],
+  [8, 63, 78, 149, 253, 262, 327, 336, 341, 360, 372, 374],
+  [128, 1687, 612, 1095, 1075, 770, 934, 1051, 1680, 1914, 2060],
+  [2158, 412, 1597, 592, 1564, 1008, 1137, 740, 836, 621, 694, 1002],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [4, 65, 70, 120, 132, 259, 282, 303, 441, 495, 499, 564],
+  [531, 1050, 1409, 1452, 1477, 1918, 2007, 2150],
+  [38, 74, 100, 210, 227, 261, 264, 271, 290, 301, 323, 326],
+  [105, 94, 19, 35, 50, 51, 71, 72, 92, 119, 122, 125],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [1744, 901],
+  [55, 124, 156, 171, 220, 242, 243, 244, 255, 263, 281, 283],
+  [3, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780, 799],
+  [9, 41, 42, 52, 90, 172, 197, 198, 276, 310, 334, 335],
+  [1828, 907, 98, 217, 823, 555, 983, 807, 108, 345, 391, 11],
+  [817, 703, 776, 656, 432, 985, 229, 982, 110, 705, 728, 1064],
+  [736, 1617, 83, 247, 490, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [2171, 2077, 77, 2139, 700, 986, 370, 251, 178, 361, 289, 446],
+  [1525, 2029, 1661, 9, 276, 831, 172, 42, 732, 41, 2032, 431],
+  [9, 41, 42, 52, 90, 172, 192, 197, 276, 310, 334, 335],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [68, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [37, 54, 58, 101, 111, 203, 219, 225, 232, 245, 365, 693],
+  [106, 113, 154, 275, 328, 329, 337, 392, 396, 398, 407, 419],
+  [58, 54, 245, 232, 37, 101, 111, 201, 219, 225, 365, 693],
+  [1, 21, 126, 139, 141, 166, 167, 221, 246, 352, 411, 442],
+  [25, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [975, 1581, 623, 1985, 268, 786, 1148, 822, 1743, 2005, 2036],
+  [2, 15, 81, 121, 137, 169, 175, 223, 231, 270, 293, 399],
+  [1387, 212, 1281, 754, 557, 903, 611, 2119, 952, 1657, 1224, 1938],
+  [38, 74, 100, 186, 227, 261, 264, 271, 290, 301, 323, 326],
+  [18, 1245, 433, 1420, 1342, 565, 508, 987, 265, 1598, 2261, 214],
+  [1281, 611, 903, 754, 2119, 209, 557, 1938, 27, 1387, 1657, 603],
+  [80, 114, 127, 215, 224, 235, 269, 272, 280, 288, 317, 339],
+  [18, 211, 265, 287, 427, 433, 508, 519, 547, 565, 861, 869],
+  [601, 235, 80, 362, 1329, 1573, 900, 339, 114, 127, 213, 224],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [98, 1828, 193, 823, 907, 983, 555, 108, 807, 345, 391, 11],
+  [11, 88, 98, 108, 193, 217, 345, 391, 503, 530, 552, 555],
+  [37, 54, 58, 101, 111, 201, 203, 225, 232, 245, 365, 693],
+  [55, 124, 156, 171, 190, 242, 243, 244, 255, 263, 281, 283],
+  [1, 21, 126, 139, 141, 166, 167, 204, 246, 352, 411, 442],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [2, 15, 81, 121, 137, 169, 175, 208, 231, 270, 293, 399],
+  [80, 114, 127, 213, 215, 235, 269, 272, 280, 288, 317, 339],
+  [37, 54, 58, 101, 111, 201, 203, 219, 232, 245, 365, 693],
+  [91, 376, 937, 115, 322, 496, 1022, 1097, 1108, 2266],
+  [38, 74, 100, 186, 210, 261, 264, 271, 290, 301, 323, 326],
+  [241, 7, 1446, 1960, 890, 1147, 1845, 2081, 958, 803, 1882, 1556],
+  [432, 982, 817, 656, 985, 194, 703, 110, 776, 705, 728, 1064],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 237],
+  [1326, 722, 1697, 945, 2, 15, 1770, 809, 1782, 1810, 748, 81],
+  [54, 58, 245, 203, 37, 101, 111, 201, 219, 225, 365, 693],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [13, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [80, 215, 1329, 601, 362, 1573, 339, 900, 114, 127, 213, 224],
+  [1297, 614, 13, 234, 582, 633, 653, 821, 919, 1007, 1079, 1189],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1320, 1996, 1735, 162, 581, 1149, 476, 1704, 766, 1271, 1487, 1746],
+  [1650, 1184, 1769, 333, 2202],
+  [53, 324, 368, 1159, 1353, 1781, 2046],
+  [7, 1147, 1960, 1845, 958, 228, 2081, 803, 1882, 890, 1556, 502],
+  [55, 124, 156, 171, 190, 220, 243, 244, 255, 263, 281, 283],
+  [55, 124, 156, 171, 190, 220, 242, 244, 255, 263, 281, 283],
+  [55, 124, 156, 171, 190, 220, 242, 243, 255, 263, 281, 283],
+  [232, 54, 58, 203, 37, 101, 111, 201, 219, 225, 365, 693],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 352, 411, 442],
+  [83, 195, 1617, 736, 490, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1867, 514, 371, 756, 783, 1194, 1242, 2034],
+  [1093, 1172],
+  [361, 178, 370, 986, 700, 2139, 2077, 77, 2171, 196, 289, 446],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [8, 63, 78, 149, 180, 262, 327, 336, 341, 360, 372, 374],
+  [1571, 416, 571, 1125, 1146, 1693, 1702, 1925, 2078],
+  [55, 578, 1847, 618, 464, 321, 124, 156, 171, 190, 220, 242],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [840, 96, 491, 1456, 1144, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [1211, 1478, 2259, 1442, 513, 1642, 1258, 1906],
+  [4, 65, 850, 70, 132, 282, 120, 184, 303, 441, 495, 499],
+  [73, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [74, 1603, 810, 1078, 38, 437, 546, 1030, 1961, 2264, 100, 186],
+  [8, 63, 78, 149, 180, 253, 327, 336, 341, 360, 372, 374],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 281, 283],
+  [38, 74, 100, 186, 210, 227, 261, 271, 290, 301, 323, 326],
+  [1598, 2261, 508, 565, 987, 1342, 1420, 433, 18, 211, 1245, 214],
+  [757, 484, 1859, 536, 298, 47, 363, 1042, 720, 1160, 504, 515],
+  [2245, 1802, 2255, 425, 1796, 1429, 1440, 1363, 628, 1530, 692, 778],
+  [1985, 975, 207, 623, 1581, 1148, 786, 822, 1743, 2005, 2036],
+  [80, 114, 127, 213, 215, 224, 235, 272, 280, 288, 317, 339],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 293, 399],
+  [38, 74, 100, 186, 210, 227, 261, 264, 290, 301, 323, 326],
+  [80, 114, 127, 213, 215, 224, 235, 269, 280, 288, 317, 339],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [],
+  [106, 113, 154, 202, 328, 329, 337, 392, 396, 398, 407, 419],
+  [732, 197, 2029, 172, 831, 1525, 1661, 9, 310, 42, 892, 41],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [2068, 49, 1610, 1940, 1026, 1455, 1567, 1777, 1780, 1884, 1987, 2166],
+  [129, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 288, 317, 339],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 283],
+  [4, 259, 65, 850, 70, 132, 120, 184, 303, 441, 495, 499],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [43, 138, 31, 45, 48, 56, 57, 75, 76, 84, 86, 99],
+  [3, 191, 325, 353, 455, 470, 558, 651, 655, 683, 780, 799],
+  [18, 211, 214, 265, 427, 433, 508, 519, 547, 565, 861, 869],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 317, 339],
+  [77, 178, 196, 251, 361, 370, 446, 551, 568, 700, 769, 781],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 301, 323, 326],
+  [40, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129, 1141],
+  [59, 161, 381, 1124, 1659, 1949, 6, 1517, 999, 599, 1286, 344],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 399],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [720, 757, 47, 266, 1859, 536, 1160, 484, 363, 1042, 504, 515],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [14, 33, 305, 315, 359, 421, 486, 575, 646, 647, 690, 698],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 323, 326],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [4, 65, 70, 120, 132, 184, 259, 282, 441, 495, 499, 564],
+  [1391, 2118, 332, 1800, 1915, 1216, 962, 1481],
+  [14, 33, 300, 315, 359, 421, 486, 575, 646, 647, 690, 698],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [295, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [892, 172, 831, 2029, 732, 276, 1525, 197, 42, 9, 41, 1661],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [5, 69, 131, 170, 314, 348, 383, 459, 468, 474, 521, 585],
+  [5, 69, 131, 170, 313, 348, 383, 459, 468, 474, 521, 585],
+  [1120, 1717, 894, 845, 1864, 575, 33, 421, 979, 1262, 1982, 14],
+  [995, 881, 380, 659, 123, 773, 1280, 2039, 2185],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 339],
+  [7, 228, 241, 463, 502, 528, 724, 803, 827, 860, 890, 958],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [665, 129, 1037, 1323, 1131, 560, 279, 378, 388, 403, 525, 561],
+  [255, 55, 1847, 578, 618, 464, 124, 156, 171, 190, 220, 242],
+  [91, 115, 226, 376, 496, 937, 1022, 1097, 1108, 2266],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 326],
+  [53, 240, 368, 1159, 1353, 1781, 2046],
+  [3, 455, 1178, 353, 1762, 1004, 2237, 2047, 1089, 835, 191, 286],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [8, 63, 78, 149, 180, 253, 262, 336, 341, 360, 372, 374],
+  [407, 444, 1406, 1016, 450, 516, 106, 854, 606, 154, 1209, 641],
+  [106, 113, 154, 202, 275, 328, 337, 392, 396, 398, 407, 419],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [2118, 1915, 1391, 304, 1216, 1800, 962, 1481],
+  [1184, 1650, 239, 1769, 2202],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 335],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 341, 360, 372, 374],
+  [106, 113, 154, 202, 275, 328, 329, 392, 396, 398, 407, 419],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1573, 900, 1329, 235, 80, 601, 215, 362, 114, 127, 213, 224],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 360, 372, 374],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [295, 309, 541, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [1286, 599, 6, 999, 381, 161, 1659, 1124, 1517, 292, 1949, 59],
+  [391, 807, 108, 11, 88, 983, 1862, 1977, 555, 907, 823, 193],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [862, 17, 2112, 116, 386, 562, 358, 428, 524, 580, 590, 608],
+  [5, 69, 131, 170, 313, 314, 383, 459, 468, 474, 521, 585],
+  [1749, 1759],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [60, 117, 173, 544, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 411, 442],
+  [455, 1004, 3, 325, 2047, 2237, 1178, 1762, 1089, 835, 191, 286],
+  [6, 59, 161, 292, 344, 381, 570, 599, 718, 755, 796, 950],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [17, 116, 347, 386, 428, 524, 562, 580, 590, 608, 635, 652],
+  [14, 33, 300, 305, 315, 421, 486, 575, 646, 647, 690, 698],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 372, 374],
+  [251, 178, 370, 986, 700, 2139, 2077, 77, 2171, 196, 289, 446],
+  [80, 235, 215, 1329, 601, 1573, 339, 900, 114, 127, 213, 224],
+  [484, 536, 757, 47, 266, 1042, 298, 1859, 720, 1160, 504, 515],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 693],
+  [745, 1431, 695, 2238],
+  [1627, 509, 395, 1825, 1596, 1666, 61, 1091, 1205, 1307, 1400, 1468],
+  [53, 240, 324, 1159, 1353, 1781, 2046],
+  [136, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868, 2061],
+  [251, 361, 178, 986, 700, 2139, 2077, 77, 2171, 196, 289, 446],
+  [514, 1867, 249, 756, 783, 1194, 1242, 2034],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 374],
+  [1730, 87, 1072, 1098, 1754, 2084],
+  [1056, 800, 2146, 1228, 8, 78, 594, 2239, 1427, 1783, 794, 1912],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [91, 226, 937, 115, 322, 496, 1022, 1097, 1108, 2266],
+  [2197, 1580, 1992, 32, 545, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [129, 279, 320, 388, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [316, 881, 123, 995, 659, 773, 1280, 2039, 2185],
+  [161, 292, 6, 1659, 999, 599, 1124, 1286, 59, 344, 1517, 1949],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [5, 69, 131, 170, 313, 314, 348, 459, 468, 474, 521, 585],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [116, 17, 2112, 562, 347, 862, 358, 428, 524, 580, 590, 608],
+  [838, 2256, 909, 426, 1372, 1861],
+  [129, 279, 320, 378, 403, 525, 560, 561, 610, 665, 725, 1037],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [595, 1356, 2252],
+  [345, 11, 807, 88, 108, 983, 1862, 1977, 555, 907, 823, 193],
+  [106, 113, 154, 202, 275, 328, 329, 337, 396, 398, 407, 419],
+  [34, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [36, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518, 1546],
+  [1825, 1596, 1666, 61, 509, 1627, 367, 1091, 1205, 1307, 1400, 1468],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 398, 407, 419],
+  [103, 109, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 407, 419],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [34, 393, 434, 574, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [129, 279, 320, 378, 388, 525, 560, 561, 610, 665, 725, 1037],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1301, 2065, 1240, 134, 112, 452, 1254, 600, 1130, 2022, 2015, 717],
+  [462, 1471],
+  [328, 444, 1406, 450, 1016, 516, 106, 854, 606, 154, 1209, 641],
+  [2169, 1388, 548, 1829, 2218],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 442],
+  [592, 740, 182, 836, 1137, 2158, 1597, 1008, 1564, 621, 694, 1002],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1794, 1116, 1725],
+  [1974, 26, 1879, 1118, 1896, 1548, 1933, 2008],
+  [254, 1571, 571, 1125, 1146, 1693, 1702, 1925, 2078],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [787, 641, 1209, 784, 154, 873, 516, 450, 606, 1016, 1406, 328],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [33, 845, 1864, 894, 1262, 979, 1982, 315, 1120, 575, 14, 1717],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [2219, 176, 12, 932, 960, 1576, 1699, 1923, 2089, 2247],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1363, 1530, 2255, 2245, 267, 1429, 1802, 1440, 628, 1796, 692, 778],
+  [1372, 838, 387, 2256, 909, 1861],
+  [18, 211, 214, 265, 287, 433, 508, 519, 547, 565, 861, 869],
+  [17, 116, 347, 358, 386, 524, 562, 580, 590, 608, 635, 652],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2032, 1661, 9, 52, 41, 42, 1525, 197, 2029, 831, 276, 172],
+  [229, 982, 817, 656, 985, 194, 703, 110, 776, 705, 728, 1064],
+  [18, 211, 1342, 1245, 1420, 565, 508, 987, 265, 1598, 2261, 214],
+  [34, 1652, 1506, 1259, 1210, 746, 673, 393, 400, 574, 589, 743],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [546, 1078, 38, 1603, 810, 2264, 261, 1030, 74, 1961, 100, 186],
+  [29, 179, 477, 487, 569, 629, 668, 675, 678, 759, 825, 832],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 495, 499, 564],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [68, 200, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [1406, 328, 1016, 407, 450, 106, 854, 516, 606, 154, 1209, 641],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [77, 178, 196, 251, 289, 361, 370, 551, 568, 700, 769, 781],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [516, 328, 407, 1016, 1406, 444, 154, 106, 606, 854, 1209, 641],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [600, 2022, 1240, 112, 1254, 2015, 405, 2065, 1301, 1130, 134, 717],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [325, 3, 353, 1178, 1004, 2047, 1762, 2237, 1089, 835, 191, 286],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [605, 5, 131, 1554, 1122, 1695, 880, 1464, 1009, 1114, 521, 824],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [85, 1275, 812, 2230, 715, 1475, 1459, 607, 1128, 24, 1229, 1445],
+  [1471, 406],
+  [7, 228, 241, 318, 502, 528, 724, 803, 827, 860, 890, 958],
+  [618, 1847, 55, 255, 578, 321, 124, 156, 171, 190, 220, 242],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 474, 521, 585],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [3, 191, 286, 325, 353, 455, 558, 651, 655, 683, 780, 799],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 521, 585],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [581, 766, 162, 1704, 1996, 1149, 1320, 238, 1735, 1271, 1487, 1746],
+  [759, 825, 678, 487, 2217, 29, 884, 832, 569, 179, 1140, 629],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2165, 16, 2223, 1441, 2088, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [886, 165, 577, 1061, 677, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [2228, 510, 1143, 954, 10, 1936, 1618, 2012, 1133, 1673, 142, 1533],
+  [363, 536, 757, 266, 47, 1042, 298, 1859, 720, 1160, 504, 515],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [14, 33, 300, 305, 315, 359, 421, 575, 646, 647, 690, 698],
+  [477, 759, 678, 825, 2217, 832, 29, 884, 569, 179, 1140, 629],
+  [1083],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [83, 195, 247, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613, 1617],
+  [257, 96, 840, 1456, 1144, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [729, 1043, 1438, 2018, 97, 1973, 1253, 1521, 2076, 2100, 2213],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [22, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223, 1381],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 499, 564],
+  [91, 115, 226, 322, 376, 937, 1022, 1097, 1108, 2266],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 564],
+  [10, 142, 483, 510, 520, 735, 777, 863, 954, 959, 971, 1065],
+  [2199, 2212, 1664, 1426, 36, 2200, 797, 567, 394, 851, 1015, 1087],
+  [1882, 1556, 803, 958, 2081, 1147, 1845, 7, 1960, 241, 890, 228],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 530, 552, 555],
+  [47, 266, 298, 363, 484, 515, 536, 720, 757, 849, 991, 1042],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [68, 200, 443, 543, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [1032, 808, 1041, 62, 1303, 887, 1577, 1904, 1966, 2258],
+  [565, 987, 1342, 265, 1598, 2261, 433, 1420, 18, 211, 1245, 214],
+  [1825, 367, 395, 1666, 1627, 1596, 61, 1091, 1205, 1307, 1400, 1468],
+  [1143, 954, 483, 2228, 10, 1133, 1618, 1936, 1673, 2012, 1533, 142],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [2259, 1442, 258, 1478, 1211, 1642, 1258, 1906],
+  [371, 1867, 249, 756, 783, 1194, 1242, 2034],
+  [47, 266, 298, 363, 484, 504, 536, 720, 757, 849, 991, 1042],
+  [450, 407, 328, 154, 1016, 444, 1406, 641, 1209, 106, 606, 787],
+  [103, 109, 397, 624, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [22, 566, 1703, 871, 657, 1710, 494, 815, 965, 1003, 1014, 1192],
+  [18, 211, 214, 265, 287, 427, 433, 508, 547, 565, 861, 869],
+  [10, 142, 483, 500, 510, 735, 777, 863, 954, 959, 971, 1065],
+  [69, 1114, 585, 131, 587, 1009, 1695, 5, 1554, 459, 605, 1464],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [136, 816, 1088, 1058, 1528, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [17, 116, 347, 358, 386, 428, 562, 580, 590, 608, 635, 652],
+  [129, 279, 320, 378, 388, 403, 560, 561, 610, 665, 725, 1037],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [7, 228, 241, 318, 463, 502, 724, 803, 827, 860, 890, 958],
+  [1473, 1705, 1213, 1824, 1840],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 552, 555],
+  [185, 1050, 1409, 1452, 1477, 1918, 2007, 2150],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [47, 484, 363, 757, 266, 298, 1042, 1859, 720, 1160, 504, 515],
+  [1604, 144, 1792, 634, 1349],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1129, 1483, 40, 676, 1707, 632, 708, 1335, 2203, 291, 639, 682],
+  [295, 309, 343, 685, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [1266, 637, 20, 152, 866, 2236, 1226, 680, 768, 935, 1201, 1249],
+  [68, 200, 443, 506, 631, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [60, 117, 173, 351, 672, 699, 741, 947, 968, 972, 1126, 1191],
+  [1580, 1992, 32, 2197, 377, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [437, 1078, 38, 1603, 810, 2264, 261, 1030, 74, 1961, 100, 186],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 565, 861, 869],
+  [1388, 2169, 408, 1829, 2218],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 568, 700, 769, 781],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 555],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [907, 807, 345, 391, 108, 983, 11, 193, 1862, 1977, 88, 823],
+  [73, 260, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [754, 952, 903, 1281, 1224, 1657, 212, 209, 2119, 611, 1387, 27],
+  [3, 191, 286, 325, 353, 455, 470, 651, 655, 683, 780, 799],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1323, 129, 320, 1037, 665, 1131, 279, 378, 388, 403, 525, 561],
+  [129, 279, 320, 378, 388, 403, 525, 560, 610, 665, 725, 1037],
+  [2112, 17, 386, 862, 116, 347, 358, 428, 524, 580, 590, 608],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [508, 987, 1342, 265, 433, 1598, 2261, 1420, 18, 211, 1245, 214],
+  [22, 518, 1703, 871, 657, 1710, 494, 815, 965, 1003, 1014, 1192],
+  [797, 1426, 36, 2200, 2212, 501, 2199, 1664, 394, 851, 1015, 1087],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 700, 769, 781],
+  [179, 629, 1140, 884, 1484, 29, 825, 2217, 678, 759, 477, 487],
+  [6, 59, 161, 292, 344, 354, 381, 599, 718, 755, 796, 950],
+  [1571, 416, 254, 1125, 1146, 1693, 1702, 1925, 2078],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [27, 209, 212, 557, 603, 611, 754, 898, 903, 941, 952, 1052],
+  [34, 393, 400, 434, 589, 673, 743, 746, 795, 927, 1053, 1111],
+  [979, 1262, 894, 14, 845, 1864, 315, 421, 33, 1120, 1717, 1982],
+  [913, 1263, 814, 1432, 908, 1220, 1443],
+  [165, 886, 677, 1061, 482, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [55, 255, 618, 1847, 464, 321, 124, 156, 171, 190, 220, 242],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [17, 116, 347, 358, 386, 428, 524, 562, 590, 608, 635, 652],
+  [476, 1704, 766, 1149, 162, 1996, 1320, 238, 1735, 1271, 1487, 1746],
+  [13, 234, 236, 614, 633, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [25, 205, 625, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [587, 69, 521, 1114, 1009, 1554, 131, 5, 1695, 459, 605, 1122],
+  [686, 2126],
+  [585, 69, 521, 1114, 1009, 1554, 131, 5, 1695, 459, 605, 1122],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [34, 393, 400, 434, 574, 673, 743, 746, 795, 927, 1053, 1111],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 608, 635, 652],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [412, 836, 740, 1137, 182, 2158, 1597, 1008, 1564, 621, 694, 1002],
+  [158, 1467, 1757, 1984, 2062],
+  [78, 8, 1228, 2146, 1783, 1056, 794, 800, 921, 374, 2239, 1427],
+  [1356, 2252, 390],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [135, 2072, 785, 1313, 1461, 1715, 1772],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [6, 1286, 344, 999, 381, 161, 1659, 1124, 292, 1517, 1949, 59],
+  [2022, 2015, 1254, 452, 1240, 112, 1130, 717, 2065, 405, 1301, 134],
+  [215, 235, 80, 900, 1573, 362, 1329, 339, 114, 127, 213, 224],
+  [1067, 1877, 1869],
+  [1938, 27, 2119, 1657, 1449, 611, 903, 1281, 754, 212, 557, 952],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [459, 5, 131, 1554, 1122, 1695, 880, 1464, 1009, 1114, 521, 824],
+  [1016, 106, 1406, 444, 1209, 328, 450, 873, 407, 516, 854, 154],
+  [1229, 1445, 1128, 24, 1459, 2230, 1583, 715, 85, 1275, 1475, 461],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 635, 652],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 665, 725, 1037],
+  [212, 1281, 2119, 903, 1938, 754, 27, 1657, 603, 557, 209, 1387],
+  [128, 1095, 1687, 1075, 181, 770, 934, 1051, 1680, 1914, 2060],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1297, 13, 236, 234, 582, 633, 653, 821, 919, 1007, 1079, 1189],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [464, 1847, 55, 578, 255, 321, 124, 156, 171, 190, 220, 242],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [182, 412, 592, 694, 740, 836, 1002, 1008, 1137, 1171, 1314, 1476],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [975, 1581, 207, 1985, 268, 786, 1148, 822, 1743, 2005, 2036],
+  [103, 109, 397, 517, 684, 707, 811, 818, 1039, 1112, 1163, 1185],
+  [25, 205, 583, 667, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [73, 260, 556, 723, 726, 893, 918, 1027, 1033, 1197, 1306, 1418],
+  [1440, 1429, 2255, 425, 267, 1363, 2245, 1530, 1802, 1796, 692, 778],
+  [569, 179, 1140, 884, 1484, 29, 825, 2217, 678, 759, 477, 487],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [68, 200, 443, 506, 543, 857, 879, 891, 1018, 1103, 1134, 1274],
+  [676, 1707, 40, 708, 1129, 1483, 540, 1335, 2203, 291, 639, 682],
+  [13, 234, 236, 582, 614, 653, 821, 919, 1007, 1079, 1189, 1269],
+  [144, 1792, 1604, 537, 1349],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 652],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [20, 1266, 866, 542, 2236, 1226, 152, 680, 768, 935, 1201, 1249],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [40, 291, 540, 632, 676, 682, 708, 1047, 1049, 1071, 1129, 1141],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [787, 154, 419, 784, 1209, 516, 450, 873, 1016, 328, 407, 1406],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [39, 79, 671, 701, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [24, 85, 461, 607, 654, 715, 744, 747, 812, 855, 1006, 1128],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 647, 690, 698],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 690, 698],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [3, 191, 286, 325, 353, 455, 470, 558, 655, 683, 780, 799],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [13, 234, 236, 582, 614, 633, 821, 919, 1007, 1079, 1189, 1269],
+  [1006, 1475, 812, 1583, 461, 1128, 2230, 85, 1275, 607, 1445, 715],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 683, 780, 799],
+  [817, 982, 432, 229, 703, 985, 194, 110, 776, 705, 728, 1064],
+  [1710, 1703, 871, 22, 566, 518, 494, 815, 965, 1003, 1014, 1192],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [995, 316, 380, 881, 123, 773, 1280, 2039, 2185],
+  [1383, 1653, 977, 2121],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1037, 129, 320, 1323, 1131, 560, 279, 378, 388, 403, 525, 561],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [25, 205, 583, 625, 782, 793, 905, 940, 996, 1279, 1333, 1348],
+  [29, 179, 438, 477, 487, 569, 629, 675, 678, 759, 825, 832],
+  [2057, 93, 788, 798, 1025, 1632, 2159],
+  [819, 2027, 23, 2124, 1219, 964, 1336, 1592, 2087, 2162],
+  [39, 79, 643, 701, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [60, 117, 173, 351, 544, 699, 741, 947, 968, 972, 1126, 1191],
+  [746, 1210, 1259, 34, 434, 1506, 1652, 393, 400, 574, 589, 743],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [29, 179, 438, 477, 487, 569, 629, 668, 678, 759, 825, 832],
+  [40, 1707, 632, 1129, 1483, 708, 540, 1335, 2203, 291, 639, 682],
+  [577, 165, 886, 1061, 482, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [759, 2217, 825, 477, 487, 29, 884, 569, 179, 1140, 832, 629],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [20, 152, 542, 637, 768, 866, 935, 1201, 1226, 1249, 1266, 1299],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 708, 1047, 1049, 1071, 1129, 1141],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 780, 799],
+  [1756, 707, 1557, 1039, 103, 109, 1334, 1804, 2227, 397, 517, 624],
+  [295, 309, 343, 541, 716, 742, 790, 859, 955, 963, 1019, 1034],
+  [2126, 586],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 698],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [267, 425, 628, 778, 1048, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [182, 412, 592, 621, 740, 836, 1002, 1008, 1137, 1171, 1314, 1476],
+  [745, 366, 1431, 2238],
+  [165, 482, 577, 677, 886, 1061, 1284, 1373, 1463, 1489, 1491, 1544],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [60, 117, 173, 351, 544, 672, 741, 947, 968, 972, 1126, 1191],
+  [986, 2139, 2077, 77, 370, 2171, 196, 251, 361, 178, 289, 446],
+  [39, 79, 643, 671, 752, 830, 841, 912, 974, 1020, 1312, 1350],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [194, 656, 817, 432, 229, 982, 985, 776, 110, 705, 728, 1064],
+  [89, 1899, 1620, 749, 1654],
+  [110, 194, 229, 432, 656, 703, 728, 776, 817, 982, 985, 1064],
+  [16, 481, 856, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [1557, 109, 1756, 103, 2227, 1334, 684, 1039, 1804, 397, 517, 624],
+  [676, 632, 40, 1707, 1335, 1129, 1483, 540, 2203, 291, 639, 682],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [32, 377, 545, 992, 1580, 1911, 1921, 1992, 2140, 2145, 2197, 2204],
+  [1275, 85, 1459, 2230, 24, 461, 607, 1229, 1128, 1445, 1475, 812],
+  [295, 309, 343, 541, 685, 742, 790, 859, 955, 963, 1019, 1034],
+  [1130, 1254, 2015, 600, 112, 1240, 2022, 1273, 2065, 452, 1207, 134],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 755, 796, 950],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [298, 1160, 1859, 757, 266, 47, 536, 484, 363, 1042, 504, 515],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [231, 1326, 1697, 945, 2, 15, 1770, 809, 748, 1810, 1782, 81],
+  [726, 73, 1027, 260, 556, 627, 893, 918, 1033, 1197, 1306, 1418],
+  [7, 228, 241, 318, 463, 502, 528, 803, 827, 860, 890, 958],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 1037],
+  [723, 73, 1027, 260, 556, 627, 893, 918, 1033, 1197, 1306, 1418],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [110, 194, 229, 432, 656, 703, 705, 776, 817, 982, 985, 1064],
+  [492, 1043, 1438, 2018, 97, 1973, 1253, 1521, 2076, 2100, 2213],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [276, 172, 2029, 831, 197, 310, 1525, 892, 9, 1661, 42, 41],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [10, 142, 483, 500, 510, 520, 777, 863, 954, 959, 971, 1065],
+  [195, 1617, 83, 247, 490, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [836, 592, 412, 182, 1137, 2158, 1597, 1008, 1564, 621, 694, 1002],
+  [60, 117, 173, 351, 544, 672, 699, 947, 968, 972, 1126, 1191],
+  [295, 309, 343, 541, 685, 716, 790, 859, 955, 963, 1019, 1034],
+  [34, 393, 400, 434, 574, 589, 673, 746, 795, 927, 1053, 1111],
+  [24, 85, 461, 607, 644, 654, 715, 747, 812, 855, 1006, 1128],
+  [366, 695, 1431, 2238],
+  [673, 1259, 1506, 34, 434, 1210, 1652, 393, 400, 574, 589, 743],
+  [24, 85, 461, 607, 644, 654, 715, 744, 812, 855, 1006, 1128],
+  [15, 1810, 2, 809, 1770, 1782, 1697, 1326, 231, 722, 945, 81],
+  [89, 704, 1620, 1654, 1899],
+  [147, 1165, 1318, 2226],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [39, 79, 643, 671, 701, 830, 841, 912, 974, 1020, 1312, 1350],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [903, 1281, 557, 212, 1657, 611, 2119, 27, 952, 1938, 209, 1387],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 796, 950],
+  [249, 371, 514, 783, 1194, 1242, 1867, 2034],
+  [266, 484, 536, 47, 298, 363, 1859, 720, 1042, 1160, 504, 515],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [477, 678, 825, 2217, 487, 29, 884, 569, 832, 179, 1140, 629],
+  [164, 1360, 1543, 1944, 2110, 2164],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [136, 369, 523, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868, 2061],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [30, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [476, 581, 1704, 162, 1149, 1996, 1735, 1320, 238, 1271, 1487, 1746],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [20, 152, 542, 637, 680, 866, 935, 1201, 1226, 1249, 1266, 1299],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 781],
+  [128, 181, 612, 934, 1051, 1075, 1095, 1680, 1687, 1914, 2060],
+  [112, 134, 405, 452, 600, 717, 1010, 1130, 1207, 1240, 1254, 1273],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [123, 316, 380, 659, 881, 995, 1280, 2039, 2185],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [194, 703, 817, 985, 432, 656, 229, 982, 110, 705, 728, 1064],
+  [10, 142, 483, 500, 510, 520, 735, 863, 954, 959, 971, 1065],
+  [267, 425, 628, 692, 1048, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 799],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [25, 205, 583, 625, 667, 793, 905, 940, 996, 1279, 1333, 1348],
+  [249, 371, 514, 756, 1194, 1242, 1867, 2034],
+  [787, 641, 419, 154, 1209, 516, 450, 873, 1016, 328, 407, 1406],
+  [2072, 1313, 135, 597, 1461, 1715, 1772],
+  [623, 1581, 975, 207, 1148, 1985, 268, 822, 1743, 2005, 2036],
+  [641, 419, 784, 154, 1209, 516, 873, 450, 1016, 606, 328, 1406],
+  [93, 669, 798, 1025, 1632, 2057, 2159],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [295, 309, 343, 541, 685, 716, 742, 859, 955, 963, 1019, 1034],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [25, 205, 583, 625, 667, 782, 905, 940, 996, 1279, 1333, 1348],
+  [921, 594, 78, 1783, 8, 1228, 2146, 2239, 1056, 800, 1912, 374],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 927, 1053, 1111],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 950],
+  [2200, 36, 2212, 567, 1426, 2199, 1664, 501, 394, 851, 1015, 1087],
+  [93, 669, 788, 1025, 1632, 2057, 2159],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1056, 1228, 2146, 374, 2239, 8, 78, 594, 1912, 1427, 794, 1783],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [2081, 1556, 1147, 1845, 1882, 958, 1960, 502, 7, 241, 890, 228],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [345, 391, 108, 11, 88, 983, 1862, 1977, 555, 907, 823, 193],
+  [1041, 507, 1032, 62, 1303, 887, 1577, 1904, 1966, 2258],
+  [1770, 1782, 1810, 2, 15, 1697, 748, 1326, 945, 231, 722, 81],
+  [1603, 1030, 261, 1078, 74, 437, 546, 2264, 38, 1961, 100, 186],
+  [103, 109, 397, 517, 624, 684, 707, 818, 1039, 1112, 1163, 1185],
+  [461, 85, 1275, 1475, 2230, 715, 1459, 1128, 607, 24, 1229, 1583],
+  [],
+  [1263, 1432, 913, 576, 908, 1220, 1443],
+  [22, 494, 518, 566, 657, 871, 965, 1003, 1014, 1192, 1223, 1381],
+  [523, 136, 1528, 1088, 1058, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [432, 656, 229, 982, 985, 194, 703, 110, 776, 705, 728, 1064],
+  [103, 109, 397, 517, 624, 684, 707, 811, 1039, 1112, 1163, 1185],
+  [670, 23, 2124, 2027, 1219, 964, 1336, 1592, 2087, 2162],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [13, 234, 236, 582, 614, 633, 653, 919, 1007, 1079, 1189, 1269],
+  [207, 268, 623, 786, 975, 1148, 1581, 1743, 1985, 2005, 2036],
+  [907, 98, 217, 983, 193, 108, 807, 555, 345, 1828, 391, 11],
+  [880, 1554, 1009, 459, 605, 5, 1114, 131, 1122, 1464, 1695, 69],
+  [759, 678, 477, 2217, 487, 884, 29, 569, 179, 1140, 629, 832],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 860, 890, 958],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [39, 79, 643, 671, 701, 752, 841, 912, 974, 1020, 1312, 1350],
+  [2029, 172, 1525, 197, 732, 276, 310, 9, 42, 41, 1661, 892],
+  [487, 678, 2217, 759, 477, 825, 29, 884, 1140, 569, 179, 629],
+  [153, 989, 1011, 104, 1922, 1978, 2020, 2122, 2251],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2047, 353, 1004, 455, 325, 3, 1178, 2237, 1762, 1089, 191, 286],
+  [740, 592, 412, 1137, 182, 2158, 1597, 1008, 1564, 621, 694, 1002],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [387, 2256, 909, 426, 1372, 1861],
+  [980, 30, 1316, 1154, 1457, 2051, 1830, 764, 874, 877, 1001, 1073],
+  [257, 96, 491, 1456, 1144, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [39, 912, 1502, 2017, 2004, 79, 643, 671, 701, 752, 830, 974],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1864, 894, 33, 421, 1262, 979, 315, 575, 1120, 1982, 14, 1717],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 991, 1042],
+  [70, 132, 65, 259, 4, 282, 120, 184, 303, 441, 495, 499],
+  [36, 394, 501, 567, 797, 1015, 1087, 1162, 1241, 1426, 1518, 1546],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 444, 407, 328, 1406, 1016, 450, 516, 606, 154, 1209, 641],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 1006, 1128],
+  [16, 481, 706, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [68, 200, 443, 506, 543, 631, 879, 891, 1018, 1103, 1134, 1274],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [295, 309, 343, 541, 685, 716, 742, 790, 955, 963, 1019, 1034],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 890, 958],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 869],
+  [347, 17, 2112, 562, 386, 116, 358, 428, 524, 580, 590, 608],
+  [10, 142, 483, 500, 510, 520, 735, 777, 954, 959, 971, 1065],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1226, 20, 2236, 637, 1266, 152, 542, 680, 768, 935, 1201, 1249],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1703, 518, 22, 566, 1710, 657, 494, 815, 965, 1003, 1014, 1192],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1209, 606, 419, 787, 641, 154, 1016, 1406, 450, 516, 106, 444],
+  [30, 764, 839, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 980, 1001, 1073, 1121, 1154, 1316, 1371, 1392],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [68, 200, 443, 506, 543, 631, 857, 891, 1018, 1103, 1134, 1274],
+  [1122, 459, 605, 5, 1464, 1554, 131, 824, 1695, 1009, 1114, 521],
+  [123, 316, 380, 995, 659, 773, 1280, 2039, 2185],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1140, 29, 629, 569, 179, 1484, 2217, 825, 678, 759, 477, 487],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [165, 577, 1061, 677, 482, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [62, 507, 808, 1032, 1041, 1303, 1577, 1904, 1966, 2258],
+  [1423, 1515, 880, 1122, 1464, 824, 459, 605, 5, 1695, 131, 1554],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1960, 1845, 1147, 2081, 241, 228, 803, 7, 1556, 958, 1882, 1446],
+  [68, 1134, 1274, 200, 443, 506, 543, 631, 857, 879, 1018, 1103],
+  [310, 732, 172, 831, 2029, 276, 197, 1525, 42, 9, 41, 1661],
+  [73, 260, 556, 627, 723, 726, 918, 1027, 1033, 1197, 1306, 1418],
+  [845, 1864, 1262, 979, 421, 575, 33, 315, 14, 1120, 1717, 1982],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 903, 941, 952, 1052],
+  [1905, 28, 1962, 2052, 1616, 904, 1035, 1366, 1816, 2151],
+  [1573, 339, 601, 235, 215, 1329, 80, 362, 114, 127, 213, 224],
+  [1744, 189],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [754, 1281, 212, 2119, 611, 1657, 557, 27, 1938, 1449, 952, 603],
+  [28, 899, 1035, 1366, 1616, 1816, 1905, 1962, 2052, 2151],
+  [25, 2125, 1798, 1333, 205, 583, 625, 667, 782, 793, 940, 996],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [555, 193, 823, 983, 807, 108, 345, 98, 391, 217, 1828, 11],
+  [576, 814, 913, 1220, 1263, 1432, 1443],
+  [2256, 387, 838, 1372, 426, 1861],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1502, 841, 2017, 39, 79, 2004, 643, 671, 701, 752, 830, 974],
+  [1263, 576, 814, 1432, 908, 1220, 1443],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [67],
+  [177, 1823, 1437, 1920],
+  [73, 260, 556, 627, 723, 726, 893, 1027, 1033, 1197, 1306, 1418],
+  [13, 234, 236, 582, 614, 633, 653, 821, 1007, 1079, 1189, 1269],
+  [16, 481, 706, 856, 1157, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [794, 1783, 594, 78, 8, 1228, 2146, 1056, 2239, 800, 1912, 1427],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 1053, 1111],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [176, 423, 2219, 12, 960, 1576, 1699, 1923, 2089, 2247],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [128, 181, 612, 770, 1051, 1075, 1095, 1680, 1687, 1914, 2060],
+  [20, 152, 542, 637, 680, 768, 866, 1201, 1226, 1249, 1266, 1299],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [115, 376, 91, 226, 322, 496, 1022, 1097, 1108, 2266],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [25, 205, 583, 625, 667, 782, 793, 905, 996, 1279, 1333, 1348],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 952, 1052],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [1697, 1326, 231, 1770, 722, 2, 809, 1782, 15, 1810, 748, 81],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [60, 117, 173, 351, 544, 672, 699, 741, 968, 972, 1126, 1191],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1224, 557, 754, 1657, 903, 1449, 1281, 27, 212, 2119, 611, 1938],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [10, 1143, 510, 1133, 1618, 483, 2228, 1673, 1936, 1115, 1533, 2012],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 963, 1019, 1034],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1882, 803, 1556, 2081, 1147, 7, 1845, 241, 502, 1960, 890, 228],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 971, 1065],
+  [12, 176, 423, 932, 1576, 1699, 1923, 2089, 2219, 2247],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [304, 332, 1216, 1391, 1481, 1800, 1915, 2118],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 1019, 1034],
+  [23, 670, 819, 1219, 1336, 1592, 2027, 2087, 2124, 2162],
+  [22, 494, 518, 566, 657, 815, 871, 1003, 1014, 1192, 1223, 1381],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2002, 60, 117, 173, 351, 544, 672, 699, 741, 947, 972, 1126],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 1065],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 1126, 1191],
+  [],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 1020, 1312, 1350],
+  [207, 1581, 623, 1985, 268, 786, 1148, 822, 1743, 2005, 2036],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1383, 1653, 660, 2121],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1262, 575, 894, 14, 845, 1864, 421, 33, 315, 1120, 1717, 1982],
+  [839, 30, 1316, 1457, 1154, 2051, 1830, 764, 874, 877, 1001, 1073],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [229, 432, 656, 817, 985, 703, 194, 110, 776, 705, 728, 1064],
+  [108, 345, 807, 391, 11, 88, 823, 907, 555, 1862, 1977, 193],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [432, 229, 817, 982, 110, 656, 194, 703, 776, 705, 728, 1064],
+  [700, 2139, 2077, 370, 77, 2171, 196, 251, 361, 178, 289, 446],
+  [508, 565, 1342, 265, 1598, 2261, 433, 1420, 18, 1245, 211, 214],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [153, 833, 1011, 104, 1922, 1978, 2020, 2122, 2251],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 1042],
+  [32, 377, 545, 714, 1580, 1911, 1921, 1992, 2140, 2145, 2197, 2204],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [316, 659, 881, 380, 123, 773, 1280, 2039, 2185],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 1279, 1333, 1348],
+  [83, 195, 247, 490, 736, 1069, 1145, 1186, 1237, 1570, 1613, 1617],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [6, 599, 1659, 344, 1286, 381, 1124, 161, 1517, 292, 1949, 59],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 877, 980, 1073, 1121, 1154, 1316, 1371, 1392],
+  [182, 412, 592, 621, 694, 740, 836, 1008, 1137, 1171, 1314, 1476],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1014, 1192, 1223, 1381],
+  [353, 2237, 2047, 3, 455, 325, 1089, 1178, 1762, 835, 191, 286],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [812, 1475, 461, 654, 2230, 85, 1275, 1583, 1128, 607, 715, 1445],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1079, 1189, 1269],
+  [1597, 1564, 2158, 182, 1137, 412, 592, 836, 740, 621, 694, 1002],
+  [1114, 1554, 131, 5, 69, 459, 605, 521, 1695, 585, 587, 824],
+  [112, 134, 405, 452, 600, 717, 771, 1130, 1207, 1240, 1254, 1273],
+  [104, 153, 989, 833, 1922, 1978, 2020, 2122, 2251],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1192, 1223, 1381],
+  [36, 394, 501, 567, 797, 851, 1087, 1162, 1241, 1426, 1518, 1546],
+  [1406, 444, 328, 407, 450, 106, 516, 606, 854, 154, 1209, 641],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1103, 1134, 1274],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1034],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1312, 1350],
+  [148, 1396, 1433, 1590, 1677, 1954],
+  [91, 115, 226, 322, 376, 496, 937, 1097, 1108, 2266],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [93, 669, 788, 798, 1632, 2057, 2159],
+  [49, 278, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [73, 726, 723, 260, 556, 627, 893, 918, 1033, 1197, 1306, 1418],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [810, 2264, 1603, 437, 546, 1078, 261, 74, 38, 1961, 100, 186],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [507, 62, 808, 1041, 1303, 887, 1577, 1904, 1966, 2258],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1197, 1306, 1418],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [28, 899, 904, 1366, 1616, 1816, 1905, 1962, 2052, 2151],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [129, 665, 320, 1323, 1131, 560, 279, 378, 388, 403, 525, 561],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1804, 1334, 109, 2227, 684, 1756, 707, 1557, 103, 397, 517, 624],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [808, 507, 1032, 62, 1303, 887, 1577, 1904, 1966, 2258],
+  [484, 363, 266, 757, 536, 47, 1859, 298, 1160, 720, 504, 515],
+  [1438, 492, 2018, 729, 97, 1973, 1253, 1521, 2076, 2100, 2213],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1049, 1071, 1129, 1141],
+  [267, 425, 628, 692, 778, 1166, 1225, 1363, 1429, 1440, 1530, 1701],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1071, 1129, 1141],
+  [185, 531, 1409, 1452, 1477, 1918, 2007, 2150],
+  [128, 181, 612, 770, 934, 1075, 1095, 1680, 1687, 1914, 2060],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1111],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [2146, 1228, 800, 374, 8, 78, 594, 2239, 1427, 1783, 794, 1912],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1088, 523, 136, 1528, 816, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [886, 165, 577, 677, 482, 1544, 696, 1284, 1373, 1463, 1489, 1491],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1877, 602, 1869],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [83, 195, 247, 490, 736, 997, 1145, 1186, 1237, 1570, 1613, 1617],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1129, 1141],
+  [1730, 87, 373, 1098, 1754, 2084],
+  [30, 764, 839, 874, 877, 980, 1001, 1121, 1154, 1316, 1371, 1392],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1687, 128, 612, 1095, 181, 770, 934, 1051, 1680, 1914, 2060],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [437, 546, 38, 1603, 810, 261, 74, 1030, 2264, 1961, 100, 186],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1189, 1269],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [488],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [36, 394, 501, 567, 797, 851, 1015, 1162, 1241, 1426, 1518, 1546],
+  [1058, 136, 523, 1528, 816, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [2237, 1004, 3, 325, 353, 455, 1762, 1178, 2047, 835, 191, 286],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [61, 367, 395, 509, 1205, 1307, 1400, 1468, 1596, 1627, 1630, 1658],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [250, 1172],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [612, 128, 1687, 181, 1075, 770, 934, 1051, 1680, 1914, 2060],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1108, 2266],
+  [87, 373, 1072, 1730, 1754, 2084],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1134, 1274],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [126, 167, 139, 21, 1, 141, 166, 204, 221, 246, 352, 411],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 2266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1163, 1185],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1009, 69, 1554, 521, 131, 5, 585, 459, 605, 587, 1695, 1122],
+  [1133, 1618, 10, 1673, 954, 1143, 510, 2228, 483, 1533, 1936, 142],
+  [414, 1794, 1725],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1879, 1548, 1974, 26, 1896, 415, 1933, 2008],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [315, 1717, 845, 1864, 894, 33, 421, 575, 1982, 979, 1262, 14],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1154, 1316, 1371, 1392],
+  [1464, 459, 605, 5, 880, 1695, 131, 1554, 1009, 1114, 521, 824],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1659, 1517, 1949, 381, 999, 161, 292, 6, 59, 599, 1286, 344],
+  [254, 416, 571, 1146, 1571, 1693, 1702, 1925, 2078],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1191],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [607, 1445, 1583, 1229, 2230, 24, 1459, 1475, 715, 85, 1275, 461],
+  [1483, 540, 40, 676, 1707, 632, 708, 1335, 2203, 291, 639, 682],
+  [717, 1254, 112, 1240, 2065, 2015, 134, 600, 2022, 452, 1301, 405],
+  [320, 665, 1037, 129, 1323, 560, 279, 378, 388, 403, 525, 561],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [10, 1618, 954, 1673, 1143, 1115, 510, 2228, 483, 1936, 1533, 142],
+  [1274, 68, 891, 200, 443, 506, 543, 631, 857, 879, 1018, 1103],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [592, 1597, 412, 1008, 182, 836, 2158, 740, 1564, 621, 694, 1002],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [884, 629, 569, 179, 29, 1484, 2217, 825, 678, 759, 477, 487],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [954, 10, 510, 2228, 483, 1133, 1618, 1673, 1936, 2012, 1533, 142],
+  [96, 257, 491, 840, 1456, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [83, 195, 247, 490, 736, 997, 1069, 1186, 1237, 1570, 1613, 1617],
+  [254, 416, 571, 1125, 1571, 1693, 1702, 1925, 2078],
+  [1845, 2081, 803, 1960, 1556, 958, 241, 1882, 7, 890, 502, 228],
+  [623, 786, 1581, 975, 207, 268, 1985, 822, 1743, 2005, 2036],
+  [1704, 581, 476, 1320, 766, 238, 1996, 162, 1735, 1271, 1487, 1746],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [30, 1316, 839, 2051, 980, 1457, 1830, 764, 874, 877, 1001, 1073],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [16, 481, 706, 856, 920, 1190, 1202, 1441, 1450, 2088, 2095, 2165],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [53, 240, 324, 368, 1353, 1781, 2046],
+  [1859, 720, 298, 266, 757, 47, 484, 536, 363, 1042, 504, 515],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1241, 1426, 1518, 1546],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1185],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [750, 147, 1318, 2226],
+  [267, 425, 628, 692, 778, 1048, 1225, 1363, 1429, 1440, 1530, 1701],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1314, 1476],
+  [250, 1093],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [325, 455, 1762, 3, 353, 1004, 2047, 2237, 1089, 835, 191, 286],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [1650, 239, 333, 1769, 2202],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1237, 1570, 1613, 1617],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1269],
+  [16, 481, 706, 856, 920, 1157, 1202, 1441, 1450, 2088, 2095, 2165],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1223, 1381],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [249, 371, 514, 756, 783, 1242, 1867, 2034],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1306, 1418],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1226, 1249, 1266, 1299],
+  [16, 481, 706, 856, 920, 1157, 1190, 1441, 1450, 2088, 2095, 2165],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [61, 367, 395, 509, 1091, 1307, 1400, 1468, 1596, 1627, 1630, 1658],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1273, 2015, 717, 2022, 600, 1254, 1130, 452, 112, 1240, 2065, 134],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [873, 419, 641, 787, 606, 154, 516, 450, 1016, 1406, 784, 328],
+  [1259, 434, 34, 673, 1652, 1506, 746, 393, 400, 574, 589, 743],
+  [258, 1478, 2259, 1442, 513, 1642, 1258, 1906],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1473, 529, 1705, 1824, 1840],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1800, 1391, 304, 332, 2118, 1915, 962, 1481],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [2124, 23, 2027, 670, 819, 964, 1336, 1592, 2087, 2162],
+  [576, 814, 908, 913, 1263, 1432, 1443],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1381],
+  [952, 557, 754, 1657, 903, 1449, 1281, 27, 1387, 212, 209, 2119],
+  [267, 425, 628, 692, 778, 1048, 1166, 1363, 1429, 1440, 1530, 1701],
+  [866, 2236, 20, 637, 1266, 152, 542, 680, 768, 935, 1201, 1249],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [2146, 8, 1056, 78, 800, 594, 374, 2239, 1427, 1783, 794, 921],
+  [1445, 24, 607, 1128, 1459, 1583, 2230, 715, 85, 1275, 1475, 461],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1570, 1613, 1617],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [112, 2065, 452, 1254, 1301, 405, 600, 134, 1130, 2022, 2015, 717],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1426, 1518, 1546],
+  [249, 371, 514, 756, 783, 1194, 1867, 2034],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [211, 18, 433, 1420, 1342, 565, 508, 987, 265, 1598, 2261, 214],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1266, 1299],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [97, 492, 729, 1043, 1438, 1521, 1973, 2018, 2076, 2100, 2213],
+  [2015, 600, 1130, 112, 1240, 2022, 717, 452, 2065, 134, 1301, 405],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [258, 513, 1211, 1442, 1478, 1642, 1906, 2259],
+  [34, 434, 1506, 1210, 746, 1652, 673, 393, 400, 574, 589, 743],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [979, 894, 575, 845, 1864, 14, 421, 33, 315, 1120, 1982, 1717],
+  [814, 913, 1432, 576, 908, 1220, 1443],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [20, 542, 637, 152, 2236, 866, 1226, 680, 768, 935, 1201, 1249],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [162, 238, 476, 581, 766, 1149, 1320, 1487, 1704, 1735, 1746, 1786],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [1207, 717, 2015, 1254, 1130, 600, 2022, 112, 1240, 452, 2065, 134],
+  [1134, 68, 891, 200, 443, 506, 543, 631, 857, 879, 1018, 1103],
+  [85, 461, 715, 2230, 1459, 812, 1475, 24, 607, 1128, 1229, 1445],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1333, 1348],
+  [123, 316, 380, 659, 773, 881, 995, 2039, 2185],
+  [212, 903, 611, 754, 2119, 557, 1938, 27, 1657, 209, 1387, 603],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [165, 482, 577, 677, 696, 886, 1061, 1373, 1463, 1489, 1491, 1544],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [599, 344, 6, 999, 381, 161, 1659, 1124, 292, 1517, 59, 1949],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [31, 43, 45, 48, 56, 57, 75, 76, 84, 86, 99, 102],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [614, 236, 13, 234, 582, 633, 653, 821, 919, 1007, 1079, 1189],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [405, 2065, 134, 1240, 112, 452, 1130, 1254, 600, 2022, 2015, 717],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [507, 1032, 1041, 808, 62, 887, 1577, 1904, 1966, 2258],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1418],
+  [61, 367, 395, 509, 1091, 1205, 1400, 1468, 1596, 1627, 1630, 1658],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1350],
+  [2072, 785, 135, 597, 1461, 1715, 1772],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1476],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2051, 30, 1457, 839, 1154, 980, 1830, 764, 874, 877, 1001, 1073],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [147, 750, 1165, 2226],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [238, 1996, 1735, 581, 162, 1149, 476, 1704, 766, 1271, 1487, 1746],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [129, 1037, 665, 320, 1131, 560, 279, 378, 388, 403, 525, 561],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [231, 1697, 722, 945, 1770, 2, 15, 809, 1782, 1810, 748, 81],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [80, 235, 1573, 339, 362, 215, 601, 900, 114, 127, 213, 224],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [25, 905, 1798, 2125, 205, 583, 625, 667, 782, 793, 940, 996],
+  [2227, 109, 1039, 1804, 707, 1557, 1756, 684, 103, 397, 517, 624],
+  [2203, 708, 632, 676, 40, 1707, 1129, 1483, 540, 291, 639, 682],
+  [23, 670, 819, 964, 1219, 1592, 2027, 2087, 2124, 2162],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [565, 508, 433, 987, 265, 1420, 18, 1245, 211, 1598, 2261, 214],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [144, 537, 634, 1604, 1792],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [53, 240, 324, 368, 1159, 1781, 2046],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [2252, 595, 390],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [164, 760, 1543, 1944, 2110, 2164],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [1530, 425, 2255, 1429, 2245, 267, 1440, 628, 1802, 1796, 692, 778],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [28, 899, 904, 1035, 1616, 1816, 1905, 1962, 2052, 2151],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1392],
+  [426, 838, 387, 909, 2256, 1861],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1463, 1489, 1491, 1544],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [1653, 977, 660, 2121],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [209, 212, 1281, 754, 557, 903, 611, 2119, 952, 1224, 1657, 1938],
+  [548, 2169, 408, 1829, 2218],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [304, 2118, 332, 1915, 1800, 1216, 962, 1481],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [1590, 1954, 148, 1021, 1433, 1677],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1468, 1596, 1627, 1630, 1658],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1016, 444, 328, 407, 450, 106, 516, 854, 606, 154, 1209, 641],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [185, 531, 1050, 1452, 1477, 1918, 2007, 2150],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [136, 369, 523, 762, 816, 1058, 1088, 1528, 1638, 1850, 1868, 2061],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [433, 18, 211, 1342, 1245, 1598, 2261, 565, 265, 508, 987, 214],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1515, 888, 880, 1122, 1464, 459, 605, 824, 5, 1695, 131, 1554],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [36, 501, 2212, 2200, 2199, 567, 797, 1664, 394, 851, 1015, 1087],
+  [2146, 1228, 594, 1783, 374, 78, 8, 1056, 800, 794, 921, 2239],
+  [510, 483, 954, 1143, 2228, 10, 1133, 1618, 1936, 1673, 1115, 2012],
+  [1440, 628, 2255, 425, 1363, 267, 1530, 2245, 1802, 1796, 692, 778],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [745, 366, 695, 2238],
+  [814, 1263, 913, 576, 908, 1220, 1443],
+  [148, 1021, 1396, 1590, 1677, 1954],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [177, 917, 1823, 1920],
+  [2018, 97, 1973, 1043, 492, 729, 1253, 1521, 2076, 2100, 2213],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [628, 1429, 2255, 267, 425, 2245, 1363, 1530, 1802, 1796, 692, 778],
+  [2223, 16, 2165, 481, 2088, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [1478, 513, 258, 2259, 1211, 1642, 1258, 1906],
+  [576, 814, 908, 913, 1220, 1263, 1432],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1229, 607, 1128, 24, 1583, 1459, 2230, 715, 1475, 85, 1275, 461],
+  [228, 241, 890, 7, 1960, 1147, 1845, 2081, 958, 803, 1882, 1556],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1657, 27, 603, 1938, 2119, 903, 952, 754, 557, 1281, 611, 1224],
+  [16, 481, 706, 856, 920, 1157, 1190, 1202, 1441, 2088, 2095, 2165],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [185, 531, 1050, 1409, 1477, 1918, 2007, 2150],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [49, 278, 1026, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [491, 96, 840, 257, 1144, 1509, 1537, 1579, 1640, 1731, 2030, 2141],
+  [1316, 2051, 839, 30, 980, 1830, 1154, 764, 874, 877, 1001, 1073],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [24, 715, 1229, 607, 2230, 1445, 1275, 85, 1128, 461, 1583, 1475],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [135, 597, 785, 1313, 1715, 1772, 2072],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1489, 1491, 1544],
+  [1122, 1695, 5, 459, 605, 131, 880, 1554, 1009, 1114, 521, 824],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [158, 1757, 593, 1984, 2062],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1596, 1627, 1630, 1658],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [462, 406],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [529, 1213, 1705, 1824, 1840],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [2230, 812, 1128, 461, 85, 1275, 607, 1583, 715, 1445, 1229, 1459],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [185, 531, 1050, 1409, 1452, 1918, 2007, 2150],
+  [258, 1442, 1211, 2259, 513, 1642, 1258, 1906],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [304, 332, 962, 1216, 1391, 1800, 1915, 2118],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1129, 540, 40, 676, 1707, 632, 708, 1335, 2203, 291, 639, 682],
+  [629, 179, 569, 1140, 884, 29, 825, 2217, 678, 759, 477, 487],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1704, 1735, 1746, 1786],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1491, 1544],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1544],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [2017, 912, 39, 841, 79, 2004, 643, 671, 701, 752, 830, 974],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [34, 1652, 434, 1259, 746, 1210, 673, 393, 400, 574, 589, 743],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [96, 257, 491, 840, 1144, 1456, 1537, 1579, 1640, 1731, 2030, 2141],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1423, 888, 880, 1122, 1464, 824, 459, 605, 5, 1695, 131, 1554],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1124, 1949, 1659, 999, 59, 381, 6, 161, 292, 599, 1286, 344],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1546],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [97, 492, 729, 1043, 1253, 1438, 1973, 2018, 2076, 2100, 2213],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [9, 197, 42, 41, 2029, 1661, 831, 172, 2032, 276, 732, 431],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [136, 1088, 523, 1058, 816, 369, 762, 1417, 1638, 1850, 1868, 2061],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [1363, 425, 2255, 1429, 2245, 267, 1440, 628, 1802, 1796, 692, 778],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [142, 2012, 1936, 1673, 1618, 2228, 10, 1143, 483, 1133, 954, 510],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1579, 1640, 1731, 2030, 2141],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1944, 164, 760, 1360, 2110, 2164],
+  [677, 577, 165, 886, 1061, 482, 696, 1284, 1373, 1463, 1489, 1491],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [1118, 1879, 1896, 26, 1974, 415, 1933, 2008],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1009, 459, 605, 131, 5, 1114, 1695, 880, 1122, 1464, 824, 521],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [803, 2081, 1882, 1147, 1845, 958, 502, 1960, 7, 241, 890, 228],
+  [707, 109, 1756, 103, 2227, 1334, 684, 1039, 1804, 397, 517, 624],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [1008, 2158, 1597, 182, 1137, 412, 592, 740, 836, 621, 694, 1002],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [49, 278, 1026, 1455, 1610, 1777, 1780, 1884, 1940, 1987, 2068, 2166],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1613, 1617],
+  [254, 416, 571, 1125, 1146, 1693, 1702, 1925, 2078],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [339, 1329, 900, 235, 80, 215, 601, 362, 114, 127, 213, 224],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [12, 176, 423, 932, 960, 1699, 1923, 2089, 2219, 2247],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1904, 1966, 2258],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1640, 1731, 2030, 2141],
+  [1992, 545, 2197, 32, 377, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [975, 207, 623, 1985, 268, 786, 1148, 822, 1743, 2005, 2036],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1128, 1445, 607, 1229, 24, 2230, 1475, 1459, 715, 85, 1275, 461],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [148, 1396, 1954, 1021, 1433, 1677],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [23, 670, 819, 964, 1219, 1336, 2027, 2087, 2124, 2162],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [395, 1627, 61, 367, 1825, 1666, 509, 1091, 1205, 1307, 1400, 1468],
+  [1008, 1564, 2158, 182, 1137, 412, 592, 836, 740, 621, 694, 1002],
+  [2261, 265, 508, 565, 987, 1420, 1342, 433, 18, 211, 1245, 214],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [810, 261, 74, 1078, 1030, 437, 546, 38, 2264, 1961, 100, 186],
+  [144, 537, 1792, 634, 1349],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [2068, 278, 49, 1940, 1026, 1455, 1567, 1777, 1780, 1884, 1987, 2166],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1617],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1905, 28, 1962, 899, 2052, 904, 1035, 1366, 1816, 2151],
+  [736, 195, 83, 247, 490, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [1673, 10, 1133, 954, 1143, 1936, 1533, 1115, 2228, 510, 142, 2012],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1899, 89, 704, 749, 1654],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [367, 1596, 395, 1825, 509, 61, 1666, 1091, 1205, 1307, 1400, 1468],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1658],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [93, 669, 788, 798, 1025, 2057, 2159],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1850, 1868, 2061],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1731, 2030, 2141],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1211, 258, 2259, 1478, 1442, 513, 1258, 1906],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [1184, 239, 333, 1769, 2202],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [34, 434, 1506, 1259, 1210, 746, 673, 393, 400, 574, 589, 743],
+  [1383, 660, 977, 2121],
+  [89, 704, 749, 1620, 1899],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1449, 27, 903, 754, 1938, 2119, 557, 1281, 603, 952, 611, 212],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [1124, 1517, 999, 6, 381, 161, 1949, 599, 292, 59, 1286, 344],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [2032, 9, 1525, 197, 431, 42, 41, 2029, 276, 831, 172, 732],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [2199, 2212, 501, 2200, 36, 1426, 797, 567, 394, 851, 1015, 1087],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [1825, 395, 61, 509, 1596, 367, 1627, 1091, 1205, 1307, 1400, 1468],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1618, 10, 1133, 1533, 954, 1143, 1936, 142, 2012, 2228, 1115, 510],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [148, 1021, 1396, 1433, 1590, 1954],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1687, 1914, 2060],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [128, 1075, 612, 181, 1095, 770, 934, 1051, 1680, 1914, 2060],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [254, 416, 571, 1125, 1146, 1571, 1702, 1925, 2078],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [5, 131, 459, 605, 1464, 1122, 1554, 521, 1114, 880, 1009, 69],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1770, 1326, 945, 2, 231, 809, 15, 1782, 1810, 722, 748, 81],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [12, 176, 423, 932, 960, 1576, 1923, 2089, 2219, 2247],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [267, 425, 628, 692, 778, 1048, 1166, 1225, 1363, 1429, 1440, 1530],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1925, 2078],
+  [871, 518, 22, 566, 657, 1710, 494, 815, 965, 1003, 1014, 1192],
+  [1149, 581, 476, 766, 162, 1320, 1996, 238, 1735, 1271, 1487, 1746],
+  [529, 1473, 1213, 1824, 1840],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [676, 40, 632, 1129, 1483, 540, 708, 1335, 2203, 291, 639, 682],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [657, 871, 1703, 22, 566, 518, 494, 815, 965, 1003, 1014, 1192],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [135, 597, 785, 1313, 1461, 1772, 2072],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1120, 315, 845, 1864, 894, 1982, 33, 421, 575, 979, 1262, 14],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1794, 414, 1116],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [87, 373, 1072, 1098, 1754, 2084],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 2030, 2141],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [1996, 162, 238, 1320, 476, 581, 766, 1149, 1704, 1271, 1487, 1746],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1985, 2005, 2036],
+  [189, 901],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1786],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [349, 1759],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [87, 373, 1072, 1098, 1730, 2084],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [684, 1557, 707, 103, 109, 1039, 1334, 2227, 1804, 397, 517, 624],
+  [158, 1467, 593, 1984, 2062],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [349, 1749],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1178, 325, 3, 455, 353, 2237, 1004, 1089, 2047, 835, 191, 286],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [239, 1650, 1184, 333, 2202],
+  [809, 1697, 2, 1782, 15, 1810, 1326, 945, 231, 748, 722, 81],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [135, 597, 785, 1313, 1461, 1715, 2072],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [49, 278, 1026, 1455, 1567, 1610, 1780, 1884, 1940, 1987, 2068, 2166],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1884, 1940, 1987, 2068, 2166],
+  [53, 240, 324, 368, 1159, 1353, 2046],
+  [809, 1770, 1810, 2, 15, 1697, 748, 1326, 945, 231, 722, 81],
+  [594, 78, 921, 794, 8, 1427, 1228, 2146, 1056, 800, 374, 2239],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [144, 1604, 634, 537, 1349],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [414, 1725, 1116],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [1802, 2245, 267, 425, 2255, 1363, 1530, 1429, 1440, 628, 692, 778],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [2125, 905, 25, 1333, 205, 583, 625, 667, 782, 793, 940, 996],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1216, 304, 1391, 2118, 332, 1915, 962, 1481],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2245, 1796, 267, 425, 2255, 1363, 1429, 1530, 1440, 628, 692, 778],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [1039, 1334, 2227, 109, 684, 1756, 707, 1557, 103, 397, 517, 624],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [809, 2, 15, 1782, 748, 1770, 1697, 1326, 231, 945, 722, 81],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [28, 899, 904, 1035, 1366, 1616, 1905, 1962, 2052, 2151],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [14, 33, 300, 305, 315, 359, 421, 486, 575, 646, 647, 690],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [177, 917, 1437, 1920],
+  [529, 1213, 1473, 1705, 1840],
+  [395, 1666, 509, 61, 367, 1596, 1627, 1091, 1205, 1307, 1400, 1468],
+  [68, 200, 443, 506, 543, 631, 857, 879, 891, 1018, 1103, 1134],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [193, 98, 217, 907, 823, 555, 983, 807, 108, 345, 391, 11],
+  [408, 548, 1388, 2169, 2218],
+  [2051, 1316, 1457, 30, 1154, 839, 980, 764, 874, 877, 1001, 1073],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [529, 1213, 1473, 1705, 1824],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1147, 2081, 803, 1960, 1556, 958, 241, 1882, 7, 890, 502, 228],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [464, 618, 255, 55, 578, 321, 124, 156, 171, 190, 220, 242],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1868, 2061],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1160, 266, 298, 757, 720, 484, 47, 536, 363, 1042, 504, 515],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [387, 426, 838, 909, 1372, 2256],
+  [1977, 88, 11, 391, 807, 345, 108, 555, 983, 907, 823, 193],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [845, 894, 33, 421, 1262, 979, 315, 575, 1120, 1982, 14, 1717],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [249, 514, 371, 756, 783, 1194, 1242, 2034],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 2061],
+  [1067, 602, 1877],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [1067, 602, 1869],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1118, 26, 1896, 1974, 1548, 415, 1933, 2008],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [958, 1556, 803, 2081, 502, 1147, 1845, 7, 241, 1960, 890, 228],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1940, 1987, 2068, 2166],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1879, 26, 1118, 1548, 1974, 415, 1933, 2008],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1620, 89, 704, 749, 1654],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1966, 2258],
+  [28, 1962, 899, 2052, 1616, 904, 1035, 1366, 1816, 2151],
+  [258, 513, 1211, 1258, 1442, 1478, 1642, 2259],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [32, 377, 545, 714, 992, 1580, 1921, 1992, 2140, 2145, 2197, 2204],
+  [2239, 800, 8, 1056, 1228, 78, 2146, 794, 594, 374, 921, 1783],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1680, 1687, 2060],
+  [2118, 332, 1391, 304, 1216, 1800, 962, 1481],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [185, 531, 1050, 1409, 1452, 1477, 2007, 2150],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [177, 917, 1437, 1823],
+  [32, 377, 545, 714, 992, 1580, 1911, 1992, 2140, 2145, 2197, 2204],
+  [104, 153, 833, 989, 1011, 1978, 2020, 2122, 2251],
+  [12, 176, 423, 932, 960, 1576, 1699, 2089, 2219, 2247],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1702, 2078],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [26, 415, 1118, 1548, 1879, 1896, 1974, 2008],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [2012, 142, 1533, 2228, 1143, 1673, 483, 10, 1618, 954, 510, 1133],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [27, 2119, 603, 611, 1657, 903, 1281, 1449, 212, 754, 557, 952],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [49, 278, 2068, 1610, 1026, 1455, 1567, 1777, 1780, 1884, 1987, 2166],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [1543, 164, 760, 1360, 2110, 2164],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1517, 1124, 59, 1659, 292, 381, 161, 999, 6, 599, 1286, 344],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [1396, 1590, 148, 1021, 1433, 1677],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [1845, 890, 1147, 2081, 241, 803, 7, 1556, 958, 228, 1882, 502],
+  [74, 261, 1603, 810, 1030, 1078, 38, 437, 546, 2264, 100, 186],
+  [28, 2052, 1905, 899, 1616, 904, 1035, 1366, 1816, 2151],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1904, 2258],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [2018, 1438, 97, 1043, 492, 729, 1253, 1521, 2076, 2100, 2213],
+  [1118, 26, 1879, 415, 1548, 1896, 1933, 2008],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [1862, 88, 11, 391, 807, 345, 108, 555, 983, 907, 823, 193],
+  [104, 153, 833, 989, 1011, 1922, 2020, 2122, 2251],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [33, 421, 845, 1864, 1120, 1717, 315, 894, 1262, 979, 575, 14],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [158, 593, 1467, 1757, 2062],
+  [207, 975, 1581, 623, 268, 786, 1148, 822, 1743, 2005, 2036],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 2068, 2166],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [1580, 2197, 32, 545, 377, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [162, 1735, 238, 1320, 581, 476, 1149, 766, 1704, 1271, 1487, 1746],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [968, 60, 117, 173, 351, 544, 672, 699, 741, 947, 972, 1126],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [39, 841, 2017, 1502, 912, 79, 643, 671, 701, 752, 830, 974],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1743, 1985, 2036],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [185, 531, 1050, 1409, 1452, 1477, 1918, 2150],
+  [26, 415, 1118, 1548, 1879, 1896, 1933, 1974],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [142, 1936, 1533, 2228, 1673, 1618, 483, 1143, 10, 954, 510, 1133],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [600, 1254, 2022, 717, 1130, 452, 112, 1240, 2065, 1207, 1273, 134],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [39, 1502, 841, 2004, 912, 79, 643, 671, 701, 752, 830, 974],
+  [97, 1438, 1973, 1043, 492, 729, 1253, 1521, 2076, 2100, 2213],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2122, 2251],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [600, 2015, 452, 1254, 1240, 112, 717, 1130, 2065, 405, 1207, 1301],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [2124, 670, 23, 1219, 819, 964, 1336, 1592, 2087, 2162],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [831, 172, 197, 1525, 276, 732, 9, 42, 310, 41, 1661, 2032],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2141],
+  [157, 2190],
+  [1661, 431, 9, 41, 42, 1525, 197, 52, 2029, 831, 276, 172],
+  [44, 46, 64, 66, 82, 95, 107, 118, 140, 155, 159, 230],
+  [249, 371, 514, 756, 783, 1194, 1242, 1867],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [207, 268, 623, 786, 822, 975, 1148, 1581, 1743, 1985, 2005],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [123, 316, 380, 659, 773, 881, 995, 1280, 2185],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [53, 240, 324, 368, 1159, 1353, 1781],
+  [353, 1004, 455, 3, 325, 2237, 835, 1178, 1089, 1762, 191, 286],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [1316, 1830, 1457, 30, 1154, 839, 980, 764, 874, 877, 1001, 1073],
+  [1962, 28, 1905, 899, 1616, 904, 1035, 1366, 1816, 2151],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [669, 93, 788, 798, 1025, 1632, 2159],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [128, 181, 612, 770, 934, 1051, 1075, 1095, 1680, 1687, 1914],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [158, 593, 1467, 1757, 1984],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [134, 112, 1301, 1240, 405, 1130, 1254, 452, 600, 2015, 717, 2022],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [49, 278, 1610, 1940, 1026, 1455, 1567, 1777, 1780, 1884, 1987, 2166],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [785, 1313, 135, 597, 1461, 1715, 1772],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [30, 764, 839, 874, 877, 980, 1001, 1073, 1121, 1154, 1316, 1371],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2100, 2213],
+  [77, 2171, 2139, 196, 700, 986, 370, 251, 178, 361, 289, 446],
+  [254, 416, 571, 1125, 1146, 1571, 1693, 1702, 1925],
+  [83, 195, 247, 490, 736, 997, 1069, 1145, 1186, 1237, 1570, 1613],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [1147, 803, 1845, 1556, 1882, 1960, 958, 241, 7, 502, 890, 228],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [87, 373, 1072, 1098, 1730, 1754],
+  [17, 116, 347, 358, 386, 428, 524, 562, 580, 590, 608, 635],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [23, 670, 819, 964, 1219, 1336, 1592, 2027, 2124, 2162],
+  [16, 2165, 2223, 481, 1441, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [12, 176, 423, 932, 960, 1576, 1699, 1923, 2219, 2247],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [3, 191, 286, 325, 353, 455, 470, 558, 651, 655, 683, 780],
+  [1140, 29, 1484, 629, 884, 569, 179, 2217, 678, 825, 759, 832],
+  [16, 481, 706, 856, 920, 1157, 1190, 1202, 1441, 1450, 2088, 2165],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2076, 2213],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [164, 760, 1360, 1543, 1944, 2164],
+  [22, 494, 518, 566, 657, 815, 871, 965, 1003, 1014, 1192, 1223],
+  [562, 17, 862, 386, 347, 116, 358, 428, 524, 580, 590, 608],
+  [890, 1960, 1845, 2081, 1556, 1147, 803, 502, 1882, 241, 958, 228],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [20, 152, 542, 637, 680, 768, 866, 935, 1201, 1226, 1249, 1266],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [1391, 304, 1915, 332, 1800, 1216, 962, 1481],
+  [1938, 611, 27, 903, 1281, 212, 603, 1657, 754, 1449, 557, 209],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [660, 1653, 1383, 977],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2020, 2251],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [23, 2027, 1219, 670, 819, 964, 1336, 1592, 2087, 2162],
+  [905, 1798, 25, 1333, 205, 583, 625, 667, 782, 793, 940, 996],
+  [686, 586],
+  [162, 238, 476, 581, 766, 1149, 1271, 1320, 1487, 1704, 1735, 1746],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [60, 117, 173, 351, 544, 672, 699, 741, 947, 968, 972, 1126],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [110, 194, 229, 432, 656, 703, 705, 728, 776, 817, 982, 985],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [2077, 77, 700, 986, 2171, 196, 370, 251, 361, 178, 289, 446],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2145, 2197, 2204],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2140, 2197, 2204],
+  [1228, 1056, 8, 78, 800, 374, 594, 2239, 1427, 1783, 794, 921],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [185, 531, 1050, 1409, 1452, 1477, 1918, 2007],
+  [28, 899, 904, 1035, 1366, 1616, 1816, 1905, 1962, 2052],
+  [112, 134, 405, 452, 600, 717, 771, 1010, 1130, 1207, 1240, 1254],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [182, 1564, 1597, 1008, 412, 592, 1137, 740, 836, 621, 694, 1002],
+  [93, 669, 788, 798, 1025, 1632, 2057],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [1, 21, 126, 139, 141, 166, 167, 204, 221, 246, 352, 411],
+  [23, 670, 819, 964, 1219, 1336, 1592, 2027, 2087, 2124],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [164, 760, 1360, 1543, 1944, 2110],
+  [481, 16, 2223, 1441, 2088, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [49, 278, 1026, 1455, 1567, 1610, 1777, 1780, 1884, 1940, 1987, 2068],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [408, 1388, 548, 1829, 2218],
+  [6, 59, 161, 292, 344, 354, 381, 570, 599, 718, 755, 796],
+  [2077, 196, 77, 2139, 700, 986, 370, 251, 178, 361, 289, 446],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [2, 15, 81, 121, 137, 169, 175, 208, 223, 231, 270, 293],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [47, 266, 298, 363, 484, 504, 515, 536, 720, 757, 849, 991],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [73, 260, 556, 627, 723, 726, 893, 918, 1027, 1033, 1197, 1306],
+  [8, 63, 78, 149, 180, 253, 262, 327, 336, 341, 360, 372],
+  [123, 316, 380, 659, 773, 881, 995, 1280, 2039],
+  [29, 179, 438, 477, 487, 569, 629, 668, 675, 678, 759, 825],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [96, 257, 491, 840, 1144, 1456, 1509, 1537, 1579, 1640, 1731, 2030],
+  [157, 2031],
+  [19, 35, 50, 51, 71, 72, 92, 94, 105, 119, 122, 125],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [1992, 32, 1580, 377, 545, 714, 992, 1911, 1921, 2140, 2145, 2204],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [1664, 501, 2212, 2200, 36, 1426, 797, 567, 394, 851, 1015, 1087],
+  [36, 2212, 797, 2199, 1664, 1426, 501, 567, 394, 851, 1015, 1087],
+  [11, 88, 98, 108, 193, 217, 218, 345, 391, 503, 530, 552],
+  [239, 333, 1184, 1650, 1769],
+  [1335, 708, 632, 676, 40, 1707, 1129, 1483, 540, 291, 639, 682],
+  [32, 377, 545, 714, 992, 1580, 1911, 1921, 1992, 2140, 2145, 2197],
+  [80, 114, 127, 213, 215, 224, 235, 269, 272, 280, 288, 317],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [106, 113, 154, 202, 275, 328, 329, 337, 392, 396, 398, 407],
+  [18, 211, 214, 265, 287, 427, 433, 508, 519, 547, 565, 861],
+  [34, 393, 400, 434, 574, 589, 673, 743, 746, 795, 927, 1053],
+  [2200, 2199, 36, 1664, 501, 1426, 797, 567, 394, 851, 1015, 1087],
+  [97, 492, 729, 1043, 1253, 1438, 1521, 1973, 2018, 2076, 2100],
+  [5, 69, 131, 170, 313, 314, 348, 383, 459, 468, 474, 521],
+  [13, 234, 236, 582, 614, 633, 653, 821, 919, 1007, 1079, 1189],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [678, 759, 825, 477, 29, 487, 884, 1140, 569, 179, 832, 629],
+  [408, 548, 1388, 1829, 2169],
+  [423, 176, 12, 932, 960, 1576, 1699, 1923, 2089, 2247],
+  [7, 228, 241, 318, 463, 502, 528, 724, 803, 827, 860, 890],
+  [40, 291, 540, 632, 639, 676, 682, 708, 1047, 1049, 1071, 1129],
+  [129, 279, 320, 378, 388, 403, 525, 560, 561, 610, 665, 725],
+  [1441, 16, 2165, 481, 2088, 706, 856, 920, 1157, 1190, 1202, 1450],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [147, 750, 1165, 1318],
+  [1334, 109, 707, 1557, 1039, 1804, 1756, 684, 103, 397, 517, 624],
+  [483, 1143, 510, 1936, 10, 954, 2012, 1618, 142, 1673, 1533, 1133],
+  [103, 109, 397, 517, 624, 684, 707, 811, 818, 1039, 1112, 1163],
+  [85, 715, 1275, 607, 1459, 1128, 461, 1475, 24, 1229, 1445, 1583],
+  [182, 412, 592, 621, 694, 740, 836, 1002, 1008, 1137, 1171, 1314],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [36, 394, 501, 567, 797, 851, 1015, 1087, 1162, 1241, 1426, 1518],
+  [39, 79, 643, 671, 701, 752, 830, 841, 912, 974, 1020, 1312],
+  [165, 482, 577, 677, 696, 886, 1061, 1284, 1373, 1463, 1489, 1491],
+  [866, 20, 1226, 1266, 152, 637, 542, 680, 768, 935, 1201, 1249],
+  [1004, 1089, 3, 353, 325, 455, 2047, 1178, 1762, 835, 191, 286],
+  [366, 695, 745, 1431],
+  [800, 1912, 1056, 1228, 8, 2146, 78, 374, 594, 794, 921, 1783],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [55, 124, 156, 171, 190, 220, 242, 243, 244, 255, 263, 281],
+  [25, 205, 583, 625, 667, 782, 793, 905, 940, 996, 1279, 1333],
+  [9, 41, 42, 52, 90, 172, 192, 197, 198, 276, 310, 334],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [267, 1802, 425, 2255, 1796, 1363, 1530, 1429, 1440, 628, 692, 778],
+  [37, 54, 58, 101, 111, 201, 203, 219, 225, 232, 245, 365],
+  [12, 176, 423, 932, 960, 1576, 1699, 1923, 2089, 2219],
+  [38, 74, 100, 186, 210, 227, 261, 264, 271, 290, 301, 323],
+  [61, 367, 395, 509, 1091, 1205, 1307, 1400, 1468, 1596, 1627, 1630],
+  [10, 142, 483, 500, 510, 520, 735, 777, 863, 954, 959, 971],
+  [104, 153, 833, 989, 1011, 1922, 1978, 2020, 2122],
+  [1356, 595, 390],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [136, 369, 523, 762, 816, 1058, 1088, 1417, 1528, 1638, 1850, 1868],
+  [1429, 267, 1440, 425, 2245, 628, 1363, 1530, 1802, 1796, 692, 778],
+  [909, 387, 838, 426, 1372, 1861],
+  [27, 209, 212, 557, 573, 603, 611, 754, 898, 903, 941, 952],
+  [62, 507, 808, 887, 1032, 1041, 1303, 1577, 1904, 1966],
+  [1211, 258, 513, 1442, 1478, 1642, 1258, 1906],
+  [24, 85, 461, 607, 644, 654, 715, 744, 747, 812, 855, 1006],
+  [1598, 265, 508, 565, 987, 1420, 1342, 433, 18, 211, 1245, 214],
+  [77, 178, 196, 251, 289, 361, 370, 446, 551, 568, 700, 769],
+  [4, 65, 70, 120, 132, 184, 259, 282, 303, 441, 495, 499],
+  [1030, 810, 437, 546, 1078, 1603, 38, 261, 74, 1961, 100, 186],
+  [295, 309, 343, 541, 685, 716, 742, 790, 859, 955, 963, 1019],
+  [91, 115, 226, 322, 376, 496, 937, 1022, 1097, 1108],
+]
+
+/** Service slug -> related service slugs, curated ones first */
+export const RELATED_SERVICES: Record<string, string[]> = {
+  plombier: ['chauffagiste', 'salle-de-bain', 'cuisiniste', 'climaticien', 'pompe-a-chaleur', 'electricien', 'pisciniste', 'peintre-en-batiment'],
+  electricien: ['domoticien', 'alarme-securite', 'borne-recharge', 'antenniste', 'panneaux-solaires', 'plombier', 'carreleur', 'couvreur'],
+  serrurier: ['alarme-securite', 'vitrier', 'metallier', 'ferronnier', 'demenageur', 'menuisier'],
+  chauffagiste: ['plombier', 'climaticien', 'pompe-a-chaleur', 'ramoneur', 'isolation-thermique', 'renovation-energetique', 'panneaux-solaires'],
+  'peintre-en-batiment': ['facadier', 'platrier', 'decorateur', 'carreleur', 'poseur-de-parquet', 'plombier', 'architecte-interieur', 'macon'],
+  menuisier: ['charpentier', 'poseur-de-parquet', 'cuisiniste', 'storiste', 'ferronnier', 'vitrier', 'metallier', 'miroitier'],
+  carreleur: ['poseur-de-parquet', 'salle-de-bain', 'peintre-en-batiment', 'platrier', 'solier', 'plombier', 'electricien', 'cuisiniste'],
+  couvreur: ['charpentier', 'zingueur', 'etancheiste', 'facadier', 'ramoneur', 'macon', 'plombier', 'electricien'],
+  macon: ['terrassier', 'charpentier', 'couvreur', 'facadier', 'etancheiste', 'plombier', 'electricien', 'paysagiste'],
+  jardinier: ['paysagiste', 'pisciniste', 'terrassier', 'nettoyage', 'desinsectisation', 'deratisation'],
+  vitrier: ['miroitier', 'menuisier', 'storiste', 'serrurier', 'alarme-securite', 'peintre-en-batiment', 'facadier', 'isolation-thermique'],
+  climaticien: ['chauffagiste', 'pompe-a-chaleur', 'plombier', 'isolation-thermique', 'electricien', 'storiste', 'domoticien', 'panneaux-solaires'],
+  cuisiniste: ['plombier', 'electricien', 'salle-de-bain', 'carreleur', 'decorateur', 'menuisier', 'architecte-interieur'],
+  solier: ['poseur-de-parquet', 'carreleur', 'peintre-en-batiment', 'decorateur', 'salle-de-bain'],
+  nettoyage: ['ramoneur', 'facadier', 'desinsectisation', 'deratisation', 'jardinier', 'demenageur'],
+  terrassier: ['macon', 'paysagiste', 'pisciniste', 'geometre', 'charpentier', 'jardinier'],
+  charpentier: ['couvreur', 'menuisier', 'macon', 'zingueur', 'terrassier', 'ramoneur', 'electricien', 'etancheiste'],
+  zingueur: ['couvreur', 'charpentier', 'etancheiste', 'facadier', 'plombier', 'isolation-thermique'],
+  etancheiste: ['couvreur', 'facadier', 'zingueur', 'macon', 'isolation-thermique', 'charpentier'],
+  facadier: ['peintre-en-batiment', 'etancheiste', 'macon', 'isolation-thermique', 'nettoyage', 'couvreur', 'zingueur', 'vitrier'],
+  platrier: ['peintre-en-batiment', 'carreleur', 'decorateur', 'poseur-de-parquet', 'isolation-thermique'],
+  metallier: ['ferronnier', 'serrurier', 'menuisier', 'alarme-securite', 'storiste', 'ascensoriste'],
+  ferronnier: ['metallier', 'serrurier', 'menuisier', 'decorateur', 'macon'],
+  'poseur-de-parquet': ['solier', 'carreleur', 'menuisier', 'peintre-en-batiment', 'decorateur', 'platrier', 'salle-de-bain'],
+  miroitier: ['vitrier', 'menuisier', 'storiste', 'decorateur', 'salle-de-bain', 'peintre-en-batiment', 'facadier'],
+  storiste: ['vitrier', 'miroitier', 'menuisier', 'alarme-securite', 'climaticien', 'metallier', 'decorateur'],
+  'salle-de-bain': ['plombier', 'carreleur', 'electricien', 'cuisiniste', 'decorateur', 'miroitier', 'architecte-interieur', 'solier'],
+  'architecte-interieur': ['decorateur', 'cuisiniste', 'salle-de-bain', 'peintre-en-batiment', 'menuisier', 'geometre', 'paysagiste', 'plombier'],
+  decorateur: ['architecte-interieur', 'peintre-en-batiment', 'poseur-de-parquet', 'cuisiniste', 'storiste', 'platrier', 'solier', 'ferronnier'],
+  domoticien: ['electricien', 'alarme-securite', 'borne-recharge', 'antenniste', 'climaticien', 'panneaux-solaires'],
+  'pompe-a-chaleur': ['chauffagiste', 'climaticien', 'plombier', 'isolation-thermique', 'panneaux-solaires', 'renovation-energetique', 'electricien'],
+  'panneaux-solaires': ['electricien', 'pompe-a-chaleur', 'borne-recharge', 'couvreur', 'renovation-energetique', 'isolation-thermique', 'chauffagiste', 'climaticien'],
+  'isolation-thermique': ['facadier', 'renovation-energetique', 'platrier', 'couvreur', 'climaticien', 'pompe-a-chaleur', 'chauffagiste', 'etancheiste'],
+  'renovation-energetique': ['isolation-thermique', 'pompe-a-chaleur', 'panneaux-solaires', 'chauffagiste', 'diagnostiqueur', 'climaticien', 'electricien'],
+  'borne-recharge': ['electricien', 'domoticien', 'panneaux-solaires', 'alarme-securite', 'antenniste'],
+  ramoneur: ['chauffagiste', 'couvreur', 'nettoyage', 'charpentier', 'diagnostiqueur'],
+  paysagiste: ['jardinier', 'pisciniste', 'terrassier', 'macon', 'decorateur', 'geometre', 'architecte-interieur'],
+  pisciniste: ['paysagiste', 'terrassier', 'macon', 'electricien', 'plombier', 'jardinier', 'salle-de-bain'],
+  'alarme-securite': ['serrurier', 'electricien', 'domoticien', 'antenniste', 'vitrier', 'borne-recharge', 'metallier', 'storiste'],
+  antenniste: ['electricien', 'domoticien', 'alarme-securite', 'couvreur', 'panneaux-solaires', 'borne-recharge'],
+  ascensoriste: ['electricien', 'metallier', 'macon', 'diagnostiqueur'],
+  diagnostiqueur: ['renovation-energetique', 'electricien', 'ramoneur', 'geometre', 'isolation-thermique', 'ascensoriste', 'desinsectisation', 'deratisation'],
+  geometre: ['terrassier', 'macon', 'diagnostiqueur', 'architecte-interieur', 'paysagiste'],
+  desinsectisation: ['deratisation', 'nettoyage', 'jardinier', 'diagnostiqueur'],
+  deratisation: ['desinsectisation', 'nettoyage', 'jardinier', 'diagnostiqueur'],
+  demenageur: ['nettoyage', 'peintre-en-batiment', 'electricien', 'plombier', 'serrurier'],
+}
@@ -0,0 +1,381 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from './problems'
+
+/** Problem sans les champs de contenu, pour les listes et les cartes */
+export type ProblemSummary = Pick<Problem, 'slug' | 'name' | 'description' | 'primaryService' | 'relatedServices' | 'urgencyLevel' | 'estimatedCost' | 'averageResponseTime' | 'seasonality'>
+
+/** Slug -> position dans `problems` */
+export const PROBLEM_INDEX: Record<string, number> = {
+  'fuite-eau': 0,
+  'canalisation-bouchee': 1,
+  'panne-chaudiere': 2,
+  'serrure-bloquee': 3,
+  'porte-claquee': 4,
+  'panne-electrique': 5,
+  'court-circuit': 6,
+  'fissure-mur': 7,
+  'infiltration-toiture': 8,
+  'degat-des-eaux': 9,
+  humidite: 10,
+  moisissure: 11,
+  'vitre-cassee': 12,
+  'volet-bloque': 13,
+  'chaudiere-qui-fuit': 14,
+  'radiateur-froid': 15,
+  'ballon-eau-chaude-panne': 16,
+  'wc-bouche': 17,
+  'robinet-qui-fuit': 18,
+  'tuile-cassee': 19,
+  'gouttiere-bouchee': 20,
+  'porte-garage-bloquee': 21,
+  'interphone-panne': 22,
+  'alarme-declenchee': 23,
+  inondation: 24,
+  'gel-tuyaux': 25,
+  'fissure-facade': 26,
+  'affaissement-terrasse': 27,
+  'probleme-isolation': 28,
+  nuisibles: 29,
+}
+
+/** Mêmes entrées et même ordre que `problems` */
+export const problemSummaries: ProblemSummary[] = [
+  {
+    slug: 'fuite-eau',
+    name: 'Fuite d’eau',
+    description: 'Une fuite d’eau peut survenir sur une canalisation, un raccord ou un appareil sanitaire. Non traitée rapidement, elle provoque des dégâts importants sur les murs, les sols et les plafonds. L’intervention rapide d’un plombier permet de limiter les dommages et d’éviter un dégât des eaux.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier', 'chauffagiste'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 80, max: 300 },
+    averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  },
+  {
+    slug: 'canalisation-bouchee',
+    name: 'Canalisation bouchée',
+    description: 'Une canalisation bouchée empêche l’évacuation normale des eaux usées. Le bouchon peut être causé par une accumulation de graisse, de calcaire, de cheveux ou d’objets. Un débouchage professionnel est nécessaire lorsque les méthodes classiques échouent.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 100, max: 400 },
+    averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  },
+  {
+    slug: 'panne-chaudiere',
+    name: 'Panne de chaudière',
+    description: 'Une panne de chaudière vous prive de chauffage et d’eau chaude. Les causes sont multiples : problème de pression, défaut d’allumage, circulateur en panne ou thermostat défectueux. Un chauffagiste qualifié doit intervenir rapidement, surtout en hiver.',
+    primaryService: 'chauffagiste',
+    relatedServices: ['chauffagiste', 'plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 150, max: 600 },
+    averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+    seasonality: 'hiver',
+  },
+  {
+    slug: 'serrure-bloquee',
+    name: 'Serrure bloquée',
+    description: 'Une serrure bloquée empêche l’ouverture ou la fermeture de votre porte. Cela peut être dû à un mécanisme grippé, une clé cassée dans le barillet ou une déformation du cylindre. Un serrurier professionnel peut intervenir sans endommager la porte.',
+    primaryService: 'serrurier',
+    relatedServices: ['serrurier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 80, max: 250 },
+    averageResponseTime: 'Généralement sous 30 min à 1h en zone urbaine (selon disponibilité)',
+  },
+  {
+    slug: 'porte-claquee',
+    name: 'Porte claquée',
+    description: 'Une porte claquée avec les clés restées à l’intérieur est l’une des urgences de serrurerie les plus fréquentes. Le serrurier peut ouvrir la porte sans dégât dans la majorité des cas grâce à des techniques non destructives.',
+    primaryService: 'serrurier',
+    relatedServices: ['serrurier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 80, max: 200 },
+    averageResponseTime: 'Généralement sous 30 min à 1h en zone urbaine (selon disponibilité)',
+  },
+  {
+    slug: 'panne-electrique',
+    name: 'Panne électrique',
+    description: 'Une panne électrique peut couper l’alimentation de tout ou partie de votre logement. Les causes vont du simple disjoncteur qui saute à un défaut d’isolement grave. Un électricien qualifié doit diagnostiquer l’origine de la panne pour intervenir en toute sécurité.',
+    primaryService: 'electricien',
+    relatedServices: ['electricien'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 100, max: 350 },
+    averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  },
+  {
+    slug: 'court-circuit',
+    name: 'Court-circuit',
+    description: 'Un court-circuit se produit lorsque deux conducteurs entrent en contact direct, provoquant une surintensité dangereuse. Il peut causer un incendie si les protections électriques sont défaillantes. L’intervention immédiate d’un électricien est indispensable.',
+    primaryService: 'electricien',
+    relatedServices: ['electricien'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 100, max: 400 },
+    averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  },
+  {
+    slug: 'fissure-mur',
+    name: 'Fissure dans un mur',
+    description: 'Les fissures murales peuvent être superficielles (microfissures esthétiques) ou structurelles (fissures traversantes). Une fissure qui s’élargit progressivement nécessite un diagnostic professionnel pour évaluer les risques et préconiser le traitement adapté.',
+    primaryService: 'macon',
+    relatedServices: ['macon', 'peintre-en-batiment'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 200, max: 800 },
+    averageResponseTime: 'Sous 48 heures (rendez-vous)',
+  },
+  {
+    slug: 'infiltration-toiture',
+    name: 'Infiltration de toiture',
+    description: 'Une infiltration de toiture laisse passer l’eau de pluie dans les combles ou les pièces habitables. Les causes sont variées : tuiles cassées, solins défectueux, zinguerie usée ou problème d’étanchéité. Une intervention rapide d’un couvreur est essentielle pour éviter les dégâts.',
+    primaryService: 'couvreur',
+    relatedServices: ['couvreur', 'plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 200, max: 1000 },
+    averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  },
+  {
+    slug: 'degat-des-eaux',
+    name: 'Dégât des eaux',
+    description: 'Un dégât des eaux désigne tout dommage causé par l’eau dans un logement : fuite de canalisation, débordement, infiltration. C’est le sinistre le plus fréquent en France (environ 1 million par an). Une réaction rapide permet de limiter les dommages et de faciliter l’indemnisation.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier', 'peintre-en-batiment'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 150, max: 500 },
+    averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  },
+  {
+    slug: 'humidite',
+    name: 'Problème d’humidité',
+    description: 'L’humidité excessive dans un logement peut provenir de remontées capillaires, d’une mauvaise ventilation ou d’infiltrations. Elle dégrade les murs, favorise les moisissures et nuit à la santé des occupants. Un diagnostic professionnel est nécessaire pour traiter la cause.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier', 'macon', 'peintre-en-batiment'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 200, max: 600 },
+    averageResponseTime: 'Sous 48 heures (rendez-vous)',
+  },
+  {
+    slug: 'moisissure',
+    name: 'Moisissure',
+    description: 'Les moisissures apparaissent dans les zones humides et mal ventilées du logement : salle de bain, cuisine, angles des murs, derrière les meubles. Au-delà du problème esthétique, elles représentent un risque pour la santé (allergies, asthme) et doivent être traitées à la source.',
+    primaryService: 'peintre-en-batiment',
+    relatedServices: ['peintre-en-batiment', 'plombier'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 150, max: 500 },
+    averageResponseTime: 'Sous 72 heures (rendez-vous)',
+  },
+  {
+    slug: 'vitre-cassee',
+    name: 'Vitre cassée',
+    description: 'Une vitre cassée expose votre logement aux intempéries, au froid et aux intrusions. Qu’il s’agisse d’un simple vitrage, d’un double vitrage ou d’une baie vitrée, un vitrier peut intervenir en urgence pour sécuriser l’ouverture et remplacer le vitrage.',
+    primaryService: 'vitrier',
+    relatedServices: ['vitrier', 'menuisier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 100, max: 350 },
+    averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  },
+  {
+    slug: 'volet-bloque',
+    name: 'Volet bloqué',
+    description: 'Un volet roulant ou battant bloqué peut être causé par un mécanisme défaillant, des lames désaxées, un moteur en panne ou des gonds usés. Un menuisier ou un spécialiste des volets peut diagnostiquer et réparer le problème sans nécessairement remplacer le volet entier.',
+    primaryService: 'menuisier',
+    relatedServices: ['menuisier', 'electricien'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 80, max: 250 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'chaudiere-qui-fuit',
+    name: 'Chaudière qui fuit',
+    description: 'Une fuite sur votre chaudière peut provenir du corps de chauffe, du vase d’expansion, des raccords ou de la soupape de sécurité. Elle nécessite une intervention rapide d’un chauffagiste pour éviter les dégâts des eaux et les risques liés à l’installation.',
+    primaryService: 'chauffagiste',
+    relatedServices: ['chauffagiste', 'plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 150, max: 500 },
+    averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  },
+  {
+    slug: 'radiateur-froid',
+    name: 'Radiateur froid',
+    description: 'Un radiateur qui reste froid alors que le chauffage fonctionne peut indiquer une poche d’air dans le circuit, un problème de circulateur ou un déséquilibre hydraulique. La purge suffit souvent à résoudre le problème, sinon un chauffagiste doit intervenir.',
+    primaryService: 'chauffagiste',
+    relatedServices: ['chauffagiste'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 100, max: 300 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'ballon-eau-chaude-panne',
+    name: 'Ballon d’eau chaude en panne',
+    description: 'Un ballon d’eau chaude (cumulus) en panne vous prive d’eau chaude sanitaire. Les causes fréquentes sont : résistance entartrée, thermostat défectueux, anode usée ou fuite de la cuve. Un plombier-chauffagiste peut réparer ou remplacer l’appareil.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier', 'chauffagiste'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 200, max: 800 },
+    averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  },
+  {
+    slug: 'wc-bouche',
+    name: 'WC bouché',
+    description: 'Des toilettes bouchées sont une urgence sanitaire courante. Le bouchon peut être causé par un excès de papier, un objet tombé dans la cuvette ou un problème dans la canalisation d’évacuation. Un plombier intervient avec les outils adaptés pour résoudre le problème rapidement.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 80, max: 250 },
+    averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité)',
+  },
+  {
+    slug: 'robinet-qui-fuit',
+    name: 'Robinet qui fuit',
+    description: 'Un robinet qui goutte en permanence gaspille jusqu’à 120 litres d’eau par jour et augmente votre facture d’eau. La cause est généralement un joint usé, une cartouche défectueuse ou un siège de robinet abîmé. La réparation est souvent simple et peu coûteuse.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 60, max: 200 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'tuile-cassee',
+    name: 'Tuile cassée',
+    description: 'Une tuile cassée ou déplacée laisse le toit vulnérable aux infiltrations d’eau et au vent. Les causes sont variées : tempête, gel, vieillissement ou impact. Un couvreur peut remplacer les tuiles endommagées et vérifier l’état général de la couverture.',
+    primaryService: 'couvreur',
+    relatedServices: ['couvreur'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 150, max: 500 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'gouttiere-bouchee',
+    name: 'Gouttière bouchée',
+    description: 'Une gouttière bouchée par des feuilles, de la mousse ou des débris ne remplit plus son rôle d’évacuation des eaux pluviales. L’eau déborde, ruisselle le long des murs et peut provoquer des infiltrations et des dégâts sur la façade.',
+    primaryService: 'couvreur',
+    relatedServices: ['couvreur'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 80, max: 250 },
+    averageResponseTime: 'Sous 48 heures',
+  },
+  {
+    slug: 'porte-garage-bloquee',
+    name: 'Porte de garage bloquée',
+    description: 'Une porte de garage bloquée, qu’elle soit sectionnelle, basculante ou enroulable, peut être causée par un problème de motorisation, de rails déformés, de ressorts cassés ou de cellules de sécurité défaillantes. Un spécialiste peut diagnostiquer et réparer la panne.',
+    primaryService: 'serrurier',
+    relatedServices: ['serrurier', 'menuisier'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 100, max: 350 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'interphone-panne',
+    name: 'Interphone en panne',
+    description: 'Un interphone en panne empêche la communication avec les visiteurs et l’ouverture à distance de la porte d’entrée. Le problème peut provenir de la platine de rue, du combiné intérieur, du câblage ou de la gâche électrique.',
+    primaryService: 'electricien',
+    relatedServices: ['electricien'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 80, max: 250 },
+    averageResponseTime: 'Sous 48 heures',
+  },
+  {
+    slug: 'alarme-declenchee',
+    name: 'Alarme déclenchée',
+    description: 'Une alarme qui se déclenche sans raison apparente peut être causée par un détecteur défectueux, un animal domestique, un courant d’air ou une interférence électronique. Un électricien spécialisé en sécurité peut identifier et corriger le problème.',
+    primaryService: 'electricien',
+    relatedServices: ['electricien'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 100, max: 300 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+  {
+    slug: 'inondation',
+    name: 'Inondation',
+    description: 'Une inondation dans votre logement, qu’elle soit d’origine naturelle (crue, pluie torrentielle) ou accidentelle (rupture de canalisation, remontée d’égouts), nécessite une intervention d’urgence pour pomper l’eau et sécuriser les lieux.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier', 'electricien'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 200, max: 1000 },
+    averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  },
+  {
+    slug: 'gel-tuyaux',
+    name: 'Gel des tuyaux',
+    description: 'Lorsque la température descend sous 0 °C, l’eau dans les canalisations peut geler et provoquer l’éclatement des tuyaux. C’est une urgence hivernale fréquente qui nécessite l’intervention rapide d’un plombier pour dégeler et réparer.',
+    primaryService: 'plombier',
+    relatedServices: ['plombier'],
+    urgencyLevel: 'haute',
+    estimatedCost: { min: 150, max: 500 },
+    averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+    seasonality: 'hiver',
+  },
+  {
+    slug: 'fissure-facade',
+    name: 'Fissure de façade',
+    description: 'Les fissures de façade altèrent l’esthétique et l’étanchéité du bâtiment. Elles peuvent être superficielles (faïçence) ou structurelles. Un maçon ou un façadier doit évaluer la gravité et réaliser les travaux de réparation adaptés.',
+    primaryService: 'macon',
+    relatedServices: ['macon', 'peintre-en-batiment'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 300, max: 1500 },
+    averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  },
+  {
+    slug: 'affaissement-terrasse',
+    name: 'Affaissement de terrasse',
+    description: 'Un affaissement de terrasse se manifeste par un enfoncement progressif ou soudain des dalles ou de la structure. Les causes principales sont un tassement du sol, un drainage insuffisant ou des fondations inadaptées. Un maçon doit évaluer les dégâts et préconiser la méthode de reprise.',
+    primaryService: 'macon',
+    relatedServices: ['macon'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 500, max: 2000 },
+    averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  },
+  {
+    slug: 'probleme-isolation',
+    name: 'Problème d’isolation',
+    description: 'Une isolation défaillante se traduit par des déperditions thermiques, un inconfort permanent et des factures de chauffage élevées. L’isolation des combles, des murs et des fenêtres est la priorité pour améliorer la performance énergétique de votre logement.',
+    primaryService: 'isolation-thermique',
+    relatedServices: ['isolation-thermique', 'menuisier'],
+    urgencyLevel: 'basse',
+    estimatedCost: { min: 1000, max: 5000 },
+    averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  },
+  {
+    slug: 'nuisibles',
+    name: 'Nuisibles',
+    description: 'Les nuisibles (cafards, punaises de lit, rats, souris, guêpes, frelons) représentent un risque sanitaire et matériel. Un traitement professionnel par un spécialiste de la désinsectisation est nécessaire pour éliminer l’infestation durablement et en toute sécurité.',
+    primaryService: 'desinsectisation',
+    relatedServices: ['desinsectisation'],
+    urgencyLevel: 'moyenne',
+    estimatedCost: { min: 100, max: 400 },
+    averageResponseTime: 'Sous 24 heures',
+  },
+]
+
+/** Service -> positions, dans l'ordre de `problems` */
+export const PROBLEMS_BY_SERVICE: Record<string, number[]> = {
+  chauffagiste: [0, 2, 14, 15, 16],
+  couvreur: [8, 19, 20],
+  desinsectisation: [29],
+  electricien: [5, 6, 13, 22, 23, 24],
+  'isolation-thermique': [28],
+  macon: [7, 10, 26, 27],
+  menuisier: [12, 13, 21, 28],
+  'peintre-en-batiment': [7, 9, 10, 11, 26],
+  plombier: [0, 1, 2, 8, 9, 10, 11, 14, 16, 17, 18, 24, 25],
+  serrurier: [3, 4, 21],
+  vitrier: [12],
+}
+
+function has(index: Record<string, unknown>, key: string): boolean {
+  return Object.prototype.hasOwnProperty.call(index, key)
+}
+
+export function getProblemSummary(slug: string): ProblemSummary | undefined {
+  return has(PROBLEM_INDEX, slug) ? problemSummaries[PROBLEM_INDEX[slug]] : undefined
+}
+
+export function getProblemSummariesByService(service: string): ProblemSummary[] {
+  return has(PROBLEMS_BY_SERVICE, service) ? PROBLEMS_BY_SERVICE[service].map((i) => problemSummaries[i]) : []
+}
+
+/** Entrée complète, chargée seule depuis son shard */
+export async function loadProblem(slug: string): Promise<Problem | undefined> {
+  if (!has(PROBLEM_INDEX, slug)) return undefined
+  const shard: { entry: Problem } = await import(`./problems-shards/${slug}`)
+  return shard.entry
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'affaissement-terrasse',
+  name: 'Affaissement de terrasse',
+  description: 'Un affaissement de terrasse se manifeste par un enfoncement progressif ou soudain des dalles ou de la structure. Les causes principales sont un tassement du sol, un drainage insuffisant ou des fondations inadaptées. Un maçon doit évaluer les dégâts et préconiser la méthode de reprise.',
+  relatedServices: ['macon'],
+  primaryService: 'macon',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Dalles qui s’enfoncent ou se désaxent', 'Flaques d’eau stagnante sur la terrasse après la pluie', 'Fissures dans les joints ou le dallage',
+    'Décrochement visible entre la terrasse et le mur de la maison',
+  ],
+  immediateActions: [
+    'Sécurisez la zone pour éviter les chutes (baliser si nécessaire)', 'Photographiez les dégâts et mesurez le niveau d’affaissement',
+    'Vérifiez s’il y a des cavités sous les dalles', 'Consultez un maçon pour un diagnostic du sol et des fondations',
+  ],
+  preventiveTips: [
+    'Assurez un bon drainage sous et autour de la terrasse', 'Évitez de surcharger la terrasse (poids excessif, véhicules)',
+    'Traitez les joints régulièrement pour empêcher les infiltrations d’eau',
+  ],
+  estimatedCost: { min: 500, max: 2000 },
+  averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  faq: [
+    {
+      q: 'Pourquoi ma terrasse s’affaisse-t-elle ?',
+      a: 'Les causes principales sont : un tassement différentiel du sol (sol argileux, remblai mal compacté), un drainage insuffisant (l’eau fragilise le support), des fondations trop légères ou des racines d’arbres qui soulèvent les dalles.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un affaissement de terrasse ?',
+      a: 'La réparation coûte 500 à 2 000 € selon l’ampleur : relevage de dalles et rechargement (500 à 800 €), injection de résine expansive pour stabiliser le sol (1 000 à 2 000 €), réfection complète de la terrasse (3 000 à 10 000 € selon la surface).',
+    },
+    {
+      q: 'La garantie décennale couvre-t-elle l’affaissement ?',
+      a: 'Si la terrasse a moins de 10 ans et que l’affaissement est dû à un défaut de construction (fondations, drainage), la garantie décennale du constructeur s’applique. Conservez les factures et le procès-verbal de réception des travaux.',
+    },
+    {
+      q: 'Faut-il refaire toute la terrasse ?',
+      a: 'Pas nécessairement. Si l’affaissement est localisé, un relevage des dalles avec rechargement du support peut suffire. Si le sol est instable sur une grande surface, l’injection de résine ou la reprise des fondations est nécessaire avant de reposer le revêtement.',
+    },
+  ],
+}
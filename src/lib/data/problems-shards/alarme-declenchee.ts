@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'alarme-declenchee',
+  name: 'Alarme déclenchée',
+  description: 'Une alarme qui se déclenche sans raison apparente peut être causée par un détecteur défectueux, un animal domestique, un courant d’air ou une interférence électronique. Un électricien spécialisé en sécurité peut identifier et corriger le problème.',
+  relatedServices: ['electricien'],
+  primaryService: 'electricien',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'La sirène se déclenche sans intrusion détectée', 'Le système signale une zone en alerte permanente', 'La centrale affiche un code d’erreur',
+    'Déclenchements intempestifs récurrents, surtout la nuit',
+  ],
+  immediateActions: [
+    'Désactivez l’alarme avec votre code ou la télécommande', 'Vérifiez le détecteur signalé en alerte (poussière, araignée, pile faible)',
+    'Vérifiez que les portes et fenêtres sont bien fermées', 'Contactez votre installateur ou un électricien si les déclenchements persistent',
+  ],
+  preventiveTips: [
+    'Remplacez les piles des détecteurs chaque année', 'Nettoyez les détecteurs de mouvement régulièrement (poussière, toiles d’araignée)',
+    'Faites réviser votre système d’alarme tous les 2 ans par un professionnel',
+  ],
+  estimatedCost: { min: 100, max: 300 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Pourquoi mon alarme se déclenche-t-elle sans raison ?',
+      a: 'Les déclenchements intempestifs sont généralement causés par : un détecteur de mouvement sensible aux animaux ou courants d’air, une pile faible, un détecteur encrassé (poussière, insectes), ou une interférence radio. Le remplacement ou le recalibrage du détecteur règle généralement le problème.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un système d’alarme ?',
+      a: 'Le diagnostic + réparation coûte 100 à 300 €. Le remplacement d’un détecteur coûte 50 à 100 €. La révision complète du système coûte 150 à 250 €. Un contrat de maintenance annuel (100 à 200 €) évite les pannes.',
+    },
+    {
+      q: 'Mon alarme dérange les voisins, quels sont les risques ?',
+      a: 'Une sirène extérieure ne doit pas sonner plus de 3 minutes selon les recommandations professionnelles (standard APSAD R81) — certaines communes imposent également des limitations via arrêté municipal. Les nuisances sonores répétées peuvent entraîner une amende. Faites réparer le système rapidement et prévenez vos voisins.',
+    },
+    {
+      q: 'Faut-il remplacer mon ancien système d’alarme ?',
+      a: 'Les systèmes de plus de 10 ans utilisent des technologies obsolètes (fréquences brouillables, pas de notification smartphone). Un système connecté moderne (500 à 1 500 € installé) offre une meilleure protection et élimine la plupart des faux déclenchements.',
+    },
+  ],
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'ballon-eau-chaude-panne',
+  name: 'Ballon d’eau chaude en panne',
+  description: 'Un ballon d’eau chaude (cumulus) en panne vous prive d’eau chaude sanitaire. Les causes fréquentes sont : résistance entartrée, thermostat défectueux, anode usée ou fuite de la cuve. Un plombier-chauffagiste peut réparer ou remplacer l’appareil.',
+  relatedServices: ['plombier', 'chauffagiste'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'L’eau chaude est tiède ou froide au robinet', 'Le ballon déclenche le disjoncteur', 'Fuite d’eau sous le ballon ou au niveau du groupe de sécurité',
+    'Le témoin lumineux du ballon est éteint', 'Bruits de claquements dans le ballon (calcaire)',
+  ],
+  immediateActions: [
+    'Vérifiez le disjoncteur dédié au ballon sur le tableau électrique', 'Vérifiez que le contacteur jour/nuit est en position forcée (marche)',
+    'Contrôlez le thermostat de sécurité (bouton rouge sous le capot)', 'Contactez un plombier si le problème persiste',
+  ],
+  preventiveTips: ['Faites détartrer votre ballon tous les 2 à 3 ans', 'Actionnez le groupe de sécurité une fois par mois pour éviter le blocage', 'Remplacez l’anode de protection tous les 5 ans'],
+  estimatedCost: { min: 200, max: 800 },
+  averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Mon ballon d’eau chaude ne chauffe plus, que faire ?',
+      a: 'Vérifiez d’abord le disjoncteur dédié et le contacteur jour/nuit (mettez-le en marche forcée). Si le ballon ne chauffe toujours pas, appuyez sur le bouton de réarmement du thermostat de sécurité (sous le capot inférieur). Si le problème persiste, la résistance est probablement entartrée ou le thermostat défectueux.',
+    },
+    {
+      q: 'Faut-il réparer ou remplacer le ballon ?',
+      a: 'Si le ballon a moins de 10 ans, la réparation est rentable (remplacement de résistance : 150 à 300 €, thermostat : 100 à 200 €). Au-delà de 12 à 15 ans, le remplacement est préférable (600 à 2 000 € selon capacité et technologie).',
+    },
+    {
+      q: 'Quelle capacité de ballon choisir ?',
+      a: 'Comptez environ 50 litres par personne : 100 L pour un couple, 200 L pour une famille de 4 personnes, 300 L pour 5 à 6 personnes. Un ballon thermodynamique consomme 2 à 3 fois moins d’électricité qu’un cumulus classique (source : ADEME).',
+    },
+    {
+      q: 'Mon ballon fuit, est-ce réparable ?',
+      a: 'Si la fuite provient du groupe de sécurité, un simple remplacement suffit (80 à 150 €). Si la cuve elle-même est percée (corrosion), le remplacement du ballon est inévitable. Une fuite de cuve ne se répare pas.',
+    },
+  ],
+}
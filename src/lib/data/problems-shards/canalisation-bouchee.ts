@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'canalisation-bouchee',
+  name: 'Canalisation bouchée',
+  description: 'Une canalisation bouchée empêche l’évacuation normale des eaux usées. Le bouchon peut être causé par une accumulation de graisse, de calcaire, de cheveux ou d’objets. Un débouchage professionnel est nécessaire lorsque les méthodes classiques échouent.',
+  relatedServices: ['plombier'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Eau qui s’écoule très lentement dans l’évier ou la douche', 'Remontées d’eau sale dans les équipements sanitaires',
+    'Mauvaises odeurs persistantes provenant des canalisations', 'Gargouillis dans les tuyaux lors de l’évacuation', 'WC dont le niveau d’eau monte anormalement après la chasse',
+  ],
+  immediateActions: [
+    'Cessez d’utiliser les équipements concernés pour éviter le débordement', 'Tentez un débouchage à la ventouse ou au mélange bicarbonate-vinaigre',
+    'Ne versez jamais de produit chimique agressif qui peut endommager les canalisations', 'Protégez le sol avec des serpillères en cas de remontée d’eau',
+  ],
+  preventiveTips: [
+    'Utilisez des grilles de protection sur les bondes de douche et d’évier', 'Versez de l’eau bouillante dans les canalisations une fois par semaine',
+    'Ne jetez jamais de graisses alimentaires dans l’évier', 'Évitez de jeter des lingettes dans les toilettes, même biodégradables',
+  ],
+  estimatedCost: { min: 100, max: 400 },
+  averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Comment déboucher une canalisation naturellement ?',
+      a: 'Versez 6 cuillères à soupe de bicarbonate de soude et 25 cl de vinaigre blanc dans la canalisation. Laissez agir 30 minutes puis rincez à l’eau bouillante. Si le bouchon persiste, utilisez une ventouse ou un furet manuel.',
+    },
+    {
+      q: 'Quel est le prix d’un débouchage professionnel ?',
+      a: 'Un débouchage simple coûte entre 100 et 200 €. Un hydrocurage haute pression pour les canalisations enterrées peut atteindre 400 €. Demandez toujours un devis avant intervention.',
+    },
+    {
+      q: 'Les produits chimiques sont-ils efficaces ?',
+      a: 'Les produits chimiques peuvent dissoudre certains bouchons légers, mais ils abiment les canalisations (surtout en PVC) et polluent l’eau. Privilégiez les méthodes mécaniques (ventouse, furet) ou faites appel à un professionnel.',
+    },
+    {
+      q: 'Ma canalisation se bouche régulièrement, que faire ?',
+      a: 'Des bouchons récurrents peuvent indiquer un problème structurel : contre-pente, canalisation écrasée ou racines d’arbre. Un diagnostic par caméra permet d’identifier la cause exacte et de planifier une réparation durable.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'chaudiere-qui-fuit',
+  name: 'Chaudière qui fuit',
+  description: 'Une fuite sur votre chaudière peut provenir du corps de chauffe, du vase d’expansion, des raccords ou de la soupape de sécurité. Elle nécessite une intervention rapide d’un chauffagiste pour éviter les dégâts des eaux et les risques liés à l’installation.',
+  relatedServices: ['chauffagiste', 'plombier'],
+  primaryService: 'chauffagiste',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Flaques d’eau sous ou autour de la chaudière', 'Gouttes régulières au niveau des raccords', 'Pression du circuit qui chute régulièrement',
+    'Traces de rouille ou de calcaire sur le corps de la chaudière', 'La soupape de sécurité laisse couler de l’eau en permanence',
+  ],
+  immediateActions: [
+    'Coupez l’alimentation gaz et électrique de la chaudière', 'Placez un récipient sous la fuite', 'Ne tentez pas de resserrer les raccords vous-même sur une chaudière à gaz',
+    'Contactez un chauffagiste agréé en urgence',
+  ],
+  preventiveTips: [
+    'Faites réaliser l’entretien annuel obligatoire de votre chaudière', 'Surveillez régulièrement la pression du circuit (1 à 1,5 bar)',
+    'Faites vérifier le vase d’expansion lors de chaque entretien',
+  ],
+  estimatedCost: { min: 150, max: 500 },
+  averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Pourquoi ma chaudière fuit-elle ?',
+      a: 'Les causes principales sont : soupape de sécurité défectueuse (pression trop élevée), vase d’expansion percé, joints usés, corps de chauffe fissuré (corrosion) ou raccords desserrés. Seul un chauffagiste agréé peut diagnostiquer et réparer la fuite en toute sécurité.',
+    },
+    {
+      q: 'Est-ce dangereux si ma chaudière fuit ?',
+      a: 'Une fuite d’eau de chaudière présente plusieurs risques : dégât des eaux, corrosion des composants, et si la pression descend trop bas, arrêt de la chaudière. Sur une chaudière à gaz, ne tentez aucune réparation vous-même.',
+    },
+    {
+      q: 'Faut-il remplacer la chaudière si elle fuit ?',
+      a: 'Pas nécessairement. Si la fuite vient d’un joint ou de la soupape, la réparation est simple et peu coûteuse (150 à 300 €). Si le corps de chauffe est fissuré (corrosion), le remplacement de la chaudière est souvent plus économique (3 000 à 7 000 € pour une chaudière à condensation).',
+    },
+    {
+      q: 'La fuite est-elle couverte par le contrat d’entretien ?',
+      a: 'La plupart des contrats d’entretien couvrent le dépannage (déplacement + main-d’œuvre). Les pièces détachées sont incluses dans les contrats « tout compris » (200 à 400 €/an) mais pas dans les contrats de base (120 à 180 €/an).',
+    },
+  ],
+}
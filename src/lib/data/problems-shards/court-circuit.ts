@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'court-circuit',
+  name: 'Court-circuit',
+  description: 'Un court-circuit se produit lorsque deux conducteurs entrent en contact direct, provoquant une surintensité dangereuse. Il peut causer un incendie si les protections électriques sont défaillantes. L’intervention immédiate d’un électricien est indispensable.',
+  relatedServices: ['electricien'],
+  primaryService: 'electricien',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Le disjoncteur saute immédiatement lors du branchement d’un appareil', 'Une prise ou un interrupteur noircit ou dégage de la fumée',
+    'Des étincelles visibles au niveau d’un branchement', 'Odeur de plastique ou de caoutchouc brûlé près du tableau', 'Fusible fondu ou disjoncteur impossible à réarmer',
+  ],
+  immediateActions: [
+    'Coupez immédiatement le disjoncteur général', 'Ne touchez pas aux fils dénudés ni aux équipements endommagés',
+    'Débranchez l’appareil suspect si vous pouvez le faire en sécurité', 'Aérez la pièce en cas d’odeur de brûlé',
+    'Appelez un électricien d’urgence pour localiser et réparer le défaut',
+  ],
+  preventiveTips: [
+    'Ne branchez pas d’appareils de forte puissance sur des rallonges', 'Faites remplacer les câbles abîmés ou dénudés sans attendre',
+    'Installez des disjoncteurs adaptés à chaque circuit (10 A, 16 A, 32 A)',
+  ],
+  estimatedCost: { min: 100, max: 400 },
+  averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  faq: [
+    {
+      q: 'Un court-circuit peut-il provoquer un incendie ?',
+      a: 'Oui, un court-circuit est l’une des principales causes d’incendie d’origine électrique en France (environ 25 % des incendies domestiques). Les protections (disjoncteurs, fusibles) doivent couper le courant instantanément. Si votre installation est vétuste, le risque augmente considérablement.',
+    },
+    {
+      q: 'Comment localiser un court-circuit ?',
+      a: 'L’électricien procède par élimination : il désactive tous les circuits au tableau, puis les réactive un par un pour identifier celui qui déclenche le disjoncteur. Il utilise ensuite un mégohmètre pour mesurer l’isolement et localiser le défaut précis.',
+    },
+    {
+      q: 'Peut-on réarmer le disjoncteur après un court-circuit ?',
+      a: 'Ne réarmez le disjoncteur qu’après avoir identifié et débranché l’appareil ou le circuit fautif. Si le disjoncteur saute de nouveau, il y a un défaut dans l’installation qui nécessite l’intervention d’un électricien.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un court-circuit ?',
+      a: 'Le diagnostic et la réparation coûtent entre 100 et 400 €. Le prix dépend de la localisation du défaut (accessible ou encastré) et de l’ampleur des dégâts (simple reconnexion ou remplacement de câblage).',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'degat-des-eaux',
+  name: 'Dégât des eaux',
+  description: 'Un dégât des eaux désigne tout dommage causé par l’eau dans un logement : fuite de canalisation, débordement, infiltration. C’est le sinistre le plus fréquent en France (environ 1 million par an). Une réaction rapide permet de limiter les dommages et de faciliter l’indemnisation.',
+  relatedServices: ['plombier', 'peintre-en-batiment'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Plafond ou mur gorgé d’eau avec taches brunâtres', 'Eau qui coule du plafond ou le long des murs', 'Parquet ou sol stratifié qui gondole', 'Odeur de moisi persistante',
+    'Peinture qui cloque et se détache des murs',
+  ],
+  immediateActions: [
+    'Coupez l’arrivée d’eau et l’électricité de la zone sinistrée', 'Épongez l’eau et déplacez les meubles et objets de valeur', 'Prenez des photos et vidéos des dégâts',
+    'Remplissez le constat amiable dégât des eaux avec votre voisin si concerné', 'Déclarez le sinistre à votre assurance sous 5 jours ouvrés',
+  ],
+  preventiveTips: [
+    'Vérifiez régulièrement l’état de vos raccords de machine à laver et lave-vaisselle', 'Installez un détecteur de fuite d’eau connecté près des points d’eau',
+    'Fermez le robinet d’arrivée d’eau lorsque vous vous absentez longtemps', 'Remplacez les flexibles de raccordement tous les 5 ans',
+  ],
+  estimatedCost: { min: 150, max: 500 },
+  averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Comment remplir le constat amiable dégât des eaux ?',
+      a: 'Le constat amiable doit être rempli avec le voisin responsable ou touché. Indiquez la date, la cause supposée, la description des dégâts et joignez des photos. Chaque partie envoie sa copie à son assureur sous 5 jours ouvrés.',
+    },
+    {
+      q: 'Mon assurance prend-elle en charge le dégât des eaux ?',
+      a: 'La garantie dégât des eaux est incluse dans tous les contrats multirisque habitation. Elle couvre les dommages aux biens mais pas la réparation de la cause (fuite, canalisation). La vétusté est souvent déduite de l’indemnisation.',
+    },
+    {
+      q: 'Combien de temps pour sécher après un dégât des eaux ?',
+      a: 'Le séchage naturel prend 2 à 6 semaines selon l’ampleur. Un assureur peut mandater une entreprise de séchage industriel (déshumidificateurs) pour accélérer le processus à 1 à 2 semaines. Ne repeignez ou ne refaites les sols qu’une fois le taux d’humidité revenu à la normale.',
+    },
+    {
+      q: 'Qui est responsable d’un dégât des eaux en copropriété ?',
+      a: 'Si la fuite provient des parties communes (colonne montante, toiture), c’est l’assurance de la copropriété qui intervient. Si elle provient d’un appartement voisin, c’est l’assurance du voisin. Le syndic doit être informé dans tous les cas.',
+    },
+  ],
+}
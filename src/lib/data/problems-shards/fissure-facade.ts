@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'fissure-facade',
+  name: 'Fissure de façade',
+  description: 'Les fissures de façade altèrent l’esthétique et l’étanchéité du bâtiment. Elles peuvent être superficielles (faïçence) ou structurelles. Un maçon ou un façadier doit évaluer la gravité et réaliser les travaux de réparation adaptés.',
+  relatedServices: ['macon', 'peintre-en-batiment'],
+  primaryService: 'macon',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Fissures visibles sur le crépi ou l’enduit extérieur', 'Enduit qui se décolle ou s’effrite par plaques', 'Traces d’humidité à l’intérieur en face de la fissure extérieure',
+    'Fissure en escalier suivant les joints des parpaings ou briques',
+  ],
+  immediateActions: ['Photographiez et mesurez les fissures pour suivre leur évolution', 'Posez des témoins en plâtre datés pour détecter les mouvements', 'Consultez un maçon pour un diagnostic'],
+  preventiveTips: [
+    'Faites ravaler votre façade tous les 10 à 15 ans', 'Traitez les microalgues et mousses avec un hydrofuge', 'Assurez un bon drainage des eaux pluviales le long des murs',
+    'Vérifiez les joints de dilatation du bâtiment',
+  ],
+  estimatedCost: { min: 300, max: 1500 },
+  averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  faq: [
+    {
+      q: 'Quels types de fissures de façade existent ?',
+      a: 'On distingue : les microfissures (<0,2 mm, esthétiques), les fissures de retrait (0,2 à 2 mm, liées au séchage de l’enduit), et les fissures structurelles (>2 mm, en escalier ou traversantes, liées à un mouvement du bâtiment). Seules les deux dernières nécessitent un traitement spécifique.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une fissure de façade ?',
+      a: 'Le traitement localisé d’une fissure coûte 300 à 800 € (ouverture, calicot, enduit). Un ravalement complet de façade coûte 40 à 100 €/m², soit 4 000 à 15 000 € pour une maison individuelle. Les travaux structurels (agrafage, injection) sont plus onéreux.',
+    },
+    {
+      q: 'Un ravalement de façade est-il obligatoire ?',
+      a: 'Certaines communes imposent un ravalement tous les 10 ans (Paris, notamment). Vérifiez le règlement de votre commune. En copropriété, le ravalement est voté en assemblée générale et les coûts sont répartis entre copropriétaires.',
+    },
+    {
+      q: 'Les fissures de façade sont-elles couvertes par la garantie décennale ?',
+      a: 'Oui, si le logement a moins de 10 ans et que les fissures compromettent la solidité de l’ouvrage ou le rendent impropre à sa destination. Le constructeur ou le maçon est tenu de réparer aux frais de son assurance décennale.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'fissure-mur',
+  name: 'Fissure dans un mur',
+  description: 'Les fissures murales peuvent être superficielles (microfissures esthétiques) ou structurelles (fissures traversantes). Une fissure qui s’élargit progressivement nécessite un diagnostic professionnel pour évaluer les risques et préconiser le traitement adapté.',
+  relatedServices: ['macon', 'peintre-en-batiment'],
+  primaryService: 'macon',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Fissure visible sur un mur intérieur ou extérieur', 'Fissure en escalier suivant les joints de maçonnerie',
+    'Portes ou fenêtres qui se coincent ou ne ferment plus correctement', 'Fissure qui s’élargit au fil du temps (mesurer avec un témoin)',
+  ],
+  immediateActions: [
+    'Mesurez et photographiez la fissure pour suivre son évolution', 'Posez un témoin en plâtre daté sur la fissure pour détecter tout mouvement',
+    'Vérifiez s’il y a d’autres fissures dans d’autres pièces', 'Consultez un maçon pour évaluer la nature de la fissure',
+  ],
+  preventiveTips: [
+    'Assurez un bon drainage autour des fondations pour éviter les mouvements de terrain', 'Évitez de planter des arbres à grandes racines près des murs porteurs',
+    'Entretenez les joints de façade régulièrement', 'Surveillez les fissures existantes avec des témoins en plâtre',
+  ],
+  estimatedCost: { min: 200, max: 800 },
+  averageResponseTime: 'Sous 48 heures (rendez-vous)',
+  faq: [
+    {
+      q: 'Quand une fissure de mur est-elle dangereuse ?',
+      a: 'Une fissure est préoccupante si elle mesure plus de 2 mm de large, si elle est traversante (visible des deux côtés du mur), si elle s’élargit progressivement ou si elle s’accompagne d’un décalage entre les deux bords. Dans ce cas, consultez un maçon ou un expert en bâtiment.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une fissure ?',
+      a: 'Une réparation esthétique (rebouchage + peinture) coûte 200 à 400 €. Un traitement structurel (agrafage, injection de résine) coûte 400 à 800 € ou plus selon l’ampleur. Si la fissure est liée aux fondations, les travaux de reprise en sous-œuvre peuvent atteindre plusieurs milliers d’euros.',
+    },
+    {
+      q: 'Les fissures sont-elles couvertes par l’assurance ?',
+      a: 'Les fissures causées par un événement naturel (sécheresse, inondation) peuvent être prises en charge si un arrêté de catastrophe naturelle est publié. Vous disposez alors de 10 jours pour déclarer le sinistre à votre assureur.',
+    },
+    {
+      q: 'Quelle est la différence entre microfissure et fissure structurelle ?',
+      a: 'Une microfissure (moins de 0,2 mm) est généralement superficielle et liée au retrait de l’enduit. Une fissure structurelle (plus de 2 mm, en escalier ou traversante) indique un mouvement du bâtiment et nécessite un diagnostic approfondi.',
+    },
+  ],
+}
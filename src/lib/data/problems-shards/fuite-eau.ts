@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'fuite-eau',
+  name: 'Fuite d’eau',
+  description: 'Une fuite d’eau peut survenir sur une canalisation, un raccord ou un appareil sanitaire. Non traitée rapidement, elle provoque des dégâts importants sur les murs, les sols et les plafonds. L’intervention rapide d’un plombier permet de limiter les dommages et d’éviter un dégât des eaux.',
+  relatedServices: ['plombier', 'chauffagiste'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Traces d’humidité ou auréoles sur les murs ou plafonds', 'Bruit d’écoulement d’eau anormal dans les murs', 'Compteur d’eau qui tourne alors que tous les robinets sont fermés',
+    'Augmentation inexplicable de la facture d’eau', 'Flaques d’eau au pied des canalisations apparentes', 'Peinture qui cloque ou papier peint qui se décolle',
+  ],
+  immediateActions: [
+    'Coupez l’arrivée d’eau générale au compteur', 'Placez des récipients sous la fuite pour récupérer l’eau', 'Épongez l’eau stagnante pour limiter les dégâts',
+    'Prenez des photos des dégâts pour votre assurance', 'Contactez un plombier d’urgence',
+  ],
+  preventiveTips: [
+    'Faites vérifier vos canalisations tous les 2 ans par un professionnel', 'Surveillez régulièrement votre compteur d’eau pour détecter les fuites cachées',
+    'Remplacez les joints d’étanchéité dès les premiers signes d’usure', 'Protégez vos tuyaux extérieurs contre le gel en hiver',
+  ],
+  estimatedCost: { min: 80, max: 300 },
+  averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  faq: [
+    {
+      q: 'Comment détecter une fuite d’eau cachée ?',
+      a: 'Relevez votre compteur d’eau le soir, ne consommez pas d’eau pendant la nuit, puis vérifiez le matin. Si le compteur a tourné, il y a une fuite. Un plombier peut également utiliser une caméra thermique ou un détecteur acoustique pour localiser la fuite sans casser.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une fuite d’eau ?',
+      a: 'Le coût varie de 80 € pour un simple changement de joint à 300 € pour une réparation sur canalisation encastrée. En urgence de nuit ou le week-end, prévoyez une majoration de 50 à 100 %.',
+    },
+    {
+      q: 'Ma fuite d’eau est-elle prise en charge par l’assurance ?',
+      a: 'Si la fuite provoque un dégât des eaux, votre assurance habitation prend en charge les dommages (sauf la réparation de la fuite elle-même). Déclarez le sinistre sous 5 jours ouvrés avec le constat amiable dégât des eaux.',
+    },
+    {
+      q: 'Faut-il couper l’eau immédiatement en cas de fuite ?',
+      a: 'Oui, coupez l’arrivée d’eau générale dès que possible. Le compteur se trouve généralement à la cave, dans un placard technique ou à l’extérieur du logement. Cela évite d’aggraver les dégâts en attendant le plombier.',
+    },
+    {
+      q: 'Peut-on réparer une fuite d’eau soi-même ?',
+      a: 'Pour un joint de robinet ou un flexible, oui. Pour une canalisation percée ou un raccord sous pression, il est fortement recommandé de faire appel à un plombier professionnel afin d’éviter d’aggraver la situation.',
+    },
+  ],
+}
@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'gel-tuyaux',
+  name: 'Gel des tuyaux',
+  description: 'Lorsque la température descend sous 0 °C, l’eau dans les canalisations peut geler et provoquer l’éclatement des tuyaux. C’est une urgence hivernale fréquente qui nécessite l’intervention rapide d’un plombier pour dégeler et réparer.',
+  relatedServices: ['plombier'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Pas d’eau au robinet malgré l’arrivée d’eau ouverte', 'Débit d’eau très faible ou irrégulier', 'Bruit de claquement dans les canalisations',
+    'Tuyau déformé ou fissuré visible', 'Traces d’eau au dégel (le tuyau a éclaté)',
+  ],
+  immediateActions: [
+    'Coupez l’arrivée d’eau générale immédiatement', 'Ouvrez les robinets pour réduire la pression lors du dégel',
+    'Dégelez progressivement avec un sèche-cheveux (jamais de flamme nue)', 'Ne forcez pas les vannes gelées', 'Contactez un plombier si le tuyau a éclaté',
+  ],
+  preventiveTips: [
+    'Isolez les tuyaux exposés au froid (gaine isolante, laine de verre)', 'Laissez couler un filet d’eau pendant les nuits de grand froid',
+    'Purgez les canalisations extérieures avant l’hiver', 'Maintenez une température minimale de 7 °C dans les pièces non chauffées',
+  ],
+  estimatedCost: { min: 150, max: 500 },
+  averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  seasonality: 'hiver',
+  faq: [
+    {
+      q: 'Comment dégeler un tuyau gelé ?',
+      a: 'Ouvrez le robinet concerné, puis réchauffez progressivement le tuyau avec un sèche-cheveux, une serviette chaude ou un câble chauffant. Commencez par le côté du robinet et progressez vers le point gelé. N’utilisez jamais de flamme nue (chalumeau) qui pourrait faire éclater le tuyau.',
+    },
+    {
+      q: 'Mon tuyau a éclaté à cause du gel, que faire ?',
+      a: 'Coupez immédiatement l’arrivée d’eau et l’électricité de la zone. Appelez un plombier d’urgence. Prenez des photos pour votre assurance. Le remplacement d’un tronc de canalisation coûte 150 à 500 € selon l’accès et le matériau.',
+    },
+    {
+      q: 'Le gel des tuyaux est-il couvert par l’assurance ?',
+      a: 'Oui, la plupart des assurances habitation couvrent les dégâts causés par le gel des canalisations via la garantie dégât des eaux. La réparation du tuyau lui-même peut être incluse si votre contrat comporte une garantie « dommages aux canalisations privées ».',
+    },
+    {
+      q: 'À quelle température les tuyaux gèlent-ils ?',
+      a: 'L’eau gèle à 0 °C, mais les tuyaux isolés résistent généralement jusqu’à -5 °C. Les tuyaux exposés (extérieurs, sous-sol non chauffé, vide sanitaire) sont les plus vulnérables. En dessous de -10 °C, même les canalisations intérieures mal isolées peuvent geler.',
+    },
+  ],
+}
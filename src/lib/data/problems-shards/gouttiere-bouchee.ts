@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'gouttiere-bouchee',
+  name: 'Gouttière bouchée',
+  description: 'Une gouttière bouchée par des feuilles, de la mousse ou des débris ne remplit plus son rôle d’évacuation des eaux pluviales. L’eau déborde, ruisselle le long des murs et peut provoquer des infiltrations et des dégâts sur la façade.',
+  relatedServices: ['couvreur'],
+  primaryService: 'couvreur',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'Eau qui déborde de la gouttière pendant la pluie', 'Végétation (mousse, herbe) visible dans la gouttière', 'Traces de ruissellement sur la façade sous la gouttière',
+    'Gouttière qui s’affaisse sous le poids des débris',
+  ],
+  immediateActions: [
+    'Si accessible depuis une échelle stable, retirez les débris avec des gants', 'Ne montez pas sur le toit sans équipement de sécurité',
+    'Vérifiez que la descente d’eau pluviale n’est pas bouchée', 'Contactez un couvreur pour un nettoyage complet et sécurisé',
+  ],
+  preventiveTips: [
+    'Nettoyez les gouttières deux fois par an (printemps et automne)', 'Installez des crapaudines (grilles) sur les descentes d’eau pluviale',
+    'Posez des pare-feuilles sur les gouttières proches d’arbres',
+  ],
+  estimatedCost: { min: 80, max: 250 },
+  averageResponseTime: 'Sous 48 heures',
+  faq: [
+    {
+      q: 'Combien coûte le nettoyage de gouttières ?',
+      a: 'Le nettoyage complet des gouttières d’une maison coûte entre 80 et 250 € selon la longueur, la hauteur et l’accessibilité. Certains couvreurs proposent des forfaits annuels d’entretien (2 passages) à 150 à 300 €.',
+    },
+    {
+      q: 'Les pare-feuilles sont-ils efficaces ?',
+      a: 'Oui, les pare-feuilles réduisent considérablement l’accumulation de débris. Les modèles en grille métallique ou en mousse coûtent 5 à 15 € par mètre linéaire (posé). Ils ne dispensent pas d’un contrôle annuel mais espacent les nettoyages.',
+    },
+    {
+      q: 'Quand faut-il remplacer une gouttière ?',
+      a: 'Remplacez une gouttière si elle présente des fissures, de la rouille percée (zinc) ou des joints défectueux (PVC). Une gouttière en zinc dure 30 à 50 ans, en aluminium 25 à 40 ans, en PVC 15 à 25 ans.',
+    },
+    {
+      q: 'Puis-je nettoyer les gouttières moi-même ?',
+      a: 'Si les gouttières sont accessibles depuis une échelle stable et que vous êtes à l’aise en hauteur, oui. Portez des gants, utilisez une échelle conforme et ne vous penchez jamais. Au-delà d’un étage ou sur un toit pentu, faites appel à un professionnel.',
+    },
+  ],
+}
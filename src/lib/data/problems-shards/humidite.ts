@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'humidite',
+  name: 'Problème d’humidité',
+  description: 'L’humidité excessive dans un logement peut provenir de remontées capillaires, d’une mauvaise ventilation ou d’infiltrations. Elle dégrade les murs, favorise les moisissures et nuit à la santé des occupants. Un diagnostic professionnel est nécessaire pour traiter la cause.',
+  relatedServices: ['plombier', 'macon', 'peintre-en-batiment'],
+  primaryService: 'plombier',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'Traces de salpêtre (dépôt blanc) sur les murs', 'Moisissures dans les angles et derrière les meubles', 'Sensation d’air humide permanent dans le logement',
+    'Papier peint qui se décolle ou peinture qui cloque', 'Odeur de moisi persistante', 'Condensation abondante sur les fenêtres',
+  ],
+  immediateActions: [
+    'Aérez le logement 10 à 15 minutes chaque jour, même en hiver', 'Vérifiez le fonctionnement de votre VMC (Ventilation Mécanique Contrôlée)',
+    'Ne séchez pas le linge à l’intérieur sans ventilation', 'Placez un déshumidificateur dans les pièces les plus touchées',
+  ],
+  preventiveTips: [
+    'Faites vérifier et entretenir votre VMC tous les ans', 'Assurez une bonne ventilation dans la cuisine et la salle de bain',
+    'Traitez les remontées capillaires avec un professionnel', 'Améliorez l’isolation thermique pour réduire la condensation',
+  ],
+  estimatedCost: { min: 200, max: 600 },
+  averageResponseTime: 'Sous 48 heures (rendez-vous)',
+  faq: [
+    {
+      q: 'Quelles sont les causes d’humidité dans une maison ?',
+      a: 'Les principales causes sont : les remontées capillaires (murs en contact avec le sol), la condensation (mauvaise ventilation, isolation insuffisante), les infiltrations (toiture, façade) et les fuites de canalisation cachées. Un diagnostic par un professionnel permet d’identifier la cause exacte.',
+    },
+    {
+      q: 'L’humidité est-elle dangereuse pour la santé ?',
+      a: 'Oui, un taux d’humidité supérieur à 70 % favorise les moisissures et les acariens, responsables d’allergies, d’asthme et d’infections respiratoires. Les enfants et les personnes âgées sont particulièrement vulnérables.',
+    },
+    {
+      q: 'Combien coûte un traitement anti-humidité ?',
+      a: 'Un traitement par injection de résine hydrophobe contre les remontées capillaires coûte 200 à 400 € par mètre linéaire. L’installation d’une VMC coûte 500 à 2 000 €. Un cuvelage de sous-sol va de 150 à 300 €/m².',
+    },
+    {
+      q: 'La VMC suffit-elle à résoudre un problème d’humidité ?',
+      a: 'La VMC traite la condensation mais pas les remontées capillaires ni les infiltrations. Si l’humidité provient du sol ou des murs, un traitement spécifique (injection, drainage, étanchéité) est nécessaire en complément de la ventilation.',
+    },
+  ],
+}
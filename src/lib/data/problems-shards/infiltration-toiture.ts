@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'infiltration-toiture',
+  name: 'Infiltration de toiture',
+  description: 'Une infiltration de toiture laisse passer l’eau de pluie dans les combles ou les pièces habitables. Les causes sont variées : tuiles cassées, solins défectueux, zinguerie usée ou problème d’étanchéité. Une intervention rapide d’un couvreur est essentielle pour éviter les dégâts.',
+  relatedServices: ['couvreur', 'plombier'],
+  primaryService: 'couvreur',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Taches d’humidité ou auréoles au plafond du dernier étage', 'Gouttes d’eau dans les combles pendant ou après la pluie',
+    'Moisissures sur la charpente ou l’isolation des combles', 'Papier peint qui se décolle ou peinture qui cloque sous les toits', 'Bois de charpente humide ou noirci',
+  ],
+  immediateActions: [
+    'Placez des récipients sous les points de fuite', 'Protégez vos biens avec des bâches en plastique', 'Ne montez pas sur le toit vous-même (risque de chute)',
+    'Prenez des photos pour votre déclaration d’assurance', 'Contactez un couvreur pour un diagnostic et un bâchage d’urgence si nécessaire',
+  ],
+  preventiveTips: [
+    'Faites inspecter votre toiture tous les 2 ans par un couvreur', 'Nettoyez les gouttières et chéneaux au printemps et à l’automne',
+    'Remplacez les tuiles cassées dès que vous les repérez', 'Vérifiez l’état des solins autour des cheminées et fenêtres de toit',
+  ],
+  estimatedCost: { min: 200, max: 1000 },
+  averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Comment localiser une infiltration de toiture ?',
+      a: 'L’eau peut parcourir un long chemin le long de la charpente avant de goutter. Inspectez les combles avec une lampe torche pendant une journée de pluie pour identifier le point d’entrée. Un couvreur expérimenté peut également réaliser un test d’étanchéité au tuyau d’arrosage.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une infiltration ?',
+      a: 'Le coût varie de 200 € pour un remplacement de tuiles à 1 000 € pour une réfection de solin ou de zinguerie. Un bâchage d’urgence coûte 150 à 300 €. Une réfection complète de toiture peut aller de 5 000 à 15 000 €.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle les infiltrations de toiture ?',
+      a: 'L’assurance habitation couvre les dégâts causés par une tempête (arrêté Cat Nat) ou une catastrophe naturelle. L’usure normale de la toiture n’est généralement pas couverte. Déclarez le sinistre dans les 5 jours ouvrés. Pour une catastrophe naturelle, le délai est de 10 jours après publication de l’arrêté ministériel au Journal Officiel (Code des assurances, art. L125-1).',
+    },
+    {
+      q: 'Peut-on réparer une infiltration en hiver ?',
+      a: 'Oui, un bâchage d’urgence est possible en toute saison. Les réparations définitives (remplacement de tuiles, réfection de solin) sont également réalisables en hiver, sauf en cas de gel ou de neige sur le toit.',
+    },
+  ],
+}
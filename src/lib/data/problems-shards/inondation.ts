@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'inondation',
+  name: 'Inondation',
+  description: 'Une inondation dans votre logement, qu’elle soit d’origine naturelle (crue, pluie torrentielle) ou accidentelle (rupture de canalisation, remontée d’égouts), nécessite une intervention d’urgence pour pomper l’eau et sécuriser les lieux.',
+  relatedServices: ['plombier', 'electricien'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Eau stagnante au sol dans une ou plusieurs pièces', 'Remontée d’eau sale par les évacuations', 'Odeur d’égout dans le logement',
+    'Murs imbibés d’eau jusqu’à une certaine hauteur',
+  ],
+  immediateActions: [
+    'Coupez l’électricité au disjoncteur général (ne marchez pas dans l’eau si des prises sont immergées)', 'Coupez l’arrivée d’eau si la cause est une rupture de canalisation',
+    'Mettez en hauteur les objets de valeur et les documents importants', 'Prenez des photos et vidéos des dégâts',
+    'Contactez les pompiers (18) si le niveau d’eau monte rapidement',
+  ],
+  preventiveTips: [
+    'Installez un clapet anti-retour sur les canalisations d’évacuation', 'Vérifiez que les regards et grilles d’évacuation ne sont pas obstrués',
+    'Souscrivez une garantie catastrophe naturelle dans votre assurance', 'Prévoyez une pompe de relevage si votre logement est en zone inondable',
+  ],
+  estimatedCost: { min: 200, max: 1000 },
+  averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité et localisation)',
+  faq: [
+    {
+      q: 'Que faire en premier en cas d’inondation ?',
+      a: 'La priorité est la sécurité : coupez l’électricité (si possible sans marcher dans l’eau), coupez le gaz, mettez-vous en sécurité en hauteur. Si le niveau monte rapidement, appelez les pompiers (18) ou le 112. Ne tentez jamais de traverser une zone inondée à pied ou en voiture.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle une inondation ?',
+      a: 'Les inondations d’origine naturelle sont couvertes par la garantie catastrophe naturelle (arrêté ministériel nécessaire). Les inondations accidentelles (rupture de canalisation) sont couvertes par la garantie dégât des eaux. Déclarez le sinistre sous 5 jours (10 jours pour Cat Nat).',
+    },
+    {
+      q: 'Combien coûte le pompage après une inondation ?',
+      a: 'Le pompage d’urgence coûte 200 à 1 000 € selon le volume d’eau et la surface. Les entreprises spécialisées en sinistres proposent le pompage, le séchage industriel et la remise en état. Les coûts sont généralement pris en charge par l’assurance.',
+    },
+    {
+      q: 'Combien de temps pour sécher un logement inondé ?',
+      a: 'Le séchage naturel prend 4 à 12 semaines selon l’ampleur. Avec des déshumidificateurs industriels, comptez 2 à 4 semaines. Les travaux de remise en état (peinture, sols) ne doivent commencer qu’une fois le taux d’humidité revenu à la normale.',
+    },
+  ],
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'interphone-panne',
+  name: 'Interphone en panne',
+  description: 'Un interphone en panne empêche la communication avec les visiteurs et l’ouverture à distance de la porte d’entrée. Le problème peut provenir de la platine de rue, du combiné intérieur, du câblage ou de la gâche électrique.',
+  relatedServices: ['electricien'],
+  primaryService: 'electricien',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Pas de sonnerie lorsqu’on appuie sur le bouton d’appel', 'Communication audio hachée ou inaudible', 'La gâche électrique ne s’ouvre plus à distance',
+    'L’écran du vidéophone reste noir',
+  ],
+  immediateActions: ['Vérifiez l’alimentation électrique du système', 'Contrôlez les fusibles dédiés à l’interphonie', 'Vérifiez les connexions du combiné intérieur'],
+  preventiveTips: [
+    'Protégez la platine de rue des intempéries avec un auvent', 'Nettoyez les contacts électriques une fois par an',
+    'En copropriété, signalez les pannes au syndic pour intervention rapide',
+  ],
+  estimatedCost: { min: 80, max: 250 },
+  averageResponseTime: 'Sous 48 heures',
+  faq: [
+    {
+      q: 'Pourquoi mon interphone ne fonctionne plus ?',
+      a: 'Les causes fréquentes sont : câblage oxydé ou coupé, platine de rue endommagée (humidité), combiné intérieur défectueux, alimentation coupée ou gâche électrique usée. Un électricien peut tester chaque composant pour identifier la panne.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un interphone ?',
+      a: 'Le dépannage coûte 80 à 250 € selon la panne. Le remplacement d’un combiné coûte 50 à 150 € (fourniture + pose). Le remplacement complet d’un système d’interphonie coûte 500 à 2 000 € en copropriété.',
+    },
+    {
+      q: 'Qui paie la réparation de l’interphone en copropriété ?',
+      a: 'L’interphone est un équipement commun : les réparations sont à la charge de la copropriété (budget d’entretien courant). Si seul votre combiné est défectueux, c’est généralement à la charge du copropriétaire.',
+    },
+    {
+      q: 'Faut-il remplacer tout le système ou juste le combiné ?',
+      a: 'Si le système a plus de 20 ans, un remplacement complet par un modèle numérique peut être plus économique. Si le système est récent, le remplacement du composant défectueux (platine, combiné, gâche) suffit.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'moisissure',
+  name: 'Moisissure',
+  description: 'Les moisissures apparaissent dans les zones humides et mal ventilées du logement : salle de bain, cuisine, angles des murs, derrière les meubles. Au-delà du problème esthétique, elles représentent un risque pour la santé (allergies, asthme) et doivent être traitées à la source.',
+  relatedServices: ['peintre-en-batiment', 'plombier'],
+  primaryService: 'peintre-en-batiment',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Taches noires, vertes ou blanches sur les murs et plafonds', 'Odeur de moisi caractéristique et persistante', 'Joints de salle de bain noircis',
+    'Peinture qui se dégrade dans les zones humides', 'Allergies ou symptômes respiratoires récurrents chez les occupants',
+  ],
+  immediateActions: [
+    'Nettoyez les moisissures visibles avec du vinaigre blanc pur (pas de Javel)', 'Aérez abondamment les pièces concernées',
+    'Portez un masque FFP2 et des gants lors du nettoyage', 'Éloignez les meubles des murs pour favoriser la circulation d’air',
+  ],
+  preventiveTips: [
+    'Maintenez un taux d’humidité intérieur entre 40 et 60 %', 'Utilisez la hotte aspirante pendant la cuisson', 'Aérez la salle de bain après chaque douche',
+    'Appliquez une peinture anti-moisissure dans les pièces humides',
+  ],
+  estimatedCost: { min: 150, max: 500 },
+  averageResponseTime: 'Sous 72 heures (rendez-vous)',
+  faq: [
+    {
+      q: 'Comment éliminer définitivement la moisissure ?',
+      a: 'Pour éliminer la moisissure durablement, il faut traiter la cause : améliorer la ventilation (VMC), réparer les infiltrations, isoler les ponts thermiques. Le nettoyage seul est temporaire. Un peintre professionnel peut traiter les murs et appliquer un revêtement anti-moisissure après assainissement.',
+    },
+    {
+      q: 'Le vinaigre blanc est-il efficace contre la moisissure ?',
+      a: 'Oui, le vinaigre blanc est efficace et préférable à l’eau de Javel. Il agit efficacement contre de nombreuses espèces de moisissures courantes et ne dégage pas de vapeurs toxiques. Vaporisez-le pur, laissez agir 1 heure puis essuyez. L’eau de Javel blanchit les moisissures sans les tuer en profondeur.',
+    },
+    {
+      q: 'La moisissure est-elle dangereuse pour la santé ?',
+      a: 'Oui, les spores de moisissure peuvent provoquer des allergies, de l’asthme, des rhinites et des infections pulmonaires. Les moisissures noires (Stachybotrys) sont les plus dangereuses. Consultez un médecin si vous présentez des symptômes respiratoires persistants.',
+    },
+    {
+      q: 'Mon propriétaire est-il responsable de la moisissure ?',
+      a: 'Si la moisissure est due à un défaut du logement (mauvaise ventilation, infiltration, isolation défaillante), le propriétaire est tenu de faire les réparations. Si elle résulte d’un défaut d’aération du locataire, la responsabilité peut être partagée.',
+    },
+  ],
+}
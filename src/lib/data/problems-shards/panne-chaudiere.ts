@@ -0,0 +1,48 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'panne-chaudiere',
+  name: 'Panne de chaudière',
+  description: 'Une panne de chaudière vous prive de chauffage et d’eau chaude. Les causes sont multiples : problème de pression, défaut d’allumage, circulateur en panne ou thermostat défectueux. Un chauffagiste qualifié doit intervenir rapidement, surtout en hiver.',
+  relatedServices: ['chauffagiste', 'plombier'],
+  primaryService: 'chauffagiste',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'La chaudière ne démarre plus ou s’arrête immédiatement', 'Le voyant d’erreur ou le code panne s’affiche sur l’écran',
+    'La pression du circuit est trop basse (inférieure à 1 bar)', 'La chaudière fait des bruits inhabituels (claquements, sifflements)', 'L’eau chaude n’arrive plus ou est tiède',
+    'Odeur de gaz ou de fumée anormale',
+  ],
+  immediateActions: [
+    'Vérifiez la pression sur le manomètre (idéalement entre 1 et 1,5 bar)', 'Contrôlez que le thermostat est correctement réglé et alimenté',
+    'Si vous sentez une odeur de gaz, aérez et quittez le logement immédiatement', 'Ne tentez pas de réparer vous-même une chaudière à gaz',
+    'Contactez un chauffagiste agréé pour un diagnostic',
+  ],
+  preventiveTips: [
+    'Faites réviser votre chaudière chaque année (entretien obligatoire)', 'Purgez vos radiateurs avant chaque saison de chauffe',
+    'Maintenez la pression du circuit entre 1 et 1,5 bar',
+  ],
+  estimatedCost: { min: 150, max: 600 },
+  averageResponseTime: 'Généralement sous 4 à 12h (selon disponibilité)',
+  seasonality: 'hiver',
+  faq: [
+    {
+      q: 'Pourquoi ma chaudière ne démarre plus ?',
+      a: 'Les causes les plus fréquentes sont : pression trop basse, thermostat défaillant, problème d’allumage (brûleur encrassé ou électrode défectueuse), ou panne du circulateur. Seul un chauffagiste agréé peut diagnostiquer et réparer en toute sécurité.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une chaudière ?',
+      a: 'Le coût dépend de la panne : de 150 € pour un remplacement de pièce courante à 600 € pour une intervention complexe (changement de vanne 3 voies, réparation de l’échangeur). Un contrat d’entretien annuel (120 à 250 €) inclut souvent le dépannage.',
+    },
+    {
+      q: 'L’entretien annuel est-il vraiment obligatoire ?',
+      a: 'Oui, l’entretien annuel est obligatoire pour les chaudières entre 4 et 400 kW (décret de 2009). Il garantit la sécurité, optimise le rendement et réduit la consommation d’énergie de 8 à 12 %. Sans attestation d’entretien, l’assureur peut refuser d’indemniser un sinistre.',
+    },
+    {
+      q: 'Dois-je remplacer ma chaudière ou la réparer ?',
+      a: 'Si votre chaudière a plus de 15 ans et que les réparations se multiplient, le remplacement est souvent plus économique. Une chaudière à condensation moderne consomme 20 à 30 % de moins et ouvre droit à MaPrimeRénov’.',
+    },
+  ],
+}
@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'panne-electrique',
+  name: 'Panne électrique',
+  description: 'Une panne électrique peut couper l’alimentation de tout ou partie de votre logement. Les causes vont du simple disjoncteur qui saute à un défaut d’isolement grave. Un électricien qualifié doit diagnostiquer l’origine de la panne pour intervenir en toute sécurité.',
+  relatedServices: ['electricien'],
+  primaryService: 'electricien',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Le disjoncteur général saute à répétition', 'Une ou plusieurs pièces sont privées d’électricité', 'Des étincelles ou des arcs électriques apparaissent aux prises',
+    'Une odeur de brûlé se dégage du tableau électrique', 'Les lumières vacillent ou clignotent sans raison',
+  ],
+  immediateActions: [
+    'Vérifiez le tableau électrique : identifiez le disjoncteur déclenché', 'Débranchez les appareils récents ou suspects avant de réarmer',
+    'N’utilisez jamais d’eau près d’une installation électrique défectueuse', 'En cas d’odeur de brûlé, coupez le disjoncteur général et aérez',
+    'Contactez un électricien si le disjoncteur saute à nouveau après réarmement',
+  ],
+  preventiveTips: [
+    'Faites vérifier votre installation électrique tous les 10 ans', 'Ne surchargez pas les multiprises (max 3 500 W par prise)',
+    'Installez des disjoncteurs différentiels 30 mA sur tous les circuits', 'Remplacez les prises et interrupteurs fissurés ou noircis',
+  ],
+  estimatedCost: { min: 100, max: 350 },
+  averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Pourquoi mon disjoncteur saute-t-il régulièrement ?',
+      a: 'Un disjoncteur qui saute régulièrement indique généralement : une surcharge du circuit (trop d’appareils branchés), un court-circuit dans l’installation, ou un défaut d’isolement (appareil ou câble défectueux). Un électricien peut identifier la cause précise avec un mégohmètre.',
+    },
+    {
+      q: 'Combien coûte un dépannage électrique ?',
+      a: 'Le dépannage électrique coûte entre 100 et 350 € selon la complexité : 100 à 150 € pour un diagnostic simple, 200 à 350 € pour une réparation avec remplacement de pièces. En urgence de nuit, comptez 50 à 100 % de majoration.',
+    },
+    {
+      q: 'Mon installation électrique est ancienne, est-ce dangereux ?',
+      a: 'Une installation de plus de 25 ans peut présenter des risques : fils dénudés, absence de mise à la terre, disjoncteurs obsolètes. Un diagnostic électrique (DPE, 100 à 200 €) permet d’évaluer les risques et de planifier une mise aux normes progressive.',
+    },
+    {
+      q: 'Faut-il une mise aux normes complète ?',
+      a: 'Pas forcément. La norme NF C 15-100 s’applique aux installations neuves. Pour les logements anciens, on applique les « 6 points de sécurité » : disjoncteur général, prise de terre, différentiel 30 mA, protection des fils, absence de matériel vétuste, liaison équipotentielle dans la salle de bain.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'porte-claquee',
+  name: 'Porte claquée',
+  description: 'Une porte claquée avec les clés restées à l’intérieur est l’une des urgences de serrurerie les plus fréquentes. Le serrurier peut ouvrir la porte sans dégât dans la majorité des cas grâce à des techniques non destructives.',
+  relatedServices: ['serrurier'],
+  primaryService: 'serrurier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Impossible d’ouvrir la porte : le pêne est engagé sans la clé', 'Les clés sont visibles à l’intérieur mais inaccessibles',
+    'La porte s’est refermée sous l’effet d’un courant d’air', 'Le verrou automatique s’est enclenché',
+  ],
+  immediateActions: [
+    'Vérifiez si une fenêtre est restée ouverte (au rez-de-chaussée uniquement)', 'Appelez un voisin de confiance qui aurait un double de vos clés',
+    'Ne tentez pas de forcer la porte avec une carte ou un tournevis', 'Contactez un serrurier professionnel pour une ouverture sans dégât',
+  ],
+  preventiveTips: [
+    'Confiez un double de clés à un voisin ou un proche de confiance', 'Installez une serrure à bouton intérieur qui empêche le claquage accidentel',
+    'Équipez votre porte d’un entrebâilleur ou d’un bloque-porte',
+  ],
+  estimatedCost: { min: 80, max: 200 },
+  averageResponseTime: 'Généralement sous 30 min à 1h en zone urbaine (selon disponibilité)',
+  faq: [
+    {
+      q: 'Combien coûte l’ouverture d’une porte claquée ?',
+      a: 'L’ouverture d’une porte claquée coûte entre 80 et 200 € en journée. La technique la plus courante est le by-pass (feuille de radio) qui ne nécessite aucun remplacement de pièce. La nuit, comptez une majoration de 50 à 100 %.',
+    },
+    {
+      q: 'Le serrurier va-t-il abimer ma porte ?',
+      a: 'Dans la grande majorité des cas, non. L’ouverture d’une porte claquée est une intervention simple qui ne nécessite aucun perçage ni remplacement. Méfiez-vous des serruriers qui affirment devoir changer le cylindre après une simple porte claquée.',
+    },
+    {
+      q: 'Combien de temps dure l’intervention ?',
+      a: 'L’ouverture d’une porte claquée prend généralement entre 5 et 15 minutes pour un serrurier expérimenté. Le délai total dépend surtout du temps de trajet du professionnel.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle l’ouverture de porte ?',
+      a: 'Certaines assurances habitation incluent une garantie « assistance clés » qui prend en charge l’ouverture de porte. Vérifiez votre contrat ou appelez votre assureur avant de contacter un serrurier pour connaître vos droits.',
+    },
+  ],
+}
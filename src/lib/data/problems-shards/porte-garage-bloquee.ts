@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'porte-garage-bloquee',
+  name: 'Porte de garage bloquée',
+  description: 'Une porte de garage bloquée, qu’elle soit sectionnelle, basculante ou enroulable, peut être causée par un problème de motorisation, de rails déformés, de ressorts cassés ou de cellules de sécurité défaillantes. Un spécialiste peut diagnostiquer et réparer la panne.',
+  relatedServices: ['serrurier', 'menuisier'],
+  primaryService: 'serrurier',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'La porte ne s’ouvre plus ou reste bloquée à mi-course', 'Le moteur tourne mais la porte ne bouge pas', 'La télécommande ne fonctionne plus',
+    'Bruits anormaux (grincements, claquements) lors de la manœuvre',
+  ],
+  immediateActions: [
+    'Vérifiez l’alimentation électrique du moteur et les piles de la télécommande', 'Utilisez le déverrouillage manuel (cordon rouge) pour ouvrir en attendant',
+    'Vérifiez que rien n’obstrue les cellules de sécurité (photocellules)', 'Contactez un spécialiste si le problème vient du moteur ou des ressorts',
+  ],
+  preventiveTips: [
+    'Lubrifiez les rails et les charnières deux fois par an', 'Faites vérifier les ressorts de compensation annuellement (pièces sous tension)',
+    'Nettoyez les cellules photocellulaires régulièrement',
+  ],
+  estimatedCost: { min: 100, max: 350 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Pourquoi ma porte de garage ne s’ouvre plus ?',
+      a: 'Les causes les plus fréquentes sont : télécommande hors service (piles), cellules de sécurité encrassées, ressort de compensation cassé, moteur défaillant ou rails déformés. Utilisez le déverrouillage manuel en attendant le réparateur.',
+    },
+    {
+      q: 'Combien coûte la réparation d’une porte de garage ?',
+      a: 'Le diagnostic + réparation coûte 100 à 350 € : 100 à 150 € pour un problème de télécommande ou de cellules, 200 à 350 € pour un remplacement de moteur ou de ressorts. Le remplacement complet d’une porte coûte 800 à 3 000 €.',
+    },
+    {
+      q: 'Peut-on réparer un ressort de porte de garage soi-même ?',
+      a: 'Non, les ressorts de porte de garage sont des pièces sous forte tension qui présentent un risque de blessure grave. Seul un professionnel équipé et expérimenté doit intervenir sur les ressorts.',
+    },
+    {
+      q: 'Faut-il changer la porte entière ou juste le moteur ?',
+      a: 'Si la porte est en bon état (pas de rouille, pas de déformation), il suffit de remplacer le moteur (300 à 800 €). Si la porte est vétuste ou endommagée, le remplacement complet est plus économique à long terme.',
+    },
+  ],
+}
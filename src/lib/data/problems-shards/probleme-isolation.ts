@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'probleme-isolation',
+  name: 'Problème d’isolation',
+  description: 'Une isolation défaillante se traduit par des déperditions thermiques, un inconfort permanent et des factures de chauffage élevées. L’isolation des combles, des murs et des fenêtres est la priorité pour améliorer la performance énergétique de votre logement.',
+  relatedServices: ['isolation-thermique', 'menuisier'],
+  primaryService: 'isolation-thermique',
+  urgencyLevel: 'basse',
+  symptoms: [
+    'Sensation de parois froides au toucher en hiver', 'Facture de chauffage anormalement élevée', 'Température différente d’une pièce à l’autre malgré le chauffage',
+    'Condensation abondante sur les fenêtres', 'Courants d’air autour des fenêtres et des portes', 'Mauvais classement DPE (F ou G)',
+  ],
+  immediateActions: [
+    'Réalisez un audit énergétique pour identifier les déperditions', 'Calfeutrez les portes et fenêtres avec des joints isolants adhésifs',
+    'Posez des rideaux épais devant les fenêtres pour limiter le froid',
+  ],
+  preventiveTips: [
+    'Isolez les combles en priorité (30 % des déperditions thermiques)', 'Remplacez les fenêtres simple vitrage par du double vitrage',
+    'Profitez de MaPrimeRénov’ et des CEE pour financer vos travaux', 'Faites réaliser un DPE (Diagnostic de Performance Énergétique) pour planifier les travaux',
+  ],
+  estimatedCost: { min: 1000, max: 5000 },
+  averageResponseTime: 'Sous 1 semaine (rendez-vous)',
+  faq: [
+    {
+      q: 'Par où commencer l’isolation de ma maison ?',
+      a: 'Commencez par les combles (30 % des déperditions), puis les murs (25 %), les fenêtres (15 %) et le plancher bas (10 %). Un audit énergétique (300 à 800 €) vous indiquera les priorités spécifiques à votre logement.',
+    },
+    {
+      q: 'Combien coûte l’isolation des combles ?',
+      a: 'L’isolation des combles perdus coûte 20 à 50 €/m², soit 1 000 à 3 000 € pour une maison de 100 m². L’isolation des combles aménagés coûte 40 à 80 €/m². Les aides (MaPrimeRénov’, CEE) peuvent couvrir 50 à 90 % du coût selon vos revenus.',
+    },
+    {
+      q: 'Quelles aides pour les travaux d’isolation ?',
+      a: 'MaPrimeRénov’ : jusqu’à 75 €/m² pour les combles. CEE (Certificats d’Économies d’Énergie) : 10 à 20 €/m² en prime. Éco-prêt à taux zéro : jusqu’à 50 000 € à 0 % d’intérêt. TVA réduite à 5,5 % sur les travaux. L’artisan doit être certifié RGE.',
+    },
+    {
+      q: 'L’isolation par l’extérieur est-elle meilleure ?',
+      a: 'L’ITE (Isolation Thermique par l’Extérieur) supprime les ponts thermiques et préserve la surface habitable. Elle coûte 100 à 200 €/m² (contre 40 à 80 €/m² pour l’intérieur) mais offre une meilleure performance. Elle est idéale lors d’un ravalement de façade.',
+    },
+    {
+      q: 'Quand remplacer les fenêtres ?',
+      a: 'Remplacez vos fenêtres si elles sont en simple vitrage, si vous sentez des courants d’air malgré la fermeture, ou si la condensation est permanente. Le double vitrage moderne (Uw ≤ 1,3) réduit les pertes thermiques de 40 à 60 %. Coût : 300 à 1 000 € par fenêtre posée.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'radiateur-froid',
+  name: 'Radiateur froid',
+  description: 'Un radiateur qui reste froid alors que le chauffage fonctionne peut indiquer une poche d’air dans le circuit, un problème de circulateur ou un déséquilibre hydraulique. La purge suffit souvent à résoudre le problème, sinon un chauffagiste doit intervenir.',
+  relatedServices: ['chauffagiste'],
+  primaryService: 'chauffagiste',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'Le radiateur est froid en haut et chaud en bas (air emprisonné)', 'Le radiateur est complètement froid alors que les autres fonctionnent',
+    'Bruits de gargouillis dans le radiateur', 'Le thermostat du radiateur ne répond plus',
+  ],
+  immediateActions: [
+    'Purgez le radiateur en ouvrant la vis de purge jusqu’à ce que l’eau coule', 'Vérifiez que la vanne thermostatique n’est pas bloquée en position fermée',
+    'Contrôlez la pression du circuit au manomètre de la chaudière', 'Si la purge ne suffit pas, contactez un chauffagiste',
+  ],
+  preventiveTips: [
+    'Purgez tous vos radiateurs chaque année avant la saison de chauffe', 'Faites réaliser un désembouage du circuit tous les 5 à 10 ans',
+    'Ne couvrez pas les radiateurs avec des meubles ou des rideaux épais',
+  ],
+  estimatedCost: { min: 100, max: 300 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Comment purger un radiateur ?',
+      a: 'Mettez le chauffage en marche, placez un récipient sous la vis de purge (petit carré en haut du radiateur), ouvrez-la d’un quart de tour avec une clé de purge. Laissez l’air s’échapper jusqu’à ce que l’eau coule régulièrement, puis refermez. Vérifiez la pression au manomètre.',
+    },
+    {
+      q: 'Pourquoi un seul radiateur est-il froid ?',
+      a: 'Si un seul radiateur est froid, vérifiez d’abord la vanne thermostatique (elle peut être bloquée). Purgez-le. Si cela ne suffit pas, le problème peut être un déséquilibre hydraulique ou un embouage du radiateur qui nécessite un désembouage professionnel.',
+    },
+    {
+      q: 'Qu’est-ce que le désembouage ?',
+      a: 'Le désembouage consiste à nettoyer le circuit de chauffage pour éliminer les boues (oxydes métalliques) qui obstruent les radiateurs et réduisent leur efficacité. Coût : 400 à 800 € pour une maison. Il améliore le rendement de 20 à 30 %.',
+    },
+    {
+      q: 'Combien coûte l’intervention d’un chauffagiste pour un radiateur froid ?',
+      a: 'Le déplacement + diagnostic coûte 80 à 120 €. Si le problème se règle par une purge, pas de supplément. Le remplacement d’une tête thermostatique coûte 50 à 100 €. Un désembouage revient à 400 à 800 €.',
+    },
+  ],
+}
@@ -0,0 +1,42 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'robinet-qui-fuit',
+  name: 'Robinet qui fuit',
+  description: 'Un robinet qui goutte en permanence gaspille jusqu’à 120 litres d’eau par jour et augmente votre facture d’eau. La cause est généralement un joint usé, une cartouche défectueuse ou un siège de robinet abîmé. La réparation est souvent simple et peu coûteuse.',
+  relatedServices: ['plombier'],
+  primaryService: 'plombier',
+  urgencyLevel: 'moyenne',
+  symptoms: ['Goutte à goutte persistant lorsque le robinet est fermé', 'Fuite au niveau de la base du robinet', 'Difficulté à fermer complètement le robinet', 'Bruit de gouttes la nuit'],
+  immediateActions: [
+    'Fermez le robinet d’arrêt sous l’évier ou le lavabo concerné', 'Placez un récipient sous le robinet pour éviter le gaspillage',
+    'Si vous êtes bricoleur, tentez de remplacer le joint vous-même',
+  ],
+  preventiveTips: [
+    'Ne serrez pas excessivement vos robinets : cela use les joints prématurément', 'Remplacez les robinets mélangeurs anciens par des mitigeurs plus fiables',
+    'Détartrez régulièrement les mousseurs (embouts) des robinets',
+  ],
+  estimatedCost: { min: 60, max: 200 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Comment réparer un robinet qui goutte ?',
+      a: 'Pour un robinet mélangeur : coupez l’eau, démontez la tête du robinet, remplacez le joint clapet (2 à 5 €). Pour un mitigeur : remplacez la cartouche céramique (15 à 40 €). Si le siège est abîmé, il faudra le rectifier ou remplacer le robinet entier.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un robinet ?',
+      a: 'Un plombier facture 60 à 120 € pour un changement de joint ou de cartouche (déplacement + main-d’œuvre + pièce). Le remplacement complet d’un robinet mitigeur coûte 80 à 200 € (fourniture + pose).',
+    },
+    {
+      q: 'Un robinet qui fuit consomme-t-il beaucoup d’eau ?',
+      a: 'Oui, un robinet qui goutte à raison d’une goutte par seconde gaspille environ 3 à 5 litres par jour, soit 1 100 à 1 800 litres par an. Cela représente 5 à 8 € sur la facture d’eau annuelle. Réparer une fuite est donc rapidement rentable.',
+    },
+    {
+      q: 'Puis-je remplacer un robinet moi-même ?',
+      a: 'Oui, si vous avez quelques notions de bricolage. Coupez l’eau, démontez l’ancien robinet (clé plate ou clé à molette), nettoyez le support, posez le nouveau avec les flexibles fournis. Comptez 30 minutes à 1 heure pour un remplacement standard.',
+    },
+  ],
+}
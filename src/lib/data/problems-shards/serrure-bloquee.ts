@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'serrure-bloquee',
+  name: 'Serrure bloquée',
+  description: 'Une serrure bloquée empêche l’ouverture ou la fermeture de votre porte. Cela peut être dû à un mécanisme grippé, une clé cassée dans le barillet ou une déformation du cylindre. Un serrurier professionnel peut intervenir sans endommager la porte.',
+  relatedServices: ['serrurier'],
+  primaryService: 'serrurier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'La clé tourne dans le vide sans actionner le mécanisme', 'La clé ne rentre plus ou reste coincée dans la serrure', 'Le cylindre tourne librement sans ouvrir la porte',
+    'La serrure grince ou résiste lors de la rotation',
+  ],
+  immediateActions: [
+    'Ne forcez pas sur la clé au risque de la casser dans le barillet', 'Essayez de lubrifier la serrure avec du graphite en poudre ou un spray dégripant',
+    'Vérifiez que la porte n’est pas déformée (gonflement du bois par humidité)', 'Contactez un serrurier plutôt que de tenter de forcer la porte',
+  ],
+  preventiveTips: [
+    'Lubrifiez votre serrure au graphite tous les 6 mois', 'N’utilisez jamais de WD-40 ou d’huile qui attirent la poussière',
+    'Évitez de claquer la porte : cela use prématurément le mécanisme', 'Faites dupliquer vos clés chez un serrurier plutôt qu’en grande surface',
+  ],
+  estimatedCost: { min: 80, max: 250 },
+  averageResponseTime: 'Généralement sous 30 min à 1h en zone urbaine (selon disponibilité)',
+  faq: [
+    {
+      q: 'Combien coûte l’ouverture d’une porte avec serrure bloquée ?',
+      a: 'L’ouverture par un serrurier coûte entre 80 et 250 € selon la technique utilisée (crochetage, by-pass, perçage du cylindre). Le crochetage non destructif est le moins cher. De nuit ou le week-end, comptez une majoration de 50 à 100 %.',
+    },
+    {
+      q: 'Le serrurier peut-il ouvrir sans casser la serrure ?',
+      a: 'Un bon serrurier privilégie toujours l’ouverture non destructive (crochetage, impression). Il ne perce le cylindre qu’en dernier recours. Méfiez-vous des serruriers qui proposent d’emblée de changer la porte ou le blindage.',
+    },
+    {
+      q: 'Comment éviter les arnaques de serruriers ?',
+      a: 'Demandez un devis précis par téléphone avant déplacement. Vérifiez le numéro SIRET et les avis en ligne. Refusez tout supplément non annoncé et exigez une facture détaillée. Ne payez jamais en liquide sans facture.',
+    },
+    {
+      q: 'Ma clé est cassée dans la serrure, que faire ?',
+      a: 'Ne tentez pas de retirer le morceau de clé avec une pince : vous risquez de l’enfoncer davantage. Un serrurier dispose d’un extracteur spécial pour retirer le bout de clé sans abimer le cylindre. Coût moyen : 80 à 150 €.',
+    },
+  ],
+}
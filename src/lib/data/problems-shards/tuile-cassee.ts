@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'tuile-cassee',
+  name: 'Tuile cassée',
+  description: 'Une tuile cassée ou déplacée laisse le toit vulnérable aux infiltrations d’eau et au vent. Les causes sont variées : tempête, gel, vieillissement ou impact. Un couvreur peut remplacer les tuiles endommagées et vérifier l’état général de la couverture.',
+  relatedServices: ['couvreur'],
+  primaryService: 'couvreur',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Tuiles visiblement fêlées, cassées ou manquantes vues depuis le sol', 'Débris de tuiles au pied de la maison après un épisode venteux',
+    'Traces d’humidité au plafond du dernier étage', 'Tuiles déplacées créant des jours visibles',
+  ],
+  immediateActions: [
+    'Ne montez pas sur le toit vous-même (risque de chute grave)', 'Observez les dégâts depuis le sol ou avec des jumelles', 'Prenez des photos pour votre assurance',
+    'Contactez un couvreur pour une inspection et un remplacement',
+  ],
+  preventiveTips: [
+    'Faites inspecter votre toiture chaque année par un couvreur', 'Élaguez les branches d’arbres surplombant le toit',
+    'Remplacez les tuiles fragilisées préventivement lors de l’inspection annuelle',
+  ],
+  estimatedCost: { min: 150, max: 500 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Combien coûte le remplacement de tuiles cassées ?',
+      a: 'Le remplacement de quelques tuiles coûte 150 à 500 € selon le nombre, le type de tuile et l’accessibilité du toit. Le prix comprend le déplacement, la main-d’œuvre et les tuiles de remplacement. Les tuiles en terre cuite coûtent 1 à 3 € pièce, les ardoises 5 à 15 € pièce.',
+    },
+    {
+      q: 'L’assurance couvre-t-elle les tuiles cassées par une tempête ?',
+      a: 'Oui, la garantie tempête de votre assurance habitation couvre les dégâts causés par des vents supérieurs à 100 km/h ou anormalement violents. Déclarez le sinistre sous 5 jours avec photos et devis du couvreur.',
+    },
+    {
+      q: 'Peut-on remplacer des tuiles sans refaire toute la toiture ?',
+      a: 'Oui, un couvreur peut remplacer des tuiles individuellement si la charpente et le reste de la couverture sont en bon état. Si plus de 30 % des tuiles sont endommagées, une réfection complète est généralement plus économique à long terme.',
+    },
+    {
+      q: 'Comment trouver des tuiles identiques aux miennes ?',
+      a: 'Un couvreur expérimenté sait identifier le modèle de tuile. Pour les maisons anciennes, il existe des négociants spécialisés en tuiles de récupération. Les fabricants proposent aussi des tuiles « vieillies » pour s’harmoniser avec les toitures existantes.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'vitre-cassee',
+  name: 'Vitre cassée',
+  description: 'Une vitre cassée expose votre logement aux intempéries, au froid et aux intrusions. Qu’il s’agisse d’un simple vitrage, d’un double vitrage ou d’une baie vitrée, un vitrier peut intervenir en urgence pour sécuriser l’ouverture et remplacer le vitrage.',
+  relatedServices: ['vitrier', 'menuisier'],
+  primaryService: 'vitrier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'Vitre fêlée, fissurée ou entièrement brisée', 'Morceaux de verre au sol à l’intérieur ou l’extérieur', 'Courant d’air froid provenant d’une fenêtre',
+    'Buée permanente entre les deux vitres (perte d’étanchéité du double vitrage)',
+  ],
+  immediateActions: [
+    'Sécurisez la zone : ramassez les morceaux de verre avec des gants épais', 'Protégez l’ouverture avec du carton rigide ou une bâche en attendant le vitrier',
+    'Empêchez les enfants et animaux d’accéder à la zone', 'Prenez des photos pour votre assurance en cas d’effraction ou de tempête',
+  ],
+  preventiveTips: [
+    'Installez un film de sécurité anti-effraction sur vos vitrages', 'Optez pour du verre trempé ou feuilleté pour les zones exposées',
+    'Entretenez les joints de vos fenêtres pour éviter les vibrations',
+  ],
+  estimatedCost: { min: 100, max: 350 },
+  averageResponseTime: 'Généralement sous 2 à 6h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Combien coûte le remplacement d’une vitre ?',
+      a: 'Le remplacement d’un simple vitrage coûte 100 à 200 € (fourniture + pose). Un double vitrage standard revient à 200 à 350 €. Une baie vitrée peut atteindre 500 à 1 500 € selon les dimensions et le type de vitrage.',
+    },
+    {
+      q: 'Le double vitrage cassé peut-il être réparé ?',
+      a: 'Un double vitrage cassé ne se répare pas : il faut remplacer l’ensemble du vitrage isolant (les deux vitres + l’intercalaire). Cependant, si seule une vitre est fêlée et que le joint périphérique est intact, le vitrier peut ne remplacer que la vitre abimée dans certains cas.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle une vitre cassée ?',
+      a: 'Oui, la garantie bris de glace de votre assurance habitation couvre le remplacement des vitrages. En cas d’effraction, c’est la garantie vol qui s’applique. En cas de tempête, c’est la garantie tempête. Déclarez le sinistre sous 5 jours.',
+    },
+    {
+      q: 'Quel type de vitrage choisir en remplacement ?',
+      a: 'Pour l’isolation thermique, optez pour un double vitrage 4/16/4 avec argon. Pour la sécurité, choisissez un vitrage feuilleté 44.2. Pour l’isolation acoustique, un vitrage asymétrique 10/12/4 est recommandé. Le vitrier vous conseillera selon vos besoins.',
+    },
+  ],
+}
@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'volet-bloque',
+  name: 'Volet bloqué',
+  description: 'Un volet roulant ou battant bloqué peut être causé par un mécanisme défaillant, des lames désaxées, un moteur en panne ou des gonds usés. Un menuisier ou un spécialiste des volets peut diagnostiquer et réparer le problème sans nécessairement remplacer le volet entier.',
+  relatedServices: ['menuisier', 'electricien'],
+  primaryService: 'menuisier',
+  urgencyLevel: 'moyenne',
+  symptoms: [
+    'Le volet roulant ne monte plus ou reste bloqué à mi-course', 'Le volet battant ne s’ouvre ou ne se ferme plus correctement',
+    'Bruit de grincement ou de frottement lors de la manœuvre', 'La sangle du volet est cassée ou décrochée',
+  ],
+  immediateActions: [
+    'Ne forcez pas le mécanisme au risque d’aggraver la panne', 'Pour un volet électrique, vérifiez l’alimentation et les fusibles',
+    'Pour un volet à sangle, vérifiez si la sangle est cassée ou emmêlée', 'Contactez un menuisier spécialiste des volets pour un diagnostic',
+  ],
+  preventiveTips: [
+    'Lubrifiez les rails et le mécanisme une fois par an avec un spray silicone', 'Nettoyez les coulisses des volets roulants pour éviter les blocages',
+    'Faites réviser les moteurs de volets électriques tous les 3 ans',
+  ],
+  estimatedCost: { min: 80, max: 250 },
+  averageResponseTime: 'Sous 24 heures',
+  faq: [
+    {
+      q: 'Pourquoi mon volet roulant est-il bloqué ?',
+      a: 'Les causes les plus fréquentes sont : des lames désaxées ou tordues, un moteur électrique en panne, une sangle cassée, un condensateur défectueux ou des coulisses encrassées. Un professionnel peut débloquer le volet et identifier la cause pour éviter la récidive.',
+    },
+    {
+      q: 'Faut-il remplacer le volet entier ou le réparer ?',
+      a: 'Dans la majorité des cas, la réparation suffit : remplacement d’une sangle (20 à 50 €), changement du moteur (150 à 400 €), redressage de lames. Le remplacement complet n’est nécessaire que si le tablier est très endommagé ou le coffre obsolète.',
+    },
+    {
+      q: 'Combien coûte la réparation d’un volet roulant ?',
+      a: 'La réparation coûte entre 80 et 250 € selon la panne : 80 à 120 € pour un changement de sangle, 150 à 250 € pour un remplacement de moteur. Un remplacement complet coûte 300 à 800 € (hors motorisation).',
+    },
+    {
+      q: 'Peut-on motoriser un volet roulant à sangle ?',
+      a: 'Oui, la motorisation d’un volet roulant existant coûte entre 200 et 500 € (moteur + pose). Le moteur se place dans le coffre du volet. Il est également possible d’ajouter une commande radio ou une programmation horaire.',
+    },
+  ],
+}
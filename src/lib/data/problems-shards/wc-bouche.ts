@@ -0,0 +1,45 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/problems.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { Problem } from '../problems'
+
+export const entry: Problem = {
+  slug: 'wc-bouche',
+  name: 'WC bouché',
+  description: 'Des toilettes bouchées sont une urgence sanitaire courante. Le bouchon peut être causé par un excès de papier, un objet tombé dans la cuvette ou un problème dans la canalisation d’évacuation. Un plombier intervient avec les outils adaptés pour résoudre le problème rapidement.',
+  relatedServices: ['plombier'],
+  primaryService: 'plombier',
+  urgencyLevel: 'haute',
+  symptoms: [
+    'L’eau monte dans la cuvette après la chasse sans redescendre', 'L’évacuation est très lente', 'Des gargouillis se font entendre lors de l’évacuation',
+    'Mauvaises odeurs provenant des WC',
+  ],
+  immediateActions: [
+    'Ne tirez plus la chasse d’eau pour éviter le débordement', 'Essayez avec une ventouse spéciale WC (à bords renforcés)',
+    'Versez un seau d’eau chaude (pas bouillante) dans la cuvette', 'Contactez un plombier si le problème persiste',
+  ],
+  preventiveTips: [
+    'Ne jetez jamais de lingettes, serviettes hygiéniques ou coton dans les WC', 'Utilisez une quantité raisonnable de papier toilette',
+    'Évitez les blocs WC qui peuvent se décrocher et bloquer la canalisation',
+  ],
+  estimatedCost: { min: 80, max: 250 },
+  averageResponseTime: 'Généralement sous 1 à 4h (selon disponibilité)',
+  faq: [
+    {
+      q: 'Comment déboucher des WC sans plombier ?',
+      a: 'Utilisez une ventouse spéciale WC (à bords renforcés) en effectuant des mouvements de pompage vigoureux. Si cela ne fonctionne pas, essayez un furet manuel. Évitez les produits chimiques agressifs qui peuvent endommager les canalisations en PVC.',
+    },
+    {
+      q: 'Combien coûte le débouchage de WC par un plombier ?',
+      a: 'Le débouchage de WC coûte entre 80 et 250 € selon la difficulté. Un débouchage à la ventouse ou au furet coûte 80 à 150 €. Si le bouchon est profond dans la canalisation, un hydrocurage peut être nécessaire (200 à 400 €).',
+    },
+    {
+      q: 'Pourquoi mes WC se bouchent-ils régulièrement ?',
+      a: 'Des WC qui se bouchent fréquemment peuvent indiquer : un problème de pente sur la canalisation d’évacuation, un rétrécissement du tuyau (calcaire, racines), ou une fosse septique pleine. Un diagnostic par caméra permet d’identifier la cause et de planifier une solution durable.',
+    },
+    {
+      q: 'L’eau de Javel peut-elle déboucher les WC ?',
+      a: 'Non, l’eau de Javel désinfecte mais ne dissout pas les bouchons. Le mélange eau chaude + liquide vaisselle peut aider pour les bouchons légers (graisse). Pour les bouchons solides, seule une action mécanique (ventouse, furet) est efficace.',
+    },
+  ],
+}
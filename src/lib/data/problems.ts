@@ -1,8 +1,13 @@
 /**
  * Données des problèmes courants pour les pages /problemes/
  * 30 problèmes avec métadonnées complètes pour le diagnostic SEO.
+ *
+ * Après modification, lancer `python3 -m scripts.pipeline content` pour
+ * régénérer problems-index.ts et les shards de problems-shards/.
  */
 
+import { PROBLEM_INDEX, PROBLEMS_BY_SERVICE } from './problems-index'
+
 export interface Problem {
   slug: string
   name: string
@@ -1056,7 +1061,7 @@ const problems: Problem[] = [
 // ---------------------------------------------------------------------------
 
 export function getProblemBySlug(slug: string): Problem | undefined {
-  return problems.find((p) => p.slug === slug)
+  return Object.prototype.hasOwnProperty.call(PROBLEM_INDEX, slug) ? problems[PROBLEM_INDEX[slug]] : undefined
 }
 
 export function getProblemSlugs(): string[] {
@@ -1064,9 +1069,8 @@ export function getProblemSlugs(): string[] {
 }
 
 export function getProblemsByService(serviceSlug: string): Problem[] {
-  return problems.filter(
-    (p) => p.primaryService === serviceSlug || p.relatedServices.includes(serviceSlug)
-  )
+  const positions = Object.prototype.hasOwnProperty.call(PROBLEMS_BY_SERVICE, serviceSlug) ? PROBLEMS_BY_SERVICE[serviceSlug] : []
+  return positions.map((i) => problems[i])
 }
 
 export default problems
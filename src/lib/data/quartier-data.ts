@@ -1,13 +1,15 @@
 /**
  * Enriched quartier-level data for ALL quartiers in france.ts.
  *
- * Computed deterministically at module load time from the villes array.
+ * Computed deterministically from the ville passed in, one quartier at a time
+ * on first lookup: quartier-index.ts maps slugs to positions in `ville.quartiers`.
  * Uses hashCode for reproducible pseudo-random variation.
  *
  * ~8 200 entries covering every ville/quartier combination.
  */
 
-import { villes, type Ville } from './france'
+import type { Ville } from './france'
+import { QUARTIER_COUNT, QUARTIER_INDEX } from './quartier-index'
 import { QUARTIER_PRIX_REEL } from './quartier-real-data'
 
 // ---------------------------------------------------------------------------
@@ -66,20 +68,6 @@ function hashCode(s: string): number {
   return Math.abs(hash)
 }
 
-// ---------------------------------------------------------------------------
-// Slug helper (inline to avoid circular dependency with utils.ts)
-// ---------------------------------------------------------------------------
-
-function toSlug(text: string): string {
-  return text
-    .toLowerCase()
-    .normalize('NFD')
-    .replace(/[\u0300-\u036f]/g, '')
-    .trim()
-    .replace(/[^a-z0-9]+/g, '-')
-    .replace(/^-|-$/g, '')
-}
-
 // ---------------------------------------------------------------------------
 // Parse population string e.g. '156 000' => 156000
 // ---------------------------------------------------------------------------
@@ -749,10 +737,10 @@ function computeProfile(
   ville: Ville,
   quartierName: string,
   quartierIndex: number,
+  slug: string,
 ): QuartierProfile {
   const population = parsePop(ville.population)
   const quartierCount = ville.quartiers.length
-  const slug = toSlug(quartierName)
   const h = hashCode(`${ville.slug}-${quartierName}`)
   const h2 = hashCode(`${quartierName}-${ville.slug}`)
 
@@ -796,43 +784,44 @@ function computeProfile(
 }
 
 // ---------------------------------------------------------------------------
-// Generate all profiles
+// Exported lookups
 // ---------------------------------------------------------------------------
 
-function generateAllProfiles(): Record<string, QuartierProfile> {
-  const profiles: Record<string, QuartierProfile> = {}
-  for (const ville of villes) {
-    for (let i = 0; i < ville.quartiers.length; i++) {
-      const quartierName = ville.quartiers[i]
-      const slug = toSlug(quartierName)
-      const key = `${ville.slug}/${slug}`
-      profiles[key] = computeProfile(ville, quartierName, i)
-    }
-  }
-  return profiles
-}
+// Profiles computed so far, keyed by `${villeSlug}/${quartierSlug}`
+const profiles = new Map<string, QuartierProfile>()
 
-// ---------------------------------------------------------------------------
-// Exported data and lookup
-// ---------------------------------------------------------------------------
+function positionsOf(villeSlug: string): Record<string, number> | undefined {
+  return Object.prototype.hasOwnProperty.call(QUARTIER_INDEX, villeSlug) ? QUARTIER_INDEX[villeSlug] : undefined
+}
 
-/** All quartier profiles, keyed by `${villeSlug}/${quartierSlug}` */
-export const QUARTIER_PROFILES: Record<string, QuartierProfile> = generateAllProfiles()
+function profileAt(ville: Ville, quartierSlug: string, i: number): QuartierProfile {
+  const key = `${ville.slug}/${quartierSlug}`
+  let profile = profiles.get(key)
+  if (!profile) {
+    profile = computeProfile(ville, ville.quartiers[i], i, quartierSlug)
+    profiles.set(key, profile)
+  }
+  return profile
+}
 
-/** Look up a single quartier profile by ville and quartier slugs */
-export function getQuartierData(villeSlug: string, quartierSlug: string): QuartierProfile | null {
-  return QUARTIER_PROFILES[`${villeSlug}/${quartierSlug}`] || null
+/**
+ * Look up a single quartier profile of a ville by quartier slug (computed on first use).
+ * Takes the ville itself (france.ts or loadVille()) so this module never imports `villes`.
+ */
+export function getQuartierData(ville: Ville, quartierSlug: string): QuartierProfile | null {
+  const positions = positionsOf(ville.slug)
+  if (!positions || !Object.prototype.hasOwnProperty.call(positions, quartierSlug)) return null
+  return profileAt(ville, quartierSlug, positions[quartierSlug])
 }
 
 /** Get all quartier profiles for a given ville */
-export function getQuartierProfilesByVille(villeSlug: string): QuartierProfile[] {
-  const prefix = `${villeSlug}/`
-  return Object.entries(QUARTIER_PROFILES)
-    .filter(([key]) => key.startsWith(prefix))
-    .map(([, profile]) => profile)
+export function getQuartierProfilesByVille(ville: Ville): QuartierProfile[] {
+  const positions = positionsOf(ville.slug)
+  if (!positions) return []
+  return Object.entries(positions).map(([slug, i]) => profileAt(ville, slug, i))
 }
 
 /** Get total number of quartier profiles */
 export function getQuartierCount(): number {
-  return Object.keys(QUARTIER_PROFILES).length
+  return QUARTIER_COUNT
 }
@@ -0,0 +1,4619 @@
+// Generated by `python3 -m scripts.pipeline quartiers` from src/lib/data/france.ts.
+// Do not edit by hand: re-run the command instead.
+
+/** Number of quartiers over all villes */
+export const QUARTIER_COUNT: number = 8189
+
+/** Ville slug -> slug of each quartier, in `ville.quartiers` order */
+export const QUARTIER_SLUGS: Record<string, string[]> = {
+  paris: [
+    '1er-arr', '2e-arr', '3e-arr', '4e-arr', '5e-arr', '6e-arr', '7e-arr', '8e-arr', '9e-arr', '10e-arr', '11e-arr', '12e-arr', '13e-arr', '14e-arr', '15e-arr', '16e-arr',
+    '17e-arr', '18e-arr', '19e-arr', '20e-arr',
+  ],
+  marseille: ['vieux-port', 'le-panier', 'la-joliette', 'castellane', 'la-canebiere', 'prado', 'bonneveine', 'les-calanques'],
+  lyon: ['presqu-ile', 'vieux-lyon', 'part-dieu', 'confluence', 'croix-rousse', 'gerland', 'villeurbanne'],
+  toulouse: ['capitole', 'saint-cyprien', 'carmes', 'les-minimes', 'saint-michel', 'rangueil', 'blagnac'],
+  nice: ['vieux-nice', 'promenade-des-anglais', 'cimiez', 'port', 'liberation', 'saint-roch'],
+  nantes: ['centre-ville', 'ile-de-nantes', 'doulon', 'erdre', 'chantenay'],
+  montpellier: ['ecusson', 'antigone', 'port-marianne', 'hopitaux-facultes', 'mosson'],
+  strasbourg: ['grande-ile', 'petite-france', 'krutenau', 'neudorf', 'robertsau'],
+  bordeaux: ['centre-historique', 'chartrons', 'saint-michel', 'bastide', 'bacalan'],
+  lille: ['vieux-lille', 'centre', 'wazemmes', 'fives', 'moulins'],
+  rennes: ['centre', 'thabor', 'sainte-therese', 'villejean', 'maurepas'],
+  toulon: ['vieille-ville', 'mourillon', 'saint-jean-du-var', 'le-revest'],
+  reims: ['centre-ville', 'clairmarais', 'croix-rouge', 'jean-jaures', 'tinqueux', 'cormontreuil', 'wilson'],
+  'saint-etienne': ['centre-ville', 'chateaucreux', 'bellevue', 'terrenoire', 'montreynaud', 'la-metare'],
+  'le-havre': ['centre-reconstruit', 'sainte-adresse', 'sanvic', 'graville', 'danton'],
+  villeurbanne: ['gratte-ciel', 'tonkin', 'cusset', 'grandclement', 'charpennes'],
+  dijon: ['centre-historique', 'toison-d-or', 'fontaine-d-ouche', 'gresilles'],
+  angers: ['centre-ville', 'doutre', 'belle-beille', 'monplaisir', 'roseraie'],
+  grenoble: ['centre-ville', 'europole', 'ile-verte', 'village-olympique', 'championnet', 'bajatiere', 'eaux-claires'],
+  'saint-denis': ['centre-ville', 'floreal', 'pleyel', 'stade-de-france', 'franc-moisin', 'basilique'],
+  nimes: ['ecusson', 'gambetta', 'costieres', 'mas-de-mingue', 'richelieu', 'jean-jaures', 'pissevin'],
+  'aix-en-provence': ['centre-historique', 'cours-mirabeau', 'mazarin', 'jas-de-bouffan'],
+  'clermont-ferrand': ['centre-historique', 'jaude', 'montferrand', 'croix-de-neyrat', 'les-cezeaux', 'salins'],
+  'le-mans': ['centre-ville', 'pontlieue', 'les-sablons', 'universite', 'bollee', 'coulaines'],
+  brest: ['centre-ville', 'recouvrance', 'saint-marc', 'lambezellec', 'bellevue'],
+  tours: ['vieux-tours', 'grammont', 'les-deux-lions', 'saint-symphorien', 'sanitas'],
+  amiens: ['centre-ville', 'saint-leu', 'henriville', 'etouvie', 'saint-acheul'],
+  annecy: ['vieille-ville', 'les-balmettes', 'annecy-le-vieux', 'seynod', 'cran-gevrier', 'novel'],
+  limoges: ['centre-ville', 'beaubreuil', 'val-de-l-aurence', 'la-borie', 'la-bastide', 'le-sablard'],
+  metz: ['centre-ville', 'sablon', 'plantieres', 'queuleu', 'borny'],
+  perpignan: ['centre-historique', 'saint-jacques', 'moulin-a-vent', 'le-vernet', 'bas-vernet'],
+  'boulogne-billancourt': ['centre-ville', 'pont-de-sevres', 'republique', 'les-princes', 'point-du-jour', 'silly', 'parchamp'],
+  besancon: ['centre-ville', 'battant', 'planoise', 'palente', 'bregille'],
+  rouen: ['centre-historique', 'saint-sever', 'martainville', 'saint-clement', 'grammont', 'jouvenet'],
+  orleans: ['centre-ville', 'la-source', 'saint-marceau', 'argonne', 'madeleine'],
+  montreuil: ['centre-ville', 'croix-de-chavaux', 'villiers-barbusse', 'la-noue', 'bel-air'],
+  caen: ['centre-ville', 'vaucelles', 'calvaire-saint-pierre', 'beaulieu', 'vaugueux', 'saint-jean', 'grace-de-dieu', 'la-gueriniere'],
+  'saint-paul': ['centre-ville', 'la-possession', 'les-trois-bassins', 'le-port', 'saint-denis', 'saint-leu', 'cilaos'],
+  argenteuil: ['centre-ville', 'val-d-argent', 'orgemont', 'joliot-curie'],
+  mulhouse: ['centre-ville', 'rebberg', 'dornach', 'bourtzwiller', 'fonderie'],
+  nancy: ['centre-ville', 'saurupt', 'haussonville', 'trois-maisons', 'stanislas', 'poincare', 'haut-du-lievre'],
+  tourcoing: ['centre-ville', 'virolois', 'croix-rouge', 'blanc-seau', 'pont-de-neuville', 'epideme', 'marliere'],
+  roubaix: ['centre-ville', 'barbieux', 'alma', 'nouveau-roubaix', 'epeule', 'cul-de-four', 'pile'],
+  nanterre: ['centre-ville', 'petit-nanterre', 'mont-valerien', 'les-provinces', 'vieux-pont', 'parc-sud', 'chemin-de-l-ile'],
+  'vitry-sur-seine': ['centre-ville', 'port-a-l-anglais', 'moulin-vert', 'plateau', 'commune-de-paris', 'gare', 'coteau'],
+  'asnieres-sur-seine': ['centre-ville', 'gennevilliers', 'clichy', 'bois-colombes', 'levallois-perret', 'villeneuve-la-garenne', 'colombes'],
+  creteil: ['centre-ancien', 'palais', 'echat', 'mont-mesly', 'prefecture', 'levriere', 'habette'],
+  avignon: ['intra-muros', 'montfavet', 'rocade-sud', 'saint-chamand'],
+  colombes: ['centre-ville', 'petit-colombes', 'agent-sarre', 'greves', 'europe', 'fosses-jean', 'stade'],
+  poitiers: ['centre-ville', 'couronneries', 'gibauderie', 'beaulieu', 'trois-cites', 'saint-eloi', 'montmidi'],
+  aubervilliers: ['centre-ville', 'quatre-chemins', 'landy', 'villette', 'robespierre', 'maladrerie', 'presqu-ile'],
+  'aulnay-sous-bois': ['centre-ville', 'rose-des-vents', 'ambourget', 'chanteloup', 'gros-saule', 'nonneville', 'mitry'],
+  dunkerque: ['centre-ville', 'malo-les-bains', 'rosendael', 'petite-synthe', 'glacis', 'coudekerque-branche', 'saint-pol-sur-mer'],
+  noumea: ['centre-ville', 'dumbea'],
+  'saint-pierre': ['centre-ville', 'petite-ile', 'entre-deux', 'le-tampon', 'saint-louis', 'saint-joseph', 'l-etang-sale'],
+  versailles: ['centre-ville', 'notre-dame', 'saint-louis', 'montreuil', 'porchefontaine', 'clagny', 'jussieu'],
+  courbevoie: ['centre-ville', 'becon', 'faubourg-de-l-arche', 'marceau', 'regnault', 'gambetta', 'voltaire'],
+  'rueil-malmaison': ['centre-ville', 'mont-valerien', 'buzenval', 'jonchere', 'plaine-gare', 'bois-preau', 'coteaux'],
+  'le-tampon': ['centre-ville', 'entre-deux', 'saint-joseph', 'la-plaine-des-palmistes', 'saint-pierre', 'petite-ile', 'cilaos'],
+  beziers: ['centre-historique', 'arenes', 'deveze', 'la-montagnette', 'faubourg', 'iranget', 'grangette'],
+  pau: ['centre-ville', 'trespoey', 'saragosse', 'bosquet', 'dufau', 'ousse-des-bois', 'universite'],
+  'la-rochelle': ['vieux-port', 'minimes', 'laleu', 'mireuil', 'la-pallice', 'villeneuve-les-salines', 'port-neuf'],
+  'cherbourg-en-cotentin': ['centre-ville', 'equeurdreville', 'octeville', 'tourlaville', 'val-de-saire', 'querqueville', 'la-glacerie'],
+  merignac: ['centre-ville', 'capeyron', 'arlac', 'chemin-long', 'beutre', 'bourranville', 'pichey'],
+  'champigny-sur-marne': ['centre-ville', 'coeuilly', 'plant', 'tremblay', 'bois-l-abbe', 'musselburgh', 'mordacs'],
+  antibes: ['centre-ville', 'juan-les-pins', 'sophia-antipolis', 'la-fontonne', 'cap-d-antibes', 'les-semboules', 'rabiac'],
+  'saint-maur-des-fosses': ['le-parc', 'la-varenne', 'saint-hilaire', 'champignol', 'adamville', 'la-pie', 'les-muriers'],
+  ajaccio: ['centre-ville', 'les-cannes', 'mezzavia', 'salines', 'saint-jean', 'pietralba', 'residence-des-iles'],
+  'fort-de-france': ['centre-ville', 'sch-lcher', 'saint-joseph', 'case-pilote', 'gros-morne', 'le-lamentin', 'le-carbet'],
+  'saint-nazaire': ['centre-ville', 'mean-penhoet', 'avalix', 'trignac'],
+  cannes: ['centre-ville', 'la-bocca', 'carnot', 'croix-des-gardes', 'californie', 'petit-juas', 'republique'],
+  'noisy-le-grand': ['centre-ville', 'gournay-sur-marne', 'neuilly-sur-marne', 'neuilly-plaisance', 'gagny', 'rosny-sous-bois', 'villemomble'],
+  drancy: ['centre-ville', 'la-muette', 'paris-campagne', 'village-parisien', 'economie', 'avenir-parisien', 'petit-drancy'],
+  mamoudzou: ['centre-ville', 'koungou', 'tsingoni', 'dembeni', 'ouangani', 'dzaoudzi', 'pamandzi'],
+  cergy: ['centre', 'grand-centre', 'axe-majeur', 'les-hauts-de-cergy', 'cergy-prefecture', 'cergy-village', 'cergy-saint-christophe'],
+  'levallois-perret': ['centre-ville', 'clichy', 'neuilly-sur-seine', 'courbevoie', 'asnieres-sur-seine', 'bois-colombes', 'la-garenne-colombes'],
+  'issy-les-moulineaux': ['centre-ville', 'vanves', 'boulogne-billancourt', 'malakoff', 'chatillon', 'clamart', 'meudon'],
+  calais: ['centre-ville', 'saint-pierre', 'beau-marais', 'fort-nieulay', 'courgain', 'nouvelle-france', 'pont-du-leu'],
+  pessac: ['centre-ville', 'saige', 'alouette', 'cap-de-bos'],
+  colmar: ['centre-historique', 'maraichers', 'europe', 'saint-antoine'],
+  'evry-courcouronnes': ['centre-ville', 'ris-orangis', 'lisses', 'bondoufle', 'corbeil-essonnes', 'soisy-sur-seine', 'fleury-merogis'],
+  venissieux: ['centre-ville', 'minguettes', 'parilly', 'moulin-a-vent'],
+  'ivry-sur-seine': ['centre-ville', 'charenton-le-pont', 'le-kremlin-bicetre', 'vitry-sur-seine', 'villejuif', 'alfortville', 'gentilly'],
+  valence: ['centre-ville', 'fontbarlettes', 'chamberliere', 'le-plan'],
+  clichy: ['centre-ville', 'levallois-perret', 'asnieres-sur-seine', 'bois-colombes', 'gennevilliers', 'neuilly-sur-seine', 'courbevoie'],
+  quimper: ['centre-historique', 'ergue-armel', 'penhars', 'kerfeunteun', 'moulin-vert', 'locmaria', 'creac-h-gwen'],
+  antony: ['centre-ville', 'sceaux', 'chatenay-malabry', 'bourg-la-reine', 'fontenay-aux-roses', 'le-plessis-robinson', 'bagneux'],
+  bourges: ['centre-historique', 'asnieres', 'gibjoncs', 'pignoux', 'val-d-auron', 'chancellerie', 'aeroport'],
+  'la-seyne-sur-mer': ['centre-ville', 'tamaris', 'les-sablettes', 'berthe', 'mar-vivo', 'pont-de-fabre', 'jas-de-ville'],
+  montauban: ['centre-ville', 'villebourbon', 'pomponne', 'lalande'],
+  'villeneuve-d-ascq': ['hotel-de-ville', 'pont-de-bois', 'triolo', 'chateau', 'flers', 'annappes', 'brigode'],
+  cayenne: ['centre-ville', 'remire-montjoly', 'matoury', 'macouria', 'montsinery-tonnegrande'],
+  'le-blanc-mesnil': ['centre-ville', 'drancy', 'le-bourget', 'aulnay-sous-bois', 'dugny', 'bobigny', 'bondy'],
+  troyes: ['centre-historique', 'pont-sainte-marie', 'chartreux', 'boucherat', 'senardes', 'jules-guesde', 'bouchon-de-champagne'],
+  pantin: ['centre-ville', 'quatre-chemins', 'eglise', 'courtillieres'],
+  villejuif: ['centre-ville', 'le-kremlin-bicetre', 'cachan', 'l-hay-les-roses', 'arcueil', 'gentilly', 'vitry-sur-seine'],
+  chambery: ['centre-ville', 'biollay', 'chantemerle', 'bellevue'],
+  niort: ['centre-ville', 'souche', 'saint-florent', 'clou-bouchet', 'sainte-pezenne', 'surimeau', 'tour-chabot-gavacherie'],
+  frejus: ['centre-ville', 'frejus-plage', 'saint-aygulf', 'les-adrets', 'la-tour-de-mare', 'villeneuve', 'puget-sur-argens'],
+  'neuilly-sur-seine': ['centre-ville', 'courbevoie', 'levallois-perret', 'puteaux', 'la-garenne-colombes', 'bois-colombes', 'clichy'],
+  sarcelles: ['village', 'grand-ensemble', 'locheres', 'flanades', 'chardonnerettes', 'watteau', 'chantepie'],
+  'saint-andre': ['centre-ville', 'sainte-suzanne', 'bras-panon', 'sainte-marie', 'saint-benoit', 'salazie', 'saint-denis'],
+  clamart: ['centre-ville', 'percy', 'jardin-parisien', 'plaine'],
+  lorient: ['centre-ville', 'merville', 'nouvelle-ville', 'keryado'],
+  narbonne: ['centre-ville', 'saint-jean-saint-pierre', 'razimbaud', 'narbonne-plage'],
+  bobigny: ['centre-ville', 'drancy', 'noisy-le-sec', 'romainville', 'pantin', 'bondy', 'les-lilas'],
+  meaux: ['centre-ville', 'nanteuil-les-meaux', 'cregy-les-meaux', 'mareuil-les-meaux', 'villenoy', 'trilport', 'chauconin-neufmontiers'],
+  'maisons-alfort': ['centre-ville', 'alfortville', 'saint-maurice', 'creteil', 'joinville-le-pont', 'charenton-le-pont', 'vitry-sur-seine'],
+  hyeres: ['centre-ville', 'giens', 'l-ayguade', 'les-salins', 'costebelle', 'la-capte', 'la-bayorre'],
+  vannes: ['centre-historique', 'menimur', 'kercado', 'conleau'],
+  beauvais: ['centre-ville', 'saint-jean', 'saint-lucien', 'argentine'],
+  'saint-louis': ['centre-ville', 'les-avirons', 'l-etang-sale', 'entre-deux', 'saint-leu', 'cilaos', 'saint-pierre'],
+  'la-roche-sur-yon': ['centre-ville', 'mouilleron-le-captif', 'aubigny-les-clouzeaux', 'nesmy', 'la-ferriere', 'la-genetouze', 'venansault'],
+  chelles: ['centre-ville', 'vaires-sur-marne', 'brou-sur-chantereine', 'courtry', 'champs-sur-marne', 'noisiel', 'torcy'],
+  'corbeil-essonnes': ['centre-ville', 'villabe', 'saintry-sur-seine', 'lisses', 'ormoy', 'saint-pierre-du-perray', 'saint-germain-les-corbeil'],
+  'saint-laurent-du-maroni': ['centre-ville', 'apatou'],
+  cholet: ['centre-ville', 'bonnevay', 'bretagne', 'jean-monnet'],
+  bayonne: ['grand-bayonne', 'petit-bayonne', 'saint-esprit', 'marracq'],
+  'fontenay-sous-bois': ['centre-ville', 'val-de-fontenay', 'rigollots', 'bois-cadet'],
+  'saint-ouen-sur-seine': ['centre-ville', 'saint-denis', 'l-ile-saint-denis', 'aubervilliers', 'epinay-sur-seine', 'villetaneuse', 'la-courneuve'],
+  'cagnes-sur-mer': ['centre-ville', 'saint-laurent-du-var', 'saint-paul-de-vence', 'la-colle-sur-loup', 'villeneuve-loubet', 'la-gaude', 'biot'],
+  'vaulx-en-velin': ['centre-ville', 'decines-charpieu', 'villeurbanne', 'bron', 'chassieu', 'rillieux-la-pape', 'caluire-et-cuire'],
+  'epinay-sur-seine': ['centre-ville', 'l-ile-saint-denis', 'villetaneuse', 'saint-denis', 'saint-ouen-sur-seine', 'stains', 'la-courneuve'],
+  'saint-quentin': ['centre-ville', 'europe', 'vermandois', 'saint-martin'],
+  sartrouville: ['centre-ville', 'houilles', 'maisons-laffitte', 'carrieres-sur-seine', 'montesson', 'le-mesnil-le-roi', 'chatou'],
+  sevran: ['centre-ville', 'villepinte', 'livry-gargan', 'aulnay-sous-bois', 'clichy-sous-bois', 'vaujours', 'les-pavillons-sous-bois'],
+  arles: ['centre-historique', 'trinquetaille', 'barriol', 'pont-de-crau', 'griffeuille', 'trebon', 'monplaisir'],
+  massy: ['centre-ville', 'champlan', 'verrieres-le-buisson', 'palaiseau', 'igny', 'chilly-mazarin', 'villebon-sur-yvette'],
+  albi: ['centre-historique', 'cantepau', 'lapanouse', 'rayssac'],
+  'les-abymes': ['centre-ville', 'le-gosier', 'pointe-a-pitre', 'morne-a-l-eau', 'baie-mahault', 'sainte-anne', 'petit-canal'],
+  gennevilliers: ['centre-ville', 'asnieres-sur-seine', 'bois-colombes', 'villeneuve-la-garenne', 'colombes', 'clichy', 'levallois-perret'],
+  'saint-herblain': ['bourg', 'sillon', 'joli-mai', 'bagatelle'],
+  grasse: ['centre-ville', 'saint-claude', 'magagnosc', 'le-plan', 'plan-de-grasse', 'saint-jacques', 'les-marronniers'],
+  bondy: ['centre-ville', 'nord', 'mainguy', 'terre-saint-blaise'],
+  'les-sables-d-olonne': ['centre-ville', 'sainte-foy', 'l-ile-d-olonne', 'saint-mathurin', 'brem-sur-mer', 'les-achards', 'talmont-saint-hilaire'],
+  laval: ['centre-ville', 'saint-nicolas', 'bourny', 'ferrie'],
+  evreux: ['centre-ville', 'navarre', 'la-madeleine', 'saint-michel'],
+  'saint-priest': ['centre-ville', 'menival', 'bel-air', 'manissieux'],
+  suresnes: ['centre-ville', 'puteaux', 'rueil-malmaison', 'nanterre', 'saint-cloud', 'garches', 'neuilly-sur-seine'],
+  martigues: ['centre-ville', 'port-de-bouc', 'sausset-les-pins', 'chateauneuf-les-martigues', 'saint-mitre-les-remparts', 'carry-le-rouet', 'ensues-la-redonne'],
+  vincennes: ['centre-ville', 'saint-mande', 'fontenay-sous-bois', 'saint-maurice', 'nogent-sur-marne', 'charenton-le-pont', 'joinville-le-pont'],
+  aubagne: ['centre-ville', 'carnoux-en-provence', 'la-penne-sur-huveaune', 'roquevaire', 'roquefort-la-bedoule', 'gemenos', 'cassis'],
+  'saint-malo': ['intra-muros', 'saint-servan', 'parame', 'rotheneuf'],
+  'livry-gargan': ['centre-ville', 'clichy-sous-bois', 'sevran', 'les-pavillons-sous-bois', 'le-raincy', 'coubron', 'montfermeil'],
+  blois: ['centre-ville', 'vienne', 'les-grouets', 'cabochon'],
+  'rosny-sous-bois': ['centre-ville', 'neuilly-plaisance', 'villemomble', 'noisy-le-sec', 'montreuil', 'bondy', 'le-raincy'],
+  'la-courneuve': ['centre-ville', 'le-bourget', 'saint-denis', 'aubervilliers', 'dugny', 'stains', 'drancy'],
+  'brive-la-gaillarde': ['centre-ville', 'ussac', 'cosnac', 'saint-pantaleon-de-larche', 'malemort', 'varetz', 'donzenac'],
+  bastia: ['terra-vecchia', 'terra-nova', 'lupino', 'paese-novo'],
+  talence: ['centre-ville', 'forum', 'plume-la-poule', 'raba'],
+  meudon: ['centre-ville', 'clamart', 'sevres', 'chaville', 'le-plessis-robinson', 'issy-les-moulineaux', 'boulogne-billancourt'],
+  montrouge: ['centre-ville', 'malakoff', 'bagneux', 'vanves', 'chatillon', 'fontenay-aux-roses', 'bourg-la-reine'],
+  ales: ['centre-ville', 'rochebelle', 'clavieres', 'tamaris'],
+  carcassonne: ['la-cite', 'bastide-saint-louis', 'grazailles', 'montredon'],
+  melun: ['centre-ville', 'le-mee-sur-seine', 'rubelles', 'vert-saint-denis', 'vaux-le-penil', 'la-rochette', 'dammarie-les-lys'],
+  'choisy-le-roi': ['centre-ville', 'thiais', 'orly', 'valenton', 'creteil', 'vitry-sur-seine', 'villeneuve-saint-georges'],
+  'saint-germain-en-laye': ['centre-ville', 'le-mesnil-le-roi', 'montesson', 'maisons-laffitte', 'le-pecq', 'le-vesinet', 'chatou'],
+  belfort: ['centre-ville', 'les-residences', 'glacis', 'miotte'],
+  'charleville-mezieres': ['centre-ville', 'manchester', 'la-houillere', 'montjoly'],
+  alfortville: ['centre-ville', 'maisons-alfort', 'vitry-sur-seine', 'creteil', 'saint-maurice', 'ivry-sur-seine', 'charenton-le-pont'],
+  'noisy-le-sec': ['centre-ville', 'romainville', 'bobigny', 'bondy', 'rosny-sous-bois', 'les-lilas', 'montreuil'],
+  sete: ['centre-ville', 'meze', 'loupian', 'marseillan', 'balaruc-les-bains', 'balaruc-le-vieux', 'pomerols'],
+  'chalon-sur-saone': ['centre-ville', 'saint-jean-des-vignes', 'pres-saint-jean', 'stade'],
+  bagneux: ['centre-ville', 'chatillon', 'fontenay-aux-roses', 'montrouge', 'bourg-la-reine', 'malakoff', 'sceaux'],
+  tarbes: ['centre-ville', 'laubadere', 'arsenal', 'ormeau'],
+  'saint-brieuc': ['centre-ville', 'cesson', 'europe', 'balzac'],
+  istres: ['centre-ville', 'miramas', 'saint-martin-de-crau', 'saint-chamas', 'fos-sur-mer', 'grans', 'saint-mitre-les-remparts'],
+  'salon-de-provence': ['centre-ville', 'grans', 'eyguieres', 'miramas', 'lamanon', 'pelissanne', 'senas'],
+  puteaux: ['centre-ville', 'suresnes', 'neuilly-sur-seine', 'courbevoie', 'la-garenne-colombes', 'nanterre', 'levallois-perret'],
+  'caluire-et-cuire': ['centre-ville', 'collonges-au-mont-d-or', 'fontaines-sur-saone', 'saint-cyr-au-mont-d-or', 'sathonay-camp', 'saint-didier-au-mont-d-or', 'villeurbanne'],
+  reze: ['centre-ville', 'les-sorinieres', 'bouguenais', 'pont-saint-martin', 'saint-sebastien-sur-loire', 'saint-aignan-grandlieu', 'vertou'],
+  'mantes-la-jolie': ['centre-ville', 'buchelay', 'mantes-la-ville', 'magnanville', 'limay', 'follainville-dennemont', 'guerville'],
+  valenciennes: ['centre-ville', 'anzin', 'marly', 'la-sentinelle', 'beuvrages', 'petite-foret', 'trith-saint-leger'],
+  anglet: ['centre-ville', 'biarritz', 'bayonne', 'boucau', 'bassussarry', 'saint-pierre-d-irube', 'arcangues'],
+  bagnolet: ['centre-ville', 'les-lilas', 'montreuil', 'romainville', 'le-pre-saint-gervais', 'noisy-le-sec', 'pantin'],
+  bron: ['centre-ville', 'chassieu', 'villeurbanne', 'venissieux', 'saint-priest', 'vaulx-en-velin', 'decines-charpieu'],
+  'chalons-en-champagne': ['centre-ville', 'croix-jean-robert', 'mont-hery', 'verbeau'],
+  chateauroux: ['centre-ville', 'saint-christophe', 'beaulieu', 'saint-jacques'],
+  arras: ['centre-ville', 'saint-sauveur', 'citadelle', 'saint-michel'],
+  thionville: ['centre-ville', 'beauregard', 'cote-des-roses', 'elange'],
+  'villenave-d-ornon': ['centre-ville', 'begles', 'cadaujac', 'latresne', 'talence', 'gradignan', 'quinsac'],
+  castres: ['centre-ville', 'saix', 'roquecourbe', 'viviers-les-montagnes', 'semalens', 'payrin-augmontel', 'soual'],
+  'bourg-en-bresse': ['centre-ville', 'montagnat', 'peronnas', 'saint-denis-les-bourg', 'viriat', 'ceyzeriat', 'saint-etienne-du-bois'],
+  gagny: ['centre-ville', 'neuilly-sur-marne', 'montfermeil', 'le-raincy', 'villemomble', 'clichy-sous-bois', 'neuilly-plaisance'],
+  'le-cannet': ['centre-ville', 'mougins', 'cannes', 'la-roquette-sur-siagne', 'vallauris', 'mouans-sartoux', 'valbonne'],
+  angouleme: ['centre-ville', 'grande-garenne', 'bel-air', 'sillac'],
+  'garges-les-gonesse': ['centre-ville', 'arnouville', 'sarcelles', 'montmagny', 'groslay', 'villiers-le-bel', 'gonesse'],
+  villepinte: ['centre-ville', 'sevran', 'tremblay-en-france', 'aulnay-sous-bois', 'livry-gargan', 'vaujours', 'coubron'],
+  stains: ['centre-ville', 'saint-denis', 'la-courneuve', 'dugny', 'villetaneuse', 'le-bourget', 'aubervilliers'],
+  gap: ['centre-ville', 'fontreyne', 'romette', 'tokoro'],
+  poissy: ['centre-ville', 'villennes-sur-seine', 'carrieres-sous-poissy', 'chambourcy', 'orgeval', 'vernouillet', 'feucherolles'],
+  colomiers: ['centre-ville', 'tournefeuille', 'cornebarrieu', 'blagnac', 'pibrac', 'la-salvetat-saint-gilles', 'plaisance-du-touch'],
+  wattrelos: ['centre-ville', 'roubaix', 'leers', 'tourcoing', 'lys-lez-lannoy', 'mouvaux', 'toufflers'],
+  draguignan: ['centre-ville', 'figanieres', 'trans-en-provence', 'la-motte', 'flayosc', 'les-arcs', 'callas'],
+  compiegne: ['centre-ville', 'clairoix', 'margny-les-compiegne', 'choisy-au-bac', 'venette', 'jaux', 'lacroix-saint-ouen'],
+  montelimar: ['centre-ville', 'montboucher-sur-jabron', 'chateauneuf-du-rhone', 'malataverne', 'donzere', 'grane', 'pierrelatte'],
+  'boulogne-sur-mer': ['haute-ville', 'capecure', 'brequerecque', 'saint-pierre'],
+  douai: ['centre-ville', 'waziers', 'sin-le-noble', 'dechy', 'roost-warendin', 'lambres-lez-douai', 'flers-en-escrebieux'],
+  'marcq-en-bar-ul': ['centre-ville', 'wasquehal', 'bondues', 'marquette-lez-lille', 'la-madeleine', 'mouvaux', 'croix'],
+  'neuilly-sur-marne': ['centre-ville', 'gagny', 'neuilly-plaisance', 'gournay-sur-marne', 'villemomble', 'noisy-le-grand', 'le-raincy'],
+  'le-lamentin': ['centre-ville', 'ducos', 'saint-joseph', 'fort-de-france', 'le-robert', 'saint-esprit', 'le-francois'],
+  'saint-joseph': ['centre-ville', 'petite-ile', 'saint-philippe', 'le-tampon', 'saint-pierre', 'la-plaine-des-palmistes', 'sainte-rose'],
+  'pontault-combault': ['centre-ville', 'emerainville', 'roissy-en-brie', 'croissy-beaubourg', 'lesigny', 'lognes', 'ozoir-la-ferriere'],
+  'saint-benoit': ['centre-ville', 'bras-panon', 'la-plaine-des-palmistes', 'salazie', 'saint-andre', 'sainte-rose', 'sainte-suzanne'],
+  'la-ciotat': ['centre-ville', 'ceyreste', 'cassis', 'roquefort-la-bedoule', 'carnoux-en-provence', 'aubagne', 'gemenos'],
+  'joue-les-tours': ['centre-ville', 'ballan-mire', 'chambray-les-tours', 'la-riche', 'saint-avertin', 'montbazon', 'tours'],
+  'tremblay-en-france': ['centre-ville', 'villepinte', 'sevran', 'vaujours', 'aulnay-sous-bois', 'livry-gargan', 'coubron'],
+  chartres: ['centre-ville', 'beaulieu', 'la-madeleine', 'rechevres'],
+  'oullins-pierre-benite': ['centre-ville', 'saint-genis-laval', 'la-mulatiere', 'saint-fons', 'sainte-foy-les-lyon', 'irigny', 'chaponost'],
+  'thonon-les-bains': ['centre-ville', 'allinges', 'anthy-sur-leman', 'publier', 'margencel', 'evian-les-bains', 'sciez'],
+  franconville: ['centre-ville', 'le-plessis-bouchard', 'montigny-les-cormeilles', 'ermont', 'cormeilles-en-parisis', 'sannois', 'beauchamp'],
+  'saint-martin-d-heres': ['centre-ville', 'gieres', 'poisat', 'eybens', 'grenoble', 'la-tronche', 'meylan'],
+  annemasse: ['centre-ville', 'vetraz-monthoux', 'ambilly', 'ville-la-grand', 'gaillard', 'etrembieres', 'monnetier-mornex'],
+  'savigny-sur-orge': ['centre-ville', 'juvisy-sur-orge', 'morangis', 'epinay-sur-orge', 'viry-chatillon', 'villemoisson-sur-orge', 'morsang-sur-orge'],
+  echirolles: ['centre-ville', 'le-pont-de-claix', 'eybens', 'seyssins', 'grenoble', 'poisat', 'jarrie'],
+  palaiseau: ['centre-ville', 'villebon-sur-yvette', 'igny', 'massy', 'orsay', 'champlan', 'saulx-les-chartreux'],
+  romainville: ['centre-ville', 'les-lilas', 'noisy-le-sec', 'bagnolet', 'le-pre-saint-gervais', 'montreuil', 'bobigny'],
+  'saint-raphael': ['centre-ville', 'frejus', 'les-adrets-de-l-esterel', 'puget-sur-argens', 'bagnols-en-foret', 'montauroux', 'roquebrune-sur-argens'],
+  'six-fours-les-plages': ['centre-ville', 'la-seyne-sur-mer', 'sanary-sur-mer', 'ollioules', 'bandol', 'saint-mandrier-sur-mer', 'toulon'],
+  'sainte-marie': ['centre-ville', 'sainte-suzanne', 'saint-denis', 'salazie', 'saint-andre', 'bras-panon', 'la-possession'],
+  'conflans-sainte-honorine': ['centre-ville', 'acheres', 'maurecourt', 'andresy', 'chanteloup-les-vignes', 'maisons-laffitte', 'triel-sur-seine'],
+  vitrolles: ['centre-ville', 'saint-victoret', 'marignane', 'rognac', 'cabries', 'les-pennes-mirabeau', 'gignac-la-nerthe'],
+  chatillon: ['centre-ville', 'fontenay-aux-roses', 'malakoff', 'bagneux', 'vanves', 'montrouge', 'clamart'],
+  meyzieu: ['centre-ville', 'jonage', 'decines-charpieu', 'pusignan', 'genas', 'chassieu', 'vaulx-en-velin'],
+  'athis-mons': ['centre-ville', 'juvisy-sur-orge', 'paray-vieille-poste', 'vigneux-sur-seine', 'morangis', 'savigny-sur-orge', 'draveil'],
+  'la-possession': ['centre-ville', 'saint-paul', 'saint-denis', 'le-port', 'salazie', 'les-trois-bassins', 'sainte-marie'],
+  matoury: ['centre-ville', 'remire-montjoly', 'cayenne', 'montsinery-tonnegrande', 'macouria'],
+  bezons: ['centre-ville', 'argenteuil', 'cormeilles-en-parisis', 'sannois', 'la-frette-sur-seine', 'saint-gratien', 'franconville'],
+  haguenau: ['centre-ville', 'kaltenhouse', 'schweighouse-sur-moder', 'oberhoffen-sur-moder', 'schirrhein', 'weitbruch', 'bischwiller'],
+  creil: ['centre-ville', 'nogent-sur-oise', 'villers-saint-paul', 'saint-maximin', 'montataire', 'verneuil-en-halatte', 'monchy-saint-eloi'],
+  'villeneuve-saint-georges': ['centre-ville', 'valenton', 'ablon-sur-seine', 'villeneuve-le-roi', 'limeil-brevannes', 'orly', 'choisy-le-roi'],
+  'villefranche-sur-saone': ['centre-ville', 'limas', 'gleize', 'pommiers', 'arnas', 'anse', 'porte-des-pierres-dorees'],
+  'saint-leu': ['centre-ville', 'les-avirons', 'l-etang-sale', 'les-trois-bassins', 'saint-louis', 'cilaos', 'entre-deux'],
+  'chatenay-malabry': ['centre-ville', 'le-plessis-robinson', 'sceaux', 'clamart', 'fontenay-aux-roses', 'antony', 'chatillon'],
+  'saint-chamond': ['centre-ville', 'l-horme', 'saint-jean-bonnefonds', 'la-grand-croix', 'saint-paul-en-jarez', 'la-talaudiere', 'sorbiers'],
+  'sainte-genevieve-des-bois': ['centre-ville', 'saint-michel-sur-orge', 'villemoisson-sur-orge', 'morsang-sur-orge', 'villiers-sur-orge', 'longpont-sur-orge', 'epinay-sur-orge'],
+  roanne: ['centre-ville', 'le-coteau', 'riorges', 'perreux', 'mably', 'commelle-vernay', 'villerest'],
+  'le-perreux-sur-marne': ['centre-ville', 'bry-sur-marne', 'nogent-sur-marne', 'fontenay-sous-bois', 'champigny-sur-marne', 'villiers-sur-marne', 'joinville-le-pont'],
+  macon: ['centre-ville', 'flace', 'saugeraies', 'bioux'],
+  auxerre: ['centre-historique', 'les-mignottes', 'sainte-genevieve', 'rive-droite'],
+  dumbea: ['centre-ville', 'paita', 'noumea'],
+  schiltigheim: ['centre-ville', 'bischheim', 'h-nheim', 'souffelweyersheim', 'mundolsheim', 'mittelhausbergen', 'reichstett'],
+  trappes: ['centre-ville', 'montigny-le-bretonneux', 'elancourt', 'la-verriere', 'voisins-le-bretonneux', 'bois-d-arcy', 'le-mesnil-saint-denis'],
+  'les-mureaux': ['centre-ville', 'meulan-en-yvelines', 'hardricourt', 'mezy-sur-seine', 'bouafle', 'flins-sur-seine', 'verneuil-sur-seine'],
+  houilles: ['centre-ville', 'sartrouville', 'carrieres-sur-seine', 'maisons-laffitte', 'montesson', 'chatou', 'le-mesnil-le-roi'],
+  'le-port': ['centre-ville', 'la-possession', 'saint-paul', 'saint-denis', 'les-trois-bassins', 'sainte-marie', 'salazie'],
+  marignane: ['centre-ville', 'saint-victoret', 'gignac-la-nerthe', 'vitrolles', 'chateauneuf-les-martigues', 'le-rove', 'ensues-la-redonne'],
+  'romans-sur-isere': ['centre-ville', 'mours-saint-eusebe', 'peyrins', 'genissieux', 'bourg-de-peage', 'chatuzange-le-goubet', 'alixan'],
+  'villiers-sur-marne': ['centre-ville', 'bry-sur-marne', 'champigny-sur-marne', 'le-plessis-trevise', 'le-perreux-sur-marne', 'chennevieres-sur-marne', 'ormesson-sur-marne'],
+  montlucon: ['centre-ville', 'desertines', 'saint-victor', 'domerat', 'premilhat', 'neris-les-bains', 'huriel'],
+  nevers: ['centre-ville', 'mouesse', 'grande-pature', 'baratte'],
+  lens: ['centre-ville', 'eleu-dit-leauwette', 'loos-en-gohelle', 'loison-sous-lens', 'sallaumines', 'lievin', 'avion'],
+  thiais: ['centre-ville', 'choisy-le-roi', 'orly', 'chevilly-larue', 'rungis', 'vitry-sur-seine', 'villeneuve-le-roi'],
+  'saint-medard-en-jalles': ['centre-ville', 'martignas-sur-jalle', 'saint-aubin-de-medoc', 'le-haillan', 'le-taillan-medoc', 'merignac', 'saint-jean-d-illac'],
+  agen: ['centre-ville', 'montanou', 'pin', 'ermitage'],
+  'montigny-le-bretonneux': ['centre-ville', 'trappes', 'voisins-le-bretonneux', 'bois-d-arcy', 'guyancourt', 'saint-cyr-l-ecole', 'fontenay-le-fleury'],
+  'nogent-sur-marne': ['centre-ville', 'fontenay-sous-bois', 'le-perreux-sur-marne', 'joinville-le-pont', 'bry-sur-marne', 'vincennes', 'saint-maurice'],
+  'aix-les-bains': ['centre-ville', 'tresserve', 'mouxy', 'gresy-sur-aix', 'drumettaz-clarafond', 'viviers-du-lac', 'brison-saint-innocent'],
+  epinal: ['centre-ville', 'la-justice', 'saut-le-cerf', 'poissompre'],
+  'saint-laurent-du-var': ['centre-ville', 'cagnes-sur-mer', 'la-gaude', 'saint-paul-de-vence', 'nice', 'la-colle-sur-loup', 'villeneuve-loubet'],
+  koungou: ['centre-ville', 'mamoudzou', 'tsingoni', 'bandraboua', 'dzaoudzi', 'm-tsangamouji', 'pamandzi'],
+  pontoise: ['centre-ville', 'saint-ouen-l-aumone', 'eragny', 'ennery', 'osny', 'cergy', 'neuville-sur-oise'],
+  begles: ['centre-ville', 'villenave-d-ornon', 'talence', 'floirac', 'bouliac', 'latresne', 'carignan-de-bordeaux'],
+  plaisir: ['centre-ville', 'les-clayes-sous-bois', 'neauphle-le-chateau', 'jouars-pontchartrain', 'elancourt', 'villiers-saint-frederic', 'maurepas'],
+  'herblay-sur-seine': ['centre-ville', 'pierrelaye', 'beauchamp', 'montigny-les-cormeilles', 'la-frette-sur-seine', 'eragny', 'bessancourt'],
+  vienne: ['centre-ville', 'pont-eveque', 'jardin', 'serpaize', 'seyssuel', 'reventin-vaugris', 'chuzelles'],
+  carpentras: ['centre-ville', 'aubignan', 'loriol-du-comtat', 'mazan', 'caromb', 'monteux', 'beaumes-de-venise'],
+  'mont-de-marsan': ['centre-ville', 'saint-pierre-du-mont', 'grenade-sur-l-adour', 'saint-sever', 'villeneuve-de-marsan', 'tartas'],
+  dreux: ['centre-ville', 'vernouillet', 'abondant', 'saint-remy-sur-avre', 'bu', 'saint-lubin-des-joncherets', 'anet'],
+  'vigneux-sur-seine': ['centre-ville', 'draveil', 'montgeron', 'athis-mons', 'crosne', 'juvisy-sur-orge', 'yerres'],
+  'rillieux-la-pape': ['centre-ville', 'sathonay-camp', 'sathonay-village', 'fontaines-sur-saone', 'cailloux-sur-fontaines', 'fontaines-saint-martin', 'collonges-au-mont-d-or'],
+  goussainville: ['centre-ville', 'le-thillay', 'fontenay-en-parisis', 'louvres', 'roissy-en-france', 'gonesse', 'puiseux-en-france'],
+  'ris-orangis': ['centre-ville', 'grigny', 'evry-courcouronnes', 'fleury-merogis', 'viry-chatillon', 'draveil', 'bondoufle'],
+  'l-hay-les-roses': ['centre-ville', 'chevilly-larue', 'cachan', 'villejuif', 'fresnes', 'arcueil', 'rungis'],
+  'saint-martin': ['centre-ville', 'marigot', 'grand-case', 'sandy-ground'],
+  'savigny-le-temple': ['centre-ville', 'cesson', 'nandy', 'vert-saint-denis', 'reau', 'moissy-cramayel', 'lieusaint'],
+  cambrai: ['centre-ville', 'neuville-saint-remy', 'proville', 'escaud-uvres', 'raillencourt-sainte-olle', 'masnieres', 'iwuy'],
+  cachan: ['centre-ville', 'arcueil', 'l-hay-les-roses', 'villejuif', 'gentilly', 'le-kremlin-bicetre', 'chevilly-larue'],
+  chatellerault: ['centre-ville', 'naintre', 'thure', 'vouneuil-sur-vienne', 'scorbe-clairvaux', 'beaumont-saint-cyr', 'dange-saint-romain'],
+  'baie-mahault': ['centre-ville', 'pointe-a-pitre', 'lamentin', 'sainte-rose', 'les-abymes', 'petit-bourg', 'morne-a-l-eau'],
+  'viry-chatillon': ['centre-ville', 'grigny', 'morsang-sur-orge', 'juvisy-sur-orge', 'savigny-sur-orge', 'ris-orangis', 'villemoisson-sur-orge'],
+  'le-chesnay-rocquencourt': ['centre-ville', 'la-celle-saint-cloud', 'versailles', 'bailly', 'louveciennes', 'bougival', 'saint-cyr-l-ecole'],
+  menton: ['centre-ville', 'roquebrune-cap-martin', 'peille', 'beausoleil', 'la-turbie', 'sospel', 'cap-d-ail'],
+  chatou: ['centre-ville', 'le-vesinet', 'croissy-sur-seine', 'montesson', 'carrieres-sur-seine', 'le-port-marly', 'le-pecq'],
+  malakoff: ['centre-ville', 'vanves', 'chatillon', 'montrouge', 'bagneux', 'issy-les-moulineaux', 'fontenay-aux-roses'],
+  'la-garenne-colombes': ['centre-ville', 'courbevoie', 'colombes', 'bois-colombes', 'puteaux', 'neuilly-sur-seine', 'nanterre'],
+  tournefeuille: ['centre-ville', 'cugnaux', 'colomiers', 'plaisance-du-touch', 'villeneuve-tolosane', 'la-salvetat-saint-gilles', 'frouzins'],
+  'bourgoin-jallieu': ['centre-ville', 'saint-alban-de-roche', 'l-isle-d-abeau', 'saint-savin', 'nivolas-vermelle', 'ruy-montceau', 'vaulx-milieu'],
+  draveil: ['centre-ville', 'vigneux-sur-seine', 'montgeron', 'grigny', 'soisy-sur-seine', 'ris-orangis', 'viry-chatillon'],
+  lievin: ['centre-ville', 'angres', 'eleu-dit-leauwette', 'grenay', 'givenchy-en-gohelle', 'lens', 'aix-noulette'],
+  'villiers-le-bel': ['centre-ville', 'sarcelles', 'ecouen', 'arnouville', 'garges-les-gonesse', 'saint-brice-sous-foret', 'ezanville'],
+  'vand-uvre-les-nancy': ['centre-ville', 'houdemont', 'villers-les-nancy', 'heillecourt', 'nancy', 'jarville-la-malgrange', 'laxou'],
+  agde: ['centre-ville', 'vias', 'marseillan', 'bessan', 'florensac', 'pomerols', 'portiragnes'],
+  'decines-charpieu': ['centre-ville', 'vaulx-en-velin', 'meyzieu', 'chassieu', 'villeurbanne', 'bron', 'jonage'],
+  'saint-cloud': ['centre-ville', 'garches', 'sevres', 'boulogne-billancourt', 'vaucresson', 'suresnes', 'ville-d-avray'],
+  faaa: ['centre-ville', 'papeete', 'punaauia', 'pirae', 'mahina', 'paea', 'papara'],
+  villemomble: ['centre-ville', 'le-raincy', 'rosny-sous-bois', 'les-pavillons-sous-bois', 'neuilly-plaisance', 'bondy', 'gagny'],
+  guyancourt: ['centre-ville', 'voisins-le-bretonneux', 'montigny-le-bretonneux', 'buc', 'saint-cyr-l-ecole', 'magny-les-hameaux', 'versailles'],
+  orange: ['centre-ville', 'la-tourre', 'fourches-vieilles', 'nogent'],
+  fresnes: ['centre-ville', 'rungis', 'chevilly-larue', 'l-hay-les-roses', 'cachan', 'thiais', 'villejuif'],
+  'saint-etienne-du-rouvray': ['centre-ville', 'sotteville-les-rouen', 'amfreville-la-mi-voie', 'belbeuf', 'petit-couronne', 'oissel', 'le-grand-quevilly'],
+  ermont: ['centre-ville', 'eaubonne', 'sannois', 'le-plessis-bouchard', 'franconville', 'margency', 'saint-gratien'],
+  'clichy-sous-bois': ['centre-ville', 'livry-gargan', 'montfermeil', 'le-raincy', 'coubron', 'les-pavillons-sous-bois', 'gagny'],
+  vallauris: ['centre-ville', 'antibes', 'mougins', 'le-cannet', 'cannes', 'biot', 'valbonne'],
+  perigueux: ['centre-historique', 'boulazac', 'chamiers', 'churchill'],
+  'sotteville-les-rouen': ['centre-ville', 'amfreville-la-mi-voie', 'le-petit-quevilly', 'saint-etienne-du-rouvray', 'rouen', 'bonsecours', 'le-mesnil-esnard'],
+  'bois-colombes': ['centre-ville', 'colombes', 'asnieres-sur-seine', 'la-garenne-colombes', 'courbevoie', 'gennevilliers', 'levallois-perret'],
+  'le-plessis-robinson': ['centre-ville', 'chatenay-malabry', 'clamart', 'fontenay-aux-roses', 'sceaux', 'chatillon', 'meudon'],
+  'charenton-le-pont': ['centre-ville', 'ivry-sur-seine', 'saint-mande', 'saint-maurice', 'alfortville', 'maisons-alfort', 'vincennes'],
+  punaauia: ['centre-ville', 'faaa', 'pirae', 'papeete', 'paea', 'mahina', 'papara'],
+  maubeuge: ['centre-ville', 'louvroil', 'rousies', 'feignies', 'ferriere-la-grande', 'hautmont', 'la-longueville'],
+  montfermeil: ['centre-ville', 'clichy-sous-bois', 'coubron', 'gagny', 'livry-gargan', 'le-raincy', 'vaujours'],
+  vanves: ['centre-ville', 'malakoff', 'issy-les-moulineaux', 'chatillon', 'montrouge', 'bagneux', 'fontenay-aux-roses'],
+  'saint-sebastien-sur-loire': ['centre-ville', 'basse-goulaine', 'reze', 'nantes', 'sainte-luce-sur-loire', 'vertou', 'haute-goulaine'],
+  orvault: ['centre-ville', 'treillieres', 'sautron', 'la-chapelle-sur-erdre', 'saint-herblain', 'nantes', 'vigneux-de-bretagne'],
+  dieppe: ['centre-ville', 'offranville', 'arques-la-bataille', 'petit-caux', 'saint-nicolas-d-aliermont', 'luneray', 'criel-sur-mer'],
+  soissons: ['centre-ville', 'belleu', 'villeneuve-saint-germain', 'crouy', 'vailly-sur-aisne', 'braine', 'anizy-le-grand'],
+  yerres: ['centre-ville', 'brunoy', 'crosne', 'montgeron', 'epinay-sous-senart', 'boussy-saint-antoine', 'vigneux-sur-seine'],
+  'illkirch-graffenstaden': ['centre-ville', 'ostwald', 'fegersheim', 'eschau', 'lingolsheim', 'geispolsheim', 'strasbourg'],
+  'sucy-en-brie': ['centre-ville', 'noiseau', 'ormesson-sur-marne', 'boissy-saint-leger', 'chennevieres-sur-marne', 'bonneuil-sur-marne', 'marolles-en-brie'],
+  'le-gosier': ['centre-ville', 'les-abymes', 'pointe-a-pitre', 'sainte-anne', 'morne-a-l-eau', 'baie-mahault', 'le-moule'],
+  rambouillet: ['centre-ville', 'le-perray-en-yvelines', 'les-essarts-le-roi', 'saint-arnoult-en-yvelines', 'coignieres', 'montfort-l-amaury', 'le-mesnil-saint-denis'],
+  'remire-montjoly': ['centre-ville', 'cayenne', 'matoury'],
+  gonesse: ['centre-ville', 'le-thillay', 'arnouville', 'garges-les-gonesse', 'goussainville', 'roissy-en-france', 'villiers-le-bel'],
+  paita: ['centre-ville', 'dumbea', 'bouloupari'],
+  blagnac: ['centre-ville', 'beauzelle', 'cornebarrieu', 'aucamville', 'fenouillet', 'colomiers', 'seilh'],
+  taverny: ['centre-ville', 'bessancourt', 'saint-leu-la-foret', 'beauchamp', 'frepillon', 'le-plessis-bouchard', 'pierrelaye'],
+  'la-teste-de-buch': ['centre-ville', 'arcachon', 'gujan-mestras', 'le-teich', 'lege-cap-ferret', 'biganos', 'andernos-les-bains'],
+  'bussy-saint-georges': ['centre-ville', 'ferrieres-en-brie', 'collegien', 'pontcarre', 'chanteloup-en-brie', 'croissy-beaubourg', 'saint-thibault-des-vignes'],
+  'champs-sur-marne': ['centre-ville', 'noisiel', 'emerainville', 'lognes', 'vaires-sur-marne', 'torcy', 'chelles'],
+  'limeil-brevannes': ['centre-ville', 'boissy-saint-leger', 'valenton', 'bonneuil-sur-marne', 'villeneuve-saint-georges', 'villecresnes', 'sucy-en-brie'],
+  'cormeilles-en-parisis': ['centre-ville', 'la-frette-sur-seine', 'franconville', 'montigny-les-cormeilles', 'sannois', 'argenteuil', 'le-plessis-bouchard'],
+  bergerac: ['centre-ville', 'prigonrieux', 'lamonzie-saint-martin', 'la-force', 'lalinde', 'eymet', 'port-sainte-foy-et-ponchapt'],
+  sens: ['centre-ville', 'saint-clement', 'paron', 'villeneuve-sur-yonne', 'pont-sur-yonne', 'champigny', 'saint-julien-du-sault'],
+  lambersart: ['centre-ville', 'saint-andre-lez-lille', 'lompret', 'lille', 'marquette-lez-lille', 'la-madeleine', 'verlinghem'],
+  armentieres: ['centre-ville', 'nieppe', 'la-chapelle-d-armentieres', 'houplines', 'erquinghem-lys', 'frelinghien', 'premesques'],
+  gradignan: ['centre-ville', 'canejan', 'talence', 'leognan', 'villenave-d-ornon', 'pessac', 'begles'],
+  villeparisis: ['centre-ville', 'courtry', 'mitry-mory', 'claye-souilly', 'villevaude', 'brou-sur-chantereine', 'chelles'],
+  sannois: ['centre-ville', 'ermont', 'saint-gratien', 'argenteuil', 'franconville', 'eaubonne', 'le-plessis-bouchard'],
+  etampes: ['centre-ville', 'morigny-champigny', 'etrechy', 'janville-sur-juine', 'le-merevillois', 'cerny', 'pussay'],
+  grigny: ['centre-ville', 'viry-chatillon', 'ris-orangis', 'morsang-sur-orge', 'fleury-merogis', 'draveil', 'juvisy-sur-orge'],
+  cenon: ['centre-ville', 'lormont', 'floirac', 'artigues-pres-bordeaux', 'tresses', 'bouliac', 'bordeaux'],
+  'bretigny-sur-orge': ['centre-ville', 'saint-germain-les-arpajon', 'leuville-sur-orge', 'le-plessis-pate', 'la-norville', 'saint-michel-sur-orge', 'arpajon'],
+  papeete: ['centre-ville', 'faaa', 'pirae', 'punaauia', 'mahina', 'paea', 'hitiaa-o-te-ra'],
+  lunel: ['centre-ville', 'saint-just', 'lunel-viel', 'marsillargues', 'valergues', 'entre-vignes', 'lansargues'],
+  'la-garde': ['centre-ville', 'la-valette-du-var', 'le-pradet', 'la-farlede', 'carqueiranne', 'sollies-ville', 'toulon'],
+  elancourt: ['centre-ville', 'trappes', 'la-verriere', 'maurepas', 'jouars-pontchartrain', 'plaisir', 'le-mesnil-saint-denis'],
+  saumur: ['centre-ville', 'vivy', 'allonnes', 'bellevigne-les-chateaux', 'brain-sur-allonnes', 'gennes-val-de-loire', 'longue-jumelles'],
+  vertou: ['centre-ville', 'les-sorinieres', 'chateau-thebaud', 'la-haie-fouassiere', 'haute-goulaine', 'saint-sebastien-sur-loire', 'le-bignon'],
+  aurillac: ['centre-ville', 'naucelles', 'arpajon-sur-cere', 'ytrac', 'jussac'],
+  eaubonne: ['centre-ville', 'margency', 'ermont', 'soisy-sous-montmorency', 'saint-gratien', 'andilly', 'montlignon'],
+  biarritz: ['centre-ville', 'la-negresse', 'saint-charles', 'milady'],
+  miramas: ['centre-ville', 'grans', 'saint-chamas', 'istres', 'salon-de-provence', 'saint-martin-de-crau', 'lancon-provence'],
+  muret: ['centre-ville', 'le-fauga', 'eaunes', 'labastidette', 'lherm', 'seysses', 'saubens'],
+  'castelnau-le-lez': ['centre-ville', 'le-cres', 'jacou', 'clapiers', 'montpellier', 'saint-aunes', 'vendargues'],
+  'villeneuve-la-garenne': ['centre-ville', 'gennevilliers', 'asnieres-sur-seine', 'clichy', 'bois-colombes', 'levallois-perret', 'colombes'],
+  'les-ulis': ['centre-ville', 'orsay', 'bures-sur-yvette', 'villejust', 'gometz-le-chatel', 'marcoussis', 'villebon-sur-yvette'],
+  'les-pavillons-sous-bois': ['centre-ville', 'bondy', 'le-raincy', 'villemomble', 'livry-gargan', 'clichy-sous-bois', 'rosny-sous-bois'],
+  sevremoine: ['centre-ville', 'la-romagne', 'la-seguiniere', 'saint-christophe-du-bois', 'begrolles-en-mauges', 'saint-leger-sous-cholet', 'beaupreau-en-mauges'],
+  'le-grand-quevilly': ['centre-ville', 'le-petit-quevilly', 'canteleu', 'petit-couronne', 'sotteville-les-rouen', 'saint-etienne-du-rouvray', 'rouen'],
+  lormont: ['centre-ville', 'cenon', 'artigues-pres-bordeaux', 'carbon-blanc', 'bassens', 'yvrac', 'sainte-eulalie'],
+  'henin-beaumont': ['centre-ville', 'montigny-en-gohelle', 'noyelles-godault', 'dourges', 'billy-montigny', 'drocourt', 'fouquieres-les-lens'],
+  brunoy: ['centre-ville', 'epinay-sous-senart', 'yerres', 'boussy-saint-antoine', 'quincy-sous-senart', 'montgeron', 'crosne'],
+  cavaillon: ['centre-ville', 'taillades', 'robion', 'caumont-sur-durance', 'l-isle-sur-la-sorgue', 'le-thor', 'cheval-blanc'],
+  'saint-ouen-l-aumone': ['centre-ville', 'pontoise', 'mery-sur-oise', 'eragny', 'ennery', 'pierrelaye', 'herblay-sur-seine'],
+  'sainte-suzanne': ['centre-ville', 'saint-andre', 'sainte-marie', 'bras-panon', 'salazie', 'saint-denis', 'saint-benoit'],
+  alencon: ['centre-ville', 'damigny', 'saint-germain-du-corbeis', 'conde-sur-sarthe', 'sees'],
+  saintes: ['centre-ville', 'saint-pallais', 'bellevue', 'recouvrance'],
+  'le-mont-dore': ['centre-ville', 'boulari', 'la-coulee', 'plum'],
+  vernon: ['centre-ville', 'saint-marcel', 'la-chapelle-longueville', 'gasny', 'pacy-sur-eure', 'vexin-sur-epte', 'saint-aubin-sur-gaillon'],
+  bethune: ['centre-ville', 'annezin', 'verquin', 'vendin-les-bethune', 'beuvry', 'locon', 'labourse'],
+  vichy: ['centre-ville', 'les-ailes', 'croix-saint-martin', 'france'],
+  'le-bouscat': ['centre-ville', 'bordeaux', 'bruges', 'eysines', 'blanquefort', 'cenon', 'talence'],
+  vierzon: ['centre-ville', 'mereau', 'foecy', 'vignoux-sur-barangeon', 'mehun-sur-yevre', 'saint-martin-d-auxigny'],
+  libourne: ['centre-ville', 'arveyres', 'genissac', 'vayres', 'saint-denis-de-pile', 'galgon', 'izon'],
+  eysines: ['centre-ville', 'le-haillan', 'bruges', 'le-bouscat', 'le-taillan-medoc', 'bordeaux', 'blanquefort'],
+  kourou: ['centre-ville', 'village-saramaca', 'les-roches', 'zone-industrielle'],
+  montbeliard: ['centre-ville', 'petite-hollande', 'chiffogne', 'les-fougeres'],
+  'petit-bourg': ['centre-ville', 'goyave', 'lamentin', 'baie-mahault', 'bouillante', 'vieux-habitants', 'pointe-noire'],
+  orly: ['centre-ville', 'villeneuve-le-roi', 'ablon-sur-seine', 'thiais', 'choisy-le-roi', 'villeneuve-saint-georges', 'rungis'],
+  laon: ['centre-ville', 'athies-sous-laon', 'anizy-le-grand', 'saint-gobain', 'vailly-sur-aisne', 'la-fere', 'beautor'],
+  frontignan: ['centre-ville', 'balaruc-le-vieux', 'balaruc-les-bains', 'gigean', 'vic-la-gardiole', 'mireval', 'poussan'],
+  'le-kremlin-bicetre': ['centre-ville', 'gentilly', 'villejuif', 'arcueil', 'ivry-sur-seine', 'cachan', 'vitry-sur-seine'],
+  coueron: ['centre-ville', 'saint-etienne-de-montluc', 'saint-jean-de-boiseau', 'sautron', 'le-pellerin', 'indre', 'la-montagne'],
+  'fontenay-aux-roses': ['centre-ville', 'chatillon', 'sceaux', 'bagneux', 'le-plessis-robinson', 'bourg-la-reine', 'clamart'],
+  montgeron: ['centre-ville', 'vigneux-sur-seine', 'crosne', 'yerres', 'brunoy', 'draveil', 'epinay-sous-senart'],
+  'beaupreau-en-mauges': ['centre-ville', 'montrevault-sur-evre', 'begrolles-en-mauges', 'le-may-sur-evre', 'saint-leger-sous-cholet', 'la-seguiniere', 'sevremoine'],
+  rodez: ['centre-ville', 'bourran', 'saint-eloi', 'olemps'],
+  'sainte-anne': ['centre-ville', 'le-moule', 'le-gosier', 'les-abymes', 'morne-a-l-eau', 'saint-francois', 'pointe-a-pitre'],
+  'les-lilas': ['centre-ville', 'le-pre-saint-gervais', 'romainville', 'bagnolet', 'pantin', 'noisy-le-sec', 'montreuil'],
+  dole: ['centre-ville', 'foucherans', 'damparis', 'tavaux'],
+  'la-valette-du-var': ['centre-ville', 'la-garde', 'sollies-ville', 'la-farlede', 'toulon', 'le-revest-les-eaux', 'le-pradet'],
+  'dammarie-les-lys': ['centre-ville', 'la-rochette', 'le-mee-sur-seine', 'boissise-le-roi', 'melun', 'chailly-en-biere', 'pringy'],
+  olivet: ['centre-ville', 'orleans', 'saint-pryve-saint-mesmin', 'saint-jean-le-blanc', 'saint-hilaire-saint-mesmin', 'la-chapelle-saint-mesmin', 'saint-jean-de-la-ruelle'],
+  'herouville-saint-clair': ['centre-ville', 'epron', 'colombelles', 'blainville-sur-orne', 'caen', 'mondeville', 'bieville-beuville'],
+  rochefort: ['centre-ville', 'martrou', 'la-vieille-paroisse', 'liberation'],
+  'combs-la-ville': ['centre-ville', 'lieusaint', 'moissy-cramayel', 'brie-comte-robert', 'evry-gregy-sur-yerre', 'servon', 'reau'],
+  lanester: ['centre-ville', 'locmiquelic', 'lorient', 'caudan', 'kervignac', 'riantec', 'hennebont'],
+  'roissy-en-brie': ['centre-ville', 'croissy-beaubourg', 'pontcarre', 'ozoir-la-ferriere', 'pontault-combault', 'collegien', 'ferrieres-en-brie'],
+  'tassin-la-demi-lune': ['centre-ville', 'charbonnieres-les-bains', 'saint-genis-les-ollieres', 'ecully', 'craponne', 'francheville', 'marcy-l-etoile'],
+  'saint-jean-de-braye': ['centre-ville', 'semoy', 'boigny-sur-bionne', 'fleury-les-aubrais', 'checy', 'saint-denis-en-val', 'saint-jean-le-blanc'],
+  'deuil-la-barre': ['centre-ville', 'montmagny', 'enghien-les-bains', 'groslay', 'montmorency', 'soisy-sous-montmorency', 'saint-gratien'],
+  'maisons-laffitte': ['centre-ville', 'sartrouville', 'le-mesnil-le-roi', 'houilles', 'montesson', 'saint-germain-en-laye', 'carrieres-sur-seine'],
+  'le-moule': ['centre-ville', 'sainte-anne', 'petit-canal', 'saint-francois', 'morne-a-l-eau', 'les-abymes', 'port-louis'],
+  'velizy-villacoublay': ['centre-ville', 'viroflay', 'jouy-en-josas', 'buc', 'versailles', 'le-chesnay-rocquencourt', 'la-celle-saint-cloud'],
+  challans: ['centre-ville', 'soullans', 'la-garnache', 'commequiers', 'froidfond', 'saint-christophe-du-ligneron', 'sallertaine'],
+  'saint-dizier': ['centre-ville', 'eclaron-braucourt-sainte-liviere', 'wassy', 'la-porte-du-der'],
+  torcy: ['centre-ville', 'vaires-sur-marne', 'noisiel', 'lognes', 'saint-thibault-des-vignes', 'collegien', 'champs-sur-marne'],
+  manosque: ['centre-ville', 'saint-lazare', 'les-plantiers', 'la-rochette'],
+  loos: ['centre-ville', 'emmerin', 'haubourdin', 'wattignies', 'sequedin', 'lille', 'faches-thumesnil'],
+  'gif-sur-yvette': ['centre-ville', 'bures-sur-yvette', 'gometz-le-chatel', 'orsay', 'les-ulis', 'saclay', 'villejust'],
+  'les-pennes-mirabeau': ['centre-ville', 'septemes-les-vallons', 'saint-victoret', 'cabries', 'vitrolles', 'le-rove', 'gignac-la-nerthe'],
+  oyonnax: ['centre-ville', 'bellignat', 'arbent', 'dortan', 'izernore', 'montreal-la-cluse', 'nantua'],
+  'montigny-les-cormeilles': ['centre-ville', 'beauchamp', 'franconville', 'la-frette-sur-seine', 'cormeilles-en-parisis', 'herblay-sur-seine', 'le-plessis-bouchard'],
+  auch: ['centre-ville', 'pavie', 'mirande', 'fleurance'],
+  abbeville: ['centre-ville', 'saint-valery-sur-somme', 'feuquieres-en-vimeu', 'airaines', 'fressenneville', 'friville-escarbotin', 'flixecourt'],
+  'villeneuve-sur-lot': ['centre-ville', 'saint-sylvestre-sur-lot', 'bias', 'pujols', 'penne-d-agenais', 'monflanquin', 'casseneuil'],
+  'mantes-la-ville': ['centre-ville', 'magnanville', 'buchelay', 'limay', 'mantes-la-jolie', 'guerville', 'porcheville'],
+  sevres: ['centre-ville', 'chaville', 'ville-d-avray', 'saint-cloud', 'meudon', 'garches', 'boulogne-billancourt'],
+  'montereau-fault-yonne': ['centre-ville', 'varennes-sur-seine', 'cannes-ecluse', 'saint-germain-laval', 'la-grande-paroisse', 'vernou-la-celle-sur-seine', 'saint-mammes'],
+  acheres: ['centre-ville', 'conflans-sainte-honorine', 'andresy', 'maisons-laffitte', 'maurecourt', 'chanteloup-les-vignes', 'saint-germain-en-laye'],
+  'le-petit-quevilly': ['centre-ville', 'le-grand-quevilly', 'sotteville-les-rouen', 'canteleu', 'rouen', 'deville-les-rouen', 'petit-couronne'],
+  arcueil: ['centre-ville', 'gentilly', 'cachan', 'le-kremlin-bicetre', 'villejuif', 'l-hay-les-roses', 'ivry-sur-seine'],
+  epernay: ['centre-ville', 'bernon', 'clara-zetkin', 'maison-blanche'],
+  'gujan-mestras': ['centre-ville', 'le-teich', 'la-teste-de-buch', 'arcachon', 'biganos', 'mios', 'salles'],
+  dax: ['centre-ville', 'sablar', 'saint-pierre', 'saint-vincent-de-xaintes'],
+  millau: ['centre-ville', 'la-cavalerie', 'severac-d-aveyron'],
+  fontaine: ['centre-ville', 'seyssinet-pariset', 'sassenage', 'grenoble', 'saint-martin-le-vinoux', 'seyssins', 'saint-egreve'],
+  'chemille-en-anjou': ['centre-ville', 'val-du-layon', 'bellevigne-en-layon', 'trementines', 'rochefort-sur-loire', 'chalonnes-sur-loire', 'le-may-sur-evre'],
+  longjumeau: ['centre-ville', 'chilly-mazarin', 'epinay-sur-orge', 'morangis', 'ballainvilliers', 'champlan', 'saulx-les-chartreux'],
+  'neuilly-plaisance': ['centre-ville', 'rosny-sous-bois', 'neuilly-sur-marne', 'villemomble', 'gagny', 'le-raincy', 'montreuil'],
+  hazebrouck: ['centre-ville', 'morbecque', 'vieux-berquin', 'cassel', 'blaringhem', 'meteren', 'godewaersvelde'],
+  'nogent-sur-oise': ['centre-ville', 'monchy-saint-eloi', 'villers-saint-paul', 'creil', 'montataire', 'laigneville', 'cauffry'],
+  voiron: ['centre-ville', 'coublevie', 'saint-etienne-de-crossey', 'chirens', 'saint-jean-de-moirans', 'la-buisse', 'moirans'],
+  'fleury-les-aubrais': ['centre-ville', 'saran', 'semoy', 'saint-jean-de-braye', 'saint-jean-de-la-ruelle', 'saint-jean-le-blanc', 'boigny-sur-bionne'],
+  'la-madeleine': ['centre-ville', 'saint-andre-lez-lille', 'marquette-lez-lille', 'mons-en-bar-ul', 'lille', 'lambersart', 'marcq-en-bar-ul'],
+  'saint-michel-sur-orge': ['centre-ville', 'sainte-genevieve-des-bois', 'longpont-sur-orge', 'villiers-sur-orge', 'villemoisson-sur-orge', 'montlhery', 'le-plessis-pate'],
+  montmorency: ['centre-ville', 'soisy-sous-montmorency', 'saint-brice-sous-foret', 'groslay', 'andilly', 'deuil-la-barre', 'margency'],
+  'montigny-les-metz': ['centre-ville', 'longeville-les-metz', 'moulins-les-metz', 'le-ban-saint-martin', 'metz', 'scy-chazelles', 'marly'],
+  'sainte-foy-les-lyon': ['centre-ville', 'la-mulatiere', 'francheville', 'oullins-pierre-benite', 'lyon', 'tassin-la-demi-lune', 'chaponost'],
+  'morsang-sur-orge': ['centre-ville', 'villemoisson-sur-orge', 'viry-chatillon', 'sainte-genevieve-des-bois', 'grigny', 'epinay-sur-orge', 'fleury-merogis'],
+  'mandelieu-la-napoule': ['centre-ville', 'pegomas', 'la-roquette-sur-siagne', 'cannes', 'le-cannet', 'auribeau-sur-siagne', 'mougins'],
+  gardanne: ['centre-ville', 'meyreuil', 'mimet', 'fuveau', 'bouc-bel-air', 'greasque', 'simiane-collongue'],
+  'le-robert': ['centre-ville', 'le-francois', 'la-trinite', 'le-lamentin', 'gros-morne', 'ducos', 'saint-joseph'],
+  'lagny-sur-marne': ['centre-ville', 'saint-thibault-des-vignes', 'thorigny-sur-marne', 'pomponne', 'chanteloup-en-brie', 'montevrain', 'dampmart'],
+  allauch: ['centre-ville', 'plan-de-cuques', 'cadolive', 'saint-savournin', 'peypin', 'mimet', 'roquevaire'],
+  'bruay-la-buissiere': ['centre-ville', 'haillicourt', 'marles-les-mines', 'lapugnoy', 'divion', 'houdain', 'calonne-ricouart'],
+  givors: ['centre-ville', 'grigny-sur-rhone', 'beauvallon', 'ternay', 'loire-sur-rhone', 'montagny', 'millery'],
+  'saint-gratien': ['centre-ville', 'enghien-les-bains', 'sannois', 'soisy-sous-montmorency', 'eaubonne', 'ermont', 'deuil-la-barre'],
+  'saint-cyr-l-ecole': ['centre-ville', 'fontenay-le-fleury', 'bois-d-arcy', 'bailly', 'guyancourt', 'versailles', 'montigny-le-bretonneux'],
+  'ozoir-la-ferriere': ['centre-ville', 'roissy-en-brie', 'gretz-armainvilliers', 'pontcarre', 'lesigny', 'chevry-cossigny', 'pontault-combault'],
+  'saint-genis-laval': ['centre-ville', 'oullins-pierre-benite', 'irigny', 'brignais', 'chaponost', 'vourles', 'charly'],
+  'montaigu-vendee': ['centre-ville', 'treize-septiers', 'la-boissiere-de-montaigu', 'cugand-la-bernardiere', 'l-herbergement', 'la-bruffiere', 'les-brouzils'],
+  'le-plessis-trevise': ['centre-ville', 'chennevieres-sur-marne', 'villiers-sur-marne', 'la-queue-en-brie', 'ormesson-sur-marne', 'noiseau', 'champigny-sur-marne'],
+  'mons-en-bar-ul': ['centre-ville', 'la-madeleine', 'wasquehal', 'lezennes', 'villeneuve-d-ascq', 'marcq-en-bar-ul', 'lille'],
+  'plaisance-du-touch': ['centre-ville', 'la-salvetat-saint-gilles', 'tournefeuille', 'fonsorbes', 'frouzins', 'leguevin', 'cugnaux'],
+  'saint-mande': ['centre-ville', 'vincennes', 'charenton-le-pont', 'saint-maurice', 'ivry-sur-seine', 'fontenay-sous-bois', 'joinville-le-pont'],
+  'bourg-la-reine': ['centre-ville', 'sceaux', 'bagneux', 'fontenay-aux-roses', 'chatillon', 'antony', 'montrouge'],
+  'villeneuve-le-roi': ['centre-ville', 'orly', 'ablon-sur-seine', 'villeneuve-saint-georges', 'thiais', 'choisy-le-roi', 'valenton'],
+  carquefou: ['centre-ville', 'thouare-sur-loire', 'sainte-luce-sur-loire', 'mauves-sur-loire', 'saint-mars-du-desert', 'la-chapelle-sur-erdre', 'suce-sur-erdre'],
+  sceaux: ['centre-ville', 'bourg-la-reine', 'fontenay-aux-roses', 'bagneux', 'chatenay-malabry', 'le-plessis-robinson', 'antony'],
+  concarneau: ['centre-ville', 'melgven', 'la-foret-fouesnant', 'saint-yvi', 'tregunc', 'rosporden', 'pont-aven'],
+  chaumont: ['centre-ville', 'nogent'],
+  lingolsheim: ['centre-ville', 'ostwald', 'holtzheim', 'eckbolsheim', 'wolfisheim', 'entzheim', 'oberschaeffolsheim'],
+  'carrieres-sous-poissy': ['centre-ville', 'villennes-sur-seine', 'poissy', 'chanteloup-les-vignes', 'triel-sur-seine', 'andresy', 'vernouillet'],
+  'coudekerque-branche': ['centre-ville', 'cappelle-la-grande', 'teteghem-coudekerque-village', 'dunkerque', 'leffrinckoucke', 'armbouts-cappel', 'bergues'],
+  wasquehal: ['centre-ville', 'croix', 'marcq-en-bar-ul', 'mons-en-bar-ul', 'mouvaux', 'roubaix', 'bondues'],
+  halluin: ['centre-ville', 'neuville-en-ferrain', 'roncq', 'bousbecque', 'wervicq-sud', 'linselles', 'tourcoing'],
+  'la-chapelle-sur-erdre': ['centre-ville', 'treillieres', 'orvault', 'suce-sur-erdre', 'carquefou', 'nantes', 'grandchamp-des-fontaines'],
+  denain: ['centre-ville', 'haulchin', 'haveluy', 'douchy-les-mines', 'lourches', 'escaudain', 'prouvy'],
+  cugnaux: ['centre-ville', 'villeneuve-tolosane', 'tournefeuille', 'frouzins', 'roques', 'portet-sur-garonne', 'plaisance-du-touch'],
+  maurepas: ['centre-ville', 'jouars-pontchartrain', 'coignieres', 'la-verriere', 'elancourt', 'le-mesnil-saint-denis', 'neauphle-le-chateau'],
+  chaville: ['centre-ville', 'ville-d-avray', 'sevres', 'meudon', 'vaucresson', 'saint-cloud', 'garches'],
+  croix: ['centre-ville', 'wasquehal', 'roubaix', 'mouvaux', 'hem', 'marcq-en-bar-ul', 'villeneuve-d-ascq'],
+  bouguenais: ['centre-ville', 'reze', 'saint-aignan-grandlieu', 'bouaye', 'indre', 'la-montagne', 'saint-herblain'],
+  'joinville-le-pont': ['centre-ville', 'saint-maurice', 'nogent-sur-marne', 'saint-maur-des-fosses', 'maisons-alfort', 'fontenay-sous-bois', 'le-perreux-sur-marne'],
+  'le-creusot': ['centre-ville', 'torcy', 'le-breuil', 'montchanin', 'blanzy', 'montceau-les-mines', 'autun'],
+  forbach: ['centre-ville', 'ting', 'stiring-wendel', 'sch-neck', 'petite-rosselle', 'morsbach', 'behren-les-forbach'],
+  'la-celle-saint-cloud': ['centre-ville', 'bougival', 'louveciennes', 'le-chesnay-rocquencourt', 'croissy-sur-seine', 'marly-le-roi', 'le-port-marly'],
+  'mitry-mory': ['centre-ville', 'villeparisis', 'claye-souilly', 'courtry', 'juilly', 'villevaude', 'longperrier'],
+  'chilly-mazarin': ['centre-ville', 'longjumeau', 'morangis', 'champlan', 'wissous', 'savigny-sur-orge', 'epinay-sur-orge'],
+  beaune: ['centre-ville', 'nuits-saint-georges', 'seurre', 'gevrey-chambertin'],
+  lannion: ['centre-ville', 'louannec', 'ploubezre', 'pleumeur-bodou', 'ploumilliau', 'trebeurden', 'tregastel'],
+  fougeres: ['centre-ville', 'lecousse', 'javene', 'romagne', 'saint-germain-en-cogles', 'la-chapelle-fleurigne', 'maen-roch'],
+  'l-isle-sur-la-sorgue': ['centre-ville', 'le-thor', 'velleron', 'cavaillon', 'pernes-les-fontaines', 'robion', 'caumont-sur-durance'],
+  'grande-synthe': ['centre-ville', 'dunkerque', 'armbouts-cappel', 'loon-plage', 'cappelle-la-grande', 'coudekerque-branche', 'bourbourg'],
+  'mont-saint-aignan': ['centre-ville', 'deville-les-rouen', 'bois-guillaume', 'notre-dame-de-bondeville', 'rouen', 'bihorel', 'maromme'],
+  sarreguemines: ['centre-ville', 'hambach', 'woustviller', 'grosbliederstroff', 'alsting', 'behren-les-forbach', 'spicheren'],
+  cahors: ['centre-historique', 'cabessut', 'terre-rouge', 'sainte-valerie'],
+  bruges: ['centre-ville', 'le-bouscat', 'bordeaux', 'eysines', 'blanquefort', 'bassens', 'le-taillan-medoc'],
+  'bourg-les-valence': ['centre-ville', 'saint-marcel-les-valence', 'valence', 'la-roche-de-glun', 'pont-de-l-isere', 'chateauneuf-sur-isere', 'malissard'],
+  albertville: ['centre-ville', 'grignon', 'gilly-sur-isere', 'mercury', 'la-bathie', 'ugine', 'val-d-arc'],
+  bressuire: ['centre-ville', 'courlay', 'argentonnay', 'nueil-les-aubiers', 'la-chapelle-saint-laurent', 'cerizay', 'la-foret-sur-sevre'],
+  gentilly: ['centre-ville', 'arcueil', 'le-kremlin-bicetre', 'cachan', 'villejuif', 'ivry-sur-seine', 'l-hay-les-roses'],
+  'cournon-d-auvergne': ['centre-ville', 'le-cendre', 'lempdes', 'perignat-les-sarlieve', 'orcet', 'mur-sur-allier', 'aubiere'],
+  vence: ['centre-ville', 'saint-jeannet', 'saint-paul-de-vence', 'la-gaude', 'tourrettes-sur-loup', 'la-colle-sur-loup', 'gattieres'],
+  macouria: ['centre-ville', 'cayenne', 'montsinery-tonnegrande', 'matoury'],
+  'chevilly-larue': ['centre-ville', 'l-hay-les-roses', 'rungis', 'fresnes', 'thiais', 'villejuif', 'cachan'],
+  ronchin: ['centre-ville', 'faches-thumesnil', 'lezennes', 'lesquin', 'wattignies', 'templemars', 'lille'],
+  mougins: ['centre-ville', 'le-cannet', 'mouans-sartoux', 'valbonne', 'la-roquette-sur-siagne', 'vallauris', 'cannes'],
+  bruz: ['centre-ville', 'pont-pean', 'chartres-de-bretagne', 'chavagne', 'saint-jacques-de-la-lande', 'laille', 'goven'],
+  lisieux: ['centre-ville', 'valorbiquet', 'livarot-pays-d-auge', 'pont-l-eveque', 'mezidon-vallee-d-auge', 'dozule', 'saint-pierre-en-auge'],
+  selestat: ['centre-ville', 'scherwiller', 'muttersholtz', 'ebersheim', 'chatenois', 'dambach-la-ville', 'hilsenheim'],
+  'la-crau': ['centre-ville', 'sollies-pont', 'la-farlede', 'sollies-ville', 'la-garde', 'carqueiranne', 'cuers'],
+  pertuis: ['centre-ville', 'la-tour-d-aigues', 'villelaure', 'cadenet', 'lauris', 'apt'],
+  'le-mee-sur-seine': ['centre-ville', 'melun', 'vert-saint-denis', 'dammarie-les-lys', 'la-rochette', 'cesson', 'rubelles'],
+  'sch-lcher': ['centre-ville', 'case-pilote', 'fort-de-france', 'saint-joseph', 'le-carbet', 'gros-morne', 'le-lamentin'],
+  'saint-lo': ['centre-ville', 'agneaux', 'conde-sur-vire', 'bourgvallees', 'saint-jean-d-elle', 'marigny-le-lozon', 'saint-amand-villages'],
+  villefontaine: ['centre-ville', 'la-verpilliere', 'vaulx-milieu', 'saint-quentin-fallavier', 'roche', 'frontonas', 'l-isle-d-abeau'],
+  royan: ['centre-ville', 'pontaillac', 'foncillon', 'conche-du-chay'],
+  vitre: ['centre-ville', 'etrelles', 'balaze', 'argentre-du-plessis', 'val-d-ize', 'saint-didier', 'domalain'],
+  'juvisy-sur-orge': ['centre-ville', 'savigny-sur-orge', 'athis-mons', 'viry-chatillon', 'morangis', 'paray-vieille-poste', 'grigny'],
+  'saint-fons': ['centre-ville', 'venissieux', 'feyzin', 'oullins-pierre-benite', 'irigny', 'saint-genis-laval', 'la-mulatiere'],
+  'saint-die-des-vosges': ['centre-ville', 'sainte-marguerite', 'saulcy-sur-meurthe', 'moyenmoutier', 'etival-clairefontaine', 'senones', 'raon-l-etape'],
+  moulins: ['centre-ville', 'avermes', 'yzeure', 'bourbon-l-archambault'],
+  sorgues: ['centre-ville', 'le-pontet', 'bedarrides', 'chateauneuf-du-pape', 'vedene', 'entraigues-sur-la-sorgue', 'althen-des-paluds'],
+  'brie-comte-robert': ['centre-ville', 'servon', 'combs-la-ville', 'evry-gregy-sur-yerre', 'grisy-suisnes', 'chevry-cossigny', 'lesigny'],
+  ploemeur: ['centre-ville', 'larmor-plage', 'lorient', 'queven', 'guidel', 'port-louis', 'gestel'],
+  riom: ['centre-ville', 'mozac', 'saint-bonnet-pres-riom', 'chateaugay', 'chatel-guyon', 'saint-beauzire', 'ennezat'],
+  meylan: ['centre-ville', 'montbonnot-saint-martin', 'corenc', 'la-tronche', 'biviers', 'gieres', 'domene'],
+  'cesson-sevigne': ['centre-ville', 'thorigne-fouillard', 'chantepie', 'acigne', 'rennes', 'domloup', 'betton'],
+  pornic: ['centre-ville', 'chauve', 'la-bernerie-en-retz', 'saint-michel-chef-chef', 'la-plaine-sur-mer', 'chaumes-en-retz', 'saint-pere-en-retz'],
+  'chennevieres-sur-marne': ['centre-ville', 'ormesson-sur-marne', 'noiseau', 'le-plessis-trevise', 'sucy-en-brie', 'champigny-sur-marne', 'la-queue-en-brie'],
+  louviers: ['centre-ville', 'le-vaudreuil', 'val-de-reuil', 'pont-de-l-arche', 'pitres', 'le-val-d-hazey', 'clef-vallee-d-eure'],
+  'mauges-sur-loire': ['centre-ville', 'ingrandes-le-fresne-sur-loire', 'chalonnes-sur-loire', 'montrevault-sur-evre', 'saint-georges-sur-loire', 'beaupreau-en-mauges', 'la-possonniere'],
+  lamentin: ['centre-ville', 'sainte-rose', 'baie-mahault', 'petit-bourg', 'pointe-noire', 'pointe-a-pitre', 'goyave'],
+  'faches-thumesnil': ['centre-ville', 'ronchin', 'wattignies', 'templemars', 'lesquin', 'lezennes', 'loos'],
+  hem: ['centre-ville', 'villeneuve-d-ascq', 'lys-lez-lannoy', 'toufflers', 'croix', 'willems', 'roubaix'],
+  bischheim: ['centre-ville', 'h-nheim', 'schiltigheim', 'souffelweyersheim', 'reichstett', 'mundolsheim', 'mittelhausbergen'],
+  'le-puy-en-velay': ['centre-ville', 'brives-charensac', 'vals-pres-le-puy', 'chadrac', 'espaly-saint-marcel', 'coubon', 'polignac'],
+  'sanary-sur-mer': ['centre-ville', 'bandol', 'ollioules', 'six-fours-les-plages', 'le-beausset', 'saint-cyr-sur-mer', 'evenos'],
+  cognac: ['centre-ville', 'saint-martin', 'crouin', 'la-chaudronne'],
+  'moissy-cramayel': ['centre-ville', 'reau', 'lieusaint', 'combs-la-ville', 'evry-gregy-sur-yerre', 'savigny-le-temple', 'nandy'],
+  'bry-sur-marne': ['centre-ville', 'le-perreux-sur-marne', 'villiers-sur-marne', 'champigny-sur-marne', 'nogent-sur-marne', 'fontenay-sous-bois', 'joinville-le-pont'],
+  'chateauneuf-les-martigues': ['centre-ville', 'carry-le-rouet', 'ensues-la-redonne', 'sausset-les-pins', 'marignane', 'gignac-la-nerthe', 'martigues'],
+  eragny: ['centre-ville', 'neuville-sur-oise', 'pontoise', 'saint-ouen-l-aumone', 'cergy', 'herblay-sur-seine', 'pierrelaye'],
+  'le-pontet': ['centre-ville', 'vedene', 'avignon', 'sorgues', 'morieres-les-avignon', 'entraigues-sur-la-sorgue', 'saint-saturnin-les-avignon'],
+  'romorantin-lanthenay': ['centre-ville', 'pruniers-en-sologne', 'villefranche-sur-cher', 'gievres', 'selles-sur-cher', 'salbris', 'cour-cheverny'],
+  floirac: ['centre-ville', 'bouliac', 'cenon', 'begles', 'artigues-pres-bordeaux', 'tresses', 'carignan-de-bordeaux'],
+  'bonneuil-sur-marne': ['centre-ville', 'limeil-brevannes', 'saint-maur-des-fosses', 'sucy-en-brie', 'creteil', 'valenton', 'ormesson-sur-marne'],
+  luneville: ['centre-ville', 'chanteheux', 'blainville-sur-l-eau', 'damelevieres', 'dombasle-sur-meurthe', 'rosieres-aux-salines', 'varangeville'],
+  'moorea-maiao': ['centre-ville'],
+  'bagnols-sur-ceze': ['centre-ville', 'laudun-l-ardoise', 'pont-saint-esprit', 'saint-victor-la-coste', 'saint-laurent-des-arbres', 'saint-genies-de-comolas', 'roquemaure'],
+  ducos: ['centre-ville', 'saint-esprit', 'le-lamentin', 'riviere-salee', 'le-francois', 'les-trois-ilets', 'sainte-luce'],
+  hendaye: ['centre-ville', 'urrugne', 'ciboure', 'saint-jean-de-luz', 'ascain', 'sare', 'saint-pee-sur-nivelle'],
+  pontarlier: ['centre-ville', 'doubs', 'val-d-usiers', 'levier', 'montlebon', 'morteau', 'orchamps-vennes'],
+  'soisy-sous-montmorency': ['centre-ville', 'montmorency', 'eaubonne', 'margency', 'enghien-les-bains', 'andilly', 'saint-gratien'],
+  'saint-egreve': ['centre-ville', 'saint-martin-le-vinoux', 'sassenage', 'fontanil-cornillon', 'fontaine', 'noyarey', 'la-tronche'],
+  'digne-les-bains': ['centre-ville', 'malijai', 'chateau-arnoux-saint-auban'],
+  osny: ['centre-ville', 'boissy-l-aillerie', 'pontoise', 'cergy', 'ennery', 'vaureal', 'courdimanche'],
+  ecully: ['centre-ville', 'champagne-au-mont-d-or', 'charbonnieres-les-bains', 'tassin-la-demi-lune', 'dardilly', 'saint-didier-au-mont-d-or', 'saint-genis-les-ollieres'],
+  carvin: ['centre-ville', 'libercourt', 'meurchin', 'courrieres', 'oignies', 'pont-a-vendin', 'harnes'],
+  'saint-maximin-la-sainte-baume': ['centre-ville', 'tourves', 'seillons-source-d-argens', 'bras', 'nans-les-pins', 'pourrieres', 'saint-zacharie'],
+  limay: ['centre-ville', 'mantes-la-ville', 'porcheville', 'mantes-la-jolie', 'issou', 'guerville', 'buchelay'],
+  'jouy-le-moutier': ['centre-ville', 'neuville-sur-oise', 'vaureal', 'cergy', 'courdimanche', 'menucourt', 'eragny'],
+  brignoles: ['centre-ville', 'forcalqueiret', 'gareoult', 'le-val', 'sainte-anastasie-sur-issole', 'rocbaron', 'la-roquebrussanne'],
+  dzaoudzi: ['centre-ville', 'pamandzi', 'mamoudzou', 'koungou', 'dembeni', 'tsingoni', 'ouangani'],
+  cluses: ['centre-ville', 'scionzier', 'marnaz', 'thyez', 'marignier', 'magland', 'taninges'],
+  balma: ['centre-ville', 'flourens', 'quint-fonsegrives', 'montrabe', 'l-union', 'toulouse', 'saint-jean'],
+  garches: ['centre-ville', 'saint-cloud', 'vaucresson', 'rueil-malmaison', 'ville-d-avray', 'sevres', 'suresnes'],
+  'sainte-rose': ['centre-ville', 'lamentin', 'baie-mahault', 'deshaies', 'pointe-noire', 'petit-bourg', 'pointe-a-pitre'],
+  'capesterre-belle-eau': ['centre-ville', 'trois-rivieres', 'saint-claude', 'goyave', 'gourbeyre', 'baillif', 'vieux-habitants'],
+  'segre-en-anjou-bleu': ['centre-ville', 'le-lion-d-angers', 'erdre-en-anjou', 'ombree-d-anjou', 'cande', 'longuenee-en-anjou', 'saint-clement-de-la-place'],
+  'ambares-et-lagrave': ['centre-ville', 'saint-louis-de-montferrand', 'cubzac-les-ponts', 'bassens', 'carbon-blanc', 'sainte-eulalie', 'parempuyre'],
+  'villeneuve-loubet': ['centre-ville', 'biot', 'roquefort-les-pins', 'la-colle-sur-loup', 'cagnes-sur-mer', 'saint-paul-de-vence', 'valbonne'],
+  'l-isle-d-abeau': ['centre-ville', 'vaulx-milieu', 'saint-alban-de-roche', 'bourgoin-jallieu', 'frontonas', 'villefontaine', 'la-verpilliere'],
+  chamalieres: ['centre-ville', 'royat', 'beaumont', 'ceyrat', 'nohanent', 'clermont-ferrand', 'orcines'],
+  'vire-normandie': ['centre-ville', 'noues-de-sienne', 'valdalliere', 'souleuvre-en-bocage', 'conde-en-normandie', 'les-monts-d-aunay'],
+  avion: ['centre-ville', 'eleu-dit-leauwette', 'vimy', 'mericourt', 'sallaumines', 'givenchy-en-gohelle', 'lens'],
+  yutz: ['centre-ville', 'manom', 'basse-ham', 'thionville', 'bertrange', 'terville', 'florange'],
+  lattes: ['centre-ville', 'perols', 'palavas-les-flots', 'montpellier', 'saint-jean-de-vedas', 'villeneuve-les-maguelone', 'castelnau-le-lez'],
+  marmande: ['centre-ville', 'sainte-bazeille', 'miramont-de-guyenne', 'tonneins', 'casteljaloux', 'clairac'],
+  'boissy-saint-leger': ['centre-ville', 'marolles-en-brie', 'limeil-brevannes', 'villecresnes', 'sucy-en-brie', 'bonneuil-sur-marne', 'santeny'],
+  sallanches: ['centre-ville', 'domancy', 'combloux', 'magland', 'le-grand-bornand', 'megeve', 'passy'],
+  saran: ['centre-ville', 'fleury-les-aubrais', 'saint-jean-de-la-ruelle', 'ormes', 'ingre', 'gidy', 'semoy'],
+  fecamp: ['centre-ville', 'goderville', 'criquetot-l-esneval', 'cany-barville', 'terres-de-caux', 'bolbec', 'gruchet-le-valasse'],
+  annonay: ['centre-ville', 'boulieu-les-annonay', 'roiffieux', 'davezieux', 'vernosc-les-annonay', 'peaugres', 'sarras'],
+  'lamballe-armor': ['centre-ville', 'saint-alban', 'pommeret', 'hillion', 'pleneuf-val-andre', 'quessoy', 'yffiniac'],
+  viroflay: ['centre-ville', 'velizy-villacoublay', 'versailles', 'jouy-en-josas', 'buc', 'le-chesnay-rocquencourt', 'la-celle-saint-cloud'],
+  blanquefort: ['centre-ville', 'bruges', 'parempuyre', 'le-taillan-medoc', 'eysines', 'le-pian-medoc', 'le-bouscat'],
+  'oree-d-anjou': ['centre-ville', 'montrevault-sur-evre', 'beaupreau-en-mauges', 'mauges-sur-loire'],
+  'montceau-les-mines': ['centre-ville', 'saint-vallier', 'blanzy', 'sanvignes-les-mines', 'ciry-le-noble', 'montchanin', 'torcy'],
+  firminy: ['centre-ville', 'fraisses', 'unieux', 'le-chambon-feugerolles', 'roche-la-moliere', 'la-ricamarie', 'saint-etienne'],
+  'saint-cyr-sur-loire': ['centre-ville', 'la-membrolle-sur-choisille', 'fondettes', 'tours', 'la-riche', 'mettray', 'notre-dame-d-oe'],
+  'le-pre-saint-gervais': ['centre-ville', 'les-lilas', 'pantin', 'bagnolet', 'romainville', 'aubervilliers', 'bobigny'],
+  'la-baule-escoublac': ['centre-ville', 'pornichet', 'saint-andre-des-eaux', 'le-pouliguen', 'guerande', 'batz-sur-mer', 'saint-nazaire'],
+  verdun: ['centre-ville', 'faubourg-pave', 'glorieux', 'belleville'],
+  guerande: ['centre-ville', 'saint-molf', 'la-turballe', 'la-baule-escoublac', 'saint-lyphard', 'le-pouliguen', 'batz-sur-mer'],
+  'les-clayes-sous-bois': ['centre-ville', 'plaisir', 'villepreux', 'bois-d-arcy', 'fontenay-le-fleury', 'elancourt', 'trappes'],
+  'saint-jean-de-la-ruelle': ['centre-ville', 'saint-pryve-saint-mesmin', 'la-chapelle-saint-mesmin', 'saran', 'ingre', 'orleans', 'fleury-les-aubrais'],
+  'loire-authion': ['centre-ville', 'le-plessis-grammoire', 'maze-milon', 'trelaze', 'saint-barthelemy-d-anjou', 'verrieres-en-anjou', 'la-menitre'],
+  'marly-le-roi': ['centre-ville', 'mareil-marly', 'louveciennes', 'l-etang-la-ville', 'le-port-marly', 'le-pecq', 'bailly'],
+  valserhone: ['centre-ville', 'collonges', 'peron', 'nantua', 'saint-jean-de-gonville', 'montreal-la-cluse', 'bellignat'],
+  sedan: ['centre-ville', 'floing', 'bazeilles', 'vrigne-aux-bois', 'vivier-au-court', 'douzy', 'nouvion-sur-meuse'],
+  cestas: ['centre-ville', 'canejan', 'pessac', 'leognan', 'marcheprime', 'saint-jean-d-illac', 'gradignan'],
+  'lons-le-saunier': ['centre-ville', 'montmorot', 'poligny'],
+  'bois-d-arcy': ['centre-ville', 'fontenay-le-fleury', 'villepreux', 'les-clayes-sous-bois', 'montigny-le-bretonneux', 'saint-cyr-l-ecole', 'trappes'],
+  'chateau-gontier-sur-mayenne': ['centre-ville', 'quelaines-saint-gault', 'meslay-du-maine', 'craon', 'entrammes', 'cosse-le-vivien', 'l-huisserie'],
+  chateaurenard: ['centre-ville', 'rognonas', 'eyragues', 'noves', 'graveson', 'barbentane', 'maillane'],
+  mauguio: ['centre-ville', 'candillargues', 'la-grande-motte', 'mudaison', 'saint-aunes', 'perols', 'lansargues'],
+  'les-herbiers': ['centre-ville', 'beaurepaire', 'la-gaubretiere', 'mouchamps', 'chanverrie', 'les-epesses', 'saint-fulgent'],
+  orsay: ['centre-ville', 'les-ulis', 'bures-sur-yvette', 'villejust', 'villebon-sur-yvette', 'palaiseau', 'gif-sur-yvette'],
+  pamiers: ['centre-ville', 'la-tour-du-crieu', 'saint-jean-du-falga', 'verniolle', 'varilhes', 'saverdun', 'mazeres'],
+  rumilly: ['centre-ville', 'sales', 'marcellaz-albanais', 'saint-felix', 'vallieres-sur-fier', 'alby-sur-cheran', 'chavanod'],
+  mennecy: ['centre-ville', 'ormoy', 'villabe', 'lisses', 'le-coudray-montceaux', 'corbeil-essonnes', 'vert-le-petit'],
+  'sainte-luce-sur-loire': ['centre-ville', 'thouare-sur-loire', 'basse-goulaine', 'carquefou', 'saint-julien-de-concelles', 'saint-sebastien-sur-loire', 'nantes'],
+  coulommiers: ['centre-ville', 'mouroux', 'boissy-le-chatel', 'beautheil-saints', 'pommeuse', 'faremoutiers', 'guerard'],
+  landerneau: ['centre-ville', 'pencran', 'la-forest-landerneau', 'plouedern', 'dirinon', 'ploudaniel', 'loperhet'],
+  trelaze: ['centre-ville', 'saint-barthelemy-d-anjou', 'les-ponts-de-ce', 'le-plessis-grammoire', 'angers', 'verrieres-en-anjou', 'sainte-gemmes-sur-loire'],
+  'verneuil-sur-seine': ['centre-ville', 'vaux-sur-seine', 'vernouillet', 'triel-sur-seine', 'les-mureaux', 'meulan-en-yvelines', 'chanteloup-les-vignes'],
+  'morne-a-l-eau': ['centre-ville', 'les-abymes', 'petit-canal', 'pointe-a-pitre', 'le-gosier', 'port-louis', 'baie-mahault'],
+  'saint-julien-en-genevois': ['centre-ville', 'neydens', 'archamps', 'beaumont', 'collonges-sous-saleve', 'viry', 'valleiry'],
+  gaillac: ['centre-ville', 'brens', 'lagrave', 'lisle-sur-tarn', 'marssac-sur-tarn', 'rabastens', 'le-sequestre'],
+  'saint-leu-la-foret': ['centre-ville', 'taverny', 'le-plessis-bouchard', 'saint-prix', 'montlignon', 'bessancourt', 'beauchamp'],
+  montbrison: ['centre-ville', 'savigneux', 'champdieu', 'saint-romain-le-puy', 'sury-le-comtal', 'montrond-les-bains', 'saint-cyprien'],
+  vaureal: ['centre-ville', 'cergy', 'jouy-le-moutier', 'courdimanche', 'neuville-sur-oise', 'menucourt', 'osny'],
+  'sin-le-noble': ['centre-ville', 'dechy', 'douai', 'waziers', 'guesnain', 'lallaing', 'montigny-en-ostrevent'],
+  domont: ['centre-ville', 'bouffemont', 'andilly', 'ezanville', 'montlignon', 'saint-brice-sous-foret', 'baillet-en-france'],
+  'le-pecq': ['centre-ville', 'le-port-marly', 'le-vesinet', 'mareil-marly', 'croissy-sur-seine', 'marly-le-roi', 'chatou'],
+  noisiel: ['centre-ville', 'champs-sur-marne', 'lognes', 'torcy', 'vaires-sur-marne', 'emerainville', 'croissy-beaubourg'],
+  'saint-amand-les-eaux': ['centre-ville', 'raismes', 'hasnon', 'lecelles', 'rosult', 'beuvrages', 'petite-foret'],
+  'amberieu-en-bugey': ['centre-ville', 'saint-denis-en-bugey', 'chateau-gaillard', 'saint-rambert-en-bugey', 'ambronay', 'lagnieu', 'jujurieux'],
+  'le-bourget': ['centre-ville', 'dugny', 'drancy', 'le-blanc-mesnil', 'la-courneuve', 'bobigny', 'stains'],
+  luce: ['centre-ville', 'luisant', 'mainvilliers', 'le-coudray', 'chartres', 'leves', 'champhol'],
+  hennebont: ['centre-ville', 'kervignac', 'caudan', 'lanester', 'inzinzac-lochrist', 'merlevenez', 'cleguer'],
+  'saint-pierre-des-corps': ['centre-ville', 'tours', 'la-ville-aux-dames', 'saint-avertin', 'larcay', 'rochecorbon', 'chambray-les-tours'],
+  'fos-sur-mer': ['centre-ville', 'port-saint-louis-du-rhone', 'port-de-bouc', 'saint-mitre-les-remparts', 'istres', 'martigues', 'saint-chamas'],
+  dembeni: ['centre-ville', 'ouangani', 'sada', 'mamoudzou', 'chiconi', 'chirongui', 'tsingoni'],
+  biscarrosse: ['centre-ville', 'parentis-en-born', 'sanguinet', 'ychoux', 'mimizan'],
+  hayange: ['centre-ville', 'nilvange', 'seremange-erzange', 'knutange', 'algrange', 'neufchef', 'florange'],
+  'port-de-bouc': ['centre-ville', 'saint-mitre-les-remparts', 'martigues', 'fos-sur-mer', 'chateauneuf-les-martigues', 'sausset-les-pins', 'port-saint-louis-du-rhone'],
+  'le-francois': ['centre-ville', 'saint-esprit', 'le-robert', 'ducos', 'le-vauclin', 'le-lamentin', 'riviere-salee'],
+  toul: ['centre-ville', 'dommartin-les-toul', 'ecrouves', 'gondreville', 'foug', 'bois-de-haye', 'liverdun'],
+  'saint-just-saint-rambert': ['centre-ville', 'bonson', 'andrezieux-boutheon', 'saint-cyprien', 'la-fouillouse', 'saint-marcellin-en-forez', 'sury-le-comtal'],
+  vendome: ['centre-ville', 'saint-ouen', 'naveil', 'montoire-sur-le-loir'],
+  'montrevault-sur-evre': ['centre-ville', 'beaupreau-en-mauges', 'mauges-sur-loire', 'begrolles-en-mauges', 'oree-d-anjou', 'le-may-sur-evre', 'saint-leger-sous-cholet'],
+  'saint-fargeau-ponthierry': ['centre-ville', 'pringy', 'boissise-le-roi', 'nandy', 'cesson', 'savigny-le-temple', 'perthes'],
+  beaucaire: ['centre-ville', 'jonquieres-saint-vincent', 'manduel', 'redessan', 'bellegarde', 'fourques', 'montfrin'],
+  montevrain: ['centre-ville', 'chanteloup-en-brie', 'chessy', 'dampmart', 'lagny-sur-marne', 'serris', 'coupvray'],
+  longwy: ['centre-ville', 'herserange', 'rehon', 'mexy', 'longlaville', 'mont-saint-martin', 'lexy'],
+  francheville: ['centre-ville', 'craponne', 'tassin-la-demi-lune', 'sainte-foy-les-lyon', 'chaponost', 'saint-genis-les-ollieres', 'brindas'],
+  fontainebleau: ['centre-ville', 'avon', 'bois-le-roi', 'samois-sur-seine', 'samoreau', 'vulaines-sur-seine', 'thomery'],
+  'le-vesinet': ['centre-ville', 'croissy-sur-seine', 'chatou', 'le-port-marly', 'le-pecq', 'montesson', 'bougival'],
+  wittenheim: ['centre-ville', 'kingersheim', 'ruelisheim', 'pulversheim', 'richwiller', 'staffelfelden', 'wittelsheim'],
+  guipavas: ['centre-ville', 'le-relecq-kerhuon', 'gouesnou', 'la-forest-landerneau', 'plougastel-daoulas', 'brest', 'plabennec'],
+  wattignies: ['centre-ville', 'templemars', 'emmerin', 'faches-thumesnil', 'loos', 'houplin-ancoisne', 'haubourdin'],
+  montivilliers: ['centre-ville', 'harfleur', 'epouville', 'fontaine-la-mallet', 'octeville-sur-mer', 'gainneville', 'gonfreville-l-orcher'],
+  elbeuf: ['centre-ville', 'caudebec-les-elbeuf', 'saint-aubin-les-elbeuf', 'saint-pierre-les-elbeuf', 'cleon', 'la-londe', 'grand-couronne'],
+  'roquebrune-sur-argens': ['centre-ville', 'puget-sur-argens', 'le-muy', 'sainte-maxime', 'frejus', 'la-motte', 'bagnols-en-foret'],
+  tarascon: ['centre-ville', 'saint-etienne-du-gres', 'fontvieille', 'maillane', 'graveson', 'barbentane', 'paradou'],
+  'bouc-bel-air': ['centre-ville', 'simiane-collongue', 'cabries', 'septemes-les-vallons', 'gardanne', 'mimet', 'meyreuil'],
+  'castanet-tolosan': ['centre-ville', 'pechabou', 'pompertuzat', 'auzeville-tolosane', 'labege', 'escalquens', 'ramonville-saint-agne'],
+  avrille: ['centre-ville', 'angers', 'beaucouze', 'montreuil-juigne', 'cantenay-epinard', 'ecouflant', 'saint-lambert-la-potherie'],
+  'rive-de-gier': ['centre-ville', 'lorette', 'genilac', 'saint-martin-la-plaine', 'la-grand-croix', 'saint-paul-en-jarez', 'l-horme'],
+  morlaix: ['centre-ville', 'saint-martin-des-champs', 'taule', 'plouigneau', 'plourin-les-morlaix', 'plougasnou', 'lanmeur'],
+  'ramonville-saint-agne': ['centre-ville', 'auzeville-tolosane', 'labege', 'castanet-tolosan', 'saint-orens-de-gameville', 'pechabou', 'quint-fonsegrives'],
+  senlis: ['centre-ville', 'verneuil-en-halatte', 'chantilly', 'creil', 'saint-maximin', 'orry-la-ville', 'pontpoint'],
+  issoire: ['centre-ville', 'saint-germain-lembron', 'vic-le-comte', 'brassac-les-mines', 'veyre-monton', 'mirefleurs', 'les-martres-de-veyre'],
+  montmagny: ['centre-ville', 'deuil-la-barre', 'groslay', 'enghien-les-bains', 'montmorency', 'sarcelles', 'saint-brice-sous-foret'],
+  'chateau-thierry': ['centre-ville', 'essomes-sur-marne', 'charly-sur-marne', 'nogent-l-artaud', 'fere-en-tardenois', 'la-ferte-milon'],
+  vesoul: ['centre-ville', 'vaivre-et-montoille', 'echenoz-la-meline', 'port-sur-saone', 'rioz'],
+  haubourdin: ['centre-ville', 'emmerin', 'loos', 'santes', 'sequedin', 'hallennes-lez-haubourdin', 'houplin-ancoisne'],
+  lognes: ['centre-ville', 'noisiel', 'croissy-beaubourg', 'torcy', 'emerainville', 'collegien', 'champs-sur-marne'],
+  'saint-brice-sous-foret': ['centre-ville', 'groslay', 'montmorency', 'sarcelles', 'domont', 'andilly', 'soisy-sous-montmorency'],
+  'verrieres-le-buisson': ['centre-ville', 'igny', 'massy', 'bievres', 'palaiseau', 'champlan', 'wissous'],
+  'pointe-a-pitre': ['centre-ville', 'les-abymes', 'baie-mahault', 'le-gosier', 'morne-a-l-eau', 'lamentin', 'petit-bourg'],
+  arnouville: ['centre-ville', 'garges-les-gonesse', 'sarcelles', 'villiers-le-bel', 'gonesse', 'le-thillay', 'groslay'],
+  'saint-avertin': ['centre-ville', 'chambray-les-tours', 'larcay', 'saint-pierre-des-corps', 'la-ville-aux-dames', 'tours', 'veretz'],
+  woippy: ['centre-ville', 'plappeville', 'le-ban-saint-martin', 'maizieres-les-metz', 'saint-julien-les-metz', 'longeville-les-metz', 'scy-chazelles'],
+  'romilly-sur-seine': ['centre-ville', 'villenauxe-la-grande', 'nogent-sur-seine'],
+  'la-fleche': ['centre-ville', 'le-lude', 'cerans-foulletourte', 'noyen-sur-sarthe', 'precigne', 'la-suze-sur-sarthe', 'aubigne-racan'],
+  illzach: ['centre-ville', 'sausheim', 'mulhouse', 'baldersheim', 'kingersheim', 'riedisheim', 'rixheim'],
+  'saint-jean-de-luz': ['centre-ville', 'ciboure', 'ahetze', 'ascain', 'bidart', 'arbonne', 'urrugne'],
+  montargis: ['centre-ville', 'chalette-sur-loing', 'amilly', 'villemandeur', 'pannes', 'corquilleroy', 'cepoy'],
+  'carrieres-sur-seine': ['centre-ville', 'houilles', 'sartrouville', 'chatou', 'montesson', 'le-vesinet', 'le-mesnil-le-roi'],
+  fameck: ['centre-ville', 'vitry-sur-orne', 'seremange-erzange', 'uckange', 'gandrange', 'florange', 'clouange'],
+  laxou: ['centre-ville', 'villers-les-nancy', 'maxeville', 'champigneulles', 'vand-uvre-les-nancy', 'nancy', 'chaligny'],
+  dinan: ['centre-ville', 'quevert', 'lanvallay', 'trelivan', 'taden', 'pleslin-trigavou', 'plouer-sur-rance'],
+  'saint-avold': ['centre-ville', 'l-hopital', 'longeville-les-saint-avold', 'carling', 'hombourg-haut', 'porcelette', 'valmont'],
+  'le-raincy': ['centre-ville', 'villemomble', 'les-pavillons-sous-bois', 'clichy-sous-bois', 'gagny', 'bondy', 'livry-gargan'],
+  'saint-gilles': ['centre-ville', 'generac', 'beauvoisin', 'vauvert', 'bellegarde', 'fourques', 'garons'],
+  bailleul: ['centre-ville', 'meteren', 'steenwerck', 'nieppe', 'boeschepe', 'estaires', 'vieux-berquin'],
+  'villers-les-nancy': ['centre-ville', 'vand-uvre-les-nancy', 'laxou', 'chaligny', 'houdemont', 'nancy', 'neuves-maisons'],
+  'saint-orens-de-gameville': ['centre-ville', 'labege', 'quint-fonsegrives', 'escalquens', 'auzeville-tolosane', 'ramonville-saint-agne', 'flourens'],
+  pontivy: ['centre-ville', 'le-sourn', 'noyal-pontivy', 'cleguerec', 'plumeliau-bieuzy', 'evellys', 'bubry'],
+  mahina: ['centre-ville', 'pirae', 'papeete', 'faaa', 'hitiaa-o-te-ra', 'punaauia', 'paea'],
+  'bar-le-duc': ['centre-ville', 'fains-veel', 'ligny-en-barrois', 'revigny-sur-ornain', 'ancerville'],
+  ollioules: ['centre-ville', 'sanary-sur-mer', 'evenos', 'la-seyne-sur-mer', 'toulon', 'six-fours-les-plages', 'le-beausset'],
+  montesson: ['centre-ville', 'le-mesnil-le-roi', 'chatou', 'saint-germain-en-laye', 'le-vesinet', 'carrieres-sur-seine', 'sartrouville'],
+  'saint-brevin-les-pins': ['centre-ville', 'corsept', 'saint-pere-en-retz', 'saint-nazaire', 'trignac', 'saint-michel-chef-chef', 'montoir-de-bretagne'],
+  'bois-guillaume': ['centre-ville', 'bihorel', 'mont-saint-aignan', 'darnetal', 'isneauville', 'houppeville', 'rouen'],
+  'saint-maurice': ['centre-ville', 'maisons-alfort', 'joinville-le-pont', 'charenton-le-pont', 'alfortville', 'saint-mande', 'vincennes'],
+  'saint-paul-les-dax': ['centre-ville', 'mees', 'dax', 'magescq', 'saint-vincent-de-paul', 'narrosse', 'saint-geours-de-maremne'],
+  'l-etang-sale': ['centre-ville', 'les-avirons', 'saint-leu', 'saint-louis', 'les-trois-bassins', 'entre-deux', 'cilaos'],
+  'saint-genis-pouilly': ['centre-ville', 'prevessin-moens', 'chevry', 'sergy', 'ornex', 'segny', 'crozet'],
+  flers: ['centre-ville', 'saint-georges-des-groseillers', 'athis-val-de-rouvre', 'tinchebray-bocage', 'domfront-en-poiraie', 'putanges-le-lac', 'bagnoles-de-l-orne-normandie'],
+  plerin: ['centre-ville', 'pordic', 'saint-brieuc', 'tremuson', 'ploufragan', 'langueux', 'tregueux'],
+  valenton: ['centre-ville', 'villeneuve-saint-georges', 'limeil-brevannes', 'choisy-le-roi', 'bonneuil-sur-marne', 'creteil', 'ablon-sur-seine'],
+  canteleu: ['centre-ville', 'le-grand-quevilly', 'le-petit-quevilly', 'deville-les-rouen', 'maromme', 'rouen', 'petit-couronne'],
+  billere: ['centre-ville', 'lons', 'jurancon', 'pau', 'lescar', 'bizanos', 'gelos'],
+  'saint-omer': ['centre-ville', 'longuenesse', 'saint-martin-lez-tatinghem', 'arques', 'blendecques', 'wizernes', 'eperlecques'],
+  rixheim: ['centre-ville', 'habsheim', 'riedisheim', 'sausheim', 'illzach', 'baldersheim', 'mulhouse'],
+  persan: ['centre-ville', 'beaumont-sur-oise', 'champagne-sur-oise', 'bernes-sur-oise', 'presles', 'l-isle-adam', 'bruyeres-sur-oise'],
+  'crepy-en-valois': ['centre-ville', 'bethisy-saint-pierre', 'nanteuil-le-haudouin', 'verberie', 'lacroix-saint-ouen', 'le-meux', 'le-plessis-belleville'],
+  castelsarrasin: ['centre-ville', 'saint-nicolas-de-la-grave', 'moissac', 'la-ville-dieu-du-temple', 'montbeton', 'lafrancaise', 'montech'],
+  montataire: ['centre-ville', 'nogent-sur-oise', 'laigneville', 'creil', 'saint-maximin', 'saint-leu-d-esserent', 'monchy-saint-eloi'],
+  chenove: ['centre-ville', 'marsannay-la-cote', 'perrigny-les-dijon', 'longvic', 'dijon', 'talant', 'plombieres-les-dijon'],
+  auray: ['centre-ville', 'pluneret', 'crach', 'sainte-anne-d-auray', 'brech', 'le-bono', 'ploemel'],
+  'pont-a-mousson': ['centre-ville', 'blenod-les-pont-a-mousson', 'pagny-sur-moselle', 'dieulouard', 'custines', 'pompey', 'liverdun'],
+  hautmont: ['centre-ville', 'louvroil', 'feignies', 'maubeuge', 'ferriere-la-grande', 'pont-sur-sambre', 'bachant'],
+  'saint-martin-de-crau': ['centre-ville', 'istres', 'mouries', 'miramas', 'maussane-les-alpilles', 'paradou', 'grans'],
+  morangis: ['centre-ville', 'chilly-mazarin', 'savigny-sur-orge', 'longjumeau', 'paray-vieille-poste', 'juvisy-sur-orge', 'wissous'],
+  'sainte-maxime': ['centre-ville', 'le-plan-de-la-tour', 'roquebrune-sur-argens', 'saint-tropez', 'grimaud', 'le-muy', 'gassin'],
+  roncq: ['centre-ville', 'linselles', 'bousbecque', 'neuville-en-ferrain', 'halluin', 'tourcoing', 'bondues'],
+  audincourt: ['centre-ville', 'valentigney', 'seloncourt', 'exincourt', 'etupes', 'sochaux', 'voujeaucourt'],
+  douarnenez: ['centre-ville', 'plogonnec', 'ploneis', 'plogastel-saint-germain', 'plozevet', 'pouldreuzic', 'plouhinec'],
+  pirae: ['centre-ville', 'papeete', 'faaa', 'mahina', 'punaauia', 'hitiaa-o-te-ra', 'paea'],
+  'fontenay-le-comte': ['centre-ville', 'rives-d-autise', 'benet', 'nalliers', 'la-chataigneraie', 'terval', 'sainte-gemme-la-plaine'],
+  juvignac: ['centre-ville', 'saint-georges-d-orques', 'grabels', 'laverune', 'murviel-les-montpellier', 'saussan', 'pignan'],
+  'lys-lez-lannoy': ['centre-ville', 'leers', 'toufflers', 'hem', 'roubaix', 'wattrelos', 'croix'],
+  bollene: ['centre-ville', 'mondragon', 'lapalud', 'mornas', 'piolenc', 'sainte-cecile-les-vignes', 'serignan-du-comtat'],
+  lieusaint: ['centre-ville', 'moissy-cramayel', 'combs-la-ville', 'nandy', 'savigny-le-temple', 'reau', 'cesson'],
+  'belleville-en-beaujolais': ['centre-ville', 'saint-georges-de-reneins', 'villie-morgon', 'saint-etienne-des-oullieres', 'arnas', 'beaujeu', 'gleize'],
+  bandraboua: ['centre-ville', 'm-tsangamouji', 'acoua', 'tsingoni', 'koungou', 'mtsamboro', 'mamoudzou'],
+  ostwald: ['centre-ville', 'lingolsheim', 'illkirch-graffenstaden', 'eckbolsheim', 'strasbourg', 'holtzheim', 'geispolsheim'],
+  'saint-francois': ['centre-ville', 'le-moule', 'sainte-anne', 'le-gosier', 'petit-canal'],
+  tsingoni: ['centre-ville', 'chiconi', 'm-tsangamouji', 'ouangani', 'mamoudzou', 'bandraboua', 'koungou'],
+  'vaires-sur-marne': ['centre-ville', 'brou-sur-chantereine', 'torcy', 'noisiel', 'chelles', 'saint-thibault-des-vignes', 'pomponne'],
+  meru: ['centre-ville', 'andeville', 'bornel', 'sainte-genevieve', 'noailles', 'neuilly-en-thelle', 'chambly'],
+  thouars: ['centre-ville', 'loretz-d-argenton', 'saint-varent', 'val-en-vignes', 'argentonnay', 'plaine-et-vallees', 'airvault'],
+  mions: ['centre-ville', 'toussieu', 'corbas', 'chaponnay', 'saint-priest', 'saint-pierre-de-chandieu', 'venissieux'],
+  andresy: ['centre-ville', 'chanteloup-les-vignes', 'maurecourt', 'triel-sur-seine', 'carrieres-sous-poissy', 'acheres', 'conflans-sainte-honorine'],
+  caudry: ['centre-ville', 'bertry', 'walincourt-selvigny', 'avesnes-les-aubert', 'le-cateau-cambresis', 'solesmes', 'busigny'],
+  'berre-l-etang': ['centre-ville', 'rognac', 'la-fare-les-oliviers', 'velaux', 'lancon-provence', 'saint-chamas', 'marignane'],
+  carros: ['centre-ville', 'gattieres', 'saint-jeannet', 'saint-martin-du-var', 'colomars', 'aspremont', 'la-gaude'],
+  'saint-jacques-de-la-lande': ['centre-ville', 'chartres-de-bretagne', 'vezin-le-coquet', 'rennes', 'le-rheu', 'chavagne', 'noyal-chatillon-sur-seiche'],
+  pierrelatte: ['centre-ville', 'saint-paul-trois-chateaux', 'donzere', 'malataverne', 'suze-la-rousse', 'chateauneuf-du-rhone', 'montelimar'],
+  'fleury-merogis': ['centre-ville', 'bondoufle', 'morsang-sur-orge', 'grigny', 'ris-orangis', 'sainte-genevieve-des-bois', 'viry-chatillon'],
+  'fontenay-le-fleury': ['centre-ville', 'saint-cyr-l-ecole', 'bois-d-arcy', 'villepreux', 'bailly', 'noisy-le-roi', 'montigny-le-bretonneux'],
+  avon: ['centre-ville', 'thomery', 'samoreau', 'vulaines-sur-seine', 'fontainebleau', 'samois-sur-seine', 'hericy'],
+  gex: ['centre-ville', 'echenevex', 'cessy', 'divonne-les-bains', 'segny', 'versonnex', 'chevry'],
+  lons: ['centre-ville', 'billere', 'lescar', 'pau', 'artiguelouve', 'jurancon', 'montardon'],
+  'taiarapu-est': ['centre-ville', 'taiarapu-ouest'],
+  amilly: ['centre-ville', 'montargis', 'chalette-sur-loing', 'villemandeur', 'cepoy', 'pannes', 'corquilleroy'],
+  plouzane: ['centre-ville', 'locmaria-plouzane', 'guilers', 'saint-renan', 'brest', 'bohars', 'ploumoguer'],
+  argentan: ['centre-ville', 'ecouche-les-vallees', 'gouffern-en-auge', 'sees', 'putanges-le-lac'],
+  gien: ['centre-ville', 'poilly-lez-gien', 'briare', 'nogent-sur-vernisson', 'coullons', 'ouzouer-sur-loire', 'chatillon-sur-loire'],
+  'plougastel-daoulas': ['centre-ville', 'le-relecq-kerhuon', 'loperhet', 'guipavas', 'logonna-daoulas', 'brest', 'la-forest-landerneau'],
+  genas: ['centre-ville', 'saint-bonnet-de-mure', 'chassieu', 'pusignan', 'meyzieu', 'saint-laurent-de-mure', 'saint-priest'],
+  moissac: ['centre-ville', 'castelsarrasin', 'saint-nicolas-de-la-grave', 'lafrancaise', 'la-ville-dieu-du-temple', 'valence', 'montbeton'],
+  tulle: ['centre-ville', 'naves', 'sainte-fereole', 'malemort', 'donzenac', 'cosnac', 'argentat-sur-dordogne'],
+  mouvaux: ['centre-ville', 'tourcoing', 'bondues', 'croix', 'wasquehal', 'roubaix', 'marcq-en-bar-ul'],
+  kingersheim: ['centre-ville', 'richwiller', 'wittenheim', 'pfastatt', 'illzach', 'mulhouse', 'ruelisheim'],
+  'claye-souilly': ['centre-ville', 'annet-sur-marne', 'villevaude', 'villeparisis', 'thorigny-sur-marne', 'pomponne', 'courtry'],
+  bonneville: ['centre-ville', 'ayse', 'saint-pierre-en-faucigny', 'arenthon', 'amancy', 'marignier', 'contamine-sur-arve'],
+  'saint-jean-de-vedas': ['centre-ville', 'laverune', 'saussan', 'montpellier', 'lattes', 'juvignac', 'fabregues'],
+  cusset: ['centre-ville', 'vichy', 'creuzier-le-vieux', 'abrest', 'bellerive-sur-allier', 'saint-germain-des-fosses', 'saint-yorre'],
+  monteux: ['centre-ville', 'althen-des-paluds', 'loriol-du-comtat', 'pernes-les-fontaines', 'entraigues-sur-la-sorgue', 'carpentras', 'bedarrides'],
+  cuers: ['centre-ville', 'belgentier', 'sollies-pont', 'neoules', 'rocbaron', 'sollies-toucas', 'meounes-les-montrieux'],
+  'freyming-merlebach': ['centre-ville', 'hombourg-haut', 'cocheren', 'l-hopital', 'morsbach', 'carling', 'farebersviller'],
+  lourdes: ['centre-ville', 'ossun', 'argeles-gazost', 'juillan', 'odos', 'ibos', 'soues'],
+  seclin: ['centre-ville', 'gondecourt', 'houplin-ancoisne', 'templemars', 'phalempin', 'avelin', 'wattignies'],
+  'val-de-reuil': ['centre-ville', 'le-vaudreuil', 'pont-de-l-arche', 'louviers', 'pitres', 'romilly-sur-andelle', 'le-val-d-hazey'],
+  'saint-andre-lez-lille': ['centre-ville', 'lambersart', 'marquette-lez-lille', 'la-madeleine', 'lille', 'lompret', 'verlinghem'],
+  'canet-en-roussillon': ['centre-ville', 'saint-nazaire', 'cabestany', 'alenya', 'sainte-marie-la-mer', 'saleilles', 'villelongue-de-la-salanque'],
+  anzin: ['centre-ville', 'beuvrages', 'valenciennes', 'petite-foret', 'bruay-sur-l-escaut', 'la-sentinelle', 'saint-saulve'],
+  autun: ['centre-ville', 'epinac', 'le-creusot', 'le-breuil', 'torcy'],
+  'les-ponts-de-ce': ['centre-ville', 'trelaze', 'sainte-gemmes-sur-loire', 'murs-erigne', 'saint-melaine-sur-aubance', 'les-garennes-sur-loire', 'saint-barthelemy-d-anjou'],
+  'villeneuve-les-avignon': ['centre-ville', 'pujaut', 'sauveterre', 'les-angles', 'roquemaure', 'saze', 'rochefort-du-gard'],
+  outreau: ['centre-ville', 'saint-leonard', 'equihen-plage', 'le-portel', 'saint-etienne-au-mont', 'boulogne-sur-mer', 'saint-martin-boulogne'],
+  graulhet: ['centre-ville', 'labastide-saint-georges', 'lagrave', 'brens', 'realmont', 'lavaur', 'marssac-sur-tarn'],
+  'saint-hilaire-de-riez': ['centre-ville', 'notre-dame-de-riez', 'le-fenouiller', 'le-perrier', 'soullans', 'saint-gilles-croix-de-vie', 'saint-jean-de-monts'],
+  'petite-ile': ['centre-ville', 'saint-pierre', 'saint-joseph', 'le-tampon', 'entre-deux', 'saint-philippe', 'saint-louis'],
+  tergnier: ['centre-ville', 'beautor', 'la-fere', 'chauny', 'sinceny', 'saint-gobain', 'gauchy'],
+  auriol: ['centre-ville', 'la-bouilladisse', 'roquevaire', 'la-destrousse', 'gemenos', 'peypin', 'belcodene'],
+  'bras-panon': ['centre-ville', 'saint-benoit', 'saint-andre', 'sainte-suzanne', 'salazie', 'la-plaine-des-palmistes', 'sainte-marie'],
+  noyon: ['centre-ville', 'ribecourt-dreslincourt', 'thourotte', 'longueil-annel', 'choisy-au-bac', 'clairoix', 'trosly-breuil'],
+  betton: ['centre-ville', 'saint-gregoire', 'chevaigne', 'melesse', 'thorigne-fouillard', 'montgermont', 'la-chapelle-des-fougeretz'],
+  tarnos: ['centre-ville', 'ondres', 'saint-martin-de-seignanx', 'labenne', 'capbreton', 'benesse-maremne', 'soorts-hossegor'],
+  gueret: ['centre-ville', 'sainte-feyre'],
+  fonsorbes: ['centre-ville', 'fontenilles', 'saint-lys', 'plaisance-du-touch', 'seysses', 'la-salvetat-saint-gilles', 'frouzins'],
+  berck: ['centre-ville', 'rang-du-fliers', 'merlimont', 'verton', 'cucq', 'le-touquet-paris-plage', 'etaples'],
+  amboise: ['centre-ville', 'la-croix-en-touraine', 'nazelles-negron', 'saint-martin-le-beau', 'blere', 'montlouis-sur-loire', 'athee-sur-cher'],
+  yzeure: ['centre-ville', 'moulins', 'avermes', 'dompierre-sur-besbre'],
+  nemours: ['centre-ville', 'saint-pierre-les-nemours', 'bourron-marlotte', 'souppes-sur-loing', 'montigny-sur-loing', 'la-chapelle-la-reine', 'moret-loing-et-orvanne'],
+  mayenne: ['centre-ville', 'ambrieres-les-vallees', 'montsurs', 'lassay-les-chateaux', 'gorron', 'andouille', 'louverne'],
+  chateaudun: ['centre-ville', 'saint-denis-lanneray', 'cloyes-les-trois-rivieres', 'bonneval', 'vald-yerre', 'brou'],
+  'moret-loing-et-orvanne': ['centre-ville', 'saint-mammes', 'montigny-sur-loing', 'champagne-sur-seine', 'vernou-la-celle-sur-seine', 'thomery', 'la-grande-paroisse'],
+  'saint-andre-les-vergers': ['centre-ville', 'rosieres-pres-troyes', 'la-riviere-de-corps', 'troyes', 'sainte-savine', 'les-noes-pres-troyes', 'saint-germain'],
+  pornichet: ['centre-ville', 'la-baule-escoublac', 'saint-nazaire', 'saint-andre-des-eaux', 'le-pouliguen', 'trignac', 'guerande'],
+  paea: ['centre-ville', 'papara', 'punaauia', 'faaa', 'pirae', 'papeete', 'teva-i-uta'],
+  comines: ['centre-ville', 'wervicq-sud', 'quesnoy-sur-deule', 'linselles', 'bousbecque', 'wambrechies', 'frelinghien'],
+  aubergenville: ['centre-ville', 'flins-sur-seine', 'epone', 'bouafle', 'juziers', 'gargenville', 'mezieres-sur-seine'],
+  'chambray-les-tours': ['centre-ville', 'saint-avertin', 'larcay', 'joue-les-tours', 'veigne', 'montbazon', 'saint-pierre-des-corps'],
+  'andernos-les-bains': ['centre-ville', 'ares', 'lege-cap-ferret', 'lanton', 'audenge', 'le-porge', 'arcachon'],
+  'chalette-sur-loing': ['centre-ville', 'montargis', 'cepoy', 'corquilleroy', 'amilly', 'pannes', 'villemandeur'],
+  meze: ['centre-ville', 'loupian', 'pinet', 'pomerols', 'villeveyrac', 'sete', 'montagnac'],
+  bayeux: ['centre-ville', 'saint-vigor-le-grand', 'creully-sur-seulles', 'le-molay-littry', 'thue-et-mue', 'rots', 'saint-manvieu-norrey'],
+  'la-chapelle-saint-luc': ['centre-ville', 'les-noes-pres-troyes', 'sainte-savine', 'troyes', 'la-riviere-de-corps', 'saint-andre-les-vergers', 'pont-sainte-marie'],
+  'l-union': ['centre-ville', 'saint-jean', 'launaguet', 'saint-genies-bellevue', 'rouffiac-tolosan', 'montrabe', 'balma'],
+  'saint-andre-de-cubzac': ['centre-ville', 'cubzac-les-ponts', 'la-lande-de-fronsac', 'val-de-virvee', 'peujard', 'ambares-et-lagrave', 'saint-loubes'],
+  'marquette-lez-lille': ['centre-ville', 'saint-andre-lez-lille', 'la-madeleine', 'wambrechies', 'lambersart', 'marcq-en-bar-ul', 'verlinghem'],
+  vidauban: ['centre-ville', 'les-arcs', 'le-cannet-des-maures', 'le-plan-de-la-tour', 'trans-en-provence', 'lorgues', 'le-muy'],
+  obernai: ['centre-ville', 'bischoffsheim', 'rosheim', 'griesheim-pres-molsheim', 'dorlisheim', 'barr', 'b-rsch'],
+  rognac: ['centre-ville', 'velaux', 'berre-l-etang', 'vitrolles', 'la-fare-les-oliviers', 'coudoux', 'ventabren'],
+  louvres: ['centre-ville', 'puiseux-en-france', 'goussainville', 'fontenay-en-parisis', 'marly-la-ville', 'roissy-en-france', 'le-thillay'],
+  villetaneuse: ['centre-ville', 'epinay-sur-seine', 'l-ile-saint-denis', 'saint-denis', 'stains', 'la-courneuve', 'saint-ouen-sur-seine'],
+  'sollies-pont': ['centre-ville', 'la-crau', 'la-farlede', 'sollies-ville', 'cuers', 'sollies-toucas', 'la-valette-du-var'],
+  granville: ['centre-ville', 'donville-les-bains', 'brehal', 'saint-pair-sur-mer', 'jullouville', 'agon-coutainville'],
+  brignais: ['centre-ville', 'vourles', 'orlienas', 'charly', 'saint-genis-laval', 'chaponost', 'irigny'],
+  'l-isle-adam': ['centre-ville', 'parmain', 'meriel', 'presles', 'champagne-sur-oise', 'butry-sur-oise', 'persan'],
+  'saint-ave': ['centre-ville', 'meucon', 'monterblanc', 'vannes', 'saint-nolff', 'plescop', 'locqueltas'],
+  quimperle: ['centre-ville', 'mellac', 'redene', 'tremeven', 'clohars-carnoet', 'moelan-sur-mer', 'riec-sur-belon'],
+  mende: ['centre-ville', 'marvejols', 'bourgs-sur-colagne', 'la-canourgue', 'peyre-en-aubrac'],
+  aubenas: ['centre-ville', 'saint-etienne-de-fontbellon', 'ucel', 'lavilledieu', 'vesseaux', 'vals-les-bains', 'villeneuve-de-berg'],
+  'pont-du-chateau': ['centre-ville', 'mur-sur-allier', 'les-martres-d-artiere', 'lempdes', 'vertaizon', 'aulnat', 'gerzat'],
+  gisors: ['centre-ville', 'etrepagny', 'vexin-sur-epte', 'gasny'],
+  'pont-sainte-maxence': ['centre-ville', 'pontpoint', 'brenouille', 'chevrieres', 'verneuil-en-halatte', 'verberie', 'villers-saint-paul'],
+  guidel: ['centre-ville', 'gestel', 'queven', 'pont-scorff', 'ploemeur', 'lorient', 'larmor-plage'],
+  'sable-sur-sarthe': ['centre-ville', 'precigne', 'noyen-sur-sarthe', 'loue'],
+  oissel: ['centre-ville', 'tourville-la-riviere', 'cleon', 'saint-etienne-du-rouvray', 'grand-couronne', 'petit-couronne', 'saint-aubin-les-elbeuf'],
+  'le-chambon-feugerolles': ['centre-ville', 'la-ricamarie', 'firminy', 'roche-la-moliere', 'saint-etienne', 'unieux', 'fraisses'],
+  vernouillet: ['centre-ville', 'dreux', 'saint-remy-sur-avre', 'abondant', 'saint-lubin-des-joncherets', 'tremblay-les-villages', 'bu'],
+  cogolin: ['centre-ville', 'gassin', 'grimaud', 'cavalaire-sur-mer', 'la-croix-valmer', 'le-plan-de-la-tour', 'saint-tropez'],
+  chateaubriant: ['centre-ville', 'rouge', 'erbray', 'abbaretz', 'derval', 'nozay', 'riaille'],
+  creutzwald: ['centre-ville', 'falck', 'ham-sous-varsberg', 'porcelette', 'carling', 'l-hopital', 'saint-avold'],
+  harnes: ['centre-ville', 'annay', 'fouquieres-les-lens', 'courrieres', 'loison-sous-lens', 'pont-a-vendin', 'noyelles-sous-lens'],
+  bischwiller: ['centre-ville', 'oberhoffen-sur-moder', 'gries', 'kaltenhouse', 'herrlisheim', 'schirrhein', 'weyersheim'],
+  'la-queue-en-brie': ['centre-ville', 'noiseau', 'le-plessis-trevise', 'chennevieres-sur-marne', 'sucy-en-brie', 'ormesson-sur-marne', 'santeny'],
+  'triel-sur-seine': ['centre-ville', 'chanteloup-les-vignes', 'vernouillet', 'verneuil-sur-seine', 'andresy', 'carrieres-sous-poissy', 'maurecourt'],
+  riedisheim: ['centre-ville', 'mulhouse', 'rixheim', 'illzach', 'brunstatt-didenheim', 'habsheim', 'sausheim'],
+  raismes: ['centre-ville', 'beuvrages', 'bruay-sur-l-escaut', 'petite-foret', 'anzin', 'saint-amand-les-eaux', 'escautpont'],
+  sarrebourg: ['centre-ville', 'reding', 'phalsbourg', 'dabo'],
+  castelnaudary: ['centre-ville', 'bram', 'montreal'],
+  'bully-les-mines': ['centre-ville', 'grenay', 'mazingarbe', 'aix-noulette', 'sains-en-gohelle', 'bouvigny-boyeffles', 'lievin'],
+  'saint-gaudens': ['centre-ville', 'montrejeau', 'martres-tolosane'],
+  'ferney-voltaire': ['centre-ville', 'prevessin-moens', 'ornex', 'versonnex', 'saint-genis-pouilly', 'segny', 'chevry'],
+  craponne: ['centre-ville', 'saint-genis-les-ollieres', 'francheville', 'tassin-la-demi-lune', 'brindas', 'grezieu-la-varenne', 'charbonnieres-les-bains'],
+  'onet-le-chateau': ['centre-ville', 'rodez', 'olemps', 'le-monastere', 'sebazac-concoures', 'druelle-balsac', 'salles-la-source'],
+  'saint-cyprien': ['centre-ville', 'latour-bas-elne', 'elne', 'alenya', 'saint-nazaire', 'corneilla-del-vercol', 'theza'],
+  'la-motte-servolex': ['centre-ville', 'voglans', 'le-bourget-du-lac', 'chambery', 'sonnaz', 'cognin', 'viviers-du-lac'],
+  cernay: ['centre-ville', 'vieux-thann', 'wittelsheim', 'staffelfelden', 'thann', 'lutterbach', 'richwiller'],
+  mios: ['centre-ville', 'biganos', 'salles', 'marcheprime', 'le-teich', 'le-barp', 'audenge'],
+  'roquebrune-cap-martin': ['centre-ville', 'beausoleil', 'menton', 'la-turbie', 'peille', 'cap-d-ail', 'eze'],
+  florange: ['centre-ville', 'terville', 'seremange-erzange', 'uckange', 'fameck', 'hayange', 'thionville'],
+  barentin: ['centre-ville', 'pavilly', 'saint-pierre-de-varengeville', 'le-houlme', 'malaunay', 'duclair', 'montville'],
+  'septemes-les-vallons': ['centre-ville', 'simiane-collongue', 'les-pennes-mirabeau', 'bouc-bel-air', 'cabries', 'plan-de-cuques', 'mimet'],
+  marly: ['centre-ville', 'aulnoy-lez-valenciennes', 'saultain', 'valenciennes', 'saint-saulve', 'anzin', 'preseau'],
+  'saint-pierre-du-perray': ['centre-ville', 'saintry-sur-seine', 'saint-germain-les-corbeil', 'corbeil-essonnes', 'tigery', 'etiolles', 'villabe'],
+  vedene: ['centre-ville', 'saint-saturnin-les-avignon', 'entraigues-sur-la-sorgue', 'le-pontet', 'morieres-les-avignon', 'althen-des-paluds', 'chateauneuf-de-gadagne'],
+  valbonne: ['centre-ville', 'opio', 'mougins', 'biot', 'mouans-sartoux', 'roquefort-les-pins', 'chateauneuf-grasse'],
+  ifs: ['centre-ville', 'cormelles-le-royal', 'fleury-sur-orne', 'mondeville', 'soliers', 'louvigny', 'saint-martin-de-may'],
+  beausoleil: ['centre-ville', 'la-turbie', 'cap-d-ail', 'roquebrune-cap-martin', 'eze', 'peille', 'la-trinite'],
+  villepreux: ['centre-ville', 'les-clayes-sous-bois', 'bois-d-arcy', 'fontenay-le-fleury', 'saint-nom-la-breteche', 'noisy-le-roi', 'saint-cyr-l-ecole'],
+  'dammartin-en-goele': ['centre-ville', 'longperrier', 'saint-mard', 'juilly', 'othis', 'moussy-le-neuf', 'saint-pathus'],
+  'le-relecq-kerhuon': ['centre-ville', 'guipavas', 'plougastel-daoulas', 'gouesnou', 'loperhet', 'brest', 'la-forest-landerneau'],
+  talant: ['centre-ville', 'fontaine-les-dijon', 'dijon', 'plombieres-les-dijon', 'chenove', 'marsannay-la-cote', 'saint-apollinaire'],
+  'riviere-salee': ['centre-ville', 'sainte-luce', 'saint-esprit', 'ducos', 'riviere-pilote', 'le-diamant', 'les-trois-ilets'],
+  somain: ['centre-ville', 'fenain', 'aniche', 'abscon', 'pecquencourt', 'auberchicourt', 'hornaing'],
+  papara: ['centre-ville', 'paea', 'punaauia', 'teva-i-uta', 'faaa', 'pirae', 'mahina'],
+  'h-nheim': ['centre-ville', 'souffelweyersheim', 'bischheim', 'schiltigheim', 'reichstett', 'mundolsheim', 'mittelhausbergen'],
+  'seyssinet-pariset': ['centre-ville', 'seyssins', 'fontaine', 'grenoble', 'echirolles', 'sassenage', 'le-pont-de-claix'],
+  'bauge-en-anjou': ['centre-ville', 'jarze-villages', 'les-bois-d-anjou', 'beaufort-en-anjou', 'durtal', 'maze-milon', 'noyant-villages'],
+  pace: ['centre-ville', 'la-chapelle-des-fougeretz', 'montgermont', 'vezin-le-coquet', 'l-hermitage', 'saint-gilles', 'geveze'],
+  dugny: ['centre-ville', 'le-bourget', 'la-courneuve', 'le-blanc-mesnil', 'stains', 'drancy', 'saint-denis'],
+  arpajon: ['centre-ville', 'la-norville', 'saint-germain-les-arpajon', 'egly', 'ollainville', 'leuville-sur-orge', 'bretigny-sur-orge'],
+  vauvert: ['centre-ville', 'le-cailar', 'beauvoisin', 'saint-laurent-d-aigouze', 'saint-gilles', 'aimargues', 'generac'],
+  'saint-cyr-sur-mer': ['centre-ville', 'la-cadiere-d-azur', 'bandol', 'le-castellet', 'sanary-sur-mer', 'le-beausset', 'ollioules'],
+  villecresnes: ['centre-ville', 'mandres-les-roses', 'marolles-en-brie', 'boissy-saint-leger', 'perigny', 'santeny', 'limeil-brevannes'],
+  sassenage: ['centre-ville', 'fontaine', 'saint-egreve', 'noyarey', 'saint-martin-le-vinoux', 'fontanil-cornillon', 'seyssinet-pariset'],
+  'bruay-sur-l-escaut': ['centre-ville', 'beuvrages', 'saint-saulve', 'anzin', 'escautpont', 'raismes', 'valenciennes'],
+  thiers: ['centre-ville', 'peschadoires', 'orleat', 'puy-guillaume', 'courpiere', 'lezoux', 'maringues'],
+  'plan-de-cuques': ['centre-ville', 'allauch', 'mimet', 'simiane-collongue', 'cadolive', 'saint-savournin', 'septemes-les-vallons'],
+  provins: ['centre-ville', 'donnemarie-dontilly', 'bray-sur-seine', 'nangis'],
+  'saint-esteve': ['centre-ville', 'baho', 'baixas', 'toulouges', 'perpignan', 'le-soler', 'pezilla-la-riviere'],
+  'saint-germain-les-arpajon': ['centre-ville', 'arpajon', 'la-norville', 'leuville-sur-orge', 'bretigny-sur-orge', 'linas', 'ollainville'],
+  mericourt: ['centre-ville', 'sallaumines', 'rouvroy', 'avion', 'billy-montigny', 'noyelles-sous-lens', 'fouquieres-les-lens'],
+  pia: ['centre-ville', 'claira', 'bompas', 'rivesaltes', 'villelongue-de-la-salanque', 'perpignan', 'saint-esteve'],
+  'epinay-sous-senart': ['centre-ville', 'brunoy', 'boussy-saint-antoine', 'quincy-sous-senart', 'yerres', 'varennes-jarcy', 'montgeron'],
+  'riviere-pilote': ['centre-ville', 'le-marin', 'sainte-luce', 'le-vauclin', 'saint-esprit', 'riviere-salee', 'sainte-anne'],
+  'ancenis-saint-gereon': ['centre-ville', 'vair-sur-loire', 'mesanger', 'oudon', 'couffe', 'loireauxence', 'mouzeil'],
+  chauny: ['centre-ville', 'sinceny', 'tergnier', 'beautor', 'la-fere', 'saint-gobain', 'anizy-le-grand'],
+  'n-ux-les-mines': ['centre-ville', 'labourse', 'sains-en-gohelle', 'verquin', 'hersin-coupigny', 'sailly-labourse', 'barlin'],
+  bolbec: ['centre-ville', 'gruchet-le-valasse', 'lillebonne', 'la-frenaye', 'saint-romain-de-colbosc', 'port-jerome-sur-seine', 'goderville'],
+  'maizieres-les-metz': ['centre-ville', 'talange', 'hagondange', 'marange-silvange', 'amneville', 'woippy', 'ennery'],
+  'les-avirons': ['centre-ville', 'saint-leu', 'l-etang-sale', 'saint-louis', 'les-trois-bassins', 'cilaos', 'entre-deux'],
+  ploufragan: ['centre-ville', 'saint-brieuc', 'tregueux', 'saint-julien', 'tremuson', 'plerin', 'langueux'],
+  'la-hague': ['centre-ville', 'cherbourg-en-cotentin', 'les-pieux', 'brix', 'bricquebec-en-cotentin'],
+  pontchateau: ['centre-ville', 'dreffeac', 'sainte-anne-sur-brivet', 'crossac', 'besne', 'sainte-reine-de-bretagne', 'campbon'],
+  'vaux-le-penil': ['centre-ville', 'livry-sur-seine', 'chartrettes', 'la-rochette', 'melun', 'rubelles', 'le-mee-sur-seine'],
+  saverne: ['centre-ville', 'marmoutier', 'dettwiller', 'bouxwiller', 'wasselonne', 'hochfelden', 'ingwiller'],
+  'la-trinite': ['centre-ville', 'sainte-marie', 'le-robert', 'gros-morne', 'le-marigot', 'saint-joseph', 'le-lorrain'],
+  fourmies: ['centre-ville', 'wignehies', 'anor', 'trelon', 'sains-du-nord', 'avesnelles', 'avesnes-sur-helpe'],
+  pamandzi: ['centre-ville', 'dzaoudzi', 'mamoudzou', 'koungou', 'dembeni', 'ouangani', 'tsingoni'],
+  yvetot: ['centre-ville', 'yerville', 'rives-en-seine', 'sainte-marguerite-sur-duclair', 'doudeville', 'terres-de-caux', 'pavilly'],
+  'enghien-les-bains': ['centre-ville', 'saint-gratien', 'deuil-la-barre', 'soisy-sous-montmorency', 'montmorency', 'eaubonne', 'montmagny'],
+  biganos: ['centre-ville', 'audenge', 'mios', 'marcheprime', 'le-teich', 'lanton', 'gujan-mestras'],
+  gravelines: ['centre-ville', 'grand-fort-philippe', 'loon-plage', 'bourbourg', 'grande-synthe', 'dunkerque', 'armbouts-cappel'],
+  gaillard: ['centre-ville', 'etrembieres', 'ambilly', 'annemasse', 'monnetier-mornex', 'vetraz-monthoux', 'ville-la-grand'],
+  'saint-junien': ['centre-ville', 'rochechouart', 'oradour-sur-glane', 'veyrac', 'verneuil-sur-vienne', 'saint-gence', 'sereilhac'],
+  dourdan: ['centre-ville', 'saint-cheron', 'forges-les-bains', 'breuillet', 'etrechy', 'limours', 'briis-sous-forges'],
+  briancon: ['centre-ville', 'l-argentiere-la-bessee'],
+  'le-haillan': ['centre-ville', 'eysines', 'merignac', 'le-taillan-medoc', 'le-bouscat', 'bruges', 'saint-medard-en-jalles'],
+  'la-roche-sur-foron': ['centre-ville', 'etaux', 'amancy', 'saint-pierre-en-faucigny', 'arenthon', 'pers-jussy', 'filliere'],
+  panazol: ['centre-ville', 'le-palais-sur-vienne', 'feytiat', 'saint-just-le-martel', 'rilhac-rancon', 'limoges', 'saint-priest-taurion'],
+  'montlouis-sur-loire': ['centre-ville', 'veretz', 'azay-sur-cher', 'la-ville-aux-dames', 'saint-martin-le-beau', 'larcay', 'vouvray'],
+  corbas: ['centre-ville', 'mions', 'feyzin', 'saint-symphorien-d-ozon', 'venissieux', 'saint-priest', 'chaponnay'],
+  'le-luc': ['centre-ville', 'le-cannet-des-maures', 'flassans-sur-issole', 'gonfaron', 'cabasse', 'le-thoronet', 'pignans'],
+  'tournon-sur-rhone': ['centre-ville', 'saint-jean-de-muzols', 'cornas', 'saint-peray', 'guilherand-granges', 'sarras', 'soyons'],
+  'villefranche-de-rouergue': ['centre-ville', 'rignac', 'capdenac-gare'],
+  castelginest: ['centre-ville', 'saint-alban', 'fonbeauzard', 'pechbonnieu', 'gratentour', 'aucamville', 'saint-loup-cammas'],
+  'saint-jean': ['centre-ville', 'rouffiac-tolosan', 'l-union', 'saint-genies-bellevue', 'castelmaurou', 'montrabe', 'launaguet'],
+  guebwiller: ['centre-ville', 'buhl', 'issenheim', 'soultz-haut-rhin', 'bollwiller', 'soultzmatt', 'rouffach'],
+  'guilherand-granges': ['centre-ville', 'saint-peray', 'soyons', 'cornas', 'charmes-sur-rhone', 'saint-georges-les-bains', 'tournon-sur-rhone'],
+  cesson: ['centre-ville', 'savigny-le-temple', 'vert-saint-denis', 'nandy', 'le-mee-sur-seine', 'reau', 'saint-fargeau-ponthierry'],
+  chassieu: ['centre-ville', 'bron', 'saint-priest', 'genas', 'decines-charpieu', 'vaulx-en-velin', 'meyzieu'],
+  'porto-vecchio': ['centre-ville', 'lecci', 'zonza', 'bonifacio'],
+  issoudun: ['centre-ville'],
+  sada: ['centre-ville', 'ouangani', 'chiconi', 'chirongui', 'boueni', 'dembeni', 'tsingoni'],
+  riorges: ['centre-ville', 'roanne', 'pouilly-les-nonains', 'le-coteau', 'villerest', 'commelle-vernay', 'mably'],
+  'chevigny-saint-sauveur': ['centre-ville', 'sennecey-les-dijon', 'quetigny', 'neuilly-crimolois', 'saint-apollinaire', 'longvic', 'varois-et-chaignot'],
+  arcachon: ['centre-ville', 'la-teste-de-buch', 'lege-cap-ferret', 'gujan-mestras', 'andernos-les-bains', 'le-teich', 'biganos'],
+  'ville-d-avray': ['centre-ville', 'chaville', 'vaucresson', 'sevres', 'garches', 'saint-cloud', 'meudon'],
+  pelissanne: ['centre-ville', 'vernegues', 'lancon-provence', 'lambesc', 'alleins', 'la-fare-les-oliviers', 'salon-de-provence'],
+  'le-taillan-medoc': ['centre-ville', 'eysines', 'le-haillan', 'le-pian-medoc', 'blanquefort', 'saint-aubin-de-medoc', 'bruges'],
+  'villeneuve-tolosane': ['centre-ville', 'cugnaux', 'roques', 'frouzins', 'roquettes', 'portet-sur-garonne', 'pinsaguel'],
+  'doue-en-anjou': ['centre-ville', 'lys-haut-layon', 'terranjou', 'montreuil-bellay', 'gennes-val-de-loire', 'brissac-loire-aubance', 'saumur'],
+  'la-chapelle-saint-mesmin': ['centre-ville', 'saint-pryve-saint-mesmin', 'saint-jean-de-la-ruelle', 'saint-hilaire-saint-mesmin', 'ingre', 'chaingy', 'olivet'],
+  'mouans-sartoux': ['centre-ville', 'la-roquette-sur-siagne', 'mougins', 'auribeau-sur-siagne', 'grasse', 'chateauneuf-grasse', 'valbonne'],
+  'croissy-sur-seine': ['centre-ville', 'le-vesinet', 'le-port-marly', 'bougival', 'chatou', 'le-pecq', 'louveciennes'],
+  wambrechies: ['centre-ville', 'marquette-lez-lille', 'quesnoy-sur-deule', 'verlinghem', 'bondues', 'saint-andre-lez-lille', 'marcq-en-bar-ul'],
+  'thouare-sur-loire': ['centre-ville', 'saint-julien-de-concelles', 'carquefou', 'sainte-luce-sur-loire', 'mauves-sur-loire', 'divatte-sur-loire', 'basse-goulaine'],
+  'vitry-le-francois': ['centre-ville'],
+  'ormesson-sur-marne': ['centre-ville', 'chennevieres-sur-marne', 'noiseau', 'sucy-en-brie', 'champigny-sur-marne', 'saint-maur-des-fosses', 'bonneuil-sur-marne'],
+  lavaur: ['centre-ville', 'labastide-saint-georges', 'saint-sulpice-la-pointe', 'coufouleux', 'graulhet', 'rabastens', 'puylaurens'],
+  'pont-saint-esprit': ['centre-ville', 'bagnols-sur-ceze', 'laudun-l-ardoise', 'saint-genies-de-comolas', 'saint-victor-la-coste', 'saint-laurent-des-arbres', 'roquemaure'],
+  maromme: ['centre-ville', 'deville-les-rouen', 'notre-dame-de-bondeville', 'mont-saint-aignan', 'le-houlme', 'canteleu', 'houppeville'],
+  mana: ['centre-ville'],
+  'le-pont-de-claix': ['centre-ville', 'echirolles', 'claix', 'jarrie', 'varces-allieres-et-risset', 'seyssins', 'eybens'],
+  'stiring-wendel': ['centre-ville', 'sch-neck', 'forbach', 'spicheren', 'ting', 'behren-les-forbach', 'petite-rosselle'],
+  fondettes: ['centre-ville', 'saint-cyr-sur-loire', 'la-membrolle-sur-choisille', 'la-riche', 'luynes', 'mettray', 'tours'],
+  'vetraz-monthoux': ['centre-ville', 'annemasse', 'ville-la-grand', 'ambilly', 'etrembieres', 'gaillard', 'cranves-sales'],
+  'saint-saulve': ['centre-ville', 'onnaing', 'bruay-sur-l-escaut', 'marly', 'anzin', 'valenciennes', 'beuvrages'],
+  trets: ['centre-ville', 'peynier', 'rousset', 'la-bouilladisse', 'auriol', 'belcodene', 'la-destrousse'],
+  'le-pradet': ['centre-ville', 'la-garde', 'carqueiranne', 'la-valette-du-var', 'la-farlede', 'saint-mandrier-sur-mer', 'toulon'],
+  tarare: ['centre-ville', 'vindry-sur-turdine', 'amplepuis', 'val-d-oingt', 'bully', 'chessy', 'saint-germain-nuelles'],
+  'saint-martin-boulogne': ['centre-ville', 'boulogne-sur-mer', 'saint-leonard', 'outreau', 'le-portel', 'wimille', 'wimereux'],
+  orthez: ['centre-ville', 'salies-de-bearn', 'mourenx', 'artix'],
+  'brissac-loire-aubance': ['centre-ville', 'les-garennes-sur-loire', 'terranjou', 'saint-melaine-sur-aubance', 'bellevigne-en-layon', 'les-ponts-de-ce', 'murs-erigne'],
+  amneville: ['centre-ville', 'rombas', 'clouange', 'gandrange', 'hagondange', 'marange-silvange', 'vitry-sur-orne'],
+  'villeneuve-les-maguelone': ['centre-ville', 'mireval', 'vic-la-gardiole', 'palavas-les-flots', 'lattes', 'saint-jean-de-vedas', 'fabregues'],
+  'chanteloup-les-vignes': ['centre-ville', 'andresy', 'triel-sur-seine', 'maurecourt', 'carrieres-sous-poissy', 'vernouillet', 'verneuil-sur-seine'],
+  passy: ['centre-ville', 'les-houches', 'domancy', 'magland', 'saint-gervais-les-bains', 'sallanches', 'combloux'],
+  'ann-ullin': ['centre-ville', 'provin', 'allennes-les-marais', 'bauvin', 'sainghin-en-weppes', 'gondecourt', 'wavrin'],
+  chateaugiron: ['centre-ville', 'domagne', 'domloup', 'noyal-sur-vilaine', 'nouvoitou', 'pire-chance', 'brece'],
+  'teva-i-uta': ['centre-ville', 'papara', 'hitiaa-o-te-ra', 'paea', 'taiarapu-ouest', 'punaauia', 'mahina'],
+  igny: ['centre-ville', 'bievres', 'palaiseau', 'verrieres-le-buisson', 'massy', 'saclay', 'villebon-sur-yvette'],
+  'deville-les-rouen': ['centre-ville', 'maromme', 'mont-saint-aignan', 'notre-dame-de-bondeville', 'rouen', 'canteleu', 'le-petit-quevilly'],
+  erstein: ['centre-ville', 'gerstheim', 'plobsheim', 'eschau', 'lipsheim', 'fegersheim', 'benfeld'],
+  dinard: ['centre-ville', 'la-richardais', 'saint-lunaire', 'saint-malo', 'saint-briac-sur-mer', 'pleurtuit', 'saint-jouan-des-guerets'],
+  tinqueux: ['centre-ville', 'saint-brice-courcelles', 'bezannes', 'reims', 'cormontreuil', 'betheny', 'muizon'],
+  bondoufle: ['centre-ville', 'fleury-merogis', 'le-plessis-pate', 'vert-le-grand', 'ris-orangis', 'evry-courcouronnes', 'lisses'],
+  'boulazac-isle-manoire': ['centre-ville', 'sanilhac', 'bassillac-et-auberoche', 'trelissac', 'perigueux', 'coulounieix-chamiers', 'champcevinel'],
+  'bora-bora': ['centre-ville'],
+  allonnes: ['centre-ville', 'saint-georges-du-bois', 'spay', 'rouillon', 'le-mans', 'arnage', 'monce-en-belin'],
+  beaumont: ['centre-ville', 'ceyrat', 'romagnat', 'aubiere', 'chamalieres', 'royat', 'clermont-ferrand'],
+  'epinay-sur-orge': ['centre-ville', 'villemoisson-sur-orge', 'villiers-sur-orge', 'ballainvilliers', 'longjumeau', 'savigny-sur-orge', 'morsang-sur-orge'],
+  etaples: ['centre-ville', 'le-touquet-paris-plage', 'cucq', 'camiers', 'merlimont', 'neufchatel-hardelot', 'rang-du-fliers'],
+  'oloron-sainte-marie': ['centre-ville', 'arudy', 'monein', 'gan', 'jurancon', 'artiguelouve', 'gelos'],
+  parempuyre: ['centre-ville', 'ludon-medoc', 'saint-louis-de-montferrand', 'blanquefort', 'macau', 'ambares-et-lagrave', 'ambes'],
+  leognan: ['centre-ville', 'martillac', 'gradignan', 'canejan', 'cadaujac', 'villenave-d-ornon', 'la-brede'],
+  chantepie: ['centre-ville', 'vern-sur-seiche', 'cesson-sevigne', 'domloup', 'noyal-chatillon-sur-seiche', 'rennes', 'nouvoitou'],
+  urrugne: ['centre-ville', 'ciboure', 'hendaye', 'ascain', 'saint-jean-de-luz', 'sare', 'saint-pee-sur-nivelle'],
+  'saint-barthelemy': ['centre-ville'],
+  wittelsheim: ['centre-ville', 'richwiller', 'staffelfelden', 'lutterbach', 'pfastatt', 'wittenheim', 'kingersheim'],
+  mainvilliers: ['centre-ville', 'leves', 'luce', 'chartres', 'luisant', 'champhol', 'saint-prest'],
+  'voisins-le-bretonneux': ['centre-ville', 'magny-les-hameaux', 'guyancourt', 'montigny-le-bretonneux', 'trappes', 'saint-cyr-l-ecole', 'bois-d-arcy'],
+  hericourt: ['centre-ville', 'champagney', 'ronchamp', 'lure'],
+  'vieux-conde': ['centre-ville', 'hergnies', 'conde-sur-l-escaut', 'fresnes-sur-escaut', 'escautpont', 'raismes', 'crespin'],
+  'port-jerome-sur-seine': ['centre-ville', 'la-frenaye', 'lillebonne', 'gruchet-le-valasse', 'rives-en-seine', 'bolbec', 'arelaune-en-seine'],
+  'argeles-sur-mer': ['centre-ville', 'sorede', 'saint-andre', 'collioure', 'palau-del-vidre', 'port-vendres', 'laroque-des-alberes'],
+  treillieres: ['centre-ville', 'orvault', 'la-chapelle-sur-erdre', 'grandchamp-des-fontaines', 'sautron', 'vigneux-de-bretagne', 'suce-sur-erdre'],
+  chantilly: ['centre-ville', 'coye-la-foret', 'orry-la-ville', 'lamorlaye', 'gouvieux', 'saint-maximin', 'la-chapelle-en-serval'],
+  'la-londe-les-maures': ['centre-ville', 'hyeres', 'pierrefeu-du-var', 'bormes-les-mimosas', 'la-crau', 'le-lavandou', 'puget-ville'],
+  fosses: ['centre-ville', 'marly-la-ville', 'survilliers', 'puiseux-en-france', 'saint-witz', 'luzarches', 'chaumontel'],
+  clermont: ['centre-ville', 'breuil-le-vert', 'fitz-james', 'agnetz', 'breuil-le-sec', 'rantigny', 'liancourt'],
+  longuenesse: ['centre-ville', 'saint-martin-lez-tatinghem', 'wizernes', 'blendecques', 'saint-omer', 'arques', 'ecques'],
+  'charvieu-chavagneux': ['centre-ville', 'pont-de-cheruy', 'tignieu-jameyzieu', 'chavanoz', 'saint-romain-de-jalionas', 'satolas-et-bonce', 'villette-d-anthon'],
+  seysses: ['centre-ville', 'frouzins', 'fonsorbes', 'labastidette', 'villeneuve-tolosane', 'roques', 'muret'],
+  limoux: ['centre-ville', 'palaja', 'montreal', 'quillan', 'carcassonne', 'pennautier', 'villemoustaussou'],
+  biot: ['centre-ville', 'villeneuve-loubet', 'valbonne', 'antibes', 'roquefort-les-pins', 'vallauris', 'opio'],
+  'pernes-les-fontaines': ['centre-ville', 'velleron', 'monteux', 'althen-des-paluds', 'saint-didier', 'entraigues-sur-la-sorgue', 'saint-saturnin-les-avignon'],
+  valentigney: ['centre-ville', 'audincourt', 'voujeaucourt', 'seloncourt', 'mandeure', 'exincourt', 'mathay'],
+  brumath: ['centre-ville', 'geudertheim', 'vendenheim', 'h-rdt', 'mommenheim', 'weitbruch', 'wingersheim-les-quatre-bans'],
+  eybens: ['centre-ville', 'poisat', 'echirolles', 'saint-martin-d-heres', 'brie-et-angonnes', 'grenoble', 'jarrie'],
+  'villers-cotterets': ['centre-ville', 'la-ferte-milon', 'belleu', 'soissons'],
+  'la-riche': ['centre-ville', 'fondettes', 'saint-cyr-sur-loire', 'tours', 'joue-les-tours', 'ballan-mire', 'la-membrolle-sur-choisille'],
+  'portes-les-valence': ['centre-ville', 'etoile-sur-rhone', 'beaumont-les-valence', 'valence', 'malissard', 'montmeyran', 'bourg-les-valence'],
+  'caudebec-les-elbeuf': ['centre-ville', 'elbeuf', 'saint-pierre-les-elbeuf', 'saint-aubin-les-elbeuf', 'cleon', 'grand-couronne', 'oissel'],
+  'saint-gely-du-fesc': ['centre-ville', 'combaillaux', 'saint-clement-de-riviere', 'les-matelles', 'grabels', 'prades-le-lez', 'montferrier-sur-lez'],
+  marck: ['centre-ville', 'calais', 'les-attaques', 'coulogne', 'oye-plage', 'ardres', 'coquelles'],
+  cabestany: ['centre-ville', 'saleilles', 'saint-nazaire', 'canet-en-roussillon', 'perpignan', 'theza', 'alenya'],
+  'divonne-les-bains': ['centre-ville', 'gex', 'cessy', 'versonnex', 'segny', 'echenevex', 'ornex'],
+  aubiere: ['centre-ville', 'perignat-les-sarlieve', 'beaumont', 'clermont-ferrand', 'la-roche-blanche', 'cournon-d-auvergne', 'ceyrat'],
+  auterive: ['centre-ville', 'miremont', 'cintegabelle', 'venerque', 'vernet', 'lagardelle-sur-leze', 'nailloux'],
+  'thorigny-sur-marne': ['centre-ville', 'lagny-sur-marne', 'dampmart', 'pomponne', 'annet-sur-marne', 'montevrain', 'saint-thibault-des-vignes'],
+  fouesnant: ['centre-ville', 'benodet', 'clohars-fouesnant', 'pleuven', 'gouesnach', 'la-foret-fouesnant', 'combrit'],
+  'andrezieux-boutheon': ['centre-ville', 'veauche', 'saint-cyprien', 'bonson', 'la-fouillouse', 'saint-just-saint-rambert', 'sury-le-comtal'],
+  miribel: ['centre-ville', 'neyron', 'saint-maurice-de-beynost', 'beynost', 'mionnay', 'la-boisse', 'montluel'],
+  blain: ['centre-ville', 'bouvron', 'fay-de-bretagne', 'notre-dame-des-landes', 'vay', 'heric', 'malville'],
+  aizenay: ['centre-ville', 'beaulieu-sous-la-roche', 'venansault', 'la-genetouze', 'apremont', 'coex', 'le-poire-sur-vie'],
+  'lezignan-corbieres': ['centre-ville', 'saint-nazaire-d-aude', 'saint-marcel-sur-aude', 'salleles-d-aude', 'moussan', 'argeliers', 'ouveillan'],
+  'gignac-la-nerthe': ['centre-ville', 'le-rove', 'saint-victoret', 'marignane', 'ensues-la-redonne', 'chateauneuf-les-martigues', 'les-pennes-mirabeau'],
+  fuveau: ['centre-ville', 'greasque', 'chateauneuf-le-rouge', 'belcodene', 'gardanne', 'meyreuil', 'peynier'],
+  gerzat: ['centre-ville', 'saint-beauzire', 'cebazat', 'aulnat', 'chateaugay', 'clermont-ferrand', 'lempdes'],
+  mondeville: ['centre-ville', 'giberville', 'cormelles-le-royal', 'colombelles', 'ifs', 'demouville', 'cagny'],
+  serris: ['centre-ville', 'bailly-romainvilliers', 'chessy', 'magny-le-hongre', 'montevrain', 'chanteloup-en-brie', 'coupvray'],
+  oignies: ['centre-ville', 'libercourt', 'dourges', 'courrieres', 'carvin', 'evin-malmaison', 'noyelles-godault'],
+  'saint-esprit': ['centre-ville', 'ducos', 'riviere-salee', 'le-francois', 'riviere-pilote', 'le-vauclin', 'sainte-luce'],
+  arue: ['centre-ville'],
+  pfastatt: ['centre-ville', 'lutterbach', 'richwiller', 'kingersheim', 'mulhouse', 'morschwiller-le-bas', 'wittelsheim'],
+  borgo: ['centre-ville', 'biguglia', 'lucciana', 'vescovato', 'furiani', 'bastia', 'penta-di-casinca'],
+  apatou: ['centre-ville', 'saint-laurent-du-maroni'],
+  feyzin: ['centre-ville', 'saint-fons', 'irigny', 'venissieux', 'solaize', 'saint-symphorien-d-ozon', 'corbas'],
+  'villebon-sur-yvette': ['centre-ville', 'palaiseau', 'villejust', 'saulx-les-chartreux', 'champlan', 'orsay', 'les-ulis'],
+  'sainte-savine': ['centre-ville', 'les-noes-pres-troyes', 'la-chapelle-saint-luc', 'la-riviere-de-corps', 'saint-andre-les-vergers', 'troyes', 'rosieres-pres-troyes'],
+  buxerolles: ['centre-ville', 'poitiers', 'chasseneuil-du-poitou', 'migne-auxances', 'montamise', 'saint-benoit', 'mignaloux-beauvoir'],
+  bandrele: ['centre-ville', 'chirongui', 'kani-keli', 'boueni', 'dembeni', 'sada', 'ouangani'],
+  'la-ferte-sous-jouarre': ['centre-ville', 'jouarre', 'lizy-sur-ourcq', 'trilport', 'rebais', 'boissy-le-chatel', 'mouroux'],
+  cabries: ['centre-ville', 'bouc-bel-air', 'les-pennes-mirabeau', 'vitrolles', 'septemes-les-vallons', 'simiane-collongue', 'saint-victoret'],
+  'beaumont-sur-oise': ['centre-ville', 'persan', 'presles', 'bernes-sur-oise', 'bruyeres-sur-oise', 'champagne-sur-oise', 'saint-martin-du-tertre'],
+  'le-beausset': ['centre-ville', 'evenos', 'le-castellet', 'ollioules', 'sanary-sur-mer', 'signes', 'la-cadiere-d-azur'],
+  'carentan-les-marais': ['centre-ville', 'sainte-mere-eglise', 'picauville', 'periers', 'marigny-le-lozon', 'agneaux', 'saint-lo'],
+  ouangani: ['centre-ville', 'chiconi', 'sada', 'dembeni', 'tsingoni', 'mamoudzou', 'chirongui'],
+  'hitiaa-o-te-ra': ['centre-ville', 'mahina', 'pirae', 'teva-i-uta', 'punaauia', 'papeete', 'faaa'],
+  couzeix: ['centre-ville', 'limoges', 'chaptelat', 'saint-gence', 'verneuil-sur-vienne', 'isle', 'le-palais-sur-vienne'],
+  lillers: ['centre-ville', 'allouagne', 'burbure', 'auchel', 'lapugnoy', 'chocques', 'isbergues'],
+  'saint-claude': ['centre-ville', 'baillif', 'gourbeyre', 'vieux-habitants', 'basse-terre', 'trois-rivieres', 'capesterre-belle-eau'],
+  courrieres: ['centre-ville', 'harnes', 'montigny-en-gohelle', 'dourges', 'oignies', 'fouquieres-les-lens', 'henin-beaumont'],
+  ploermel: ['centre-ville', 'val-d-oust', 'taupont', 'malestroit', 'josselin', 'serent', 'guegon'],
+  jeumont: ['centre-ville', 'marpent', 'boussois', 'recquignies', 'cousolre', 'rousies', 'ferriere-la-grande'],
+  avranches: ['centre-ville', 'ducey-les-cheris', 'sartilly-baie-bocage', 'isigny-le-buat', 'brecey', 'pontorson', 'jullouville'],
+  apt: ['centre-ville', 'gargas', 'saint-saturnin-les-apt', 'lauris', 'cadenet', 'villelaure', 'merindol'],
+  parthenay: ['centre-ville', 'pompaire', 'chatillon-sur-thouet', 'la-chapelle-saint-laurent', 'airvault'],
+  pierrelaye: ['centre-ville', 'herblay-sur-seine', 'beauchamp', 'bessancourt', 'montigny-les-cormeilles', 'mery-sur-oise', 'saint-ouen-l-aumone'],
+  'le-muy': ['centre-ville', 'la-motte', 'roquebrune-sur-argens', 'les-arcs', 'puget-sur-argens', 'trans-en-provence', 'callas'],
+  'douchy-les-mines': ['centre-ville', 'lourches', 'haulchin', 'neuville-sur-escaut', 'denain', 'thiant', 'haspres'],
+  villerupt: ['centre-ville', 'thil', 'hussigny-godbrange', 'haucourt-moulaine', 'saulnes', 'mexy', 'herserange'],
+  'saint-pierre-du-mont': ['centre-ville', 'mont-de-marsan', 'grenade-sur-l-adour', 'saint-sever', 'villeneuve-de-marsan', 'tartas'],
+  maxeville: ['centre-ville', 'champigneulles', 'nancy', 'laxou', 'malzeville', 'saint-max', 'frouard'],
+  soyaux: ['centre-ville', 'l-isle-d-espagnac', 'magnac-sur-touvre', 'puymoyen', 'garat', 'angouleme', 'gond-pontouvre'],
+  mazamet: ['centre-ville', 'aussillon', 'aiguefonde', 'pont-de-larn', 'payrin-augmontel', 'labruguiere', 'viviers-les-montagnes'],
+  filliere: ['centre-ville', 'groisy', 'villaz', 'etaux', 'la-roche-sur-foron', 'argonay', 'allonzier-la-caille'],
+  ingre: ['centre-ville', 'ormes', 'la-chapelle-saint-mesmin', 'saint-jean-de-la-ruelle', 'chaingy', 'saint-pryve-saint-mesmin', 'saran'],
+  auchel: ['centre-ville', 'cauchy-a-la-tour', 'burbure', 'calonne-ricouart', 'marles-les-mines', 'allouagne', 'lapugnoy'],
+  'grigny-sur-rhone': ['centre-ville', 'ternay', 'millery', 'montagny', 'serezin-du-rhone', 'givors', 'communay'],
+  'saint-loubes': ['centre-ville', 'saint-sulpice-et-cameyrac', 'montussan', 'sainte-eulalie', 'cubzac-les-ponts', 'izon', 'yvrac'],
+  lambesc: ['centre-ville', 'vernegues', 'charleval', 'saint-cannat', 'pelissanne', 'la-roque-d-antheron', 'rognes'],
+  'pont-audemer': ['centre-ville', 'beuzeville', 'bourg-achard', 'brionne', 'grand-bourgtheroulde'],
+  'la-farlede': ['centre-ville', 'sollies-ville', 'sollies-pont', 'la-crau', 'la-garde', 'la-valette-du-var', 'sollies-toucas'],
+  'neuville-en-ferrain': ['centre-ville', 'halluin', 'roncq', 'tourcoing', 'bousbecque', 'mouvaux', 'wattrelos'],
+  loudeac: ['centre-ville'],
+  'mery-sur-oise': ['centre-ville'],
+  aniche: ['centre-ville'],
+  chambly: ['centre-ville'],
+  'saint-gregoire': ['centre-ville'],
+  leguevin: ['centre-ville'],
+  foix: ['centre-ville'],
+  voreppe: ['centre-ville'],
+  'bourg-de-peage': ['centre-ville'],
+  'lancon-provence': ['centre-ville'],
+  'saint-max': ['centre-ville'],
+  'saint-amand-montrond': ['centre-ville'],
+  'saint-laurent-de-la-salanque': ['centre-ville'],
+  'saint-lys': ['centre-ville'],
+  carmaux: ['centre-ville'],
+  ezanville: ['centre-ville'],
+  lorgues: ['centre-ville'],
+  beauchamp: ['centre-ville'],
+  'roche-la-moliere': ['centre-ville'],
+  'le-rheu': ['centre-ville'],
+  merville: ['centre-ville'],
+  frouzins: ['centre-ville'],
+  figeac: ['centre-ville'],
+  'portet-sur-garonne': ['centre-ville'],
+  montlhery: ['centre-ville'],
+  'grand-couronne': ['centre-ville'],
+  'mezidon-vallee-d-auge': ['centre-ville'],
+  bernay: ['centre-ville'],
+  revel: ['centre-ville'],
+  bondues: ['centre-ville'],
+  aytre: ['centre-ville'],
+  'montigny-en-gohelle': ['centre-ville'],
+  'cosne-cours-sur-loire': ['centre-ville'],
+  'saint-barthelemy-d-anjou': ['centre-ville'],
+  'saint-sulpice-la-pointe': ['centre-ville'],
+  'basse-goulaine': ['centre-ville'],
+  'grand-santi': ['centre-ville'],
+  'saint-doulchard': ['centre-ville'],
+  aucamville: ['centre-ville'],
+  'saint-jean-d-illac': ['centre-ville'],
+  perols: ['centre-ville'],
+  crosne: ['centre-ville'],
+  'gros-morne': ['centre-ville'],
+  lesquin: ['centre-ville'],
+  'saint-remy-de-provence': ['centre-ville'],
+  'aire-sur-la-lys': ['centre-ville'],
+  audenge: ['centre-ville'],
+  maripasoula: ['centre-ville'],
+  'nort-sur-erdre': ['centre-ville'],
+  darnetal: ['centre-ville'],
+  'saint-jean-le-blanc': ['centre-ville'],
+  sene: ['centre-ville'],
+  'bures-sur-yvette': ['centre-ville'],
+  savenay: ['centre-ville'],
+  redon: ['centre-ville'],
+  'l-isle-jourdain': ['centre-ville'],
+  leers: ['centre-ville'],
+  albert: ['centre-ville'],
+  'ville-la-grand': ['centre-ville'],
+  'petit-caux': ['centre-ville'],
+  elne: ['centre-ville'],
+  vallet: ['centre-ville'],
+  'quincy-sous-senart': ['centre-ville'],
+  'clermont-l-herault': ['centre-ville'],
+  tonneins: ['centre-ville'],
+  lescar: ['centre-ville'],
+  arques: ['centre-ville'],
+  landivisiau: ['centre-ville'],
+  'dombasle-sur-meurthe': ['centre-ville'],
+  lucon: ['centre-ville'],
+  'basse-terre': ['centre-ville'],
+  sallaumines: ['centre-ville'],
+  guichen: ['centre-ville'],
+  'sainte-luce': ['centre-ville'],
+  carqueiranne: ['centre-ville'],
+  'saint-philbert-de-grand-lieu': ['centre-ville'],
+  belley: ['centre-ville'],
+  'magny-les-hameaux': ['centre-ville'],
+  chaponost: ['centre-ville'],
+  rombas: ['centre-ville'],
+  'mont-saint-martin': ['centre-ville'],
+  'jarville-la-malgrange': ['centre-ville'],
+  liffre: ['centre-ville'],
+  'la-ravoire': ['centre-ville'],
+  'livron-sur-drome': ['centre-ville'],
+  'le-passage': ['centre-ville'],
+  molsheim: ['centre-ville'],
+  'nogent-le-rotrou': ['centre-ville'],
+  'paray-le-monial': ['centre-ville'],
+  poisy: ['centre-ville'],
+  'vert-saint-denis': ['centre-ville'],
+  hagondange: ['centre-ville'],
+  'les-sorinieres': ['centre-ville'],
+  rivesaltes: ['centre-ville'],
+  'evian-les-bains': ['centre-ville'],
+  'conde-sur-l-escaut': ['centre-ville'],
+  'fontaine-les-dijon': ['centre-ville'],
+  'le-cres': ['centre-ville'],
+  lifou: ['centre-ville'],
+  valreas: ['centre-ville'],
+  dardilly: ['centre-ville'],
+  ouistreham: ['centre-ville'],
+  sarzeau: ['centre-ville'],
+  beuvry: ['centre-ville'],
+  ussel: ['centre-ville'],
+  capbreton: ['centre-ville'],
+  'le-teich': ['centre-ville'],
+  launaguet: ['centre-ville'],
+  scionzier: ['centre-ville'],
+  breuillet: ['centre-ville'],
+  'prevessin-moens': ['centre-ville'],
+  'varennes-vauzelles': ['centre-ville'],
+  bougival: ['centre-ville'],
+  tomblaine: ['centre-ville'],
+  grabels: ['centre-ville'],
+  checy: ['centre-ville'],
+  lamorlaye: ['centre-ville'],
+  grenade: ['centre-ville'],
+  'magny-le-hongre': ['centre-ville'],
+  'la-fare-les-oliviers': ['centre-ville'],
+  escaudain: ['centre-ville'],
+  irigny: ['centre-ville'],
+  'morieres-les-avignon': ['centre-ville'],
+  joigny: ['centre-ville'],
+  queven: ['centre-ville'],
+  'saint-paul-trois-chateaux': ['centre-ville'],
+  cornebarrieu: ['centre-ville'],
+  pibrac: ['centre-ville'],
+  veauche: ['centre-ville'],
+  quetigny: ['centre-ville'],
+  boucau: ['centre-ville'],
+  cebazat: ['centre-ville'],
+  'meulan-en-yvelines': ['centre-ville'],
+  'bellerive-sur-allier': ['centre-ville'],
+  velaux: ['centre-ville'],
+  'epagny-metz-tessy': ['centre-ville'],
+  chirongui: ['centre-ville'],
+  'gonfreville-l-orcher': ['centre-ville'],
+  roquevaire: ['centre-ville'],
+  'entraigues-sur-la-sorgue': ['centre-ville'],
+  'les-angles': ['centre-ville'],
+  longvic: ['centre-ville'],
+  'le-thor': ['centre-ville'],
+  'chartres-de-bretagne': ['centre-ville'],
+  perigny: ['centre-ville'],
+  bessancourt: ['centre-ville'],
+  'saint-jean-de-monts': ['centre-ville'],
+  gouvieux: ['centre-ville'],
+  nangis: ['centre-ville'],
+  pithiviers: ['centre-ville'],
+  golbey: ['centre-ville'],
+  'gretz-armainvilliers': ['centre-ville'],
+  'monistrol-sur-loire': ['centre-ville'],
+  'ombree-d-anjou': ['centre-ville'],
+  'le-portel': ['centre-ville'],
+  'sarlat-la-caneda': ['centre-ville'],
+  'la-chapelle-d-armentieres': ['centre-ville'],
+  'les-hauts-d-anjou': ['centre-ville'],
+  'la-ferte-bernard': ['centre-ville'],
+  'le-teil': ['centre-ville'],
+  wingles: ['centre-ville'],
+  beauzelle: ['centre-ville'],
+  lempdes: ['centre-ville'],
+  'chamonix-mont-blanc': ['centre-ville'],
+  soustons: ['centre-ville'],
+  'aigues-mortes': ['centre-ville'],
+  'l-ile-saint-denis': ['centre-ville'],
+  'artigues-pres-bordeaux': ['centre-ville'],
+  plabennec: ['centre-ville'],
+  'petit-couronne': ['centre-ville'],
+  coutras: ['centre-ville'],
+  'margny-les-compiegne': ['centre-ville'],
+  'saint-chamas': ['centre-ville'],
+  'essey-les-nancy': ['centre-ville'],
+  'thorigne-fouillard': ['centre-ville'],
+  'saint-jory': ['centre-ville'],
+  crest: ['centre-ville'],
+  isbergues: ['centre-ville'],
+  janze: ['centre-ville'],
+  'le-poire-sur-vie': ['centre-ville'],
+  'souleuvre-en-bocage': ['centre-ville'],
+  domerat: ['centre-ville'],
+  marcoussis: ['centre-ville'],
+  'aulnoye-aymeries': ['centre-ville'],
+  crolles: ['centre-ville'],
+  'ergue-gaberic': ['centre-ville'],
+  'puget-sur-argens': ['centre-ville'],
+  roussillon: ['centre-ville'],
+  'le-grau-du-roi': ['centre-ville'],
+  serignan: ['centre-ville'],
+  'saint-renan': ['centre-ville'],
+  'port-saint-louis-du-rhone': ['centre-ville'],
+  mauleon: ['centre-ville'],
+  chantonnay: ['centre-ville'],
+  sautron: ['centre-ville'],
+  'le-loroux-bottereau': ['centre-ville'],
+  rouvroy: ['centre-ville'],
+  'thaon-les-vosges': ['centre-ville'],
+  'chateauneuf-sur-loire': ['centre-ville'],
+  'bormes-les-mimosas': ['centre-ville'],
+  'varces-allieres-et-risset': ['centre-ville'],
+  lillebonne: ['centre-ville'],
+  privas: ['centre-ville'],
+  'vendin-le-vieil': ['centre-ville'],
+  vif: ['centre-ville'],
+  uzes: ['centre-ville'],
+  'le-plessis-bouchard': ['centre-ville'],
+  peymeinade: ['centre-ville'],
+  unieux: ['centre-ville'],
+  'la-salvetat-saint-gilles': ['centre-ville'],
+  'saint-vallier': ['centre-ville'],
+  'theix-noyalo': ['centre-ville'],
+  'talmont-saint-hilaire': ['centre-ville'],
+  'le-marin': ['centre-ville'],
+  'pont-l-abbe': ['centre-ville'],
+  'le-vauclin': ['centre-ville'],
+  eguilles: ['centre-ville'],
+  onnaing: ['centre-ville'],
+  'ballan-mire': ['centre-ville'],
+  hirson: ['centre-ville'],
+  'reignier-esery': ['centre-ville'],
+  perenchies: ['centre-ville'],
+  groslay: ['centre-ville'],
+  tregueux: ['centre-ville'],
+  'saint-aubin-les-elbeuf': ['centre-ville'],
+  'la-grande-motte': ['centre-ville'],
+  bassens: ['centre-ville'],
+  vaucresson: ['centre-ville'],
+  pignan: ['centre-ville'],
+  'gennes-val-de-loire': ['centre-ville'],
+  venelles: ['centre-ville'],
+  'larmor-plage': ['centre-ville'],
+  marseillan: ['centre-ville'],
+  trignac: ['centre-ville'],
+  orchies: ['centre-ville'],
+  'taiarapu-ouest': ['centre-ville'],
+  feurs: ['centre-ville'],
+  'noyal-chatillon-sur-seiche': ['centre-ville'],
+  marguerittes: ['centre-ville'],
+  bouaye: ['centre-ville'],
+  'saint-gilles-croix-de-vie': ['centre-ville'],
+  'carbon-blanc': ['centre-ville'],
+  coutances: ['centre-ville'],
+  bihorel: ['centre-ville'],
+  'saint-pierre-les-elbeuf': ['centre-ville'],
+  chiconi: ['centre-ville'],
+  'tonnay-charente': ['centre-ville'],
+  harfleur: ['centre-ville'],
+  'tournan-en-brie': ['centre-ville'],
+  guilers: ['centre-ville'],
+  bandol: ['centre-ville'],
+  'brunstatt-didenheim': ['centre-ville'],
+  evron: ['centre-ville'],
+  meximieux: ['centre-ville'],
+  'teteghem-coudekerque-village': ['centre-ville'],
+  thuir: ['centre-ville'],
+  pegomas: ['centre-ville'],
+  malemort: ['centre-ville'],
+  souffelweyersheim: ['centre-ville'],
+  'charnay-les-macon': ['centre-ville'],
+  donges: ['centre-ville'],
+  mazingarbe: ['centre-ville'],
+  'petit-canal': ['centre-ville'],
+  salles: ['centre-ville'],
+  'vern-sur-seiche': ['centre-ville'],
+  anse: ['centre-ville'],
+  'la-colle-sur-loup': ['centre-ville'],
+  'paray-vieille-poste': ['centre-ville'],
+  'ballancourt-sur-essonne': ['centre-ville'],
+  'le-mesnil-esnard': ['centre-ville'],
+  linselles: ['centre-ville'],
+  'la-ville-du-bois': ['centre-ville'],
+  chinon: ['centre-ville'],
+  questembert: ['centre-ville'],
+  'val-de-briey': ['centre-ville'],
+  coulaines: ['centre-ville'],
+  'cavalaire-sur-mer': ['centre-ville'],
+  talange: ['centre-ville'],
+  'rochefort-du-gard': ['centre-ville'],
+  sorbiers: ['centre-ville'],
+  'verrieres-en-anjou': ['centre-ville'],
+  'la-tour-du-pin': ['centre-ville'],
+  'les-arcs': ['centre-ville'],
+  'boussy-saint-antoine': ['centre-ville'],
+  seyssins: ['centre-ville'],
+  uvea: ['centre-ville'],
+  guenange: ['centre-ville'],
+  monts: ['centre-ville'],
+  vineuil: ['centre-ville'],
+  wintzenheim: ['centre-ville'],
+  'martignas-sur-jalle': ['centre-ville'],
+  jarny: ['centre-ville'],
+  kone: ['centre-ville'],
+  languidic: ['centre-ville'],
+  'la-ricamarie': ['centre-ville'],
+  champagnole: ['centre-ville'],
+  bellegarde: ['centre-ville'],
+  gleize: ['centre-ville'],
+  'tignieu-jameyzieu': ['centre-ville'],
+  aureilhan: ['centre-ville'],
+  beaugency: ['centre-ville'],
+  'le-malesherbois': ['centre-ville'],
+  'saint-vincent-de-tyrosse': ['centre-ville'],
+  vaujours: ['centre-ville'],
+  aussonne: ['centre-ville'],
+  isle: ['centre-ville'],
+  louveciennes: ['centre-ville'],
+  linas: ['centre-ville'],
+  'jouy-en-josas': ['centre-ville'],
+  libercourt: ['centre-ville'],
+  'le-soler': ['centre-ville'],
+  'saint-affrique': ['centre-ville'],
+  langueux: ['centre-ville'],
+  'billy-montigny': ['centre-ville'],
+  houplines: ['centre-ville'],
+  geispolsheim: ['centre-ville'],
+  mordelles: ['centre-ville'],
+  'lege-cap-ferret': ['centre-ville'],
+  contes: ['centre-ville'],
+  ustaritz: ['centre-ville'],
+  romagnat: ['centre-ville'],
+  'saint-julien-de-concelles': ['centre-ville'],
+  lure: ['centre-ville'],
+  achicourt: ['centre-ville'],
+  gargenville: ['centre-ville'],
+  'saint-pierre-en-faucigny': ['centre-ville'],
+  publier: ['centre-ville'],
+  sisteron: ['centre-ville'],
+  'cappelle-la-grande': ['centre-ville'],
+  claix: ['centre-ville'],
+  'coulounieix-chamiers': ['centre-ville'],
+  bompas: ['centre-ville'],
+  'courcelles-les-lens': ['centre-ville'],
+  baillargues: ['centre-ville'],
+  malzeville: ['centre-ville'],
+  corte: ['centre-ville'],
+  moirans: ['centre-ville'],
+  'neuville-sur-saone': ['centre-ville'],
+  'montreuil-juigne': ['centre-ville'],
+  lagord: ['centre-ville'],
+  terville: ['centre-ville'],
+  pezenas: ['centre-ville'],
+  'la-verpilliere': ['centre-ville'],
+  'saint-etienne-de-montluc': ['centre-ville'],
+  'hettange-grande': ['centre-ville'],
+  chessy: ['centre-ville'],
+  'saint-aubin-de-medoc': ['centre-ville'],
+  'saint-denis-en-val': ['centre-ville'],
+  'la-couronne': ['centre-ville'],
+  nieppe: ['centre-ville'],
+  thann: ['centre-ville'],
+  'cranves-sales': ['centre-ville'],
+  wavrin: ['centre-ville'],
+  'lys-haut-layon': ['centre-ville'],
+  'saint-remy-les-chevreuse': ['centre-ville'],
+  'noisy-le-roi': ['centre-ville'],
+  'les-andelys': ['centre-ville'],
+  mtsamboro: ['centre-ville'],
+  beynes: ['centre-ville'],
+  'saint-marcellin': ['centre-ville'],
+  'les-avenieres-veyrins-thuellin': ['centre-ville'],
+  emerainville: ['centre-ville'],
+  'machecoul-saint-meme': ['centre-ville'],
+  bidart: ['centre-ville'],
+  pluvigner: ['centre-ville'],
+  falaise: ['centre-ville'],
+  langon: ['centre-ville'],
+  'bain-de-bretagne': ['centre-ville'],
+  mimizan: ['centre-ville'],
+  villars: ['centre-ville'],
+  'l-aigle': ['centre-ville'],
+  'bourg-saint-andeol': ['centre-ville'],
+  biguglia: ['centre-ville'],
+  hasparren: ['centre-ville'],
+  tullins: ['centre-ville'],
+  'saint-prix': ['centre-ville'],
+  deols: ['centre-ville'],
+  'saint-maixent-l-ecole': ['centre-ville'],
+  loireauxence: ['centre-ville'],
+  'parentis-en-born': ['centre-ville'],
+  auxonne: ['centre-ville'],
+  gerardmer: ['centre-ville'],
+  'saint-peray': ['centre-ville'],
+  'sausset-les-pins': ['centre-ville'],
+  lesneven: ['centre-ville'],
+  wissembourg: ['centre-ville'],
+  goyave: ['centre-ville'],
+  rosporden: ['centre-ville'],
+  'faverges-seythenex': ['centre-ville'],
+  'saint-apollinaire': ['centre-ville'],
+  melesse: ['centre-ville'],
+  'saint-yrieix-sur-charente': ['centre-ville'],
+  'suce-sur-erdre': ['centre-ville'],
+  chateaubourg: ['centre-ville'],
+  'jaunay-marigny': ['centre-ville'],
+  'saint-jean-de-maurienne': ['centre-ville'],
+  ceret: ['centre-ville'],
+  'villard-bonnot': ['centre-ville'],
+  crozon: ['centre-ville'],
+  huningue: ['centre-ville'],
+  'saint-berthevin': ['centre-ville'],
+  'saint-germain-les-corbeil': ['centre-ville'],
+  pordic: ['centre-ville'],
+  clisson: ['centre-ville'],
+  toulouges: ['centre-ville'],
+  fabregues: ['centre-ville'],
+  rethel: ['centre-ville'],
+  saujon: ['centre-ville'],
+  'chaumes-en-retz': ['centre-ville'],
+  'saint-didier-au-mont-d-or': ['centre-ville'],
+  langres: ['centre-ville'],
+  'soisy-sur-seine': ['centre-ville'],
+  yssingeaux: ['centre-ville'],
+  'trois-rivieres': ['centre-ville'],
+  'carhaix-plouguer': ['centre-ville'],
+  lagnieu: ['centre-ville'],
+  'ruelle-sur-touvre': ['centre-ville'],
+  remiremont: ['centre-ville'],
+  gieres: ['centre-ville'],
+  lisses: ['centre-ville'],
+  trelissac: ['centre-ville'],
+  cournonterral: ['centre-ville'],
+  'saint-nicolas-de-port': ['centre-ville'],
+  'audun-le-tiche': ['centre-ville'],
+  'guipry-messac': ['centre-ville'],
+  'fresnes-sur-escaut': ['centre-ville'],
+  digoin: ['centre-ville'],
+  pontcharra: ['centre-ville'],
+  paimpol: ['centre-ville'],
+  lanton: ['centre-ville'],
+  'perros-guirec': ['centre-ville'],
+  'villemoisson-sur-orge': ['centre-ville'],
+  barlin: ['centre-ville'],
+  courtry: ['centre-ville'],
+  'rosny-sur-seine': ['centre-ville'],
+  'gournay-sur-marne': ['centre-ville'],
+  'moyeuvre-grande': ['centre-ville'],
+  courdimanche: ['centre-ville'],
+  'saint-christol-lez-ales': ['centre-ville'],
+  'nanteuil-les-meaux': ['centre-ville'],
+  gourbeyre: ['centre-ville'],
+  ensisheim: ['centre-ville'],
+  'roquefort-les-pins': ['centre-ville'],
+  'le-pian-medoc': ['centre-ville'],
+  vizille: ['centre-ville'],
+  'la-ferte-saint-aubin': ['centre-ville'],
+  'montoir-de-bretagne': ['centre-ville'],
+  'le-mesnil-saint-denis': ['centre-ville'],
+  'bourg-saint-maurice': ['centre-ville'],
+  salazie: ['centre-ville'],
+  waziers: ['centre-ville'],
+  'la-gaude': ['centre-ville'],
+  'saint-pee-sur-nivelle': ['centre-ville'],
+  vendargues: ['centre-ville'],
+  'divatte-sur-loire': ['centre-ville'],
+  orgeval: ['centre-ville'],
+  lodeve: ['centre-ville'],
+  colombelles: ['centre-ville'],
+  mably: ['centre-ville'],
+  herbignac: ['centre-ville'],
+  chauray: ['centre-ville'],
+  'les-trois-bassins': ['centre-ville'],
+  caudan: ['centre-ville'],
+  kervignac: ['centre-ville'],
+  'templeuve-en-pevele': ['centre-ville'],
+  ecouen: ['centre-ville'],
+  'sainte-pazanne': ['centre-ville'],
+  'verneuil-d-avre-et-d-iton': ['centre-ville'],
+  'aubigny-les-clouzeaux': ['centre-ville'],
+  labenne: ['centre-ville'],
+  montauroux: ['centre-ville'],
+  'entre-deux': ['centre-ville'],
+  pleurtuit: ['centre-ville'],
+  egly: ['centre-ville'],
+  'saint-ismier': ['centre-ville'],
+  eckbolsheim: ['centre-ville'],
+  ugine: ['centre-ville'],
+  wissous: ['centre-ville'],
+  tregunc: ['centre-ville'],
+  'balaruc-les-bains': ['centre-ville'],
+  'la-talaudiere': ['centre-ville'],
+  eyguieres: ['centre-ville'],
+  'bagneres-de-bigorre': ['centre-ville'],
+  guingamp: ['centre-ville'],
+  viriat: ['centre-ville'],
+  'saint-pierre-en-auge': ['centre-ville'],
+  'pont-saint-martin': ['centre-ville'],
+  peronne: ['centre-ville'],
+  auby: ['centre-ville'],
+  'aulnoy-lez-valenciennes': ['centre-ville'],
+  villemandeur: ['centre-ville'],
+  'vieux-habitants': ['centre-ville'],
+  'notre-dame-de-bondeville': ['centre-ville'],
+  'grandchamp-des-fontaines': ['centre-ville'],
+  leforest: ['centre-ville'],
+  barr: ['centre-ville'],
+  brech: ['centre-ville'],
+  manduel: ['centre-ville'],
+  'binic-etables-sur-mer': ['centre-ville'],
+  jurancon: ['centre-ville'],
+  epone: ['centre-ville'],
+  uckange: ['centre-ville'],
+  'sathonay-camp': ['centre-ville'],
+  trevoux: ['centre-ville'],
+  'saint-andre-des-eaux': ['centre-ville'],
+  'soultz-haut-rhin': ['centre-ville'],
+  chauvigny: ['centre-ville'],
+  'sainte-adresse': ['centre-ville'],
+  'castelnau-d-estretefonds': ['centre-ville'],
+  'saint-rambert-d-albon': ['centre-ville'],
+  nerac: ['centre-ville'],
+  marsillargues: ['centre-ville'],
+  etrechy: ['centre-ville'],
+  'saint-bonnet-de-mure': ['centre-ville'],
+  'bailly-romainvilliers': ['centre-ville'],
+  betheny: ['centre-ville'],
+  valognes: ['centre-ville'],
+  'fontaines-sur-saone': ['centre-ville'],
+  cognin: ['centre-ville'],
+  morteau: ['centre-ville'],
+  luisant: ['centre-ville'],
+  houdain: ['centre-ville'],
+  'saint-pol-de-leon': ['centre-ville'],
+  'la-plaine-des-palmistes': ['centre-ville'],
+  pledran: ['centre-ville'],
+  bourbourg: ['centre-ville'],
+  senas: ['centre-ville'],
+  escalquens: ['centre-ville'],
+  jacou: ['centre-ville'],
+  lucciana: ['centre-ville'],
+  lesigny: ['centre-ville'],
+  change: ['centre-ville'],
+  cadaujac: ['centre-ville'],
+  'trans-en-provence': ['centre-ville'],
+  'beaufort-en-anjou': ['centre-ville'],
+  surgeres: ['centre-ville'],
+  montluel: ['centre-ville'],
+  'saint-maurice-l-exil': ['centre-ville'],
+  castries: ['centre-ville'],
+  acigne: ['centre-ville'],
+  'carnoux-en-provence': ['centre-ville'],
+  veigne: ['centre-ville'],
+  'auvers-sur-oise': ['centre-ville'],
+  'le-controis-en-sologne': ['centre-ville'],
+  'noyelles-sous-lens': ['centre-ville'],
+  lutterbach: ['centre-ville'],
+  'essarts-en-bocage': ['centre-ville'],
+  'les-abrets-en-dauphine': ['centre-ville'],
+  'le-coteau': ['centre-ville'],
+  loudun: ['centre-ville'],
+  'laudun-l-ardoise': ['centre-ville'],
+  domene: ['centre-ville'],
+  chabeuil: ['centre-ville'],
+  'saint-thibault-des-vignes': ['centre-ville'],
+  'les-essarts-le-roi': ['centre-ville'],
+  'saint-yrieix-la-perche': ['centre-ville'],
+  nyons: ['centre-ville'],
+  'montfort-sur-meu': ['centre-ville'],
+  'quesnoy-sur-deule': ['centre-ville'],
+  caussade: ['centre-ville'],
+  'loos-en-gohelle': ['centre-ville'],
+  poussan: ['centre-ville'],
+  beuvrages: ['centre-ville'],
+  douvaine: ['centre-ville'],
+  ploeren: ['centre-ville'],
+  liancourt: ['centre-ville'],
+  'saint-jean-d-angely': ['centre-ville'],
+  brindas: ['centre-ville'],
+  divion: ['centre-ville'],
+  puilboreau: ['centre-ville'],
+  'le-cateau-cambresis': ['centre-ville'],
+  'saint-julien-les-villas': ['centre-ville'],
+  'merville-31': ['centre-ville'],
+  'cambo-les-bains': ['centre-ville'],
+  plouguerneau: ['centre-ville'],
+  'moelan-sur-mer': ['centre-ville'],
+  meyreuil: ['centre-ville'],
+  gaillon: ['centre-ville'],
+  itteville: ['centre-ville'],
+  'saint-alban-leysse': ['centre-ville'],
+  'saulx-les-chartreux': ['centre-ville'],
+  neufchateau: ['centre-ville'],
+  'saint-victoret': ['centre-ville'],
+  'le-peage-de-roussillon': ['centre-ville'],
+  othis: ['centre-ville'],
+  feignies: ['centre-ville'],
+  'vallons-de-l-erdre': ['centre-ville'],
+  'vigneux-de-bretagne': ['centre-ville'],
+  'inzinzac-lochrist': ['centre-ville'],
+  migennes: ['centre-ville'],
+  fronton: ['centre-ville'],
+  'meung-sur-loire': ['centre-ville'],
+  'luxeuil-les-bains': ['centre-ville'],
+  montech: ['centre-ville'],
+  cassis: ['centre-ville'],
+  'chalonnes-sur-loire': ['centre-ville'],
+  thones: ['centre-ville'],
+  'chatelaillon-plage': ['centre-ville'],
+  gignac: ['centre-ville'],
+  elven: ['centre-ville'],
+  'la-bassee': ['centre-ville'],
+  'le-lavandou': ['centre-ville'],
+  grenay: ['centre-ville'],
+  honfleur: ['centre-ville'],
+  gigean: ['centre-ville'],
+  'saint-pierre-d-oleron': ['centre-ville'],
+  'laneuveville-devant-nancy': ['centre-ville'],
+  lentilly: ['centre-ville'],
+  'sury-le-comtal': ['centre-ville'],
+  canohes: ['centre-ville'],
+  'loriol-sur-drome': ['centre-ville'],
+  'la-penne-sur-huveaune': ['centre-ville'],
+  'montauban-de-bretagne': ['centre-ville'],
+  bouffemont: ['centre-ville'],
+  ceyrat: ['centre-ville'],
+  'chasse-sur-rhone': ['centre-ville'],
+  furiani: ['centre-ville'],
+  'labarthe-sur-leze': ['centre-ville'],
+  heric: ['centre-ville'],
+  labruguiere: ['centre-ville'],
+  bouchemaine: ['centre-ville'],
+  gemenos: ['centre-ville'],
+  'longuenee-en-anjou': ['centre-ville'],
+  thoiry: ['centre-ville'],
+  'le-lorrain': ['centre-ville'],
+  'longue-jumelles': ['centre-ville'],
+  'saint-juery': ['centre-ville'],
+  'saint-jean-bonnefonds': ['centre-ville'],
+  'le-mene': ['centre-ville'],
+  champigneulles: ['centre-ville'],
+  rives: ['centre-ville'],
+  'la-bouilladisse': ['centre-ville'],
+  'sainte-livrade-sur-lot': ['centre-ville'],
+  eaunes: ['centre-ville'],
+  'la-chevroliere': ['centre-ville'],
+  'marange-silvange': ['centre-ville'],
+  'l-arbresle': ['centre-ville'],
+  'saint-alban': ['centre-ville'],
+  cormontreuil: ['centre-ville'],
+  'la-mulatiere': ['centre-ville'],
+  ondres: ['centre-ville'],
+  'bon-encontre': ['centre-ville'],
+  lezoux: ['centre-ville'],
+  gueugnon: ['centre-ville'],
+  brioude: ['centre-ville'],
+  estaires: ['centre-ville'],
+  'neuves-maisons': ['centre-ville'],
+  'chatuzange-le-goubet': ['centre-ville'],
+  ploudalmezeau: ['centre-ville'],
+  ambert: ['centre-ville'],
+  limours: ['centre-ville'],
+  marignier: ['centre-ville'],
+  'les-trois-ilets': ['centre-ville'],
+  'la-montagne': ['centre-ville'],
+  'change-53': ['centre-ville'],
+  gouesnou: ['centre-ville'],
+  eu: ['centre-ville'],
+  'champagne-sur-seine': ['centre-ville'],
+  calvisson: ['centre-ville'],
+  ares: ['centre-ville'],
+  'longpont-sur-orge': ['centre-ville'],
+  'villers-saint-paul': ['centre-ville'],
+  'le-perray-en-yvelines': ['centre-ville'],
+  'saint-pathus': ['centre-ville'],
+  condom: ['centre-ville'],
+  'grezieu-la-varenne': ['centre-ville'],
+  'vezin-le-coquet': ['centre-ville'],
+  'saint-priest-en-jarez': ['centre-ville'],
+  cuincy: ['centre-ville'],
+  'saint-florent-sur-cher': ['centre-ville'],
+  entrelacs: ['centre-ville'],
+  'saint-laurent-blangy': ['centre-ville'],
+  'ploneour-lanvern': ['centre-ville'],
+  sciez: ['centre-ville'],
+  louhans: ['centre-ville'],
+  peronnas: ['centre-ville'],
+  frouard: ['centre-ville'],
+  bonsecours: ['centre-ville'],
+  'm-tsangamouji': ['centre-ville'],
+  'saint-andre-de-sangonis': ['centre-ville'],
+  courthezon: ['centre-ville'],
+  'la-tronche': ['centre-ville'],
+  'auneau-bleury-saint-symphorien': ['centre-ville'],
+  embrun: ['centre-ville'],
+  combourg: ['centre-ville'],
+  'saint-remy': ['centre-ville'],
+  'murs-erigne': ['centre-ville'],
+  'j-uf': ['centre-ville'],
+  'saint-flour': ['centre-ville'],
+  'breal-sous-montfort': ['centre-ville'],
+  'saint-jorioz': ['centre-ville'],
+  sevremont: ['centre-ville'],
+  magnanville: ['centre-ville'],
+  'mehun-sur-yevre': ['centre-ville'],
+  izon: ['centre-ville'],
+  baud: ['centre-ville'],
+  givet: ['centre-ville'],
+  plescop: ['centre-ville'],
+  'arpajon-sur-cere': ['centre-ville'],
+  ambilly: ['centre-ville'],
+  nandy: ['centre-ville'],
+  'villemur-sur-tarn': ['centre-ville'],
+  'bons-en-chablais': ['centre-ville'],
+  'le-mesnil-le-roi': ['centre-ville'],
+  'saint-cyr-au-mont-d-or': ['centre-ville'],
+  'dompierre-sur-mer': ['centre-ville'],
+  'champagne-au-mont-d-or': ['centre-ville'],
+  thyez: ['centre-ville'],
+  avallon: ['centre-ville'],
+  vaugneray: ['centre-ville'],
+  'pont-de-cheruy': ['centre-ville'],
+  'bonchamp-les-laval': ['centre-ville'],
+  'chatel-guyon': ['centre-ville'],
+  milhaud: ['centre-ville'],
+  esvres: ['centre-ville'],
+  louvroil: ['centre-ville'],
+  'vouneuil-sous-biard': ['centre-ville'],
+  lallaing: ['centre-ville'],
+  mazan: ['centre-ville'],
+  'migne-auxances': ['centre-ville'],
+  mare: ['centre-ville'],
+  mornant: ['centre-ville'],
+  'belin-beliet': ['centre-ville'],
+  'noyal-sur-vilaine': ['centre-ville'],
+  'sollies-toucas': ['centre-ville'],
+  'chatenoy-le-royal': ['centre-ville'],
+  huahine: ['centre-ville'],
+  pluneret: ['centre-ville'],
+  'saint-pryve-saint-mesmin': ['centre-ville'],
+  wimereux: ['centre-ville'],
+  homecourt: ['centre-ville'],
+  mer: ['centre-ville'],
+  'jassans-riottier': ['centre-ville'],
+  fleurance: ['centre-ville'],
+  bellevigny: ['centre-ville'],
+  'saint-martin-de-seignanx': ['centre-ville'],
+  'cuges-les-pins': ['centre-ville'],
+  loches: ['centre-ville'],
+  malaunay: ['centre-ville'],
+  'terrasson-lavilledieu': ['centre-ville'],
+  'pont-eveque': ['centre-ville'],
+  'aire-sur-l-adour': ['centre-ville'],
+  'saint-marcel': ['centre-ville'],
+  guer: ['centre-ville'],
+  'livarot-pays-d-auge': ['centre-ville'],
+  bruguieres: ['centre-ville'],
+  'horbourg-wihr': ['centre-ville'],
+  'saint-quentin-fallavier': ['centre-ville'],
+  boueni: ['centre-ville'],
+  'saint-symphorien-d-ozon': ['centre-ville'],
+  'prades-le-lez': ['centre-ville'],
+  menucourt: ['centre-ville'],
+  'thue-et-mue': ['centre-ville'],
+  'saint-genest-lerpt': ['centre-ville'],
+  'saint-marcel-les-valence': ['centre-ville'],
+  feytiat: ['centre-ville'],
+  'saint-mitre-les-remparts': ['centre-ville'],
+  'octeville-sur-mer': ['centre-ville'],
+  'petite-rosselle': ['centre-ville'],
+  'franqueville-saint-pierre': ['centre-ville'],
+  mallemort: ['centre-ville'],
+  'behren-les-forbach': ['centre-ville'],
+  'le-blanc': ['centre-ville'],
+  'aurec-sur-loire': ['centre-ville'],
+  'marennes-hiers-brouage': ['centre-ville'],
+  'le-diamant': ['centre-ville'],
+  'saint-denis-les-bourg': ['centre-ville'],
+  fayence: ['centre-ville'],
+  oraison: ['centre-ville'],
+  prades: ['centre-ville'],
+  jonage: ['centre-ville'],
+  dourges: ['centre-ville'],
+  vendenheim: ['centre-ville'],
+  'quint-fonsegrives': ['centre-ville'],
+  'palavas-les-flots': ['centre-ville'],
+  bouillante: ['centre-ville'],
+  'le-barcares': ['centre-ville'],
+  'blainville-sur-orne': ['centre-ville'],
+  'saint-cannat': ['centre-ville'],
+  'sainte-sigolene': ['centre-ville'],
+  ostricourt: ['centre-ville'],
+  'haute-goulaine': ['centre-ville'],
+  pecquencourt: ['centre-ville'],
+  'fouquieres-les-lens': ['centre-ville'],
+  mutzig: ['centre-ville'],
+  'pierrefeu-du-var': ['centre-ville'],
+  maule: ['centre-ville'],
+  'hersin-coupigny': ['centre-ville'],
+  noves: ['centre-ville'],
+  'mesnils-sur-iton': ['centre-ville'],
+  'saint-martin-le-vinoux': ['centre-ville'],
+  'bois-le-roi': ['centre-ville'],
+  esbly: ['centre-ville'],
+  bouillargues: ['centre-ville'],
+  'saint-jean-de-boiseau': ['centre-ville'],
+  beauvoisin: ['centre-ville'],
+  geveze: ['centre-ville'],
+  mondonville: ['centre-ville'],
+  'vaison-la-romaine': ['centre-ville'],
+  'mortagne-sur-sevre': ['centre-ville'],
+  'luc-la-primaube': ['centre-ville'],
+  'le-castellet': ['centre-ville'],
+  'jouars-pontchartrain': ['centre-ville'],
+  pavilly: ['centre-ville'],
+  'marly-la-ville': ['centre-ville'],
+  'trith-saint-leger': ['centre-ville'],
+  commentry: ['centre-ville'],
+  'vexin-sur-epte': ['centre-ville'],
+  'saint-girons': ['centre-ville'],
+  donzere: ['centre-ville'],
+  clapiers: ['centre-ville'],
+  'saint-mandrier-sur-mer': ['centre-ville'],
+  'noyelles-godault': ['centre-ville'],
+  'fontenay-tresigny': ['centre-ville'],
+  'la-verriere': ['centre-ville'],
+  'ablon-sur-seine': ['centre-ville'],
+  lavelanet: ['centre-ville'],
+  'conde-en-normandie': ['centre-ville'],
+  corbie: ['centre-ville'],
+  aubignan: ['centre-ville'],
+  'hombourg-haut': ['centre-ville'],
+  benfeld: ['centre-ville'],
+  marnaz: ['centre-ville'],
+  naintre: ['centre-ville'],
+  'roost-warendin': ['centre-ville'],
+  'saint-denis-de-pile': ['centre-ville'],
+  blanzy: ['centre-ville'],
+  vias: ['centre-ville'],
+  'loon-plage': ['centre-ville'],
+  'villennes-sur-seine': ['centre-ville'],
+  ciboure: ['centre-ville'],
+  quievrechain: ['centre-ville'],
+  'sains-en-gohelle': ['centre-ville'],
+  'fleury-sur-orne': ['centre-ville'],
+  'le-puy-sainte-reparade': ['centre-ville'],
+  montdidier: ['centre-ville'],
+  'grand-champ': ['centre-ville'],
+  'bellevigne-en-layon': ['centre-ville'],
+  negrepelisse: ['centre-ville'],
+  'tain-l-hermitage': ['centre-ville'],
+  fontenilles: ['centre-ville'],
+  'saint-pierre-d-irube': ['centre-ville'],
+  'saint-andre-de-la-roche': ['centre-ville'],
+  'bricquebec-en-cotentin': ['centre-ville'],
+  'aixe-sur-vienne': ['centre-ville'],
+  'raon-l-etape': ['centre-ville'],
+  'saintry-sur-seine': ['centre-ville'],
+  'saint-zacharie': ['centre-ville'],
+  eschau: ['centre-ville'],
+  'saint-arnoult-en-yvelines': ['centre-ville'],
+  'grand-charmont': ['centre-ville'],
+  'lesparre-medoc': ['centre-ville'],
+  douvrin: ['centre-ville'],
+  rabastens: ['centre-ville'],
+  'montpon-menesterol': ['centre-ville'],
+  riantec: ['centre-ville'],
+  'la-wantzenau': ['centre-ville'],
+  'gond-pontouvre': ['centre-ville'],
+  oberhausbergen: ['centre-ville'],
+  'le-poinconnet': ['centre-ville'],
+  seloncourt: ['centre-ville'],
+  'port-la-nouvelle': ['centre-ville'],
+  fismes: ['centre-ville'],
+  chambourcy: ['centre-ville'],
+  boe: ['centre-ville'],
+  ludres: ['centre-ville'],
+  'saint-martin-lez-tatinghem': ['centre-ville'],
+  ventabren: ['centre-ville'],
+  bessan: ['centre-ville'],
+  arradon: ['centre-ville'],
+  gareoult: ['centre-ville'],
+  kembs: ['centre-ville'],
+  roye: ['centre-ville'],
+  cessy: ['centre-ville'],
+  villabe: ['centre-ville'],
+  'dol-de-bretagne': ['centre-ville'],
+  'saint-galmier': ['centre-ville'],
+  sillingy: ['centre-ville'],
+  annezin: ['centre-ville'],
+  montmorillon: ['centre-ville'],
+  briec: ['centre-ville'],
+  buc: ['centre-ville'],
+  'nieul-sur-mer': ['centre-ville'],
+  lannemezan: ['centre-ville'],
+  'saint-just-en-chaussee': ['centre-ville'],
+  mouroux: ['centre-ville'],
+  viry: ['centre-ville'],
+  'le-barp': ['centre-ville'],
+  bedarieux: ['centre-ville'],
+  algrange: ['centre-ville'],
+  'roquefort-la-bedoule': ['centre-ville'],
+  sarrians: ['centre-ville'],
+  'saint-laurent-de-mure': ['centre-ville'],
+  calvi: ['centre-ville'],
+  vergeze: ['centre-ville'],
+  fenouillet: ['centre-ville'],
+  'simiane-collongue': ['centre-ville'],
+  'oye-plage': ['centre-ville'],
+  fegersheim: ['centre-ville'],
+  wasselonne: ['centre-ville'],
+  'magny-en-vexin': ['centre-ville'],
+  'le-palais-sur-vienne': ['centre-ville'],
+  peypin: ['centre-ville'],
+  'erdre-en-anjou': ['centre-ville'],
+  'thizy-les-bourgs': ['centre-ville'],
+  'saint-hilaire-du-harcouet': ['centre-ville'],
+  'pointe-noire': ['centre-ville'],
+  'maze-milon': ['centre-ville'],
+  'ensues-la-redonne': ['centre-ville'],
+  canejan: ['centre-ville'],
+  plouay: ['centre-ville'],
+  'saint-gervais-les-bains': ['centre-ville'],
+  melle: ['centre-ville'],
+  doullens: ['centre-ville'],
+  'flines-lez-raches': ['centre-ville'],
+  lacanau: ['centre-ville'],
+  'la-cadiere-d-azur': ['centre-ville'],
+  coursan: ['centre-ville'],
+  orgeres: ['centre-ville'],
+  beaucouze: ['centre-ville'],
+  bannalec: ['centre-ville'],
+  'gournay-en-bray': ['centre-ville'],
+  piolenc: ['centre-ville'],
+  revin: ['centre-ville'],
+  epernon: ['centre-ville'],
+  'saint-michel-chef-chef': ['centre-ville'],
+  'saint-martin-la-pallu': ['centre-ville'],
+  'cugand-la-bernardiere': ['centre-ville'],
+  lannilis: ['centre-ville'],
+  missillac: ['centre-ville'],
+  'marolles-en-hurepoix': ['centre-ville'],
+  valdahon: ['centre-ville'],
+  aimargues: ['centre-ville'],
+  'saint-privat-des-vieux': ['centre-ville'],
+  'carry-le-rouet': ['centre-ville'],
+  tournus: ['centre-ville'],
+  mondelange: ['centre-ville'],
+  'montbonnot-saint-martin': ['centre-ville'],
+  saleilles: ['centre-ville'],
+  valdalliere: ['centre-ville'],
+  marcheprime: ['centre-ville'],
+  mourenx: ['centre-ville'],
+  ligne: ['centre-ville'],
+  altkirch: ['centre-ville'],
+  leves: ['centre-ville'],
+  dainville: ['centre-ville'],
+  'l-isle-d-espagnac': ['centre-ville'],
+  longueau: ['centre-ville'],
+  'saint-xandre': ['centre-ville'],
+  'saint-georges-d-orques': ['centre-ville'],
+  gan: ['centre-ville'],
+  cancale: ['centre-ville'],
+  bedarrides: ['centre-ville'],
+  'la-roquette-sur-siagne': ['centre-ville'],
+  pouzauges: ['centre-ville'],
+  'caumont-sur-durance': ['centre-ville'],
+  sausheim: ['centre-ville'],
+  'la-creche': ['centre-ville'],
+  rocbaron: ['centre-ville'],
+  sigean: ['centre-ville'],
+  parmain: ['centre-ville'],
+  chanverrie: ['centre-ville'],
+  'montrond-les-bains': ['centre-ville'],
+  santes: ['centre-ville'],
+  'rives-du-loir-en-anjou': ['centre-ville'],
+  pourrieres: ['centre-ville'],
+  'montval-sur-loir': ['centre-ville'],
+  'sainghin-en-weppes': ['centre-ville'],
+  wallers: ['centre-ville'],
+  'challes-les-eaux': ['centre-ville'],
+  delle: ['centre-ville'],
+  'la-gorgue': ['centre-ville'],
+  rungis: ['centre-ville'],
+  gannat: ['centre-ville'],
+  sauvian: ['centre-ville'],
+  'cloyes-les-trois-rivieres': ['centre-ville'],
+  'port-louis': ['centre-ville'],
+  'la-ville-aux-dames': ['centre-ville'],
+  'bohain-en-vermandois': ['centre-ville'],
+  ternay: ['centre-ville'],
+  'saint-martin-d-uriage': ['centre-ville'],
+  genay: ['centre-ville'],
+  wormhout: ['centre-ville'],
+  liverdun: ['centre-ville'],
+  'ludon-medoc': ['centre-ville'],
+  bourail: ['centre-ville'],
+  carbonne: ['centre-ville'],
+  beaurains: ['centre-ville'],
+  'le-port-marly': ['centre-ville'],
+  viarmes: ['centre-ville'],
+  'ille-sur-tet': ['centre-ville'],
+  ambazac: ['centre-ville'],
+  pollestres: ['centre-ville'],
+  'quincy-voisins': ['centre-ville'],
+  baisieux: ['centre-ville'],
+  'chazelles-sur-lyon': ['centre-ville'],
+  'nogent-sur-seine': ['centre-ville'],
+  lardy: ['centre-ville'],
+  roquemaure: ['centre-ville'],
+  aussillon: ['centre-ville'],
+  'saint-sebastien-de-morsent': ['centre-ville'],
+  nouzonville: ['centre-ville'],
+  'saint-mars-du-desert': ['centre-ville'],
+  coublevie: ['centre-ville'],
+  'les-achards': ['centre-ville'],
+  servian: ['centre-ville'],
+  'la-garnache': ['centre-ville'],
+  'neuville-de-poitou': ['centre-ville'],
+  penmarch: ['centre-ville'],
+  'kani-keli': ['centre-ville'],
+  chevreuse: ['centre-ville'],
+  ernee: ['centre-ville'],
+  grans: ['centre-ville'],
+  'le-boulou': ['centre-ville'],
+  drap: ['centre-ville'],
+  'nueil-les-aubiers': ['centre-ville'],
+  guines: ['centre-ville'],
+  foulayronnes: ['centre-ville'],
+  'etoile-sur-rhone': ['centre-ville'],
+  'la-roque-d-antheron': ['centre-ville'],
+  rosheim: ['centre-ville'],
+  ollainville: ['centre-ville'],
+  'la-ferriere': ['centre-ville'],
+  'aubigny-sur-nere': ['centre-ville'],
+  'noyant-villages': ['centre-ville'],
+  'cregy-les-meaux': ['centre-ville'],
+  arnage: ['centre-ville'],
+  'chatillon-sur-seine': ['centre-ville'],
+  'saint-memmie': ['centre-ville'],
+  fenain: ['centre-ville'],
+  'saint-genis-les-ollieres': ['centre-ville'],
+  coulogne: ['centre-ville'],
+  roques: ['centre-ville'],
+  'boulay-moselle': ['centre-ville'],
+  'marsannay-la-cote': ['centre-ville'],
+  mouguerre: ['centre-ville'],
+  'wervicq-sud': ['centre-ville'],
+  rousset: ['centre-ville'],
+  'flers-en-escrebieux': ['centre-ville'],
+  aiffres: ['centre-ville'],
+  reichshoffen: ['centre-ville'],
+  'lacroix-saint-ouen': ['centre-ville'],
+  'le-cendre': ['centre-ville'],
+  ploumagoar: ['centre-ville'],
+  heillecourt: ['centre-ville'],
+  'marles-les-mines': ['centre-ville'],
+  'peyrolles-en-provence': ['centre-ville'],
+  'saint-pierre-les-nemours': ['centre-ville'],
+  plouhinec: ['centre-ville'],
+  'borderes-sur-l-echez': ['centre-ville'],
+  'vic-le-comte': ['centre-ville'],
+  'le-lion-d-angers': ['centre-ville'],
+  drusenheim: ['centre-ville'],
+  'charbonnieres-les-bains': ['centre-ville'],
+  garons: ['centre-ville'],
+  levens: ['centre-ville'],
+  'cormelles-le-royal': ['centre-ville'],
+  'saint-astier': ['centre-ville'],
+  cruseilles: ['centre-ville'],
+  'calonne-ricouart': ['centre-ville'],
+  gray: ['centre-ville'],
+  trebes: ['centre-ville'],
+  reyrieux: ['centre-ville'],
+  'parigne-l-eveque': ['centre-ville'],
+  blere: ['centre-ville'],
+  commercy: ['centre-ville'],
+  chagny: ['centre-ville'],
+  meriel: ['centre-ville'],
+  'bretignolles-sur-mer': ['centre-ville'],
+  'erquinghem-lys': ['centre-ville'],
+  idron: ['centre-ville'],
+  dechy: ['centre-ville'],
+  'la-balme-de-sillingy': ['centre-ville'],
+  plesse: ['centre-ville'],
+  mundolsheim: ['centre-ville'],
+  'le-pellerin': ['centre-ville'],
+  mouy: ['centre-ville'],
+  gambsheim: ['centre-ville'],
+  audruicq: ['centre-ville'],
+  bethoncourt: ['centre-ville'],
+  barberaz: ['centre-ville'],
+  'vindry-sur-turdine': ['centre-ville'],
+  'saint-lyphard': ['centre-ville'],
+  tahaa: ['centre-ville'],
+  'villers-le-lac': ['centre-ville'],
+  tresses: ['centre-ville'],
+  brebieres: ['centre-ville'],
+  blotzheim: ['centre-ville'],
+  mormant: ['centre-ville'],
+  champniers: ['centre-ville'],
+  'condat-sur-vienne': ['centre-ville'],
+  'mouilleron-le-captif': ['centre-ville'],
+  'villette-d-anthon': ['centre-ville'],
+  'moulins-les-metz': ['centre-ville'],
+  valleiry: ['centre-ville'],
+  'cazouls-les-beziers': ['centre-ville'],
+  florensac: ['centre-ville'],
+  'chatillon-sur-chalaronne': ['centre-ville'],
+  'pont-sainte-marie': ['centre-ville'],
+  bauvin: ['centre-ville'],
+  'le-rove': ['centre-ville'],
+  mulsanne: ['centre-ville'],
+  'guemene-penfao': ['centre-ville'],
+  semeac: ['centre-ville'],
+  'nuits-saint-georges': ['centre-ville'],
+  'mignaloux-beauvoir': ['centre-ville'],
+  laille: ['centre-ville'],
+  farebersviller: ['centre-ville'],
+  forcalquier: ['centre-ville'],
+  'saint-clement-de-riviere': ['centre-ville'],
+  marquise: ['centre-ville'],
+  'le-bourget-du-lac': ['centre-ville'],
+  'nans-les-pins': ['centre-ville'],
+  surzur: ['centre-ville'],
+  vernaison: ['centre-ville'],
+  tourves: ['centre-ville'],
+  'saint-saturnin-les-avignon': ['centre-ville'],
+  gorges: ['centre-ville'],
+  'vaux-sur-seine': ['centre-ville'],
+  jonquieres: ['centre-ville'],
+  beynost: ['centre-ville'],
+  'brou-sur-chantereine': ['centre-ville'],
+  acoua: ['centre-ville'],
+  pauillac: ['centre-ville'],
+  gauchy: ['centre-ville'],
+  'l-hopital': ['centre-ville'],
+  'schweighouse-sur-moder': ['centre-ville'],
+  scaer: ['centre-ville'],
+  'bassens-73': ['centre-ville'],
+  valdoie: ['centre-ville'],
+  coubron: ['centre-ville'],
+  villerest: ['centre-ville'],
+  'loison-sous-lens': ['centre-ville'],
+  seichamps: ['centre-ville'],
+  'villars-les-dombes': ['centre-ville'],
+  'l-etang-la-ville': ['centre-ville'],
+  'baume-les-dames': ['centre-ville'],
+  trilport: ['centre-ville'],
+  'pont-l-eveque': ['centre-ville'],
+  'douvres-la-delivrande': ['centre-ville'],
+  'le-cannet-des-maures': ['centre-ville'],
+  'villeneuve-sur-yonne': ['centre-ville'],
+  longuyon: ['centre-ville'],
+  'saint-vit': ['centre-ville'],
+  'saint-cheron': ['centre-ville'],
+  'ferriere-la-grande': ['centre-ville'],
+  'locmaria-plouzane': ['centre-ville'],
+  cucq: ['centre-ville'],
+  villenoy: ['centre-ville'],
+  chavanoz: ['centre-ville'],
+  'sully-sur-loire': ['centre-ville'],
+  'dives-sur-mer': ['centre-ville'],
+  'moncoutant-sur-sevre': ['centre-ville'],
+  'villeneuve-en-retz': ['centre-ville'],
+  'saint-marcellin-en-forez': ['centre-ville'],
+  'le-val-d-hazey': ['centre-ville'],
+  faulquemont: ['centre-ville'],
+  'chateau-arnoux-saint-auban': ['centre-ville'],
+  'ay-champagne': ['centre-ville'],
+  'val-de-moder': ['centre-ville'],
+  pulnoy: ['centre-ville'],
+  baillif: ['centre-ville'],
+  genlis: ['centre-ville'],
+  'billy-berclau': ['centre-ville'],
+  'saint-georges-de-didonne': ['centre-ville'],
+  'saint-pantaleon-de-larche': ['centre-ville'],
+  muzillac: ['centre-ville'],
+  'maen-roch': ['centre-ville'],
+  baden: ['centre-ville'],
+  chateaulin: ['centre-ville'],
+  ornex: ['centre-ville'],
+  'saint-philippe': ['centre-ville'],
+  giberville: ['centre-ville'],
+  habsheim: ['centre-ville'],
+  yffiniac: ['centre-ville'],
+  sommieres: ['centre-ville'],
+  'villefranche-de-lauragais': ['centre-ville'],
+  'la-ferte-mace': ['centre-ville'],
+  blaye: ['centre-ville'],
+  haillicourt: ['centre-ville'],
+  'bonnieres-sur-seine': ['centre-ville'],
+  luynes: ['centre-ville'],
+  'petite-foret': ['centre-ville'],
+  laventie: ['centre-ville'],
+  'saint-sever': ['centre-ville'],
+  cilaos: ['centre-ville'],
+  bezannes: ['centre-ville'],
+  'champagne-sur-oise': ['centre-ville'],
+  'sainte-soulle': ['centre-ville'],
+  'la-meziere': ['centre-ville'],
+  gruissan: ['centre-ville'],
+  'hauts-de-bienne': ['centre-ville'],
+  'saint-etienne-au-mont': ['centre-ville'],
+  'pacy-sur-eure': ['centre-ville'],
+  'morcenx-la-nouvelle': ['centre-ville'],
+  decazeville: ['centre-ville'],
+  allinges: ['centre-ville'],
+  'saint-james': ['centre-ville'],
+  rambervillers: ['centre-ville'],
+  plouigneau: ['centre-ville'],
+  beaurepaire: ['centre-ville'],
+  lestrem: ['centre-ville'],
+  'villefranche-sur-mer': ['centre-ville'],
+  luzarches: ['centre-ville'],
+  taputapuatea: ['centre-ville'],
+  papaichton: ['centre-ville'],
+}
+
+/** Ville slug -> quartier slug -> position in `ville.quartiers` */
+export const QUARTIER_INDEX: Record<string, Record<string, number>> = {
+  paris: {
+    '1er-arr': 0,
+    '2e-arr': 1,
+    '3e-arr': 2,
+    '4e-arr': 3,
+    '5e-arr': 4,
+    '6e-arr': 5,
+    '7e-arr': 6,
+    '8e-arr': 7,
+    '9e-arr': 8,
+    '10e-arr': 9,
+    '11e-arr': 10,
+    '12e-arr': 11,
+    '13e-arr': 12,
+    '14e-arr': 13,
+    '15e-arr': 14,
+    '16e-arr': 15,
+    '17e-arr': 16,
+    '18e-arr': 17,
+    '19e-arr': 18,
+    '20e-arr': 19,
+  },
+  marseille: { 'vieux-port': 0, 'le-panier': 1, 'la-joliette': 2, castellane: 3, 'la-canebiere': 4, prado: 5, bonneveine: 6, 'les-calanques': 7 },
+  lyon: { 'presqu-ile': 0, 'vieux-lyon': 1, 'part-dieu': 2, confluence: 3, 'croix-rousse': 4, gerland: 5, villeurbanne: 6 },
+  toulouse: { capitole: 0, 'saint-cyprien': 1, carmes: 2, 'les-minimes': 3, 'saint-michel': 4, rangueil: 5, blagnac: 6 },
+  nice: { 'vieux-nice': 0, 'promenade-des-anglais': 1, cimiez: 2, port: 3, liberation: 4, 'saint-roch': 5 },
+  nantes: { 'centre-ville': 0, 'ile-de-nantes': 1, doulon: 2, erdre: 3, chantenay: 4 },
+  montpellier: { ecusson: 0, antigone: 1, 'port-marianne': 2, 'hopitaux-facultes': 3, mosson: 4 },
+  strasbourg: { 'grande-ile': 0, 'petite-france': 1, krutenau: 2, neudorf: 3, robertsau: 4 },
+  bordeaux: { 'centre-historique': 0, chartrons: 1, 'saint-michel': 2, bastide: 3, bacalan: 4 },
+  lille: { 'vieux-lille': 0, centre: 1, wazemmes: 2, fives: 3, moulins: 4 },
+  rennes: { centre: 0, thabor: 1, 'sainte-therese': 2, villejean: 3, maurepas: 4 },
+  toulon: { 'vieille-ville': 0, mourillon: 1, 'saint-jean-du-var': 2, 'le-revest': 3 },
+  reims: { 'centre-ville': 0, clairmarais: 1, 'croix-rouge': 2, 'jean-jaures': 3, tinqueux: 4, cormontreuil: 5, wilson: 6 },
+  'saint-etienne': { 'centre-ville': 0, chateaucreux: 1, bellevue: 2, terrenoire: 3, montreynaud: 4, 'la-metare': 5 },
+  'le-havre': { 'centre-reconstruit': 0, 'sainte-adresse': 1, sanvic: 2, graville: 3, danton: 4 },
+  villeurbanne: { 'gratte-ciel': 0, tonkin: 1, cusset: 2, grandclement: 3, charpennes: 4 },
+  dijon: { 'centre-historique': 0, 'toison-d-or': 1, 'fontaine-d-ouche': 2, gresilles: 3 },
+  angers: { 'centre-ville': 0, doutre: 1, 'belle-beille': 2, monplaisir: 3, roseraie: 4 },
+  grenoble: { 'centre-ville': 0, europole: 1, 'ile-verte': 2, 'village-olympique': 3, championnet: 4, bajatiere: 5, 'eaux-claires': 6 },
+  'saint-denis': { 'centre-ville': 0, floreal: 1, pleyel: 2, 'stade-de-france': 3, 'franc-moisin': 4, basilique: 5 },
+  nimes: { ecusson: 0, gambetta: 1, costieres: 2, 'mas-de-mingue': 3, richelieu: 4, 'jean-jaures': 5, pissevin: 6 },
+  'aix-en-provence': { 'centre-historique': 0, 'cours-mirabeau': 1, mazarin: 2, 'jas-de-bouffan': 3 },
+  'clermont-ferrand': { 'centre-historique': 0, jaude: 1, montferrand: 2, 'croix-de-neyrat': 3, 'les-cezeaux': 4, salins: 5 },
+  'le-mans': { 'centre-ville': 0, pontlieue: 1, 'les-sablons': 2, universite: 3, bollee: 4, coulaines: 5 },
+  brest: { 'centre-ville': 0, recouvrance: 1, 'saint-marc': 2, lambezellec: 3, bellevue: 4 },
+  tours: { 'vieux-tours': 0, grammont: 1, 'les-deux-lions': 2, 'saint-symphorien': 3, sanitas: 4 },
+  amiens: { 'centre-ville': 0, 'saint-leu': 1, henriville: 2, etouvie: 3, 'saint-acheul': 4 },
+  annecy: { 'vieille-ville': 0, 'les-balmettes': 1, 'annecy-le-vieux': 2, seynod: 3, 'cran-gevrier': 4, novel: 5 },
+  limoges: { 'centre-ville': 0, beaubreuil: 1, 'val-de-l-aurence': 2, 'la-borie': 3, 'la-bastide': 4, 'le-sablard': 5 },
+  metz: { 'centre-ville': 0, sablon: 1, plantieres: 2, queuleu: 3, borny: 4 },
+  perpignan: { 'centre-historique': 0, 'saint-jacques': 1, 'moulin-a-vent': 2, 'le-vernet': 3, 'bas-vernet': 4 },
+  'boulogne-billancourt': { 'centre-ville': 0, 'pont-de-sevres': 1, republique: 2, 'les-princes': 3, 'point-du-jour': 4, silly: 5, parchamp: 6 },
+  besancon: { 'centre-ville': 0, battant: 1, planoise: 2, palente: 3, bregille: 4 },
+  rouen: { 'centre-historique': 0, 'saint-sever': 1, martainville: 2, 'saint-clement': 3, grammont: 4, jouvenet: 5 },
+  orleans: { 'centre-ville': 0, 'la-source': 1, 'saint-marceau': 2, argonne: 3, madeleine: 4 },
+  montreuil: { 'centre-ville': 0, 'croix-de-chavaux': 1, 'villiers-barbusse': 2, 'la-noue': 3, 'bel-air': 4 },
+  caen: { 'centre-ville': 0, vaucelles: 1, 'calvaire-saint-pierre': 2, beaulieu: 3, vaugueux: 4, 'saint-jean': 5, 'grace-de-dieu': 6, 'la-gueriniere': 7 },
+  'saint-paul': { 'centre-ville': 0, 'la-possession': 1, 'les-trois-bassins': 2, 'le-port': 3, 'saint-denis': 4, 'saint-leu': 5, cilaos: 6 },
+  argenteuil: { 'centre-ville': 0, 'val-d-argent': 1, orgemont: 2, 'joliot-curie': 3 },
+  mulhouse: { 'centre-ville': 0, rebberg: 1, dornach: 2, bourtzwiller: 3, fonderie: 4 },
+  nancy: { 'centre-ville': 0, saurupt: 1, haussonville: 2, 'trois-maisons': 3, stanislas: 4, poincare: 5, 'haut-du-lievre': 6 },
+  tourcoing: { 'centre-ville': 0, virolois: 1, 'croix-rouge': 2, 'blanc-seau': 3, 'pont-de-neuville': 4, epideme: 5, marliere: 6 },
+  roubaix: { 'centre-ville': 0, barbieux: 1, alma: 2, 'nouveau-roubaix': 3, epeule: 4, 'cul-de-four': 5, pile: 6 },
+  nanterre: { 'centre-ville': 0, 'petit-nanterre': 1, 'mont-valerien': 2, 'les-provinces': 3, 'vieux-pont': 4, 'parc-sud': 5, 'chemin-de-l-ile': 6 },
+  'vitry-sur-seine': { 'centre-ville': 0, 'port-a-l-anglais': 1, 'moulin-vert': 2, plateau: 3, 'commune-de-paris': 4, gare: 5, coteau: 6 },
+  'asnieres-sur-seine': { 'centre-ville': 0, gennevilliers: 1, clichy: 2, 'bois-colombes': 3, 'levallois-perret': 4, 'villeneuve-la-garenne': 5, colombes: 6 },
+  creteil: { 'centre-ancien': 0, palais: 1, echat: 2, 'mont-mesly': 3, prefecture: 4, levriere: 5, habette: 6 },
+  avignon: { 'intra-muros': 0, montfavet: 1, 'rocade-sud': 2, 'saint-chamand': 3 },
+  colombes: { 'centre-ville': 0, 'petit-colombes': 1, 'agent-sarre': 2, greves: 3, europe: 4, 'fosses-jean': 5, stade: 6 },
+  poitiers: { 'centre-ville': 0, couronneries: 1, gibauderie: 2, beaulieu: 3, 'trois-cites': 4, 'saint-eloi': 5, montmidi: 6 },
+  aubervilliers: { 'centre-ville': 0, 'quatre-chemins': 1, landy: 2, villette: 3, robespierre: 4, maladrerie: 5, 'presqu-ile': 6 },
+  'aulnay-sous-bois': { 'centre-ville': 0, 'rose-des-vents': 1, ambourget: 2, chanteloup: 3, 'gros-saule': 4, nonneville: 5, mitry: 6 },
+  dunkerque: { 'centre-ville': 0, 'malo-les-bains': 1, rosendael: 2, 'petite-synthe': 3, glacis: 4, 'coudekerque-branche': 5, 'saint-pol-sur-mer': 6 },
+  noumea: { 'centre-ville': 0, dumbea: 1 },
+  'saint-pierre': { 'centre-ville': 0, 'petite-ile': 1, 'entre-deux': 2, 'le-tampon': 3, 'saint-louis': 4, 'saint-joseph': 5, 'l-etang-sale': 6 },
+  versailles: { 'centre-ville': 0, 'notre-dame': 1, 'saint-louis': 2, montreuil: 3, porchefontaine: 4, clagny: 5, jussieu: 6 },
+  courbevoie: { 'centre-ville': 0, becon: 1, 'faubourg-de-l-arche': 2, marceau: 3, regnault: 4, gambetta: 5, voltaire: 6 },
+  'rueil-malmaison': { 'centre-ville': 0, 'mont-valerien': 1, buzenval: 2, jonchere: 3, 'plaine-gare': 4, 'bois-preau': 5, coteaux: 6 },
+  'le-tampon': { 'centre-ville': 0, 'entre-deux': 1, 'saint-joseph': 2, 'la-plaine-des-palmistes': 3, 'saint-pierre': 4, 'petite-ile': 5, cilaos: 6 },
+  beziers: { 'centre-historique': 0, arenes: 1, deveze: 2, 'la-montagnette': 3, faubourg: 4, iranget: 5, grangette: 6 },
+  pau: { 'centre-ville': 0, trespoey: 1, saragosse: 2, bosquet: 3, dufau: 4, 'ousse-des-bois': 5, universite: 6 },
+  'la-rochelle': { 'vieux-port': 0, minimes: 1, laleu: 2, mireuil: 3, 'la-pallice': 4, 'villeneuve-les-salines': 5, 'port-neuf': 6 },
+  'cherbourg-en-cotentin': { 'centre-ville': 0, equeurdreville: 1, octeville: 2, tourlaville: 3, 'val-de-saire': 4, querqueville: 5, 'la-glacerie': 6 },
+  merignac: { 'centre-ville': 0, capeyron: 1, arlac: 2, 'chemin-long': 3, beutre: 4, bourranville: 5, pichey: 6 },
+  'champigny-sur-marne': { 'centre-ville': 0, coeuilly: 1, plant: 2, tremblay: 3, 'bois-l-abbe': 4, musselburgh: 5, mordacs: 6 },
+  antibes: { 'centre-ville': 0, 'juan-les-pins': 1, 'sophia-antipolis': 2, 'la-fontonne': 3, 'cap-d-antibes': 4, 'les-semboules': 5, rabiac: 6 },
+  'saint-maur-des-fosses': { 'le-parc': 0, 'la-varenne': 1, 'saint-hilaire': 2, champignol: 3, adamville: 4, 'la-pie': 5, 'les-muriers': 6 },
+  ajaccio: { 'centre-ville': 0, 'les-cannes': 1, mezzavia: 2, salines: 3, 'saint-jean': 4, pietralba: 5, 'residence-des-iles': 6 },
+  'fort-de-france': { 'centre-ville': 0, 'sch-lcher': 1, 'saint-joseph': 2, 'case-pilote': 3, 'gros-morne': 4, 'le-lamentin': 5, 'le-carbet': 6 },
+  'saint-nazaire': { 'centre-ville': 0, 'mean-penhoet': 1, avalix: 2, trignac: 3 },
+  cannes: { 'centre-ville': 0, 'la-bocca': 1, carnot: 2, 'croix-des-gardes': 3, californie: 4, 'petit-juas': 5, republique: 6 },
+  'noisy-le-grand': { 'centre-ville': 0, 'gournay-sur-marne': 1, 'neuilly-sur-marne': 2, 'neuilly-plaisance': 3, gagny: 4, 'rosny-sous-bois': 5, villemomble: 6 },
+  drancy: { 'centre-ville': 0, 'la-muette': 1, 'paris-campagne': 2, 'village-parisien': 3, economie: 4, 'avenir-parisien': 5, 'petit-drancy': 6 },
+  mamoudzou: { 'centre-ville': 0, koungou: 1, tsingoni: 2, dembeni: 3, ouangani: 4, dzaoudzi: 5, pamandzi: 6 },
+  cergy: { centre: 0, 'grand-centre': 1, 'axe-majeur': 2, 'les-hauts-de-cergy': 3, 'cergy-prefecture': 4, 'cergy-village': 5, 'cergy-saint-christophe': 6 },
+  'levallois-perret': { 'centre-ville': 0, clichy: 1, 'neuilly-sur-seine': 2, courbevoie: 3, 'asnieres-sur-seine': 4, 'bois-colombes': 5, 'la-garenne-colombes': 6 },
+  'issy-les-moulineaux': { 'centre-ville': 0, vanves: 1, 'boulogne-billancourt': 2, malakoff: 3, chatillon: 4, clamart: 5, meudon: 6 },
+  calais: { 'centre-ville': 0, 'saint-pierre': 1, 'beau-marais': 2, 'fort-nieulay': 3, courgain: 4, 'nouvelle-france': 5, 'pont-du-leu': 6 },
+  pessac: { 'centre-ville': 0, saige: 1, alouette: 2, 'cap-de-bos': 3 },
+  colmar: { 'centre-historique': 0, maraichers: 1, europe: 2, 'saint-antoine': 3 },
+  'evry-courcouronnes': { 'centre-ville': 0, 'ris-orangis': 1, lisses: 2, bondoufle: 3, 'corbeil-essonnes': 4, 'soisy-sur-seine': 5, 'fleury-merogis': 6 },
+  venissieux: { 'centre-ville': 0, minguettes: 1, parilly: 2, 'moulin-a-vent': 3 },
+  'ivry-sur-seine': { 'centre-ville': 0, 'charenton-le-pont': 1, 'le-kremlin-bicetre': 2, 'vitry-sur-seine': 3, villejuif: 4, alfortville: 5, gentilly: 6 },
+  valence: { 'centre-ville': 0, fontbarlettes: 1, chamberliere: 2, 'le-plan': 3 },
+  clichy: { 'centre-ville': 0, 'levallois-perret': 1, 'asnieres-sur-seine': 2, 'bois-colombes': 3, gennevilliers: 4, 'neuilly-sur-seine': 5, courbevoie: 6 },
+  quimper: { 'centre-historique': 0, 'ergue-armel': 1, penhars: 2, kerfeunteun: 3, 'moulin-vert': 4, locmaria: 5, 'creac-h-gwen': 6 },
+  antony: { 'centre-ville': 0, sceaux: 1, 'chatenay-malabry': 2, 'bourg-la-reine': 3, 'fontenay-aux-roses': 4, 'le-plessis-robinson': 5, bagneux: 6 },
+  bourges: { 'centre-historique': 0, asnieres: 1, gibjoncs: 2, pignoux: 3, 'val-d-auron': 4, chancellerie: 5, aeroport: 6 },
+  'la-seyne-sur-mer': { 'centre-ville': 0, tamaris: 1, 'les-sablettes': 2, berthe: 3, 'mar-vivo': 4, 'pont-de-fabre': 5, 'jas-de-ville': 6 },
+  montauban: { 'centre-ville': 0, villebourbon: 1, pomponne: 2, lalande: 3 },
+  'villeneuve-d-ascq': { 'hotel-de-ville': 0, 'pont-de-bois': 1, triolo: 2, chateau: 3, flers: 4, annappes: 5, brigode: 6 },
+  cayenne: { 'centre-ville': 0, 'remire-montjoly': 1, matoury: 2, macouria: 3, 'montsinery-tonnegrande': 4 },
+  'le-blanc-mesnil': { 'centre-ville': 0, drancy: 1, 'le-bourget': 2, 'aulnay-sous-bois': 3, dugny: 4, bobigny: 5, bondy: 6 },
+  troyes: { 'centre-historique': 0, 'pont-sainte-marie': 1, chartreux: 2, boucherat: 3, senardes: 4, 'jules-guesde': 5, 'bouchon-de-champagne': 6 },
+  pantin: { 'centre-ville': 0, 'quatre-chemins': 1, eglise: 2, courtillieres: 3 },
+  villejuif: { 'centre-ville': 0, 'le-kremlin-bicetre': 1, cachan: 2, 'l-hay-les-roses': 3, arcueil: 4, gentilly: 5, 'vitry-sur-seine': 6 },
+  chambery: { 'centre-ville': 0, biollay: 1, chantemerle: 2, bellevue: 3 },
+  niort: { 'centre-ville': 0, souche: 1, 'saint-florent': 2, 'clou-bouchet': 3, 'sainte-pezenne': 4, surimeau: 5, 'tour-chabot-gavacherie': 6 },
+  frejus: { 'centre-ville': 0, 'frejus-plage': 1, 'saint-aygulf': 2, 'les-adrets': 3, 'la-tour-de-mare': 4, villeneuve: 5, 'puget-sur-argens': 6 },
+  'neuilly-sur-seine': { 'centre-ville': 0, courbevoie: 1, 'levallois-perret': 2, puteaux: 3, 'la-garenne-colombes': 4, 'bois-colombes': 5, clichy: 6 },
+  sarcelles: { village: 0, 'grand-ensemble': 1, locheres: 2, flanades: 3, chardonnerettes: 4, watteau: 5, chantepie: 6 },
+  'saint-andre': { 'centre-ville': 0, 'sainte-suzanne': 1, 'bras-panon': 2, 'sainte-marie': 3, 'saint-benoit': 4, salazie: 5, 'saint-denis': 6 },
+  clamart: { 'centre-ville': 0, percy: 1, 'jardin-parisien': 2, plaine: 3 },
+  lorient: { 'centre-ville': 0, merville: 1, 'nouvelle-ville': 2, keryado: 3 },
+  narbonne: { 'centre-ville': 0, 'saint-jean-saint-pierre': 1, razimbaud: 2, 'narbonne-plage': 3 },
+  bobigny: { 'centre-ville': 0, drancy: 1, 'noisy-le-sec': 2, romainville: 3, pantin: 4, bondy: 5, 'les-lilas': 6 },
+  meaux: { 'centre-ville': 0, 'nanteuil-les-meaux': 1, 'cregy-les-meaux': 2, 'mareuil-les-meaux': 3, villenoy: 4, trilport: 5, 'chauconin-neufmontiers': 6 },
+  'maisons-alfort': { 'centre-ville': 0, alfortville: 1, 'saint-maurice': 2, creteil: 3, 'joinville-le-pont': 4, 'charenton-le-pont': 5, 'vitry-sur-seine': 6 },
+  hyeres: { 'centre-ville': 0, giens: 1, 'l-ayguade': 2, 'les-salins': 3, costebelle: 4, 'la-capte': 5, 'la-bayorre': 6 },
+  vannes: { 'centre-historique': 0, menimur: 1, kercado: 2, conleau: 3 },
+  beauvais: { 'centre-ville': 0, 'saint-jean': 1, 'saint-lucien': 2, argentine: 3 },
+  'saint-louis': { 'centre-ville': 0, 'les-avirons': 1, 'l-etang-sale': 2, 'entre-deux': 3, 'saint-leu': 4, cilaos: 5, 'saint-pierre': 6 },
+  'la-roche-sur-yon': { 'centre-ville': 0, 'mouilleron-le-captif': 1, 'aubigny-les-clouzeaux': 2, nesmy: 3, 'la-ferriere': 4, 'la-genetouze': 5, venansault: 6 },
+  chelles: { 'centre-ville': 0, 'vaires-sur-marne': 1, 'brou-sur-chantereine': 2, courtry: 3, 'champs-sur-marne': 4, noisiel: 5, torcy: 6 },
+  'corbeil-essonnes': { 'centre-ville': 0, villabe: 1, 'saintry-sur-seine': 2, lisses: 3, ormoy: 4, 'saint-pierre-du-perray': 5, 'saint-germain-les-corbeil': 6 },
+  'saint-laurent-du-maroni': { 'centre-ville': 0, apatou: 1 },
+  cholet: { 'centre-ville': 0, bonnevay: 1, bretagne: 2, 'jean-monnet': 3 },
+  bayonne: { 'grand-bayonne': 0, 'petit-bayonne': 1, 'saint-esprit': 2, marracq: 3 },
+  'fontenay-sous-bois': { 'centre-ville': 0, 'val-de-fontenay': 1, rigollots: 2, 'bois-cadet': 3 },
+  'saint-ouen-sur-seine': { 'centre-ville': 0, 'saint-denis': 1, 'l-ile-saint-denis': 2, aubervilliers: 3, 'epinay-sur-seine': 4, villetaneuse: 5, 'la-courneuve': 6 },
+  'cagnes-sur-mer': { 'centre-ville': 0, 'saint-laurent-du-var': 1, 'saint-paul-de-vence': 2, 'la-colle-sur-loup': 3, 'villeneuve-loubet': 4, 'la-gaude': 5, biot: 6 },
+  'vaulx-en-velin': { 'centre-ville': 0, 'decines-charpieu': 1, villeurbanne: 2, bron: 3, chassieu: 4, 'rillieux-la-pape': 5, 'caluire-et-cuire': 6 },
+  'epinay-sur-seine': { 'centre-ville': 0, 'l-ile-saint-denis': 1, villetaneuse: 2, 'saint-denis': 3, 'saint-ouen-sur-seine': 4, stains: 5, 'la-courneuve': 6 },
+  'saint-quentin': { 'centre-ville': 0, europe: 1, vermandois: 2, 'saint-martin': 3 },
+  sartrouville: { 'centre-ville': 0, houilles: 1, 'maisons-laffitte': 2, 'carrieres-sur-seine': 3, montesson: 4, 'le-mesnil-le-roi': 5, chatou: 6 },
+  sevran: { 'centre-ville': 0, villepinte: 1, 'livry-gargan': 2, 'aulnay-sous-bois': 3, 'clichy-sous-bois': 4, vaujours: 5, 'les-pavillons-sous-bois': 6 },
+  arles: { 'centre-historique': 0, trinquetaille: 1, barriol: 2, 'pont-de-crau': 3, griffeuille: 4, trebon: 5, monplaisir: 6 },
+  massy: { 'centre-ville': 0, champlan: 1, 'verrieres-le-buisson': 2, palaiseau: 3, igny: 4, 'chilly-mazarin': 5, 'villebon-sur-yvette': 6 },
+  albi: { 'centre-historique': 0, cantepau: 1, lapanouse: 2, rayssac: 3 },
+  'les-abymes': { 'centre-ville': 0, 'le-gosier': 1, 'pointe-a-pitre': 2, 'morne-a-l-eau': 3, 'baie-mahault': 4, 'sainte-anne': 5, 'petit-canal': 6 },
+  gennevilliers: { 'centre-ville': 0, 'asnieres-sur-seine': 1, 'bois-colombes': 2, 'villeneuve-la-garenne': 3, colombes: 4, clichy: 5, 'levallois-perret': 6 },
+  'saint-herblain': { bourg: 0, sillon: 1, 'joli-mai': 2, bagatelle: 3 },
+  grasse: { 'centre-ville': 0, 'saint-claude': 1, magagnosc: 2, 'le-plan': 3, 'plan-de-grasse': 4, 'saint-jacques': 5, 'les-marronniers': 6 },
+  bondy: { 'centre-ville': 0, nord: 1, mainguy: 2, 'terre-saint-blaise': 3 },
+  'les-sables-d-olonne': { 'centre-ville': 0, 'sainte-foy': 1, 'l-ile-d-olonne': 2, 'saint-mathurin': 3, 'brem-sur-mer': 4, 'les-achards': 5, 'talmont-saint-hilaire': 6 },
+  laval: { 'centre-ville': 0, 'saint-nicolas': 1, bourny: 2, ferrie: 3 },
+  evreux: { 'centre-ville': 0, navarre: 1, 'la-madeleine': 2, 'saint-michel': 3 },
+  'saint-priest': { 'centre-ville': 0, menival: 1, 'bel-air': 2, manissieux: 3 },
+  suresnes: { 'centre-ville': 0, puteaux: 1, 'rueil-malmaison': 2, nanterre: 3, 'saint-cloud': 4, garches: 5, 'neuilly-sur-seine': 6 },
+  martigues: { 'centre-ville': 0, 'port-de-bouc': 1, 'sausset-les-pins': 2, 'chateauneuf-les-martigues': 3, 'saint-mitre-les-remparts': 4, 'carry-le-rouet': 5, 'ensues-la-redonne': 6 },
+  vincennes: { 'centre-ville': 0, 'saint-mande': 1, 'fontenay-sous-bois': 2, 'saint-maurice': 3, 'nogent-sur-marne': 4, 'charenton-le-pont': 5, 'joinville-le-pont': 6 },
+  aubagne: { 'centre-ville': 0, 'carnoux-en-provence': 1, 'la-penne-sur-huveaune': 2, roquevaire: 3, 'roquefort-la-bedoule': 4, gemenos: 5, cassis: 6 },
+  'saint-malo': { 'intra-muros': 0, 'saint-servan': 1, parame: 2, rotheneuf: 3 },
+  'livry-gargan': { 'centre-ville': 0, 'clichy-sous-bois': 1, sevran: 2, 'les-pavillons-sous-bois': 3, 'le-raincy': 4, coubron: 5, montfermeil: 6 },
+  blois: { 'centre-ville': 0, vienne: 1, 'les-grouets': 2, cabochon: 3 },
+  'rosny-sous-bois': { 'centre-ville': 0, 'neuilly-plaisance': 1, villemomble: 2, 'noisy-le-sec': 3, montreuil: 4, bondy: 5, 'le-raincy': 6 },
+  'la-courneuve': { 'centre-ville': 0, 'le-bourget': 1, 'saint-denis': 2, aubervilliers: 3, dugny: 4, stains: 5, drancy: 6 },
+  'brive-la-gaillarde': { 'centre-ville': 0, ussac: 1, cosnac: 2, 'saint-pantaleon-de-larche': 3, malemort: 4, varetz: 5, donzenac: 6 },
+  bastia: { 'terra-vecchia': 0, 'terra-nova': 1, lupino: 2, 'paese-novo': 3 },
+  talence: { 'centre-ville': 0, forum: 1, 'plume-la-poule': 2, raba: 3 },
+  meudon: { 'centre-ville': 0, clamart: 1, sevres: 2, chaville: 3, 'le-plessis-robinson': 4, 'issy-les-moulineaux': 5, 'boulogne-billancourt': 6 },
+  montrouge: { 'centre-ville': 0, malakoff: 1, bagneux: 2, vanves: 3, chatillon: 4, 'fontenay-aux-roses': 5, 'bourg-la-reine': 6 },
+  ales: { 'centre-ville': 0, rochebelle: 1, clavieres: 2, tamaris: 3 },
+  carcassonne: { 'la-cite': 0, 'bastide-saint-louis': 1, grazailles: 2, montredon: 3 },
+  melun: { 'centre-ville': 0, 'le-mee-sur-seine': 1, rubelles: 2, 'vert-saint-denis': 3, 'vaux-le-penil': 4, 'la-rochette': 5, 'dammarie-les-lys': 6 },
+  'choisy-le-roi': { 'centre-ville': 0, thiais: 1, orly: 2, valenton: 3, creteil: 4, 'vitry-sur-seine': 5, 'villeneuve-saint-georges': 6 },
+  'saint-germain-en-laye': { 'centre-ville': 0, 'le-mesnil-le-roi': 1, montesson: 2, 'maisons-laffitte': 3, 'le-pecq': 4, 'le-vesinet': 5, chatou: 6 },
+  belfort: { 'centre-ville': 0, 'les-residences': 1, glacis: 2, miotte: 3 },
+  'charleville-mezieres': { 'centre-ville': 0, manchester: 1, 'la-houillere': 2, montjoly: 3 },
+  alfortville: { 'centre-ville': 0, 'maisons-alfort': 1, 'vitry-sur-seine': 2, creteil: 3, 'saint-maurice': 4, 'ivry-sur-seine': 5, 'charenton-le-pont': 6 },
+  'noisy-le-sec': { 'centre-ville': 0, romainville: 1, bobigny: 2, bondy: 3, 'rosny-sous-bois': 4, 'les-lilas': 5, montreuil: 6 },
+  sete: { 'centre-ville': 0, meze: 1, loupian: 2, marseillan: 3, 'balaruc-les-bains': 4, 'balaruc-le-vieux': 5, pomerols: 6 },
+  'chalon-sur-saone': { 'centre-ville': 0, 'saint-jean-des-vignes': 1, 'pres-saint-jean': 2, stade: 3 },
+  bagneux: { 'centre-ville': 0, chatillon: 1, 'fontenay-aux-roses': 2, montrouge: 3, 'bourg-la-reine': 4, malakoff: 5, sceaux: 6 },
+  tarbes: { 'centre-ville': 0, laubadere: 1, arsenal: 2, ormeau: 3 },
+  'saint-brieuc': { 'centre-ville': 0, cesson: 1, europe: 2, balzac: 3 },
+  istres: { 'centre-ville': 0, miramas: 1, 'saint-martin-de-crau': 2, 'saint-chamas': 3, 'fos-sur-mer': 4, grans: 5, 'saint-mitre-les-remparts': 6 },
+  'salon-de-provence': { 'centre-ville': 0, grans: 1, eyguieres: 2, miramas: 3, lamanon: 4, pelissanne: 5, senas: 6 },
+  puteaux: { 'centre-ville': 0, suresnes: 1, 'neuilly-sur-seine': 2, courbevoie: 3, 'la-garenne-colombes': 4, nanterre: 5, 'levallois-perret': 6 },
+  'caluire-et-cuire': { 'centre-ville': 0, 'collonges-au-mont-d-or': 1, 'fontaines-sur-saone': 2, 'saint-cyr-au-mont-d-or': 3, 'sathonay-camp': 4, 'saint-didier-au-mont-d-or': 5, villeurbanne: 6 },
+  reze: { 'centre-ville': 0, 'les-sorinieres': 1, bouguenais: 2, 'pont-saint-martin': 3, 'saint-sebastien-sur-loire': 4, 'saint-aignan-grandlieu': 5, vertou: 6 },
+  'mantes-la-jolie': { 'centre-ville': 0, buchelay: 1, 'mantes-la-ville': 2, magnanville: 3, limay: 4, 'follainville-dennemont': 5, guerville: 6 },
+  valenciennes: { 'centre-ville': 0, anzin: 1, marly: 2, 'la-sentinelle': 3, beuvrages: 4, 'petite-foret': 5, 'trith-saint-leger': 6 },
+  anglet: { 'centre-ville': 0, biarritz: 1, bayonne: 2, boucau: 3, bassussarry: 4, 'saint-pierre-d-irube': 5, arcangues: 6 },
+  bagnolet: { 'centre-ville': 0, 'les-lilas': 1, montreuil: 2, romainville: 3, 'le-pre-saint-gervais': 4, 'noisy-le-sec': 5, pantin: 6 },
+  bron: { 'centre-ville': 0, chassieu: 1, villeurbanne: 2, venissieux: 3, 'saint-priest': 4, 'vaulx-en-velin': 5, 'decines-charpieu': 6 },
+  'chalons-en-champagne': { 'centre-ville': 0, 'croix-jean-robert': 1, 'mont-hery': 2, verbeau: 3 },
+  chateauroux: { 'centre-ville': 0, 'saint-christophe': 1, beaulieu: 2, 'saint-jacques': 3 },
+  arras: { 'centre-ville': 0, 'saint-sauveur': 1, citadelle: 2, 'saint-michel': 3 },
+  thionville: { 'centre-ville': 0, beauregard: 1, 'cote-des-roses': 2, elange: 3 },
+  'villenave-d-ornon': { 'centre-ville': 0, begles: 1, cadaujac: 2, latresne: 3, talence: 4, gradignan: 5, quinsac: 6 },
+  castres: { 'centre-ville': 0, saix: 1, roquecourbe: 2, 'viviers-les-montagnes': 3, semalens: 4, 'payrin-augmontel': 5, soual: 6 },
+  'bourg-en-bresse': { 'centre-ville': 0, montagnat: 1, peronnas: 2, 'saint-denis-les-bourg': 3, viriat: 4, ceyzeriat: 5, 'saint-etienne-du-bois': 6 },
+  gagny: { 'centre-ville': 0, 'neuilly-sur-marne': 1, montfermeil: 2, 'le-raincy': 3, villemomble: 4, 'clichy-sous-bois': 5, 'neuilly-plaisance': 6 },
+  'le-cannet': { 'centre-ville': 0, mougins: 1, cannes: 2, 'la-roquette-sur-siagne': 3, vallauris: 4, 'mouans-sartoux': 5, valbonne: 6 },
+  angouleme: { 'centre-ville': 0, 'grande-garenne': 1, 'bel-air': 2, sillac: 3 },
+  'garges-les-gonesse': { 'centre-ville': 0, arnouville: 1, sarcelles: 2, montmagny: 3, groslay: 4, 'villiers-le-bel': 5, gonesse: 6 },
+  villepinte: { 'centre-ville': 0, sevran: 1, 'tremblay-en-france': 2, 'aulnay-sous-bois': 3, 'livry-gargan': 4, vaujours: 5, coubron: 6 },
+  stains: { 'centre-ville': 0, 'saint-denis': 1, 'la-courneuve': 2, dugny: 3, villetaneuse: 4, 'le-bourget': 5, aubervilliers: 6 },
+  gap: { 'centre-ville': 0, fontreyne: 1, romette: 2, tokoro: 3 },
+  poissy: { 'centre-ville': 0, 'villennes-sur-seine': 1, 'carrieres-sous-poissy': 2, chambourcy: 3, orgeval: 4, vernouillet: 5, feucherolles: 6 },
+  colomiers: { 'centre-ville': 0, tournefeuille: 1, cornebarrieu: 2, blagnac: 3, pibrac: 4, 'la-salvetat-saint-gilles': 5, 'plaisance-du-touch': 6 },
+  wattrelos: { 'centre-ville': 0, roubaix: 1, leers: 2, tourcoing: 3, 'lys-lez-lannoy': 4, mouvaux: 5, toufflers: 6 },
+  draguignan: { 'centre-ville': 0, figanieres: 1, 'trans-en-provence': 2, 'la-motte': 3, flayosc: 4, 'les-arcs': 5, callas: 6 },
+  compiegne: { 'centre-ville': 0, clairoix: 1, 'margny-les-compiegne': 2, 'choisy-au-bac': 3, venette: 4, jaux: 5, 'lacroix-saint-ouen': 6 },
+  montelimar: { 'centre-ville': 0, 'montboucher-sur-jabron': 1, 'chateauneuf-du-rhone': 2, malataverne: 3, donzere: 4, grane: 5, pierrelatte: 6 },
+  'boulogne-sur-mer': { 'haute-ville': 0, capecure: 1, brequerecque: 2, 'saint-pierre': 3 },
+  douai: { 'centre-ville': 0, waziers: 1, 'sin-le-noble': 2, dechy: 3, 'roost-warendin': 4, 'lambres-lez-douai': 5, 'flers-en-escrebieux': 6 },
+  'marcq-en-bar-ul': { 'centre-ville': 0, wasquehal: 1, bondues: 2, 'marquette-lez-lille': 3, 'la-madeleine': 4, mouvaux: 5, croix: 6 },
+  'neuilly-sur-marne': { 'centre-ville': 0, gagny: 1, 'neuilly-plaisance': 2, 'gournay-sur-marne': 3, villemomble: 4, 'noisy-le-grand': 5, 'le-raincy': 6 },
+  'le-lamentin': { 'centre-ville': 0, ducos: 1, 'saint-joseph': 2, 'fort-de-france': 3, 'le-robert': 4, 'saint-esprit': 5, 'le-francois': 6 },
+  'saint-joseph': { 'centre-ville': 0, 'petite-ile': 1, 'saint-philippe': 2, 'le-tampon': 3, 'saint-pierre': 4, 'la-plaine-des-palmistes': 5, 'sainte-rose': 6 },
+  'pontault-combault': { 'centre-ville': 0, emerainville: 1, 'roissy-en-brie': 2, 'croissy-beaubourg': 3, lesigny: 4, lognes: 5, 'ozoir-la-ferriere': 6 },
+  'saint-benoit': { 'centre-ville': 0, 'bras-panon': 1, 'la-plaine-des-palmistes': 2, salazie: 3, 'saint-andre': 4, 'sainte-rose': 5, 'sainte-suzanne': 6 },
+  'la-ciotat': { 'centre-ville': 0, ceyreste: 1, cassis: 2, 'roquefort-la-bedoule': 3, 'carnoux-en-provence': 4, aubagne: 5, gemenos: 6 },
+  'joue-les-tours': { 'centre-ville': 0, 'ballan-mire': 1, 'chambray-les-tours': 2, 'la-riche': 3, 'saint-avertin': 4, montbazon: 5, tours: 6 },
+  'tremblay-en-france': { 'centre-ville': 0, villepinte: 1, sevran: 2, vaujours: 3, 'aulnay-sous-bois': 4, 'livry-gargan': 5, coubron: 6 },
+  chartres: { 'centre-ville': 0, beaulieu: 1, 'la-madeleine': 2, rechevres: 3 },
+  'oullins-pierre-benite': { 'centre-ville': 0, 'saint-genis-laval': 1, 'la-mulatiere': 2, 'saint-fons': 3, 'sainte-foy-les-lyon': 4, irigny: 5, chaponost: 6 },
+  'thonon-les-bains': { 'centre-ville': 0, allinges: 1, 'anthy-sur-leman': 2, publier: 3, margencel: 4, 'evian-les-bains': 5, sciez: 6 },
+  franconville: { 'centre-ville': 0, 'le-plessis-bouchard': 1, 'montigny-les-cormeilles': 2, ermont: 3, 'cormeilles-en-parisis': 4, sannois: 5, beauchamp: 6 },
+  'saint-martin-d-heres': { 'centre-ville': 0, gieres: 1, poisat: 2, eybens: 3, grenoble: 4, 'la-tronche': 5, meylan: 6 },
+  annemasse: { 'centre-ville': 0, 'vetraz-monthoux': 1, ambilly: 2, 'ville-la-grand': 3, gaillard: 4, etrembieres: 5, 'monnetier-mornex': 6 },
+  'savigny-sur-orge': { 'centre-ville': 0, 'juvisy-sur-orge': 1, morangis: 2, 'epinay-sur-orge': 3, 'viry-chatillon': 4, 'villemoisson-sur-orge': 5, 'morsang-sur-orge': 6 },
+  echirolles: { 'centre-ville': 0, 'le-pont-de-claix': 1, eybens: 2, seyssins: 3, grenoble: 4, poisat: 5, jarrie: 6 },
+  palaiseau: { 'centre-ville': 0, 'villebon-sur-yvette': 1, igny: 2, massy: 3, orsay: 4, champlan: 5, 'saulx-les-chartreux': 6 },
+  romainville: { 'centre-ville': 0, 'les-lilas': 1, 'noisy-le-sec': 2, bagnolet: 3, 'le-pre-saint-gervais': 4, montreuil: 5, bobigny: 6 },
+  'saint-raphael': { 'centre-ville': 0, frejus: 1, 'les-adrets-de-l-esterel': 2, 'puget-sur-argens': 3, 'bagnols-en-foret': 4, montauroux: 5, 'roquebrune-sur-argens': 6 },
+  'six-fours-les-plages': { 'centre-ville': 0, 'la-seyne-sur-mer': 1, 'sanary-sur-mer': 2, ollioules: 3, bandol: 4, 'saint-mandrier-sur-mer': 5, toulon: 6 },
+  'sainte-marie': { 'centre-ville': 0, 'sainte-suzanne': 1, 'saint-denis': 2, salazie: 3, 'saint-andre': 4, 'bras-panon': 5, 'la-possession': 6 },
+  'conflans-sainte-honorine': { 'centre-ville': 0, acheres: 1, maurecourt: 2, andresy: 3, 'chanteloup-les-vignes': 4, 'maisons-laffitte': 5, 'triel-sur-seine': 6 },
+  vitrolles: { 'centre-ville': 0, 'saint-victoret': 1, marignane: 2, rognac: 3, cabries: 4, 'les-pennes-mirabeau': 5, 'gignac-la-nerthe': 6 },
+  chatillon: { 'centre-ville': 0, 'fontenay-aux-roses': 1, malakoff: 2, bagneux: 3, vanves: 4, montrouge: 5, clamart: 6 },
+  meyzieu: { 'centre-ville': 0, jonage: 1, 'decines-charpieu': 2, pusignan: 3, genas: 4, chassieu: 5, 'vaulx-en-velin': 6 },
+  'athis-mons': { 'centre-ville': 0, 'juvisy-sur-orge': 1, 'paray-vieille-poste': 2, 'vigneux-sur-seine': 3, morangis: 4, 'savigny-sur-orge': 5, draveil: 6 },
+  'la-possession': { 'centre-ville': 0, 'saint-paul': 1, 'saint-denis': 2, 'le-port': 3, salazie: 4, 'les-trois-bassins': 5, 'sainte-marie': 6 },
+  matoury: { 'centre-ville': 0, 'remire-montjoly': 1, cayenne: 2, 'montsinery-tonnegrande': 3, macouria: 4 },
+  bezons: { 'centre-ville': 0, argenteuil: 1, 'cormeilles-en-parisis': 2, sannois: 3, 'la-frette-sur-seine': 4, 'saint-gratien': 5, franconville: 6 },
+  haguenau: { 'centre-ville': 0, kaltenhouse: 1, 'schweighouse-sur-moder': 2, 'oberhoffen-sur-moder': 3, schirrhein: 4, weitbruch: 5, bischwiller: 6 },
+  creil: { 'centre-ville': 0, 'nogent-sur-oise': 1, 'villers-saint-paul': 2, 'saint-maximin': 3, montataire: 4, 'verneuil-en-halatte': 5, 'monchy-saint-eloi': 6 },
+  'villeneuve-saint-georges': { 'centre-ville': 0, valenton: 1, 'ablon-sur-seine': 2, 'villeneuve-le-roi': 3, 'limeil-brevannes': 4, orly: 5, 'choisy-le-roi': 6 },
+  'villefranche-sur-saone': { 'centre-ville': 0, limas: 1, gleize: 2, pommiers: 3, arnas: 4, anse: 5, 'porte-des-pierres-dorees': 6 },
+  'saint-leu': { 'centre-ville': 0, 'les-avirons': 1, 'l-etang-sale': 2, 'les-trois-bassins': 3, 'saint-louis': 4, cilaos: 5, 'entre-deux': 6 },
+  'chatenay-malabry': { 'centre-ville': 0, 'le-plessis-robinson': 1, sceaux: 2, clamart: 3, 'fontenay-aux-roses': 4, antony: 5, chatillon: 6 },
+  'saint-chamond': { 'centre-ville': 0, 'l-horme': 1, 'saint-jean-bonnefonds': 2, 'la-grand-croix': 3, 'saint-paul-en-jarez': 4, 'la-talaudiere': 5, sorbiers: 6 },
+  'sainte-genevieve-des-bois': { 'centre-ville': 0, 'saint-michel-sur-orge': 1, 'villemoisson-sur-orge': 2, 'morsang-sur-orge': 3, 'villiers-sur-orge': 4, 'longpont-sur-orge': 5, 'epinay-sur-orge': 6 },
+  roanne: { 'centre-ville': 0, 'le-coteau': 1, riorges: 2, perreux: 3, mably: 4, 'commelle-vernay': 5, villerest: 6 },
+  'le-perreux-sur-marne': { 'centre-ville': 0, 'bry-sur-marne': 1, 'nogent-sur-marne': 2, 'fontenay-sous-bois': 3, 'champigny-sur-marne': 4, 'villiers-sur-marne': 5, 'joinville-le-pont': 6 },
+  macon: { 'centre-ville': 0, flace: 1, saugeraies: 2, bioux: 3 },
+  auxerre: { 'centre-historique': 0, 'les-mignottes': 1, 'sainte-genevieve': 2, 'rive-droite': 3 },
+  dumbea: { 'centre-ville': 0, paita: 1, noumea: 2 },
+  schiltigheim: { 'centre-ville': 0, bischheim: 1, 'h-nheim': 2, souffelweyersheim: 3, mundolsheim: 4, mittelhausbergen: 5, reichstett: 6 },
+  trappes: { 'centre-ville': 0, 'montigny-le-bretonneux': 1, elancourt: 2, 'la-verriere': 3, 'voisins-le-bretonneux': 4, 'bois-d-arcy': 5, 'le-mesnil-saint-denis': 6 },
+  'les-mureaux': { 'centre-ville': 0, 'meulan-en-yvelines': 1, hardricourt: 2, 'mezy-sur-seine': 3, bouafle: 4, 'flins-sur-seine': 5, 'verneuil-sur-seine': 6 },
+  houilles: { 'centre-ville': 0, sartrouville: 1, 'carrieres-sur-seine': 2, 'maisons-laffitte': 3, montesson: 4, chatou: 5, 'le-mesnil-le-roi': 6 },
+  'le-port': { 'centre-ville': 0, 'la-possession': 1, 'saint-paul': 2, 'saint-denis': 3, 'les-trois-bassins': 4, 'sainte-marie': 5, salazie: 6 },
+  marignane: { 'centre-ville': 0, 'saint-victoret': 1, 'gignac-la-nerthe': 2, vitrolles: 3, 'chateauneuf-les-martigues': 4, 'le-rove': 5, 'ensues-la-redonne': 6 },
+  'romans-sur-isere': { 'centre-ville': 0, 'mours-saint-eusebe': 1, peyrins: 2, genissieux: 3, 'bourg-de-peage': 4, 'chatuzange-le-goubet': 5, alixan: 6 },
+  'villiers-sur-marne': { 'centre-ville': 0, 'bry-sur-marne': 1, 'champigny-sur-marne': 2, 'le-plessis-trevise': 3, 'le-perreux-sur-marne': 4, 'chennevieres-sur-marne': 5, 'ormesson-sur-marne': 6 },
+  montlucon: { 'centre-ville': 0, desertines: 1, 'saint-victor': 2, domerat: 3, premilhat: 4, 'neris-les-bains': 5, huriel: 6 },
+  nevers: { 'centre-ville': 0, mouesse: 1, 'grande-pature': 2, baratte: 3 },
+  lens: { 'centre-ville': 0, 'eleu-dit-leauwette': 1, 'loos-en-gohelle': 2, 'loison-sous-lens': 3, sallaumines: 4, lievin: 5, avion: 6 },
+  thiais: { 'centre-ville': 0, 'choisy-le-roi': 1, orly: 2, 'chevilly-larue': 3, rungis: 4, 'vitry-sur-seine': 5, 'villeneuve-le-roi': 6 },
+  'saint-medard-en-jalles': { 'centre-ville': 0, 'martignas-sur-jalle': 1, 'saint-aubin-de-medoc': 2, 'le-haillan': 3, 'le-taillan-medoc': 4, merignac: 5, 'saint-jean-d-illac': 6 },
+  agen: { 'centre-ville': 0, montanou: 1, pin: 2, ermitage: 3 },
+  'montigny-le-bretonneux': { 'centre-ville': 0, trappes: 1, 'voisins-le-bretonneux': 2, 'bois-d-arcy': 3, guyancourt: 4, 'saint-cyr-l-ecole': 5, 'fontenay-le-fleury': 6 },
+  'nogent-sur-marne': { 'centre-ville': 0, 'fontenay-sous-bois': 1, 'le-perreux-sur-marne': 2, 'joinville-le-pont': 3, 'bry-sur-marne': 4, vincennes: 5, 'saint-maurice': 6 },
+  'aix-les-bains': { 'centre-ville': 0, tresserve: 1, mouxy: 2, 'gresy-sur-aix': 3, 'drumettaz-clarafond': 4, 'viviers-du-lac': 5, 'brison-saint-innocent': 6 },
+  epinal: { 'centre-ville': 0, 'la-justice': 1, 'saut-le-cerf': 2, poissompre: 3 },
+  'saint-laurent-du-var': { 'centre-ville': 0, 'cagnes-sur-mer': 1, 'la-gaude': 2, 'saint-paul-de-vence': 3, nice: 4, 'la-colle-sur-loup': 5, 'villeneuve-loubet': 6 },
+  koungou: { 'centre-ville': 0, mamoudzou: 1, tsingoni: 2, bandraboua: 3, dzaoudzi: 4, 'm-tsangamouji': 5, pamandzi: 6 },
+  pontoise: { 'centre-ville': 0, 'saint-ouen-l-aumone': 1, eragny: 2, ennery: 3, osny: 4, cergy: 5, 'neuville-sur-oise': 6 },
+  begles: { 'centre-ville': 0, 'villenave-d-ornon': 1, talence: 2, floirac: 3, bouliac: 4, latresne: 5, 'carignan-de-bordeaux': 6 },
+  plaisir: { 'centre-ville': 0, 'les-clayes-sous-bois': 1, 'neauphle-le-chateau': 2, 'jouars-pontchartrain': 3, elancourt: 4, 'villiers-saint-frederic': 5, maurepas: 6 },
+  'herblay-sur-seine': { 'centre-ville': 0, pierrelaye: 1, beauchamp: 2, 'montigny-les-cormeilles': 3, 'la-frette-sur-seine': 4, eragny: 5, bessancourt: 6 },
+  vienne: { 'centre-ville': 0, 'pont-eveque': 1, jardin: 2, serpaize: 3, seyssuel: 4, 'reventin-vaugris': 5, chuzelles: 6 },
+  carpentras: { 'centre-ville': 0, aubignan: 1, 'loriol-du-comtat': 2, mazan: 3, caromb: 4, monteux: 5, 'beaumes-de-venise': 6 },
+  'mont-de-marsan': { 'centre-ville': 0, 'saint-pierre-du-mont': 1, 'grenade-sur-l-adour': 2, 'saint-sever': 3, 'villeneuve-de-marsan': 4, tartas: 5 },
+  dreux: { 'centre-ville': 0, vernouillet: 1, abondant: 2, 'saint-remy-sur-avre': 3, bu: 4, 'saint-lubin-des-joncherets': 5, anet: 6 },
+  'vigneux-sur-seine': { 'centre-ville': 0, draveil: 1, montgeron: 2, 'athis-mons': 3, crosne: 4, 'juvisy-sur-orge': 5, yerres: 6 },
+  'rillieux-la-pape': { 'centre-ville': 0, 'sathonay-camp': 1, 'sathonay-village': 2, 'fontaines-sur-saone': 3, 'cailloux-sur-fontaines': 4, 'fontaines-saint-martin': 5, 'collonges-au-mont-d-or': 6 },
+  goussainville: { 'centre-ville': 0, 'le-thillay': 1, 'fontenay-en-parisis': 2, louvres: 3, 'roissy-en-france': 4, gonesse: 5, 'puiseux-en-france': 6 },
+  'ris-orangis': { 'centre-ville': 0, grigny: 1, 'evry-courcouronnes': 2, 'fleury-merogis': 3, 'viry-chatillon': 4, draveil: 5, bondoufle: 6 },
+  'l-hay-les-roses': { 'centre-ville': 0, 'chevilly-larue': 1, cachan: 2, villejuif: 3, fresnes: 4, arcueil: 5, rungis: 6 },
+  'saint-martin': { 'centre-ville': 0, marigot: 1, 'grand-case': 2, 'sandy-ground': 3 },
+  'savigny-le-temple': { 'centre-ville': 0, cesson: 1, nandy: 2, 'vert-saint-denis': 3, reau: 4, 'moissy-cramayel': 5, lieusaint: 6 },
+  cambrai: { 'centre-ville': 0, 'neuville-saint-remy': 1, proville: 2, 'escaud-uvres': 3, 'raillencourt-sainte-olle': 4, masnieres: 5, iwuy: 6 },
+  cachan: { 'centre-ville': 0, arcueil: 1, 'l-hay-les-roses': 2, villejuif: 3, gentilly: 4, 'le-kremlin-bicetre': 5, 'chevilly-larue': 6 },
+  chatellerault: { 'centre-ville': 0, naintre: 1, thure: 2, 'vouneuil-sur-vienne': 3, 'scorbe-clairvaux': 4, 'beaumont-saint-cyr': 5, 'dange-saint-romain': 6 },
+  'baie-mahault': { 'centre-ville': 0, 'pointe-a-pitre': 1, lamentin: 2, 'sainte-rose': 3, 'les-abymes': 4, 'petit-bourg': 5, 'morne-a-l-eau': 6 },
+  'viry-chatillon': { 'centre-ville': 0, grigny: 1, 'morsang-sur-orge': 2, 'juvisy-sur-orge': 3, 'savigny-sur-orge': 4, 'ris-orangis': 5, 'villemoisson-sur-orge': 6 },
+  'le-chesnay-rocquencourt': { 'centre-ville': 0, 'la-celle-saint-cloud': 1, versailles: 2, bailly: 3, louveciennes: 4, bougival: 5, 'saint-cyr-l-ecole': 6 },
+  menton: { 'centre-ville': 0, 'roquebrune-cap-martin': 1, peille: 2, beausoleil: 3, 'la-turbie': 4, sospel: 5, 'cap-d-ail': 6 },
+  chatou: { 'centre-ville': 0, 'le-vesinet': 1, 'croissy-sur-seine': 2, montesson: 3, 'carrieres-sur-seine': 4, 'le-port-marly': 5, 'le-pecq': 6 },
+  malakoff: { 'centre-ville': 0, vanves: 1, chatillon: 2, montrouge: 3, bagneux: 4, 'issy-les-moulineaux': 5, 'fontenay-aux-roses': 6 },
+  'la-garenne-colombes': { 'centre-ville': 0, courbevoie: 1, colombes: 2, 'bois-colombes': 3, puteaux: 4, 'neuilly-sur-seine': 5, nanterre: 6 },
+  tournefeuille: { 'centre-ville': 0, cugnaux: 1, colomiers: 2, 'plaisance-du-touch': 3, 'villeneuve-tolosane': 4, 'la-salvetat-saint-gilles': 5, frouzins: 6 },
+  'bourgoin-jallieu': { 'centre-ville': 0, 'saint-alban-de-roche': 1, 'l-isle-d-abeau': 2, 'saint-savin': 3, 'nivolas-vermelle': 4, 'ruy-montceau': 5, 'vaulx-milieu': 6 },
+  draveil: { 'centre-ville': 0, 'vigneux-sur-seine': 1, montgeron: 2, grigny: 3, 'soisy-sur-seine': 4, 'ris-orangis': 5, 'viry-chatillon': 6 },
+  lievin: { 'centre-ville': 0, angres: 1, 'eleu-dit-leauwette': 2, grenay: 3, 'givenchy-en-gohelle': 4, lens: 5, 'aix-noulette': 6 },
+  'villiers-le-bel': { 'centre-ville': 0, sarcelles: 1, ecouen: 2, arnouville: 3, 'garges-les-gonesse': 4, 'saint-brice-sous-foret': 5, ezanville: 6 },
+  'vand-uvre-les-nancy': { 'centre-ville': 0, houdemont: 1, 'villers-les-nancy': 2, heillecourt: 3, nancy: 4, 'jarville-la-malgrange': 5, laxou: 6 },
+  agde: { 'centre-ville': 0, vias: 1, marseillan: 2, bessan: 3, florensac: 4, pomerols: 5, portiragnes: 6 },
+  'decines-charpieu': { 'centre-ville': 0, 'vaulx-en-velin': 1, meyzieu: 2, chassieu: 3, villeurbanne: 4, bron: 5, jonage: 6 },
+  'saint-cloud': { 'centre-ville': 0, garches: 1, sevres: 2, 'boulogne-billancourt': 3, vaucresson: 4, suresnes: 5, 'ville-d-avray': 6 },
+  faaa: { 'centre-ville': 0, papeete: 1, punaauia: 2, pirae: 3, mahina: 4, paea: 5, papara: 6 },
+  villemomble: { 'centre-ville': 0, 'le-raincy': 1, 'rosny-sous-bois': 2, 'les-pavillons-sous-bois': 3, 'neuilly-plaisance': 4, bondy: 5, gagny: 6 },
+  guyancourt: { 'centre-ville': 0, 'voisins-le-bretonneux': 1, 'montigny-le-bretonneux': 2, buc: 3, 'saint-cyr-l-ecole': 4, 'magny-les-hameaux': 5, versailles: 6 },
+  orange: { 'centre-ville': 0, 'la-tourre': 1, 'fourches-vieilles': 2, nogent: 3 },
+  fresnes: { 'centre-ville': 0, rungis: 1, 'chevilly-larue': 2, 'l-hay-les-roses': 3, cachan: 4, thiais: 5, villejuif: 6 },
+  'saint-etienne-du-rouvray': { 'centre-ville': 0, 'sotteville-les-rouen': 1, 'amfreville-la-mi-voie': 2, belbeuf: 3, 'petit-couronne': 4, oissel: 5, 'le-grand-quevilly': 6 },
+  ermont: { 'centre-ville': 0, eaubonne: 1, sannois: 2, 'le-plessis-bouchard': 3, franconville: 4, margency: 5, 'saint-gratien': 6 },
+  'clichy-sous-bois': { 'centre-ville': 0, 'livry-gargan': 1, montfermeil: 2, 'le-raincy': 3, coubron: 4, 'les-pavillons-sous-bois': 5, gagny: 6 },
+  vallauris: { 'centre-ville': 0, antibes: 1, mougins: 2, 'le-cannet': 3, cannes: 4, biot: 5, valbonne: 6 },
+  perigueux: { 'centre-historique': 0, boulazac: 1, chamiers: 2, churchill: 3 },
+  'sotteville-les-rouen': { 'centre-ville': 0, 'amfreville-la-mi-voie': 1, 'le-petit-quevilly': 2, 'saint-etienne-du-rouvray': 3, rouen: 4, bonsecours: 5, 'le-mesnil-esnard': 6 },
+  'bois-colombes': { 'centre-ville': 0, colombes: 1, 'asnieres-sur-seine': 2, 'la-garenne-colombes': 3, courbevoie: 4, gennevilliers: 5, 'levallois-perret': 6 },
+  'le-plessis-robinson': { 'centre-ville': 0, 'chatenay-malabry': 1, clamart: 2, 'fontenay-aux-roses': 3, sceaux: 4, chatillon: 5, meudon: 6 },
+  'charenton-le-pont': { 'centre-ville': 0, 'ivry-sur-seine': 1, 'saint-mande': 2, 'saint-maurice': 3, alfortville: 4, 'maisons-alfort': 5, vincennes: 6 },
+  punaauia: { 'centre-ville': 0, faaa: 1, pirae: 2, papeete: 3, paea: 4, mahina: 5, papara: 6 },
+  maubeuge: { 'centre-ville': 0, louvroil: 1, rousies: 2, feignies: 3, 'ferriere-la-grande': 4, hautmont: 5, 'la-longueville': 6 },
+  montfermeil: { 'centre-ville': 0, 'clichy-sous-bois': 1, coubron: 2, gagny: 3, 'livry-gargan': 4, 'le-raincy': 5, vaujours: 6 },
+  vanves: { 'centre-ville': 0, malakoff: 1, 'issy-les-moulineaux': 2, chatillon: 3, montrouge: 4, bagneux: 5, 'fontenay-aux-roses': 6 },
+  'saint-sebastien-sur-loire': { 'centre-ville': 0, 'basse-goulaine': 1, reze: 2, nantes: 3, 'sainte-luce-sur-loire': 4, vertou: 5, 'haute-goulaine': 6 },
+  orvault: { 'centre-ville': 0, treillieres: 1, sautron: 2, 'la-chapelle-sur-erdre': 3, 'saint-herblain': 4, nantes: 5, 'vigneux-de-bretagne': 6 },
+  dieppe: { 'centre-ville': 0, offranville: 1, 'arques-la-bataille': 2, 'petit-caux': 3, 'saint-nicolas-d-aliermont': 4, luneray: 5, 'criel-sur-mer': 6 },
+  soissons: { 'centre-ville': 0, belleu: 1, 'villeneuve-saint-germain': 2, crouy: 3, 'vailly-sur-aisne': 4, braine: 5, 'anizy-le-grand': 6 },
+  yerres: { 'centre-ville': 0, brunoy: 1, crosne: 2, montgeron: 3, 'epinay-sous-senart': 4, 'boussy-saint-antoine': 5, 'vigneux-sur-seine': 6 },
+  'illkirch-graffenstaden': { 'centre-ville': 0, ostwald: 1, fegersheim: 2, eschau: 3, lingolsheim: 4, geispolsheim: 5, strasbourg: 6 },
+  'sucy-en-brie': { 'centre-ville': 0, noiseau: 1, 'ormesson-sur-marne': 2, 'boissy-saint-leger': 3, 'chennevieres-sur-marne': 4, 'bonneuil-sur-marne': 5, 'marolles-en-brie': 6 },
+  'le-gosier': { 'centre-ville': 0, 'les-abymes': 1, 'pointe-a-pitre': 2, 'sainte-anne': 3, 'morne-a-l-eau': 4, 'baie-mahault': 5, 'le-moule': 6 },
+  rambouillet: { 'centre-ville': 0, 'le-perray-en-yvelines': 1, 'les-essarts-le-roi': 2, 'saint-arnoult-en-yvelines': 3, coignieres: 4, 'montfort-l-amaury': 5, 'le-mesnil-saint-denis': 6 },
+  'remire-montjoly': { 'centre-ville': 0, cayenne: 1, matoury: 2 },
+  gonesse: { 'centre-ville': 0, 'le-thillay': 1, arnouville: 2, 'garges-les-gonesse': 3, goussainville: 4, 'roissy-en-france': 5, 'villiers-le-bel': 6 },
+  paita: { 'centre-ville': 0, dumbea: 1, bouloupari: 2 },
+  blagnac: { 'centre-ville': 0, beauzelle: 1, cornebarrieu: 2, aucamville: 3, fenouillet: 4, colomiers: 5, seilh: 6 },
+  taverny: { 'centre-ville': 0, bessancourt: 1, 'saint-leu-la-foret': 2, beauchamp: 3, frepillon: 4, 'le-plessis-bouchard': 5, pierrelaye: 6 },
+  'la-teste-de-buch': { 'centre-ville': 0, arcachon: 1, 'gujan-mestras': 2, 'le-teich': 3, 'lege-cap-ferret': 4, biganos: 5, 'andernos-les-bains': 6 },
+  'bussy-saint-georges': { 'centre-ville': 0, 'ferrieres-en-brie': 1, collegien: 2, pontcarre: 3, 'chanteloup-en-brie': 4, 'croissy-beaubourg': 5, 'saint-thibault-des-vignes': 6 },
+  'champs-sur-marne': { 'centre-ville': 0, noisiel: 1, emerainville: 2, lognes: 3, 'vaires-sur-marne': 4, torcy: 5, chelles: 6 },
+  'limeil-brevannes': { 'centre-ville': 0, 'boissy-saint-leger': 1, valenton: 2, 'bonneuil-sur-marne': 3, 'villeneuve-saint-georges': 4, villecresnes: 5, 'sucy-en-brie': 6 },
+  'cormeilles-en-parisis': { 'centre-ville': 0, 'la-frette-sur-seine': 1, franconville: 2, 'montigny-les-cormeilles': 3, sannois: 4, argenteuil: 5, 'le-plessis-bouchard': 6 },
+  bergerac: { 'centre-ville': 0, prigonrieux: 1, 'lamonzie-saint-martin': 2, 'la-force': 3, lalinde: 4, eymet: 5, 'port-sainte-foy-et-ponchapt': 6 },
+  sens: { 'centre-ville': 0, 'saint-clement': 1, paron: 2, 'villeneuve-sur-yonne': 3, 'pont-sur-yonne': 4, champigny: 5, 'saint-julien-du-sault': 6 },
+  lambersart: { 'centre-ville': 0, 'saint-andre-lez-lille': 1, lompret: 2, lille: 3, 'marquette-lez-lille': 4, 'la-madeleine': 5, verlinghem: 6 },
+  armentieres: { 'centre-ville': 0, nieppe: 1, 'la-chapelle-d-armentieres': 2, houplines: 3, 'erquinghem-lys': 4, frelinghien: 5, premesques: 6 },
+  gradignan: { 'centre-ville': 0, canejan: 1, talence: 2, leognan: 3, 'villenave-d-ornon': 4, pessac: 5, begles: 6 },
+  villeparisis: { 'centre-ville': 0, courtry: 1, 'mitry-mory': 2, 'claye-souilly': 3, villevaude: 4, 'brou-sur-chantereine': 5, chelles: 6 },
+  sannois: { 'centre-ville': 0, ermont: 1, 'saint-gratien': 2, argenteuil: 3, franconville: 4, eaubonne: 5, 'le-plessis-bouchard': 6 },
+  etampes: { 'centre-ville': 0, 'morigny-champigny': 1, etrechy: 2, 'janville-sur-juine': 3, 'le-merevillois': 4, cerny: 5, pussay: 6 },
+  grigny: { 'centre-ville': 0, 'viry-chatillon': 1, 'ris-orangis': 2, 'morsang-sur-orge': 3, 'fleury-merogis': 4, draveil: 5, 'juvisy-sur-orge': 6 },
+  cenon: { 'centre-ville': 0, lormont: 1, floirac: 2, 'artigues-pres-bordeaux': 3, tresses: 4, bouliac: 5, bordeaux: 6 },
+  'bretigny-sur-orge': { 'centre-ville': 0, 'saint-germain-les-arpajon': 1, 'leuville-sur-orge': 2, 'le-plessis-pate': 3, 'la-norville': 4, 'saint-michel-sur-orge': 5, arpajon: 6 },
+  papeete: { 'centre-ville': 0, faaa: 1, pirae: 2, punaauia: 3, mahina: 4, paea: 5, 'hitiaa-o-te-ra': 6 },
+  lunel: { 'centre-ville': 0, 'saint-just': 1, 'lunel-viel': 2, marsillargues: 3, valergues: 4, 'entre-vignes': 5, lansargues: 6 },
+  'la-garde': { 'centre-ville': 0, 'la-valette-du-var': 1, 'le-pradet': 2, 'la-farlede': 3, carqueiranne: 4, 'sollies-ville': 5, toulon: 6 },
+  elancourt: { 'centre-ville': 0, trappes: 1, 'la-verriere': 2, maurepas: 3, 'jouars-pontchartrain': 4, plaisir: 5, 'le-mesnil-saint-denis': 6 },
+  saumur: { 'centre-ville': 0, vivy: 1, allonnes: 2, 'bellevigne-les-chateaux': 3, 'brain-sur-allonnes': 4, 'gennes-val-de-loire': 5, 'longue-jumelles': 6 },
+  vertou: { 'centre-ville': 0, 'les-sorinieres': 1, 'chateau-thebaud': 2, 'la-haie-fouassiere': 3, 'haute-goulaine': 4, 'saint-sebastien-sur-loire': 5, 'le-bignon': 6 },
+  aurillac: { 'centre-ville': 0, naucelles: 1, 'arpajon-sur-cere': 2, ytrac: 3, jussac: 4 },
+  eaubonne: { 'centre-ville': 0, margency: 1, ermont: 2, 'soisy-sous-montmorency': 3, 'saint-gratien': 4, andilly: 5, montlignon: 6 },
+  biarritz: { 'centre-ville': 0, 'la-negresse': 1, 'saint-charles': 2, milady: 3 },
+  miramas: { 'centre-ville': 0, grans: 1, 'saint-chamas': 2, istres: 3, 'salon-de-provence': 4, 'saint-martin-de-crau': 5, 'lancon-provence': 6 },
+  muret: { 'centre-ville': 0, 'le-fauga': 1, eaunes: 2, labastidette: 3, lherm: 4, seysses: 5, saubens: 6 },
+  'castelnau-le-lez': { 'centre-ville': 0, 'le-cres': 1, jacou: 2, clapiers: 3, montpellier: 4, 'saint-aunes': 5, vendargues: 6 },
+  'villeneuve-la-garenne': { 'centre-ville': 0, gennevilliers: 1, 'asnieres-sur-seine': 2, clichy: 3, 'bois-colombes': 4, 'levallois-perret': 5, colombes: 6 },
+  'les-ulis': { 'centre-ville': 0, orsay: 1, 'bures-sur-yvette': 2, villejust: 3, 'gometz-le-chatel': 4, marcoussis: 5, 'villebon-sur-yvette': 6 },
+  'les-pavillons-sous-bois': { 'centre-ville': 0, bondy: 1, 'le-raincy': 2, villemomble: 3, 'livry-gargan': 4, 'clichy-sous-bois': 5, 'rosny-sous-bois': 6 },
+  sevremoine: { 'centre-ville': 0, 'la-romagne': 1, 'la-seguiniere': 2, 'saint-christophe-du-bois': 3, 'begrolles-en-mauges': 4, 'saint-leger-sous-cholet': 5, 'beaupreau-en-mauges': 6 },
+  'le-grand-quevilly': { 'centre-ville': 0, 'le-petit-quevilly': 1, canteleu: 2, 'petit-couronne': 3, 'sotteville-les-rouen': 4, 'saint-etienne-du-rouvray': 5, rouen: 6 },
+  lormont: { 'centre-ville': 0, cenon: 1, 'artigues-pres-bordeaux': 2, 'carbon-blanc': 3, bassens: 4, yvrac: 5, 'sainte-eulalie': 6 },
+  'henin-beaumont': { 'centre-ville': 0, 'montigny-en-gohelle': 1, 'noyelles-godault': 2, dourges: 3, 'billy-montigny': 4, drocourt: 5, 'fouquieres-les-lens': 6 },
+  brunoy: { 'centre-ville': 0, 'epinay-sous-senart': 1, yerres: 2, 'boussy-saint-antoine': 3, 'quincy-sous-senart': 4, montgeron: 5, crosne: 6 },
+  cavaillon: { 'centre-ville': 0, taillades: 1, robion: 2, 'caumont-sur-durance': 3, 'l-isle-sur-la-sorgue': 4, 'le-thor': 5, 'cheval-blanc': 6 },
+  'saint-ouen-l-aumone': { 'centre-ville': 0, pontoise: 1, 'mery-sur-oise': 2, eragny: 3, ennery: 4, pierrelaye: 5, 'herblay-sur-seine': 6 },
+  'sainte-suzanne': { 'centre-ville': 0, 'saint-andre': 1, 'sainte-marie': 2, 'bras-panon': 3, salazie: 4, 'saint-denis': 5, 'saint-benoit': 6 },
+  alencon: { 'centre-ville': 0, damigny: 1, 'saint-germain-du-corbeis': 2, 'conde-sur-sarthe': 3, sees: 4 },
+  saintes: { 'centre-ville': 0, 'saint-pallais': 1, bellevue: 2, recouvrance: 3 },
+  'le-mont-dore': { 'centre-ville': 0, boulari: 1, 'la-coulee': 2, plum: 3 },
+  vernon: { 'centre-ville': 0, 'saint-marcel': 1, 'la-chapelle-longueville': 2, gasny: 3, 'pacy-sur-eure': 4, 'vexin-sur-epte': 5, 'saint-aubin-sur-gaillon': 6 },
+  bethune: { 'centre-ville': 0, annezin: 1, verquin: 2, 'vendin-les-bethune': 3, beuvry: 4, locon: 5, labourse: 6 },
+  vichy: { 'centre-ville': 0, 'les-ailes': 1, 'croix-saint-martin': 2, france: 3 },
+  'le-bouscat': { 'centre-ville': 0, bordeaux: 1, bruges: 2, eysines: 3, blanquefort: 4, cenon: 5, talence: 6 },
+  vierzon: { 'centre-ville': 0, mereau: 1, foecy: 2, 'vignoux-sur-barangeon': 3, 'mehun-sur-yevre': 4, 'saint-martin-d-auxigny': 5 },
+  libourne: { 'centre-ville': 0, arveyres: 1, genissac: 2, vayres: 3, 'saint-denis-de-pile': 4, galgon: 5, izon: 6 },
+  eysines: { 'centre-ville': 0, 'le-haillan': 1, bruges: 2, 'le-bouscat': 3, 'le-taillan-medoc': 4, bordeaux: 5, blanquefort: 6 },
+  kourou: { 'centre-ville': 0, 'village-saramaca': 1, 'les-roches': 2, 'zone-industrielle': 3 },
+  montbeliard: { 'centre-ville': 0, 'petite-hollande': 1, chiffogne: 2, 'les-fougeres': 3 },
+  'petit-bourg': { 'centre-ville': 0, goyave: 1, lamentin: 2, 'baie-mahault': 3, bouillante: 4, 'vieux-habitants': 5, 'pointe-noire': 6 },
+  orly: { 'centre-ville': 0, 'villeneuve-le-roi': 1, 'ablon-sur-seine': 2, thiais: 3, 'choisy-le-roi': 4, 'villeneuve-saint-georges': 5, rungis: 6 },
+  laon: { 'centre-ville': 0, 'athies-sous-laon': 1, 'anizy-le-grand': 2, 'saint-gobain': 3, 'vailly-sur-aisne': 4, 'la-fere': 5, beautor: 6 },
+  frontignan: { 'centre-ville': 0, 'balaruc-le-vieux': 1, 'balaruc-les-bains': 2, gigean: 3, 'vic-la-gardiole': 4, mireval: 5, poussan: 6 },
+  'le-kremlin-bicetre': { 'centre-ville': 0, gentilly: 1, villejuif: 2, arcueil: 3, 'ivry-sur-seine': 4, cachan: 5, 'vitry-sur-seine': 6 },
+  coueron: { 'centre-ville': 0, 'saint-etienne-de-montluc': 1, 'saint-jean-de-boiseau': 2, sautron: 3, 'le-pellerin': 4, indre: 5, 'la-montagne': 6 },
+  'fontenay-aux-roses': { 'centre-ville': 0, chatillon: 1, sceaux: 2, bagneux: 3, 'le-plessis-robinson': 4, 'bourg-la-reine': 5, clamart: 6 },
+  montgeron: { 'centre-ville': 0, 'vigneux-sur-seine': 1, crosne: 2, yerres: 3, brunoy: 4, draveil: 5, 'epinay-sous-senart': 6 },
+  'beaupreau-en-mauges': { 'centre-ville': 0, 'montrevault-sur-evre': 1, 'begrolles-en-mauges': 2, 'le-may-sur-evre': 3, 'saint-leger-sous-cholet': 4, 'la-seguiniere': 5, sevremoine: 6 },
+  rodez: { 'centre-ville': 0, bourran: 1, 'saint-eloi': 2, olemps: 3 },
+  'sainte-anne': { 'centre-ville': 0, 'le-moule': 1, 'le-gosier': 2, 'les-abymes': 3, 'morne-a-l-eau': 4, 'saint-francois': 5, 'pointe-a-pitre': 6 },
+  'les-lilas': { 'centre-ville': 0, 'le-pre-saint-gervais': 1, romainville: 2, bagnolet: 3, pantin: 4, 'noisy-le-sec': 5, montreuil: 6 },
+  dole: { 'centre-ville': 0, foucherans: 1, damparis: 2, tavaux: 3 },
+  'la-valette-du-var': { 'centre-ville': 0, 'la-garde': 1, 'sollies-ville': 2, 'la-farlede': 3, toulon: 4, 'le-revest-les-eaux': 5, 'le-pradet': 6 },
+  'dammarie-les-lys': { 'centre-ville': 0, 'la-rochette': 1, 'le-mee-sur-seine': 2, 'boissise-le-roi': 3, melun: 4, 'chailly-en-biere': 5, pringy: 6 },
+  olivet: {
+    'centre-ville': 0,
+    orleans: 1,
+    'saint-pryve-saint-mesmin': 2,
+    'saint-jean-le-blanc': 3,
+    'saint-hilaire-saint-mesmin': 4,
+    'la-chapelle-saint-mesmin': 5,
+    'saint-jean-de-la-ruelle': 6,
+  },
+  'herouville-saint-clair': { 'centre-ville': 0, epron: 1, colombelles: 2, 'blainville-sur-orne': 3, caen: 4, mondeville: 5, 'bieville-beuville': 6 },
+  rochefort: { 'centre-ville': 0, martrou: 1, 'la-vieille-paroisse': 2, liberation: 3 },
+  'combs-la-ville': { 'centre-ville': 0, lieusaint: 1, 'moissy-cramayel': 2, 'brie-comte-robert': 3, 'evry-gregy-sur-yerre': 4, servon: 5, reau: 6 },
+  lanester: { 'centre-ville': 0, locmiquelic: 1, lorient: 2, caudan: 3, kervignac: 4, riantec: 5, hennebont: 6 },
+  'roissy-en-brie': { 'centre-ville': 0, 'croissy-beaubourg': 1, pontcarre: 2, 'ozoir-la-ferriere': 3, 'pontault-combault': 4, collegien: 5, 'ferrieres-en-brie': 6 },
+  'tassin-la-demi-lune': { 'centre-ville': 0, 'charbonnieres-les-bains': 1, 'saint-genis-les-ollieres': 2, ecully: 3, craponne: 4, francheville: 5, 'marcy-l-etoile': 6 },
+  'saint-jean-de-braye': { 'centre-ville': 0, semoy: 1, 'boigny-sur-bionne': 2, 'fleury-les-aubrais': 3, checy: 4, 'saint-denis-en-val': 5, 'saint-jean-le-blanc': 6 },
+  'deuil-la-barre': { 'centre-ville': 0, montmagny: 1, 'enghien-les-bains': 2, groslay: 3, montmorency: 4, 'soisy-sous-montmorency': 5, 'saint-gratien': 6 },
+  'maisons-laffitte': { 'centre-ville': 0, sartrouville: 1, 'le-mesnil-le-roi': 2, houilles: 3, montesson: 4, 'saint-germain-en-laye': 5, 'carrieres-sur-seine': 6 },
+  'le-moule': { 'centre-ville': 0, 'sainte-anne': 1, 'petit-canal': 2, 'saint-francois': 3, 'morne-a-l-eau': 4, 'les-abymes': 5, 'port-louis': 6 },
+  'velizy-villacoublay': { 'centre-ville': 0, viroflay: 1, 'jouy-en-josas': 2, buc: 3, versailles: 4, 'le-chesnay-rocquencourt': 5, 'la-celle-saint-cloud': 6 },
+  challans: { 'centre-ville': 0, soullans: 1, 'la-garnache': 2, commequiers: 3, froidfond: 4, 'saint-christophe-du-ligneron': 5, sallertaine: 6 },
+  'saint-dizier': { 'centre-ville': 0, 'eclaron-braucourt-sainte-liviere': 1, wassy: 2, 'la-porte-du-der': 3 },
+  torcy: { 'centre-ville': 0, 'vaires-sur-marne': 1, noisiel: 2, lognes: 3, 'saint-thibault-des-vignes': 4, collegien: 5, 'champs-sur-marne': 6 },
+  manosque: { 'centre-ville': 0, 'saint-lazare': 1, 'les-plantiers': 2, 'la-rochette': 3 },
+  loos: { 'centre-ville': 0, emmerin: 1, haubourdin: 2, wattignies: 3, sequedin: 4, lille: 5, 'faches-thumesnil': 6 },
+  'gif-sur-yvette': { 'centre-ville': 0, 'bures-sur-yvette': 1, 'gometz-le-chatel': 2, orsay: 3, 'les-ulis': 4, saclay: 5, villejust: 6 },
+  'les-pennes-mirabeau': { 'centre-ville': 0, 'septemes-les-vallons': 1, 'saint-victoret': 2, cabries: 3, vitrolles: 4, 'le-rove': 5, 'gignac-la-nerthe': 6 },
+  oyonnax: { 'centre-ville': 0, bellignat: 1, arbent: 2, dortan: 3, izernore: 4, 'montreal-la-cluse': 5, nantua: 6 },
+  'montigny-les-cormeilles': { 'centre-ville': 0, beauchamp: 1, franconville: 2, 'la-frette-sur-seine': 3, 'cormeilles-en-parisis': 4, 'herblay-sur-seine': 5, 'le-plessis-bouchard': 6 },
+  auch: { 'centre-ville': 0, pavie: 1, mirande: 2, fleurance: 3 },
+  abbeville: { 'centre-ville': 0, 'saint-valery-sur-somme': 1, 'feuquieres-en-vimeu': 2, airaines: 3, fressenneville: 4, 'friville-escarbotin': 5, flixecourt: 6 },
+  'villeneuve-sur-lot': { 'centre-ville': 0, 'saint-sylvestre-sur-lot': 1, bias: 2, pujols: 3, 'penne-d-agenais': 4, monflanquin: 5, casseneuil: 6 },
+  'mantes-la-ville': { 'centre-ville': 0, magnanville: 1, buchelay: 2, limay: 3, 'mantes-la-jolie': 4, guerville: 5, porcheville: 6 },
+  sevres: { 'centre-ville': 0, chaville: 1, 'ville-d-avray': 2, 'saint-cloud': 3, meudon: 4, garches: 5, 'boulogne-billancourt': 6 },
+  'montereau-fault-yonne': { 'centre-ville': 0, 'varennes-sur-seine': 1, 'cannes-ecluse': 2, 'saint-germain-laval': 3, 'la-grande-paroisse': 4, 'vernou-la-celle-sur-seine': 5, 'saint-mammes': 6 },
+  acheres: { 'centre-ville': 0, 'conflans-sainte-honorine': 1, andresy: 2, 'maisons-laffitte': 3, maurecourt: 4, 'chanteloup-les-vignes': 5, 'saint-germain-en-laye': 6 },
+  'le-petit-quevilly': { 'centre-ville': 0, 'le-grand-quevilly': 1, 'sotteville-les-rouen': 2, canteleu: 3, rouen: 4, 'deville-les-rouen': 5, 'petit-couronne': 6 },
+  arcueil: { 'centre-ville': 0, gentilly: 1, cachan: 2, 'le-kremlin-bicetre': 3, villejuif: 4, 'l-hay-les-roses': 5, 'ivry-sur-seine': 6 },
+  epernay: { 'centre-ville': 0, bernon: 1, 'clara-zetkin': 2, 'maison-blanche': 3 },
+  'gujan-mestras': { 'centre-ville': 0, 'le-teich': 1, 'la-teste-de-buch': 2, arcachon: 3, biganos: 4, mios: 5, salles: 6 },
+  dax: { 'centre-ville': 0, sablar: 1, 'saint-pierre': 2, 'saint-vincent-de-xaintes': 3 },
+  millau: { 'centre-ville': 0, 'la-cavalerie': 1, 'severac-d-aveyron': 2 },
+  fontaine: { 'centre-ville': 0, 'seyssinet-pariset': 1, sassenage: 2, grenoble: 3, 'saint-martin-le-vinoux': 4, seyssins: 5, 'saint-egreve': 6 },
+  'chemille-en-anjou': { 'centre-ville': 0, 'val-du-layon': 1, 'bellevigne-en-layon': 2, trementines: 3, 'rochefort-sur-loire': 4, 'chalonnes-sur-loire': 5, 'le-may-sur-evre': 6 },
+  longjumeau: { 'centre-ville': 0, 'chilly-mazarin': 1, 'epinay-sur-orge': 2, morangis: 3, ballainvilliers: 4, champlan: 5, 'saulx-les-chartreux': 6 },
+  'neuilly-plaisance': { 'centre-ville': 0, 'rosny-sous-bois': 1, 'neuilly-sur-marne': 2, villemomble: 3, gagny: 4, 'le-raincy': 5, montreuil: 6 },
+  hazebrouck: { 'centre-ville': 0, morbecque: 1, 'vieux-berquin': 2, cassel: 3, blaringhem: 4, meteren: 5, godewaersvelde: 6 },
+  'nogent-sur-oise': { 'centre-ville': 0, 'monchy-saint-eloi': 1, 'villers-saint-paul': 2, creil: 3, montataire: 4, laigneville: 5, cauffry: 6 },
+  voiron: { 'centre-ville': 0, coublevie: 1, 'saint-etienne-de-crossey': 2, chirens: 3, 'saint-jean-de-moirans': 4, 'la-buisse': 5, moirans: 6 },
+  'fleury-les-aubrais': { 'centre-ville': 0, saran: 1, semoy: 2, 'saint-jean-de-braye': 3, 'saint-jean-de-la-ruelle': 4, 'saint-jean-le-blanc': 5, 'boigny-sur-bionne': 6 },
+  'la-madeleine': { 'centre-ville': 0, 'saint-andre-lez-lille': 1, 'marquette-lez-lille': 2, 'mons-en-bar-ul': 3, lille: 4, lambersart: 5, 'marcq-en-bar-ul': 6 },
+  'saint-michel-sur-orge': { 'centre-ville': 0, 'sainte-genevieve-des-bois': 1, 'longpont-sur-orge': 2, 'villiers-sur-orge': 3, 'villemoisson-sur-orge': 4, montlhery: 5, 'le-plessis-pate': 6 },
+  montmorency: { 'centre-ville': 0, 'soisy-sous-montmorency': 1, 'saint-brice-sous-foret': 2, groslay: 3, andilly: 4, 'deuil-la-barre': 5, margency: 6 },
+  'montigny-les-metz': { 'centre-ville': 0, 'longeville-les-metz': 1, 'moulins-les-metz': 2, 'le-ban-saint-martin': 3, metz: 4, 'scy-chazelles': 5, marly: 6 },
+  'sainte-foy-les-lyon': { 'centre-ville': 0, 'la-mulatiere': 1, francheville: 2, 'oullins-pierre-benite': 3, lyon: 4, 'tassin-la-demi-lune': 5, chaponost: 6 },
+  'morsang-sur-orge': { 'centre-ville': 0, 'villemoisson-sur-orge': 1, 'viry-chatillon': 2, 'sainte-genevieve-des-bois': 3, grigny: 4, 'epinay-sur-orge': 5, 'fleury-merogis': 6 },
+  'mandelieu-la-napoule': { 'centre-ville': 0, pegomas: 1, 'la-roquette-sur-siagne': 2, cannes: 3, 'le-cannet': 4, 'auribeau-sur-siagne': 5, mougins: 6 },
+  gardanne: { 'centre-ville': 0, meyreuil: 1, mimet: 2, fuveau: 3, 'bouc-bel-air': 4, greasque: 5, 'simiane-collongue': 6 },
+  'le-robert': { 'centre-ville': 0, 'le-francois': 1, 'la-trinite': 2, 'le-lamentin': 3, 'gros-morne': 4, ducos: 5, 'saint-joseph': 6 },
+  'lagny-sur-marne': { 'centre-ville': 0, 'saint-thibault-des-vignes': 1, 'thorigny-sur-marne': 2, pomponne: 3, 'chanteloup-en-brie': 4, montevrain: 5, dampmart: 6 },
+  allauch: { 'centre-ville': 0, 'plan-de-cuques': 1, cadolive: 2, 'saint-savournin': 3, peypin: 4, mimet: 5, roquevaire: 6 },
+  'bruay-la-buissiere': { 'centre-ville': 0, haillicourt: 1, 'marles-les-mines': 2, lapugnoy: 3, divion: 4, houdain: 5, 'calonne-ricouart': 6 },
+  givors: { 'centre-ville': 0, 'grigny-sur-rhone': 1, beauvallon: 2, ternay: 3, 'loire-sur-rhone': 4, montagny: 5, millery: 6 },
+  'saint-gratien': { 'centre-ville': 0, 'enghien-les-bains': 1, sannois: 2, 'soisy-sous-montmorency': 3, eaubonne: 4, ermont: 5, 'deuil-la-barre': 6 },
+  'saint-cyr-l-ecole': { 'centre-ville': 0, 'fontenay-le-fleury': 1, 'bois-d-arcy': 2, bailly: 3, guyancourt: 4, versailles: 5, 'montigny-le-bretonneux': 6 },
+  'ozoir-la-ferriere': { 'centre-ville': 0, 'roissy-en-brie': 1, 'gretz-armainvilliers': 2, pontcarre: 3, lesigny: 4, 'chevry-cossigny': 5, 'pontault-combault': 6 },
+  'saint-genis-laval': { 'centre-ville': 0, 'oullins-pierre-benite': 1, irigny: 2, brignais: 3, chaponost: 4, vourles: 5, charly: 6 },
+  'montaigu-vendee': { 'centre-ville': 0, 'treize-septiers': 1, 'la-boissiere-de-montaigu': 2, 'cugand-la-bernardiere': 3, 'l-herbergement': 4, 'la-bruffiere': 5, 'les-brouzils': 6 },
+  'le-plessis-trevise': { 'centre-ville': 0, 'chennevieres-sur-marne': 1, 'villiers-sur-marne': 2, 'la-queue-en-brie': 3, 'ormesson-sur-marne': 4, noiseau: 5, 'champigny-sur-marne': 6 },
+  'mons-en-bar-ul': { 'centre-ville': 0, 'la-madeleine': 1, wasquehal: 2, lezennes: 3, 'villeneuve-d-ascq': 4, 'marcq-en-bar-ul': 5, lille: 6 },
+  'plaisance-du-touch': { 'centre-ville': 0, 'la-salvetat-saint-gilles': 1, tournefeuille: 2, fonsorbes: 3, frouzins: 4, leguevin: 5, cugnaux: 6 },
+  'saint-mande': { 'centre-ville': 0, vincennes: 1, 'charenton-le-pont': 2, 'saint-maurice': 3, 'ivry-sur-seine': 4, 'fontenay-sous-bois': 5, 'joinville-le-pont': 6 },
+  'bourg-la-reine': { 'centre-ville': 0, sceaux: 1, bagneux: 2, 'fontenay-aux-roses': 3, chatillon: 4, antony: 5, montrouge: 6 },
+  'villeneuve-le-roi': { 'centre-ville': 0, orly: 1, 'ablon-sur-seine': 2, 'villeneuve-saint-georges': 3, thiais: 4, 'choisy-le-roi': 5, valenton: 6 },
+  carquefou: { 'centre-ville': 0, 'thouare-sur-loire': 1, 'sainte-luce-sur-loire': 2, 'mauves-sur-loire': 3, 'saint-mars-du-desert': 4, 'la-chapelle-sur-erdre': 5, 'suce-sur-erdre': 6 },
+  sceaux: { 'centre-ville': 0, 'bourg-la-reine': 1, 'fontenay-aux-roses': 2, bagneux: 3, 'chatenay-malabry': 4, 'le-plessis-robinson': 5, antony: 6 },
+  concarneau: { 'centre-ville': 0, melgven: 1, 'la-foret-fouesnant': 2, 'saint-yvi': 3, tregunc: 4, rosporden: 5, 'pont-aven': 6 },
+  chaumont: { 'centre-ville': 0, nogent: 1 },
+  lingolsheim: { 'centre-ville': 0, ostwald: 1, holtzheim: 2, eckbolsheim: 3, wolfisheim: 4, entzheim: 5, oberschaeffolsheim: 6 },
+  'carrieres-sous-poissy': { 'centre-ville': 0, 'villennes-sur-seine': 1, poissy: 2, 'chanteloup-les-vignes': 3, 'triel-sur-seine': 4, andresy: 5, vernouillet: 6 },
+  'coudekerque-branche': { 'centre-ville': 0, 'cappelle-la-grande': 1, 'teteghem-coudekerque-village': 2, dunkerque: 3, leffrinckoucke: 4, 'armbouts-cappel': 5, bergues: 6 },
+  wasquehal: { 'centre-ville': 0, croix: 1, 'marcq-en-bar-ul': 2, 'mons-en-bar-ul': 3, mouvaux: 4, roubaix: 5, bondues: 6 },
+  halluin: { 'centre-ville': 0, 'neuville-en-ferrain': 1, roncq: 2, bousbecque: 3, 'wervicq-sud': 4, linselles: 5, tourcoing: 6 },
+  'la-chapelle-sur-erdre': { 'centre-ville': 0, treillieres: 1, orvault: 2, 'suce-sur-erdre': 3, carquefou: 4, nantes: 5, 'grandchamp-des-fontaines': 6 },
+  denain: { 'centre-ville': 0, haulchin: 1, haveluy: 2, 'douchy-les-mines': 3, lourches: 4, escaudain: 5, prouvy: 6 },
+  cugnaux: { 'centre-ville': 0, 'villeneuve-tolosane': 1, tournefeuille: 2, frouzins: 3, roques: 4, 'portet-sur-garonne': 5, 'plaisance-du-touch': 6 },
+  maurepas: { 'centre-ville': 0, 'jouars-pontchartrain': 1, coignieres: 2, 'la-verriere': 3, elancourt: 4, 'le-mesnil-saint-denis': 5, 'neauphle-le-chateau': 6 },
+  chaville: { 'centre-ville': 0, 'ville-d-avray': 1, sevres: 2, meudon: 3, vaucresson: 4, 'saint-cloud': 5, garches: 6 },
+  croix: { 'centre-ville': 0, wasquehal: 1, roubaix: 2, mouvaux: 3, hem: 4, 'marcq-en-bar-ul': 5, 'villeneuve-d-ascq': 6 },
+  bouguenais: { 'centre-ville': 0, reze: 1, 'saint-aignan-grandlieu': 2, bouaye: 3, indre: 4, 'la-montagne': 5, 'saint-herblain': 6 },
+  'joinville-le-pont': { 'centre-ville': 0, 'saint-maurice': 1, 'nogent-sur-marne': 2, 'saint-maur-des-fosses': 3, 'maisons-alfort': 4, 'fontenay-sous-bois': 5, 'le-perreux-sur-marne': 6 },
+  'le-creusot': { 'centre-ville': 0, torcy: 1, 'le-breuil': 2, montchanin: 3, blanzy: 4, 'montceau-les-mines': 5, autun: 6 },
+  forbach: { 'centre-ville': 0, ting: 1, 'stiring-wendel': 2, 'sch-neck': 3, 'petite-rosselle': 4, morsbach: 5, 'behren-les-forbach': 6 },
+  'la-celle-saint-cloud': { 'centre-ville': 0, bougival: 1, louveciennes: 2, 'le-chesnay-rocquencourt': 3, 'croissy-sur-seine': 4, 'marly-le-roi': 5, 'le-port-marly': 6 },
+  'mitry-mory': { 'centre-ville': 0, villeparisis: 1, 'claye-souilly': 2, courtry: 3, juilly: 4, villevaude: 5, longperrier: 6 },
+  'chilly-mazarin': { 'centre-ville': 0, longjumeau: 1, morangis: 2, champlan: 3, wissous: 4, 'savigny-sur-orge': 5, 'epinay-sur-orge': 6 },
+  beaune: { 'centre-ville': 0, 'nuits-saint-georges': 1, seurre: 2, 'gevrey-chambertin': 3 },
+  lannion: { 'centre-ville': 0, louannec: 1, ploubezre: 2, 'pleumeur-bodou': 3, ploumilliau: 4, trebeurden: 5, tregastel: 6 },
+  fougeres: { 'centre-ville': 0, lecousse: 1, javene: 2, romagne: 3, 'saint-germain-en-cogles': 4, 'la-chapelle-fleurigne': 5, 'maen-roch': 6 },
+  'l-isle-sur-la-sorgue': { 'centre-ville': 0, 'le-thor': 1, velleron: 2, cavaillon: 3, 'pernes-les-fontaines': 4, robion: 5, 'caumont-sur-durance': 6 },
+  'grande-synthe': { 'centre-ville': 0, dunkerque: 1, 'armbouts-cappel': 2, 'loon-plage': 3, 'cappelle-la-grande': 4, 'coudekerque-branche': 5, bourbourg: 6 },
+  'mont-saint-aignan': { 'centre-ville': 0, 'deville-les-rouen': 1, 'bois-guillaume': 2, 'notre-dame-de-bondeville': 3, rouen: 4, bihorel: 5, maromme: 6 },
+  sarreguemines: { 'centre-ville': 0, hambach: 1, woustviller: 2, grosbliederstroff: 3, alsting: 4, 'behren-les-forbach': 5, spicheren: 6 },
+  cahors: { 'centre-historique': 0, cabessut: 1, 'terre-rouge': 2, 'sainte-valerie': 3 },
+  bruges: { 'centre-ville': 0, 'le-bouscat': 1, bordeaux: 2, eysines: 3, blanquefort: 4, bassens: 5, 'le-taillan-medoc': 6 },
+  'bourg-les-valence': { 'centre-ville': 0, 'saint-marcel-les-valence': 1, valence: 2, 'la-roche-de-glun': 3, 'pont-de-l-isere': 4, 'chateauneuf-sur-isere': 5, malissard: 6 },
+  albertville: { 'centre-ville': 0, grignon: 1, 'gilly-sur-isere': 2, mercury: 3, 'la-bathie': 4, ugine: 5, 'val-d-arc': 6 },
+  bressuire: { 'centre-ville': 0, courlay: 1, argentonnay: 2, 'nueil-les-aubiers': 3, 'la-chapelle-saint-laurent': 4, cerizay: 5, 'la-foret-sur-sevre': 6 },
+  gentilly: { 'centre-ville': 0, arcueil: 1, 'le-kremlin-bicetre': 2, cachan: 3, villejuif: 4, 'ivry-sur-seine': 5, 'l-hay-les-roses': 6 },
+  'cournon-d-auvergne': { 'centre-ville': 0, 'le-cendre': 1, lempdes: 2, 'perignat-les-sarlieve': 3, orcet: 4, 'mur-sur-allier': 5, aubiere: 6 },
+  vence: { 'centre-ville': 0, 'saint-jeannet': 1, 'saint-paul-de-vence': 2, 'la-gaude': 3, 'tourrettes-sur-loup': 4, 'la-colle-sur-loup': 5, gattieres: 6 },
+  macouria: { 'centre-ville': 0, cayenne: 1, 'montsinery-tonnegrande': 2, matoury: 3 },
+  'chevilly-larue': { 'centre-ville': 0, 'l-hay-les-roses': 1, rungis: 2, fresnes: 3, thiais: 4, villejuif: 5, cachan: 6 },
+  ronchin: { 'centre-ville': 0, 'faches-thumesnil': 1, lezennes: 2, lesquin: 3, wattignies: 4, templemars: 5, lille: 6 },
+  mougins: { 'centre-ville': 0, 'le-cannet': 1, 'mouans-sartoux': 2, valbonne: 3, 'la-roquette-sur-siagne': 4, vallauris: 5, cannes: 6 },
+  bruz: { 'centre-ville': 0, 'pont-pean': 1, 'chartres-de-bretagne': 2, chavagne: 3, 'saint-jacques-de-la-lande': 4, laille: 5, goven: 6 },
+  lisieux: { 'centre-ville': 0, valorbiquet: 1, 'livarot-pays-d-auge': 2, 'pont-l-eveque': 3, 'mezidon-vallee-d-auge': 4, dozule: 5, 'saint-pierre-en-auge': 6 },
+  selestat: { 'centre-ville': 0, scherwiller: 1, muttersholtz: 2, ebersheim: 3, chatenois: 4, 'dambach-la-ville': 5, hilsenheim: 6 },
+  'la-crau': { 'centre-ville': 0, 'sollies-pont': 1, 'la-farlede': 2, 'sollies-ville': 3, 'la-garde': 4, carqueiranne: 5, cuers: 6 },
+  pertuis: { 'centre-ville': 0, 'la-tour-d-aigues': 1, villelaure: 2, cadenet: 3, lauris: 4, apt: 5 },
+  'le-mee-sur-seine': { 'centre-ville': 0, melun: 1, 'vert-saint-denis': 2, 'dammarie-les-lys': 3, 'la-rochette': 4, cesson: 5, rubelles: 6 },
+  'sch-lcher': { 'centre-ville': 0, 'case-pilote': 1, 'fort-de-france': 2, 'saint-joseph': 3, 'le-carbet': 4, 'gros-morne': 5, 'le-lamentin': 6 },
+  'saint-lo': { 'centre-ville': 0, agneaux: 1, 'conde-sur-vire': 2, bourgvallees: 3, 'saint-jean-d-elle': 4, 'marigny-le-lozon': 5, 'saint-amand-villages': 6 },
+  villefontaine: { 'centre-ville': 0, 'la-verpilliere': 1, 'vaulx-milieu': 2, 'saint-quentin-fallavier': 3, roche: 4, frontonas: 5, 'l-isle-d-abeau': 6 },
+  royan: { 'centre-ville': 0, pontaillac: 1, foncillon: 2, 'conche-du-chay': 3 },
+  vitre: { 'centre-ville': 0, etrelles: 1, balaze: 2, 'argentre-du-plessis': 3, 'val-d-ize': 4, 'saint-didier': 5, domalain: 6 },
+  'juvisy-sur-orge': { 'centre-ville': 0, 'savigny-sur-orge': 1, 'athis-mons': 2, 'viry-chatillon': 3, morangis: 4, 'paray-vieille-poste': 5, grigny: 6 },
+  'saint-fons': { 'centre-ville': 0, venissieux: 1, feyzin: 2, 'oullins-pierre-benite': 3, irigny: 4, 'saint-genis-laval': 5, 'la-mulatiere': 6 },
+  'saint-die-des-vosges': { 'centre-ville': 0, 'sainte-marguerite': 1, 'saulcy-sur-meurthe': 2, moyenmoutier: 3, 'etival-clairefontaine': 4, senones: 5, 'raon-l-etape': 6 },
+  moulins: { 'centre-ville': 0, avermes: 1, yzeure: 2, 'bourbon-l-archambault': 3 },
+  sorgues: { 'centre-ville': 0, 'le-pontet': 1, bedarrides: 2, 'chateauneuf-du-pape': 3, vedene: 4, 'entraigues-sur-la-sorgue': 5, 'althen-des-paluds': 6 },
+  'brie-comte-robert': { 'centre-ville': 0, servon: 1, 'combs-la-ville': 2, 'evry-gregy-sur-yerre': 3, 'grisy-suisnes': 4, 'chevry-cossigny': 5, lesigny: 6 },
+  ploemeur: { 'centre-ville': 0, 'larmor-plage': 1, lorient: 2, queven: 3, guidel: 4, 'port-louis': 5, gestel: 6 },
+  riom: { 'centre-ville': 0, mozac: 1, 'saint-bonnet-pres-riom': 2, chateaugay: 3, 'chatel-guyon': 4, 'saint-beauzire': 5, ennezat: 6 },
+  meylan: { 'centre-ville': 0, 'montbonnot-saint-martin': 1, corenc: 2, 'la-tronche': 3, biviers: 4, gieres: 5, domene: 6 },
+  'cesson-sevigne': { 'centre-ville': 0, 'thorigne-fouillard': 1, chantepie: 2, acigne: 3, rennes: 4, domloup: 5, betton: 6 },
+  pornic: { 'centre-ville': 0, chauve: 1, 'la-bernerie-en-retz': 2, 'saint-michel-chef-chef': 3, 'la-plaine-sur-mer': 4, 'chaumes-en-retz': 5, 'saint-pere-en-retz': 6 },
+  'chennevieres-sur-marne': { 'centre-ville': 0, 'ormesson-sur-marne': 1, noiseau: 2, 'le-plessis-trevise': 3, 'sucy-en-brie': 4, 'champigny-sur-marne': 5, 'la-queue-en-brie': 6 },
+  louviers: { 'centre-ville': 0, 'le-vaudreuil': 1, 'val-de-reuil': 2, 'pont-de-l-arche': 3, pitres: 4, 'le-val-d-hazey': 5, 'clef-vallee-d-eure': 6 },
+  'mauges-sur-loire': {
+    'centre-ville': 0,
+    'ingrandes-le-fresne-sur-loire': 1,
+    'chalonnes-sur-loire': 2,
+    'montrevault-sur-evre': 3,
+    'saint-georges-sur-loire': 4,
+    'beaupreau-en-mauges': 5,
+    'la-possonniere': 6,
+  },
+  lamentin: { 'centre-ville': 0, 'sainte-rose': 1, 'baie-mahault': 2, 'petit-bourg': 3, 'pointe-noire': 4, 'pointe-a-pitre': 5, goyave: 6 },
+  'faches-thumesnil': { 'centre-ville': 0, ronchin: 1, wattignies: 2, templemars: 3, lesquin: 4, lezennes: 5, loos: 6 },
+  hem: { 'centre-ville': 0, 'villeneuve-d-ascq': 1, 'lys-lez-lannoy': 2, toufflers: 3, croix: 4, willems: 5, roubaix: 6 },
+  bischheim: { 'centre-ville': 0, 'h-nheim': 1, schiltigheim: 2, souffelweyersheim: 3, reichstett: 4, mundolsheim: 5, mittelhausbergen: 6 },
+  'le-puy-en-velay': { 'centre-ville': 0, 'brives-charensac': 1, 'vals-pres-le-puy': 2, chadrac: 3, 'espaly-saint-marcel': 4, coubon: 5, polignac: 6 },
+  'sanary-sur-mer': { 'centre-ville': 0, bandol: 1, ollioules: 2, 'six-fours-les-plages': 3, 'le-beausset': 4, 'saint-cyr-sur-mer': 5, evenos: 6 },
+  cognac: { 'centre-ville': 0, 'saint-martin': 1, crouin: 2, 'la-chaudronne': 3 },
+  'moissy-cramayel': { 'centre-ville': 0, reau: 1, lieusaint: 2, 'combs-la-ville': 3, 'evry-gregy-sur-yerre': 4, 'savigny-le-temple': 5, nandy: 6 },
+  'bry-sur-marne': { 'centre-ville': 0, 'le-perreux-sur-marne': 1, 'villiers-sur-marne': 2, 'champigny-sur-marne': 3, 'nogent-sur-marne': 4, 'fontenay-sous-bois': 5, 'joinville-le-pont': 6 },
+  'chateauneuf-les-martigues': { 'centre-ville': 0, 'carry-le-rouet': 1, 'ensues-la-redonne': 2, 'sausset-les-pins': 3, marignane: 4, 'gignac-la-nerthe': 5, martigues: 6 },
+  eragny: { 'centre-ville': 0, 'neuville-sur-oise': 1, pontoise: 2, 'saint-ouen-l-aumone': 3, cergy: 4, 'herblay-sur-seine': 5, pierrelaye: 6 },
+  'le-pontet': { 'centre-ville': 0, vedene: 1, avignon: 2, sorgues: 3, 'morieres-les-avignon': 4, 'entraigues-sur-la-sorgue': 5, 'saint-saturnin-les-avignon': 6 },
+  'romorantin-lanthenay': { 'centre-ville': 0, 'pruniers-en-sologne': 1, 'villefranche-sur-cher': 2, gievres: 3, 'selles-sur-cher': 4, salbris: 5, 'cour-cheverny': 6 },
+  floirac: { 'centre-ville': 0, bouliac: 1, cenon: 2, begles: 3, 'artigues-pres-bordeaux': 4, tresses: 5, 'carignan-de-bordeaux': 6 },
+  'bonneuil-sur-marne': { 'centre-ville': 0, 'limeil-brevannes': 1, 'saint-maur-des-fosses': 2, 'sucy-en-brie': 3, creteil: 4, valenton: 5, 'ormesson-sur-marne': 6 },
+  luneville: { 'centre-ville': 0, chanteheux: 1, 'blainville-sur-l-eau': 2, damelevieres: 3, 'dombasle-sur-meurthe': 4, 'rosieres-aux-salines': 5, varangeville: 6 },
+  'moorea-maiao': { 'centre-ville': 0 },
+  'bagnols-sur-ceze': { 'centre-ville': 0, 'laudun-l-ardoise': 1, 'pont-saint-esprit': 2, 'saint-victor-la-coste': 3, 'saint-laurent-des-arbres': 4, 'saint-genies-de-comolas': 5, roquemaure: 6 },
+  ducos: { 'centre-ville': 0, 'saint-esprit': 1, 'le-lamentin': 2, 'riviere-salee': 3, 'le-francois': 4, 'les-trois-ilets': 5, 'sainte-luce': 6 },
+  hendaye: { 'centre-ville': 0, urrugne: 1, ciboure: 2, 'saint-jean-de-luz': 3, ascain: 4, sare: 5, 'saint-pee-sur-nivelle': 6 },
+  pontarlier: { 'centre-ville': 0, doubs: 1, 'val-d-usiers': 2, levier: 3, montlebon: 4, morteau: 5, 'orchamps-vennes': 6 },
+  'soisy-sous-montmorency': { 'centre-ville': 0, montmorency: 1, eaubonne: 2, margency: 3, 'enghien-les-bains': 4, andilly: 5, 'saint-gratien': 6 },
+  'saint-egreve': { 'centre-ville': 0, 'saint-martin-le-vinoux': 1, sassenage: 2, 'fontanil-cornillon': 3, fontaine: 4, noyarey: 5, 'la-tronche': 6 },
+  'digne-les-bains': { 'centre-ville': 0, malijai: 1, 'chateau-arnoux-saint-auban': 2 },
+  osny: { 'centre-ville': 0, 'boissy-l-aillerie': 1, pontoise: 2, cergy: 3, ennery: 4, vaureal: 5, courdimanche: 6 },
+  ecully: {
+    'centre-ville': 0,
+    'champagne-au-mont-d-or': 1,
+    'charbonnieres-les-bains': 2,
+    'tassin-la-demi-lune': 3,
+    dardilly: 4,
+    'saint-didier-au-mont-d-or': 5,
+    'saint-genis-les-ollieres': 6,
+  },
+  carvin: { 'centre-ville': 0, libercourt: 1, meurchin: 2, courrieres: 3, oignies: 4, 'pont-a-vendin': 5, harnes: 6 },
+  'saint-maximin-la-sainte-baume': { 'centre-ville': 0, tourves: 1, 'seillons-source-d-argens': 2, bras: 3, 'nans-les-pins': 4, pourrieres: 5, 'saint-zacharie': 6 },
+  limay: { 'centre-ville': 0, 'mantes-la-ville': 1, porcheville: 2, 'mantes-la-jolie': 3, issou: 4, guerville: 5, buchelay: 6 },
+  'jouy-le-moutier': { 'centre-ville': 0, 'neuville-sur-oise': 1, vaureal: 2, cergy: 3, courdimanche: 4, menucourt: 5, eragny: 6 },
+  brignoles: { 'centre-ville': 0, forcalqueiret: 1, gareoult: 2, 'le-val': 3, 'sainte-anastasie-sur-issole': 4, rocbaron: 5, 'la-roquebrussanne': 6 },
+  dzaoudzi: { 'centre-ville': 0, pamandzi: 1, mamoudzou: 2, koungou: 3, dembeni: 4, tsingoni: 5, ouangani: 6 },
+  cluses: { 'centre-ville': 0, scionzier: 1, marnaz: 2, thyez: 3, marignier: 4, magland: 5, taninges: 6 },
+  balma: { 'centre-ville': 0, flourens: 1, 'quint-fonsegrives': 2, montrabe: 3, 'l-union': 4, toulouse: 5, 'saint-jean': 6 },
+  garches: { 'centre-ville': 0, 'saint-cloud': 1, vaucresson: 2, 'rueil-malmaison': 3, 'ville-d-avray': 4, sevres: 5, suresnes: 6 },
+  'sainte-rose': { 'centre-ville': 0, lamentin: 1, 'baie-mahault': 2, deshaies: 3, 'pointe-noire': 4, 'petit-bourg': 5, 'pointe-a-pitre': 6 },
+  'capesterre-belle-eau': { 'centre-ville': 0, 'trois-rivieres': 1, 'saint-claude': 2, goyave: 3, gourbeyre: 4, baillif: 5, 'vieux-habitants': 6 },
+  'segre-en-anjou-bleu': { 'centre-ville': 0, 'le-lion-d-angers': 1, 'erdre-en-anjou': 2, 'ombree-d-anjou': 3, cande: 4, 'longuenee-en-anjou': 5, 'saint-clement-de-la-place': 6 },
+  'ambares-et-lagrave': { 'centre-ville': 0, 'saint-louis-de-montferrand': 1, 'cubzac-les-ponts': 2, bassens: 3, 'carbon-blanc': 4, 'sainte-eulalie': 5, parempuyre: 6 },
+  'villeneuve-loubet': { 'centre-ville': 0, biot: 1, 'roquefort-les-pins': 2, 'la-colle-sur-loup': 3, 'cagnes-sur-mer': 4, 'saint-paul-de-vence': 5, valbonne: 6 },
+  'l-isle-d-abeau': { 'centre-ville': 0, 'vaulx-milieu': 1, 'saint-alban-de-roche': 2, 'bourgoin-jallieu': 3, frontonas: 4, villefontaine: 5, 'la-verpilliere': 6 },
+  chamalieres: { 'centre-ville': 0, royat: 1, beaumont: 2, ceyrat: 3, nohanent: 4, 'clermont-ferrand': 5, orcines: 6 },
+  'vire-normandie': { 'centre-ville': 0, 'noues-de-sienne': 1, valdalliere: 2, 'souleuvre-en-bocage': 3, 'conde-en-normandie': 4, 'les-monts-d-aunay': 5 },
+  avion: { 'centre-ville': 0, 'eleu-dit-leauwette': 1, vimy: 2, mericourt: 3, sallaumines: 4, 'givenchy-en-gohelle': 5, lens: 6 },
+  yutz: { 'centre-ville': 0, manom: 1, 'basse-ham': 2, thionville: 3, bertrange: 4, terville: 5, florange: 6 },
+  lattes: { 'centre-ville': 0, perols: 1, 'palavas-les-flots': 2, montpellier: 3, 'saint-jean-de-vedas': 4, 'villeneuve-les-maguelone': 5, 'castelnau-le-lez': 6 },
+  marmande: { 'centre-ville': 0, 'sainte-bazeille': 1, 'miramont-de-guyenne': 2, tonneins: 3, casteljaloux: 4, clairac: 5 },
+  'boissy-saint-leger': { 'centre-ville': 0, 'marolles-en-brie': 1, 'limeil-brevannes': 2, villecresnes: 3, 'sucy-en-brie': 4, 'bonneuil-sur-marne': 5, santeny: 6 },
+  sallanches: { 'centre-ville': 0, domancy: 1, combloux: 2, magland: 3, 'le-grand-bornand': 4, megeve: 5, passy: 6 },
+  saran: { 'centre-ville': 0, 'fleury-les-aubrais': 1, 'saint-jean-de-la-ruelle': 2, ormes: 3, ingre: 4, gidy: 5, semoy: 6 },
+  fecamp: { 'centre-ville': 0, goderville: 1, 'criquetot-l-esneval': 2, 'cany-barville': 3, 'terres-de-caux': 4, bolbec: 5, 'gruchet-le-valasse': 6 },
+  annonay: { 'centre-ville': 0, 'boulieu-les-annonay': 1, roiffieux: 2, davezieux: 3, 'vernosc-les-annonay': 4, peaugres: 5, sarras: 6 },
+  'lamballe-armor': { 'centre-ville': 0, 'saint-alban': 1, pommeret: 2, hillion: 3, 'pleneuf-val-andre': 4, quessoy: 5, yffiniac: 6 },
+  viroflay: { 'centre-ville': 0, 'velizy-villacoublay': 1, versailles: 2, 'jouy-en-josas': 3, buc: 4, 'le-chesnay-rocquencourt': 5, 'la-celle-saint-cloud': 6 },
+  blanquefort: { 'centre-ville': 0, bruges: 1, parempuyre: 2, 'le-taillan-medoc': 3, eysines: 4, 'le-pian-medoc': 5, 'le-bouscat': 6 },
+  'oree-d-anjou': { 'centre-ville': 0, 'montrevault-sur-evre': 1, 'beaupreau-en-mauges': 2, 'mauges-sur-loire': 3 },
+  'montceau-les-mines': { 'centre-ville': 0, 'saint-vallier': 1, blanzy: 2, 'sanvignes-les-mines': 3, 'ciry-le-noble': 4, montchanin: 5, torcy: 6 },
+  firminy: { 'centre-ville': 0, fraisses: 1, unieux: 2, 'le-chambon-feugerolles': 3, 'roche-la-moliere': 4, 'la-ricamarie': 5, 'saint-etienne': 6 },
+  'saint-cyr-sur-loire': { 'centre-ville': 0, 'la-membrolle-sur-choisille': 1, fondettes: 2, tours: 3, 'la-riche': 4, mettray: 5, 'notre-dame-d-oe': 6 },
+  'le-pre-saint-gervais': { 'centre-ville': 0, 'les-lilas': 1, pantin: 2, bagnolet: 3, romainville: 4, aubervilliers: 5, bobigny: 6 },
+  'la-baule-escoublac': { 'centre-ville': 0, pornichet: 1, 'saint-andre-des-eaux': 2, 'le-pouliguen': 3, guerande: 4, 'batz-sur-mer': 5, 'saint-nazaire': 6 },
+  verdun: { 'centre-ville': 0, 'faubourg-pave': 1, glorieux: 2, belleville: 3 },
+  guerande: { 'centre-ville': 0, 'saint-molf': 1, 'la-turballe': 2, 'la-baule-escoublac': 3, 'saint-lyphard': 4, 'le-pouliguen': 5, 'batz-sur-mer': 6 },
+  'les-clayes-sous-bois': { 'centre-ville': 0, plaisir: 1, villepreux: 2, 'bois-d-arcy': 3, 'fontenay-le-fleury': 4, elancourt: 5, trappes: 6 },
+  'saint-jean-de-la-ruelle': { 'centre-ville': 0, 'saint-pryve-saint-mesmin': 1, 'la-chapelle-saint-mesmin': 2, saran: 3, ingre: 4, orleans: 5, 'fleury-les-aubrais': 6 },
+  'loire-authion': { 'centre-ville': 0, 'le-plessis-grammoire': 1, 'maze-milon': 2, trelaze: 3, 'saint-barthelemy-d-anjou': 4, 'verrieres-en-anjou': 5, 'la-menitre': 6 },
+  'marly-le-roi': { 'centre-ville': 0, 'mareil-marly': 1, louveciennes: 2, 'l-etang-la-ville': 3, 'le-port-marly': 4, 'le-pecq': 5, bailly: 6 },
+  valserhone: { 'centre-ville': 0, collonges: 1, peron: 2, nantua: 3, 'saint-jean-de-gonville': 4, 'montreal-la-cluse': 5, bellignat: 6 },
+  sedan: { 'centre-ville': 0, floing: 1, bazeilles: 2, 'vrigne-aux-bois': 3, 'vivier-au-court': 4, douzy: 5, 'nouvion-sur-meuse': 6 },
+  cestas: { 'centre-ville': 0, canejan: 1, pessac: 2, leognan: 3, marcheprime: 4, 'saint-jean-d-illac': 5, gradignan: 6 },
+  'lons-le-saunier': { 'centre-ville': 0, montmorot: 1, poligny: 2 },
+  'bois-d-arcy': { 'centre-ville': 0, 'fontenay-le-fleury': 1, villepreux: 2, 'les-clayes-sous-bois': 3, 'montigny-le-bretonneux': 4, 'saint-cyr-l-ecole': 5, trappes: 6 },
+  'chateau-gontier-sur-mayenne': { 'centre-ville': 0, 'quelaines-saint-gault': 1, 'meslay-du-maine': 2, craon: 3, entrammes: 4, 'cosse-le-vivien': 5, 'l-huisserie': 6 },
+  chateaurenard: { 'centre-ville': 0, rognonas: 1, eyragues: 2, noves: 3, graveson: 4, barbentane: 5, maillane: 6 },
+  mauguio: { 'centre-ville': 0, candillargues: 1, 'la-grande-motte': 2, mudaison: 3, 'saint-aunes': 4, perols: 5, lansargues: 6 },
+  'les-herbiers': { 'centre-ville': 0, beaurepaire: 1, 'la-gaubretiere': 2, mouchamps: 3, chanverrie: 4, 'les-epesses': 5, 'saint-fulgent': 6 },
+  orsay: { 'centre-ville': 0, 'les-ulis': 1, 'bures-sur-yvette': 2, villejust: 3, 'villebon-sur-yvette': 4, palaiseau: 5, 'gif-sur-yvette': 6 },
+  pamiers: { 'centre-ville': 0, 'la-tour-du-crieu': 1, 'saint-jean-du-falga': 2, verniolle: 3, varilhes: 4, saverdun: 5, mazeres: 6 },
+  rumilly: { 'centre-ville': 0, sales: 1, 'marcellaz-albanais': 2, 'saint-felix': 3, 'vallieres-sur-fier': 4, 'alby-sur-cheran': 5, chavanod: 6 },
+  mennecy: { 'centre-ville': 0, ormoy: 1, villabe: 2, lisses: 3, 'le-coudray-montceaux': 4, 'corbeil-essonnes': 5, 'vert-le-petit': 6 },
+  'sainte-luce-sur-loire': { 'centre-ville': 0, 'thouare-sur-loire': 1, 'basse-goulaine': 2, carquefou: 3, 'saint-julien-de-concelles': 4, 'saint-sebastien-sur-loire': 5, nantes: 6 },
+  coulommiers: { 'centre-ville': 0, mouroux: 1, 'boissy-le-chatel': 2, 'beautheil-saints': 3, pommeuse: 4, faremoutiers: 5, guerard: 6 },
+  landerneau: { 'centre-ville': 0, pencran: 1, 'la-forest-landerneau': 2, plouedern: 3, dirinon: 4, ploudaniel: 5, loperhet: 6 },
+  trelaze: { 'centre-ville': 0, 'saint-barthelemy-d-anjou': 1, 'les-ponts-de-ce': 2, 'le-plessis-grammoire': 3, angers: 4, 'verrieres-en-anjou': 5, 'sainte-gemmes-sur-loire': 6 },
+  'verneuil-sur-seine': { 'centre-ville': 0, 'vaux-sur-seine': 1, vernouillet: 2, 'triel-sur-seine': 3, 'les-mureaux': 4, 'meulan-en-yvelines': 5, 'chanteloup-les-vignes': 6 },
+  'morne-a-l-eau': { 'centre-ville': 0, 'les-abymes': 1, 'petit-canal': 2, 'pointe-a-pitre': 3, 'le-gosier': 4, 'port-louis': 5, 'baie-mahault': 6 },
+  'saint-julien-en-genevois': { 'centre-ville': 0, neydens: 1, archamps: 2, beaumont: 3, 'collonges-sous-saleve': 4, viry: 5, valleiry: 6 },
+  gaillac: { 'centre-ville': 0, brens: 1, lagrave: 2, 'lisle-sur-tarn': 3, 'marssac-sur-tarn': 4, rabastens: 5, 'le-sequestre': 6 },
+  'saint-leu-la-foret': { 'centre-ville': 0, taverny: 1, 'le-plessis-bouchard': 2, 'saint-prix': 3, montlignon: 4, bessancourt: 5, beauchamp: 6 },
+  montbrison: { 'centre-ville': 0, savigneux: 1, champdieu: 2, 'saint-romain-le-puy': 3, 'sury-le-comtal': 4, 'montrond-les-bains': 5, 'saint-cyprien': 6 },
+  vaureal: { 'centre-ville': 0, cergy: 1, 'jouy-le-moutier': 2, courdimanche: 3, 'neuville-sur-oise': 4, menucourt: 5, osny: 6 },
+  'sin-le-noble': { 'centre-ville': 0, dechy: 1, douai: 2, waziers: 3, guesnain: 4, lallaing: 5, 'montigny-en-ostrevent': 6 },
+  domont: { 'centre-ville': 0, bouffemont: 1, andilly: 2, ezanville: 3, montlignon: 4, 'saint-brice-sous-foret': 5, 'baillet-en-france': 6 },
+  'le-pecq': { 'centre-ville': 0, 'le-port-marly': 1, 'le-vesinet': 2, 'mareil-marly': 3, 'croissy-sur-seine': 4, 'marly-le-roi': 5, chatou: 6 },
+  noisiel: { 'centre-ville': 0, 'champs-sur-marne': 1, lognes: 2, torcy: 3, 'vaires-sur-marne': 4, emerainville: 5, 'croissy-beaubourg': 6 },
+  'saint-amand-les-eaux': { 'centre-ville': 0, raismes: 1, hasnon: 2, lecelles: 3, rosult: 4, beuvrages: 5, 'petite-foret': 6 },
+  'amberieu-en-bugey': { 'centre-ville': 0, 'saint-denis-en-bugey': 1, 'chateau-gaillard': 2, 'saint-rambert-en-bugey': 3, ambronay: 4, lagnieu: 5, jujurieux: 6 },
+  'le-bourget': { 'centre-ville': 0, dugny: 1, drancy: 2, 'le-blanc-mesnil': 3, 'la-courneuve': 4, bobigny: 5, stains: 6 },
+  luce: { 'centre-ville': 0, luisant: 1, mainvilliers: 2, 'le-coudray': 3, chartres: 4, leves: 5, champhol: 6 },
+  hennebont: { 'centre-ville': 0, kervignac: 1, caudan: 2, lanester: 3, 'inzinzac-lochrist': 4, merlevenez: 5, cleguer: 6 },
+  'saint-pierre-des-corps': { 'centre-ville': 0, tours: 1, 'la-ville-aux-dames': 2, 'saint-avertin': 3, larcay: 4, rochecorbon: 5, 'chambray-les-tours': 6 },
+  'fos-sur-mer': { 'centre-ville': 0, 'port-saint-louis-du-rhone': 1, 'port-de-bouc': 2, 'saint-mitre-les-remparts': 3, istres: 4, martigues: 5, 'saint-chamas': 6 },
+  dembeni: { 'centre-ville': 0, ouangani: 1, sada: 2, mamoudzou: 3, chiconi: 4, chirongui: 5, tsingoni: 6 },
+  biscarrosse: { 'centre-ville': 0, 'parentis-en-born': 1, sanguinet: 2, ychoux: 3, mimizan: 4 },
+  hayange: { 'centre-ville': 0, nilvange: 1, 'seremange-erzange': 2, knutange: 3, algrange: 4, neufchef: 5, florange: 6 },
+  'port-de-bouc': { 'centre-ville': 0, 'saint-mitre-les-remparts': 1, martigues: 2, 'fos-sur-mer': 3, 'chateauneuf-les-martigues': 4, 'sausset-les-pins': 5, 'port-saint-louis-du-rhone': 6 },
+  'le-francois': { 'centre-ville': 0, 'saint-esprit': 1, 'le-robert': 2, ducos: 3, 'le-vauclin': 4, 'le-lamentin': 5, 'riviere-salee': 6 },
+  toul: { 'centre-ville': 0, 'dommartin-les-toul': 1, ecrouves: 2, gondreville: 3, foug: 4, 'bois-de-haye': 5, liverdun: 6 },
+  'saint-just-saint-rambert': { 'centre-ville': 0, bonson: 1, 'andrezieux-boutheon': 2, 'saint-cyprien': 3, 'la-fouillouse': 4, 'saint-marcellin-en-forez': 5, 'sury-le-comtal': 6 },
+  vendome: { 'centre-ville': 0, 'saint-ouen': 1, naveil: 2, 'montoire-sur-le-loir': 3 },
+  'montrevault-sur-evre': { 'centre-ville': 0, 'beaupreau-en-mauges': 1, 'mauges-sur-loire': 2, 'begrolles-en-mauges': 3, 'oree-d-anjou': 4, 'le-may-sur-evre': 5, 'saint-leger-sous-cholet': 6 },
+  'saint-fargeau-ponthierry': { 'centre-ville': 0, pringy: 1, 'boissise-le-roi': 2, nandy: 3, cesson: 4, 'savigny-le-temple': 5, perthes: 6 },
+  beaucaire: { 'centre-ville': 0, 'jonquieres-saint-vincent': 1, manduel: 2, redessan: 3, bellegarde: 4, fourques: 5, montfrin: 6 },
+  montevrain: { 'centre-ville': 0, 'chanteloup-en-brie': 1, chessy: 2, dampmart: 3, 'lagny-sur-marne': 4, serris: 5, coupvray: 6 },
+  longwy: { 'centre-ville': 0, herserange: 1, rehon: 2, mexy: 3, longlaville: 4, 'mont-saint-martin': 5, lexy: 6 },
+  francheville: { 'centre-ville': 0, craponne: 1, 'tassin-la-demi-lune': 2, 'sainte-foy-les-lyon': 3, chaponost: 4, 'saint-genis-les-ollieres': 5, brindas: 6 },
+  fontainebleau: { 'centre-ville': 0, avon: 1, 'bois-le-roi': 2, 'samois-sur-seine': 3, samoreau: 4, 'vulaines-sur-seine': 5, thomery: 6 },
+  'le-vesinet': { 'centre-ville': 0, 'croissy-sur-seine': 1, chatou: 2, 'le-port-marly': 3, 'le-pecq': 4, montesson: 5, bougival: 6 },
+  wittenheim: { 'centre-ville': 0, kingersheim: 1, ruelisheim: 2, pulversheim: 3, richwiller: 4, staffelfelden: 5, wittelsheim: 6 },
+  guipavas: { 'centre-ville': 0, 'le-relecq-kerhuon': 1, gouesnou: 2, 'la-forest-landerneau': 3, 'plougastel-daoulas': 4, brest: 5, plabennec: 6 },
+  wattignies: { 'centre-ville': 0, templemars: 1, emmerin: 2, 'faches-thumesnil': 3, loos: 4, 'houplin-ancoisne': 5, haubourdin: 6 },
+  montivilliers: { 'centre-ville': 0, harfleur: 1, epouville: 2, 'fontaine-la-mallet': 3, 'octeville-sur-mer': 4, gainneville: 5, 'gonfreville-l-orcher': 6 },
+  elbeuf: { 'centre-ville': 0, 'caudebec-les-elbeuf': 1, 'saint-aubin-les-elbeuf': 2, 'saint-pierre-les-elbeuf': 3, cleon: 4, 'la-londe': 5, 'grand-couronne': 6 },
+  'roquebrune-sur-argens': { 'centre-ville': 0, 'puget-sur-argens': 1, 'le-muy': 2, 'sainte-maxime': 3, frejus: 4, 'la-motte': 5, 'bagnols-en-foret': 6 },
+  tarascon: { 'centre-ville': 0, 'saint-etienne-du-gres': 1, fontvieille: 2, maillane: 3, graveson: 4, barbentane: 5, paradou: 6 },
+  'bouc-bel-air': { 'centre-ville': 0, 'simiane-collongue': 1, cabries: 2, 'septemes-les-vallons': 3, gardanne: 4, mimet: 5, meyreuil: 6 },
+  'castanet-tolosan': { 'centre-ville': 0, pechabou: 1, pompertuzat: 2, 'auzeville-tolosane': 3, labege: 4, escalquens: 5, 'ramonville-saint-agne': 6 },
+  avrille: { 'centre-ville': 0, angers: 1, beaucouze: 2, 'montreuil-juigne': 3, 'cantenay-epinard': 4, ecouflant: 5, 'saint-lambert-la-potherie': 6 },
+  'rive-de-gier': { 'centre-ville': 0, lorette: 1, genilac: 2, 'saint-martin-la-plaine': 3, 'la-grand-croix': 4, 'saint-paul-en-jarez': 5, 'l-horme': 6 },
+  morlaix: { 'centre-ville': 0, 'saint-martin-des-champs': 1, taule: 2, plouigneau: 3, 'plourin-les-morlaix': 4, plougasnou: 5, lanmeur: 6 },
+  'ramonville-saint-agne': { 'centre-ville': 0, 'auzeville-tolosane': 1, labege: 2, 'castanet-tolosan': 3, 'saint-orens-de-gameville': 4, pechabou: 5, 'quint-fonsegrives': 6 },
+  senlis: { 'centre-ville': 0, 'verneuil-en-halatte': 1, chantilly: 2, creil: 3, 'saint-maximin': 4, 'orry-la-ville': 5, pontpoint: 6 },
+  issoire: { 'centre-ville': 0, 'saint-germain-lembron': 1, 'vic-le-comte': 2, 'brassac-les-mines': 3, 'veyre-monton': 4, mirefleurs: 5, 'les-martres-de-veyre': 6 },
+  montmagny: { 'centre-ville': 0, 'deuil-la-barre': 1, groslay: 2, 'enghien-les-bains': 3, montmorency: 4, sarcelles: 5, 'saint-brice-sous-foret': 6 },
+  'chateau-thierry': { 'centre-ville': 0, 'essomes-sur-marne': 1, 'charly-sur-marne': 2, 'nogent-l-artaud': 3, 'fere-en-tardenois': 4, 'la-ferte-milon': 5 },
+  vesoul: { 'centre-ville': 0, 'vaivre-et-montoille': 1, 'echenoz-la-meline': 2, 'port-sur-saone': 3, rioz: 4 },
+  haubourdin: { 'centre-ville': 0, emmerin: 1, loos: 2, santes: 3, sequedin: 4, 'hallennes-lez-haubourdin': 5, 'houplin-ancoisne': 6 },
+  lognes: { 'centre-ville': 0, noisiel: 1, 'croissy-beaubourg': 2, torcy: 3, emerainville: 4, collegien: 5, 'champs-sur-marne': 6 },
+  'saint-brice-sous-foret': { 'centre-ville': 0, groslay: 1, montmorency: 2, sarcelles: 3, domont: 4, andilly: 5, 'soisy-sous-montmorency': 6 },
+  'verrieres-le-buisson': { 'centre-ville': 0, igny: 1, massy: 2, bievres: 3, palaiseau: 4, champlan: 5, wissous: 6 },
+  'pointe-a-pitre': { 'centre-ville': 0, 'les-abymes': 1, 'baie-mahault': 2, 'le-gosier': 3, 'morne-a-l-eau': 4, lamentin: 5, 'petit-bourg': 6 },
+  arnouville: { 'centre-ville': 0, 'garges-les-gonesse': 1, sarcelles: 2, 'villiers-le-bel': 3, gonesse: 4, 'le-thillay': 5, groslay: 6 },
+  'saint-avertin': { 'centre-ville': 0, 'chambray-les-tours': 1, larcay: 2, 'saint-pierre-des-corps': 3, 'la-ville-aux-dames': 4, tours: 5, veretz: 6 },
+  woippy: { 'centre-ville': 0, plappeville: 1, 'le-ban-saint-martin': 2, 'maizieres-les-metz': 3, 'saint-julien-les-metz': 4, 'longeville-les-metz': 5, 'scy-chazelles': 6 },
+  'romilly-sur-seine': { 'centre-ville': 0, 'villenauxe-la-grande': 1, 'nogent-sur-seine': 2 },
+  'la-fleche': { 'centre-ville': 0, 'le-lude': 1, 'cerans-foulletourte': 2, 'noyen-sur-sarthe': 3, precigne: 4, 'la-suze-sur-sarthe': 5, 'aubigne-racan': 6 },
+  illzach: { 'centre-ville': 0, sausheim: 1, mulhouse: 2, baldersheim: 3, kingersheim: 4, riedisheim: 5, rixheim: 6 },
+  'saint-jean-de-luz': { 'centre-ville': 0, ciboure: 1, ahetze: 2, ascain: 3, bidart: 4, arbonne: 5, urrugne: 6 },
+  montargis: { 'centre-ville': 0, 'chalette-sur-loing': 1, amilly: 2, villemandeur: 3, pannes: 4, corquilleroy: 5, cepoy: 6 },
+  'carrieres-sur-seine': { 'centre-ville': 0, houilles: 1, sartrouville: 2, chatou: 3, montesson: 4, 'le-vesinet': 5, 'le-mesnil-le-roi': 6 },
+  fameck: { 'centre-ville': 0, 'vitry-sur-orne': 1, 'seremange-erzange': 2, uckange: 3, gandrange: 4, florange: 5, clouange: 6 },
+  laxou: { 'centre-ville': 0, 'villers-les-nancy': 1, maxeville: 2, champigneulles: 3, 'vand-uvre-les-nancy': 4, nancy: 5, chaligny: 6 },
+  dinan: { 'centre-ville': 0, quevert: 1, lanvallay: 2, trelivan: 3, taden: 4, 'pleslin-trigavou': 5, 'plouer-sur-rance': 6 },
+  'saint-avold': { 'centre-ville': 0, 'l-hopital': 1, 'longeville-les-saint-avold': 2, carling: 3, 'hombourg-haut': 4, porcelette: 5, valmont: 6 },
+  'le-raincy': { 'centre-ville': 0, villemomble: 1, 'les-pavillons-sous-bois': 2, 'clichy-sous-bois': 3, gagny: 4, bondy: 5, 'livry-gargan': 6 },
+  'saint-gilles': { 'centre-ville': 0, generac: 1, beauvoisin: 2, vauvert: 3, bellegarde: 4, fourques: 5, garons: 6 },
+  bailleul: { 'centre-ville': 0, meteren: 1, steenwerck: 2, nieppe: 3, boeschepe: 4, estaires: 5, 'vieux-berquin': 6 },
+  'villers-les-nancy': { 'centre-ville': 0, 'vand-uvre-les-nancy': 1, laxou: 2, chaligny: 3, houdemont: 4, nancy: 5, 'neuves-maisons': 6 },
+  'saint-orens-de-gameville': { 'centre-ville': 0, labege: 1, 'quint-fonsegrives': 2, escalquens: 3, 'auzeville-tolosane': 4, 'ramonville-saint-agne': 5, flourens: 6 },
+  pontivy: { 'centre-ville': 0, 'le-sourn': 1, 'noyal-pontivy': 2, cleguerec: 3, 'plumeliau-bieuzy': 4, evellys: 5, bubry: 6 },
+  mahina: { 'centre-ville': 0, pirae: 1, papeete: 2, faaa: 3, 'hitiaa-o-te-ra': 4, punaauia: 5, paea: 6 },
+  'bar-le-duc': { 'centre-ville': 0, 'fains-veel': 1, 'ligny-en-barrois': 2, 'revigny-sur-ornain': 3, ancerville: 4 },
+  ollioules: { 'centre-ville': 0, 'sanary-sur-mer': 1, evenos: 2, 'la-seyne-sur-mer': 3, toulon: 4, 'six-fours-les-plages': 5, 'le-beausset': 6 },
+  montesson: { 'centre-ville': 0, 'le-mesnil-le-roi': 1, chatou: 2, 'saint-germain-en-laye': 3, 'le-vesinet': 4, 'carrieres-sur-seine': 5, sartrouville: 6 },
+  'saint-brevin-les-pins': { 'centre-ville': 0, corsept: 1, 'saint-pere-en-retz': 2, 'saint-nazaire': 3, trignac: 4, 'saint-michel-chef-chef': 5, 'montoir-de-bretagne': 6 },
+  'bois-guillaume': { 'centre-ville': 0, bihorel: 1, 'mont-saint-aignan': 2, darnetal: 3, isneauville: 4, houppeville: 5, rouen: 6 },
+  'saint-maurice': { 'centre-ville': 0, 'maisons-alfort': 1, 'joinville-le-pont': 2, 'charenton-le-pont': 3, alfortville: 4, 'saint-mande': 5, vincennes: 6 },
+  'saint-paul-les-dax': { 'centre-ville': 0, mees: 1, dax: 2, magescq: 3, 'saint-vincent-de-paul': 4, narrosse: 5, 'saint-geours-de-maremne': 6 },
+  'l-etang-sale': { 'centre-ville': 0, 'les-avirons': 1, 'saint-leu': 2, 'saint-louis': 3, 'les-trois-bassins': 4, 'entre-deux': 5, cilaos: 6 },
+  'saint-genis-pouilly': { 'centre-ville': 0, 'prevessin-moens': 1, chevry: 2, sergy: 3, ornex: 4, segny: 5, crozet: 6 },
+  flers: {
+    'centre-ville': 0,
+    'saint-georges-des-groseillers': 1,
+    'athis-val-de-rouvre': 2,
+    'tinchebray-bocage': 3,
+    'domfront-en-poiraie': 4,
+    'putanges-le-lac': 5,
+    'bagnoles-de-l-orne-normandie': 6,
+  },
+  plerin: { 'centre-ville': 0, pordic: 1, 'saint-brieuc': 2, tremuson: 3, ploufragan: 4, langueux: 5, tregueux: 6 },
+  valenton: { 'centre-ville': 0, 'villeneuve-saint-georges': 1, 'limeil-brevannes': 2, 'choisy-le-roi': 3, 'bonneuil-sur-marne': 4, creteil: 5, 'ablon-sur-seine': 6 },
+  canteleu: { 'centre-ville': 0, 'le-grand-quevilly': 1, 'le-petit-quevilly': 2, 'deville-les-rouen': 3, maromme: 4, rouen: 5, 'petit-couronne': 6 },
+  billere: { 'centre-ville': 0, lons: 1, jurancon: 2, pau: 3, lescar: 4, bizanos: 5, gelos: 6 },
+  'saint-omer': { 'centre-ville': 0, longuenesse: 1, 'saint-martin-lez-tatinghem': 2, arques: 3, blendecques: 4, wizernes: 5, eperlecques: 6 },
+  rixheim: { 'centre-ville': 0, habsheim: 1, riedisheim: 2, sausheim: 3, illzach: 4, baldersheim: 5, mulhouse: 6 },
+  persan: { 'centre-ville': 0, 'beaumont-sur-oise': 1, 'champagne-sur-oise': 2, 'bernes-sur-oise': 3, presles: 4, 'l-isle-adam': 5, 'bruyeres-sur-oise': 6 },
+  'crepy-en-valois': { 'centre-ville': 0, 'bethisy-saint-pierre': 1, 'nanteuil-le-haudouin': 2, verberie: 3, 'lacroix-saint-ouen': 4, 'le-meux': 5, 'le-plessis-belleville': 6 },
+  castelsarrasin: { 'centre-ville': 0, 'saint-nicolas-de-la-grave': 1, moissac: 2, 'la-ville-dieu-du-temple': 3, montbeton: 4, lafrancaise: 5, montech: 6 },
+  montataire: { 'centre-ville': 0, 'nogent-sur-oise': 1, laigneville: 2, creil: 3, 'saint-maximin': 4, 'saint-leu-d-esserent': 5, 'monchy-saint-eloi': 6 },
+  chenove: { 'centre-ville': 0, 'marsannay-la-cote': 1, 'perrigny-les-dijon': 2, longvic: 3, dijon: 4, talant: 5, 'plombieres-les-dijon': 6 },
+  auray: { 'centre-ville': 0, pluneret: 1, crach: 2, 'sainte-anne-d-auray': 3, brech: 4, 'le-bono': 5, ploemel: 6 },
+  'pont-a-mousson': { 'centre-ville': 0, 'blenod-les-pont-a-mousson': 1, 'pagny-sur-moselle': 2, dieulouard: 3, custines: 4, pompey: 5, liverdun: 6 },
+  hautmont: { 'centre-ville': 0, louvroil: 1, feignies: 2, maubeuge: 3, 'ferriere-la-grande': 4, 'pont-sur-sambre': 5, bachant: 6 },
+  'saint-martin-de-crau': { 'centre-ville': 0, istres: 1, mouries: 2, miramas: 3, 'maussane-les-alpilles': 4, paradou: 5, grans: 6 },
+  morangis: { 'centre-ville': 0, 'chilly-mazarin': 1, 'savigny-sur-orge': 2, longjumeau: 3, 'paray-vieille-poste': 4, 'juvisy-sur-orge': 5, wissous: 6 },
+  'sainte-maxime': { 'centre-ville': 0, 'le-plan-de-la-tour': 1, 'roquebrune-sur-argens': 2, 'saint-tropez': 3, grimaud: 4, 'le-muy': 5, gassin: 6 },
+  roncq: { 'centre-ville': 0, linselles: 1, bousbecque: 2, 'neuville-en-ferrain': 3, halluin: 4, tourcoing: 5, bondues: 6 },
+  audincourt: { 'centre-ville': 0, valentigney: 1, seloncourt: 2, exincourt: 3, etupes: 4, sochaux: 5, voujeaucourt: 6 },
+  douarnenez: { 'centre-ville': 0, plogonnec: 1, ploneis: 2, 'plogastel-saint-germain': 3, plozevet: 4, pouldreuzic: 5, plouhinec: 6 },
+  pirae: { 'centre-ville': 0, papeete: 1, faaa: 2, mahina: 3, punaauia: 4, 'hitiaa-o-te-ra': 5, paea: 6 },
+  'fontenay-le-comte': { 'centre-ville': 0, 'rives-d-autise': 1, benet: 2, nalliers: 3, 'la-chataigneraie': 4, terval: 5, 'sainte-gemme-la-plaine': 6 },
+  juvignac: { 'centre-ville': 0, 'saint-georges-d-orques': 1, grabels: 2, laverune: 3, 'murviel-les-montpellier': 4, saussan: 5, pignan: 6 },
+  'lys-lez-lannoy': { 'centre-ville': 0, leers: 1, toufflers: 2, hem: 3, roubaix: 4, wattrelos: 5, croix: 6 },
+  bollene: { 'centre-ville': 0, mondragon: 1, lapalud: 2, mornas: 3, piolenc: 4, 'sainte-cecile-les-vignes': 5, 'serignan-du-comtat': 6 },
+  lieusaint: { 'centre-ville': 0, 'moissy-cramayel': 1, 'combs-la-ville': 2, nandy: 3, 'savigny-le-temple': 4, reau: 5, cesson: 6 },
+  'belleville-en-beaujolais': { 'centre-ville': 0, 'saint-georges-de-reneins': 1, 'villie-morgon': 2, 'saint-etienne-des-oullieres': 3, arnas: 4, beaujeu: 5, gleize: 6 },
+  bandraboua: { 'centre-ville': 0, 'm-tsangamouji': 1, acoua: 2, tsingoni: 3, koungou: 4, mtsamboro: 5, mamoudzou: 6 },
+  ostwald: { 'centre-ville': 0, lingolsheim: 1, 'illkirch-graffenstaden': 2, eckbolsheim: 3, strasbourg: 4, holtzheim: 5, geispolsheim: 6 },
+  'saint-francois': { 'centre-ville': 0, 'le-moule': 1, 'sainte-anne': 2, 'le-gosier': 3, 'petit-canal': 4 },
+  tsingoni: { 'centre-ville': 0, chiconi: 1, 'm-tsangamouji': 2, ouangani: 3, mamoudzou: 4, bandraboua: 5, koungou: 6 },
+  'vaires-sur-marne': { 'centre-ville': 0, 'brou-sur-chantereine': 1, torcy: 2, noisiel: 3, chelles: 4, 'saint-thibault-des-vignes': 5, pomponne: 6 },
+  meru: { 'centre-ville': 0, andeville: 1, bornel: 2, 'sainte-genevieve': 3, noailles: 4, 'neuilly-en-thelle': 5, chambly: 6 },
+  thouars: { 'centre-ville': 0, 'loretz-d-argenton': 1, 'saint-varent': 2, 'val-en-vignes': 3, argentonnay: 4, 'plaine-et-vallees': 5, airvault: 6 },
+  mions: { 'centre-ville': 0, toussieu: 1, corbas: 2, chaponnay: 3, 'saint-priest': 4, 'saint-pierre-de-chandieu': 5, venissieux: 6 },
+  andresy: { 'centre-ville': 0, 'chanteloup-les-vignes': 1, maurecourt: 2, 'triel-sur-seine': 3, 'carrieres-sous-poissy': 4, acheres: 5, 'conflans-sainte-honorine': 6 },
+  caudry: { 'centre-ville': 0, bertry: 1, 'walincourt-selvigny': 2, 'avesnes-les-aubert': 3, 'le-cateau-cambresis': 4, solesmes: 5, busigny: 6 },
+  'berre-l-etang': { 'centre-ville': 0, rognac: 1, 'la-fare-les-oliviers': 2, velaux: 3, 'lancon-provence': 4, 'saint-chamas': 5, marignane: 6 },
+  carros: { 'centre-ville': 0, gattieres: 1, 'saint-jeannet': 2, 'saint-martin-du-var': 3, colomars: 4, aspremont: 5, 'la-gaude': 6 },
+  'saint-jacques-de-la-lande': { 'centre-ville': 0, 'chartres-de-bretagne': 1, 'vezin-le-coquet': 2, rennes: 3, 'le-rheu': 4, chavagne: 5, 'noyal-chatillon-sur-seiche': 6 },
+  pierrelatte: { 'centre-ville': 0, 'saint-paul-trois-chateaux': 1, donzere: 2, malataverne: 3, 'suze-la-rousse': 4, 'chateauneuf-du-rhone': 5, montelimar: 6 },
+  'fleury-merogis': { 'centre-ville': 0, bondoufle: 1, 'morsang-sur-orge': 2, grigny: 3, 'ris-orangis': 4, 'sainte-genevieve-des-bois': 5, 'viry-chatillon': 6 },
+  'fontenay-le-fleury': { 'centre-ville': 0, 'saint-cyr-l-ecole': 1, 'bois-d-arcy': 2, villepreux: 3, bailly: 4, 'noisy-le-roi': 5, 'montigny-le-bretonneux': 6 },
+  avon: { 'centre-ville': 0, thomery: 1, samoreau: 2, 'vulaines-sur-seine': 3, fontainebleau: 4, 'samois-sur-seine': 5, hericy: 6 },
+  gex: { 'centre-ville': 0, echenevex: 1, cessy: 2, 'divonne-les-bains': 3, segny: 4, versonnex: 5, chevry: 6 },
+  lons: { 'centre-ville': 0, billere: 1, lescar: 2, pau: 3, artiguelouve: 4, jurancon: 5, montardon: 6 },
+  'taiarapu-est': { 'centre-ville': 0, 'taiarapu-ouest': 1 },
+  amilly: { 'centre-ville': 0, montargis: 1, 'chalette-sur-loing': 2, villemandeur: 3, cepoy: 4, pannes: 5, corquilleroy: 6 },
+  plouzane: { 'centre-ville': 0, 'locmaria-plouzane': 1, guilers: 2, 'saint-renan': 3, brest: 4, bohars: 5, ploumoguer: 6 },
+  argentan: { 'centre-ville': 0, 'ecouche-les-vallees': 1, 'gouffern-en-auge': 2, sees: 3, 'putanges-le-lac': 4 },
+  gien: { 'centre-ville': 0, 'poilly-lez-gien': 1, briare: 2, 'nogent-sur-vernisson': 3, coullons: 4, 'ouzouer-sur-loire': 5, 'chatillon-sur-loire': 6 },
+  'plougastel-daoulas': { 'centre-ville': 0, 'le-relecq-kerhuon': 1, loperhet: 2, guipavas: 3, 'logonna-daoulas': 4, brest: 5, 'la-forest-landerneau': 6 },
+  genas: { 'centre-ville': 0, 'saint-bonnet-de-mure': 1, chassieu: 2, pusignan: 3, meyzieu: 4, 'saint-laurent-de-mure': 5, 'saint-priest': 6 },
+  moissac: { 'centre-ville': 0, castelsarrasin: 1, 'saint-nicolas-de-la-grave': 2, lafrancaise: 3, 'la-ville-dieu-du-temple': 4, valence: 5, montbeton: 6 },
+  tulle: { 'centre-ville': 0, naves: 1, 'sainte-fereole': 2, malemort: 3, donzenac: 4, cosnac: 5, 'argentat-sur-dordogne': 6 },
+  mouvaux: { 'centre-ville': 0, tourcoing: 1, bondues: 2, croix: 3, wasquehal: 4, roubaix: 5, 'marcq-en-bar-ul': 6 },
+  kingersheim: { 'centre-ville': 0, richwiller: 1, wittenheim: 2, pfastatt: 3, illzach: 4, mulhouse: 5, ruelisheim: 6 },
+  'claye-souilly': { 'centre-ville': 0, 'annet-sur-marne': 1, villevaude: 2, villeparisis: 3, 'thorigny-sur-marne': 4, pomponne: 5, courtry: 6 },
+  bonneville: { 'centre-ville': 0, ayse: 1, 'saint-pierre-en-faucigny': 2, arenthon: 3, amancy: 4, marignier: 5, 'contamine-sur-arve': 6 },
+  'saint-jean-de-vedas': { 'centre-ville': 0, laverune: 1, saussan: 2, montpellier: 3, lattes: 4, juvignac: 5, fabregues: 6 },
+  cusset: { 'centre-ville': 0, vichy: 1, 'creuzier-le-vieux': 2, abrest: 3, 'bellerive-sur-allier': 4, 'saint-germain-des-fosses': 5, 'saint-yorre': 6 },
+  monteux: { 'centre-ville': 0, 'althen-des-paluds': 1, 'loriol-du-comtat': 2, 'pernes-les-fontaines': 3, 'entraigues-sur-la-sorgue': 4, carpentras: 5, bedarrides: 6 },
+  cuers: { 'centre-ville': 0, belgentier: 1, 'sollies-pont': 2, neoules: 3, rocbaron: 4, 'sollies-toucas': 5, 'meounes-les-montrieux': 6 },
+  'freyming-merlebach': { 'centre-ville': 0, 'hombourg-haut': 1, cocheren: 2, 'l-hopital': 3, morsbach: 4, carling: 5, farebersviller: 6 },
+  lourdes: { 'centre-ville': 0, ossun: 1, 'argeles-gazost': 2, juillan: 3, odos: 4, ibos: 5, soues: 6 },
+  seclin: { 'centre-ville': 0, gondecourt: 1, 'houplin-ancoisne': 2, templemars: 3, phalempin: 4, avelin: 5, wattignies: 6 },
+  'val-de-reuil': { 'centre-ville': 0, 'le-vaudreuil': 1, 'pont-de-l-arche': 2, louviers: 3, pitres: 4, 'romilly-sur-andelle': 5, 'le-val-d-hazey': 6 },
+  'saint-andre-lez-lille': { 'centre-ville': 0, lambersart: 1, 'marquette-lez-lille': 2, 'la-madeleine': 3, lille: 4, lompret: 5, verlinghem: 6 },
+  'canet-en-roussillon': { 'centre-ville': 0, 'saint-nazaire': 1, cabestany: 2, alenya: 3, 'sainte-marie-la-mer': 4, saleilles: 5, 'villelongue-de-la-salanque': 6 },
+  anzin: { 'centre-ville': 0, beuvrages: 1, valenciennes: 2, 'petite-foret': 3, 'bruay-sur-l-escaut': 4, 'la-sentinelle': 5, 'saint-saulve': 6 },
+  autun: { 'centre-ville': 0, epinac: 1, 'le-creusot': 2, 'le-breuil': 3, torcy: 4 },
+  'les-ponts-de-ce': { 'centre-ville': 0, trelaze: 1, 'sainte-gemmes-sur-loire': 2, 'murs-erigne': 3, 'saint-melaine-sur-aubance': 4, 'les-garennes-sur-loire': 5, 'saint-barthelemy-d-anjou': 6 },
+  'villeneuve-les-avignon': { 'centre-ville': 0, pujaut: 1, sauveterre: 2, 'les-angles': 3, roquemaure: 4, saze: 5, 'rochefort-du-gard': 6 },
+  outreau: { 'centre-ville': 0, 'saint-leonard': 1, 'equihen-plage': 2, 'le-portel': 3, 'saint-etienne-au-mont': 4, 'boulogne-sur-mer': 5, 'saint-martin-boulogne': 6 },
+  graulhet: { 'centre-ville': 0, 'labastide-saint-georges': 1, lagrave: 2, brens: 3, realmont: 4, lavaur: 5, 'marssac-sur-tarn': 6 },
+  'saint-hilaire-de-riez': { 'centre-ville': 0, 'notre-dame-de-riez': 1, 'le-fenouiller': 2, 'le-perrier': 3, soullans: 4, 'saint-gilles-croix-de-vie': 5, 'saint-jean-de-monts': 6 },
+  'petite-ile': { 'centre-ville': 0, 'saint-pierre': 1, 'saint-joseph': 2, 'le-tampon': 3, 'entre-deux': 4, 'saint-philippe': 5, 'saint-louis': 6 },
+  tergnier: { 'centre-ville': 0, beautor: 1, 'la-fere': 2, chauny: 3, sinceny: 4, 'saint-gobain': 5, gauchy: 6 },
+  auriol: { 'centre-ville': 0, 'la-bouilladisse': 1, roquevaire: 2, 'la-destrousse': 3, gemenos: 4, peypin: 5, belcodene: 6 },
+  'bras-panon': { 'centre-ville': 0, 'saint-benoit': 1, 'saint-andre': 2, 'sainte-suzanne': 3, salazie: 4, 'la-plaine-des-palmistes': 5, 'sainte-marie': 6 },
+  noyon: { 'centre-ville': 0, 'ribecourt-dreslincourt': 1, thourotte: 2, 'longueil-annel': 3, 'choisy-au-bac': 4, clairoix: 5, 'trosly-breuil': 6 },
+  betton: { 'centre-ville': 0, 'saint-gregoire': 1, chevaigne: 2, melesse: 3, 'thorigne-fouillard': 4, montgermont: 5, 'la-chapelle-des-fougeretz': 6 },
+  tarnos: { 'centre-ville': 0, ondres: 1, 'saint-martin-de-seignanx': 2, labenne: 3, capbreton: 4, 'benesse-maremne': 5, 'soorts-hossegor': 6 },
+  gueret: { 'centre-ville': 0, 'sainte-feyre': 1 },
+  fonsorbes: { 'centre-ville': 0, fontenilles: 1, 'saint-lys': 2, 'plaisance-du-touch': 3, seysses: 4, 'la-salvetat-saint-gilles': 5, frouzins: 6 },
+  berck: { 'centre-ville': 0, 'rang-du-fliers': 1, merlimont: 2, verton: 3, cucq: 4, 'le-touquet-paris-plage': 5, etaples: 6 },
+  amboise: { 'centre-ville': 0, 'la-croix-en-touraine': 1, 'nazelles-negron': 2, 'saint-martin-le-beau': 3, blere: 4, 'montlouis-sur-loire': 5, 'athee-sur-cher': 6 },
+  yzeure: { 'centre-ville': 0, moulins: 1, avermes: 2, 'dompierre-sur-besbre': 3 },
+  nemours: {
+    'centre-ville': 0,
+    'saint-pierre-les-nemours': 1,
+    'bourron-marlotte': 2,
+    'souppes-sur-loing': 3,
+    'montigny-sur-loing': 4,
+    'la-chapelle-la-reine': 5,
+    'moret-loing-et-orvanne': 6,
+  },
+  mayenne: { 'centre-ville': 0, 'ambrieres-les-vallees': 1, montsurs: 2, 'lassay-les-chateaux': 3, gorron: 4, andouille: 5, louverne: 6 },
+  chateaudun: { 'centre-ville': 0, 'saint-denis-lanneray': 1, 'cloyes-les-trois-rivieres': 2, bonneval: 3, 'vald-yerre': 4, brou: 5 },
+  'moret-loing-et-orvanne': { 'centre-ville': 0, 'saint-mammes': 1, 'montigny-sur-loing': 2, 'champagne-sur-seine': 3, 'vernou-la-celle-sur-seine': 4, thomery: 5, 'la-grande-paroisse': 6 },
+  'saint-andre-les-vergers': { 'centre-ville': 0, 'rosieres-pres-troyes': 1, 'la-riviere-de-corps': 2, troyes: 3, 'sainte-savine': 4, 'les-noes-pres-troyes': 5, 'saint-germain': 6 },
+  pornichet: { 'centre-ville': 0, 'la-baule-escoublac': 1, 'saint-nazaire': 2, 'saint-andre-des-eaux': 3, 'le-pouliguen': 4, trignac: 5, guerande: 6 },
+  paea: { 'centre-ville': 0, papara: 1, punaauia: 2, faaa: 3, pirae: 4, papeete: 5, 'teva-i-uta': 6 },
+  comines: { 'centre-ville': 0, 'wervicq-sud': 1, 'quesnoy-sur-deule': 2, linselles: 3, bousbecque: 4, wambrechies: 5, frelinghien: 6 },
+  aubergenville: { 'centre-ville': 0, 'flins-sur-seine': 1, epone: 2, bouafle: 3, juziers: 4, gargenville: 5, 'mezieres-sur-seine': 6 },
+  'chambray-les-tours': { 'centre-ville': 0, 'saint-avertin': 1, larcay: 2, 'joue-les-tours': 3, veigne: 4, montbazon: 5, 'saint-pierre-des-corps': 6 },
+  'andernos-les-bains': { 'centre-ville': 0, ares: 1, 'lege-cap-ferret': 2, lanton: 3, audenge: 4, 'le-porge': 5, arcachon: 6 },
+  'chalette-sur-loing': { 'centre-ville': 0, montargis: 1, cepoy: 2, corquilleroy: 3, amilly: 4, pannes: 5, villemandeur: 6 },
+  meze: { 'centre-ville': 0, loupian: 1, pinet: 2, pomerols: 3, villeveyrac: 4, sete: 5, montagnac: 6 },
+  bayeux: { 'centre-ville': 0, 'saint-vigor-le-grand': 1, 'creully-sur-seulles': 2, 'le-molay-littry': 3, 'thue-et-mue': 4, rots: 5, 'saint-manvieu-norrey': 6 },
+  'la-chapelle-saint-luc': { 'centre-ville': 0, 'les-noes-pres-troyes': 1, 'sainte-savine': 2, troyes: 3, 'la-riviere-de-corps': 4, 'saint-andre-les-vergers': 5, 'pont-sainte-marie': 6 },
+  'l-union': { 'centre-ville': 0, 'saint-jean': 1, launaguet: 2, 'saint-genies-bellevue': 3, 'rouffiac-tolosan': 4, montrabe: 5, balma: 6 },
+  'saint-andre-de-cubzac': { 'centre-ville': 0, 'cubzac-les-ponts': 1, 'la-lande-de-fronsac': 2, 'val-de-virvee': 3, peujard: 4, 'ambares-et-lagrave': 5, 'saint-loubes': 6 },
+  'marquette-lez-lille': { 'centre-ville': 0, 'saint-andre-lez-lille': 1, 'la-madeleine': 2, wambrechies: 3, lambersart: 4, 'marcq-en-bar-ul': 5, verlinghem: 6 },
+  vidauban: { 'centre-ville': 0, 'les-arcs': 1, 'le-cannet-des-maures': 2, 'le-plan-de-la-tour': 3, 'trans-en-provence': 4, lorgues: 5, 'le-muy': 6 },
+  obernai: { 'centre-ville': 0, bischoffsheim: 1, rosheim: 2, 'griesheim-pres-molsheim': 3, dorlisheim: 4, barr: 5, 'b-rsch': 6 },
+  rognac: { 'centre-ville': 0, velaux: 1, 'berre-l-etang': 2, vitrolles: 3, 'la-fare-les-oliviers': 4, coudoux: 5, ventabren: 6 },
+  louvres: { 'centre-ville': 0, 'puiseux-en-france': 1, goussainville: 2, 'fontenay-en-parisis': 3, 'marly-la-ville': 4, 'roissy-en-france': 5, 'le-thillay': 6 },
+  villetaneuse: { 'centre-ville': 0, 'epinay-sur-seine': 1, 'l-ile-saint-denis': 2, 'saint-denis': 3, stains: 4, 'la-courneuve': 5, 'saint-ouen-sur-seine': 6 },
+  'sollies-pont': { 'centre-ville': 0, 'la-crau': 1, 'la-farlede': 2, 'sollies-ville': 3, cuers: 4, 'sollies-toucas': 5, 'la-valette-du-var': 6 },
+  granville: { 'centre-ville': 0, 'donville-les-bains': 1, brehal: 2, 'saint-pair-sur-mer': 3, jullouville: 4, 'agon-coutainville': 5 },
+  brignais: { 'centre-ville': 0, vourles: 1, orlienas: 2, charly: 3, 'saint-genis-laval': 4, chaponost: 5, irigny: 6 },
+  'l-isle-adam': { 'centre-ville': 0, parmain: 1, meriel: 2, presles: 3, 'champagne-sur-oise': 4, 'butry-sur-oise': 5, persan: 6 },
+  'saint-ave': { 'centre-ville': 0, meucon: 1, monterblanc: 2, vannes: 3, 'saint-nolff': 4, plescop: 5, locqueltas: 6 },
+  quimperle: { 'centre-ville': 0, mellac: 1, redene: 2, tremeven: 3, 'clohars-carnoet': 4, 'moelan-sur-mer': 5, 'riec-sur-belon': 6 },
+  mende: { 'centre-ville': 0, marvejols: 1, 'bourgs-sur-colagne': 2, 'la-canourgue': 3, 'peyre-en-aubrac': 4 },
+  aubenas: { 'centre-ville': 0, 'saint-etienne-de-fontbellon': 1, ucel: 2, lavilledieu: 3, vesseaux: 4, 'vals-les-bains': 5, 'villeneuve-de-berg': 6 },
+  'pont-du-chateau': { 'centre-ville': 0, 'mur-sur-allier': 1, 'les-martres-d-artiere': 2, lempdes: 3, vertaizon: 4, aulnat: 5, gerzat: 6 },
+  gisors: { 'centre-ville': 0, etrepagny: 1, 'vexin-sur-epte': 2, gasny: 3 },
+  'pont-sainte-maxence': { 'centre-ville': 0, pontpoint: 1, brenouille: 2, chevrieres: 3, 'verneuil-en-halatte': 4, verberie: 5, 'villers-saint-paul': 6 },
+  guidel: { 'centre-ville': 0, gestel: 1, queven: 2, 'pont-scorff': 3, ploemeur: 4, lorient: 5, 'larmor-plage': 6 },
+  'sable-sur-sarthe': { 'centre-ville': 0, precigne: 1, 'noyen-sur-sarthe': 2, loue: 3 },
+  oissel: { 'centre-ville': 0, 'tourville-la-riviere': 1, cleon: 2, 'saint-etienne-du-rouvray': 3, 'grand-couronne': 4, 'petit-couronne': 5, 'saint-aubin-les-elbeuf': 6 },
+  'le-chambon-feugerolles': { 'centre-ville': 0, 'la-ricamarie': 1, firminy: 2, 'roche-la-moliere': 3, 'saint-etienne': 4, unieux: 5, fraisses: 6 },
+  vernouillet: { 'centre-ville': 0, dreux: 1, 'saint-remy-sur-avre': 2, abondant: 3, 'saint-lubin-des-joncherets': 4, 'tremblay-les-villages': 5, bu: 6 },
+  cogolin: { 'centre-ville': 0, gassin: 1, grimaud: 2, 'cavalaire-sur-mer': 3, 'la-croix-valmer': 4, 'le-plan-de-la-tour': 5, 'saint-tropez': 6 },
+  chateaubriant: { 'centre-ville': 0, rouge: 1, erbray: 2, abbaretz: 3, derval: 4, nozay: 5, riaille: 6 },
+  creutzwald: { 'centre-ville': 0, falck: 1, 'ham-sous-varsberg': 2, porcelette: 3, carling: 4, 'l-hopital': 5, 'saint-avold': 6 },
+  harnes: { 'centre-ville': 0, annay: 1, 'fouquieres-les-lens': 2, courrieres: 3, 'loison-sous-lens': 4, 'pont-a-vendin': 5, 'noyelles-sous-lens': 6 },
+  bischwiller: { 'centre-ville': 0, 'oberhoffen-sur-moder': 1, gries: 2, kaltenhouse: 3, herrlisheim: 4, schirrhein: 5, weyersheim: 6 },
+  'la-queue-en-brie': { 'centre-ville': 0, noiseau: 1, 'le-plessis-trevise': 2, 'chennevieres-sur-marne': 3, 'sucy-en-brie': 4, 'ormesson-sur-marne': 5, santeny: 6 },
+  'triel-sur-seine': { 'centre-ville': 0, 'chanteloup-les-vignes': 1, vernouillet: 2, 'verneuil-sur-seine': 3, andresy: 4, 'carrieres-sous-poissy': 5, maurecourt: 6 },
+  riedisheim: { 'centre-ville': 0, mulhouse: 1, rixheim: 2, illzach: 3, 'brunstatt-didenheim': 4, habsheim: 5, sausheim: 6 },
+  raismes: { 'centre-ville': 0, beuvrages: 1, 'bruay-sur-l-escaut': 2, 'petite-foret': 3, anzin: 4, 'saint-amand-les-eaux': 5, escautpont: 6 },
+  sarrebourg: { 'centre-ville': 0, reding: 1, phalsbourg: 2, dabo: 3 },
+  castelnaudary: { 'centre-ville': 0, bram: 1, montreal: 2 },
+  'bully-les-mines': { 'centre-ville': 0, grenay: 1, mazingarbe: 2, 'aix-noulette': 3, 'sains-en-gohelle': 4, 'bouvigny-boyeffles': 5, lievin: 6 },
+  'saint-gaudens': { 'centre-ville': 0, montrejeau: 1, 'martres-tolosane': 2 },
+  'ferney-voltaire': { 'centre-ville': 0, 'prevessin-moens': 1, ornex: 2, versonnex: 3, 'saint-genis-pouilly': 4, segny: 5, chevry: 6 },
+  craponne: { 'centre-ville': 0, 'saint-genis-les-ollieres': 1, francheville: 2, 'tassin-la-demi-lune': 3, brindas: 4, 'grezieu-la-varenne': 5, 'charbonnieres-les-bains': 6 },
+  'onet-le-chateau': { 'centre-ville': 0, rodez: 1, olemps: 2, 'le-monastere': 3, 'sebazac-concoures': 4, 'druelle-balsac': 5, 'salles-la-source': 6 },
+  'saint-cyprien': { 'centre-ville': 0, 'latour-bas-elne': 1, elne: 2, alenya: 3, 'saint-nazaire': 4, 'corneilla-del-vercol': 5, theza: 6 },
+  'la-motte-servolex': { 'centre-ville': 0, voglans: 1, 'le-bourget-du-lac': 2, chambery: 3, sonnaz: 4, cognin: 5, 'viviers-du-lac': 6 },
+  cernay: { 'centre-ville': 0, 'vieux-thann': 1, wittelsheim: 2, staffelfelden: 3, thann: 4, lutterbach: 5, richwiller: 6 },
+  mios: { 'centre-ville': 0, biganos: 1, salles: 2, marcheprime: 3, 'le-teich': 4, 'le-barp': 5, audenge: 6 },
+  'roquebrune-cap-martin': { 'centre-ville': 0, beausoleil: 1, menton: 2, 'la-turbie': 3, peille: 4, 'cap-d-ail': 5, eze: 6 },
+  florange: { 'centre-ville': 0, terville: 1, 'seremange-erzange': 2, uckange: 3, fameck: 4, hayange: 5, thionville: 6 },
+  barentin: { 'centre-ville': 0, pavilly: 1, 'saint-pierre-de-varengeville': 2, 'le-houlme': 3, malaunay: 4, duclair: 5, montville: 6 },
+  'septemes-les-vallons': { 'centre-ville': 0, 'simiane-collongue': 1, 'les-pennes-mirabeau': 2, 'bouc-bel-air': 3, cabries: 4, 'plan-de-cuques': 5, mimet: 6 },
+  marly: { 'centre-ville': 0, 'aulnoy-lez-valenciennes': 1, saultain: 2, valenciennes: 3, 'saint-saulve': 4, anzin: 5, preseau: 6 },
+  'saint-pierre-du-perray': { 'centre-ville': 0, 'saintry-sur-seine': 1, 'saint-germain-les-corbeil': 2, 'corbeil-essonnes': 3, tigery: 4, etiolles: 5, villabe: 6 },
+  vedene: {
+    'centre-ville': 0,
+    'saint-saturnin-les-avignon': 1,
+    'entraigues-sur-la-sorgue': 2,
+    'le-pontet': 3,
+    'morieres-les-avignon': 4,
+    'althen-des-paluds': 5,
+    'chateauneuf-de-gadagne': 6,
+  },
+  valbonne: { 'centre-ville': 0, opio: 1, mougins: 2, biot: 3, 'mouans-sartoux': 4, 'roquefort-les-pins': 5, 'chateauneuf-grasse': 6 },
+  ifs: { 'centre-ville': 0, 'cormelles-le-royal': 1, 'fleury-sur-orne': 2, mondeville: 3, soliers: 4, louvigny: 5, 'saint-martin-de-may': 6 },
+  beausoleil: { 'centre-ville': 0, 'la-turbie': 1, 'cap-d-ail': 2, 'roquebrune-cap-martin': 3, eze: 4, peille: 5, 'la-trinite': 6 },
+  villepreux: { 'centre-ville': 0, 'les-clayes-sous-bois': 1, 'bois-d-arcy': 2, 'fontenay-le-fleury': 3, 'saint-nom-la-breteche': 4, 'noisy-le-roi': 5, 'saint-cyr-l-ecole': 6 },
+  'dammartin-en-goele': { 'centre-ville': 0, longperrier: 1, 'saint-mard': 2, juilly: 3, othis: 4, 'moussy-le-neuf': 5, 'saint-pathus': 6 },
+  'le-relecq-kerhuon': { 'centre-ville': 0, guipavas: 1, 'plougastel-daoulas': 2, gouesnou: 3, loperhet: 4, brest: 5, 'la-forest-landerneau': 6 },
+  talant: { 'centre-ville': 0, 'fontaine-les-dijon': 1, dijon: 2, 'plombieres-les-dijon': 3, chenove: 4, 'marsannay-la-cote': 5, 'saint-apollinaire': 6 },
+  'riviere-salee': { 'centre-ville': 0, 'sainte-luce': 1, 'saint-esprit': 2, ducos: 3, 'riviere-pilote': 4, 'le-diamant': 5, 'les-trois-ilets': 6 },
+  somain: { 'centre-ville': 0, fenain: 1, aniche: 2, abscon: 3, pecquencourt: 4, auberchicourt: 5, hornaing: 6 },
+  papara: { 'centre-ville': 0, paea: 1, punaauia: 2, 'teva-i-uta': 3, faaa: 4, pirae: 5, mahina: 6 },
+  'h-nheim': { 'centre-ville': 0, souffelweyersheim: 1, bischheim: 2, schiltigheim: 3, reichstett: 4, mundolsheim: 5, mittelhausbergen: 6 },
+  'seyssinet-pariset': { 'centre-ville': 0, seyssins: 1, fontaine: 2, grenoble: 3, echirolles: 4, sassenage: 5, 'le-pont-de-claix': 6 },
+  'bauge-en-anjou': { 'centre-ville': 0, 'jarze-villages': 1, 'les-bois-d-anjou': 2, 'beaufort-en-anjou': 3, durtal: 4, 'maze-milon': 5, 'noyant-villages': 6 },
+  pace: { 'centre-ville': 0, 'la-chapelle-des-fougeretz': 1, montgermont: 2, 'vezin-le-coquet': 3, 'l-hermitage': 4, 'saint-gilles': 5, geveze: 6 },
+  dugny: { 'centre-ville': 0, 'le-bourget': 1, 'la-courneuve': 2, 'le-blanc-mesnil': 3, stains: 4, drancy: 5, 'saint-denis': 6 },
+  arpajon: { 'centre-ville': 0, 'la-norville': 1, 'saint-germain-les-arpajon': 2, egly: 3, ollainville: 4, 'leuville-sur-orge': 5, 'bretigny-sur-orge': 6 },
+  vauvert: { 'centre-ville': 0, 'le-cailar': 1, beauvoisin: 2, 'saint-laurent-d-aigouze': 3, 'saint-gilles': 4, aimargues: 5, generac: 6 },
+  'saint-cyr-sur-mer': { 'centre-ville': 0, 'la-cadiere-d-azur': 1, bandol: 2, 'le-castellet': 3, 'sanary-sur-mer': 4, 'le-beausset': 5, ollioules: 6 },
+  villecresnes: { 'centre-ville': 0, 'mandres-les-roses': 1, 'marolles-en-brie': 2, 'boissy-saint-leger': 3, perigny: 4, santeny: 5, 'limeil-brevannes': 6 },
+  sassenage: { 'centre-ville': 0, fontaine: 1, 'saint-egreve': 2, noyarey: 3, 'saint-martin-le-vinoux': 4, 'fontanil-cornillon': 5, 'seyssinet-pariset': 6 },
+  'bruay-sur-l-escaut': { 'centre-ville': 0, beuvrages: 1, 'saint-saulve': 2, anzin: 3, escautpont: 4, raismes: 5, valenciennes: 6 },
+  thiers: { 'centre-ville': 0, peschadoires: 1, orleat: 2, 'puy-guillaume': 3, courpiere: 4, lezoux: 5, maringues: 6 },
+  'plan-de-cuques': { 'centre-ville': 0, allauch: 1, mimet: 2, 'simiane-collongue': 3, cadolive: 4, 'saint-savournin': 5, 'septemes-les-vallons': 6 },
+  provins: { 'centre-ville': 0, 'donnemarie-dontilly': 1, 'bray-sur-seine': 2, nangis: 3 },
+  'saint-esteve': { 'centre-ville': 0, baho: 1, baixas: 2, toulouges: 3, perpignan: 4, 'le-soler': 5, 'pezilla-la-riviere': 6 },
+  'saint-germain-les-arpajon': { 'centre-ville': 0, arpajon: 1, 'la-norville': 2, 'leuville-sur-orge': 3, 'bretigny-sur-orge': 4, linas: 5, ollainville: 6 },
+  mericourt: { 'centre-ville': 0, sallaumines: 1, rouvroy: 2, avion: 3, 'billy-montigny': 4, 'noyelles-sous-lens': 5, 'fouquieres-les-lens': 6 },
+  pia: { 'centre-ville': 0, claira: 1, bompas: 2, rivesaltes: 3, 'villelongue-de-la-salanque': 4, perpignan: 5, 'saint-esteve': 6 },
+  'epinay-sous-senart': { 'centre-ville': 0, brunoy: 1, 'boussy-saint-antoine': 2, 'quincy-sous-senart': 3, yerres: 4, 'varennes-jarcy': 5, montgeron: 6 },
+  'riviere-pilote': { 'centre-ville': 0, 'le-marin': 1, 'sainte-luce': 2, 'le-vauclin': 3, 'saint-esprit': 4, 'riviere-salee': 5, 'sainte-anne': 6 },
+  'ancenis-saint-gereon': { 'centre-ville': 0, 'vair-sur-loire': 1, mesanger: 2, oudon: 3, couffe: 4, loireauxence: 5, mouzeil: 6 },
+  chauny: { 'centre-ville': 0, sinceny: 1, tergnier: 2, beautor: 3, 'la-fere': 4, 'saint-gobain': 5, 'anizy-le-grand': 6 },
+  'n-ux-les-mines': { 'centre-ville': 0, labourse: 1, 'sains-en-gohelle': 2, verquin: 3, 'hersin-coupigny': 4, 'sailly-labourse': 5, barlin: 6 },
+  bolbec: { 'centre-ville': 0, 'gruchet-le-valasse': 1, lillebonne: 2, 'la-frenaye': 3, 'saint-romain-de-colbosc': 4, 'port-jerome-sur-seine': 5, goderville: 6 },
+  'maizieres-les-metz': { 'centre-ville': 0, talange: 1, hagondange: 2, 'marange-silvange': 3, amneville: 4, woippy: 5, ennery: 6 },
+  'les-avirons': { 'centre-ville': 0, 'saint-leu': 1, 'l-etang-sale': 2, 'saint-louis': 3, 'les-trois-bassins': 4, cilaos: 5, 'entre-deux': 6 },
+  ploufragan: { 'centre-ville': 0, 'saint-brieuc': 1, tregueux: 2, 'saint-julien': 3, tremuson: 4, plerin: 5, langueux: 6 },
+  'la-hague': { 'centre-ville': 0, 'cherbourg-en-cotentin': 1, 'les-pieux': 2, brix: 3, 'bricquebec-en-cotentin': 4 },
+  pontchateau: { 'centre-ville': 0, dreffeac: 1, 'sainte-anne-sur-brivet': 2, crossac: 3, besne: 4, 'sainte-reine-de-bretagne': 5, campbon: 6 },
+  'vaux-le-penil': { 'centre-ville': 0, 'livry-sur-seine': 1, chartrettes: 2, 'la-rochette': 3, melun: 4, rubelles: 5, 'le-mee-sur-seine': 6 },
+  saverne: { 'centre-ville': 0, marmoutier: 1, dettwiller: 2, bouxwiller: 3, wasselonne: 4, hochfelden: 5, ingwiller: 6 },
+  'la-trinite': { 'centre-ville': 0, 'sainte-marie': 1, 'le-robert': 2, 'gros-morne': 3, 'le-marigot': 4, 'saint-joseph': 5, 'le-lorrain': 6 },
+  fourmies: { 'centre-ville': 0, wignehies: 1, anor: 2, trelon: 3, 'sains-du-nord': 4, avesnelles: 5, 'avesnes-sur-helpe': 6 },
+  pamandzi: { 'centre-ville': 0, dzaoudzi: 1, mamoudzou: 2, koungou: 3, dembeni: 4, ouangani: 5, tsingoni: 6 },
+  yvetot: { 'centre-ville': 0, yerville: 1, 'rives-en-seine': 2, 'sainte-marguerite-sur-duclair': 3, doudeville: 4, 'terres-de-caux': 5, pavilly: 6 },
+  'enghien-les-bains': { 'centre-ville': 0, 'saint-gratien': 1, 'deuil-la-barre': 2, 'soisy-sous-montmorency': 3, montmorency: 4, eaubonne: 5, montmagny: 6 },
+  biganos: { 'centre-ville': 0, audenge: 1, mios: 2, marcheprime: 3, 'le-teich': 4, lanton: 5, 'gujan-mestras': 6 },
+  gravelines: { 'centre-ville': 0, 'grand-fort-philippe': 1, 'loon-plage': 2, bourbourg: 3, 'grande-synthe': 4, dunkerque: 5, 'armbouts-cappel': 6 },
+  gaillard: { 'centre-ville': 0, etrembieres: 1, ambilly: 2, annemasse: 3, 'monnetier-mornex': 4, 'vetraz-monthoux': 5, 'ville-la-grand': 6 },
+  'saint-junien': { 'centre-ville': 0, rochechouart: 1, 'oradour-sur-glane': 2, veyrac: 3, 'verneuil-sur-vienne': 4, 'saint-gence': 5, sereilhac: 6 },
+  dourdan: { 'centre-ville': 0, 'saint-cheron': 1, 'forges-les-bains': 2, breuillet: 3, etrechy: 4, limours: 5, 'briis-sous-forges': 6 },
+  briancon: { 'centre-ville': 0, 'l-argentiere-la-bessee': 1 },
+  'le-haillan': { 'centre-ville': 0, eysines: 1, merignac: 2, 'le-taillan-medoc': 3, 'le-bouscat': 4, bruges: 5, 'saint-medard-en-jalles': 6 },
+  'la-roche-sur-foron': { 'centre-ville': 0, etaux: 1, amancy: 2, 'saint-pierre-en-faucigny': 3, arenthon: 4, 'pers-jussy': 5, filliere: 6 },
+  panazol: { 'centre-ville': 0, 'le-palais-sur-vienne': 1, feytiat: 2, 'saint-just-le-martel': 3, 'rilhac-rancon': 4, limoges: 5, 'saint-priest-taurion': 6 },
+  'montlouis-sur-loire': { 'centre-ville': 0, veretz: 1, 'azay-sur-cher': 2, 'la-ville-aux-dames': 3, 'saint-martin-le-beau': 4, larcay: 5, vouvray: 6 },
+  corbas: { 'centre-ville': 0, mions: 1, feyzin: 2, 'saint-symphorien-d-ozon': 3, venissieux: 4, 'saint-priest': 5, chaponnay: 6 },
+  'le-luc': { 'centre-ville': 0, 'le-cannet-des-maures': 1, 'flassans-sur-issole': 2, gonfaron: 3, cabasse: 4, 'le-thoronet': 5, pignans: 6 },
+  'tournon-sur-rhone': { 'centre-ville': 0, 'saint-jean-de-muzols': 1, cornas: 2, 'saint-peray': 3, 'guilherand-granges': 4, sarras: 5, soyons: 6 },
+  'villefranche-de-rouergue': { 'centre-ville': 0, rignac: 1, 'capdenac-gare': 2 },
+  castelginest: { 'centre-ville': 0, 'saint-alban': 1, fonbeauzard: 2, pechbonnieu: 3, gratentour: 4, aucamville: 5, 'saint-loup-cammas': 6 },
+  'saint-jean': { 'centre-ville': 0, 'rouffiac-tolosan': 1, 'l-union': 2, 'saint-genies-bellevue': 3, castelmaurou: 4, montrabe: 5, launaguet: 6 },
+  guebwiller: { 'centre-ville': 0, buhl: 1, issenheim: 2, 'soultz-haut-rhin': 3, bollwiller: 4, soultzmatt: 5, rouffach: 6 },
+  'guilherand-granges': { 'centre-ville': 0, 'saint-peray': 1, soyons: 2, cornas: 3, 'charmes-sur-rhone': 4, 'saint-georges-les-bains': 5, 'tournon-sur-rhone': 6 },
+  cesson: { 'centre-ville': 0, 'savigny-le-temple': 1, 'vert-saint-denis': 2, nandy: 3, 'le-mee-sur-seine': 4, reau: 5, 'saint-fargeau-ponthierry': 6 },
+  chassieu: { 'centre-ville': 0, bron: 1, 'saint-priest': 2, genas: 3, 'decines-charpieu': 4, 'vaulx-en-velin': 5, meyzieu: 6 },
+  'porto-vecchio': { 'centre-ville': 0, lecci: 1, zonza: 2, bonifacio: 3 },
+  issoudun: { 'centre-ville': 0 },
+  sada: { 'centre-ville': 0, ouangani: 1, chiconi: 2, chirongui: 3, boueni: 4, dembeni: 5, tsingoni: 6 },
+  riorges: { 'centre-ville': 0, roanne: 1, 'pouilly-les-nonains': 2, 'le-coteau': 3, villerest: 4, 'commelle-vernay': 5, mably: 6 },
+  'chevigny-saint-sauveur': { 'centre-ville': 0, 'sennecey-les-dijon': 1, quetigny: 2, 'neuilly-crimolois': 3, 'saint-apollinaire': 4, longvic: 5, 'varois-et-chaignot': 6 },
+  arcachon: { 'centre-ville': 0, 'la-teste-de-buch': 1, 'lege-cap-ferret': 2, 'gujan-mestras': 3, 'andernos-les-bains': 4, 'le-teich': 5, biganos: 6 },
+  'ville-d-avray': { 'centre-ville': 0, chaville: 1, vaucresson: 2, sevres: 3, garches: 4, 'saint-cloud': 5, meudon: 6 },
+  pelissanne: { 'centre-ville': 0, vernegues: 1, 'lancon-provence': 2, lambesc: 3, alleins: 4, 'la-fare-les-oliviers': 5, 'salon-de-provence': 6 },
+  'le-taillan-medoc': { 'centre-ville': 0, eysines: 1, 'le-haillan': 2, 'le-pian-medoc': 3, blanquefort: 4, 'saint-aubin-de-medoc': 5, bruges: 6 },
+  'villeneuve-tolosane': { 'centre-ville': 0, cugnaux: 1, roques: 2, frouzins: 3, roquettes: 4, 'portet-sur-garonne': 5, pinsaguel: 6 },
+  'doue-en-anjou': { 'centre-ville': 0, 'lys-haut-layon': 1, terranjou: 2, 'montreuil-bellay': 3, 'gennes-val-de-loire': 4, 'brissac-loire-aubance': 5, saumur: 6 },
+  'la-chapelle-saint-mesmin': { 'centre-ville': 0, 'saint-pryve-saint-mesmin': 1, 'saint-jean-de-la-ruelle': 2, 'saint-hilaire-saint-mesmin': 3, ingre: 4, chaingy: 5, olivet: 6 },
+  'mouans-sartoux': { 'centre-ville': 0, 'la-roquette-sur-siagne': 1, mougins: 2, 'auribeau-sur-siagne': 3, grasse: 4, 'chateauneuf-grasse': 5, valbonne: 6 },
+  'croissy-sur-seine': { 'centre-ville': 0, 'le-vesinet': 1, 'le-port-marly': 2, bougival: 3, chatou: 4, 'le-pecq': 5, louveciennes: 6 },
+  wambrechies: { 'centre-ville': 0, 'marquette-lez-lille': 1, 'quesnoy-sur-deule': 2, verlinghem: 3, bondues: 4, 'saint-andre-lez-lille': 5, 'marcq-en-bar-ul': 6 },
+  'thouare-sur-loire': { 'centre-ville': 0, 'saint-julien-de-concelles': 1, carquefou: 2, 'sainte-luce-sur-loire': 3, 'mauves-sur-loire': 4, 'divatte-sur-loire': 5, 'basse-goulaine': 6 },
+  'vitry-le-francois': { 'centre-ville': 0 },
+  'ormesson-sur-marne': { 'centre-ville': 0, 'chennevieres-sur-marne': 1, noiseau: 2, 'sucy-en-brie': 3, 'champigny-sur-marne': 4, 'saint-maur-des-fosses': 5, 'bonneuil-sur-marne': 6 },
+  lavaur: { 'centre-ville': 0, 'labastide-saint-georges': 1, 'saint-sulpice-la-pointe': 2, coufouleux: 3, graulhet: 4, rabastens: 5, puylaurens: 6 },
+  'pont-saint-esprit': { 'centre-ville': 0, 'bagnols-sur-ceze': 1, 'laudun-l-ardoise': 2, 'saint-genies-de-comolas': 3, 'saint-victor-la-coste': 4, 'saint-laurent-des-arbres': 5, roquemaure: 6 },
+  maromme: { 'centre-ville': 0, 'deville-les-rouen': 1, 'notre-dame-de-bondeville': 2, 'mont-saint-aignan': 3, 'le-houlme': 4, canteleu: 5, houppeville: 6 },
+  mana: { 'centre-ville': 0 },
+  'le-pont-de-claix': { 'centre-ville': 0, echirolles: 1, claix: 2, jarrie: 3, 'varces-allieres-et-risset': 4, seyssins: 5, eybens: 6 },
+  'stiring-wendel': { 'centre-ville': 0, 'sch-neck': 1, forbach: 2, spicheren: 3, ting: 4, 'behren-les-forbach': 5, 'petite-rosselle': 6 },
+  fondettes: { 'centre-ville': 0, 'saint-cyr-sur-loire': 1, 'la-membrolle-sur-choisille': 2, 'la-riche': 3, luynes: 4, mettray: 5, tours: 6 },
+  'vetraz-monthoux': { 'centre-ville': 0, annemasse: 1, 'ville-la-grand': 2, ambilly: 3, etrembieres: 4, gaillard: 5, 'cranves-sales': 6 },
+  'saint-saulve': { 'centre-ville': 0, onnaing: 1, 'bruay-sur-l-escaut': 2, marly: 3, anzin: 4, valenciennes: 5, beuvrages: 6 },
+  trets: { 'centre-ville': 0, peynier: 1, rousset: 2, 'la-bouilladisse': 3, auriol: 4, belcodene: 5, 'la-destrousse': 6 },
+  'le-pradet': { 'centre-ville': 0, 'la-garde': 1, carqueiranne: 2, 'la-valette-du-var': 3, 'la-farlede': 4, 'saint-mandrier-sur-mer': 5, toulon: 6 },
+  tarare: { 'centre-ville': 0, 'vindry-sur-turdine': 1, amplepuis: 2, 'val-d-oingt': 3, bully: 4, chessy: 5, 'saint-germain-nuelles': 6 },
+  'saint-martin-boulogne': { 'centre-ville': 0, 'boulogne-sur-mer': 1, 'saint-leonard': 2, outreau: 3, 'le-portel': 4, wimille: 5, wimereux: 6 },
+  orthez: { 'centre-ville': 0, 'salies-de-bearn': 1, mourenx: 2, artix: 3 },
+  'brissac-loire-aubance': { 'centre-ville': 0, 'les-garennes-sur-loire': 1, terranjou: 2, 'saint-melaine-sur-aubance': 3, 'bellevigne-en-layon': 4, 'les-ponts-de-ce': 5, 'murs-erigne': 6 },
+  amneville: { 'centre-ville': 0, rombas: 1, clouange: 2, gandrange: 3, hagondange: 4, 'marange-silvange': 5, 'vitry-sur-orne': 6 },
+  'villeneuve-les-maguelone': { 'centre-ville': 0, mireval: 1, 'vic-la-gardiole': 2, 'palavas-les-flots': 3, lattes: 4, 'saint-jean-de-vedas': 5, fabregues: 6 },
+  'chanteloup-les-vignes': { 'centre-ville': 0, andresy: 1, 'triel-sur-seine': 2, maurecourt: 3, 'carrieres-sous-poissy': 4, vernouillet: 5, 'verneuil-sur-seine': 6 },
+  passy: { 'centre-ville': 0, 'les-houches': 1, domancy: 2, magland: 3, 'saint-gervais-les-bains': 4, sallanches: 5, combloux: 6 },
+  'ann-ullin': { 'centre-ville': 0, provin: 1, 'allennes-les-marais': 2, bauvin: 3, 'sainghin-en-weppes': 4, gondecourt: 5, wavrin: 6 },
+  chateaugiron: { 'centre-ville': 0, domagne: 1, domloup: 2, 'noyal-sur-vilaine': 3, nouvoitou: 4, 'pire-chance': 5, brece: 6 },
+  'teva-i-uta': { 'centre-ville': 0, papara: 1, 'hitiaa-o-te-ra': 2, paea: 3, 'taiarapu-ouest': 4, punaauia: 5, mahina: 6 },
+  igny: { 'centre-ville': 0, bievres: 1, palaiseau: 2, 'verrieres-le-buisson': 3, massy: 4, saclay: 5, 'villebon-sur-yvette': 6 },
+  'deville-les-rouen': { 'centre-ville': 0, maromme: 1, 'mont-saint-aignan': 2, 'notre-dame-de-bondeville': 3, rouen: 4, canteleu: 5, 'le-petit-quevilly': 6 },
+  erstein: { 'centre-ville': 0, gerstheim: 1, plobsheim: 2, eschau: 3, lipsheim: 4, fegersheim: 5, benfeld: 6 },
+  dinard: { 'centre-ville': 0, 'la-richardais': 1, 'saint-lunaire': 2, 'saint-malo': 3, 'saint-briac-sur-mer': 4, pleurtuit: 5, 'saint-jouan-des-guerets': 6 },
+  tinqueux: { 'centre-ville': 0, 'saint-brice-courcelles': 1, bezannes: 2, reims: 3, cormontreuil: 4, betheny: 5, muizon: 6 },
+  bondoufle: { 'centre-ville': 0, 'fleury-merogis': 1, 'le-plessis-pate': 2, 'vert-le-grand': 3, 'ris-orangis': 4, 'evry-courcouronnes': 5, lisses: 6 },
+  'boulazac-isle-manoire': { 'centre-ville': 0, sanilhac: 1, 'bassillac-et-auberoche': 2, trelissac: 3, perigueux: 4, 'coulounieix-chamiers': 5, champcevinel: 6 },
+  'bora-bora': { 'centre-ville': 0 },
+  allonnes: { 'centre-ville': 0, 'saint-georges-du-bois': 1, spay: 2, rouillon: 3, 'le-mans': 4, arnage: 5, 'monce-en-belin': 6 },
+  beaumont: { 'centre-ville': 0, ceyrat: 1, romagnat: 2, aubiere: 3, chamalieres: 4, royat: 5, 'clermont-ferrand': 6 },
+  'epinay-sur-orge': { 'centre-ville': 0, 'villemoisson-sur-orge': 1, 'villiers-sur-orge': 2, ballainvilliers: 3, longjumeau: 4, 'savigny-sur-orge': 5, 'morsang-sur-orge': 6 },
+  etaples: { 'centre-ville': 0, 'le-touquet-paris-plage': 1, cucq: 2, camiers: 3, merlimont: 4, 'neufchatel-hardelot': 5, 'rang-du-fliers': 6 },
+  'oloron-sainte-marie': { 'centre-ville': 0, arudy: 1, monein: 2, gan: 3, jurancon: 4, artiguelouve: 5, gelos: 6 },
+  parempuyre: { 'centre-ville': 0, 'ludon-medoc': 1, 'saint-louis-de-montferrand': 2, blanquefort: 3, macau: 4, 'ambares-et-lagrave': 5, ambes: 6 },
+  leognan: { 'centre-ville': 0, martillac: 1, gradignan: 2, canejan: 3, cadaujac: 4, 'villenave-d-ornon': 5, 'la-brede': 6 },
+  chantepie: { 'centre-ville': 0, 'vern-sur-seiche': 1, 'cesson-sevigne': 2, domloup: 3, 'noyal-chatillon-sur-seiche': 4, rennes: 5, nouvoitou: 6 },
+  urrugne: { 'centre-ville': 0, ciboure: 1, hendaye: 2, ascain: 3, 'saint-jean-de-luz': 4, sare: 5, 'saint-pee-sur-nivelle': 6 },
+  'saint-barthelemy': { 'centre-ville': 0 },
+  wittelsheim: { 'centre-ville': 0, richwiller: 1, staffelfelden: 2, lutterbach: 3, pfastatt: 4, wittenheim: 5, kingersheim: 6 },
+  mainvilliers: { 'centre-ville': 0, leves: 1, luce: 2, chartres: 3, luisant: 4, champhol: 5, 'saint-prest': 6 },
+  'voisins-le-bretonneux': { 'centre-ville': 0, 'magny-les-hameaux': 1, guyancourt: 2, 'montigny-le-bretonneux': 3, trappes: 4, 'saint-cyr-l-ecole': 5, 'bois-d-arcy': 6 },
+  hericourt: { 'centre-ville': 0, champagney: 1, ronchamp: 2, lure: 3 },
+  'vieux-conde': { 'centre-ville': 0, hergnies: 1, 'conde-sur-l-escaut': 2, 'fresnes-sur-escaut': 3, escautpont: 4, raismes: 5, crespin: 6 },
+  'port-jerome-sur-seine': { 'centre-ville': 0, 'la-frenaye': 1, lillebonne: 2, 'gruchet-le-valasse': 3, 'rives-en-seine': 4, bolbec: 5, 'arelaune-en-seine': 6 },
+  'argeles-sur-mer': { 'centre-ville': 0, sorede: 1, 'saint-andre': 2, collioure: 3, 'palau-del-vidre': 4, 'port-vendres': 5, 'laroque-des-alberes': 6 },
+  treillieres: { 'centre-ville': 0, orvault: 1, 'la-chapelle-sur-erdre': 2, 'grandchamp-des-fontaines': 3, sautron: 4, 'vigneux-de-bretagne': 5, 'suce-sur-erdre': 6 },
+  chantilly: { 'centre-ville': 0, 'coye-la-foret': 1, 'orry-la-ville': 2, lamorlaye: 3, gouvieux: 4, 'saint-maximin': 5, 'la-chapelle-en-serval': 6 },
+  'la-londe-les-maures': { 'centre-ville': 0, hyeres: 1, 'pierrefeu-du-var': 2, 'bormes-les-mimosas': 3, 'la-crau': 4, 'le-lavandou': 5, 'puget-ville': 6 },
+  fosses: { 'centre-ville': 0, 'marly-la-ville': 1, survilliers: 2, 'puiseux-en-france': 3, 'saint-witz': 4, luzarches: 5, chaumontel: 6 },
+  clermont: { 'centre-ville': 0, 'breuil-le-vert': 1, 'fitz-james': 2, agnetz: 3, 'breuil-le-sec': 4, rantigny: 5, liancourt: 6 },
+  longuenesse: { 'centre-ville': 0, 'saint-martin-lez-tatinghem': 1, wizernes: 2, blendecques: 3, 'saint-omer': 4, arques: 5, ecques: 6 },
+  'charvieu-chavagneux': { 'centre-ville': 0, 'pont-de-cheruy': 1, 'tignieu-jameyzieu': 2, chavanoz: 3, 'saint-romain-de-jalionas': 4, 'satolas-et-bonce': 5, 'villette-d-anthon': 6 },
+  seysses: { 'centre-ville': 0, frouzins: 1, fonsorbes: 2, labastidette: 3, 'villeneuve-tolosane': 4, roques: 5, muret: 6 },
+  limoux: { 'centre-ville': 0, palaja: 1, montreal: 2, quillan: 3, carcassonne: 4, pennautier: 5, villemoustaussou: 6 },
+  biot: { 'centre-ville': 0, 'villeneuve-loubet': 1, valbonne: 2, antibes: 3, 'roquefort-les-pins': 4, vallauris: 5, opio: 6 },
+  'pernes-les-fontaines': { 'centre-ville': 0, velleron: 1, monteux: 2, 'althen-des-paluds': 3, 'saint-didier': 4, 'entraigues-sur-la-sorgue': 5, 'saint-saturnin-les-avignon': 6 },
+  valentigney: { 'centre-ville': 0, audincourt: 1, voujeaucourt: 2, seloncourt: 3, mandeure: 4, exincourt: 5, mathay: 6 },
+  brumath: { 'centre-ville': 0, geudertheim: 1, vendenheim: 2, 'h-rdt': 3, mommenheim: 4, weitbruch: 5, 'wingersheim-les-quatre-bans': 6 },
+  eybens: { 'centre-ville': 0, poisat: 1, echirolles: 2, 'saint-martin-d-heres': 3, 'brie-et-angonnes': 4, grenoble: 5, jarrie: 6 },
+  'villers-cotterets': { 'centre-ville': 0, 'la-ferte-milon': 1, belleu: 2, soissons: 3 },
+  'la-riche': { 'centre-ville': 0, fondettes: 1, 'saint-cyr-sur-loire': 2, tours: 3, 'joue-les-tours': 4, 'ballan-mire': 5, 'la-membrolle-sur-choisille': 6 },
+  'portes-les-valence': { 'centre-ville': 0, 'etoile-sur-rhone': 1, 'beaumont-les-valence': 2, valence: 3, malissard: 4, montmeyran: 5, 'bourg-les-valence': 6 },
+  'caudebec-les-elbeuf': { 'centre-ville': 0, elbeuf: 1, 'saint-pierre-les-elbeuf': 2, 'saint-aubin-les-elbeuf': 3, cleon: 4, 'grand-couronne': 5, oissel: 6 },
+  'saint-gely-du-fesc': { 'centre-ville': 0, combaillaux: 1, 'saint-clement-de-riviere': 2, 'les-matelles': 3, grabels: 4, 'prades-le-lez': 5, 'montferrier-sur-lez': 6 },
+  marck: { 'centre-ville': 0, calais: 1, 'les-attaques': 2, coulogne: 3, 'oye-plage': 4, ardres: 5, coquelles: 6 },
+  cabestany: { 'centre-ville': 0, saleilles: 1, 'saint-nazaire': 2, 'canet-en-roussillon': 3, perpignan: 4, theza: 5, alenya: 6 },
+  'divonne-les-bains': { 'centre-ville': 0, gex: 1, cessy: 2, versonnex: 3, segny: 4, echenevex: 5, ornex: 6 },
+  aubiere: { 'centre-ville': 0, 'perignat-les-sarlieve': 1, beaumont: 2, 'clermont-ferrand': 3, 'la-roche-blanche': 4, 'cournon-d-auvergne': 5, ceyrat: 6 },
+  auterive: { 'centre-ville': 0, miremont: 1, cintegabelle: 2, venerque: 3, vernet: 4, 'lagardelle-sur-leze': 5, nailloux: 6 },
+  'thorigny-sur-marne': { 'centre-ville': 0, 'lagny-sur-marne': 1, dampmart: 2, pomponne: 3, 'annet-sur-marne': 4, montevrain: 5, 'saint-thibault-des-vignes': 6 },
+  fouesnant: { 'centre-ville': 0, benodet: 1, 'clohars-fouesnant': 2, pleuven: 3, gouesnach: 4, 'la-foret-fouesnant': 5, combrit: 6 },
+  'andrezieux-boutheon': { 'centre-ville': 0, veauche: 1, 'saint-cyprien': 2, bonson: 3, 'la-fouillouse': 4, 'saint-just-saint-rambert': 5, 'sury-le-comtal': 6 },
+  miribel: { 'centre-ville': 0, neyron: 1, 'saint-maurice-de-beynost': 2, beynost: 3, mionnay: 4, 'la-boisse': 5, montluel: 6 },
+  blain: { 'centre-ville': 0, bouvron: 1, 'fay-de-bretagne': 2, 'notre-dame-des-landes': 3, vay: 4, heric: 5, malville: 6 },
+  aizenay: { 'centre-ville': 0, 'beaulieu-sous-la-roche': 1, venansault: 2, 'la-genetouze': 3, apremont: 4, coex: 5, 'le-poire-sur-vie': 6 },
+  'lezignan-corbieres': { 'centre-ville': 0, 'saint-nazaire-d-aude': 1, 'saint-marcel-sur-aude': 2, 'salleles-d-aude': 3, moussan: 4, argeliers: 5, ouveillan: 6 },
+  'gignac-la-nerthe': { 'centre-ville': 0, 'le-rove': 1, 'saint-victoret': 2, marignane: 3, 'ensues-la-redonne': 4, 'chateauneuf-les-martigues': 5, 'les-pennes-mirabeau': 6 },
+  fuveau: { 'centre-ville': 0, greasque: 1, 'chateauneuf-le-rouge': 2, belcodene: 3, gardanne: 4, meyreuil: 5, peynier: 6 },
+  gerzat: { 'centre-ville': 0, 'saint-beauzire': 1, cebazat: 2, aulnat: 3, chateaugay: 4, 'clermont-ferrand': 5, lempdes: 6 },
+  mondeville: { 'centre-ville': 0, giberville: 1, 'cormelles-le-royal': 2, colombelles: 3, ifs: 4, demouville: 5, cagny: 6 },
+  serris: { 'centre-ville': 0, 'bailly-romainvilliers': 1, chessy: 2, 'magny-le-hongre': 3, montevrain: 4, 'chanteloup-en-brie': 5, coupvray: 6 },
+  oignies: { 'centre-ville': 0, libercourt: 1, dourges: 2, courrieres: 3, carvin: 4, 'evin-malmaison': 5, 'noyelles-godault': 6 },
+  'saint-esprit': { 'centre-ville': 0, ducos: 1, 'riviere-salee': 2, 'le-francois': 3, 'riviere-pilote': 4, 'le-vauclin': 5, 'sainte-luce': 6 },
+  arue: { 'centre-ville': 0 },
+  pfastatt: { 'centre-ville': 0, lutterbach: 1, richwiller: 2, kingersheim: 3, mulhouse: 4, 'morschwiller-le-bas': 5, wittelsheim: 6 },
+  borgo: { 'centre-ville': 0, biguglia: 1, lucciana: 2, vescovato: 3, furiani: 4, bastia: 5, 'penta-di-casinca': 6 },
+  apatou: { 'centre-ville': 0, 'saint-laurent-du-maroni': 1 },
+  feyzin: { 'centre-ville': 0, 'saint-fons': 1, irigny: 2, venissieux: 3, solaize: 4, 'saint-symphorien-d-ozon': 5, corbas: 6 },
+  'villebon-sur-yvette': { 'centre-ville': 0, palaiseau: 1, villejust: 2, 'saulx-les-chartreux': 3, champlan: 4, orsay: 5, 'les-ulis': 6 },
+  'sainte-savine': { 'centre-ville': 0, 'les-noes-pres-troyes': 1, 'la-chapelle-saint-luc': 2, 'la-riviere-de-corps': 3, 'saint-andre-les-vergers': 4, troyes: 5, 'rosieres-pres-troyes': 6 },
+  buxerolles: { 'centre-ville': 0, poitiers: 1, 'chasseneuil-du-poitou': 2, 'migne-auxances': 3, montamise: 4, 'saint-benoit': 5, 'mignaloux-beauvoir': 6 },
+  bandrele: { 'centre-ville': 0, chirongui: 1, 'kani-keli': 2, boueni: 3, dembeni: 4, sada: 5, ouangani: 6 },
+  'la-ferte-sous-jouarre': { 'centre-ville': 0, jouarre: 1, 'lizy-sur-ourcq': 2, trilport: 3, rebais: 4, 'boissy-le-chatel': 5, mouroux: 6 },
+  cabries: { 'centre-ville': 0, 'bouc-bel-air': 1, 'les-pennes-mirabeau': 2, vitrolles: 3, 'septemes-les-vallons': 4, 'simiane-collongue': 5, 'saint-victoret': 6 },
+  'beaumont-sur-oise': { 'centre-ville': 0, persan: 1, presles: 2, 'bernes-sur-oise': 3, 'bruyeres-sur-oise': 4, 'champagne-sur-oise': 5, 'saint-martin-du-tertre': 6 },
+  'le-beausset': { 'centre-ville': 0, evenos: 1, 'le-castellet': 2, ollioules: 3, 'sanary-sur-mer': 4, signes: 5, 'la-cadiere-d-azur': 6 },
+  'carentan-les-marais': { 'centre-ville': 0, 'sainte-mere-eglise': 1, picauville: 2, periers: 3, 'marigny-le-lozon': 4, agneaux: 5, 'saint-lo': 6 },
+  ouangani: { 'centre-ville': 0, chiconi: 1, sada: 2, dembeni: 3, tsingoni: 4, mamoudzou: 5, chirongui: 6 },
+  'hitiaa-o-te-ra': { 'centre-ville': 0, mahina: 1, pirae: 2, 'teva-i-uta': 3, punaauia: 4, papeete: 5, faaa: 6 },
+  couzeix: { 'centre-ville': 0, limoges: 1, chaptelat: 2, 'saint-gence': 3, 'verneuil-sur-vienne': 4, isle: 5, 'le-palais-sur-vienne': 6 },
+  lillers: { 'centre-ville': 0, allouagne: 1, burbure: 2, auchel: 3, lapugnoy: 4, chocques: 5, isbergues: 6 },
+  'saint-claude': { 'centre-ville': 0, baillif: 1, gourbeyre: 2, 'vieux-habitants': 3, 'basse-terre': 4, 'trois-rivieres': 5, 'capesterre-belle-eau': 6 },
+  courrieres: { 'centre-ville': 0, harnes: 1, 'montigny-en-gohelle': 2, dourges: 3, oignies: 4, 'fouquieres-les-lens': 5, 'henin-beaumont': 6 },
+  ploermel: { 'centre-ville': 0, 'val-d-oust': 1, taupont: 2, malestroit: 3, josselin: 4, serent: 5, guegon: 6 },
+  jeumont: { 'centre-ville': 0, marpent: 1, boussois: 2, recquignies: 3, cousolre: 4, rousies: 5, 'ferriere-la-grande': 6 },
+  avranches: { 'centre-ville': 0, 'ducey-les-cheris': 1, 'sartilly-baie-bocage': 2, 'isigny-le-buat': 3, brecey: 4, pontorson: 5, jullouville: 6 },
+  apt: { 'centre-ville': 0, gargas: 1, 'saint-saturnin-les-apt': 2, lauris: 3, cadenet: 4, villelaure: 5, merindol: 6 },
+  parthenay: { 'centre-ville': 0, pompaire: 1, 'chatillon-sur-thouet': 2, 'la-chapelle-saint-laurent': 3, airvault: 4 },
+  pierrelaye: { 'centre-ville': 0, 'herblay-sur-seine': 1, beauchamp: 2, bessancourt: 3, 'montigny-les-cormeilles': 4, 'mery-sur-oise': 5, 'saint-ouen-l-aumone': 6 },
+  'le-muy': { 'centre-ville': 0, 'la-motte': 1, 'roquebrune-sur-argens': 2, 'les-arcs': 3, 'puget-sur-argens': 4, 'trans-en-provence': 5, callas: 6 },
+  'douchy-les-mines': { 'centre-ville': 0, lourches: 1, haulchin: 2, 'neuville-sur-escaut': 3, denain: 4, thiant: 5, haspres: 6 },
+  villerupt: { 'centre-ville': 0, thil: 1, 'hussigny-godbrange': 2, 'haucourt-moulaine': 3, saulnes: 4, mexy: 5, herserange: 6 },
+  'saint-pierre-du-mont': { 'centre-ville': 0, 'mont-de-marsan': 1, 'grenade-sur-l-adour': 2, 'saint-sever': 3, 'villeneuve-de-marsan': 4, tartas: 5 },
+  maxeville: { 'centre-ville': 0, champigneulles: 1, nancy: 2, laxou: 3, malzeville: 4, 'saint-max': 5, frouard: 6 },
+  soyaux: { 'centre-ville': 0, 'l-isle-d-espagnac': 1, 'magnac-sur-touvre': 2, puymoyen: 3, garat: 4, angouleme: 5, 'gond-pontouvre': 6 },
+  mazamet: { 'centre-ville': 0, aussillon: 1, aiguefonde: 2, 'pont-de-larn': 3, 'payrin-augmontel': 4, labruguiere: 5, 'viviers-les-montagnes': 6 },
+  filliere: { 'centre-ville': 0, groisy: 1, villaz: 2, etaux: 3, 'la-roche-sur-foron': 4, argonay: 5, 'allonzier-la-caille': 6 },
+  ingre: { 'centre-ville': 0, ormes: 1, 'la-chapelle-saint-mesmin': 2, 'saint-jean-de-la-ruelle': 3, chaingy: 4, 'saint-pryve-saint-mesmin': 5, saran: 6 },
+  auchel: { 'centre-ville': 0, 'cauchy-a-la-tour': 1, burbure: 2, 'calonne-ricouart': 3, 'marles-les-mines': 4, allouagne: 5, lapugnoy: 6 },
+  'grigny-sur-rhone': { 'centre-ville': 0, ternay: 1, millery: 2, montagny: 3, 'serezin-du-rhone': 4, givors: 5, communay: 6 },
+  'saint-loubes': { 'centre-ville': 0, 'saint-sulpice-et-cameyrac': 1, montussan: 2, 'sainte-eulalie': 3, 'cubzac-les-ponts': 4, izon: 5, yvrac: 6 },
+  lambesc: { 'centre-ville': 0, vernegues: 1, charleval: 2, 'saint-cannat': 3, pelissanne: 4, 'la-roque-d-antheron': 5, rognes: 6 },
+  'pont-audemer': { 'centre-ville': 0, beuzeville: 1, 'bourg-achard': 2, brionne: 3, 'grand-bourgtheroulde': 4 },
+  'la-farlede': { 'centre-ville': 0, 'sollies-ville': 1, 'sollies-pont': 2, 'la-crau': 3, 'la-garde': 4, 'la-valette-du-var': 5, 'sollies-toucas': 6 },
+  'neuville-en-ferrain': { 'centre-ville': 0, halluin: 1, roncq: 2, tourcoing: 3, bousbecque: 4, mouvaux: 5, wattrelos: 6 },
+  loudeac: { 'centre-ville': 0 },
+  'mery-sur-oise': { 'centre-ville': 0 },
+  aniche: { 'centre-ville': 0 },
+  chambly: { 'centre-ville': 0 },
+  'saint-gregoire': { 'centre-ville': 0 },
+  leguevin: { 'centre-ville': 0 },
+  foix: { 'centre-ville': 0 },
+  voreppe: { 'centre-ville': 0 },
+  'bourg-de-peage': { 'centre-ville': 0 },
+  'lancon-provence': { 'centre-ville': 0 },
+  'saint-max': { 'centre-ville': 0 },
+  'saint-amand-montrond': { 'centre-ville': 0 },
+  'saint-laurent-de-la-salanque': { 'centre-ville': 0 },
+  'saint-lys': { 'centre-ville': 0 },
+  carmaux: { 'centre-ville': 0 },
+  ezanville: { 'centre-ville': 0 },
+  lorgues: { 'centre-ville': 0 },
+  beauchamp: { 'centre-ville': 0 },
+  'roche-la-moliere': { 'centre-ville': 0 },
+  'le-rheu': { 'centre-ville': 0 },
+  merville: { 'centre-ville': 0 },
+  frouzins: { 'centre-ville': 0 },
+  figeac: { 'centre-ville': 0 },
+  'portet-sur-garonne': { 'centre-ville': 0 },
+  montlhery: { 'centre-ville': 0 },
+  'grand-couronne': { 'centre-ville': 0 },
+  'mezidon-vallee-d-auge': { 'centre-ville': 0 },
+  bernay: { 'centre-ville': 0 },
+  revel: { 'centre-ville': 0 },
+  bondues: { 'centre-ville': 0 },
+  aytre: { 'centre-ville': 0 },
+  'montigny-en-gohelle': { 'centre-ville': 0 },
+  'cosne-cours-sur-loire': { 'centre-ville': 0 },
+  'saint-barthelemy-d-anjou': { 'centre-ville': 0 },
+  'saint-sulpice-la-pointe': { 'centre-ville': 0 },
+  'basse-goulaine': { 'centre-ville': 0 },
+  'grand-santi': { 'centre-ville': 0 },
+  'saint-doulchard': { 'centre-ville': 0 },
+  aucamville: { 'centre-ville': 0 },
+  'saint-jean-d-illac': { 'centre-ville': 0 },
+  perols: { 'centre-ville': 0 },
+  crosne: { 'centre-ville': 0 },
+  'gros-morne': { 'centre-ville': 0 },
+  lesquin: { 'centre-ville': 0 },
+  'saint-remy-de-provence': { 'centre-ville': 0 },
+  'aire-sur-la-lys': { 'centre-ville': 0 },
+  audenge: { 'centre-ville': 0 },
+  maripasoula: { 'centre-ville': 0 },
+  'nort-sur-erdre': { 'centre-ville': 0 },
+  darnetal: { 'centre-ville': 0 },
+  'saint-jean-le-blanc': { 'centre-ville': 0 },
+  sene: { 'centre-ville': 0 },
+  'bures-sur-yvette': { 'centre-ville': 0 },
+  savenay: { 'centre-ville': 0 },
+  redon: { 'centre-ville': 0 },
+  'l-isle-jourdain': { 'centre-ville': 0 },
+  leers: { 'centre-ville': 0 },
+  albert: { 'centre-ville': 0 },
+  'ville-la-grand': { 'centre-ville': 0 },
+  'petit-caux': { 'centre-ville': 0 },
+  elne: { 'centre-ville': 0 },
+  vallet: { 'centre-ville': 0 },
+  'quincy-sous-senart': { 'centre-ville': 0 },
+  'clermont-l-herault': { 'centre-ville': 0 },
+  tonneins: { 'centre-ville': 0 },
+  lescar: { 'centre-ville': 0 },
+  arques: { 'centre-ville': 0 },
+  landivisiau: { 'centre-ville': 0 },
+  'dombasle-sur-meurthe': { 'centre-ville': 0 },
+  lucon: { 'centre-ville': 0 },
+  'basse-terre': { 'centre-ville': 0 },
+  sallaumines: { 'centre-ville': 0 },
+  guichen: { 'centre-ville': 0 },
+  'sainte-luce': { 'centre-ville': 0 },
+  carqueiranne: { 'centre-ville': 0 },
+  'saint-philbert-de-grand-lieu': { 'centre-ville': 0 },
+  belley: { 'centre-ville': 0 },
+  'magny-les-hameaux': { 'centre-ville': 0 },
+  chaponost: { 'centre-ville': 0 },
+  rombas: { 'centre-ville': 0 },
+  'mont-saint-martin': { 'centre-ville': 0 },
+  'jarville-la-malgrange': { 'centre-ville': 0 },
+  liffre: { 'centre-ville': 0 },
+  'la-ravoire': { 'centre-ville': 0 },
+  'livron-sur-drome': { 'centre-ville': 0 },
+  'le-passage': { 'centre-ville': 0 },
+  molsheim: { 'centre-ville': 0 },
+  'nogent-le-rotrou': { 'centre-ville': 0 },
+  'paray-le-monial': { 'centre-ville': 0 },
+  poisy: { 'centre-ville': 0 },
+  'vert-saint-denis': { 'centre-ville': 0 },
+  hagondange: { 'centre-ville': 0 },
+  'les-sorinieres': { 'centre-ville': 0 },
+  rivesaltes: { 'centre-ville': 0 },
+  'evian-les-bains': { 'centre-ville': 0 },
+  'conde-sur-l-escaut': { 'centre-ville': 0 },
+  'fontaine-les-dijon': { 'centre-ville': 0 },
+  'le-cres': { 'centre-ville': 0 },
+  lifou: { 'centre-ville': 0 },
+  valreas: { 'centre-ville': 0 },
+  dardilly: { 'centre-ville': 0 },
+  ouistreham: { 'centre-ville': 0 },
+  sarzeau: { 'centre-ville': 0 },
+  beuvry: { 'centre-ville': 0 },
+  ussel: { 'centre-ville': 0 },
+  capbreton: { 'centre-ville': 0 },
+  'le-teich': { 'centre-ville': 0 },
+  launaguet: { 'centre-ville': 0 },
+  scionzier: { 'centre-ville': 0 },
+  breuillet: { 'centre-ville': 0 },
+  'prevessin-moens': { 'centre-ville': 0 },
+  'varennes-vauzelles': { 'centre-ville': 0 },
+  bougival: { 'centre-ville': 0 },
+  tomblaine: { 'centre-ville': 0 },
+  grabels: { 'centre-ville': 0 },
+  checy: { 'centre-ville': 0 },
+  lamorlaye: { 'centre-ville': 0 },
+  grenade: { 'centre-ville': 0 },
+  'magny-le-hongre': { 'centre-ville': 0 },
+  'la-fare-les-oliviers': { 'centre-ville': 0 },
+  escaudain: { 'centre-ville': 0 },
+  irigny: { 'centre-ville': 0 },
+  'morieres-les-avignon': { 'centre-ville': 0 },
+  joigny: { 'centre-ville': 0 },
+  queven: { 'centre-ville': 0 },
+  'saint-paul-trois-chateaux': { 'centre-ville': 0 },
+  cornebarrieu: { 'centre-ville': 0 },
+  pibrac: { 'centre-ville': 0 },
+  veauche: { 'centre-ville': 0 },
+  quetigny: { 'centre-ville': 0 },
+  boucau: { 'centre-ville': 0 },
+  cebazat: { 'centre-ville': 0 },
+  'meulan-en-yvelines': { 'centre-ville': 0 },
+  'bellerive-sur-allier': { 'centre-ville': 0 },
+  velaux: { 'centre-ville': 0 },
+  'epagny-metz-tessy': { 'centre-ville': 0 },
+  chirongui: { 'centre-ville': 0 },
+  'gonfreville-l-orcher': { 'centre-ville': 0 },
+  roquevaire: { 'centre-ville': 0 },
+  'entraigues-sur-la-sorgue': { 'centre-ville': 0 },
+  'les-angles': { 'centre-ville': 0 },
+  longvic: { 'centre-ville': 0 },
+  'le-thor': { 'centre-ville': 0 },
+  'chartres-de-bretagne': { 'centre-ville': 0 },
+  perigny: { 'centre-ville': 0 },
+  bessancourt: { 'centre-ville': 0 },
+  'saint-jean-de-monts': { 'centre-ville': 0 },
+  gouvieux: { 'centre-ville': 0 },
+  nangis: { 'centre-ville': 0 },
+  pithiviers: { 'centre-ville': 0 },
+  golbey: { 'centre-ville': 0 },
+  'gretz-armainvilliers': { 'centre-ville': 0 },
+  'monistrol-sur-loire': { 'centre-ville': 0 },
+  'ombree-d-anjou': { 'centre-ville': 0 },
+  'le-portel': { 'centre-ville': 0 },
+  'sarlat-la-caneda': { 'centre-ville': 0 },
+  'la-chapelle-d-armentieres': { 'centre-ville': 0 },
+  'les-hauts-d-anjou': { 'centre-ville': 0 },
+  'la-ferte-bernard': { 'centre-ville': 0 },
+  'le-teil': { 'centre-ville': 0 },
+  wingles: { 'centre-ville': 0 },
+  beauzelle: { 'centre-ville': 0 },
+  lempdes: { 'centre-ville': 0 },
+  'chamonix-mont-blanc': { 'centre-ville': 0 },
+  soustons: { 'centre-ville': 0 },
+  'aigues-mortes': { 'centre-ville': 0 },
+  'l-ile-saint-denis': { 'centre-ville': 0 },
+  'artigues-pres-bordeaux': { 'centre-ville': 0 },
+  plabennec: { 'centre-ville': 0 },
+  'petit-couronne': { 'centre-ville': 0 },
+  coutras: { 'centre-ville': 0 },
+  'margny-les-compiegne': { 'centre-ville': 0 },
+  'saint-chamas': { 'centre-ville': 0 },
+  'essey-les-nancy': { 'centre-ville': 0 },
+  'thorigne-fouillard': { 'centre-ville': 0 },
+  'saint-jory': { 'centre-ville': 0 },
+  crest: { 'centre-ville': 0 },
+  isbergues: { 'centre-ville': 0 },
+  janze: { 'centre-ville': 0 },
+  'le-poire-sur-vie': { 'centre-ville': 0 },
+  'souleuvre-en-bocage': { 'centre-ville': 0 },
+  domerat: { 'centre-ville': 0 },
+  marcoussis: { 'centre-ville': 0 },
+  'aulnoye-aymeries': { 'centre-ville': 0 },
+  crolles: { 'centre-ville': 0 },
+  'ergue-gaberic': { 'centre-ville': 0 },
+  'puget-sur-argens': { 'centre-ville': 0 },
+  roussillon: { 'centre-ville': 0 },
+  'le-grau-du-roi': { 'centre-ville': 0 },
+  serignan: { 'centre-ville': 0 },
+  'saint-renan': { 'centre-ville': 0 },
+  'port-saint-louis-du-rhone': { 'centre-ville': 0 },
+  mauleon: { 'centre-ville': 0 },
+  chantonnay: { 'centre-ville': 0 },
+  sautron: { 'centre-ville': 0 },
+  'le-loroux-bottereau': { 'centre-ville': 0 },
+  rouvroy: { 'centre-ville': 0 },
+  'thaon-les-vosges': { 'centre-ville': 0 },
+  'chateauneuf-sur-loire': { 'centre-ville': 0 },
+  'bormes-les-mimosas': { 'centre-ville': 0 },
+  'varces-allieres-et-risset': { 'centre-ville': 0 },
+  lillebonne: { 'centre-ville': 0 },
+  privas: { 'centre-ville': 0 },
+  'vendin-le-vieil': { 'centre-ville': 0 },
+  vif: { 'centre-ville': 0 },
+  uzes: { 'centre-ville': 0 },
+  'le-plessis-bouchard': { 'centre-ville': 0 },
+  peymeinade: { 'centre-ville': 0 },
+  unieux: { 'centre-ville': 0 },
+  'la-salvetat-saint-gilles': { 'centre-ville': 0 },
+  'saint-vallier': { 'centre-ville': 0 },
+  'theix-noyalo': { 'centre-ville': 0 },
+  'talmont-saint-hilaire': { 'centre-ville': 0 },
+  'le-marin': { 'centre-ville': 0 },
+  'pont-l-abbe': { 'centre-ville': 0 },
+  'le-vauclin': { 'centre-ville': 0 },
+  eguilles: { 'centre-ville': 0 },
+  onnaing: { 'centre-ville': 0 },
+  'ballan-mire': { 'centre-ville': 0 },
+  hirson: { 'centre-ville': 0 },
+  'reignier-esery': { 'centre-ville': 0 },
+  perenchies: { 'centre-ville': 0 },
+  groslay: { 'centre-ville': 0 },
+  tregueux: { 'centre-ville': 0 },
+  'saint-aubin-les-elbeuf': { 'centre-ville': 0 },
+  'la-grande-motte': { 'centre-ville': 0 },
+  bassens: { 'centre-ville': 0 },
+  vaucresson: { 'centre-ville': 0 },
+  pignan: { 'centre-ville': 0 },
+  'gennes-val-de-loire': { 'centre-ville': 0 },
+  venelles: { 'centre-ville': 0 },
+  'larmor-plage': { 'centre-ville': 0 },
+  marseillan: { 'centre-ville': 0 },
+  trignac: { 'centre-ville': 0 },
+  orchies: { 'centre-ville': 0 },
+  'taiarapu-ouest': { 'centre-ville': 0 },
+  feurs: { 'centre-ville': 0 },
+  'noyal-chatillon-sur-seiche': { 'centre-ville': 0 },
+  marguerittes: { 'centre-ville': 0 },
+  bouaye: { 'centre-ville': 0 },
+  'saint-gilles-croix-de-vie': { 'centre-ville': 0 },
+  'carbon-blanc': { 'centre-ville': 0 },
+  coutances: { 'centre-ville': 0 },
+  bihorel: { 'centre-ville': 0 },
+  'saint-pierre-les-elbeuf': { 'centre-ville': 0 },
+  chiconi: { 'centre-ville': 0 },
+  'tonnay-charente': { 'centre-ville': 0 },
+  harfleur: { 'centre-ville': 0 },
+  'tournan-en-brie': { 'centre-ville': 0 },
+  guilers: { 'centre-ville': 0 },
+  bandol: { 'centre-ville': 0 },
+  'brunstatt-didenheim': { 'centre-ville': 0 },
+  evron: { 'centre-ville': 0 },
+  meximieux: { 'centre-ville': 0 },
+  'teteghem-coudekerque-village': { 'centre-ville': 0 },
+  thuir: { 'centre-ville': 0 },
+  pegomas: { 'centre-ville': 0 },
+  malemort: { 'centre-ville': 0 },
+  souffelweyersheim: { 'centre-ville': 0 },
+  'charnay-les-macon': { 'centre-ville': 0 },
+  donges: { 'centre-ville': 0 },
+  mazingarbe: { 'centre-ville': 0 },
+  'petit-canal': { 'centre-ville': 0 },
+  salles: { 'centre-ville': 0 },
+  'vern-sur-seiche': { 'centre-ville': 0 },
+  anse: { 'centre-ville': 0 },
+  'la-colle-sur-loup': { 'centre-ville': 0 },
+  'paray-vieille-poste': { 'centre-ville': 0 },
+  'ballancourt-sur-essonne': { 'centre-ville': 0 },
+  'le-mesnil-esnard': { 'centre-ville': 0 },
+  linselles: { 'centre-ville': 0 },
+  'la-ville-du-bois': { 'centre-ville': 0 },
+  chinon: { 'centre-ville': 0 },
+  questembert: { 'centre-ville': 0 },
+  'val-de-briey': { 'centre-ville': 0 },
+  coulaines: { 'centre-ville': 0 },
+  'cavalaire-sur-mer': { 'centre-ville': 0 },
+  talange: { 'centre-ville': 0 },
+  'rochefort-du-gard': { 'centre-ville': 0 },
+  sorbiers: { 'centre-ville': 0 },
+  'verrieres-en-anjou': { 'centre-ville': 0 },
+  'la-tour-du-pin': { 'centre-ville': 0 },
+  'les-arcs': { 'centre-ville': 0 },
+  'boussy-saint-antoine': { 'centre-ville': 0 },
+  seyssins: { 'centre-ville': 0 },
+  uvea: { 'centre-ville': 0 },
+  guenange: { 'centre-ville': 0 },
+  monts: { 'centre-ville': 0 },
+  vineuil: { 'centre-ville': 0 },
+  wintzenheim: { 'centre-ville': 0 },
+  'martignas-sur-jalle': { 'centre-ville': 0 },
+  jarny: { 'centre-ville': 0 },
+  kone: { 'centre-ville': 0 },
+  languidic: { 'centre-ville': 0 },
+  'la-ricamarie': { 'centre-ville': 0 },
+  champagnole: { 'centre-ville': 0 },
+  bellegarde: { 'centre-ville': 0 },
+  gleize: { 'centre-ville': 0 },
+  'tignieu-jameyzieu': { 'centre-ville': 0 },
+  aureilhan: { 'centre-ville': 0 },
+  beaugency: { 'centre-ville': 0 },
+  'le-malesherbois': { 'centre-ville': 0 },
+  'saint-vincent-de-tyrosse': { 'centre-ville': 0 },
+  vaujours: { 'centre-ville': 0 },
+  aussonne: { 'centre-ville': 0 },
+  isle: { 'centre-ville': 0 },
+  louveciennes: { 'centre-ville': 0 },
+  linas: { 'centre-ville': 0 },
+  'jouy-en-josas': { 'centre-ville': 0 },
+  libercourt: { 'centre-ville': 0 },
+  'le-soler': { 'centre-ville': 0 },
+  'saint-affrique': { 'centre-ville': 0 },
+  langueux: { 'centre-ville': 0 },
+  'billy-montigny': { 'centre-ville': 0 },
+  houplines: { 'centre-ville': 0 },
+  geispolsheim: { 'centre-ville': 0 },
+  mordelles: { 'centre-ville': 0 },
+  'lege-cap-ferret': { 'centre-ville': 0 },
+  contes: { 'centre-ville': 0 },
+  ustaritz: { 'centre-ville': 0 },
+  romagnat: { 'centre-ville': 0 },
+  'saint-julien-de-concelles': { 'centre-ville': 0 },
+  lure: { 'centre-ville': 0 },
+  achicourt: { 'centre-ville': 0 },
+  gargenville: { 'centre-ville': 0 },
+  'saint-pierre-en-faucigny': { 'centre-ville': 0 },
+  publier: { 'centre-ville': 0 },
+  sisteron: { 'centre-ville': 0 },
+  'cappelle-la-grande': { 'centre-ville': 0 },
+  claix: { 'centre-ville': 0 },
+  'coulounieix-chamiers': { 'centre-ville': 0 },
+  bompas: { 'centre-ville': 0 },
+  'courcelles-les-lens': { 'centre-ville': 0 },
+  baillargues: { 'centre-ville': 0 },
+  malzeville: { 'centre-ville': 0 },
+  corte: { 'centre-ville': 0 },
+  moirans: { 'centre-ville': 0 },
+  'neuville-sur-saone': { 'centre-ville': 0 },
+  'montreuil-juigne': { 'centre-ville': 0 },
+  lagord: { 'centre-ville': 0 },
+  terville: { 'centre-ville': 0 },
+  pezenas: { 'centre-ville': 0 },
+  'la-verpilliere': { 'centre-ville': 0 },
+  'saint-etienne-de-montluc': { 'centre-ville': 0 },
+  'hettange-grande': { 'centre-ville': 0 },
+  chessy: { 'centre-ville': 0 },
+  'saint-aubin-de-medoc': { 'centre-ville': 0 },
+  'saint-denis-en-val': { 'centre-ville': 0 },
+  'la-couronne': { 'centre-ville': 0 },
+  nieppe: { 'centre-ville': 0 },
+  thann: { 'centre-ville': 0 },
+  'cranves-sales': { 'centre-ville': 0 },
+  wavrin: { 'centre-ville': 0 },
+  'lys-haut-layon': { 'centre-ville': 0 },
+  'saint-remy-les-chevreuse': { 'centre-ville': 0 },
+  'noisy-le-roi': { 'centre-ville': 0 },
+  'les-andelys': { 'centre-ville': 0 },
+  mtsamboro: { 'centre-ville': 0 },
+  beynes: { 'centre-ville': 0 },
+  'saint-marcellin': { 'centre-ville': 0 },
+  'les-avenieres-veyrins-thuellin': { 'centre-ville': 0 },
+  emerainville: { 'centre-ville': 0 },
+  'machecoul-saint-meme': { 'centre-ville': 0 },
+  bidart: { 'centre-ville': 0 },
+  pluvigner: { 'centre-ville': 0 },
+  falaise: { 'centre-ville': 0 },
+  langon: { 'centre-ville': 0 },
+  'bain-de-bretagne': { 'centre-ville': 0 },
+  mimizan: { 'centre-ville': 0 },
+  villars: { 'centre-ville': 0 },
+  'l-aigle': { 'centre-ville': 0 },
+  'bourg-saint-andeol': { 'centre-ville': 0 },
+  biguglia: { 'centre-ville': 0 },
+  hasparren: { 'centre-ville': 0 },
+  tullins: { 'centre-ville': 0 },
+  'saint-prix': { 'centre-ville': 0 },
+  deols: { 'centre-ville': 0 },
+  'saint-maixent-l-ecole': { 'centre-ville': 0 },
+  loireauxence: { 'centre-ville': 0 },
+  'parentis-en-born': { 'centre-ville': 0 },
+  auxonne: { 'centre-ville': 0 },
+  gerardmer: { 'centre-ville': 0 },
+  'saint-peray': { 'centre-ville': 0 },
+  'sausset-les-pins': { 'centre-ville': 0 },
+  lesneven: { 'centre-ville': 0 },
+  wissembourg: { 'centre-ville': 0 },
+  goyave: { 'centre-ville': 0 },
+  rosporden: { 'centre-ville': 0 },
+  'faverges-seythenex': { 'centre-ville': 0 },
+  'saint-apollinaire': { 'centre-ville': 0 },
+  melesse: { 'centre-ville': 0 },
+  'saint-yrieix-sur-charente': { 'centre-ville': 0 },
+  'suce-sur-erdre': { 'centre-ville': 0 },
+  chateaubourg: { 'centre-ville': 0 },
+  'jaunay-marigny': { 'centre-ville': 0 },
+  'saint-jean-de-maurienne': { 'centre-ville': 0 },
+  ceret: { 'centre-ville': 0 },
+  'villard-bonnot': { 'centre-ville': 0 },
+  crozon: { 'centre-ville': 0 },
+  huningue: { 'centre-ville': 0 },
+  'saint-berthevin': { 'centre-ville': 0 },
+  'saint-germain-les-corbeil': { 'centre-ville': 0 },
+  pordic: { 'centre-ville': 0 },
+  clisson: { 'centre-ville': 0 },
+  toulouges: { 'centre-ville': 0 },
+  fabregues: { 'centre-ville': 0 },
+  rethel: { 'centre-ville': 0 },
+  saujon: { 'centre-ville': 0 },
+  'chaumes-en-retz': { 'centre-ville': 0 },
+  'saint-didier-au-mont-d-or': { 'centre-ville': 0 },
+  langres: { 'centre-ville': 0 },
+  'soisy-sur-seine': { 'centre-ville': 0 },
+  yssingeaux: { 'centre-ville': 0 },
+  'trois-rivieres': { 'centre-ville': 0 },
+  'carhaix-plouguer': { 'centre-ville': 0 },
+  lagnieu: { 'centre-ville': 0 },
+  'ruelle-sur-touvre': { 'centre-ville': 0 },
+  remiremont: { 'centre-ville': 0 },
+  gieres: { 'centre-ville': 0 },
+  lisses: { 'centre-ville': 0 },
+  trelissac: { 'centre-ville': 0 },
+  cournonterral: { 'centre-ville': 0 },
+  'saint-nicolas-de-port': { 'centre-ville': 0 },
+  'audun-le-tiche': { 'centre-ville': 0 },
+  'guipry-messac': { 'centre-ville': 0 },
+  'fresnes-sur-escaut': { 'centre-ville': 0 },
+  digoin: { 'centre-ville': 0 },
+  pontcharra: { 'centre-ville': 0 },
+  paimpol: { 'centre-ville': 0 },
+  lanton: { 'centre-ville': 0 },
+  'perros-guirec': { 'centre-ville': 0 },
+  'villemoisson-sur-orge': { 'centre-ville': 0 },
+  barlin: { 'centre-ville': 0 },
+  courtry: { 'centre-ville': 0 },
+  'rosny-sur-seine': { 'centre-ville': 0 },
+  'gournay-sur-marne': { 'centre-ville': 0 },
+  'moyeuvre-grande': { 'centre-ville': 0 },
+  courdimanche: { 'centre-ville': 0 },
+  'saint-christol-lez-ales': { 'centre-ville': 0 },
+  'nanteuil-les-meaux': { 'centre-ville': 0 },
+  gourbeyre: { 'centre-ville': 0 },
+  ensisheim: { 'centre-ville': 0 },
+  'roquefort-les-pins': { 'centre-ville': 0 },
+  'le-pian-medoc': { 'centre-ville': 0 },
+  vizille: { 'centre-ville': 0 },
+  'la-ferte-saint-aubin': { 'centre-ville': 0 },
+  'montoir-de-bretagne': { 'centre-ville': 0 },
+  'le-mesnil-saint-denis': { 'centre-ville': 0 },
+  'bourg-saint-maurice': { 'centre-ville': 0 },
+  salazie: { 'centre-ville': 0 },
+  waziers: { 'centre-ville': 0 },
+  'la-gaude': { 'centre-ville': 0 },
+  'saint-pee-sur-nivelle': { 'centre-ville': 0 },
+  vendargues: { 'centre-ville': 0 },
+  'divatte-sur-loire': { 'centre-ville': 0 },
+  orgeval: { 'centre-ville': 0 },
+  lodeve: { 'centre-ville': 0 },
+  colombelles: { 'centre-ville': 0 },
+  mably: { 'centre-ville': 0 },
+  herbignac: { 'centre-ville': 0 },
+  chauray: { 'centre-ville': 0 },
+  'les-trois-bassins': { 'centre-ville': 0 },
+  caudan: { 'centre-ville': 0 },
+  kervignac: { 'centre-ville': 0 },
+  'templeuve-en-pevele': { 'centre-ville': 0 },
+  ecouen: { 'centre-ville': 0 },
+  'sainte-pazanne': { 'centre-ville': 0 },
+  'verneuil-d-avre-et-d-iton': { 'centre-ville': 0 },
+  'aubigny-les-clouzeaux': { 'centre-ville': 0 },
+  labenne: { 'centre-ville': 0 },
+  montauroux: { 'centre-ville': 0 },
+  'entre-deux': { 'centre-ville': 0 },
+  pleurtuit: { 'centre-ville': 0 },
+  egly: { 'centre-ville': 0 },
+  'saint-ismier': { 'centre-ville': 0 },
+  eckbolsheim: { 'centre-ville': 0 },
+  ugine: { 'centre-ville': 0 },
+  wissous: { 'centre-ville': 0 },
+  tregunc: { 'centre-ville': 0 },
+  'balaruc-les-bains': { 'centre-ville': 0 },
+  'la-talaudiere': { 'centre-ville': 0 },
+  eyguieres: { 'centre-ville': 0 },
+  'bagneres-de-bigorre': { 'centre-ville': 0 },
+  guingamp: { 'centre-ville': 0 },
+  viriat: { 'centre-ville': 0 },
+  'saint-pierre-en-auge': { 'centre-ville': 0 },
+  'pont-saint-martin': { 'centre-ville': 0 },
+  peronne: { 'centre-ville': 0 },
+  auby: { 'centre-ville': 0 },
+  'aulnoy-lez-valenciennes': { 'centre-ville': 0 },
+  villemandeur: { 'centre-ville': 0 },
+  'vieux-habitants': { 'centre-ville': 0 },
+  'notre-dame-de-bondeville': { 'centre-ville': 0 },
+  'grandchamp-des-fontaines': { 'centre-ville': 0 },
+  leforest: { 'centre-ville': 0 },
+  barr: { 'centre-ville': 0 },
+  brech: { 'centre-ville': 0 },
+  manduel: { 'centre-ville': 0 },
+  'binic-etables-sur-mer': { 'centre-ville': 0 },
+  jurancon: { 'centre-ville': 0 },
+  epone: { 'centre-ville': 0 },
+  uckange: { 'centre-ville': 0 },
+  'sathonay-camp': { 'centre-ville': 0 },
+  trevoux: { 'centre-ville': 0 },
+  'saint-andre-des-eaux': { 'centre-ville': 0 },
+  'soultz-haut-rhin': { 'centre-ville': 0 },
+  chauvigny: { 'centre-ville': 0 },
+  'sainte-adresse': { 'centre-ville': 0 },
+  'castelnau-d-estretefonds': { 'centre-ville': 0 },
+  'saint-rambert-d-albon': { 'centre-ville': 0 },
+  nerac: { 'centre-ville': 0 },
+  marsillargues: { 'centre-ville': 0 },
+  etrechy: { 'centre-ville': 0 },
+  'saint-bonnet-de-mure': { 'centre-ville': 0 },
+  'bailly-romainvilliers': { 'centre-ville': 0 },
+  betheny: { 'centre-ville': 0 },
+  valognes: { 'centre-ville': 0 },
+  'fontaines-sur-saone': { 'centre-ville': 0 },
+  cognin: { 'centre-ville': 0 },
+  morteau: { 'centre-ville': 0 },
+  luisant: { 'centre-ville': 0 },
+  houdain: { 'centre-ville': 0 },
+  'saint-pol-de-leon': { 'centre-ville': 0 },
+  'la-plaine-des-palmistes': { 'centre-ville': 0 },
+  pledran: { 'centre-ville': 0 },
+  bourbourg: { 'centre-ville': 0 },
+  senas: { 'centre-ville': 0 },
+  escalquens: { 'centre-ville': 0 },
+  jacou: { 'centre-ville': 0 },
+  lucciana: { 'centre-ville': 0 },
+  lesigny: { 'centre-ville': 0 },
+  change: { 'centre-ville': 0 },
+  cadaujac: { 'centre-ville': 0 },
+  'trans-en-provence': { 'centre-ville': 0 },
+  'beaufort-en-anjou': { 'centre-ville': 0 },
+  surgeres: { 'centre-ville': 0 },
+  montluel: { 'centre-ville': 0 },
+  'saint-maurice-l-exil': { 'centre-ville': 0 },
+  castries: { 'centre-ville': 0 },
+  acigne: { 'centre-ville': 0 },
+  'carnoux-en-provence': { 'centre-ville': 0 },
+  veigne: { 'centre-ville': 0 },
+  'auvers-sur-oise': { 'centre-ville': 0 },
+  'le-controis-en-sologne': { 'centre-ville': 0 },
+  'noyelles-sous-lens': { 'centre-ville': 0 },
+  lutterbach: { 'centre-ville': 0 },
+  'essarts-en-bocage': { 'centre-ville': 0 },
+  'les-abrets-en-dauphine': { 'centre-ville': 0 },
+  'le-coteau': { 'centre-ville': 0 },
+  loudun: { 'centre-ville': 0 },
+  'laudun-l-ardoise': { 'centre-ville': 0 },
+  domene: { 'centre-ville': 0 },
+  chabeuil: { 'centre-ville': 0 },
+  'saint-thibault-des-vignes': { 'centre-ville': 0 },
+  'les-essarts-le-roi': { 'centre-ville': 0 },
+  'saint-yrieix-la-perche': { 'centre-ville': 0 },
+  nyons: { 'centre-ville': 0 },
+  'montfort-sur-meu': { 'centre-ville': 0 },
+  'quesnoy-sur-deule': { 'centre-ville': 0 },
+  caussade: { 'centre-ville': 0 },
+  'loos-en-gohelle': { 'centre-ville': 0 },
+  poussan: { 'centre-ville': 0 },
+  beuvrages: { 'centre-ville': 0 },
+  douvaine: { 'centre-ville': 0 },
+  ploeren: { 'centre-ville': 0 },
+  liancourt: { 'centre-ville': 0 },
+  'saint-jean-d-angely': { 'centre-ville': 0 },
+  brindas: { 'centre-ville': 0 },
+  divion: { 'centre-ville': 0 },
+  puilboreau: { 'centre-ville': 0 },
+  'le-cateau-cambresis': { 'centre-ville': 0 },
+  'saint-julien-les-villas': { 'centre-ville': 0 },
+  'merville-31': { 'centre-ville': 0 },
+  'cambo-les-bains': { 'centre-ville': 0 },
+  plouguerneau: { 'centre-ville': 0 },
+  'moelan-sur-mer': { 'centre-ville': 0 },
+  meyreuil: { 'centre-ville': 0 },
+  gaillon: { 'centre-ville': 0 },
+  itteville: { 'centre-ville': 0 },
+  'saint-alban-leysse': { 'centre-ville': 0 },
+  'saulx-les-chartreux': { 'centre-ville': 0 },
+  neufchateau: { 'centre-ville': 0 },
+  'saint-victoret': { 'centre-ville': 0 },
+  'le-peage-de-roussillon': { 'centre-ville': 0 },
+  othis: { 'centre-ville': 0 },
+  feignies: { 'centre-ville': 0 },
+  'vallons-de-l-erdre': { 'centre-ville': 0 },
+  'vigneux-de-bretagne': { 'centre-ville': 0 },
+  'inzinzac-lochrist': { 'centre-ville': 0 },
+  migennes: { 'centre-ville': 0 },
+  fronton: { 'centre-ville': 0 },
+  'meung-sur-loire': { 'centre-ville': 0 },
+  'luxeuil-les-bains': { 'centre-ville': 0 },
+  montech: { 'centre-ville': 0 },
+  cassis: { 'centre-ville': 0 },
+  'chalonnes-sur-loire': { 'centre-ville': 0 },
+  thones: { 'centre-ville': 0 },
+  'chatelaillon-plage': { 'centre-ville': 0 },
+  gignac: { 'centre-ville': 0 },
+  elven: { 'centre-ville': 0 },
+  'la-bassee': { 'centre-ville': 0 },
+  'le-lavandou': { 'centre-ville': 0 },
+  grenay: { 'centre-ville': 0 },
+  honfleur: { 'centre-ville': 0 },
+  gigean: { 'centre-ville': 0 },
+  'saint-pierre-d-oleron': { 'centre-ville': 0 },
+  'laneuveville-devant-nancy': { 'centre-ville': 0 },
+  lentilly: { 'centre-ville': 0 },
+  'sury-le-comtal': { 'centre-ville': 0 },
+  canohes: { 'centre-ville': 0 },
+  'loriol-sur-drome': { 'centre-ville': 0 },
+  'la-penne-sur-huveaune': { 'centre-ville': 0 },
+  'montauban-de-bretagne': { 'centre-ville': 0 },
+  bouffemont: { 'centre-ville': 0 },
+  ceyrat: { 'centre-ville': 0 },
+  'chasse-sur-rhone': { 'centre-ville': 0 },
+  furiani: { 'centre-ville': 0 },
+  'labarthe-sur-leze': { 'centre-ville': 0 },
+  heric: { 'centre-ville': 0 },
+  labruguiere: { 'centre-ville': 0 },
+  bouchemaine: { 'centre-ville': 0 },
+  gemenos: { 'centre-ville': 0 },
+  'longuenee-en-anjou': { 'centre-ville': 0 },
+  thoiry: { 'centre-ville': 0 },
+  'le-lorrain': { 'centre-ville': 0 },
+  'longue-jumelles': { 'centre-ville': 0 },
+  'saint-juery': { 'centre-ville': 0 },
+  'saint-jean-bonnefonds': { 'centre-ville': 0 },
+  'le-mene': { 'centre-ville': 0 },
+  champigneulles: { 'centre-ville': 0 },
+  rives: { 'centre-ville': 0 },
+  'la-bouilladisse': { 'centre-ville': 0 },
+  'sainte-livrade-sur-lot': { 'centre-ville': 0 },
+  eaunes: { 'centre-ville': 0 },
+  'la-chevroliere': { 'centre-ville': 0 },
+  'marange-silvange': { 'centre-ville': 0 },
+  'l-arbresle': { 'centre-ville': 0 },
+  'saint-alban': { 'centre-ville': 0 },
+  cormontreuil: { 'centre-ville': 0 },
+  'la-mulatiere': { 'centre-ville': 0 },
+  ondres: { 'centre-ville': 0 },
+  'bon-encontre': { 'centre-ville': 0 },
+  lezoux: { 'centre-ville': 0 },
+  gueugnon: { 'centre-ville': 0 },
+  brioude: { 'centre-ville': 0 },
+  estaires: { 'centre-ville': 0 },
+  'neuves-maisons': { 'centre-ville': 0 },
+  'chatuzange-le-goubet': { 'centre-ville': 0 },
+  ploudalmezeau: { 'centre-ville': 0 },
+  ambert: { 'centre-ville': 0 },
+  limours: { 'centre-ville': 0 },
+  marignier: { 'centre-ville': 0 },
+  'les-trois-ilets': { 'centre-ville': 0 },
+  'la-montagne': { 'centre-ville': 0 },
+  'change-53': { 'centre-ville': 0 },
+  gouesnou: { 'centre-ville': 0 },
+  eu: { 'centre-ville': 0 },
+  'champagne-sur-seine': { 'centre-ville': 0 },
+  calvisson: { 'centre-ville': 0 },
+  ares: { 'centre-ville': 0 },
+  'longpont-sur-orge': { 'centre-ville': 0 },
+  'villers-saint-paul': { 'centre-ville': 0 },
+  'le-perray-en-yvelines': { 'centre-ville': 0 },
+  'saint-pathus': { 'centre-ville': 0 },
+  condom: { 'centre-ville': 0 },
+  'grezieu-la-varenne': { 'centre-ville': 0 },
+  'vezin-le-coquet': { 'centre-ville': 0 },
+  'saint-priest-en-jarez': { 'centre-ville': 0 },
+  cuincy: { 'centre-ville': 0 },
+  'saint-florent-sur-cher': { 'centre-ville': 0 },
+  entrelacs: { 'centre-ville': 0 },
+  'saint-laurent-blangy': { 'centre-ville': 0 },
+  'ploneour-lanvern': { 'centre-ville': 0 },
+  sciez: { 'centre-ville': 0 },
+  louhans: { 'centre-ville': 0 },
+  peronnas: { 'centre-ville': 0 },
+  frouard: { 'centre-ville': 0 },
+  bonsecours: { 'centre-ville': 0 },
+  'm-tsangamouji': { 'centre-ville': 0 },
+  'saint-andre-de-sangonis': { 'centre-ville': 0 },
+  courthezon: { 'centre-ville': 0 },
+  'la-tronche': { 'centre-ville': 0 },
+  'auneau-bleury-saint-symphorien': { 'centre-ville': 0 },
+  embrun: { 'centre-ville': 0 },
+  combourg: { 'centre-ville': 0 },
+  'saint-remy': { 'centre-ville': 0 },
+  'murs-erigne': { 'centre-ville': 0 },
+  'j-uf': { 'centre-ville': 0 },
+  'saint-flour': { 'centre-ville': 0 },
+  'breal-sous-montfort': { 'centre-ville': 0 },
+  'saint-jorioz': { 'centre-ville': 0 },
+  sevremont: { 'centre-ville': 0 },
+  magnanville: { 'centre-ville': 0 },
+  'mehun-sur-yevre': { 'centre-ville': 0 },
+  izon: { 'centre-ville': 0 },
+  baud: { 'centre-ville': 0 },
+  givet: { 'centre-ville': 0 },
+  plescop: { 'centre-ville': 0 },
+  'arpajon-sur-cere': { 'centre-ville': 0 },
+  ambilly: { 'centre-ville': 0 },
+  nandy: { 'centre-ville': 0 },
+  'villemur-sur-tarn': { 'centre-ville': 0 },
+  'bons-en-chablais': { 'centre-ville': 0 },
+  'le-mesnil-le-roi': { 'centre-ville': 0 },
+  'saint-cyr-au-mont-d-or': { 'centre-ville': 0 },
+  'dompierre-sur-mer': { 'centre-ville': 0 },
+  'champagne-au-mont-d-or': { 'centre-ville': 0 },
+  thyez: { 'centre-ville': 0 },
+  avallon: { 'centre-ville': 0 },
+  vaugneray: { 'centre-ville': 0 },
+  'pont-de-cheruy': { 'centre-ville': 0 },
+  'bonchamp-les-laval': { 'centre-ville': 0 },
+  'chatel-guyon': { 'centre-ville': 0 },
+  milhaud: { 'centre-ville': 0 },
+  esvres: { 'centre-ville': 0 },
+  louvroil: { 'centre-ville': 0 },
+  'vouneuil-sous-biard': { 'centre-ville': 0 },
+  lallaing: { 'centre-ville': 0 },
+  mazan: { 'centre-ville': 0 },
+  'migne-auxances': { 'centre-ville': 0 },
+  mare: { 'centre-ville': 0 },
+  mornant: { 'centre-ville': 0 },
+  'belin-beliet': { 'centre-ville': 0 },
+  'noyal-sur-vilaine': { 'centre-ville': 0 },
+  'sollies-toucas': { 'centre-ville': 0 },
+  'chatenoy-le-royal': { 'centre-ville': 0 },
+  huahine: { 'centre-ville': 0 },
+  pluneret: { 'centre-ville': 0 },
+  'saint-pryve-saint-mesmin': { 'centre-ville': 0 },
+  wimereux: { 'centre-ville': 0 },
+  homecourt: { 'centre-ville': 0 },
+  mer: { 'centre-ville': 0 },
+  'jassans-riottier': { 'centre-ville': 0 },
+  fleurance: { 'centre-ville': 0 },
+  bellevigny: { 'centre-ville': 0 },
+  'saint-martin-de-seignanx': { 'centre-ville': 0 },
+  'cuges-les-pins': { 'centre-ville': 0 },
+  loches: { 'centre-ville': 0 },
+  malaunay: { 'centre-ville': 0 },
+  'terrasson-lavilledieu': { 'centre-ville': 0 },
+  'pont-eveque': { 'centre-ville': 0 },
+  'aire-sur-l-adour': { 'centre-ville': 0 },
+  'saint-marcel': { 'centre-ville': 0 },
+  guer: { 'centre-ville': 0 },
+  'livarot-pays-d-auge': { 'centre-ville': 0 },
+  bruguieres: { 'centre-ville': 0 },
+  'horbourg-wihr': { 'centre-ville': 0 },
+  'saint-quentin-fallavier': { 'centre-ville': 0 },
+  boueni: { 'centre-ville': 0 },
+  'saint-symphorien-d-ozon': { 'centre-ville': 0 },
+  'prades-le-lez': { 'centre-ville': 0 },
+  menucourt: { 'centre-ville': 0 },
+  'thue-et-mue': { 'centre-ville': 0 },
+  'saint-genest-lerpt': { 'centre-ville': 0 },
+  'saint-marcel-les-valence': { 'centre-ville': 0 },
+  feytiat: { 'centre-ville': 0 },
+  'saint-mitre-les-remparts': { 'centre-ville': 0 },
+  'octeville-sur-mer': { 'centre-ville': 0 },
+  'petite-rosselle': { 'centre-ville': 0 },
+  'franqueville-saint-pierre': { 'centre-ville': 0 },
+  mallemort: { 'centre-ville': 0 },
+  'behren-les-forbach': { 'centre-ville': 0 },
+  'le-blanc': { 'centre-ville': 0 },
+  'aurec-sur-loire': { 'centre-ville': 0 },
+  'marennes-hiers-brouage': { 'centre-ville': 0 },
+  'le-diamant': { 'centre-ville': 0 },
+  'saint-denis-les-bourg': { 'centre-ville': 0 },
+  fayence: { 'centre-ville': 0 },
+  oraison: { 'centre-ville': 0 },
+  prades: { 'centre-ville': 0 },
+  jonage: { 'centre-ville': 0 },
+  dourges: { 'centre-ville': 0 },
+  vendenheim: { 'centre-ville': 0 },
+  'quint-fonsegrives': { 'centre-ville': 0 },
+  'palavas-les-flots': { 'centre-ville': 0 },
+  bouillante: { 'centre-ville': 0 },
+  'le-barcares': { 'centre-ville': 0 },
+  'blainville-sur-orne': { 'centre-ville': 0 },
+  'saint-cannat': { 'centre-ville': 0 },
+  'sainte-sigolene': { 'centre-ville': 0 },
+  ostricourt: { 'centre-ville': 0 },
+  'haute-goulaine': { 'centre-ville': 0 },
+  pecquencourt: { 'centre-ville': 0 },
+  'fouquieres-les-lens': { 'centre-ville': 0 },
+  mutzig: { 'centre-ville': 0 },
+  'pierrefeu-du-var': { 'centre-ville': 0 },
+  maule: { 'centre-ville': 0 },
+  'hersin-coupigny': { 'centre-ville': 0 },
+  noves: { 'centre-ville': 0 },
+  'mesnils-sur-iton': { 'centre-ville': 0 },
+  'saint-martin-le-vinoux': { 'centre-ville': 0 },
+  'bois-le-roi': { 'centre-ville': 0 },
+  esbly: { 'centre-ville': 0 },
+  bouillargues: { 'centre-ville': 0 },
+  'saint-jean-de-boiseau': { 'centre-ville': 0 },
+  beauvoisin: { 'centre-ville': 0 },
+  geveze: { 'centre-ville': 0 },
+  mondonville: { 'centre-ville': 0 },
+  'vaison-la-romaine': { 'centre-ville': 0 },
+  'mortagne-sur-sevre': { 'centre-ville': 0 },
+  'luc-la-primaube': { 'centre-ville': 0 },
+  'le-castellet': { 'centre-ville': 0 },
+  'jouars-pontchartrain': { 'centre-ville': 0 },
+  pavilly: { 'centre-ville': 0 },
+  'marly-la-ville': { 'centre-ville': 0 },
+  'trith-saint-leger': { 'centre-ville': 0 },
+  commentry: { 'centre-ville': 0 },
+  'vexin-sur-epte': { 'centre-ville': 0 },
+  'saint-girons': { 'centre-ville': 0 },
+  donzere: { 'centre-ville': 0 },
+  clapiers: { 'centre-ville': 0 },
+  'saint-mandrier-sur-mer': { 'centre-ville': 0 },
+  'noyelles-godault': { 'centre-ville': 0 },
+  'fontenay-tresigny': { 'centre-ville': 0 },
+  'la-verriere': { 'centre-ville': 0 },
+  'ablon-sur-seine': { 'centre-ville': 0 },
+  lavelanet: { 'centre-ville': 0 },
+  'conde-en-normandie': { 'centre-ville': 0 },
+  corbie: { 'centre-ville': 0 },
+  aubignan: { 'centre-ville': 0 },
+  'hombourg-haut': { 'centre-ville': 0 },
+  benfeld: { 'centre-ville': 0 },
+  marnaz: { 'centre-ville': 0 },
+  naintre: { 'centre-ville': 0 },
+  'roost-warendin': { 'centre-ville': 0 },
+  'saint-denis-de-pile': { 'centre-ville': 0 },
+  blanzy: { 'centre-ville': 0 },
+  vias: { 'centre-ville': 0 },
+  'loon-plage': { 'centre-ville': 0 },
+  'villennes-sur-seine': { 'centre-ville': 0 },
+  ciboure: { 'centre-ville': 0 },
+  quievrechain: { 'centre-ville': 0 },
+  'sains-en-gohelle': { 'centre-ville': 0 },
+  'fleury-sur-orne': { 'centre-ville': 0 },
+  'le-puy-sainte-reparade': { 'centre-ville': 0 },
+  montdidier: { 'centre-ville': 0 },
+  'grand-champ': { 'centre-ville': 0 },
+  'bellevigne-en-layon': { 'centre-ville': 0 },
+  negrepelisse: { 'centre-ville': 0 },
+  'tain-l-hermitage': { 'centre-ville': 0 },
+  fontenilles: { 'centre-ville': 0 },
+  'saint-pierre-d-irube': { 'centre-ville': 0 },
+  'saint-andre-de-la-roche': { 'centre-ville': 0 },
+  'bricquebec-en-cotentin': { 'centre-ville': 0 },
+  'aixe-sur-vienne': { 'centre-ville': 0 },
+  'raon-l-etape': { 'centre-ville': 0 },
+  'saintry-sur-seine': { 'centre-ville': 0 },
+  'saint-zacharie': { 'centre-ville': 0 },
+  eschau: { 'centre-ville': 0 },
+  'saint-arnoult-en-yvelines': { 'centre-ville': 0 },
+  'grand-charmont': { 'centre-ville': 0 },
+  'lesparre-medoc': { 'centre-ville': 0 },
+  douvrin: { 'centre-ville': 0 },
+  rabastens: { 'centre-ville': 0 },
+  'montpon-menesterol': { 'centre-ville': 0 },
+  riantec: { 'centre-ville': 0 },
+  'la-wantzenau': { 'centre-ville': 0 },
+  'gond-pontouvre': { 'centre-ville': 0 },
+  oberhausbergen: { 'centre-ville': 0 },
+  'le-poinconnet': { 'centre-ville': 0 },
+  seloncourt: { 'centre-ville': 0 },
+  'port-la-nouvelle': { 'centre-ville': 0 },
+  fismes: { 'centre-ville': 0 },
+  chambourcy: { 'centre-ville': 0 },
+  boe: { 'centre-ville': 0 },
+  ludres: { 'centre-ville': 0 },
+  'saint-martin-lez-tatinghem': { 'centre-ville': 0 },
+  ventabren: { 'centre-ville': 0 },
+  bessan: { 'centre-ville': 0 },
+  arradon: { 'centre-ville': 0 },
+  gareoult: { 'centre-ville': 0 },
+  kembs: { 'centre-ville': 0 },
+  roye: { 'centre-ville': 0 },
+  cessy: { 'centre-ville': 0 },
+  villabe: { 'centre-ville': 0 },
+  'dol-de-bretagne': { 'centre-ville': 0 },
+  'saint-galmier': { 'centre-ville': 0 },
+  sillingy: { 'centre-ville': 0 },
+  annezin: { 'centre-ville': 0 },
+  montmorillon: { 'centre-ville': 0 },
+  briec: { 'centre-ville': 0 },
+  buc: { 'centre-ville': 0 },
+  'nieul-sur-mer': { 'centre-ville': 0 },
+  lannemezan: { 'centre-ville': 0 },
+  'saint-just-en-chaussee': { 'centre-ville': 0 },
+  mouroux: { 'centre-ville': 0 },
+  viry: { 'centre-ville': 0 },
+  'le-barp': { 'centre-ville': 0 },
+  bedarieux: { 'centre-ville': 0 },
+  algrange: { 'centre-ville': 0 },
+  'roquefort-la-bedoule': { 'centre-ville': 0 },
+  sarrians: { 'centre-ville': 0 },
+  'saint-laurent-de-mure': { 'centre-ville': 0 },
+  calvi: { 'centre-ville': 0 },
+  vergeze: { 'centre-ville': 0 },
+  fenouillet: { 'centre-ville': 0 },
+  'simiane-collongue': { 'centre-ville': 0 },
+  'oye-plage': { 'centre-ville': 0 },
+  fegersheim: { 'centre-ville': 0 },
+  wasselonne: { 'centre-ville': 0 },
+  'magny-en-vexin': { 'centre-ville': 0 },
+  'le-palais-sur-vienne': { 'centre-ville': 0 },
+  peypin: { 'centre-ville': 0 },
+  'erdre-en-anjou': { 'centre-ville': 0 },
+  'thizy-les-bourgs': { 'centre-ville': 0 },
+  'saint-hilaire-du-harcouet': { 'centre-ville': 0 },
+  'pointe-noire': { 'centre-ville': 0 },
+  'maze-milon': { 'centre-ville': 0 },
+  'ensues-la-redonne': { 'centre-ville': 0 },
+  canejan: { 'centre-ville': 0 },
+  plouay: { 'centre-ville': 0 },
+  'saint-gervais-les-bains': { 'centre-ville': 0 },
+  melle: { 'centre-ville': 0 },
+  doullens: { 'centre-ville': 0 },
+  'flines-lez-raches': { 'centre-ville': 0 },
+  lacanau: { 'centre-ville': 0 },
+  'la-cadiere-d-azur': { 'centre-ville': 0 },
+  coursan: { 'centre-ville': 0 },
+  orgeres: { 'centre-ville': 0 },
+  beaucouze: { 'centre-ville': 0 },
+  bannalec: { 'centre-ville': 0 },
+  'gournay-en-bray': { 'centre-ville': 0 },
+  piolenc: { 'centre-ville': 0 },
+  revin: { 'centre-ville': 0 },
+  epernon: { 'centre-ville': 0 },
+  'saint-michel-chef-chef': { 'centre-ville': 0 },
+  'saint-martin-la-pallu': { 'centre-ville': 0 },
+  'cugand-la-bernardiere': { 'centre-ville': 0 },
+  lannilis: { 'centre-ville': 0 },
+  missillac: { 'centre-ville': 0 },
+  'marolles-en-hurepoix': { 'centre-ville': 0 },
+  valdahon: { 'centre-ville': 0 },
+  aimargues: { 'centre-ville': 0 },
+  'saint-privat-des-vieux': { 'centre-ville': 0 },
+  'carry-le-rouet': { 'centre-ville': 0 },
+  tournus: { 'centre-ville': 0 },
+  mondelange: { 'centre-ville': 0 },
+  'montbonnot-saint-martin': { 'centre-ville': 0 },
+  saleilles: { 'centre-ville': 0 },
+  valdalliere: { 'centre-ville': 0 },
+  marcheprime: { 'centre-ville': 0 },
+  mourenx: { 'centre-ville': 0 },
+  ligne: { 'centre-ville': 0 },
+  altkirch: { 'centre-ville': 0 },
+  leves: { 'centre-ville': 0 },
+  dainville: { 'centre-ville': 0 },
+  'l-isle-d-espagnac': { 'centre-ville': 0 },
+  longueau: { 'centre-ville': 0 },
+  'saint-xandre': { 'centre-ville': 0 },
+  'saint-georges-d-orques': { 'centre-ville': 0 },
+  gan: { 'centre-ville': 0 },
+  cancale: { 'centre-ville': 0 },
+  bedarrides: { 'centre-ville': 0 },
+  'la-roquette-sur-siagne': { 'centre-ville': 0 },
+  pouzauges: { 'centre-ville': 0 },
+  'caumont-sur-durance': { 'centre-ville': 0 },
+  sausheim: { 'centre-ville': 0 },
+  'la-creche': { 'centre-ville': 0 },
+  rocbaron: { 'centre-ville': 0 },
+  sigean: { 'centre-ville': 0 },
+  parmain: { 'centre-ville': 0 },
+  chanverrie: { 'centre-ville': 0 },
+  'montrond-les-bains': { 'centre-ville': 0 },
+  santes: { 'centre-ville': 0 },
+  'rives-du-loir-en-anjou': { 'centre-ville': 0 },
+  pourrieres: { 'centre-ville': 0 },
+  'montval-sur-loir': { 'centre-ville': 0 },
+  'sainghin-en-weppes': { 'centre-ville': 0 },
+  wallers: { 'centre-ville': 0 },
+  'challes-les-eaux': { 'centre-ville': 0 },
+  delle: { 'centre-ville': 0 },
+  'la-gorgue': { 'centre-ville': 0 },
+  rungis: { 'centre-ville': 0 },
+  gannat: { 'centre-ville': 0 },
+  sauvian: { 'centre-ville': 0 },
+  'cloyes-les-trois-rivieres': { 'centre-ville': 0 },
+  'port-louis': { 'centre-ville': 0 },
+  'la-ville-aux-dames': { 'centre-ville': 0 },
+  'bohain-en-vermandois': { 'centre-ville': 0 },
+  ternay: { 'centre-ville': 0 },
+  'saint-martin-d-uriage': { 'centre-ville': 0 },
+  genay: { 'centre-ville': 0 },
+  wormhout: { 'centre-ville': 0 },
+  liverdun: { 'centre-ville': 0 },
+  'ludon-medoc': { 'centre-ville': 0 },
+  bourail: { 'centre-ville': 0 },
+  carbonne: { 'centre-ville': 0 },
+  beaurains: { 'centre-ville': 0 },
+  'le-port-marly': { 'centre-ville': 0 },
+  viarmes: { 'centre-ville': 0 },
+  'ille-sur-tet': { 'centre-ville': 0 },
+  ambazac: { 'centre-ville': 0 },
+  pollestres: { 'centre-ville': 0 },
+  'quincy-voisins': { 'centre-ville': 0 },
+  baisieux: { 'centre-ville': 0 },
+  'chazelles-sur-lyon': { 'centre-ville': 0 },
+  'nogent-sur-seine': { 'centre-ville': 0 },
+  lardy: { 'centre-ville': 0 },
+  roquemaure: { 'centre-ville': 0 },
+  aussillon: { 'centre-ville': 0 },
+  'saint-sebastien-de-morsent': { 'centre-ville': 0 },
+  nouzonville: { 'centre-ville': 0 },
+  'saint-mars-du-desert': { 'centre-ville': 0 },
+  coublevie: { 'centre-ville': 0 },
+  'les-achards': { 'centre-ville': 0 },
+  servian: { 'centre-ville': 0 },
+  'la-garnache': { 'centre-ville': 0 },
+  'neuville-de-poitou': { 'centre-ville': 0 },
+  penmarch: { 'centre-ville': 0 },
+  'kani-keli': { 'centre-ville': 0 },
+  chevreuse: { 'centre-ville': 0 },
+  ernee: { 'centre-ville': 0 },
+  grans: { 'centre-ville': 0 },
+  'le-boulou': { 'centre-ville': 0 },
+  drap: { 'centre-ville': 0 },
+  'nueil-les-aubiers': { 'centre-ville': 0 },
+  guines: { 'centre-ville': 0 },
+  foulayronnes: { 'centre-ville': 0 },
+  'etoile-sur-rhone': { 'centre-ville': 0 },
+  'la-roque-d-antheron': { 'centre-ville': 0 },
+  rosheim: { 'centre-ville': 0 },
+  ollainville: { 'centre-ville': 0 },
+  'la-ferriere': { 'centre-ville': 0 },
+  'aubigny-sur-nere': { 'centre-ville': 0 },
+  'noyant-villages': { 'centre-ville': 0 },
+  'cregy-les-meaux': { 'centre-ville': 0 },
+  arnage: { 'centre-ville': 0 },
+  'chatillon-sur-seine': { 'centre-ville': 0 },
+  'saint-memmie': { 'centre-ville': 0 },
+  fenain: { 'centre-ville': 0 },
+  'saint-genis-les-ollieres': { 'centre-ville': 0 },
+  coulogne: { 'centre-ville': 0 },
+  roques: { 'centre-ville': 0 },
+  'boulay-moselle': { 'centre-ville': 0 },
+  'marsannay-la-cote': { 'centre-ville': 0 },
+  mouguerre: { 'centre-ville': 0 },
+  'wervicq-sud': { 'centre-ville': 0 },
+  rousset: { 'centre-ville': 0 },
+  'flers-en-escrebieux': { 'centre-ville': 0 },
+  aiffres: { 'centre-ville': 0 },
+  reichshoffen: { 'centre-ville': 0 },
+  'lacroix-saint-ouen': { 'centre-ville': 0 },
+  'le-cendre': { 'centre-ville': 0 },
+  ploumagoar: { 'centre-ville': 0 },
+  heillecourt: { 'centre-ville': 0 },
+  'marles-les-mines': { 'centre-ville': 0 },
+  'peyrolles-en-provence': { 'centre-ville': 0 },
+  'saint-pierre-les-nemours': { 'centre-ville': 0 },
+  plouhinec: { 'centre-ville': 0 },
+  'borderes-sur-l-echez': { 'centre-ville': 0 },
+  'vic-le-comte': { 'centre-ville': 0 },
+  'le-lion-d-angers': { 'centre-ville': 0 },
+  drusenheim: { 'centre-ville': 0 },
+  'charbonnieres-les-bains': { 'centre-ville': 0 },
+  garons: { 'centre-ville': 0 },
+  levens: { 'centre-ville': 0 },
+  'cormelles-le-royal': { 'centre-ville': 0 },
+  'saint-astier': { 'centre-ville': 0 },
+  cruseilles: { 'centre-ville': 0 },
+  'calonne-ricouart': { 'centre-ville': 0 },
+  gray: { 'centre-ville': 0 },
+  trebes: { 'centre-ville': 0 },
+  reyrieux: { 'centre-ville': 0 },
+  'parigne-l-eveque': { 'centre-ville': 0 },
+  blere: { 'centre-ville': 0 },
+  commercy: { 'centre-ville': 0 },
+  chagny: { 'centre-ville': 0 },
+  meriel: { 'centre-ville': 0 },
+  'bretignolles-sur-mer': { 'centre-ville': 0 },
+  'erquinghem-lys': { 'centre-ville': 0 },
+  idron: { 'centre-ville': 0 },
+  dechy: { 'centre-ville': 0 },
+  'la-balme-de-sillingy': { 'centre-ville': 0 },
+  plesse: { 'centre-ville': 0 },
+  mundolsheim: { 'centre-ville': 0 },
+  'le-pellerin': { 'centre-ville': 0 },
+  mouy: { 'centre-ville': 0 },
+  gambsheim: { 'centre-ville': 0 },
+  audruicq: { 'centre-ville': 0 },
+  bethoncourt: { 'centre-ville': 0 },
+  barberaz: { 'centre-ville': 0 },
+  'vindry-sur-turdine': { 'centre-ville': 0 },
+  'saint-lyphard': { 'centre-ville': 0 },
+  tahaa: { 'centre-ville': 0 },
+  'villers-le-lac': { 'centre-ville': 0 },
+  tresses: { 'centre-ville': 0 },
+  brebieres: { 'centre-ville': 0 },
+  blotzheim: { 'centre-ville': 0 },
+  mormant: { 'centre-ville': 0 },
+  champniers: { 'centre-ville': 0 },
+  'condat-sur-vienne': { 'centre-ville': 0 },
+  'mouilleron-le-captif': { 'centre-ville': 0 },
+  'villette-d-anthon': { 'centre-ville': 0 },
+  'moulins-les-metz': { 'centre-ville': 0 },
+  valleiry: { 'centre-ville': 0 },
+  'cazouls-les-beziers': { 'centre-ville': 0 },
+  florensac: { 'centre-ville': 0 },
+  'chatillon-sur-chalaronne': { 'centre-ville': 0 },
+  'pont-sainte-marie': { 'centre-ville': 0 },
+  bauvin: { 'centre-ville': 0 },
+  'le-rove': { 'centre-ville': 0 },
+  mulsanne: { 'centre-ville': 0 },
+  'guemene-penfao': { 'centre-ville': 0 },
+  semeac: { 'centre-ville': 0 },
+  'nuits-saint-georges': { 'centre-ville': 0 },
+  'mignaloux-beauvoir': { 'centre-ville': 0 },
+  laille: { 'centre-ville': 0 },
+  farebersviller: { 'centre-ville': 0 },
+  forcalquier: { 'centre-ville': 0 },
+  'saint-clement-de-riviere': { 'centre-ville': 0 },
+  marquise: { 'centre-ville': 0 },
+  'le-bourget-du-lac': { 'centre-ville': 0 },
+  'nans-les-pins': { 'centre-ville': 0 },
+  surzur: { 'centre-ville': 0 },
+  vernaison: { 'centre-ville': 0 },
+  tourves: { 'centre-ville': 0 },
+  'saint-saturnin-les-avignon': { 'centre-ville': 0 },
+  gorges: { 'centre-ville': 0 },
+  'vaux-sur-seine': { 'centre-ville': 0 },
+  jonquieres: { 'centre-ville': 0 },
+  beynost: { 'centre-ville': 0 },
+  'brou-sur-chantereine': { 'centre-ville': 0 },
+  acoua: { 'centre-ville': 0 },
+  pauillac: { 'centre-ville': 0 },
+  gauchy: { 'centre-ville': 0 },
+  'l-hopital': { 'centre-ville': 0 },
+  'schweighouse-sur-moder': { 'centre-ville': 0 },
+  scaer: { 'centre-ville': 0 },
+  'bassens-73': { 'centre-ville': 0 },
+  valdoie: { 'centre-ville': 0 },
+  coubron: { 'centre-ville': 0 },
+  villerest: { 'centre-ville': 0 },
+  'loison-sous-lens': { 'centre-ville': 0 },
+  seichamps: { 'centre-ville': 0 },
+  'villars-les-dombes': { 'centre-ville': 0 },
+  'l-etang-la-ville': { 'centre-ville': 0 },
+  'baume-les-dames': { 'centre-ville': 0 },
+  trilport: { 'centre-ville': 0 },
+  'pont-l-eveque': { 'centre-ville': 0 },
+  'douvres-la-delivrande': { 'centre-ville': 0 },
+  'le-cannet-des-maures': { 'centre-ville': 0 },
+  'villeneuve-sur-yonne': { 'centre-ville': 0 },
+  longuyon: { 'centre-ville': 0 },
+  'saint-vit': { 'centre-ville': 0 },
+  'saint-cheron': { 'centre-ville': 0 },
+  'ferriere-la-grande': { 'centre-ville': 0 },
+  'locmaria-plouzane': { 'centre-ville': 0 },
+  cucq: { 'centre-ville': 0 },
+  villenoy: { 'centre-ville': 0 },
+  chavanoz: { 'centre-ville': 0 },
+  'sully-sur-loire': { 'centre-ville': 0 },
+  'dives-sur-mer': { 'centre-ville': 0 },
+  'moncoutant-sur-sevre': { 'centre-ville': 0 },
+  'villeneuve-en-retz': { 'centre-ville': 0 },
+  'saint-marcellin-en-forez': { 'centre-ville': 0 },
+  'le-val-d-hazey': { 'centre-ville': 0 },
+  faulquemont: { 'centre-ville': 0 },
+  'chateau-arnoux-saint-auban': { 'centre-ville': 0 },
+  'ay-champagne': { 'centre-ville': 0 },
+  'val-de-moder': { 'centre-ville': 0 },
+  pulnoy: { 'centre-ville': 0 },
+  baillif: { 'centre-ville': 0 },
+  genlis: { 'centre-ville': 0 },
+  'billy-berclau': { 'centre-ville': 0 },
+  'saint-georges-de-didonne': { 'centre-ville': 0 },
+  'saint-pantaleon-de-larche': { 'centre-ville': 0 },
+  muzillac: { 'centre-ville': 0 },
+  'maen-roch': { 'centre-ville': 0 },
+  baden: { 'centre-ville': 0 },
+  chateaulin: { 'centre-ville': 0 },
+  ornex: { 'centre-ville': 0 },
+  'saint-philippe': { 'centre-ville': 0 },
+  giberville: { 'centre-ville': 0 },
+  habsheim: { 'centre-ville': 0 },
+  yffiniac: { 'centre-ville': 0 },
+  sommieres: { 'centre-ville': 0 },
+  'villefranche-de-lauragais': { 'centre-ville': 0 },
+  'la-ferte-mace': { 'centre-ville': 0 },
+  blaye: { 'centre-ville': 0 },
+  haillicourt: { 'centre-ville': 0 },
+  'bonnieres-sur-seine': { 'centre-ville': 0 },
+  luynes: { 'centre-ville': 0 },
+  'petite-foret': { 'centre-ville': 0 },
+  laventie: { 'centre-ville': 0 },
+  'saint-sever': { 'centre-ville': 0 },
+  cilaos: { 'centre-ville': 0 },
+  bezannes: { 'centre-ville': 0 },
+  'champagne-sur-oise': { 'centre-ville': 0 },
+  'sainte-soulle': { 'centre-ville': 0 },
+  'la-meziere': { 'centre-ville': 0 },
+  gruissan: { 'centre-ville': 0 },
+  'hauts-de-bienne': { 'centre-ville': 0 },
+  'saint-etienne-au-mont': { 'centre-ville': 0 },
+  'pacy-sur-eure': { 'centre-ville': 0 },
+  'morcenx-la-nouvelle': { 'centre-ville': 0 },
+  decazeville: { 'centre-ville': 0 },
+  allinges: { 'centre-ville': 0 },
+  'saint-james': { 'centre-ville': 0 },
+  rambervillers: { 'centre-ville': 0 },
+  plouigneau: { 'centre-ville': 0 },
+  beaurepaire: { 'centre-ville': 0 },
+  lestrem: { 'centre-ville': 0 },
+  'villefranche-sur-mer': { 'centre-ville': 0 },
+  luzarches: { 'centre-ville': 0 },
+  taputapuatea: { 'centre-ville': 0 },
+  papaichton: { 'centre-ville': 0 },
+}
@@ -0,0 +1,187 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from './trade-content'
+
+/** TradeContent sans les champs de contenu, pour les listes et les cartes */
+export type TradeContentSummary = Pick<TradeContent, 'slug' | 'name' | 'priceRange' | 'averageResponseTime'>
+
+/** Slug -> position dans `tradeContent` */
+export const TRADE_CONTENT_INDEX: Record<string, number> = {
+  plombier: 0,
+  electricien: 1,
+  serrurier: 2,
+  chauffagiste: 3,
+  'peintre-en-batiment': 4,
+  menuisier: 5,
+  carreleur: 6,
+  couvreur: 7,
+  macon: 8,
+  jardinier: 9,
+  vitrier: 10,
+  climaticien: 11,
+  cuisiniste: 12,
+  solier: 13,
+  nettoyage: 14,
+  terrassier: 15,
+  charpentier: 16,
+  zingueur: 17,
+  etancheiste: 18,
+  facadier: 19,
+  platrier: 20,
+  metallier: 21,
+  ferronnier: 22,
+  'poseur-de-parquet': 23,
+  miroitier: 24,
+  storiste: 25,
+  'salle-de-bain': 26,
+  'architecte-interieur': 27,
+  decorateur: 28,
+  domoticien: 29,
+  'pompe-a-chaleur': 30,
+  'panneaux-solaires': 31,
+  'isolation-thermique': 32,
+  'renovation-energetique': 33,
+  'borne-recharge': 34,
+  ramoneur: 35,
+  paysagiste: 36,
+  pisciniste: 37,
+  'alarme-securite': 38,
+  antenniste: 39,
+  ascensoriste: 40,
+  diagnostiqueur: 41,
+  geometre: 42,
+  desinsectisation: 43,
+  deratisation: 44,
+  demenageur: 45,
+}
+
+/** Mêmes entrées et même ordre que `tradeContent` */
+export const tradeContentSummaries: TradeContentSummary[] = [
+  {
+    slug: 'plombier',
+    name: 'Plombier',
+    priceRange: { min: 60, max: 90, unit: '€/h' },
+    averageResponseTime: 'Urgence (fuite, bouchon) : délai variable selon disponibilité ; travaux planifiés sous 1 à 2 semaines',
+  },
+  {
+    slug: 'electricien',
+    name: 'Électricien',
+    priceRange: { min: 50, max: 80, unit: '€/h' },
+    averageResponseTime: 'Urgence (panne, court-circuit) : délai variable selon disponibilité ; travaux planifiés sous 1 à 2 semaines',
+  },
+  {
+    slug: 'serrurier',
+    name: 'Serrurier',
+    priceRange: { min: 80, max: 150, unit: '€/intervention' },
+    averageResponseTime: 'Urgence (porte claquée, effraction) : délai variable selon disponibilité et localisation',
+  },
+  {
+    slug: 'chauffagiste',
+    name: 'Chauffagiste',
+    priceRange: { min: 60, max: 100, unit: '€/h' },
+    averageResponseTime: 'Urgence : délai variable selon disponibilité ; entretien sur rendez-vous sous 1 à 2 semaines',
+  },
+  {
+    slug: 'peintre-en-batiment',
+    name: 'Peintre en bâtiment',
+    priceRange: { min: 25, max: 45, unit: '€/m²' },
+    averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+  },
+  { slug: 'menuisier', name: 'Menuisier', priceRange: { min: 45, max: 75, unit: '€/h' }, averageResponseTime: 'Devis sous 48h, intervention sous 2 à 4 semaines' },
+  { slug: 'carreleur', name: 'Carreleur', priceRange: { min: 35, max: 65, unit: '€/m²' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines' },
+  {
+    slug: 'couvreur',
+    name: 'Couvreur',
+    priceRange: { min: 50, max: 90, unit: '€/m²' },
+    averageResponseTime: 'Urgence (bâchage, fuite) : délai variable selon disponibilité ; travaux de réfection sous 1 à 4 semaines',
+  },
+  { slug: 'macon', name: 'Maçon', priceRange: { min: 45, max: 70, unit: '€/h' }, averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines' },
+  { slug: 'jardinier', name: 'Jardinier', priceRange: { min: 30, max: 50, unit: '€/h' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines selon la saison' },
+  {
+    slug: 'vitrier',
+    name: 'Vitrier',
+    priceRange: { min: 50, max: 100, unit: '€/intervention' },
+    averageResponseTime: 'Urgence (bris de vitre) : délai variable selon disponibilité ; remplacement définitif sous 24 à 48h',
+  },
+  {
+    slug: 'climaticien',
+    name: 'Climaticien',
+    priceRange: { min: 60, max: 100, unit: '€/h' },
+    averageResponseTime: 'Urgence canicule : délai variable selon disponibilité ; installation sur devis sous 2 à 4 semaines',
+  },
+  {
+    slug: 'cuisiniste',
+    name: 'Cuisiniste',
+    priceRange: { min: 3000, max: 15000, unit: '€ (cuisine complète)' },
+    averageResponseTime: 'Conception 2 à 3 semaines, fabrication 4 à 8 semaines, pose 3 à 7 jours',
+  },
+  { slug: 'solier', name: 'Solier', priceRange: { min: 25, max: 60, unit: '€/m²' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines' },
+  { slug: 'nettoyage', name: 'Nettoyage', priceRange: { min: 25, max: 45, unit: '€/h' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 5 jours' },
+  { slug: 'terrassier', name: 'Terrassier', priceRange: { min: 30, max: 60, unit: '€/m³' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines' },
+  { slug: 'charpentier', name: 'Charpentier', priceRange: { min: 50, max: 120, unit: '€/m²' }, averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 4 semaines' },
+  { slug: 'zingueur', name: 'Zingueur', priceRange: { min: 40, max: 80, unit: '€/ml' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines' },
+  { slug: 'etancheiste', name: 'Étanchéiste', priceRange: { min: 40, max: 100, unit: '€/m²' }, averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 3 semaines' },
+  { slug: 'facadier', name: 'Façadier', priceRange: { min: 30, max: 100, unit: '€/m²' }, averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines' },
+  { slug: 'platrier', name: 'Plâtrier', priceRange: { min: 25, max: 55, unit: '€/m²' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines' },
+  { slug: 'metallier', name: 'Métallier', priceRange: { min: 150, max: 400, unit: '€/ml' }, averageResponseTime: 'Devis sous 1 semaine, fabrication 3 à 6 semaines' },
+  { slug: 'ferronnier', name: 'Ferronnier', priceRange: { min: 200, max: 600, unit: '€/ml' }, averageResponseTime: 'Devis sous 1 semaine, fabrication 4 à 8 semaines' },
+  { slug: 'poseur-de-parquet', name: 'Poseur de parquet', priceRange: { min: 25, max: 80, unit: '€/m²' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines' },
+  { slug: 'miroitier', name: 'Miroitier', priceRange: { min: 80, max: 250, unit: '€/m²' }, averageResponseTime: 'Devis sous 48h, fabrication 1 à 3 semaines' },
+  { slug: 'storiste', name: 'Storiste', priceRange: { min: 200, max: 800, unit: '€/unité' }, averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines' },
+  { slug: 'salle-de-bain', name: 'Salle de bain', priceRange: { min: 4000, max: 15000, unit: '€' }, averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines' },
+  { slug: 'architecte-interieur', name: 'Architecte d\'intérieur', priceRange: { min: 50, max: 150, unit: '€/m²' }, averageResponseTime: 'Premier rendez-vous sous 1 semaine' },
+  { slug: 'decorateur', name: 'Décorateur', priceRange: { min: 50, max: 120, unit: '€/h' }, averageResponseTime: 'Premier rendez-vous sous 1 semaine' },
+  { slug: 'domoticien', name: 'Domoticien', priceRange: { min: 500, max: 5000, unit: '€' }, averageResponseTime: 'Devis sous 1 semaine, installation 1 à 4 semaines' },
+  { slug: 'pompe-a-chaleur', name: 'Pompe à chaleur', priceRange: { min: 8000, max: 18000, unit: '€' }, averageResponseTime: 'Devis sous 1 semaine, installation 2 à 4 semaines' },
+  {
+    slug: 'panneaux-solaires',
+    name: 'Panneaux solaires',
+    priceRange: { min: 7000, max: 20000, unit: '€' },
+    averageResponseTime: 'Étude gratuite sous 1 semaine, installation 4 à 8 semaines',
+  },
+  {
+    slug: 'isolation-thermique',
+    name: 'Isolation thermique',
+    priceRange: { min: 20, max: 100, unit: '€/m²' },
+    averageResponseTime: 'Devis sous 1 semaine, intervention 1 à 3 semaines',
+  },
+  {
+    slug: 'renovation-energetique',
+    name: 'Rénovation énergétique',
+    priceRange: { min: 15000, max: 50000, unit: '€' },
+    averageResponseTime: 'Audit sous 2 semaines, planification des travaux 1 à 3 mois',
+  },
+  { slug: 'borne-recharge', name: 'Borne de recharge', priceRange: { min: 1200, max: 3000, unit: '€' }, averageResponseTime: 'Devis sous 48h, installation sous 1 à 2 semaines' },
+  {
+    slug: 'ramoneur',
+    name: 'Ramoneur',
+    priceRange: { min: 50, max: 120, unit: '€' },
+    averageResponseTime: 'Intervention sous 1 semaine en basse saison, 2 à 3 semaines en automne',
+  },
+  { slug: 'paysagiste', name: 'Paysagiste', priceRange: { min: 35, max: 80, unit: '€/m²' }, averageResponseTime: 'Étude sous 2 semaines, réalisation 2 à 8 semaines' },
+  { slug: 'pisciniste', name: 'Pisciniste', priceRange: { min: 15000, max: 50000, unit: '€' }, averageResponseTime: 'Étude sous 2 semaines, construction 4 à 12 semaines' },
+  { slug: 'alarme-securite', name: 'Alarme et sécurité', priceRange: { min: 500, max: 3000, unit: '€' }, averageResponseTime: 'Devis sous 48h, installation sous 1 semaine' },
+  { slug: 'antenniste', name: 'Antenniste', priceRange: { min: 100, max: 400, unit: '€' }, averageResponseTime: 'Intervention sous 48h à 1 semaine' },
+  { slug: 'ascensoriste', name: 'Ascensoriste', priceRange: { min: 15000, max: 50000, unit: '€' }, averageResponseTime: 'Diagnostic sous 1 semaine, installation 4 à 12 semaines' },
+  { slug: 'diagnostiqueur', name: 'Diagnostiqueur', priceRange: { min: 100, max: 600, unit: '€' }, averageResponseTime: 'Intervention sous 48h à 1 semaine' },
+  { slug: 'geometre', name: 'Géomètre', priceRange: { min: 500, max: 3000, unit: '€' }, averageResponseTime: 'Devis sous 1 semaine, intervention 2 à 4 semaines' },
+  { slug: 'desinsectisation', name: 'Désinsectisation', priceRange: { min: 80, max: 300, unit: '€' }, averageResponseTime: 'Intervention sous 24 à 48h' },
+  { slug: 'deratisation', name: 'Dératisation', priceRange: { min: 80, max: 300, unit: '€' }, averageResponseTime: 'Intervention sous 24 à 48h' },
+  { slug: 'demenageur', name: 'Déménageur', priceRange: { min: 500, max: 3000, unit: '€' }, averageResponseTime: 'Devis sous 48h (visite technique), planification 2 à 8 semaines' },
+]
+
+function has(index: Record<string, unknown>, key: string): boolean {
+  return Object.prototype.hasOwnProperty.call(index, key)
+}
+
+export function getTradeContentSummary(slug: string): TradeContentSummary | undefined {
+  return has(TRADE_CONTENT_INDEX, slug) ? tradeContentSummaries[TRADE_CONTENT_INDEX[slug]] : undefined
+}
+
+/** Entrée complète, chargée seule depuis son shard */
+export async function loadTradeContent(slug: string): Promise<TradeContent | undefined> {
+  if (!has(TRADE_CONTENT_INDEX, slug)) return undefined
+  const shard: { entry: TradeContent } = await import(`./trade-content-shards/${slug}`)
+  return shard.entry
+}
@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'alarme-securite',
+  name: 'Alarme et sécurité',
+  priceRange: { min: 500, max: 3000, unit: '€' },
+  commonTasks: [
+    'Alarme sans fil (maison 100 m²) : 500 à 1 500 €', 'Vidéosurveillance (4 caméras) : 1 000 à 3 000 €', 'Interphone/visiophone : 300 à 1 500 €',
+    'Contrôle d\'accès (digicode, badge) : 500 à 2 000 €', 'Télésurveillance (abonnement) : 20 à 50 €/mois',
+  ],
+  tips: [
+    'Privilégiez les systèmes certifiés NF A2P (1 à 3 boucliers) — c\'est un gage de fiabilité reconnu par les assurances.',
+    'Une alarme avec télésurveillance permet une intervention des forces de l\'ordre en 15 à 20 minutes en zone urbaine.',
+    'Installez des détecteurs sur tous les points d\'accès vulnérables : porte d\'entrée, baies vitrées, portes de garage et fenêtres du rez-de-chaussée. Un système sous-dimensionné laisse des zones non couvertes.',
+    'Pour la vidéosurveillance extérieure, vérifiez la réglementation RGPD : vos caméras ne doivent filmer que votre propriété privée, jamais la voie publique ni le jardin du voisin.',
+    'Testez votre alarme au moins une fois par trimestre en déclenchant une alerte test auprès de votre centre de télésurveillance : c\'est la seule façon de vérifier que toute la chaîne fonctionne.',
+  ],
+  faq: [
+    {
+      q: 'Mon assurance baisse-t-elle avec une alarme ?',
+      a: 'Oui, la plupart des assureurs accordent une réduction de 5 à 15 % sur la prime habitation pour un système d\'alarme certifié NF A2P avec télésurveillance. Certains contrats exigent même une alarme pour couvrir les objets de valeur supérieure à un certain montant.',
+    },
+    {
+      q: 'Alarme filaire ou sans fil : que choisir ?',
+      a: 'L\'alarme sans fil est la plus répandue en résidentiel : installation rapide (1 journée), pas de travaux de câblage, et elle se déplace facilement en cas de déménagement. L\'alarme filaire est plus fiable (pas de problème de batterie ni d\'interférence radio), idéale pour les grandes maisons ou les locaux professionnels, mais nécessite des travaux d\'installation plus importants.',
+    },
+    {
+      q: 'Peut-on installer une caméra de vidéosurveillance chez soi sans autorisation ?',
+      a: 'Chez un particulier, aucune autorisation n\'est requise tant que les caméras ne filment que votre propriété privée (jardin, entrée, garage). Il est interdit de filmer la voie publique, le trottoir ou la propriété des voisins. En copropriété, l\'installation dans les parties communes nécessite un vote en assemblée générale. Vous devez informer vos visiteurs par un panneau visible.',
+    },
+    {
+      q: 'La télésurveillance vaut-elle le coût de l\'abonnement ?',
+      a: 'L\'abonnement de télésurveillance (20 à 50 €/mois) inclut la surveillance 24h/24 par un opérateur qui lève le doute en cas d\'alerte et prévient les forces de l\'ordre si nécessaire. C\'est particulièrement utile si vous vous absentez souvent ou si vous avez une résidence secondaire. Sans télésurveillance, l\'alarme ne fait que sonner localement, ce qui est peu dissuasif en zone isolée.',
+    },
+    {
+      q: 'Combien de détecteurs faut-il pour protéger une maison ?',
+      a: 'Pour une maison standard de 100 m² sur un niveau : 1 centrale, 1 détecteur d\'ouverture par porte/fenêtre accessible (6 à 10), 2 à 3 détecteurs de mouvement pour les zones de passage intérieures, 1 sirène extérieure et 2 télécommandes. Comptez 500 à 1 500 € pour un kit complet sans fil certifié NF A2P, hors pose professionnelle (200 à 500 €).',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour système d\'alarme en panne, caméra de vidéosurveillance défaillante ou intrusion détectée. Un technicien en sécurité peut intervenir sous 2 à 4 heures pour diagnostiquer et remettre en service votre installation. Majorations : +80 à 120 % la nuit et le week-end.',
+  certifications: ['Certification APSAD (règles de sécurité)', 'Label NF A2P (alarmes)', 'Habilitation CNAPS (agents de sécurité)'],
+  averageResponseTime: 'Devis sous 48h, installation sous 1 semaine',
+}
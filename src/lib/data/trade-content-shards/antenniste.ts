@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'antenniste',
+  name: 'Antenniste',
+  priceRange: { min: 100, max: 400, unit: '€' },
+  commonTasks: [
+    'Installation antenne TNT : 100 à 250 €', 'Installation parabole satellite : 150 à 400 €', 'Raccordement fibre optique intérieur : 100 à 300 €',
+    'Amplificateur de signal TNT : 80 à 200 €', 'Câblage coaxial ou Ethernet : 30 à 60 €/point',
+  ],
+  tips: [
+    'Depuis 2023, la TNT en Ultra HD (DVB-T2) se déploie progressivement. Vérifiez que votre installation est compatible.',
+    'Pour une réception optimale de la TNT, l\'antenne doit être orientée vers l\'émetteur le plus proche (consultez le site de l\'ANFR).',
+    'Si vous passez à la fibre optique, faites câbler plusieurs pièces en Ethernet Cat 6 lors de l\'installation : le Wi-Fi reste moins stable que le filaire pour le streaming 4K et le télétravail.',
+    'En immeuble collectif, vérifiez si une antenne collective existe avant d\'installer une antenne individuelle — votre syndic peut avoir un contrat couvrant déjà la TNT et le satellite.',
+    'Pour les zones de réception difficile, un amplificateur de signal TNT avec filtre 4G/5G évite les interférences causées par les antennes relais de téléphonie mobile à proximité.',
+  ],
+  faq: [
+    {
+      q: 'TNT, satellite ou box internet : que choisir ?',
+      a: 'La TNT est gratuite et couvre 97 % du territoire mais offre moins de chaînes. Le satellite (Canal+, Fransat) offre plus de chaînes mais nécessite une parabole. La box internet ADSL/fibre propose la TV via le réseau internet avec replay et VOD inclus. En zone blanche (pas de fibre ni de bonne couverture TNT), le satellite reste la meilleure option.',
+    },
+    {
+      q: 'Pourquoi ma réception TNT est-elle mauvaise ?',
+      a: 'Les causes les plus fréquentes sont : une antenne mal orientée ou vieillissante, un câble coaxial abîmé ou trop ancien (préférez le câble de type 17 VATC), des interférences 4G/5G (nécessitant un filtre LTE), un amplificateur défaillant ou des prises murales oxydées. Un antenniste peut diagnostiquer le problème en mesurant le signal à chaque point du réseau.',
+    },
+    {
+      q: 'Combien coûte le raccordement fibre optique intérieur ?',
+      a: 'Le raccordement de la fibre depuis le point de branchement optique (PBO) jusqu\'à la prise terminale optique (PTO) est gratuit et réalisé par l\'opérateur. En revanche, si vous souhaitez plusieurs prises Ethernet dans différentes pièces ou un câblage encastré, un antenniste facture 100 à 300 € par point de desserte, plus le passage de gaines si nécessaire.',
+    },
+    {
+      q: 'Faut-il une autorisation pour installer une parabole ?',
+      a: 'En maison individuelle, aucune autorisation n\'est requise sauf en zone protégée (ABF). En copropriété, le règlement peut interdire les paraboles en façade, mais la loi du 2 juillet 1966 garantit le « droit à l\'antenne » : le syndic ne peut pas refuser si aucune antenne collective ne fournit un service équivalent. La parabole doit être discrète et ne pas nuire à l\'esthétique du bâtiment.',
+    },
+    {
+      q: 'Mon antenne TNT est-elle compatible avec la nouvelle norme DVB-T2 ?',
+      a: 'L\'antenne elle-même (râteau UHF) est généralement compatible : c\'est le décodeur TNT ou le téléviseur qui doit supporter le DVB-T2/HEVC. Les téléviseurs vendus depuis 2020 intègrent généralement cette norme. Si votre téléviseur est plus ancien, un décodeur TNT HD compatible DVB-T2 coûte 30 à 60 €. Vérifiez sur le site recevoirlatnt.fr.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'installation d\'antennes ou de paraboles. Pour une panne de réception TNT ou satellite, un antenniste peut intervenir sous 48h à 1 semaine pour un diagnostic et une réparation.',
+  certifications: [
+    'Titre Professionnel Installateur Antenniste (inscrit au RNCP)', 'Habilitation électrique (obligatoire)',
+    'Habilitation travail en hauteur (obligatoire pour interventions sur toiture)', 'Formation fibre optique FTTH (raccordement et câblage)',
+  ],
+  averageResponseTime: 'Intervention sous 48h à 1 semaine',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'architecte-interieur',
+  name: 'Architecte d\'intérieur',
+  priceRange: { min: 50, max: 150, unit: '€/m²' },
+  commonTasks: [
+    'Consultation / conseil déco : 80 à 200 €/h', 'Projet d\'aménagement complet : 50 à 150 €/m² de surface aménagée', 'Suivi de chantier : 8 à 15 % du montant des travaux',
+    'Plans 3D et planches d\'ambiance : 500 à 2 000 €', 'Rénovation d\'appartement haussmannien : 800 à 2 000 €/m²',
+  ],
+  tips: [
+    'Un architecte d\'intérieur titulaire du diplôme CFAI est inscrit au Conseil français des architectes d\'intérieur et peut porter le titre protégé.',
+    'Définissez un budget précis avant la première consultation pour que le professionnel adapte ses propositions.',
+    'Demandez un contrat de mission détaillé avant le démarrage : il doit préciser les livrables (plans, vues 3D, planning), les honoraires et les conditions de suivi de chantier.',
+    'Si votre projet implique des modifications structurelles (suppression de mur porteur, trémie d\'escalier), l\'architecte d\'intérieur devra faire valider les calculs par un bureau d\'études structure.',
+    'Pour les projets d\'envergure (plus de 150 m² de surface de plancher), le recours à un architecte DPLG est obligatoire, même si un architecte d\'intérieur coordonne le projet esthétique.',
+  ],
+  faq: [
+    {
+      q: 'Architecte d\'intérieur ou décorateur ?',
+      a: 'L\'architecte d\'intérieur peut modifier les volumes (cloisons, ouvertures, mezzanines) et déposer des permis. Le décorateur intervient uniquement sur l\'ameublement, les couleurs et les textiles sans toucher au bâti. Pour une rénovation avec travaux structurels, un architecte d\'intérieur est indispensable.',
+    },
+    {
+      q: 'Combien coûte un architecte d\'intérieur pour un appartement ?',
+      a: 'Les honoraires varient selon le type de mission : une consultation de 2h coûte 150 à 400 €, un projet complet (plans + 3D + shopping list) revient à 50 à 150 €/m², et un suivi de chantier complet ajoute 8 à 15 % du montant des travaux. Pour un appartement de 70 m² avec rénovation lourde, comptez 5 000 à 15 000 € d\'honoraires pour la mission complète.',
+    },
+    {
+      q: 'Quels livrables attendre d\'un architecte d\'intérieur ?',
+      a: 'Une mission complète inclut : un relevé de l\'existant, des plans d\'aménagement (2 à 3 propositions), des vues 3D réalistes, des planches de matériaux et de couleurs, un carnet de détails techniques, un descriptif des travaux pour consulter les entreprises et un planning prévisionnel. Vérifiez que ces livrables sont listés dans le contrat de mission.',
+    },
+    {
+      q: 'L\'architecte d\'intérieur peut-il déposer un permis de construire ?',
+      a: 'L\'architecte d\'intérieur peut déposer une déclaration préalable de travaux et un permis de construire pour les projets de moins de 150 m² de surface de plancher. Au-delà de 150 m², un architecte DPLG (inscrit à l\'Ordre) est obligatoire pour signer le permis. Les deux professionnels travaillent souvent en complémentarité sur les grands projets.',
+    },
+    {
+      q: 'Comment choisir le bon architecte d\'intérieur ?',
+      a: 'Consultez son portfolio pour vérifier que son style correspond à vos goûts. Vérifiez son diplôme (CFAI ou équivalent bac+5) et son inscription au Conseil français des architectes d\'intérieur. Demandez des références de clients récents et visitez si possible un chantier en cours. Enfin, comparez au moins 3 devis en vérifiant que le périmètre de la mission est identique.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'architecture d\'intérieur. Les projets d\'aménagement et de rénovation sont planifiés sur plusieurs semaines à plusieurs mois. Prenez rendez-vous pour une première consultation sous 1 semaine.',
+  certifications: [
+    'Diplôme CFAI (Conseil Français des Architectes d\'Intérieur — titre protégé)', 'Inscription à l\'Ordre des Architectes (si architecte DPLG/HMONP)',
+    'Assurance décennale (obligatoire pour les travaux de structure)',
+  ],
+  averageResponseTime: 'Premier rendez-vous sous 1 semaine',
+}
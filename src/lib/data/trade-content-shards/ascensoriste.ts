@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'ascensoriste',
+  name: 'Ascensoriste',
+  priceRange: { min: 15000, max: 50000, unit: '€' },
+  commonTasks: [
+    'Installation ascenseur 3 étages : 20 000 à 50 000 €', 'Monte-escalier (1 étage) : 3 500 à 8 000 €', 'Plateforme élévatrice PMR : 8 000 à 15 000 €',
+    'Contrat de maintenance annuel : 1 500 à 4 000 €', 'Modernisation d\'ascenseur existant : 10 000 à 30 000 €',
+  ],
+  tips: [
+    'Le contrat de maintenance est obligatoire (décret du 9 septembre 2004). Comparez les offres : certains contrats incluent les pièces d\'usure, d\'autres non.',
+    'Pour un monte-escalier, vérifiez la largeur de l\'escalier (65 cm minimum) et la capacité de charge (jusqu\'à 130 kg standard).',
+    'Avant de signer un contrat de maintenance, vérifiez s\'il est « à l\'entretien complet » (pièces incluses) ou « à l\'entretien normal » (pièces en supplément) : la différence de coût annuel peut être de 30 à 50 %.',
+    'Un ascenseur en copropriété doit faire l\'objet d\'un contrôle technique quinquennal obligatoire par un organisme agréé, indépendamment du contrat de maintenance.',
+    'Pour l\'installation d\'un monte-escalier, demandez une démonstration à domicile avant d\'acheter : chaque escalier est différent (courbe, largeur, palier intermédiaire) et le confort d\'utilisation doit être testé in situ.',
+  ],
+  faq: [
+    {
+      q: 'Quelles aides pour un monte-escalier ?',
+      a: 'MaPrimeAdapt\' (jusqu\'à 70 % pour les revenus modestes), TVA réduite à 5,5 %, crédit d\'impôt de 25 % (plafonné à 5 000 € pour une personne seule), aides des caisses de retraite et de l\'ANAH. Le reste à charge peut être inférieur à 1 000 € pour un ménage modeste.',
+    },
+    {
+      q: 'Peut-on installer un ascenseur dans une maison individuelle ?',
+      a: 'Oui, il existe des ascenseurs privatifs compacts (cabine de 1 m² environ) qui s\'installent dans une trémie de 1,20 × 1,20 m ou à l\'extérieur du bâtiment. Le coût varie de 15 000 à 40 000 € selon le nombre d\'étages et le type (hydraulique, électrique, pneumatique). Un permis de construire est nécessaire si l\'installation modifie la structure ou la façade du bâtiment.',
+    },
+    {
+      q: 'Monte-escalier droit ou tournant : quelle différence de prix ?',
+      a: 'Un monte-escalier pour escalier droit coûte 3 500 à 5 000 € car le rail est standard. Pour un escalier tournant ou avec palier, le rail est fabriqué sur mesure, ce qui porte le prix à 6 000 à 12 000 €. L\'installation prend 2 à 4 heures pour un droit et une journée pour un tournant. Les deux types bénéficient des mêmes aides financières.',
+    },
+    {
+      q: 'Quel est le coût de maintenance d\'un ascenseur en copropriété ?',
+      a: 'Le contrat de maintenance annuel coûte 1 500 à 4 000 € selon le type d\'ascenseur et le niveau de prestation (normal ou complet). La loi impose un entretien mensuel, un contrôle semestriel de sécurité et un contrôle technique quinquennal par un organisme indépendant (1 000 à 2 000 €). Le budget total annuel pour un ascenseur est de 2 500 à 6 000 €.',
+    },
+    {
+      q: 'Quelles sont les normes de sécurité pour un ascenseur ?',
+      a: 'Les ascenseurs doivent respecter la directive européenne 2014/33/UE et la norme NF EN 81-20. Les travaux de modernisation obligatoires (loi SAE de 2003) incluent : porte palière verrouillée, dispositif anti-vandalisme, système de télécommunication en cabine, précision d\'arrêt et d\'horizontalité, et dispositif de protection contre la vitesse excessive.',
+    },
+  ],
+  emergencyInfo: 'En cas de personne bloquée dans un ascenseur ou de panne immobilisant la cabine, les sociétés d\'ascenseurs ont l\'obligation réglementaire (décret n° 2004-964) de disposer d\'un service de garde joignable à tout moment. En cas de personne bloquée, appelez également les pompiers (18). Majorations : +100 à 150 % la nuit, le week-end et les jours fériés.',
+  certifications: [
+    'Conformité NF EN 81-20/50 (norme européenne de sécurité des ascenseurs)', 'Habilitation électrique HBT (obligatoire)',
+    'Certification constructeur agréé (Otis, Schindler, Kone, ThyssenKrupp)', 'Contrôle technique quinquennal obligatoire (organisme agréé)',
+  ],
+  averageResponseTime: 'Diagnostic sous 1 semaine, installation 4 à 12 semaines',
+}
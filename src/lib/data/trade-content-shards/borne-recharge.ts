@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'borne-recharge',
+  name: 'Borne de recharge',
+  priceRange: { min: 1200, max: 3000, unit: '€' },
+  commonTasks: [
+    'Borne 7,4 kW (monophasé) : 1 200 à 2 000 €', 'Borne 11 kW (triphasé) : 1 500 à 2 500 €', 'Borne 22 kW (triphasé) : 2 000 à 3 500 €',
+    'Installation en copropriété (droit à la prise) : 1 500 à 3 000 €', 'Mise aux normes du tableau électrique : 500 à 1 500 €',
+  ],
+  tips: [
+    'Seul un électricien certifié IRVE peut installer une borne de recharge — c\'est obligatoire pour bénéficier des aides (prime Advenir en copropriété). Note : le crédit d\'impôt de 300 € a été supprimé au 1er janvier 2026.',
+    'Une borne 7,4 kW suffit pour la plupart des usages (recharge complète en 6 à 8h pendant la nuit).',
+    'Vérifiez la puissance de votre abonnement électrique avant l\'installation : une borne 7,4 kW nécessite souvent un passage en 9 kVA minimum, et une borne 11 kW exige un raccordement triphasé.',
+    'Programmez la recharge en heures creuses (généralement entre 22h et 6h) pour réduire le coût d\'électricité de 30 à 40 % par rapport aux heures pleines.',
+    'En copropriété, vous pouvez invoquer le « droit à la prise » (décret du 13 juillet 2011) : le syndic ne peut pas refuser l\'installation sauf motif sérieux et légitime.',
+  ],
+  faq: [
+    {
+      q: 'Quelles aides pour installer une borne de recharge ?',
+      a: 'Le crédit d\'impôt pour borne de recharge a été supprimé au 1er janvier 2026. Prime Advenir jusqu\'à 960 € en copropriété, TVA réduite à 5,5 % pour les logements de plus de 2 ans. Le budget net après aides dépend de votre situation (copropriété, aides locales).',
+    },
+    {
+      q: 'Peut-on recharger sa voiture électrique sur une prise domestique classique ?',
+      a: 'Techniquement oui, mais c\'est déconseillé pour un usage quotidien. Une prise standard 230V/10A délivre seulement 2,3 kW, soit 10 à 15 heures pour une recharge complète. De plus, elle n\'est pas conçue pour une utilisation prolongée à pleine charge et peut provoquer un échauffement dangereux. Une prise renforcée Green\'Up (3,7 kW) est un minimum acceptable.',
+    },
+    {
+      q: 'Quelle différence entre une borne monophasée et triphasée ?',
+      a: 'Une borne monophasée (7,4 kW max) est la plus courante en maison individuelle et suffit pour une recharge nocturne. Une borne triphasée (11 ou 22 kW) recharge 2 à 3 fois plus vite mais nécessite un raccordement triphasé (modification du compteur Enedis, 150 à 300 €). Le triphasé est recommandé si vous parcourez plus de 100 km par jour.',
+    },
+    {
+      q: 'Combien coûte la recharge d\'une voiture électrique à domicile ?',
+      a: 'En tarif de base, une recharge complète (batterie de 50 kWh) coûte environ 10 à 12 €. En heures creuses, ce coût tombe à 7 à 8 €, soit environ 2 € aux 100 km. C\'est 4 à 5 fois moins cher qu\'un véhicule essence. Avec un abonnement adapté et la programmation nocturne, le surcoût d\'électricité est de 30 à 50 €/mois pour 15 000 km/an.',
+    },
+    {
+      q: 'L\'installation d\'une borne nécessite-t-elle des travaux importants ?',
+      a: 'Dans la majorité des cas, l\'installation est simple : fixation murale de la borne, tirage d\'un câble depuis le tableau électrique et ajout d\'un disjoncteur dédié. Les travaux durent 2 à 4 heures. Cependant, si le tableau est éloigné du garage (plus de 20 m) ou si une mise aux normes électrique est nécessaire, le coût et la durée augmentent significativement.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'installation de bornes de recharge. En cas de panne de votre borne existante, contactez le SAV du fabricant ou votre installateur IRVE pour un diagnostic sous 48h.',
+  certifications: [
+    'Qualification IRVE P1/P2/P3 (obligatoire — Infrastructure de Recharge de Véhicules Électriques)', 'Habilitation électrique (obligatoire)', 'Qualifelec (mention IRVE)',
+    'Consuel (attestation de conformité électrique)',
+  ],
+  averageResponseTime: 'Devis sous 48h, installation sous 1 à 2 semaines',
+}
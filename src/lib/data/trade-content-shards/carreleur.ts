@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'carreleur',
+  name: 'Carreleur',
+  priceRange: { min: 35, max: 65, unit: '€/m²' },
+  commonTasks: [
+    'Pose de carrelage au sol (format standard) : 35 à 55 €/m² (pose uniquement)', 'Pose de carrelage grand format (60x60 et plus) : 50 à 75 €/m²',
+    'Pose de faïence murale (salle de bain) : 40 à 65 €/m²', 'Pose de mosaïque : 60 à 100 €/m²', 'Carrelage d\'une terrasse extérieure : 45 à 80 €/m²',
+    'Dépose d\'ancien carrelage + repose : 15 à 30 €/m² supplémentaires',
+  ],
+  tips: [
+    'Le prix de la pose dépend fortement du format des carreaux : les grands formats (60x60, 80x80) et les poses en diagonale ou en décalé coûtent 20 à 40 % plus cher que la pose droite en format standard.',
+    'Vérifiez que le carreleur inclut la préparation du support dans son devis : ragréage, mise à niveau et étanchéité (obligatoire en salle de bain sous la norme DTU 52.1). Un support mal préparé est la première cause de décollement.',
+    'Prévoyez 10 à 15 % de carrelage supplémentaire pour les coupes et la casse. Pour les grands formats et les poses complexes, cette marge peut monter à 20 %.',
+    'Demandez au carreleur son avis sur le type de carrelage adapté à votre usage : classement UPEC pour l\'intérieur (U pour usure, P pour poinçonnement, E pour eau, C pour chimique), et classement R pour l\'antidérapant en extérieur.',
+    'Pour une salle de bain, exigez une étanchéité sous carrelage (système SPEC conforme au DTU 52.1). C\'est un travail supplémentaire mais indispensable pour éviter les infiltrations.',
+  ],
+  faq: [
+    {
+      q: 'Combien de temps faut-il pour carreler une salle de bain ?',
+      a: 'Pour une salle de bain standard de 5 à 8 m² (sol + murs), comptez 3 à 5 jours de travail incluant la préparation, la pose de l\'étanchéité, le carrelage et les joints. Ajoutez 1 à 2 jours si l\'ancien carrelage doit être déposé. Le séchage des joints nécessite 24h supplémentaires avant utilisation.',
+    },
+    {
+      q: 'Puis-je poser du carrelage sur un ancien carrelage ?',
+      a: 'Oui, c\'est possible si l\'ancien carrelage est bien adhérent, plan et en bon état. Le carreleur utilisera un primaire d\'accrochage spécifique. Attention cependant : cette technique ajoute environ 1 cm d\'épaisseur au sol, ce qui peut poser des problèmes de seuil de porte et de hauteur sous plafond dans certaines pièces.',
+    },
+    {
+      q: 'Quel carrelage choisir pour un sol de cuisine ?',
+      a: 'Pour une cuisine, privilégiez un carrelage grès cérame classement UPEC U3 P3 E2 C1 minimum : résistant à l\'usure, aux chocs, à l\'eau et aux produits ménagers. Les formats 30x60 ou 60x60 en finition mate ou satinée sont les plus pratiques. Évitez les finitions très brillantes (glissantes) et les couleurs trop claires (salissantes).',
+    },
+    {
+      q: 'Quel est le coût de la pose de carrelage au m² ?',
+      a: 'La pose de carrelage au sol coûte entre 35 et 55 €/m² en format standard (30x30 à 45x45), 50 à 75 €/m² pour du grand format (60x60 et plus) et 60 à 100 €/m² pour de la mosaïque. La pose murale (faïence) revient à 40 à 65 €/m². Ces prix s\'entendent hors fourniture du carrelage. Ajoutez 15 à 30 €/m² si l\'ancien revêtement doit être déposé.',
+    },
+    {
+      q: 'Faut-il une étanchéité sous le carrelage de salle de bain ?',
+      a: 'Oui, l\'étanchéité sous carrelage (système SPEC) est indispensable dans les zones de projection d\'eau (douche, contour de baignoire) conformément au DTU 52.1. Le carreleur applique une membrane ou un produit liquide d\'étanchéité avant la pose du carrelage. Ce poste supplémentaire coûte 20 à 40 €/m² mais évite les infiltrations d\'eau et les dégâts des eaux chez le voisin du dessous.',
+    },
+    {
+      q: 'Comment choisir entre carrelage et grès cérame ?',
+      a: 'Le grès cérame est en réalité un type de carrelage, fabriqué par pressage à haute température. Il est plus dense, plus résistant et moins poreux que la faïence ou le carrelage classique en terre cuite. Le grès cérame pleine masse est le plus solide (teinté dans la masse, les éclats sont invisibles). Pour un usage courant en intérieur, le grès cérame émaillé offre le meilleur rapport qualité-prix.',
+    },
+    {
+      q: 'Quel carrelage choisir pour une terrasse extérieure ?',
+      a: 'Pour une terrasse, choisissez un carrelage antidérapant classé R11 minimum (R12 en bord de piscine), résistant au gel (norme ISO 10545-12) et de faible porosité. Le grès cérame pleine masse ou le carrelage en pierre naturelle sont les mieux adaptés. Prévoyez une pente de 1 à 2 % pour l\'évacuation de l\'eau. Le budget est de 45 à 80 €/m² pour la pose.',
+    },
+    {
+      q: 'Combien de temps faut-il attendre avant de marcher sur un carrelage neuf ?',
+      a: 'Il faut attendre 24 heures minimum après la pose avant de marcher sur le carrelage, le temps que la colle sèche. Les joints doivent être réalisés 24 à 48 heures après la pose et nécessitent à leur tour 24 heures de séchage. Au total, comptez 3 à 4 jours avant de pouvoir utiliser normalement la pièce. Évitez de poser des meubles lourds pendant au moins une semaine.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour le carrelage. Prenez rendez-vous pour un devis gratuit sous 48h et une intervention planifiée sous 1 à 3 semaines.',
+  certifications: [
+    'Qualibat (qualification 6321/6322 carrelage et revêtements céramiques)', 'Certification CSTB (classement UPEC des locaux — Centre Scientifique et Technique du Bâtiment)',
+    'Compagnons du Devoir (formation d\'excellence)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+}
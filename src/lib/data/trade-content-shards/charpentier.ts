@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'charpentier',
+  name: 'Charpentier',
+  priceRange: { min: 50, max: 120, unit: '€/m²' },
+  commonTasks: [
+    'Charpente traditionnelle bois : 70 à 150 €/m² de toiture', 'Charpente fermettes industrielles : 50 à 80 €/m²',
+    'Réparation de charpente (remplacement de pièces) : 100 à 250 €/ml', 'Traitement insecticide/fongicide : 15 à 30 €/m²', 'Surélévation en ossature bois : 1 200 à 2 000 €/m²',
+  ],
+  tips: [
+    'Un traitement préventif de la charpente tous les 10 ans prolonge sa durée de vie de plusieurs décennies.',
+    'Pour une extension en bois, vérifiez que le charpentier est certifié ACQPA ou titulaire d\'un Qualibat charpente bois.',
+    'Exigez un diagnostic parasitaire (termites, capricornes) avant toute rénovation de charpente ancienne.',
+    'En zone sismique, la charpente doit respecter les règles parasismiques (Eurocode 8). Demandez au charpentier de vérifier la classification de votre commune.',
+    'Lors d\'une surélévation en ossature bois, vérifiez que le PLU de votre commune autorise la hauteur supplémentaire et obtenez un permis de construire avant le démarrage des travaux.',
+  ],
+  faq: [
+    {
+      q: 'Quelle est la durée de vie d\'une charpente bois ?',
+      a: 'Une charpente bois bien entretenue dure 100 ans et plus. Les charpentes en chêne des bâtiments anciens atteignent souvent 200 à 300 ans. Le principal ennemi est l\'humidité, qui favorise les champignons (mérule) et les insectes xylophages.',
+    },
+    {
+      q: 'Charpente traditionnelle ou fermettes ?',
+      a: 'La charpente traditionnelle permet d\'aménager les combles et offre un cachet architectural. Les fermettes sont 30 à 40 % moins chères mais rendent les combles inaménageables (sauf conversion coûteuse). Pour une maison avec projet de combles aménagés, choisissez le traditionnel.',
+    },
+    {
+      q: 'Comment détecter un problème de charpente ?',
+      a: 'Les signes d\'alerte sont : affaissement visible de la toiture, craquements inhabituels, présence de sciure (signe d\'insectes xylophages), taches d\'humidité au plafond, odeur de moisi dans les combles. Au moindre doute, faites intervenir un charpentier pour un diagnostic. Un traitement précoce coûte 15 à 30 €/m², contre 100 à 250 €/ml pour un remplacement de pièce.',
+    },
+    {
+      q: 'Quel bois choisir pour une charpente ?',
+      a: 'Le sapin et l\'épicéa (résineux) sont les plus courants et économiques (classe d\'emploi 2). Le chêne est plus noble et résistant mais 2 à 3 fois plus cher. Le douglas offre un excellent compromis : naturellement durable (classe 3), il résiste aux insectes sans traitement chimique. Pour les régions humides, le mélèze est recommandé.',
+    },
+    {
+      q: 'Combien coûte l\'aménagement de combles avec modification de charpente ?',
+      a: 'L\'aménagement de combles avec modification de charpente (passage de fermettes en charpente traditionnelle) coûte entre 800 et 1 500 €/m² tout compris (charpente, isolation, plancher, escalier, finitions). Pour des combles de 40 m², prévoyez un budget de 35 000 à 60 000 €. C\'est souvent plus rentable qu\'une extension.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la charpente. En cas de dégât de tempête sur la charpente, contactez d\'abord un couvreur pour un bâchage d\'urgence, puis un charpentier pour le diagnostic et la réparation structurelle.',
+  certifications: [
+    'Qualibat (qualification 2311/2312 charpente bois)', 'CTB-A+ (certification traitement du bois — FCBA)', 'Compagnons du Devoir (formation d\'excellence)',
+    'RGE (si isolation des combles associée)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 4 semaines',
+}
@@ -0,0 +1,63 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'chauffagiste',
+  name: 'Chauffagiste',
+  priceRange: { min: 60, max: 100, unit: '€/h' },
+  commonTasks: [
+    'Entretien annuel de chaudière gaz : 100 à 200 €', 'Remplacement d\'une chaudière gaz à condensation : 3 000 à 7 000 € (fourniture + pose)',
+    'Installation d\'une pompe à chaleur air-eau : 8 000 à 15 000 €', 'Désembouage d\'un circuit de chauffage : 400 à 900 €',
+    'Remplacement de radiateurs : 300 à 800 € par radiateur (fourniture + pose)', 'Installation d\'un plancher chauffant : 50 à 100 €/m²',
+  ],
+  tips: [
+    'L\'entretien annuel de votre chaudière est obligatoire par la loi (décret du 9 juin 2009). Prévoyez-le à l\'automne, avant la saison de chauffe, pour éviter les pannes en plein hiver.',
+    'Privilégiez un chauffagiste certifié RGE pour bénéficier des aides financières : MaPrimeRenov\' (jusqu\'à 5 000 € pour une pompe à chaleur), CEE, éco-prêt à taux zéro et TVA à 5,5 %. Attention : depuis le 1er mars 2025, les chaudières gaz et fioul sont soumises à la TVA à 20 % (fin du taux réduit). La TVA réduite (5,5 % ou 10 %) s\'applique uniquement aux équipements non fossiles (PAC, chaudière biomasse, etc.).',
+    'Comparez les performances énergétiques (COP pour les pompes à chaleur, rendement pour les chaudières) et pas seulement le prix d\'achat. Une chaudière à condensation consomme 15 à 30 % de moins qu\'une ancienne chaudière non-condensation (plus de 15 ans).',
+    'Demandez un bilan thermique complet avant l\'installation d\'un nouveau système de chauffage. Un bon chauffagiste dimensionne l\'installation en fonction de la surface, de l\'isolation et de la zone climatique.',
+    'Souscrivez un contrat d\'entretien annuel : il coûte entre 120 et 250 € par an et inclut généralement la visite obligatoire, le dépannage prioritaire et les pièces d\'usure.',
+  ],
+  faq: [
+    {
+      q: 'Quand dois-je remplacer ma chaudière ?',
+      a: 'Une chaudière a une durée de vie moyenne de 15 à 20 ans. Les signes qui doivent alerter : pannes fréquentes, surconsommation de gaz, bruits inhabituels, eau pas assez chaude. Si votre chaudière a plus de 15 ans, un remplacement par un modèle à condensation vous fera économiser 20 à 30 % sur votre facture énergétique.',
+    },
+    {
+      q: 'Pompe à chaleur ou chaudière gaz : que choisir ?',
+      a: 'La pompe à chaleur air-eau est plus écologique et bénéficie de plus d\'aides (MaPrimeRenov\' jusqu\'à 5 000 €), mais son coût d\'installation est plus élevé (8 000 à 15 000 € contre 3 000 à 7 000 € pour une chaudière gaz). Elle est idéale pour les maisons bien isolées. La chaudière gaz à condensation reste pertinente en appartement ou si le réseau de gaz est déjà installé.',
+    },
+    {
+      q: 'Les aides de l\'État pour le chauffage sont-elles cumulables ?',
+      a: 'Oui, sous conditions de revenus et avec un artisan RGE. Vous pouvez cumuler MaPrimeRenov\', les CEE (Certificats d\'Économies d\'Énergie), l\'éco-prêt à taux zéro (jusqu\'à 50 000 €) et la TVA réduite à 5,5 %. Le montant total peut couvrir 50 à 90 % du coût des travaux pour les ménages modestes. Attention : depuis le 1er mars 2025, les chaudières gaz et fioul sont soumises à la TVA à 20 % (fin du taux réduit). La TVA réduite (5,5 % ou 10 %) s\'applique uniquement aux équipements non fossiles (PAC, chaudière biomasse, etc.).',
+    },
+    {
+      q: 'Ma chaudière est en panne en plein hiver, que faire ?',
+      a: 'Vérifiez d\'abord les éléments simples : thermostat, pression du circuit (entre 1 et 1,5 bar), disjoncteur dédié. Si le problème persiste, appelez un chauffagiste en urgence. Les délais varient selon les disponibilités et votre localisation. Si vous avez un contrat d\'entretien, le dépannage est souvent inclus ou prioritaire.',
+    },
+    {
+      q: 'L\'entretien annuel de la chaudière est-il vraiment obligatoire ?',
+      a: 'Oui, l\'entretien annuel est obligatoire depuis le décret du 9 juin 2009 pour toutes les chaudières (gaz, fioul, bois) d\'une puissance de 4 à 400 kW. Le chauffagiste vérifie la combustion, nettoie les composants et mesure les émissions de CO. Il remet une attestation d\'entretien, exigée par l\'assurance en cas de sinistre. Le coût est de 100 à 200 €.',
+    },
+    {
+      q: 'Comment purger correctement ses radiateurs ?',
+      a: 'La purge des radiateurs doit se faire chaque année avant la saison de chauffe. Ouvrez la vis de purge en haut du radiateur avec une clé spéciale, laissez l\'air s\'échapper jusqu\'à ce que de l\'eau coule, puis refermez. Commencez par le radiateur le plus proche de la chaudière. Après la purge, vérifiez la pression du circuit (1 à 1,5 bar) et ajoutez de l\'eau si nécessaire.',
+    },
+    {
+      q: 'Quel est le coût d\'un plancher chauffant ?',
+      a: 'L\'installation d\'un plancher chauffant hydraulique coûte entre 50 et 100 €/m² (pose uniquement) et entre 70 et 120 €/m² pour un système électrique. Pour une maison de 100 m², le budget total (fourniture + pose) est de 8 000 à 15 000 €. Le plancher chauffant offre un confort supérieur aux radiateurs et permet des économies d\'énergie de 10 à 15 %.',
+    },
+    {
+      q: 'Faut-il un contrat d\'entretien pour sa chaudière ?',
+      a: 'Le contrat d\'entretien n\'est pas obligatoire mais vivement recommandé. Il coûte entre 120 et 250 € par an et inclut la visite annuelle obligatoire, le dépannage prioritaire (souvent sous 24h) et parfois les pièces d\'usure. Sans contrat, une intervention d\'urgence coûte 150 à 350 € avec des délais plus longs, surtout en plein hiver.',
+    },
+  ],
+  emergencyInfo: 'En cas de panne de chauffage en hiver, contactez un chauffagiste d\'urgence : les délais d\'intervention varient selon les disponibilités et la localisation. En cas d\'odeur de gaz, ouvrez les fenêtres, ne touchez pas aux interrupteurs électriques, quittez le logement et appelez immédiatement le numéro d\'urgence GRDF : 0 800 47 33 33 (gratuit, 24h/24).',
+  certifications: [
+    'RGE (Reconnu Garant de l\'Environnement)', 'Qualibat (qualification 5211/5212 chauffage)', 'PG (Professionnel du Gaz — obligatoire pour les installations gaz)',
+    'Qualigaz (certificat de conformité gaz)', 'QualiPAC (pompes à chaleur)', 'Qualibois (chauffage bois : poêles, chaudières)', 'Qualifioul (installations fioul)',
+    'QualiSol (chauffe-eau solaire)',
+  ],
+  averageResponseTime: 'Urgence : délai variable selon disponibilité ; entretien sur rendez-vous sous 1 à 2 semaines',
+}
@@ -0,0 +1,63 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'climaticien',
+  name: 'Climaticien',
+  priceRange: { min: 60, max: 100, unit: '€/h' },
+  commonTasks: [
+    'Installation d\'un split mural (2,5 kW) : 1 500 à 3 000 €', 'Pose d\'une climatisation gainable : 5 000 à 12 000 €',
+    'Installation d\'une climatisation multi-split (3 unités) : 4 000 à 8 000 €', 'Entretien annuel d\'une climatisation : 100 à 200 €',
+    'Recharge de gaz réfrigérant : 200 à 500 €', 'Installation d\'une pompe à chaleur air-air : 3 000 à 7 000 €',
+  ],
+  tips: [
+    'Privilégiez un climaticien certifié RGE et détenteur de l\'attestation de capacité à manipuler les fluides frigorigènes, obligatoire depuis 2015 pour toute intervention sur un circuit frigorifique.',
+    'Une pompe à chaleur air-air (climatisation réversible) est plus économique qu\'une climatisation classique : elle consomme 1 kWh d\'électricité pour produire 3 à 4 kWh de chaleur ou de froid (COP de 3 à 4).',
+    'Le dimensionnement est crucial : une climatisation trop puissante consomme plus et dégrade le confort (cycles courts). Exigez un bilan thermique avant toute installation.',
+    'L\'entretien annuel est obligatoire pour les systèmes contenant plus de 2 kg de fluide frigorigène (la plupart des splits). Le carnet d\'entretien doit être tenu à jour.',
+    'Attention au bruit : vérifiez le niveau sonore de l\'unité extérieure (en dB(A)) et respectez les distances réglementaires avec le voisinage. L\'installation d\'une unité extérieure en copropriété nécessite souvent l\'accord de l\'assemblée générale.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte l\'installation d\'une climatisation ?',
+      a: 'Un split mural standard (2,5 kW, pour une pièce de 25 m²) coûte entre 1 500 et 3 000 € pose comprise. Un système multi-split (3 unités intérieures) revient à 4 000 à 8 000 €. La climatisation gainable (invisible, conduits dans les faux plafonds) coûte 5 000 à 12 000 €. Les modèles réversibles (chaud/froid) sont plus économiques à l\'usage.',
+    },
+    {
+      q: 'La climatisation réversible est-elle économique pour le chauffage ?',
+      a: 'Oui, une pompe à chaleur air-air réversible consomme 3 à 4 fois moins d\'électricité qu\'un radiateur électrique classique grâce à son COP (Coefficient de Performance). Pour un appartement de 60 m², l\'économie est de 300 à 600 € par an sur la facture de chauffage. L\'investissement est amorti en 3 à 5 ans.',
+    },
+    {
+      q: 'Faut-il une autorisation pour installer une climatisation ?',
+      a: 'L\'unité extérieure ne nécessite pas de permis de construire, mais une déclaration préalable peut être exigée dans certaines communes (vérifiez le PLU). En copropriété, l\'accord de l\'assemblée générale est généralement requis. Respectez les réglementations sur le bruit (émergence < 5 dB(A) le jour, < 3 dB(A) la nuit).',
+    },
+    {
+      q: 'À quelle fréquence faut-il entretenir sa climatisation ?',
+      a: 'L\'entretien annuel est obligatoire pour les systèmes contenant plus de 2 kg de fluide frigorigène. Nettoyez les filtres intérieurs tous les 2 à 4 semaines en période d\'utilisation (un filtre encrassé réduit les performances de 20 à 30 %). L\'entretien professionnel comprend la vérification du circuit frigorifique, le nettoyage des échangeurs et le contrôle de l\'étanchéité. Le coût est de 100 à 200 € par an.',
+    },
+    {
+      q: 'Quelle puissance de climatisation pour ma pièce ?',
+      a: 'En règle générale, comptez 100 watts par m² pour une pièce standard (hauteur sous plafond de 2,50 m, isolation correcte). Ainsi, une pièce de 25 m² nécessite environ 2 500 watts (2,5 kW). Ce calcul doit être affiné par un bilan thermique tenant compte de l\'exposition, de la surface vitrée, de l\'isolation et du nombre d\'occupants. Un surdimensionnement entraîne des cycles courts et une surconsommation.',
+    },
+    {
+      q: 'La climatisation réversible remplace-t-elle un chauffage classique ?',
+      a: 'Dans le sud de la France et les régions tempérées, une pompe à chaleur air-air réversible peut constituer le chauffage principal. En revanche, dans les régions au climat continental ou montagnard (températures inférieures à -7 °C), elle doit être complétée par un chauffage d\'appoint car son rendement baisse fortement par grand froid. Un modèle Inverter maintient de bonnes performances jusqu\'à -15 °C.',
+    },
+    {
+      q: 'Climatisation split ou gainable : quelle différence ?',
+      a: 'Le split mural est l\'option la plus simple et la moins chère (1 500 à 3 000 € par unité), idéale pour climatiser une ou deux pièces. La climatisation gainable distribue l\'air via des gaines dans les faux plafonds : elle est invisible, silencieuse et climatise tout le logement de manière homogène, mais coûte plus cher (5 000 à 12 000 €) et nécessite un faux plafond ou des combles accessibles.',
+    },
+    {
+      q: 'Quel est l\'impact de la climatisation sur la facture d\'électricité ?',
+      a: 'Un split de 2,5 kW consomme environ 800 à 1 200 kWh par saison (juin à septembre), soit 150 à 250 € sur la facture d\'électricité. Les modèles Inverter de classe A+++ consomment 30 à 40 % de moins que les modèles classiques. Réglez le thermostat sur 25-26 °C plutôt que 20 °C : chaque degré en moins augmente la consommation de 7 %.',
+    },
+  ],
+  emergencyInfo: 'En cas de panne de climatisation pendant une canicule, contactez un climaticien d\'urgence : les délais varient selon les disponibilités. Vérifiez d\'abord les réglages, le disjoncteur dédié et les filtres (encrassés = perte de performance). En attendant, fermez les volets, aérez la nuit et utilisez un ventilateur.',
+  certifications: [
+    'Attestation de capacité fluides frigorigènes (obligatoire — catégorie I à IV)', 'RGE (Reconnu Garant de l\'Environnement)',
+    'QualiPAC (pompes à chaleur et climatisation réversible)', 'Qualifroid / Qualiclimafroid (qualification froid et climatisation, accrédité COFRAC)',
+    'Qualibat (qualification 5311/5312 génie climatique)',
+  ],
+  averageResponseTime: 'Urgence canicule : délai variable selon disponibilité ; installation sur devis sous 2 à 4 semaines',
+}
@@ -0,0 +1,61 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'couvreur',
+  name: 'Couvreur',
+  priceRange: { min: 50, max: 90, unit: '€/m²' },
+  commonTasks: [
+    'Réparation de fuite de toiture : 200 à 800 €', 'Remplacement de tuiles cassées : 40 à 80 €/m²', 'Réfection complète de toiture (100 m²) : 8 000 à 18 000 €',
+    'Pose de gouttière en zinc : 40 à 80 €/ml', 'Nettoyage et démoussage de toiture : 15 à 30 €/m²', 'Installation de fenêtre de toit (Velux) : 500 à 1 500 € (hors fourniture)',
+  ],
+  tips: [
+    'Faites inspecter votre toiture tous les 5 ans et après chaque épisode de grêlons ou de tempête. Une petite réparation à temps évite un remplacement complet bien plus coûteux.',
+    'Vérifiez que le couvreur dispose d\'une garantie décennale à jour et d\'une assurance responsabilité civile. Les travaux de toiture engagent la solidité de l\'ouvrage et sont couverts 10 ans.',
+    'Profitez d\'une réfection de toiture pour améliorer l\'isolation : l\'isolation par l\'extérieur (sarking) ou par l\'intérieur permet de réduire les déperditions thermiques de 25 à 30 %. Un couvreur RGE ouvre droit aux aides de l\'État.',
+    'Ne montez jamais seul sur un toit pour évaluer les dégâts. La chute de hauteur est la première cause d\'accident mortel dans le bâtiment. Laissez l\'inspection à un professionnel équipé.',
+    'Demandez des photos avant/après et un rapport d\'intervention écrit. Certains couvreurs utilisent des drones pour inspecter la toiture sans échafaudage, ce qui réduit les coûts.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte une réfection complète de toiture ?',
+      a: 'Pour une maison de 100 m² de toiture, comptez entre 8 000 et 18 000 € selon le matériau (tuiles terre cuite : 50-80 €/m², ardoise : 80-120 €/m², zinc : 60-100 €/m²) et la complexité (pente, cheminée, lucarnes). Ce prix inclut la dépose, la fourniture et la pose. L\'échafaudage représente 10 à 15 % du budget.',
+    },
+    {
+      q: 'Faut-il un permis de construire pour refaire sa toiture ?',
+      a: 'Une déclaration préalable de travaux suffit si vous conservez le même matériau et la même couleur. En revanche, un permis de construire est nécessaire si vous modifiez la pente, la hauteur ou le type de couverture. En zone protégée (ABF), l\'accord de l\'Architecte des Bâtiments de France est requis.',
+    },
+    {
+      q: 'À quelle fréquence faut-il démousser sa toiture ?',
+      a: 'Un démoussage est recommandé tous les 3 à 5 ans, selon l\'exposition et l\'environnement (plus fréquent près d\'arbres ou en zone humide). Le démoussage coûte entre 15 et 30 €/m² et prolonge la durée de vie de votre couverture. Évitez le nettoyeur haute pression, qui endommage les tuiles.',
+    },
+    {
+      q: 'Ma toiture fuit après une tempête, que faire en urgence ?',
+      a: 'Placez des récipients sous les fuites et contactez un couvreur d\'urgence. Prenez des photos des dégâts pour votre assurance et déclarez le sinistre sous 5 jours ouvrés (30 jours après publication de l\'arrêté de catastrophe naturelle au Journal Officiel, art. L113-2 Code des assurances). En attendant le couvreur, vous pouvez bâcher temporairement la zone depuis l\'intérieur des combles, sans monter sur le toit.',
+    },
+    {
+      q: 'Quelle est la durée de vie d\'une toiture selon le matériau ?',
+      a: 'Les tuiles en terre cuite durent 50 à 100 ans, l\'ardoise naturelle 75 à 150 ans, le zinc 50 à 80 ans et les tuiles béton 30 à 50 ans. Le shingle (bitume) a la durée de vie la plus courte : 20 à 30 ans. Ces durées supposent un entretien régulier (démoussage, remplacement des éléments cassés, vérification des solins et faîtages).',
+    },
+    {
+      q: 'Combien coûte l\'installation d\'une fenêtre de toit (Velux) ?',
+      a: 'L\'installation d\'une fenêtre de toit standard (78x98 cm) coûte entre 500 et 1 500 € pour la pose seule, auxquels s\'ajoute le prix de la fenêtre (300 à 1 200 € selon le modèle). Une fenêtre motorisée avec stores intégrés peut atteindre 2 500 €. Le couvreur doit assurer une parfaite étanchéité avec un kit de raccordement adapté à la couverture.',
+    },
+    {
+      q: 'L\'isolation de toiture est-elle éligible aux aides de l\'État ?',
+      a: 'Oui, l\'isolation de la toiture par l\'intérieur ou l\'extérieur (sarking) est éligible à MaPrimeRenov\' (jusqu\'à 25 €/m² pour les ménages modestes), aux CEE et à l\'éco-prêt à taux zéro. Le couvreur doit être certifié RGE. L\'isolation de toiture est l\'un des travaux les plus rentables : elle réduit les déperditions thermiques de 25 à 30 % et se rentabilise en 4 à 6 ans.',
+    },
+    {
+      q: 'Comment savoir si ma charpente a besoin d\'un traitement ?',
+      a: 'Inspectez les bois de charpente à la recherche de sciure au sol (signe de vrillettes ou capricornes), de trous de sortie d\'insectes, de champignons (mérule) ou de bois qui s\'effrite au contact. Un diagnostic par un professionnel est recommandé tous les 10 ans. Le traitement préventif ou curatif coûte entre 20 et 50 €/m² et protège la charpente pour 10 à 20 ans.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour dégâts de tempête, tuiles arrachées ou fuite de toiture. Un couvreur d\'urgence peut effectuer un bâchage provisoire pour protéger votre habitation, selon disponibilité. Majorations : +80 à 120 % la nuit et le week-end.',
+  certifications: [
+    'Qualibat (qualification 3111/3112 couverture en tuiles)', 'RGE (obligatoire pour l\'isolation de toiture — aides MaPrimeRénov\')',
+    'Compagnons du Devoir (formation d\'excellence)', 'QualiPV (si pose de panneaux solaires en toiture)',
+  ],
+  averageResponseTime: 'Urgence (bâchage, fuite) : délai variable selon disponibilité ; travaux de réfection sous 1 à 4 semaines',
+}
@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'cuisiniste',
+  name: 'Cuisiniste',
+  priceRange: { min: 3000, max: 15000, unit: '€ (cuisine complète)' },
+  commonTasks: [
+    'Cuisine équipée entrée de gamme (5 ml) : 3 000 à 6 000 € (fourniture + pose)', 'Cuisine équipée milieu de gamme : 6 000 à 12 000 €',
+    'Cuisine sur mesure haut de gamme : 12 000 à 30 000 €', 'Remplacement d\'un plan de travail : 200 à 800 €/ml selon le matériau',
+    'Pose seule d\'une cuisine (hors meubles) : 1 500 à 4 000 €', 'Installation d\'un îlot central : 2 000 à 8 000 €',
+  ],
+  tips: [
+    'Faites réaliser plusieurs plans d\'aménagement avant de vous engager. Un bon cuisiniste propose un plan 3D gratuit et prend en compte vos habitudes culinaires, pas uniquement l\'esthétique.',
+    'Vérifiez que le devis inclut tous les postes : meubles, plan de travail, électroménager, plomberie, électricité, crédence et finitions. Les "surprises" représentent souvent 10 à 20 % du budget initial.',
+    'Le triangle d\'activité (évier-plaque-réfrigérateur) est la clé d\'une cuisine fonctionnelle : la distance entre chaque point ne doit pas dépasser 2,5 m pour un confort optimal.',
+    'Privilégiez les charnières et glissières de marque (Blum, Hettich, Grass) : ce sont les pièces les plus sollicitées et la qualité de la quincaillerie détermine la durabilité de la cuisine.',
+    'Demandez la garantie sur les meubles (minimum 5 ans), le plan de travail et la pose. Un cuisiniste sérieux offre un service après-vente et un ajustement des portes après 6 mois d\'utilisation.',
+  ],
+  faq: [
+    {
+      q: 'Quel budget prévoir pour une cuisine équipée ?',
+      a: 'Pour une cuisine de 5 mètres linéaires, comptez 3 000 à 6 000 € en entrée de gamme (meubles en mélaminé, électroménager basique), 6 000 à 12 000 € en milieu de gamme (façades laquées, électroménager de marque) et 12 000 à 30 000 € pour du haut de gamme ou du sur-mesure. La pose représente 15 à 25 % du budget total.',
+    },
+    {
+      q: 'Combien de temps dure l\'installation d\'une cuisine ?',
+      a: 'L\'installation complète (dépose ancienne cuisine, plomberie, électricité, pose des meubles, plan de travail, électroménager et finitions) prend entre 3 et 7 jours ouvrés. Ajoutez 1 à 2 semaines de délai pour la fabrication des meubles sur mesure et 2 à 3 mois pour le haut de gamme.',
+    },
+    {
+      q: 'Quel plan de travail choisir ?',
+      a: 'Le stratifié est le plus abordable (50-150 €/ml) et disponible en nombreux décors. Le bois massif (150-300 €/ml) est chaleureux mais demande un entretien régulier. Le quartz (250-500 €/ml) est très résistant et sans entretien. Le granit (300-600 €/ml) est indestructible. La céramique (400-800 €/ml) résiste à tout (chaleur, rayures, taches).',
+    },
+    {
+      q: 'Faut-il prévoir des travaux de plomberie et d\'électricité avec la cuisine ?',
+      a: 'Oui, la rénovation d\'une cuisine implique presque toujours des travaux de plomberie (déplacement de l\'évier, raccordement du lave-vaisselle) et d\'électricité (ajout de prises, circuit dédié pour le four et la plaque). Un bon cuisiniste coordonne ces corps de métier. Prévoyez 500 à 2 000 € supplémentaires pour la plomberie et 300 à 1 500 € pour l\'électricité.',
+    },
+    {
+      q: 'Comment bien agencer une petite cuisine ?',
+      a: 'Dans une cuisine de moins de 8 m², privilégiez un agencement en L ou en I pour optimiser l\'espace. Utilisez des meubles hauts jusqu\'au plafond, des tiroirs plutôt que des placards bas (accès plus facile), et un plan de travail escamotable si nécessaire. Un cuisiniste expérimenté peut rendre une cuisine de 5 m² parfaitement fonctionnelle grâce à des solutions sur mesure.',
+    },
+    {
+      q: 'Quelle est la différence entre une cuisine en kit et une cuisine sur mesure ?',
+      a: 'La cuisine en kit (grande surface de bricolage) coûte 1 000 à 4 000 € pour 5 ml mais propose des dimensions standardisées qui laissent parfois des espaces vides. La cuisine sur mesure (cuisiniste professionnel) coûte 3 000 à 15 000 € mais s\'adapte parfaitement à votre pièce, avec des matériaux de meilleure qualité et un suivi de chantier complet incluant la pose.',
+    },
+    {
+      q: 'Les cuisinistes proposent-ils un service après-vente ?',
+      a: 'Les cuisinistes sérieux offrent une garantie de 2 à 10 ans sur les meubles et un service après-vente incluant le réglage des portes et tiroirs après installation (le bois travaille les premiers mois). Vérifiez les conditions de garantie avant de signer : certaines enseignes incluent un ajustement gratuit à 6 mois. En cas de problème, le cuisiniste est votre interlocuteur unique, contrairement à une cuisine en kit.',
+    },
+    {
+      q: 'Quels sont les délais pour une cuisine sur mesure ?',
+      a: 'Comptez 2 à 3 semaines pour la conception (prise de mesures, plan 3D, choix des matériaux), 4 à 8 semaines pour la fabrication des meubles, et 3 à 7 jours pour la pose complète. Au total, prévoyez 2 à 3 mois entre la commande et l\'installation. Les cuisines haut de gamme ou importées peuvent nécessiter 3 à 4 mois de fabrication.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'installation de cuisine. La conception, la fabrication et la pose sont des projets planifiés sur plusieurs semaines. Prenez rendez-vous pour un premier échange sous 48h.',
+  certifications: [
+    'Qualibat (qualification aménagement intérieur)', 'NF Ameublement (certification AFNOR/FCBA — sécurité et durabilité du mobilier)',
+    'NF Environnement Ameublement (label éco-responsable)', 'Garantie Meubles de France (fabrication française)',
+  ],
+  averageResponseTime: 'Conception 2 à 3 semaines, fabrication 4 à 8 semaines, pose 3 à 7 jours',
+}
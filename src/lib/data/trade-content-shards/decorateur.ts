@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'decorateur',
+  name: 'Décorateur',
+  priceRange: { min: 50, max: 120, unit: '€/h' },
+  commonTasks: [
+    'Conseil en décoration (visite + recommandations) : 150 à 500 €', 'Planche d\'ambiance et shopping list : 300 à 1 000 €/pièce',
+    'Home staging pour vente immobilière : 1 à 3 % du prix de vente', 'Décoration événementielle : 500 à 3 000 €', 'Accompagnement achat mobilier : 50 à 120 €/h',
+  ],
+  tips: [
+    'Un bon décorateur vous fait gagner du temps et de l\'argent en évitant les erreurs d\'achat (meubles inadaptés, couleurs qui ne vont pas ensemble).',
+    'Pour un home staging, comptez un ROI de 5 à 10 fois le coût investi sur le prix de vente final.',
+    'Demandez au décorateur une shopping list avec des alternatives à plusieurs niveaux de prix : cela vous permet d\'ajuster le budget sans compromettre l\'harmonie générale du projet.',
+    'Pour une pièce à vivre, commencez par définir les couleurs dominantes (murs, sol) avant de choisir le mobilier. L\'inverse est une erreur fréquente qui oblige à tout reprendre.',
+    'Un décorateur professionnel bénéficie de tarifs négociés chez les fournisseurs (10 à 30 % de remise) : même en comptant ses honoraires, vous pouvez économiser sur l\'achat du mobilier.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte un décorateur pour un salon ?',
+      a: 'Pour un salon de 25 à 35 m², comptez 500 à 2 000 € pour une prestation complète : visite, planche d\'ambiance, shopping list et accompagnement achat. Le budget mobilier et accessoires est en sus.',
+    },
+    {
+      q: 'Quelle est la différence entre un décorateur et un home stager ?',
+      a: 'Le décorateur crée un intérieur personnalisé selon les goûts et le mode de vie du client (projet durable). Le home stager prépare un bien immobilier pour la vente en le dépersonnalisant et en le mettant en valeur pour séduire un maximum d\'acheteurs (projet temporaire). Le home staging coûte généralement 1 à 3 % du prix de vente et permet de vendre plus vite et souvent à un meilleur prix.',
+    },
+    {
+      q: 'Un décorateur peut-il intervenir à distance ?',
+      a: 'Oui, beaucoup de décorateurs proposent des prestations en ligne : vous envoyez les photos et les mesures de votre pièce, et le décorateur vous livre une planche d\'ambiance, un plan d\'aménagement et une shopping list. Le coût est 30 à 50 % inférieur à une prestation sur place (300 à 1 000 € par pièce). C\'est une bonne solution pour les petits budgets ou les zones éloignées.',
+    },
+    {
+      q: 'Quelles sont les tendances déco actuelles ?',
+      a: 'Les tendances 2025-2026 privilégient les matériaux naturels (bois brut, pierre, lin), les couleurs terracotta et vert sauge, le mobilier arrondi et les luminaires sculpturaux. Le style japandi (mélange japonais-scandinave) et le maximalisme coloré coexistent. Un bon décorateur vous guidera vers un style intemporel qui ne se démodera pas en quelques mois.',
+    },
+    {
+      q: 'Le décorateur achète-t-il le mobilier à ma place ?',
+      a: 'Selon la formule choisie, le décorateur peut soit vous fournir une shopping list que vous achetez vous-même, soit se charger de toutes les commandes (accompagnement achat). Dans le second cas, il gère les délais de livraison, vérifie la conformité des produits et coordonne la mise en place. Cette prestation coûte 50 à 120 €/h ou un forfait de 500 à 1 500 € selon le volume d\'achats.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la décoration d\'intérieur. Les prestations de conseil déco, home staging et accompagnement achat sont planifiées sur rendez-vous. Premier rendez-vous disponible sous 1 semaine.',
+  certifications: [
+    'Titre professionnel Décorateur d\'intérieur (inscrit au RNCP)', 'Membre de l\'UFDI (Union Francophone des Décorateurs d\'Intérieur)',
+    'Certification home staging (si spécialisation valorisation immobilière)',
+  ],
+  averageResponseTime: 'Premier rendez-vous sous 1 semaine',
+}
@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'demenageur',
+  name: 'Déménageur',
+  priceRange: { min: 500, max: 3000, unit: '€' },
+  commonTasks: [
+    'Déménagement studio (30 m²) même ville : 400 à 800 €', 'Déménagement T3 (60 m²) même ville : 800 à 1 500 €', 'Déménagement T3 longue distance (500 km) : 1 500 à 3 000 €',
+    'Déménagement maison (120 m²) : 2 000 à 5 000 €', 'Garde-meubles : 50 à 200 €/m³/mois',
+  ],
+  tips: [
+    'Demandez 3 devis minimum et vérifiez que le déménageur est immatriculé au registre des transporteurs (numéro DREAL).',
+    'Souscrivez l\'assurance « valeur déclarée » (1 à 2 % de la valeur des biens) plutôt que la couverture de base (très faible indemnisation au poids).',
+    'Faites une visite technique à domicile avec le déménageur avant de signer : c\'est la seule façon d\'obtenir un devis fiable et d\'éviter les mauvaises surprises le jour J (escalier étroit, piano, accès difficile).',
+    'Déballez et vérifiez vos cartons dans les 3 jours suivant la livraison : au-delà, il est beaucoup plus difficile de faire jouer la garantie pour les objets endommagés.',
+    'Comparez les formules : le déménagement « économique » (vous faites les cartons) coûte 30 à 40 % moins cher que la formule « tout compris » (emballage, transport, déballage).',
+  ],
+  faq: [
+    {
+      q: 'Quand réserver son déménageur ?',
+      a: 'Réservez 4 à 6 semaines à l\'avance en période creuse (octobre-mars) et 8 à 12 semaines en période haute (juin-septembre). Les premiers et derniers jours du mois sont les plus demandés. Un déménagement en milieu de mois et en semaine est souvent 20 à 30 % moins cher.',
+    },
+    {
+      q: 'Comment vérifier si un déménageur est sérieux ?',
+      a: 'Vérifiez qu\'il possède une immatriculation DREAL (registre des transporteurs, obligatoire), une assurance responsabilité civile professionnelle et idéalement le label NF Service Déménagement. Consultez les avis en ligne et demandez des références. Méfiez-vous des devis par téléphone sans visite à domicile et des prix très inférieurs au marché.',
+    },
+    {
+      q: 'Que faire en cas de casse ou de perte pendant le déménagement ?',
+      a: 'Notez les réserves directement sur le bon de livraison le jour du déménagement (« carton X abîmé », « meuble rayé »). Confirmez par lettre recommandée AR dans les 10 jours. L\'indemnisation dépend de l\'assurance souscrite : la couverture de base rembourse au poids (très peu), tandis que l\'assurance « valeur déclarée » rembourse à la valeur réelle. Conservez les factures d\'achat des objets de valeur.',
+    },
+    {
+      q: 'Combien de cartons faut-il pour un déménagement ?',
+      a: 'En moyenne, comptez 20 à 30 cartons pour un studio, 40 à 60 pour un T3 et 80 à 120 pour une maison. La plupart des déménageurs professionnels fournissent les cartons dans le devis (ou les facturent 2 à 5 € pièce). Récupérer des cartons gratuits en supermarché est possible mais vérifiez leur solidité — un carton qui cède peut endommager son contenu.',
+    },
+    {
+      q: 'Peut-on déménager ses plantes et son électroménager ?',
+      a: 'Les plantes ne sont pas couvertes par l\'assurance du déménageur et voyagent sous votre responsabilité. Transportez-les vous-même si possible. Pour l\'électroménager, le lave-linge doit être vidangé et ses tambours calés avec les vis de transport. Le réfrigérateur doit être débranché 24h à l\'avance et transporté debout. Le déménageur peut refuser ces appareils s\'ils ne sont pas préparés.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour le déménagement. Les déménagements nécessitent une visite technique préalable et une planification de 2 à 8 semaines. Prenez rendez-vous pour un devis gratuit sous 48h.',
+  certifications: ['Immatriculation DREAL (obligatoire)', 'Label NF Service Déménagement', 'Certification ISO 9001 (qualité)'],
+  averageResponseTime: 'Devis sous 48h (visite technique), planification 2 à 8 semaines',
+}
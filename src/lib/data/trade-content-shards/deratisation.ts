@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'deratisation',
+  name: 'Dératisation',
+  priceRange: { min: 80, max: 300, unit: '€' },
+  commonTasks: [
+    'Dératisation maison/appartement : 80 à 200 €', 'Dératisation local commercial : 150 à 400 €', 'Contrat annuel de prévention (4 passages) : 300 à 800 €',
+    'Traitement fouines/loirs : 150 à 350 €', 'Rebouchage des accès (grillage, mousse expansive) : 100 à 300 €',
+  ],
+  tips: [
+    'La dératisation est obligatoire dans les locaux à usage professionnel (restaurants, commerces alimentaires) — un contrat annuel est recommandé.',
+    'Un diagnostic des points d\'entrée est essentiel : sans rebouchage, les rongeurs reviennent en quelques semaines.',
+    'Ne touchez jamais les cadavres ou excréments de rongeurs à mains nues : portez des gants jetables et désinfectez les surfaces à l\'eau de Javel, car les rongeurs transmettent des maladies (leptospirose, hantavirus).',
+    'Rangez toute nourriture dans des contenants hermétiques (verre, métal) et ne laissez jamais de gamelles d\'animaux domestiques pleines la nuit : c\'est la principale source d\'attraction pour les rongeurs.',
+    'Avant de signer un contrat, demandez si le dératiseur utilise des postes d\'appâtage sécurisés (obligatoires en présence d\'enfants ou d\'animaux domestiques) et s\'il récupère les cadavres après traitement.',
+  ],
+  faq: [
+    {
+      q: 'Comment savoir si j\'ai des rats ou des souris ?',
+      a: 'Les indices sont : crottes (2 cm pour un rat, 5 mm pour une souris), traces de grignotage sur les câbles/emballages, bruits de grattement la nuit (dans les cloisons, faux-plafonds), odeur musquée caractéristique. Un professionnel peut confirmer l\'espèce et évaluer l\'ampleur de l\'infestation.',
+    },
+    {
+      q: 'Les rats sont-ils dangereux pour la santé ?',
+      a: 'Oui, les rats transmettent de nombreuses maladies par leurs urines, excréments et morsures : leptospirose (potentiellement mortelle), salmonellose, hantavirus et peste (rare en France). Ils rongent aussi les câbles électriques (risque d\'incendie) et les canalisations (risque de fuite). Une intervention rapide est indispensable dès les premiers signes.',
+    },
+    {
+      q: 'Combien de temps dure une dératisation complète ?',
+      a: 'Une dératisation prend généralement 2 à 4 semaines avec 2 à 3 passages du professionnel. Le premier passage pose les appâts et identifie les points d\'activité. Les passages suivants contrôlent la consommation des appâts et ajustent le traitement. Le rebouchage des accès est réalisé une fois l\'infestation maîtrisée. Pour un local commercial, un contrat annuel avec 4 passages préventifs est recommandé.',
+    },
+    {
+      q: 'Les pièges à rats du commerce sont-ils efficaces ?',
+      a: 'Les pièges mécaniques (tapettes) et les pièges à colle peuvent attraper quelques individus isolés, mais sont inefficaces contre une colonie établie. Les rats sont des animaux intelligents qui apprennent rapidement à éviter les pièges. De plus, l\'utilisation de raticides par un non-professionnel peut être dangereuse pour les enfants, les animaux domestiques et la faune sauvage.',
+    },
+    {
+      q: 'Le propriétaire ou le locataire doit-il payer la dératisation ?',
+      a: 'La dératisation relève de l\'obligation du propriétaire de fournir un logement décent (loi du 6 juillet 1989). Si l\'infestation préexistait à l\'entrée dans les lieux, le propriétaire paie intégralement. Si elle apparaît en cours de bail à cause d\'un défaut d\'entretien du locataire (poubelles ouvertes, nourriture stockée au sol), le locataire peut être mis à contribution. En copropriété, le syndic traite les parties communes.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour infestation sévère de rats ou souris menaçant la salubrité ou la sécurité (rongement de câbles électriques, contamination alimentaire). Un dératiseur peut intervenir sous 2 à 6 heures en zone urbaine. Majorations : +50 à 80 % en dehors des heures ouvrées.',
+  certifications: [
+    'Certibiocide nuisibles TP14/TP18 (obligatoire — valable 5 ans)', 'Certification CS3D (Chambre Syndicale 3D — Dératisation, Désinsectisation, Désinfection)',
+    'Assurance RC professionnelle (obligatoire)', 'Déclaration d\'activité biocides auprès de l\'ANSES',
+  ],
+  averageResponseTime: 'Intervention sous 24 à 48h',
+}
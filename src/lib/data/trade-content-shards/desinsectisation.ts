@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'desinsectisation',
+  name: 'Désinsectisation',
+  priceRange: { min: 80, max: 300, unit: '€' },
+  commonTasks: [
+    'Traitement punaises de lit (appartement) : 200 à 600 €', 'Traitement cafards/blattes : 80 à 250 €', 'Destruction de nid de guêpes/frelons : 80 à 200 €',
+    'Traitement anti-moustiques (jardin) : 150 à 400 €', 'Traitement termites : 1 500 à 4 000 €',
+  ],
+  tips: [
+    'Pour les punaises de lit, un minimum de 2 passages à 15 jours d\'intervalle est nécessaire pour éliminer les œufs qui éclosent après le premier traitement.',
+    'En cas de frelons asiatiques, contactez votre mairie — certaines communes prennent en charge la destruction des nids.',
+    'Ne tentez jamais de détruire un nid de guêpes ou de frelons vous-même : les piqûres multiples peuvent provoquer un choc anaphylactique mortel, même chez une personne non allergique.',
+    'Après un traitement contre les cafards, ne nettoyez pas les zones traitées pendant au moins 15 jours : le produit insecticide continue d\'agir par contact sur les insectes survivants.',
+    'Pour prévenir le retour des punaises de lit après traitement, placez des housses anti-punaises sur les matelas et sommiers et inspectez régulièrement les coutures et les recoins du lit.',
+  ],
+  emergencyInfo: 'Pour un nid de guêpes ou frelons dangereux (proximité de passage fréquenté), un désinsectiseur peut intervenir en urgence. Délai variable selon disponibilité. Coût : 100 à 250 €.',
+  faq: [
+    {
+      q: 'Les punaises de lit sont-elles un signe de saleté ?',
+      a: 'Non, les punaises de lit ne sont pas liées à l\'hygiène. Elles se transportent via les bagages, les vêtements et les meubles d\'occasion. Même les hôtels 5 étoiles peuvent être touchés. Le traitement professionnel (thermique ou chimique) est la seule solution efficace.',
+    },
+    {
+      q: 'Traitement thermique ou chimique contre les punaises de lit ?',
+      a: 'Le traitement thermique (vapeur sèche à 180°C ou canon à chaleur) tue les punaises et leurs œufs en une seule intervention, sans produit chimique. Il coûte 30 à 50 % plus cher que le traitement chimique mais est plus rapide et sans résidu. Le traitement chimique (insecticide professionnel) est efficace mais nécessite 2 à 3 passages car les œufs résistent au premier traitement.',
+    },
+    {
+      q: 'Comment reconnaître des punaises de lit ?',
+      a: 'Les punaises de lit adultes mesurent 5 à 7 mm, sont ovales, plates et de couleur brun-rougeâtre. Les signes d\'infestation sont : piqûres en ligne ou en grappe sur la peau au réveil, petites taches noires (déjections) sur le matelas et les draps, traces de sang sur les draps, et une odeur douceâtre dans les cas avancés. Elles se cachent dans les coutures des matelas, les fissures du sommier et derrière les têtes de lit.',
+    },
+    {
+      q: 'Les produits anti-cafards du commerce sont-ils efficaces ?',
+      a: 'Les gels et pièges vendus en grande surface peuvent traiter une infestation légère (quelques individus). Pour une infestation établie (plusieurs dizaines d\'individus, présence en journée), seul un traitement professionnel avec des biocides à usage restreint (non accessibles au public) garantit une éradication complète. Le coût professionnel (80 à 250 €) est vite amorti face à une infestation qui s\'aggrave.',
+    },
+    {
+      q: 'Le propriétaire ou le locataire doit-il payer la désinsectisation ?',
+      a: 'En cas de punaises de lit, la loi Elan (2018) impose au propriétaire de prendre en charge le traitement, sauf si le locataire est à l\'origine de l\'infestation (ce qui est difficile à prouver). Pour les cafards, le propriétaire doit livrer un logement décent exempt de nuisibles. L\'entretien courant (prévention) reste à la charge du locataire. En copropriété, le syndic peut faire traiter les parties communes.',
+    },
+  ],
+  certifications: [
+    'Certibiocide nuisibles TP14/TP18 (obligatoire — valable 5 ans)', 'Certification CS3D (Chambre Syndicale 3D — Dératisation, Désinsectisation, Désinfection)',
+    'Assurance RC professionnelle (obligatoire)', 'Déclaration d\'activité biocides auprès de l\'ANSES',
+  ],
+  averageResponseTime: 'Intervention sous 24 à 48h',
+}
@@ -0,0 +1,50 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'diagnostiqueur',
+  name: 'Diagnostiqueur',
+  priceRange: { min: 100, max: 600, unit: '€' },
+  commonTasks: [
+    'DPE (Diagnostic de Performance Énergétique) : 100 à 250 €', 'Pack diagnostics vente (DPE + amiante + plomb + électricité + gaz + termites) : 300 à 600 €',
+    'Diagnostic amiante : 80 à 150 €', 'Diagnostic plomb (CREP) : 100 à 200 €', 'Diagnostic électricité ou gaz : 100 à 150 €',
+  ],
+  tips: [
+    'Le DPE est obligatoire pour toute vente ou location depuis 2006. Depuis 2021, il est opposable juridiquement : un mauvais DPE peut entraîner une action en justice.',
+    'Regroupez tous les diagnostics chez un même professionnel pour obtenir un tarif pack (30 à 40 % de réduction).',
+    'Vérifiez que votre diagnostiqueur est certifié par un organisme accrédité COFRAC et qu\'il dispose d\'une assurance responsabilité civile professionnelle à jour — c\'est une obligation légale.',
+    'Anticipez les diagnostics avant la mise en vente : un DPE défavorable (F ou G) doit être affiché sur l\'annonce immobilière et peut réduire le prix de vente de 5 à 15 %.',
+    'Pour une location, le DPE et l\'ERP sont obligatoires lors de chaque nouveau bail. Le diagnostic plomb (CREP) est aussi requis pour les logements construits avant 1949.',
+  ],
+  faq: [
+    {
+      q: 'Quels diagnostics sont obligatoires pour vendre ?',
+      a: 'DPE, diagnostic amiante (si permis avant 1997), plomb (si avant 1949), électricité et gaz (si installations de plus de 15 ans), termites (dans les zones à risque), ERP (état des risques et pollutions), et mesurage loi Carrez. Le DPE a une durée de validité de 10 ans, les autres varient de 6 mois (termites) à illimité (amiante si négatif).',
+    },
+    {
+      q: 'Combien de temps les diagnostics immobiliers sont-ils valables ?',
+      a: 'La validité varie selon le diagnostic : DPE : 10 ans. Amiante : illimité si négatif (à refaire si positif après travaux). Plomb (CREP) : illimité si négatif, 1 an si positif (pour la vente), 6 ans pour la location. Électricité et gaz : 3 ans pour la vente, 6 ans pour la location. Termites : 6 mois. ERP : 6 mois. Loi Carrez : illimité sauf travaux.',
+    },
+    {
+      q: 'Le DPE est-il fiable ?',
+      a: 'Depuis la réforme de 2021, le DPE est calculé selon une méthode unifiée (3CL-2021) qui prend en compte l\'enveloppe du bâtiment, le système de chauffage et la ventilation. Il est désormais opposable juridiquement. Toutefois, des écarts de résultats entre diagnostiqueurs persistent. N\'hésitez pas à demander un second avis si le résultat vous semble incohérent.',
+    },
+    {
+      q: 'Peut-on contester un diagnostic immobilier ?',
+      a: 'Oui, si vous estimez qu\'un diagnostic est erroné, vous pouvez faire appel à un autre diagnostiqueur pour un contre-diagnostic. En cas de préjudice avéré (DPE surévalué ayant conduit à un achat plus cher), une action en justice contre le diagnostiqueur est possible via son assurance RC professionnelle. Le vendeur peut aussi être mis en cause pour vice caché.',
+    },
+    {
+      q: 'Faut-il être présent lors des diagnostics ?',
+      a: 'Ce n\'est pas obligatoire mais fortement recommandé, surtout pour le DPE. Votre présence permet de fournir des informations utiles au diagnostiqueur (factures d\'énergie, travaux récents d\'isolation, type de chauffage) qui amélioreront la précision du diagnostic. Le diagnostiqueur doit avoir accès à toutes les pièces, y compris les combles, la cave et le garage.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour les diagnostics immobiliers. Les diagnostics (DPE, amiante, plomb, électricité, gaz) sont des prestations planifiées. Intervention possible sous 48h à 1 semaine selon la disponibilité.',
+  certifications: [
+    'Certification par organisme accrédité COFRAC (obligatoire — Bureau Veritas, Dekra, Qualixpert, I.Cert, etc.)',
+    'Certifications par domaine : DPE, amiante, plomb, électricité, gaz, termites (chacune est spécifique)', 'Assurance RC professionnelle (obligatoire)',
+    'Formation continue obligatoire (recyclage tous les 7 ans)',
+  ],
+  averageResponseTime: 'Intervention sous 48h à 1 semaine',
+}
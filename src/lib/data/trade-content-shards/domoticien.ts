@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'domoticien',
+  name: 'Domoticien',
+  priceRange: { min: 500, max: 5000, unit: '€' },
+  commonTasks: [
+    'Installation domotique complète maison : 5 000 à 20 000 €', 'Éclairage connecté (10 points) : 1 000 à 3 000 €', 'Thermostat connecté : 300 à 800 € (fourniture + pose)',
+    'Serrure connectée : 300 à 1 000 €', 'Système multiroom audio : 2 000 à 8 000 €',
+  ],
+  tips: [
+    'Privilégiez les protocoles ouverts (KNX, Zigbee, Z-Wave) plutôt que les systèmes propriétaires fermés pour garantir l\'évolutivité.',
+    'Prévoyez un réseau Ethernet en étoile (câble Cat 6) même si vous utilisez du Wi-Fi — c\'est la base d\'une installation fiable.',
+    'En rénovation, les protocoles sans fil (Zigbee, Z-Wave, Wi-Fi) évitent de tirer des câbles dans les murs. En construction neuve, privilégiez le KNX filaire pour une fiabilité maximale.',
+    'Pensez à prévoir un onduleur (UPS) pour votre box domotique et votre routeur : une coupure de courant ne doit pas désactiver votre système de sécurité ni votre chauffage.',
+    'Choisissez un domoticien qui propose un contrat de maintenance : les mises à jour logicielles, le remplacement de piles des capteurs et le support technique sont essentiels pour la pérennité du système.',
+  ],
+  faq: [
+    {
+      q: 'Quel budget pour domotiser une maison ?',
+      a: 'Le budget varie de 3 000 € (kit DIY : éclairage + thermostat + volets) à 30 000 €+ (installation professionnelle KNX complète). Un bon compromis est un système Zigbee/Z-Wave avec box domotique (5 000 à 10 000 €) qui couvre éclairage, chauffage, volets et sécurité.',
+    },
+    {
+      q: 'KNX, Zigbee ou Z-Wave : quel protocole choisir ?',
+      a: 'Le KNX est le standard professionnel filaire le plus fiable et pérenne (30 ans+), mais il coûte 2 à 3 fois plus cher et nécessite un câblage spécifique (bus EIB). Le Zigbee est le protocole sans fil le plus répandu (compatible Philips Hue, Ikea, Aqara) avec un excellent rapport qualité-prix. Le Z-Wave offre une portée supérieure et moins d\'interférences mais un choix de produits plus restreint. En rénovation, Zigbee ou Z-Wave sont les plus adaptés.',
+    },
+    {
+      q: 'La domotique permet-elle de réaliser des économies d\'énergie ?',
+      a: 'Oui, une installation domotique bien configurée réduit la facture énergétique de 15 à 30 %. Le thermostat connecté seul fait économiser 10 à 15 % sur le chauffage. L\'automatisation des volets (fermeture la nuit en hiver, occultation en été) ajoute 5 à 10 %. La gestion intelligente de l\'éclairage (détecteurs de présence, scénarios) réduit la consommation de 20 à 40 %.',
+    },
+    {
+      q: 'Peut-on domotiser une maison ancienne sans gros travaux ?',
+      a: 'Oui, grâce aux protocoles sans fil (Zigbee, Z-Wave, Wi-Fi). On remplace les interrupteurs par des modules connectés, on ajoute des capteurs (température, ouverture, mouvement) et on installe une box domotique centrale. L\'installation est non invasive et réversible. Comptez 3 000 à 8 000 € pour une maison de 4 pièces avec éclairage, chauffage, volets et sécurité.',
+    },
+    {
+      q: 'La domotique est-elle compatible avec les assistants vocaux ?',
+      a: 'La plupart des systèmes domotiques sont compatibles avec Google Home, Amazon Alexa et Apple HomeKit. Le contrôle vocal permet de piloter l\'éclairage, le chauffage, les volets et les scénarios par la voix. Pour une compatibilité maximale, le nouveau standard Matter (soutenu par Google, Apple, Amazon et Samsung) unifie les protocoles et garantit l\'interopérabilité entre marques.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour panne de serrure connectée vous empêchant d\'accéder à votre domicile, ou défaillance du système d\'alarme domotique. Un domoticien peut intervenir pour un diagnostic et une remise en service selon disponibilité. Majorations : +80 à 120 % la nuit et le week-end.',
+  certifications: [
+    'Certification KNX Partner (standard international de la domotique filaire)', 'Certification Crestron/Control4 (systèmes haut de gamme)',
+    'Habilitation électrique (obligatoire)', 'Qualifelec (mention courants faibles et domotique)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, installation 1 à 4 semaines',
+}
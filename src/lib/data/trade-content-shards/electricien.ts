@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'electricien',
+  name: 'Électricien',
+  priceRange: { min: 50, max: 80, unit: '€/h' },
+  commonTasks: [
+    'Mise aux normes d\'un tableau électrique : 800 à 2 500 €', 'Installation d\'un point lumineux : 80 à 200 €', 'Pose d\'une prise électrique supplémentaire : 60 à 150 €',
+    'Remplacement d\'un interrupteur différentiel : 150 à 350 €', 'Installation d\'un interphone ou visiophone : 300 à 1 200 €',
+    'Réfection complète de l\'électricité d\'un appartement (60 m²) : 5 000 à 10 000 €',
+  ],
+  tips: [
+    'Assurez-vous que l\'électricien respecte la norme NF C 15-100, obligatoire pour toute installation électrique en France. Demandez un certificat de conformité Consuel à la fin des travaux.',
+    'Comparez au moins trois devis en vérifiant que chacun détaille les fournitures, la main-d\'oeuvre et le coût des mises en conformité éventuelles.',
+    'Choisissez un électricien certifié IRVE si vous souhaitez installer une borne de recharge pour véhicule électrique : c\'est obligatoire pour bénéficier des aides. Note : le crédit d\'impôt pour borne de recharge a été supprimé au 1er janvier 2026.',
+    'Avant toute intervention, vérifiez que l\'électricien possède une habilitation électrique valide (B1, B2 ou BR selon le type de travaux).',
+    'Pour des travaux de rénovation énergétique (chauffage électrique performant, VMC), un électricien RGE est indispensable pour obtenir les aides financières de l\'État.',
+  ],
+  faq: [
+    {
+      q: 'Ma maison est ancienne, faut-il refaire toute l\'électricité ?',
+      a: 'Pas nécessairement, mais un diagnostic électrique est fortement recommandé pour les installations de plus de 15 ans. Un électricien qualifié évaluera la conformité à la norme NF C 15-100 et proposera les mises à niveau nécessaires. Une rénovation partielle (tableau, prises de terre, différentiels) coûte entre 1 500 et 4 000 € selon la surface.',
+    },
+    {
+      q: 'Combien coûte l\'installation d\'une borne de recharge pour voiture électrique ?',
+      a: 'L\'installation d\'une borne de recharge domestique (wallbox 7 kW) coûte entre 1 200 et 2 500 € pose comprise. Note : le crédit d\'impôt pour borne de recharge a été supprimé au 1er janvier 2026. Faites appel à un électricien certifié IRVE. Le délai d\'installation est généralement de 1 à 3 jours.',
+    },
+    {
+      q: 'Qu\'est-ce que le certificat Consuel et est-il obligatoire ?',
+      a: 'Le Consuel (Comité National pour la Sécurité des Usagers de l\'Électricité) délivre une attestation de conformité électrique. Il est obligatoire pour toute nouvelle installation ou rénovation complète avant la mise sous tension par Enedis. Le coût est d\'environ 120 à 180 € selon le type d\'installation.',
+    },
+    {
+      q: 'Comment savoir si mon installation électrique est aux normes ?',
+      a: 'Faites réaliser un diagnostic électrique par un électricien certifié ou un diagnostiqueur agréé. Ce contrôle vérifie la conformité à la norme NF C 15-100 : présence d\'un disjoncteur différentiel 30 mA, mise à la terre, protection des circuits et état des prises. Ce diagnostic est obligatoire pour la vente d\'un logement de plus de 15 ans et coûte entre 100 et 200 €.',
+    },
+    {
+      q: 'Quand faut-il refaire le tableau électrique ?',
+      a: 'Le remplacement du tableau est nécessaire si votre installation a plus de 25 ans, si le tableau comporte encore des fusibles à broche, s\'il n\'y a pas de disjoncteur différentiel 30 mA ou si vous ajoutez des équipements énergivores (borne de recharge, pompe à chaleur). Le coût d\'un tableau neuf aux normes est de 800 à 2 500 € selon le nombre de circuits.',
+    },
+    {
+      q: 'Les travaux électriques nécessitent-ils une mise aux normes complète ?',
+      a: 'Non, la mise aux normes complète n\'est obligatoire que pour une construction neuve ou une rénovation totale. Pour des travaux partiels, seuls les circuits concernés doivent respecter la norme NF C 15-100 en vigueur. Toutefois, l\'électricien doit s\'assurer que les travaux ne créent pas de danger sur le reste de l\'installation.',
+    },
+    {
+      q: 'Combien de prises électriques faut-il par pièce ?',
+      a: 'La norme NF C 15-100 impose un minimum de 5 prises dans un séjour de moins de 28 m² (7 au-delà), 3 prises dans une chambre, 6 prises dans une cuisine (dont 4 au-dessus du plan de travail) et 1 prise dans les toilettes. Chaque prise doit être alimentée par un circuit protégé par un disjoncteur adapté (16 A ou 20 A).',
+    },
+    {
+      q: 'Peut-on faire soi-même des travaux électriques dans son logement ?',
+      a: 'Légalement, un particulier peut réaliser des travaux électriques dans son propre logement, mais il engage sa responsabilité en cas d\'accident ou d\'incendie. L\'attestation Consuel sera exigée pour le raccordement au réseau. Pour des raisons de sécurité et d\'assurance, il est vivement recommandé de confier les travaux à un électricien qualifié, surtout pour le tableau et les circuits principaux.',
+    },
+  ],
+  emergencyInfo: 'En cas de panne électrique, de fils dénudés ou d\'odeur de brûlé, coupez immédiatement le disjoncteur général et appelez un électricien d\'urgence. Ne tentez jamais de réparer vous-même un problème électrique. Un électricien d\'astreinte peut intervenir selon sa disponibilité, avec une majoration de 50 à 100 % en dehors des heures ouvrées.',
+  certifications: [
+    'Qualifelec (qualification E1 à E3 selon le niveau de compétence)', 'RGE (Reconnu Garant de l\'Environnement)', 'Qualification IRVE (obligatoire pour les bornes de recharge)',
+    'Habilitation électrique (B1, B2, BR, HC — obligatoire)', 'Qualibat (qualification 5411/5412 installations électriques)', 'Consuel (attestation de conformité électrique)',
+  ],
+  averageResponseTime: 'Urgence (panne, court-circuit) : délai variable selon disponibilité ; travaux planifiés sous 1 à 2 semaines',
+}
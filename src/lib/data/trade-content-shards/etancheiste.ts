@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'etancheiste',
+  name: 'Étanchéiste',
+  priceRange: { min: 40, max: 100, unit: '€/m²' },
+  commonTasks: [
+    'Étanchéité toiture-terrasse (membrane bitume) : 40 à 80 €/m²', 'Étanchéité PVC/EPDM : 50 à 100 €/m²', 'Étanchéité de balcon/loggia : 60 à 120 €/m²',
+    'Cuvelage de sous-sol : 150 à 300 €/m²', 'Traitement d\'infiltrations : 50 à 200 €/m²',
+  ],
+  tips: [
+    'L\'étanchéité d\'un toit-terrasse doit être contrôlée tous les 5 ans. Un défaut mineur non traité peut entraîner des dommages structurels majeurs.',
+    'Pour les terrasses accessibles, privilégiez une membrane EPDM (durée de vie 40 ans+) plutôt qu\'un bitume classique.',
+    'Demandez un test d\'étanchéité (mise en eau) après les travaux : l\'étanchéiste remplit la terrasse de quelques centimètres d\'eau pendant 48 à 72h pour vérifier l\'absence de fuite.',
+    'Coupler l\'étanchéité avec une isolation thermique (toiture chaude) est plus rentable que de faire les deux séparément et ouvre droit aux aides MaPrimeRénov\'.',
+    'Vérifiez que l\'étanchéiste possède une garantie décennale spécifique à l\'étanchéité (et pas seulement une garantie généraliste bâtiment) pour être correctement couvert en cas de sinistre.',
+  ],
+  faq: [
+    {
+      q: 'Quelle garantie pour des travaux d\'étanchéité ?',
+      a: 'Les travaux d\'étanchéité sont couverts par la garantie décennale (10 ans). De plus, la plupart des fabricants de membranes offrent une garantie produit de 15 à 25 ans. Exigez les attestations d\'assurance et de garantie fabricant.',
+    },
+    {
+      q: 'Quelle est la durée de vie d\'une étanchéité de toit-terrasse ?',
+      a: 'Une membrane bitume SBS dure 20 à 30 ans, une membrane EPDM (caoutchouc synthétique) atteint 40 à 50 ans, et une résine d\'étanchéité liquide (SEL) offre 20 à 25 ans de protection. La durée de vie dépend aussi de l\'entretien : un nettoyage annuel et une inspection bisannuelle prolongent significativement la longévité du complexe.',
+    },
+    {
+      q: 'Comment savoir si mon toit-terrasse a un problème d\'étanchéité ?',
+      a: 'Les signes révélateurs sont : traces d\'humidité ou auréoles au plafond de l\'étage inférieur, flaques stagnantes sur la terrasse après 48h sans pluie (défaut de pente), cloquage ou décollement de la membrane, végétation qui pousse dans les joints. Un diagnostic par un étanchéiste professionnel coûte 200 à 500 € et permet de cibler les réparations.',
+    },
+    {
+      q: 'Qu\'est-ce qu\'un cuvelage de sous-sol ?',
+      a: 'Le cuvelage est un traitement d\'étanchéité intérieur ou extérieur des murs enterrés pour stopper les infiltrations d\'eau dans un sous-sol. Il combine un enduit d\'imperméabilisation, un drainage périphérique et parfois une pompe de relevage. Le coût varie de 150 à 300 €/m² de surface traitée. C\'est la solution définitive pour un sous-sol humide.',
+    },
+    {
+      q: 'Peut-on végétaliser un toit-terrasse étanchéifié ?',
+      a: 'Oui, à condition que la structure porte le surpoids (80 à 150 kg/m² selon le type de végétalisation) et que l\'étanchéité soit anti-racines (membrane bitume avec voile de verre ou EPDM). La végétalisation extensive (sedum) est la plus légère et la moins exigeante en entretien. Elle prolonge la durée de vie de l\'étanchéité en la protégeant des UV.',
+    },
+  ],
+  emergencyInfo: 'En cas d\'infiltration d\'eau majeure par la toiture-terrasse ou le sous-sol, un étanchéiste peut réaliser une réparation provisoire d\'urgence pour stopper les dégâts. Disponibilité et délais variables. Majorations : +60 à 100 % en dehors des heures ouvrées.',
+  certifications: ['Qualibat (qualification 1311/1312 étanchéité)', 'Certification ASQUAL (géomembranes et étanchéité)', 'RGE (obligatoire si isolation thermique associée — toiture chaude)'],
+  averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 3 semaines',
+}
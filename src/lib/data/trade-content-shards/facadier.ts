@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'facadier',
+  name: 'Façadier',
+  priceRange: { min: 30, max: 100, unit: '€/m²' },
+  commonTasks: [
+    'Ravalement de façade (enduit) : 30 à 70 €/m²', 'Isolation thermique par l\'extérieur (ITE) : 100 à 200 €/m²', 'Peinture de façade : 20 à 45 €/m²',
+    'Nettoyage haute pression : 10 à 25 €/m²', 'Traitement anti-mousse et hydrofuge : 15 à 30 €/m²',
+  ],
+  tips: [
+    'Un ravalement de façade est obligatoire tous les 10 ans dans certaines communes. Renseignez-vous auprès de votre mairie.',
+    'Profitez d\'un ravalement pour ajouter une isolation par l\'extérieur (ITE) et bénéficier des aides MaPrimeRénov\'.',
+    'Vérifiez les arrêtés municipaux sur les couleurs autorisées pour votre façade : les ABF (Architectes des Bâtiments de France) imposent des teintes spécifiques dans les zones protégées.',
+    'Avant un ravalement, faites diagnostiquer les fissures : une fissure structurelle nécessite un traitement des fondations avant toute remise en état de la façade.',
+    'Privilégiez les mois de printemps et d\'automne pour le ravalement : les enduits ne doivent pas être appliqués en dessous de 5 °C ni au-dessus de 35 °C.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte un ravalement de façade pour une maison ?',
+      a: 'Pour une maison de 100 m² de façade, comptez entre 5 000 et 15 000 € selon l\'état du support, le type d\'enduit et la nécessité d\'un échafaudage. Avec ITE, le budget monte à 15 000 à 25 000 € mais les aides peuvent couvrir jusqu\'à 40 %.',
+    },
+    {
+      q: 'Le ravalement de façade est-il obligatoire ?',
+      a: 'Dans les communes ayant pris un arrêté en ce sens, le ravalement est obligatoire tous les 10 ans (article L132-1 du Code de la construction). La mairie peut vous mettre en demeure de réaliser les travaux sous 6 mois. En copropriété, le ravalement est voté en assemblée générale à la majorité absolue.',
+    },
+    {
+      q: 'Quelles aides financières pour un ravalement de façade ?',
+      a: 'Un ravalement simple n\'ouvre pas droit aux aides. En revanche, si vous ajoutez une isolation thermique par l\'extérieur (ITE), vous pouvez bénéficier de MaPrimeRénov\' (jusqu\'à 75 €/m²), des CEE (prime énergie), de l\'éco-PTZ et de la TVA à 5,5 %. Certaines communes accordent aussi des subventions pour l\'embellissement des façades.',
+    },
+    {
+      q: 'Combien de temps durent les travaux de ravalement ?',
+      a: 'Pour une maison individuelle, le ravalement dure 2 à 4 semaines selon la surface et le type de traitement (nettoyage simple, enduit, ITE). L\'installation de l\'échafaudage prend 1 à 2 jours. Prévoyez que l\'échafaudage restera en place pendant toute la durée du chantier, ce qui peut gêner l\'accès au jardin ou au parking.',
+    },
+    {
+      q: 'Quelle différence entre enduit monocouche et enduit traditionnel ?',
+      a: 'L\'enduit monocouche (ou enduit projeté) s\'applique en une seule passe à la machine et coûte 25 à 50 €/m². L\'enduit traditionnel se pose en 3 couches à la main (gobetis, corps d\'enduit, finition) et revient à 40 à 70 €/m². Le traditionnel offre une meilleure durabilité et un rendu plus authentique, mais il est plus long à mettre en œuvre.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour le ravalement de façade. Les travaux de façade nécessitent un échafaudage et une déclaration préalable en mairie. Prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'Qualibat (qualification 6111/6112 ravalement, 7131/7132 ITE)', 'RGE (obligatoire pour l\'ITE — isolation thermique par l\'extérieur)',
+    'Certification applicateur Sto, Weber ou Parex-Lanko (partenaires fabricants)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines',
+}
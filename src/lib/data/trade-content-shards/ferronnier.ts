@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'ferronnier',
+  name: 'Ferronnier',
+  priceRange: { min: 200, max: 600, unit: '€/ml' },
+  commonTasks: [
+    'Portail en fer forgé sur mesure : 2 000 à 8 000 €', 'Grille de fenêtre : 150 à 500 €/unité', 'Rampe d\'escalier en fer forgé : 200 à 600 €/ml',
+    'Table ou mobilier en fer forgé : 500 à 3 000 €', 'Restauration d\'ouvrages anciens : sur devis',
+  ],
+  tips: [
+    'La ferronnerie d\'art est un métier rare — les délais de fabrication sont souvent longs (4 à 8 semaines). Anticipez vos projets.',
+    'Pour les ouvrages extérieurs, exigez un traitement anticorrosion par galvanisation à chaud avant mise en peinture.',
+    'Demandez à voir le book de réalisations du ferronnier : chaque artisan a un style propre (contemporain, classique, art déco). Assurez-vous que son esthétique correspond à votre projet.',
+    'Le fer forgé nécessite un entretien régulier : appliquez une peinture antirouille tous les 5 à 7 ans pour les ouvrages extérieurs afin de préserver l\'aspect et la solidité.',
+    'Pour un portail en fer forgé motorisé, prévoyez les gaines électriques dans les piliers avant la pose du portail — les ajouter après est beaucoup plus coûteux.',
+  ],
+  faq: [
+    {
+      q: 'Quelle est la différence entre un ferronnier et un métallier ?',
+      a: 'Le ferronnier travaille principalement le fer forgé à chaud (forge traditionnelle) pour des ouvrages décoratifs et artistiques. Le métallier travaille l\'acier, l\'inox et l\'aluminium à froid (soudure, pliage) pour des ouvrages structurels. En pratique, beaucoup d\'artisans maîtrisent les deux techniques.',
+    },
+    {
+      q: 'Combien coûte un portail en fer forgé ?',
+      a: 'Un portail en fer forgé sur mesure coûte entre 2 000 et 8 000 € selon les dimensions, la complexité du motif et le type de finition. Un portail battant standard (3 m de largeur) revient à 2 500 à 4 500 €, tandis qu\'un modèle très ouvragé avec volutes et pointes peut atteindre 6 000 à 8 000 €. Ajoutez 1 000 à 2 500 € pour la motorisation.',
+    },
+    {
+      q: 'Le fer forgé est-il adapté en bord de mer ?',
+      a: 'Le fer forgé supporte mal les environnements salins sans traitement adapté. Pour le bord de mer, exigez une galvanisation à chaud (immersion dans un bain de zinc à 450 °C) suivie d\'une peinture époxy marine. Ce traitement double le coût de la finition mais garantit 20 à 30 ans de tenue. Alternativement, optez pour de l\'inox 316L ou de l\'aluminium.',
+    },
+    {
+      q: 'Peut-on restaurer une rampe ou un portail ancien en fer forgé ?',
+      a: 'Oui, un ferronnier spécialisé en restauration peut décaper, redresser et ressouder des ouvrages anciens. La restauration coûte généralement 30 à 60 % du prix d\'un ouvrage neuf équivalent, tout en préservant le cachet d\'origine. Le ferronnier peut aussi reproduire à l\'identique les éléments manquants (volutes, rosaces). Comptez 4 à 8 semaines de travail en atelier.',
+    },
+    {
+      q: 'Le fer forgé est-il plus solide que l\'acier soudé ?',
+      a: 'Le fer forgé traditionnel (travaillé à la forge à 900-1200 °C) offre une structure fibreuse très résistante à la fatigue et aux chocs. L\'acier soudé industriel est plus rigide mais les soudures constituent des points de faiblesse potentiels. Pour un garde-corps ou un portail, les deux techniques offrent une solidité largement suffisante. Le fer forgé se distingue surtout par son esthétique unique.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la ferronnerie d\'art. Les ouvrages en fer forgé sont fabriqués sur mesure en atelier et nécessitent un délai de fabrication de 4 à 8 semaines. Prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'Label Entreprise du Patrimoine Vivant (EPV — délivré par l\'État)', 'Titre de Maître Artisan en métier d\'art (Chambre de Métiers)',
+    'Compagnons du Devoir (formation d\'excellence)', 'Qualibat (qualification 4411 métallerie-serrurerie)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, fabrication 4 à 8 semaines',
+}
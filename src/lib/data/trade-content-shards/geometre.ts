@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'geometre',
+  name: 'Géomètre',
+  priceRange: { min: 500, max: 3000, unit: '€' },
+  commonTasks: [
+    'Bornage de terrain : 800 à 2 000 €', 'Division parcellaire : 1 000 à 3 000 €', 'Plan topographique : 500 à 1 500 €', 'Plan de masse (permis de construire) : 300 à 800 €',
+    'Implantation de construction : 500 à 1 500 €',
+  ],
+  tips: [
+    'Seul un géomètre-expert inscrit à l\'Ordre peut réaliser un bornage officiel — les documents produits par un géomètre non inscrit n\'ont pas de valeur juridique.',
+    'Le bornage est obligatoire pour toute vente de terrain à bâtir (loi SRU). Il est aussi recommandé en cas de litige de voisinage.',
+    'Demandez un devis détaillé qui distingue les honoraires du géomètre-expert et les frais annexes (déplacement, bornes, publication au cadastre) : les tarifs ne sont pas réglementés et varient du simple au triple.',
+    'Pour un projet de construction, faites intervenir le géomètre-expert en amont : le plan topographique et l\'implantation de la construction sont indispensables avant le dépôt du permis de construire.',
+    'Conservez précieusement le procès-verbal de bornage : c\'est un document juridique définitif qui ne peut être contesté que par voie judiciaire et qui engage votre voisin autant que vous.',
+  ],
+  faq: [
+    {
+      q: 'Quelle est la différence entre bornage et cadastre ?',
+      a: 'Le bornage fixe les limites réelles de propriété sur le terrain (bornes physiques + procès-verbal). Le cadastre est un document fiscal qui donne les limites indicatives. En cas de contradiction, le bornage prévaut. Le cadastre n\'a pas de valeur juridique pour déterminer les limites de propriété.',
+    },
+    {
+      q: 'Mon voisin peut-il refuser un bornage ?',
+      a: 'Non, le bornage est un droit imprescriptible prévu par l\'article 646 du Code civil. Si votre voisin refuse de participer au bornage amiable, vous pouvez saisir le tribunal judiciaire pour demander un bornage judiciaire. Le juge désignera un géomètre-expert et les frais seront partagés entre les deux parties. La procédure dure 6 à 18 mois.',
+    },
+    {
+      q: 'Combien coûte un bornage de terrain ?',
+      a: 'Le bornage amiable coûte entre 800 et 2 000 € selon la taille du terrain, le nombre de bornes à poser et la complexité (terrain en pente, accès difficile, nombreux voisins). Le bornage judiciaire est plus cher (2 000 à 5 000 €) en raison des frais de procédure. Les honoraires sont libres mais doivent être annoncés par devis préalable.',
+    },
+    {
+      q: 'Qu\'est-ce qu\'une division parcellaire ?',
+      a: 'La division parcellaire consiste à diviser un terrain en deux ou plusieurs lots constructibles. Le géomètre-expert réalise le plan de division, dépose le dossier en mairie et procède au bornage des nouveaux lots. Cette opération est obligatoire pour vendre une partie de son terrain. Le coût est de 1 000 à 3 000 € et le délai de 1 à 3 mois.',
+    },
+    {
+      q: 'Le géomètre-expert est-il nécessaire pour un permis de construire ?',
+      a: 'Ce n\'est pas une obligation légale, mais le plan topographique et le plan de masse (pièces PCMI 2 et PCMI 3) réalisés par un géomètre-expert sont beaucoup plus précis que ceux faits par un non-professionnel. Pour les projets complexes (terrain en pente, limite de propriété proche), le recours au géomètre est vivement recommandé pour éviter un refus de permis.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour les prestations de géomètre-expert. Le bornage, la division parcellaire et les plans topographiques sont des missions planifiées. Prenez rendez-vous pour un devis sous 1 semaine.',
+  certifications: ['Inscription à l\'Ordre des Géomètres-Experts (obligatoire)', 'Diplôme DPLG ou ESGT', 'Assurance RC professionnelle obligatoire'],
+  averageResponseTime: 'Devis sous 1 semaine, intervention 2 à 4 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'isolation-thermique',
+  name: 'Isolation thermique',
+  priceRange: { min: 20, max: 100, unit: '€/m²' },
+  commonTasks: [
+    'Isolation des combles perdus (soufflage) : 20 à 35 €/m²', 'Isolation des combles aménagés : 40 à 80 €/m²', 'Isolation des murs par l\'intérieur (ITI) : 30 à 70 €/m²',
+    'Isolation des murs par l\'extérieur (ITE) : 100 à 200 €/m²', 'Isolation du plancher bas : 25 à 50 €/m²',
+  ],
+  tips: [
+    'Les combles sont responsables de 25 à 30 % des déperditions thermiques : c\'est le poste à traiter en priorité.',
+    'Exigez des matériaux certifiés ACERMI et un artisan RGE pour bénéficier des aides (MaPrimeRénov\', CEE, éco-PTZ).',
+    'Comparez les devis sur la résistance thermique (R) proposée et pas uniquement sur le prix au m² : un isolant moins cher mais moins performant vous coûtera plus cher en énergie à long terme.',
+    'Attention aux ponts thermiques (jonctions murs/planchers, contours de fenêtres) : une isolation mal posée peut perdre jusqu\'à 20 % de son efficacité si ces points ne sont pas traités.',
+    'Pour l\'isolation par l\'extérieur (ITE), vérifiez que l\'entreprise maîtrise la pose d\'enduit sur isolant et demandez des photos de chantiers réalisés depuis au moins 5 ans.',
+  ],
+  faq: [
+    {
+      q: 'Quelle épaisseur d\'isolant faut-il ?',
+      a: 'Pour les combles perdus : 30 à 40 cm de laine de verre/roche (R ≥ 7 m².K/W). Pour les murs par l\'intérieur : 12 à 16 cm (R ≥ 3,7). Pour les murs par l\'extérieur : 14 à 18 cm (R ≥ 3,7). Ces valeurs correspondent à la RT 2012 / RE 2020 et permettent d\'obtenir les aides.',
+    },
+    {
+      q: 'Isolation par l\'intérieur ou par l\'extérieur : que choisir ?',
+      a: 'L\'ITI (intérieur) est moins chère (30 à 70 €/m²) et ne modifie pas la façade, mais réduit la surface habitable de 3 à 5 %. L\'ITE (extérieur) coûte plus cher (100 à 200 €/m²) mais supprime les ponts thermiques, préserve l\'espace intérieur et offre un ravalement de façade inclus. L\'ITE est idéale lors d\'un ravalement obligatoire.',
+    },
+    {
+      q: 'L\'isolation des combles est-elle vraiment prioritaire ?',
+      a: 'Oui, car la chaleur monte : les combles non isolés représentent 25 à 30 % des pertes de chaleur d\'une maison. C\'est aussi l\'isolation la moins chère (20 à 35 €/m² en soufflage pour combles perdus) avec le meilleur retour sur investissement (amortie en 3 à 5 ans grâce aux économies de chauffage).',
+    },
+    {
+      q: 'Quels matériaux isolants choisir ?',
+      a: 'La laine de verre et la laine de roche offrent le meilleur rapport performance/prix. La ouate de cellulose et la fibre de bois sont des alternatives écologiques avec un bon déphasage thermique (confort d\'été). Le polyuréthane est le plus performant à épaisseur égale mais coûte plus cher. Tous doivent être certifiés ACERMI.',
+    },
+    {
+      q: 'L\'isolation phonique et thermique sont-elles la même chose ?',
+      a: 'Non, ce sont deux performances distinctes. Un bon isolant thermique n\'est pas forcément un bon isolant phonique. La laine de roche et la ouate de cellulose offrent de bonnes performances dans les deux domaines. Pour une isolation phonique spécifique, il faut traiter les parois avec des systèmes masse-ressort-masse (double cloison avec isolant intercalé).',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'isolation thermique. Les travaux d\'isolation sont des projets planifiés nécessitant une étude préalable. Prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'RGE (Reconnu Garant de l\'Environnement — obligatoire pour les aides)', 'Qualibat (qualification 7131/7132 isolation thermique intérieure et extérieure)',
+    'Certification ACERMI (garantie de performance des matériaux isolants)', 'NF Habitat / NF Habitat HQE (label qualité rénovation)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, intervention 1 à 3 semaines',
+}
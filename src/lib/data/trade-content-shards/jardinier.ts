@@ -0,0 +1,63 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'jardinier',
+  name: 'Jardinier',
+  priceRange: { min: 30, max: 50, unit: '€/h' },
+  commonTasks: [
+    'Tonte de pelouse (jardin de 200 m²) : 30 à 60 €', 'Taille de haie : 15 à 25 €/ml', 'Élagage d\'arbre (hauteur moyenne) : 200 à 600 € par arbre',
+    'Création de jardin (plantations + engazonnement) : 20 à 50 €/m²', 'Entretien mensuel d\'un jardin (200 m²) : 100 à 200 €/mois',
+    'Abattage d\'arbre avec dessouchage : 400 à 1 500 € selon la taille',
+  ],
+  tips: [
+    'Les prestations de jardinage à domicile ouvrent droit à un crédit d\'impôt de 50 % dans la limite de 5 000 € de dépenses par an (soit 2 500 € de crédit d\'impôt). Le jardinier doit être déclaré en tant que service à la personne (SAP).',
+    'Privilégiez un contrat annuel d\'entretien plutôt que des interventions ponctuelles : le tarif horaire est généralement 20 à 30 % inférieur et le jardinier connaît mieux votre terrain au fil des saisons.',
+    'Pour l\'élagage d\'arbres de plus de 7 mètres, faites appel à un élagueur-grimpeur certifié CS (Certificat de Spécialisation) taille et soins des arbres. L\'élagage non professionnel peut tuer l\'arbre et engager votre responsabilité.',
+    'Vérifiez que le jardinier évacue les déchets verts ou prévoyez ce poste dans le devis. L\'évacuation et le traitement en déchetterie représentent un coût supplémentaire de 50 à 150 € par intervention.',
+    'Pour la création d\'un jardin, demandez un plan d\'aménagement tenant compte de l\'exposition, du sol et du climat de votre région. Un jardinier-paysagiste saura choisir des plantes adaptées qui nécessiteront moins d\'entretien.',
+  ],
+  faq: [
+    {
+      q: 'Puis-je bénéficier d\'un crédit d\'impôt pour les travaux de jardinage ?',
+      a: 'Oui, les petits travaux de jardinage (tonte, taille de haies, désherbage, débroussaillage) bénéficient d\'un crédit d\'impôt de 50 % dans la limite de 5 000 € par an. Le jardinier doit être agréé services à la personne (SAP) ou vous devez passer par un organisme agréé (CESU). Les travaux de création paysagère ne sont pas éligibles.',
+    },
+    {
+      q: 'A-t-on le droit de couper les branches du voisin qui dépassent ?',
+      a: 'Non, vous ne pouvez pas couper vous-même les branches de votre voisin qui dépassent sur votre terrain. L\'article 673 du Code civil vous autorise à demander à votre voisin de les couper, et en cas de refus, à saisir le tribunal. Depuis 2023, si votre voisin ne réagit pas sous 2 mois après mise en demeure, vous pouvez faire couper à ses frais.',
+    },
+    {
+      q: 'Quelle est la meilleure période pour tailler les haies ?',
+      a: 'La taille principale se fait en fin d\'hiver (février-mars), avant la reprise de végétation. Une seconde taille d\'entretien est recommandée en fin d\'été (septembre). Attention : la taille est interdite du 15 mars au 31 juillet dans les zones agricoles pour protéger la nidification des oiseaux (arrêté du 24 avril 2015).',
+    },
+    {
+      q: 'Quel budget pour l\'entretien annuel d\'un jardin de 500 m² ?',
+      a: 'Comptez entre 1 500 et 3 500 € par an pour un entretien complet comprenant la tonte bimensuelle (avril à octobre), 2 tailles de haie, le désherbage des massifs et le ramassage des feuilles à l\'automne. Ce budget peut être réduit de 50 % grâce au crédit d\'impôt si le jardinier est agréé SAP.',
+    },
+    {
+      q: 'Combien coûte l\'élagage d\'un grand arbre ?',
+      a: 'L\'élagage d\'un arbre de taille moyenne (8 à 15 m) coûte entre 200 et 600 €, et entre 500 et 1 500 € pour un grand arbre (plus de 15 m). Le prix dépend de la hauteur, de l\'accessibilité et du volume de branches à couper. L\'abattage avec dessouchage est plus cher : 400 à 2 500 € selon la taille. Faites appel à un élagueur-grimpeur certifié CS pour les arbres de grande hauteur.',
+    },
+    {
+      q: 'Quand et comment scarifier sa pelouse ?',
+      a: 'La scarification se fait idéalement au printemps (mars-avril) et éventuellement à l\'automne (septembre). Elle consiste à griffer le sol pour retirer la mousse et le feutrage qui étouffent le gazon. Après scarification, semez du gazon de regarnissage et apportez un engrais adapté. Un jardinier professionnel facture la scarification entre 0,15 et 0,30 €/m².',
+    },
+    {
+      q: 'Faut-il une autorisation pour abattre un arbre dans son jardin ?',
+      a: 'En règle générale, vous pouvez abattre un arbre sur votre propriété sans autorisation. Cependant, une autorisation est nécessaire si l\'arbre est classé (Espace Boisé Classé au PLU), s\'il est situé en zone protégée (périmètre ABF) ou si un arrêté municipal interdit l\'abattage. Renseignez-vous auprès de votre mairie avant toute intervention. En copropriété, l\'accord du syndic est requis.',
+    },
+    {
+      q: 'Comment créer un système d\'arrosage automatique ?',
+      a: 'L\'installation d\'un arrosage automatique enterré coûte entre 8 et 15 €/m² pour un jardin de 200 à 500 m², incluant les tuyaux, les asperseurs, le programmateur et la main-d\'oeuvre. Un système goutte-à-goutte pour les massifs et haies est moins cher (3 à 8 €/m²). Le jardinier-paysagiste dimensionne l\'installation en fonction de la pression d\'eau, du débit disponible et des besoins des plantations.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour le jardinage courant. Pour l\'élagage d\'urgence d\'un arbre dangereux après une tempête, contactez les pompiers (18) ou un élagueur grimpeur spécialisé. Entretien sur rendez-vous sous 1 à 2 semaines.',
+  certifications: [
+    'Certiphyto (obligatoire pour l\'utilisation de produits phytosanitaires)', 'Agrément Services à la Personne (SAP — crédit d\'impôt 50 %)',
+    'CS Taille et soins des arbres (certificat de spécialisation élagage)', 'Qualipaysage (certification professionnelle du secteur paysager)',
+    'CAPA Travaux Paysagers (diplôme de référence)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines selon la saison',
+}
@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'macon',
+  name: 'Maçon',
+  priceRange: { min: 45, max: 70, unit: '€/h' },
+  commonTasks: [
+    'Construction d\'un mur en parpaings : 50 à 80 €/m²', 'Coulée d\'une dalle béton (garage, terrasse) : 60 à 120 €/m²',
+    'Ouverture d\'un mur porteur (avec IPN) : 2 500 à 6 000 €', 'Construction d\'une extension : 1 200 à 2 000 €/m²', 'Réparation de fissures structurelles : 50 à 200 €/ml',
+    'Montage d\'un mur de clôture : 100 à 250 €/ml',
+  ],
+  tips: [
+    'Pour toute ouverture dans un mur porteur, exigez une étude structurelle réalisée par un bureau d\'études agréé. Le maçon doit suivre les préconisations de l\'ingénieur et poser une poutre (IPN) dimensionnée pour reprendre les charges.',
+    'Vérifiez les références du maçon sur des chantiers similaires au vôtre. Un maçon spécialisé en neuf n\'a pas forcément l\'expérience de la rénovation, et inversement.',
+    'Les travaux de maçonnerie sont soumis à la garantie décennale obligatoire. Demandez une copie de l\'attestation d\'assurance avant le début du chantier et vérifiez qu\'elle couvre le type de travaux prévus.',
+    'Pour une extension ou une construction, une déclaration préalable ou un permis de construire est obligatoire selon la surface. En dessous de 20 m², une déclaration suffit ; au-delà, le permis est requis (seuil porté à 40 m² en zone PLU).',
+    'Privilégiez les périodes de printemps et d\'automne pour les travaux de maçonnerie : le béton et le mortier nécessitent des températures comprises entre 5 et 30°C pour une prise optimale.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte la construction d\'une extension de maison ?',
+      a: 'Le prix d\'une extension en maçonnerie traditionnelle varie de 1 200 à 2 000 €/m² selon les finitions, la complexité de la structure et la région. Une extension de 20 m² coûte ainsi entre 24 000 et 40 000 €. Ce prix comprend les fondations, les murs, la toiture et le clos couvert, mais pas les finitions intérieures.',
+    },
+    {
+      q: 'Peut-on abattre un mur porteur soi-même ?',
+      a: 'Absolument pas. L\'ouverture d\'un mur porteur sans étude structurelle préalable et sans professionnel qualifié peut provoquer l\'effondrement partiel ou total du bâtiment. De plus, en copropriété, l\'accord du syndicat est obligatoire. Le coût d\'une ouverture dans un mur porteur (étude + travaux) est de 2 500 à 6 000 €.',
+    },
+    {
+      q: 'Quelles sont les fondations nécessaires pour un mur de clôture ?',
+      a: 'Un mur de clôture en parpaings nécessite une semelle de fondation en béton armé d\'au moins 30 cm de profondeur et 40 cm de largeur, hors gel (50 à 80 cm selon la région). Le maçon doit respecter les règles d\'urbanisme locales (hauteur maximale, retrait par rapport à la limite de propriété).',
+    },
+    {
+      q: 'Combien coûte la construction d\'un garage en parpaings ?',
+      a: 'La construction d\'un garage simple (environ 20 m²) en parpaings coûte entre 15 000 et 25 000 €, comprenant les fondations, les murs, la dalle, la toiture et la porte de garage. Un garage double (40 m²) revient à 25 000 à 45 000 €. Un permis de construire est nécessaire pour une surface supérieure à 20 m², une déclaration préalable en dessous.',
+    },
+    {
+      q: 'Les fissures sur ma maison sont-elles dangereuses ?',
+      a: 'Les microfissures (moins de 0,2 mm) sont généralement superficielles et sans danger. Les fissures de 0,2 à 2 mm doivent être surveillées et réparées pour éviter les infiltrations d\'eau. Les fissures supérieures à 2 mm ou en escalier le long des joints de parpaings peuvent indiquer un problème structurel et nécessitent l\'intervention urgente d\'un maçon et éventuellement d\'un bureau d\'études.',
+    },
+    {
+      q: 'Quelle est la meilleure période pour réaliser des travaux de maçonnerie ?',
+      a: 'Le printemps (avril-juin) et l\'automne (septembre-octobre) sont les périodes idéales. Le béton et le mortier nécessitent des températures entre 5 et 30 °C pour une prise optimale. En hiver, le gel peut compromettre la solidité du béton, et en plein été, la chaleur excessive accélère le séchage et provoque des fissures. Si les travaux doivent se faire en hiver, le maçon utilisera des adjuvants antigel.',
+    },
+    {
+      q: 'Faut-il un permis de construire pour une extension de maison ?',
+      a: 'En zone couverte par un PLU (Plan Local d\'Urbanisme), une déclaration préalable suffit pour une extension de moins de 40 m². Au-delà, un permis de construire est obligatoire. Hors PLU, le seuil est de 20 m². De plus, si la surface totale de la maison après extension dépasse 150 m², le recours à un architecte est obligatoire.',
+    },
+    {
+      q: 'Combien coûte une dalle béton pour une terrasse ?',
+      a: 'Une dalle béton de 15 cm d\'épaisseur pour terrasse coûte entre 60 et 120 €/m², comprenant le terrassement, le ferraillage, le coffrage et le coulage du béton. Pour une terrasse de 30 m², le budget total est de 1 800 à 3 600 €. Le béton décoratif (désactivé, ciré ou imprimé) est plus cher : 80 à 180 €/m², mais ne nécessite pas de revêtement supplémentaire.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la maçonnerie. Pour les travaux de gros oeuvre, extension ou rénovation, prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'Qualibat (qualification 2111/2112 maçonnerie et béton armé)', 'RGE (obligatoire si ITE — isolation thermique par l\'extérieur)',
+    'Compagnons du Devoir (formation d\'excellence)', 'NF Habitat (label qualité construction neuve et rénovation)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines',
+}
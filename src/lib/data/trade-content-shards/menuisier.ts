@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'menuisier',
+  name: 'Menuisier',
+  priceRange: { min: 45, max: 75, unit: '€/h' },
+  commonTasks: [
+    'Pose d\'une fenêtre double vitrage PVC : 300 à 800 € (hors fourniture)', 'Fabrication et pose d\'un placard sur mesure : 800 à 3 000 €',
+    'Pose d\'une porte intérieure : 150 à 400 € (hors fourniture)', 'Installation d\'une cuisine aménagée : 1 500 à 5 000 € (pose uniquement)',
+    'Création d\'un escalier sur mesure : 3 000 à 10 000 €', 'Pose de parquet massif ou contrecollé : 30 à 70 €/m² (pose uniquement)',
+  ],
+  tips: [
+    'Distinguez le menuisier d\'agencement (placards, cuisines, dressings sur mesure) du menuisier poseur (fenêtres, portes, parquet). Choisissez le spécialiste adapté à votre projet pour un résultat optimal.',
+    'Pour le remplacement de fenêtres, un menuisier certifié RGE est indispensable pour bénéficier de MaPrimeRenov\' et des CEE. La pose doit respecter le DTU 36.5 pour garantir l\'étanchéité.',
+    'Demandez à voir des réalisations précédentes du menuisier, surtout pour du mobilier sur mesure. Les photos de chantiers terminés sont un bon indicateur de la qualité du travail.',
+    'Vérifiez que le devis précise l\'essence de bois utilisée (chêne, hêtre, sapin, bois exotique) et son origine. Le label PEFC ou FSC garantit un bois issu de forêts gérées durablement.',
+    'Pour des fenêtres ou des volets, comparez les performances thermiques (coefficient Uw en W/m².K) et pas uniquement le prix. Un bon vitrage isolant se rentabilise en économies de chauffage.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte le remplacement de toutes les fenêtres d\'une maison ?',
+      a: 'Pour une maison standard avec 8 à 12 fenêtres, comptez entre 5 000 et 15 000 € selon le matériau (PVC : le moins cher, aluminium : intermédiaire, bois : le plus cher) et le type de vitrage. Avec les aides (MaPrimeRenov\' + CEE), la facture peut être réduite de 30 à 50 % pour les ménages modestes.',
+    },
+    {
+      q: 'Bois, PVC ou aluminium : quel matériau choisir pour mes fenêtres ?',
+      a: 'Le PVC offre le meilleur rapport qualité-prix et une bonne isolation (à partir de 300 € la fenêtre). Le bois est le plus esthétique et isolant mais nécessite un entretien régulier (à partir de 500 €). L\'aluminium est fin, moderne et sans entretien, mais moins isolant (à partir de 450 €). Le mixte bois-alu combine les avantages des deux.',
+    },
+    {
+      q: 'Faut-il un permis de construire pour changer les fenêtres ?',
+      a: 'Non, mais une déclaration préalable de travaux en mairie est obligatoire si vous modifiez l\'aspect extérieur de la façade (forme, couleur, matériau des fenêtres). En zone protégée (ABF, sites classés), l\'accord de l\'Architecte des Bâtiments de France est nécessaire. Les délais d\'instruction sont de 1 à 2 mois.',
+    },
+    {
+      q: 'Combien coûte un dressing ou placard sur mesure ?',
+      a: 'Un placard sur mesure avec portes coulissantes coûte entre 800 et 3 000 € selon les dimensions, le matériau (mélaminé, bois massif, laqué) et les aménagements intérieurs (tiroirs, penderies, étagères). Un dressing complet avec éclairage intégré peut atteindre 5 000 à 8 000 €. Le sur-mesure permet d\'exploiter chaque centimètre, notamment sous les combles ou dans les espaces atypiques.',
+    },
+    {
+      q: 'Quelle est la durée de vie des fenêtres en PVC ?',
+      a: 'Les fenêtres PVC de qualité ont une durée de vie de 25 à 35 ans sans entretien particulier, hormis un nettoyage régulier au savon doux. Les fenêtres en bois durent aussi longtemps mais nécessitent un entretien (lasure ou peinture) tous les 5 à 7 ans. Les fenêtres aluminium ont la meilleure longévité, jusqu\'à 40 ans, grâce à leur résistance à la corrosion.',
+    },
+    {
+      q: 'Un menuisier peut-il fabriquer un escalier sur mesure ?',
+      a: 'Oui, c\'est même l\'une des spécialités du menuisier d\'agencement. Un escalier sur mesure en bois coûte entre 3 000 et 10 000 € selon l\'essence (hêtre, chêne, frêne), la forme (droit, tournant, hélicoïdal) et les finitions (vitrification, peinture, garde-corps). La fabrication et la pose prennent 2 à 4 semaines. Un escalier sur mesure optimise l\'espace et s\'adapte parfaitement à la configuration du logement.',
+    },
+    {
+      q: 'Comment entretenir ses menuiseries en bois ?',
+      a: 'Les menuiseries extérieures en bois doivent être protégées par une lasure ou une peinture microporeuse tous les 5 à 7 ans. Poncez légèrement la surface, dépoussiérez et appliquez deux couches de lasure au pinceau. Pour les menuiseries intérieures (portes, placards), un nettoyage à l\'eau savonneuse suffit. Si le bois est abîmé, un menuisier peut le décaper, le traiter et le remettre en état.',
+    },
+    {
+      q: 'Quelles aides existent pour le remplacement de fenêtres ?',
+      a: 'MaPrimeRenov\' finance jusqu\'à 100 € par fenêtre (simple vers double vitrage) pour les ménages modestes. Les CEE (Certificats d\'Économies d\'Énergie) ajoutent 40 à 100 € par fenêtre (selon profil de revenus). L\'éco-prêt à taux zéro permet de financer jusqu\'à 7 000 € de remplacement de fenêtres sans intérêts. Le menuisier doit être certifié RGE pour que vous puissiez bénéficier de ces aides.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la menuiserie. Pour le remplacement de fenêtres cassées ou de portes endommagées, prenez rendez-vous pour un devis gratuit sous 48h.',
+  certifications: [
+    'Qualibat (qualification 3511 fourniture et pose de menuiseries extérieures)', 'RGE (obligatoire pour les aides — fenêtres et portes isolantes)',
+    'Certification NF Fenêtres bois ou NF Fenêtres PVC (FCBA/CSTB)', 'Compagnons du Devoir (formation d\'excellence)', 'Label Menuiserie 21 (engagement qualité UFME)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 2 à 4 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'metallier',
+  name: 'Métallier',
+  priceRange: { min: 150, max: 400, unit: '€/ml' },
+  commonTasks: [
+    'Escalier métallique sur mesure : 3 000 à 12 000 €', 'Garde-corps en acier/inox : 150 à 400 €/ml', 'Verrière d\'intérieur : 800 à 2 500 €/m²',
+    'Porte d\'entrée en acier : 1 500 à 5 000 €', 'Pergola métallique : 3 000 à 8 000 €',
+  ],
+  tips: [
+    'L\'acier thermolaqué offre le meilleur rapport qualité/prix pour les ouvrages extérieurs. L\'inox est réservé aux environnements corrosifs (bord de mer).',
+    'Demandez des plans cotés et une maquette 3D avant la fabrication pour valider les dimensions exactes.',
+    'Pour un garde-corps, vérifiez que le métallier respecte la norme NF P01-012 : hauteur minimale de 1 m, espacement des barreaux de 11 cm maximum et absence de point d\'escalade pour les enfants.',
+    'Prévoyez un accès suffisant pour la livraison et la manutention : un escalier métallique ou une verrière arrive souvent en éléments de grande dimension qui nécessitent un passage adapté.',
+    'Demandez au métallier de vous fournir une note de calcul pour les ouvrages structurels (escaliers, mezzanines, passerelles) afin de garantir la conformité aux normes de résistance.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte une verrière d\'intérieur ?',
+      a: 'Une verrière atelier sur mesure coûte entre 800 et 2 500 €/m² selon le matériau (acier, aluminium), le type de vitrage (simple, double, feuilleté) et la complexité de la pose. Une verrière standard de 2 m × 1,5 m revient à 2 500 à 5 000 €, pose comprise.',
+    },
+    {
+      q: 'Acier, inox ou aluminium : quel métal choisir ?',
+      a: 'L\'acier est le plus polyvalent et le moins cher, idéal pour la plupart des ouvrages intérieurs et extérieurs (avec traitement thermolaqué). L\'inox (304 ou 316) résiste à la corrosion sans entretien, parfait pour les bords de mer ou de piscine, mais coûte 2 à 3 fois plus cher. L\'aluminium est léger et ne rouille pas, adapté aux menuiseries et grandes portées.',
+    },
+    {
+      q: 'Combien coûte un escalier métallique sur mesure ?',
+      a: 'Un escalier droit en acier thermolaqué revient à 3 000 à 6 000 €, un quart-tournant à 5 000 à 8 000 € et un escalier hélicoïdal à 6 000 à 12 000 €. Le prix augmente avec les finitions (marches en bois, verre ou acier), le type de garde-corps et la complexité de la pose. Prévoyez 4 à 6 semaines de fabrication.',
+    },
+    {
+      q: 'Une verrière d\'intérieur isole-t-elle du bruit ?',
+      a: 'Avec un simple vitrage (6 mm), l\'isolation acoustique est faible (environ 25 dB). Un double vitrage 4/16/4 atteint 30 à 35 dB, ce qui est acceptable pour séparer une cuisine d\'un salon. Pour une véritable isolation phonique (bureau, chambre), optez pour un vitrage acoustique feuilleté 44.2 qui offre 37 à 42 dB d\'affaiblissement.',
+    },
+    {
+      q: 'Faut-il un permis de construire pour une pergola métallique ?',
+      a: 'Une pergola de moins de 5 m² est dispensée de formalités. Entre 5 et 20 m² (ou 40 m² en zone PLU), une déclaration préalable de travaux suffit. Au-delà de 20 m² (ou 40 m²), un permis de construire est nécessaire. En zone protégée (ABF), toute pergola nécessite au minimum une déclaration préalable, quelle que soit la surface.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la métallerie. Les ouvrages métalliques (escaliers, garde-corps, verrières) sont fabriqués sur mesure en atelier. Prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'Qualibat (qualification 4411/4412 métallerie-serrurerie)', 'Certification EN 1090 (exécution des structures en acier — marquage CE)',
+    'Label Artisanat d\'Art (ouvrages décoratifs)', 'ACQPA (qualification peinture anticorrosion — si thermolaquage)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, fabrication 3 à 6 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'miroitier',
+  name: 'Miroitier',
+  priceRange: { min: 80, max: 250, unit: '€/m²' },
+  commonTasks: [
+    'Pose de miroir sur mesure : 80 à 200 €/m²', 'Crédence de cuisine en verre : 150 à 350 €/m²', 'Paroi de douche en verre trempé : 400 à 1 200 €',
+    'Vitrine de commerce : 200 à 500 €/m²', 'Remplacement de double vitrage : 150 à 400 €/m²',
+  ],
+  tips: [
+    'Pour les parois de douche et garde-corps, le verre trempé securit est obligatoire (norme NF EN 12150).',
+    'Un miroir sur mesure avec bords polis et fixations invisibles coûte plus cher mais offre un rendu haut de gamme.',
+    'En cas de bris de vitrage, sécurisez immédiatement la zone et bâchez l\'ouverture. Un miroitier d\'urgence peut intervenir sous 24 à 48h pour un remplacement provisoire ou définitif.',
+    'Pour une crédence en verre, prévoyez les prises de mesure après la pose de la cuisine : les découpes pour les prises électriques et les interrupteurs doivent être millimétrées.',
+    'Le verre feuilleté (deux verres collés par un film PVB) est obligatoire pour les garde-corps et les applications en hauteur. En cas de casse, les morceaux restent collés au film, évitant les blessures.',
+  ],
+  faq: [
+    {
+      q: 'Quelle épaisseur de verre pour une crédence ?',
+      a: 'Une crédence de cuisine nécessite un verre trempé de 6 mm minimum (8 mm recommandé pour les grandes surfaces). Le verre laqué est le plus populaire car il offre un large choix de couleurs et se nettoie facilement. Budget : 150 à 350 €/m², pose comprise.',
+    },
+    {
+      q: 'Combien coûte le remplacement d\'un double vitrage ?',
+      a: 'Le remplacement d\'un double vitrage standard (4/16/4) coûte entre 150 et 300 €/m² pose comprise. Un vitrage à isolation renforcée (VIR ou ITR) revient à 200 à 400 €/m² mais réduit les déperditions thermiques de 40 %. Pour une fenêtre standard (1,2 m × 1 m), comptez 200 à 400 € tout compris. Le délai est de 1 à 2 semaines (fabrication sur mesure).',
+    },
+    {
+      q: 'Verre trempé ou verre feuilleté : lequel choisir ?',
+      a: 'Le verre trempé (securit) est 5 fois plus résistant que le verre ordinaire et se brise en petits morceaux non coupants. Il est obligatoire pour les parois de douche et les tables. Le verre feuilleté (deux verres + film PVB) ne tombe pas en morceaux à la casse : il est obligatoire pour les garde-corps, les toitures vitrées et les vitrines. Certaines applications exigent un verre trempé-feuilleté (cumul des deux propriétés).',
+    },
+    {
+      q: 'Un miroitier peut-il intervenir en urgence ?',
+      a: 'Oui, la plupart des miroitiers proposent un service d\'urgence pour les vitrines de commerce cassées, les fenêtres brisées après effraction ou les dégâts de tempête. L\'intervention sous 24h coûte 30 à 50 % de plus qu\'une intervention programmée. En attendant, bâchez l\'ouverture avec une bâche ou du contreplaqué pour sécuriser le local.',
+    },
+    {
+      q: 'Comment choisir un miroir pour une salle de bain ?',
+      a: 'Optez pour un miroir avec traitement anti-buée intégré (film chauffant au dos) et bords polis pour résister à l\'humidité. Évitez les miroirs bas de gamme dont le tain (couche réfléchissante) se dégrade rapidement en milieu humide. Un miroir sur mesure avec éclairage LED intégré coûte 200 à 800 € selon les dimensions et les options.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour vitrine de commerce cassée, miroir brisé ou paroi de douche éclatée. Un miroitier d\'urgence peut sécuriser les lieux et poser un vitrage provisoire selon disponibilité. Majorations : +100 à 150 % la nuit et le week-end.',
+  certifications: [
+    'Qualibat (qualification 4311/4312 vitrerie-miroiterie)', 'Certification Cekal (qualité des vitrages isolants, feuilletés et trempés)',
+    'Certification NF EN 12150 (verres de sécurité trempés)',
+  ],
+  averageResponseTime: 'Devis sous 48h, fabrication 1 à 3 semaines',
+}
@@ -0,0 +1,63 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'nettoyage',
+  name: 'Nettoyage',
+  priceRange: { min: 25, max: 45, unit: '€/h' },
+  commonTasks: [
+    'Nettoyage de fin de chantier (appartement 60 m²) : 400 à 800 €', 'Nettoyage de copropriété (parties communes) : 200 à 500 €/mois',
+    'Nettoyage de vitres (logement) : 5 à 10 €/m²', 'Remise en état après sinistre : 500 à 2 000 €', 'Nettoyage de façade (kärcher professionnel) : 10 à 25 €/m²',
+    'Débarras et nettoyage de locaux : 30 à 50 €/m²',
+  ],
+  tips: [
+    'Pour un nettoyage de fin de chantier, exigez un cahier des charges précis : lessivage des murs, décapage des sols, nettoyage des vitres (intérieur + extérieur), dégraissage de la cuisine et nettoyage des sanitaires.',
+    'Vérifiez que l\'entreprise de nettoyage dispose d\'une assurance responsabilité civile professionnelle et que ses salariés sont déclarés (demandez un extrait Kbis et une attestation URSSAF).',
+    'Pour le nettoyage régulier de copropriété, un contrat annuel avec un cahier des charges détaillé (fréquence, surfaces, prestations) est plus économique que des interventions ponctuelles.',
+    'Les entreprises de nettoyage à domicile agréées services à la personne (SAP) ouvrent droit à un crédit d\'impôt de 50 % dans la limite de 12 000 € de dépenses par an.',
+    'Pour un nettoyage après sinistre (dégât des eaux, incendie), conservez les factures pour votre assurance. La plupart des contrats d\'assurance habitation couvrent ces frais.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte un nettoyage de fin de chantier ?',
+      a: 'Pour un appartement de 60 m², comptez 400 à 800 € selon l\'état des lieux et l\'étendue des travaux réalisés. Pour une maison de 120 m², le budget est de 700 à 1 500 €. Ce tarif inclut le lessivage des murs, le décapage et lustrage des sols, le nettoyage des vitres et la désinfection des sanitaires.',
+    },
+    {
+      q: 'Puis-je bénéficier d\'un crédit d\'impôt pour le nettoyage ?',
+      a: 'Oui, le ménage à domicile bénéficie d\'un crédit d\'impôt de 50 % si l\'entreprise est agréée services à la personne (SAP) ou si vous employez directement une personne via le CESU. Le plafond est de 12 000 € de dépenses par an (+1 500 € par enfant à charge). Seul le nettoyage à domicile est éligible, pas le nettoyage professionnel de locaux.',
+    },
+    {
+      q: 'Comment choisir une entreprise de nettoyage fiable ?',
+      a: 'Vérifiez le SIRET, l\'inscription au registre du commerce (Kbis), l\'attestation URSSAF à jour et l\'assurance RC professionnelle. Demandez des références clients et consultez les avis en ligne. Une entreprise sérieuse propose un devis gratuit après visite sur site et ne demande jamais de paiement en espèces.',
+    },
+    {
+      q: 'Quelle est la différence entre un nettoyage classique et un nettoyage de fin de chantier ?',
+      a: 'Le nettoyage de fin de chantier est bien plus intensif qu\'un ménage classique. Il comprend le décapage des sols (résidus de colle, ciment, peinture), le lessivage des murs et plafonds, le nettoyage des menuiseries et vitrages, et la désinfection complète des sanitaires. Le tarif est 2 à 3 fois plus élevé qu\'un ménage standard car il nécessite des produits et des équipements professionnels spécifiques.',
+    },
+    {
+      q: 'Combien coûte le nettoyage des parties communes d\'un immeuble ?',
+      a: 'Le nettoyage hebdomadaire des parties communes (hall, escalier, paliers) d\'un petit immeuble de 10 à 20 lots coûte entre 200 et 500 € par mois. Ce tarif inclut le balayage, le lavage des sols, le nettoyage des vitres d\'entrée et la sortie des poubelles. Un contrat annuel est plus économique que des interventions ponctuelles et permet de répartir les charges entre copropriétaires.',
+    },
+    {
+      q: 'Le nettoyage après un dégât des eaux est-il couvert par l\'assurance ?',
+      a: 'Oui, la plupart des contrats d\'assurance habitation couvrent les frais de remise en état après un dégât des eaux, y compris le nettoyage et l\'assèchement. Déclarez le sinistre sous 5 jours ouvrés, prenez des photos des dégâts et conservez toutes les factures. L\'expert de l\'assurance validera la prise en charge. Certains contrats incluent un service d\'assistance avec envoi direct d\'une entreprise de nettoyage.',
+    },
+    {
+      q: 'Peut-on nettoyer une façade soi-même ou faut-il un professionnel ?',
+      a: 'Le nettoyage d\'une façade de plain-pied peut se faire soi-même avec un nettoyeur haute pression (attention à ne pas dépasser 100 bars pour ne pas abîmer l\'enduit). Au-delà du premier étage, faites appel à un professionnel équipé (nacelle, échafaudage) pour des raisons de sécurité. Le nettoyage professionnel de façade coûte 10 à 25 €/m² et peut inclure un traitement hydrofuge de protection.',
+    },
+    {
+      q: 'Quels produits sont utilisés pour un nettoyage professionnel écologique ?',
+      a: 'Les entreprises labellisées Écolabel Européen utilisent des produits biodégradables à base de tensioactifs végétaux, sans phosphates ni solvants chlorés. Les techniques de nettoyage vapeur (150 °C) permettent de désinfecter sans produit chimique. Le microfibre professionnelle réduit la consommation d\'eau de 90 %. Ces solutions écologiques sont particulièrement adaptées aux crèches, écoles et logements avec enfants en bas âge.',
+    },
+  ],
+  emergencyInfo: 'Nettoyage d\'urgence disponible après sinistre (dégât des eaux, incendie, inondation). Intervention sous 24 à 48h pour la remise en état et le nettoyage post-sinistre. Majoration de +30 à 60 % en dehors des heures ouvrées.',
+  certifications: [
+    'Qualipropre (qualification professionnelle du secteur de la propreté — valable 4 ans)',
+    'Agrément Services à la Personne (SAP — crédit d\'impôt 50 % pour le ménage à domicile)', 'ISO 14001 (management environnemental)',
+    'Écolabel Européen (utilisation de produits écologiques)', 'CQP Agent de propreté (Certificat de Qualification Professionnelle — INHNI)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 5 jours',
+}
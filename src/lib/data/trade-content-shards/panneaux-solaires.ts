@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'panneaux-solaires',
+  name: 'Panneaux solaires',
+  priceRange: { min: 7000, max: 20000, unit: '€' },
+  commonTasks: [
+    'Installation photovoltaïque 3 kWc : 7 000 à 10 000 €', 'Installation photovoltaïque 6 kWc : 12 000 à 16 000 €', 'Installation photovoltaïque 9 kWc : 16 000 à 22 000 €',
+    'Solaire thermique (eau chaude) : 4 000 à 8 000 €', 'Batterie de stockage : 4 000 à 10 000 €',
+  ],
+  tips: [
+    'La rentabilité dépend de l\'orientation (sud idéal), de l\'inclinaison (30° optimal) et de l\'ensoleillement local. Une étude de faisabilité gratuite est proposée par la plupart des installateurs.',
+    'En autoconsommation avec revente du surplus, le retour sur investissement est de 8 à 12 ans en moyenne.',
+    'Vérifiez que votre installateur possède la certification QualiPV et le label RGE, deux conditions indispensables pour bénéficier des aides de l\'État (prime à l\'autoconsommation, obligation d\'achat EDF OA).',
+    'Faites nettoyer vos panneaux une fois par an à l\'eau claire sans détergent : la poussière et les fientes d\'oiseaux peuvent réduire la production de 5 à 15 %.',
+    'Pensez au monitoring en temps réel via une application : un dysfonctionnement non détecté peut représenter plusieurs centaines d\'euros de perte de production sur un an.',
+  ],
+  faq: [
+    {
+      q: 'Est-ce rentable d\'installer des panneaux solaires ?',
+      a: 'Oui, avec un prix de l\'électricité en hausse constante. Une installation de 3 kWc produit environ 3 500 kWh/an dans le sud de la France, soit 500 à 700 € d\'économie annuelle. Avec la prime à l\'autoconsommation (1 140 € pour 3 kWc) et la revente du surplus au tarif CRE en vigueur (révisé trimestriellement — vérifiez sur edf-oa.fr), le retour sur investissement se fait en 8 à 12 ans pour un équipement qui dure 30 ans+.',
+    },
+    {
+      q: 'Quelle est la durée de vie des panneaux solaires ?',
+      a: 'Les panneaux photovoltaïques ont une durée de vie de 30 à 40 ans. La garantie constructeur couvre généralement 25 ans sur la production (80 % du rendement initial garanti). L\'onduleur, en revanche, doit être remplacé tous les 10 à 15 ans (coût : 1 000 à 2 000 €).',
+    },
+    {
+      q: 'Peut-on installer des panneaux solaires sur un toit plat ou orienté nord ?',
+      a: 'Un toit plat convient très bien grâce à des supports inclinés à 30° orientés plein sud. En revanche, une orientation nord réduit la production de 40 à 50 %, ce qui rend le projet rarement rentable. Les orientations est et ouest restent viables avec une perte de 15 à 20 % seulement.',
+    },
+    {
+      q: 'Faut-il une autorisation pour poser des panneaux solaires ?',
+      a: 'Oui, une déclaration préalable de travaux en mairie est obligatoire dans tous les cas. En zone protégée (ABF, monument historique), l\'architecte des Bâtiments de France doit donner son accord, ce qui peut rallonger le délai de 2 à 6 mois. En copropriété, un vote en assemblée générale est requis.',
+    },
+    {
+      q: 'Autoconsommation totale ou revente du surplus : quel choix faire ?',
+      a: 'L\'autoconsommation avec revente du surplus est le modèle le plus courant et le plus rentable pour les particuliers. Vous consommez directement l\'électricité produite et revendez l\'excédent à EDF OA à un tarif garanti pendant 20 ans. La revente totale est plutôt réservée aux grandes toitures ou aux bâtiments peu consommateurs.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'installation de panneaux solaires. En cas de panne de votre onduleur ou de baisse de production anormale, contactez votre installateur pour un diagnostic sous 48h à 1 semaine.',
+  certifications: [
+    'QualiPV (qualification Qualit\'EnR — installation photovoltaïque)', 'RGE (obligatoire pour les aides MaPrimeRénov\' et prime autoconsommation)',
+    'QualiSol (si installation de solaire thermique — chauffe-eau et SSC)', 'Consuel (attestation de conformité électrique — obligatoire pour le raccordement)',
+  ],
+  averageResponseTime: 'Étude gratuite sous 1 semaine, installation 4 à 8 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'paysagiste',
+  name: 'Paysagiste',
+  priceRange: { min: 35, max: 80, unit: '€/m²' },
+  commonTasks: [
+    'Aménagement paysager complet : 35 à 80 €/m²', 'Création de terrasse (bois, pierre) : 80 à 250 €/m²', 'Engazonnement (semis ou placage) : 5 à 15 €/m²',
+    'Plantation d\'arbres et haies : 30 à 100 €/unité', 'Système d\'arrosage automatique : 10 à 25 €/m²',
+  ],
+  tips: [
+    'Un paysagiste concepteur (diplôme DPLG ou ENSP) conçoit le projet ; un paysagiste entrepreneur réalise les travaux. Les deux compétences sont parfois réunies chez le même professionnel.',
+    'Demandez un plan d\'aménagement avec plantations adaptées au climat et au sol de votre région.',
+    'Prévoyez les travaux de plantation entre octobre et mars (période de repos végétatif) pour favoriser la reprise des végétaux et bénéficier de tarifs pépiniéristes plus avantageux.',
+    'Intégrez un système d\'arrosage automatique dès la conception du projet : l\'installer après coup coûte 30 à 50 % plus cher car il faut creuser dans un jardin déjà aménagé.',
+    'Demandez un plan d\'entretien annuel chiffré : un beau jardin nécessite un suivi régulier (taille, fertilisation, désherbage) dont le coût annuel représente 5 à 10 % de l\'investissement initial.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte l\'aménagement d\'un jardin de 200 m² ?',
+      a: 'Pour un jardin de 200 m² avec terrasse, plantations et engazonnement, comptez 8 000 à 20 000 € selon le niveau de finition. Un projet haut de gamme avec piscine peut atteindre 50 000 €+.',
+    },
+    {
+      q: 'Quelle est la différence entre un paysagiste et un jardinier ?',
+      a: 'Le paysagiste conçoit et réalise des aménagements extérieurs complets (terrasses, plantations, murets, éclairage, arrosage). Le jardinier assure l\'entretien courant (tonte, taille, désherbage). Un paysagiste diplômé DPLG ou ENSP peut aussi réaliser des études de sol et des plans d\'architecte paysagiste. Pour un simple entretien de jardin, un jardinier suffit (20 à 40 €/h).',
+    },
+    {
+      q: 'Faut-il un permis pour des travaux d\'aménagement extérieur ?',
+      a: 'Aucune autorisation n\'est requise pour les plantations et l\'engazonnement. En revanche, une déclaration préalable de travaux est nécessaire pour une terrasse de plus de 20 m² ou surélevée de plus de 60 cm, un mur de clôture dépassant 2 m de hauteur, ou un abri de jardin de plus de 5 m². Un permis de construire s\'impose au-delà de 20 m² de surface de plancher.',
+    },
+    {
+      q: 'Quelles plantes choisir pour un jardin facile d\'entretien ?',
+      a: 'Privilégiez les plantes vivaces adaptées à votre zone climatique : lavande, romarin et olivier en climat méditerranéen ; hortensias, érables et graminées en climat océanique. Les couvre-sols (pervenche, lierre, thym rampant) limitent le désherbage. Un paillis minéral ou organique réduit l\'arrosage de 50 % et freine la pousse des mauvaises herbes.',
+    },
+    {
+      q: 'Comment estimer le budget d\'entretien annuel d\'un jardin ?',
+      a: 'Pour un jardin de 200 m², comptez 1 000 à 3 000 €/an en entretien professionnel (tonte bimensuelle, taille des haies 2 fois/an, traitement phytosanitaire, nettoyage). Un contrat annuel d\'entretien avec un paysagiste est 20 à 30 % moins cher que des interventions ponctuelles. Le crédit d\'impôt « services à la personne » (50 %) s\'applique pour l\'entretien de jardin chez les particuliers.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour l\'aménagement paysager. Les projets de création de jardin, terrasse et plantations sont planifiés sur plusieurs semaines. Prenez rendez-vous pour une étude sous 2 semaines.',
+  certifications: [
+    'Diplôme ENSP ou DEP Paysage (titre de paysagiste concepteur)', 'Qualipaysage (certification professionnelle — reconnue par l\'État)',
+    'Label Écojardin (gestion écologique des espaces verts)', 'Certiphyto (obligatoire si utilisation de produits phytosanitaires)',
+  ],
+  averageResponseTime: 'Étude sous 2 semaines, réalisation 2 à 8 semaines',
+}
@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'peintre-en-batiment',
+  name: 'Peintre en bâtiment',
+  priceRange: { min: 25, max: 45, unit: '€/m²' },
+  commonTasks: [
+    'Peinture d\'une pièce (murs + plafond, 12 m²) : 400 à 800 €', 'Ravalement de façade (enduit + peinture) : 40 à 100 €/m²',
+    'Pose de papier peint : 15 à 35 €/m² (hors fourniture)', 'Laquage de boiseries et portes : 30 à 60 €/m²', 'Traitement et peinture de volets : 50 à 120 € par volet',
+    'Peinture de plafond seul : 18 à 35 €/m²',
+  ],
+  tips: [
+    'Un bon peintre commence toujours par une préparation minutieuse des surfaces : lessivage, ponçage, rebouchage des fissures et application d\'une sous-couche. Cette étape représente 60 % du travail et garantit un résultat durable.',
+    'Demandez au peintre de préciser la marque et la gamme de peinture utilisée. Les peintures professionnelles (Tollens, Sikkens, Zolpan) offrent un meilleur rendu et une meilleure tenue que les premiers prix de grande surface.',
+    'Pour un ravalement de façade, vérifiez que le peintre possède une garantie décennale, car les travaux extérieurs engagent la responsabilité du professionnel pendant 10 ans.',
+    'Le devis doit indiquer le nombre de couches prévues (minimum 2 pour un résultat optimal), le type de finition (mat, satiné, brillant) et si la préparation des supports est incluse.',
+    'Privilégiez les peintures à faible émission de COV (Composants Organiques Volatils), identifiées par le label A+ sur l\'étiquette, surtout pour les chambres et les pièces de vie.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte la peinture d\'un appartement complet ?',
+      a: 'Pour un appartement de 60 m², comptez entre 2 500 et 5 000 € pour la peinture de toutes les pièces (murs et plafonds), fournitures incluses. Le prix varie selon l\'état des murs (plus de préparation = plus cher), le nombre de couleurs et la qualité de la peinture choisie. Demandez au moins 3 devis pour comparer.',
+    },
+    {
+      q: 'Faut-il vider entièrement la pièce avant les travaux de peinture ?',
+      a: 'Idéalement oui, mais un bon peintre peut travailler dans une pièce partiellement vidée. Il protégera les meubles restants avec des bâches et du ruban de masquage. Prévoyez toutefois de déplacer les meubles au centre de la pièce et de débarrasser les étagères et les cadres.',
+    },
+    {
+      q: 'Quelle est la différence entre peinture mate, satinée et brillante ?',
+      a: 'La peinture mate masque les imperfections et donne un aspect sobre, idéale pour les plafonds et les chambres. La satinée est lavable et résistante, parfaite pour les pièces de vie, couloirs et cuisines. La brillante (ou laquée) offre un rendu très lisse et se nettoie facilement, recommandée pour les boiseries et les salles de bain.',
+    },
+    {
+      q: 'Combien de temps faut-il pour peindre un appartement ?',
+      a: 'Pour un appartement de 60 m², comptez 5 à 8 jours de travail incluant la préparation, l\'application de 2 couches et les finitions. Le délai peut être plus long si les murs nécessitent d\'importants travaux de préparation (rebouchage, enduit, ponçage).',
+    },
+    {
+      q: 'Comment bien préparer les murs avant de peindre ?',
+      a: 'La préparation comprend le lessivage à la lessive Saint-Marc pour dégraisser, le rebouchage des trous et fissures à l\'enduit, le ponçage au papier de verre grain 120, et l\'application d\'une sous-couche d\'accrochage. Sur un mur neuf en plâtre, une sous-couche spéciale est indispensable pour éviter que la peinture ne cloque. Cette étape représente 60 % du temps total des travaux.',
+    },
+    {
+      q: 'Quelle peinture choisir pour une salle de bain ?',
+      a: 'Optez pour une peinture acrylique spéciale pièces humides, résistante à l\'humidité et aux moisissures (classe 1 ou 2 selon la norme ISO 11998). Les marques professionnelles comme Tollens, Sikkens ou Zolpan proposent des gammes dédiées. Comptez 30 à 50 € le litre en qualité professionnelle. Évitez les peintures glycéro dans les pièces de vie en raison de leurs émanations de COV.',
+    },
+    {
+      q: 'La peinture de façade nécessite-t-elle une autorisation ?',
+      a: 'Oui, un ravalement de façade nécessite une déclaration préalable de travaux en mairie si vous modifiez l\'aspect extérieur (couleur, enduit). En zone protégée (ABF), l\'accord de l\'Architecte des Bâtiments de France est requis, ce qui peut limiter le choix des couleurs. Certaines communes imposent un ravalement tous les 10 ans (Paris, par exemple) et peuvent émettre un arrêté si la façade est dégradée.',
+    },
+    {
+      q: 'Combien de couches de peinture faut-il appliquer ?',
+      a: 'Deux couches de peinture de finition sont le minimum pour un résultat homogène et durable. Sur un support neuf ou un changement de couleur radical (clair vers foncé), une sous-couche plus deux couches de finition sont nécessaires. Chaque couche doit sécher complètement (4 à 6 heures pour une acrylique) avant l\'application de la suivante.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la peinture en bâtiment. Prenez rendez-vous pour un devis gratuit sous 48h et une intervention planifiée sous 1 à 3 semaines.',
+  certifications: [
+    'Qualibat (qualification 6111/6112 peinture et ravalement)', 'RGE (obligatoire si ITE — isolation thermique par l\'extérieur)',
+    'ACQPA (qualification peinture anticorrosion — ouvrages métalliques)', 'Compagnons du Devoir (formation d\'excellence)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+}
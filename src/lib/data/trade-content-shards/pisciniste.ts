@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'pisciniste',
+  name: 'Pisciniste',
+  priceRange: { min: 15000, max: 50000, unit: '€' },
+  commonTasks: [
+    'Piscine coque polyester 8×4 m : 15 000 à 25 000 €', 'Piscine béton maçonnée 8×4 m : 25 000 à 50 000 €', 'Piscine hors-sol bois ou acier : 3 000 à 10 000 €',
+    'Rénovation de liner : 2 000 à 5 000 €', 'Mise en sécurité (alarme, barrière, couverture) : 1 000 à 5 000 €',
+  ],
+  tips: [
+    'La mise en sécurité est obligatoire (loi du 3 janvier 2003) : alarme, barrière, couverture ou abri. Amende de 45 000 € en cas de non-respect.',
+    'Prévoyez un budget annuel d\'entretien de 500 à 1 500 € (produits, électricité, hivernage).',
+    'Faites réaliser une étude de sol avant de choisir le type de piscine : un terrain argileux ou avec une nappe phréatique haute impose des contraintes de construction qui peuvent doubler le budget.',
+    'Comparez les garanties décennales des piscinistes : la structure (béton, coque) doit être couverte 10 ans, mais le liner et les équipements techniques ont des garanties plus courtes (2 à 5 ans).',
+    'Pensez à l\'hivernage actif (filtration réduite) plutôt que passif (arrêt total) si vous êtes dans une région où les températures descendent rarement sous 0°C : la remise en route au printemps sera beaucoup plus simple.',
+  ],
+  faq: [
+    {
+      q: 'Faut-il un permis de construire pour une piscine ?',
+      a: 'Pas de formalité pour les piscines de moins de 10 m². Déclaration préalable de travaux pour les piscines de 10 à 100 m². Permis de construire obligatoire au-delà de 100 m² ou pour les piscines couvertes de plus de 1,80 m de hauteur. La taxe d\'aménagement s\'applique à toutes les piscines de plus de 10 m² (200 €/m² en 2025).',
+    },
+    {
+      q: 'Piscine coque ou béton : laquelle choisir ?',
+      a: 'La piscine coque polyester est moins chère (15 000 à 25 000 € pour 8×4 m), plus rapide à installer (1 à 2 semaines) et facile d\'entretien, mais les formes et dimensions sont limitées au catalogue du fabricant. La piscine béton (25 000 à 50 000 €) permet toutes les formes et dimensions sur mesure, mais nécessite 2 à 3 mois de travaux. Le béton est plus durable (50 ans+) que la coque (20 à 25 ans).',
+    },
+    {
+      q: 'Quel système de traitement d\'eau choisir ?',
+      a: 'Le chlore reste le plus économique (200 à 400 €/an) mais peut irriter la peau et les yeux. L\'électrolyse au sel (1 500 à 3 000 € d\'investissement) est plus confortable et économique sur le long terme. Le traitement UV ou à l\'ozone (2 000 à 4 000 €) réduit drastiquement l\'usage de produits chimiques. Le brome est recommandé pour les piscines chauffées (spa, couverture).',
+    },
+    {
+      q: 'Combien coûte l\'entretien annuel d\'une piscine ?',
+      a: 'Le budget annuel d\'entretien varie de 500 à 1 500 € selon la taille et le système de traitement : produits chimiques (200 à 500 €), électricité pour la filtration (300 à 600 €), remplacement de pièces d\'usure (100 à 300 €), hivernage et mise en route (200 à 400 € si réalisés par un professionnel). Un robot nettoyeur automatique (800 à 2 000 €) réduit le temps d\'entretien manuel.',
+    },
+    {
+      q: 'Une piscine augmente-t-elle la valeur de mon bien immobilier ?',
+      a: 'Oui, une piscine enterrée bien entretenue peut augmenter la valeur d\'une maison de 5 à 15 % selon la région (davantage dans le sud). En revanche, elle augmente aussi la taxe foncière (via la taxe d\'aménagement de 200 €/m²) et les charges d\'assurance habitation. Dans les régions au nord de la Loire, la plus-value est plus limitée.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la construction de piscine. En cas de fuite de votre piscine existante ou de panne du système de filtration, contactez votre pisciniste pour un diagnostic sous 48h à 1 semaine.',
+  certifications: ['Qualification FPP (Fédération des Professionnels de la Piscine)', 'Label Propiscines', 'Certification NF Piscine'],
+  averageResponseTime: 'Étude sous 2 semaines, construction 4 à 12 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'platrier',
+  name: 'Plâtrier',
+  priceRange: { min: 25, max: 55, unit: '€/m²' },
+  commonTasks: [
+    'Pose de cloisons en plaques de plâtre : 30 à 55 €/m²', 'Faux-plafond en plaques de plâtre : 35 à 65 €/m²', 'Doublage isolant (plaque + isolant) : 40 à 80 €/m²',
+    'Enduit plâtre traditionnel : 25 à 45 €/m²', 'Staff et corniche décorative : 30 à 100 €/ml',
+  ],
+  tips: [
+    'Pour les pièces humides (salle de bain, cuisine), exigez des plaques hydrofuges (vertes) et non des plaques standard.',
+    'Un plâtrier-plaquiste expérimenté réalise des joints invisibles. Vérifiez la qualité des finitions sur des chantiers précédents.',
+    'Pour une isolation acoustique efficace entre deux pièces, demandez une cloison double parement (2 plaques de chaque côté) avec laine minérale de 45 mm minimum dans l\'ossature.',
+    'Les plaques de plâtre existent en version coupe-feu (rose, résistance 1 à 2 heures), hydrofuge (verte) et haute dureté (bleue). Choisissez la bonne référence selon l\'usage de la pièce.',
+    'Pour un faux-plafond, demandez un plâtrier qui utilise des suspentes anti-vibratiles : elles réduisent considérablement la transmission des bruits d\'impact venant de l\'étage supérieur.',
+  ],
+  faq: [
+    {
+      q: 'Plaque de plâtre ou enduit traditionnel ?',
+      a: 'Les plaques de plâtre (BA13) sont plus rapides à poser et moins chères (30-55 €/m²). L\'enduit traditionnel offre une meilleure inertie thermique et acoustique mais coûte plus cher en main-d\'œuvre. Pour une rénovation, les plaques sont souvent privilégiées ; pour du neuf haut de gamme, l\'enduit traditionnel.',
+    },
+    {
+      q: 'Quelle épaisseur de cloison pour une bonne isolation phonique ?',
+      a: 'Une cloison standard en BA13 (72 mm total) offre un affaiblissement de 35 à 40 dB. Pour une isolation phonique correcte entre deux chambres, optez pour une cloison de 98 mm (ossature 48 mm + 2 plaques de 13 mm + laine 45 mm) qui atteint 42 à 48 dB. Pour un mur mitoyen ou un studio de musique, une double cloison désolidarisée (160 mm) atteint 55 à 60 dB.',
+    },
+    {
+      q: 'Comment réparer une fissure dans un plafond en plâtre ?',
+      a: 'Pour une fissure superficielle, grattez la fissure en V, appliquez un calicot (bande à fissure) enduit de MAP ou d\'enduit de lissage. Pour une fissure structurelle (qui s\'ouvre progressivement), faites d\'abord diagnostiquer la cause (mouvement de structure, tassement) avant de réparer le plâtre. Une réparation cosmétique sur une fissure active réapparaîtra en quelques mois.',
+    },
+    {
+      q: 'Combien de temps faut-il pour poser un faux-plafond ?',
+      a: 'Un plâtrier expérimenté pose environ 15 à 25 m² de faux-plafond par jour. Pour une maison de 80 m², comptez 4 à 6 jours (ossature + plaques + bandes). Ajoutez 1 à 2 jours pour les finitions (enduit de lissage, ponçage). Les découpes pour spots encastrés et VMC sont incluses dans ce délai.',
+    },
+    {
+      q: 'Quelle est la hauteur minimale pour un faux-plafond ?',
+      a: 'La hauteur sous plafond minimale habitable est de 2,20 m selon le Code de la construction. Un faux-plafond standard consomme 5 à 10 cm de hauteur (suspentes + ossature + plaque). Si vous prévoyez des spots encastrés, comptez 10 à 15 cm. Pour un passage de gaines de VMC ou de climatisation, il faudra 20 à 30 cm.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la plâtrerie. Pour les réparations de cloisons, faux-plafonds ou enduits, prenez rendez-vous pour un devis gratuit sous 48h.',
+  certifications: [
+    'Qualibat (qualification 4111/4112 plâtrerie, cloisons et doublages)', 'Certification Placo Applicateur (partenaire Saint-Gobain)',
+    'RGE (obligatoire si doublage isolant ouvrant droit aux aides)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines',
+}
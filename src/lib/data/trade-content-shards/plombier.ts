@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'plombier',
+  name: 'Plombier',
+  priceRange: { min: 60, max: 90, unit: '€/h' },
+  commonTasks: [
+    'Débouchage de canalisation : 80 à 250 € selon la complexité', 'Remplacement d\'un chauffe-eau : 800 à 2 500 € (fourniture + pose)', 'Réparation de fuite d\'eau : 90 à 300 €',
+    'Installation d\'un WC : 200 à 600 € (hors fourniture)', 'Pose d\'un robinet mitigeur : 80 à 200 € (hors fourniture)',
+    'Remplacement d\'un ballon d\'eau chaude : 600 à 2 000 €',
+  ],
+  tips: [
+    'Vérifiez que le plombier dispose d\'une assurance responsabilité civile professionnelle et d\'une garantie décennale, obligatoires pour les travaux de plomberie.',
+    'Demandez toujours un devis détaillé avant le début des travaux : un professionnel sérieux ne commence jamais sans accord écrit sur le prix.',
+    'Privilégiez un plombier certifié RGE si vous envisagez des travaux liés au chauffage ou à l\'eau chaude, car cela vous ouvre droit aux aides de l\'État (MaPrimeRenov\', CEE).',
+    'En cas d\'urgence, coupez l\'arrivée d\'eau générale avant l\'arrivée du plombier pour limiter les dégâts. Le compteur se trouve souvent dans la cave ou à l\'extérieur.',
+    'Méfiez-vous des plombiers qui refusent de donner un devis par écrit ou qui exigent un paiement intégral avant intervention : ce sont des signaux d\'alerte.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte une intervention de plombier en urgence ?',
+      a: 'Une intervention d\'urgence coûte en moyenne entre 150 et 400 €, avec des majorations possibles la nuit (+50 à 100 %), le week-end (+25 à 50 %) et les jours fériés (+50 à 100 %). Exigez toujours un devis avant que le plombier ne commence les travaux, même en urgence.',
+    },
+    {
+      q: 'Comment savoir si mon plombier est fiable ?',
+      a: 'Vérifiez son numéro SIRET sur le site de l\'INSEE, son inscription au registre des métiers, et demandez une copie de son assurance décennale. Un plombier sérieux fournit ces documents sans difficulté. Consultez également les avis en ligne et demandez des références de chantiers récents.',
+    },
+    {
+      q: 'Quels travaux de plomberie puis-je faire moi-même ?',
+      a: 'Vous pouvez changer un joint de robinet, remplacer un flexible de douche ou déboucher un siphon avec une ventouse. En revanche, toute intervention sur les canalisations encastrées, le chauffe-eau ou l\'arrivée d\'eau principale doit être confiée à un professionnel pour des raisons de sécurité et d\'assurance.',
+    },
+    {
+      q: 'Le plombier doit-il fournir une facture ?',
+      a: 'Oui, c\'est obligatoire pour toute prestation supérieure à 25 €. La facture doit mentionner le détail des travaux, le prix unitaire des pièces, le taux horaire de la main-d\'oeuvre et la TVA appliquée (10 % pour la rénovation, 20 % pour le neuf). Conservez-la précieusement pour la garantie.',
+    },
+    {
+      q: 'Que faire en cas de fuite d\'eau la nuit ?',
+      a: 'Coupez immédiatement l\'arrivée d\'eau au compteur général, généralement situé dans la cave ou à l\'extérieur du logement. Placez des récipients sous la fuite et épongez l\'eau stagnante pour limiter les dégâts. Contactez ensuite un plombier d\'urgence ; les majorations nocturnes et de week-end varient de 50 à 100 % du tarif de base.',
+    },
+    {
+      q: 'Comment déboucher un évier naturellement ?',
+      a: 'Versez un mélange de bicarbonate de soude (6 cuillères à soupe) et de vinaigre blanc (25 cl) dans la canalisation, laissez agir 30 minutes puis rincez à l\'eau bouillante. Si le bouchon persiste, utilisez une ventouse ou un furet manuel. Si ces méthodes échouent, faites appel à un plombier qui pourra utiliser un furet électrique ou un hydrocurage.',
+    },
+    {
+      q: 'Quel est le coût d\'un remplacement de chauffe-eau ?',
+      a: 'Le remplacement d\'un chauffe-eau électrique de 200 litres coûte entre 800 et 1 500 € (fourniture + pose), tandis qu\'un chauffe-eau thermodynamique revient à 2 500 à 4 500 €. Le prix dépend du type (électrique, gaz, thermodynamique, solaire), de la capacité et de l\'accessibilité de l\'installation. Un chauffe-eau thermodynamique permet d\'économiser 40 à 50 % sur la facture d\'eau chaude par rapport à un chauffe-eau électrique classique (source : ADEME).',
+    },
+    {
+      q: 'Quelle est la durée de vie d\'une installation de plomberie ?',
+      a: 'Les canalisations en cuivre durent 50 à 80 ans, celles en PER (polyéthylène réticulé) environ 50 ans, tandis que les tuyaux en plomb (interdits depuis 1995) doivent être remplacés. Un chauffe-eau a une durée de vie de 10 à 15 ans et les robinetteries de 15 à 20 ans. Un entretien régulier (détartrage, vérification des joints) prolonge significativement la durée de vie de l\'installation.',
+    },
+  ],
+  emergencyInfo: 'En cas de fuite d\'eau importante ou de canalisation bouchée, coupez immédiatement l\'arrivée d\'eau au compteur général et contactez un plombier d\'urgence. Certains professionnels proposent des interventions en soirée ou le week-end. Les tarifs d\'urgence sont majorés de 50 à 100 % par rapport à une intervention en journée.',
+  certifications: [
+    'Qualibat (qualification 5111/5112 plomberie sanitaire)', 'RGE (Reconnu Garant de l\'Environnement)', 'PG (Professionnel du Gaz — obligatoire pour les installations gaz)',
+    'Qualigaz (certificat de conformité gaz)', 'QualiPAC (pompes à chaleur)', 'QualiSol (chauffe-eau solaire)',
+  ],
+  averageResponseTime: 'Urgence (fuite, bouchon) : délai variable selon disponibilité ; travaux planifiés sous 1 à 2 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'pompe-a-chaleur',
+  name: 'Pompe à chaleur',
+  priceRange: { min: 8000, max: 18000, unit: '€' },
+  commonTasks: [
+    'PAC air/eau (chauffage + ECS) : 10 000 à 18 000 €', 'PAC air/air (climatisation réversible) : 3 000 à 8 000 €', 'PAC géothermique : 15 000 à 25 000 €',
+    'Entretien annuel obligatoire : 150 à 300 €', 'Remplacement de chaudière fioul par PAC : 12 000 à 20 000 €',
+  ],
+  tips: [
+    'Exigez un installateur certifié QualiPAC — c\'est obligatoire pour bénéficier des aides MaPrimeRénov\' et des CEE.',
+    'Un dimensionnement correct est crucial : une PAC surdimensionnée consomme plus et s\'use prématurément. Exigez une étude thermique (800 à 1 500 €).',
+    'L\'entretien annuel d\'une PAC de plus de 4 kW est obligatoire depuis 2020 (décret n° 2020-912). Souscrivez un contrat de maintenance dès l\'installation pour garantir les performances et la durée de vie.',
+    'Vérifiez le niveau sonore de l\'unité extérieure (exprimé en dB(A) à 1 m) avant l\'achat : les PAC air/eau les plus silencieuses descendent sous 40 dB(A). Un mauvais choix peut créer des conflits de voisinage.',
+    'Coupler une pompe à chaleur avec des panneaux solaires photovoltaïques permet d\'alimenter la PAC avec de l\'électricité gratuite en journée, réduisant la facture de chauffage de 60 à 80 %.',
+  ],
+  faq: [
+    {
+      q: 'Quelles aides pour installer une pompe à chaleur ?',
+      a: 'MaPrimeRénov\' : jusqu\'à 5 000 € (revenus modestes). CEE (prime énergie) : 2 000 à 4 000 €. Éco-PTZ : prêt à taux zéro jusqu\'à 50 000 €. TVA réduite à 5,5 %. Au total, les aides peuvent couvrir 40 à 70 % du coût pour les ménages modestes.',
+    },
+    {
+      q: 'PAC air/eau ou air/air : laquelle choisir ?',
+      a: 'La PAC air/eau chauffe l\'eau du circuit de radiateurs ou du plancher chauffant et peut aussi produire l\'eau chaude sanitaire. Elle est idéale en remplacement d\'une chaudière fioul ou gaz (10 000 à 18 000 €). La PAC air/air (climatisation réversible) souffle de l\'air chaud ou froid via des splits muraux (3 000 à 8 000 €). Elle est plus économique mais ne produit pas d\'eau chaude et n\'ouvre pas droit à MaPrimeRénov\'.',
+    },
+    {
+      q: 'Quelle est la durée de vie d\'une pompe à chaleur ?',
+      a: 'Une PAC air/eau bien entretenue dure 15 à 20 ans. Le compresseur (pièce la plus sollicitée) a une durée de vie de 12 à 15 ans. Un entretien annuel (vérification du fluide frigorigène, nettoyage des filtres, contrôle des performances) est obligatoire et prolonge significativement la durée de vie. Le remplacement du compresseur (1 500 à 3 000 €) peut redonner 10 ans de vie à l\'installation.',
+    },
+    {
+      q: 'Une pompe à chaleur fonctionne-t-elle par grand froid ?',
+      a: 'Les PAC air/eau récentes fonctionnent jusqu\'à -15 °C, voire -25 °C pour les modèles haut de gamme (Daikin Altherma, Atlantic Alfea). Toutefois, le COP (coefficient de performance) diminue avec la température extérieure : de 4 à 5 par temps doux (7 °C), il chute à 2 à 3 par -10 °C. Un appoint électrique intégré prend le relais lors des vagues de froid exceptionnelles.',
+    },
+    {
+      q: 'La pompe à chaleur est-elle bruyante ?',
+      a: 'L\'unité extérieure émet 40 à 55 dB(A) à 1 m de distance (comparable à une conversation). Les modèles récents proposent un mode silencieux nocturne (35 à 45 dB). La réglementation impose un seuil d\'émergence de 5 dB(A) le jour et 3 dB(A) la nuit par rapport au bruit ambiant. Installez l\'unité extérieure à distance des chambres du voisin et sur des plots anti-vibratiles pour limiter les nuisances.',
+    },
+  ],
+  emergencyInfo: 'En cas de panne de chauffage en hiver, un chauffagiste d\'urgence peut intervenir en 2 à 4h pour un diagnostic. Coût : 150 à 350 € (déplacement + diagnostic).',
+  certifications: [
+    'QualiPAC (obligatoire pour les aides MaPrimeRénov\' et CEE)', 'RGE (Reconnu Garant de l\'Environnement)',
+    'Attestation de capacité fluides frigorigènes (obligatoire — catégorie I)', 'Qualibat (qualification 5212/5213 chauffage, génie climatique)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, installation 2 à 4 semaines',
+}
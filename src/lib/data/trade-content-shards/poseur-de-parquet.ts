@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'poseur-de-parquet',
+  name: 'Poseur de parquet',
+  priceRange: { min: 25, max: 80, unit: '€/m²' },
+  commonTasks: [
+    'Pose de parquet flottant : 25 à 40 €/m²', 'Pose de parquet massif collé : 40 à 80 €/m²', 'Pose de parquet massif cloué : 50 à 90 €/m²',
+    'Ponçage et vitrification : 25 à 45 €/m²', 'Pose en point de Hongrie ou Versailles : 80 à 150 €/m²',
+  ],
+  tips: [
+    'Laissez le parquet s\'acclimater 48h minimum dans la pièce avant la pose, pour éviter les déformations.',
+    'Pour un parquet massif dans une pièce humide, optez pour des essences exotiques (teck, ipé) naturellement résistantes à l\'eau.',
+    'Choisissez une finition adaptée à votre usage : la vitrification est la plus résistante pour un couloir ou un séjour très fréquenté, tandis que l\'huile donne un toucher plus naturel et se rénove localement.',
+    'Vérifiez que le support est parfaitement plan avant la pose (tolérance de 3 mm sous une règle de 2 m) — un ragréage peut être nécessaire et doit être prévu dans le devis.',
+    'Demandez au poseur de laisser un joint de dilatation périphérique de 8 à 10 mm le long des murs. Ce joint, caché par les plinthes, est indispensable pour que le bois puisse travailler avec les variations d\'humidité.',
+  ],
+  faq: [
+    {
+      q: 'Parquet massif, contrecollé ou stratifié ?',
+      a: 'Le parquet massif (30-80 €/m² hors pose) se ponce et se rénove plusieurs fois, durant 50 à 100 ans. Le contrecollé (25-60 €/m²) se ponce 1 à 3 fois et dure 30 ans. Le stratifié (10-25 €/m²) ne se ponce pas et dure 10 à 20 ans. Le massif est un investissement, le stratifié un compromis économique.',
+    },
+    {
+      q: 'Peut-on poser du parquet sur un plancher chauffant ?',
+      a: 'Oui, à condition de choisir un parquet compatible. Le parquet contrecollé (épaisseur de parement 2,5 à 4 mm) est le plus adapté car il se déforme peu. Le parquet massif est possible si l\'épaisseur reste sous 15 mm. Évitez les essences sensibles (hêtre, érable) et privilégiez le chêne. La pose collée en plein est obligatoire — la pose flottante est déconseillée sur plancher chauffant.',
+    },
+    {
+      q: 'Combien coûte un ponçage-vitrification de parquet ?',
+      a: 'Le ponçage-vitrification coûte entre 25 et 45 €/m² pour un parquet en bon état (3 passes de ponçage + 2 couches de vitrification). Si le parquet est très abîmé ou taché, un rebouchage des joints et des trous ajoute 5 à 10 €/m². Pour un appartement de 60 m², le budget total est de 1 800 à 3 300 €. Le chantier dure 3 à 5 jours avec un séchage de 24 à 48h après la dernière couche.',
+    },
+    {
+      q: 'Quelle pose choisir : flottante, collée ou clouée ?',
+      a: 'La pose flottante (clipsée sur sous-couche) est la plus rapide et la moins chère (15 à 25 €/m²), idéale pour le stratifié et le contrecollé. La pose collée (25 à 40 €/m²) offre un meilleur confort acoustique et convient au contrecollé et au massif mince. La pose clouée (35 à 50 €/m²) est la méthode traditionnelle pour le parquet massif sur lambourdes, offrant la meilleure longévité.',
+    },
+    {
+      q: 'Comment entretenir un parquet au quotidien ?',
+      a: 'Passez l\'aspirateur régulièrement avec une brosse douce (pas de brosse rotative). Nettoyez à la serpillère bien essorée avec un savon neutre. Évitez l\'eau stagnante et les produits agressifs (javel, ammoniaque). Pour un parquet vitrifié, appliquez un polish de rénovation une fois par an. Pour un parquet huilé, repassez une couche d\'huile d\'entretien tous les 6 à 12 mois sur les zones de passage.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la pose de parquet. La pose, le ponçage et la vitrification nécessitent des conditions de température et d\'humidité contrôlées. Prenez rendez-vous pour un devis gratuit sous 48h.',
+  certifications: [
+    'Qualibat (qualification 6421 parquets et revêtements en bois)', 'Label Parquets de France (origine et qualité de fabrication)',
+    'Compagnons du Devoir (formation d\'excellence)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+}
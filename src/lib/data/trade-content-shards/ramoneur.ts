@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'ramoneur',
+  name: 'Ramoneur',
+  priceRange: { min: 50, max: 120, unit: '€' },
+  commonTasks: [
+    'Ramonage de cheminée (conduit maçonné) : 50 à 90 €', 'Ramonage de poêle à bois/granulés : 60 à 120 €', 'Ramonage de chaudière (conduit fumée) : 70 à 130 €',
+    'Débistrage (enlèvement du bistre) : 150 à 400 €', 'Tubage de conduit : 1 500 à 3 500 €',
+  ],
+  tips: [
+    'Le ramonage est obligatoire 1 à 2 fois par an selon les communes (vérifiez le règlement sanitaire départemental). Le certificat de ramonage est exigé par votre assurance en cas de sinistre.',
+    'Planifiez votre ramonage en septembre/octobre, avant la saison de chauffe — les délais sont plus courts qu\'en plein hiver.',
+    'Après l\'intervention, exigez un certificat de ramonage portant la date, la nature des travaux et le nom du professionnel : c\'est ce document que votre assureur réclamera en cas de sinistre.',
+    'Si votre conduit est ancien (avant 1960) ou fissuré, le ramoneur peut recommander un tubage en inox : c\'est un investissement de 1 500 à 3 500 € qui sécurise l\'installation pour 30 ans.',
+    'Pour un poêle à granulés, le ramonage doit inclure le nettoyage du conduit d\'évacuation ET du conduit de raccordement : les deux sont sources d\'encrassement et de risque.',
+  ],
+  faq: [
+    {
+      q: 'Que risque-t-on sans ramonage ?',
+      a: 'Sans ramonage, vous risquez un feu de cheminée (bistre inflammable), une intoxication au monoxyde de carbone (CO), et un refus d\'indemnisation par votre assurance en cas d\'incendie. L\'amende pour défaut de ramonage peut atteindre 450 € (contravention de 3e classe).',
+    },
+    {
+      q: 'Combien de fois par an faut-il faire ramoner ?',
+      a: 'Le règlement sanitaire départemental impose généralement 2 ramonages par an pour les combustibles solides (bois, granulés) dont 1 pendant la période de chauffe, et 1 ramonage par an pour le gaz et le fioul. Vérifiez les obligations de votre commune car elles varient d\'un département à l\'autre.',
+    },
+    {
+      q: 'Quelle est la différence entre ramonage mécanique et chimique ?',
+      a: 'Le ramonage mécanique (avec hérisson) est le seul reconnu légalement et par les assurances. Le ramonage chimique (bûches de ramonage) est un complément d\'entretien qui ramollit les dépôts de suie, mais ne remplace jamais le passage d\'un professionnel. Les bûches de ramonage ne donnent pas droit à un certificat.',
+    },
+    {
+      q: 'Qu\'est-ce que le bistre et comment le traiter ?',
+      a: 'Le bistre est un dépôt dur et inflammable qui se forme sur les parois du conduit, surtout avec du bois humide ou une combustion lente. Le débistrage nécessite une machine rotative spéciale (débistreuse) et coûte 150 à 400 €. Un ramonage classique ne suffit pas à l\'éliminer. Brûler du bois sec (moins de 20 % d\'humidité) limite sa formation.',
+    },
+    {
+      q: 'Comment choisir un bon ramoneur ?',
+      a: 'Vérifiez qu\'il possède une qualification Qualibat 5141 ou une certification équivalente, une assurance responsabilité civile professionnelle et qu\'il remet systématiquement un certificat de ramonage. Privilégiez un professionnel local recommandé par le bouche-à-oreille. Méfiez-vous des offres à moins de 30 € : un ramonage sérieux prend 20 à 40 minutes.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence en cas de feu de cheminée ou de suspicion d\'intoxication au monoxyde de carbone (CO). Appelez les pompiers (18) en premier. Un ramoneur-fumiste peut intervenir sous 2 à 4 heures pour sécuriser le conduit après l\'intervention des secours. Majorations : +80 à 100 % la nuit et le week-end.',
+  certifications: ['Qualibat (qualification 5141 ramonage et entretien de conduits)', 'Titre Professionnel Ramoneur-fumiste (inscrit au RNCP)', 'Compagnons du Devoir (formation d\'excellence)'],
+  averageResponseTime: 'Intervention sous 1 semaine en basse saison, 2 à 3 semaines en automne',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'renovation-energetique',
+  name: 'Rénovation énergétique',
+  priceRange: { min: 15000, max: 50000, unit: '€' },
+  commonTasks: [
+    'Audit énergétique (DPE + préconisations) : 800 à 1 500 €', 'Rénovation globale (isolation + chauffage + ventilation) : 20 000 à 60 000 €',
+    'Passage de DPE F/G à C/D : 15 000 à 40 000 €', 'Remplacement de chaudière fioul par PAC + isolation : 25 000 à 50 000 €',
+  ],
+  tips: [
+    'Commencez toujours par un audit énergétique pour hiérarchiser les travaux et maximiser les aides.',
+    'Le Parcours accompagné de MaPrimeRénov\' récompense les projets de rénovation globale améliorant le DPE d\'au moins 2 classes. Ce bonus a été intégré dans le Parcours accompagné depuis 2024.',
+    'Faites appel à un Accompagnateur Rénov\' agréé par l\'État : c\'est désormais obligatoire pour les projets de rénovation globale bénéficiant de MaPrimeRénov\'.',
+    'Priorisez les travaux dans cet ordre : isolation (combles, murs, sols), puis ventilation (VMC double flux), puis changement du système de chauffage. Isoler sans ventiler provoque des problèmes d\'humidité.',
+    'Conservez toutes les factures et attestations RGE pendant 10 ans : elles servent de preuve pour les garanties décennales et en cas de contrôle fiscal sur les aides perçues.',
+  ],
+  faq: [
+    {
+      q: 'Quelles sont les aides pour une rénovation énergétique ?',
+      a: 'MaPrimeRénov\' (jusqu\'à 20 000 €), MaPrimeRénov\' Parcours accompagné pour les ménages modestes (jusqu\'à 32 000 € pour les très modestes), CEE (primes énergie), éco-PTZ (jusqu\'à 50 000 € à taux zéro), TVA à 5,5 %, aides locales (régions, départements). Un ménage modeste peut couvrir jusqu\'à 80 % du coût des travaux.',
+    },
+    {
+      q: 'Qu\'est-ce qu\'un audit énergétique et est-il obligatoire ?',
+      a: 'L\'audit énergétique est une analyse complète de votre logement (isolation, chauffage, ventilation) avec un plan de travaux chiffré. Il est obligatoire depuis 2023 pour la vente des logements classés F ou G au DPE. Son coût (800 à 1 500 €) est partiellement pris en charge par MaPrimeRénov\' (jusqu\'à 500 €).',
+    },
+    {
+      q: 'Comment passer d\'un DPE F ou G à un DPE C ou D ?',
+      a: 'Il faut généralement combiner isolation des combles et des murs (gain de 1 à 2 classes), remplacement du chauffage par une pompe à chaleur ou chaudière à condensation (gain de 1 classe), et installation d\'une VMC double flux. Le budget moyen est de 20 000 à 40 000 €, mais les aides peuvent couvrir 50 à 80 % pour les ménages modestes.',
+    },
+    {
+      q: 'Peut-on rénover par étapes ou faut-il tout faire d\'un coup ?',
+      a: 'On peut rénover par étapes, mais la rénovation globale est plus efficace et mieux aidée. Le parcours « par geste » de MaPrimeRénov\' finance chaque poste séparément, tandis que le parcours « accompagné » pour une rénovation globale offre des primes bonifiées. Attention à l\'ordre des travaux : isoler avant de changer le chauffage pour bien dimensionner l\'équipement.',
+    },
+    {
+      q: 'Les logements classés G seront-ils vraiment interdits à la location ?',
+      a: 'Oui, la loi Climat et Résilience interdit progressivement la location des passoires thermiques : les logements G sont interdits à la location depuis janvier 2025, les F le seront en 2028 et les E en 2034. Les propriétaires bailleurs doivent donc engager des travaux de rénovation sous peine de ne plus pouvoir louer.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la rénovation énergétique. Les projets de rénovation globale nécessitent un audit énergétique préalable et une planification sur plusieurs mois. Prenez rendez-vous pour un premier rendez-vous sous 2 semaines.',
+  certifications: [
+    'RGE (Reconnu Garant de l\'Environnement — obligatoire pour toutes les aides)', 'Audit énergétique certifié OPQIBI 1905 ou Qualibat 8731',
+    'Label BBC Rénovation (Bâtiment Basse Consommation)', 'Accompagnateur Rénov\' agréé par l\'État (obligatoire pour MaPrimeRénov\' parcours accompagné)',
+  ],
+  averageResponseTime: 'Audit sous 2 semaines, planification des travaux 1 à 3 mois',
+}
@@ -0,0 +1,50 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'salle-de-bain',
+  name: 'Salle de bain',
+  priceRange: { min: 4000, max: 15000, unit: '€' },
+  commonTasks: [
+    'Rénovation complète salle de bain 5 m² : 5 000 à 12 000 €', 'Remplacement baignoire par douche à l\'italienne : 3 000 à 7 000 €',
+    'Création d\'une salle de bain (dans une chambre) : 8 000 à 20 000 €', 'Pose de carrelage mural et sol : 40 à 80 €/m²',
+    'Installation meuble vasque + robinetterie : 500 à 2 500 €',
+  ],
+  tips: [
+    'Pour une douche à l\'italienne, exigez une étanchéité SPEC (Système de Protection à l\'Eau sous Carrelage) certifiée.',
+    'Prévoyez une VMC performante pour éviter les problèmes d\'humidité et de moisissures.',
+    'Prévoyez un budget de 15 à 20 % en plus pour les imprévus (tuyauterie vétuste à reprendre, support mural dégradé derrière l\'ancien carrelage).',
+    'Pour une salle de bain accessible PMR, les normes imposent une douche de plain-pied d\'au moins 120 × 120 cm, des barres d\'appui et un espace de manœuvre de 150 cm de diamètre.',
+    'Faites appel à un seul coordinateur de travaux (plombier-carreleur ou entreprise tous corps d\'état) plutôt que de gérer 3 ou 4 artisans séparément — cela simplifie la planification et les garanties.',
+  ],
+  faq: [
+    {
+      q: 'Quelles aides pour rénover sa salle de bain ?',
+      a: 'Si vous avez plus de 60 ans ou êtes en situation de handicap, l\'aide MaPrimeAdapt\' peut couvrir jusqu\'à 70 % des travaux d\'adaptation (douche accessible, barres d\'appui). La TVA réduite à 10 % s\'applique pour les logements de plus de 2 ans. Certaines caisses de retraite proposent aussi des aides.',
+    },
+    {
+      q: 'Combien de temps durent les travaux de rénovation d\'une salle de bain ?',
+      a: 'Une rénovation complète de salle de bain (5 à 8 m²) dure en moyenne 2 à 3 semaines : démolition (2-3 jours), plomberie et électricité (2-3 jours), étanchéité et carrelage (4-5 jours), pose des équipements (2-3 jours), finitions (1-2 jours). Pendant les travaux, prévoyez un point d\'eau de substitution (cuisine, salle d\'eau secondaire).',
+    },
+    {
+      q: 'Douche à l\'italienne ou receveur extra-plat ?',
+      a: 'La douche à l\'italienne (encastrée dans le sol) offre un esthétisme supérieur et une accessibilité optimale, mais nécessite un sol épais pour encastrer la bonde et une étanchéité irréprochable (4 000 à 7 000 €). Le receveur extra-plat (2 à 4 cm de hauteur) est plus simple à poser, moins risqué pour l\'étanchéité et plus économique (2 500 à 5 000 €). En rénovation d\'appartement, le receveur extra-plat est souvent le choix le plus pragmatique.',
+    },
+    {
+      q: 'Quel carrelage choisir pour une salle de bain ?',
+      a: 'Privilégiez un carrelage antidérapant classé R10 ou R11 pour le sol de douche (norme DIN 51097 classe B minimum). Le grès cérame est le matériau le plus résistant à l\'humidité et le plus facile à entretenir. Évitez les joints blancs qui jaunissent : optez pour un joint époxy (imperméable et antifongique) de couleur grise ou assortie au carrelage.',
+    },
+    {
+      q: 'Peut-on créer une salle de bain dans une chambre ?',
+      a: 'Oui, c\'est courant lors d\'une rénovation. Les contraintes principales sont : l\'acheminement des arrivées d\'eau et des évacuations (possible avec une pompe de relevage si nécessaire), la ventilation (VMC obligatoire), l\'étanchéité du sol et l\'isolation phonique. Le budget pour créer une salle de bain complète dans une chambre se situe entre 8 000 et 20 000 € selon le niveau de finition.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la rénovation de salle de bain. En cas de fuite d\'eau urgente, contactez un plombier d\'urgence. Pour votre projet de rénovation, prenez rendez-vous pour un devis gratuit sous 1 semaine.',
+  certifications: [
+    'Qualibat (qualification aménagement intérieur, plomberie, carrelage)', 'Handibat (label accessibilité PMR — Chambre de Métiers)',
+    'RGE (si isolation thermique associée — ouvre droit aux aides)',
+  ],
+  averageResponseTime: 'Devis sous 1 semaine, intervention sous 2 à 6 semaines',
+}
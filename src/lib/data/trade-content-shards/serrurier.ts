@@ -0,0 +1,61 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'serrurier',
+  name: 'Serrurier',
+  priceRange: { min: 80, max: 150, unit: '€/intervention' },
+  commonTasks: [
+    'Ouverture de porte claquée (sans effraction) : 80 à 150 €', 'Ouverture de porte blindée : 150 à 400 €', 'Changement de serrure standard : 100 à 300 € (fourniture incluse)',
+    'Pose d\'une serrure multipoints : 300 à 800 €', 'Blindage de porte existante : 800 à 2 000 €', 'Installation d\'une porte blindée complète : 1 500 à 4 500 €',
+  ],
+  tips: [
+    'En cas de porte claquée, ne paniquez pas : un serrurier qualifié peut ouvrir sans dégradation dans la majorité des cas. Ne faites jamais appel à un dépanneur trouvé sur un prospectus dans votre boîte aux lettres.',
+    'Exigez un devis ferme et définitif avant toute intervention, y compris en urgence. La loi oblige le serrurier à vous remettre un devis écrit pour toute prestation dépassant 150 €.',
+    'Méfiez-vous des serruriers qui annoncent des prix très bas par téléphone puis gonflent la facture une fois sur place. Vérifiez les avis en ligne et le numéro SIRET avant d\'appeler.',
+    'Privilégiez les serruriers ayant une adresse physique vérifiable (atelier ou magasin). C\'est un gage de sérieux et de recours possible en cas de problème.',
+    'Après un cambriolage, faites intervenir la police avant le serrurier. Vous aurez besoin du dépôt de plainte pour votre assurance, et il ne faut pas toucher à la scène.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte une ouverture de porte le dimanche ou la nuit ?',
+      a: 'Une ouverture de porte en horaires non ouvrés (nuit, dimanche, jours fériés) coûte entre 150 et 350 € pour une porte standard, et entre 250 et 500 € pour une porte blindée. Les majorations de nuit (entre 20h et 6h) vont de 50 à 100 % du tarif de base. Demandez toujours le prix total avant que le serrurier n\'intervienne.',
+    },
+    {
+      q: 'Quelle serrure choisir pour sécuriser mon logement ?',
+      a: 'Pour une sécurité optimale, optez pour une serrure certifiée A2P (Assurance Prévention Protection). Il existe 3 niveaux : A2P* (résistance de 5 min à l\'effraction), A2P** (10 min) et A2P*** (15 min). Les assureurs exigent souvent un niveau A2P** minimum. Comptez 200 à 600 € pour la serrure et 100 à 200 € pour la pose.',
+    },
+    {
+      q: 'Mon assurance prend-elle en charge les frais de serrurier ?',
+      a: 'Oui, la plupart des contrats d\'assurance habitation couvrent les frais de serrurier en cas de cambriolage, de perte de clés ou de porte claquée, souvent dans le cadre de la garantie assistance. Vérifiez votre contrat et contactez votre assureur avant l\'intervention si possible. Conservez la facture et le devis pour le remboursement.',
+    },
+    {
+      q: 'Comment éviter les arnaques aux serruriers ?',
+      a: 'Vérifiez le SIRET de l\'entreprise, recherchez des avis en ligne et privilégiez le bouche-à-oreille. Refusez toute intervention sans devis préalable écrit. Un serrurier honnête accepte toujours de détailler ses tarifs. En cas de doute, contactez la DGCCRF (Direction Générale de la Concurrence) au 0809 540 550.',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle un changement de serrure après un cambriolage ?',
+      a: 'Oui, la garantie vol de votre assurance habitation prend généralement en charge le remplacement de la serrure et la réparation de la porte après un cambriolage. Vous devez déposer plainte au commissariat, déclarer le sinistre sous 2 jours ouvrés et conserver la facture du serrurier. Le remboursement se fait sur présentation de ces justificatifs, souvent sans franchise.',
+    },
+    {
+      q: 'Combien de temps faut-il pour ouvrir une porte claquée ?',
+      a: 'Un serrurier expérimenté ouvre une porte claquée (non verrouillée à clé) en 5 à 15 minutes sans abîmer la serrure, grâce à des outils spécialisés (crochet, by-pass, radio). Pour une porte verrouillée ou blindée, l\'intervention peut prendre 30 minutes à 1 heure. Si le cylindre doit être percé, le remplacement de la serrure sera nécessaire.',
+    },
+    {
+      q: 'Quelle est la différence entre une serrure 3 points et 5 points ?',
+      a: 'Une serrure 3 points verrouille la porte en trois endroits (haut, milieu, bas) et offre un niveau de sécurité correct pour un appartement. La serrure 5 points ajoute deux points latéraux pour une résistance accrue à l\'effraction, recommandée pour les maisons et les rez-de-chaussée. Les assureurs exigent souvent un minimum de 3 points avec certification A2P pour les logements.',
+    },
+    {
+      q: 'Peut-on changer une serrure de porte d\'entrée en copropriété ?',
+      a: 'Vous pouvez librement changer le cylindre (barillet) de votre porte d\'entrée privative sans autorisation. En revanche, modifier la serrure de la porte d\'entrée de l\'immeuble nécessite l\'accord du syndic de copropriété. Si vous êtes locataire, vous pouvez changer la serrure à vos frais mais devez remettre l\'ancienne en quittant le logement.',
+    },
+  ],
+  emergencyInfo: 'En cas de porte claquée ou de serrure cassée, un serrurier d\'urgence intervient dans les meilleurs délais (délai variable selon disponibilité et localisation). Attention aux majorations : +50 % en soirée (après 19h), +75 à 100 % la nuit (après 22h), le dimanche et les jours fériés. Exigez toujours un devis écrit avant le début de l\'intervention.',
+  certifications: [
+    'Certification A2P (1 à 3 étoiles — résistance à l\'effraction, délivrée par le CNPP)', 'Qualibat (qualification 4421 serrurerie)',
+    'CQP Serrurier-dépanneur (Certificat de Qualification Professionnelle)', 'Certification FMSD (Serrurier dépanneur-installateur, inscrite au RNCP)',
+  ],
+  averageResponseTime: 'Urgence (porte claquée, effraction) : délai variable selon disponibilité et localisation',
+}
@@ -0,0 +1,61 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'solier',
+  name: 'Solier',
+  priceRange: { min: 25, max: 60, unit: '€/m²' },
+  commonTasks: [
+    'Pose de parquet flottant : 20 à 35 €/m² (pose uniquement)', 'Pose de parquet massif collé : 35 à 60 €/m²', 'Pose de sol PVC/vinyle en lames ou dalles : 15 à 30 €/m²',
+    'Pose de moquette : 10 à 25 €/m²', 'Ragréage du sol (mise à niveau) : 15 à 30 €/m²', 'Pose de sol souple linoléum : 20 à 40 €/m²',
+  ],
+  tips: [
+    'Le ragréage (mise à niveau du support) est souvent indispensable avant la pose d\'un revêtement de sol. Un sol mal préparé est la première cause de désordres. Ce poste peut représenter 15 à 30 €/m² supplémentaires.',
+    'Le parquet contrecollé offre le meilleur compromis entre esthétique (couche d\'usure en bois noble) et stabilité (pas de retrait ni gonflement). Il est compatible avec le chauffage au sol.',
+    'Les sols PVC/vinyle nouvelle génération (LVT - Luxury Vinyl Tiles) offrent un rendu très réaliste (imitation bois, pierre) avec une grande résistance à l\'eau et à l\'usure, idéaux pour les salles de bain et cuisines.',
+    'Demandez au solier le classement UPEC du revêtement proposé et vérifiez qu\'il correspond à l\'usage de la pièce : U3 P3 minimum pour une entrée ou un couloir, U2 P2 suffisant pour une chambre.',
+    'Prévoyez 5 à 10 % de matériau supplémentaire pour les coupes et les raccords. Pour les poses en diagonale ou dans les pièces en L, cette marge monte à 15 %.',
+  ],
+  faq: [
+    {
+      q: 'Parquet massif, contrecollé ou stratifié : lequel choisir ?',
+      a: 'Le parquet massif (30-80 €/m²) est le plus noble et durable (ponçable plusieurs fois), mais sensible à l\'humidité. Le contrecollé (25-60 €/m²) offre le meilleur compromis qualité-prix et convient au chauffage au sol. Le stratifié (10-25 €/m²) est le moins cher mais ne peut pas être poncé et a une durée de vie limitée (10-15 ans).',
+    },
+    {
+      q: 'Peut-on poser du parquet sur du carrelage existant ?',
+      a: 'Oui, à condition que le carrelage soit bien adhérent, plan (tolérance de 2 mm sous la règle de 2 m) et propre. Le solier posera une sous-couche d\'isolation phonique et thermique. Attention : l\'ajout d\'épaisseur (8 à 15 mm) peut nécessiter de raboter les portes et d\'adapter les seuils.',
+    },
+    {
+      q: 'Quel sol choisir pour une salle de bain ?',
+      a: 'Les meilleurs choix sont le sol PVC/vinyle (étanche, antidérapant, 15-30 €/m²), le parquet teck ou bambou (naturellement résistant à l\'eau, 40-70 €/m²) ou le sol souple linoléum (écologique, antibactérien, 20-40 €/m²). Évitez le stratifié classique qui gonfle au contact de l\'eau. Le carrelage reste la solution la plus durable.',
+    },
+    {
+      q: 'Qu\'est-ce que le ragréage et quand est-il nécessaire ?',
+      a: 'Le ragréage est une chape fine (3 à 10 mm) coulée sur le sol existant pour le lisser et le mettre à niveau avant la pose d\'un revêtement. Il est nécessaire quand le sol présente des irrégularités supérieures à 2 mm sous la règle de 2 m. Le coût est de 15 à 30 €/m². Le solier utilise un ragréage autolissant qui se met à niveau seul et sèche en 4 à 24 heures.',
+    },
+    {
+      q: 'Le parquet est-il compatible avec le chauffage au sol ?',
+      a: 'Oui, mais uniquement certains types : le parquet contrecollé (épaisseur totale de 12 à 15 mm) et le stratifié sont compatibles, en pose flottante. Le parquet massif est déconseillé car il se dilate trop. La résistance thermique totale (parquet + sous-couche) ne doit pas dépasser 0,15 m².K/W. Un solier expérimenté saura vous orienter vers le bon produit et la bonne épaisseur.',
+    },
+    {
+      q: 'Combien coûte la pose de parquet dans un appartement ?',
+      a: 'Pour un appartement de 60 m², la pose de parquet flottant coûte entre 1 200 et 2 100 € (pose seule, 20 à 35 €/m²), le parquet contrecollé collé entre 2 100 et 3 600 € (35 à 60 €/m²), et le parquet massif entre 3 000 et 4 800 € (50 à 80 €/m²). Ajoutez le ragréage si nécessaire (15 à 30 €/m²) et la sous-couche isolante (3 à 8 €/m²).',
+    },
+    {
+      q: 'Pose collée ou pose flottante : quelle différence ?',
+      a: 'La pose flottante (les lames s\'emboîtent sans fixation au sol) est plus rapide, moins chère (20 à 35 €/m²) et permet de démonter le parquet. La pose collée (les lames sont collées directement au sol) offre un meilleur confort acoustique, une meilleure stabilité et est obligatoire pour le parquet massif et le chauffage au sol. Elle coûte 35 à 60 €/m² et nécessite un sol parfaitement préparé.',
+    },
+    {
+      q: 'Quelle sous-couche choisir sous un parquet flottant ?',
+      a: 'La sous-couche en mousse polyéthylène (2 à 4 €/m²) est l\'option économique de base. La sous-couche en liège (5 à 10 €/m²) offre la meilleure isolation phonique et thermique. La sous-couche en fibre de bois (4 à 8 €/m²) est le choix écologique. Pour un sol sur vide sanitaire ou en rez-de-chaussée, ajoutez un pare-vapeur pour protéger le parquet de l\'humidité.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour la pose de revêtements de sol. Prenez rendez-vous pour un devis gratuit sous 48h et une intervention planifiée sous 1 à 3 semaines.',
+  certifications: [
+    'Qualibat (qualification 6411 revêtements de sol souples)', 'Qualibat (qualification 6421 parquets et revêtements en bois)',
+    'Titre Professionnel Solier Moquettiste (inscrit au RNCP)', 'Compagnons du Devoir (formation d\'excellence)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+}
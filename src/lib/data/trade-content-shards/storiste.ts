@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'storiste',
+  name: 'Storiste',
+  priceRange: { min: 200, max: 800, unit: '€/unité' },
+  commonTasks: [
+    'Store banne motorisé : 800 à 3 000 €', 'Volet roulant électrique : 300 à 800 €/fenêtre', 'Store intérieur (vénitien, enrouleur) : 100 à 400 €',
+    'Pergola bioclimatique : 5 000 à 15 000 €', 'Motorisation de volets existants : 200 à 500 €/volet',
+  ],
+  tips: [
+    'Pour les stores extérieurs, privilégiez une toile acrylique teinte masse (garantie 5 à 10 ans) plutôt qu\'une toile polyester qui se décolore rapidement.',
+    'La motorisation Somfy est la référence en France — elle permet l\'intégration domotique et les capteurs vent/soleil.',
+    'Mesurez précisément l\'encombrement disponible (coffre de volet, profondeur du linteau) avant de commander un store ou un volet : un mauvais dimensionnement oblige à tout refaire.',
+    'Pour un store banne, investissez dans un capteur vent automatique : il rétracte le store en cas de rafales et évite les dégâts qui ne sont généralement pas couverts par la garantie.',
+    'Si vos volets roulants grincent ou peinent à monter, un simple graissage des coulisses et un dépoussiérage du tablier suffisent souvent. L\'entretien annuel prolonge leur durée de vie de plusieurs années.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte la motorisation de tous les volets d\'une maison ?',
+      a: 'Pour une maison de 8 à 10 volets, comptez 2 500 à 5 000 € pour la motorisation complète (moteurs + commandes radio + installation). Une commande centralisée ajoute 300 à 800 €. La motorisation solaire est possible si le câblage électrique est difficile (+30 % de surcoût).',
+    },
+    {
+      q: 'Store banne manuel ou motorisé ?',
+      a: 'Un store banne manuel (manivelle) coûte 500 à 1 500 € et convient aux petites largeurs (jusqu\'à 3 m). Un store motorisé (800 à 3 000 €) est recommandé au-delà de 3 m de largeur, car la manœuvre manuelle devient pénible. La motorisation permet aussi l\'ajout de capteurs automatiques (vent, soleil, pluie) qui protègent le store en votre absence.',
+    },
+    {
+      q: 'Quelle est la durée de vie d\'un store banne ?',
+      a: 'Un store banne de qualité dure 10 à 15 ans avec un entretien correct. La toile acrylique teinte masse (la plus résistante) conserve ses couleurs 10 à 12 ans. L\'armature en aluminium dure 20 ans+. Pour prolonger la durée de vie : rétractez le store en cas de vent fort, laissez sécher la toile avant de la replier et nettoyez-la une fois par an au savon de Marseille.',
+    },
+    {
+      q: 'Quelles aides pour le remplacement de volets roulants ?',
+      a: 'Le remplacement de volets roulants anciens par des modèles isolants ouvre droit à la TVA réduite à 10 % pour les logements de plus de 2 ans. Si les volets intègrent une isolation thermique renforcée (coefficient Uc ≤ 1,4), vous pouvez bénéficier de MaPrimeRénov\' et des CEE (prime énergie) à condition de passer par un installateur RGE.',
+    },
+    {
+      q: 'Pergola bioclimatique ou store banne : que choisir ?',
+      a: 'Le store banne (800 à 3 000 €) est idéal pour un ombrage ponctuel et se rétracte entièrement. La pergola bioclimatique (5 000 à 15 000 €) offre une protection permanente avec des lames orientables qui régulent la luminosité et la ventilation. La pergola ajoute de la valeur au bien immobilier et crée un véritable espace de vie extérieur utilisable même par temps de pluie légère.',
+    },
+  ],
+  emergencyInfo: 'Intervention d\'urgence pour volet roulant bloqué empêchant la fermeture ou l\'ouverture d\'une fenêtre, ou store banne cassé menaçant de tomber. Un storiste peut intervenir pour une réparation ou un déblocage selon disponibilité. Majorations : +60 à 100 % en dehors des heures ouvrées.',
+  certifications: [
+    'Qualibat (qualification 3511/3512 stores et fermetures)', 'RGE (obligatoire pour volets isolants ouvrant droit aux aides)',
+    'Expert Somfy (partenaire installateur certifié par le fabricant)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines',
+}
@@ -0,0 +1,49 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'terrassier',
+  name: 'Terrassier',
+  priceRange: { min: 30, max: 60, unit: '€/m³' },
+  commonTasks: [
+    'Terrassement pour fondations : 30 à 60 €/m³', 'Décaissement de terrain : 5 à 15 €/m²', 'Viabilisation de parcelle (VRD) : 5 000 à 15 000 €',
+    'Assainissement individuel (fosse septique) : 4 000 à 12 000 €', 'Création de tranchées pour réseaux : 15 à 40 €/ml',
+  ],
+  tips: [
+    'Avant tout terrassement, faites réaliser une étude de sol (G2) pour connaître la nature du terrain et adapter les travaux.',
+    'Vérifiez que le terrassier dispose d\'une assurance décennale et d\'une RC professionnelle.',
+    'Demandez les autorisations de voirie si les engins doivent circuler sur la voie publique.',
+    'Faites réaliser un DICT (Déclaration d\'Intention de Commencement de Travaux) avant de creuser pour localiser les réseaux souterrains (gaz, électricité, eau, télécom).',
+    'Prévoyez une zone de stockage suffisante pour les déblais : un terrassement de 100 m² génère 50 à 150 m³ de terre à évacuer ou à réutiliser en remblai.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte un terrassement de maison ?',
+      a: 'Le terrassement pour une maison individuelle de 100 m² au sol coûte entre 3 000 et 10 000 € selon la nature du terrain, la profondeur des fondations et l\'accessibilité du chantier.',
+    },
+    {
+      q: 'Faut-il un permis pour terrassement ?',
+      a: 'Pas de permis spécifique, mais une déclaration préalable de travaux est nécessaire si le terrassement modifie le relief naturel du terrain de plus de 2 m de hauteur et 100 m² de surface.',
+    },
+    {
+      q: 'Quelle est la meilleure période pour réaliser un terrassement ?',
+      a: 'Le printemps et l\'été sont les saisons idéales, car le sol est sec et stable. Évitez les périodes de gel (le sol gelé est très dur à creuser) et les fortes pluies (risque d\'effondrement et de boue). Un terrassier expérimenté adapte ses techniques selon la saison.',
+    },
+    {
+      q: 'Qu\'est-ce qu\'une étude de sol et est-elle obligatoire ?',
+      a: 'L\'étude de sol (ou étude géotechnique G2) analyse la nature du terrain (argile, roche, sable) pour dimensionner les fondations. Elle est obligatoire depuis 2020 pour la vente de terrains constructibles en zone argileuse (loi ELAN). Son coût est de 1 500 à 3 000 € et elle évite des surcoûts majeurs en cas de terrain instable.',
+    },
+    {
+      q: 'Combien de temps dure un terrassement pour une maison ?',
+      a: 'Le terrassement d\'une maison individuelle dure en moyenne 2 à 5 jours ouvrés selon la surface, la profondeur des fondations et la nature du sol. Un terrain rocheux nécessitera un brise-roche hydraulique et peut doubler la durée du chantier. L\'évacuation des terres représente souvent 30 à 40 % du temps total.',
+    },
+  ],
+  emergencyInfo: 'Pas de service d\'urgence pour le terrassement. Les travaux de terrassement nécessitent une préparation rigoureuse (étude de sol, DICT). Prenez rendez-vous pour un devis gratuit sous 48h.',
+  certifications: [
+    'Qualibat (qualification 1111/1112 terrassement)', 'CACES (Certificat d\'Aptitude à la Conduite En Sécurité — catégories A à F)',
+    'AIPR (Autorisation d\'Intervention à Proximité des Réseaux — obligatoire)',
+  ],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 3 semaines',
+}
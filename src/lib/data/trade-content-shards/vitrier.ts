@@ -0,0 +1,62 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'vitrier',
+  name: 'Vitrier',
+  priceRange: { min: 50, max: 100, unit: '€/intervention' },
+  commonTasks: [
+    'Remplacement d\'un simple vitrage : 60 à 150 €/m² (fourniture + pose)', 'Pose de double vitrage : 150 à 350 €/m²', 'Remplacement d\'une vitre cassée (standard) : 80 à 200 €',
+    'Survitrage d\'une fenêtre existante : 80 à 150 €/m²', 'Pose d\'une crédence en verre (cuisine) : 200 à 500 €/m²',
+    'Installation d\'une paroi de douche en verre : 400 à 1 200 €',
+  ],
+  tips: [
+    'En cas de vitre cassée, sécurisez la zone avec du carton ou du ruban adhésif en attendant le vitrier. Ne tentez pas de retirer les morceaux de verre à mains nues.',
+    'Privilégiez le double vitrage 4/16/4 pour un bon rapport qualité-prix en isolation thermique. Le triple vitrage n\'est justifié que dans les régions très froides.',
+    'Demandez au vitrier de vous fournir le coefficient d\'isolation (Ug) du vitrage proposé. Plus ce chiffre est bas, meilleure est l\'isolation : Ug < 1,1 W/m².K pour du bon double vitrage.',
+    'Pour une crédence ou une paroi de douche, exigez du verre sécurit (trempé) conforme à la norme EN 12150 : en cas de casse, il se fragmente en petits morceaux non coupants.',
+    'Un vitrier d\'urgence peut intervenir pour sécuriser une vitrine commerciale ou une baie vitrée cassée. Vérifiez que le professionnel propose un service de mise en sécurité provisoire.',
+  ],
+  faq: [
+    {
+      q: 'Combien coûte le remplacement d\'une vitre cassée ?',
+      a: 'Le remplacement d\'une vitre simple coûte entre 80 et 200 € pour une fenêtre standard (environ 1 m²). Pour du double vitrage, comptez 150 à 350 €/m² fourniture et pose comprises. Les tarifs augmentent pour les grandes dimensions, les formes spéciales et les interventions en urgence (+50 à 100 %).',
+    },
+    {
+      q: 'Mon assurance couvre-t-elle le remplacement d\'une vitre ?',
+      a: 'Oui, si la casse est due à un événement couvert par votre contrat (tempête, vandalisme, cambriolage). La garantie bris de glace, souvent en option, couvre les vitres, miroirs et plaques vitrocéramiques. Déclarez le sinistre sous 5 jours ouvrés et conservez les morceaux de verre si possible.',
+    },
+    {
+      q: 'Double ou triple vitrage : lequel choisir ?',
+      a: 'Le double vitrage 4/16/4 avec gaz argon (Ug ≈ 1,1 W/m².K) suffit dans la majorité des cas en France métropolitaine. Le triple vitrage (Ug ≈ 0,6 W/m².K) est recommandé uniquement pour les façades nord en climat continental ou montagnard. Il est plus lourd et plus cher (+40 à 60 %) pour un gain d\'isolation modeste en climat tempéré.',
+    },
+    {
+      q: 'Peut-on remplacer un simple vitrage par du double vitrage sans changer la fenêtre ?',
+      a: 'Oui, grâce au survitrage ou au remplacement du vitrage seul (si le châssis est en bon état et assez profond pour accueillir un double vitrage). Le survitrage consiste à fixer un second vitrage sur la fenêtre existante (80 à 150 €/m²). Le remplacement du vitrage dans le châssis existant coûte 150 à 300 €/m². Ces solutions sont moins performantes qu\'un remplacement complet mais beaucoup moins chères.',
+    },
+    {
+      q: 'Combien de temps faut-il pour remplacer une vitre cassée ?',
+      a: 'Le remplacement d\'une vitre standard prend 30 minutes à 1 heure sur place. Cependant, si le vitrage est sur mesure (grande dimension, forme spéciale, double vitrage à commander), le vitrier posera d\'abord un panneau provisoire et reviendra sous 24 à 72 heures avec le vitrage définitif. Pour les urgences, la mise en sécurité provisoire est réalisée en moins d\'une heure.',
+    },
+    {
+      q: 'Qu\'est-ce que le verre sécurit (trempé) et quand est-il obligatoire ?',
+      a: 'Le verre trempé est chauffé à 700 °C puis refroidi brusquement, ce qui le rend 5 fois plus résistant qu\'un verre ordinaire. En cas de casse, il se fragmente en petits morceaux non coupants. Il est obligatoire pour les portes vitrées, les parois de douche, les garde-corps en verre et les baies vitrées dont le bord inférieur est à moins de 90 cm du sol (norme NF DTU 39).',
+    },
+    {
+      q: 'Comment améliorer l\'isolation de mes vitrages sans tout changer ?',
+      a: 'Plusieurs solutions existent : le film isolant thermique à coller sur le vitrage (10 à 30 €/m², gain de 30 % sur les déperditions), le survitrage (80 à 150 €/m²), ou le remplacement des joints d\'étanchéité des fenêtres (5 à 15 €/ml). Un vitrier peut aussi remplacer le vitrage seul sans changer le châssis, si celui-ci est en bon état.',
+    },
+    {
+      q: 'Quel type de verre choisir pour une crédence de cuisine ?',
+      a: 'La crédence en verre doit être en verre trempé sécurit (obligatoire derrière une plaque de cuisson) de 6 mm d\'épaisseur minimum. Elle peut être laquée dans la couleur de votre choix, imprimée avec un motif ou en verre dépoli. Comptez 200 à 500 €/m² pose comprise. L\'avantage principal est l\'absence de joints : le nettoyage est simple et l\'hygiène optimale.',
+    },
+  ],
+  emergencyInfo: 'En cas de vitre cassée (effraction, tempête, accident), un vitrier d\'urgence peut intervenir pour sécuriser l\'ouverture avec un panneau provisoire, selon disponibilité. Le remplacement définitif se fait généralement sous 24 à 48h. Majorations : +50 à 100 % la nuit et le week-end.',
+  certifications: [
+    'Qualibat (qualification 4311/4312 vitrerie-miroiterie)', 'Certification Cekal (qualité des vitrages isolants, feuilletés et trempés)',
+    'RGE (pour remplacement de vitrages isolants ouvrant droit aux aides)',
+  ],
+  averageResponseTime: 'Urgence (bris de vitre) : délai variable selon disponibilité ; remplacement définitif sous 24 à 48h',
+}
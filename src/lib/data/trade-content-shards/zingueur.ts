@@ -0,0 +1,46 @@
+// Generated by `python3 -m scripts.pipeline content` from src/lib/data/trade-content.ts.
+// Do not edit by hand: re-run the command instead.
+
+import type { TradeContent } from '../trade-content'
+
+export const entry: TradeContent = {
+  slug: 'zingueur',
+  name: 'Zingueur',
+  priceRange: { min: 40, max: 80, unit: '€/ml' },
+  commonTasks: [
+    'Pose de gouttières en zinc : 40 à 80 €/ml', 'Remplacement de chéneaux : 60 à 120 €/ml', 'Pose de descentes d\'eau : 30 à 60 €/ml',
+    'Habillage de rives et bandeaux : 50 à 100 €/ml', 'Réparation de noues et faîtages : 80 à 200 €/ml',
+  ],
+  tips: [
+    'Le zinc a une durée de vie de 50 à 100 ans selon la qualité et l\'exposition. Préférez le zinc prépatiné pour une meilleure résistance à la corrosion.',
+    'Faites vérifier l\'état de vos gouttières et descentes après chaque automne pour éviter les engorgements.',
+    'Choisissez un zingueur qui travaille le zinc en continu (sans soudure) pour les longues longueurs de gouttière : c\'est plus étanche et plus durable.',
+    'Faites poser des crépines (grilles) à l\'entrée des descentes pour empêcher les feuilles mortes de boucher les évacuations.',
+    'En bord de mer, le zinc standard se corrode rapidement. Optez pour du zinc-cuivre-titane (VMZINC) ou de l\'aluminium laqué, plus résistant aux embruns salins.',
+  ],
+  faq: [
+    {
+      q: 'Quel est le prix de remplacement de gouttières ?',
+      a: 'Comptez 40 à 80 €/ml pour des gouttières en zinc, pose comprise. Pour une maison de 40 ml de gouttières, le budget total se situe entre 2 000 et 4 000 €. Le PVC est moins cher (20 à 40 €/ml) mais dure 2 à 3 fois moins longtemps.',
+    },
+    {
+      q: 'Gouttière zinc, PVC ou aluminium : laquelle choisir ?',
+      a: 'Le zinc est le matériau le plus durable (50 à 100 ans) avec un bel aspect patiné, mais il est le plus cher. L\'aluminium laqué offre un bon compromis (30 à 50 ans, large choix de couleurs, 35 à 70 €/ml). Le PVC est économique (20 à 40 €/ml) mais se déforme sous l\'effet du soleil et ne dure que 15 à 25 ans.',
+    },
+    {
+      q: 'À quelle fréquence faut-il nettoyer ses gouttières ?',
+      a: 'Un nettoyage complet est recommandé 2 fois par an : à la fin de l\'automne (après la chute des feuilles) et au printemps. Si votre maison est entourée d\'arbres, ajoutez un nettoyage en été. Des gouttières bouchées provoquent des débordements qui endommagent les façades et les fondations.',
+    },
+    {
+      q: 'Quels sont les signes d\'une gouttière en mauvais état ?',
+      a: 'Les signes d\'alerte sont : débordements lors des pluies, traces de rouille ou verdissement, gouttière qui se désolidarise de la façade, fissures visibles, eau qui coule le long du mur au lieu de descendre par les tuyaux. Une gouttière percée non réparée peut provoquer des infiltrations dans les murs et la toiture.',
+    },
+    {
+      q: 'Peut-on poser des gouttières soi-même ?',
+      a: 'La pose de gouttières PVC avec collage est accessible aux bricoleurs confirmés. En revanche, la zinguerie (zinc soudé) requiert un savoir-faire professionnel : soudure à l\'étain, façonnage sur mesure et respect des pentes d\'écoulement (5 mm/ml minimum). Un défaut de pose entraîne des infiltrations et engage votre responsabilité en cas de sinistre.',
+    },
+  ],
+  emergencyInfo: 'En cas de débordement de gouttière, descente d\'eau arrachée ou fuite au niveau des raccords de toiture, contactez un zingueur d\'urgence pour une réparation provisoire. Disponibilité et délais variables. Majorations : +60 à 100 % la nuit et le week-end.',
+  certifications: ['Qualibat (qualification 3121/3122 couverture-zinguerie)', 'Compagnons du Devoir (formation d\'excellence)', 'Certification VMZINC Installateur (partenaire fabricant)'],
+  averageResponseTime: 'Devis sous 48h, intervention sous 1 à 2 semaines',
+}
@@ -2,6 +2,9 @@
  * Contenu SEO riche pour chaque corps de métier.
  * Utilisé sur les pages hub de services pour ajouter du contenu contextuel
  * (guide de prix, FAQ, conseils pratiques).
+ *
+ * Après modification, lancer `python3 -m scripts.pipeline content` pour
+ * régénérer trade-content-index.ts et les shards de trade-content-shards/.
  */
 
 export interface TradeContent {
@@ -0,0 +1,80 @@
+import { describe, it, expect } from 'vitest'
+import communeData from '@/lib/data/insee-communes.json'
+import {
+  resolveProviderCity,
+  getInseeCodesForCity,
+  getCityValues,
+  buildCityFilter,
+  getCommuneNames,
+} from './insee-resolver'
+
+const communes = communeData as Record<string, { n: string; r: string; d: string }>
+
+describe('resolveProviderCity', () => {
+  it('should match insee-communes.json for every code', () => {
+    for (const [code, entry] of Object.entries(communes)) {
+      expect(resolveProviderCity({ address_city: code })).toEqual({ address_city: entry.n, address_region: entry.r })
+    }
+  })
+
+  it('should resolve arrondissement codes to the parent commune', () => {
+    expect(resolveProviderCity({ address_city: '75112' }).address_city).toBe('Paris')
+    expect(resolveProviderCity({ address_city: '13216' }).address_city).toBe('Marseille')
+    expect(resolveProviderCity({ address_city: '69381' })).toEqual({ address_city: 'Lyon', address_region: 'Auvergne-Rhône-Alpes' })
+  })
+
+  it('should keep an existing region', () => {
+    expect(resolveProviderCity({ address_city: '2A004', address_region: 'Corse-du-Sud' })).toEqual({
+      address_city: 'Ajaccio',
+      address_region: 'Corse-du-Sud',
+    })
+  })
+
+  it('should return the same object when nothing changes', () => {
+    const named = { address_city: 'Lyon' }
+    const unknown = { address_city: '00000' }
+    expect(resolveProviderCity(named)).toBe(named)
+    expect(resolveProviderCity(unknown)).toBe(unknown)
+  })
+})
+
+describe('getInseeCodesForCity', () => {
+  it('should ignore case and accents', () => {
+    expect(getInseeCodesForCity('saint-etienne')).toEqual(getInseeCodesForCity('Saint-Étienne'))
+    expect(getInseeCodesForCity('Saint-Étienne')).toContain('42218')
+  })
+
+  it('should return every commune sharing a name', () => {
+    const codes = getInseeCodesForCity('Saint-Denis')
+    expect(codes).toContain('93066')
+    expect(codes).toContain('97411')
+  })
+
+  it('should return an empty array for unknown names', () => {
+    expect(getInseeCodesForCity('Ville Inexistante')).toEqual([])
+  })
+})
+
+describe('getCityValues', () => {
+  it('should include arrondissement codes for Paris, Marseille and Lyon', () => {
+    const paris = getCityValues('Paris')
+    expect(paris[0]).toBe('Paris')
+    expect(paris).toContain('75056')
+    expect(paris).toContain('75101')
+    expect(paris).toContain('75120')
+    expect(getCityValues('Marseille')).toHaveLength(1 + 1 + 16)
+    expect(getCityValues('Lyon')).toHaveLength(1 + 1 + 9)
+  })
+
+  it('should build an in() filter', () => {
+    expect(buildCityFilter('Lyon')).toBe(`address_city.in.(${getCityValues('Lyon').join(',')})`)
+  })
+})
+
+describe('getCommuneNames', () => {
+  it('should list one name per code', () => {
+    const names = getCommuneNames()
+    expect(names.length).toBe(Object.keys(communes).length + 20 + 16 + 9)
+    expect(new Set(names)).toEqual(new Set(Object.values(communes).map(c => c.n)))
+  })
+})
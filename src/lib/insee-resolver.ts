@@ -8,30 +8,52 @@
  * 2. getInseeCodesForCity() — get INSEE codes matching a city name (for queries)
  */
 
-import communeData from '@/lib/data/insee-communes.json'
+import table from '@/lib/data/insee-communes.compact.json'
 
 type CommuneEntry = { n: string; r: string; d: string }
-const communes = communeData as Record<string, CommuneEntry>
-
-// Paris, Marseille, Lyon have arrondissement codes not in the main communes JSON.
-// Map them to the parent commune so resolveProviderCity works for all 743K+ providers.
-const ARRONDISSEMENT_MAP: Record<string, CommuneEntry> = {}
-// Paris: 75101–75120 → Paris (75056)
-for (let i = 75101; i <= 75120; i++) {
-  ARRONDISSEMENT_MAP[String(i)] = { n: 'Paris', r: 'Île-de-France', d: '75' }
-}
-// Marseille: 13201–13216 → Marseille (13055)
-for (let i = 13201; i <= 13216; i++) {
-  ARRONDISSEMENT_MAP[String(i)] = { n: 'Marseille', r: "Provence-Alpes-Côte d'Azur", d: '13' }
+
+// Compact form of insee-communes.json, generated by `python3 -m scripts.pipeline communes`:
+// sorted fixed-width codes, a name table, department/region enums and the
+// code positions ordered by normalized name. Paris, Marseille and Lyon
+// arrondissement codes (75101–75120, 13201–13216, 69381–69389) are included
+// under the name of their parent commune.
+type CompactCommunes = {
+  regions: string[]
+  departements: [string, number][]
+  names: string[]
+  codes: string
+  communes: number[]
+  byName: number[]
 }
-// Lyon: 69381–69389 → Lyon (69123)
-for (let i = 69381; i <= 69389; i++) {
-  ARRONDISSEMENT_MAP[String(i)] = { n: 'Lyon', r: 'Auvergne-Rhône-Alpes', d: '69' }
+const compact = table as CompactCommunes
+
+const CODE_LEN = 5
+const DEPT_BITS = 7
+const DEPT_MASK = (1 << DEPT_BITS) - 1
+const COMMUNE_COUNT = compact.codes.length / CODE_LEN
+
+const codeAt = (i: number) => compact.codes.slice(i * CODE_LEN, (i + 1) * CODE_LEN)
+const nameAt = (i: number) => compact.names[compact.communes[i] >> DEPT_BITS]
+
+function findCode(code: string): number {
+  if (code.length !== CODE_LEN) return -1
+  let lo = 0
+  let hi = COMMUNE_COUNT - 1
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1
+    const c = codeAt(mid)
+    if (c === code) return mid
+    if (c < code) lo = mid + 1
+    else hi = mid - 1
+  }
+  return -1
 }
 
-// Merged lookup: communes JSON + arrondissement overrides
 function getCommune(code: string): CommuneEntry | undefined {
-  return communes[code] || ARRONDISSEMENT_MAP[code]
+  const i = findCode(code)
+  if (i < 0) return undefined
+  const [d, regionId] = compact.departements[compact.communes[i] & DEPT_MASK]
+  return { n: nameAt(i), r: compact.regions[regionId], d }
 }
 
 const INSEE_CODE_RE = /^\d{4,5}$/
@@ -78,23 +100,16 @@ export function resolveProviderCities<T extends { address_city?: string | null;
 const _normalize = (t: string) =>
   t.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim()
 
-// Build reverse map lazily (only on first use)
-let _reverseMap: Map<string, string[]> | null = null
-
-function getReverseMap(): Map<string, string[]> {
-  if (_reverseMap) return _reverseMap
-
-  _reverseMap = new Map()
-  for (const [code, info] of Object.entries(communes)) {
-    const key = _normalize(info.n)
-    const existing = _reverseMap.get(key)
-    if (existing) {
-      existing.push(code)
-    } else {
-      _reverseMap.set(key, [code])
-    }
+// Reverse lookup: binary search over the code positions ordered by normalized name
+function lowerBound(key: string): number {
+  let lo = 0
+  let hi = compact.byName.length
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1
+    if (_normalize(nameAt(compact.byName[mid])) < key) lo = mid + 1
+    else hi = mid
   }
-  return _reverseMap
+  return lo
 }
 
 /**
@@ -102,29 +117,33 @@ function getReverseMap(): Map<string, string[]> {
  * Returns empty array if no match.
  */
 export function getInseeCodesForCity(cityName: string): string[] {
-  return getReverseMap().get(_normalize(cityName)) || []
+  const key = _normalize(cityName)
+  const codes: string[] = []
+  for (let j = lowerBound(key); j < compact.byName.length; j++) {
+    const i = compact.byName[j]
+    if (_normalize(nameAt(i)) !== key) break
+    codes.push(codeAt(i))
+  }
+  return codes
 }
 
 /**
  * Get all possible address_city values for a given city name.
- * Returns the city name itself plus all matching INSEE codes.
+ * Returns the city name itself plus all matching INSEE codes
+ * (arrondissement codes included for Paris, Marseille and Lyon).
  * Use with `.in('address_city', getCityValues(...))` for index-friendly queries.
  */
 export function getCityValues(cityName: string): string[] {
-  const codes = getInseeCodesForCity(cityName)
-  const normalized = _normalize(cityName)
-
-  // Include arrondissement codes for Paris, Marseille, Lyon
-  const arrondissementCodes: string[] = []
-  if (normalized === 'paris') {
-    for (let i = 75101; i <= 75120; i++) arrondissementCodes.push(String(i))
-  } else if (normalized === 'marseille') {
-    for (let i = 13201; i <= 13216; i++) arrondissementCodes.push(String(i))
-  } else if (normalized === 'lyon') {
-    for (let i = 69381; i <= 69389; i++) arrondissementCodes.push(String(i))
-  }
+  return [cityName, ...getInseeCodesForCity(cityName)]
+}
 
-  return [cityName, ...codes, ...arrondissementCodes]
+/**
+ * Every commune name, in code order (for sitemaps and bulk slug generation).
+ */
+export function getCommuneNames(): string[] {
+  const names: string[] = []
+  for (let i = 0; i < COMMUNE_COUNT; i++) names.push(nameAt(i))
+  return names
 }
 
 /**
@@ -0,0 +1,95 @@
+import { describe, it, expect, vi } from 'vitest'
+import {
+  syncOfflineArticles,
+  getOfflineIndex,
+  getOfflineArticle,
+  type OfflineManifest,
+  type OfflineStore,
+} from './offline-articles'
+
+function memoryStore(): OfflineStore & { data: Map<string, string> } {
+  const data = new Map<string, string>()
+  return {
+    data,
+    async get(key) { return data.has(key) ? data.get(key)! : null },
+    async set(key, value) { data.set(key, value) },
+    async remove(key) { data.delete(key) },
+  }
+}
+
+const index = JSON.stringify({
+  fields: ['slug', 'title', 'excerpt', 'category', 'date', 'readTime', 'image'],
+  rows: [
+    ['b', 'Article B', 'Résumé B', 'Conseils', '2026-02-01', '4 min', '/b.jpg'],
+    ['a', 'Article A', 'Résumé A', 'Prix', '2026-01-01', '6 min', '/a.jpg'],
+  ],
+  categories: ['Conseils', 'Prix'],
+})
+
+// Serveur simulé : manifest.json, index.json et articles/<hash>.json
+function server(manifest: OfflineManifest, failing: string[] = []) {
+  return vi.fn(async (url: string) => {
+    const path = String(url).replace('/data/offline/', '')
+    const body = path === 'manifest.json' ? JSON.stringify(manifest)
+      : path === 'index.json' ? index
+      : JSON.stringify({ slug: path, html: `<p>${path}</p>` })
+    const ok = !failing.includes(path)
+    return { ok, status: ok ? 200 : 500, text: async () => body } as Response
+  })
+}
+
+const v1: OfflineManifest = {
+  format: 1,
+  version: 1,
+  index: 'i1',
+  articles: { a: ['ha1', 1], b: ['hb1', 1] },
+  removed: {},
+}
+
+describe('syncOfflineArticles', () => {
+  it('downloads every article on the first sync', async () => {
+    const store = memoryStore()
+    const fetcher = server(v1)
+    const result = await syncOfflineArticles({ store, fetcher })
+    expect(result).toEqual({ version: 1, downloaded: 2, removed: 0, upToDate: false })
+    expect(fetcher).toHaveBeenCalledWith('/data/offline/articles/ha1.json', expect.anything())
+    expect((await getOfflineIndex(store)).map(a => a.slug)).toEqual(['b', 'a'])
+    expect(await getOfflineArticle('a', store)).toEqual({ slug: 'articles/ha1.json', html: '<p>articles/ha1.json</p>' })
+  })
+
+  it('only reads the manifest when the version did not move', async () => {
+    const store = memoryStore()
+    await syncOfflineArticles({ store, fetcher: server(v1) })
+    const fetcher = server(v1)
+    expect(await syncOfflineArticles({ store, fetcher })).toEqual({ version: 1, downloaded: 0, removed: 0, upToDate: true })
+    expect(fetcher).toHaveBeenCalledTimes(1)
+  })
+
+  it('downloads only changed articles and drops removed ones', async () => {
+    const store = memoryStore()
+    await syncOfflineArticles({ store, fetcher: server(v1) })
+    const v2: OfflineManifest = { format: 1, version: 2, index: 'i1', articles: { a: ['ha2', 2], c: ['hc2', 2] }, removed: { b: 2 } }
+    const fetcher = server(v2)
+    expect(await syncOfflineArticles({ store, fetcher })).toEqual({ version: 2, downloaded: 2, removed: 1, upToDate: false })
+    const urls = fetcher.mock.calls.map(([url]) => url)
+    expect(urls).toEqual(['/data/offline/manifest.json', '/data/offline/articles/ha2.json', '/data/offline/articles/hc2.json'])
+    expect(await getOfflineArticle('b', store)).toBeNull()
+  })
+
+  it('keeps the previous version after a failed download and resumes', async () => {
+    const store = memoryStore()
+    await syncOfflineArticles({ store, fetcher: server(v1) })
+    const v2: OfflineManifest = { format: 1, version: 2, index: 'i2', articles: { a: ['ha2', 2], b: ['hb2', 2] }, removed: {} }
+    await expect(syncOfflineArticles({ store, fetcher: server(v2, ['articles/hb2.json']) })).rejects.toThrow('HTTP 500')
+    const fetcher = server(v2)
+    expect(await syncOfflineArticles({ store, fetcher })).toEqual({ version: 2, downloaded: 1, removed: 0, upToDate: false })
+    expect(fetcher.mock.calls.map(([url]) => url)).toContain('/data/offline/index.json')
+  })
+
+  it('resyncs everything when the bundle format changes', async () => {
+    const store = memoryStore()
+    await syncOfflineArticles({ store, fetcher: server(v1) })
+    const result = await syncOfflineArticles({ store, fetcher: server({ ...v1, format: 2 }) })
+    expect(result.downloaded).toBe(2)
+  })
+})
@@ -0,0 +1,170 @@
+/**
+ * Blog hors ligne pour les applications Capacitor.
+ *
+ * `python3 -m scripts.pipeline offline` publie sous /data/offline un index
+ * compact, un fichier par article (nommé par son hash) et manifest.json, qui
+ * donne la version de synchronisation et, pour chaque article, son hash et la
+ * version où il a changé. L'application ne télécharge que les articles
+ * modifiés depuis sa dernière synchronisation : une version inchangée coûte
+ * la seule lecture du manifest, sinon seuls les hashes qui diffèrent des
+ * hashes locaux sont téléchargés.
+ */
+
+export const OFFLINE_BASE_URL = '/data/offline'
+
+const STATE_KEY = 'offline:state'
+const INDEX_KEY = 'offline:index'
+const ARTICLE_KEY = 'offline:article:'
+
+// Téléchargements simultanés
+const CONCURRENCY = 6
+
+export interface OfflineManifest {
+  format: number
+  version: number
+  /** Hash de index.json */
+  index: string
+  /** slug -> [hash du fichier, version de la dernière modification] */
+  articles: Record<string, [string, number]>
+  /** slug -> version de la suppression */
+  removed: Record<string, number>
+}
+
+export interface OfflineArticleSummary {
+  slug: string
+  title: string
+  excerpt: string
+  category: string
+  date: string
+  readTime: string
+  image?: string
+}
+
+export interface OfflineArticle extends OfflineArticleSummary {
+  tags?: string[]
+  updatedDate?: string
+  author?: string
+  authorBio?: string
+  wordCount?: number
+  faq?: { question: string; answer: string }[]
+  /** Corps de l'article déjà rendu en HTML */
+  html: string
+}
+
+/** Stockage clé/valeur asynchrone (localStorage par défaut) */
+export interface OfflineStore {
+  get(key: string): Promise<string | null>
+  set(key: string, value: string): Promise<void>
+  remove(key: string): Promise<void>
+}
+
+interface SyncState {
+  format: number
+  version: number
+  index: string | null
+  hashes: Record<string, string>
+}
+
+export interface SyncResult {
+  version: number
+  downloaded: number
+  removed: number
+  upToDate: boolean
+}
+
+export const localStorageStore: OfflineStore = {
+  async get(key) {
+    return localStorage.getItem(key)
+  },
+  async set(key, value) {
+    localStorage.setItem(key, value)
+  },
+  async remove(key) {
+    localStorage.removeItem(key)
+  },
+}
+
+async function readState(store: OfflineStore): Promise<SyncState> {
+  const raw = await store.get(STATE_KEY)
+  return raw ? JSON.parse(raw) : { format: 0, version: 0, index: null, hashes: {} }
+}
+
+async function fetchText(fetcher: typeof fetch, url: string): Promise<string> {
+  const res = await fetcher(url, { cache: 'no-cache' })
+  if (!res.ok) throw new Error(`${url}: HTTP ${res.status}`)
+  return res.text()
+}
+
+/**
+ * Met le stockage local à la version publiée. En cas d'échec réseau, les
+ * articles déjà téléchargés sont conservés et la version reste l'ancienne :
+ * la synchronisation suivante reprend là où celle-ci s'est arrêtée.
+ */
+export async function syncOfflineArticles(options: {
+  baseUrl?: string
+  store?: OfflineStore
+  fetcher?: typeof fetch
+} = {}): Promise<SyncResult> {
+  const { baseUrl = OFFLINE_BASE_URL, store = localStorageStore, fetcher = fetch } = options
+  const manifest: OfflineManifest = JSON.parse(await fetchText(fetcher, `${baseUrl}/manifest.json`))
+  const state = await readState(store)
+  const fresh = state.format !== manifest.format
+  if (!fresh && state.version === manifest.version) {
+    return { version: state.version, downloaded: 0, removed: 0, upToDate: true }
+  }
+
+  // Nouveau format : tout est retéléchargé
+  const hashes: Record<string, string> = fresh ? {} : { ...state.hashes }
+  const todo = Object.keys(manifest.articles).filter(slug => hashes[slug] !== manifest.articles[slug][0])
+
+  let removed = 0
+  for (const slug of Object.keys(state.hashes)) {
+    if (!Object.prototype.hasOwnProperty.call(manifest.articles, slug)) {
+      await store.remove(ARTICLE_KEY + slug)
+      delete hashes[slug]
+      removed++
+    }
+  }
+
+  let downloaded = 0
+  try {
+    for (let i = 0; i < todo.length; i += CONCURRENCY) {
+      // allSettled : les téléchargements en cours aboutissent avant l'enregistrement de l'état
+      const results = await Promise.allSettled(todo.slice(i, i + CONCURRENCY).map(async slug => {
+        const hash = manifest.articles[slug][0]
+        await store.set(ARTICLE_KEY + slug, await fetchText(fetcher, `${baseUrl}/articles/${hash}.json`))
+        hashes[slug] = hash
+        downloaded++
+      }))
+      const failed = results.find((r): r is PromiseRejectedResult => r.status === 'rejected')
+      if (failed) throw failed.reason
+    }
+    if (fresh || state.index !== manifest.index) {
+      await store.set(INDEX_KEY, await fetchText(fetcher, `${baseUrl}/index.json`))
+    }
+  } catch (err) {
+    await store.set(STATE_KEY, JSON.stringify({ ...state, format: manifest.format, hashes }))
+    throw err
+  }
+
+  await store.set(STATE_KEY, JSON.stringify({
+    format: manifest.format,
+    version: manifest.version,
+    index: manifest.index,
+    hashes,
+  }))
+  return { version: manifest.version, downloaded, removed, upToDate: false }
+}
+
+/** Liste des articles disponibles hors ligne, du plus récent au plus ancien */
+export async function getOfflineIndex(store: OfflineStore = localStorageStore): Promise<OfflineArticleSummary[]> {
+  const raw = await store.get(INDEX_KEY)
+  if (!raw) return []
+  const { fields, rows }: { fields: string[]; rows: unknown[][] } = JSON.parse(raw)
+  return rows.map(row => Object.fromEntries(fields.map((field, i) => [field, row[i]])) as unknown as OfflineArticleSummary)
+}
+
+export async function getOfflineArticle(slug: string, store: OfflineStore = localStorageStore): Promise<OfflineArticle | null> {
+  const raw = await store.get(ARTICLE_KEY + slug)
+  return raw ? JSON.parse(raw) : null
+}
@@ -1788,7 +1788,7 @@ function mapDensiteToUrbanDensity(densite: QuartierDataProfile['densite']): Urba
 
 function getQuartierProfile(ville: Ville, quartierName: string): QuartierProfile {
   // Try to get enriched data from quartier-data.ts first
-  const realData = getQuartierData(ville.slug, toQuartierSlug(quartierName))
+  const realData = getQuartierData(ville, toQuartierSlug(quartierName))
   if (realData) {
     const eraKey = mapEpoqueToBuildingEra(realData.epoque)
     const densityKey = mapDensiteToUrbanDensity(realData.densite)
@@ -1988,7 +1988,7 @@ function generateQuartierDataDrivenContent(
   const dataSources: string[] = []
 
   // Try to get enriched quartier data for real values
-  const realData = getQuartierData(ville.slug, toQuartierSlug(quartierName))
+  const realData = getQuartierData(ville, toQuartierSlug(quartierName))
 
   // ── Section 1: Immobilier quartier ──
   const prixQ = realData ? realData.prixM2 : qData.prix_m2_moyen
@@ -1,5 +1,5 @@
 import { createClient } from '@supabase/supabase-js'
-import { getVilleBySlug as getVilleBySlugImport } from '@/lib/data/france'
+import { getVilleCoreBySlug } from '@/lib/data/france-core'
 import { resolveProviderCity, resolveProviderCities, getCityValues } from '@/lib/insee-resolver'
 
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!
@@ -184,7 +184,7 @@ export async function getServiceBySlug(slug: string) {
 export async function getLocationBySlug(slug: string) {
   if (IS_BUILD) {
     // Use static france.ts fallback during build
-    const ville = getVilleBySlugImport(slug)
+    const ville = getVilleCoreBySlug(slug)
     if (ville) return { id: '', name: ville.name, slug: ville.slug, postal_code: ville.codePostal }
     return null
   }
@@ -206,7 +206,7 @@ export async function getLocationBySlug(slug: string) {
     return data
   } catch {
     // Fallback to france.ts static data when DB table is empty/missing
-    const ville = getVilleBySlugImport(slug)
+    const ville = getVilleCoreBySlug(slug)
     if (ville) return { id: '', name: ville.name, slug: ville.slug, postal_code: ville.codePostal }
     return null
   }
@@ -358,7 +358,7 @@ export async function getProvidersByServiceAndLocation(
 
   // Use STATIC data for service/location — no DB needed. This keeps total function
   // time well under Vercel's 10s serverless timeout (avoids nested retry cascades).
-  const ville = getVilleBySlugImport(locationSlug)
+  const ville = getVilleCoreBySlug(locationSlug)
   if (!ville) return []
 
   const specialties = SERVICE_TO_SPECIALTIES[serviceSlug]
@@ -438,7 +438,7 @@ export async function hasProvidersByServiceAndLocation(
         const specialties = SERVICE_TO_SPECIALTIES[serviceSlug]
         if (!specialties || specialties.length === 0) return false
 
-        const ville = getVilleBySlugImport(locationSlug)
+        const ville = getVilleCoreBySlug(locationSlug)
         const cityName = ville?.name
         if (!cityName) return false
 
@@ -477,7 +477,7 @@ export async function getProviderCountByServiceAndLocation(
         const specialties = SERVICE_TO_SPECIALTIES[serviceSlug]
         if (!specialties || specialties.length === 0) return 0
 
-        const ville = getVilleBySlugImport(locationSlug)
+        const ville = getVilleCoreBySlug(locationSlug)
         const cityName = ville?.name
         if (!cityName) return 0
 
@@ -503,7 +503,7 @@ export async function getProvidersByLocation(locationSlug: string) {
   if (IS_BUILD) return [] // Skip during build
 
   // Use STATIC data for location — no DB needed
-  const ville = getVilleBySlugImport(locationSlug)
+  const ville = getVilleCoreBySlug(locationSlug)
   if (!ville) return []
 
   const cityValues = getCityValues(ville.name)
@@ -1,6 +1,7 @@
 import { type ClassValue, clsx } from 'clsx'
 import { twMerge } from 'tailwind-merge'
-import { services, villes } from '@/lib/data/france'
+import { services } from '@/lib/data/france'
+import { villesCore } from '@/lib/data/france-core'
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
@@ -58,7 +59,7 @@ const _normalize = (t: string) => t.toLowerCase().normalize('NFD').replace(/[\u0
 const _serviceMap = new Map(services.map(s => [_normalize(s.name), s.slug]))
 // Also map slug → slug for direct matches (provider specialty may already be a slug)
 services.forEach(s => { if (!_serviceMap.has(s.slug)) _serviceMap.set(s.slug, s.slug) })
-const _villeMap = new Map(villes.map(v => [_normalize(v.name), v.slug]))
+const _villeMap = new Map(villesCore.map(v => [_normalize(v.name), v.slug]))
 
 // Reverse mapping: provider specialty variants → canonical service slug
 // Covers cases where provider.specialty is a synonym (e.g., "peintre" → "peintre-en-batiment")